@@ -1,4 +1,5 @@
 import os
+import shutil
 from dataclasses import dataclass
 from typing import Optional, Any, Union
 
@@ -19,6 +20,10 @@ def has_all_else_optional(value: dict[Region, Any | None], typ: str):
     return f"Optional[{typ}]"
 
 
+def has_else_none(value: Any | None, typ: str):
+    return "None" if value is None else typ
+
+
 def make_relative(value: None | int | list[int], based_on: int | None) -> None | int | list[int]:
     if value is None or based_on is None:
         return None
@@ -35,7 +40,21 @@ def as_hex(value: None | int | list[int]) -> str:
     if isinstance(value, int):
         return f"0x{value:0x}"
     joined = ",".join(f"0x{x:0x}" for x in value)
-    return f"[{joined}]"
+    return f"({joined})"
+
+
+# Value of a symbol in a packed SymbolTable column. Missing values and symbols with more than one address are marked
+# with SymbolTable.NONE; the latter are stored separately by is_multi_address.
+def as_hex_column(value: None | int | list[int]) -> str:
+    if isinstance(value, list):
+        value = value[0] if len(value) == 1 else None
+    if value is None:
+        return "0xFFFFFFFF"
+    return as_hex(value)
+
+
+def is_multi_address(value: None | list[int]) -> bool:
+    return value is not None and len(value) > 1
 
 
 def escape_py(value: str) -> str:
@@ -46,8 +65,11 @@ J2ENV = Environment(
     loader=PackageLoader(__package__)
 )
 J2ENV.filters['has_all_else_optional'] = has_all_else_optional
+J2ENV.filters['has_else_none'] = has_else_none
 J2ENV.filters['make_relative'] = make_relative
 J2ENV.filters['as_hex'] = as_hex
+J2ENV.filters['as_hex_column'] = as_hex_column
+J2ENV.tests['multi_address'] = is_multi_address
 J2ENV.filters['escape_py'] = escape_py
 
 
@@ -56,6 +78,7 @@ class File:
     template_name: str
     output_name: str
     region: Region | None
+    binary: Binary | None = None
 
 
 def generate(
@@ -65,11 +88,44 @@ def generate(
         release: str
 ):
     files = [
-        File('protocol.py.jinja2', 'protocol.py', None)
+        File('protocol.py.jinja2', 'protocol.py', None),
+        File('descriptions.py.jinja2', '_descriptions.py', None),
+        File('symbol_sections.py.jinja2', '_symbol_sections.py', None),
     ]
 
+    # The symbol tables of each section are in their own module, so they are only imported when needed.
+    tables_path = os.path.join(pkg_path, '_tables')
+    shutil.rmtree(tables_path, ignore_errors=True)
+    packages = [tables_path]
+
     for region in Region:
         files.append(File('region.py.jinja2', f'{region.file_name()}.py', region))
+        files.append(File('region.pyi.jinja2', f'{region.file_name()}.pyi', region))
+        packages.append(os.path.join(tables_path, region.file_name()))
+        for binary in binaries:
+            if not binary.functions and not binary.data:
+                continue
+            files.append(File(
+                'section.py.jinja2', os.path.join('_tables', region.file_name(), f'{binary.name}.py'), region, binary
+            ))
+
+    for package in packages:
+        os.makedirs(package)
+        open(os.path.join(package, '__init__.py'), 'w').close()
+
+    # Symbol descriptions are identical across regions, so they are stored once and referenced by index.
+    descriptions: dict[str, int] = {}
+    for binary in binaries:
+        for symbol in binary.functions + binary.data:
+            descriptions.setdefault(symbol.description, len(descriptions))
+
+    # Symbol names are identical across regions too, so one index of the sections defining each name is shared.
+    symbol_sections: dict[str, list[str]] = {}
+    for binary in binaries:
+        for symbol in binary.functions + binary.data:
+            sections = symbol_sections.setdefault(symbol.name, [])
+            if binary.name not in sections:
+                sections.append(binary.name)
 
     for file in files:
         template = J2ENV.get_template(file.template_name)
@@ -77,8 +133,11 @@ def generate(
             f.write(format_str(template.render(
                 binaries=binaries,
                 region=file.region,
-                pkg_name=pkg_name
-            ), mode=FileMode(preview=True)))
+                binary=file.binary,
+                pkg_name=pkg_name,
+                descriptions=descriptions,
+                symbol_sections=symbol_sections
+            ), mode=FileMode(preview=True, is_pyi=file.output_name.endswith('.pyi'))))
 
     with open(os.path.join(pkg_path, '_release.py'), 'w') as f:
         f.write(f'RELEASE = "{release}"\n')
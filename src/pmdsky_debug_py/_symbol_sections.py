@@ -0,0 +1,7410 @@
+# Names of the sections defining each symbol. The same in all regions.
+# Lets symbols be found by name without loading the tables of every section.
+SYMBOL_SECTIONS: dict[str, tuple[str, ...]] = dict(
+    zip(
+        (
+            "_start_arm7",
+            "do_autoload_arm7",
+            "StartAutoloadDoneCallbackArm7",
+            "NitroSpMain",
+            "HardwareInterrupt",
+            "ReturnFromInterrupt",
+            "AudioInterrupt",
+            "ClearImeFlag",
+            "ClearIeFlag",
+            "GetCurrentPlaybackTime",
+            "ClearIrqFlag",
+            "EnableIrqFlag",
+            "SetIrqFlag",
+            "EnableIrqFiqFlags",
+            "SetIrqFiqFlags",
+            "GetProcessorMode",
+            "_s32_div_f",
+            "_u32_div_f",
+            "_u32_div_not_0_f",
+            "Svc_SoftReset",
+            "Svc_WaitByLoop",
+            "Svc_CpuSet",
+            "_start",
+            "InitI_CpuClear32",
+            "MIi_UncompressBackward",
+            "do_autoload",
+            "StartAutoloadDoneCallback",
+            "init_cp15",
+            "OSi_ReferSymbol",
+            "NitroMain",
+            "InitMemAllocTable",
+            "SetMemAllocatorParams",
+            "GetAllocArenaDefault",
+            "GetFreeArenaDefault",
+            "InitMemArena",
+            "MemAllocFlagsToBlockType",
+            "FindAvailableMemBlock",
+            "SplitMemBlock",
+            "MemAlloc",
+            "MemFree",
+            "MemArenaAlloc",
+            "CreateMemArena",
+            "MemLocateSet",
+            "MemLocateUnset",
+            "RoundUpDiv256",
+            "UFixedPoint64CmpLt",
+            "MultiplyByFixedPoint",
+            "UMultiplyByFixedPoint",
+            "IntToFixedPoint64",
+            "FixedPoint64ToInt",
+            "FixedPoint32To64",
+            "NegateFixedPoint64",
+            "FixedPoint64IsZero",
+            "FixedPoint64IsNegative",
+            "FixedPoint64CmpLt",
+            "MultiplyFixedPoint64",
+            "DivideFixedPoint64",
+            "UMultiplyFixedPoint64",
+            "UDivideFixedPoint64",
+            "AddFixedPoint64",
+            "ClampedLn",
+            "GetRngSeed",
+            "SetRngSeed",
+            "Rand16Bit",
+            "RandInt",
+            "RandRange",
+            "Rand32Bit",
+            "RandIntSafe",
+            "RandRangeSafe",
+            "WaitForever",
+            "InterruptMasterDisable",
+            "InterruptMasterEnable",
+            "InitMemAllocTableVeneer",
+            "ZInit8",
+            "PointsToZero",
+            "MemZero",
+            "MemZero16",
+            "MemZero32",
+            "MemsetSimple",
+            "Memset32",
+            "MemcpySimple",
+            "Memcpy16",
+            "Memcpy32",
+            "TaskProcBoot",
+            "EnableAllInterrupts",
+            "GetTime",
+            "DisableAllInterrupts",
+            "SoundResume",
+            "CardPullOutWithStatus",
+            "CardPullOut",
+            "CardBackupError",
+            "HaltProcessDisp",
+            "OverlayIsLoaded",
+            "LoadOverlay",
+            "UnloadOverlay",
+            "GetDsFirmwareUserSettingsVeneer",
+            "Rgb8ToRgb5",
+            "EuclideanNorm",
+            "ClampComponentAbs",
+            "GetHeldButtons",
+            "GetPressedButtons",
+            "GetReleasedStylus",
+            "KeyWaitInit",
+            "DebugPrintSystemClock",
+            "GetSystemClock",
+            "SprintfSystemClock",
+            "DataTransferInit",
+            "DataTransferStop",
+            "FileInitVeneer",
+            "FileOpen",
+            "FileGetSize",
+            "FileRead",
+            "FileSeek",
+            "FileClose",
+            "UnloadFile",
+            "LoadFileFromRom",
+            "TransformPaletteDataWithFlushDivideFade",
+            "UpdateFadeStatus",
+            "HandleFades",
+            "GetFadeStatus",
+            "InitDebug",
+            "InitDebugFlag",
+            "GetDebugFlag",
+            "SetDebugFlag",
+            "InitDebugStripped6",
+            "AppendProgPos",
+            "InitDebugStripped5",
+            "DebugPrintTrace",
+            "DebugDisplay",
+            "DebugPrint0",
+            "InitDebugLogFlag",
+            "GetDebugLogFlag",
+            "SetDebugLogFlag",
+            "DebugPrint",
+            "InitDebugStripped4",
+            "InitDebugStripped3",
+            "InitDebugStripped2",
+            "InitDebugStripped1",
+            "FatalError",
+            "OpenAllPackFiles",
+            "GetFileLengthInPackWithPackNb",
+            "LoadFileInPackWithPackId",
+            "AllocAndLoadFileInPack",
+            "OpenPackFile",
+            "GetFileLengthInPack",
+            "LoadFileInPack",
+            "GetDungeonResultMsg",
+            "GetDamageSource",
+            "GetItemCategoryVeneer",
+            "GetItemMoveId16",
+            "IsThrownItem",
+            "IsNotMoney",
+            "IsEdible",
+            "IsHM",
+            "IsGummi",
+            "IsAuraBow",
+            "IsLosableItem",
+            "IsTreasureBox",
+            "IsStorableItem",
+            "IsShoppableItem",
+            "IsValidTargetItem",
+            "IsItemUsableNow",
+            "IsTicketItem",
+            "InitItem",
+            "InitStandardItem",
+            "InitBulkItem",
+            "BulkItemToItem",
+            "ItemToBulkItem",
+            "GetDisplayedBuyPrice",
+            "GetDisplayedSellPrice",
+            "GetActualBuyPrice",
+            "GetActualSellPrice",
+            "FindItemInInventory",
+            "SprintfStatic",
+            "ItemZInit",
+            "AreItemsEquivalent",
+            "WriteItemsToSave",
+            "ReadItemsFromSave",
+            "IsItemAvailableInDungeonGroup",
+            "GetItemIdFromList",
+            "NormalizeTreasureBox",
+            "SortItemList",
+            "RemoveEmptyItems",
+            "LoadItemPspi2n",
+            "GetExclusiveItemType",
+            "GetExclusiveItemOffsetEnsureValid",
+            "IsItemValid",
+            "GetExclusiveItemParameter",
+            "GetItemCategory",
+            "EnsureValidItem",
+            "GetItemName",
+            "GetItemNameFormatted",
+            "GetItemBuyPrice",
+            "GetItemSellPrice",
+            "GetItemSpriteId",
+            "GetItemPaletteId",
+            "GetItemActionName",
+            "GetThrownItemQuantityLimit",
+            "GetItemMoveId",
+            "TestItemAiFlag",
+            "IsItemInTimeDarkness",
+            "IsItemValidVeneer",
+            "SetActiveInventoryToMain",
+            "AllInventoriesZInit",
+            "SpecialEpisodeInventoryZInit",
+            "RescueInventoryZInit",
+            "SetActiveInventory",
+            "GetMoneyCarried",
+            "SetMoneyCarried",
+            "AddMoneyCarried",
+            "GetCurrentBagCapacity",
+            "IsBagFull",
+            "GetNbItemsInBag",
+            "CountNbItemsOfTypeInBag",
+            "CountItemTypeInBag",
+            "IsItemInBag",
+            "IsItemWithFlagsInBag",
+            "IsItemInTreasureBoxes",
+            "IsHeldItemInBag",
+            "IsItemForSpecialSpawnInBag",
+            "HasStorableItems",
+            "GetItemIndex",
+            "GetEquivItemIndex",
+            "GetEquippedThrowableItem",
+            "GetFirstUnequippedItemOfType",
+            "CopyItemAtIdx",
+            "GetItemAtIdx",
+            "RemoveEmptyItemsInBag",
+            "RemoveItemNoHole",
+            "RemoveItem",
+            "RemoveHeldItemNoHole",
+            "RemoveItemByIdAndStackNoHole",
+            "RemoveEquivItem",
+            "RemoveEquivItemNoHole",
+            "DecrementStackItem",
+            "RemoveItemNoHoleCheck",
+            "RemoveFirstUnequippedItemOfType",
+            "RemoveAllItems",
+            "RemoveAllItemsStartingAt",
+            "SpecialProcAddItemToBag",
+            "AddItemToBagNoHeld",
+            "AddItemToBag",
+            "CleanStickyItemsInBag",
+            "CountStickyItemsInBag",
+            "TransmuteHeldItemInBag",
+            "SetFlagsForHeldItemInBag",
+            "RemoveHolderForItemInBag",
+            "SetHolderForItemInBag",
+            "SortItemsInBag",
+            "RemovePokeItemsInBag",
+            "IsStorageFull",
+            "CountNbOfItemsInStorage",
+            "CountNbOfValidItemsInStorage",
+            "CountNbOfValidItemsInTimeDarknessInStorage",
+            "CountNbItemsOfTypeInStorage",
+            "CountItemTypeInStorage",
+            "GetEquivBulkItemIdxInStorage",
+            "ConvertStorageItemAtIdxToBulkItem",
+            "ConvertStorageItemAtIdxToItem",
+            "RemoveItemAtIdxInStorage",
+            "RemoveBulkItemInStorage",
+            "RemoveItemInStorage",
+            "StorageZInit",
+            "AddBulkItemToStorage",
+            "AddItemToStorage",
+            "SortItemsInStorage",
+            "AllKecleonShopsZInit",
+            "SpecialEpisodeKecleonShopZInit",
+            "SetActiveKecleonShop",
+            "GetMoneyStored",
+            "SetMoneyStored",
+            "AddMoneyStored",
+            "SortKecleonItems1",
+            "GenerateKecleonItems1",
+            "SortKecleonItems2",
+            "GenerateKecleonItems2",
+            "GetExclusiveItemOffset",
+            "ApplyExclusiveItemStatBoosts",
+            "SetExclusiveItemEffect",
+            "ExclusiveItemEffectFlagTest",
+            "IsExclusiveItemIdForMonster",
+            "IsExclusiveItemForMonster",
+            "BagHasExclusiveItemTypeForMonster",
+            "GetExclusiveItemForMonsterFromBag",
+            "GetHpBoostFromExclusiveItems",
+            "ApplyGummiBoostsToGroundMonster",
+            "ApplyGummiBoostsToTeamMember",
+            "ApplySitrusBerryBoostToGroundMonster",
+            "ApplyLifeSeedBoostToGroundMonster",
+            "ApplyGinsengToGroundMonster",
+            "ApplyProteinBoostToGroundMonster",
+            "ApplyCalciumBoostToGroundMonster",
+            "ApplyIronBoostToGroundMonster",
+            "ApplyZincBoostToGroundMonster",
+            "ApplyNectarBoostToGroundMonster",
+            "IsMonsterAffectedByGravelyrockGroundMode",
+            "ApplyGravelyrockBoostToGroundMonster",
+            "ApplyGummiBoostsGroundMode",
+            "LoadSynthBin",
+            "CloseSynthBin",
+            "GetSynthItem",
+            "LoadWazaP",
+            "LoadWazaP2",
+            "UnloadCurrentWazaP",
+            "GetMoveName",
+            "FormatMoveString",
+            "FormatMoveStringMore",
+            "InitMove",
+            "InitMoveCheckId",
+            "GetInfoMoveGround",
+            "GetMoveTargetAndRange",
+            "GetMoveType",
+            "GetMovesetLevelUpPtr",
+            "IsInvalidMoveset",
+            "GetMovesetHmTmPtr",
+            "GetMovesetEggPtr",
+            "GetMoveAiWeight",
+            "GetMoveNbStrikes",
+            "GetMoveBasePower",
+            "GetMoveBasePowerGround",
+            "GetMoveAccuracyOrAiChance",
+            "GetMoveBasePp",
+            "GetMaxPp",
+            "GetMoveMaxGinsengBoost",
+            "GetMoveMaxGinsengBoostGround",
+            "GetMoveCritChance",
+            "IsThawingMove",
+            "IsAffectedByTaunt",
+            "GetMoveRangeId",
+            "GetMoveActualAccuracy",
+            "GetMoveBasePowerFromId",
+            "IsMoveRangeString19",
+            "GetMoveMessageFromId",
+            "GetNbMoves",
+            "GetMovesetIdx",
+            "IsReflectedByMagicCoat",
+            "CanBeSnatched",
+            "FailsWhileMuzzled",
+            "IsSoundMove",
+            "IsRecoilMove",
+            "AllManip1",
+            "AllManip2",
+            "ManipMoves1v1",
+            "ManipMoves1v2",
+            "ManipMoves2v1",
+            "ManipMoves2v2",
+            "DungeonMoveToGroundMove",
+            "GroundToDungeonMoveset",
+            "DungeonToGroundMoveset",
+            "GetInfoGroundMoveset",
+            "FindFirstFreeMovesetIdx",
+            "LearnMoves",
+            "CopyMoveTo",
+            "CopyMoveFrom",
+            "CopyMovesetTo",
+            "CopyMovesetFrom",
+            "Is2TurnsMove",
+            "IsRegularAttackOrProjectile",
+            "IsPunchMove",
+            "IsHealingWishOrLunarDance",
+            "IsCopyingMove",
+            "IsTrappingMove",
+            "IsOneHitKoMove",
+            "IsNot2TurnsMoveOrSketch",
+            "IsRealMove",
+            "IsMovesetValid",
+            "IsRealMoveInTimeDarkness",
+            "IsMovesetValidInTimeDarkness",
+            "GetFirstNotRealMoveInTimeDarkness",
+            "IsSameMove",
+            "GetMoveCategory",
+            "GetPpIncrease",
+            "OpenWaza",
+            "SelectWaza",
+            "PlayBgmByIdVeneer",
+            "PlayBgmByIdVolumeVeneer",
+            "PlaySeVolumeWrapper",
+            "PlayBgmById",
+            "PlayBgmByIdVolume",
+            "StopBgmCommand",
+            "PlaySeByIdVolume",
+            "SendAudioCommand2",
+            "AllocAudioCommand",
+            "SendAudioCommand",
+            "InitSoundSystem",
+            "ManipBgmPlayback",
+            "SoundDriverReset",
+            "LoadDseFile",
+            "PlaySeLoad",
+            "IsSongOver",
+            "PlayBgm",
+            "StopBgm",
+            "ChangeBgm",
+            "PlayBgm2",
+            "StopBgm2",
+            "ChangeBgm2",
+            "PlayME",
+            "StopME",
+            "PlaySe",
+            "PlaySeFullSpec",
+            "SeChangeVolume",
+            "SeChangePan",
+            "StopSe",
+            "CopyAndInterleaveWrapper",
+            "InitAnimationControl",
+            "InitAnimationControlWithSet",
+            "SetSpriteIdForAnimationControl",
+            "SetAnimationForAnimationControlInternal",
+            "SetAnimationForAnimationControl",
+            "GetWanForAnimationControl",
+            "SetAndPlayAnimationForAnimationControl",
+            "SwitchAnimationControlToNextFrame",
+            "LoadAnimationFrameAndIncrementInAnimationControl",
+            "AnimationControlGetAllocForMaxFrame",
+            "DeleteWanTableEntry",
+            "AllocateWanTableEntry",
+            "FindWanTableEntry",
+            "GetLoadedWanTableEntry",
+            "InitWanTable",
+            "LoadWanTableEntry",
+            "LoadWanTableEntryFromPack",
+            "LoadWanTableEntryFromPackUseProvidedMemory",
+            "ReplaceWanFromBinFile",
+            "DeleteWanTableEntryVeneer",
+            "WanHasAnimationGroup",
+            "WanTableSpriteHasAnimationGroup",
+            "SpriteTypeInWanTable",
+            "LoadWteFromRom",
+            "LoadWteFromFileDirectory",
+            "UnloadWte",
+            "LoadWtuFromBin",
+            "ProcessWte",
+            "GeomSetTexImageParam",
+            "GeomSetVertexCoord16",
+            "InitRender3dData",
+            "GeomSwapBuffers",
+            "InitRender3dElement64",
+            "Render3d64Texture0x7",
+            "Render3d64WindowFrame",
+            "EnqueueRender3d64Tiling",
+            "Render3d64Tiling",
+            "Render3d64Quadrilateral",
+            "Render3d64RectangleMulticolor",
+            "Render3d64Rectangle",
+            "Render3d64Nothing",
+            "Render3d64Texture",
+            "Render3dElement64",
+            "HandleSir0Translation",
+            "ConvertPointersSir0",
+            "HandleSir0TranslationVeneer",
+            "DecompressAtNormalVeneer",
+            "DecompressAtNormal",
+            "DecompressAtHalf",
+            "DecompressAtFromMemoryPointerVeneer",
+            "DecompressAtFromMemoryPointer",
+            "WriteByteFromMemoryPointer",
+            "GetAtSize",
+            "GetLanguageType",
+            "GetLanguage",
+            "StrcmpTag",
+            "AtoiTag",
+            "AnalyzeText",
+            "PreprocessString",
+            "PreprocessStringFromId",
+            "StrcmpTagVeneer",
+            "AtoiTagVeneer",
+            "InitPreprocessorArgs",
+            "SetStringAccuracy",
+            "SetStringPower",
+            "GetRankString",
+            "GetCurrentTeamNameString",
+            "GetBagNameString",
+            "GetDungeonResultString",
+            "SetQuestionMarks",
+            "StrcpySimple",
+            "StrncpySimple",
+            "StrncpySimpleNoPad",
+            "StrncmpSimple",
+            "StrncpySimpleNoPadSafe",
+            "StrcpyName",
+            "StrncpyName",
+            "GetStringFromFile",
+            "LoadStringFile",
+            "AllocateTemp1024ByteBufferFromPool",
+            "GetStringFromFileVeneer",
+            "StringFromId",
+            "CopyStringFromId",
+            "CopyNStringFromId",
+            "LoadTblTalk",
+            "GetTalkLine",
+            "IsAOrBPressed",
+            "DrawTextInWindow",
+            "GetCharWidth",
+            "GetColorCodePaletteOffset",
+            "DrawChar",
+            "GetWindow",
+            "NewWindowScreenCheck",
+            "NewWindow",
+            "SetScreenWindowsColor",
+            "SetBothScreensWindowsColor",
+            "UpdateWindow",
+            "ClearWindow",
+            "DeleteWindow",
+            "GetWindowRectangle",
+            "GetWindowContents",
+            "LoadCursors",
+            "InitWindowTrailer",
+            "Arm9LoadUnkFieldNa0x2029EC8",
+            "Arm9StoreUnkFieldNa0x2029ED8",
+            "LoadAlert",
+            "PrintClearMark",
+            "PrintBadgeMark",
+            "PrintMark",
+            "CreateParentMenuFromStringIds",
+            "IsEmptyString",
+            "CreateParentMenu",
+            "CreateParentMenuWrapper",
+            "CreateParentMenuInternal",
+            "ResumeParentMenu",
+            "SetParentMenuState7",
+            "CloseParentMenu",
+            "IsParentMenuActive",
+            "CheckParentMenuField0x1A0",
+            "UpdateParentMenu",
+            "CreateSimpleMenuFromStringIds",
+            "CreateSimpleMenu",
+            "CreateSimpleMenuInternal",
+            "ResumeSimpleMenu",
+            "CloseSimpleMenu",
+            "IsSimpleMenuActive",
+            "CheckSimpleMenuField0x1A0",
+            "GetSimpleMenuField0x1A4",
+            "GetSimpleMenuResult",
+            "UpdateSimpleMenu",
+            "SetSimpleMenuField0x1AC",
+            "CreateAdvancedMenu",
+            "ResumeAdvancedMenu",
+            "CloseAdvancedMenu",
+            "IsAdvancedMenuActive2",
+            "IsAdvancedMenuActive",
+            "GetAdvancedMenuCurrentOption",
+            "GetAdvancedMenuResult",
+            "UpdateAdvancedMenu",
+            "CreateCollectionMenu",
+            "SetCollectionMenuField0x1BC",
+            "SetCollectionMenuWidth",
+            "CloseCollectionMenu",
+            "IsCollectionMenuActive",
+            "SetCollectionMenuField0x1C8",
+            "SetCollectionMenuField0x1A0",
+            "SetCollectionMenuField0x1A4",
+            "SetCollectionMenuVoidFn",
+            "UpdateCollectionMenu",
+            "SetCollectionMenuField0x1B2",
+            "IsCollectionMenuState3",
+            "CreateOptionsMenu",
+            "CloseOptionsMenu",
+            "IsOptionsMenuActive",
+            "CheckOptionsMenuField0x1A4",
+            "GetOptionsMenuStates",
+            "GetOptionsMenuResult",
+            "UpdateOptionsMenu",
+            "CreateDebugMenu",
+            "CloseDebugMenu",
+            "IsDebugMenuActive",
+            "CheckDebugMenuField0x1A4",
+            "UpdateDebugMenu",
+            "CreateScrollBoxSingle",
+            "CreateScrollBoxMulti",
+            "SetScrollBoxState7",
+            "CloseScrollBox",
+            "IsScrollBoxActive",
+            "UpdateScrollBox",
+            "CreateDialogueBox",
+            "CloseDialogueBox",
+            "IsDialogueBoxActive",
+            "ShowStringIdInDialogueBox",
+            "ShowStringInDialogueBox",
+            "ShowDialogueBox",
+            "ReadStringFromDialogueBox",
+            "UpdateDialogueBox",
+            "CreatePortraitBox",
+            "ClosePortraitBox",
+            "PortraitBoxNeedsUpdate",
+            "ShowPortraitInPortraitBox",
+            "HidePortraitBox",
+            "UpdatePortraitBox",
+            "CreateTextBox",
+            "CreateTextBoxWithArg",
+            "CloseTextBox",
+            "CloseTextBox2",
+            "CreateTextBoxInternal",
+            "UpdateTextBox",
+            "IsTextBoxActive",
+            "CreateAreaNameBox",
+            "SetAreaNameBoxState3",
+            "CloseAreaNameBox",
+            "IsAreaNameBoxActive",
+            "UpdateAreaNameBox",
+            "CreateControlsChart",
+            "CloseControlsChart",
+            "IsControlsChartActive",
+            "UpdateControlsChart",
+            "CreateAlertBox",
+            "CloseAlertBox",
+            "IsAlertBoxActive",
+            "UpdateAlertBox",
+            "CreateAdvancedTextBox",
+            "CreateAdvancedTextBoxWithArg",
+            "CreateAdvancedTextBoxInternal",
+            "SetAdvancedTextBoxPartialMenu",
+            "SetAdvancedTextBoxField0x1C4",
+            "SetAdvancedTextBoxField0x1C2",
+            "CloseAdvancedTextBox2",
+            "SetAdvancedTextBoxState5",
+            "CloseAdvancedTextBox",
+            "IsAdvancedTextBoxActive",
+            "GetAdvancedTextBoxFlags2",
+            "SetUnkAdvancedTextBoxFn",
+            "SetUnkAdvancedTextBoxWindowFn",
+            "UpdateAdvancedTextBox",
+            "PlayAdvancedTextBoxInputSound",
+            "CreateTeamSelectionMenu",
+            "CloseTeamSelectionMenu",
+            "IsTeamSelectionMenuActive",
+            "UpdateTeamSelectionMenu",
+            "IsTeamSelectionMenuState3",
+            "CalcMenuHeightDiv8",
+            "InitWindowInput",
+            "IsMenuOptionActive",
+            "PlayWindowInputSound",
+            "InitInventoryMenuInput",
+            "ShowKeyboard",
+            "GetKeyboardStatus",
+            "GetKeyboardStringResult",
+            "TeamSelectionMenuGetItem",
+            "PrintMoveOptionMenu",
+            "PrintIqSkillsMenu",
+            "GetNotifyNote",
+            "SetNotifyNote",
+            "InitSpecialEpisodeHero",
+            "EventFlagBackupVeneer",
+            "InitMainTeamAfterQuiz",
+            "InitSpecialEpisodePartners",
+            "InitSpecialEpisodeExtraPartner",
+            "ReadStringSave",
+            "CheckStringSave",
+            "WriteSaveFile",
+            "ReadSaveFile",
+            "CalcChecksum",
+            "CheckChecksumInvalid",
+            "NoteSaveBase",
+            "WriteQuickSaveInfo",
+            "ReadSaveHeader",
+            "NoteLoadBase",
+            "ReadQuickSaveInfo",
+            "GetGameMode",
+            "InitScriptVariableValues",
+            "InitEventFlagScriptVars",
+            "ZinitScriptVariable",
+            "LoadScriptVariableRaw",
+            "LoadScriptVariableValue",
+            "LoadScriptVariableValueAtIndex",
+            "SaveScriptVariableValue",
+            "SaveScriptVariableValueAtIndex",
+            "LoadScriptVariableValueSum",
+            "LoadScriptVariableValueBytes",
+            "SaveScriptVariableValueBytes",
+            "ScriptVariablesEqual",
+            "EventFlagResume",
+            "EventFlagBackup",
+            "DumpScriptVariableValues",
+            "RestoreScriptVariableValues",
+            "InitScenarioScriptVars",
+            "SetScenarioScriptVar",
+            "GetSpecialEpisodeType",
+            "SetSpecialEpisodeType",
+            "GetExecuteSpecialEpisodeType",
+            "IsSpecialEpisodeOpen",
+            "HasPlayedOldGame",
+            "GetPerformanceFlagWithChecks",
+            "GetScenarioBalance",
+            "ScenarioFlagBackup",
+            "InitWorldMapScriptVars",
+            "InitDungeonListScriptVars",
+            "SetDungeonConquest",
+            "GetDungeonMode",
+            "GlobalProgressAlloc",
+            "ResetGlobalProgress",
+            "SetMonsterFlag1",
+            "GetMonsterFlag1",
+            "SetMonsterFlag2",
+            "HasMonsterBeenAttackedInDungeons",
+            "SetDungeonTipShown",
+            "GetDungeonTipShown",
+            "SetMaxReachedFloor",
+            "GetMaxReachedFloor",
+            "IncrementNbAdventures",
+            "GetNbAdventures",
+            "CanMonsterSpawn",
+            "IncrementExclusiveMonsterCounts",
+            "CopyProgressInfoTo",
+            "CopyProgressInfoFromScratchTo",
+            "CopyProgressInfoFrom",
+            "CopyProgressInfoFromScratchFrom",
+            "InitKaomadoStream",
+            "InitPortraitParams",
+            "InitPortraitParamsWithMonsterId",
+            "SetPortraitEmotion",
+            "SetPortraitLayout",
+            "SetPortraitOffset",
+            "AllowPortraitDefault",
+            "IsValidPortrait",
+            "LoadPortrait",
+            "WonderMailPasswordToMission",
+            "SetEnterDungeon",
+            "InitDungeonInit",
+            "IsNoLossPenaltyDungeon",
+            "CheckMissionRestrictions",
+            "GetNbFloors",
+            "GetNbFloorsPlusOne",
+            "GetDungeonGroup",
+            "GetNbPrecedingFloors",
+            "GetNbFloorsDungeonGroup",
+            "DungeonFloorToGroupFloor",
+            "GetMissionRank",
+            "GetOutlawLevel",
+            "GetOutlawLeaderLevel",
+            "GetOutlawMinionLevel",
+            "AddGuestMonster",
+            "GetGroundNameId",
+            "SetAdventureLogStructLocation",
+            "SetAdventureLogDungeonFloor",
+            "GetAdventureLogDungeonFloor",
+            "ClearAdventureLogStruct",
+            "SetAdventureLogCompleted",
+            "IsAdventureLogNotEmpty",
+            "GetAdventureLogCompleted",
+            "IncrementNbDungeonsCleared",
+            "GetNbDungeonsCleared",
+            "IncrementNbFriendRescues",
+            "GetNbFriendRescues",
+            "IncrementNbEvolutions",
+            "GetNbEvolutions",
+            "IncrementNbSteals",
+            "IncrementNbEggsHatched",
+            "GetNbEggsHatched",
+            "GetNbPokemonJoined",
+            "GetNbMovesLearned",
+            "SetVictoriesOnOneFloor",
+            "GetVictoriesOnOneFloor",
+            "SetPokemonJoined",
+            "SetPokemonBattled",
+            "GetNbPokemonBattled",
+            "IncrementNbBigTreasureWins",
+            "SetNbBigTreasureWins",
+            "GetNbBigTreasureWins",
+            "SetNbRecycled",
+            "GetNbRecycled",
+            "IncrementNbSkyGiftsSent",
+            "SetNbSkyGiftsSent",
+            "GetNbSkyGiftsSent",
+            "ComputeSpecialCounters",
+            "RecruitSpecialPokemonLog",
+            "IncrementNbFainted",
+            "GetNbFainted",
+            "SetItemAcquired",
+            "GetNbItemAcquired",
+            "SetChallengeLetterCleared",
+            "GetSentryDutyGamePoints",
+            "SetSentryDutyGamePoints",
+            "CopyLogTo",
+            "CopyLogFrom",
+            "GetAbilityString",
+            "GetAbilityDescStringId",
+            "GetTypeStringId",
+            "GetConversion2ConvertToType",
+            "CopyBitsTo",
+            "CopyBitsFrom",
+            "StoreDefaultTeamData",
+            "GetMainTeamNameWithCheck",
+            "GetMainTeamName",
+            "SetMainTeamName",
+            "GetRankupPoints",
+            "GetRank",
+            "GetRankStorageSize",
+            "ResetPlayTimer",
+            "PlayTimerTick",
+            "GetPlayTimeSeconds",
+            "SubFixedPoint",
+            "BinToDecFixedPoint",
+            "CeilFixedPoint",
+            "DungeonGoesUp",
+            "GetTurnLimit",
+            "DoesNotSaveWhenEntering",
+            "TreasureBoxDropsEnabled",
+            "IsLevelResetDungeon",
+            "GetMaxItemsAllowed",
+            "IsMoneyAllowed",
+            "GetMaxRescueAttempts",
+            "IsRecruitingAllowed",
+            "GetLeaderChangeFlag",
+            "GetRandomMovementChance",
+            "CanEnemyEvolve",
+            "GetMaxMembersAllowed",
+            "IsIqEnabled",
+            "IsTrapInvisibleWhenAttacking",
+            "JoinedAtRangeCheck",
+            "IsDojoDungeon",
+            "IsFutureDungeon",
+            "IsSpecialEpisodeDungeon",
+            "RetrieveFromItemList1",
+            "IsForbiddenFloor",
+            "Copy16BitsFrom",
+            "RetrieveFromItemList2",
+            "IsInvalidForMission",
+            "IsExpEnabledInDungeon",
+            "IsSkyExclusiveDungeon",
+            "JoinedAtRangeCheck2",
+            "GetBagCapacity",
+            "GetBagCapacitySpecialEpisode",
+            "GetRankUpEntry",
+            "GetBgRegionArea",
+            "LoadMonsterMd",
+            "GetNameRaw",
+            "GetName",
+            "GetNameWithGender",
+            "GetSpeciesString",
+            "GetNameString",
+            "GetSpriteIndex",
+            "GetDexNumber",
+            "GetCategoryString",
+            "GetMonsterGender",
+            "GetBodySize",
+            "GetSpriteSize",
+            "GetSpriteFileSize",
+            "GetShadowSize",
+            "GetSpeedStatus",
+            "GetMobilityType",
+            "GetRegenSpeed",
+            "GetCanMoveFlag",
+            "GetChanceAsleep",
+            "GetWeightMultiplier",
+            "GetSize",
+            "GetBaseHp",
+            "CanThrowItems",
+            "CanEvolve",
+            "GetMonsterPreEvolution",
+            "GetBaseOffensiveStat",
+            "GetBaseDefensiveStat",
+            "GetType",
+            "GetAbility",
+            "GetRecruitRate2",
+            "GetRecruitRate1",
+            "GetExp",
+            "GetEvoParameters",
+            "GetTreasureBoxChances",
+            "GetIqGroup",
+            "GetSpawnThreshold",
+            "NeedsItemToSpawn",
+            "GetExclusiveItem",
+            "GetFamilyIndex",
+            "LoadM2nAndN2m",
+            "GuestMonsterToGroundMonster",
+            "StrcmpMonsterName",
+            "GetLvlUpEntry",
+            "GetEncodedHalfword",
+            "GetEvoFamily",
+            "GetEvolutions",
+            "ShuffleHiddenPower",
+            "GetBaseForm",
+            "GetBaseFormBurmyWormadamShellosGastrodonCherrim",
+            "GetBaseFormCastformCherrimDeoxys",
+            "GetAllBaseForms",
+            "GetDexNumberVeneer",
+            "GetMonsterIdFromSpawnEntry",
+            "SetMonsterId",
+            "SetMonsterLevelAndId",
+            "GetMonsterLevelFromSpawnEntry",
+            "GetMonsterGenderVeneer",
+            "IsMonsterValid",
+            "IsUnown",
+            "IsShaymin",
+            "IsCastform",
+            "IsCherrim",
+            "IsDeoxys",
+            "GetSecondFormIfValid",
+            "FemaleToMaleForm",
+            "GetBaseFormCastformDeoxysCherrim",
+            "BaseFormsEqual",
+            "DexNumbersEqual",
+            "GendersEqual",
+            "GendersEqualNotGenderless",
+            "GendersNotEqualNotGenderless",
+            "IsMonsterOnTeam",
+            "GetNbRecruited",
+            "IsValidTeamMember",
+            "IsMainCharacter",
+            "GetTeamMember",
+            "GetHeroMemberIdx",
+            "GetPartnerMemberIdx",
+            "GetMainCharacter1MemberIdx",
+            "GetMainCharacter2MemberIdx",
+            "GetMainCharacter3MemberIdx",
+            "GetHero",
+            "GetPartner",
+            "GetMainCharacter1",
+            "GetMainCharacter2",
+            "GetMainCharacter3",
+            "GetFirstMatchingMemberIdx",
+            "GetFirstEmptyMemberIdx",
+            "IsMonsterNotNicknamed",
+            "RemoveActiveMembersFromAllTeams",
+            "RemoveActiveMembersFromSpecialEpisodeTeam",
+            "RemoveActiveMembersFromRescueTeam",
+            "CheckTeamMemberIdx",
+            "IsMonsterIdInNormalRange",
+            "SetActiveTeam",
+            "GetActiveTeamMember",
+            "GetActiveRosterIndex",
+            "TryAddMonsterToActiveTeam",
+            "RemoveActiveMembersFromMainTeam",
+            "SetTeamSetupHeroAndPartnerOnly",
+            "SetTeamSetupHeroOnly",
+            "GetPartyMembers",
+            "RefillTeam",
+            "ClearItem",
+            "ChangeGiratinaFormIfSkyDungeon",
+            "GetIqSkillStringId",
+            "DoesTacticFollowLeader",
+            "GetUnlockedTactics",
+            "GetUnlockedTacticFlags",
+            "CanLearnIqSkill",
+            "GetLearnableIqSkills",
+            "DisableIqSkill",
+            "EnableIqSkill",
+            "GetSpeciesIqSkill",
+            "DisableAllIqSkills",
+            "EnableAllLearnableIqSkills",
+            "IqSkillFlagTest",
+            "GetNextIqSkill",
+            "GetExplorerMazeTeamName",
+            "GetExplorerMazeMonster",
+            "WriteMonsterInfoToSave",
+            "ReadMonsterInfoFromSave",
+            "WriteMonsterToSave",
+            "ReadMonsterFromSave",
+            "GetEvolutionPossibilities",
+            "GetMonsterEvoStatus",
+            "CopyTacticString",
+            "GetStatBoostsForMonsterSummary",
+            "CreateMonsterSummaryFromTeamMember",
+            "GetSosMailCount",
+            "IsMissionSuspendedAndValid",
+            "AreMissionsEquivalent",
+            "IsMissionValid",
+            "GenerateMission",
+            "IsMissionTypeSpecialEpisode",
+            "GenerateDailyMissions",
+            "AlreadyHaveMission",
+            "CountJobListMissions",
+            "DungeonRequestsDone",
+            "DungeonRequestsDoneWrapper",
+            "AnyDungeonRequestsDone",
+            "AddMissionToJobList",
+            "GetAcceptedMission",
+            "GetMissionByTypeAndDungeon",
+            "CheckAcceptedMissionByTypeAndDungeon",
+            "GetAllPossibleMonsters",
+            "GenerateAllPossibleMonstersList",
+            "DeleteAllPossibleMonstersList",
+            "GenerateAllPossibleDungeonsList",
+            "DeleteAllPossibleDungeonsList",
+            "GenerateAllPossibleDeliverList",
+            "DeleteAllPossibleDeliverList",
+            "ClearMissionData",
+            "IsMonsterMissionAllowed",
+            "CanMonsterBeUsedForMissionWrapper",
+            "CanMonsterBeUsedForMission",
+            "IsMonsterMissionAllowedStory",
+            "CanDungeonBeUsedForMission",
+            "CanSendItem",
+            "IsAvailableItem",
+            "GetAvailableItemDeliveryList",
+            "GetActorMatchingStorageId",
+            "SetActorTalkMainAndActorTalkSub",
+            "SetActorTalkMain",
+            "SetActorTalkSub",
+            "RandomizeDemoActors",
+            "ItemAtTableIdx",
+            "MainLoop",
+            "CreateJobSummary",
+            "DungeonSwapIdToIdx",
+            "DungeonSwapIdxToId",
+            "GetDungeonModeSpecial",
+            "SECURE",
+            "START_MODULE_PARAMS",
+            "DEFAULT_MEMORY_ARENA_SIZE",
+            "LOG_MAX_ARG",
+            "DAMAGE_SOURCE_CODE_ORB_ITEM",
+            "DAMAGE_SOURCE_CODE_NON_ORB_ITEM",
+            "AURA_BOW_ID_LAST",
+            "NUMBER_OF_ITEMS",
+            "MAX_MONEY_CARRIED",
+            "MAX_MONEY_STORED",
+            "WINDOW_LIST_PTR",
+            "SCRIPT_VARS_VALUES_PTR",
+            "MAX_PLAY_TIME",
+            "MONSTER_ID_LIMIT",
+            "MAX_RECRUITABLE_TEAM_MEMBERS",
+            "NATURAL_LOG_VALUE_TABLE",
+            "CART_REMOVED_IMG_DATA",
+            "STRING_DEBUG_EMPTY",
+            "STRING_DEBUG_FORMAT_LINE_FILE",
+            "STRING_DEBUG_NO_PROG_POS",
+            "STRING_DEBUG_SPACED_PRINT",
+            "STRING_DEBUG_FATAL",
+            "STRING_DEBUG_NEWLINE",
+            "STRING_DEBUG_LOG_NULL",
+            "STRING_DEBUG_STRING_NEWLINE",
+            "STRING_EFFECT_EFFECT_BIN",
+            "STRING_MONSTER_MONSTER_BIN",
+            "STRING_BALANCE_M_LEVEL_BIN",
+            "STRING_DUNGEON_DUNGEON_BIN",
+            "STRING_MONSTER_M_ATTACK_BIN",
+            "STRING_MONSTER_M_GROUND_BIN",
+            "STRING_FILE_DIRECTORY_INIT",
+            "AVAILABLE_ITEMS_IN_GROUP_TABLE",
+            "ARM9_UNKNOWN_TABLE__NA_2097FF8",
+            "KECLEON_SHOP_ITEM_TABLE_LISTS_1",
+            "KECLEON_SHOP_ITEM_TABLE_LISTS_2",
+            "EXCLUSIVE_ITEM_STAT_BOOST_DATA",
+            "EXCLUSIVE_ITEM_DEFENSE_BOOSTS",
+            "EXCLUSIVE_ITEM_SPECIAL_ATTACK_BOOSTS",
+            "EXCLUSIVE_ITEM_SPECIAL_DEFENSE_BOOSTS",
+            "EXCLUSIVE_ITEM_EFFECT_DATA",
+            "EXCLUSIVE_ITEM_STAT_BOOST_DATA_INDEXES",
+            "RECYCLE_SHOP_ITEM_LIST",
+            "TYPE_SPECIFIC_EXCLUSIVE_ITEMS",
+            "RECOIL_MOVE_LIST",
+            "PUNCH_MOVE_LIST",
+            "MOVE_POWER_STARS_TABLE",
+            "MOVE_ACCURACY_STARS_TABLE",
+            "PARENT_MENU_DEFAULT_WINDOW_PARAMS",
+            "SIMPLE_MENU_DEFAULT_WINDOW_PARAMS",
+            "ADVANCED_MENU_DEFAULT_WINDOW_PARAMS",
+            "COLLECTION_MENU_DEFAULT_WINDOW_PARAMS",
+            "OPTIONS_MENU_DEFAULT_WINDOW_PARAMS",
+            "DEBUG_MENU_DEFAULT_WINDOW_PARAMS",
+            "SCROLL_BOX_DEFAULT_WINDOW_PARAMS",
+            "DIALOGUE_BOX_DEFAULT_WINDOW_PARAMS",
+            "PORTRAIT_BOX_DEFAULT_WINDOW_PARAMS",
+            "TEXT_BOX_DEFAULT_WINDOW_PARAMS",
+            "AREA_NAME_BOX_DEFAULT_WINDOW_PARAMS",
+            "CONTROLS_CHART_DEFAULT_WINDOW_PARAMS",
+            "ALERT_BOX_DEFAULT_WINDOW_PARAMS",
+            "ADVANCED_TEXT_BOX_DEFAULT_WINDOW_PARAMS",
+            "TEAM_SELECTION_MENU_DEFAULT_WINDOW_PARAMS",
+            "PARTNER_TALK_KIND_TABLE",
+            "SCRIPT_VARS_LOCALS",
+            "SCRIPT_VARS",
+            "PORTRAIT_LAYOUTS",
+            "KAOMADO_FILEPATH",
+            "WONDER_MAIL_BITS_MAP",
+            "WONDER_MAIL_BITS_SWAP",
+            "ARM9_UNKNOWN_TABLE__NA_209E12C",
+            "ARM9_UNKNOWN_TABLE__NA_209E164",
+            "ARM9_UNKNOWN_TABLE__NA_209E280",
+            "WONDER_MAIL_ENCRYPTION_TABLE",
+            "DUNGEON_DATA_LIST",
+            "ADVENTURE_LOG_ENCOUNTERS_MONSTER_IDS",
+            "ARM9_UNKNOWN_DATA__NA_209E6BC",
+            "TACTIC_NAME_STRING_IDS",
+            "STATUS_NAME_STRING_IDS",
+            "DUNGEON_RETURN_STATUS_TABLE",
+            "STATUSES_FULL_DESCRIPTION_STRING_IDS",
+            "ARM9_UNKNOWN_DATA__NA_209EAAC",
+            "MISSION_FLOOR_RANKS_AND_ITEM_LISTS_1",
+            "MISSION_FLOORS_FORBIDDEN",
+            "MISSION_FLOOR_RANKS_AND_ITEM_LISTS_2",
+            "MISSION_FLOOR_RANKS_PTRS",
+            "DUNGEON_RESTRICTIONS",
+            "SPECIAL_BAND_STAT_BOOST",
+            "MUNCH_BELT_STAT_BOOST",
+            "GUMMI_STAT_BOOST",
+            "MIN_IQ_EXCLUSIVE_MOVE_USER",
+            "WONDER_GUMMI_IQ_GAIN",
+            "AURA_BOW_STAT_BOOST",
+            "MIN_IQ_ITEM_MASTER",
+            "DEF_SCARF_STAT_BOOST",
+            "POWER_BAND_STAT_BOOST",
+            "WONDER_GUMMI_STAT_BOOST",
+            "ZINC_BAND_STAT_BOOST",
+            "EGG_HP_BONUS",
+            "EVOLUTION_HP_BONUS",
+            "DAMAGE_FORMULA_FLV_SHIFT",
+            "EVOLUTION_PHYSICAL_STAT_BONUSES",
+            "DAMAGE_FORMULA_CONSTANT_SHIFT",
+            "DAMAGE_FORMULA_FLV_DEFICIT_DIVISOR",
+            "EGG_STAT_BONUSES",
+            "EVOLUTION_SPECIAL_STAT_BONUSES",
+            "DAMAGE_FORMULA_NON_TEAM_MEMBER_MODIFIER",
+            "DAMAGE_FORMULA_LN_PREFACTOR",
+            "DAMAGE_FORMULA_DEF_PREFACTOR",
+            "DAMAGE_FORMULA_AT_PREFACTOR",
+            "DAMAGE_FORMULA_LN_ARG_PREFACTOR",
+            "FORBIDDEN_FORGOT_MOVE_LIST",
+            "TACTICS_UNLOCK_LEVEL_TABLE",
+            "CLIENT_LEVEL_TABLE",
+            "OUTLAW_LEVEL_TABLE",
+            "OUTLAW_MINION_LEVEL_TABLE",
+            "HIDDEN_POWER_BASE_POWER_TABLE",
+            "VERSION_EXCLUSIVE_MONSTERS",
+            "IQ_SKILL_RESTRICTIONS",
+            "SECONDARY_TERRAIN_TYPES",
+            "SENTRY_DUTY_MONSTER_IDS",
+            "IQ_SKILLS",
+            "IQ_GROUP_SKILLS",
+            "MONEY_QUANTITY_TABLE",
+            "ARM9_UNKNOWN_TABLE__NA_20A20B0",
+            "IQ_GUMMI_GAIN_TABLE",
+            "GUMMI_BELLY_RESTORE_TABLE",
+            "BAG_CAPACITY_TABLE_SPECIAL_EPISODES",
+            "BAG_CAPACITY_TABLE",
+            "SPECIAL_EPISODE_MAIN_CHARACTERS",
+            "GUEST_MONSTER_DATA",
+            "RANK_UP_TABLE",
+            "DS_DOWNLOAD_TEAMS",
+            "ARM9_UNKNOWN_PTR__NA_20A2C84",
+            "UNOWN_SPECIES_ADDITIONAL_CHARS",
+            "MONSTER_SPRITE_DATA",
+            "REMOTE_STRINGS",
+            "RANK_STRINGS_1",
+            "MISSION_MENU_STRING_IDS_1",
+            "RANK_STRINGS_2",
+            "MISSION_MENU_STRING_IDS_2",
+            "RANK_STRINGS_3",
+            "MISSION_DUNGEON_UNLOCK_TABLE",
+            "NO_SEND_ITEM_TABLE",
+            "ARM9_UNKNOWN_TABLE__NA_20A3CC8",
+            "ARM9_UNKNOWN_TABLE__NA_20A3CE4",
+            "ARM9_UNKNOWN_FUNCTION_TABLE__NA_20A3CF4",
+            "MISSION_BANNED_STORY_MONSTERS",
+            "ITEM_DELIVERY_TABLE",
+            "MISSION_RANK_POINTS",
+            "MISSION_BANNED_MONSTERS",
+            "MISSION_STRING_IDS",
+            "LEVEL_LIST",
+            "EVENTS",
+            "ARM9_UNKNOWN_TABLE__NA_20A68BC",
+            "DEMO_TEAMS",
+            "ACTOR_LIST",
+            "ENTITIES",
+            "JOB_WINDOW_PARAMS_1",
+            "JOB_MENU_ITEMS_1",
+            "JOB_MENU_ITEMS_2",
+            "JOB_MENU_ITEMS_3",
+            "JOB_MENU_ITEMS_4",
+            "JOB_MENU_ITEMS_5",
+            "JOB_MENU_ITEMS_6",
+            "JOB_MENU_ITEMS_7",
+            "JOB_MENU_ITEMS_8",
+            "JOB_MENU_ITEMS_9",
+            "JOB_MENU_ITEMS_10",
+            "JOB_MENU_ITEMS_11",
+            "JOB_MENU_ITEMS_12",
+            "JOB_MENU_ITEMS_13",
+            "JOB_WINDOW_PARAMS_2",
+            "DUNGEON_SWAP_ID_TABLE",
+            "MAP_MARKER_PLACEMENTS",
+            "LFO_OUTPUT_VOICE_UPDATE_FLAGS",
+            "TRIG_TABLE",
+            "FX_ATAN_IDX_TABLE",
+            "TEX_PLTT_START_ADDR_TABLE",
+            "TEX_START_ADDR_TABLE",
+            "ARM9_UNKNOWN_TABLE__NA_20AE924",
+            "MEMORY_ALLOCATION_ARENA_GETTERS",
+            "PRNG_SEQUENCE_NUM",
+            "LOADED_OVERLAY_GROUP_0",
+            "LOADED_OVERLAY_GROUP_1",
+            "LOADED_OVERLAY_GROUP_2",
+            "DEBUG_IS_INITIALIZED",
+            "PACK_FILES_OPENED",
+            "PACK_FILE_PATHS_TABLE",
+            "GAME_STATE_VALUES",
+            "BAG_ITEMS_PTR_MIRROR",
+            "ITEM_DATA_TABLE_PTRS",
+            "DUNGEON_MOVE_TABLES",
+            "MOVE_DATA_TABLE_PTR",
+            "WAN_TABLE",
+            "RENDER_3D",
+            "RENDER_3D_FUNCTIONS_64",
+            "LANGUAGE_INFO_DATA",
+            "TBL_TALK_GROUP_STRING_ID_START",
+            "KEYBOARD_STRING_IDS",
+            "NOTIFY_NOTE",
+            "DEFAULT_HERO_ID",
+            "DEFAULT_PARTNER_ID",
+            "GAME_MODE",
+            "GLOBAL_PROGRESS_PTR",
+            "ADVENTURE_LOG_PTR",
+            "ITEM_TABLES_PTRS_1",
+            "UNOWN_SPECIES_ADDITIONAL_CHAR_PTR_TABLE",
+            "TEAM_MEMBER_TABLE_PTR",
+            "MISSION_DELIVER_LIST_PTR",
+            "MISSION_DELIVER_COUNT",
+            "MISSION_DUNGEON_LIST_PTR",
+            "MISSION_DUNGEON_COUNT",
+            "MISSION_MONSTER_LIST_PTR",
+            "MISSION_MONSTER_COUNT",
+            "MISSION_LIST_PTR",
+            "REMOTE_STRING_PTR_TABLE",
+            "RANK_STRING_PTR_TABLE",
+            "SMD_EVENTS_FUN_TABLE",
+            "MUSIC_DURATION_LOOKUP_TABLE_1",
+            "MUSIC_DURATION_LOOKUP_TABLE_2",
+            "LFO_WAVEFORM_CALLBACKS",
+            "IS_DISP_ON",
+            "GXI_DMA_ID",
+            "JUICE_BAR_NECTAR_IQ_GAIN",
+            "DEBUG_TEXT_SPEED",
+            "REGULAR_TEXT_SPEED",
+            "HERO_START_LEVEL",
+            "PARTNER_START_LEVEL",
+            "CopyAndInterleave",
+            "Render3dSetTextureParams",
+            "Render3dSetPaletteBase",
+            "Render3dRectangle",
+            "GeomSetPolygonAttributes",
+            "Render3dQuadrilateral",
+            "Render3dTiling",
+            "Render3dTextureInternal",
+            "Render3dTexture",
+            "Render3dTextureNoSetup",
+            "NewRender3dElement",
+            "EnqueueRender3dTexture",
+            "EnqueueRender3dTiling",
+            "NewRender3dRectangle",
+            "NewRender3dQuadrilateral",
+            "NewRender3dTexture",
+            "NewRender3dTiling",
+            "Render3dProcessQueue",
+            "GetKeyN2MSwitch",
+            "GetKeyN2M",
+            "GetKeyN2MBaseForm",
+            "GetKeyM2NSwitch",
+            "GetKeyM2N",
+            "GetKeyM2NBaseForm",
+            "InitDmaTransfer_Standard",
+            "ShouldMonsterRunAwayVariationOutlawCheck",
+            "AiMovement",
+            "CalculateAiTargetPos",
+            "ChooseAiMove",
+            "LightningRodStormDrainCheck",
+            "MEMORY_ALLOCATION_TABLE",
+            "DEFAULT_MEMORY_ARENA",
+            "DEFAULT_MEMORY_ARENA_BLOCKS",
+            "RENDER_3D_FUNCTIONS",
+            "DseDriver_LoadDefaultSettings",
+            "DseDriver_IsSettingsValid",
+            "DseDriver_ConfigureHeap",
+            "DseDriver_Init",
+            "Dse_SetError",
+            "Dse_SetError2",
+            "DseUtil_ByteSwap32",
+            "SoundUtil_GetRandomNumber",
+            "DseMem_Init",
+            "DseMem_Quit",
+            "DseMem_AllocateUser",
+            "DseMem_Allocate",
+            "DseMem_AllocateThreadStack",
+            "DseMem_Free",
+            "DseMem_Clear",
+            "DseFile_CheckHeader",
+            "DseSwd_SysInit",
+            "DseSwd_SysQuit",
+            "DseSwd_SampleLoaderMain",
+            "DseSwd_MainBankDummyCallback",
+            "DseSwd_LoadMainBank",
+            "DseSwd_LoadBank",
+            "DseSwd_IsBankLoading",
+            "DseSwd_LoadWaves",
+            "DseSwd_LoadWavesInternal",
+            "DseSwd_Unload",
+            "ReadWaviEntry",
+            "DseSwd_GetInstrument",
+            "DseSwd_GetNextSplitInRange",
+            "DseSwd_GetMainBankById",
+            "DseSwd_GetBankById",
+            "DseSwd_InitMainBankFileReader",
+            "DseSwd_OpenMainBankFileReader",
+            "DseSwd_CloseMainBankFileReader",
+            "DseSwd_ReadMainBank",
+            "DseBgm_DefaultSignalCallback",
+            "DseBgm_Load",
+            "DseBgm_Unload",
+            "DseBgm_SetSignalCallback",
+            "DseBgm_IsPlaying",
+            "ResumeBgm",
+            "DseBgm_Stop",
+            "DseBgm_StopAll",
+            "DseBgm_SetFades",
+            "DseSequence_Start",
+            "DseSequence_PauseList",
+            "DseSequence_SetFades",
+            "DseSequence_GetParameter",
+            "DseSequence_GetSmallestNumLoops",
+            "DseSequence_Reset",
+            "DseSequence_Stop",
+            "FindSmdlSongChunk",
+            "DseSequence_LoadSong",
+            "DseSequence_GetById",
+            "DseSequence_AllocateNew",
+            "DseSequence_Unload",
+            "DseSequence_InitTracks",
+            "DseBgm_SysSetupNoteList",
+            "DseSe_SysReset",
+            "DseSe_Load",
+            "DseSe_Unload",
+            "DseSe_GetUsedBankIDs",
+            "DseSe_HasPlayingInstances",
+            "DseSe_Play",
+            "DseSe_GetEffectSong",
+            "DseSe_CheckTooManyInstances",
+            "DseSe_CheckTooManyInstancesInGroup",
+            "DseSe_GetBestSeqAllocation",
+            "DseSe_GetById",
+            "DseSe_Stop",
+            "DseSe_StopAll",
+            "DseSe_StopSeq",
+            "FlushChannels",
+            "DseDriver_StartMainThread",
+            "DseDriver_StartTickTimer",
+            "DseDriver_NotifyTick",
+            "DseDriver_Main",
+            "DseSequence_TickNotes",
+            "ParseDseEvent",
+            "UpdateSequencerTracks",
+            "DseSequence_TickFades",
+            "DseTrackEvent_Invalid",
+            "DseTrackEvent_WaitSame",
+            "DseTrackEvent_WaitDelta",
+            "DseTrackEvent_Wait8",
+            "DseTrackEvent_Wait16",
+            "DseTrackEvent_Wait24",
+            "DseTrackEvent_WaitUntilFadeout",
+            "DseTrackEvent_EndTrack",
+            "DseTrackEvent_MainLoopBegin",
+            "DseTrackEvent_SubLoopBegin",
+            "DseTrackEvent_SubLoopEnd",
+            "DseTrackEvent_SubLoopBreakOnLastIteration",
+            "DseTrackEvent_SetOctave",
+            "DseTrackEvent_OctaveDelta",
+            "DseTrackEvent_SetBpm",
+            "DseTrackEvent_SetBpm2",
+            "DseTrackEvent_SetBank",
+            "DseTrackEvent_SetBankMsb",
+            "DseTrackEvent_SetBankLsb",
+            "DseTrackEvent_Dummy1Byte",
+            "DseTrackEvent_SetInstrument",
+            "DseTrackEvent_SongVolumeFade",
+            "DseTrackEvent_RestoreEnvelopeDefaults",
+            "DseTrackEvent_SetEnvelopeAttackBegin",
+            "DseTrackEvent_SetEnvelopeAttackTime",
+            "DseTrackEvent_SetEnvelopeHoldTime",
+            "DseTrackEvent_SetEnvelopeDecayTimeAndSustainLevel",
+            "DseTrackEvent_SetEnvelopeSustainTime",
+            "DseTrackEvent_SetEnvelopeReleaseTime",
+            "DseTrackEvent_SetNoteDurationMultiplier",
+            "DseTrackEvent_ForceLfoEnvelopeLevel",
+            "DseTrackEvent_SetHoldNotes",
+            "DseTrackEvent_SetFlagBit1Unknown",
+            "DseTrackEvent_SetOptionalVolume",
+            "DseTrackEvent_Dummy2Bytes",
+            "DseTrackEvent_SetTuning",
+            "DseTrackEvent_TuningDeltaCoarse",
+            "DseTrackEvent_TuningDeltaFine",
+            "DseTrackEvent_TuningDeltaFull",
+            "DseTrackEvent_TuningFade",
+            "DseTrackEvent_SetNoteRandomRegion",
+            "DseTrackEvent_SetTuningJitterAmplitude",
+            "DseTrackEvent_SetKeyBend",
+            "DseTrackEvent_SetUnknown2",
+            "DseTrackEvent_SetKeyBendRange",
+            "DseTrackEvent_SetupKeyBendLfo",
+            "DseTrackEvent_SetupKeyBendLfoEnvelope",
+            "DseTrackEvent_UseKeyBendLfo",
+            "DseTrackEvent_SetVolume",
+            "DseTrackEvent_VolumeDelta",
+            "DseTrackEvent_VolumeFade",
+            "DseTrackEvent_SetExpression",
+            "DseTrackEvent_SetupVolumeLfo",
+            "DseTrackEvent_SetupVolumeLfoEnvelope",
+            "DseTrackEvent_UseVolumeLfo",
+            "DseTrackEvent_SetPan",
+            "DseTrackEvent_PanDelta",
+            "DseTrackEvent_PanFade",
+            "DseTrackEvent_SetupPanLfo",
+            "DseTrackEvent_SetupPanLfoEnvelope",
+            "DseTrackEvent_UsePanLfo",
+            "DseTrackEvent_SetupLfo",
+            "DseTrackEvent_SetupLfoEnvelope",
+            "DseTrackEvent_SetLfoParameter",
+            "DseTrackEvent_UseLfo",
+            "DseTrackEvent_Signal",
+            "DseTrackEvent_Dummy2Bytes2",
+            "DseSynth_Reset",
+            "DseSynth_AllocateNew",
+            "DseSynth_Unload",
+            "DseSynth_ClearHeldNotes",
+            "DseSynth_ResetAndSetBankAndSequence",
+            "DseSynth_StopChannels",
+            "DseSynth_ResetAllVoiceTimersAndVolumes",
+            "DseSynth_RestoreHeldNotes",
+            "DseSynth_SetGlobalVolumeIndex",
+            "DseSynth_SetBend",
+            "DseSynth_SetVolume",
+            "DseSynth_SetPan",
+            "DseSynth_SetBankAndSequence",
+            "DseChannel_Init",
+            "DseChannel_DeallocateVoices",
+            "DseChannel_ResetTimerAndVolumeForVoices",
+            "DseChannel_SetBank",
+            "DseChannel_SetInstrument",
+            "DseChannel_SetLfoConstEnvelopeLevel",
+            "DseChannel_SetKeyBend",
+            "DseChannel_AllocateNote",
+            "DseChannel_ReleaseNoteInternal",
+            "DseChannel_ChangeNote",
+            "DseChannel_ReleaseNote",
+            "DseVoice_PlayNote",
+            "DseVoice_ReleaseNote",
+            "DseVoice_UpdateParameters",
+            "DseVoice_ResetAll",
+            "DseVoice_ResetHW",
+            "UpdateChannels",
+            "DseVoice_Cleanup",
+            "DseVoice_Allocate",
+            "DseVoice_Start",
+            "DseVoice_ReleaseHeld",
+            "DseVoice_Release",
+            "DseVoice_Deallocate",
+            "DseVoice_FlagForActivation",
+            "DseVoice_FlagForDeactivation",
+            "DseVoice_CountNumActiveInChannel",
+            "DseVoice_UpdateHardware",
+            "SoundEnvelope_Reset",
+            "SoundEnvelopeParameters_Reset",
+            "SoundEnvelopeParameters_CheckValidity",
+            "SoundEnvelope_SetParameters",
+            "SoundEnvelope_SetSlide",
+            "UpdateTrackVolumeEnvelopes",
+            "SoundEnvelope_Release",
+            "SoundEnvelope_Stop",
+            "SoundEnvelope_ForceVolume",
+            "SoundEnvelope_Stop2",
+            "SoundEnvelope_Tick",
+            "SoundLfoBank_Reset",
+            "SoundLfoBank_Set",
+            "SoundLfoBank_SetConstEnvelopes",
+            "SoundLfoBank_Tick",
+            "SoundLfoWave_InvalidFunc",
+            "SoundLfoWave_HalfSquareFunc",
+            "SoundLfoWave_FullSquareFunc",
+            "SoundLfoWave_HalfTriangleFunc",
+            "SoundLfoWave_FullTriangleFunc",
+            "SoundLfoWave_SawFunc",
+            "SoundLfoWave_ReverseSawFunc",
+            "SoundLfoWave_HalfNoiseFunc",
+            "SoundLfoWave_FullNoiseFunc",
+            "Crypto_RC4Init",
+            "Mtx_LookAt",
+            "Mtx_OrthoW",
+            "FX_Div",
+            "FX_GetDivResultFx64c",
+            "FX_GetDivResult",
+            "FX_InvAsync",
+            "FX_DivAsync",
+            "FX_DivS32",
+            "FX_ModS32",
+            "Vec_DotProduct",
+            "Vec_CrossProduct",
+            "Vec_Normalize",
+            "Vec_Distance",
+            "FX_Atan2Idx",
+            "GX_Init",
+            "GX_HBlankIntr",
+            "GX_VBlankIntr",
+            "GX_DispOff",
+            "GX_DispOn",
+            "GX_SetGraphicsMode",
+            "Gxs_SetGraphicsMode",
+            "GXx_SetMasterBrightness",
+            "GX_InitGxState",
+            "EnableVramBanksInSetDontSave",
+            "GX_SetBankForBg",
+            "GX_SetBankForObj",
+            "GX_SetBankForBgExtPltt",
+            "GX_SetBankForObjExtPltt",
+            "GX_SetBankForTex",
+            "GX_SetBankForTexPltt",
+            "GX_SetBankForClearImage",
+            "GX_SetBankForArm7",
+            "GX_SetBankForLcdc",
+            "GX_SetBankForSubBg",
+            "GX_SetBankForSubObj",
+            "GX_SetBankForSubBgExtPltt",
+            "GX_SetBankForSubObjExtPltt",
+            "EnableVramBanksInSet",
+            "GX_ResetBankForBgExtPltt",
+            "GX_ResetBankForObjExtPltt",
+            "GX_ResetBankForTex",
+            "GX_ResetBankForTexPltt",
+            "GX_ResetBankForSubBgExtPltt",
+            "GX_ResetBankForSubObjExtPltt",
+            "DisableBankForX",
+            "GX_DisableBankForBg",
+            "GX_DisableBankForObj",
+            "GX_DisableBankForBgExtPltt",
+            "GX_DisableBankForObjExtPltt",
+            "GX_DisableBankForTex",
+            "GX_DisableBankForTexPltt",
+            "GX_DisableBankForClearImage",
+            "GX_DisableBankForArm7",
+            "GX_DisableBankForLcdc",
+            "GX_DisableBankForSubBg",
+            "GX_DisableBankForSubObj",
+            "GX_DisableBankForSubBgExtPltt",
+            "GX_DisableBankForSubObjExtPltt",
+            "G2_GetBG0ScrPtr",
+            "G2S_GetBG0ScrPtr",
+            "G2_GetBG1ScrPtr",
+            "G2S_GetBG1ScrPtr",
+            "G2_GetBG2ScrPtr",
+            "G2_GetBG3ScrPtr",
+            "G2_GetBG0CharPtr",
+            "G2S_GetBG0CharPtr",
+            "G2_GetBG1CharPtr",
+            "G2S_GetBG1CharPtr",
+            "G2_GetBG2CharPtr",
+            "G2_GetBG3CharPtr",
+            "G2x_SetBlendAlpha",
+            "G2x_SetBlendBrightness",
+            "G2x_ChangeBlendBrightness",
+            "G3_LoadMtx44",
+            "G3_LoadMtx43",
+            "G3_MultMtx43",
+            "G3X_Init",
+            "G3X_Reset",
+            "G3X_ClearFifo",
+            "G3X_InitMtxStack",
+            "G3X_ResetMtxStack",
+            "G3X_SetClearColor",
+            "G3X_InitTable",
+            "G3X_GetMtxStackLevelPV",
+            "G3X_GetMtxStackLevelPJ",
+            "GXi_NopClearFifo128",
+            "G3i_OrthoW",
+            "G3i_LookAt",
+            "GX_LoadBgPltt",
+            "Gxs_LoadBgPltt",
+            "GX_LoadObjPltt",
+            "Gxs_LoadObjPltt",
+            "GX_LoadOam",
+            "Gxs_LoadOam",
+            "GX_LoadObj",
+            "Gxs_LoadObj",
+            "GX_LoadBg0Scr",
+            "GX_LoadBg1Scr",
+            "Gxs_LoadBg1Scr",
+            "GX_LoadBg2Scr",
+            "GX_LoadBg3Scr",
+            "GX_LoadBg0Char",
+            "Gxs_LoadBg0Char",
+            "GX_LoadBg1Char",
+            "Gxs_LoadBg1Char",
+            "GX_LoadBg2Char",
+            "GX_LoadBg3Char",
+            "GX_BeginLoadBgExtPltt",
+            "GX_EndLoadBgExtPltt",
+            "GX_BeginLoadObjExtPltt",
+            "GX_EndLoadObjExtPltt",
+            "Gxs_BeginLoadBgExtPltt",
+            "Gxs_EndLoadBgExtPltt",
+            "Gxs_BeginLoadObjExtPltt",
+            "Gxs_EndLoadObjExtPltt",
+            "GX_BeginLoadTex",
+            "GX_LoadTex",
+            "GX_EndLoadTex",
+            "GX_BeginLoadTexPltt",
+            "GX_LoadTexPltt",
+            "GX_EndLoadTexPltt",
+            "GeomGxFifoSendMtx4x3",
+            "GX_SendFifo64B",
+            "OS_GetLockID",
+            "IncrementThreadCount",
+            "InsertThreadIntoList",
+            "StartThread",
+            "ThreadExit",
+            "SetThreadField0xB4",
+            "InitThread",
+            "GetTimer0Control",
+            "GetIrqFlag",
+            "GetDsFirmwareUserSettings",
+            "CountLeadingZeros",
+            "WaitForever2",
+            "WaitForInterrupt",
+            "ArrayFill16",
+            "ArrayCopy16",
+            "ArrayFill32",
+            "ArrayCopy32",
+            "ArrayFill32Fast",
+            "ArrayCopy32Fast",
+            "MemsetFast",
+            "MemcpyFast",
+            "AtomicExchange",
+            "FileInit",
+            "GetOverlayInfo",
+            "LoadOverlayInternal",
+            "InitOverlay",
+            "abs",
+            "mbtowc",
+            "TryAssignByte",
+            "TryAssignByteWrapper",
+            "wcstombs",
+            "memcpy",
+            "memmove",
+            "memset",
+            "memchr",
+            "memcmp",
+            "memset_internal",
+            "__vsprintf_internal_slice",
+            "TryAppendToSlice",
+            "__vsprintf_internal",
+            "vsprintf",
+            "snprintf",
+            "sprintf",
+            "strlen",
+            "strcpy",
+            "strncpy",
+            "strcat",
+            "strncat",
+            "strcmp",
+            "strncmp",
+            "strchr",
+            "strcspn",
+            "strstr",
+            "wcslen",
+            "_dadd",
+            "_d2f",
+            "_ll_ufrom_d",
+            "_dflt",
+            "_dfltu",
+            "_dmul",
+            "_dsqrt",
+            "_dsub",
+            "_fadd",
+            "_dgeq",
+            "_dleq",
+            "_dls",
+            "_deq",
+            "_dneq",
+            "_fls",
+            "_fdiv",
+            "_f2d",
+            "_ffix",
+            "_fflt",
+            "_ffltu",
+            "_fmul",
+            "sqrtf",
+            "_fsub",
+            "_ll_mod",
+            "_ll_sdiv",
+            "_ll_udiv",
+            "_ull_mod",
+            "_ll_mul",
+            "_drdiv",
+            "_ddiv",
+            "_fp_init",
+            "DoMoveDamage",
+            "DoMoveIronTail",
+            "DoMoveDamageMultihitUntilMiss",
+            "DoMoveYawn",
+            "DoMoveSleep",
+            "DoMoveNightmare",
+            "DoMoveMorningSun",
+            "DoMoveVitalThrow",
+            "DoMoveDig",
+            "DoMoveSweetScent",
+            "DoMoveCharm",
+            "DoMoveRainDance",
+            "DoMoveHail",
+            "DoMoveHealStatus",
+            "DoMoveBubble",
+            "DoMoveEncore",
+            "DoMoveRage",
+            "DoMoveSuperFang",
+            "DoMovePainSplit",
+            "DoMoveTorment",
+            "DoMoveStringShot",
+            "DoMoveSwagger",
+            "DoMoveSnore",
+            "DoMoveScreech",
+            "DoMoveDamageCringe30",
+            "DoMoveWeatherBall",
+            "DoMoveWhirlpool",
+            "DoMoveFakeTears",
+            "DoMoveSpite",
+            "DoMoveFocusEnergy",
+            "DoMoveSmokescreen",
+            "DoMoveMirrorMove",
+            "DoMoveOverheat",
+            "DoMoveAuroraBeam",
+            "DoMoveMemento",
+            "DoMoveOctazooka",
+            "DoMoveFlatter",
+            "DoMoveWillOWisp",
+            "DoMoveReturn",
+            "DoMoveGrudge",
+            "DoMoveCounter",
+            "DoMoveDamageBurn10FlameWheel",
+            "DoMoveDamageBurn10",
+            "DoMoveExpose",
+            "DoMoveDoubleTeam",
+            "DoMoveGust",
+            "DoMoveBoostDefense1",
+            "DoMoveParalyze",
+            "DoMoveBoostAttack1",
+            "DoMoveRazorWind",
+            "DoMoveBide",
+            "DoMoveBideUnleash",
+            "DoMoveCrunch",
+            "DoMoveDamageCringe20",
+            "DoMoveDamageParalyze20",
+            "DoMoveEndeavor",
+            "DoMoveFacade",
+            "DoMoveDamageLowerSpeed20",
+            "DoMoveBrickBreak",
+            "DoMoveDamageLowerSpeed100",
+            "DoMoveFocusPunch",
+            "DoMoveDamageDrain",
+            "DoMoveReversal",
+            "DoMoveSmellingSalt",
+            "DoMoveMetalSound",
+            "DoMoveTickle",
+            "DoMoveShadowHold",
+            "DoMoveHaze",
+            "DoMoveDamageMultihitFatigue",
+            "DoMoveDamageWeightDependent",
+            "DoMoveDamageBoostAllStats",
+            "DoMoveSynthesis",
+            "DoMoveBoostSpeed1",
+            "DoMoveRapidSpin",
+            "DoMoveSureShot",
+            "DoMoveCosmicPower",
+            "DoMoveSkyAttack",
+            "DoMoveDamageFreeze15",
+            "DoMoveMeteorMash",
+            "DoMoveEndure",
+            "DoMoveLowerSpeed1",
+            "DoMoveDamageConfuse10",
+            "DoMovePsywave",
+            "DoMoveDamageLowerDefensiveStatVariable",
+            "DoMovePsychoBoost",
+            "DoMoveUproar",
+            "DoMoveWaterSpout",
+            "DoMovePsychUp",
+            "DoMoveDamageWithRecoil",
+            "EntityIsValidMoveEffects",
+            "DoMoveRecoverHp",
+            "DoMoveEarthquake",
+            "GetNaturePowerVariant",
+            "DoMoveNaturePower",
+            "DoMoveDamageParalyze10",
+            "DoMoveSelfdestruct",
+            "DoMoveShadowBall",
+            "DoMoveCharge",
+            "DoMoveThunderbolt",
+            "DoMoveMist",
+            "DoMoveFissure",
+            "DoMoveDamageCringe10",
+            "DoMoveSafeguard",
+            "DoMoveAbsorb",
+            "DefenderAbilityIsActiveMoveEffects",
+            "DoMoveSkillSwap",
+            "DoMoveSketch",
+            "DoMoveHeadbutt",
+            "DoMoveDoubleEdge",
+            "DoMoveSandstorm",
+            "DoMoveLowerAccuracy1",
+            "DoMoveDamagePoison40",
+            "DoMoveGrowth",
+            "DoMoveSacredFire",
+            "DoMoveOhko",
+            "DoMoveSolarBeam",
+            "DoMoveSonicBoom",
+            "DoMoveFly",
+            "DoMoveExplosion",
+            "DoMoveDive",
+            "DoMoveWaterfall",
+            "DoMoveDamageLowerAccuracy40",
+            "DoMoveStockpile",
+            "DoMoveTwister",
+            "DoMoveTwineedle",
+            "DoMoveRecoverHpTeam",
+            "DoMoveMinimize",
+            "DoMoveSeismicToss",
+            "DoMoveConfuse",
+            "DoMoveTaunt",
+            "DoMoveMoonlight",
+            "DoMoveHornDrill",
+            "DoMoveSwordsDance",
+            "DoMoveConversion",
+            "DoMoveConversion2",
+            "DoMoveHelpingHand",
+            "DoMoveBoostDefense2",
+            "DoMoveWarp",
+            "DoMoveThundershock",
+            "DoMoveThunderWave",
+            "DoMoveZapCannon",
+            "DoMoveBlock",
+            "DoMovePoison",
+            "DoMoveToxic",
+            "DoMovePoisonFang",
+            "DoMoveDamagePoison18",
+            "DoMoveJumpKick",
+            "DoMoveBounce",
+            "DoMoveHiJumpKick",
+            "DoMoveTriAttack",
+            "DoMoveSwapItems",
+            "DoMoveTripleKick",
+            "DoMoveSport",
+            "DoMoveMudSlap",
+            "DoMoveDamageStealItem",
+            "DoMoveAmnesia",
+            "DoMoveNightShade",
+            "DoMoveGrowl",
+            "DoMoveSurf",
+            "DoMoveRolePlay",
+            "DoMoveSunnyDay",
+            "DoMoveLowerDefense1",
+            "DoMoveWish",
+            "DoMoveFakeOut",
+            "DoMoveSleepTalk",
+            "DoMovePayDay",
+            "DoMoveAssist",
+            "DoMoveRest",
+            "DoMoveIngrain",
+            "DoMoveSwallow",
+            "DoMoveCurse",
+            "DoMoveSuperpower",
+            "DoMoveSteelWing",
+            "DoMoveSpitUp",
+            "DoMoveDynamicPunch",
+            "DoMoveKnockOff",
+            "DoMoveSplash",
+            "DoMoveSetDamage",
+            "DoMoveBellyDrum",
+            "DoMoveLightScreen",
+            "DoMoveSecretPower",
+            "DoMoveDamageConfuse30",
+            "DoMoveBulkUp",
+            "DoMovePause",
+            "DoMoveFeatherDance",
+            "DoMoveBeatUp",
+            "DoMoveBlastBurn",
+            "DoMoveCrushClaw",
+            "DoMoveBlazeKick",
+            "DoMovePresent",
+            "DoMoveEruption",
+            "DoMoveTransform",
+            "DoMovePoisonTail",
+            "DoMoveBlowback",
+            "DoMoveCamouflage",
+            "DoMoveTailGlow",
+            "DoMoveDamageConstrict10",
+            "DoMovePerishSong",
+            "DoMoveWrap",
+            "DoMoveSpikes",
+            "DoMoveMagnitude",
+            "DoMoveMagicCoat",
+            "DoMoveProtect",
+            "DoMoveDefenseCurl",
+            "DoMoveDecoy",
+            "DoMoveMistBall",
+            "DoMoveDestinyBond",
+            "DoMoveMirrorCoat",
+            "DoMoveCalmMind",
+            "DoMoveHiddenPower",
+            "DoMoveMetalClaw",
+            "DoMoveAttract",
+            "DoMoveCopycat",
+            "DoMoveFrustration",
+            "DoMoveLeechSeed",
+            "DoMoveMetronome",
+            "DoMoveDreamEater",
+            "DoMoveSnatch",
+            "DoMoveRecycle",
+            "DoMoveReflect",
+            "DoMoveDragonRage",
+            "DoMoveDragonDance",
+            "DoMoveSkullBash",
+            "DoMoveDamageLowerSpecialDefense50",
+            "DoMoveStruggle",
+            "DoMoveRockSmash",
+            "DoMoveSeeTrap",
+            "DoMoveTakeaway",
+            "DoMoveRebound",
+            "DoMoveSwitchPositions",
+            "DoMoveStayAway",
+            "DoMoveCleanse",
+            "DoMoveSiesta",
+            "DoMoveTwoEdge",
+            "DoMoveNoMove",
+            "DoMoveScan",
+            "DoMovePowerEars",
+            "DoMoveTransfer",
+            "DoMoveSlowDown",
+            "DoMoveSearchlight",
+            "DoMovePetrify",
+            "DoMovePounce",
+            "DoMoveTrawl",
+            "DoMoveEscape",
+            "DoMoveDrought",
+            "DoMoveTrapBuster",
+            "DoMoveWildCall",
+            "DoMoveInvisify",
+            "DoMoveOneShot",
+            "DoMoveHpGauge",
+            "DoMoveVacuumCut",
+            "DoMoveReviver",
+            "DoMoveShocker",
+            "DoMoveEcho",
+            "DoMoveFamish",
+            "DoMoveOneRoom",
+            "DoMoveFillIn",
+            "DoMoveTrapper",
+            "DoMoveItemize",
+            "DoMoveHurl",
+            "DoMoveMobile",
+            "DoMoveSeeStairs",
+            "DoMoveLongToss",
+            "DoMovePierce",
+            "DoMoveHammerArm",
+            "DoMoveAquaRing",
+            "DoMoveGastroAcid",
+            "DoMoveHealingWish",
+            "DoMoveCloseCombat",
+            "DoMoveLuckyChant",
+            "DoMoveGuardSwap",
+            "DoMoveHealOrder",
+            "DoMoveHealBlock",
+            "DoMoveThunderFang",
+            "DoMoveDefog",
+            "DoMoveTrumpCard",
+            "DoMoveIceFang",
+            "DoMovePsychoShift",
+            "DoMoveEmbargo",
+            "DoMoveBrine",
+            "DoMoveNaturalGift",
+            "DoMoveGyroBall",
+            "DoMoveShadowForce",
+            "DoMoveGravity",
+            "DoMoveStealthRock",
+            "DoMoveChargeBeam",
+            "DoMoveDamageEatItem",
+            "DoMoveAcupressure",
+            "DoMoveMagnetRise",
+            "DoMoveToxicSpikes",
+            "DoMoveLastResort",
+            "DoMoveTrickRoom",
+            "DoMoveWorrySeed",
+            "DoMoveDamageHpDependent",
+            "DoMoveHeartSwap",
+            "DoMoveRoost",
+            "DoMovePowerSwap",
+            "DoMovePowerTrick",
+            "DoMoveFeint",
+            "DoMoveFlareBlitz",
+            "DoMoveDefendOrder",
+            "DoMoveFireFang",
+            "DoMoveLunarDance",
+            "DoMoveMiracleEye",
+            "DoMoveWakeUpSlap",
+            "DoMoveMetalBurst",
+            "DoMoveHeadSmash",
+            "DoMoveCaptivate",
+            "DoMoveLeafStorm",
+            "DoMoveDracoMeteor",
+            "DoMoveRockPolish",
+            "DoMoveNastyPlot",
+            "DoMoveTag0x1AB",
+            "DoMoveTag0x1A6",
+            "DoMoveTag0x1A7",
+            "MAX_HP_CAP_MOVE_EFFECTS",
+            "LUNAR_DANCE_PP_RESTORATION",
+            "TOP_MENU_MUSIC_ID",
+            "CreateMainMenus",
+            "AddMainMenuOption",
+            "AddSubMenuOption",
+            "ProcessContinueScreenContents",
+            "PRINTS_STRINGS",
+            "PRINTS_STRUCT",
+            "MAIN_MENU_WINDOW_PARAMS_1",
+            "MAIN_MENU_WINDOW_PARAMS_2",
+            "MAIN_MENU_WINDOW_PARAMS_3",
+            "MAIN_MENU_WINDOW_PARAMS_4",
+            "CONTINUE_CHOICE",
+            "SUBMENU",
+            "MAIN_MENU",
+            "MAIN_MENU_WINDOW_PARAMS_5",
+            "MAIN_MENU_WINDOW_PARAMS_6",
+            "MAIN_MENU_WINDOW_PARAMS_7",
+            "MAIN_MENU_ITEMS_CONFIRM",
+            "MAIN_MENU_WINDOW_PARAMS_8",
+            "MAIN_MENU_WINDOW_PARAMS_9",
+            "MAIN_DEBUG_MENU_ITEMS_1",
+            "MAIN_MENU_WINDOW_PARAMS_10",
+            "MAIN_DEBUG_MENU_ITEMS_2",
+            "CreateInventoryMenu",
+            "SetInventoryMenuState0",
+            "SetInventoryMenuState6",
+            "CloseInventoryMenu",
+            "IsInventoryMenuActive",
+            "CheckInventoryMenuField0x1A0",
+            "PopInventoryMenuField0x1A3",
+            "UpdateInventoryMenu",
+            "IsInventoryMenuState3",
+            "GetEffectAnimationField0x19",
+            "AnimationHasMoreFrames",
+            "GetEffectAnimation",
+            "GetMoveAnimation",
+            "GetSpecialMonsterMoveAnimation",
+            "GetTrapAnimation",
+            "GetItemAnimation1",
+            "GetItemAnimation2",
+            "GetMoveAnimationSpeed",
+            "DrawTeamStats",
+            "UpdateTeamStats",
+            "FreeTeamStats",
+            "FreeMapAndTeam",
+            "ProcessTeamStatsLvHp",
+            "ProcessTeamStatsNameGender",
+            "IsBackgroundTileset",
+            "InitTilesetBuffer",
+            "MainGame",
+            "INVENTORY_MENU_DEFAULT_WINDOW_PARAMS",
+            "FIRST_DUNGEON_WITH_MONSTER_HOUSE_TRAPS",
+            "BAD_POISON_DAMAGE_COOLDOWN",
+            "PROTEIN_STAT_BOOST",
+            "WATERFALL_CRINGE_CHANCE",
+            "AURORA_BEAM_LOWER_ATTACK_CHANCE",
+            "SPAWN_CAP_NO_MONSTER_HOUSE",
+            "OREN_BERRY_DAMAGE",
+            "IRON_TAIL_LOWER_DEFENSE_CHANCE",
+            "TWINEEDLE_POISON_CHANCE",
+            "EXTRASENSORY_CRINGE_CHANCE",
+            "ROCK_SLIDE_CRINGE_CHANCE",
+            "CRUNCH_LOWER_DEFENSE_CHANCE",
+            "FOREWARN_FORCED_MISS_CHANCE",
+            "UNOWN_STONE_DROP_CHANCE",
+            "SITRUS_BERRY_HP_RESTORATION",
+            "MUDDY_WATER_LOWER_ACCURACY_CHANCE",
+            "SILVER_WIND_BOOST_CHANCE",
+            "POISON_TAIL_POISON_CHANCE",
+            "THUNDERSHOCK_PARALYZE_CHANCE",
+            "BOUNCE_PARALYZE_CHANCE",
+            "HEADBUTT_CRINGE_CHANCE",
+            "FIRE_FANG_CRINGE_CHANCE",
+            "SACRED_FIRE_BURN_CHANCE",
+            "WHIRLPOOL_CONSTRICTION_CHANCE",
+            "EXP_ELITE_EXP_BOOST",
+            "MONSTER_HOUSE_MAX_NON_MONSTER_SPAWNS",
+            "HEAL_ORDER_HP_RESTORATION",
+            "STEEL_WING_BOOST_DEFENSE_CHANCE",
+            "GOLD_THORN_POWER",
+            "BURN_DAMAGE",
+            "POISON_DAMAGE",
+            "SPAWN_COOLDOWN",
+            "MIST_BALL_LOWER_SPECIAL_ATTACK_CHANCE",
+            "CHARGE_BEAM_BOOST_SPECIAL_ATTACK_CHANCE",
+            "ORAN_BERRY_FULL_HP_BOOST",
+            "LIFE_SEED_HP_BOOST",
+            "OCTAZOOKA_LOWER_ACCURACY_CHANCE",
+            "LUSTER_PURGE_LOWER_SPECIAL_DEFENSE_CHANCE",
+            "SUPER_LUCK_CRIT_RATE_BOOST",
+            "CONSTRICT_LOWER_SPEED_CHANCE",
+            "ICE_FANG_FREEZE_CHANCE",
+            "SMOG_POISON_CHANCE",
+            "LICK_PARALYZE_CHANCE",
+            "THUNDER_FANG_PARALYZE_CHANCE",
+            "BITE_CRINGE_CHANCE",
+            "SKY_ATTACK_CRINGE_CHANCE",
+            "ICE_FANG_CRINGE_CHANCE",
+            "BLAZE_KICK_BURN_CHANCE",
+            "FLAMETHROWER_BURN_CHANCE",
+            "DIZZY_PUNCH_CONFUSE_CHANCE",
+            "SECRET_POWER_EFFECT_CHANCE",
+            "METAL_CLAW_BOOST_ATTACK_CHANCE",
+            "TECHNICIAN_MOVE_POWER_THRESHOLD",
+            "SONICBOOM_FIXED_DAMAGE",
+            "RAIN_ABILITY_BONUS_REGEN",
+            "LEECH_SEED_HP_DRAIN",
+            "EXCLUSIVE_ITEM_EXP_BOOST",
+            "AFTERMATH_CHANCE",
+            "SET_DAMAGE_STATUS_DAMAGE",
+            "INTIMIDATOR_ACTIVATION_CHANCE",
+            "TYPE_ADVANTAGE_MASTER_CRIT_RATE",
+            "ORAN_BERRY_HP_RESTORATION",
+            "SITRUS_BERRY_FULL_HP_BOOST",
+            "SNORE_CRINGE_CHANCE",
+            "METEOR_MASH_BOOST_ATTACK_CHANCE",
+            "CRUSH_CLAW_LOWER_DEFENSE_CHANCE",
+            "BURN_DAMAGE_COOLDOWN",
+            "SHADOW_BALL_LOWER_SPECIAL_DEFENSE_CHANCE",
+            "STICK_POWER",
+            "BUBBLE_LOWER_SPEED_CHANCE",
+            "ICE_BODY_BONUS_REGEN",
+            "POWDER_SNOW_FREEZE_CHANCE",
+            "POISON_STING_POISON_CHANCE",
+            "SPAWN_COOLDOWN_THIEF_ALERT",
+            "POISON_FANG_POISON_CHANCE",
+            "WEATHER_MOVE_TURN_COUNT",
+            "THUNDER_PARALYZE_CHANCE",
+            "THUNDERBOLT_PARALYZE_CHANCE",
+            "MONSTER_HOUSE_MAX_MONSTER_SPAWNS",
+            "TWISTER_CRINGE_CHANCE",
+            "SPEED_BOOST_TURNS",
+            "FAKE_OUT_CRINGE_CHANCE",
+            "THUNDER_FANG_CRINGE_CHANCE",
+            "FLARE_BLITZ_BURN_CHANCE",
+            "FLAME_WHEEL_BURN_CHANCE",
+            "PSYBEAM_CONFUSE_CHANCE",
+            "TRI_ATTACK_STATUS_CHANCE",
+            "MIRACLE_CHEST_EXP_BOOST",
+            "WONDER_CHEST_EXP_BOOST",
+            "SPAWN_CAP_WITH_MONSTER_HOUSE",
+            "POISON_DAMAGE_COOLDOWN",
+            "LEECH_SEED_DAMAGE_COOLDOWN",
+            "THROWN_ITEM_HIT_CHANCE",
+            "GEO_PEBBLE_DAMAGE",
+            "GRAVELEROCK_DAMAGE",
+            "RARE_FOSSIL_DAMAGE",
+            "GINSENG_CHANCE_3",
+            "ZINC_STAT_BOOST",
+            "IRON_STAT_BOOST",
+            "CALCIUM_STAT_BOOST",
+            "WISH_BONUS_REGEN",
+            "DRAGON_RAGE_FIXED_DAMAGE",
+            "CORSOLA_TWIG_POWER",
+            "CACNEA_SPIKE_POWER",
+            "GOLD_FANG_POWER",
+            "SILVER_SPIKE_POWER",
+            "IRON_THORN_POWER",
+            "SCOPE_LENS_CRIT_RATE_BOOST",
+            "HEALING_WISH_HP_RESTORATION",
+            "ME_FIRST_MULTIPLIER",
+            "FACADE_DAMAGE_MULTIPLIER",
+            "IMPRISON_TURN_RANGE",
+            "SLEEP_TURN_RANGE",
+            "NIGHTMARE_TURN_RANGE",
+            "BURN_DAMAGE_MULTIPLIER",
+            "REST_TURN_RANGE",
+            "MATCHUP_SUPER_EFFECTIVE_MULTIPLIER_ERRATIC_PLAYER",
+            "MATCHUP_IMMUNE_MULTIPLIER",
+            "SPORT_CONDITION_TURN_RANGE",
+            "SURE_SHOT_TURN_RANGE",
+            "DETECT_BAND_MOVE_ACCURACY_DROP",
+            "TINTED_LENS_MULTIPLIER",
+            "SMOKESCREEN_TURN_RANGE",
+            "PERISH_SONG_TURN_RANGE",
+            "SHADOW_FORCE_DAMAGE_MULTIPLIER",
+            "DIG_DAMAGE_MULTIPLIER",
+            "DIVE_DAMAGE_MULTIPLIER",
+            "BOUNCE_DAMAGE_MULTIPLIER",
+            "POWER_PITCHER_DAMAGE_MULTIPLIER",
+            "QUICK_DODGER_MOVE_ACCURACY_DROP",
+            "MATCHUP_NOT_VERY_EFFECTIVE_MULTIPLIER",
+            "MATCHUP_SUPER_EFFECTIVE_MULTIPLIER",
+            "MATCHUP_NEUTRAL_MULTIPLIER",
+            "MATCHUP_IMMUNE_MULTIPLIER_ERRATIC_PLAYER",
+            "MATCHUP_NOT_VERY_EFFECTIVE_MULTIPLIER_ERRATIC_PLAYER",
+            "MATCHUP_NEUTRAL_MULTIPLIER_ERRATIC_PLAYER",
+            "AIR_BLADE_DAMAGE_MULTIPLIER",
+            "KECLEON_SHOP_BOOST_CHANCE_MULTIPLIER",
+            "HIDDEN_STAIRS_SPAWN_CHANCE_MULTIPLIER",
+            "YAWN_TURN_RANGE",
+            "SPEED_BOOST_TURN_RANGE",
+            "SOLARBEAM_DAMAGE_MULTIPLIER",
+            "SKY_ATTACK_DAMAGE_MULTIPLIER",
+            "RAZOR_WIND_DAMAGE_MULTIPLIER",
+            "FOCUS_PUNCH_DAMAGE_MULTIPLIER",
+            "SKULL_BASH_DAMAGE_MULTIPLIER",
+            "FLY_DAMAGE_MULTIPLIER",
+            "WEATHER_BALL_TYPE_TABLE",
+            "LAST_RESORT_DAMAGE_MULT_TABLE",
+            "SYNTHESIS_HP_RESTORATION_TABLE",
+            "ROOST_HP_RESTORATION_TABLE",
+            "MOONLIGHT_HP_RESTORATION_TABLE",
+            "MORNING_SUN_HP_RESTORATION_TABLE",
+            "REVERSAL_DAMAGE_MULT_TABLE",
+            "WATER_SPOUT_DAMAGE_MULT_TABLE",
+            "WRING_OUT_DAMAGE_MULT_TABLE",
+            "ERUPTION_DAMAGE_MULT_TABLE",
+            "WEATHER_BALL_DAMAGE_MULT_TABLE",
+            "EAT_ITEM_EFFECT_IGNORE_LIST",
+            "CASTFORM_WEATHER_ATTRIBUTE_TABLE",
+            "BAD_POISON_DAMAGE_TABLE",
+            "TYPE_MATCHUP_COMBINATOR_TABLE",
+            "OFFENSIVE_STAT_STAGE_MULTIPLIERS",
+            "DEFENSIVE_STAT_STAGE_MULTIPLIERS",
+            "NATURE_POWER_TABLE",
+            "APPLES_AND_BERRIES_ITEM_IDS",
+            "RECRUITMENT_LEVEL_BOOST_TABLE",
+            "NATURAL_GIFT_ITEM_TABLE",
+            "RANDOM_MUSIC_ID_TABLE",
+            "SHOP_ITEM_CHANCES",
+            "MALE_ACCURACY_STAGE_MULTIPLIERS",
+            "MALE_EVASION_STAGE_MULTIPLIERS",
+            "FEMALE_ACCURACY_STAGE_MULTIPLIERS",
+            "FEMALE_EVASION_STAGE_MULTIPLIERS",
+            "MUSIC_ID_TABLE",
+            "TYPE_MATCHUP_TABLE",
+            "FIXED_ROOM_MONSTER_SPAWN_STATS_TABLE",
+            "METRONOME_TABLE",
+            "TILESET_PROPERTIES",
+            "FIXED_ROOM_PROPERTIES_TABLE",
+            "TRAP_ANIMATION_INFO",
+            "ITEM_ANIMATION_INFO",
+            "MOVE_ANIMATION_INFO",
+            "EFFECT_ANIMATION_INFO",
+            "SPECIAL_MONSTER_MOVE_ANIMATION_INFO",
+            "DEFEAT_ITEM_LOSS_CHANCE",
+            "UnlockScriptingLock",
+            "FuncThatCallsRunNextOpcode",
+            "RunNextOpcode",
+            "HandleUnlocks",
+            "LoadFileFromRomVeneer",
+            "SsbLoad2",
+            "ScriptParamToInt",
+            "ScriptParamToFixedPoint16",
+            "StationLoadHanger",
+            "ScriptStationLoadTalk",
+            "SsbLoad1",
+            "ScriptSpecialProcessCall",
+            "GetCoroutineInfo",
+            "GetSpecialRecruitmentSpecies",
+            "PrepareMenuAcceptTeamMember",
+            "InitRandomNpcJobs",
+            "GetRandomNpcJobType",
+            "GetRandomNpcJobSubtype",
+            "GetRandomNpcJobStillAvailable",
+            "AcceptRandomNpcJob",
+            "GroundMainLoop",
+            "GetAllocArenaGround",
+            "GetFreeArenaGround",
+            "GroundMainReturnDungeon",
+            "GroundMainNextDay",
+            "JumpToTitleScreen",
+            "ReturnToTitleScreen",
+            "ScriptSpecialProcess0x16",
+            "IsScreenFadeInProgress",
+            "LoadBackgroundAttributes",
+            "LoadMapType10",
+            "LoadMapType11",
+            "GetSpecialLayoutBackground",
+            "SetAnimDataFields",
+            "SetAnimDataFieldsWrapper",
+            "InitAnimDataFromOtherAnimData",
+            "SetAnimDataFields2",
+            "GetIdleAnimationType",
+            "LoadObjectAnimData",
+            "InitAnimDataFromOtherAnimDataVeneer",
+            "AnimRelatedFunction",
+            "AllocAndInitPartnerFollowDataAndLiveActorList",
+            "InitPartnerFollowDataAndLiveActorList",
+            "DeleteLiveActor",
+            "ChangeActorAnimation",
+            "InitPartnerFollowData",
+            "GetDirectionLiveActor",
+            "SetDirectionLiveActor",
+            "CreateTeamInfoBox",
+            "CloseTeamInfoBox",
+            "IsTeamInfoBoxActive",
+            "UpdateTeamInfoBox",
+            "CreateTopGroundMenu",
+            "CloseTopGroundMenu",
+            "UpdateTopGroundMenu",
+            "IsBagNotEmpty",
+            "GetExclusiveItemRequirements",
+            "HandleControlsTopScreenGround",
+            "GetDungeonMapPos",
+            "WorldMapSetMode",
+            "WorldMapSetCamera",
+            "StatusUpdate",
+            "HandleTeamStatsGround",
+            "OVERLAY11_UNKNOWN_TABLE__NA_2316A38",
+            "SCRIPT_COMMAND_PARSING_DATA",
+            "SCRIPT_OP_CODE_NAMES",
+            "SCRIPT_OP_CODES",
+            "OVERLAY11_DEBUG_STRINGS",
+            "C_ROUTINE_NAMES",
+            "C_ROUTINES",
+            "GROUND_WEATHER_TABLE",
+            "GROUND_WAN_FILES_TABLE",
+            "OBJECTS",
+            "RECRUITMENT_TABLE_LOCATIONS",
+            "RECRUITMENT_TABLE_LEVELS",
+            "RECRUITMENT_TABLE_SPECIES",
+            "LEVEL_TILEMAP_LIST",
+            "SETANIMATION_TABLE",
+            "TEAM_INFO_BOX_DEFAULT_WINDOW_PARAMS",
+            "OVERLAY11_OVERLAY_LOAD_TABLE",
+            "UNIONALL_RAM_ADDRESS",
+            "GROUND_STATE_MAP",
+            "GROUND_STATE_WEATHER",
+            "GROUND_STATE_PTRS",
+            "WORLD_MAP_MODE",
+            "EntryOverlay13",
+            "ExitOverlay13",
+            "Overlay13SwitchFunctionNa238A1C8",
+            "Overlay13SwitchFunctionNa238A574",
+            "GetPersonality",
+            "GetOptionStringFromID",
+            "WaitForNextStep",
+            "QUIZ_BORDER_COLOR_TABLE",
+            "PORTRAIT_ATTRIBUTES",
+            "QUIZ_MALE_FEMALE_BOOST_TABLE",
+            "OVERLAY13_UNKNOWN_STRUCT__NA_238C024",
+            "QUIZ_WINDOW_PARAMS_1",
+            "QUIZ_WINDOW_PARAMS_2",
+            "QUIZ_WINDOW_PARAMS_3",
+            "QUIZ_WINDOW_PARAMS_4",
+            "QUIZ_MENU_ITEMS_1",
+            "STARTERS_PARTNER_IDS",
+            "STARTERS_HERO_IDS",
+            "STARTERS_TYPE_INCOMPATIBILITY_TABLE",
+            "STARTERS_STRINGS",
+            "QUIZ_QUESTION_STRINGS",
+            "QUIZ_ANSWER_STRINGS",
+            "QUIZ_ANSWER_POINTS",
+            "OVERLAY13_RESERVED_SPACE",
+            "OVERLAY13_UNKNOWN_POINTER__NA_238CEA0",
+            "OVERLAY13_UNKNOWN_POINTER__NA_238CEA4",
+            "OVERLAY13_UNKNOWN_POINTER__NA_238CEA8",
+            "QUIZ_WINDOW_PARAMS_5",
+            "QUIZ_WINDOW_PARAMS_6",
+            "QUIZ_DEBUG_MENU_ITEMS",
+            "OVERLAY13_UNKNOWN_STRUCT__NA_238CF14",
+            "QUIZ_QUESTION_ANSWER_ASSOCIATIONS",
+            "SentrySetupState",
+            "SentryUpdateDisplay",
+            "SentrySetExitingState",
+            "SentryRunState",
+            "SentrySetStateIntermediate",
+            "SentryState0",
+            "SentryState1",
+            "SentryState2",
+            "SentryState3",
+            "SentryState4",
+            "SentryStateExit",
+            "SentryState6",
+            "SentryState7",
+            "SentryState8",
+            "SentryState9",
+            "SentryStateA",
+            "SentryStateB",
+            "SentryStateGenerateChoices",
+            "SentryStateGetUserChoice",
+            "SentryStateFinalizeRound",
+            "SentryStateF",
+            "SentryState10",
+            "SentryState11",
+            "SentryState12",
+            "SentryState13",
+            "SentryState14",
+            "SentryState15",
+            "SentryState16",
+            "SentryState17",
+            "SentryState18",
+            "SentryState19",
+            "SentryState1A",
+            "SentryStateFinalizePoints",
+            "SentryState1C",
+            "SentryState1D",
+            "SentryState1E",
+            "SentryState1F",
+            "SentryState20",
+            "SentryState21",
+            "SENTRY_DUTY_STRUCT_SIZE",
+            "SENTRY_LOUDRED_MONSTER_ID",
+            "STRING_ID_SENTRY_TOP_SESSIONS",
+            "STRING_ID_SENTRY_INSTRUCTIONS",
+            "STRING_ID_SENTRY_HERE_COMES",
+            "STRING_ID_SENTRY_WHOSE_FOOTPRINT",
+            "STRING_ID_SENTRY_TRY_AGAIN",
+            "STRING_ID_SENTRY_OUT_OF_TIME",
+            "STRING_ID_SENTRY_FOOTPRINT_IS_6EE",
+            "STRING_ID_SENTRY_COME_IN_6EF",
+            "STRING_ID_SENTRY_WRONG",
+            "STRING_ID_SENTRY_BUCK_UP",
+            "STRING_ID_SENTRY_FOOTPRINT_IS_6EC",
+            "STRING_ID_SENTRY_COME_IN_6ED",
+            "STRING_ID_SENTRY_KEEP_YOU_WAITING",
+            "STRING_ID_SENTRY_THATLL_DO_IT",
+            "SENTRY_CHATOT_MONSTER_ID",
+            "STRING_ID_SENTRY_NO_MORE_VISITORS",
+            "STRING_ID_SENTRY_THATS_ALL",
+            "SENTRY_GROVYLE_MONSTER_ID",
+            "SENTRY_DEBUG_MENU_ITEMS",
+            "SENTRY_DUTY_PTR",
+            "SENTRY_DUTY_STATE_HANDLER_TABLE",
+            "BANK_MAIN_MENU_ITEMS",
+            "BANK_WINDOW_PARAMS_1",
+            "BANK_WINDOW_PARAMS_2",
+            "BANK_WINDOW_PARAMS_3",
+            "BANK_WINDOW_PARAMS_4",
+            "BANK_WINDOW_PARAMS_5",
+            "OVERLAY15_RESERVED_SPACE",
+            "OVERLAY15_UNKNOWN_POINTER__NA_238B180",
+            "EVO_MENU_ITEMS_CONFIRM",
+            "EVO_SUBMENU_ITEMS",
+            "EVO_MAIN_MENU_ITEMS",
+            "EVO_MENU_STRING_IDS",
+            "EVO_WINDOW_PARAMS_1",
+            "EVO_WINDOW_PARAMS_2",
+            "EVO_WINDOW_PARAMS_3",
+            "EVO_WINDOW_PARAMS_4",
+            "EVO_WINDOW_PARAMS_5",
+            "EVO_WINDOW_PARAMS_6",
+            "EVO_WINDOW_PARAMS_7",
+            "OVERLAY16_RESERVED_SPACE",
+            "OVERLAY16_UNKNOWN_POINTER__NA_238CE40",
+            "OVERLAY16_UNKNOWN_POINTER__NA_238CE58",
+            "ASSEMBLY_WINDOW_PARAMS_1",
+            "ASSEMBLY_WINDOW_PARAMS_2",
+            "ASSEMBLY_WINDOW_PARAMS_3",
+            "ASSEMBLY_WINDOW_PARAMS_4",
+            "ASSEMBLY_WINDOW_PARAMS_5",
+            "ASSEMBLY_MENU_ITEMS_CONFIRM",
+            "ASSEMBLY_MAIN_MENU_ITEMS_1",
+            "ASSEMBLY_MAIN_MENU_ITEMS_2",
+            "ASSEMBLY_SUBMENU_ITEMS_1",
+            "ASSEMBLY_SUBMENU_ITEMS_2",
+            "ASSEMBLY_SUBMENU_ITEMS_3",
+            "ASSEMBLY_SUBMENU_ITEMS_4",
+            "ASSEMBLY_SUBMENU_ITEMS_5",
+            "ASSEMBLY_SUBMENU_ITEMS_6",
+            "ASSEMBLY_SUBMENU_ITEMS_7",
+            "OVERLAY17_FUNCTION_POINTER_TABLE",
+            "OVERLAY17_RESERVED_SPACE",
+            "OVERLAY17_UNKNOWN_POINTER__NA_238BE00",
+            "OVERLAY17_UNKNOWN_POINTER__NA_238BE04",
+            "OVERLAY17_UNKNOWN_POINTER__NA_238BE08",
+            "LINK_SHOP_WINDOW_PARAMS_1",
+            "LINK_SHOP_WINDOW_PARAMS_2",
+            "LINK_SHOP_WINDOW_PARAMS_3",
+            "LINK_SHOP_WINDOW_PARAMS_4",
+            "LINK_SHOP_WINDOW_PARAMS_5",
+            "LINK_SHOP_WINDOW_PARAMS_6",
+            "LINK_SHOP_WINDOW_PARAMS_7",
+            "LINK_SHOP_WINDOW_PARAMS_8",
+            "LINK_SHOP_WINDOW_PARAMS_9",
+            "LINK_SHOP_WINDOW_PARAMS_10",
+            "LINK_SHOP_WINDOW_PARAMS_11",
+            "LINK_SHOP_MENU_ITEMS_CONFIRM",
+            "LINK_SHOP_SUBMENU_ITEMS_1",
+            "LINK_SHOP_SUBMENU_ITEMS_2",
+            "LINK_SHOP_MAIN_MENU_ITEMS",
+            "LINK_SHOP_SUBMENU_ITEMS_3",
+            "LINK_SHOP_SUBMENU_ITEMS_4",
+            "LINK_SHOP_SUBMENU_ITEMS_5",
+            "LINK_SHOP_SUBMENU_ITEMS_6",
+            "LINK_SHOP_SUBMENU_ITEMS_7",
+            "OVERLAY18_FUNCTION_POINTER_TABLE",
+            "OVERLAY18_RESERVED_SPACE",
+            "OVERLAY18_UNKNOWN_POINTER__NA_238D620",
+            "OVERLAY18_UNKNOWN_POINTER__NA_238D624",
+            "OVERLAY18_UNKNOWN_POINTER__NA_238D628",
+            "GetBarItem",
+            "GetRecruitableMonsterAll",
+            "GetRecruitableMonsterList",
+            "GetRecruitableMonsterListRestricted",
+            "OVERLAY19_UNKNOWN_TABLE__NA_238DAE0",
+            "BAR_UNLOCKABLE_DUNGEONS_TABLE",
+            "BAR_RECRUITABLE_MONSTER_TABLE",
+            "BAR_AVAILABLE_ITEMS",
+            "OVERLAY19_UNKNOWN_STRING_IDS__NA_238E178",
+            "OVERLAY19_UNKNOWN_STRUCT__NA_238E1A4",
+            "OVERLAY19_UNKNOWN_STRING_IDS__NA_238E1CC",
+            "BAR_WINDOW_PARAMS_1",
+            "BAR_WINDOW_PARAMS_2",
+            "BAR_WINDOW_PARAMS_3",
+            "BAR_MENU_ITEMS_CONFIRM_1",
+            "BAR_MENU_ITEMS_CONFIRM_2",
+            "OVERLAY19_UNKNOWN_STRING_IDS__NA_238E238",
+            "BAR_MAIN_MENU_ITEMS",
+            "BAR_SUBMENU_ITEMS_1",
+            "BAR_SUBMENU_ITEMS_2",
+            "OVERLAY19_RESERVED_SPACE",
+            "OVERLAY19_UNKNOWN_POINTER__NA_238E360",
+            "OVERLAY19_UNKNOWN_POINTER__NA_238E364",
+            "OVERLAY20_UNKNOWN_POINTER__NA_238CF7C",
+            "RECYCLE_MENU_ITEMS_CONFIRM_1",
+            "RECYCLE_MENU_ITEMS_CONFIRM_2",
+            "RECYCLE_SUBMENU_ITEMS_1",
+            "RECYCLE_SUBMENU_ITEMS_2",
+            "RECYCLE_MAIN_MENU_ITEMS_1",
+            "OVERLAY20_UNKNOWN_TABLE__NA_238D014",
+            "RECYCLE_WINDOW_PARAMS_1",
+            "RECYCLE_WINDOW_PARAMS_2",
+            "RECYCLE_WINDOW_PARAMS_3",
+            "RECYCLE_WINDOW_PARAMS_4",
+            "RECYCLE_WINDOW_PARAMS_5",
+            "RECYCLE_WINDOW_PARAMS_6",
+            "RECYCLE_MAIN_MENU_ITEMS_2",
+            "RECYCLE_WINDOW_PARAMS_7",
+            "RECYCLE_WINDOW_PARAMS_8",
+            "RECYCLE_WINDOW_PARAMS_9",
+            "RECYCLE_WINDOW_PARAMS_10",
+            "RECYCLE_WINDOW_PARAMS_11",
+            "RECYCLE_MAIN_MENU_ITEMS_3",
+            "OVERLAY20_RESERVED_SPACE",
+            "OVERLAY20_UNKNOWN_POINTER__NA_238D120",
+            "OVERLAY20_UNKNOWN_POINTER__NA_238D124",
+            "OVERLAY20_UNKNOWN_POINTER__NA_238D128",
+            "OVERLAY20_UNKNOWN_POINTER__NA_238D12C",
+            "SWAP_SHOP_WINDOW_PARAMS_1",
+            "SWAP_SHOP_MENU_ITEMS_CONFIRM",
+            "SWAP_SHOP_SUBMENU_ITEMS_1",
+            "SWAP_SHOP_SUBMENU_ITEMS_2",
+            "SWAP_SHOP_MAIN_MENU_ITEMS_1",
+            "SWAP_SHOP_MAIN_MENU_ITEMS_2",
+            "SWAP_SHOP_SUBMENU_ITEMS_3",
+            "OVERLAY21_UNKNOWN_STRING_IDS",
+            "SWAP_SHOP_WINDOW_PARAMS_2",
+            "SWAP_SHOP_WINDOW_PARAMS_3",
+            "SWAP_SHOP_WINDOW_PARAMS_4",
+            "SWAP_SHOP_WINDOW_PARAMS_5",
+            "SWAP_SHOP_WINDOW_PARAMS_6",
+            "SWAP_SHOP_WINDOW_PARAMS_7",
+            "SWAP_SHOP_WINDOW_PARAMS_8",
+            "SWAP_SHOP_WINDOW_PARAMS_9",
+            "OVERLAY21_JP_STRING",
+            "OVERLAY21_RESERVED_SPACE",
+            "OVERLAY21_UNKNOWN_POINTER__NA_238CF40",
+            "OVERLAY21_UNKNOWN_POINTER__NA_238CF44",
+            "SHOP_WINDOW_PARAMS_1",
+            "SHOP_WINDOW_PARAMS_2",
+            "OVERLAY22_UNKNOWN_STRUCT__NA_238E85C",
+            "SHOP_MENU_ITEMS_CONFIRM",
+            "SHOP_MAIN_MENU_ITEMS_1",
+            "SHOP_MAIN_MENU_ITEMS_2",
+            "SHOP_MAIN_MENU_ITEMS_3",
+            "OVERLAY22_UNKNOWN_STRING_IDS",
+            "SHOP_WINDOW_PARAMS_3",
+            "SHOP_WINDOW_PARAMS_4",
+            "SHOP_WINDOW_PARAMS_5",
+            "SHOP_WINDOW_PARAMS_6",
+            "SHOP_WINDOW_PARAMS_7",
+            "SHOP_WINDOW_PARAMS_8",
+            "SHOP_WINDOW_PARAMS_9",
+            "SHOP_WINDOW_PARAMS_10",
+            "OVERLAY22_RESERVED_SPACE",
+            "OVERLAY22_UNKNOWN_POINTER__NA_238EC60",
+            "OVERLAY22_UNKNOWN_POINTER__NA_238EC64",
+            "OVERLAY22_UNKNOWN_POINTER__NA_238EC68",
+            "OVERLAY22_UNKNOWN_POINTER__NA_238EC6C",
+            "OVERLAY22_UNKNOWN_POINTER__NA_238EC70",
+            "OVERLAY23_UNKNOWN_VALUE__NA_238D2E8",
+            "OVERLAY23_UNKNOWN_VALUE__NA_238D2EC",
+            "OVERLAY23_UNKNOWN_STRUCT__NA_238D2F0",
+            "STORAGE_MENU_ITEMS_CONFIRM",
+            "STORAGE_MAIN_MENU_ITEMS_1",
+            "STORAGE_MAIN_MENU_ITEMS_2",
+            "STORAGE_MAIN_MENU_ITEMS_3",
+            "STORAGE_MAIN_MENU_ITEMS_4",
+            "OVERLAY23_UNKNOWN_STRING_IDS",
+            "STORAGE_WINDOW_PARAMS_1",
+            "STORAGE_WINDOW_PARAMS_2",
+            "STORAGE_WINDOW_PARAMS_3",
+            "STORAGE_WINDOW_PARAMS_4",
+            "STORAGE_WINDOW_PARAMS_5",
+            "STORAGE_WINDOW_PARAMS_6",
+            "STORAGE_WINDOW_PARAMS_7",
+            "STORAGE_WINDOW_PARAMS_8",
+            "OVERLAY23_RESERVED_SPACE",
+            "OVERLAY23_UNKNOWN_POINTER__NA_238D8A0",
+            "OVERLAY24_UNKNOWN_STRUCT__NA_238C508",
+            "OVERLAY24_UNKNOWN_STRUCT__NA_238C514",
+            "DAYCARE_MENU_ITEMS_CONFIRM",
+            "DAYCARE_MAIN_MENU_ITEMS",
+            "OVERLAY24_UNKNOWN_STRING_IDS",
+            "DAYCARE_WINDOW_PARAMS_1",
+            "DAYCARE_WINDOW_PARAMS_2",
+            "DAYCARE_WINDOW_PARAMS_3",
+            "DAYCARE_WINDOW_PARAMS_4",
+            "DAYCARE_WINDOW_PARAMS_5",
+            "OVERLAY24_RESERVED_SPACE",
+            "OVERLAY24_UNKNOWN_POINTER__NA_238C600",
+            "OVERLAY25_UNKNOWN_STRUCT__NA_238B498",
+            "APPRAISAL_WINDOW_PARAMS_1",
+            "APPRAISAL_MENU_ITEMS_CONFIRM",
+            "APPRAISAL_MAIN_MENU_ITEMS",
+            "APPRAISAL_SUBMENU_ITEMS",
+            "OVERLAY25_UNKNOWN_STRING_IDS",
+            "APPRAISAL_WINDOW_PARAMS_2",
+            "APPRAISAL_WINDOW_PARAMS_3",
+            "APPRAISAL_WINDOW_PARAMS_4",
+            "APPRAISAL_WINDOW_PARAMS_5",
+            "APPRAISAL_WINDOW_PARAMS_6",
+            "APPRAISAL_WINDOW_PARAMS_7",
+            "APPRAISAL_WINDOW_PARAMS_8",
+            "OVERLAY25_RESERVED_SPACE",
+            "OVERLAY25_UNKNOWN_POINTER__NA_238B5E0",
+            "OVERLAY26_UNKNOWN_TABLE__NA_238AE20",
+            "OVERLAY26_RESERVED_SPACE",
+            "OVERLAY26_UNKNOWN_POINTER__NA_238AF60",
+            "OVERLAY26_UNKNOWN_POINTER__NA_238AF64",
+            "OVERLAY26_UNKNOWN_POINTER__NA_238AF68",
+            "OVERLAY26_UNKNOWN_POINTER__NA_238AF6C",
+            "OVERLAY26_UNKNOWN_POINTER5__NA_238AF70",
+            "OVERLAY27_UNKNOWN_VALUE__NA_238C948",
+            "OVERLAY27_UNKNOWN_VALUE__NA_238C94C",
+            "OVERLAY27_UNKNOWN_STRUCT__NA_238C950",
+            "DISCARD_ITEMS_MENU_ITEMS_CONFIRM",
+            "DISCARD_ITEMS_SUBMENU_ITEMS_1",
+            "DISCARD_ITEMS_SUBMENU_ITEMS_2",
+            "DISCARD_ITEMS_MAIN_MENU_ITEMS",
+            "OVERLAY27_UNKNOWN_STRING_IDS",
+            "DISCARD_WINDOW_PARAMS_1",
+            "DISCARD_WINDOW_PARAMS_2",
+            "DISCARD_WINDOW_PARAMS_3",
+            "DISCARD_WINDOW_PARAMS_4",
+            "DISCARD_WINDOW_PARAMS_5",
+            "DISCARD_WINDOW_PARAMS_6",
+            "DISCARD_WINDOW_PARAMS_7",
+            "DISCARD_WINDOW_PARAMS_8",
+            "OVERLAY27_RESERVED_SPACE",
+            "OVERLAY27_UNKNOWN_POINTER__NA_238CE80",
+            "OVERLAY27_UNKNOWN_POINTER__NA_238CE84",
+            "GetWeatherColorTable",
+            "DungeonAlloc",
+            "GetDungeonPtrMaster",
+            "DungeonZInit",
+            "DungeonFree",
+            "RunDungeon",
+            "EntityIsValid",
+            "GetFloorType",
+            "TryForcedLoss",
+            "IsBossFight",
+            "IsCurrentFixedRoomBossFight",
+            "IsMarowakTrainingMaze",
+            "FixedRoomIsSubstituteRoom",
+            "StoryRestrictionsEnabled",
+            "GetScenarioBalanceVeneer",
+            "FadeToBlack",
+            "CheckTouchscreenArea",
+            "GetTrapInfo",
+            "GetItemInfo",
+            "GetTileAtEntity",
+            "UpdateEntityPixelPos",
+            "SetEntityPixelPosXY",
+            "IncrementEntityPixelPosXY",
+            "CreateEnemyEntity",
+            "SpawnTrap",
+            "SpawnItemEntity",
+            "ShouldMinimapDisplayEntity",
+            "ShouldDisplayEntity",
+            "ShouldDisplayEntityWrapper",
+            "CanSeeTarget",
+            "CanTargetEntity",
+            "CanTargetPosition",
+            "PopulateActiveMonsterPtrs",
+            "GetTeamMemberIndex",
+            "SubstitutePlaceholderStringTags",
+            "UpdateMapSurveyorFlag",
+            "PointCameraToMonster",
+            "UpdateCamera",
+            "ItemIsActive",
+            "GetVisibilityRange",
+            "RevealWholeFloor",
+            "PlayEffectAnimationEntity",
+            "PlayEffectAnimationPos",
+            "PlayEffectAnimationPixelPos",
+            "AnimationDelayOrSomething",
+            "UpdateStatusIconFlags",
+            "PlayEffectAnimation0x171Full",
+            "PlayEffectAnimation0x171",
+            "ShowPpRestoreEffect",
+            "ShouldDisplayEntityAdvanced",
+            "PlayEffectAnimation0x1A9",
+            "PlayEffectAnimation0x18E",
+            "LoadMappaFileAttributes",
+            "GetItemIdToSpawn",
+            "CopySpawnEntriesMaster",
+            "MonsterSpawnListPartialCopy",
+            "IsOnMonsterSpawnList",
+            "GetMonsterIdToSpawn",
+            "GetMonsterLevelToSpawn",
+            "AllocTopScreenStatus",
+            "FreeTopScreenStatus",
+            "InitializeTeamStats",
+            "UpdateTeamStatsWrapper",
+            "FreeTeamStatsWrapper",
+            "AssignTopScreenHandlers",
+            "HandleTopScreenFades",
+            "FreeTopScreen",
+            "GetDirectionTowardsPosition",
+            "GetChebyshevDistance",
+            "IsPositionActuallyInSight",
+            "IsPositionInSight",
+            "GetLeader",
+            "GetLeaderMonster",
+            "GetRandomTile",
+            "FindNearbyUnoccupiedTile",
+            "FindClosestUnoccupiedTileWithin2",
+            "FindFarthestUnoccupiedTileWithin2",
+            "FindUnoccupiedTileWithin3",
+            "TickStatusTurnCounter",
+            "AdvanceFrame",
+            "DisplayAnimatedNumbers",
+            "SetDungeonRngPreseed23Bit",
+            "GenerateDungeonRngSeed",
+            "GetDungeonRngPreseed",
+            "SetDungeonRngPreseed",
+            "InitDungeonRng",
+            "DungeonRand16Bit",
+            "DungeonRandInt",
+            "DungeonRandRange",
+            "DungeonRandOutcome",
+            "CalcStatusDuration",
+            "DungeonRngUnsetSecondary",
+            "DungeonRngSetSecondary",
+            "DungeonRngSetPrimary",
+            "MusicTableIdxToMusicId",
+            "ChangeDungeonMusic",
+            "TrySwitchPlace",
+            "SetLeaderActionFields",
+            "ClearMonsterActionFields",
+            "SetMonsterActionFields",
+            "SetActionPassTurnOrWalk",
+            "GetItemToUseByIndex",
+            "GetItemToUse",
+            "GetItemAction",
+            "RemoveUsedItem",
+            "AddDungeonSubMenuOption",
+            "DisableDungeonSubMenuOption",
+            "SetActionRegularAttack",
+            "SetActionUseMovePlayer",
+            "SetActionUseMoveAi",
+            "RunFractionalTurn",
+            "RunLeaderTurn",
+            "TrySpawnMonsterAndActivatePlusMinus",
+            "IsFloorOver",
+            "DecrementWindCounter",
+            "IsDungeonEndReasonFailure",
+            "SetForcedLossReason",
+            "GetForcedLossReason",
+            "BindTrapToTile",
+            "AreLateGameTrapsEnabledWrapper",
+            "SpawnEnemyTrapAtPos",
+            "PrepareTrapperTrap",
+            "TrySpawnTrap",
+            "TrySpawnTrapperTrap",
+            "TryRemoveTrap",
+            "TryTriggerTrap",
+            "ApplyMudTrapEffect",
+            "ApplyStickyTrapEffect",
+            "ApplyGrimyTrapEffect",
+            "ApplyPitfallTrapEffect",
+            "ApplySummonTrapEffect",
+            "ApplyPpZeroTrapEffect",
+            "ApplyPokemonTrapEffect",
+            "ApplyTripTrapEffect",
+            "ApplyStealthRockTrapEffect",
+            "ApplyToxicSpikesTrapEffect",
+            "ApplyRandomTrapEffect",
+            "ApplyGrudgeTrapEffect",
+            "ApplyTrapEffect",
+            "RevealTrapsNearby",
+            "ShouldRunMonsterAi",
+            "DebugRecruitingEnabled",
+            "TryActivateIqBooster",
+            "IsSecretBazaarNpcBehavior",
+            "GetLeaderAction",
+            "GetEntityTouchscreenArea",
+            "SetLeaderAction",
+            "ShouldLeaderKeepRunning",
+            "CheckLeaderTile",
+            "ChangeLeader",
+            "UseSingleUseItemWrapper",
+            "UseSingleUseItem",
+            "UseThrowableItem",
+            "ResetDamageData",
+            "FreeLoadedAttackSpriteAndMore",
+            "SetAndLoadCurrentAttackAnimation",
+            "ClearLoadedAttackSprite",
+            "GetLoadedAttackSpriteId",
+            "DungeonGetTotalSpriteFileSize",
+            "DungeonGetSpriteIndex",
+            "JoinedAtRangeCheck2Veneer",
+            "FloorNumberIsEven",
+            "GetKecleonIdToSpawnByFloor",
+            "StoreSpriteFileIndexBothGenders",
+            "LoadMonsterSpriteInner",
+            "SwapMonsterWanFileIndex",
+            "LoadMonsterSprite",
+            "DeleteMonsterSpriteFile",
+            "DeleteAllMonsterSpriteFiles",
+            "EuFaintCheck",
+            "HandleFaint",
+            "MoveMonsterToPos",
+            "CreateMonsterSummaryFromMonster",
+            "UpdateAiTargetPos",
+            "SetMonsterTypeAndAbility",
+            "TryActivateSlowStart",
+            "TryActivateArtificialWeatherAbilities",
+            "GetMonsterApparentId",
+            "TryActivateTraceAndColorChange",
+            "DefenderAbilityIsActive",
+            "IsMonster",
+            "TryActivateConversion2",
+            "TryActivateTruant",
+            "TryPointCameraToMonster",
+            "ReevaluateSnatchMonster",
+            "GetRandomExplorerMazeMonster",
+            "RestorePpAllMovesSetFlags",
+            "CheckTeamMemberIdxVeneer",
+            "IsMonsterIdInNormalRangeVeneer",
+            "BoostIQ",
+            "ShouldMonsterHeadToStairs",
+            "MewSpawnCheck",
+            "TryEndStatusWithAbility",
+            "ExclusiveItemEffectIsActive",
+            "GetTeamMemberWithIqSkill",
+            "TeamMemberHasEnabledIqSkill",
+            "TeamLeaderIqSkillIsEnabled",
+            "CountMovesOutOfPp",
+            "HasSuperEffectiveMoveAgainstUser",
+            "TryEatItem",
+            "SetDecoyAiTracker",
+            "CheckSpawnThreshold",
+            "HasLowHealth",
+            "AreEntitiesAdjacent",
+            "IsSpecialStoryAlly",
+            "IsExperienceLocked",
+            "InitOtherMonsterData",
+            "InitEnemySpawnStats",
+            "InitEnemyStatsAndMoves",
+            "SpawnTeam",
+            "SpawnInitialMonsters",
+            "SpawnMonster",
+            "InitTeamMember",
+            "InitMonster",
+            "SubInitMonster",
+            "MarkShopkeeperSpawn",
+            "SpawnShopkeepers",
+            "GetMaxHpAtLevel",
+            "GetOffensiveStatAtLevel",
+            "GetDefensiveStatAtLevel",
+            "GetOutlawSpawnData",
+            "ExecuteMonsterAction",
+            "TryActivateFlashFireOnAllMonsters",
+            "HasStatusThatPreventsActing",
+            "GetMobilityTypeCheckSlip",
+            "GetMobilityTypeCheckSlipAndFloating",
+            "IsInvalidSpawnTile",
+            "GetMobilityTypeAfterIqSkills",
+            "CannotStandOnTile",
+            "CalcSpeedStage",
+            "CalcSpeedStageWrapper",
+            "GetNumberOfAttacks",
+            "GetMonsterDisplayNameType",
+            "GetMonsterName",
+            "IsMonsterDrowsy",
+            "MonsterHasNonvolatileNonsleepStatus",
+            "MonsterHasImmobilizingStatus",
+            "MonsterHasAttackInterferingStatus",
+            "MonsterHasSkillInterferingStatus",
+            "MonsterHasLeechSeedStatus",
+            "MonsterHasWhifferStatus",
+            "IsMonsterVisuallyImpaired",
+            "IsMonsterMuzzled",
+            "MonsterHasMiracleEyeStatus",
+            "MonsterHasNegativeStatus",
+            "IsMonsterSleeping",
+            "CheckVariousStatuses2",
+            "CheckVariousConditions",
+            "CheckVariousStatuses",
+            "CanMonsterMoveInDirection",
+            "GetDirectionalMobilityType",
+            "IsMonsterCornered",
+            "CanAttackInDirection",
+            "CanAiMonsterMoveInDirection",
+            "ShouldMonsterRunAway",
+            "ShouldMonsterRunAwayVariation",
+            "GetTreatmentBetweenMonsters",
+            "SafeguardIsActive",
+            "LeafGuardIsActive",
+            "IsProtectedFromStatDrops",
+            "NoGastroAcidStatus",
+            "AbilityIsActive",
+            "AbilityIsActiveVeneer",
+            "OtherMonsterAbilityIsActive",
+            "LevitateIsActive",
+            "MonsterIsType",
+            "IsTypeAffectedByGravity",
+            "HasTypeAffectedByGravity",
+            "CanSeeInvisibleMonsters",
+            "IsTacticSet",
+            "HasDropeyeStatus",
+            "IqSkillIsEnabled",
+            "UpdateIqSkills",
+            "GetMoveTypeForMonster",
+            "GetMovePower",
+            "MonsterCanThrowItems",
+            "UpdateStateFlags",
+            "IsProtectedFromNegativeStatus",
+            "AddExpSpecial",
+            "EnemyEvolution",
+            "LevelUpItemEffect",
+            "TryDecreaseLevel",
+            "LevelUp",
+            "GetMonsterMoves",
+            "EvolveMonster",
+            "ChangeMonsterAnimation",
+            "GetIdleAnimationId",
+            "DetermineAllMonsterShadow",
+            "DetermineMonsterShadow",
+            "DisplayActions",
+            "CheckNonLeaderTile",
+            "EndNegativeStatusCondition",
+            "EndNegativeStatusConditionWrapper",
+            "TransferNegativeStatusCondition",
+            "EndSleepClassStatus",
+            "EndBurnClassStatus",
+            "EndFrozenClassStatus",
+            "EndCringeClassStatus",
+            "EndReflectClassStatus",
+            "TryRemoveSnatchedMonsterFromDungeonStruct",
+            "EndCurseClassStatus",
+            "EndLeechSeedClassStatus",
+            "EndSureShotClassStatus",
+            "EndInvisibleClassStatus",
+            "EndBlinkerClassStatus",
+            "EndMuzzledStatus",
+            "EndMiracleEyeStatus",
+            "EndMagnetRiseStatus",
+            "TransferNegativeBlinkerClassStatus",
+            "EndFrozenStatus",
+            "EndProtectStatus",
+            "TryRestoreRoostTyping",
+            "TryTriggerMonsterHouse",
+            "ShouldMonsterFollowLeader",
+            "RunMonsterAi",
+            "ApplyDamageAndEffects",
+            "ApplyDamage",
+            "AftermathCheck",
+            "GetTypeMatchupBothTypes",
+            "ScrappyShouldActivate",
+            "IsTypeIneffectiveAgainstGhost",
+            "GhostImmunityIsActive",
+            "GetTypeMatchup",
+            "CalcTypeBasedDamageEffects",
+            "CalcDamage",
+            "ApplyDamageAndEffectsWrapper",
+            "CalcRecoilDamageFixed",
+            "CalcDamageFixed",
+            "CalcDamageFixedNoCategory",
+            "CalcDamageFixedWrapper",
+            "UpdateShopkeeperModeAfterAttack",
+            "UpdateShopkeeperModeAfterTrap",
+            "ResetDamageCalcDiagnostics",
+            "SpecificRecruitCheck",
+            "RecruitCheck",
+            "TryRecruit",
+            "TrySpawnMonsterAndTickSpawnCounter",
+            "AiDecideUseItem",
+            "GetPossibleAiThrownItemDirections",
+            "GetPossibleAiArcItemTargets",
+            "TryNonLeaderItemPickUp",
+            "GetExclusiveItemWithEffectFromBag",
+            "AuraBowIsActive",
+            "ExclusiveItemOffenseBoost",
+            "ExclusiveItemDefenseBoost",
+            "TeamMemberHasItemActive",
+            "TeamMemberHasExclusiveItemEffectActive",
+            "TrySpawnEnemyItemDrop",
+            "TickNoSlipCap",
+            "TickStatusAndHealthRegen",
+            "InflictSleepStatusSingle",
+            "TryInflictSleepStatus",
+            "IsProtectedFromSleepClassStatus",
+            "TryInflictNightmareStatus",
+            "TryInflictNappingStatus",
+            "TryInflictYawningStatus",
+            "TryInflictSleeplessStatus",
+            "TryInflictPausedStatus",
+            "TryInflictInfatuatedStatus",
+            "TryInflictBurnStatus",
+            "TryInflictBurnStatusWholeTeam",
+            "TryInflictPoisonedStatus",
+            "TryInflictBadlyPoisonedStatus",
+            "TryInflictFrozenStatus",
+            "TryInflictConstrictionStatus",
+            "TryInflictShadowHoldStatus",
+            "TryInflictIngrainStatus",
+            "TryInflictWrappedStatus",
+            "FreeOtherWrappedMonsters",
+            "TryInflictPetrifiedStatus",
+            "LowerOffensiveStat",
+            "LowerDefensiveStat",
+            "BoostOffensiveStat",
+            "BoostDefensiveStat",
+            "FlashFireShouldActivate",
+            "ActivateFlashFire",
+            "ApplyOffensiveStatMultiplier",
+            "ApplyDefensiveStatMultiplier",
+            "BoostHitChanceStat",
+            "LowerHitChanceStat",
+            "TryInflictCringeStatus",
+            "TryInflictParalysisStatus",
+            "BoostSpeed",
+            "BoostSpeedOneStage",
+            "LowerSpeed",
+            "TrySealMove",
+            "BoostOrLowerSpeed",
+            "ResetHitChanceStat",
+            "ExclusiveItemEffectIsActiveWithLogging",
+            "TryActivateQuickFeet",
+            "TryInflictTerrifiedStatus",
+            "TryInflictGrudgeStatus",
+            "TryInflictConfusedStatus",
+            "TryInflictCoweringStatus",
+            "TryRestoreHp",
+            "TryIncreaseHp",
+            "RevealItems",
+            "RevealStairs",
+            "RevealEnemies",
+            "TryInflictLeechSeedStatus",
+            "TryInflictDestinyBondStatus",
+            "TryInflictSureShotStatus",
+            "TryInflictWhifferStatus",
+            "TryInflictSetDamageStatus",
+            "TryInflictFocusEnergyStatus",
+            "TryInflictDecoyStatus",
+            "TryInflictCurseStatus",
+            "TryInflictSnatchStatus",
+            "TryInflictTauntStatus",
+            "TryInflictStockpileStatus",
+            "TryInflictInvisibleStatus",
+            "TryInflictPerishSongStatus",
+            "TryInflictEncoreStatus",
+            "TryDecreaseBelly",
+            "TryIncreaseBelly",
+            "TryInflictMuzzledStatus",
+            "TryTransform",
+            "TryInflictMobileStatus",
+            "TryInflictExposedStatus",
+            "TryActivateIdentifyCondition",
+            "TryInflictBlinkerStatus",
+            "IsBlinded",
+            "TryInflictCrossEyedStatus",
+            "TryInflictEyedropStatus",
+            "TryInflictSlipStatus",
+            "TryInflictDropeyeStatus",
+            "RestoreAllMovePP",
+            "RestoreOneMovePP",
+            "RestoreRandomMovePP",
+            "ApplyProteinEffect",
+            "ApplyCalciumEffect",
+            "ApplyIronEffect",
+            "ApplyZincEffect",
+            "TryInflictLongTossStatus",
+            "TryInflictPierceStatus",
+            "TryInflictGastroAcidStatus",
+            "SetAquaRingHealingCountdownTo4",
+            "ApplyAquaRingHealing",
+            "TryInflictAquaRingStatus",
+            "TryInflictLuckyChantStatus",
+            "TryInflictHealBlockStatus",
+            "MonsterHasEmbargoStatus",
+            "LogItemBlockedByEmbargo",
+            "TryInflictEmbargoStatus",
+            "TryInflictMiracleEyeStatus",
+            "TryInflictMagnetRiseStatus",
+            "IsFloating",
+            "TryInflictSafeguardStatus",
+            "TryInflictMistStatus",
+            "TryInflictWishStatus",
+            "TryInflictMagicCoatStatus",
+            "TryInflictLightScreenStatus",
+            "TryInflictReflectStatus",
+            "TryInflictProtectStatus",
+            "TryInflictMirrorCoatStatus",
+            "TryInflictEndureStatus",
+            "TryInflictMirrorMoveStatus",
+            "TryInflictConversion2Status",
+            "TryInflictVitalThrowStatus",
+            "TryResetStatChanges",
+            "MirrorMoveIsActive",
+            "MistIsActive",
+            "Conversion2IsActive",
+            "AiConsiderMove",
+            "TryAddTargetToAiTargetList",
+            "IsAiTargetEligible",
+            "IsTargetInRange",
+            "ShouldUsePp",
+            "GetEntityMoveTargetAndRange",
+            "GetEntityNaturalGiftInfo",
+            "GetEntityWeatherBallType",
+            "ActivateMotorDrive",
+            "TryActivateFrisk",
+            "TryActivateBadDreams",
+            "ActivateStench",
+            "TryActivateSteadfast",
+            "IsInSpawnList",
+            "ChangeShayminForme",
+            "ApplyItemEffect",
+            "ApplyCheriBerryEffect",
+            "ApplyPechaBerryEffect",
+            "ApplyRawstBerryEffect",
+            "ApplyHungerSeedEffect",
+            "ApplyVileSeedEffect",
+            "ApplyViolentSeedEffect",
+            "ApplyGinsengEffect",
+            "ApplyBlastSeedEffect",
+            "ApplyGummiBoostsDungeonMode",
+            "CanMonsterUseItem",
+            "ApplyGrimyFoodEffect",
+            "ApplyMixElixirEffect",
+            "ApplyDoughSeedEffect",
+            "ApplyViaSeedEffect",
+            "ApplyGravelyrockEffect",
+            "ApplyGonePebbleEffect",
+            "ApplyGracideaEffect",
+            "GetAiUseItemProbability",
+            "IsAdjacentToEnemy",
+            "ShouldTryEatItem",
+            "GetMaxPpWrapper",
+            "MoveIsNotPhysical",
+            "CategoryIsNotPhysical",
+            "TryDrought",
+            "TryPounce",
+            "TryBlowAway",
+            "TryExplosion",
+            "TryAftermathExplosion",
+            "TryWarp",
+            "EnsureCanStandCurrentTile",
+            "TryActivateNondamagingDefenderAbility",
+            "TryActivateNondamagingDefenderExclusiveItem",
+            "GetMoveRangeDistance",
+            "MoveHitCheck",
+            "IsHyperBeamVariant",
+            "IsChargingTwoTurnMove",
+            "IsChargingAnyTwoTurnMove",
+            "HasMaxGinsengBoost99",
+            "TwoTurnMoveForcedMiss",
+            "DungeonRandOutcomeUserTargetInteraction",
+            "DungeonRandOutcomeUserAction",
+            "CanAiUseMove",
+            "CanMonsterUseMove",
+            "UpdateMovePp",
+            "GetDamageSourceWrapper",
+            "LowerSshort",
+            "PlayMoveAnimation",
+            "GetMoveAnimationId",
+            "ShouldMovePlayAlternativeAnimation",
+            "ExecuteMoveEffect",
+            "DoMoveDamageInlined",
+            "DealDamage",
+            "DealDamageWithTypeAndPowerBoost",
+            "DealDamageProjectile",
+            "DealDamageWithType",
+            "PerformDamageSequence",
+            "CanHitWithRegularAttack",
+            "StatusCheckerCheck",
+            "GetApparentWeather",
+            "TryWeatherFormChange",
+            "ActivateSportCondition",
+            "TryActivateWeather",
+            "DigitCount",
+            "LoadTextureUi",
+            "DisplayNumberTextureUi",
+            "DisplayCharTextureUi",
+            "DisplayUi",
+            "GetTile",
+            "GetTileSafe",
+            "IsFullFloorFixedRoom",
+            "IsCurrentTilesetBackground",
+            "TrySpawnGoldenChamber",
+            "CountItemsOnFloorForAcuteSniffer",
+            "GetStairsSpawnPosition",
+            "PositionIsOnStairs",
+            "GetStairsRoom",
+            "GetDefaultTileTextureId",
+            "DetermineAllTilesWalkableNeighbors",
+            "DetermineTileWalkableNeighbors",
+            "UpdateTrapsVisibility",
+            "DrawTileGrid",
+            "HideTileGrid",
+            "DiscoverMinimap",
+            "PositionHasItem",
+            "PositionHasMonster",
+            "TrySmashWall",
+            "IsWaterTileset",
+            "GetRandomSpawnMonsterID",
+            "NearbyAllyIqSkillIsEnabled",
+            "ResetGravity",
+            "GravityIsActive",
+            "TryActivateGravity",
+            "ShouldBoostKecleonShopSpawnChance",
+            "SetShouldBoostKecleonShopSpawnChance",
+            "UpdateShouldBoostKecleonShopSpawnChance",
+            "GetDoughSeedFlag",
+            "SetDoughSeedFlag",
+            "TrySpawnDoughSeedPoke",
+            "IsSecretBazaar",
+            "ShouldBoostHiddenStairsSpawnChance",
+            "SetShouldBoostHiddenStairsSpawnChance",
+            "UpdateShouldBoostHiddenStairsSpawnChance",
+            "IsSecretRoom",
+            "IsSecretFloor",
+            "GetCurrentHiddenStairsType",
+            "HiddenStairsPresent",
+            "PositionIsOnHiddenStairs",
+            "HiddenStairsTrigger",
+            "GetHiddenStairsField",
+            "SetHiddenStairsField",
+            "GetHiddenFloorField",
+            "SetHiddenFloorField",
+            "LoadWeather3DFiles",
+            "RenderWeather3D",
+            "GetMinimapData",
+            "DrawMinimapTile",
+            "FlashLeaderIcon",
+            "UpdateMinimap",
+            "SetMinimapDataE447",
+            "GetMinimapDataE447",
+            "SetMinimapDataE448",
+            "InitWeirdMinimapMatrix",
+            "InitMinimapDisplayTile",
+            "LoadFixedRoomDataVeneer",
+            "UnloadFixedRoomData",
+            "IsNormalFloor",
+            "GenerateFloor",
+            "GetTileTerrain",
+            "DungeonRand100",
+            "ClearHiddenStairs",
+            "FlagHallwayJunctions",
+            "GenerateStandardFloor",
+            "GenerateOuterRingFloor",
+            "GenerateCrossroadsFloor",
+            "GenerateLineFloor",
+            "GenerateCrossFloor",
+            "GenerateBeetleFloor",
+            "MergeRoomsVertically",
+            "GenerateOuterRoomsFloor",
+            "IsNotFullFloorFixedRoom",
+            "GenerateFixedRoom",
+            "GenerateOneRoomMonsterHouseFloor",
+            "GenerateTwoRoomsWithMonsterHouseFloor",
+            "GenerateExtraHallways",
+            "GetGridPositions",
+            "InitDungeonGrid",
+            "AssignRooms",
+            "CreateRoomsAndAnchors",
+            "GenerateSecondaryStructures",
+            "AssignGridCellConnections",
+            "CreateGridCellConnections",
+            "GenerateRoomImperfections",
+            "CreateHallway",
+            "EnsureConnectedGrid",
+            "SetTerrainObstacleChecked",
+            "FinalizeJunctions",
+            "GenerateKecleonShop",
+            "GenerateMonsterHouse",
+            "GenerateMazeRoom",
+            "GenerateMaze",
+            "GenerateMazeLine",
+            "SetSpawnFlag5",
+            "IsNextToHallway",
+            "ResolveInvalidSpawns",
+            "ConvertSecondaryTerrainToChasms",
+            "EnsureImpassableTilesAreWalls",
+            "InitializeTile",
+            "ResetFloor",
+            "PosIsOutOfBounds",
+            "ShuffleSpawnPositions",
+            "MarkNonEnemySpawns",
+            "MarkEnemySpawns",
+            "SetSecondaryTerrainOnWall",
+            "GenerateSecondaryTerrainFormations",
+            "StairsAlwaysReachable",
+            "GetNextFixedRoomAction",
+            "ConvertWallsToChasms",
+            "ResetInnerBoundaryTileRows",
+            "ResetImportantSpawnPositions",
+            "SpawnStairs",
+            "GetHiddenStairsType",
+            "GetFinalKecleonShopSpawnChance",
+            "ResetHiddenStairsSpawn",
+            "PlaceFixedRoomTile",
+            "FixedRoomActionParamToDirection",
+            "ApplyKeyEffect",
+            "LoadFixedRoomData",
+            "LoadFixedRoom",
+            "OpenFixedBin",
+            "CloseFixedBin",
+            "AreOrbsAllowed",
+            "AreTileJumpsAllowed",
+            "AreTrawlOrbsAllowed",
+            "AreOrbsAllowedVeneer",
+            "AreLateGameTrapsEnabled",
+            "AreMovesEnabled",
+            "IsRoomIlluminated",
+            "GetMatchingMonsterId",
+            "GenerateItemExplicit",
+            "GenerateAndSpawnItem",
+            "IsHiddenStairsFloor",
+            "IsSecretBazaarVeneer",
+            "GenerateStandardItem",
+            "GenerateCleanItem",
+            "TryLeaderItemPickUp",
+            "SpawnItem",
+            "RemoveGroundItem",
+            "SpawnDroppedItemWrapper",
+            "SpawnDroppedItem",
+            "TryGenerateUnownStoneDrop",
+            "HasHeldItem",
+            "GenerateMoneyQuantity",
+            "CheckTeamItemsFlags",
+            "AddHeldItemToBag",
+            "RemoveEmptyItemsInBagWrapper",
+            "GenerateItem",
+            "DoesProjectileHitTarget",
+            "DisplayFloorCard",
+            "HandleFloorCard",
+            "CheckActiveChallengeRequest",
+            "GetMissionDestination",
+            "IsOutlawOrChallengeRequestFloor",
+            "IsDestinationFloor",
+            "IsCurrentMissionType",
+            "IsCurrentMissionTypeExact",
+            "IsOutlawMonsterHouseFloor",
+            "IsGoldenChamber",
+            "IsLegendaryChallengeFloor",
+            "IsJirachiChallengeFloor",
+            "IsDestinationFloorWithMonster",
+            "LoadMissionMonsterSprites",
+            "MissionTargetEnemyIsDefeated",
+            "SetMissionTargetEnemyDefeated",
+            "IsDestinationFloorWithFixedRoom",
+            "GetItemToRetrieve",
+            "GetItemToDeliver",
+            "GetSpecialTargetItem",
+            "IsDestinationFloorWithItem",
+            "IsDestinationFloorWithHiddenOutlaw",
+            "IsDestinationFloorWithFleeingOutlaw",
+            "GetMissionTargetEnemy",
+            "GetMissionEnemyMinionGroup",
+            "SetTargetMonsterNotFoundFlag",
+            "GetTargetMonsterNotFoundFlag",
+            "FloorHasMissionMonster",
+            "GenerateMissionEggMonster",
+            "LogMessageByIdWithPopupCheckParticipants",
+            "LogMessageByIdWithPopupCheckUser",
+            "LogMessageWithPopupCheckUser",
+            "LogMessageByIdQuiet",
+            "LogMessageQuiet",
+            "LogMessageByIdWithPopupCheckUserTarget",
+            "LogMessageWithPopupCheckUserTarget",
+            "LogMessageByIdQuietCheckUserTarget",
+            "LogMessageByIdWithPopupCheckUserUnknown",
+            "LogMessageByIdWithPopup",
+            "LogMessageWithPopup",
+            "LogMessage",
+            "LogMessageById",
+            "InitPortraitDungeon",
+            "OpenMessageLog",
+            "RunDungeonMode",
+            "StartFadeDungeon",
+            "StartFadeDungeonWrapper",
+            "HandleFadesDungeon",
+            "HandleFadesDungeonBothScreens",
+            "DisplayFloorTip",
+            "DisplayItemTip",
+            "DisplayDungeonTip",
+            "SetBothScreensWindowColorToDefault",
+            "GetPersonalityIndex",
+            "DisplayMessage",
+            "DisplayMessage2",
+            "YesNoMenu",
+            "DisplayMessageInternal",
+            "OpenMenu",
+            "OthersMenuLoop",
+            "OthersMenu",
+            "DUNGEON_STRUCT_SIZE",
+            "MAX_HP_CAP",
+            "OFFSET_OF_DUNGEON_FLOOR_PROPERTIES",
+            "SPAWN_RAND_MAX",
+            "DUNGEON_PRNG_LCG_MULTIPLIER",
+            "DUNGEON_PRNG_LCG_INCREMENT_SECONDARY",
+            "ATTACK_SPRITE_BUFFER_SIZE",
+            "KECLEON_FEMALE_ID",
+            "KECLEON_MALE_ID",
+            "MSG_ID_SLOW_START",
+            "EXPERIENCE_POINT_GAIN_CAP",
+            "JUDGMENT_MOVE_ID",
+            "REGULAR_ATTACK_MOVE_ID",
+            "DEOXYS_ATTACK_ID",
+            "DEOXYS_SPEED_ID",
+            "GIRATINA_ALTERED_ID",
+            "PUNISHMENT_MOVE_ID",
+            "OFFENSE_STAT_MAX",
+            "PROJECTILE_MOVE_ID",
+            "BELLY_LOST_PER_TURN",
+            "MONSTER_HEAL_HP_MAX",
+            "MOVE_TARGET_AND_RANGE_SPECIAL_USER_HEALING",
+            "PLAIN_SEED_STRING_ID",
+            "MAX_ELIXIR_PP_RESTORATION",
+            "SLIP_SEED_FAIL_STRING_ID",
+            "ROCK_WRECKER_MOVE_ID",
+            "CASTFORM_NORMAL_FORM_MALE_ID",
+            "CASTFORM_NORMAL_FORM_FEMALE_ID",
+            "CHERRIM_SUNSHINE_FORM_MALE_ID",
+            "CHERRIM_OVERCAST_FORM_FEMALE_ID",
+            "CHERRIM_SUNSHINE_FORM_FEMALE_ID",
+            "FLOOR_GENERATION_STATUS_PTR",
+            "OFFSET_OF_DUNGEON_N_NORMAL_ITEM_SPAWNS",
+            "DUNGEON_GRID_COLUMN_BYTES",
+            "DEFAULT_MAX_POSITION",
+            "OFFSET_OF_DUNGEON_GUARANTEED_ITEM_ID",
+            "FIXED_ROOM_TILE_SPAWN_TABLE",
+            "TREASURE_BOX_1_ITEM_IDS",
+            "FIXED_ROOM_REVISIT_OVERRIDES",
+            "FIXED_ROOM_MONSTER_SPAWN_TABLE",
+            "FIXED_ROOM_ITEM_SPAWN_TABLE",
+            "FIXED_ROOM_ENTITY_SPAWN_TABLE",
+            "STATUS_ICON_ARRAY_MUZZLED",
+            "STATUS_ICON_ARRAY_MAGNET_RISE",
+            "STATUS_ICON_ARRAY_MIRACLE_EYE",
+            "STATUS_ICON_ARRAY_LEECH_SEED",
+            "STATUS_ICON_ARRAY_LONG_TOSS",
+            "STATUS_ICON_ARRAY_BLINDED",
+            "STATUS_ICON_ARRAY_BURN",
+            "STATUS_ICON_ARRAY_SURE_SHOT",
+            "STATUS_ICON_ARRAY_INVISIBLE",
+            "STATUS_ICON_ARRAY_SLEEP",
+            "STATUS_ICON_ARRAY_CURSE",
+            "STATUS_ICON_ARRAY_FREEZE",
+            "STATUS_ICON_ARRAY_CRINGE",
+            "STATUS_ICON_ARRAY_BIDE",
+            "STATUS_ICON_ARRAY_REFLECT",
+            "DIRECTIONS_XY",
+            "DISPLACEMENTS_WITHIN_2_LARGEST_FIRST",
+            "DISPLACEMENTS_WITHIN_2_SMALLEST_FIRST",
+            "DISPLACEMENTS_WITHIN_3",
+            "ITEM_CATEGORY_ACTIONS",
+            "FRACTIONAL_TURN_SEQUENCE",
+            "BELLY_DRAIN_IN_WALLS_INT",
+            "BELLY_DRAIN_IN_WALLS_THOUSANDTHS",
+            "DAMAGE_MULTIPLIER_0_5",
+            "DAMAGE_MULTIPLIER_1_5",
+            "DAMAGE_MULTIPLIER_2",
+            "CLOUDY_DAMAGE_MULTIPLIER",
+            "SOLID_ROCK_MULTIPLIER",
+            "DAMAGE_FORMULA_MAX_BASE",
+            "WONDER_GUARD_MULTIPLIER",
+            "DAMAGE_FORMULA_MIN_BASE",
+            "TYPE_DAMAGE_NEGATING_EXCLUSIVE_ITEM_EFFECTS",
+            "TWO_TURN_STATUSES",
+            "TWO_TURN_MOVES_AND_STATUSES",
+            "SPATK_STAT_IDX",
+            "ATK_STAT_IDX",
+            "ROLLOUT_DAMAGE_MULT_TABLE",
+            "MAP_COLOR_TABLE",
+            "CORNER_CARDINAL_NEIGHBOR_IS_OPEN",
+            "GUMMI_LIKE_STRING_IDS",
+            "GUMMI_IQ_STRING_IDS",
+            "DAMAGE_STRING_IDS",
+            "DUNGEON_PTR",
+            "DUNGEON_PTR_MASTER",
+            "TOP_SCREEN_STATUS_PTR",
+            "LEADER_PTR",
+            "DUNGEON_PRNG_STATE",
+            "DUNGEON_PRNG_STATE_SECONDARY_VALUES",
+            "LOADED_ATTACK_SPRITE_FILE_INDEX",
+            "LOADED_ATTACK_SPRITE_PACK_ID",
+            "EXCL_ITEM_EFFECTS_WEATHER_ATK_SPEED_BOOST",
+            "EXCL_ITEM_EFFECTS_WEATHER_MOVE_SPEED_BOOST",
+            "EXCL_ITEM_EFFECTS_WEATHER_NO_STATUS",
+            "AI_THROWN_ITEM_ACTION_CHOICE_COUNT",
+            "EXCL_ITEM_EFFECTS_EVASION_BOOST",
+            "DEFAULT_TILE",
+            "HIDDEN_STAIRS_SPAWN_BLOCKED",
+            "FIXED_ROOM_DATA_PTR",
+            "DUNGEON_FADES_PTR",
+            "NECTAR_IQ_BOOST",
+            "COMPRESSED_SPRITE_BUFFER_SIZE",
+            "WriteQuicksaveData",
+            "OVERLAY30_JP_STRING_1",
+            "OVERLAY30_JP_STRING_2",
+            "EntryOverlay31",
+            "DrawDungeonMenuStatusWindow",
+            "DungeonMenuSwitch",
+            "CreateStairsMenuState",
+            "StairsSubheadingCallback",
+            "HandleStairsMenu",
+            "MovesMenu",
+            "HandleMovesMenuWrapper0",
+            "HandleMovesMenuWrapper1",
+            "HandleMovesMenu",
+            "TeamMenu",
+            "RestMenu",
+            "RecruitmentSearchMenuLoop",
+            "HelpMenuLoop",
+            "DUNGEON_WINDOW_PARAMS_1",
+            "DUNGEON_WINDOW_PARAMS_2",
+            "DUNGEON_WINDOW_PARAMS_3",
+            "DUNGEON_WINDOW_PARAMS_4",
+            "DUNGEON_MAIN_MENU_ITEMS",
+            "DUNGEON_MENU_SWITCH_STR1",
+            "OVERLAY31_UNKNOWN_STRING_IDS",
+            "OVERLAY31_UNKNOWN_STRUCT__NA_2389E30",
+            "DUNGEON_WINDOW_PARAMS_5",
+            "DUNGEON_WINDOW_PARAMS_6",
+            "DUNGEON_WINDOW_PARAMS_7",
+            "DUNGEON_SUBMENU_ITEMS_1",
+            "DUNGEON_SUBMENU_ITEMS_2",
+            "DUNGEON_SUBMENU_ITEMS_3",
+            "DUNGEON_SUBMENU_ITEMS_4",
+            "OVERLAY31_UNKNOWN_STRUCT__NA_2389EF0",
+            "DUNGEON_WINDOW_PARAMS_8",
+            "DUNGEON_WINDOW_PARAMS_9",
+            "DUNGEON_WINDOW_PARAMS_10",
+            "DUNGEON_WINDOW_PARAMS_11",
+            "DUNGEON_WINDOW_PARAMS_12",
+            "DUNGEON_WINDOW_PARAMS_13",
+            "OVERLAY31_JP_STRING",
+            "DUNGEON_WINDOW_PARAMS_14",
+            "DUNGEON_WINDOW_PARAMS_15",
+            "DUNGEON_WINDOW_PARAMS_16",
+            "DUNGEON_WINDOW_PARAMS_17",
+            "DUNGEON_WINDOW_PARAMS_18",
+            "DUNGEON_WINDOW_PARAMS_19",
+            "OVERLAY31_UNKNOWN_STRUCT__NA_2389FE8",
+            "DUNGEON_WINDOW_PARAMS_20",
+            "DUNGEON_WINDOW_PARAMS_21",
+            "DUNGEON_WINDOW_PARAMS_22",
+            "DUNGEON_WINDOW_PARAMS_23",
+            "DUNGEON_WINDOW_PARAMS_24",
+            "DUNGEON_WINDOW_PARAMS_25",
+            "DUNGEON_SUBMENU_ITEMS_5",
+            "DUNGEON_WINDOW_PARAMS_26",
+            "OVERLAY31_UNKNOWN_STRUCT__NA_238A144",
+            "DUNGEON_WINDOW_PARAMS_27",
+            "DUNGEON_WINDOW_PARAMS_28",
+            "OVERLAY31_UNKNOWN_STRUCT__NA_238A190",
+            "DUNGEON_SUBMENU_ITEMS_6",
+            "DUNGEON_WINDOW_PARAMS_29",
+            "DUNGEON_WINDOW_PARAMS_30",
+            "DUNGEON_WINDOW_PARAMS_31",
+            "DUNGEON_WINDOW_PARAMS_32",
+            "OVERLAY31_RESERVED_SPACE",
+            "OVERLAY31_UNKNOWN_POINTER__NA_238A260",
+            "OVERLAY31_UNKNOWN_VALUE__NA_238A264",
+            "OVERLAY31_UNKNOWN_POINTER__NA_238A268",
+            "OVERLAY31_UNKNOWN_POINTER__NA_238A26C",
+            "OVERLAY31_UNKNOWN_POINTER__NA_238A270",
+            "OVERLAY31_UNKNOWN_POINTER__NA_238A274",
+            "OVERLAY31_UNKNOWN_POINTER__NA_238A278",
+            "OVERLAY31_UNKNOWN_POINTER__NA_238A27C",
+            "OVERLAY31_UNKNOWN_POINTER__NA_238A280",
+            "OVERLAY31_UNKNOWN_POINTER__NA_238A284",
+            "OVERLAY31_UNKNOWN_POINTER__NA_238A288",
+            "OVERLAY31_UNKNOWN_POINTER__NA_238A28C",
+            "ExplorersOfSkyMain",
+            "OVERLAY34_UNKNOWN_STRUCT__NA_22DD014",
+            "START_MENU_ITEMS_CONFIRM",
+            "OVERLAY34_UNKNOWN_STRUCT__NA_22DD03C",
+            "DUNGEON_DEBUG_MENU_ITEMS",
+            "OVERLAY34_RESERVED_SPACE",
+            "OVERLAY34_UNKNOWN_POINTER__NA_22DD080",
+            "OVERLAY34_UNKNOWN_POINTER__NA_22DD084",
+            "OVERLAY34_UNKNOWN_POINTER__NA_22DD088",
+            "OVERLAY34_UNKNOWN_POINTER__NA_22DD08C",
+            "OVERLAY34_UNKNOWN_POINTER__NA_22DD090",
+            "CreateJukeboxTrackMenu",
+            "CloseJukeboxTrackMenu",
+            "IsJukeboxTrackMenuActive",
+            "UpdateJukeboxTrackMenu",
+            "CreatePlaybackControlsMenu",
+            "ClosePlaybackControlsMenu",
+            "IsPlaybackControlsMenuActive",
+            "UpdatePlaybackControlsMenu",
+            "CreateInputLockBox",
+            "CloseInputLockBox",
+            "IsInputLockBoxActive",
+            "UpdateInputLockBox",
+            "JUKEBOX_TRACK_MENU_DEFAULT_WINDOW_PARAMS",
+            "PLAYBACK_CONTROLS_MENU_DEFAULT_WINDOW_PARAMS",
+            "INPUT_LOCK_BOX_DEFAULT_WINDOW_PARAMS",
+            "TOP_MENU_RETURN_MUSIC_ID",
+            "DEFAULT_MEMORY_ARENA_MEMORY",
+            "GROUND_MEMORY_ARENA_2",
+            "GROUND_MEMORY_ARENA_2_BLOCKS",
+            "GROUND_MEMORY_ARENA_2_MEMORY",
+            "DUNGEON_COLORMAP_PTR",
+            "DUNGEON_STRUCT",
+            "MOVE_DATA_TABLE",
+            "SOUND_MEMORY_ARENA",
+            "SOUND_MEMORY_ARENA_BLOCKS",
+            "SOUND_MEMORY_ARENA_MEMORY",
+            "FRAMES_SINCE_LAUNCH",
+            "TOUCHSCREEN_STATUS",
+            "BAG_ITEMS",
+            "BAG_ITEMS_PTR",
+            "STORAGE_ITEMS",
+            "STORAGE_ITEM_QUANTITIES",
+            "KECLEON_SHOP_ITEMS_PTR",
+            "KECLEON_SHOP_ITEMS",
+            "UNUSED_KECLEON_SHOP_ITEMS",
+            "KECLEON_WARES_ITEMS_PTR",
+            "KECLEON_WARES_ITEMS",
+            "UNUSED_KECLEON_WARES_ITEMS",
+            "MONEY_CARRIED",
+            "MONEY_STORED",
+            "AUDIO_COMMANDS_BUFFER",
+            "SOUND_MEMORY_ARENA_PTR",
+            "WINDOW_LIST",
+            "CURSOR_16_SPRITE_ID",
+            "CURSOR_SPRITE_ID",
+            "CURSOR_ANIMATION_CONTROL",
+            "CURSOR_16_ANIMATION_CONTROL",
+            "ALERT_SPRITE_ID",
+            "ALERT_ANIMATION_CONTROL",
+            "LAST_NEW_MOVE",
+            "SCRIPT_VARS_VALUES",
+            "BAG_LEVEL",
+            "DEBUG_SPECIAL_EPISODE_NUMBER",
+            "KAOMADO_STREAM",
+            "PENDING_DUNGEON_ID",
+            "PENDING_STARTING_FLOOR",
+            "PLAY_TIME_SECONDS",
+            "PLAY_TIME_FRAME_COUNTER",
+            "TEAM_NAME",
+            "LEVEL_UP_DATA_MONSTER_ID",
+            "LEVEL_UP_DATA_DECOMPRESS_BUFFER",
+            "TEAM_MEMBER_TABLE",
+            "DRIVER_WORK",
+            "DISP_MODE",
+            "GXI_VRAM_LOCK_ID",
+            "ENABLED_VRAM_BANKS",
+            "SUB_BG_EXT_PLTT",
+            "CLR_IMG",
+            "THREAD_INFO_STRUCT",
+            "FRAMES_SINCE_LAUNCH_TIMES_THREE",
+            "GROUND_MEMORY_ARENA_1_PTR",
+            "GROUND_MEMORY_ARENA_2_PTR",
+            "LOCK_NOTIFY_ARRAY",
+            "GROUND_MEMORY_ARENA_1",
+            "GROUND_MEMORY_ARENA_1_BLOCKS",
+            "GROUND_MEMORY_ARENA_1_MEMORY",
+            "SENTRY_DUTY_STRUCT",
+            "TURNING_ON_THE_SPOT_FLAG",
+            "LOADED_ATTACK_SPRITE_DATA",
+            "AI_THROWN_ITEM_DIRECTION_IS_USED",
+            "AI_THROWN_ITEM_PROBABILITIES",
+            "AI_THROWN_ITEM_DIRECTIONS",
+            "ROLLOUT_ICE_BALL_MISSED",
+            "MULTIHIT_FATIGUE_MOVE_USED",
+            "TWINEEDLE_HIT_TRACKER",
+            "RAPID_SPIN_BINDING_REMOVAL",
+            "ROLLOUT_ICE_BALL_SUCCESSIVE_HITS",
+            "MULTIHIT_MOVE_SUCCESSIVE_HITS",
+            "TRIPLE_KICK_SUCCESSIVE_HITS",
+            "METRONOME_NEXT_INDEX",
+            "FLOOR_GENERATION_STATUS",
+            "STAIRS_MENU_PTR",
+        ),
+        (
+            ("arm7",),
+            ("arm7",),
+            ("arm7",),
+            ("arm7",),
+            (
+                "arm7",
+                "itcm",
+            ),
+            (
+                "arm7",
+                "itcm",
+            ),
+            ("arm7",),
+            ("arm7",),
+            ("arm7",),
+            ("arm7",),
+            (
+                "arm7",
+                "libs",
+            ),
+            (
+                "arm7",
+                "libs",
+            ),
+            (
+                "arm7",
+                "libs",
+            ),
+            (
+                "arm7",
+                "libs",
+            ),
+            (
+                "arm7",
+                "libs",
+            ),
+            (
+                "arm7",
+                "libs",
+            ),
+            (
+                "arm7",
+                "libs",
+            ),
+            (
+                "arm7",
+                "libs",
+            ),
+            (
+                "arm7",
+                "libs",
+            ),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            (
+                "arm9",
+                "overlay10",
+                "overlay11",
+                "overlay29",
+            ),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("arm9",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("itcm",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("libs",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("move_effects",),
+            ("overlay0",),
+            ("overlay1",),
+            ("overlay1",),
+            ("overlay1",),
+            ("overlay1",),
+            ("overlay1",),
+            ("overlay1",),
+            ("overlay1",),
+            ("overlay1",),
+            ("overlay1",),
+            ("overlay1",),
+            ("overlay1",),
+            ("overlay1",),
+            ("overlay1",),
+            ("overlay1",),
+            ("overlay1",),
+            ("overlay1",),
+            ("overlay1",),
+            ("overlay1",),
+            ("overlay1",),
+            ("overlay1",),
+            ("overlay1",),
+            ("overlay1",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay10",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay11",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay13",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay14",),
+            ("overlay15",),
+            ("overlay15",),
+            ("overlay15",),
+            ("overlay15",),
+            ("overlay15",),
+            ("overlay15",),
+            ("overlay15",),
+            ("overlay15",),
+            ("overlay16",),
+            ("overlay16",),
+            ("overlay16",),
+            ("overlay16",),
+            ("overlay16",),
+            ("overlay16",),
+            ("overlay16",),
+            ("overlay16",),
+            ("overlay16",),
+            ("overlay16",),
+            ("overlay16",),
+            ("overlay16",),
+            ("overlay16",),
+            ("overlay16",),
+            ("overlay17",),
+            ("overlay17",),
+            ("overlay17",),
+            ("overlay17",),
+            ("overlay17",),
+            ("overlay17",),
+            ("overlay17",),
+            ("overlay17",),
+            ("overlay17",),
+            ("overlay17",),
+            ("overlay17",),
+            ("overlay17",),
+            ("overlay17",),
+            ("overlay17",),
+            ("overlay17",),
+            ("overlay17",),
+            ("overlay17",),
+            ("overlay17",),
+            ("overlay17",),
+            ("overlay17",),
+            ("overlay18",),
+            ("overlay18",),
+            ("overlay18",),
+            ("overlay18",),
+            ("overlay18",),
+            ("overlay18",),
+            ("overlay18",),
+            ("overlay18",),
+            ("overlay18",),
+            ("overlay18",),
+            ("overlay18",),
+            ("overlay18",),
+            ("overlay18",),
+            ("overlay18",),
+            ("overlay18",),
+            ("overlay18",),
+            ("overlay18",),
+            ("overlay18",),
+            ("overlay18",),
+            ("overlay18",),
+            ("overlay18",),
+            ("overlay18",),
+            ("overlay18",),
+            ("overlay18",),
+            ("overlay18",),
+            ("overlay19",),
+            ("overlay19",),
+            ("overlay19",),
+            ("overlay19",),
+            ("overlay19",),
+            ("overlay19",),
+            ("overlay19",),
+            ("overlay19",),
+            ("overlay19",),
+            ("overlay19",),
+            ("overlay19",),
+            ("overlay19",),
+            ("overlay19",),
+            ("overlay19",),
+            ("overlay19",),
+            ("overlay19",),
+            ("overlay19",),
+            ("overlay19",),
+            ("overlay19",),
+            ("overlay19",),
+            ("overlay19",),
+            ("overlay19",),
+            ("overlay19",),
+            ("overlay20",),
+            ("overlay20",),
+            ("overlay20",),
+            ("overlay20",),
+            ("overlay20",),
+            ("overlay20",),
+            ("overlay20",),
+            ("overlay20",),
+            ("overlay20",),
+            ("overlay20",),
+            ("overlay20",),
+            ("overlay20",),
+            ("overlay20",),
+            ("overlay20",),
+            ("overlay20",),
+            ("overlay20",),
+            ("overlay20",),
+            ("overlay20",),
+            ("overlay20",),
+            ("overlay20",),
+            ("overlay20",),
+            ("overlay20",),
+            ("overlay20",),
+            ("overlay20",),
+            ("overlay20",),
+            ("overlay21",),
+            ("overlay21",),
+            ("overlay21",),
+            ("overlay21",),
+            ("overlay21",),
+            ("overlay21",),
+            ("overlay21",),
+            ("overlay21",),
+            ("overlay21",),
+            ("overlay21",),
+            ("overlay21",),
+            ("overlay21",),
+            ("overlay21",),
+            ("overlay21",),
+            ("overlay21",),
+            ("overlay21",),
+            ("overlay21",),
+            ("overlay21",),
+            ("overlay21",),
+            ("overlay21",),
+            ("overlay22",),
+            ("overlay22",),
+            ("overlay22",),
+            ("overlay22",),
+            ("overlay22",),
+            ("overlay22",),
+            ("overlay22",),
+            ("overlay22",),
+            ("overlay22",),
+            ("overlay22",),
+            ("overlay22",),
+            ("overlay22",),
+            ("overlay22",),
+            ("overlay22",),
+            ("overlay22",),
+            ("overlay22",),
+            ("overlay22",),
+            ("overlay22",),
+            ("overlay22",),
+            ("overlay22",),
+            ("overlay22",),
+            ("overlay22",),
+            ("overlay23",),
+            ("overlay23",),
+            ("overlay23",),
+            ("overlay23",),
+            ("overlay23",),
+            ("overlay23",),
+            ("overlay23",),
+            ("overlay23",),
+            ("overlay23",),
+            ("overlay23",),
+            ("overlay23",),
+            ("overlay23",),
+            ("overlay23",),
+            ("overlay23",),
+            ("overlay23",),
+            ("overlay23",),
+            ("overlay23",),
+            ("overlay23",),
+            ("overlay23",),
+            ("overlay24",),
+            ("overlay24",),
+            ("overlay24",),
+            ("overlay24",),
+            ("overlay24",),
+            ("overlay24",),
+            ("overlay24",),
+            ("overlay24",),
+            ("overlay24",),
+            ("overlay24",),
+            ("overlay24",),
+            ("overlay24",),
+            ("overlay25",),
+            ("overlay25",),
+            ("overlay25",),
+            ("overlay25",),
+            ("overlay25",),
+            ("overlay25",),
+            ("overlay25",),
+            ("overlay25",),
+            ("overlay25",),
+            ("overlay25",),
+            ("overlay25",),
+            ("overlay25",),
+            ("overlay25",),
+            ("overlay25",),
+            ("overlay25",),
+            ("overlay26",),
+            ("overlay26",),
+            ("overlay26",),
+            ("overlay26",),
+            ("overlay26",),
+            ("overlay26",),
+            ("overlay26",),
+            ("overlay27",),
+            ("overlay27",),
+            ("overlay27",),
+            ("overlay27",),
+            ("overlay27",),
+            ("overlay27",),
+            ("overlay27",),
+            ("overlay27",),
+            ("overlay27",),
+            ("overlay27",),
+            ("overlay27",),
+            ("overlay27",),
+            ("overlay27",),
+            ("overlay27",),
+            ("overlay27",),
+            ("overlay27",),
+            ("overlay27",),
+            ("overlay27",),
+            ("overlay27",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay29",),
+            ("overlay30",),
+            ("overlay30",),
+            ("overlay30",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay31",),
+            ("overlay34",),
+            ("overlay34",),
+            ("overlay34",),
+            ("overlay34",),
+            ("overlay34",),
+            ("overlay34",),
+            ("overlay34",),
+            ("overlay34",),
+            ("overlay34",),
+            ("overlay34",),
+            ("overlay34",),
+            ("overlay9",),
+            ("overlay9",),
+            ("overlay9",),
+            ("overlay9",),
+            ("overlay9",),
+            ("overlay9",),
+            ("overlay9",),
+            ("overlay9",),
+            ("overlay9",),
+            ("overlay9",),
+            ("overlay9",),
+            ("overlay9",),
+            ("overlay9",),
+            ("overlay9",),
+            ("overlay9",),
+            ("overlay9",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+            ("ram",),
+        ),
+    )
+)
@@ -0,0 +1,6367 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the arm9 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "Svc_SoftReset",
+        "Svc_WaitByLoop",
+        "Svc_CpuSet",
+        "_start",
+        "InitI_CpuClear32",
+        "MIi_UncompressBackward",
+        "do_autoload",
+        "StartAutoloadDoneCallback",
+        "init_cp15",
+        "OSi_ReferSymbol",
+        "NitroMain",
+        "InitMemAllocTable",
+        "SetMemAllocatorParams",
+        "GetAllocArenaDefault",
+        "GetFreeArenaDefault",
+        "InitMemArena",
+        "MemAllocFlagsToBlockType",
+        "FindAvailableMemBlock",
+        "SplitMemBlock",
+        "MemAlloc",
+        "MemFree",
+        "MemArenaAlloc",
+        "CreateMemArena",
+        "MemLocateSet",
+        "MemLocateUnset",
+        "RoundUpDiv256",
+        "UFixedPoint64CmpLt",
+        "MultiplyByFixedPoint",
+        "UMultiplyByFixedPoint",
+        "IntToFixedPoint64",
+        "FixedPoint64ToInt",
+        "FixedPoint32To64",
+        "NegateFixedPoint64",
+        "FixedPoint64IsZero",
+        "FixedPoint64IsNegative",
+        "FixedPoint64CmpLt",
+        "MultiplyFixedPoint64",
+        "DivideFixedPoint64",
+        "UMultiplyFixedPoint64",
+        "UDivideFixedPoint64",
+        "AddFixedPoint64",
+        "ClampedLn",
+        "GetRngSeed",
+        "SetRngSeed",
+        "Rand16Bit",
+        "RandInt",
+        "RandRange",
+        "Rand32Bit",
+        "RandIntSafe",
+        "RandRangeSafe",
+        "WaitForever",
+        "InterruptMasterDisable",
+        "InterruptMasterEnable",
+        "InitMemAllocTableVeneer",
+        "ZInit8",
+        "PointsToZero",
+        "MemZero",
+        "MemZero16",
+        "MemZero32",
+        "MemsetSimple",
+        "Memset32",
+        "MemcpySimple",
+        "Memcpy16",
+        "Memcpy32",
+        "TaskProcBoot",
+        "EnableAllInterrupts",
+        "GetTime",
+        "DisableAllInterrupts",
+        "SoundResume",
+        "CardPullOutWithStatus",
+        "CardPullOut",
+        "CardBackupError",
+        "HaltProcessDisp",
+        "OverlayIsLoaded",
+        "LoadOverlay",
+        "UnloadOverlay",
+        "GetDsFirmwareUserSettingsVeneer",
+        "Rgb8ToRgb5",
+        "EuclideanNorm",
+        "ClampComponentAbs",
+        "GetHeldButtons",
+        "GetPressedButtons",
+        "GetReleasedStylus",
+        "KeyWaitInit",
+        "DebugPrintSystemClock",
+        "GetSystemClock",
+        "SprintfSystemClock",
+        "DataTransferInit",
+        "DataTransferStop",
+        "FileInitVeneer",
+        "FileOpen",
+        "FileGetSize",
+        "FileRead",
+        "FileSeek",
+        "FileClose",
+        "UnloadFile",
+        "LoadFileFromRom",
+        "TransformPaletteDataWithFlushDivideFade",
+        "UpdateFadeStatus",
+        "HandleFades",
+        "GetFadeStatus",
+        "InitDebug",
+        "InitDebugFlag",
+        "GetDebugFlag",
+        "SetDebugFlag",
+        "InitDebugStripped6",
+        "AppendProgPos",
+        "InitDebugStripped5",
+        "DebugPrintTrace",
+        "DebugDisplay",
+        "DebugPrint0",
+        "InitDebugLogFlag",
+        "GetDebugLogFlag",
+        "SetDebugLogFlag",
+        "DebugPrint",
+        "InitDebugStripped4",
+        "InitDebugStripped3",
+        "InitDebugStripped2",
+        "InitDebugStripped1",
+        "FatalError",
+        "OpenAllPackFiles",
+        "GetFileLengthInPackWithPackNb",
+        "LoadFileInPackWithPackId",
+        "AllocAndLoadFileInPack",
+        "OpenPackFile",
+        "GetFileLengthInPack",
+        "LoadFileInPack",
+        "GetDungeonResultMsg",
+        "GetDamageSource",
+        "GetItemCategoryVeneer",
+        "GetItemMoveId16",
+        "IsThrownItem",
+        "IsNotMoney",
+        "IsEdible",
+        "IsHM",
+        "IsGummi",
+        "IsAuraBow",
+        "IsLosableItem",
+        "IsTreasureBox",
+        "IsStorableItem",
+        "IsShoppableItem",
+        "IsValidTargetItem",
+        "IsItemUsableNow",
+        "IsTicketItem",
+        "InitItem",
+        "InitStandardItem",
+        "InitBulkItem",
+        "BulkItemToItem",
+        "ItemToBulkItem",
+        "GetDisplayedBuyPrice",
+        "GetDisplayedSellPrice",
+        "GetActualBuyPrice",
+        "GetActualSellPrice",
+        "FindItemInInventory",
+        "SprintfStatic",
+        "ItemZInit",
+        "AreItemsEquivalent",
+        "WriteItemsToSave",
+        "ReadItemsFromSave",
+        "IsItemAvailableInDungeonGroup",
+        "GetItemIdFromList",
+        "NormalizeTreasureBox",
+        "SortItemList",
+        "RemoveEmptyItems",
+        "LoadItemPspi2n",
+        "GetExclusiveItemType",
+        "GetExclusiveItemOffsetEnsureValid",
+        "IsItemValid",
+        "GetExclusiveItemParameter",
+        "GetItemCategory",
+        "EnsureValidItem",
+        "GetItemName",
+        "GetItemNameFormatted",
+        "GetItemBuyPrice",
+        "GetItemSellPrice",
+        "GetItemSpriteId",
+        "GetItemPaletteId",
+        "GetItemActionName",
+        "GetThrownItemQuantityLimit",
+        "GetItemMoveId",
+        "TestItemAiFlag",
+        "IsItemInTimeDarkness",
+        "IsItemValidVeneer",
+        "SetActiveInventoryToMain",
+        "AllInventoriesZInit",
+        "SpecialEpisodeInventoryZInit",
+        "RescueInventoryZInit",
+        "SetActiveInventory",
+        "GetMoneyCarried",
+        "SetMoneyCarried",
+        "AddMoneyCarried",
+        "GetCurrentBagCapacity",
+        "IsBagFull",
+        "GetNbItemsInBag",
+        "CountNbItemsOfTypeInBag",
+        "CountItemTypeInBag",
+        "IsItemInBag",
+        "IsItemWithFlagsInBag",
+        "IsItemInTreasureBoxes",
+        "IsHeldItemInBag",
+        "IsItemForSpecialSpawnInBag",
+        "HasStorableItems",
+        "GetItemIndex",
+        "GetEquivItemIndex",
+        "GetEquippedThrowableItem",
+        "GetFirstUnequippedItemOfType",
+        "CopyItemAtIdx",
+        "GetItemAtIdx",
+        "RemoveEmptyItemsInBag",
+        "RemoveItemNoHole",
+        "RemoveItem",
+        "RemoveHeldItemNoHole",
+        "RemoveItemByIdAndStackNoHole",
+        "RemoveEquivItem",
+        "RemoveEquivItemNoHole",
+        "DecrementStackItem",
+        "RemoveItemNoHoleCheck",
+        "RemoveFirstUnequippedItemOfType",
+        "RemoveAllItems",
+        "RemoveAllItemsStartingAt",
+        "SpecialProcAddItemToBag",
+        "AddItemToBagNoHeld",
+        "AddItemToBag",
+        "CleanStickyItemsInBag",
+        "CountStickyItemsInBag",
+        "TransmuteHeldItemInBag",
+        "SetFlagsForHeldItemInBag",
+        "RemoveHolderForItemInBag",
+        "SetHolderForItemInBag",
+        "SortItemsInBag",
+        "RemovePokeItemsInBag",
+        "IsStorageFull",
+        "CountNbOfItemsInStorage",
+        "CountNbOfValidItemsInStorage",
+        "CountNbOfValidItemsInTimeDarknessInStorage",
+        "CountNbItemsOfTypeInStorage",
+        "CountItemTypeInStorage",
+        "GetEquivBulkItemIdxInStorage",
+        "ConvertStorageItemAtIdxToBulkItem",
+        "ConvertStorageItemAtIdxToItem",
+        "RemoveItemAtIdxInStorage",
+        "RemoveBulkItemInStorage",
+        "RemoveItemInStorage",
+        "StorageZInit",
+        "AddBulkItemToStorage",
+        "AddItemToStorage",
+        "SortItemsInStorage",
+        "AllKecleonShopsZInit",
+        "SpecialEpisodeKecleonShopZInit",
+        "SetActiveKecleonShop",
+        "GetMoneyStored",
+        "SetMoneyStored",
+        "AddMoneyStored",
+        "SortKecleonItems1",
+        "GenerateKecleonItems1",
+        "SortKecleonItems2",
+        "GenerateKecleonItems2",
+        "GetExclusiveItemOffset",
+        "ApplyExclusiveItemStatBoosts",
+        "SetExclusiveItemEffect",
+        "ExclusiveItemEffectFlagTest",
+        "IsExclusiveItemIdForMonster",
+        "IsExclusiveItemForMonster",
+        "BagHasExclusiveItemTypeForMonster",
+        "GetExclusiveItemForMonsterFromBag",
+        "GetHpBoostFromExclusiveItems",
+        "ApplyGummiBoostsToGroundMonster",
+        "ApplyGummiBoostsToTeamMember",
+        "ApplySitrusBerryBoostToGroundMonster",
+        "ApplyLifeSeedBoostToGroundMonster",
+        "ApplyGinsengToGroundMonster",
+        "ApplyProteinBoostToGroundMonster",
+        "ApplyCalciumBoostToGroundMonster",
+        "ApplyIronBoostToGroundMonster",
+        "ApplyZincBoostToGroundMonster",
+        "ApplyNectarBoostToGroundMonster",
+        "IsMonsterAffectedByGravelyrockGroundMode",
+        "ApplyGravelyrockBoostToGroundMonster",
+        "ApplyGummiBoostsGroundMode",
+        "LoadSynthBin",
+        "CloseSynthBin",
+        "GetSynthItem",
+        "LoadWazaP",
+        "LoadWazaP2",
+        "UnloadCurrentWazaP",
+        "GetMoveName",
+        "FormatMoveString",
+        "FormatMoveStringMore",
+        "InitMove",
+        "InitMoveCheckId",
+        "GetInfoMoveGround",
+        "GetMoveTargetAndRange",
+        "GetMoveType",
+        "GetMovesetLevelUpPtr",
+        "IsInvalidMoveset",
+        "GetMovesetHmTmPtr",
+        "GetMovesetEggPtr",
+        "GetMoveAiWeight",
+        "GetMoveNbStrikes",
+        "GetMoveBasePower",
+        "GetMoveBasePowerGround",
+        "GetMoveAccuracyOrAiChance",
+        "GetMoveBasePp",
+        "GetMaxPp",
+        "GetMoveMaxGinsengBoost",
+        "GetMoveMaxGinsengBoostGround",
+        "GetMoveCritChance",
+        "IsThawingMove",
+        "IsAffectedByTaunt",
+        "GetMoveRangeId",
+        "GetMoveActualAccuracy",
+        "GetMoveBasePowerFromId",
+        "IsMoveRangeString19",
+        "GetMoveMessageFromId",
+        "GetNbMoves",
+        "GetMovesetIdx",
+        "IsReflectedByMagicCoat",
+        "CanBeSnatched",
+        "FailsWhileMuzzled",
+        "IsSoundMove",
+        "IsRecoilMove",
+        "AllManip1",
+        "AllManip2",
+        "ManipMoves1v1",
+        "ManipMoves1v2",
+        "ManipMoves2v1",
+        "ManipMoves2v2",
+        "DungeonMoveToGroundMove",
+        "GroundToDungeonMoveset",
+        "DungeonToGroundMoveset",
+        "GetInfoGroundMoveset",
+        "FindFirstFreeMovesetIdx",
+        "LearnMoves",
+        "CopyMoveTo",
+        "CopyMoveFrom",
+        "CopyMovesetTo",
+        "CopyMovesetFrom",
+        "Is2TurnsMove",
+        "IsRegularAttackOrProjectile",
+        "IsPunchMove",
+        "IsHealingWishOrLunarDance",
+        "IsCopyingMove",
+        "IsTrappingMove",
+        "IsOneHitKoMove",
+        "IsNot2TurnsMoveOrSketch",
+        "IsRealMove",
+        "IsMovesetValid",
+        "IsRealMoveInTimeDarkness",
+        "IsMovesetValidInTimeDarkness",
+        "GetFirstNotRealMoveInTimeDarkness",
+        "IsSameMove",
+        "GetMoveCategory",
+        "GetPpIncrease",
+        "OpenWaza",
+        "SelectWaza",
+        "PlayBgmByIdVeneer",
+        "PlayBgmByIdVolumeVeneer",
+        "PlaySeVolumeWrapper",
+        "PlayBgmById",
+        "PlayBgmByIdVolume",
+        "StopBgmCommand",
+        "PlaySeByIdVolume",
+        "SendAudioCommand2",
+        "AllocAudioCommand",
+        "SendAudioCommand",
+        "InitSoundSystem",
+        "ManipBgmPlayback",
+        "SoundDriverReset",
+        "LoadDseFile",
+        "PlaySeLoad",
+        "IsSongOver",
+        "PlayBgm",
+        "StopBgm",
+        "ChangeBgm",
+        "PlayBgm2",
+        "StopBgm2",
+        "ChangeBgm2",
+        "PlayME",
+        "StopME",
+        "PlaySe",
+        "PlaySeFullSpec",
+        "SeChangeVolume",
+        "SeChangePan",
+        "StopSe",
+        "CopyAndInterleaveWrapper",
+        "InitAnimationControl",
+        "InitAnimationControlWithSet",
+        "SetSpriteIdForAnimationControl",
+        "SetAnimationForAnimationControlInternal",
+        "SetAnimationForAnimationControl",
+        "GetWanForAnimationControl",
+        "SetAndPlayAnimationForAnimationControl",
+        "SwitchAnimationControlToNextFrame",
+        "LoadAnimationFrameAndIncrementInAnimationControl",
+        "AnimationControlGetAllocForMaxFrame",
+        "DeleteWanTableEntry",
+        "AllocateWanTableEntry",
+        "FindWanTableEntry",
+        "GetLoadedWanTableEntry",
+        "InitWanTable",
+        "LoadWanTableEntry",
+        "LoadWanTableEntryFromPack",
+        "LoadWanTableEntryFromPackUseProvidedMemory",
+        "ReplaceWanFromBinFile",
+        "DeleteWanTableEntryVeneer",
+        "WanHasAnimationGroup",
+        "WanTableSpriteHasAnimationGroup",
+        "SpriteTypeInWanTable",
+        "LoadWteFromRom",
+        "LoadWteFromFileDirectory",
+        "UnloadWte",
+        "LoadWtuFromBin",
+        "ProcessWte",
+        "GeomSetTexImageParam",
+        "GeomSetVertexCoord16",
+        "InitRender3dData",
+        "GeomSwapBuffers",
+        "InitRender3dElement64",
+        "Render3d64Texture0x7",
+        "Render3d64WindowFrame",
+        "EnqueueRender3d64Tiling",
+        "Render3d64Tiling",
+        "Render3d64Quadrilateral",
+        "Render3d64RectangleMulticolor",
+        "Render3d64Rectangle",
+        "Render3d64Nothing",
+        "Render3d64Texture",
+        "Render3dElement64",
+        "HandleSir0Translation",
+        "ConvertPointersSir0",
+        "HandleSir0TranslationVeneer",
+        "DecompressAtNormalVeneer",
+        "DecompressAtNormal",
+        "DecompressAtHalf",
+        "DecompressAtFromMemoryPointerVeneer",
+        "DecompressAtFromMemoryPointer",
+        "WriteByteFromMemoryPointer",
+        "GetAtSize",
+        "GetLanguageType",
+        "GetLanguage",
+        "StrcmpTag",
+        "AtoiTag",
+        "AnalyzeText",
+        "PreprocessString",
+        "PreprocessStringFromId",
+        "StrcmpTagVeneer",
+        "AtoiTagVeneer",
+        "InitPreprocessorArgs",
+        "SetStringAccuracy",
+        "SetStringPower",
+        "GetRankString",
+        "GetCurrentTeamNameString",
+        "GetBagNameString",
+        "GetDungeonResultString",
+        "SetQuestionMarks",
+        "StrcpySimple",
+        "StrncpySimple",
+        "StrncpySimpleNoPad",
+        "StrncmpSimple",
+        "StrncpySimpleNoPadSafe",
+        "StrcpyName",
+        "StrncpyName",
+        "GetStringFromFile",
+        "LoadStringFile",
+        "AllocateTemp1024ByteBufferFromPool",
+        "GetStringFromFileVeneer",
+        "StringFromId",
+        "CopyStringFromId",
+        "CopyNStringFromId",
+        "LoadTblTalk",
+        "GetTalkLine",
+        "IsAOrBPressed",
+        "DrawTextInWindow",
+        "GetCharWidth",
+        "GetColorCodePaletteOffset",
+        "DrawChar",
+        "GetWindow",
+        "NewWindowScreenCheck",
+        "NewWindow",
+        "SetScreenWindowsColor",
+        "SetBothScreensWindowsColor",
+        "UpdateWindow",
+        "ClearWindow",
+        "DeleteWindow",
+        "GetWindowRectangle",
+        "GetWindowContents",
+        "LoadCursors",
+        "InitWindowTrailer",
+        "Arm9LoadUnkFieldNa0x2029EC8",
+        "Arm9StoreUnkFieldNa0x2029ED8",
+        "LoadAlert",
+        "PrintClearMark",
+        "PrintBadgeMark",
+        "PrintMark",
+        "CreateParentMenuFromStringIds",
+        "IsEmptyString",
+        "CreateParentMenu",
+        "CreateParentMenuWrapper",
+        "CreateParentMenuInternal",
+        "ResumeParentMenu",
+        "SetParentMenuState7",
+        "CloseParentMenu",
+        "IsParentMenuActive",
+        "CheckParentMenuField0x1A0",
+        "UpdateParentMenu",
+        "CreateSimpleMenuFromStringIds",
+        "CreateSimpleMenu",
+        "CreateSimpleMenuInternal",
+        "ResumeSimpleMenu",
+        "CloseSimpleMenu",
+        "IsSimpleMenuActive",
+        "CheckSimpleMenuField0x1A0",
+        "GetSimpleMenuField0x1A4",
+        "GetSimpleMenuResult",
+        "UpdateSimpleMenu",
+        "SetSimpleMenuField0x1AC",
+        "CreateAdvancedMenu",
+        "ResumeAdvancedMenu",
+        "CloseAdvancedMenu",
+        "IsAdvancedMenuActive2",
+        "IsAdvancedMenuActive",
+        "GetAdvancedMenuCurrentOption",
+        "GetAdvancedMenuResult",
+        "UpdateAdvancedMenu",
+        "CreateCollectionMenu",
+        "SetCollectionMenuField0x1BC",
+        "SetCollectionMenuWidth",
+        "CloseCollectionMenu",
+        "IsCollectionMenuActive",
+        "SetCollectionMenuField0x1C8",
+        "SetCollectionMenuField0x1A0",
+        "SetCollectionMenuField0x1A4",
+        "SetCollectionMenuVoidFn",
+        "UpdateCollectionMenu",
+        "SetCollectionMenuField0x1B2",
+        "IsCollectionMenuState3",
+        "CreateOptionsMenu",
+        "CloseOptionsMenu",
+        "IsOptionsMenuActive",
+        "CheckOptionsMenuField0x1A4",
+        "GetOptionsMenuStates",
+        "GetOptionsMenuResult",
+        "UpdateOptionsMenu",
+        "CreateDebugMenu",
+        "CloseDebugMenu",
+        "IsDebugMenuActive",
+        "CheckDebugMenuField0x1A4",
+        "UpdateDebugMenu",
+        "CreateScrollBoxSingle",
+        "CreateScrollBoxMulti",
+        "SetScrollBoxState7",
+        "CloseScrollBox",
+        "IsScrollBoxActive",
+        "UpdateScrollBox",
+        "CreateDialogueBox",
+        "CloseDialogueBox",
+        "IsDialogueBoxActive",
+        "ShowStringIdInDialogueBox",
+        "ShowStringInDialogueBox",
+        "ShowDialogueBox",
+        "ReadStringFromDialogueBox",
+        "UpdateDialogueBox",
+        "CreatePortraitBox",
+        "ClosePortraitBox",
+        "PortraitBoxNeedsUpdate",
+        "ShowPortraitInPortraitBox",
+        "HidePortraitBox",
+        "UpdatePortraitBox",
+        "CreateTextBox",
+        "CreateTextBoxWithArg",
+        "CloseTextBox",
+        "CloseTextBox2",
+        "CreateTextBoxInternal",
+        "UpdateTextBox",
+        "IsTextBoxActive",
+        "CreateAreaNameBox",
+        "SetAreaNameBoxState3",
+        "CloseAreaNameBox",
+        "IsAreaNameBoxActive",
+        "UpdateAreaNameBox",
+        "CreateControlsChart",
+        "CloseControlsChart",
+        "IsControlsChartActive",
+        "UpdateControlsChart",
+        "CreateAlertBox",
+        "CloseAlertBox",
+        "IsAlertBoxActive",
+        "UpdateAlertBox",
+        "CreateAdvancedTextBox",
+        "CreateAdvancedTextBoxWithArg",
+        "CreateAdvancedTextBoxInternal",
+        "SetAdvancedTextBoxPartialMenu",
+        "SetAdvancedTextBoxField0x1C4",
+        "SetAdvancedTextBoxField0x1C2",
+        "CloseAdvancedTextBox2",
+        "SetAdvancedTextBoxState5",
+        "CloseAdvancedTextBox",
+        "IsAdvancedTextBoxActive",
+        "GetAdvancedTextBoxFlags2",
+        "SetUnkAdvancedTextBoxFn",
+        "SetUnkAdvancedTextBoxWindowFn",
+        "UpdateAdvancedTextBox",
+        "PlayAdvancedTextBoxInputSound",
+        "CreateTeamSelectionMenu",
+        "CloseTeamSelectionMenu",
+        "IsTeamSelectionMenuActive",
+        "UpdateTeamSelectionMenu",
+        "IsTeamSelectionMenuState3",
+        "CalcMenuHeightDiv8",
+        "InitWindowInput",
+        "IsMenuOptionActive",
+        "PlayWindowInputSound",
+        "InitInventoryMenuInput",
+        "ShowKeyboard",
+        "GetKeyboardStatus",
+        "GetKeyboardStringResult",
+        "TeamSelectionMenuGetItem",
+        "PrintMoveOptionMenu",
+        "PrintIqSkillsMenu",
+        "GetNotifyNote",
+        "SetNotifyNote",
+        "InitSpecialEpisodeHero",
+        "EventFlagBackupVeneer",
+        "InitMainTeamAfterQuiz",
+        "InitSpecialEpisodePartners",
+        "InitSpecialEpisodeExtraPartner",
+        "ReadStringSave",
+        "CheckStringSave",
+        "WriteSaveFile",
+        "ReadSaveFile",
+        "CalcChecksum",
+        "CheckChecksumInvalid",
+        "NoteSaveBase",
+        "WriteQuickSaveInfo",
+        "ReadSaveHeader",
+        "NoteLoadBase",
+        "ReadQuickSaveInfo",
+        "GetGameMode",
+        "InitScriptVariableValues",
+        "InitEventFlagScriptVars",
+        "ZinitScriptVariable",
+        "LoadScriptVariableRaw",
+        "LoadScriptVariableValue",
+        "LoadScriptVariableValueAtIndex",
+        "SaveScriptVariableValue",
+        "SaveScriptVariableValueAtIndex",
+        "LoadScriptVariableValueSum",
+        "LoadScriptVariableValueBytes",
+        "SaveScriptVariableValueBytes",
+        "ScriptVariablesEqual",
+        "EventFlagResume",
+        "EventFlagBackup",
+        "DumpScriptVariableValues",
+        "RestoreScriptVariableValues",
+        "InitScenarioScriptVars",
+        "SetScenarioScriptVar",
+        "GetSpecialEpisodeType",
+        "SetSpecialEpisodeType",
+        "GetExecuteSpecialEpisodeType",
+        "IsSpecialEpisodeOpen",
+        "HasPlayedOldGame",
+        "GetPerformanceFlagWithChecks",
+        "GetScenarioBalance",
+        "ScenarioFlagBackup",
+        "InitWorldMapScriptVars",
+        "InitDungeonListScriptVars",
+        "SetDungeonConquest",
+        "GetDungeonMode",
+        "GlobalProgressAlloc",
+        "ResetGlobalProgress",
+        "SetMonsterFlag1",
+        "GetMonsterFlag1",
+        "SetMonsterFlag2",
+        "HasMonsterBeenAttackedInDungeons",
+        "SetDungeonTipShown",
+        "GetDungeonTipShown",
+        "SetMaxReachedFloor",
+        "GetMaxReachedFloor",
+        "IncrementNbAdventures",
+        "GetNbAdventures",
+        "CanMonsterSpawn",
+        "IncrementExclusiveMonsterCounts",
+        "CopyProgressInfoTo",
+        "CopyProgressInfoFromScratchTo",
+        "CopyProgressInfoFrom",
+        "CopyProgressInfoFromScratchFrom",
+        "InitKaomadoStream",
+        "InitPortraitParams",
+        "InitPortraitParamsWithMonsterId",
+        "SetPortraitEmotion",
+        "SetPortraitLayout",
+        "SetPortraitOffset",
+        "AllowPortraitDefault",
+        "IsValidPortrait",
+        "LoadPortrait",
+        "WonderMailPasswordToMission",
+        "SetEnterDungeon",
+        "InitDungeonInit",
+        "IsNoLossPenaltyDungeon",
+        "CheckMissionRestrictions",
+        "GetNbFloors",
+        "GetNbFloorsPlusOne",
+        "GetDungeonGroup",
+        "GetNbPrecedingFloors",
+        "GetNbFloorsDungeonGroup",
+        "DungeonFloorToGroupFloor",
+        "GetMissionRank",
+        "GetOutlawLevel",
+        "GetOutlawLeaderLevel",
+        "GetOutlawMinionLevel",
+        "AddGuestMonster",
+        "GetGroundNameId",
+        "SetAdventureLogStructLocation",
+        "SetAdventureLogDungeonFloor",
+        "GetAdventureLogDungeonFloor",
+        "ClearAdventureLogStruct",
+        "SetAdventureLogCompleted",
+        "IsAdventureLogNotEmpty",
+        "GetAdventureLogCompleted",
+        "IncrementNbDungeonsCleared",
+        "GetNbDungeonsCleared",
+        "IncrementNbFriendRescues",
+        "GetNbFriendRescues",
+        "IncrementNbEvolutions",
+        "GetNbEvolutions",
+        "IncrementNbSteals",
+        "IncrementNbEggsHatched",
+        "GetNbEggsHatched",
+        "GetNbPokemonJoined",
+        "GetNbMovesLearned",
+        "SetVictoriesOnOneFloor",
+        "GetVictoriesOnOneFloor",
+        "SetPokemonJoined",
+        "SetPokemonBattled",
+        "GetNbPokemonBattled",
+        "IncrementNbBigTreasureWins",
+        "SetNbBigTreasureWins",
+        "GetNbBigTreasureWins",
+        "SetNbRecycled",
+        "GetNbRecycled",
+        "IncrementNbSkyGiftsSent",
+        "SetNbSkyGiftsSent",
+        "GetNbSkyGiftsSent",
+        "ComputeSpecialCounters",
+        "RecruitSpecialPokemonLog",
+        "IncrementNbFainted",
+        "GetNbFainted",
+        "SetItemAcquired",
+        "GetNbItemAcquired",
+        "SetChallengeLetterCleared",
+        "GetSentryDutyGamePoints",
+        "SetSentryDutyGamePoints",
+        "CopyLogTo",
+        "CopyLogFrom",
+        "GetAbilityString",
+        "GetAbilityDescStringId",
+        "GetTypeStringId",
+        "GetConversion2ConvertToType",
+        "CopyBitsTo",
+        "CopyBitsFrom",
+        "StoreDefaultTeamData",
+        "GetMainTeamNameWithCheck",
+        "GetMainTeamName",
+        "SetMainTeamName",
+        "GetRankupPoints",
+        "GetRank",
+        "GetRankStorageSize",
+        "ResetPlayTimer",
+        "PlayTimerTick",
+        "GetPlayTimeSeconds",
+        "SubFixedPoint",
+        "BinToDecFixedPoint",
+        "CeilFixedPoint",
+        "DungeonGoesUp",
+        "GetTurnLimit",
+        "DoesNotSaveWhenEntering",
+        "TreasureBoxDropsEnabled",
+        "IsLevelResetDungeon",
+        "GetMaxItemsAllowed",
+        "IsMoneyAllowed",
+        "GetMaxRescueAttempts",
+        "IsRecruitingAllowed",
+        "GetLeaderChangeFlag",
+        "GetRandomMovementChance",
+        "CanEnemyEvolve",
+        "GetMaxMembersAllowed",
+        "IsIqEnabled",
+        "IsTrapInvisibleWhenAttacking",
+        "JoinedAtRangeCheck",
+        "IsDojoDungeon",
+        "IsFutureDungeon",
+        "IsSpecialEpisodeDungeon",
+        "RetrieveFromItemList1",
+        "IsForbiddenFloor",
+        "Copy16BitsFrom",
+        "RetrieveFromItemList2",
+        "IsInvalidForMission",
+        "IsExpEnabledInDungeon",
+        "IsSkyExclusiveDungeon",
+        "JoinedAtRangeCheck2",
+        "GetBagCapacity",
+        "GetBagCapacitySpecialEpisode",
+        "GetRankUpEntry",
+        "GetBgRegionArea",
+        "LoadMonsterMd",
+        "GetNameRaw",
+        "GetName",
+        "GetNameWithGender",
+        "GetSpeciesString",
+        "GetNameString",
+        "GetSpriteIndex",
+        "GetDexNumber",
+        "GetCategoryString",
+        "GetMonsterGender",
+        "GetBodySize",
+        "GetSpriteSize",
+        "GetSpriteFileSize",
+        "GetShadowSize",
+        "GetSpeedStatus",
+        "GetMobilityType",
+        "GetRegenSpeed",
+        "GetCanMoveFlag",
+        "GetChanceAsleep",
+        "GetWeightMultiplier",
+        "GetSize",
+        "GetBaseHp",
+        "CanThrowItems",
+        "CanEvolve",
+        "GetMonsterPreEvolution",
+        "GetBaseOffensiveStat",
+        "GetBaseDefensiveStat",
+        "GetType",
+        "GetAbility",
+        "GetRecruitRate2",
+        "GetRecruitRate1",
+        "GetExp",
+        "GetEvoParameters",
+        "GetTreasureBoxChances",
+        "GetIqGroup",
+        "GetSpawnThreshold",
+        "NeedsItemToSpawn",
+        "GetExclusiveItem",
+        "GetFamilyIndex",
+        "LoadM2nAndN2m",
+        "GuestMonsterToGroundMonster",
+        "StrcmpMonsterName",
+        "GetLvlUpEntry",
+        "GetEncodedHalfword",
+        "GetEvoFamily",
+        "GetEvolutions",
+        "ShuffleHiddenPower",
+        "GetBaseForm",
+        "GetBaseFormBurmyWormadamShellosGastrodonCherrim",
+        "GetBaseFormCastformCherrimDeoxys",
+        "GetAllBaseForms",
+        "GetDexNumberVeneer",
+        "GetMonsterIdFromSpawnEntry",
+        "SetMonsterId",
+        "SetMonsterLevelAndId",
+        "GetMonsterLevelFromSpawnEntry",
+        "GetMonsterGenderVeneer",
+        "IsMonsterValid",
+        "IsUnown",
+        "IsShaymin",
+        "IsCastform",
+        "IsCherrim",
+        "IsDeoxys",
+        "GetSecondFormIfValid",
+        "FemaleToMaleForm",
+        "GetBaseFormCastformDeoxysCherrim",
+        "BaseFormsEqual",
+        "DexNumbersEqual",
+        "GendersEqual",
+        "GendersEqualNotGenderless",
+        "GendersNotEqualNotGenderless",
+        "IsMonsterOnTeam",
+        "GetNbRecruited",
+        "IsValidTeamMember",
+        "IsMainCharacter",
+        "GetTeamMember",
+        "GetHeroMemberIdx",
+        "GetPartnerMemberIdx",
+        "GetMainCharacter1MemberIdx",
+        "GetMainCharacter2MemberIdx",
+        "GetMainCharacter3MemberIdx",
+        "GetHero",
+        "GetPartner",
+        "GetMainCharacter1",
+        "GetMainCharacter2",
+        "GetMainCharacter3",
+        "GetFirstMatchingMemberIdx",
+        "GetFirstEmptyMemberIdx",
+        "IsMonsterNotNicknamed",
+        "RemoveActiveMembersFromAllTeams",
+        "RemoveActiveMembersFromSpecialEpisodeTeam",
+        "RemoveActiveMembersFromRescueTeam",
+        "CheckTeamMemberIdx",
+        "IsMonsterIdInNormalRange",
+        "SetActiveTeam",
+        "GetActiveTeamMember",
+        "GetActiveRosterIndex",
+        "TryAddMonsterToActiveTeam",
+        "RemoveActiveMembersFromMainTeam",
+        "SetTeamSetupHeroAndPartnerOnly",
+        "SetTeamSetupHeroOnly",
+        "GetPartyMembers",
+        "RefillTeam",
+        "ClearItem",
+        "ChangeGiratinaFormIfSkyDungeon",
+        "GetIqSkillStringId",
+        "DoesTacticFollowLeader",
+        "GetUnlockedTactics",
+        "GetUnlockedTacticFlags",
+        "CanLearnIqSkill",
+        "GetLearnableIqSkills",
+        "DisableIqSkill",
+        "EnableIqSkill",
+        "GetSpeciesIqSkill",
+        "DisableAllIqSkills",
+        "EnableAllLearnableIqSkills",
+        "IqSkillFlagTest",
+        "GetNextIqSkill",
+        "GetExplorerMazeTeamName",
+        "GetExplorerMazeMonster",
+        "WriteMonsterInfoToSave",
+        "ReadMonsterInfoFromSave",
+        "WriteMonsterToSave",
+        "ReadMonsterFromSave",
+        "GetEvolutionPossibilities",
+        "GetMonsterEvoStatus",
+        "CopyTacticString",
+        "GetStatBoostsForMonsterSummary",
+        "CreateMonsterSummaryFromTeamMember",
+        "GetSosMailCount",
+        "IsMissionSuspendedAndValid",
+        "AreMissionsEquivalent",
+        "IsMissionValid",
+        "GenerateMission",
+        "IsMissionTypeSpecialEpisode",
+        "GenerateDailyMissions",
+        "AlreadyHaveMission",
+        "CountJobListMissions",
+        "DungeonRequestsDone",
+        "DungeonRequestsDoneWrapper",
+        "AnyDungeonRequestsDone",
+        "AddMissionToJobList",
+        "GetAcceptedMission",
+        "GetMissionByTypeAndDungeon",
+        "CheckAcceptedMissionByTypeAndDungeon",
+        "GetAllPossibleMonsters",
+        "GenerateAllPossibleMonstersList",
+        "DeleteAllPossibleMonstersList",
+        "GenerateAllPossibleDungeonsList",
+        "DeleteAllPossibleDungeonsList",
+        "GenerateAllPossibleDeliverList",
+        "DeleteAllPossibleDeliverList",
+        "ClearMissionData",
+        "IsMonsterMissionAllowed",
+        "CanMonsterBeUsedForMissionWrapper",
+        "CanMonsterBeUsedForMission",
+        "IsMonsterMissionAllowedStory",
+        "CanDungeonBeUsedForMission",
+        "CanSendItem",
+        "IsAvailableItem",
+        "GetAvailableItemDeliveryList",
+        "GetActorMatchingStorageId",
+        "SetActorTalkMainAndActorTalkSub",
+        "SetActorTalkMain",
+        "SetActorTalkSub",
+        "RandomizeDemoActors",
+        "ItemAtTableIdx",
+        "MainLoop",
+        "CreateJobSummary",
+        "DungeonSwapIdToIdx",
+        "DungeonSwapIdxToId",
+        "GetDungeonModeSpecial",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x1A4,
+            0x6B0,
+            0x79E,
+            0x800,
+            0x954,
+            0x970,
+            0xA1C,
+            0xAAC,
+            0xAB0,
+            0xB9C,
+            0xC6C,
+            0xDE0,
+            0xE70,
+            0xEC0,
+            0xEC4,
+            0xEC8,
+            0xF44,
+            0xF88,
+            0x1070,
+            0x1170,
+            0x1188,
+            0x119C,
+            0x1280,
+            0x1390,
+            0x1638,
+            0x1894,
+            0x1A30,
+            0x1A54,
+            0x1B0C,
+            0x1C80,
+            0x1CB0,
+            0x1CD4,
+            0x1CF8,
+            0x1D28,
+            0x1D50,
+            0x1D68,
+            0x1DF4,
+            0x1EC8,
+            0x1FA0,
+            0x2084,
+            0x21C8,
+            0x21F4,
+            0x222C,
+            0x223C,
+            0x224C,
+            0x2274,
+            0x228C,
+            0x22AC,
+            0x22F8,
+            0x2318,
+            0x2438,
+            0x30CC,
+            0x30E4,
+            0x321C,
+            0x3228,
+            0x3238,
+            0x3250,
+            0x326C,
+            0x3288,
+            0x32A4,
+            0x32BC,
+            0x32D4,
+            0x32F0,
+            0x330C,
+            0x3328,
+            0x3608,
+            0x37B4,
+            0x3824,
+            0x3CC4,
+            0x3D2C,
+            0x3D70,
+            0x3D94,
+            0x3DB8,
+            0x3ED0,
+            0x40AC,
+            0x4868,
+            0x4F74,
+            0x4FCC,
+            0xFFFFFFFF,
+            0x5110,
+            0x61EC,
+            0x625C,
+            0x6C1C,
+            0x6DA4,
+            0x6EF8,
+            0x6F68,
+            0x6FB8,
+            0x8168,
+            0x8194,
+            0x8204,
+            0x8210,
+            0x8244,
+            0x8254,
+            0x82A8,
+            0x82C4,
+            0x8BD4,
+            0x8C3C,
+            0xAE38,
+            0xBA18,
+            0xBA90,
+            0xBDB4,
+            0xC15C,
+            0xC194,
+            0xC198,
+            0xC1A0,
+            0xC1A4,
+            0xC1A8,
+            0xC1F0,
+            0xC1F4,
+            0xC250,
+            0xC284,
+            0xC2B8,
+            0xC2BC,
+            0xC2C4,
+            0xC2C8,
+            0xC2D4,
+            0xC2D8,
+            0xC2DC,
+            0xC2E0,
+            0xC2E4,
+            0xC364,
+            0xC3C4,
+            0xC3E4,
+            0xC410,
+            0xC468,
+            0xC4FC,
+            0xC50C,
+            0xC584,
+            0xCADC,
+            0xCB78,
+            0xCB84,
+            0xCB98,
+            0xCBB4,
+            0xCBD4,
+            0xCBF8,
+            0xCC7C,
+            0xCC9C,
+            0xCCC0,
+            0xCD0C,
+            0xCD30,
+            0xCD68,
+            0xCE34,
+            0xCE80,
+            0xCEFC,
+            0xCF24,
+            0xCFE0,
+            0xD000,
+            0xD078,
+            0xD128,
+            0xD158,
+            0xD1A0,
+            0xD1E8,
+            0xD230,
+            0xD300,
+            0xFFFFFFFF,
+            0xD8A4,
+            0xD8BC,
+            0xD9E4,
+            0xDCCC,
+            0xE094,
+            0xE0DC,
+            0xE280,
+            0xE428,
+            0xE698,
+            0xE760,
+            0xE830,
+            0xE84C,
+            0xE890,
+            0xE8B8,
+            0xE8D8,
+            0xE8F8,
+            0xE934,
+            0xE954,
+            0xEA60,
+            0xEA80,
+            0xEAA0,
+            0xEAC0,
+            0xEAE0,
+            0xEB00,
+            0xEB28,
+            0xEB48,
+            0xEBD8,
+            0xEC00,
+            0xEC74,
+            0xEC84,
+            0xECF0,
+            0xED38,
+            0xED80,
+            0xEDA4,
+            0xEDC4,
+            0xEE00,
+            0xEE2C,
+            0xEE68,
+            0xEEA4,
+            0xEEF4,
+            0xEF30,
+            0xEF88,
+            0xEFC8,
+            0xF014,
+            0xF074,
+            0xF0F8,
+            0xF18C,
+            0xF1F4,
+            0xF234,
+            0xF2B0,
+            0xF314,
+            0xF388,
+            0xF3F0,
+            0xF418,
+            0xF438,
+            0xF4AC,
+            0xF4FC,
+            0xF57C,
+            0xF600,
+            0xF6A8,
+            0xF73C,
+            0xF7C0,
+            0xF840,
+            0xF850,
+            0xF884,
+            0xF8F4,
+            0xF91C,
+            0xF92C,
+            0xF9B8,
+            0xF9E8,
+            0xFB10,
+            0xFB94,
+            0xFBFC,
+            0xFC88,
+            0xFCCC,
+            0xFD54,
+            0xFDFC,
+            0xFE20,
+            0xFE58,
+            0xFEA8,
+            0xFF50,
+            0xFF8C,
+            0xFFF8,
+            0x10054,
+            0x1009C,
+            0x10248,
+            0x1028C,
+            0x10308,
+            0x10384,
+            0x103C4,
+            0x10454,
+            0x104CC,
+            0x1063C,
+            0x106FC,
+            0x1076C,
+            0x107B4,
+            0x107CC,
+            0x10800,
+            0x109FC,
+            0x10AF4,
+            0x10D08,
+            0x10E00,
+            0x10EE8,
+            0x10F0C,
+            0x11028,
+            0x1104C,
+            0x1106C,
+            0x1113C,
+            0x11180,
+            0x11214,
+            0x1143C,
+            0x115D0,
+            0x115FC,
+            0x11628,
+            0x11664,
+            0x116A0,
+            0x117B4,
+            0x117F0,
+            0x1182C,
+            0x11868,
+            0x118A4,
+            0x118D8,
+            0x118F8,
+            0x11944,
+            0x12B88,
+            0x12BDC,
+            0x132F8,
+            0x1346C,
+            0x13494,
+            0x134BC,
+            0x134FC,
+            0x13520,
+            0x13828,
+            0x13860,
+            0x13890,
+            0x138D0,
+            0x138E8,
+            0x1390C,
+            0x1392C,
+            0x13974,
+            0x1399C,
+            0x139E8,
+            0x13A34,
+            0x13A54,
+            0x13A74,
+            0x13A94,
+            0x13AB4,
+            0x13AD8,
+            0x13AF8,
+            0x13B78,
+            0x13B98,
+            0x13BB8,
+            0x13BD8,
+            0x13BF8,
+            0x13C18,
+            0x13C38,
+            0x13C90,
+            0x13CAC,
+            0x13CD8,
+            0x13D0C,
+            0xFFFFFFFF,
+            0x13DB0,
+            0x13DCC,
+            0x13DE8,
+            0x13E04,
+            0x13EBC,
+            0x14288,
+            0x142B0,
+            0x14344,
+            0x143E4,
+            0x1454C,
+            0x145EC,
+            0x14754,
+            0x1478C,
+            0x14820,
+            0x14860,
+            0x14908,
+            0x14954,
+            0x14AF4,
+            0x14B2C,
+            0x14B64,
+            0x14B94,
+            0x14D0C,
+            0x14D94,
+            0x14DC0,
+            0x14E00,
+            0x14E2C,
+            0x14E64,
+            0x14EA8,
+            0x14EE0,
+            0x14F0C,
+            0x14FA0,
+            0x1500C,
+            0x150AC,
+            0x150CC,
+            0x151F4,
+            0x15270,
+            0x1528C,
+            0x1533C,
+            0x153A4,
+            0x17BF4,
+            0x17C00,
+            0x17D68,
+            0x17E90,
+            0x17F0C,
+            0x17F84,
+            0x18354,
+            0x18B80,
+            0x18C08,
+            0x18C44,
+            0x18CC4,
+            0x18F40,
+            0x19164,
+            0x19428,
+            0x19610,
+            0x198EC,
+            0x19954,
+            0x19BC4,
+            0x19CEC,
+            0x19E20,
+            0x1A084,
+            0x1A184,
+            0x1A264,
+            0x1A4A8,
+            0x1A598,
+            0x1A708,
+            0x1A8C4,
+            0x1A99C,
+            0x1AA80,
+            0x1C08C,
+            0x1C0EC,
+            0xFFFFFFFF,
+            0x1C184,
+            0x1C218,
+            0x1C368,
+            0x1C484,
+            0x1C4B4,
+            0x1C4F4,
+            0x1C5FC,
+            0x1D20C,
+            0x1D278,
+            0x1D2E0,
+            0x1D370,
+            0x1D3D0,
+            0x1D458,
+            0x1D478,
+            0x1D520,
+            0x1D62C,
+            0x1D720,
+            0x1D7C8,
+            0x1DAE0,
+            0x1DB1C,
+            0x1DD0C,
+            0x1DEE8,
+            0x1DF60,
+            0x1DFB4,
+            0x1E050,
+            0x1E14C,
+            0x1E530,
+            0x1E570,
+            0x1E5A0,
+            0x1E7B8,
+            0x1E7CC,
+            0x1E8E0,
+            0x1EA88,
+            0x1ED38,
+            0x1EE24,
+            0x1EEEC,
+            0x1EF8C,
+            0x1F0F8,
+            0x1F1A4,
+            0x1F1A8,
+            0x1F270,
+            0x1F550,
+            0x1F5D0,
+            0x1F628,
+            0x1F65C,
+            0x1F668,
+            0x1FAAC,
+            0x1FFE8,
+            0x1FFF4,
+            0x2050C,
+            0x20588,
+            0x20688,
+            0x206B0,
+            0x20A20,
+            0x20A64,
+            0x20F20,
+            0x225EC,
+            0x237B4,
+            0x237F4,
+            0x23800,
+            0x238B4,
+            0x245C0,
+            0x24688,
+            0x24D88,
+            0x24F00,
+            0x250C8,
+            0x252A4,
+            0x253B0,
+            0x253CC,
+            0x253E8,
+            0x2543C,
+            0x25478,
+            0x254C0,
+            0x254FC,
+            0x255E0,
+            0x25A54,
+            0x25AE4,
+            0x25B54,
+            0x25B84,
+            0x25B90,
+            0x25BB0,
+            0x25BD8,
+            0x25C08,
+            0x25C58,
+            0x261CC,
+            0x264F8,
+            0x26830,
+            0x268A8,
+            0x26A50,
+            0x278EC,
+            0x2793C,
+            0x279B4,
+            0x27D5C,
+            0x27D74,
+            0x27DE4,
+            0x27E4C,
+            0x28488,
+            0x28578,
+            0x28630,
+            0x29800,
+            0x29964,
+            0x2A1BC,
+            0x2A1CC,
+            0x2A1DC,
+            0x2A6D8,
+            0x2A728,
+            0x2A750,
+            0x2A8C0,
+            0x2A960,
+            0x2A984,
+            0x2AA24,
+            0x2AA50,
+            0x2AC48,
+            0x2AD9C,
+            0x2ADB0,
+            0x2AE34,
+            0x2AE54,
+            0x2AEF0,
+            0x2B3E0,
+            0x2B4A0,
+            0x2B578,
+            0x2B784,
+            0x2B7B8,
+            0x2B7E4,
+            0x2B804,
+            0x2B84C,
+            0x2B870,
+            0x2B8BC,
+            0x2BD00,
+            0x2BD14,
+            0x2BEE4,
+            0x2BF38,
+            0x2BFB0,
+            0x2BFD0,
+            0x2BFF0,
+            0x2C004,
+            0x2C058,
+            0x2C69C,
+            0x2C8D4,
+            0x2C8E8,
+            0x2CA00,
+            0x2CA1C,
+            0x2CA88,
+            0x2CA9C,
+            0x2CAB0,
+            0x2CAC4,
+            0x2CAFC,
+            0x2D3CC,
+            0x2D408,
+            0x2D4E4,
+            0x2D824,
+            0x2D850,
+            0x2D870,
+            0x2D8A4,
+            0x2D8D8,
+            0x2D90C,
+            0x2DF44,
+            0x2E1EC,
+            0x2E218,
+            0x2E238,
+            0x2E28C,
+            0x2E6C0,
+            0x2E80C,
+            0x2E9A4,
+            0x2E9BC,
+            0x2E9D8,
+            0x2E9FC,
+            0x2F3A4,
+            0x2F43C,
+            0x2F474,
+            0x2F4A8,
+            0x2F530,
+            0x2F698,
+            0x2F740,
+            0x2F77C,
+            0x2F8A0,
+            0x2F944,
+            0x2F960,
+            0x2F984,
+            0x2F9D0,
+            0x2FA00,
+            0x2FBB8,
+            0x2FBD0,
+            0x2FBF0,
+            0x2FC0C,
+            0x2FCD0,
+            0x2FD50,
+            0x2FE90,
+            0x2FEB0,
+            0x30030,
+            0x30044,
+            0x30060,
+            0x30080,
+            0x30120,
+            0x301C8,
+            0x301E4,
+            0x30204,
+            0x302A4,
+            0x30338,
+            0x304E8,
+            0x30568,
+            0x308A8,
+            0x308D8,
+            0x30910,
+            0x30A70,
+            0x30A98,
+            0x30B30,
+            0x30B44,
+            0x30B80,
+            0x30B94,
+            0x30BB8,
+            0x30D34,
+            0x30DB4,
+            0x30DC8,
+            0x30DDC,
+            0x3121C,
+            0x31238,
+            0x3148C,
+            0x314A8,
+            0x31530,
+            0x31BA4,
+            0xFFFFFFFF,
+            0x31DEC,
+            0x32768,
+            0x32C54,
+            0x32D2C,
+            0x36AE4,
+            0x36FD0,
+            0x37858,
+            0x3AA58,
+            0x405BC,
+            0x41D3C,
+            0x487BC,
+            0x487CC,
+            0x48804,
+            0x48A74,
+            0x48AE0,
+            0x48D28,
+            0x48DA0,
+            0x48ED0,
+            0x48EEC,
+            0x49190,
+            0x491EC,
+            0x49240,
+            0x49268,
+            0x492A0,
+            0x49564,
+            0x49588,
+            0x496A8,
+            0x49960,
+            0x4B2F8,
+            0x4B384,
+            0x4B63C,
+            0x4B76C,
+            0x4B7D4,
+            0x4B824,
+            0x4B9B0,
+            0x4BB58,
+            0x4BCC0,
+            0x4BE38,
+            0x4BE9C,
+            0x4BF04,
+            0x4BF50,
+            0x4C2F8,
+            0x4C51C,
+            0x4C740,
+            0x4C768,
+            0x4C7C0,
+            0x4C950,
+            0x4CC24,
+            0x4CC38,
+            0x4CC70,
+            0x4CC84,
+            0x4CDA8,
+            0x4CDCC,
+            0x4CECC,
+            0x4CFF0,
+            0x4D0C0,
+            0x4D1C8,
+            0x4D270,
+            0x4D2D4,
+            0x4D440,
+            0x4D468,
+            0x4D484,
+            0x4D4C0,
+            0x4D4FC,
+            0x4D540,
+            0x4D588,
+            0x4D5C8,
+            0x4D614,
+            0x4D630,
+            0x4D650,
+            0x4D684,
+            0x4D698,
+            0x4D6A0,
+            0x4D6F8,
+            0x4D880,
+            0x4D8B8,
+            0x4DA80,
+            0x4DAB8,
+            0x4DAD4,
+            0x4DB0C,
+            0x4DB2C,
+            0x4DB3C,
+            0x4DB80,
+            0x4DBCC,
+            0x4DBD4,
+            0x4DBF4,
+            0x4E0B8,
+            0x4EC84,
+            0x4ED94,
+            0x4F318,
+            0x4F6FC,
+            0x4F8B4,
+            0x4F8EC,
+            0x4F900,
+            0x4F918,
+            0x4F930,
+            0x4F984,
+            0x4FB4C,
+            0x4FBC4,
+            0x4FBE0,
+            0x4FBFC,
+            0x4FC18,
+            0x4FC90,
+            0x4FD5C,
+            0x4FD74,
+            0x4FD94,
+            0x4FDA8,
+            0x4FED4,
+            0x4FEFC,
+            0x4FF34,
+            0x4FF60,
+            0x4FFA4,
+            0x4FFB8,
+            0x50000,
+            0x50014,
+            0x5005C,
+            0x50070,
+            0x50074,
+            0x500B0,
+            0x500C4,
+            0x500D8,
+            0x500EC,
+            0x50120,
+            0x50134,
+            0x50190,
+            0x501EC,
+            0x50200,
+            0x50220,
+            0x50258,
+            0x5026C,
+            0x502A4,
+            0x502B8,
+            0x502D8,
+            0x50310,
+            0x50324,
+            0x5057C,
+            0x505E8,
+            0x50624,
+            0x50638,
+            0x50704,
+            0x50758,
+            0x507DC,
+            0x507F4,
+            0x50884,
+            0x50A70,
+            0x50C54,
+            0x50C74,
+            0x50C88,
+            0x50C9C,
+            0x50CF8,
+            0x50D78,
+            0x50E04,
+            0x50E48,
+            0x50EB4,
+            0x50ECC,
+            0x50EF0,
+            0x50FAC,
+            0x5101C,
+            0x51140,
+            0x51150,
+            0x5118C,
+            0x51248,
+            0x51358,
+            0x5139C,
+            0x515C0,
+            0x515E8,
+            0x51600,
+            0x51628,
+            0x51650,
+            0x51678,
+            0x51690,
+            0x516B8,
+            0x516D0,
+            0x516F8,
+            0x51720,
+            0x51738,
+            0x51760,
+            0x51778,
+            0x517A0,
+            0x517C8,
+            0x517E8,
+            0x51804,
+            0x51820,
+            0x5183C,
+            0x518A0,
+            0x51924,
+            0x519B4,
+            0x51A14,
+            0x51A54,
+            0x51A7C,
+            0x51A98,
+            0x51B0C,
+            0x51B1C,
+            0x51B2C,
+            0x521C4,
+            0x52690,
+            0x526CC,
+            0x52708,
+            0x52778,
+            0x52838,
+            0x52A00,
+            0xFFFFFFFF,
+            0x52A78,
+            0x52A94,
+            0x52AE0,
+            0x52AFC,
+            0x52B18,
+            0x52B54,
+            0x52B74,
+            0x52B90,
+            0x52BAC,
+            0x52BC8,
+            0x52BEC,
+            0x52C18,
+            0x52C34,
+            0x52C50,
+            0x52C6C,
+            0x52C88,
+            0x52CB4,
+            0x52CE0,
+            0x52CFC,
+            0x52D1C,
+            0x52D3C,
+            0x52D5C,
+            0x52D7C,
+            0x52D98,
+            0x52DB4,
+            0x52DE8,
+            0x52E18,
+            0x52E60,
+            0x52E7C,
+            0x52E98,
+            0x52EC4,
+            0x52EF0,
+            0x52F0C,
+            0x531CC,
+            0x5332C,
+            0x53B18,
+            0x53BC8,
+            0x5414C,
+            0x54204,
+            0x54344,
+            0x543A0,
+            0x545CC,
+            0x54714,
+            0x547E0,
+            0x547F0,
+            0x547FC,
+            0x5481C,
+            0x54824,
+            0x54834,
+            0x54ADC,
+            0x54AE8,
+            0x54E04,
+            0x54E20,
+            0x54E50,
+            0x54EA8,
+            0x54EF0,
+            0x54F20,
+            0x54F5C,
+            0x54FA0,
+            0x55054,
+            0x55140,
+            0x551C8,
+            0x551F4,
+            0x55244,
+            0x554C4,
+            0x555F0,
+            0x5570C,
+            0x558A4,
+            0x55924,
+            0x559CC,
+            0x559F8,
+            0x55A24,
+            0x55A68,
+            0x55AAC,
+            0x55AEC,
+            0x55B14,
+            0x55B40,
+            0x55B88,
+            0x55BD0,
+            0x55C70,
+            0x55CE0,
+            0x563EC,
+            0x56444,
+            0x564D4,
+            0x5653C,
+            0x565E0,
+            0x56610,
+            0x56648,
+            0x56708,
+            0x56738,
+            0x56AD0,
+            0x56CDC,
+            0x56D48,
+            0x56E2C,
+            0x56F9C,
+            0x580D4,
+            0x5856C,
+            0x58954,
+            0x58F98,
+            0x58FB8,
+            0x58FC8,
+            0x59018,
+            0x59054,
+            0x59080,
+            0x59120,
+            0x59170,
+            0x591E4,
+            0x59208,
+            0x5922C,
+            0x59280,
+            0x592A0,
+            0x593DC,
+            0x59474,
+            0x59494,
+            0x595A0,
+            0x596B0,
+            0x597C0,
+            0x59E94,
+            0x5A58C,
+            0x5A7AC,
+            0x5A7CC,
+            0x5B1A4,
+            0x5BCF8,
+            0x5CBD0,
+            0x5CCB0,
+            0x5CDBC,
+            0x5D5A0,
+            0x5E5B4,
+            0x5E94C,
+            0x5F014,
+            0x5F100,
+            0x5F120,
+            0x5F18C,
+            0x5F19C,
+            0x5F434,
+            0x5F454,
+            0x5F728,
+            0x5F820,
+            0x5FAB4,
+            0x5FAD4,
+            0x5FB40,
+            0x5FB70,
+            0x5FC1C,
+            0x5FC4C,
+            0x5FC88,
+            0x5FD34,
+            0x62D90,
+            0x62DD4,
+            0x62DE4,
+            0x62E60,
+            0x62F34,
+            0x63158,
+            0x637D8,
+            0x63824,
+            0x65D14,
+            0x65EB8,
+            0x65ECC,
+            0x65EDC,
+            0x65FC4,
+            0x66074,
+            0x66098,
+            0x69B98,
+            0x6AAAC,
+            0x6AAE8,
+            0x6AB04,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x20001A4,
+            0x20006B0,
+            0x200079E,
+            0x2000800,
+            0x2000954,
+            0x2000970,
+            0x2000A1C,
+            0x2000AAC,
+            0x2000AB0,
+            0x2000B9C,
+            0x2000C6C,
+            0x2000DE0,
+            0x2000E70,
+            0x2000EC0,
+            0x2000EC4,
+            0x2000EC8,
+            0x2000F44,
+            0x2000F88,
+            0x2001070,
+            0x2001170,
+            0x2001188,
+            0x200119C,
+            0x2001280,
+            0x2001390,
+            0x2001638,
+            0x2001894,
+            0x2001A30,
+            0x2001A54,
+            0x2001B0C,
+            0x2001C80,
+            0x2001CB0,
+            0x2001CD4,
+            0x2001CF8,
+            0x2001D28,
+            0x2001D50,
+            0x2001D68,
+            0x2001DF4,
+            0x2001EC8,
+            0x2001FA0,
+            0x2002084,
+            0x20021C8,
+            0x20021F4,
+            0x200222C,
+            0x200223C,
+            0x200224C,
+            0x2002274,
+            0x200228C,
+            0x20022AC,
+            0x20022F8,
+            0x2002318,
+            0x2002438,
+            0x20030CC,
+            0x20030E4,
+            0x200321C,
+            0x2003228,
+            0x2003238,
+            0x2003250,
+            0x200326C,
+            0x2003288,
+            0x20032A4,
+            0x20032BC,
+            0x20032D4,
+            0x20032F0,
+            0x200330C,
+            0x2003328,
+            0x2003608,
+            0x20037B4,
+            0x2003824,
+            0x2003CC4,
+            0x2003D2C,
+            0x2003D70,
+            0x2003D94,
+            0x2003DB8,
+            0x2003ED0,
+            0x20040AC,
+            0x2004868,
+            0x2004F74,
+            0x2004FCC,
+            0xFFFFFFFF,
+            0x2005110,
+            0x20061EC,
+            0x200625C,
+            0x2006C1C,
+            0x2006DA4,
+            0x2006EF8,
+            0x2006F68,
+            0x2006FB8,
+            0x2008168,
+            0x2008194,
+            0x2008204,
+            0x2008210,
+            0x2008244,
+            0x2008254,
+            0x20082A8,
+            0x20082C4,
+            0x2008BD4,
+            0x2008C3C,
+            0x200AE38,
+            0x200BA18,
+            0x200BA90,
+            0x200BDB4,
+            0x200C15C,
+            0x200C194,
+            0x200C198,
+            0x200C1A0,
+            0x200C1A4,
+            0x200C1A8,
+            0x200C1F0,
+            0x200C1F4,
+            0x200C250,
+            0x200C284,
+            0x200C2B8,
+            0x200C2BC,
+            0x200C2C4,
+            0x200C2C8,
+            0x200C2D4,
+            0x200C2D8,
+            0x200C2DC,
+            0x200C2E0,
+            0x200C2E4,
+            0x200C364,
+            0x200C3C4,
+            0x200C3E4,
+            0x200C410,
+            0x200C468,
+            0x200C4FC,
+            0x200C50C,
+            0x200C584,
+            0x200CADC,
+            0x200CB78,
+            0x200CB84,
+            0x200CB98,
+            0x200CBB4,
+            0x200CBD4,
+            0x200CBF8,
+            0x200CC7C,
+            0x200CC9C,
+            0x200CCC0,
+            0x200CD0C,
+            0x200CD30,
+            0x200CD68,
+            0x200CE34,
+            0x200CE80,
+            0x200CEFC,
+            0x200CF24,
+            0x200CFE0,
+            0x200D000,
+            0x200D078,
+            0x200D128,
+            0x200D158,
+            0x200D1A0,
+            0x200D1E8,
+            0x200D230,
+            0x200D300,
+            0xFFFFFFFF,
+            0x200D8A4,
+            0x200D8BC,
+            0x200D9E4,
+            0x200DCCC,
+            0x200E094,
+            0x200E0DC,
+            0x200E280,
+            0x200E428,
+            0x200E698,
+            0x200E760,
+            0x200E830,
+            0x200E84C,
+            0x200E890,
+            0x200E8B8,
+            0x200E8D8,
+            0x200E8F8,
+            0x200E934,
+            0x200E954,
+            0x200EA60,
+            0x200EA80,
+            0x200EAA0,
+            0x200EAC0,
+            0x200EAE0,
+            0x200EB00,
+            0x200EB28,
+            0x200EB48,
+            0x200EBD8,
+            0x200EC00,
+            0x200EC74,
+            0x200EC84,
+            0x200ECF0,
+            0x200ED38,
+            0x200ED80,
+            0x200EDA4,
+            0x200EDC4,
+            0x200EE00,
+            0x200EE2C,
+            0x200EE68,
+            0x200EEA4,
+            0x200EEF4,
+            0x200EF30,
+            0x200EF88,
+            0x200EFC8,
+            0x200F014,
+            0x200F074,
+            0x200F0F8,
+            0x200F18C,
+            0x200F1F4,
+            0x200F234,
+            0x200F2B0,
+            0x200F314,
+            0x200F388,
+            0x200F3F0,
+            0x200F418,
+            0x200F438,
+            0x200F4AC,
+            0x200F4FC,
+            0x200F57C,
+            0x200F600,
+            0x200F6A8,
+            0x200F73C,
+            0x200F7C0,
+            0x200F840,
+            0x200F850,
+            0x200F884,
+            0x200F8F4,
+            0x200F91C,
+            0x200F92C,
+            0x200F9B8,
+            0x200F9E8,
+            0x200FB10,
+            0x200FB94,
+            0x200FBFC,
+            0x200FC88,
+            0x200FCCC,
+            0x200FD54,
+            0x200FDFC,
+            0x200FE20,
+            0x200FE58,
+            0x200FEA8,
+            0x200FF50,
+            0x200FF8C,
+            0x200FFF8,
+            0x2010054,
+            0x201009C,
+            0x2010248,
+            0x201028C,
+            0x2010308,
+            0x2010384,
+            0x20103C4,
+            0x2010454,
+            0x20104CC,
+            0x201063C,
+            0x20106FC,
+            0x201076C,
+            0x20107B4,
+            0x20107CC,
+            0x2010800,
+            0x20109FC,
+            0x2010AF4,
+            0x2010D08,
+            0x2010E00,
+            0x2010EE8,
+            0x2010F0C,
+            0x2011028,
+            0x201104C,
+            0x201106C,
+            0x201113C,
+            0x2011180,
+            0x2011214,
+            0x201143C,
+            0x20115D0,
+            0x20115FC,
+            0x2011628,
+            0x2011664,
+            0x20116A0,
+            0x20117B4,
+            0x20117F0,
+            0x201182C,
+            0x2011868,
+            0x20118A4,
+            0x20118D8,
+            0x20118F8,
+            0x2011944,
+            0x2012B88,
+            0x2012BDC,
+            0x20132F8,
+            0x201346C,
+            0x2013494,
+            0x20134BC,
+            0x20134FC,
+            0x2013520,
+            0x2013828,
+            0x2013860,
+            0x2013890,
+            0x20138D0,
+            0x20138E8,
+            0x201390C,
+            0x201392C,
+            0x2013974,
+            0x201399C,
+            0x20139E8,
+            0x2013A34,
+            0x2013A54,
+            0x2013A74,
+            0x2013A94,
+            0x2013AB4,
+            0x2013AD8,
+            0x2013AF8,
+            0x2013B78,
+            0x2013B98,
+            0x2013BB8,
+            0x2013BD8,
+            0x2013BF8,
+            0x2013C18,
+            0x2013C38,
+            0x2013C90,
+            0x2013CAC,
+            0x2013CD8,
+            0x2013D0C,
+            0xFFFFFFFF,
+            0x2013DB0,
+            0x2013DCC,
+            0x2013DE8,
+            0x2013E04,
+            0x2013EBC,
+            0x2014288,
+            0x20142B0,
+            0x2014344,
+            0x20143E4,
+            0x201454C,
+            0x20145EC,
+            0x2014754,
+            0x201478C,
+            0x2014820,
+            0x2014860,
+            0x2014908,
+            0x2014954,
+            0x2014AF4,
+            0x2014B2C,
+            0x2014B64,
+            0x2014B94,
+            0x2014D0C,
+            0x2014D94,
+            0x2014DC0,
+            0x2014E00,
+            0x2014E2C,
+            0x2014E64,
+            0x2014EA8,
+            0x2014EE0,
+            0x2014F0C,
+            0x2014FA0,
+            0x201500C,
+            0x20150AC,
+            0x20150CC,
+            0x20151F4,
+            0x2015270,
+            0x201528C,
+            0x201533C,
+            0x20153A4,
+            0x2017BF4,
+            0x2017C00,
+            0x2017D68,
+            0x2017E90,
+            0x2017F0C,
+            0x2017F84,
+            0x2018354,
+            0x2018B80,
+            0x2018C08,
+            0x2018C44,
+            0x2018CC4,
+            0x2018F40,
+            0x2019164,
+            0x2019428,
+            0x2019610,
+            0x20198EC,
+            0x2019954,
+            0x2019BC4,
+            0x2019CEC,
+            0x2019E20,
+            0x201A084,
+            0x201A184,
+            0x201A264,
+            0x201A4A8,
+            0x201A598,
+            0x201A708,
+            0x201A8C4,
+            0x201A99C,
+            0x201AA80,
+            0x201C08C,
+            0x201C0EC,
+            0xFFFFFFFF,
+            0x201C184,
+            0x201C218,
+            0x201C368,
+            0x201C484,
+            0x201C4B4,
+            0x201C4F4,
+            0x201C5FC,
+            0x201D20C,
+            0x201D278,
+            0x201D2E0,
+            0x201D370,
+            0x201D3D0,
+            0x201D458,
+            0x201D478,
+            0x201D520,
+            0x201D62C,
+            0x201D720,
+            0x201D7C8,
+            0x201DAE0,
+            0x201DB1C,
+            0x201DD0C,
+            0x201DEE8,
+            0x201DF60,
+            0x201DFB4,
+            0x201E050,
+            0x201E14C,
+            0x201E530,
+            0x201E570,
+            0x201E5A0,
+            0x201E7B8,
+            0x201E7CC,
+            0x201E8E0,
+            0x201EA88,
+            0x201ED38,
+            0x201EE24,
+            0x201EEEC,
+            0x201EF8C,
+            0x201F0F8,
+            0x201F1A4,
+            0x201F1A8,
+            0x201F270,
+            0x201F550,
+            0x201F5D0,
+            0x201F628,
+            0x201F65C,
+            0x201F668,
+            0x201FAAC,
+            0x201FFE8,
+            0x201FFF4,
+            0x202050C,
+            0x2020588,
+            0x2020688,
+            0x20206B0,
+            0x2020A20,
+            0x2020A64,
+            0x2020F20,
+            0x20225EC,
+            0x20237B4,
+            0x20237F4,
+            0x2023800,
+            0x20238B4,
+            0x20245C0,
+            0x2024688,
+            0x2024D88,
+            0x2024F00,
+            0x20250C8,
+            0x20252A4,
+            0x20253B0,
+            0x20253CC,
+            0x20253E8,
+            0x202543C,
+            0x2025478,
+            0x20254C0,
+            0x20254FC,
+            0x20255E0,
+            0x2025A54,
+            0x2025AE4,
+            0x2025B54,
+            0x2025B84,
+            0x2025B90,
+            0x2025BB0,
+            0x2025BD8,
+            0x2025C08,
+            0x2025C58,
+            0x20261CC,
+            0x20264F8,
+            0x2026830,
+            0x20268A8,
+            0x2026A50,
+            0x20278EC,
+            0x202793C,
+            0x20279B4,
+            0x2027D5C,
+            0x2027D74,
+            0x2027DE4,
+            0x2027E4C,
+            0x2028488,
+            0x2028578,
+            0x2028630,
+            0x2029800,
+            0x2029964,
+            0x202A1BC,
+            0x202A1CC,
+            0x202A1DC,
+            0x202A6D8,
+            0x202A728,
+            0x202A750,
+            0x202A8C0,
+            0x202A960,
+            0x202A984,
+            0x202AA24,
+            0x202AA50,
+            0x202AC48,
+            0x202AD9C,
+            0x202ADB0,
+            0x202AE34,
+            0x202AE54,
+            0x202AEF0,
+            0x202B3E0,
+            0x202B4A0,
+            0x202B578,
+            0x202B784,
+            0x202B7B8,
+            0x202B7E4,
+            0x202B804,
+            0x202B84C,
+            0x202B870,
+            0x202B8BC,
+            0x202BD00,
+            0x202BD14,
+            0x202BEE4,
+            0x202BF38,
+            0x202BFB0,
+            0x202BFD0,
+            0x202BFF0,
+            0x202C004,
+            0x202C058,
+            0x202C69C,
+            0x202C8D4,
+            0x202C8E8,
+            0x202CA00,
+            0x202CA1C,
+            0x202CA88,
+            0x202CA9C,
+            0x202CAB0,
+            0x202CAC4,
+            0x202CAFC,
+            0x202D3CC,
+            0x202D408,
+            0x202D4E4,
+            0x202D824,
+            0x202D850,
+            0x202D870,
+            0x202D8A4,
+            0x202D8D8,
+            0x202D90C,
+            0x202DF44,
+            0x202E1EC,
+            0x202E218,
+            0x202E238,
+            0x202E28C,
+            0x202E6C0,
+            0x202E80C,
+            0x202E9A4,
+            0x202E9BC,
+            0x202E9D8,
+            0x202E9FC,
+            0x202F3A4,
+            0x202F43C,
+            0x202F474,
+            0x202F4A8,
+            0x202F530,
+            0x202F698,
+            0x202F740,
+            0x202F77C,
+            0x202F8A0,
+            0x202F944,
+            0x202F960,
+            0x202F984,
+            0x202F9D0,
+            0x202FA00,
+            0x202FBB8,
+            0x202FBD0,
+            0x202FBF0,
+            0x202FC0C,
+            0x202FCD0,
+            0x202FD50,
+            0x202FE90,
+            0x202FEB0,
+            0x2030030,
+            0x2030044,
+            0x2030060,
+            0x2030080,
+            0x2030120,
+            0x20301C8,
+            0x20301E4,
+            0x2030204,
+            0x20302A4,
+            0x2030338,
+            0x20304E8,
+            0x2030568,
+            0x20308A8,
+            0x20308D8,
+            0x2030910,
+            0x2030A70,
+            0x2030A98,
+            0x2030B30,
+            0x2030B44,
+            0x2030B80,
+            0x2030B94,
+            0x2030BB8,
+            0x2030D34,
+            0x2030DB4,
+            0x2030DC8,
+            0x2030DDC,
+            0x203121C,
+            0x2031238,
+            0x203148C,
+            0x20314A8,
+            0x2031530,
+            0x2031BA4,
+            0xFFFFFFFF,
+            0x2031DEC,
+            0x2032768,
+            0x2032C54,
+            0x2032D2C,
+            0x2036AE4,
+            0x2036FD0,
+            0x2037858,
+            0x203AA58,
+            0x20405BC,
+            0x2041D3C,
+            0x20487BC,
+            0x20487CC,
+            0x2048804,
+            0x2048A74,
+            0x2048AE0,
+            0x2048D28,
+            0x2048DA0,
+            0x2048ED0,
+            0x2048EEC,
+            0x2049190,
+            0x20491EC,
+            0x2049240,
+            0x2049268,
+            0x20492A0,
+            0x2049564,
+            0x2049588,
+            0x20496A8,
+            0x2049960,
+            0x204B2F8,
+            0x204B384,
+            0x204B63C,
+            0x204B76C,
+            0x204B7D4,
+            0x204B824,
+            0x204B9B0,
+            0x204BB58,
+            0x204BCC0,
+            0x204BE38,
+            0x204BE9C,
+            0x204BF04,
+            0x204BF50,
+            0x204C2F8,
+            0x204C51C,
+            0x204C740,
+            0x204C768,
+            0x204C7C0,
+            0x204C950,
+            0x204CC24,
+            0x204CC38,
+            0x204CC70,
+            0x204CC84,
+            0x204CDA8,
+            0x204CDCC,
+            0x204CECC,
+            0x204CFF0,
+            0x204D0C0,
+            0x204D1C8,
+            0x204D270,
+            0x204D2D4,
+            0x204D440,
+            0x204D468,
+            0x204D484,
+            0x204D4C0,
+            0x204D4FC,
+            0x204D540,
+            0x204D588,
+            0x204D5C8,
+            0x204D614,
+            0x204D630,
+            0x204D650,
+            0x204D684,
+            0x204D698,
+            0x204D6A0,
+            0x204D6F8,
+            0x204D880,
+            0x204D8B8,
+            0x204DA80,
+            0x204DAB8,
+            0x204DAD4,
+            0x204DB0C,
+            0x204DB2C,
+            0x204DB3C,
+            0x204DB80,
+            0x204DBCC,
+            0x204DBD4,
+            0x204DBF4,
+            0x204E0B8,
+            0x204EC84,
+            0x204ED94,
+            0x204F318,
+            0x204F6FC,
+            0x204F8B4,
+            0x204F8EC,
+            0x204F900,
+            0x204F918,
+            0x204F930,
+            0x204F984,
+            0x204FB4C,
+            0x204FBC4,
+            0x204FBE0,
+            0x204FBFC,
+            0x204FC18,
+            0x204FC90,
+            0x204FD5C,
+            0x204FD74,
+            0x204FD94,
+            0x204FDA8,
+            0x204FED4,
+            0x204FEFC,
+            0x204FF34,
+            0x204FF60,
+            0x204FFA4,
+            0x204FFB8,
+            0x2050000,
+            0x2050014,
+            0x205005C,
+            0x2050070,
+            0x2050074,
+            0x20500B0,
+            0x20500C4,
+            0x20500D8,
+            0x20500EC,
+            0x2050120,
+            0x2050134,
+            0x2050190,
+            0x20501EC,
+            0x2050200,
+            0x2050220,
+            0x2050258,
+            0x205026C,
+            0x20502A4,
+            0x20502B8,
+            0x20502D8,
+            0x2050310,
+            0x2050324,
+            0x205057C,
+            0x20505E8,
+            0x2050624,
+            0x2050638,
+            0x2050704,
+            0x2050758,
+            0x20507DC,
+            0x20507F4,
+            0x2050884,
+            0x2050A70,
+            0x2050C54,
+            0x2050C74,
+            0x2050C88,
+            0x2050C9C,
+            0x2050CF8,
+            0x2050D78,
+            0x2050E04,
+            0x2050E48,
+            0x2050EB4,
+            0x2050ECC,
+            0x2050EF0,
+            0x2050FAC,
+            0x205101C,
+            0x2051140,
+            0x2051150,
+            0x205118C,
+            0x2051248,
+            0x2051358,
+            0x205139C,
+            0x20515C0,
+            0x20515E8,
+            0x2051600,
+            0x2051628,
+            0x2051650,
+            0x2051678,
+            0x2051690,
+            0x20516B8,
+            0x20516D0,
+            0x20516F8,
+            0x2051720,
+            0x2051738,
+            0x2051760,
+            0x2051778,
+            0x20517A0,
+            0x20517C8,
+            0x20517E8,
+            0x2051804,
+            0x2051820,
+            0x205183C,
+            0x20518A0,
+            0x2051924,
+            0x20519B4,
+            0x2051A14,
+            0x2051A54,
+            0x2051A7C,
+            0x2051A98,
+            0x2051B0C,
+            0x2051B1C,
+            0x2051B2C,
+            0x20521C4,
+            0x2052690,
+            0x20526CC,
+            0x2052708,
+            0x2052778,
+            0x2052838,
+            0x2052A00,
+            0xFFFFFFFF,
+            0x2052A78,
+            0x2052A94,
+            0x2052AE0,
+            0x2052AFC,
+            0x2052B18,
+            0x2052B54,
+            0x2052B74,
+            0x2052B90,
+            0x2052BAC,
+            0x2052BC8,
+            0x2052BEC,
+            0x2052C18,
+            0x2052C34,
+            0x2052C50,
+            0x2052C6C,
+            0x2052C88,
+            0x2052CB4,
+            0x2052CE0,
+            0x2052CFC,
+            0x2052D1C,
+            0x2052D3C,
+            0x2052D5C,
+            0x2052D7C,
+            0x2052D98,
+            0x2052DB4,
+            0x2052DE8,
+            0x2052E18,
+            0x2052E60,
+            0x2052E7C,
+            0x2052E98,
+            0x2052EC4,
+            0x2052EF0,
+            0x2052F0C,
+            0x20531CC,
+            0x205332C,
+            0x2053B18,
+            0x2053BC8,
+            0x205414C,
+            0x2054204,
+            0x2054344,
+            0x20543A0,
+            0x20545CC,
+            0x2054714,
+            0x20547E0,
+            0x20547F0,
+            0x20547FC,
+            0x205481C,
+            0x2054824,
+            0x2054834,
+            0x2054ADC,
+            0x2054AE8,
+            0x2054E04,
+            0x2054E20,
+            0x2054E50,
+            0x2054EA8,
+            0x2054EF0,
+            0x2054F20,
+            0x2054F5C,
+            0x2054FA0,
+            0x2055054,
+            0x2055140,
+            0x20551C8,
+            0x20551F4,
+            0x2055244,
+            0x20554C4,
+            0x20555F0,
+            0x205570C,
+            0x20558A4,
+            0x2055924,
+            0x20559CC,
+            0x20559F8,
+            0x2055A24,
+            0x2055A68,
+            0x2055AAC,
+            0x2055AEC,
+            0x2055B14,
+            0x2055B40,
+            0x2055B88,
+            0x2055BD0,
+            0x2055C70,
+            0x2055CE0,
+            0x20563EC,
+            0x2056444,
+            0x20564D4,
+            0x205653C,
+            0x20565E0,
+            0x2056610,
+            0x2056648,
+            0x2056708,
+            0x2056738,
+            0x2056AD0,
+            0x2056CDC,
+            0x2056D48,
+            0x2056E2C,
+            0x2056F9C,
+            0x20580D4,
+            0x205856C,
+            0x2058954,
+            0x2058F98,
+            0x2058FB8,
+            0x2058FC8,
+            0x2059018,
+            0x2059054,
+            0x2059080,
+            0x2059120,
+            0x2059170,
+            0x20591E4,
+            0x2059208,
+            0x205922C,
+            0x2059280,
+            0x20592A0,
+            0x20593DC,
+            0x2059474,
+            0x2059494,
+            0x20595A0,
+            0x20596B0,
+            0x20597C0,
+            0x2059E94,
+            0x205A58C,
+            0x205A7AC,
+            0x205A7CC,
+            0x205B1A4,
+            0x205BCF8,
+            0x205CBD0,
+            0x205CCB0,
+            0x205CDBC,
+            0x205D5A0,
+            0x205E5B4,
+            0x205E94C,
+            0x205F014,
+            0x205F100,
+            0x205F120,
+            0x205F18C,
+            0x205F19C,
+            0x205F434,
+            0x205F454,
+            0x205F728,
+            0x205F820,
+            0x205FAB4,
+            0x205FAD4,
+            0x205FB40,
+            0x205FB70,
+            0x205FC1C,
+            0x205FC4C,
+            0x205FC88,
+            0x205FD34,
+            0x2062D90,
+            0x2062DD4,
+            0x2062DE4,
+            0x2062E60,
+            0x2062F34,
+            0x2063158,
+            0x20637D8,
+            0x2063824,
+            0x2065D14,
+            0x2065EB8,
+            0x2065ECC,
+            0x2065EDC,
+            0x2065FC4,
+            0x2066074,
+            0x2066098,
+            0x2069B98,
+            0x206AAAC,
+            0x206AAE8,
+            0x206AB04,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            16,
+            16,
+            16,
+            17,
+            1,
+            18,
+            18,
+            18,
+            1,
+            18,
+            19,
+            20,
+            21,
+            22,
+            23,
+            24,
+            25,
+            26,
+            27,
+            28,
+            29,
+            30,
+            31,
+            32,
+            33,
+            34,
+            35,
+            36,
+            37,
+            38,
+            39,
+            40,
+            41,
+            42,
+            43,
+            44,
+            45,
+            46,
+            47,
+            48,
+            49,
+            50,
+            51,
+            52,
+            53,
+            54,
+            55,
+            56,
+            57,
+            58,
+            59,
+            60,
+            60,
+            61,
+            62,
+            63,
+            64,
+            65,
+            66,
+            67,
+            68,
+            69,
+            70,
+            71,
+            72,
+            73,
+            74,
+            75,
+            76,
+            77,
+            78,
+            79,
+            80,
+            81,
+            82,
+            83,
+            84,
+            85,
+            86,
+            87,
+            88,
+            88,
+            89,
+            90,
+            91,
+            92,
+            93,
+            94,
+            95,
+            96,
+            97,
+            98,
+            99,
+            100,
+            101,
+            102,
+            103,
+            104,
+            105,
+            106,
+            107,
+            108,
+            109,
+            110,
+            111,
+            112,
+            113,
+            112,
+            114,
+            115,
+            116,
+            117,
+            118,
+            119,
+            120,
+            112,
+            112,
+            112,
+            112,
+            121,
+            122,
+            123,
+            124,
+            125,
+            126,
+            127,
+            128,
+            129,
+            130,
+            131,
+            132,
+            133,
+            134,
+            135,
+            136,
+            137,
+            138,
+            139,
+            140,
+            141,
+            142,
+            143,
+            144,
+            145,
+            146,
+            147,
+            148,
+            149,
+            150,
+            151,
+            152,
+            151,
+            152,
+            153,
+            154,
+            155,
+            156,
+            157,
+            157,
+            158,
+            159,
+            160,
+            161,
+            162,
+            163,
+            164,
+            165,
+            166,
+            164,
+            167,
+            168,
+            169,
+            170,
+            171,
+            172,
+            173,
+            174,
+            175,
+            176,
+            177,
+            178,
+            136,
+            179,
+            180,
+            181,
+            182,
+            183,
+            184,
+            185,
+            186,
+            187,
+            188,
+            189,
+            190,
+            191,
+            192,
+            193,
+            194,
+            136,
+            195,
+            196,
+            196,
+            197,
+            197,
+            198,
+            199,
+            200,
+            201,
+            163,
+            202,
+            203,
+            204,
+            205,
+            205,
+            205,
+            205,
+            202,
+            164,
+            206,
+            203,
+            207,
+            208,
+            209,
+            210,
+            211,
+            212,
+            213,
+            214,
+            215,
+            216,
+            217,
+            218,
+            219,
+            220,
+            221,
+            222,
+            223,
+            224,
+            225,
+            226,
+            227,
+            228,
+            229,
+            230,
+            231,
+            232,
+            233,
+            234,
+            235,
+            236,
+            237,
+            238,
+            239,
+            240,
+            241,
+            242,
+            243,
+            244,
+            245,
+            246,
+            247,
+            248,
+            249,
+            250,
+            251,
+            252,
+            253,
+            254,
+            255,
+            256,
+            257,
+            258,
+            259,
+            260,
+            261,
+            262,
+            263,
+            264,
+            265,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            267,
+            268,
+            269,
+            270,
+            271,
+            272,
+            273,
+            274,
+            275,
+            276,
+            277,
+            277,
+            278,
+            279,
+            280,
+            281,
+            282,
+            283,
+            284,
+            285,
+            286,
+            287,
+            288,
+            289,
+            290,
+            291,
+            292,
+            293,
+            294,
+            295,
+            296,
+            297,
+            297,
+            298,
+            288,
+            299,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            300,
+            301,
+            302,
+            303,
+            304,
+            303,
+            305,
+            306,
+            305,
+            306,
+            297,
+            307,
+            308,
+            309,
+            310,
+            297,
+            297,
+            297,
+            297,
+            311,
+            312,
+            311,
+            313,
+            314,
+            315,
+            316,
+            317,
+            317,
+            318,
+            319,
+            320,
+            321,
+            322,
+            323,
+            324,
+            325,
+            326,
+            327,
+            328,
+            329,
+            330,
+            331,
+            266,
+            332,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            333,
+            266,
+            266,
+            266,
+            266,
+            266,
+            334,
+            335,
+            336,
+            337,
+            338,
+            339,
+            340,
+            341,
+            342,
+            343,
+            344,
+            345,
+            346,
+            347,
+            348,
+            349,
+            350,
+            351,
+            352,
+            353,
+            354,
+            355,
+            356,
+            357,
+            358,
+            359,
+            360,
+            361,
+            362,
+            363,
+            364,
+            365,
+            366,
+            367,
+            368,
+            369,
+            370,
+            371,
+            372,
+            373,
+            374,
+            375,
+            376,
+            377,
+            378,
+            379,
+            380,
+            381,
+            382,
+            383,
+            384,
+            382,
+            385,
+            386,
+            387,
+            388,
+            389,
+            390,
+            391,
+            392,
+            393,
+            394,
+            395,
+            396,
+            266,
+            266,
+            397,
+            398,
+            399,
+            400,
+            401,
+            402,
+            403,
+            404,
+            405,
+            406,
+            407,
+            408,
+            409,
+            163,
+            410,
+            411,
+            412,
+            413,
+            414,
+            163,
+            415,
+            416,
+            417,
+            418,
+            419,
+            420,
+            421,
+            422,
+            423,
+            424,
+            425,
+            426,
+            427,
+            428,
+            429,
+            430,
+            431,
+            432,
+            433,
+            434,
+            435,
+            436,
+            437,
+            438,
+            439,
+            440,
+            441,
+            442,
+            443,
+            444,
+            445,
+            446,
+            447,
+            448,
+            449,
+            450,
+            451,
+            452,
+            453,
+            454,
+            455,
+            456,
+            457,
+            458,
+            459,
+            460,
+            461,
+            462,
+            463,
+            464,
+            465,
+            458,
+            458,
+            466,
+            467,
+            468,
+            469,
+            470,
+            471,
+            472,
+            473,
+            474,
+            475,
+            476,
+            477,
+            478,
+            479,
+            480,
+            481,
+            482,
+            483,
+            484,
+            485,
+            486,
+            487,
+            488,
+            489,
+            490,
+            491,
+            492,
+            493,
+            494,
+            495,
+            496,
+            497,
+            498,
+            499,
+            500,
+            501,
+            502,
+            503,
+            504,
+            505,
+            506,
+            507,
+            508,
+            509,
+            510,
+            511,
+            512,
+            513,
+            514,
+            515,
+            516,
+            517,
+            518,
+            519,
+            520,
+            521,
+            522,
+            523,
+            524,
+            525,
+            526,
+            527,
+            528,
+            529,
+            530,
+            531,
+            532,
+            533,
+            534,
+            535,
+            536,
+            537,
+            538,
+            539,
+            540,
+            541,
+            542,
+            543,
+            544,
+            545,
+            546,
+            547,
+            548,
+            549,
+            550,
+            551,
+            552,
+            553,
+            554,
+            555,
+            556,
+            557,
+            557,
+            558,
+            163,
+            559,
+            560,
+            561,
+            562,
+            563,
+            564,
+            565,
+            566,
+            567,
+            568,
+            569,
+            569,
+            570,
+            571,
+            572,
+            573,
+            266,
+            574,
+            575,
+            576,
+            577,
+            578,
+            579,
+            580,
+            581,
+            582,
+            583,
+            584,
+            585,
+            586,
+            587,
+            588,
+            589,
+            590,
+            591,
+            592,
+            593,
+            594,
+            595,
+            596,
+            597,
+            598,
+            599,
+            600,
+            601,
+            602,
+            603,
+            604,
+            605,
+            606,
+            607,
+            608,
+            609,
+            277,
+            609,
+            610,
+            611,
+            612,
+            613,
+            614,
+            163,
+            615,
+            616,
+            609,
+            617,
+            157,
+            618,
+            619,
+            620,
+            621,
+            622,
+            623,
+            624,
+            625,
+            626,
+            627,
+            628,
+            629,
+            630,
+            631,
+            632,
+            633,
+            634,
+            635,
+            636,
+            637,
+            638,
+            639,
+            640,
+            641,
+            642,
+            643,
+            644,
+            266,
+            645,
+            646,
+            647,
+            648,
+            649,
+            650,
+            651,
+            652,
+            653,
+            654,
+            655,
+            656,
+            657,
+            658,
+            659,
+            660,
+            661,
+            662,
+            663,
+            664,
+            665,
+            666,
+            667,
+            668,
+            669,
+            670,
+            671,
+            672,
+            673,
+            674,
+            675,
+            676,
+            677,
+            678,
+            679,
+            680,
+            681,
+            682,
+            683,
+            684,
+            685,
+            618,
+            686,
+            687,
+            688,
+            689,
+            690,
+            691,
+            692,
+            693,
+            694,
+            695,
+            696,
+            697,
+            698,
+            699,
+            700,
+            701,
+            702,
+            703,
+            704,
+            705,
+            706,
+            707,
+            708,
+            707,
+            709,
+            707,
+            710,
+            707,
+            711,
+            712,
+            707,
+            713,
+            707,
+            707,
+            714,
+            715,
+            716,
+            717,
+            718,
+            719,
+            306,
+            720,
+            721,
+            722,
+            723,
+            724,
+            725,
+            726,
+            727,
+            728,
+            163,
+            729,
+            730,
+            730,
+            729,
+            731,
+            732,
+            733,
+            734,
+            735,
+            736,
+            737,
+            738,
+            739,
+            740,
+            741,
+            742,
+            743,
+            744,
+            745,
+            746,
+            747,
+            748,
+            748,
+            749,
+            750,
+            751,
+            752,
+            753,
+            754,
+            755,
+            756,
+            757,
+            758,
+            759,
+            760,
+            748,
+            761,
+            762,
+            163,
+            763,
+            764,
+            765,
+            766,
+            767,
+            768,
+            769,
+            770,
+            771,
+            771,
+            771,
+            772,
+            773,
+            774,
+            775,
+            776,
+            777,
+            778,
+            779,
+            780,
+            781,
+            782,
+            783,
+            784,
+            785,
+            771,
+            786,
+            787,
+            788,
+            789,
+            790,
+            791,
+            792,
+            793,
+            794,
+            795,
+            796,
+            797,
+            798,
+            799,
+            800,
+            801,
+            802,
+            803,
+            804,
+            805,
+            806,
+            807,
+            808,
+            809,
+            810,
+            811,
+            812,
+            813,
+            814,
+            815,
+            816,
+            817,
+            818,
+            819,
+            820,
+            821,
+            163,
+            822,
+            823,
+            824,
+            825,
+            826,
+            827,
+            828,
+            829,
+            830,
+            831,
+            832,
+            833,
+            834,
+            835,
+            836,
+            837,
+            838,
+            157,
+            619,
+            839,
+            840,
+            841,
+            842,
+            843,
+            844,
+            845,
+            846,
+            847,
+            848,
+            849,
+            850,
+            851,
+            852,
+            853,
+            854,
+            855,
+            856,
+            857,
+            858,
+            859,
+            860,
+            861,
+            862,
+            863,
+            864,
+            865,
+            866,
+            867,
+            868,
+            869,
+            870,
+            871,
+            872,
+            873,
+            874,
+            875,
+            876,
+            877,
+            878,
+            879,
+            880,
+            881,
+            882,
+            883,
+            884,
+            885,
+            886,
+            887,
+            888,
+        ),
+    ),
+    c_types=None,
+    multi={
+        78: ((0x5050, 0x50B0), (0x2005050, 0x20050B0)),
+        154: (
+            (
+                0xD6BC,
+                0xE808,
+                0x13800,
+                0x177C4,
+                0x17ADC,
+                0x2378C,
+                0x239B0,
+                0x3822C,
+                0x39734,
+                0x3AC6C,
+                0x3D2A0,
+                0x41A48,
+                0x42DA0,
+                0x52750,
+                0x54DDC,
+                0x60D64,
+            ),
+            (
+                0x200D6BC,
+                0x200E808,
+                0x2013800,
+                0x20177C4,
+                0x2017ADC,
+                0x202378C,
+                0x20239B0,
+                0x203822C,
+                0x2039734,
+                0x203AC6C,
+                0x203D2A0,
+                0x2041A48,
+                0x2042DA0,
+                0x2052750,
+                0x2054DDC,
+                0x2060D64,
+            ),
+        ),
+        315: ((0x13D54, 0x148AC), (0x2013D54, 0x20148AC)),
+        386: ((0x1C14C, 0x1C168), (0x201C14C, 0x201C168)),
+        608: ((0x31D98, 0x32CD8), (0x2031D98, 0x2032CD8)),
+        810: ((0x52A24, 0x52A40, 0x52A5C), (0x2052A24, 0x2052A40, 0x2052A5C)),
+    },
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "SECURE",
+        "START_MODULE_PARAMS",
+        "DEFAULT_MEMORY_ARENA_SIZE",
+        "LOG_MAX_ARG",
+        "DAMAGE_SOURCE_CODE_ORB_ITEM",
+        "DAMAGE_SOURCE_CODE_NON_ORB_ITEM",
+        "AURA_BOW_ID_LAST",
+        "NUMBER_OF_ITEMS",
+        "MAX_MONEY_CARRIED",
+        "MAX_MONEY_STORED",
+        "WINDOW_LIST_PTR",
+        "SCRIPT_VARS_VALUES_PTR",
+        "MAX_PLAY_TIME",
+        "MONSTER_ID_LIMIT",
+        "MAX_RECRUITABLE_TEAM_MEMBERS",
+        "NATURAL_LOG_VALUE_TABLE",
+        "CART_REMOVED_IMG_DATA",
+        "STRING_DEBUG_EMPTY",
+        "STRING_DEBUG_FORMAT_LINE_FILE",
+        "STRING_DEBUG_NO_PROG_POS",
+        "STRING_DEBUG_SPACED_PRINT",
+        "STRING_DEBUG_FATAL",
+        "STRING_DEBUG_NEWLINE",
+        "STRING_DEBUG_LOG_NULL",
+        "STRING_DEBUG_STRING_NEWLINE",
+        "STRING_EFFECT_EFFECT_BIN",
+        "STRING_MONSTER_MONSTER_BIN",
+        "STRING_BALANCE_M_LEVEL_BIN",
+        "STRING_DUNGEON_DUNGEON_BIN",
+        "STRING_MONSTER_M_ATTACK_BIN",
+        "STRING_MONSTER_M_GROUND_BIN",
+        "STRING_FILE_DIRECTORY_INIT",
+        "AVAILABLE_ITEMS_IN_GROUP_TABLE",
+        "ARM9_UNKNOWN_TABLE__NA_2097FF8",
+        "KECLEON_SHOP_ITEM_TABLE_LISTS_1",
+        "KECLEON_SHOP_ITEM_TABLE_LISTS_2",
+        "EXCLUSIVE_ITEM_STAT_BOOST_DATA",
+        "EXCLUSIVE_ITEM_DEFENSE_BOOSTS",
+        "EXCLUSIVE_ITEM_SPECIAL_ATTACK_BOOSTS",
+        "EXCLUSIVE_ITEM_SPECIAL_DEFENSE_BOOSTS",
+        "EXCLUSIVE_ITEM_EFFECT_DATA",
+        "EXCLUSIVE_ITEM_STAT_BOOST_DATA_INDEXES",
+        "RECYCLE_SHOP_ITEM_LIST",
+        "TYPE_SPECIFIC_EXCLUSIVE_ITEMS",
+        "RECOIL_MOVE_LIST",
+        "PUNCH_MOVE_LIST",
+        "MOVE_POWER_STARS_TABLE",
+        "MOVE_ACCURACY_STARS_TABLE",
+        "PARENT_MENU_DEFAULT_WINDOW_PARAMS",
+        "SIMPLE_MENU_DEFAULT_WINDOW_PARAMS",
+        "ADVANCED_MENU_DEFAULT_WINDOW_PARAMS",
+        "COLLECTION_MENU_DEFAULT_WINDOW_PARAMS",
+        "OPTIONS_MENU_DEFAULT_WINDOW_PARAMS",
+        "DEBUG_MENU_DEFAULT_WINDOW_PARAMS",
+        "SCROLL_BOX_DEFAULT_WINDOW_PARAMS",
+        "DIALOGUE_BOX_DEFAULT_WINDOW_PARAMS",
+        "PORTRAIT_BOX_DEFAULT_WINDOW_PARAMS",
+        "TEXT_BOX_DEFAULT_WINDOW_PARAMS",
+        "AREA_NAME_BOX_DEFAULT_WINDOW_PARAMS",
+        "CONTROLS_CHART_DEFAULT_WINDOW_PARAMS",
+        "ALERT_BOX_DEFAULT_WINDOW_PARAMS",
+        "ADVANCED_TEXT_BOX_DEFAULT_WINDOW_PARAMS",
+        "TEAM_SELECTION_MENU_DEFAULT_WINDOW_PARAMS",
+        "PARTNER_TALK_KIND_TABLE",
+        "SCRIPT_VARS_LOCALS",
+        "SCRIPT_VARS",
+        "PORTRAIT_LAYOUTS",
+        "KAOMADO_FILEPATH",
+        "WONDER_MAIL_BITS_MAP",
+        "WONDER_MAIL_BITS_SWAP",
+        "ARM9_UNKNOWN_TABLE__NA_209E12C",
+        "ARM9_UNKNOWN_TABLE__NA_209E164",
+        "ARM9_UNKNOWN_TABLE__NA_209E280",
+        "WONDER_MAIL_ENCRYPTION_TABLE",
+        "DUNGEON_DATA_LIST",
+        "ADVENTURE_LOG_ENCOUNTERS_MONSTER_IDS",
+        "ARM9_UNKNOWN_DATA__NA_209E6BC",
+        "TACTIC_NAME_STRING_IDS",
+        "STATUS_NAME_STRING_IDS",
+        "DUNGEON_RETURN_STATUS_TABLE",
+        "STATUSES_FULL_DESCRIPTION_STRING_IDS",
+        "ARM9_UNKNOWN_DATA__NA_209EAAC",
+        "MISSION_FLOOR_RANKS_AND_ITEM_LISTS_1",
+        "MISSION_FLOORS_FORBIDDEN",
+        "MISSION_FLOOR_RANKS_AND_ITEM_LISTS_2",
+        "MISSION_FLOOR_RANKS_PTRS",
+        "DUNGEON_RESTRICTIONS",
+        "SPECIAL_BAND_STAT_BOOST",
+        "MUNCH_BELT_STAT_BOOST",
+        "GUMMI_STAT_BOOST",
+        "MIN_IQ_EXCLUSIVE_MOVE_USER",
+        "WONDER_GUMMI_IQ_GAIN",
+        "AURA_BOW_STAT_BOOST",
+        "MIN_IQ_ITEM_MASTER",
+        "DEF_SCARF_STAT_BOOST",
+        "POWER_BAND_STAT_BOOST",
+        "WONDER_GUMMI_STAT_BOOST",
+        "ZINC_BAND_STAT_BOOST",
+        "EGG_HP_BONUS",
+        "EVOLUTION_HP_BONUS",
+        "DAMAGE_FORMULA_FLV_SHIFT",
+        "EVOLUTION_PHYSICAL_STAT_BONUSES",
+        "DAMAGE_FORMULA_CONSTANT_SHIFT",
+        "DAMAGE_FORMULA_FLV_DEFICIT_DIVISOR",
+        "EGG_STAT_BONUSES",
+        "EVOLUTION_SPECIAL_STAT_BONUSES",
+        "DAMAGE_FORMULA_NON_TEAM_MEMBER_MODIFIER",
+        "DAMAGE_FORMULA_LN_PREFACTOR",
+        "DAMAGE_FORMULA_DEF_PREFACTOR",
+        "DAMAGE_FORMULA_AT_PREFACTOR",
+        "DAMAGE_FORMULA_LN_ARG_PREFACTOR",
+        "FORBIDDEN_FORGOT_MOVE_LIST",
+        "TACTICS_UNLOCK_LEVEL_TABLE",
+        "CLIENT_LEVEL_TABLE",
+        "OUTLAW_LEVEL_TABLE",
+        "OUTLAW_MINION_LEVEL_TABLE",
+        "HIDDEN_POWER_BASE_POWER_TABLE",
+        "VERSION_EXCLUSIVE_MONSTERS",
+        "IQ_SKILL_RESTRICTIONS",
+        "SECONDARY_TERRAIN_TYPES",
+        "SENTRY_DUTY_MONSTER_IDS",
+        "IQ_SKILLS",
+        "IQ_GROUP_SKILLS",
+        "MONEY_QUANTITY_TABLE",
+        "ARM9_UNKNOWN_TABLE__NA_20A20B0",
+        "IQ_GUMMI_GAIN_TABLE",
+        "GUMMI_BELLY_RESTORE_TABLE",
+        "BAG_CAPACITY_TABLE_SPECIAL_EPISODES",
+        "BAG_CAPACITY_TABLE",
+        "SPECIAL_EPISODE_MAIN_CHARACTERS",
+        "GUEST_MONSTER_DATA",
+        "RANK_UP_TABLE",
+        "DS_DOWNLOAD_TEAMS",
+        "ARM9_UNKNOWN_PTR__NA_20A2C84",
+        "UNOWN_SPECIES_ADDITIONAL_CHARS",
+        "MONSTER_SPRITE_DATA",
+        "REMOTE_STRINGS",
+        "RANK_STRINGS_1",
+        "MISSION_MENU_STRING_IDS_1",
+        "RANK_STRINGS_2",
+        "MISSION_MENU_STRING_IDS_2",
+        "RANK_STRINGS_3",
+        "MISSION_DUNGEON_UNLOCK_TABLE",
+        "NO_SEND_ITEM_TABLE",
+        "ARM9_UNKNOWN_TABLE__NA_20A3CC8",
+        "ARM9_UNKNOWN_TABLE__NA_20A3CE4",
+        "ARM9_UNKNOWN_FUNCTION_TABLE__NA_20A3CF4",
+        "MISSION_BANNED_STORY_MONSTERS",
+        "ITEM_DELIVERY_TABLE",
+        "MISSION_RANK_POINTS",
+        "MISSION_BANNED_MONSTERS",
+        "MISSION_STRING_IDS",
+        "LEVEL_LIST",
+        "EVENTS",
+        "ARM9_UNKNOWN_TABLE__NA_20A68BC",
+        "DEMO_TEAMS",
+        "ACTOR_LIST",
+        "ENTITIES",
+        "JOB_WINDOW_PARAMS_1",
+        "JOB_MENU_ITEMS_1",
+        "JOB_MENU_ITEMS_2",
+        "JOB_MENU_ITEMS_3",
+        "JOB_MENU_ITEMS_4",
+        "JOB_MENU_ITEMS_5",
+        "JOB_MENU_ITEMS_6",
+        "JOB_MENU_ITEMS_7",
+        "JOB_MENU_ITEMS_8",
+        "JOB_MENU_ITEMS_9",
+        "JOB_MENU_ITEMS_10",
+        "JOB_MENU_ITEMS_11",
+        "JOB_MENU_ITEMS_12",
+        "JOB_MENU_ITEMS_13",
+        "JOB_WINDOW_PARAMS_2",
+        "DUNGEON_SWAP_ID_TABLE",
+        "MAP_MARKER_PLACEMENTS",
+        "LFO_OUTPUT_VOICE_UPDATE_FLAGS",
+        "TRIG_TABLE",
+        "FX_ATAN_IDX_TABLE",
+        "TEX_PLTT_START_ADDR_TABLE",
+        "TEX_START_ADDR_TABLE",
+        "ARM9_UNKNOWN_TABLE__NA_20AE924",
+        "MEMORY_ALLOCATION_ARENA_GETTERS",
+        "PRNG_SEQUENCE_NUM",
+        "LOADED_OVERLAY_GROUP_0",
+        "LOADED_OVERLAY_GROUP_1",
+        "LOADED_OVERLAY_GROUP_2",
+        "DEBUG_IS_INITIALIZED",
+        "PACK_FILES_OPENED",
+        "PACK_FILE_PATHS_TABLE",
+        "GAME_STATE_VALUES",
+        "BAG_ITEMS_PTR_MIRROR",
+        "ITEM_DATA_TABLE_PTRS",
+        "DUNGEON_MOVE_TABLES",
+        "MOVE_DATA_TABLE_PTR",
+        "WAN_TABLE",
+        "RENDER_3D",
+        "RENDER_3D_FUNCTIONS_64",
+        "LANGUAGE_INFO_DATA",
+        "TBL_TALK_GROUP_STRING_ID_START",
+        "KEYBOARD_STRING_IDS",
+        "NOTIFY_NOTE",
+        "DEFAULT_HERO_ID",
+        "DEFAULT_PARTNER_ID",
+        "GAME_MODE",
+        "GLOBAL_PROGRESS_PTR",
+        "ADVENTURE_LOG_PTR",
+        "ITEM_TABLES_PTRS_1",
+        "UNOWN_SPECIES_ADDITIONAL_CHAR_PTR_TABLE",
+        "TEAM_MEMBER_TABLE_PTR",
+        "MISSION_DELIVER_LIST_PTR",
+        "MISSION_DELIVER_COUNT",
+        "MISSION_DUNGEON_LIST_PTR",
+        "MISSION_DUNGEON_COUNT",
+        "MISSION_MONSTER_LIST_PTR",
+        "MISSION_MONSTER_COUNT",
+        "MISSION_LIST_PTR",
+        "REMOTE_STRING_PTR_TABLE",
+        "RANK_STRING_PTR_TABLE",
+        "SMD_EVENTS_FUN_TABLE",
+        "MUSIC_DURATION_LOOKUP_TABLE_1",
+        "MUSIC_DURATION_LOOKUP_TABLE_2",
+        "LFO_WAVEFORM_CALLBACKS",
+        "IS_DISP_ON",
+        "GXI_DMA_ID",
+        "JUICE_BAR_NECTAR_IQ_GAIN",
+        "DEBUG_TEXT_SPEED",
+        "REGULAR_TEXT_SPEED",
+        "HERO_START_LEVEL",
+        "PARTNER_START_LEVEL",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x0,
+            0xBA0,
+            0xE58,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xCCBC,
+            0xFFFFFFFF,
+            0xEDF8,
+            0x107F8,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x51188,
+            0x54818,
+            0xFFFFFFFF,
+            0x917E0,
+            0x92EE4,
+            0x94EF8,
+            0x94EFC,
+            0x94F18,
+            0x94F30,
+            0x94F3C,
+            0x94F50,
+            0x94F54,
+            0x94F5C,
+            0x94F60,
+            0x94F74,
+            0x94F88,
+            0x94F9C,
+            0x94FB0,
+            0x94FC8,
+            0x94FE0,
+            0x95130,
+            0x98444,
+            0x98504,
+            0x98514,
+            0x9852C,
+            0x9852D,
+            0x9852E,
+            0x9852F,
+            0x98568,
+            0x98569,
+            0x98D10,
+            0x99070,
+            0x991B8,
+            0x991CE,
+            0x9A150,
+            0x9A168,
+            0x9B3CC,
+            0x9B3DC,
+            0x9B3EC,
+            0x9B3FC,
+            0x9B40C,
+            0x9B448,
+            0x9B458,
+            0x9B468,
+            0x9B478,
+            0x9B488,
+            0x9B498,
+            0x9B4B4,
+            0x9B4D0,
+            0x9B4E0,
+            0x9B4F0,
+            0x9D268,
+            0x9D450,
+            0x9DDF4,
+            0x9E598,
+            0x9E658,
+            0x9E66C,
+            0x9E68C,
+            0x9E6B0,
+            0x9E6E8,
+            0x9E804,
+            0x9E824,
+            0x9E924,
+            0x9EBF4,
+            0x9EC40,
+            0x9EC44,
+            0x9EC5C,
+            0x9ED28,
+            0x9EE94,
+            0x9F030,
+            0x9F034,
+            0x9FC98,
+            0x9FD60,
+            0xA1058,
+            0xA11E8,
+            0xA1DF0,
+            0xA1E00,
+            0xA1E0C,
+            0xA1E10,
+            0xA1E14,
+            0xA1E1C,
+            0xA1E28,
+            0xA1E2C,
+            0xA1E30,
+            0xA1E34,
+            0xA1E38,
+            0xA1E3C,
+            0xA1E48,
+            0xA1E50,
+            0xA1E54,
+            0xA1E58,
+            0xA1E5C,
+            0xA1E60,
+            0xA1E68,
+            0xA1E6C,
+            0xA1E70,
+            0xA1E74,
+            0xA1E78,
+            0xA1E7C,
+            0xA1E9C,
+            0xA1EC4,
+            0xA1EFC,
+            0xA1F1C,
+            0xA1F3C,
+            0xA1F5C,
+            0xA1F84,
+            0xA1FE0,
+            0xA206C,
+            0xA2134,
+            0xA2200,
+            0xA2314,
+            0xA24A4,
+            0xA2634,
+            0xA2834,
+            0xA2ABC,
+            0xA2D44,
+            0xA2D58,
+            0xA2D78,
+            0xA2E40,
+            0xA30C8,
+            0xA3198,
+            0xA3208,
+            0xA320C,
+            0xA332C,
+            0xA4140,
+            0xA416C,
+            0xA419C,
+            0xA41AC,
+            0xA41DC,
+            0xA41EC,
+            0xA42AC,
+            0xA42B2,
+            0xA42C8,
+            0xA42E4,
+            0xA42F4,
+            0xA4314,
+            0xA433E,
+            0xA436C,
+            0xA43AC,
+            0xA44A4,
+            0xA4CEC,
+            0xA5BD8,
+            0xA715C,
+            0xA7168,
+            0xA71B0,
+            0xA8890,
+            0xA9AB8,
+            0xA9AC8,
+            0xA9AE8,
+            0xA9B58,
+            0xA9B70,
+            0xA9B88,
+            0xA9BA0,
+            0xA9BB8,
+            0xA9BD0,
+            0xA9BE8,
+            0xA9C00,
+            0xA9C18,
+            0xA9C30,
+            0xA9C50,
+            0xA9C70,
+            0xA9C80,
+            0xA9D70,
+            0xAA840,
+            0xAA850,
+            0xAE850,
+            0xAE954,
+            0xAE964,
+            0xAF1C4,
+            0xAF7A0,
+            0xAF7CC,
+            0xAFAD0,
+            0xAFAD4,
+            0xAFAD8,
+            0xAFF50,
+            0xAFF54,
+            0xAFF58,
+            0xAFF70,
+            0xAFF70,
+            0xAFF78,
+            0xAFFA8,
+            0xAFFB0,
+            0xB0524,
+            0xB0540,
+            0xB0584,
+            0xB05A8,
+            0xB0614,
+            0xB0718,
+            0xB0814,
+            0xB0818,
+            0xB081A,
+            0xB088C,
+            0xB0890,
+            0xB0894,
+            0xB1264,
+            0xB131C,
+            0xB138C,
+            0xB13A4,
+            0xB13A8,
+            0xB13AC,
+            0xB13B0,
+            0xB13B4,
+            0xB13B8,
+            0xB13BC,
+            0xB13C0,
+            0xB13DC,
+            0xB14D4,
+            0xB1894,
+            0xB1994,
+            0xB1B94,
+            0xB34D8,
+            0xB34DC,
+            0x118B8,
+            0x20DEC,
+            0x20DF0,
+            0x48B9C,
+            0x48C0C,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x2000000,
+            0x2000BA0,
+            0x2000E58,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x200CCBC,
+            0xFFFFFFFF,
+            0x200EDF8,
+            0x20107F8,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2051188,
+            0x2054818,
+            0xFFFFFFFF,
+            0x20917E0,
+            0x2092EE4,
+            0x2094EF8,
+            0x2094EFC,
+            0x2094F18,
+            0x2094F30,
+            0x2094F3C,
+            0x2094F50,
+            0x2094F54,
+            0x2094F5C,
+            0x2094F60,
+            0x2094F74,
+            0x2094F88,
+            0x2094F9C,
+            0x2094FB0,
+            0x2094FC8,
+            0x2094FE0,
+            0x2095130,
+            0x2098444,
+            0x2098504,
+            0x2098514,
+            0x209852C,
+            0x209852D,
+            0x209852E,
+            0x209852F,
+            0x2098568,
+            0x2098569,
+            0x2098D10,
+            0x2099070,
+            0x20991B8,
+            0x20991CE,
+            0x209A150,
+            0x209A168,
+            0x209B3CC,
+            0x209B3DC,
+            0x209B3EC,
+            0x209B3FC,
+            0x209B40C,
+            0x209B448,
+            0x209B458,
+            0x209B468,
+            0x209B478,
+            0x209B488,
+            0x209B498,
+            0x209B4B4,
+            0x209B4D0,
+            0x209B4E0,
+            0x209B4F0,
+            0x209D268,
+            0x209D450,
+            0x209DDF4,
+            0x209E598,
+            0x209E658,
+            0x209E66C,
+            0x209E68C,
+            0x209E6B0,
+            0x209E6E8,
+            0x209E804,
+            0x209E824,
+            0x209E924,
+            0x209EBF4,
+            0x209EC40,
+            0x209EC44,
+            0x209EC5C,
+            0x209ED28,
+            0x209EE94,
+            0x209F030,
+            0x209F034,
+            0x209FC98,
+            0x209FD60,
+            0x20A1058,
+            0x20A11E8,
+            0x20A1DF0,
+            0x20A1E00,
+            0x20A1E0C,
+            0x20A1E10,
+            0x20A1E14,
+            0x20A1E1C,
+            0x20A1E28,
+            0x20A1E2C,
+            0x20A1E30,
+            0x20A1E34,
+            0x20A1E38,
+            0x20A1E3C,
+            0x20A1E48,
+            0x20A1E50,
+            0x20A1E54,
+            0x20A1E58,
+            0x20A1E5C,
+            0x20A1E60,
+            0x20A1E68,
+            0x20A1E6C,
+            0x20A1E70,
+            0x20A1E74,
+            0x20A1E78,
+            0x20A1E7C,
+            0x20A1E9C,
+            0x20A1EC4,
+            0x20A1EFC,
+            0x20A1F1C,
+            0x20A1F3C,
+            0x20A1F5C,
+            0x20A1F84,
+            0x20A1FE0,
+            0x20A206C,
+            0x20A2134,
+            0x20A2200,
+            0x20A2314,
+            0x20A24A4,
+            0x20A2634,
+            0x20A2834,
+            0x20A2ABC,
+            0x20A2D44,
+            0x20A2D58,
+            0x20A2D78,
+            0x20A2E40,
+            0x20A30C8,
+            0x20A3198,
+            0x20A3208,
+            0x20A320C,
+            0x20A332C,
+            0x20A4140,
+            0x20A416C,
+            0x20A419C,
+            0x20A41AC,
+            0x20A41DC,
+            0x20A41EC,
+            0x20A42AC,
+            0x20A42B2,
+            0x20A42C8,
+            0x20A42E4,
+            0x20A42F4,
+            0x20A4314,
+            0x20A433E,
+            0x20A436C,
+            0x20A43AC,
+            0x20A44A4,
+            0x20A4CEC,
+            0x20A5BD8,
+            0x20A715C,
+            0x20A7168,
+            0x20A71B0,
+            0x20A8890,
+            0x20A9AB8,
+            0x20A9AC8,
+            0x20A9AE8,
+            0x20A9B58,
+            0x20A9B70,
+            0x20A9B88,
+            0x20A9BA0,
+            0x20A9BB8,
+            0x20A9BD0,
+            0x20A9BE8,
+            0x20A9C00,
+            0x20A9C18,
+            0x20A9C30,
+            0x20A9C50,
+            0x20A9C70,
+            0x20A9C80,
+            0x20A9D70,
+            0x20AA840,
+            0x20AA850,
+            0x20AE850,
+            0x20AE954,
+            0x20AE964,
+            0x20AF1C4,
+            0x20AF7A0,
+            0x20AF7CC,
+            0x20AFAD0,
+            0x20AFAD4,
+            0x20AFAD8,
+            0x20AFF50,
+            0x20AFF54,
+            0x20AFF58,
+            0x20AFF70,
+            0x20AFF70,
+            0x20AFF78,
+            0x20AFFA8,
+            0x20AFFB0,
+            0x20B0524,
+            0x20B0540,
+            0x20B0584,
+            0x20B05A8,
+            0x20B0614,
+            0x20B0718,
+            0x20B0814,
+            0x20B0818,
+            0x20B081A,
+            0x20B088C,
+            0x20B0890,
+            0x20B0894,
+            0x20B1264,
+            0x20B131C,
+            0x20B138C,
+            0x20B13A4,
+            0x20B13A8,
+            0x20B13AC,
+            0x20B13B0,
+            0x20B13B4,
+            0x20B13B8,
+            0x20B13BC,
+            0x20B13C0,
+            0x20B13DC,
+            0x20B14D4,
+            0x20B1894,
+            0x20B1994,
+            0x20B1B94,
+            0x20B34D8,
+            0x20B34DC,
+            0x20118B8,
+            0x2020DEC,
+            0x2020DF0,
+            0x2048B9C,
+            0x2048C0C,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0x800,
+            0xCC,
+            0x4,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0xFFFFFFFF,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0xFFFFFFFF,
+            0x2000,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x3200,
+            0x40,
+            0x10,
+            0x10,
+            0x3C,
+            0x39,
+            0x39,
+            0x39,
+            0x778,
+            0x777,
+            0x360,
+            0x88,
+            0x16,
+            0x20,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x58,
+            0x40,
+            0x730,
+            0xC0,
+            0xFFFFFFFF,
+            0x20,
+            0x24,
+            0x38,
+            0x100,
+            0x20,
+            0x100,
+            0x2D0,
+            0x4C,
+            0x4,
+            0x18,
+            0xCC,
+            0x16C,
+            0x19C,
+            0x4,
+            0xC64,
+            0xC8,
+            0x12F8,
+            0x190,
+            0xC00,
+            0x2,
+            0x2,
+            0x2,
+            0x4,
+            0x2,
+            0x2,
+            0x4,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0xFFFFFFFF,
+            0x4,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x8,
+            0x4,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x12,
+            0x18,
+            0x20,
+            0x20,
+            0x20,
+            0x28,
+            0x5C,
+            0x8A,
+            0xC8,
+            0xCC,
+            0x114,
+            0x190,
+            0x190,
+            0x200,
+            0x288,
+            0x288,
+            0x14,
+            0x20,
+            0xC8,
+            0x288,
+            0xD0,
+            0x70,
+            0x4,
+            0x80,
+            0x4B0,
+            0x2C,
+            0x30,
+            0x10,
+            0x30,
+            0x10,
+            0xB4,
+            0x6,
+            0x6,
+            0x1C,
+            0x10,
+            0x20,
+            0x2A,
+            0x2E,
+            0x40,
+            0xF8,
+            0x788,
+            0x2470,
+            0x1584,
+            0xC,
+            0x48,
+            0x28F8,
+            0x1218,
+            0x10,
+            0x20,
+            0x20,
+            0x18,
+            0x18,
+            0x18,
+            0x18,
+            0x18,
+            0x18,
+            0x18,
+            0x18,
+            0x18,
+            0x20,
+            0x20,
+            0x10,
+            0xD4,
+            0x9B0,
+            0x10,
+            0x4974,
+            0x102,
+            0x10,
+            0x60,
+            0x2D4,
+            0x8,
+            0x2,
+            0x4,
+            0x4,
+            0x4,
+            0xFFFFFFFF,
+            0x4,
+            0x18,
+            0xFFFFFFFF,
+            0x4,
+            0xC,
+            0xFFFFFFFF,
+            0x4,
+            0xFFFFFFFF,
+            0x44,
+            0x20,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x3C,
+            0x1,
+            0x2,
+            0x2,
+            0x1,
+            0x4,
+            0x4,
+            0x68,
+            0x70,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x1C,
+            0x40,
+            0x1FC,
+            0x100,
+            0x200,
+            0x40,
+            0x1,
+            0x4,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            889,
+            890,
+            891,
+            892,
+            893,
+            894,
+            895,
+            896,
+            897,
+            898,
+            899,
+            900,
+            901,
+            902,
+            903,
+            904,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            905,
+            906,
+            907,
+            907,
+            908,
+            909,
+            910,
+            911,
+            912,
+            913,
+            266,
+            914,
+            915,
+            916,
+            917,
+            918,
+            919,
+            920,
+            921,
+            922,
+            923,
+            924,
+            925,
+            926,
+            927,
+            928,
+            929,
+            930,
+            931,
+            932,
+            933,
+            934,
+            935,
+            936,
+            937,
+            938,
+            939,
+            940,
+            941,
+            942,
+            943,
+            944,
+            945,
+            946,
+            266,
+            947,
+            948,
+            949,
+            950,
+            266,
+            266,
+            951,
+            266,
+            952,
+            953,
+            954,
+            955,
+            956,
+            957,
+            958,
+            959,
+            960,
+            961,
+            962,
+            963,
+            964,
+            266,
+            266,
+            965,
+            966,
+            967,
+            968,
+            969,
+            970,
+            971,
+            972,
+            973,
+            974,
+            975,
+            976,
+            977,
+            978,
+            979,
+            980,
+            981,
+            982,
+            983,
+            984,
+            985,
+            986,
+            987,
+            988,
+            989,
+            990,
+            990,
+            991,
+            992,
+            993,
+            994,
+            1,
+            995,
+            266,
+            996,
+            997,
+            266,
+            266,
+            998,
+            266,
+            998,
+            266,
+            999,
+            1000,
+            1001,
+            1002,
+            1003,
+            1004,
+            1005,
+            1006,
+            1007,
+            1008,
+            266,
+            1009,
+            1010,
+            1011,
+            266,
+            1012,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1013,
+            1014,
+            1,
+            1015,
+            1016,
+            1,
+            1,
+            1017,
+            1018,
+            1019,
+            1020,
+            1021,
+            1022,
+            1,
+            1023,
+            1024,
+            1025,
+            1026,
+            1027,
+            1028,
+            1029,
+            1030,
+            1031,
+            1032,
+            1025,
+            1033,
+            1034,
+            1035,
+            1036,
+            1037,
+            1038,
+            1039,
+            1040,
+            1041,
+            1042,
+            1043,
+            1044,
+            1045,
+            1046,
+            1047,
+            1048,
+            1049,
+            266,
+            1050,
+            1051,
+            1052,
+            1053,
+            1054,
+            1,
+            1,
+            1,
+            1055,
+            1056,
+            1057,
+            1058,
+            1059,
+        ),
+    ),
+    c_types=(
+        "",
+        "struct start_module_params*",
+        "uint32_t",
+        "int",
+        "enum damage_source_non_move",
+        "enum damage_source_non_move",
+        "enum item_id",
+        "uint32_t",
+        "uint32_t",
+        "uint32_t",
+        "struct window_list*",
+        "struct script_var_value_table*",
+        "uint32_t",
+        "uint32_t",
+        "uint32_t",
+        "fx16_12[2048]",
+        "undefined[0]",
+        "char[4]",
+        "char[28]",
+        "char[24]",
+        "char[12]",
+        "char[20]",
+        "char[4]",
+        "char[8]",
+        "char[4]",
+        "char[20]",
+        "char[20]",
+        "char[20]",
+        "char[20]",
+        "char[24]",
+        "char[24]",
+        "char[40]",
+        "",
+        "",
+        "enum item_id[4]",
+        "enum item_id[4]",
+        "struct exclusive_item_stat_boost_entry[15]",
+        "",
+        "",
+        "",
+        "struct exclusive_item_effect_entry[956]",
+        "",
+        "",
+        "struct item_id_16[17][4]",
+        "struct move_id_16[11]",
+        "struct move_id_16[16]",
+        "int[6]",
+        "int[8]",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct partner_talk_kind_table_entry[11]",
+        "struct script_local_var_table",
+        "struct script_var_table",
+        "struct portrait_layout[32]",
+        "char[20]",
+        "uint8_t[32]",
+        "uint8_t[36]",
+        "",
+        "",
+        "",
+        "uint8_t[256]",
+        "struct dungeon_data_list_entry[180]",
+        "struct monster_id_16[38]",
+        "",
+        "int16_t[12]",
+        "int16_t[102]",
+        "struct dungeon_return_status[91]",
+        "struct status_description[103]",
+        "",
+        "",
+        "struct mission_floors_forbidden[100]",
+        "",
+        "undefined*[100]",
+        "struct dungeon_restriction[256]",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int32_t",
+        "int16_t",
+        "int16_t",
+        "int32_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "fx32_8",
+        "int16_t[2]",
+        "fx32_8",
+        "fx32_8",
+        "int16_t[4]",
+        "int16_t[2]",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "struct forbidden_forgot_move_entry[3]",
+        "int16_t[12]",
+        "int16_t[16]",
+        "int16_t[16]",
+        "int16_t[16]",
+        "int[10]",
+        "struct version_exclusive_monster[23]",
+        "int16_t[69]",
+        "struct secondary_terrain_type_8[200]",
+        "struct monster_id_16[102]",
+        "int32_t[69]",
+        "uint8_t[400]",
+        "int[100]",
+        "",
+        "int16_t[18][18]",
+        "int16_t[18][18]",
+        "uint32_t[5]",
+        "uint32_t[8]",
+        "struct monster_id_16[100]",
+        "struct guest_monster[18]",
+        "struct rankup_table_entry[13]",
+        "struct monster_id_16[56]",
+        "",
+        "enum monster_id[28]",
+        "struct monster_sprite_data_entry[600]",
+        "",
+        "",
+        "int16_t[8]",
+        "",
+        "int16_t[8]",
+        "",
+        "struct dungeon_unlock_entry[3]",
+        "struct item_id_16[3]",
+        "",
+        "",
+        "",
+        "struct monster_id_16[21]",
+        "struct item_id_16[23]",
+        "int[16]",
+        "struct monster_id_16[124]",
+        "int16_t[964]",
+        "",
+        "struct script_level[0]",
+        "",
+        "struct monster_id_16[18][2]",
+        "",
+        "struct script_entity[386]",
+        "struct window_params",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct window_params",
+        "struct dungeon_id_8[212]",
+        "struct map_marker[310]",
+        "struct dse_voice_update_flags",
+        "struct trig_values[4096]",
+        "fx16_14[129]",
+        "int16_t[8]",
+        "int16_t[48]",
+        "",
+        "struct mem_arena_getters",
+        "uint16_t",
+        "enum overlay_group_id",
+        "enum overlay_group_id",
+        "enum overlay_group_id",
+        "bool",
+        "struct pack_file_opened*",
+        "char*[6]",
+        "",
+        "struct item*",
+        "void*[3]",
+        "",
+        "struct move_data_table*",
+        "struct wan_table*",
+        "struct render_3d_global",
+        "render_3d_element_64_fn_t[8]",
+        "",
+        "int16_t[6]",
+        "int16_t[30]",
+        "bool",
+        "struct monster_id_16",
+        "struct monster_id_16",
+        "uint8_t",
+        "struct global_progress*",
+        "struct adventure_log*",
+        "void*[26]",
+        "enum monster_id*[28]",
+        "struct team_member_table*",
+        "undefined*",
+        "int",
+        "undefined*",
+        "int",
+        "undefined*",
+        "int",
+        "undefined*",
+        "char*[7]",
+        "char*[16]",
+        "void*[127]",
+        "int16_t[128]",
+        "int32_t[128]",
+        "sound_lfo_waveform_callback[16]",
+        "bool",
+        "uint32_t",
+        "struct data_processing_instruction",
+        "struct data_processing_instruction",
+        "struct data_processing_instruction",
+        "struct data_processing_instruction",
+        "struct data_processing_instruction",
+    ),
+    multi={
+        7: ((0xE88C, 0xE930), (0x200E88C, 0x200E930)),
+        11: (
+            (0x4B630, 0x4B81C, 0x4C764, 0x4C7BC),
+            (0x204B630, 0x204B81C, 0x204C764, 0x204C7BC),
+        ),
+        14: ((0x555B4, 0x559C8), (0x20555B4, 0x20559C8)),
+    },
+)
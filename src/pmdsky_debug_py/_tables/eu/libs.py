@@ -0,0 +1,2183 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the libs section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "DseDriver_LoadDefaultSettings",
+        "DseDriver_IsSettingsValid",
+        "DseDriver_ConfigureHeap",
+        "DseDriver_Init",
+        "Dse_SetError",
+        "Dse_SetError2",
+        "DseUtil_ByteSwap32",
+        "SoundUtil_GetRandomNumber",
+        "DseMem_Init",
+        "DseMem_Quit",
+        "DseMem_AllocateUser",
+        "DseMem_Allocate",
+        "DseMem_AllocateThreadStack",
+        "DseMem_Free",
+        "DseMem_Clear",
+        "DseFile_CheckHeader",
+        "DseSwd_SysInit",
+        "DseSwd_SysQuit",
+        "DseSwd_SampleLoaderMain",
+        "DseSwd_MainBankDummyCallback",
+        "DseSwd_LoadMainBank",
+        "DseSwd_LoadBank",
+        "DseSwd_IsBankLoading",
+        "DseSwd_LoadWaves",
+        "DseSwd_LoadWavesInternal",
+        "DseSwd_Unload",
+        "ReadWaviEntry",
+        "DseSwd_GetInstrument",
+        "DseSwd_GetNextSplitInRange",
+        "DseSwd_GetMainBankById",
+        "DseSwd_GetBankById",
+        "DseSwd_InitMainBankFileReader",
+        "DseSwd_OpenMainBankFileReader",
+        "DseSwd_CloseMainBankFileReader",
+        "DseSwd_ReadMainBank",
+        "DseBgm_DefaultSignalCallback",
+        "DseBgm_Load",
+        "DseBgm_Unload",
+        "DseBgm_SetSignalCallback",
+        "DseBgm_IsPlaying",
+        "ResumeBgm",
+        "DseBgm_Stop",
+        "DseBgm_StopAll",
+        "DseBgm_SetFades",
+        "DseSequence_Start",
+        "DseSequence_PauseList",
+        "DseSequence_SetFades",
+        "DseSequence_GetParameter",
+        "DseSequence_GetSmallestNumLoops",
+        "DseSequence_Reset",
+        "DseSequence_Stop",
+        "FindSmdlSongChunk",
+        "DseSequence_LoadSong",
+        "DseSequence_GetById",
+        "DseSequence_AllocateNew",
+        "DseSequence_Unload",
+        "DseSequence_InitTracks",
+        "DseBgm_SysSetupNoteList",
+        "DseSe_SysReset",
+        "DseSe_Load",
+        "DseSe_Unload",
+        "DseSe_GetUsedBankIDs",
+        "DseSe_HasPlayingInstances",
+        "DseSe_Play",
+        "DseSe_GetEffectSong",
+        "DseSe_CheckTooManyInstances",
+        "DseSe_CheckTooManyInstancesInGroup",
+        "DseSe_GetBestSeqAllocation",
+        "DseSe_GetById",
+        "DseSe_Stop",
+        "DseSe_StopAll",
+        "DseSe_StopSeq",
+        "FlushChannels",
+        "DseDriver_StartMainThread",
+        "DseDriver_StartTickTimer",
+        "DseDriver_NotifyTick",
+        "DseDriver_Main",
+        "DseSequence_TickNotes",
+        "ParseDseEvent",
+        "UpdateSequencerTracks",
+        "DseSequence_TickFades",
+        "DseTrackEvent_Invalid",
+        "DseTrackEvent_WaitSame",
+        "DseTrackEvent_WaitDelta",
+        "DseTrackEvent_Wait8",
+        "DseTrackEvent_Wait16",
+        "DseTrackEvent_Wait24",
+        "DseTrackEvent_WaitUntilFadeout",
+        "DseTrackEvent_EndTrack",
+        "DseTrackEvent_MainLoopBegin",
+        "DseTrackEvent_SubLoopBegin",
+        "DseTrackEvent_SubLoopEnd",
+        "DseTrackEvent_SubLoopBreakOnLastIteration",
+        "DseTrackEvent_SetOctave",
+        "DseTrackEvent_OctaveDelta",
+        "DseTrackEvent_SetBpm",
+        "DseTrackEvent_SetBpm2",
+        "DseTrackEvent_SetBank",
+        "DseTrackEvent_SetBankMsb",
+        "DseTrackEvent_SetBankLsb",
+        "DseTrackEvent_Dummy1Byte",
+        "DseTrackEvent_SetInstrument",
+        "DseTrackEvent_SongVolumeFade",
+        "DseTrackEvent_RestoreEnvelopeDefaults",
+        "DseTrackEvent_SetEnvelopeAttackBegin",
+        "DseTrackEvent_SetEnvelopeAttackTime",
+        "DseTrackEvent_SetEnvelopeHoldTime",
+        "DseTrackEvent_SetEnvelopeDecayTimeAndSustainLevel",
+        "DseTrackEvent_SetEnvelopeSustainTime",
+        "DseTrackEvent_SetEnvelopeReleaseTime",
+        "DseTrackEvent_SetNoteDurationMultiplier",
+        "DseTrackEvent_ForceLfoEnvelopeLevel",
+        "DseTrackEvent_SetHoldNotes",
+        "DseTrackEvent_SetFlagBit1Unknown",
+        "DseTrackEvent_SetOptionalVolume",
+        "DseTrackEvent_Dummy2Bytes",
+        "DseTrackEvent_SetTuning",
+        "DseTrackEvent_TuningDeltaCoarse",
+        "DseTrackEvent_TuningDeltaFine",
+        "DseTrackEvent_TuningDeltaFull",
+        "DseTrackEvent_TuningFade",
+        "DseTrackEvent_SetNoteRandomRegion",
+        "DseTrackEvent_SetTuningJitterAmplitude",
+        "DseTrackEvent_SetKeyBend",
+        "DseTrackEvent_SetUnknown2",
+        "DseTrackEvent_SetKeyBendRange",
+        "DseTrackEvent_SetupKeyBendLfo",
+        "DseTrackEvent_SetupKeyBendLfoEnvelope",
+        "DseTrackEvent_UseKeyBendLfo",
+        "DseTrackEvent_SetVolume",
+        "DseTrackEvent_VolumeDelta",
+        "DseTrackEvent_VolumeFade",
+        "DseTrackEvent_SetExpression",
+        "DseTrackEvent_SetupVolumeLfo",
+        "DseTrackEvent_SetupVolumeLfoEnvelope",
+        "DseTrackEvent_UseVolumeLfo",
+        "DseTrackEvent_SetPan",
+        "DseTrackEvent_PanDelta",
+        "DseTrackEvent_PanFade",
+        "DseTrackEvent_SetupPanLfo",
+        "DseTrackEvent_SetupPanLfoEnvelope",
+        "DseTrackEvent_UsePanLfo",
+        "DseTrackEvent_SetupLfo",
+        "DseTrackEvent_SetupLfoEnvelope",
+        "DseTrackEvent_SetLfoParameter",
+        "DseTrackEvent_UseLfo",
+        "DseTrackEvent_Signal",
+        "DseTrackEvent_Dummy2Bytes2",
+        "DseSynth_Reset",
+        "DseSynth_AllocateNew",
+        "DseSynth_Unload",
+        "DseSynth_ClearHeldNotes",
+        "DseSynth_ResetAndSetBankAndSequence",
+        "DseSynth_StopChannels",
+        "DseSynth_ResetAllVoiceTimersAndVolumes",
+        "DseSynth_RestoreHeldNotes",
+        "DseSynth_SetGlobalVolumeIndex",
+        "DseSynth_SetBend",
+        "DseSynth_SetVolume",
+        "DseSynth_SetPan",
+        "DseSynth_SetBankAndSequence",
+        "DseChannel_Init",
+        "DseChannel_DeallocateVoices",
+        "DseChannel_ResetTimerAndVolumeForVoices",
+        "DseChannel_SetBank",
+        "DseChannel_SetInstrument",
+        "DseChannel_SetLfoConstEnvelopeLevel",
+        "DseChannel_SetKeyBend",
+        "DseChannel_AllocateNote",
+        "DseChannel_ReleaseNoteInternal",
+        "DseChannel_ChangeNote",
+        "DseChannel_ReleaseNote",
+        "DseVoice_PlayNote",
+        "DseVoice_ReleaseNote",
+        "DseVoice_UpdateParameters",
+        "DseVoice_ResetAll",
+        "DseVoice_ResetHW",
+        "UpdateChannels",
+        "DseVoice_Cleanup",
+        "DseVoice_Allocate",
+        "DseVoice_Start",
+        "DseVoice_ReleaseHeld",
+        "DseVoice_Release",
+        "DseVoice_Deallocate",
+        "DseVoice_FlagForActivation",
+        "DseVoice_FlagForDeactivation",
+        "DseVoice_CountNumActiveInChannel",
+        "DseVoice_UpdateHardware",
+        "SoundEnvelope_Reset",
+        "SoundEnvelopeParameters_Reset",
+        "SoundEnvelopeParameters_CheckValidity",
+        "SoundEnvelope_SetParameters",
+        "SoundEnvelope_SetSlide",
+        "UpdateTrackVolumeEnvelopes",
+        "SoundEnvelope_Release",
+        "SoundEnvelope_Stop",
+        "SoundEnvelope_ForceVolume",
+        "SoundEnvelope_Stop2",
+        "SoundEnvelope_Tick",
+        "SoundLfoBank_Reset",
+        "SoundLfoBank_Set",
+        "SoundLfoBank_SetConstEnvelopes",
+        "SoundLfoBank_Tick",
+        "SoundLfoWave_InvalidFunc",
+        "SoundLfoWave_HalfSquareFunc",
+        "SoundLfoWave_FullSquareFunc",
+        "SoundLfoWave_HalfTriangleFunc",
+        "SoundLfoWave_FullTriangleFunc",
+        "SoundLfoWave_SawFunc",
+        "SoundLfoWave_ReverseSawFunc",
+        "SoundLfoWave_HalfNoiseFunc",
+        "SoundLfoWave_FullNoiseFunc",
+        "Crypto_RC4Init",
+        "Mtx_LookAt",
+        "Mtx_OrthoW",
+        "FX_Div",
+        "FX_GetDivResultFx64c",
+        "FX_GetDivResult",
+        "FX_InvAsync",
+        "FX_DivAsync",
+        "FX_DivS32",
+        "FX_ModS32",
+        "Vec_DotProduct",
+        "Vec_CrossProduct",
+        "Vec_Normalize",
+        "Vec_Distance",
+        "FX_Atan2Idx",
+        "GX_Init",
+        "GX_HBlankIntr",
+        "GX_VBlankIntr",
+        "GX_DispOff",
+        "GX_DispOn",
+        "GX_SetGraphicsMode",
+        "Gxs_SetGraphicsMode",
+        "GXx_SetMasterBrightness",
+        "GX_InitGxState",
+        "EnableVramBanksInSetDontSave",
+        "GX_SetBankForBg",
+        "GX_SetBankForObj",
+        "GX_SetBankForBgExtPltt",
+        "GX_SetBankForObjExtPltt",
+        "GX_SetBankForTex",
+        "GX_SetBankForTexPltt",
+        "GX_SetBankForClearImage",
+        "GX_SetBankForArm7",
+        "GX_SetBankForLcdc",
+        "GX_SetBankForSubBg",
+        "GX_SetBankForSubObj",
+        "GX_SetBankForSubBgExtPltt",
+        "GX_SetBankForSubObjExtPltt",
+        "EnableVramBanksInSet",
+        "GX_ResetBankForBgExtPltt",
+        "GX_ResetBankForObjExtPltt",
+        "GX_ResetBankForTex",
+        "GX_ResetBankForTexPltt",
+        "GX_ResetBankForSubBgExtPltt",
+        "GX_ResetBankForSubObjExtPltt",
+        "DisableBankForX",
+        "GX_DisableBankForBg",
+        "GX_DisableBankForObj",
+        "GX_DisableBankForBgExtPltt",
+        "GX_DisableBankForObjExtPltt",
+        "GX_DisableBankForTex",
+        "GX_DisableBankForTexPltt",
+        "GX_DisableBankForClearImage",
+        "GX_DisableBankForArm7",
+        "GX_DisableBankForLcdc",
+        "GX_DisableBankForSubBg",
+        "GX_DisableBankForSubObj",
+        "GX_DisableBankForSubBgExtPltt",
+        "GX_DisableBankForSubObjExtPltt",
+        "G2_GetBG0ScrPtr",
+        "G2S_GetBG0ScrPtr",
+        "G2_GetBG1ScrPtr",
+        "G2S_GetBG1ScrPtr",
+        "G2_GetBG2ScrPtr",
+        "G2_GetBG3ScrPtr",
+        "G2_GetBG0CharPtr",
+        "G2S_GetBG0CharPtr",
+        "G2_GetBG1CharPtr",
+        "G2S_GetBG1CharPtr",
+        "G2_GetBG2CharPtr",
+        "G2_GetBG3CharPtr",
+        "G2x_SetBlendAlpha",
+        "G2x_SetBlendBrightness",
+        "G2x_ChangeBlendBrightness",
+        "G3_LoadMtx44",
+        "G3_LoadMtx43",
+        "G3_MultMtx43",
+        "G3X_Init",
+        "G3X_Reset",
+        "G3X_ClearFifo",
+        "G3X_InitMtxStack",
+        "G3X_ResetMtxStack",
+        "G3X_SetClearColor",
+        "G3X_InitTable",
+        "G3X_GetMtxStackLevelPV",
+        "G3X_GetMtxStackLevelPJ",
+        "GXi_NopClearFifo128",
+        "G3i_OrthoW",
+        "G3i_LookAt",
+        "GX_LoadBgPltt",
+        "Gxs_LoadBgPltt",
+        "GX_LoadObjPltt",
+        "Gxs_LoadObjPltt",
+        "GX_LoadOam",
+        "Gxs_LoadOam",
+        "GX_LoadObj",
+        "Gxs_LoadObj",
+        "GX_LoadBg0Scr",
+        "GX_LoadBg1Scr",
+        "Gxs_LoadBg1Scr",
+        "GX_LoadBg2Scr",
+        "GX_LoadBg3Scr",
+        "GX_LoadBg0Char",
+        "Gxs_LoadBg0Char",
+        "GX_LoadBg1Char",
+        "Gxs_LoadBg1Char",
+        "GX_LoadBg2Char",
+        "GX_LoadBg3Char",
+        "GX_BeginLoadBgExtPltt",
+        "GX_EndLoadBgExtPltt",
+        "GX_BeginLoadObjExtPltt",
+        "GX_EndLoadObjExtPltt",
+        "Gxs_BeginLoadBgExtPltt",
+        "Gxs_EndLoadBgExtPltt",
+        "Gxs_BeginLoadObjExtPltt",
+        "Gxs_EndLoadObjExtPltt",
+        "GX_BeginLoadTex",
+        "GX_LoadTex",
+        "GX_EndLoadTex",
+        "GX_BeginLoadTexPltt",
+        "GX_LoadTexPltt",
+        "GX_EndLoadTexPltt",
+        "GeomGxFifoSendMtx4x3",
+        "GX_SendFifo64B",
+        "OS_GetLockID",
+        "IncrementThreadCount",
+        "InsertThreadIntoList",
+        "StartThread",
+        "ThreadExit",
+        "SetThreadField0xB4",
+        "InitThread",
+        "GetTimer0Control",
+        "ClearIrqFlag",
+        "EnableIrqFlag",
+        "SetIrqFlag",
+        "EnableIrqFiqFlags",
+        "SetIrqFiqFlags",
+        "GetIrqFlag",
+        "GetProcessorMode",
+        "GetDsFirmwareUserSettings",
+        "CountLeadingZeros",
+        "WaitForever2",
+        "WaitForInterrupt",
+        "ArrayFill16",
+        "ArrayCopy16",
+        "ArrayFill32",
+        "ArrayCopy32",
+        "ArrayFill32Fast",
+        "ArrayCopy32Fast",
+        "MemsetFast",
+        "MemcpyFast",
+        "AtomicExchange",
+        "FileInit",
+        "GetOverlayInfo",
+        "LoadOverlayInternal",
+        "InitOverlay",
+        "abs",
+        "mbtowc",
+        "TryAssignByte",
+        "TryAssignByteWrapper",
+        "wcstombs",
+        "memcpy",
+        "memmove",
+        "memset",
+        "memchr",
+        "memcmp",
+        "memset_internal",
+        "__vsprintf_internal_slice",
+        "TryAppendToSlice",
+        "__vsprintf_internal",
+        "vsprintf",
+        "snprintf",
+        "sprintf",
+        "strlen",
+        "strcpy",
+        "strncpy",
+        "strcat",
+        "strncat",
+        "strcmp",
+        "strncmp",
+        "strchr",
+        "strcspn",
+        "strstr",
+        "wcslen",
+        "_dadd",
+        "_d2f",
+        "_ll_ufrom_d",
+        "_dflt",
+        "_dfltu",
+        "_dmul",
+        "_dsqrt",
+        "_dsub",
+        "_fadd",
+        "_dgeq",
+        "_dleq",
+        "_dls",
+        "_deq",
+        "_dneq",
+        "_fls",
+        "_fdiv",
+        "_f2d",
+        "_ffix",
+        "_fflt",
+        "_ffltu",
+        "_fmul",
+        "sqrtf",
+        "_fsub",
+        "_ll_mod",
+        "_ll_sdiv",
+        "_ll_udiv",
+        "_ull_mod",
+        "_ll_mul",
+        "_s32_div_f",
+        "_u32_div_f",
+        "_u32_div_not_0_f",
+        "_drdiv",
+        "_ddiv",
+        "_fp_init",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xE8,
+            0x180,
+            0x264,
+            0x308,
+            0x77C,
+            0x7B0,
+            0x7EC,
+            0x81C,
+            0x844,
+            0x8B4,
+            0x8D0,
+            0x8E4,
+            0x9F4,
+            0xB3C,
+            0xBE4,
+            0xC44,
+            0xCC4,
+            0xD50,
+            0xD90,
+            0xDF0,
+            0xDF8,
+            0x1030,
+            0x1234,
+            0x1250,
+            0x1300,
+            0x140C,
+            0x1480,
+            0x14B8,
+            0x14F0,
+            0x1578,
+            0x15C8,
+            0x1618,
+            0x1628,
+            0x1654,
+            0x1664,
+            0x1728,
+            0x1730,
+            0x1834,
+            0x186C,
+            0x18CC,
+            0x18E4,
+            0x19C4,
+            0x1A04,
+            0x1A64,
+            0x1AA4,
+            0x1B34,
+            0x1C98,
+            0x1F8C,
+            0x2140,
+            0x2194,
+            0x22EC,
+            0x2410,
+            0x247C,
+            0x257C,
+            0x25C8,
+            0x2700,
+            0x2784,
+            0x27D4,
+            0x2848,
+            0x2940,
+            0x2AF4,
+            0x2B84,
+            0x2C58,
+            0x2D24,
+            0x2ED8,
+            0x2F20,
+            0x3028,
+            0x31EC,
+            0x3268,
+            0x32B4,
+            0x3408,
+            0x3474,
+            0x459C,
+            0x4D34,
+            0x4E04,
+            0x4EFC,
+            0x4F3C,
+            0x5088,
+            0x514C,
+            0x5310,
+            0x56AC,
+            0x5844,
+            0x5850,
+            0x585C,
+            0x5874,
+            0x5884,
+            0x58A0,
+            0x58C4,
+            0x58F0,
+            0x593C,
+            0x5944,
+            0x5984,
+            0x59C0,
+            0x59E8,
+            0x59F4,
+            0x5A08,
+            0x5A48,
+            0x5A88,
+            0x5AB4,
+            0x5AE4,
+            0x5B14,
+            0x5B1C,
+            0x5B64,
+            0x5BF0,
+            0x5C08,
+            0x5C28,
+            0x5C48,
+            0x5C68,
+            0x5C98,
+            0x5CB8,
+            0x5CD8,
+            0x5CE4,
+            0x5D00,
+            0x5D38,
+            0x5D48,
+            0x5D54,
+            0x5D5C,
+            0x5DDC,
+            0x5E64,
+            0x5EEC,
+            0x5F7C,
+            0x606C,
+            0x6094,
+            0x60AC,
+            0x60D8,
+            0x60F0,
+            0x60FC,
+            0x6154,
+            0x617C,
+            0x61A4,
+            0x6238,
+            0x62E8,
+            0x6344,
+            0x63D0,
+            0x642C,
+            0x6454,
+            0x647C,
+            0x64FC,
+            0x6590,
+            0x65EC,
+            0x6648,
+            0x6670,
+            0x6698,
+            0x66F0,
+            0x6724,
+            0x6860,
+            0x6894,
+            0x68C4,
+            0x7130,
+            0x71A8,
+            0x7278,
+            0x72E4,
+            0x7380,
+            0x73A8,
+            0x73D4,
+            0x742C,
+            0x7494,
+            0x757C,
+            0x7610,
+            0x76E0,
+            0x7774,
+            0x7804,
+            0x79B8,
+            0x7A3C,
+            0x7AB8,
+            0x7AF0,
+            0x7B84,
+            0x7BB8,
+            0x7C00,
+            0x7C90,
+            0x7D38,
+            0x7DC8,
+            0x7E04,
+            0x8078,
+            0x80BC,
+            0x8260,
+            0x8304,
+            0x83B4,
+            0x84A4,
+            0x8540,
+            0x86A8,
+            0x8704,
+            0x8784,
+            0x87C8,
+            0x88CC,
+            0x891C,
+            0x8954,
+            0x8980,
+            0x8B98,
+            0x8BAC,
+            0x8BC8,
+            0x8C1C,
+            0x8C80,
+            0x8D34,
+            0x8E00,
+            0x8E2C,
+            0x8E44,
+            0x8E64,
+            0x8E7C,
+            0x8FC4,
+            0x8FDC,
+            0x91D4,
+            0x9220,
+            0x92D4,
+            0x92E8,
+            0x9324,
+            0x936C,
+            0x93C0,
+            0x9424,
+            0x9460,
+            0x949C,
+            0x94E0,
+            0x9648,
+            0x9750,
+            0x9858,
+            0x9A60,
+            0x9A70,
+            0x9A94,
+            0x9ACC,
+            0x9AFC,
+            0x9B24,
+            0x9B60,
+            0x9B9C,
+            0x9BD8,
+            0x9C5C,
+            0x9D74,
+            0x9DF0,
+            0x9F9C,
+            0xA0E8,
+            0xA110,
+            0xA144,
+            0xA180,
+            0xA1C8,
+            0xA230,
+            0xA24C,
+            0xA274,
+            0xA2D4,
+            0xA38C,
+            0xA61C,
+            0xA76C,
+            0xA86C,
+            0xA918,
+            0xAAF0,
+            0xABD8,
+            0xAD0C,
+            0xADB8,
+            0xADD8,
+            0xAE80,
+            0xAEF0,
+            0xAF70,
+            0xAFF0,
+            0xB024,
+            0xB048,
+            0xB06C,
+            0xB080,
+            0xB094,
+            0xB0BC,
+            0xB0E4,
+            0xB1C4,
+            0xB1D8,
+            0xB1EC,
+            0xB210,
+            0xB234,
+            0xB248,
+            0xB25C,
+            0xB270,
+            0xB284,
+            0xB298,
+            0xB2AC,
+            0xB2C0,
+            0xB2E8,
+            0xB310,
+            0xB344,
+            0xB364,
+            0xB398,
+            0xB3B8,
+            0xB43C,
+            0xB4C0,
+            0xB4F4,
+            0xB514,
+            0xB548,
+            0xB568,
+            0xB5B8,
+            0xB610,
+            0xB62C,
+            0xB654,
+            0xB698,
+            0xB6B4,
+            0xB6D0,
+            0xB6EC,
+            0xB7F8,
+            0xB864,
+            0xB88C,
+            0xB924,
+            0xB9B4,
+            0xB9DC,
+            0xBA7C,
+            0xBAAC,
+            0xBADC,
+            0xBB70,
+            0xBBD4,
+            0xBC20,
+            0xBC74,
+            0xBCCC,
+            0xBD24,
+            0xBD7C,
+            0xBDD0,
+            0xBE28,
+            0xBE80,
+            0xBED8,
+            0xBF38,
+            0xBF98,
+            0xBFF8,
+            0xC058,
+            0xC0B8,
+            0xC118,
+            0xC178,
+            0xC1D8,
+            0xC238,
+            0xC298,
+            0xC2F8,
+            0xC398,
+            0xC3E0,
+            0xC428,
+            0xC46C,
+            0xC484,
+            0xC4C4,
+            0xC4DC,
+            0xC51C,
+            0xC578,
+            0xC6B8,
+            0xC704,
+            0xC738,
+            0xC7A4,
+            0xC7E8,
+            0xC80C,
+            0xCF54,
+            0xD078,
+            0xD1C0,
+            0xD488,
+            0xD584,
+            0xDBA4,
+            0xDBAC,
+            0xEE0C,
+            0xF6F8,
+            0xF70C,
+            0xF720,
+            0xF738,
+            0xF74C,
+            0xF764,
+            0xF770,
+            0xF930,
+            0xF9B4,
+            0xFB48,
+            0xFB58,
+            0x101E0,
+            0x10208,
+            0x1023C,
+            0x10258,
+            0x10280,
+            0x102DC,
+            0x10334,
+            0x103F0,
+            0x10570,
+            0x1330C,
+            0x13BC4,
+            0x13CC0,
+            0x13DE4,
+            0x1A484,
+            0x1B0E4,
+            0x1B11C,
+            0x1B130,
+            0x1B14C,
+            0x1B1C4,
+            0x1B1E4,
+            0x1B230,
+            0x1B244,
+            0x1B270,
+            0x1B2B0,
+            0x1CB9C,
+            0x1D3C0,
+            0x1D404,
+            0x1D46C,
+            0x1D484,
+            0x1D4AC,
+            0x1D5A0,
+            0x1D5BC,
+            0x1D684,
+            0x1D6D4,
+            0x1D704,
+            0x1D754,
+            0x1D868,
+            0x1D89C,
+            0x1D8D8,
+            0x1D998,
+            0x1F310,
+            0x21DF0,
+            0x22108,
+            0x2220C,
+            0x22298,
+            0x222D8,
+            0x22314,
+            0x22678,
+            0x2282C,
+            0x22BE0,
+            0x22E04,
+            0x22E9C,
+            0x22F40,
+            0x22FDC,
+            0x23068,
+            0x230F4,
+            0x2315C,
+            0x23514,
+            0x23598,
+            0x235CC,
+            0x23614,
+            0x2365C,
+            0x2383C,
+            0x2392C,
+            0x23BA4,
+            0x23BB4,
+            0x23D64,
+            0x23D70,
+            0x23DAC,
+            0x23DCC,
+            0x23FD8,
+            0x23FE0,
+            0x241BC,
+            0x241D4,
+            0x24718,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x206C558,
+            0x206C5F0,
+            0x206C6D4,
+            0x206C778,
+            0x206CBEC,
+            0x206CC20,
+            0x206CC5C,
+            0x206CC8C,
+            0x206CCB4,
+            0x206CD24,
+            0x206CD40,
+            0x206CD54,
+            0x206CE64,
+            0x206CFAC,
+            0x206D054,
+            0x206D0B4,
+            0x206D134,
+            0x206D1C0,
+            0x206D200,
+            0x206D260,
+            0x206D268,
+            0x206D4A0,
+            0x206D6A4,
+            0x206D6C0,
+            0x206D770,
+            0x206D87C,
+            0x206D8F0,
+            0x206D928,
+            0x206D960,
+            0x206D9E8,
+            0x206DA38,
+            0x206DA88,
+            0x206DA98,
+            0x206DAC4,
+            0x206DAD4,
+            0x206DB98,
+            0x206DBA0,
+            0x206DCA4,
+            0x206DCDC,
+            0x206DD3C,
+            0x206DD54,
+            0x206DE34,
+            0x206DE74,
+            0x206DED4,
+            0x206DF14,
+            0x206DFA4,
+            0x206E108,
+            0x206E3FC,
+            0x206E5B0,
+            0x206E604,
+            0x206E75C,
+            0x206E880,
+            0x206E8EC,
+            0x206E9EC,
+            0x206EA38,
+            0x206EB70,
+            0x206EBF4,
+            0x206EC44,
+            0x206ECB8,
+            0x206EDB0,
+            0x206EF64,
+            0x206EFF4,
+            0x206F0C8,
+            0x206F194,
+            0x206F348,
+            0x206F390,
+            0x206F498,
+            0x206F65C,
+            0x206F6D8,
+            0x206F724,
+            0x206F878,
+            0x206F8E4,
+            0x2070A0C,
+            0x20711A4,
+            0x2071274,
+            0x207136C,
+            0x20713AC,
+            0x20714F8,
+            0x20715BC,
+            0x2071780,
+            0x2071B1C,
+            0x2071CB4,
+            0x2071CC0,
+            0x2071CCC,
+            0x2071CE4,
+            0x2071CF4,
+            0x2071D10,
+            0x2071D34,
+            0x2071D60,
+            0x2071DAC,
+            0x2071DB4,
+            0x2071DF4,
+            0x2071E30,
+            0x2071E58,
+            0x2071E64,
+            0x2071E78,
+            0x2071EB8,
+            0x2071EF8,
+            0x2071F24,
+            0x2071F54,
+            0x2071F84,
+            0x2071F8C,
+            0x2071FD4,
+            0x2072060,
+            0x2072078,
+            0x2072098,
+            0x20720B8,
+            0x20720D8,
+            0x2072108,
+            0x2072128,
+            0x2072148,
+            0x2072154,
+            0x2072170,
+            0x20721A8,
+            0x20721B8,
+            0x20721C4,
+            0x20721CC,
+            0x207224C,
+            0x20722D4,
+            0x207235C,
+            0x20723EC,
+            0x20724DC,
+            0x2072504,
+            0x207251C,
+            0x2072548,
+            0x2072560,
+            0x207256C,
+            0x20725C4,
+            0x20725EC,
+            0x2072614,
+            0x20726A8,
+            0x2072758,
+            0x20727B4,
+            0x2072840,
+            0x207289C,
+            0x20728C4,
+            0x20728EC,
+            0x207296C,
+            0x2072A00,
+            0x2072A5C,
+            0x2072AB8,
+            0x2072AE0,
+            0x2072B08,
+            0x2072B60,
+            0x2072B94,
+            0x2072CD0,
+            0x2072D04,
+            0x2072D34,
+            0x20735A0,
+            0x2073618,
+            0x20736E8,
+            0x2073754,
+            0x20737F0,
+            0x2073818,
+            0x2073844,
+            0x207389C,
+            0x2073904,
+            0x20739EC,
+            0x2073A80,
+            0x2073B50,
+            0x2073BE4,
+            0x2073C74,
+            0x2073E28,
+            0x2073EAC,
+            0x2073F28,
+            0x2073F60,
+            0x2073FF4,
+            0x2074028,
+            0x2074070,
+            0x2074100,
+            0x20741A8,
+            0x2074238,
+            0x2074274,
+            0x20744E8,
+            0x207452C,
+            0x20746D0,
+            0x2074774,
+            0x2074824,
+            0x2074914,
+            0x20749B0,
+            0x2074B18,
+            0x2074B74,
+            0x2074BF4,
+            0x2074C38,
+            0x2074D3C,
+            0x2074D8C,
+            0x2074DC4,
+            0x2074DF0,
+            0x2075008,
+            0x207501C,
+            0x2075038,
+            0x207508C,
+            0x20750F0,
+            0x20751A4,
+            0x2075270,
+            0x207529C,
+            0x20752B4,
+            0x20752D4,
+            0x20752EC,
+            0x2075434,
+            0x207544C,
+            0x2075644,
+            0x2075690,
+            0x2075744,
+            0x2075758,
+            0x2075794,
+            0x20757DC,
+            0x2075830,
+            0x2075894,
+            0x20758D0,
+            0x207590C,
+            0x2075950,
+            0x2075AB8,
+            0x2075BC0,
+            0x2075CC8,
+            0x2075ED0,
+            0x2075EE0,
+            0x2075F04,
+            0x2075F3C,
+            0x2075F6C,
+            0x2075F94,
+            0x2075FD0,
+            0x207600C,
+            0x2076048,
+            0x20760CC,
+            0x20761E4,
+            0x2076260,
+            0x207640C,
+            0x2076558,
+            0x2076580,
+            0x20765B4,
+            0x20765F0,
+            0x2076638,
+            0x20766A0,
+            0x20766BC,
+            0x20766E4,
+            0x2076744,
+            0x20767FC,
+            0x2076A8C,
+            0x2076BDC,
+            0x2076CDC,
+            0x2076D88,
+            0x2076F60,
+            0x2077048,
+            0x207717C,
+            0x2077228,
+            0x2077248,
+            0x20772F0,
+            0x2077360,
+            0x20773E0,
+            0x2077460,
+            0x2077494,
+            0x20774B8,
+            0x20774DC,
+            0x20774F0,
+            0x2077504,
+            0x207752C,
+            0x2077554,
+            0x2077634,
+            0x2077648,
+            0x207765C,
+            0x2077680,
+            0x20776A4,
+            0x20776B8,
+            0x20776CC,
+            0x20776E0,
+            0x20776F4,
+            0x2077708,
+            0x207771C,
+            0x2077730,
+            0x2077758,
+            0x2077780,
+            0x20777B4,
+            0x20777D4,
+            0x2077808,
+            0x2077828,
+            0x20778AC,
+            0x2077930,
+            0x2077964,
+            0x2077984,
+            0x20779B8,
+            0x20779D8,
+            0x2077A28,
+            0x2077A80,
+            0x2077A9C,
+            0x2077AC4,
+            0x2077B08,
+            0x2077B24,
+            0x2077B40,
+            0x2077B5C,
+            0x2077C68,
+            0x2077CD4,
+            0x2077CFC,
+            0x2077D94,
+            0x2077E24,
+            0x2077E4C,
+            0x2077EEC,
+            0x2077F1C,
+            0x2077F4C,
+            0x2077FE0,
+            0x2078044,
+            0x2078090,
+            0x20780E4,
+            0x207813C,
+            0x2078194,
+            0x20781EC,
+            0x2078240,
+            0x2078298,
+            0x20782F0,
+            0x2078348,
+            0x20783A8,
+            0x2078408,
+            0x2078468,
+            0x20784C8,
+            0x2078528,
+            0x2078588,
+            0x20785E8,
+            0x2078648,
+            0x20786A8,
+            0x2078708,
+            0x2078768,
+            0x2078808,
+            0x2078850,
+            0x2078898,
+            0x20788DC,
+            0x20788F4,
+            0x2078934,
+            0x207894C,
+            0x207898C,
+            0x20789E8,
+            0x2078B28,
+            0x2078B74,
+            0x2078BA8,
+            0x2078C14,
+            0x2078C58,
+            0x2078C7C,
+            0x20793C4,
+            0x20794E8,
+            0x2079630,
+            0x20798F8,
+            0x20799F4,
+            0x207A014,
+            0x207A01C,
+            0x207B27C,
+            0x207BB68,
+            0x207BB7C,
+            0x207BB90,
+            0x207BBA8,
+            0x207BBBC,
+            0x207BBD4,
+            0x207BBE0,
+            0x207BDA0,
+            0x207BE24,
+            0x207BFB8,
+            0x207BFC8,
+            0x207C650,
+            0x207C678,
+            0x207C6AC,
+            0x207C6C8,
+            0x207C6F0,
+            0x207C74C,
+            0x207C7A4,
+            0x207C860,
+            0x207C9E0,
+            0x207F77C,
+            0x2080034,
+            0x2080130,
+            0x2080254,
+            0x20868F4,
+            0x2087554,
+            0x208758C,
+            0x20875A0,
+            0x20875BC,
+            0x2087634,
+            0x2087654,
+            0x20876A0,
+            0x20876B4,
+            0x20876E0,
+            0x2087720,
+            0x208900C,
+            0x2089830,
+            0x2089874,
+            0x20898DC,
+            0x20898F4,
+            0x208991C,
+            0x2089A10,
+            0x2089A2C,
+            0x2089AF4,
+            0x2089B44,
+            0x2089B74,
+            0x2089BC4,
+            0x2089CD8,
+            0x2089D0C,
+            0x2089D48,
+            0x2089E08,
+            0x208B780,
+            0x208E260,
+            0x208E578,
+            0x208E67C,
+            0x208E708,
+            0x208E748,
+            0x208E784,
+            0x208EAE8,
+            0x208EC9C,
+            0x208F050,
+            0x208F274,
+            0x208F30C,
+            0x208F3B0,
+            0x208F44C,
+            0x208F4D8,
+            0x208F564,
+            0x208F5CC,
+            0x208F984,
+            0x208FA08,
+            0x208FA3C,
+            0x208FA84,
+            0x208FACC,
+            0x208FCAC,
+            0x208FD9C,
+            0x2090014,
+            0x2090024,
+            0x20901D4,
+            0x20901E0,
+            0x209021C,
+            0x209023C,
+            0x2090448,
+            0x2090450,
+            0x209062C,
+            0x2090644,
+            0x2090B88,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1,
+            1093,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1094,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1095,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            330,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1096,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            266,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1097,
+            1098,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1099,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1100,
+            1101,
+            1101,
+            1102,
+            1103,
+            1104,
+            1100,
+            1100,
+            1105,
+            1100,
+            1106,
+            1107,
+            1108,
+            1109,
+            1110,
+            1111,
+            1112,
+            1112,
+            1112,
+            1112,
+            1112,
+            1112,
+            1112,
+            1112,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1113,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1114,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1115,
+            1116,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1117,
+            1,
+            1,
+            1118,
+            1119,
+            1120,
+            1121,
+            1122,
+            1123,
+            1124,
+            1125,
+            1126,
+            1127,
+            1128,
+            1129,
+            1130,
+            1131,
+            1132,
+            1133,
+            1134,
+            1135,
+            1136,
+            1137,
+            1138,
+            1139,
+            1140,
+            1141,
+            1142,
+            1143,
+            1144,
+            1145,
+            1146,
+            1147,
+            1148,
+            1149,
+            1150,
+            1151,
+            1152,
+            1153,
+            1154,
+            1155,
+            1156,
+            1157,
+            1158,
+            1159,
+            1160,
+            1161,
+            1162,
+            1163,
+            1164,
+            1165,
+            1166,
+            1167,
+            1168,
+            1169,
+            1170,
+            1171,
+            1172,
+            1173,
+            1174,
+            1175,
+            1176,
+            1177,
+            1178,
+            1179,
+            1180,
+            1181,
+            1182,
+            1183,
+            1184,
+            1185,
+            1186,
+            1187,
+            1188,
+            1189,
+            1190,
+            1191,
+            1192,
+            1193,
+            1194,
+            1195,
+            1196,
+            1197,
+            1198,
+            1199,
+            1200,
+            1201,
+            1202,
+            1203,
+            1204,
+            1205,
+            1206,
+            1207,
+            1208,
+            1209,
+            1210,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
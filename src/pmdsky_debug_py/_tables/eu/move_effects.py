@@ -0,0 +1,1663 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the move_effects section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "DoMoveDamage",
+        "DoMoveIronTail",
+        "DoMoveDamageMultihitUntilMiss",
+        "DoMoveYawn",
+        "DoMoveSleep",
+        "DoMoveNightmare",
+        "DoMoveMorningSun",
+        "DoMoveVitalThrow",
+        "DoMoveDig",
+        "DoMoveSweetScent",
+        "DoMoveCharm",
+        "DoMoveRainDance",
+        "DoMoveHail",
+        "DoMoveHealStatus",
+        "DoMoveBubble",
+        "DoMoveEncore",
+        "DoMoveRage",
+        "DoMoveSuperFang",
+        "DoMovePainSplit",
+        "DoMoveTorment",
+        "DoMoveStringShot",
+        "DoMoveSwagger",
+        "DoMoveSnore",
+        "DoMoveScreech",
+        "DoMoveDamageCringe30",
+        "DoMoveWeatherBall",
+        "DoMoveWhirlpool",
+        "DoMoveFakeTears",
+        "DoMoveSpite",
+        "DoMoveFocusEnergy",
+        "DoMoveSmokescreen",
+        "DoMoveMirrorMove",
+        "DoMoveOverheat",
+        "DoMoveAuroraBeam",
+        "DoMoveMemento",
+        "DoMoveOctazooka",
+        "DoMoveFlatter",
+        "DoMoveWillOWisp",
+        "DoMoveReturn",
+        "DoMoveGrudge",
+        "DoMoveCounter",
+        "DoMoveDamageBurn10FlameWheel",
+        "DoMoveDamageBurn10",
+        "DoMoveExpose",
+        "DoMoveDoubleTeam",
+        "DoMoveGust",
+        "DoMoveBoostDefense1",
+        "DoMoveParalyze",
+        "DoMoveBoostAttack1",
+        "DoMoveRazorWind",
+        "DoMoveBide",
+        "DoMoveBideUnleash",
+        "DoMoveCrunch",
+        "DoMoveDamageCringe20",
+        "DoMoveDamageParalyze20",
+        "DoMoveEndeavor",
+        "DoMoveFacade",
+        "DoMoveDamageLowerSpeed20",
+        "DoMoveBrickBreak",
+        "DoMoveDamageLowerSpeed100",
+        "DoMoveFocusPunch",
+        "DoMoveDamageDrain",
+        "DoMoveReversal",
+        "DoMoveSmellingSalt",
+        "DoMoveMetalSound",
+        "DoMoveTickle",
+        "DoMoveShadowHold",
+        "DoMoveHaze",
+        "DoMoveDamageMultihitFatigue",
+        "DoMoveDamageWeightDependent",
+        "DoMoveDamageBoostAllStats",
+        "DoMoveSynthesis",
+        "DoMoveBoostSpeed1",
+        "DoMoveRapidSpin",
+        "DoMoveSureShot",
+        "DoMoveCosmicPower",
+        "DoMoveSkyAttack",
+        "DoMoveDamageFreeze15",
+        "DoMoveMeteorMash",
+        "DoMoveEndure",
+        "DoMoveLowerSpeed1",
+        "DoMoveDamageConfuse10",
+        "DoMovePsywave",
+        "DoMoveDamageLowerDefensiveStatVariable",
+        "DoMovePsychoBoost",
+        "DoMoveUproar",
+        "DoMoveWaterSpout",
+        "DoMovePsychUp",
+        "DoMoveDamageWithRecoil",
+        "EntityIsValidMoveEffects",
+        "DoMoveRecoverHp",
+        "DoMoveEarthquake",
+        "GetNaturePowerVariant",
+        "DoMoveNaturePower",
+        "DoMoveDamageParalyze10",
+        "DoMoveSelfdestruct",
+        "DoMoveShadowBall",
+        "DoMoveCharge",
+        "DoMoveThunderbolt",
+        "DoMoveMist",
+        "DoMoveFissure",
+        "DoMoveDamageCringe10",
+        "DoMoveSafeguard",
+        "DoMoveAbsorb",
+        "DefenderAbilityIsActiveMoveEffects",
+        "DoMoveSkillSwap",
+        "DoMoveSketch",
+        "DoMoveHeadbutt",
+        "DoMoveDoubleEdge",
+        "DoMoveSandstorm",
+        "DoMoveLowerAccuracy1",
+        "DoMoveDamagePoison40",
+        "DoMoveGrowth",
+        "DoMoveSacredFire",
+        "DoMoveOhko",
+        "DoMoveSolarBeam",
+        "DoMoveSonicBoom",
+        "DoMoveFly",
+        "DoMoveExplosion",
+        "DoMoveDive",
+        "DoMoveWaterfall",
+        "DoMoveDamageLowerAccuracy40",
+        "DoMoveStockpile",
+        "DoMoveTwister",
+        "DoMoveTwineedle",
+        "DoMoveRecoverHpTeam",
+        "DoMoveMinimize",
+        "DoMoveSeismicToss",
+        "DoMoveConfuse",
+        "DoMoveTaunt",
+        "DoMoveMoonlight",
+        "DoMoveHornDrill",
+        "DoMoveSwordsDance",
+        "DoMoveConversion",
+        "DoMoveConversion2",
+        "DoMoveHelpingHand",
+        "DoMoveBoostDefense2",
+        "DoMoveWarp",
+        "DoMoveThundershock",
+        "DoMoveThunderWave",
+        "DoMoveZapCannon",
+        "DoMoveBlock",
+        "DoMovePoison",
+        "DoMoveToxic",
+        "DoMovePoisonFang",
+        "DoMoveDamagePoison18",
+        "DoMoveJumpKick",
+        "DoMoveBounce",
+        "DoMoveHiJumpKick",
+        "DoMoveTriAttack",
+        "DoMoveSwapItems",
+        "DoMoveTripleKick",
+        "DoMoveSport",
+        "DoMoveMudSlap",
+        "DoMoveDamageStealItem",
+        "DoMoveAmnesia",
+        "DoMoveNightShade",
+        "DoMoveGrowl",
+        "DoMoveSurf",
+        "DoMoveRolePlay",
+        "DoMoveSunnyDay",
+        "DoMoveLowerDefense1",
+        "DoMoveWish",
+        "DoMoveFakeOut",
+        "DoMoveSleepTalk",
+        "DoMovePayDay",
+        "DoMoveAssist",
+        "DoMoveRest",
+        "DoMoveIngrain",
+        "DoMoveSwallow",
+        "DoMoveCurse",
+        "DoMoveSuperpower",
+        "DoMoveSteelWing",
+        "DoMoveSpitUp",
+        "DoMoveDynamicPunch",
+        "DoMoveKnockOff",
+        "DoMoveSplash",
+        "DoMoveSetDamage",
+        "DoMoveBellyDrum",
+        "DoMoveLightScreen",
+        "DoMoveSecretPower",
+        "DoMoveDamageConfuse30",
+        "DoMoveBulkUp",
+        "DoMovePause",
+        "DoMoveFeatherDance",
+        "DoMoveBeatUp",
+        "DoMoveBlastBurn",
+        "DoMoveCrushClaw",
+        "DoMoveBlazeKick",
+        "DoMovePresent",
+        "DoMoveEruption",
+        "DoMoveTransform",
+        "DoMovePoisonTail",
+        "DoMoveBlowback",
+        "DoMoveCamouflage",
+        "DoMoveTailGlow",
+        "DoMoveDamageConstrict10",
+        "DoMovePerishSong",
+        "DoMoveWrap",
+        "DoMoveSpikes",
+        "DoMoveMagnitude",
+        "DoMoveMagicCoat",
+        "DoMoveProtect",
+        "DoMoveDefenseCurl",
+        "DoMoveDecoy",
+        "DoMoveMistBall",
+        "DoMoveDestinyBond",
+        "DoMoveMirrorCoat",
+        "DoMoveCalmMind",
+        "DoMoveHiddenPower",
+        "DoMoveMetalClaw",
+        "DoMoveAttract",
+        "DoMoveCopycat",
+        "DoMoveFrustration",
+        "DoMoveLeechSeed",
+        "DoMoveMetronome",
+        "DoMoveDreamEater",
+        "DoMoveSnatch",
+        "DoMoveRecycle",
+        "DoMoveReflect",
+        "DoMoveDragonRage",
+        "DoMoveDragonDance",
+        "DoMoveSkullBash",
+        "DoMoveDamageLowerSpecialDefense50",
+        "DoMoveStruggle",
+        "DoMoveRockSmash",
+        "DoMoveSeeTrap",
+        "DoMoveTakeaway",
+        "DoMoveRebound",
+        "DoMoveSwitchPositions",
+        "DoMoveStayAway",
+        "DoMoveCleanse",
+        "DoMoveSiesta",
+        "DoMoveTwoEdge",
+        "DoMoveNoMove",
+        "DoMoveScan",
+        "DoMovePowerEars",
+        "DoMoveTransfer",
+        "DoMoveSlowDown",
+        "DoMoveSearchlight",
+        "DoMovePetrify",
+        "DoMovePounce",
+        "DoMoveTrawl",
+        "DoMoveEscape",
+        "DoMoveDrought",
+        "DoMoveTrapBuster",
+        "DoMoveWildCall",
+        "DoMoveInvisify",
+        "DoMoveOneShot",
+        "DoMoveHpGauge",
+        "DoMoveVacuumCut",
+        "DoMoveReviver",
+        "DoMoveShocker",
+        "DoMoveEcho",
+        "DoMoveFamish",
+        "DoMoveOneRoom",
+        "DoMoveFillIn",
+        "DoMoveTrapper",
+        "DoMoveItemize",
+        "DoMoveHurl",
+        "DoMoveMobile",
+        "DoMoveSeeStairs",
+        "DoMoveLongToss",
+        "DoMovePierce",
+        "DoMoveHammerArm",
+        "DoMoveAquaRing",
+        "DoMoveGastroAcid",
+        "DoMoveHealingWish",
+        "DoMoveCloseCombat",
+        "DoMoveLuckyChant",
+        "DoMoveGuardSwap",
+        "DoMoveHealOrder",
+        "DoMoveHealBlock",
+        "DoMoveThunderFang",
+        "DoMoveDefog",
+        "DoMoveTrumpCard",
+        "DoMoveIceFang",
+        "DoMovePsychoShift",
+        "DoMoveEmbargo",
+        "DoMoveBrine",
+        "DoMoveNaturalGift",
+        "DoMoveGyroBall",
+        "DoMoveShadowForce",
+        "DoMoveGravity",
+        "DoMoveStealthRock",
+        "DoMoveChargeBeam",
+        "DoMoveDamageEatItem",
+        "DoMoveAcupressure",
+        "DoMoveMagnetRise",
+        "DoMoveToxicSpikes",
+        "DoMoveLastResort",
+        "DoMoveTrickRoom",
+        "DoMoveWorrySeed",
+        "DoMoveDamageHpDependent",
+        "DoMoveHeartSwap",
+        "DoMoveRoost",
+        "DoMovePowerSwap",
+        "DoMovePowerTrick",
+        "DoMoveFeint",
+        "DoMoveFlareBlitz",
+        "DoMoveDefendOrder",
+        "DoMoveFireFang",
+        "DoMoveLunarDance",
+        "DoMoveMiracleEye",
+        "DoMoveWakeUpSlap",
+        "DoMoveMetalBurst",
+        "DoMoveHeadSmash",
+        "DoMoveCaptivate",
+        "DoMoveLeafStorm",
+        "DoMoveDracoMeteor",
+        "DoMoveRockPolish",
+        "DoMoveNastyPlot",
+        "DoMoveTag0x1AB",
+        "DoMoveTag0x1A6",
+        "DoMoveTag0x1A7",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0x24,
+            0xA4,
+            0x104,
+            0x140,
+            0x17C,
+            0x1B4,
+            0x1F4,
+            0x204,
+            0x2C8,
+            0x2E8,
+            0x310,
+            0x36C,
+            0x3C8,
+            0x3E0,
+            0x44C,
+            0x460,
+            0x4A4,
+            0x55C,
+            0x648,
+            0x790,
+            0x7A8,
+            0x7E4,
+            0x888,
+            0x8B0,
+            0x91C,
+            0x990,
+            0xA18,
+            0xA4C,
+            0xAFC,
+            0xB0C,
+            0xB48,
+            0xB6C,
+            0xBD0,
+            0xC4C,
+            0xCB4,
+            0xD28,
+            0xD64,
+            0xE00,
+            0xEE4,
+            0xEF4,
+            0xF08,
+            0xF90,
+            0x1018,
+            0x1044,
+            0x1060,
+            0x10A0,
+            0xFFFFFFFF,
+            0x10D8,
+            0x10F8,
+            0x1188,
+            0x11CC,
+            0x1274,
+            0x12F4,
+            0x1360,
+            0x13CC,
+            0x148C,
+            0x14CC,
+            0x1538,
+            0x15A8,
+            0x160C,
+            0x1698,
+            0x17D8,
+            0x188C,
+            0x18F4,
+            0x1928,
+            0x1984,
+            0x1998,
+            0x19AC,
+            0x19F8,
+            0x1A44,
+            0x1B28,
+            0x1B68,
+            0x1B80,
+            0x1BEC,
+            0x1C24,
+            0x1C68,
+            0x1D34,
+            0x1D9C,
+            0x1E24,
+            0x1E34,
+            0x1E4C,
+            0x1EB8,
+            0x1F1C,
+            0x1FA4,
+            0x2014,
+            0x2024,
+            0x20D8,
+            0x2178,
+            0xFFFFFFFF,
+            0x2274,
+            0x22B8,
+            0x2318,
+            0x2354,
+            0x23B0,
+            0x241C,
+            0x248C,
+            0x250C,
+            0x256C,
+            0x25D8,
+            0x25E8,
+            0x2700,
+            0x276C,
+            0x277C,
+            0xFFFFFFFF,
+            0x28DC,
+            0x29D8,
+            0x2B08,
+            0x2B74,
+            0x2C3C,
+            0x2C98,
+            0x2CB8,
+            0x2D24,
+            0x2D44,
+            0x2DCC,
+            0x2EB8,
+            0x2F88,
+            0x3028,
+            0x30B8,
+            0x3110,
+            0x31D8,
+            0x3244,
+            0x32B8,
+            0x3310,
+            0x33A0,
+            0x3438,
+            0x3480,
+            0x349C,
+            0x3610,
+            0x3628,
+            0x363C,
+            0x367C,
+            0x3778,
+            0x3798,
+            0x38A8,
+            0x38B8,
+            0x391C,
+            0x393C,
+            0x3954,
+            0x39C0,
+            0x3A34,
+            0x3A98,
+            0x3AAC,
+            0x3AC4,
+            0x3ADC,
+            0x3B48,
+            0x3BB4,
+            0x3CE0,
+            0x3DAC,
+            0x3ED8,
+            0x3F94,
+            0x41BC,
+            0x41F8,
+            0x4224,
+            0x4290,
+            0x429C,
+            0x42BC,
+            0x435C,
+            0x438C,
+            0x43CC,
+            0x4464,
+            0x44C0,
+            0x44F0,
+            0x4500,
+            0x456C,
+            0x4584,
+            0x4640,
+            0x4658,
+            0x46C4,
+            0x46D4,
+            0x472C,
+            0x4768,
+            0x47F0,
+            0x4884,
+            0x48CC,
+            0x4930,
+            0x4B30,
+            0x4E88,
+            0x4E98,
+            0x4F4C,
+            0x4F5C,
+            0x5134,
+            0x51A0,
+            0x51E4,
+            0x5234,
+            0x5268,
+            0x535C,
+            0x53A8,
+            0x5428,
+            0x54B0,
+            0x55AC,
+            0x5690,
+            0x56D8,
+            0x5744,
+            0x575C,
+            0x580C,
+            0x582C,
+            0x58E8,
+            0x58FC,
+            0x590C,
+            0x597C,
+            0x5A04,
+            0x5A14,
+            0x5A24,
+            0x5A44,
+            0x5A64,
+            0x5AE4,
+            0x5B18,
+            0x5B28,
+            0x5B6C,
+            0x5B84,
+            0x5C18,
+            0x5C8C,
+            0x5D94,
+            0x5E7C,
+            0x5EAC,
+            0x5F0C,
+            0x607C,
+            0x608C,
+            0x61C0,
+            0x61D0,
+            0x6270,
+            0x62AC,
+            0x633C,
+            0x63EC,
+            0x64C4,
+            0x6548,
+            0x6558,
+            0x676C,
+            0x6780,
+            0x67A8,
+            0x67C0,
+            0x68FC,
+            0x6938,
+            0x6A60,
+            0x6A74,
+            0x6A84,
+            0x6A94,
+            0x6C5C,
+            0x6C74,
+            0x6C84,
+            0x6C94,
+            0x6CA8,
+            0x6CB8,
+            0x6D50,
+            0x6D60,
+            0x6F0C,
+            0x6FD8,
+            0x6FEC,
+            0x7088,
+            0x7098,
+            0x70C4,
+            0x70DC,
+            0x70F4,
+            0x719C,
+            0x71BC,
+            0x71CC,
+            0x7338,
+            0x7390,
+            0x7424,
+            0x7434,
+            0x7444,
+            0x7454,
+            0x7464,
+            0x7474,
+            0x74B8,
+            0x74C8,
+            0x74E0,
+            0x7530,
+            0x75B0,
+            0x75C0,
+            0x7620,
+            0x7648,
+            0x7660,
+            0x76F4,
+            0x77A8,
+            0x7868,
+            0x78F8,
+            0x7918,
+            0x7930,
+            0x7980,
+            0x7A40,
+            0x7AA8,
+            0x7B44,
+            0x7B54,
+            0x7BC4,
+            0x7C2C,
+            0x7CE8,
+            0x7E6C,
+            0x7E7C,
+            0x7EEC,
+            0x7F90,
+            0x7FC4,
+            0x809C,
+            0x8150,
+            0x81E0,
+            0x829C,
+            0x82FC,
+            0x8310,
+            0x8348,
+            0x848C,
+            0x84D0,
+            0x8580,
+            0x85E8,
+            0x8618,
+            0x86A4,
+            0x86B8,
+            0x8778,
+            0x883C,
+            0x8894,
+            0x88F8,
+            0x892C,
+            0x894C,
+            0x8968,
+            0x89AC,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0x232684C,
+            0x23268CC,
+            0x232692C,
+            0x2326968,
+            0x23269A4,
+            0x23269DC,
+            0x2326A1C,
+            0x2326A2C,
+            0x2326AF0,
+            0x2326B10,
+            0x2326B38,
+            0x2326B94,
+            0x2326BF0,
+            0x2326C08,
+            0x2326C74,
+            0x2326C88,
+            0x2326CCC,
+            0x2326D84,
+            0x2326E70,
+            0x2326FB8,
+            0x2326FD0,
+            0x232700C,
+            0x23270B0,
+            0x23270D8,
+            0x2327144,
+            0x23271B8,
+            0x2327240,
+            0x2327274,
+            0x2327324,
+            0x2327334,
+            0x2327370,
+            0x2327394,
+            0x23273F8,
+            0x2327474,
+            0x23274DC,
+            0x2327550,
+            0x232758C,
+            0x2327628,
+            0x232770C,
+            0x232771C,
+            0x2327730,
+            0x23277B8,
+            0x2327840,
+            0x232786C,
+            0x2327888,
+            0x23278C8,
+            0xFFFFFFFF,
+            0x2327900,
+            0x2327920,
+            0x23279B0,
+            0x23279F4,
+            0x2327A9C,
+            0x2327B1C,
+            0x2327B88,
+            0x2327BF4,
+            0x2327CB4,
+            0x2327CF4,
+            0x2327D60,
+            0x2327DD0,
+            0x2327E34,
+            0x2327EC0,
+            0x2328000,
+            0x23280B4,
+            0x232811C,
+            0x2328150,
+            0x23281AC,
+            0x23281C0,
+            0x23281D4,
+            0x2328220,
+            0x232826C,
+            0x2328350,
+            0x2328390,
+            0x23283A8,
+            0x2328414,
+            0x232844C,
+            0x2328490,
+            0x232855C,
+            0x23285C4,
+            0x232864C,
+            0x232865C,
+            0x2328674,
+            0x23286E0,
+            0x2328744,
+            0x23287CC,
+            0x232883C,
+            0x232884C,
+            0x2328900,
+            0x23289A0,
+            0xFFFFFFFF,
+            0x2328A9C,
+            0x2328AE0,
+            0x2328B40,
+            0x2328B7C,
+            0x2328BD8,
+            0x2328C44,
+            0x2328CB4,
+            0x2328D34,
+            0x2328D94,
+            0x2328E00,
+            0x2328E10,
+            0x2328F28,
+            0x2328F94,
+            0x2328FA4,
+            0xFFFFFFFF,
+            0x2329104,
+            0x2329200,
+            0x2329330,
+            0x232939C,
+            0x2329464,
+            0x23294C0,
+            0x23294E0,
+            0x232954C,
+            0x232956C,
+            0x23295F4,
+            0x23296E0,
+            0x23297B0,
+            0x2329850,
+            0x23298E0,
+            0x2329938,
+            0x2329A00,
+            0x2329A6C,
+            0x2329AE0,
+            0x2329B38,
+            0x2329BC8,
+            0x2329C60,
+            0x2329CA8,
+            0x2329CC4,
+            0x2329E38,
+            0x2329E50,
+            0x2329E64,
+            0x2329EA4,
+            0x2329FA0,
+            0x2329FC0,
+            0x232A0D0,
+            0x232A0E0,
+            0x232A144,
+            0x232A164,
+            0x232A17C,
+            0x232A1E8,
+            0x232A25C,
+            0x232A2C0,
+            0x232A2D4,
+            0x232A2EC,
+            0x232A304,
+            0x232A370,
+            0x232A3DC,
+            0x232A508,
+            0x232A5D4,
+            0x232A700,
+            0x232A7BC,
+            0x232A9E4,
+            0x232AA20,
+            0x232AA4C,
+            0x232AAB8,
+            0x232AAC4,
+            0x232AAE4,
+            0x232AB84,
+            0x232ABB4,
+            0x232ABF4,
+            0x232AC8C,
+            0x232ACE8,
+            0x232AD18,
+            0x232AD28,
+            0x232AD94,
+            0x232ADAC,
+            0x232AE68,
+            0x232AE80,
+            0x232AEEC,
+            0x232AEFC,
+            0x232AF54,
+            0x232AF90,
+            0x232B018,
+            0x232B0AC,
+            0x232B0F4,
+            0x232B158,
+            0x232B358,
+            0x232B6B0,
+            0x232B6C0,
+            0x232B774,
+            0x232B784,
+            0x232B95C,
+            0x232B9C8,
+            0x232BA0C,
+            0x232BA5C,
+            0x232BA90,
+            0x232BB84,
+            0x232BBD0,
+            0x232BC50,
+            0x232BCD8,
+            0x232BDD4,
+            0x232BEB8,
+            0x232BF00,
+            0x232BF6C,
+            0x232BF84,
+            0x232C034,
+            0x232C054,
+            0x232C110,
+            0x232C124,
+            0x232C134,
+            0x232C1A4,
+            0x232C22C,
+            0x232C23C,
+            0x232C24C,
+            0x232C26C,
+            0x232C28C,
+            0x232C30C,
+            0x232C340,
+            0x232C350,
+            0x232C394,
+            0x232C3AC,
+            0x232C440,
+            0x232C4B4,
+            0x232C5BC,
+            0x232C6A4,
+            0x232C6D4,
+            0x232C734,
+            0x232C8A4,
+            0x232C8B4,
+            0x232C9E8,
+            0x232C9F8,
+            0x232CA98,
+            0x232CAD4,
+            0x232CB64,
+            0x232CC14,
+            0x232CCEC,
+            0x232CD70,
+            0x232CD80,
+            0x232CF94,
+            0x232CFA8,
+            0x232CFD0,
+            0x232CFE8,
+            0x232D124,
+            0x232D160,
+            0x232D288,
+            0x232D29C,
+            0x232D2AC,
+            0x232D2BC,
+            0x232D484,
+            0x232D49C,
+            0x232D4AC,
+            0x232D4BC,
+            0x232D4D0,
+            0x232D4E0,
+            0x232D578,
+            0x232D588,
+            0x232D734,
+            0x232D800,
+            0x232D814,
+            0x232D8B0,
+            0x232D8C0,
+            0x232D8EC,
+            0x232D904,
+            0x232D91C,
+            0x232D9C4,
+            0x232D9E4,
+            0x232D9F4,
+            0x232DB60,
+            0x232DBB8,
+            0x232DC4C,
+            0x232DC5C,
+            0x232DC6C,
+            0x232DC7C,
+            0x232DC8C,
+            0x232DC9C,
+            0x232DCE0,
+            0x232DCF0,
+            0x232DD08,
+            0x232DD58,
+            0x232DDD8,
+            0x232DDE8,
+            0x232DE48,
+            0x232DE70,
+            0x232DE88,
+            0x232DF1C,
+            0x232DFD0,
+            0x232E090,
+            0x232E120,
+            0x232E140,
+            0x232E158,
+            0x232E1A8,
+            0x232E268,
+            0x232E2D0,
+            0x232E36C,
+            0x232E37C,
+            0x232E3EC,
+            0x232E454,
+            0x232E510,
+            0x232E694,
+            0x232E6A4,
+            0x232E714,
+            0x232E7B8,
+            0x232E7EC,
+            0x232E8C4,
+            0x232E978,
+            0x232EA08,
+            0x232EAC4,
+            0x232EB24,
+            0x232EB38,
+            0x232EB70,
+            0x232ECB4,
+            0x232ECF8,
+            0x232EDA8,
+            0x232EE10,
+            0x232EE40,
+            0x232EECC,
+            0x232EEE0,
+            0x232EFA0,
+            0x232F064,
+            0x232F0BC,
+            0x232F120,
+            0x232F154,
+            0x232F174,
+            0x232F190,
+            0x232F1D4,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1211,
+            1212,
+            1213,
+            1214,
+            1215,
+            1216,
+            1217,
+            1218,
+            1219,
+            1220,
+            1221,
+            1222,
+            1223,
+            1224,
+            1225,
+            1226,
+            1227,
+            1228,
+            1229,
+            1230,
+            1231,
+            1232,
+            1233,
+            1234,
+            1235,
+            1236,
+            1237,
+            1238,
+            1239,
+            1240,
+            1241,
+            1242,
+            1243,
+            1244,
+            1245,
+            1246,
+            1247,
+            1248,
+            1249,
+            1250,
+            1251,
+            1252,
+            1253,
+            1254,
+            1255,
+            1256,
+            1257,
+            1258,
+            1259,
+            1260,
+            1261,
+            1262,
+            1263,
+            1264,
+            1265,
+            1266,
+            1267,
+            1268,
+            1269,
+            1270,
+            1271,
+            1272,
+            1273,
+            1274,
+            1275,
+            1276,
+            1277,
+            1278,
+            1279,
+            1280,
+            1281,
+            1282,
+            1283,
+            1284,
+            1285,
+            1286,
+            1287,
+            1288,
+            1289,
+            1290,
+            1291,
+            1292,
+            1293,
+            1294,
+            1295,
+            1296,
+            1297,
+            1298,
+            1299,
+            1300,
+            1301,
+            1302,
+            1303,
+            1304,
+            1305,
+            1306,
+            1307,
+            1308,
+            1309,
+            1310,
+            1311,
+            1312,
+            1313,
+            1314,
+            1315,
+            1316,
+            1317,
+            1318,
+            1319,
+            1320,
+            1321,
+            1322,
+            1323,
+            1324,
+            1325,
+            1326,
+            1327,
+            1328,
+            1329,
+            1330,
+            1331,
+            1332,
+            1333,
+            1334,
+            1335,
+            1336,
+            1337,
+            1338,
+            1339,
+            1340,
+            1341,
+            1342,
+            1343,
+            1344,
+            1345,
+            1346,
+            1347,
+            1348,
+            1349,
+            1350,
+            1351,
+            1352,
+            1353,
+            1354,
+            1355,
+            1356,
+            1357,
+            1358,
+            1359,
+            1360,
+            1361,
+            1362,
+            1363,
+            1364,
+            1365,
+            1366,
+            1367,
+            1368,
+            1369,
+            1370,
+            1371,
+            1372,
+            1373,
+            1374,
+            1375,
+            1376,
+            1377,
+            1378,
+            1379,
+            1380,
+            1381,
+            1382,
+            1383,
+            1384,
+            1385,
+            1386,
+            1387,
+            1388,
+            1389,
+            1390,
+            1391,
+            1392,
+            1393,
+            1394,
+            1395,
+            1396,
+            1397,
+            1398,
+            1399,
+            1400,
+            1401,
+            1402,
+            1403,
+            1404,
+            1405,
+            1406,
+            1407,
+            1408,
+            1409,
+            1410,
+            1411,
+            1412,
+            1413,
+            1414,
+            1415,
+            1416,
+            1417,
+            1418,
+            1419,
+            1420,
+            1421,
+            1422,
+            1423,
+            1424,
+            1425,
+            1426,
+            1427,
+            1428,
+            1429,
+            1430,
+            1431,
+            1432,
+            1433,
+            1434,
+            1435,
+            1436,
+            1437,
+            1438,
+            1439,
+            1440,
+            1441,
+            1442,
+            1443,
+            1444,
+            1445,
+            1446,
+            1447,
+            1448,
+            1449,
+            1450,
+            1451,
+            1452,
+            1453,
+            1454,
+            1455,
+            1456,
+            1457,
+            1458,
+            1459,
+            1460,
+            1461,
+            1462,
+            1463,
+            1464,
+            1465,
+            1466,
+            1467,
+            1468,
+            1469,
+            1470,
+            1471,
+            1472,
+            1473,
+            1474,
+            1475,
+            1476,
+            1477,
+            1478,
+            1479,
+            1480,
+            1481,
+            1482,
+            1483,
+            1484,
+            1485,
+            1486,
+            1487,
+            1488,
+            1489,
+            1490,
+            1491,
+            1492,
+            1493,
+            1494,
+            1495,
+            1496,
+            1497,
+            1498,
+            1499,
+            1500,
+            1501,
+            1502,
+            1503,
+            1504,
+            1505,
+            1506,
+            1507,
+            1508,
+            1509,
+            1510,
+            1511,
+            1512,
+            1513,
+            1514,
+            1515,
+            1516,
+            1517,
+            1518,
+            1519,
+            1520,
+            1521,
+            1522,
+            1523,
+            1524,
+            1525,
+        ),
+    ),
+    c_types=None,
+    multi={
+        0: (
+            (0x0, 0x4744, 0x5AF4, 0x7FA0),
+            (0x2326828, 0x232AF6C, 0x232C31C, 0x232E7C8),
+        ),
+        47: ((0x10C0, 0x2474, 0x5678), (0x23278E8, 0x2328C9C, 0x232BEA0)),
+        89: (
+            (0x2250, 0x461C, 0x6748, 0x8468),
+            (0x2328A78, 0x232AE44, 0x232CF70, 0x232EC90),
+        ),
+        104: (
+            (0x2878, 0x4158, 0x6018, 0x8038),
+            (0x23290A0, 0x232A980, 0x232C840, 0x232E860),
+        ),
+    },
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "MAX_HP_CAP_MOVE_EFFECTS",
+        "LUNAR_DANCE_PP_RESTORATION",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1526,
+            1527,
+        ),
+    ),
+    c_types=(
+        "int32_t",
+        "int32_t",
+    ),
+    multi={},
+)
@@ -0,0 +1,190 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay1 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "CreateMainMenus",
+        "AddMainMenuOption",
+        "AddSubMenuOption",
+        "ProcessContinueScreenContents",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x7B88,
+            0x7FFC,
+            0x80D4,
+            0x9998,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x23318C8,
+            0x2331D3C,
+            0x2331E14,
+            0x23336D8,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1529,
+            1530,
+            1531,
+            1532,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "PRINTS_STRINGS",
+        "PRINTS_STRUCT",
+        "MAIN_MENU_WINDOW_PARAMS_1",
+        "MAIN_MENU_WINDOW_PARAMS_2",
+        "MAIN_MENU_WINDOW_PARAMS_3",
+        "MAIN_MENU_WINDOW_PARAMS_4",
+        "CONTINUE_CHOICE",
+        "SUBMENU",
+        "MAIN_MENU",
+        "MAIN_MENU_WINDOW_PARAMS_5",
+        "MAIN_MENU_WINDOW_PARAMS_6",
+        "MAIN_MENU_WINDOW_PARAMS_7",
+        "MAIN_MENU_ITEMS_CONFIRM",
+        "MAIN_MENU_WINDOW_PARAMS_8",
+        "MAIN_MENU_WINDOW_PARAMS_9",
+        "MAIN_DEBUG_MENU_ITEMS_1",
+        "MAIN_MENU_WINDOW_PARAMS_10",
+        "MAIN_DEBUG_MENU_ITEMS_2",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x11B38,
+            0x11D20,
+            0x11F24,
+            0x11F34,
+            0x11F44,
+            0x11F54,
+            0x11F74,
+            0x11F94,
+            0x11FDC,
+            0x12128,
+            0x12138,
+            0x12148,
+            0x12158,
+            0x121DC,
+            0x121FC,
+            0x1221C,
+            0x1227C,
+            0x1229C,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x233B878,
+            0x233BA60,
+            0x233BC64,
+            0x233BC74,
+            0x233BC84,
+            0x233BC94,
+            0x233BCB4,
+            0x233BCD4,
+            0x233BD1C,
+            0x233BE68,
+            0x233BE78,
+            0x233BE88,
+            0x233BE98,
+            0x233BF1C,
+            0x233BF3C,
+            0x233BF5C,
+            0x233BFBC,
+            0x233BFDC,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0x1E8,
+            0x1F0,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x20,
+            0x48,
+            0xA0,
+            0x10,
+            0x10,
+            0x10,
+            0x18,
+            0x10,
+            0x10,
+            0x60,
+            0x10,
+            0x38,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            266,
+            1533,
+            266,
+            266,
+            266,
+            266,
+            1,
+            1,
+            1,
+            266,
+            266,
+            266,
+            1,
+            266,
+            266,
+            1,
+            266,
+            1,
+        ),
+    ),
+    c_types=(
+        "",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[3]",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[12]",
+        "struct window_params",
+        "struct simple_menu_id_item[7]",
+    ),
+    multi={},
+)
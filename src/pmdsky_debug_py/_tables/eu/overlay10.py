@@ -0,0 +1,1326 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay10 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "CreateInventoryMenu",
+        "SetInventoryMenuState0",
+        "SetInventoryMenuState6",
+        "CloseInventoryMenu",
+        "IsInventoryMenuActive",
+        "CheckInventoryMenuField0x1A0",
+        "PopInventoryMenuField0x1A3",
+        "UpdateInventoryMenu",
+        "IsInventoryMenuState3",
+        "SprintfStatic",
+        "GetEffectAnimationField0x19",
+        "AnimationHasMoreFrames",
+        "GetEffectAnimation",
+        "GetMoveAnimation",
+        "GetSpecialMonsterMoveAnimation",
+        "GetTrapAnimation",
+        "GetItemAnimation1",
+        "GetItemAnimation2",
+        "GetMoveAnimationSpeed",
+        "DrawTeamStats",
+        "UpdateTeamStats",
+        "FreeTeamStats",
+        "FreeMapAndTeam",
+        "ProcessTeamStatsLvHp",
+        "ProcessTeamStatsNameGender",
+        "IsBackgroundTileset",
+        "InitTilesetBuffer",
+        "MainGame",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x0,
+            0x24C,
+            0x260,
+            0x274,
+            0x2E8,
+            0x308,
+            0x3D8,
+            0x3F4,
+            0x8F4,
+            0xFFFFFFFF,
+            0x1434,
+            0x2E84,
+            0x3420,
+            0x3434,
+            0x3448,
+            0x345C,
+            0x3470,
+            0x3484,
+            0x3498,
+            0x3F68,
+            0x4260,
+            0x4934,
+            0x4C64,
+            0x4CD4,
+            0x4DFC,
+            0x5B0C,
+            0x5C54,
+            0x5E24,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x22BD3C0,
+            0x22BD60C,
+            0x22BD620,
+            0x22BD634,
+            0x22BD6A8,
+            0x22BD6C8,
+            0x22BD798,
+            0x22BD7B4,
+            0x22BDCB4,
+            0xFFFFFFFF,
+            0x22BE7F4,
+            0x22C0244,
+            0x22C07E0,
+            0x22C07F4,
+            0x22C0808,
+            0x22C081C,
+            0x22C0830,
+            0x22C0844,
+            0x22C0858,
+            0x22C1328,
+            0x22C1620,
+            0x22C1CF4,
+            0x22C2024,
+            0x22C2094,
+            0x22C21BC,
+            0x22C2ECC,
+            0x22C3014,
+            0x22C31E4,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1534,
+            1535,
+            1536,
+            1537,
+            1538,
+            1539,
+            1540,
+            1541,
+            1542,
+            1543,
+            1544,
+            1545,
+            1546,
+            1547,
+            1548,
+            1549,
+            1550,
+            1551,
+            1552,
+            1553,
+            1554,
+            1555,
+            1556,
+            1557,
+            1558,
+            1559,
+            1560,
+            1561,
+        ),
+    ),
+    c_types=None,
+    multi={
+        9: ((0x9CC, 0x4DD4), (0x22BDD8C, 0x22C2194)),
+    },
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "INVENTORY_MENU_DEFAULT_WINDOW_PARAMS",
+        "FIRST_DUNGEON_WITH_MONSTER_HOUSE_TRAPS",
+        "BAD_POISON_DAMAGE_COOLDOWN",
+        "PROTEIN_STAT_BOOST",
+        "WATERFALL_CRINGE_CHANCE",
+        "AURORA_BEAM_LOWER_ATTACK_CHANCE",
+        "SPAWN_CAP_NO_MONSTER_HOUSE",
+        "OREN_BERRY_DAMAGE",
+        "IRON_TAIL_LOWER_DEFENSE_CHANCE",
+        "TWINEEDLE_POISON_CHANCE",
+        "EXTRASENSORY_CRINGE_CHANCE",
+        "ROCK_SLIDE_CRINGE_CHANCE",
+        "CRUNCH_LOWER_DEFENSE_CHANCE",
+        "FOREWARN_FORCED_MISS_CHANCE",
+        "UNOWN_STONE_DROP_CHANCE",
+        "SITRUS_BERRY_HP_RESTORATION",
+        "MUDDY_WATER_LOWER_ACCURACY_CHANCE",
+        "SILVER_WIND_BOOST_CHANCE",
+        "POISON_TAIL_POISON_CHANCE",
+        "THUNDERSHOCK_PARALYZE_CHANCE",
+        "BOUNCE_PARALYZE_CHANCE",
+        "HEADBUTT_CRINGE_CHANCE",
+        "FIRE_FANG_CRINGE_CHANCE",
+        "SACRED_FIRE_BURN_CHANCE",
+        "WHIRLPOOL_CONSTRICTION_CHANCE",
+        "EXP_ELITE_EXP_BOOST",
+        "MONSTER_HOUSE_MAX_NON_MONSTER_SPAWNS",
+        "HEAL_ORDER_HP_RESTORATION",
+        "STEEL_WING_BOOST_DEFENSE_CHANCE",
+        "GOLD_THORN_POWER",
+        "BURN_DAMAGE",
+        "POISON_DAMAGE",
+        "SPAWN_COOLDOWN",
+        "MIST_BALL_LOWER_SPECIAL_ATTACK_CHANCE",
+        "CHARGE_BEAM_BOOST_SPECIAL_ATTACK_CHANCE",
+        "ORAN_BERRY_FULL_HP_BOOST",
+        "LIFE_SEED_HP_BOOST",
+        "OCTAZOOKA_LOWER_ACCURACY_CHANCE",
+        "LUSTER_PURGE_LOWER_SPECIAL_DEFENSE_CHANCE",
+        "SUPER_LUCK_CRIT_RATE_BOOST",
+        "CONSTRICT_LOWER_SPEED_CHANCE",
+        "ICE_FANG_FREEZE_CHANCE",
+        "SMOG_POISON_CHANCE",
+        "LICK_PARALYZE_CHANCE",
+        "THUNDER_FANG_PARALYZE_CHANCE",
+        "BITE_CRINGE_CHANCE",
+        "SKY_ATTACK_CRINGE_CHANCE",
+        "ICE_FANG_CRINGE_CHANCE",
+        "BLAZE_KICK_BURN_CHANCE",
+        "FLAMETHROWER_BURN_CHANCE",
+        "DIZZY_PUNCH_CONFUSE_CHANCE",
+        "SECRET_POWER_EFFECT_CHANCE",
+        "METAL_CLAW_BOOST_ATTACK_CHANCE",
+        "TECHNICIAN_MOVE_POWER_THRESHOLD",
+        "SONICBOOM_FIXED_DAMAGE",
+        "RAIN_ABILITY_BONUS_REGEN",
+        "LEECH_SEED_HP_DRAIN",
+        "EXCLUSIVE_ITEM_EXP_BOOST",
+        "AFTERMATH_CHANCE",
+        "SET_DAMAGE_STATUS_DAMAGE",
+        "INTIMIDATOR_ACTIVATION_CHANCE",
+        "TYPE_ADVANTAGE_MASTER_CRIT_RATE",
+        "ORAN_BERRY_HP_RESTORATION",
+        "SITRUS_BERRY_FULL_HP_BOOST",
+        "SNORE_CRINGE_CHANCE",
+        "METEOR_MASH_BOOST_ATTACK_CHANCE",
+        "CRUSH_CLAW_LOWER_DEFENSE_CHANCE",
+        "BURN_DAMAGE_COOLDOWN",
+        "SHADOW_BALL_LOWER_SPECIAL_DEFENSE_CHANCE",
+        "STICK_POWER",
+        "BUBBLE_LOWER_SPEED_CHANCE",
+        "ICE_BODY_BONUS_REGEN",
+        "POWDER_SNOW_FREEZE_CHANCE",
+        "POISON_STING_POISON_CHANCE",
+        "SPAWN_COOLDOWN_THIEF_ALERT",
+        "POISON_FANG_POISON_CHANCE",
+        "WEATHER_MOVE_TURN_COUNT",
+        "THUNDER_PARALYZE_CHANCE",
+        "THUNDERBOLT_PARALYZE_CHANCE",
+        "MONSTER_HOUSE_MAX_MONSTER_SPAWNS",
+        "TWISTER_CRINGE_CHANCE",
+        "SPEED_BOOST_TURNS",
+        "FAKE_OUT_CRINGE_CHANCE",
+        "THUNDER_FANG_CRINGE_CHANCE",
+        "FLARE_BLITZ_BURN_CHANCE",
+        "FLAME_WHEEL_BURN_CHANCE",
+        "PSYBEAM_CONFUSE_CHANCE",
+        "TRI_ATTACK_STATUS_CHANCE",
+        "MIRACLE_CHEST_EXP_BOOST",
+        "WONDER_CHEST_EXP_BOOST",
+        "SPAWN_CAP_WITH_MONSTER_HOUSE",
+        "POISON_DAMAGE_COOLDOWN",
+        "LEECH_SEED_DAMAGE_COOLDOWN",
+        "THROWN_ITEM_HIT_CHANCE",
+        "GEO_PEBBLE_DAMAGE",
+        "GRAVELEROCK_DAMAGE",
+        "RARE_FOSSIL_DAMAGE",
+        "GINSENG_CHANCE_3",
+        "ZINC_STAT_BOOST",
+        "IRON_STAT_BOOST",
+        "CALCIUM_STAT_BOOST",
+        "WISH_BONUS_REGEN",
+        "DRAGON_RAGE_FIXED_DAMAGE",
+        "CORSOLA_TWIG_POWER",
+        "CACNEA_SPIKE_POWER",
+        "GOLD_FANG_POWER",
+        "SILVER_SPIKE_POWER",
+        "IRON_THORN_POWER",
+        "SCOPE_LENS_CRIT_RATE_BOOST",
+        "HEALING_WISH_HP_RESTORATION",
+        "ME_FIRST_MULTIPLIER",
+        "FACADE_DAMAGE_MULTIPLIER",
+        "IMPRISON_TURN_RANGE",
+        "SLEEP_TURN_RANGE",
+        "NIGHTMARE_TURN_RANGE",
+        "BURN_DAMAGE_MULTIPLIER",
+        "REST_TURN_RANGE",
+        "MATCHUP_SUPER_EFFECTIVE_MULTIPLIER_ERRATIC_PLAYER",
+        "MATCHUP_IMMUNE_MULTIPLIER",
+        "SPORT_CONDITION_TURN_RANGE",
+        "SURE_SHOT_TURN_RANGE",
+        "DETECT_BAND_MOVE_ACCURACY_DROP",
+        "TINTED_LENS_MULTIPLIER",
+        "SMOKESCREEN_TURN_RANGE",
+        "PERISH_SONG_TURN_RANGE",
+        "SHADOW_FORCE_DAMAGE_MULTIPLIER",
+        "DIG_DAMAGE_MULTIPLIER",
+        "DIVE_DAMAGE_MULTIPLIER",
+        "BOUNCE_DAMAGE_MULTIPLIER",
+        "POWER_PITCHER_DAMAGE_MULTIPLIER",
+        "QUICK_DODGER_MOVE_ACCURACY_DROP",
+        "MATCHUP_NOT_VERY_EFFECTIVE_MULTIPLIER",
+        "MATCHUP_SUPER_EFFECTIVE_MULTIPLIER",
+        "MATCHUP_NEUTRAL_MULTIPLIER",
+        "MATCHUP_IMMUNE_MULTIPLIER_ERRATIC_PLAYER",
+        "MATCHUP_NOT_VERY_EFFECTIVE_MULTIPLIER_ERRATIC_PLAYER",
+        "MATCHUP_NEUTRAL_MULTIPLIER_ERRATIC_PLAYER",
+        "AIR_BLADE_DAMAGE_MULTIPLIER",
+        "KECLEON_SHOP_BOOST_CHANCE_MULTIPLIER",
+        "HIDDEN_STAIRS_SPAWN_CHANCE_MULTIPLIER",
+        "YAWN_TURN_RANGE",
+        "SPEED_BOOST_TURN_RANGE",
+        "SOLARBEAM_DAMAGE_MULTIPLIER",
+        "SKY_ATTACK_DAMAGE_MULTIPLIER",
+        "RAZOR_WIND_DAMAGE_MULTIPLIER",
+        "FOCUS_PUNCH_DAMAGE_MULTIPLIER",
+        "SKULL_BASH_DAMAGE_MULTIPLIER",
+        "FLY_DAMAGE_MULTIPLIER",
+        "WEATHER_BALL_TYPE_TABLE",
+        "LAST_RESORT_DAMAGE_MULT_TABLE",
+        "SYNTHESIS_HP_RESTORATION_TABLE",
+        "ROOST_HP_RESTORATION_TABLE",
+        "MOONLIGHT_HP_RESTORATION_TABLE",
+        "MORNING_SUN_HP_RESTORATION_TABLE",
+        "REVERSAL_DAMAGE_MULT_TABLE",
+        "WATER_SPOUT_DAMAGE_MULT_TABLE",
+        "WRING_OUT_DAMAGE_MULT_TABLE",
+        "ERUPTION_DAMAGE_MULT_TABLE",
+        "WEATHER_BALL_DAMAGE_MULT_TABLE",
+        "EAT_ITEM_EFFECT_IGNORE_LIST",
+        "CASTFORM_WEATHER_ATTRIBUTE_TABLE",
+        "BAD_POISON_DAMAGE_TABLE",
+        "TYPE_MATCHUP_COMBINATOR_TABLE",
+        "OFFENSIVE_STAT_STAGE_MULTIPLIERS",
+        "DEFENSIVE_STAT_STAGE_MULTIPLIERS",
+        "NATURE_POWER_TABLE",
+        "APPLES_AND_BERRIES_ITEM_IDS",
+        "RECRUITMENT_LEVEL_BOOST_TABLE",
+        "NATURAL_GIFT_ITEM_TABLE",
+        "RANDOM_MUSIC_ID_TABLE",
+        "SHOP_ITEM_CHANCES",
+        "MALE_ACCURACY_STAGE_MULTIPLIERS",
+        "MALE_EVASION_STAGE_MULTIPLIERS",
+        "FEMALE_ACCURACY_STAGE_MULTIPLIERS",
+        "FEMALE_EVASION_STAGE_MULTIPLIERS",
+        "MUSIC_ID_TABLE",
+        "TYPE_MATCHUP_TABLE",
+        "FIXED_ROOM_MONSTER_SPAWN_STATS_TABLE",
+        "METRONOME_TABLE",
+        "TILESET_PROPERTIES",
+        "FIXED_ROOM_PROPERTIES_TABLE",
+        "TRAP_ANIMATION_INFO",
+        "ITEM_ANIMATION_INFO",
+        "MOVE_ANIMATION_INFO",
+        "EFFECT_ANIMATION_INFO",
+        "SPECIAL_MONSTER_MOVE_ANIMATION_INFO",
+        "DEFEAT_ITEM_LOSS_CHANCE",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x792C,
+            0x79A4,
+            0x79AC,
+            0x79B8,
+            0x79BC,
+            0x79C0,
+            0x79C8,
+            0x79D0,
+            0x79D8,
+            0x79DC,
+            0x79E0,
+            0x79E4,
+            0x79E8,
+            0x7A00,
+            0x7A0C,
+            0x7A10,
+            0x7A1C,
+            0x7A20,
+            0x7A24,
+            0x7A28,
+            0x7A2C,
+            0x7A30,
+            0x7A34,
+            0x7A38,
+            0x7A3C,
+            0x7A40,
+            0x7A44,
+            0x7A50,
+            0x7A5C,
+            0x7A68,
+            0x7A6C,
+            0x7A70,
+            0x7A74,
+            0x7A78,
+            0x7A88,
+            0x7A8C,
+            0x7A90,
+            0x7A98,
+            0x7AA4,
+            0x7AA8,
+            0x7AAC,
+            0x7AB0,
+            0x7AB4,
+            0x7AC0,
+            0x7AC4,
+            0x7ACC,
+            0x7AD0,
+            0x7AD4,
+            0x7AD8,
+            0x7ADC,
+            0x7AE0,
+            0x7AE4,
+            0x7AEC,
+            0x7AF4,
+            0x7B00,
+            0x7B10,
+            0x7B20,
+            0x7B24,
+            0x7B2C,
+            0x7B30,
+            0x7B50,
+            0x7B78,
+            0x7B84,
+            0x7B8C,
+            0x7B98,
+            0x7B9C,
+            0x7BA0,
+            0x7BA8,
+            0x7BB4,
+            0x7BBC,
+            0x7BC4,
+            0x7BC8,
+            0x7BCC,
+            0x7BD4,
+            0x7BD8,
+            0x7BDC,
+            0x7BEC,
+            0x7BF0,
+            0x7BF4,
+            0x7BF8,
+            0x7C00,
+            0x7C04,
+            0x7C08,
+            0x7C10,
+            0x7C1C,
+            0x7C20,
+            0x7C28,
+            0x7C2C,
+            0x7C30,
+            0x7C34,
+            0x7C3C,
+            0x7C40,
+            0x7C44,
+            0x7C48,
+            0x7C4C,
+            0x7C50,
+            0x7C54,
+            0x7C58,
+            0x7C5C,
+            0x7C60,
+            0x7C64,
+            0x7C68,
+            0x7C6C,
+            0x7C70,
+            0x7C74,
+            0x7C78,
+            0x7C7C,
+            0x7C80,
+            0x7C88,
+            0x7C8C,
+            0x7CA8,
+            0x7CB0,
+            0x7CB4,
+            0x7CB8,
+            0x7CBC,
+            0x7CDC,
+            0x7CE0,
+            0x7CE4,
+            0x7CF0,
+            0x7D24,
+            0x7D30,
+            0x7D40,
+            0x7D58,
+            0x7D5C,
+            0x7D68,
+            0x7D74,
+            0x7D7C,
+            0x7D80,
+            0x7D84,
+            0x7D90,
+            0x7DA0,
+            0x7DA8,
+            0x7DB0,
+            0x7DB4,
+            0x7DB8,
+            0x7DBC,
+            0x7DC4,
+            0x7DDC,
+            0x7DE4,
+            0x7DE8,
+            0x7DF8,
+            0x7E20,
+            0x7E3C,
+            0x7E40,
+            0x7E48,
+            0x7E4C,
+            0x7E54,
+            0x7E58,
+            0x7E74,
+            0x7EDC,
+            0x7EEC,
+            0x7EFC,
+            0x7F0C,
+            0x7F1C,
+            0x7F2C,
+            0x7F3C,
+            0x7F4C,
+            0x7F5C,
+            0x80EC,
+            0x810C,
+            0x8204,
+            0x8234,
+            0x82AC,
+            0x8330,
+            0x8384,
+            0x83D8,
+            0x8450,
+            0x85FC,
+            0x86C8,
+            0x8794,
+            0x8884,
+            0x89A4,
+            0x89F8,
+            0x8A4C,
+            0x8AA0,
+            0x8AF4,
+            0x8C48,
+            0x8ED0,
+            0x9374,
+            0x98B4,
+            0xA208,
+            0xAFE8,
+            0xB01C,
+            0xC5FC,
+            0xFAC4,
+            0x14754,
+            0x61A0,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x22C4CEC,
+            0x22C4D64,
+            0x22C4D6C,
+            0x22C4D78,
+            0x22C4D7C,
+            0x22C4D80,
+            0x22C4D88,
+            0x22C4D90,
+            0x22C4D98,
+            0x22C4D9C,
+            0x22C4DA0,
+            0x22C4DA4,
+            0x22C4DA8,
+            0x22C4DC0,
+            0x22C4DCC,
+            0x22C4DD0,
+            0x22C4DDC,
+            0x22C4DE0,
+            0x22C4DE4,
+            0x22C4DE8,
+            0x22C4DEC,
+            0x22C4DF0,
+            0x22C4DF4,
+            0x22C4DF8,
+            0x22C4DFC,
+            0x22C4E00,
+            0x22C4E04,
+            0x22C4E10,
+            0x22C4E1C,
+            0x22C4E28,
+            0x22C4E2C,
+            0x22C4E30,
+            0x22C4E34,
+            0x22C4E38,
+            0x22C4E48,
+            0x22C4E4C,
+            0x22C4E50,
+            0x22C4E58,
+            0x22C4E64,
+            0x22C4E68,
+            0x22C4E6C,
+            0x22C4E70,
+            0x22C4E74,
+            0x22C4E80,
+            0x22C4E84,
+            0x22C4E8C,
+            0x22C4E90,
+            0x22C4E94,
+            0x22C4E98,
+            0x22C4E9C,
+            0x22C4EA0,
+            0x22C4EA4,
+            0x22C4EAC,
+            0x22C4EB4,
+            0x22C4EC0,
+            0x22C4ED0,
+            0x22C4EE0,
+            0x22C4EE4,
+            0x22C4EEC,
+            0x22C4EF0,
+            0x22C4F10,
+            0x22C4F38,
+            0x22C4F44,
+            0x22C4F4C,
+            0x22C4F58,
+            0x22C4F5C,
+            0x22C4F60,
+            0x22C4F68,
+            0x22C4F74,
+            0x22C4F7C,
+            0x22C4F84,
+            0x22C4F88,
+            0x22C4F8C,
+            0x22C4F94,
+            0x22C4F98,
+            0x22C4F9C,
+            0x22C4FAC,
+            0x22C4FB0,
+            0x22C4FB4,
+            0x22C4FB8,
+            0x22C4FC0,
+            0x22C4FC4,
+            0x22C4FC8,
+            0x22C4FD0,
+            0x22C4FDC,
+            0x22C4FE0,
+            0x22C4FE8,
+            0x22C4FEC,
+            0x22C4FF0,
+            0x22C4FF4,
+            0x22C4FFC,
+            0x22C5000,
+            0x22C5004,
+            0x22C5008,
+            0x22C500C,
+            0x22C5010,
+            0x22C5014,
+            0x22C5018,
+            0x22C501C,
+            0x22C5020,
+            0x22C5024,
+            0x22C5028,
+            0x22C502C,
+            0x22C5030,
+            0x22C5034,
+            0x22C5038,
+            0x22C503C,
+            0x22C5040,
+            0x22C5048,
+            0x22C504C,
+            0x22C5068,
+            0x22C5070,
+            0x22C5074,
+            0x22C5078,
+            0x22C507C,
+            0x22C509C,
+            0x22C50A0,
+            0x22C50A4,
+            0x22C50B0,
+            0x22C50E4,
+            0x22C50F0,
+            0x22C5100,
+            0x22C5118,
+            0x22C511C,
+            0x22C5128,
+            0x22C5134,
+            0x22C513C,
+            0x22C5140,
+            0x22C5144,
+            0x22C5150,
+            0x22C5160,
+            0x22C5168,
+            0x22C5170,
+            0x22C5174,
+            0x22C5178,
+            0x22C517C,
+            0x22C5184,
+            0x22C519C,
+            0x22C51A4,
+            0x22C51A8,
+            0x22C51B8,
+            0x22C51E0,
+            0x22C51FC,
+            0x22C5200,
+            0x22C5208,
+            0x22C520C,
+            0x22C5214,
+            0x22C5218,
+            0x22C5234,
+            0x22C529C,
+            0x22C52AC,
+            0x22C52BC,
+            0x22C52CC,
+            0x22C52DC,
+            0x22C52EC,
+            0x22C52FC,
+            0x22C530C,
+            0x22C531C,
+            0x22C54AC,
+            0x22C54CC,
+            0x22C55C4,
+            0x22C55F4,
+            0x22C566C,
+            0x22C56F0,
+            0x22C5744,
+            0x22C5798,
+            0x22C5810,
+            0x22C59BC,
+            0x22C5A88,
+            0x22C5B54,
+            0x22C5C44,
+            0x22C5D64,
+            0x22C5DB8,
+            0x22C5E0C,
+            0x22C5E60,
+            0x22C5EB4,
+            0x22C6008,
+            0x22C6290,
+            0x22C6734,
+            0x22C6C74,
+            0x22C75C8,
+            0x22C83A8,
+            0x22C83DC,
+            0x22C99BC,
+            0x22CCE84,
+            0x22D1B14,
+            0x22C3560,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0x1,
+            0x2,
+            0x2,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2,
+            0x2,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2,
+            0x2,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2,
+            0x2,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2,
+            0x2,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2,
+            0x2,
+            0xFFFFFFFF,
+            0x2,
+            0xFFFFFFFF,
+            0x2,
+            0x2,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2,
+            0xFFFFFFFF,
+            0x2,
+            0xFFFFFFFF,
+            0x2,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2,
+            0xFFFFFFFF,
+            0x2,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0xFFFFFFFF,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x4,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x4,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x4,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x4,
+            0xFFFFFFFF,
+            0x4,
+            0xFFFFFFFF,
+            0x4,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x48,
+            0x30,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x54,
+            0x54,
+            0x78,
+            0x84,
+            0xCC,
+            0xCC,
+            0xF0,
+            0x120,
+            0x54,
+            0x54,
+            0x54,
+            0x54,
+            0x154,
+            0x288,
+            0x4A4,
+            0x540,
+            0x954,
+            0xC00,
+            0x34,
+            0x15E0,
+            0x34C8,
+            0x4C90,
+            0xADF4,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1562,
+            1563,
+            1564,
+            1565,
+            1566,
+            1567,
+            1568,
+            1569,
+            1570,
+            1571,
+            1572,
+            1573,
+            1574,
+            1575,
+            1576,
+            1577,
+            1578,
+            1579,
+            1580,
+            1581,
+            1582,
+            1583,
+            1584,
+            1585,
+            1586,
+            1587,
+            1588,
+            1589,
+            1590,
+            1591,
+            1592,
+            1593,
+            1594,
+            1595,
+            1596,
+            1597,
+            1598,
+            1599,
+            1600,
+            1601,
+            1602,
+            1603,
+            1604,
+            1605,
+            1606,
+            1607,
+            1608,
+            1609,
+            1610,
+            1611,
+            1612,
+            1613,
+            1614,
+            1615,
+            1616,
+            1617,
+            1618,
+            1619,
+            1620,
+            1621,
+            1622,
+            1623,
+            1624,
+            1625,
+            1626,
+            1627,
+            1628,
+            1629,
+            1630,
+            1631,
+            1632,
+            1633,
+            1634,
+            1635,
+            1636,
+            1637,
+            1638,
+            1639,
+            1640,
+            1641,
+            1642,
+            1643,
+            1644,
+            1645,
+            1646,
+            1647,
+            1648,
+            1649,
+            1650,
+            1651,
+            1652,
+            1653,
+            1654,
+            1655,
+            1656,
+            1657,
+            1658,
+            1659,
+            1660,
+            1661,
+            1662,
+            1663,
+            1664,
+            1665,
+            1666,
+            1667,
+            1668,
+            1669,
+            1670,
+            1671,
+            1672,
+            1673,
+            1674,
+            1675,
+            1676,
+            1677,
+            1678,
+            1679,
+            1680,
+            1681,
+            1682,
+            1683,
+            1684,
+            1685,
+            1686,
+            1687,
+            1688,
+            1689,
+            1690,
+            1691,
+            1692,
+            1693,
+            1694,
+            1695,
+            1696,
+            1697,
+            1698,
+            1699,
+            1700,
+            1701,
+            1702,
+            1703,
+            1704,
+            1705,
+            1706,
+            1707,
+            1708,
+            1709,
+            1710,
+            1711,
+            1712,
+            1713,
+            1714,
+            1715,
+            1716,
+            1717,
+            1718,
+            1719,
+            1720,
+            1721,
+            1722,
+            1723,
+            1724,
+            1725,
+            1726,
+            1727,
+            1728,
+            948,
+            1729,
+            1730,
+            1731,
+            1732,
+            1733,
+            1734,
+            1735,
+            1736,
+            1737,
+            1738,
+            1739,
+            1740,
+            1741,
+            1742,
+            1743,
+            1744,
+            1745,
+            1746,
+            1747,
+        ),
+    ),
+    c_types=(
+        "struct window_params",
+        "struct dungeon_id_8",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "fx32_8",
+        "fx32_8",
+        "int16_t[2]",
+        "int16_t[2]",
+        "int16_t[2]",
+        "fx32_8",
+        "int16_t[2]",
+        "fx32_8",
+        "fx32_8",
+        "int16_t[2]",
+        "int16_t[2]",
+        "int",
+        "fx32_8",
+        "int16_t[2]",
+        "int16_t[2]",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "int",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "int16_t[2]",
+        "int16_t[2]",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "struct type_id_8[8]",
+        "fx32_8[4]",
+        "int16_t[8]",
+        "int16_t[8]",
+        "int16_t[8]",
+        "int16_t[8]",
+        "fx32_8[4]",
+        "fx32_8[4]",
+        "fx32_8[4]",
+        "fx32_8[4]",
+        "fx32_8[8]",
+        "struct item_id_16[36]",
+        "struct castform_weather_attributes[8]",
+        "int16_t[30]",
+        "struct type_matchup_combinator_table",
+        "fx32_8[21]",
+        "fx32_8[21]",
+        "struct wildcard_move_desc[15]",
+        "struct item_id_16[66]",
+        "int16_t[102]",
+        "struct natural_gift_item_info[34]",
+        "struct music_id_16[30][4]",
+        "int16_t[144]",
+        "fx32_8[21]",
+        "fx32_8[21]",
+        "fx32_8[21]",
+        "fx32_8[21]",
+        "struct music_id_16[170]",
+        "struct type_matchup_table",
+        "struct fixed_room_monster_spawn_stats_entry[99]",
+        "struct wildcard_move_desc[168]",
+        "struct tileset_property[199]",
+        "struct fixed_room_properties_entry[256]",
+        "struct trap_animation[26]",
+        "struct item_animation[1400]",
+        "struct move_animation[563]",
+        "struct effect_animation[700]",
+        "struct special_monster_move_animation[7422]",
+        "struct data_processing_instruction",
+    ),
+    multi={},
+)
@@ -0,0 +1,516 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay11 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "UnlockScriptingLock",
+        "FuncThatCallsRunNextOpcode",
+        "RunNextOpcode",
+        "HandleUnlocks",
+        "LoadFileFromRomVeneer",
+        "SsbLoad2",
+        "ScriptParamToInt",
+        "ScriptParamToFixedPoint16",
+        "StationLoadHanger",
+        "ScriptStationLoadTalk",
+        "SsbLoad1",
+        "ScriptSpecialProcessCall",
+        "GetCoroutineInfo",
+        "GetSpecialRecruitmentSpecies",
+        "PrepareMenuAcceptTeamMember",
+        "InitRandomNpcJobs",
+        "GetRandomNpcJobType",
+        "GetRandomNpcJobSubtype",
+        "GetRandomNpcJobStillAvailable",
+        "AcceptRandomNpcJob",
+        "GroundMainLoop",
+        "GetAllocArenaGround",
+        "GetFreeArenaGround",
+        "GroundMainReturnDungeon",
+        "GroundMainNextDay",
+        "JumpToTitleScreen",
+        "ReturnToTitleScreen",
+        "ScriptSpecialProcess0x16",
+        "IsScreenFadeInProgress",
+        "LoadBackgroundAttributes",
+        "LoadMapType10",
+        "LoadMapType11",
+        "GetSpecialLayoutBackground",
+        "SetAnimDataFields",
+        "SetAnimDataFieldsWrapper",
+        "InitAnimDataFromOtherAnimData",
+        "SetAnimDataFields2",
+        "GetIdleAnimationType",
+        "LoadObjectAnimData",
+        "InitAnimDataFromOtherAnimDataVeneer",
+        "AnimRelatedFunction",
+        "AllocAndInitPartnerFollowDataAndLiveActorList",
+        "InitPartnerFollowDataAndLiveActorList",
+        "DeleteLiveActor",
+        "ChangeActorAnimation",
+        "InitPartnerFollowData",
+        "GetDirectionLiveActor",
+        "SetDirectionLiveActor",
+        "CreateTeamInfoBox",
+        "CloseTeamInfoBox",
+        "IsTeamInfoBoxActive",
+        "UpdateTeamInfoBox",
+        "CreateTopGroundMenu",
+        "CloseTopGroundMenu",
+        "UpdateTopGroundMenu",
+        "IsBagNotEmpty",
+        "SprintfStatic",
+        "GetExclusiveItemRequirements",
+        "HandleControlsTopScreenGround",
+        "GetDungeonMapPos",
+        "WorldMapSetMode",
+        "WorldMapSetCamera",
+        "StatusUpdate",
+        "HandleTeamStatsGround",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xEF0,
+            0xF24,
+            0x1B24,
+            0x8110,
+            0x849C,
+            0x84BC,
+            0x866C,
+            0x86A0,
+            0x8994,
+            0x91A4,
+            0x9B10,
+            0xAED8,
+            0xBD78,
+            0xBDFC,
+            0xBE40,
+            0xBEE4,
+            0xBF7C,
+            0xBF94,
+            0xBFB0,
+            0xC018,
+            0xC534,
+            0xD11C,
+            0xD180,
+            0xD1D4,
+            0xD1F8,
+            0xD39C,
+            0xD454,
+            0xD4B4,
+            0xDD38,
+            0xF900,
+            0x10AE4,
+            0x11004,
+            0x15380,
+            0x1863C,
+            0x1877C,
+            0x18A84,
+            0x19108,
+            0x19B70,
+            0x1AC80,
+            0x1AD28,
+            0xFFFFFFFF,
+            0x1BADC,
+            0x1BB38,
+            0x1C398,
+            0x1D1E8,
+            0x1F848,
+            0x20FC8,
+            0x20FD8,
+            0x22CB4,
+            0x22D6C,
+            0x22DA4,
+            0x22DC4,
+            0x24BA4,
+            0x24D10,
+            0x24D6C,
+            0x288E0,
+            0x2CCE8,
+            0x2ED54,
+            0x32434,
+            0x32B64,
+            0x32E20,
+            0x32EE0,
+            0x378F8,
+            0x3793C,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x22DDA70,
+            0x22DDAA4,
+            0x22DE6A4,
+            0x22E4C90,
+            0x22E501C,
+            0x22E503C,
+            0x22E51EC,
+            0x22E5220,
+            0x22E5514,
+            0x22E5D24,
+            0x22E6690,
+            0x22E7A58,
+            0x22E88F8,
+            0x22E897C,
+            0x22E89C0,
+            0x22E8A64,
+            0x22E8AFC,
+            0x22E8B14,
+            0x22E8B30,
+            0x22E8B98,
+            0x22E90B4,
+            0x22E9C9C,
+            0x22E9D00,
+            0x22E9D54,
+            0x22E9D78,
+            0x22E9F1C,
+            0x22E9FD4,
+            0x22EA034,
+            0x22EA8B8,
+            0x22EC480,
+            0x22ED664,
+            0x22EDB84,
+            0x22F1F00,
+            0x22F51BC,
+            0x22F52FC,
+            0x22F5604,
+            0x22F5C88,
+            0x22F66F0,
+            0x22F7800,
+            0x22F78A8,
+            0xFFFFFFFF,
+            0x22F865C,
+            0x22F86B8,
+            0x22F8F18,
+            0x22F9D68,
+            0x22FC3C8,
+            0x22FDB48,
+            0x22FDB58,
+            0x22FF834,
+            0x22FF8EC,
+            0x22FF924,
+            0x22FF944,
+            0x2301724,
+            0x2301890,
+            0x23018EC,
+            0x2305460,
+            0x2309868,
+            0x230B8D4,
+            0x230EFB4,
+            0x230F6E4,
+            0x230F9A0,
+            0x230FA60,
+            0x2314478,
+            0x23144BC,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1748,
+            1749,
+            1750,
+            1751,
+            1752,
+            1,
+            1753,
+            1754,
+            1,
+            1,
+            1,
+            1755,
+            1756,
+            1757,
+            1758,
+            1759,
+            1760,
+            1761,
+            1762,
+            1763,
+            1764,
+            1765,
+            1766,
+            1767,
+            1768,
+            1769,
+            1770,
+            1771,
+            1772,
+            1773,
+            1774,
+            1774,
+            1775,
+            1776,
+            1777,
+            1778,
+            1779,
+            1780,
+            1781,
+            1782,
+            1783,
+            1784,
+            1785,
+            1786,
+            1787,
+            1788,
+            1789,
+            1790,
+            1791,
+            1792,
+            1793,
+            1794,
+            1795,
+            1796,
+            1797,
+            1798,
+            1799,
+            1800,
+            1801,
+            1802,
+            1803,
+            1804,
+            1805,
+            1806,
+        ),
+    ),
+    c_types=None,
+    multi={
+        40: ((0x1AD34, 0x1AE84), (0x22F78B4, 0x22F7A04)),
+    },
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "OVERLAY11_UNKNOWN_TABLE__NA_2316A38",
+        "SCRIPT_COMMAND_PARSING_DATA",
+        "SCRIPT_OP_CODE_NAMES",
+        "SCRIPT_OP_CODES",
+        "OVERLAY11_DEBUG_STRINGS",
+        "C_ROUTINE_NAMES",
+        "C_ROUTINES",
+        "GROUND_WEATHER_TABLE",
+        "GROUND_WAN_FILES_TABLE",
+        "OBJECTS",
+        "RECRUITMENT_TABLE_LOCATIONS",
+        "RECRUITMENT_TABLE_LEVELS",
+        "RECRUITMENT_TABLE_SPECIES",
+        "LEVEL_TILEMAP_LIST",
+        "SETANIMATION_TABLE",
+        "TEAM_INFO_BOX_DEFAULT_WINDOW_PARAMS",
+        "OVERLAY11_OVERLAY_LOAD_TABLE",
+        "UNIONALL_RAM_ADDRESS",
+        "GROUND_STATE_MAP",
+        "GROUND_STATE_WEATHER",
+        "GROUND_STATE_PTRS",
+        "WORLD_MAP_MODE",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0x3A938,
+            0x3A958,
+            0x3C470,
+            0x3D068,
+            0x3D94C,
+            0x40688,
+            0x41C70,
+            0x41CA0,
+            0x42D5C,
+            0x44844,
+            0x4485C,
+            0x44888,
+            0x44CDC,
+            0x4587C,
+            0x4640C,
+            0x4701C,
+            0x48C64,
+            0x48C80,
+            0x48C8C,
+            0x48CB4,
+            0x48DA4,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0x23174B8,
+            0x23174D8,
+            0x2318FF0,
+            0x2319BE8,
+            0x231A4CC,
+            0x231D208,
+            0x231E7F0,
+            0x231E820,
+            0x231F8DC,
+            0x23213C4,
+            0x23213DC,
+            0x2321408,
+            0x232185C,
+            0x23223FC,
+            0x2322F8C,
+            0x2323B9C,
+            0x23257E4,
+            0x2325800,
+            0x232580C,
+            0x2325834,
+            0x2325924,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xBF8,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x10BC,
+            0x1AAC,
+            0x16,
+            0x2C,
+            0x2C,
+            0x288,
+            0xA8,
+            0xFFFFFFFF,
+            0x150,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x18,
+            0x4,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1807,
+            1808,
+            1809,
+            1810,
+            1811,
+            1812,
+            1813,
+            1814,
+            1815,
+            1816,
+            1817,
+            1818,
+            1819,
+            1820,
+            1821,
+            1822,
+            1823,
+            1025,
+            1025,
+            1824,
+            1825,
+            1826,
+        ),
+    ),
+    c_types=(
+        "",
+        "undefined[32]",
+        "char[0]",
+        "struct script_opcode_table",
+        "char[0]",
+        "char[0]",
+        "struct common_routine_table",
+        "struct ground_weather_entry[12]",
+        "char[343][12]",
+        "struct script_object[0]",
+        "struct dungeon_id_16[22]",
+        "int16_t[22]",
+        "struct monster_id_16[22]",
+        "struct level_tilemap_list_entry[81]",
+        "struct animation_data[84]",
+        "struct window_params",
+        "struct overlay_load_entry[21]",
+        "",
+        "",
+        "",
+        "struct main_ground_data",
+        "uint32_t",
+    ),
+    multi={},
+)
@@ -0,0 +1,247 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay13 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "EntryOverlay13",
+        "ExitOverlay13",
+        "Overlay13SwitchFunctionNa238A1C8",
+        "Overlay13SwitchFunctionNa238A574",
+        "GetPersonality",
+        "GetOptionStringFromID",
+        "WaitForNextStep",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x0,
+            0x50,
+            0x88,
+            0x434,
+            0x1C68,
+            0x1CB0,
+            0x1D0C,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238AC80,
+            0x238ACD0,
+            0x238AD08,
+            0x238B0B4,
+            0x238C8E8,
+            0x238C930,
+            0x238C98C,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1827,
+            163,
+            1828,
+            1829,
+            1830,
+            1831,
+            1832,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "QUIZ_BORDER_COLOR_TABLE",
+        "PORTRAIT_ATTRIBUTES",
+        "QUIZ_MALE_FEMALE_BOOST_TABLE",
+        "OVERLAY13_UNKNOWN_STRUCT__NA_238C024",
+        "QUIZ_WINDOW_PARAMS_1",
+        "QUIZ_WINDOW_PARAMS_2",
+        "QUIZ_WINDOW_PARAMS_3",
+        "QUIZ_WINDOW_PARAMS_4",
+        "QUIZ_MENU_ITEMS_1",
+        "STARTERS_PARTNER_IDS",
+        "STARTERS_HERO_IDS",
+        "STARTERS_TYPE_INCOMPATIBILITY_TABLE",
+        "STARTERS_STRINGS",
+        "QUIZ_QUESTION_STRINGS",
+        "QUIZ_ANSWER_STRINGS",
+        "QUIZ_ANSWER_POINTS",
+        "OVERLAY13_RESERVED_SPACE",
+        "OVERLAY13_UNKNOWN_POINTER__NA_238CEA0",
+        "OVERLAY13_UNKNOWN_POINTER__NA_238CEA4",
+        "OVERLAY13_UNKNOWN_POINTER__NA_238CEA8",
+        "QUIZ_WINDOW_PARAMS_5",
+        "QUIZ_WINDOW_PARAMS_6",
+        "QUIZ_DEBUG_MENU_ITEMS",
+        "OVERLAY13_UNKNOWN_STRUCT__NA_238CF14",
+        "QUIZ_QUESTION_ANSWER_ASSOCIATIONS",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x1ED0,
+            0x1ED4,
+            0x1EDC,
+            0x1EE4,
+            0x1EF4,
+            0x1F04,
+            0x1F14,
+            0x1F24,
+            0x1F34,
+            0x1F4C,
+            0x1F78,
+            0x1FB8,
+            0x200C,
+            0x206C,
+            0x20F0,
+            0x2250,
+            0x2D50,
+            0x2D60,
+            0x2D64,
+            0x2D68,
+            0x2D6C,
+            0x2D7C,
+            0x2D8C,
+            0x2DD4,
+            0x2DE4,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238CB50,
+            0x238CB54,
+            0x238CB5C,
+            0x238CB64,
+            0x238CB74,
+            0x238CB84,
+            0x238CB94,
+            0x238CBA4,
+            0x238CBB4,
+            0x238CBCC,
+            0x238CBF8,
+            0x238CC38,
+            0x238CC8C,
+            0x238CCEC,
+            0x238CD70,
+            0x238CED0,
+            0x238D9D0,
+            0x238D9E0,
+            0x238D9E4,
+            0x238D9E8,
+            0x238D9EC,
+            0x238D9FC,
+            0x238DA0C,
+            0x238DA54,
+            0x238DA64,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0x4,
+            0x8,
+            0x8,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x18,
+            0x2A,
+            0x40,
+            0x54,
+            0x60,
+            0x84,
+            0x160,
+            0xAE0,
+            0x10,
+            0x4,
+            0x4,
+            0x4,
+            0x10,
+            0x10,
+            0x48,
+            0x10,
+            0x84,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1833,
+            1834,
+            266,
+            1835,
+            1836,
+            1837,
+            1838,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1839,
+        ),
+    ),
+    c_types=(
+        "",
+        "",
+        "",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[3]",
+        "struct monster_id_16[21]",
+        "struct monster_id_16[32]",
+        "",
+        "uint16_t[48]",
+        "uint16_t[66]",
+        "uint16_t[176]",
+        "struct quiz_answer_points_entry[174]",
+        "",
+        "",
+        "",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[9]",
+        "",
+        "uint16_t[66]",
+    ),
+    multi={},
+)
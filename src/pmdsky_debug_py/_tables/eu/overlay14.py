@@ -0,0 +1,395 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay14 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "SentrySetupState",
+        "SentryUpdateDisplay",
+        "SentrySetExitingState",
+        "SentryRunState",
+        "SentrySetStateIntermediate",
+        "SentryState0",
+        "SentryState1",
+        "SentryState2",
+        "SentryState3",
+        "SentryState4",
+        "SentryStateExit",
+        "SentryState6",
+        "SentryState7",
+        "SentryState8",
+        "SentryState9",
+        "SentryStateA",
+        "SentryStateB",
+        "SentryStateGenerateChoices",
+        "SentryStateGetUserChoice",
+        "SentryStateFinalizeRound",
+        "SentryStateF",
+        "SentryState10",
+        "SentryState11",
+        "SentryState12",
+        "SentryState13",
+        "SentryState14",
+        "SentryState15",
+        "SentryState16",
+        "SentryState17",
+        "SentryState18",
+        "SentryState19",
+        "SentryState1A",
+        "SentryStateFinalizePoints",
+        "SentryState1C",
+        "SentryState1D",
+        "SentryState1E",
+        "SentryState1F",
+        "SentryState20",
+        "SentryState21",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x0,
+            0xCBC,
+            0x1598,
+            0x16BC,
+            0x2088,
+            0x20A8,
+            0x20CC,
+            0x2124,
+            0x2148,
+            0x2270,
+            0x2294,
+            0x22A0,
+            0x22C4,
+            0x22DC,
+            0x2300,
+            0x2324,
+            0x233C,
+            0x2354,
+            0x2954,
+            0x2E84,
+            0x31C8,
+            0x31E0,
+            0x3258,
+            0x3270,
+            0x32A8,
+            0x32D0,
+            0x32E8,
+            0x3328,
+            0x3380,
+            0x33F8,
+            0x3430,
+            0x3448,
+            0x3488,
+            0x3518,
+            0x355C,
+            0x35C0,
+            0x35D8,
+            0x3654,
+            0x366C,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238AC80,
+            0x238B93C,
+            0x238C218,
+            0x238C33C,
+            0x238CD08,
+            0x238CD28,
+            0x238CD4C,
+            0x238CDA4,
+            0x238CDC8,
+            0x238CEF0,
+            0x238CF14,
+            0x238CF20,
+            0x238CF44,
+            0x238CF5C,
+            0x238CF80,
+            0x238CFA4,
+            0x238CFBC,
+            0x238CFD4,
+            0x238D5D4,
+            0x238DB04,
+            0x238DE48,
+            0x238DE60,
+            0x238DED8,
+            0x238DEF0,
+            0x238DF28,
+            0x238DF50,
+            0x238DF68,
+            0x238DFA8,
+            0x238E000,
+            0x238E078,
+            0x238E0B0,
+            0x238E0C8,
+            0x238E108,
+            0x238E198,
+            0x238E1DC,
+            0x238E240,
+            0x238E258,
+            0x238E2D4,
+            0x238E2EC,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1840,
+            1841,
+            1842,
+            1843,
+            1844,
+            1845,
+            1845,
+            1845,
+            1845,
+            1845,
+            1846,
+            1845,
+            1847,
+            1845,
+            1845,
+            1848,
+            1845,
+            1849,
+            1850,
+            1851,
+            1845,
+            1845,
+            1852,
+            1845,
+            1853,
+            1854,
+            1845,
+            1845,
+            1855,
+            1845,
+            1856,
+            1845,
+            1857,
+            1858,
+            1845,
+            1859,
+            1845,
+            1860,
+            1845,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "SENTRY_DUTY_STRUCT_SIZE",
+        "SENTRY_LOUDRED_MONSTER_ID",
+        "STRING_ID_SENTRY_TOP_SESSIONS",
+        "STRING_ID_SENTRY_INSTRUCTIONS",
+        "STRING_ID_SENTRY_HERE_COMES",
+        "STRING_ID_SENTRY_WHOSE_FOOTPRINT",
+        "STRING_ID_SENTRY_TRY_AGAIN",
+        "STRING_ID_SENTRY_OUT_OF_TIME",
+        "STRING_ID_SENTRY_FOOTPRINT_IS_6EE",
+        "STRING_ID_SENTRY_COME_IN_6EF",
+        "STRING_ID_SENTRY_WRONG",
+        "STRING_ID_SENTRY_BUCK_UP",
+        "STRING_ID_SENTRY_FOOTPRINT_IS_6EC",
+        "STRING_ID_SENTRY_COME_IN_6ED",
+        "STRING_ID_SENTRY_KEEP_YOU_WAITING",
+        "STRING_ID_SENTRY_THATLL_DO_IT",
+        "SENTRY_CHATOT_MONSTER_ID",
+        "STRING_ID_SENTRY_NO_MORE_VISITORS",
+        "STRING_ID_SENTRY_THATS_ALL",
+        "SENTRY_GROVYLE_MONSTER_ID",
+        "SENTRY_DEBUG_MENU_ITEMS",
+        "SENTRY_DUTY_PTR",
+        "SENTRY_DUTY_STATE_HANDLER_TABLE",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x39C0,
+            0x3AA0,
+            0x3AB4,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x238E640,
+            0x238E720,
+            0x238E734,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x48,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1861,
+            1862,
+            1863,
+            1864,
+            1865,
+            1866,
+            1867,
+            1868,
+            1869,
+            1870,
+            1871,
+            1872,
+            1873,
+            1874,
+            1875,
+            1876,
+            1877,
+            1878,
+            1879,
+            1880,
+            1,
+            1881,
+            1882,
+        ),
+    ),
+    c_types=(
+        "uint32_t",
+        "enum monster_id",
+        "int",
+        "int",
+        "int",
+        "int",
+        "int",
+        "int",
+        "int",
+        "int",
+        "int",
+        "int",
+        "int",
+        "int",
+        "int",
+        "int",
+        "enum monster_id",
+        "int",
+        "int",
+        "enum monster_id",
+        "struct simple_menu_id_item[9]",
+        "struct sentry_duty*",
+        "state_handler_fn_t[35]",
+    ),
+    multi={},
+)
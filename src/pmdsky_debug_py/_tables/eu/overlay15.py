@@ -0,0 +1,83 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay15 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+
+DATA = SymbolTable(
+    names=(
+        "BANK_MAIN_MENU_ITEMS",
+        "BANK_WINDOW_PARAMS_1",
+        "BANK_WINDOW_PARAMS_2",
+        "BANK_WINDOW_PARAMS_3",
+        "BANK_WINDOW_PARAMS_4",
+        "BANK_WINDOW_PARAMS_5",
+        "OVERLAY15_RESERVED_SPACE",
+        "OVERLAY15_UNKNOWN_POINTER__NA_238B180",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xF40,
+            0xFFFFFFFF,
+            0xF78,
+            0xF88,
+            0xF98,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x1060,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238BBC0,
+            0xFFFFFFFF,
+            0x238BBF8,
+            0x238BC08,
+            0x238BC18,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x238BCE0,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0x28,
+            0xFFFFFFFF,
+            0x10,
+            0x10,
+            0x10,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "struct simple_menu_id_item[5]",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "",
+    ),
+    multi={},
+)
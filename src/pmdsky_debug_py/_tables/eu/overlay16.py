@@ -0,0 +1,119 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay16 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+
+DATA = SymbolTable(
+    names=(
+        "EVO_MENU_ITEMS_CONFIRM",
+        "EVO_SUBMENU_ITEMS",
+        "EVO_MAIN_MENU_ITEMS",
+        "EVO_MENU_STRING_IDS",
+        "EVO_WINDOW_PARAMS_1",
+        "EVO_WINDOW_PARAMS_2",
+        "EVO_WINDOW_PARAMS_3",
+        "EVO_WINDOW_PARAMS_4",
+        "EVO_WINDOW_PARAMS_5",
+        "EVO_WINDOW_PARAMS_6",
+        "EVO_WINDOW_PARAMS_7",
+        "OVERLAY16_RESERVED_SPACE",
+        "OVERLAY16_UNKNOWN_POINTER__NA_238CE40",
+        "OVERLAY16_UNKNOWN_POINTER__NA_238CE58",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x2BCC,
+            0x2BE4,
+            0x2C04,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2C88,
+            0x2C98,
+            0x2CA8,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2D00,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238D84C,
+            0x238D864,
+            0x238D884,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x238D908,
+            0x238D918,
+            0x238D928,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x238D980,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0x18,
+            0x20,
+            0x20,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x10,
+            0x10,
+            0x10,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1,
+            1,
+            1,
+            1883,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "uint16_t[26]",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "",
+        "",
+    ),
+    multi={},
+)
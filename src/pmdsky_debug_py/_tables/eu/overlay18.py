@@ -0,0 +1,185 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay18 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+
+DATA = SymbolTable(
+    names=(
+        "LINK_SHOP_WINDOW_PARAMS_1",
+        "LINK_SHOP_WINDOW_PARAMS_2",
+        "LINK_SHOP_WINDOW_PARAMS_3",
+        "LINK_SHOP_WINDOW_PARAMS_4",
+        "LINK_SHOP_WINDOW_PARAMS_5",
+        "LINK_SHOP_WINDOW_PARAMS_6",
+        "LINK_SHOP_WINDOW_PARAMS_7",
+        "LINK_SHOP_WINDOW_PARAMS_8",
+        "LINK_SHOP_WINDOW_PARAMS_9",
+        "LINK_SHOP_WINDOW_PARAMS_10",
+        "LINK_SHOP_WINDOW_PARAMS_11",
+        "LINK_SHOP_MENU_ITEMS_CONFIRM",
+        "LINK_SHOP_SUBMENU_ITEMS_1",
+        "LINK_SHOP_SUBMENU_ITEMS_2",
+        "LINK_SHOP_MAIN_MENU_ITEMS",
+        "LINK_SHOP_SUBMENU_ITEMS_3",
+        "LINK_SHOP_SUBMENU_ITEMS_4",
+        "LINK_SHOP_SUBMENU_ITEMS_5",
+        "LINK_SHOP_SUBMENU_ITEMS_6",
+        "LINK_SHOP_SUBMENU_ITEMS_7",
+        "OVERLAY18_FUNCTION_POINTER_TABLE",
+        "OVERLAY18_RESERVED_SPACE",
+        "OVERLAY18_UNKNOWN_POINTER__NA_238D620",
+        "OVERLAY18_UNKNOWN_POINTER__NA_238D624",
+        "OVERLAY18_UNKNOWN_POINTER__NA_238D628",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x3130,
+            0x3140,
+            0x3150,
+            0x3160,
+            0x3170,
+            0x3180,
+            0x3190,
+            0x31A0,
+            0x31B0,
+            0x31C0,
+            0x31D0,
+            0x31E0,
+            0x31F8,
+            0x3218,
+            0x3238,
+            0x3258,
+            0x3280,
+            0x32B0,
+            0x32F8,
+            0x3340,
+            0x3388,
+            0xFFFFFFFF,
+            0x34E0,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238DDB0,
+            0x238DDC0,
+            0x238DDD0,
+            0x238DDE0,
+            0x238DDF0,
+            0x238DE00,
+            0x238DE10,
+            0x238DE20,
+            0x238DE30,
+            0x238DE40,
+            0x238DE50,
+            0x238DE60,
+            0x238DE78,
+            0x238DE98,
+            0x238DEB8,
+            0x238DED8,
+            0x238DF00,
+            0x238DF30,
+            0x238DF78,
+            0x238DFC0,
+            0x238E008,
+            0xFFFFFFFF,
+            0x238E160,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x18,
+            0x20,
+            0x20,
+            0x20,
+            0x28,
+            0x30,
+            0x48,
+            0x48,
+            0x48,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[5]",
+        "struct simple_menu_id_item[6]",
+        "struct simple_menu_id_item[9]",
+        "struct simple_menu_id_item[9]",
+        "struct simple_menu_id_item[9]",
+        "void*[76]",
+        "",
+        "",
+        "",
+        "",
+    ),
+    multi={},
+)
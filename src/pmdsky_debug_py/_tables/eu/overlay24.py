@@ -0,0 +1,107 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay24 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+
+DATA = SymbolTable(
+    names=(
+        "OVERLAY24_UNKNOWN_STRUCT__NA_238C508",
+        "OVERLAY24_UNKNOWN_STRUCT__NA_238C514",
+        "DAYCARE_MENU_ITEMS_CONFIRM",
+        "DAYCARE_MAIN_MENU_ITEMS",
+        "OVERLAY24_UNKNOWN_STRING_IDS",
+        "DAYCARE_WINDOW_PARAMS_1",
+        "DAYCARE_WINDOW_PARAMS_2",
+        "DAYCARE_WINDOW_PARAMS_3",
+        "DAYCARE_WINDOW_PARAMS_4",
+        "DAYCARE_WINDOW_PARAMS_5",
+        "OVERLAY24_RESERVED_SPACE",
+        "OVERLAY24_UNKNOWN_POINTER__NA_238C600",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x23C8,
+            0x23D4,
+            0x23E0,
+            0x23F8,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2480,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x24C0,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238D048,
+            0x238D054,
+            0x238D060,
+            0x238D078,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x238D100,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x238D140,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x18,
+            0x20,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x10,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            266,
+            266,
+            1,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "",
+        "",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[4]",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "",
+    ),
+    multi={},
+)
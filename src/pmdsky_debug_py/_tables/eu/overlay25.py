@@ -0,0 +1,125 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay25 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+
+DATA = SymbolTable(
+    names=(
+        "OVERLAY25_UNKNOWN_STRUCT__NA_238B498",
+        "APPRAISAL_WINDOW_PARAMS_1",
+        "APPRAISAL_MENU_ITEMS_CONFIRM",
+        "APPRAISAL_MAIN_MENU_ITEMS",
+        "APPRAISAL_SUBMENU_ITEMS",
+        "OVERLAY25_UNKNOWN_STRING_IDS",
+        "APPRAISAL_WINDOW_PARAMS_2",
+        "APPRAISAL_WINDOW_PARAMS_3",
+        "APPRAISAL_WINDOW_PARAMS_4",
+        "APPRAISAL_WINDOW_PARAMS_5",
+        "APPRAISAL_WINDOW_PARAMS_6",
+        "APPRAISAL_WINDOW_PARAMS_7",
+        "APPRAISAL_WINDOW_PARAMS_8",
+        "OVERLAY25_RESERVED_SPACE",
+        "OVERLAY25_UNKNOWN_POINTER__NA_238B5E0",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x1358,
+            0x1364,
+            0x1374,
+            0x138C,
+            0x13AC,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x1424,
+            0x1434,
+            0x1444,
+            0x1454,
+            0xFFFFFFFF,
+            0x14A0,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238BFD8,
+            0x238BFE4,
+            0x238BFF4,
+            0x238C00C,
+            0x238C02C,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x238C0A4,
+            0x238C0B4,
+            0x238C0C4,
+            0x238C0D4,
+            0xFFFFFFFF,
+            0x238C120,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0x10,
+            0x18,
+            0x20,
+            0x20,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            266,
+            266,
+            1,
+            1,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "",
+        "struct window_params",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "",
+    ),
+    multi={},
+)
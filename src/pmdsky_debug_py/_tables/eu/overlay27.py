@@ -0,0 +1,149 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay27 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+
+DATA = SymbolTable(
+    names=(
+        "OVERLAY27_UNKNOWN_VALUE__NA_238C948",
+        "OVERLAY27_UNKNOWN_VALUE__NA_238C94C",
+        "OVERLAY27_UNKNOWN_STRUCT__NA_238C950",
+        "DISCARD_ITEMS_MENU_ITEMS_CONFIRM",
+        "DISCARD_ITEMS_SUBMENU_ITEMS_1",
+        "DISCARD_ITEMS_SUBMENU_ITEMS_2",
+        "DISCARD_ITEMS_MAIN_MENU_ITEMS",
+        "OVERLAY27_UNKNOWN_STRING_IDS",
+        "DISCARD_WINDOW_PARAMS_1",
+        "DISCARD_WINDOW_PARAMS_2",
+        "DISCARD_WINDOW_PARAMS_3",
+        "DISCARD_WINDOW_PARAMS_4",
+        "DISCARD_WINDOW_PARAMS_5",
+        "DISCARD_WINDOW_PARAMS_6",
+        "DISCARD_WINDOW_PARAMS_7",
+        "DISCARD_WINDOW_PARAMS_8",
+        "OVERLAY27_RESERVED_SPACE",
+        "OVERLAY27_UNKNOWN_POINTER__NA_238CE80",
+        "OVERLAY27_UNKNOWN_POINTER__NA_238CE84",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x2808,
+            0x280C,
+            0x2810,
+            0x281C,
+            0x2834,
+            0x2854,
+            0x2874,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x290C,
+            0x291C,
+            0x292C,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2D40,
+            0x2D44,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238D488,
+            0x238D48C,
+            0x238D490,
+            0x238D49C,
+            0x238D4B4,
+            0x238D4D4,
+            0x238D4F4,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x238D58C,
+            0x238D59C,
+            0x238D5AC,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x238D9C0,
+            0x238D9C4,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x18,
+            0x20,
+            0x20,
+            0x28,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x10,
+            0x10,
+            0x10,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            266,
+            266,
+            266,
+            1,
+            1,
+            1,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "",
+        "",
+        "",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[5]",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "",
+        "",
+    ),
+    multi={},
+)
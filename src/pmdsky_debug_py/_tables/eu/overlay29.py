@@ -0,0 +1,4788 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay29 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "GetWeatherColorTable",
+        "DungeonAlloc",
+        "GetDungeonPtrMaster",
+        "DungeonZInit",
+        "DungeonFree",
+        "RunDungeon",
+        "EntityIsValid",
+        "GetFloorType",
+        "TryForcedLoss",
+        "IsBossFight",
+        "IsCurrentFixedRoomBossFight",
+        "IsMarowakTrainingMaze",
+        "FixedRoomIsSubstituteRoom",
+        "StoryRestrictionsEnabled",
+        "GetScenarioBalanceVeneer",
+        "FadeToBlack",
+        "CheckTouchscreenArea",
+        "GetTrapInfo",
+        "GetItemInfo",
+        "GetTileAtEntity",
+        "UpdateEntityPixelPos",
+        "SetEntityPixelPosXY",
+        "IncrementEntityPixelPosXY",
+        "CreateEnemyEntity",
+        "SpawnTrap",
+        "SpawnItemEntity",
+        "ShouldMinimapDisplayEntity",
+        "ShouldDisplayEntity",
+        "ShouldDisplayEntityWrapper",
+        "CanSeeTarget",
+        "CanTargetEntity",
+        "CanTargetPosition",
+        "PopulateActiveMonsterPtrs",
+        "GetTeamMemberIndex",
+        "SubstitutePlaceholderStringTags",
+        "UpdateMapSurveyorFlag",
+        "PointCameraToMonster",
+        "UpdateCamera",
+        "ItemIsActive",
+        "GetVisibilityRange",
+        "RevealWholeFloor",
+        "PlayEffectAnimationEntity",
+        "PlayEffectAnimationPos",
+        "PlayEffectAnimationPixelPos",
+        "AnimationDelayOrSomething",
+        "UpdateStatusIconFlags",
+        "PlayEffectAnimation0x171Full",
+        "PlayEffectAnimation0x171",
+        "ShowPpRestoreEffect",
+        "ShouldDisplayEntityAdvanced",
+        "PlayEffectAnimation0x1A9",
+        "PlayEffectAnimation0x18E",
+        "LoadMappaFileAttributes",
+        "GetItemIdToSpawn",
+        "CopySpawnEntriesMaster",
+        "MonsterSpawnListPartialCopy",
+        "IsOnMonsterSpawnList",
+        "GetMonsterIdToSpawn",
+        "GetMonsterLevelToSpawn",
+        "AllocTopScreenStatus",
+        "FreeTopScreenStatus",
+        "InitializeTeamStats",
+        "UpdateTeamStatsWrapper",
+        "FreeTeamStatsWrapper",
+        "AssignTopScreenHandlers",
+        "HandleTopScreenFades",
+        "FreeTopScreen",
+        "GetDirectionTowardsPosition",
+        "GetChebyshevDistance",
+        "IsPositionActuallyInSight",
+        "IsPositionInSight",
+        "GetLeader",
+        "GetLeaderMonster",
+        "GetRandomTile",
+        "FindNearbyUnoccupiedTile",
+        "FindClosestUnoccupiedTileWithin2",
+        "FindFarthestUnoccupiedTileWithin2",
+        "FindUnoccupiedTileWithin3",
+        "TickStatusTurnCounter",
+        "AdvanceFrame",
+        "DisplayAnimatedNumbers",
+        "SetDungeonRngPreseed23Bit",
+        "GenerateDungeonRngSeed",
+        "GetDungeonRngPreseed",
+        "SetDungeonRngPreseed",
+        "InitDungeonRng",
+        "DungeonRand16Bit",
+        "DungeonRandInt",
+        "DungeonRandRange",
+        "DungeonRandOutcome",
+        "CalcStatusDuration",
+        "DungeonRngUnsetSecondary",
+        "DungeonRngSetSecondary",
+        "DungeonRngSetPrimary",
+        "MusicTableIdxToMusicId",
+        "ChangeDungeonMusic",
+        "TrySwitchPlace",
+        "SetLeaderActionFields",
+        "ClearMonsterActionFields",
+        "SetMonsterActionFields",
+        "SetActionPassTurnOrWalk",
+        "GetItemToUseByIndex",
+        "GetItemToUse",
+        "GetItemAction",
+        "RemoveUsedItem",
+        "AddDungeonSubMenuOption",
+        "DisableDungeonSubMenuOption",
+        "SetActionRegularAttack",
+        "SetActionUseMovePlayer",
+        "SetActionUseMoveAi",
+        "RunFractionalTurn",
+        "RunLeaderTurn",
+        "TrySpawnMonsterAndActivatePlusMinus",
+        "IsFloorOver",
+        "DecrementWindCounter",
+        "IsDungeonEndReasonFailure",
+        "SetForcedLossReason",
+        "GetForcedLossReason",
+        "BindTrapToTile",
+        "AreLateGameTrapsEnabledWrapper",
+        "SpawnEnemyTrapAtPos",
+        "PrepareTrapperTrap",
+        "TrySpawnTrap",
+        "TrySpawnTrapperTrap",
+        "TryRemoveTrap",
+        "TryTriggerTrap",
+        "ApplyMudTrapEffect",
+        "ApplyStickyTrapEffect",
+        "ApplyGrimyTrapEffect",
+        "ApplyPitfallTrapEffect",
+        "ApplySummonTrapEffect",
+        "ApplyPpZeroTrapEffect",
+        "ApplyPokemonTrapEffect",
+        "ApplyTripTrapEffect",
+        "ApplyStealthRockTrapEffect",
+        "ApplyToxicSpikesTrapEffect",
+        "ApplyRandomTrapEffect",
+        "ApplyGrudgeTrapEffect",
+        "ApplyTrapEffect",
+        "RevealTrapsNearby",
+        "ShouldRunMonsterAi",
+        "DebugRecruitingEnabled",
+        "TryActivateIqBooster",
+        "IsSecretBazaarNpcBehavior",
+        "GetLeaderAction",
+        "GetEntityTouchscreenArea",
+        "SetLeaderAction",
+        "ShouldLeaderKeepRunning",
+        "CheckLeaderTile",
+        "ChangeLeader",
+        "UseSingleUseItemWrapper",
+        "UseSingleUseItem",
+        "UseThrowableItem",
+        "ResetDamageData",
+        "FreeLoadedAttackSpriteAndMore",
+        "SetAndLoadCurrentAttackAnimation",
+        "ClearLoadedAttackSprite",
+        "GetLoadedAttackSpriteId",
+        "DungeonGetTotalSpriteFileSize",
+        "DungeonGetSpriteIndex",
+        "JoinedAtRangeCheck2Veneer",
+        "FloorNumberIsEven",
+        "GetKecleonIdToSpawnByFloor",
+        "StoreSpriteFileIndexBothGenders",
+        "LoadMonsterSpriteInner",
+        "SwapMonsterWanFileIndex",
+        "LoadMonsterSprite",
+        "DeleteMonsterSpriteFile",
+        "DeleteAllMonsterSpriteFiles",
+        "EuFaintCheck",
+        "HandleFaint",
+        "MoveMonsterToPos",
+        "CreateMonsterSummaryFromMonster",
+        "UpdateAiTargetPos",
+        "SetMonsterTypeAndAbility",
+        "TryActivateSlowStart",
+        "TryActivateArtificialWeatherAbilities",
+        "GetMonsterApparentId",
+        "TryActivateTraceAndColorChange",
+        "DefenderAbilityIsActive",
+        "IsMonster",
+        "TryActivateConversion2",
+        "TryActivateTruant",
+        "TryPointCameraToMonster",
+        "ReevaluateSnatchMonster",
+        "GetRandomExplorerMazeMonster",
+        "RestorePpAllMovesSetFlags",
+        "CheckTeamMemberIdxVeneer",
+        "IsMonsterIdInNormalRangeVeneer",
+        "BoostIQ",
+        "ShouldMonsterHeadToStairs",
+        "MewSpawnCheck",
+        "TryEndStatusWithAbility",
+        "ExclusiveItemEffectIsActive",
+        "GetTeamMemberWithIqSkill",
+        "TeamMemberHasEnabledIqSkill",
+        "TeamLeaderIqSkillIsEnabled",
+        "CountMovesOutOfPp",
+        "HasSuperEffectiveMoveAgainstUser",
+        "TryEatItem",
+        "SetDecoyAiTracker",
+        "CheckSpawnThreshold",
+        "HasLowHealth",
+        "AreEntitiesAdjacent",
+        "IsSpecialStoryAlly",
+        "IsExperienceLocked",
+        "InitOtherMonsterData",
+        "InitEnemySpawnStats",
+        "InitEnemyStatsAndMoves",
+        "SpawnTeam",
+        "SpawnInitialMonsters",
+        "SpawnMonster",
+        "InitTeamMember",
+        "InitMonster",
+        "SubInitMonster",
+        "MarkShopkeeperSpawn",
+        "SpawnShopkeepers",
+        "GetMaxHpAtLevel",
+        "GetOffensiveStatAtLevel",
+        "GetDefensiveStatAtLevel",
+        "GetOutlawSpawnData",
+        "ExecuteMonsterAction",
+        "TryActivateFlashFireOnAllMonsters",
+        "HasStatusThatPreventsActing",
+        "GetMobilityTypeCheckSlip",
+        "GetMobilityTypeCheckSlipAndFloating",
+        "IsInvalidSpawnTile",
+        "GetMobilityTypeAfterIqSkills",
+        "CannotStandOnTile",
+        "CalcSpeedStage",
+        "CalcSpeedStageWrapper",
+        "GetNumberOfAttacks",
+        "GetMonsterDisplayNameType",
+        "GetMonsterName",
+        "SprintfStatic",
+        "IsMonsterDrowsy",
+        "MonsterHasNonvolatileNonsleepStatus",
+        "MonsterHasImmobilizingStatus",
+        "MonsterHasAttackInterferingStatus",
+        "MonsterHasSkillInterferingStatus",
+        "MonsterHasLeechSeedStatus",
+        "MonsterHasWhifferStatus",
+        "IsMonsterVisuallyImpaired",
+        "IsMonsterMuzzled",
+        "MonsterHasMiracleEyeStatus",
+        "MonsterHasNegativeStatus",
+        "IsMonsterSleeping",
+        "CheckVariousStatuses2",
+        "CheckVariousConditions",
+        "CheckVariousStatuses",
+        "CanMonsterMoveInDirection",
+        "GetDirectionalMobilityType",
+        "IsMonsterCornered",
+        "CanAttackInDirection",
+        "CanAiMonsterMoveInDirection",
+        "ShouldMonsterRunAway",
+        "ShouldMonsterRunAwayVariation",
+        "GetTreatmentBetweenMonsters",
+        "SafeguardIsActive",
+        "LeafGuardIsActive",
+        "IsProtectedFromStatDrops",
+        "NoGastroAcidStatus",
+        "AbilityIsActive",
+        "AbilityIsActiveVeneer",
+        "OtherMonsterAbilityIsActive",
+        "LevitateIsActive",
+        "MonsterIsType",
+        "IsTypeAffectedByGravity",
+        "HasTypeAffectedByGravity",
+        "CanSeeInvisibleMonsters",
+        "IsTacticSet",
+        "HasDropeyeStatus",
+        "IqSkillIsEnabled",
+        "UpdateIqSkills",
+        "GetMoveTypeForMonster",
+        "GetMovePower",
+        "MonsterCanThrowItems",
+        "UpdateStateFlags",
+        "IsProtectedFromNegativeStatus",
+        "AddExpSpecial",
+        "EnemyEvolution",
+        "LevelUpItemEffect",
+        "TryDecreaseLevel",
+        "LevelUp",
+        "GetMonsterMoves",
+        "EvolveMonster",
+        "ChangeMonsterAnimation",
+        "GetIdleAnimationId",
+        "DetermineAllMonsterShadow",
+        "DetermineMonsterShadow",
+        "DisplayActions",
+        "CheckNonLeaderTile",
+        "EndNegativeStatusCondition",
+        "EndNegativeStatusConditionWrapper",
+        "TransferNegativeStatusCondition",
+        "EndSleepClassStatus",
+        "EndBurnClassStatus",
+        "EndFrozenClassStatus",
+        "EndCringeClassStatus",
+        "EndReflectClassStatus",
+        "TryRemoveSnatchedMonsterFromDungeonStruct",
+        "EndCurseClassStatus",
+        "EndLeechSeedClassStatus",
+        "EndSureShotClassStatus",
+        "EndInvisibleClassStatus",
+        "EndBlinkerClassStatus",
+        "EndMuzzledStatus",
+        "EndMiracleEyeStatus",
+        "EndMagnetRiseStatus",
+        "TransferNegativeBlinkerClassStatus",
+        "EndFrozenStatus",
+        "EndProtectStatus",
+        "TryRestoreRoostTyping",
+        "TryTriggerMonsterHouse",
+        "ShouldMonsterFollowLeader",
+        "RunMonsterAi",
+        "ApplyDamageAndEffects",
+        "ApplyDamage",
+        "AftermathCheck",
+        "GetTypeMatchupBothTypes",
+        "ScrappyShouldActivate",
+        "IsTypeIneffectiveAgainstGhost",
+        "GhostImmunityIsActive",
+        "GetTypeMatchup",
+        "CalcTypeBasedDamageEffects",
+        "CalcDamage",
+        "ApplyDamageAndEffectsWrapper",
+        "CalcRecoilDamageFixed",
+        "CalcDamageFixed",
+        "CalcDamageFixedNoCategory",
+        "CalcDamageFixedWrapper",
+        "UpdateShopkeeperModeAfterAttack",
+        "UpdateShopkeeperModeAfterTrap",
+        "ResetDamageCalcDiagnostics",
+        "SpecificRecruitCheck",
+        "RecruitCheck",
+        "TryRecruit",
+        "TrySpawnMonsterAndTickSpawnCounter",
+        "AiDecideUseItem",
+        "GetPossibleAiThrownItemDirections",
+        "GetPossibleAiArcItemTargets",
+        "TryNonLeaderItemPickUp",
+        "GetExclusiveItemWithEffectFromBag",
+        "AuraBowIsActive",
+        "ExclusiveItemOffenseBoost",
+        "ExclusiveItemDefenseBoost",
+        "TeamMemberHasItemActive",
+        "TeamMemberHasExclusiveItemEffectActive",
+        "TrySpawnEnemyItemDrop",
+        "TickNoSlipCap",
+        "TickStatusAndHealthRegen",
+        "InflictSleepStatusSingle",
+        "TryInflictSleepStatus",
+        "IsProtectedFromSleepClassStatus",
+        "TryInflictNightmareStatus",
+        "TryInflictNappingStatus",
+        "TryInflictYawningStatus",
+        "TryInflictSleeplessStatus",
+        "TryInflictPausedStatus",
+        "TryInflictInfatuatedStatus",
+        "TryInflictBurnStatus",
+        "TryInflictBurnStatusWholeTeam",
+        "TryInflictPoisonedStatus",
+        "TryInflictBadlyPoisonedStatus",
+        "TryInflictFrozenStatus",
+        "TryInflictConstrictionStatus",
+        "TryInflictShadowHoldStatus",
+        "TryInflictIngrainStatus",
+        "TryInflictWrappedStatus",
+        "FreeOtherWrappedMonsters",
+        "TryInflictPetrifiedStatus",
+        "LowerOffensiveStat",
+        "LowerDefensiveStat",
+        "BoostOffensiveStat",
+        "BoostDefensiveStat",
+        "FlashFireShouldActivate",
+        "ActivateFlashFire",
+        "ApplyOffensiveStatMultiplier",
+        "ApplyDefensiveStatMultiplier",
+        "BoostHitChanceStat",
+        "LowerHitChanceStat",
+        "TryInflictCringeStatus",
+        "TryInflictParalysisStatus",
+        "BoostSpeed",
+        "BoostSpeedOneStage",
+        "LowerSpeed",
+        "TrySealMove",
+        "BoostOrLowerSpeed",
+        "ResetHitChanceStat",
+        "ExclusiveItemEffectIsActiveWithLogging",
+        "TryActivateQuickFeet",
+        "TryInflictTerrifiedStatus",
+        "TryInflictGrudgeStatus",
+        "TryInflictConfusedStatus",
+        "TryInflictCoweringStatus",
+        "TryRestoreHp",
+        "TryIncreaseHp",
+        "RevealItems",
+        "RevealStairs",
+        "RevealEnemies",
+        "TryInflictLeechSeedStatus",
+        "TryInflictDestinyBondStatus",
+        "TryInflictSureShotStatus",
+        "TryInflictWhifferStatus",
+        "TryInflictSetDamageStatus",
+        "TryInflictFocusEnergyStatus",
+        "TryInflictDecoyStatus",
+        "TryInflictCurseStatus",
+        "TryInflictSnatchStatus",
+        "TryInflictTauntStatus",
+        "TryInflictStockpileStatus",
+        "TryInflictInvisibleStatus",
+        "TryInflictPerishSongStatus",
+        "TryInflictEncoreStatus",
+        "TryDecreaseBelly",
+        "TryIncreaseBelly",
+        "TryInflictMuzzledStatus",
+        "TryTransform",
+        "TryInflictMobileStatus",
+        "TryInflictExposedStatus",
+        "TryActivateIdentifyCondition",
+        "TryInflictBlinkerStatus",
+        "IsBlinded",
+        "TryInflictCrossEyedStatus",
+        "TryInflictEyedropStatus",
+        "TryInflictSlipStatus",
+        "TryInflictDropeyeStatus",
+        "RestoreAllMovePP",
+        "RestoreOneMovePP",
+        "RestoreRandomMovePP",
+        "ApplyProteinEffect",
+        "ApplyCalciumEffect",
+        "ApplyIronEffect",
+        "ApplyZincEffect",
+        "TryInflictLongTossStatus",
+        "TryInflictPierceStatus",
+        "TryInflictGastroAcidStatus",
+        "SetAquaRingHealingCountdownTo4",
+        "ApplyAquaRingHealing",
+        "TryInflictAquaRingStatus",
+        "TryInflictLuckyChantStatus",
+        "TryInflictHealBlockStatus",
+        "MonsterHasEmbargoStatus",
+        "LogItemBlockedByEmbargo",
+        "TryInflictEmbargoStatus",
+        "TryInflictMiracleEyeStatus",
+        "TryInflictMagnetRiseStatus",
+        "IsFloating",
+        "TryInflictSafeguardStatus",
+        "TryInflictMistStatus",
+        "TryInflictWishStatus",
+        "TryInflictMagicCoatStatus",
+        "TryInflictLightScreenStatus",
+        "TryInflictReflectStatus",
+        "TryInflictProtectStatus",
+        "TryInflictMirrorCoatStatus",
+        "TryInflictEndureStatus",
+        "TryInflictMirrorMoveStatus",
+        "TryInflictConversion2Status",
+        "TryInflictVitalThrowStatus",
+        "TryResetStatChanges",
+        "MirrorMoveIsActive",
+        "MistIsActive",
+        "Conversion2IsActive",
+        "AiConsiderMove",
+        "TryAddTargetToAiTargetList",
+        "IsAiTargetEligible",
+        "IsTargetInRange",
+        "ShouldUsePp",
+        "GetEntityMoveTargetAndRange",
+        "GetEntityNaturalGiftInfo",
+        "GetEntityWeatherBallType",
+        "ActivateMotorDrive",
+        "TryActivateFrisk",
+        "TryActivateBadDreams",
+        "ActivateStench",
+        "TryActivateSteadfast",
+        "IsInSpawnList",
+        "ChangeShayminForme",
+        "ApplyItemEffect",
+        "ApplyCheriBerryEffect",
+        "ApplyPechaBerryEffect",
+        "ApplyRawstBerryEffect",
+        "ApplyHungerSeedEffect",
+        "ApplyVileSeedEffect",
+        "ApplyViolentSeedEffect",
+        "ApplyGinsengEffect",
+        "ApplyBlastSeedEffect",
+        "ApplyGummiBoostsDungeonMode",
+        "CanMonsterUseItem",
+        "ApplyGrimyFoodEffect",
+        "ApplyMixElixirEffect",
+        "ApplyDoughSeedEffect",
+        "ApplyViaSeedEffect",
+        "ApplyGravelyrockEffect",
+        "ApplyGonePebbleEffect",
+        "ApplyGracideaEffect",
+        "GetAiUseItemProbability",
+        "IsAdjacentToEnemy",
+        "ShouldTryEatItem",
+        "GetMaxPpWrapper",
+        "MoveIsNotPhysical",
+        "CategoryIsNotPhysical",
+        "TryDrought",
+        "TryPounce",
+        "TryBlowAway",
+        "TryExplosion",
+        "TryAftermathExplosion",
+        "TryWarp",
+        "EnsureCanStandCurrentTile",
+        "TryActivateNondamagingDefenderAbility",
+        "TryActivateNondamagingDefenderExclusiveItem",
+        "GetMoveRangeDistance",
+        "MoveHitCheck",
+        "IsHyperBeamVariant",
+        "IsChargingTwoTurnMove",
+        "IsChargingAnyTwoTurnMove",
+        "HasMaxGinsengBoost99",
+        "TwoTurnMoveForcedMiss",
+        "DungeonRandOutcomeUserTargetInteraction",
+        "DungeonRandOutcomeUserAction",
+        "CanAiUseMove",
+        "CanMonsterUseMove",
+        "UpdateMovePp",
+        "GetDamageSourceWrapper",
+        "LowerSshort",
+        "PlayMoveAnimation",
+        "GetMoveAnimationId",
+        "ShouldMovePlayAlternativeAnimation",
+        "ExecuteMoveEffect",
+        "DoMoveDamageInlined",
+        "DealDamage",
+        "DealDamageWithTypeAndPowerBoost",
+        "DealDamageProjectile",
+        "DealDamageWithType",
+        "PerformDamageSequence",
+        "CanHitWithRegularAttack",
+        "StatusCheckerCheck",
+        "GetApparentWeather",
+        "TryWeatherFormChange",
+        "ActivateSportCondition",
+        "TryActivateWeather",
+        "DigitCount",
+        "LoadTextureUi",
+        "DisplayNumberTextureUi",
+        "DisplayCharTextureUi",
+        "DisplayUi",
+        "GetTile",
+        "GetTileSafe",
+        "IsFullFloorFixedRoom",
+        "IsCurrentTilesetBackground",
+        "TrySpawnGoldenChamber",
+        "CountItemsOnFloorForAcuteSniffer",
+        "GetStairsSpawnPosition",
+        "PositionIsOnStairs",
+        "GetStairsRoom",
+        "GetDefaultTileTextureId",
+        "DetermineAllTilesWalkableNeighbors",
+        "DetermineTileWalkableNeighbors",
+        "UpdateTrapsVisibility",
+        "DrawTileGrid",
+        "HideTileGrid",
+        "DiscoverMinimap",
+        "PositionHasItem",
+        "PositionHasMonster",
+        "TrySmashWall",
+        "IsWaterTileset",
+        "GetRandomSpawnMonsterID",
+        "NearbyAllyIqSkillIsEnabled",
+        "ResetGravity",
+        "GravityIsActive",
+        "TryActivateGravity",
+        "ShouldBoostKecleonShopSpawnChance",
+        "SetShouldBoostKecleonShopSpawnChance",
+        "UpdateShouldBoostKecleonShopSpawnChance",
+        "GetDoughSeedFlag",
+        "SetDoughSeedFlag",
+        "TrySpawnDoughSeedPoke",
+        "IsSecretBazaar",
+        "ShouldBoostHiddenStairsSpawnChance",
+        "SetShouldBoostHiddenStairsSpawnChance",
+        "UpdateShouldBoostHiddenStairsSpawnChance",
+        "IsSecretRoom",
+        "IsSecretFloor",
+        "GetCurrentHiddenStairsType",
+        "HiddenStairsPresent",
+        "PositionIsOnHiddenStairs",
+        "HiddenStairsTrigger",
+        "GetHiddenStairsField",
+        "SetHiddenStairsField",
+        "GetHiddenFloorField",
+        "SetHiddenFloorField",
+        "LoadWeather3DFiles",
+        "RenderWeather3D",
+        "GetMinimapData",
+        "DrawMinimapTile",
+        "FlashLeaderIcon",
+        "UpdateMinimap",
+        "SetMinimapDataE447",
+        "GetMinimapDataE447",
+        "SetMinimapDataE448",
+        "InitWeirdMinimapMatrix",
+        "InitMinimapDisplayTile",
+        "LoadFixedRoomDataVeneer",
+        "UnloadFixedRoomData",
+        "IsNormalFloor",
+        "GenerateFloor",
+        "GetTileTerrain",
+        "DungeonRand100",
+        "ClearHiddenStairs",
+        "FlagHallwayJunctions",
+        "GenerateStandardFloor",
+        "GenerateOuterRingFloor",
+        "GenerateCrossroadsFloor",
+        "GenerateLineFloor",
+        "GenerateCrossFloor",
+        "GenerateBeetleFloor",
+        "MergeRoomsVertically",
+        "GenerateOuterRoomsFloor",
+        "IsNotFullFloorFixedRoom",
+        "GenerateFixedRoom",
+        "GenerateOneRoomMonsterHouseFloor",
+        "GenerateTwoRoomsWithMonsterHouseFloor",
+        "GenerateExtraHallways",
+        "GetGridPositions",
+        "InitDungeonGrid",
+        "AssignRooms",
+        "CreateRoomsAndAnchors",
+        "GenerateSecondaryStructures",
+        "AssignGridCellConnections",
+        "CreateGridCellConnections",
+        "GenerateRoomImperfections",
+        "CreateHallway",
+        "EnsureConnectedGrid",
+        "SetTerrainObstacleChecked",
+        "FinalizeJunctions",
+        "GenerateKecleonShop",
+        "GenerateMonsterHouse",
+        "GenerateMazeRoom",
+        "GenerateMaze",
+        "GenerateMazeLine",
+        "SetSpawnFlag5",
+        "IsNextToHallway",
+        "ResolveInvalidSpawns",
+        "ConvertSecondaryTerrainToChasms",
+        "EnsureImpassableTilesAreWalls",
+        "InitializeTile",
+        "ResetFloor",
+        "PosIsOutOfBounds",
+        "ShuffleSpawnPositions",
+        "MarkNonEnemySpawns",
+        "MarkEnemySpawns",
+        "SetSecondaryTerrainOnWall",
+        "GenerateSecondaryTerrainFormations",
+        "StairsAlwaysReachable",
+        "GetNextFixedRoomAction",
+        "ConvertWallsToChasms",
+        "ResetInnerBoundaryTileRows",
+        "ResetImportantSpawnPositions",
+        "SpawnStairs",
+        "GetHiddenStairsType",
+        "GetFinalKecleonShopSpawnChance",
+        "ResetHiddenStairsSpawn",
+        "PlaceFixedRoomTile",
+        "FixedRoomActionParamToDirection",
+        "ApplyKeyEffect",
+        "LoadFixedRoomData",
+        "LoadFixedRoom",
+        "OpenFixedBin",
+        "CloseFixedBin",
+        "AreOrbsAllowed",
+        "AreTileJumpsAllowed",
+        "AreTrawlOrbsAllowed",
+        "AreOrbsAllowedVeneer",
+        "AreLateGameTrapsEnabled",
+        "AreMovesEnabled",
+        "IsRoomIlluminated",
+        "GetMatchingMonsterId",
+        "GenerateItemExplicit",
+        "GenerateAndSpawnItem",
+        "IsHiddenStairsFloor",
+        "IsSecretBazaarVeneer",
+        "GenerateStandardItem",
+        "GenerateCleanItem",
+        "TryLeaderItemPickUp",
+        "SpawnItem",
+        "RemoveGroundItem",
+        "SpawnDroppedItemWrapper",
+        "SpawnDroppedItem",
+        "TryGenerateUnownStoneDrop",
+        "HasHeldItem",
+        "GenerateMoneyQuantity",
+        "CheckTeamItemsFlags",
+        "AddHeldItemToBag",
+        "RemoveEmptyItemsInBagWrapper",
+        "GenerateItem",
+        "DoesProjectileHitTarget",
+        "DisplayFloorCard",
+        "HandleFloorCard",
+        "CheckActiveChallengeRequest",
+        "GetMissionDestination",
+        "IsOutlawOrChallengeRequestFloor",
+        "IsDestinationFloor",
+        "IsCurrentMissionType",
+        "IsCurrentMissionTypeExact",
+        "IsOutlawMonsterHouseFloor",
+        "IsGoldenChamber",
+        "IsLegendaryChallengeFloor",
+        "IsJirachiChallengeFloor",
+        "IsDestinationFloorWithMonster",
+        "LoadMissionMonsterSprites",
+        "MissionTargetEnemyIsDefeated",
+        "SetMissionTargetEnemyDefeated",
+        "IsDestinationFloorWithFixedRoom",
+        "GetItemToRetrieve",
+        "GetItemToDeliver",
+        "GetSpecialTargetItem",
+        "IsDestinationFloorWithItem",
+        "IsDestinationFloorWithHiddenOutlaw",
+        "IsDestinationFloorWithFleeingOutlaw",
+        "GetMissionTargetEnemy",
+        "GetMissionEnemyMinionGroup",
+        "SetTargetMonsterNotFoundFlag",
+        "GetTargetMonsterNotFoundFlag",
+        "FloorHasMissionMonster",
+        "GenerateMissionEggMonster",
+        "LogMessageByIdWithPopupCheckParticipants",
+        "LogMessageByIdWithPopupCheckUser",
+        "LogMessageWithPopupCheckUser",
+        "LogMessageByIdQuiet",
+        "LogMessageQuiet",
+        "LogMessageByIdWithPopupCheckUserTarget",
+        "LogMessageWithPopupCheckUserTarget",
+        "LogMessageByIdQuietCheckUserTarget",
+        "LogMessageByIdWithPopupCheckUserUnknown",
+        "LogMessageByIdWithPopup",
+        "LogMessageWithPopup",
+        "LogMessage",
+        "LogMessageById",
+        "InitPortraitDungeon",
+        "OpenMessageLog",
+        "RunDungeonMode",
+        "StartFadeDungeon",
+        "StartFadeDungeonWrapper",
+        "HandleFadesDungeon",
+        "HandleFadesDungeonBothScreens",
+        "DisplayFloorTip",
+        "DisplayItemTip",
+        "DisplayDungeonTip",
+        "SetBothScreensWindowColorToDefault",
+        "GetPersonalityIndex",
+        "DisplayMessage",
+        "DisplayMessage2",
+        "YesNoMenu",
+        "DisplayMessageInternal",
+        "OpenMenu",
+        "OthersMenuLoop",
+        "OthersMenu",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x23E0,
+            0x281C,
+            0x2840,
+            0x2850,
+            0x2870,
+            0x2CF8,
+            0xFFFFFFFF,
+            0x4170,
+            0x43E0,
+            0x4624,
+            0x4640,
+            0x4660,
+            0x468C,
+            0x46E8,
+            0x471C,
+            0x4728,
+            0x4A78,
+            0x53C8,
+            0x53D0,
+            0x53E8,
+            0x5800,
+            0x5844,
+            0x5850,
+            0x5E80,
+            0x6020,
+            0x60D4,
+            0x6258,
+            0x6334,
+            0x64EC,
+            0x650C,
+            0x65D0,
+            0x6714,
+            0x6738,
+            0x67F8,
+            0x6898,
+            0x6BDC,
+            0x6C84,
+            0x6CF4,
+            0xFFFFFFFF,
+            0x716C,
+            0x7260,
+            0x7414,
+            0x760C,
+            0x7650,
+            0x7710,
+            0x78E4,
+            0x7E48,
+            0x7E9C,
+            0x8794,
+            0x9D00,
+            0xFFFFFFFF,
+            0xA208,
+            0xADEC,
+            0xB8F4,
+            0xBA18,
+            0xBA90,
+            0xBB7C,
+            0xBBD0,
+            0xBC88,
+            0xBCF4,
+            0xBD74,
+            0xBF60,
+            0xBFC0,
+            0xC018,
+            0xC4F8,
+            0xC69C,
+            0xCA7C,
+            0xCE50,
+            0xCEBC,
+            0xCEFC,
+            0xCFD4,
+            0xD3B0,
+            0xD448,
+            0xD458,
+            0xD674,
+            0xD820,
+            0xD83C,
+            0xD858,
+            0xD874,
+            0xDE10,
+            0xE548,
+            0xE798,
+            0xE7B0,
+            0xE7FC,
+            0xE80C,
+            0xE81C,
+            0xE850,
+            0xE8C8,
+            0xE8F0,
+            0xFFFFFFFF,
+            0xE9B0,
+            0xEA64,
+            0xEA7C,
+            0xEA94,
+            0xEB30,
+            0xEC44,
+            0xEFA8,
+            0xF1F8,
+            0xF224,
+            0xF238,
+            0xF24C,
+            0xF27C,
+            0xF37C,
+            0xF408,
+            0xF43C,
+            0xF64C,
+            0xF724,
+            0xFA80,
+            0xFAC8,
+            0xFAEC,
+            0xFB38,
+            0x10138,
+            0x1050C,
+            0x10618,
+            0x10978,
+            0x10D74,
+            0x10E38,
+            0x10E4C,
+            0x11688,
+            0x11698,
+            0x117A0,
+            0x11A04,
+            0x11AEC,
+            0x11C04,
+            0x11CAC,
+            0x11DD0,
+            0x1219C,
+            0x12264,
+            0x12460,
+            0x12654,
+            0x127C8,
+            0x12864,
+            0x1294C,
+            0x12B60,
+            0x12C84,
+            0x12D20,
+            0x12D74,
+            0x12EA8,
+            0x12F88,
+            0x1340C,
+            0x13820,
+            0x138A0,
+            0x138A8,
+            0x13938,
+            0x149C0,
+            0x149E0,
+            0x14D10,
+            0x16EC4,
+            0x1746C,
+            0x17770,
+            0x19108,
+            0x19134,
+            0x192F8,
+            0x1AC50,
+            0x1AD48,
+            0x1ADA0,
+            0x1AE40,
+            0x1AE88,
+            0x1AEA0,
+            0x1B1C0,
+            0x1B1E0,
+            0x1B1EC,
+            0x1B224,
+            0x1B244,
+            0x1B30C,
+            0x1B40C,
+            0x1B48C,
+            0x1B5A0,
+            0x1B63C,
+            0x1BD68,
+            0x1BDB8,
+            0x1C47C,
+            0x1C858,
+            0x1CFD0,
+            0x1D020,
+            0x1D0C8,
+            0x1D164,
+            0x1D294,
+            0x1D37C,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x1D5D0,
+            0x1D67C,
+            0x1D740,
+            0x1D7FC,
+            0x1D878,
+            0x1D900,
+            0x1DACC,
+            0x1DAF4,
+            0x1DFD0,
+            0x1E2BC,
+            0x1E47C,
+            0x1E668,
+            0xFFFFFFFF,
+            0x1EE84,
+            0x1EEF0,
+            0x1EF0C,
+            0x1EF34,
+            0x1EF98,
+            0x1F0A0,
+            0x1F3C4,
+            0x1F478,
+            0x1F49C,
+            0x1F504,
+            0x1F94C,
+            0x1F96C,
+            0x1FCD4,
+            0x1FDD4,
+            0x200B0,
+            0x20388,
+            0x20BF4,
+            0x20F00,
+            0x21230,
+            0x21850,
+            0x21C3C,
+            0x22014,
+            0x220C8,
+            0x22178,
+            0x221CC,
+            0x22234,
+            0x2229C,
+            0x2235C,
+            0x23014,
+            0x23074,
+            0x234D8,
+            0x23520,
+            0x23570,
+            0x23774,
+            0x23B48,
+            0x23CA0,
+            0x23DF8,
+            0x23E08,
+            0x23FB4,
+            0x24010,
+            0x24174,
+            0x2435C,
+            0x24390,
+            0x243AC,
+            0x243CC,
+            0x243E8,
+            0x24434,
+            0x24450,
+            0x2446C,
+            0x244A8,
+            0x244C4,
+            0x244E0,
+            0x24654,
+            0x246C4,
+            0x249EC,
+            0x24B5C,
+            0x24D24,
+            0x24DDC,
+            0x24FC4,
+            0x250E0,
+            0x251A4,
+            0x25464,
+            0x25554,
+            0x25608,
+            0x257EC,
+            0x25840,
+            0x259D8,
+            0x25B88,
+            0x25BBC,
+            0x25C24,
+            0x25C30,
+            0x25CC4,
+            0x25CFC,
+            0x25D34,
+            0x25D58,
+            0x25D98,
+            0x25DCC,
+            0x25DFC,
+            0x25E2C,
+            0x25E68,
+            0x26128,
+            0x261C8,
+            0x26214,
+            0x2626C,
+            0x262DC,
+            0x263E8,
+            0x265A8,
+            0x26908,
+            0x26E34,
+            0x26EE8,
+            0x279C4,
+            0x27B28,
+            0x28854,
+            0x28960,
+            0x28A10,
+            0x28A58,
+            0x28E8C,
+            0x29540,
+            0x29770,
+            0x29AD4,
+            0x29AE8,
+            0x29E88,
+            0x2A054,
+            0x2A104,
+            0x2A280,
+            0x2A3A0,
+            0x2A584,
+            0x2A5D4,
+            0x2A770,
+            0x2A7FC,
+            0x2A8AC,
+            0x2A9D4,
+            0x2AAA4,
+            0x2AB10,
+            0x2AB7C,
+            0x2B798,
+            0x2BB24,
+            0x2BBC4,
+            0x2BC00,
+            0x2BDF8,
+            0x2C14C,
+            0x2C1EC,
+            0x2C4E8,
+            0x2CE8C,
+            0x2E900,
+            0x2E980,
+            0x2EA4C,
+            0x2EAE4,
+            0x2EAF8,
+            0x2EB4C,
+            0x2EBF8,
+            0x2FAA0,
+            0x31010,
+            0x31080,
+            0x31134,
+            0x3129C,
+            0x312E8,
+            0x31334,
+            0x31370,
+            0x3141C,
+            0x31A08,
+            0x31AC4,
+            0x31F58,
+            0x325B0,
+            0x32808,
+            0x32CA4,
+            0x32F20,
+            0x33058,
+            0x33548,
+            0x335BC,
+            0x3366C,
+            0x3367C,
+            0x3368C,
+            0x33734,
+            0x338CC,
+            0x33A84,
+            0x34F68,
+            0x35704,
+            0x357B8,
+            0x358C4,
+            0x35B2C,
+            0x35C40,
+            0x35D50,
+            0x35E60,
+            0x35F4C,
+            0x3608C,
+            0x36218,
+            0x364F8,
+            0x36544,
+            0x3681C,
+            0x36AD8,
+            0x36D00,
+            0x36E58,
+            0x37010,
+            0x370D4,
+            0x372D0,
+            0x3734C,
+            0x374DC,
+            0x376F4,
+            0x3787C,
+            0x379E8,
+            0x37B54,
+            0x37BC4,
+            0x37C20,
+            0x37E44,
+            0x37FC4,
+            0x3810C,
+            0x382C8,
+            0x38424,
+            0x386F0,
+            0x3881C,
+            0x38834,
+            0x3899C,
+            0x38B0C,
+            0x38B6C,
+            0x38C20,
+            0x38CFC,
+            0x38D40,
+            0x38D98,
+            0x38E18,
+            0x3904C,
+            0x3914C,
+            0x391C4,
+            0x394F0,
+            0x39580,
+            0x3963C,
+            0x396CC,
+            0x39930,
+            0x39A50,
+            0x39AE0,
+            0x39BC8,
+            0x39C64,
+            0x39D04,
+            0x39FBC,
+            0x3A160,
+            0x3A288,
+            0x3A3B8,
+            0x3A45C,
+            0x3A50C,
+            0x3A600,
+            0x3A7B8,
+            0x3AA90,
+            0x3B004,
+            0x3B0FC,
+            0x3B2EC,
+            0x3B3A8,
+            0x3B528,
+            0x3B5AC,
+            0x3B6C4,
+            0x3B724,
+            0x3B83C,
+            0x3B8EC,
+            0x3B9D4,
+            0x3BB00,
+            0x3BC38,
+            0x3BD68,
+            0x3BE30,
+            0x3BEC4,
+            0x3BF58,
+            0x3BFEC,
+            0x3C080,
+            0x3C0F0,
+            0x3C15C,
+            0x3C2A0,
+            0x3C2C8,
+            0x3C33C,
+            0x3C3E8,
+            0x3C488,
+            0x3C5AC,
+            0x3C5E0,
+            0x3C60C,
+            0x3C730,
+            0x3C864,
+            0x3C92C,
+            0x3CD50,
+            0x3CDF0,
+            0x3CE8C,
+            0x3CF2C,
+            0x3CFCC,
+            0x3D06C,
+            0x3D10C,
+            0x3D1BC,
+            0x3D258,
+            0x3D2F8,
+            0x3D398,
+            0x3D464,
+            0x3D504,
+            0x3D628,
+            0x3D6AC,
+            0x3D6F4,
+            0x3D760,
+            0x3DE90,
+            0x3DF84,
+            0x3E574,
+            0x3E680,
+            0x3EB8C,
+            0x3ED70,
+            0x3EDEC,
+            0x3EF40,
+            0x3EF84,
+            0x3F098,
+            0x3F21C,
+            0x3F244,
+            0x3F2DC,
+            0x3F3CC,
+            0x3F56C,
+            0x40AD4,
+            0x40B00,
+            0x40B34,
+            0x40B7C,
+            0x40C68,
+            0x40D04,
+            0x40D50,
+            0x40E6C,
+            0x40FA8,
+            0x4138C,
+            0x4141C,
+            0x41568,
+            0x415C8,
+            0x41634,
+            0x416A8,
+            0x41720,
+            0x418A8,
+            0x41F44,
+            0x427D8,
+            0x42878,
+            0x428D8,
+            0x42900,
+            0x42918,
+            0x4347C,
+            0x43B08,
+            0x43CC8,
+            0x44330,
+            0x44670,
+            0x44BF0,
+            0x44FEC,
+            0x45960,
+            0x45BD8,
+            0x4618C,
+            0x47B30,
+            0x4841C,
+            0x4848C,
+            0x48504,
+            0x48680,
+            0x4873C,
+            0x4881C,
+            0x48908,
+            0x4895C,
+            0x48A0C,
+            0x48C74,
+            0x48D2C,
+            0x48D4C,
+            0x4959C,
+            0x499F8,
+            0x49B60,
+            0x52724,
+            0x56930,
+            0x569E0,
+            0x56A78,
+            0x56B0C,
+            0x56B9C,
+            0x56C2C,
+            0x56E88,
+            0x56F34,
+            0x58BC8,
+            0x59030,
+            0x5930C,
+            0x59384,
+            0x59530,
+            0x59580,
+            0x5974C,
+            0x59854,
+            0x598DC,
+            0x5A14C,
+            0x5A1B4,
+            0x5A224,
+            0x5A254,
+            0x5A274,
+            0x5A2B0,
+            0x5A410,
+            0x5A43C,
+            0x5A478,
+            0x5A4A0,
+            0x5AA9C,
+            0x5AAD4,
+            0x5AF9C,
+            0x5B478,
+            0x5B7EC,
+            0x5BA8C,
+            0x5BB7C,
+            0x5BBB8,
+            0x5BBEC,
+            0x5BEE4,
+            0x5BFE8,
+            0x5C2D8,
+            0x5C3BC,
+            0x5C3E0,
+            0x5C40C,
+            0x5C510,
+            0x5C528,
+            0x5C540,
+            0x5C580,
+            0x5C598,
+            0x5C5B0,
+            0x5C614,
+            0x5C63C,
+            0x5C654,
+            0x5C66C,
+            0x5C6AC,
+            0x5C6D4,
+            0x5C700,
+            0x5C728,
+            0x5C758,
+            0x5C7E4,
+            0x5C8A0,
+            0x5C8B8,
+            0x5C8D0,
+            0x5C8E8,
+            0x5C900,
+            0x5CB14,
+            0x5D168,
+            0x5D23C,
+            0x5DA74,
+            0x5DD38,
+            0x5E268,
+            0x5E280,
+            0x5E294,
+            0x5E2F4,
+            0x5E354,
+            0x5E688,
+            0x5E694,
+            0x5E6B8,
+            0x5E73C,
+            0x5EEDC,
+            0x5EEE8,
+            0x5EEF8,
+            0x5EF70,
+            0x5F08C,
+            0x5F1F4,
+            0x5F680,
+            0x5FAE0,
+            0x5FC40,
+            0x5FDD8,
+            0x5FF94,
+            0x600E0,
+            0x60374,
+            0x60390,
+            0x607D8,
+            0x608A8,
+            0x60A4C,
+            0x60FE8,
+            0x61068,
+            0x61168,
+            0x6137C,
+            0x616D8,
+            0x620C0,
+            0x624A0,
+            0x62D98,
+            0x63184,
+            0x63488,
+            0x63964,
+            0x639A0,
+            0x63C4C,
+            0x64000,
+            0x64288,
+            0x644BC,
+            0x64738,
+            0x648E0,
+            0x64934,
+            0x649D8,
+            0x64A70,
+            0x64ADC,
+            0x64B38,
+            0x64B70,
+            0x64D10,
+            0x64D48,
+            0x64DB0,
+            0x654D4,
+            0x657D0,
+            0x65810,
+            0x65ED0,
+            0x66534,
+            0x665AC,
+            0x66BE0,
+            0x66CCC,
+            0x66CF0,
+            0x66E00,
+            0x66F20,
+            0x66F6C,
+            0x66F94,
+            0x679D0,
+            0x67D3C,
+            0x67DF4,
+            0x67E84,
+            0x680B8,
+            0x680EC,
+            0x68110,
+            0x68140,
+            0x68170,
+            0x681A0,
+            0x681AC,
+            0x681C4,
+            0x681DC,
+            0x681F4,
+            0x68418,
+            0x68494,
+            0x68570,
+            0x6859C,
+            0x68C34,
+            0x68C48,
+            0x690C0,
+            0x695A0,
+            0x69728,
+            0x69AA8,
+            0x69B44,
+            0x6A0CC,
+            0x6A850,
+            0x6A8A0,
+            0x6AC4C,
+            0x6AF90,
+            0x6B0AC,
+            0x6B344,
+            0x6C0A0,
+            0x6C354,
+            0x6C38C,
+            0x6D1CC,
+            0x6D224,
+            0x6D244,
+            0x6D288,
+            0x6D29C,
+            0x6D2D0,
+            0x6D30C,
+            0x6D330,
+            0x6D354,
+            0x6D394,
+            0x6D3CC,
+            0x6D478,
+            0x6D4F0,
+            0x6D510,
+            0x6D524,
+            0x6D54C,
+            0x6D570,
+            0x6D59C,
+            0x6D5E4,
+            0x6D644,
+            0x6D668,
+            0x6D6A0,
+            0x6D6B8,
+            0x6D744,
+            0x6D758,
+            0x6D7C8,
+            0x6D920,
+            0x6F2D0,
+            0x6F324,
+            0x6F364,
+            0x6F39C,
+            0x6F3C0,
+            0x6F3D0,
+            0x6F424,
+            0x6F470,
+            0x6F4C4,
+            0x6F518,
+            0x6F53C,
+            0x6F588,
+            0x6F794,
+            0x6FB40,
+            0x6FBDC,
+            0x6FFA8,
+            0x70488,
+            0x706E8,
+            0x70854,
+            0x70A64,
+            0x70C08,
+            0x70D34,
+            0x70F70,
+            0x70FE0,
+            0x7106C,
+            0x712D8,
+            0x7132C,
+            0x71598,
+            0x71610,
+            0x71E74,
+            0x7384C,
+            0x73AB0,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x22DEF60,
+            0x22DF39C,
+            0x22DF3C0,
+            0x22DF3D0,
+            0x22DF3F0,
+            0x22DF878,
+            0xFFFFFFFF,
+            0x22E0CF0,
+            0x22E0F60,
+            0x22E11A4,
+            0x22E11C0,
+            0x22E11E0,
+            0x22E120C,
+            0x22E1268,
+            0x22E129C,
+            0x22E12A8,
+            0x22E15F8,
+            0x22E1F48,
+            0x22E1F50,
+            0x22E1F68,
+            0x22E2380,
+            0x22E23C4,
+            0x22E23D0,
+            0x22E2A00,
+            0x22E2BA0,
+            0x22E2C54,
+            0x22E2DD8,
+            0x22E2EB4,
+            0x22E306C,
+            0x22E308C,
+            0x22E3150,
+            0x22E3294,
+            0x22E32B8,
+            0x22E3378,
+            0x22E3418,
+            0x22E375C,
+            0x22E3804,
+            0x22E3874,
+            0xFFFFFFFF,
+            0x22E3CEC,
+            0x22E3DE0,
+            0x22E3F94,
+            0x22E418C,
+            0x22E41D0,
+            0x22E4290,
+            0x22E4464,
+            0x22E49C8,
+            0x22E4A1C,
+            0x22E5314,
+            0x22E6880,
+            0xFFFFFFFF,
+            0x22E6D88,
+            0x22E796C,
+            0x22E8474,
+            0x22E8598,
+            0x22E8610,
+            0x22E86FC,
+            0x22E8750,
+            0x22E8808,
+            0x22E8874,
+            0x22E88F4,
+            0x22E8AE0,
+            0x22E8B40,
+            0x22E8B98,
+            0x22E9078,
+            0x22E921C,
+            0x22E95FC,
+            0x22E99D0,
+            0x22E9A3C,
+            0x22E9A7C,
+            0x22E9B54,
+            0x22E9F30,
+            0x22E9FC8,
+            0x22E9FD8,
+            0x22EA1F4,
+            0x22EA3A0,
+            0x22EA3BC,
+            0x22EA3D8,
+            0x22EA3F4,
+            0x22EA990,
+            0x22EB0C8,
+            0x22EB318,
+            0x22EB330,
+            0x22EB37C,
+            0x22EB38C,
+            0x22EB39C,
+            0x22EB3D0,
+            0x22EB448,
+            0x22EB470,
+            0xFFFFFFFF,
+            0x22EB530,
+            0x22EB5E4,
+            0x22EB5FC,
+            0x22EB614,
+            0x22EB6B0,
+            0x22EB7C4,
+            0x22EBB28,
+            0x22EBD78,
+            0x22EBDA4,
+            0x22EBDB8,
+            0x22EBDCC,
+            0x22EBDFC,
+            0x22EBEFC,
+            0x22EBF88,
+            0x22EBFBC,
+            0x22EC1CC,
+            0x22EC2A4,
+            0x22EC600,
+            0x22EC648,
+            0x22EC66C,
+            0x22EC6B8,
+            0x22ECCB8,
+            0x22ED08C,
+            0x22ED198,
+            0x22ED4F8,
+            0x22ED8F4,
+            0x22ED9B8,
+            0x22ED9CC,
+            0x22EE208,
+            0x22EE218,
+            0x22EE320,
+            0x22EE584,
+            0x22EE66C,
+            0x22EE784,
+            0x22EE82C,
+            0x22EE950,
+            0x22EED1C,
+            0x22EEDE4,
+            0x22EEFE0,
+            0x22EF1D4,
+            0x22EF348,
+            0x22EF3E4,
+            0x22EF4CC,
+            0x22EF6E0,
+            0x22EF804,
+            0x22EF8A0,
+            0x22EF8F4,
+            0x22EFA28,
+            0x22EFB08,
+            0x22EFF8C,
+            0x22F03A0,
+            0x22F0420,
+            0x22F0428,
+            0x22F04B8,
+            0x22F1540,
+            0x22F1560,
+            0x22F1890,
+            0x22F3A44,
+            0x22F3FEC,
+            0x22F42F0,
+            0x22F5C88,
+            0x22F5CB4,
+            0x22F5E78,
+            0x22F77D0,
+            0x22F78C8,
+            0x22F7920,
+            0x22F79C0,
+            0x22F7A08,
+            0x22F7A20,
+            0x22F7D40,
+            0x22F7D60,
+            0x22F7D6C,
+            0x22F7DA4,
+            0x22F7DC4,
+            0x22F7E8C,
+            0x22F7F8C,
+            0x22F800C,
+            0x22F8120,
+            0x22F81BC,
+            0x22F88E8,
+            0x22F8938,
+            0x22F8FFC,
+            0x22F93D8,
+            0x22F9B50,
+            0x22F9BA0,
+            0x22F9C48,
+            0x22F9CE4,
+            0x22F9E14,
+            0x22F9EFC,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x22FA150,
+            0x22FA1FC,
+            0x22FA2C0,
+            0x22FA37C,
+            0x22FA3F8,
+            0x22FA480,
+            0x22FA64C,
+            0x22FA674,
+            0x22FAB50,
+            0x22FAE3C,
+            0x22FAFFC,
+            0x22FB1E8,
+            0xFFFFFFFF,
+            0x22FBA04,
+            0x22FBA70,
+            0x22FBA8C,
+            0x22FBAB4,
+            0x22FBB18,
+            0x22FBC20,
+            0x22FBF44,
+            0x22FBFF8,
+            0x22FC01C,
+            0x22FC084,
+            0x22FC4CC,
+            0x22FC4EC,
+            0x22FC854,
+            0x22FC954,
+            0x22FCC30,
+            0x22FCF08,
+            0x22FD774,
+            0x22FDA80,
+            0x22FDDB0,
+            0x22FE3D0,
+            0x22FE7BC,
+            0x22FEB94,
+            0x22FEC48,
+            0x22FECF8,
+            0x22FED4C,
+            0x22FEDB4,
+            0x22FEE1C,
+            0x22FEEDC,
+            0x22FFB94,
+            0x22FFBF4,
+            0x2300058,
+            0x23000A0,
+            0x23000F0,
+            0x23002F4,
+            0x23006C8,
+            0x2300820,
+            0x2300978,
+            0x2300988,
+            0x2300B34,
+            0x2300B90,
+            0x2300CF4,
+            0x2300EDC,
+            0x2300F10,
+            0x2300F2C,
+            0x2300F4C,
+            0x2300F68,
+            0x2300FB4,
+            0x2300FD0,
+            0x2300FEC,
+            0x2301028,
+            0x2301044,
+            0x2301060,
+            0x23011D4,
+            0x2301244,
+            0x230156C,
+            0x23016DC,
+            0x23018A4,
+            0x230195C,
+            0x2301B44,
+            0x2301C60,
+            0x2301D24,
+            0x2301FE4,
+            0x23020D4,
+            0x2302188,
+            0x230236C,
+            0x23023C0,
+            0x2302558,
+            0x2302708,
+            0x230273C,
+            0x23027A4,
+            0x23027B0,
+            0x2302844,
+            0x230287C,
+            0x23028B4,
+            0x23028D8,
+            0x2302918,
+            0x230294C,
+            0x230297C,
+            0x23029AC,
+            0x23029E8,
+            0x2302CA8,
+            0x2302D48,
+            0x2302D94,
+            0x2302DEC,
+            0x2302E5C,
+            0x2302F68,
+            0x2303128,
+            0x2303488,
+            0x23039B4,
+            0x2303A68,
+            0x2304544,
+            0x23046A8,
+            0x23053D4,
+            0x23054E0,
+            0x2305590,
+            0x23055D8,
+            0x2305A0C,
+            0x23060C0,
+            0x23062F0,
+            0x2306654,
+            0x2306668,
+            0x2306A08,
+            0x2306BD4,
+            0x2306C84,
+            0x2306E00,
+            0x2306F20,
+            0x2307104,
+            0x2307154,
+            0x23072F0,
+            0x230737C,
+            0x230742C,
+            0x2307554,
+            0x2307624,
+            0x2307690,
+            0x23076FC,
+            0x2308318,
+            0x23086A4,
+            0x2308744,
+            0x2308780,
+            0x2308978,
+            0x2308CCC,
+            0x2308D6C,
+            0x2309068,
+            0x2309A0C,
+            0x230B480,
+            0x230B500,
+            0x230B5CC,
+            0x230B664,
+            0x230B678,
+            0x230B6CC,
+            0x230B778,
+            0x230C620,
+            0x230DB90,
+            0x230DC00,
+            0x230DCB4,
+            0x230DE1C,
+            0x230DE68,
+            0x230DEB4,
+            0x230DEF0,
+            0x230DF9C,
+            0x230E588,
+            0x230E644,
+            0x230EAD8,
+            0x230F130,
+            0x230F388,
+            0x230F824,
+            0x230FAA0,
+            0x230FBD8,
+            0x23100C8,
+            0x231013C,
+            0x23101EC,
+            0x23101FC,
+            0x231020C,
+            0x23102B4,
+            0x231044C,
+            0x2310604,
+            0x2311AE8,
+            0x2312284,
+            0x2312338,
+            0x2312444,
+            0x23126AC,
+            0x23127C0,
+            0x23128D0,
+            0x23129E0,
+            0x2312ACC,
+            0x2312C0C,
+            0x2312D98,
+            0x2313078,
+            0x23130C4,
+            0x231339C,
+            0x2313658,
+            0x2313880,
+            0x23139D8,
+            0x2313B90,
+            0x2313C54,
+            0x2313E50,
+            0x2313ECC,
+            0x231405C,
+            0x2314274,
+            0x23143FC,
+            0x2314568,
+            0x23146D4,
+            0x2314744,
+            0x23147A0,
+            0x23149C4,
+            0x2314B44,
+            0x2314C8C,
+            0x2314E48,
+            0x2314FA4,
+            0x2315270,
+            0x231539C,
+            0x23153B4,
+            0x231551C,
+            0x231568C,
+            0x23156EC,
+            0x23157A0,
+            0x231587C,
+            0x23158C0,
+            0x2315918,
+            0x2315998,
+            0x2315BCC,
+            0x2315CCC,
+            0x2315D44,
+            0x2316070,
+            0x2316100,
+            0x23161BC,
+            0x231624C,
+            0x23164B0,
+            0x23165D0,
+            0x2316660,
+            0x2316748,
+            0x23167E4,
+            0x2316884,
+            0x2316B3C,
+            0x2316CE0,
+            0x2316E08,
+            0x2316F38,
+            0x2316FDC,
+            0x231708C,
+            0x2317180,
+            0x2317338,
+            0x2317610,
+            0x2317B84,
+            0x2317C7C,
+            0x2317E6C,
+            0x2317F28,
+            0x23180A8,
+            0x231812C,
+            0x2318244,
+            0x23182A4,
+            0x23183BC,
+            0x231846C,
+            0x2318554,
+            0x2318680,
+            0x23187B8,
+            0x23188E8,
+            0x23189B0,
+            0x2318A44,
+            0x2318AD8,
+            0x2318B6C,
+            0x2318C00,
+            0x2318C70,
+            0x2318CDC,
+            0x2318E20,
+            0x2318E48,
+            0x2318EBC,
+            0x2318F68,
+            0x2319008,
+            0x231912C,
+            0x2319160,
+            0x231918C,
+            0x23192B0,
+            0x23193E4,
+            0x23194AC,
+            0x23198D0,
+            0x2319970,
+            0x2319A0C,
+            0x2319AAC,
+            0x2319B4C,
+            0x2319BEC,
+            0x2319C8C,
+            0x2319D3C,
+            0x2319DD8,
+            0x2319E78,
+            0x2319F18,
+            0x2319FE4,
+            0x231A084,
+            0x231A1A8,
+            0x231A22C,
+            0x231A274,
+            0x231A2E0,
+            0x231AA10,
+            0x231AB04,
+            0x231B0F4,
+            0x231B200,
+            0x231B70C,
+            0x231B8F0,
+            0x231B96C,
+            0x231BAC0,
+            0x231BB04,
+            0x231BC18,
+            0x231BD9C,
+            0x231BDC4,
+            0x231BE5C,
+            0x231BF4C,
+            0x231C0EC,
+            0x231D654,
+            0x231D680,
+            0x231D6B4,
+            0x231D6FC,
+            0x231D7E8,
+            0x231D884,
+            0x231D8D0,
+            0x231D9EC,
+            0x231DB28,
+            0x231DF0C,
+            0x231DF9C,
+            0x231E0E8,
+            0x231E148,
+            0x231E1B4,
+            0x231E228,
+            0x231E2A0,
+            0x231E428,
+            0x231EAC4,
+            0x231F358,
+            0x231F3F8,
+            0x231F458,
+            0x231F480,
+            0x231F498,
+            0x231FFFC,
+            0x2320688,
+            0x2320848,
+            0x2320EB0,
+            0x23211F0,
+            0x2321770,
+            0x2321B6C,
+            0x23224E0,
+            0x2322758,
+            0x2322D0C,
+            0x23246B0,
+            0x2324F9C,
+            0x232500C,
+            0x2325084,
+            0x2325200,
+            0x23252BC,
+            0x232539C,
+            0x2325488,
+            0x23254DC,
+            0x232558C,
+            0x23257F4,
+            0x23258AC,
+            0x23258CC,
+            0x232611C,
+            0x2326578,
+            0x23266E0,
+            0x232F2A4,
+            0x23334B0,
+            0x2333560,
+            0x23335F8,
+            0x233368C,
+            0x233371C,
+            0x23337AC,
+            0x2333A08,
+            0x2333AB4,
+            0x2335748,
+            0x2335BB0,
+            0x2335E8C,
+            0x2335F04,
+            0x23360B0,
+            0x2336100,
+            0x23362CC,
+            0x23363D4,
+            0x233645C,
+            0x2336CCC,
+            0x2336D34,
+            0x2336DA4,
+            0x2336DD4,
+            0x2336DF4,
+            0x2336E30,
+            0x2336F90,
+            0x2336FBC,
+            0x2336FF8,
+            0x2337020,
+            0x233761C,
+            0x2337654,
+            0x2337B1C,
+            0x2337FF8,
+            0x233836C,
+            0x233860C,
+            0x23386FC,
+            0x2338738,
+            0x233876C,
+            0x2338A64,
+            0x2338B68,
+            0x2338E58,
+            0x2338F3C,
+            0x2338F60,
+            0x2338F8C,
+            0x2339090,
+            0x23390A8,
+            0x23390C0,
+            0x2339100,
+            0x2339118,
+            0x2339130,
+            0x2339194,
+            0x23391BC,
+            0x23391D4,
+            0x23391EC,
+            0x233922C,
+            0x2339254,
+            0x2339280,
+            0x23392A8,
+            0x23392D8,
+            0x2339364,
+            0x2339420,
+            0x2339438,
+            0x2339450,
+            0x2339468,
+            0x2339480,
+            0x2339694,
+            0x2339CE8,
+            0x2339DBC,
+            0x233A5F4,
+            0x233A8B8,
+            0x233ADE8,
+            0x233AE00,
+            0x233AE14,
+            0x233AE74,
+            0x233AED4,
+            0x233B208,
+            0x233B214,
+            0x233B238,
+            0x233B2BC,
+            0x233BA5C,
+            0x233BA68,
+            0x233BA78,
+            0x233BAF0,
+            0x233BC0C,
+            0x233BD74,
+            0x233C200,
+            0x233C660,
+            0x233C7C0,
+            0x233C958,
+            0x233CB14,
+            0x233CC60,
+            0x233CEF4,
+            0x233CF10,
+            0x233D358,
+            0x233D428,
+            0x233D5CC,
+            0x233DB68,
+            0x233DBE8,
+            0x233DCE8,
+            0x233DEFC,
+            0x233E258,
+            0x233EC40,
+            0x233F020,
+            0x233F918,
+            0x233FD04,
+            0x2340008,
+            0x23404E4,
+            0x2340520,
+            0x23407CC,
+            0x2340B80,
+            0x2340E08,
+            0x234103C,
+            0x23412B8,
+            0x2341460,
+            0x23414B4,
+            0x2341558,
+            0x23415F0,
+            0x234165C,
+            0x23416B8,
+            0x23416F0,
+            0x2341890,
+            0x23418C8,
+            0x2341930,
+            0x2342054,
+            0x2342350,
+            0x2342390,
+            0x2342A50,
+            0x23430B4,
+            0x234312C,
+            0x2343760,
+            0x234384C,
+            0x2343870,
+            0x2343980,
+            0x2343AA0,
+            0x2343AEC,
+            0x2343B14,
+            0x2344550,
+            0x23448BC,
+            0x2344974,
+            0x2344A04,
+            0x2344C38,
+            0x2344C6C,
+            0x2344C90,
+            0x2344CC0,
+            0x2344CF0,
+            0x2344D20,
+            0x2344D2C,
+            0x2344D44,
+            0x2344D5C,
+            0x2344D74,
+            0x2344F98,
+            0x2345014,
+            0x23450F0,
+            0x234511C,
+            0x23457B4,
+            0x23457C8,
+            0x2345C40,
+            0x2346120,
+            0x23462A8,
+            0x2346628,
+            0x23466C4,
+            0x2346C4C,
+            0x23473D0,
+            0x2347420,
+            0x23477CC,
+            0x2347B10,
+            0x2347C2C,
+            0x2347EC4,
+            0x2348C20,
+            0x2348ED4,
+            0x2348F0C,
+            0x2349D4C,
+            0x2349DA4,
+            0x2349DC4,
+            0x2349E08,
+            0x2349E1C,
+            0x2349E50,
+            0x2349E8C,
+            0x2349EB0,
+            0x2349ED4,
+            0x2349F14,
+            0x2349F4C,
+            0x2349FF8,
+            0x234A070,
+            0x234A090,
+            0x234A0A4,
+            0x234A0CC,
+            0x234A0F0,
+            0x234A11C,
+            0x234A164,
+            0x234A1C4,
+            0x234A1E8,
+            0x234A220,
+            0x234A238,
+            0x234A2C4,
+            0x234A2D8,
+            0x234A348,
+            0x234A4A0,
+            0x234BE50,
+            0x234BEA4,
+            0x234BEE4,
+            0x234BF1C,
+            0x234BF40,
+            0x234BF50,
+            0x234BFA4,
+            0x234BFF0,
+            0x234C044,
+            0x234C098,
+            0x234C0BC,
+            0x234C108,
+            0x234C314,
+            0x234C6C0,
+            0x234C75C,
+            0x234CB28,
+            0x234D008,
+            0x234D268,
+            0x234D3D4,
+            0x234D5E4,
+            0x234D788,
+            0x234D8B4,
+            0x234DAF0,
+            0x234DB60,
+            0x234DBEC,
+            0x234DE58,
+            0x234DEAC,
+            0x234E118,
+            0x234E190,
+            0x234E9F4,
+            0x23503CC,
+            0x2350630,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1893,
+            1894,
+            1895,
+            1896,
+            1897,
+            1898,
+            1899,
+            1900,
+            1901,
+            1902,
+            196,
+            1903,
+            1904,
+            1905,
+            1906,
+            1907,
+            1908,
+            1909,
+            1910,
+            1911,
+            1912,
+            1913,
+            1913,
+            1914,
+            1915,
+            1916,
+            1917,
+            1918,
+            1919,
+            1920,
+            1921,
+            1922,
+            1923,
+            1924,
+            1925,
+            1926,
+            1927,
+            1928,
+            1929,
+            1930,
+            1931,
+            1932,
+            1933,
+            1934,
+            1935,
+            1936,
+            1937,
+            1938,
+            1939,
+            1940,
+            1941,
+            1942,
+            1943,
+            1944,
+            1945,
+            1946,
+            1947,
+            1948,
+            1949,
+            1950,
+            1951,
+            1952,
+            1953,
+            1954,
+            1955,
+            1956,
+            1957,
+            1958,
+            1959,
+            1960,
+            1961,
+            1962,
+            1963,
+            1964,
+            1965,
+            1966,
+            1967,
+            1968,
+            1969,
+            1970,
+            1971,
+            1972,
+            1973,
+            1974,
+            1975,
+            1976,
+            1977,
+            1978,
+            1979,
+            1980,
+            1981,
+            1982,
+            1983,
+            1984,
+            1985,
+            1986,
+            1987,
+            1988,
+            1989,
+            1990,
+            1991,
+            1992,
+            1993,
+            1994,
+            1995,
+            1996,
+            1997,
+            1998,
+            1999,
+            2000,
+            2001,
+            2002,
+            2003,
+            2004,
+            2005,
+            2006,
+            2007,
+            2008,
+            2009,
+            2010,
+            2011,
+            2012,
+            2013,
+            2014,
+            2015,
+            2016,
+            2017,
+            2018,
+            2019,
+            2020,
+            2021,
+            2022,
+            2023,
+            2024,
+            2025,
+            2026,
+            2027,
+            2028,
+            2029,
+            2030,
+            2031,
+            2032,
+            2033,
+            2034,
+            2035,
+            2036,
+            2037,
+            2038,
+            2039,
+            2040,
+            2041,
+            2042,
+            2043,
+            2044,
+            2045,
+            2046,
+            2047,
+            2048,
+            2049,
+            2050,
+            2051,
+            2052,
+            2053,
+            2054,
+            2055,
+            2056,
+            2057,
+            609,
+            163,
+            2058,
+            2059,
+            2060,
+            2061,
+            2062,
+            2063,
+            2064,
+            2065,
+            2066,
+            2067,
+            2068,
+            2069,
+            2070,
+            2071,
+            2072,
+            2073,
+            2074,
+            2075,
+            2076,
+            2077,
+            2078,
+            2079,
+            2080,
+            2081,
+            2082,
+            2083,
+            2084,
+            2085,
+            2086,
+            2087,
+            2088,
+            2089,
+            2090,
+            2091,
+            2092,
+            2093,
+            2094,
+            2095,
+            2096,
+            2097,
+            2098,
+            2099,
+            2100,
+            2101,
+            2102,
+            2103,
+            2104,
+            2105,
+            2106,
+            2107,
+            2108,
+            2109,
+            2110,
+            2111,
+            2112,
+            2113,
+            2114,
+            2115,
+            2116,
+            2117,
+            2118,
+            2119,
+            2120,
+            2121,
+            2122,
+            2123,
+            2124,
+            2125,
+            2126,
+            2127,
+            2128,
+            2129,
+            2130,
+            2131,
+            2132,
+            2133,
+            2134,
+            2135,
+            2136,
+            2137,
+            2138,
+            2139,
+            2140,
+            2141,
+            2142,
+            2143,
+            2144,
+            2145,
+            2146,
+            2147,
+            2148,
+            2149,
+            2150,
+            2151,
+            2152,
+            2153,
+            2154,
+            2155,
+            2156,
+            2157,
+            2158,
+            2159,
+            2160,
+            2161,
+            2162,
+            2163,
+            2164,
+            2165,
+            2166,
+            2167,
+            2168,
+            2169,
+            2170,
+            2171,
+            2172,
+            2173,
+            2174,
+            2175,
+            2176,
+            2177,
+            2178,
+            2179,
+            2180,
+            2181,
+            2182,
+            2183,
+            2184,
+            2185,
+            2186,
+            2187,
+            2188,
+            2189,
+            2190,
+            2191,
+            2192,
+            2193,
+            2194,
+            2195,
+            2196,
+            2197,
+            2198,
+            2199,
+            2200,
+            2201,
+            2202,
+            2203,
+            2204,
+            2205,
+            2206,
+            2207,
+            2208,
+            2209,
+            2210,
+            2211,
+            2212,
+            2213,
+            2214,
+            2215,
+            2216,
+            2217,
+            2218,
+            2219,
+            2220,
+            2221,
+            2222,
+            2223,
+            2224,
+            2225,
+            2226,
+            2227,
+            2228,
+            2229,
+            2230,
+            2231,
+            2232,
+            2233,
+            2234,
+            2235,
+            2236,
+            2237,
+            2238,
+            2239,
+            2240,
+            2241,
+            2242,
+            2243,
+            2244,
+            2245,
+            2246,
+            2247,
+            2248,
+            2249,
+            2250,
+            2251,
+            2252,
+            2253,
+            2254,
+            2255,
+            2256,
+            2257,
+            2258,
+            2259,
+            2260,
+            2261,
+            2262,
+            2263,
+            2264,
+            2265,
+            2266,
+            2267,
+            2268,
+            2269,
+            2270,
+            2271,
+            2272,
+            2273,
+            2274,
+            2275,
+            2276,
+            2277,
+            2278,
+            2279,
+            2280,
+            2281,
+            2282,
+            2283,
+            2284,
+            2285,
+            2286,
+            2286,
+            2286,
+            2287,
+            2288,
+            2289,
+            2290,
+            2291,
+            2292,
+            2293,
+            2294,
+            2295,
+            2296,
+            2297,
+            2298,
+            2299,
+            2300,
+            2301,
+            2302,
+            2303,
+            2304,
+            2305,
+            2306,
+            2307,
+            2308,
+            2309,
+            2310,
+            2311,
+            2312,
+            2313,
+            2314,
+            2315,
+            2316,
+            2317,
+            2318,
+            2319,
+            2320,
+            2321,
+            2322,
+            2323,
+            2324,
+            2325,
+            2326,
+            2327,
+            2328,
+            2329,
+            2330,
+            2331,
+            2332,
+            2333,
+            2334,
+            2335,
+            2336,
+            2337,
+            2338,
+            2339,
+            2340,
+            2341,
+            2342,
+            2343,
+            2344,
+            2345,
+            2346,
+            2347,
+            2348,
+            2349,
+            2350,
+            2351,
+            2352,
+            2353,
+            2354,
+            2355,
+            2356,
+            2357,
+            2358,
+            2359,
+            2360,
+            2361,
+            2362,
+            2363,
+            2364,
+            2365,
+            2366,
+            2367,
+            2368,
+            2369,
+            2370,
+            2371,
+            2372,
+            2373,
+            2374,
+            2375,
+            2376,
+            2377,
+            2378,
+            2379,
+            2380,
+            2381,
+            2382,
+            2383,
+            2384,
+            2385,
+            2386,
+            2387,
+            2388,
+            2389,
+            2390,
+            2391,
+            2392,
+            2393,
+            2394,
+            2395,
+            2396,
+            2397,
+            2398,
+            2399,
+            2400,
+            2401,
+            2402,
+            2403,
+            2404,
+            2405,
+            2406,
+            2407,
+            2408,
+            2409,
+            2410,
+            2411,
+            2412,
+            2413,
+            2414,
+            2415,
+            2416,
+            2417,
+            2418,
+            2419,
+            2420,
+            2421,
+            2422,
+            2423,
+            2424,
+            2425,
+            2426,
+            2427,
+            2428,
+            2429,
+            163,
+            2430,
+            2431,
+            163,
+            2432,
+            2433,
+            2434,
+            2435,
+            2436,
+            2437,
+            2438,
+            2439,
+            2440,
+            2441,
+            2442,
+            2443,
+            2444,
+            2445,
+            2446,
+            2447,
+            2448,
+            2449,
+            2450,
+            2451,
+            2452,
+            2453,
+            2454,
+            2455,
+            2456,
+            2457,
+            2458,
+            2459,
+            2460,
+            2461,
+            2462,
+            2463,
+            2464,
+            2465,
+            2466,
+            2467,
+            2468,
+            2469,
+            2470,
+            2471,
+            2472,
+            2473,
+            2474,
+            2475,
+            2476,
+            2477,
+            2478,
+            2479,
+            2480,
+            2481,
+            2482,
+            2483,
+            2484,
+            2485,
+            2486,
+            2487,
+            2488,
+            2489,
+            2490,
+            2491,
+            2492,
+            2493,
+            2494,
+            2495,
+            2496,
+            2497,
+            2498,
+            2499,
+            2500,
+            2501,
+            2502,
+            2503,
+            2504,
+            2505,
+            2506,
+            2507,
+            2508,
+            2509,
+            2510,
+            2511,
+            2512,
+            2513,
+            2514,
+            2515,
+            2516,
+            2517,
+            2518,
+            2519,
+            2520,
+            2521,
+            2522,
+            2523,
+            2524,
+            2525,
+            2526,
+            2527,
+            2528,
+            2529,
+            2530,
+            2531,
+            2532,
+            2533,
+            2534,
+            2535,
+            2536,
+            2537,
+            2538,
+            2539,
+            2540,
+            2541,
+            2542,
+            2543,
+            2544,
+            2545,
+            2546,
+            2547,
+            2548,
+            2549,
+            2550,
+            2551,
+            266,
+            163,
+            163,
+            2552,
+            2553,
+            2554,
+            2555,
+            2556,
+            2557,
+            2558,
+            2559,
+            2560,
+            2561,
+            2562,
+            2563,
+            2564,
+            2565,
+            2566,
+            2567,
+            2568,
+            2569,
+            2570,
+            2571,
+            2572,
+            2573,
+            2574,
+            2575,
+            2576,
+            2577,
+            2578,
+            2579,
+            2580,
+            2581,
+            2582,
+            2583,
+            2584,
+            2585,
+            2586,
+            2587,
+            2588,
+            2589,
+            2590,
+            2591,
+            2592,
+            2593,
+            2594,
+            2595,
+            2596,
+            2597,
+            2598,
+            2599,
+            2600,
+            2601,
+            2602,
+            2603,
+            2604,
+            2605,
+            2606,
+            2607,
+            2608,
+            2609,
+            2610,
+            2611,
+            2612,
+            2613,
+            2614,
+            2615,
+            2616,
+            2617,
+            2618,
+            2619,
+            2620,
+            2621,
+            2622,
+            2623,
+            2624,
+            2625,
+            2626,
+            2627,
+            2628,
+            2629,
+            2630,
+            2631,
+            2632,
+            2633,
+            2634,
+            2635,
+            2636,
+            2637,
+            2638,
+            2639,
+        ),
+    ),
+    c_types=None,
+    multi={
+        6: (
+            (
+                0x4114,
+                0x57DC,
+                0x5DC7,
+                0x7118,
+                0x75E8,
+                0xD424,
+                0x10438,
+                0x10BF0,
+                0x12178,
+                0x135D4,
+                0x143C4,
+                0x190C8,
+                0x1A0E0,
+                0x1B19C,
+                0x20818,
+                0x22338,
+                0x23F90,
+                0x268E4,
+                0x28664,
+                0x29438,
+                0x29AB0,
+                0x2BDA4,
+                0x2C128,
+                0x2CE68,
+                0x327E4,
+                0x32EFC,
+                0x34EF0,
+                0x35794,
+                0x38FF8,
+                0x3CC14,
+                0x3CD2C,
+                0x3DE6C,
+                0x3F074,
+                0x40AB0,
+                0x42CC0,
+                0x43458,
+                0x43AE4,
+                0x44064,
+                0x4464C,
+                0x45320,
+                0x49508,
+                0x52700,
+                0x57E6C,
+                0x58F98,
+                0x5BCF8,
+                0x68B5C,
+                0x69704,
+                0x6BC24,
+                0x6D8FC,
+                0x71E50,
+                0x72CA0,
+            ),
+            (
+                0x22E0C94,
+                0x22E235C,
+                0x22E2947,
+                0x22E3C98,
+                0x22E4168,
+                0x22E9FA4,
+                0x22ECFB8,
+                0x22ED770,
+                0x22EECF8,
+                0x22F0154,
+                0x22F0F44,
+                0x22F5C48,
+                0x22F6C60,
+                0x22F7D1C,
+                0x22FD398,
+                0x22FEEB8,
+                0x2300B10,
+                0x2303464,
+                0x23051E4,
+                0x2305FB8,
+                0x2306630,
+                0x2308924,
+                0x2308CA8,
+                0x23099E8,
+                0x230F364,
+                0x230FA7C,
+                0x2311A70,
+                0x2312314,
+                0x2315B78,
+                0x2319794,
+                0x23198AC,
+                0x231A9EC,
+                0x231BBF4,
+                0x231D630,
+                0x231F840,
+                0x231FFD8,
+                0x2320664,
+                0x2320BE4,
+                0x23211CC,
+                0x2321EA0,
+                0x2326088,
+                0x232F280,
+                0x23349EC,
+                0x2335B18,
+                0x2338878,
+                0x23456DC,
+                0x2346284,
+                0x23487A4,
+                0x234A47C,
+                0x234E9D0,
+                0x234F820,
+            ),
+        ),
+        38: (
+            (
+                0x713C,
+                0x12148,
+                0x197D0,
+                0x23744,
+                0x26578,
+                0x2BDC8,
+                0x2E8D0,
+                0x3246C,
+                0x33704,
+                0x34F14,
+                0x35AD8,
+                0x3901C,
+                0x6BBD0,
+            ),
+            (
+                0x22E3CBC,
+                0x22EECC8,
+                0x22F6350,
+                0x23002C4,
+                0x23030F8,
+                0x2308948,
+                0x230B450,
+                0x230EFEC,
+                0x2310284,
+                0x2311A94,
+                0x2312658,
+                0x2315B9C,
+                0x2348750,
+            ),
+        ),
+        50: (
+            (0x9F60, 0x9FAC, 0x9FF8, 0xA044, 0xA2F4, 0xA340),
+            (0x22E6AE0, 0x22E6B2C, 0x22E6B78, 0x22E6BC4, 0x22E6E74, 0x22E6EC0),
+        ),
+        89: ((0xE950, 0xE980), (0x22EB4D0, 0x22EB500)),
+        179: (
+            (0x1D558, 0x258B8, 0x2E834, 0x35A74, 0x46C4C, 0x568CC),
+            (0x22FA0D8, 0x2302438, 0x230B3B4, 0x23125F4, 0x23237CC, 0x233344C),
+        ),
+        180: (
+            (
+                0x1D5AC,
+                0x2590C,
+                0x2E888,
+                0x33874,
+                0x3C990,
+                0x3E8B4,
+                0x3F1F8,
+                0x46CA0,
+                0x714E0,
+            ),
+            (
+                0x22FA12C,
+                0x230248C,
+                0x230B408,
+                0x23103F4,
+                0x2319510,
+                0x231B434,
+                0x231BD78,
+                0x2323820,
+                0x234E060,
+            ),
+        ),
+        193: (
+            (
+                0x1EB24,
+                0x23DD4,
+                0x2E8AC,
+                0x337A0,
+                0x34F44,
+                0x386CC,
+                0x3D688,
+                0x3E75C,
+                0x47800,
+                0x568A8,
+                0x6BC00,
+                0x6C330,
+            ),
+            (
+                0x22FB6A4,
+                0x2300954,
+                0x230B42C,
+                0x2310320,
+                0x2311AC4,
+                0x231524C,
+                0x231A208,
+                0x231B2DC,
+                0x2324380,
+                0x2333428,
+                0x2348780,
+                0x2348EB0,
+            ),
+        ),
+    },
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "DUNGEON_STRUCT_SIZE",
+        "MAX_HP_CAP",
+        "OFFSET_OF_DUNGEON_FLOOR_PROPERTIES",
+        "SPAWN_RAND_MAX",
+        "DUNGEON_PRNG_LCG_MULTIPLIER",
+        "DUNGEON_PRNG_LCG_INCREMENT_SECONDARY",
+        "ATTACK_SPRITE_BUFFER_SIZE",
+        "KECLEON_FEMALE_ID",
+        "KECLEON_MALE_ID",
+        "MSG_ID_SLOW_START",
+        "EXPERIENCE_POINT_GAIN_CAP",
+        "JUDGMENT_MOVE_ID",
+        "REGULAR_ATTACK_MOVE_ID",
+        "DEOXYS_ATTACK_ID",
+        "DEOXYS_SPEED_ID",
+        "GIRATINA_ALTERED_ID",
+        "PUNISHMENT_MOVE_ID",
+        "OFFENSE_STAT_MAX",
+        "PROJECTILE_MOVE_ID",
+        "BELLY_LOST_PER_TURN",
+        "MONSTER_HEAL_HP_MAX",
+        "MOVE_TARGET_AND_RANGE_SPECIAL_USER_HEALING",
+        "PLAIN_SEED_STRING_ID",
+        "MAX_ELIXIR_PP_RESTORATION",
+        "SLIP_SEED_FAIL_STRING_ID",
+        "ROCK_WRECKER_MOVE_ID",
+        "CASTFORM_NORMAL_FORM_MALE_ID",
+        "CASTFORM_NORMAL_FORM_FEMALE_ID",
+        "CHERRIM_SUNSHINE_FORM_MALE_ID",
+        "CHERRIM_OVERCAST_FORM_FEMALE_ID",
+        "CHERRIM_SUNSHINE_FORM_FEMALE_ID",
+        "FLOOR_GENERATION_STATUS_PTR",
+        "OFFSET_OF_DUNGEON_N_NORMAL_ITEM_SPAWNS",
+        "DUNGEON_GRID_COLUMN_BYTES",
+        "DEFAULT_MAX_POSITION",
+        "OFFSET_OF_DUNGEON_GUARANTEED_ITEM_ID",
+        "FIXED_ROOM_TILE_SPAWN_TABLE",
+        "TREASURE_BOX_1_ITEM_IDS",
+        "FIXED_ROOM_REVISIT_OVERRIDES",
+        "FIXED_ROOM_MONSTER_SPAWN_TABLE",
+        "FIXED_ROOM_ITEM_SPAWN_TABLE",
+        "FIXED_ROOM_ENTITY_SPAWN_TABLE",
+        "STATUS_ICON_ARRAY_MUZZLED",
+        "STATUS_ICON_ARRAY_MAGNET_RISE",
+        "STATUS_ICON_ARRAY_MIRACLE_EYE",
+        "STATUS_ICON_ARRAY_LEECH_SEED",
+        "STATUS_ICON_ARRAY_LONG_TOSS",
+        "STATUS_ICON_ARRAY_BLINDED",
+        "STATUS_ICON_ARRAY_BURN",
+        "STATUS_ICON_ARRAY_SURE_SHOT",
+        "STATUS_ICON_ARRAY_INVISIBLE",
+        "STATUS_ICON_ARRAY_SLEEP",
+        "STATUS_ICON_ARRAY_CURSE",
+        "STATUS_ICON_ARRAY_FREEZE",
+        "STATUS_ICON_ARRAY_CRINGE",
+        "STATUS_ICON_ARRAY_BIDE",
+        "STATUS_ICON_ARRAY_REFLECT",
+        "DIRECTIONS_XY",
+        "DISPLACEMENTS_WITHIN_2_LARGEST_FIRST",
+        "DISPLACEMENTS_WITHIN_2_SMALLEST_FIRST",
+        "DISPLACEMENTS_WITHIN_3",
+        "ITEM_CATEGORY_ACTIONS",
+        "FRACTIONAL_TURN_SEQUENCE",
+        "BELLY_DRAIN_IN_WALLS_INT",
+        "BELLY_DRAIN_IN_WALLS_THOUSANDTHS",
+        "DAMAGE_MULTIPLIER_0_5",
+        "DAMAGE_MULTIPLIER_1_5",
+        "DAMAGE_MULTIPLIER_2",
+        "CLOUDY_DAMAGE_MULTIPLIER",
+        "SOLID_ROCK_MULTIPLIER",
+        "DAMAGE_FORMULA_MAX_BASE",
+        "WONDER_GUARD_MULTIPLIER",
+        "DAMAGE_FORMULA_MIN_BASE",
+        "TYPE_DAMAGE_NEGATING_EXCLUSIVE_ITEM_EFFECTS",
+        "TWO_TURN_STATUSES",
+        "TWO_TURN_MOVES_AND_STATUSES",
+        "SPATK_STAT_IDX",
+        "ATK_STAT_IDX",
+        "ROLLOUT_DAMAGE_MULT_TABLE",
+        "MAP_COLOR_TABLE",
+        "CORNER_CARDINAL_NEIGHBOR_IS_OPEN",
+        "GUMMI_LIKE_STRING_IDS",
+        "GUMMI_IQ_STRING_IDS",
+        "DAMAGE_STRING_IDS",
+        "DUNGEON_PTR",
+        "DUNGEON_PTR_MASTER",
+        "TOP_SCREEN_STATUS_PTR",
+        "LEADER_PTR",
+        "DUNGEON_PRNG_STATE",
+        "DUNGEON_PRNG_STATE_SECONDARY_VALUES",
+        "LOADED_ATTACK_SPRITE_FILE_INDEX",
+        "LOADED_ATTACK_SPRITE_PACK_ID",
+        "EXCL_ITEM_EFFECTS_WEATHER_ATK_SPEED_BOOST",
+        "EXCL_ITEM_EFFECTS_WEATHER_MOVE_SPEED_BOOST",
+        "EXCL_ITEM_EFFECTS_WEATHER_NO_STATUS",
+        "AI_THROWN_ITEM_ACTION_CHOICE_COUNT",
+        "EXCL_ITEM_EFFECTS_EVASION_BOOST",
+        "DEFAULT_TILE",
+        "HIDDEN_STAIRS_SPAWN_BLOCKED",
+        "FIXED_ROOM_DATA_PTR",
+        "DUNGEON_FADES_PTR",
+        "NECTAR_IQ_BOOST",
+        "COMPRESSED_SPRITE_BUFFER_SIZE",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xBC80,
+            0xFFFFFFFF,
+            0xE8C4,
+            0x1AD10,
+            0x1B23C,
+            0x1B240,
+            0x1D15C,
+            0x26574,
+            0x3034C,
+            0x30350,
+            0x30354,
+            0x30358,
+            0x3035C,
+            0x30360,
+            0x30390,
+            0xFFFFFFFF,
+            0x34950,
+            0xFFFFFFFF,
+            0x3EC14,
+            0x40628,
+            0x4062C,
+            0x40A94,
+            0xFFFFFFFF,
+            0x592F8,
+            0x592FC,
+            0x59300,
+            0x59304,
+            0x59308,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x63FFC,
+            0xFFFFFFFF,
+            0x73E5C,
+            0x73E88,
+            0x73EA0,
+            0x73FA0,
+            0x74180,
+            0x74378,
+            0x75248,
+            0x75258,
+            0x75278,
+            0x75288,
+            0x752A0,
+            0x752F8,
+            0x75320,
+            0x75348,
+            0x75370,
+            0x75398,
+            0x753C8,
+            0x75400,
+            0x75440,
+            0x75480,
+            0x75580,
+            0x757A8,
+            0x75868,
+            0x758D0,
+            0x75938,
+            0x7609C,
+            0x76310,
+            0x767F4,
+            0x767F6,
+            0x768C8,
+            0x768D0,
+            0x768D8,
+            0x768E8,
+            0x768F0,
+            0x768F8,
+            0xFFFFFFFF,
+            0x76908,
+            0x76930,
+            0x76AEC,
+            0x76B38,
+            0x76B74,
+            0x76B78,
+            0x76B7C,
+            0x7705C,
+            0x770A4,
+            0x77360,
+            0x773BC,
+            0x773C8,
+            0x775B8,
+            0x775BC,
+            0x775D4,
+            0x775DC,
+            0x775F0,
+            0x77604,
+            0x7762C,
+            0x7762E,
+            0x77630,
+            0x77638,
+            0x77640,
+            0x7777C,
+            0x77790,
+            0x777BC,
+            0x77824,
+            0x7782C,
+            0x77878,
+            0x40264,
+            0x6FFEC,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x22E8800,
+            0xFFFFFFFF,
+            0x22EB444,
+            0x22F7890,
+            0x22F7DBC,
+            0x22F7DC0,
+            0x22F9CDC,
+            0x23030F4,
+            0x230CECC,
+            0x230CED0,
+            0x230CED4,
+            0x230CED8,
+            0x230CEDC,
+            0x230CEE0,
+            0x230CF10,
+            0xFFFFFFFF,
+            0x23114D0,
+            0xFFFFFFFF,
+            0x231B794,
+            0x231D1A8,
+            0x231D1AC,
+            0x231D614,
+            0xFFFFFFFF,
+            0x2335E78,
+            0x2335E7C,
+            0x2335E80,
+            0x2335E84,
+            0x2335E88,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2340B7C,
+            0xFFFFFFFF,
+            0x23509DC,
+            0x2350A08,
+            0x2350A20,
+            0x2350B20,
+            0x2350D00,
+            0x2350EF8,
+            0x2351DC8,
+            0x2351DD8,
+            0x2351DF8,
+            0x2351E08,
+            0x2351E20,
+            0x2351E78,
+            0x2351EA0,
+            0x2351EC8,
+            0x2351EF0,
+            0x2351F18,
+            0x2351F48,
+            0x2351F80,
+            0x2351FC0,
+            0x2352000,
+            0x2352100,
+            0x2352328,
+            0x23523E8,
+            0x2352450,
+            0x23524B8,
+            0x2352C1C,
+            0x2352E90,
+            0x2353374,
+            0x2353376,
+            0x2353448,
+            0x2353450,
+            0x2353458,
+            0x2353468,
+            0x2353470,
+            0x2353478,
+            0xFFFFFFFF,
+            0x2353488,
+            0x23534B0,
+            0x235366C,
+            0x23536B8,
+            0x23536F4,
+            0x23536F8,
+            0x23536FC,
+            0x2353BDC,
+            0x2353C24,
+            0x2353EE0,
+            0x2353F3C,
+            0x2353F48,
+            0x2354138,
+            0x235413C,
+            0x2354154,
+            0x235415C,
+            0x2354170,
+            0x2354184,
+            0x23541AC,
+            0x23541AE,
+            0x23541B0,
+            0x23541B8,
+            0x23541C0,
+            0x23542FC,
+            0x2354310,
+            0x235433C,
+            0x23543A4,
+            0x23543AC,
+            0x23543F8,
+            0x231CDE4,
+            0x234CB6C,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0xFFFFFFFF,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0xFFFFFFFF,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x2C,
+            0x18,
+            0x100,
+            0x1E0,
+            0x1F8,
+            0xC9C,
+            0x10,
+            0x10,
+            0x18,
+            0x18,
+            0x18,
+            0x28,
+            0x28,
+            0x28,
+            0x28,
+            0x40,
+            0x38,
+            0x40,
+            0x40,
+            0x70,
+            0x90,
+            0x20,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x20,
+            0xFA,
+            0x2,
+            0x2,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xB,
+            0x2C,
+            0x4,
+            0x4,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x20,
+            0x8,
+            0xA,
+            0xFFFFFFFF,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x14,
+            0x14,
+            0x2,
+            0x2,
+            0x8,
+            0x8,
+            0x8,
+            0x4,
+            0x8,
+            0x14,
+            0x1,
+            0x4,
+            0x4,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            2640,
+            2641,
+            2642,
+            2643,
+            2644,
+            2645,
+            2646,
+            2647,
+            2648,
+            2649,
+            2650,
+            2651,
+            2652,
+            2653,
+            2654,
+            2655,
+            2656,
+            2657,
+            2658,
+            2659,
+            2641,
+            2660,
+            2661,
+            2662,
+            2663,
+            2664,
+            2665,
+            2666,
+            2667,
+            2668,
+            2669,
+            2670,
+            2671,
+            2672,
+            2673,
+            2674,
+            2675,
+            2676,
+            2677,
+            2678,
+            2679,
+            2680,
+            2681,
+            2682,
+            2683,
+            2684,
+            2685,
+            2686,
+            2687,
+            2688,
+            2689,
+            2690,
+            2691,
+            2692,
+            2693,
+            2694,
+            2695,
+            2696,
+            2697,
+            2698,
+            2699,
+            2700,
+            2701,
+            2702,
+            2703,
+            2704,
+            2705,
+            2706,
+            2707,
+            2708,
+            2709,
+            2710,
+            2711,
+            2712,
+            2713,
+            2714,
+            2715,
+            2716,
+            2717,
+            2718,
+            2719,
+            2720,
+            2721,
+            2722,
+            2723,
+            2724,
+            2725,
+            2726,
+            2727,
+            2728,
+            2729,
+            2730,
+            2731,
+            2732,
+            2733,
+            2734,
+            2735,
+            2736,
+            2737,
+            2738,
+            2739,
+            2740,
+            2741,
+        ),
+    ),
+    c_types=(
+        "uint32_t",
+        "int32_t",
+        "uint32_t",
+        "int32_t",
+        "uint32_t",
+        "uint32_t",
+        "int32_t",
+        "enum monster_id",
+        "enum monster_id",
+        "int32_t",
+        "int32_t",
+        "enum move_id",
+        "enum move_id",
+        "enum monster_id",
+        "enum monster_id",
+        "enum monster_id",
+        "enum move_id",
+        "int32_t",
+        "enum move_id",
+        "fx32_16",
+        "int",
+        "struct move_target_and_range",
+        "int32_t",
+        "int32_t",
+        "int32_t",
+        "enum move_id",
+        "enum monster_id",
+        "enum monster_id",
+        "enum monster_id",
+        "enum monster_id",
+        "enum monster_id",
+        "struct floor_generation_status*",
+        "uint32_t",
+        "uint32_t",
+        "int32_t",
+        "uint32_t",
+        "struct fixed_room_tile_spawn_entry[11]",
+        "struct item_id_16[12]",
+        "struct fixed_room_id_8[256]",
+        "struct fixed_room_monster_spawn_entry[120]",
+        "struct fixed_room_item_spawn_entry[63]",
+        "struct fixed_room_entity_spawn_entry[269]",
+        "struct status_icon_flags[2]",
+        "struct status_icon_flags[2]",
+        "struct status_icon_flags[3]",
+        "struct status_icon_flags[3]",
+        "struct status_icon_flags[3]",
+        "struct status_icon_flags[5]",
+        "struct status_icon_flags[5]",
+        "struct status_icon_flags[5]",
+        "struct status_icon_flags[5]",
+        "struct status_icon_flags[8]",
+        "struct status_icon_flags[7]",
+        "struct status_icon_flags[8]",
+        "struct status_icon_flags[8]",
+        "struct status_icon_flags[14]",
+        "struct status_icon_flags[18]",
+        "int16_t[8][2]",
+        "struct position[26]",
+        "struct position[26]",
+        "struct position[50]",
+        "struct action_16[16]",
+        "int16_t[125]",
+        "uint16_t",
+        "uint16_t",
+        "struct fx64_16",
+        "struct fx64_16",
+        "struct fx64_16",
+        "struct fx64_16",
+        "struct fx64_16",
+        "struct fx64_16",
+        "struct fx64_16",
+        "struct fx64_16",
+        "struct damage_negating_exclusive_eff_entry[28]",
+        "struct status_two_turn_id_8[11]",
+        "struct two_turn_move_and_status[22]",
+        "int32_t",
+        "int32_t",
+        "fx32_8[10]",
+        "struct rgba[9]",
+        "bool[4][8]",
+        "int16_t[4]",
+        "int16_t[5]",
+        "int16_t[27]",
+        "struct dungeon*",
+        "struct dungeon*",
+        "struct top_screen_status*",
+        "struct entity*",
+        "struct prng_state",
+        "uint32_t[5]",
+        "uint16_t",
+        "enum pack_file_id",
+        "struct exclusive_item_effect_id_8[8]",
+        "struct exclusive_item_effect_id_8[8]",
+        "struct exclusive_item_effect_id_8[8]",
+        "uint32_t",
+        "struct exclusive_item_effect_id_8[8]",
+        "struct tile",
+        "bool",
+        "void*",
+        "struct dungeon_fades*",
+        "struct data_processing_instruction",
+        "struct data_processing_instruction",
+    ),
+    multi={
+        0: ((0x2838, 0x286C), (0x22DF3B8, 0x22DF3EC)),
+        1: ((0x7C00, 0x356F4, 0x3C334), (0x22E4780, 0x2312274, 0x2318EB4)),
+        2: ((0xB828, 0x5EECC), (0x22E83A8, 0x233BA4C)),
+        4: ((0xE7F8, 0xE8BC), (0x22EB378, 0x22EB43C)),
+        18: ((0x30F70, 0x405E0), (0x230DAF0, 0x231D160)),
+        31: (
+            (
+                0x5EED0,
+                0x5EF6C,
+                0x5F1F0,
+                0x5F67C,
+                0x5FADC,
+                0x5FC3C,
+                0x5FDD4,
+                0x5FF90,
+                0x60370,
+                0x607D0,
+                0x60FE4,
+                0x61164,
+                0x61374,
+                0x616D4,
+                0x620BC,
+                0x63FF4,
+                0x64280,
+                0x64734,
+                0x654C0,
+                0x657C8,
+                0x661DC,
+                0x66574,
+                0x66844,
+                0x66BD8,
+                0x66CC8,
+                0x66DFC,
+                0x66F8C,
+            ),
+            (
+                0x233BA50,
+                0x233BAEC,
+                0x233BD70,
+                0x233C1FC,
+                0x233C65C,
+                0x233C7BC,
+                0x233C954,
+                0x233CB10,
+                0x233CEF0,
+                0x233D350,
+                0x233DB64,
+                0x233DCE4,
+                0x233DEF4,
+                0x233E254,
+                0x233EC3C,
+                0x2340B74,
+                0x2340E00,
+                0x23412B4,
+                0x2342040,
+                0x2342348,
+                0x2342D5C,
+                0x23430F4,
+                0x23433C4,
+                0x2343758,
+                0x2343848,
+                0x234397C,
+                0x2343B0C,
+            ),
+        ),
+        32: ((0x5EED8, 0x654C8), (0x233BA58, 0x2342048)),
+        33: (
+            (
+                0x5F678,
+                0x5FAD8,
+                0x5FDD0,
+                0x5FF8C,
+                0x6036C,
+                0x607D4,
+                0x60A48,
+                0x60FDC,
+                0x61160,
+                0x61378,
+                0x616D0,
+                0x620B8,
+                0x6249C,
+                0x62D94,
+                0x63178,
+                0x63960,
+                0x63FF8,
+                0x64284,
+                0x644B8,
+                0x66530,
+            ),
+            (
+                0x233C1F8,
+                0x233C658,
+                0x233C950,
+                0x233CB0C,
+                0x233CEEC,
+                0x233D354,
+                0x233D5C8,
+                0x233DB5C,
+                0x233DCE0,
+                0x233DEF8,
+                0x233E250,
+                0x233EC38,
+                0x233F01C,
+                0x233F914,
+                0x233FCF8,
+                0x23404E0,
+                0x2340B78,
+                0x2340E04,
+                0x2341038,
+                0x23430B0,
+            ),
+        ),
+        35: ((0x654C4, 0x68EE4), (0x2342044, 0x2345A64)),
+    },
+)
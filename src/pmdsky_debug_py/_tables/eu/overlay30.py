@@ -0,0 +1,57 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay30 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=("WriteQuicksaveData",),
+    addresses=array("I", (0x448,)),
+    absolute_addresses=array("I", (0x2383868,)),
+    lengths=array("I", (0xFFFFFFFF,)),
+    descriptions=array("I", (2742,)),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "OVERLAY30_JP_STRING_1",
+        "OVERLAY30_JP_STRING_2",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x3864,
+            0x3870,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x2386C84,
+            0x2386C90,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xC,
+            0xC,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            2743,
+            2744,
+        ),
+    ),
+    c_types=(
+        "",
+        "",
+    ),
+    multi={},
+)
@@ -0,0 +1,492 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay31 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "EntryOverlay31",
+        "DrawDungeonMenuStatusWindow",
+        "DungeonMenuSwitch",
+        "CreateStairsMenuState",
+        "StairsSubheadingCallback",
+        "HandleStairsMenu",
+        "MovesMenu",
+        "HandleMovesMenuWrapper0",
+        "HandleMovesMenuWrapper1",
+        "HandleMovesMenu",
+        "TeamMenu",
+        "RestMenu",
+        "RecruitmentSearchMenuLoop",
+        "HelpMenuLoop",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x0,
+            0x44,
+            0x2A0,
+            0x6B4,
+            0x748,
+            0x79C,
+            0x29A0,
+            0x2B9C,
+            0x2BC0,
+            0x2BE4,
+            0x4850,
+            0x5F90,
+            0x6408,
+            0x6A00,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x2383420,
+            0x2383464,
+            0x23836C0,
+            0x2383AD4,
+            0x2383B68,
+            0x2383BBC,
+            0x2385DC0,
+            0x2385FBC,
+            0x2385FE0,
+            0x2386004,
+            0x2387C70,
+            0x23893B0,
+            0x2389828,
+            0x2389E20,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            163,
+            2745,
+            2746,
+            2747,
+            2748,
+            2749,
+            2750,
+            2751,
+            2752,
+            2753,
+            2754,
+            2755,
+            2756,
+            2757,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "DUNGEON_WINDOW_PARAMS_1",
+        "DUNGEON_WINDOW_PARAMS_2",
+        "DUNGEON_WINDOW_PARAMS_3",
+        "DUNGEON_WINDOW_PARAMS_4",
+        "DUNGEON_MAIN_MENU_ITEMS",
+        "DUNGEON_MENU_SWITCH_STR1",
+        "OVERLAY31_UNKNOWN_STRING_IDS",
+        "OVERLAY31_UNKNOWN_STRUCT__NA_2389E30",
+        "DUNGEON_WINDOW_PARAMS_5",
+        "DUNGEON_WINDOW_PARAMS_6",
+        "DUNGEON_WINDOW_PARAMS_7",
+        "DUNGEON_SUBMENU_ITEMS_1",
+        "DUNGEON_SUBMENU_ITEMS_2",
+        "DUNGEON_SUBMENU_ITEMS_3",
+        "DUNGEON_SUBMENU_ITEMS_4",
+        "OVERLAY31_UNKNOWN_STRUCT__NA_2389EF0",
+        "DUNGEON_WINDOW_PARAMS_8",
+        "DUNGEON_WINDOW_PARAMS_9",
+        "DUNGEON_WINDOW_PARAMS_10",
+        "DUNGEON_WINDOW_PARAMS_11",
+        "DUNGEON_WINDOW_PARAMS_12",
+        "DUNGEON_WINDOW_PARAMS_13",
+        "OVERLAY31_JP_STRING",
+        "DUNGEON_WINDOW_PARAMS_14",
+        "DUNGEON_WINDOW_PARAMS_15",
+        "DUNGEON_WINDOW_PARAMS_16",
+        "DUNGEON_WINDOW_PARAMS_17",
+        "DUNGEON_WINDOW_PARAMS_18",
+        "DUNGEON_WINDOW_PARAMS_19",
+        "OVERLAY31_UNKNOWN_STRUCT__NA_2389FE8",
+        "DUNGEON_WINDOW_PARAMS_20",
+        "DUNGEON_WINDOW_PARAMS_21",
+        "DUNGEON_WINDOW_PARAMS_22",
+        "DUNGEON_WINDOW_PARAMS_23",
+        "DUNGEON_WINDOW_PARAMS_24",
+        "DUNGEON_WINDOW_PARAMS_25",
+        "DUNGEON_SUBMENU_ITEMS_5",
+        "DUNGEON_WINDOW_PARAMS_26",
+        "OVERLAY31_UNKNOWN_STRUCT__NA_238A144",
+        "DUNGEON_WINDOW_PARAMS_27",
+        "DUNGEON_WINDOW_PARAMS_28",
+        "OVERLAY31_UNKNOWN_STRUCT__NA_238A190",
+        "DUNGEON_SUBMENU_ITEMS_6",
+        "DUNGEON_WINDOW_PARAMS_29",
+        "DUNGEON_WINDOW_PARAMS_30",
+        "DUNGEON_WINDOW_PARAMS_31",
+        "DUNGEON_WINDOW_PARAMS_32",
+        "OVERLAY31_RESERVED_SPACE",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A260",
+        "OVERLAY31_UNKNOWN_VALUE__NA_238A264",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A268",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A26C",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A270",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A274",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A278",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A27C",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A280",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A284",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A288",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A28C",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x7598,
+            0x75A8,
+            0x75B8,
+            0x75C8,
+            0x75D8,
+            0x7618,
+            0x7624,
+            0x7634,
+            0x7644,
+            0x7654,
+            0x7664,
+            0x7674,
+            0x7694,
+            0x76B4,
+            0x76D4,
+            0x76F4,
+            0x7700,
+            0x7710,
+            0x7720,
+            0x7730,
+            0x7740,
+            0x7750,
+            0x7768,
+            0x778C,
+            0x779C,
+            0x77AC,
+            0x77BC,
+            0x77CC,
+            0x77DC,
+            0x77EC,
+            0x77F8,
+            0x7808,
+            0x7818,
+            0x7828,
+            0x7838,
+            0x7910,
+            0x7920,
+            0x7938,
+            0x7948,
+            0x7974,
+            0x7984,
+            0x7994,
+            0x79A4,
+            0x79EC,
+            0x79FC,
+            0x7A0C,
+            0x7A1C,
+            0xFFFFFFFF,
+            0x7A60,
+            0xFFFFFFFF,
+            0x7A68,
+            0x7A6C,
+            0x7A70,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x7A7C,
+            0x7A80,
+            0x7A84,
+            0x7A88,
+            0x7A8C,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238A9B8,
+            0x238A9C8,
+            0x238A9D8,
+            0x238A9E8,
+            0x238A9F8,
+            0x238AA38,
+            0x238AA44,
+            0x238AA54,
+            0x238AA64,
+            0x238AA74,
+            0x238AA84,
+            0x238AA94,
+            0x238AAB4,
+            0x238AAD4,
+            0x238AAF4,
+            0x238AB14,
+            0x238AB20,
+            0x238AB30,
+            0x238AB40,
+            0x238AB50,
+            0x238AB60,
+            0x238AB70,
+            0x238AB88,
+            0x238ABAC,
+            0x238ABBC,
+            0x238ABCC,
+            0x238ABDC,
+            0x238ABEC,
+            0x238ABFC,
+            0x238AC0C,
+            0x238AC18,
+            0x238AC28,
+            0x238AC38,
+            0x238AC48,
+            0x238AC58,
+            0x238AD30,
+            0x238AD40,
+            0x238AD58,
+            0x238AD68,
+            0x238AD94,
+            0x238ADA4,
+            0x238ADB4,
+            0x238ADC4,
+            0x238AE0C,
+            0x238AE1C,
+            0x238AE2C,
+            0x238AE3C,
+            0xFFFFFFFF,
+            0x238AE80,
+            0xFFFFFFFF,
+            0x238AE88,
+            0x238AE8C,
+            0x238AE90,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x238AE9C,
+            0x238AEA0,
+            0x238AEA4,
+            0x238AEA8,
+            0x238AEAC,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x40,
+            0xC,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x10,
+            0x10,
+            0x10,
+            0x20,
+            0x20,
+            0x20,
+            0x20,
+            0xFFFFFFFF,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0xFFFFFFFF,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0xFFFFFFFF,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x18,
+            0x10,
+            0xFFFFFFFF,
+            0x10,
+            0x10,
+            0xFFFFFFFF,
+            0x48,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            266,
+            266,
+            266,
+            266,
+            1,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1,
+            1,
+            1,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            2758,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[8]",
+        "char[12]",
+        "",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[3]",
+        "struct window_params",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "struct simple_menu_id_item[9]",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+    ),
+    multi={},
+)
@@ -0,0 +1,146 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay9 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "CreateJukeboxTrackMenu",
+        "CloseJukeboxTrackMenu",
+        "IsJukeboxTrackMenuActive",
+        "UpdateJukeboxTrackMenu",
+        "CreatePlaybackControlsMenu",
+        "ClosePlaybackControlsMenu",
+        "IsPlaybackControlsMenuActive",
+        "UpdatePlaybackControlsMenu",
+        "CreateInputLockBox",
+        "CloseInputLockBox",
+        "IsInputLockBoxActive",
+        "UpdateInputLockBox",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x15B0,
+            0x18CC,
+            0x1904,
+            0x195C,
+            0x1E98,
+            0x21D8,
+            0x227C,
+            0x2304,
+            0x2790,
+            0x2940,
+            0x295C,
+            0x297C,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x233E7B0,
+            0x233EACC,
+            0x233EB04,
+            0x233EB5C,
+            0x233F098,
+            0x233F3D8,
+            0x233F47C,
+            0x233F504,
+            0x233F990,
+            0x233FB40,
+            0x233FB5C,
+            0x233FB7C,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            2761,
+            2762,
+            2763,
+            2764,
+            2765,
+            2766,
+            2767,
+            2768,
+            2769,
+            2770,
+            2771,
+            2772,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "JUKEBOX_TRACK_MENU_DEFAULT_WINDOW_PARAMS",
+        "PLAYBACK_CONTROLS_MENU_DEFAULT_WINDOW_PARAMS",
+        "INPUT_LOCK_BOX_DEFAULT_WINDOW_PARAMS",
+        "TOP_MENU_RETURN_MUSIC_ID",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x2D1C,
+            0x2D2C,
+            0x2D3C,
+            0xE80,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x233FF1C,
+            0x233FF2C,
+            0x233FF3C,
+            0x233E080,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            2773,
+            2774,
+            2775,
+            2776,
+        ),
+    ),
+    c_types=(
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct data_processing_instruction",
+    ),
+    multi={},
+)
@@ -0,0 +1,493 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the ram section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+
+DATA = SymbolTable(
+    names=(
+        "DEFAULT_MEMORY_ARENA_MEMORY",
+        "GROUND_MEMORY_ARENA_2",
+        "GROUND_MEMORY_ARENA_2_BLOCKS",
+        "GROUND_MEMORY_ARENA_2_MEMORY",
+        "DUNGEON_COLORMAP_PTR",
+        "DUNGEON_STRUCT",
+        "MOVE_DATA_TABLE",
+        "SOUND_MEMORY_ARENA",
+        "SOUND_MEMORY_ARENA_BLOCKS",
+        "SOUND_MEMORY_ARENA_MEMORY",
+        "FRAMES_SINCE_LAUNCH",
+        "TOUCHSCREEN_STATUS",
+        "BAG_ITEMS",
+        "BAG_ITEMS_PTR",
+        "STORAGE_ITEMS",
+        "STORAGE_ITEM_QUANTITIES",
+        "KECLEON_SHOP_ITEMS_PTR",
+        "KECLEON_SHOP_ITEMS",
+        "UNUSED_KECLEON_SHOP_ITEMS",
+        "KECLEON_WARES_ITEMS_PTR",
+        "KECLEON_WARES_ITEMS",
+        "UNUSED_KECLEON_WARES_ITEMS",
+        "MONEY_CARRIED",
+        "MONEY_STORED",
+        "AUDIO_COMMANDS_BUFFER",
+        "SOUND_MEMORY_ARENA_PTR",
+        "WINDOW_LIST",
+        "CURSOR_16_SPRITE_ID",
+        "CURSOR_SPRITE_ID",
+        "CURSOR_ANIMATION_CONTROL",
+        "CURSOR_16_ANIMATION_CONTROL",
+        "ALERT_SPRITE_ID",
+        "ALERT_ANIMATION_CONTROL",
+        "LAST_NEW_MOVE",
+        "SCRIPT_VARS_VALUES",
+        "BAG_LEVEL",
+        "DEBUG_SPECIAL_EPISODE_NUMBER",
+        "KAOMADO_STREAM",
+        "PENDING_DUNGEON_ID",
+        "PENDING_STARTING_FLOOR",
+        "PLAY_TIME_SECONDS",
+        "PLAY_TIME_FRAME_COUNTER",
+        "TEAM_NAME",
+        "LEVEL_UP_DATA_MONSTER_ID",
+        "LEVEL_UP_DATA_DECOMPRESS_BUFFER",
+        "TEAM_MEMBER_TABLE",
+        "DRIVER_WORK",
+        "DISP_MODE",
+        "GXI_VRAM_LOCK_ID",
+        "ENABLED_VRAM_BANKS",
+        "SUB_BG_EXT_PLTT",
+        "CLR_IMG",
+        "THREAD_INFO_STRUCT",
+        "FRAMES_SINCE_LAUNCH_TIMES_THREE",
+        "GROUND_MEMORY_ARENA_1_PTR",
+        "GROUND_MEMORY_ARENA_2_PTR",
+        "LOCK_NOTIFY_ARRAY",
+        "GROUND_MEMORY_ARENA_1",
+        "GROUND_MEMORY_ARENA_1_BLOCKS",
+        "GROUND_MEMORY_ARENA_1_MEMORY",
+        "SENTRY_DUTY_STRUCT",
+        "TURNING_ON_THE_SPOT_FLAG",
+        "LOADED_ATTACK_SPRITE_DATA",
+        "AI_THROWN_ITEM_DIRECTION_IS_USED",
+        "AI_THROWN_ITEM_PROBABILITIES",
+        "AI_THROWN_ITEM_DIRECTIONS",
+        "ROLLOUT_ICE_BALL_MISSED",
+        "MULTIHIT_FATIGUE_MOVE_USED",
+        "TWINEEDLE_HIT_TRACKER",
+        "RAPID_SPIN_BINDING_REMOVAL",
+        "ROLLOUT_ICE_BALL_SUCCESSIVE_HITS",
+        "MULTIHIT_MOVE_SUCCESSIVE_HITS",
+        "TRIPLE_KICK_SUCCESSIVE_HITS",
+        "METRONOME_NEXT_INDEX",
+        "FLOOR_GENERATION_STATUS",
+        "STAIRS_MENU_PTR",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xB5500,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x1BA634,
+            0x1BA674,
+            0x211D0C,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2A3F1C,
+            0x2A4164,
+            0x2A44E8,
+            0x2A44EE,
+            0x2A4CBE,
+            0x2A5490,
+            0x2A5494,
+            0x2A54B4,
+            0x2A54D4,
+            0x2A54D8,
+            0x2A54E8,
+            0x2A54F8,
+            0x2A5504,
+            0x2A5590,
+            0xFFFFFFFF,
+            0x2A921C,
+            0x2AB5A4,
+            0x2AB5A6,
+            0x2AB5C0,
+            0x2AB63C,
+            0x2AB6B8,
+            0x2AB6BC,
+            0x2AB78C,
+            0x2AB9EC,
+            0x2ABA9C,
+            0x2ABDEC,
+            0x2ABDF0,
+            0x2ABE3C,
+            0x2ABE3D,
+            0x2ABFD4,
+            0x2ABFD8,
+            0x2AC258,
+            0x2AC26C,
+            0x2AC270,
+            0x2AC720,
+            0x2B7C70,
+            0x2B9EC8,
+            0x2B9ECA,
+            0x2B9ECC,
+            0x2B9EE8,
+            0x2B9F04,
+            0x2B9F88,
+            0x2BA304,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x3259F4,
+            0x325B00,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x37D5A6,
+            0x37D5AC,
+            0x37D5D0,
+            0x37D5D8,
+            0x37D5F8,
+            0x37D669,
+            0x37D66A,
+            0x37D66B,
+            0x37D66D,
+            0x37D670,
+            0x37D678,
+            0x37D67C,
+            0x37D688,
+            0x37DBBC,
+            0x38AEC4,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x20B5500,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x21BA634,
+            0x21BA674,
+            0x2211D0C,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x22A3F1C,
+            0x22A4164,
+            0x22A44E8,
+            0x22A44EE,
+            0x22A4CBE,
+            0x22A5490,
+            0x22A5494,
+            0x22A54B4,
+            0x22A54D4,
+            0x22A54D8,
+            0x22A54E8,
+            0x22A54F8,
+            0x22A5504,
+            0x22A5590,
+            0xFFFFFFFF,
+            0x22A921C,
+            0x22AB5A4,
+            0x22AB5A6,
+            0x22AB5C0,
+            0x22AB63C,
+            0x22AB6B8,
+            0x22AB6BC,
+            0x22AB78C,
+            0x22AB9EC,
+            0x22ABA9C,
+            0x22ABDEC,
+            0x22ABDF0,
+            0x22ABE3C,
+            0x22ABE3D,
+            0x22ABFD4,
+            0x22ABFD8,
+            0x22AC258,
+            0x22AC26C,
+            0x22AC270,
+            0x22AC720,
+            0x22B7C70,
+            0x22B9EC8,
+            0x22B9ECA,
+            0x22B9ECC,
+            0x22B9EE8,
+            0x22B9F04,
+            0x22B9F88,
+            0x22BA304,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x23259F4,
+            0x2325B00,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x237D5A6,
+            0x237D5AC,
+            0x237D5D0,
+            0x237D5D8,
+            0x237D5F8,
+            0x237D669,
+            0x237D66A,
+            0x237D66B,
+            0x237D66D,
+            0x237D670,
+            0x237D678,
+            0x237D67C,
+            0x237D688,
+            0x237DBBC,
+            0x238AEC4,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0x1E6400,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x4,
+            0x2CB14,
+            0x38C6,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x4,
+            0x104,
+            0x12C,
+            0x4,
+            0x7D0,
+            0x7D0,
+            0x4,
+            0x20,
+            0x20,
+            0x4,
+            0x10,
+            0x10,
+            0x4,
+            0x4,
+            0x200,
+            0xFFFFFFFF,
+            0x1180,
+            0x2,
+            0x2,
+            0x7C,
+            0x7C,
+            0x2,
+            0x7C,
+            0x8,
+            0x400,
+            0x1,
+            0x1,
+            0x48,
+            0x1,
+            0x1,
+            0x4,
+            0x1,
+            0xA,
+            0x2,
+            0x4B0,
+            0x99A8,
+            0xFFFFFFFF,
+            0x2,
+            0x2,
+            0x2,
+            0x4,
+            0x4,
+            0xFFFFFFFF,
+            0x4,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x18,
+            0x1C,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x1,
+            0x4,
+            0x8,
+            0x20,
+            0x20,
+            0x1,
+            0x1,
+            0x1,
+            0x1,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x40,
+            0x4,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            2777,
+            2778,
+            2779,
+            2780,
+            2781,
+            2782,
+            2783,
+            2784,
+            2785,
+            2786,
+            2787,
+            2788,
+            2789,
+            2790,
+            2791,
+            2792,
+            2793,
+            2794,
+            2795,
+            2796,
+            2797,
+            2798,
+            2799,
+            2800,
+            2801,
+            2802,
+            2803,
+            2804,
+            2805,
+            2806,
+            2807,
+            2808,
+            2809,
+            2810,
+            2811,
+            2812,
+            2813,
+            2814,
+            2815,
+            2816,
+            2817,
+            2818,
+            2819,
+            2820,
+            2821,
+            2822,
+            1,
+            1,
+            1,
+            2823,
+            1,
+            1,
+            2824,
+            2825,
+            2826,
+            2827,
+            2828,
+            2829,
+            2830,
+            2831,
+            1,
+            2832,
+            2833,
+            2834,
+            2835,
+            2836,
+            2837,
+            2838,
+            2839,
+            2840,
+            2841,
+            2842,
+            2843,
+            2844,
+            2845,
+            2846,
+        ),
+    ),
+    c_types=(
+        "uint8_t[1991680]",
+        "struct mem_arena",
+        "struct mem_block[32]",
+        "uint8_t[720100]",
+        "struct rgba*",
+        "struct dungeon",
+        "struct move_data_table",
+        "struct mem_arena",
+        "struct mem_block[20]",
+        "uint8_t[245252]",
+        "uint32_t",
+        "struct touchscreen_status",
+        "struct item[50]",
+        "struct item*",
+        "struct item_id_16[1000]",
+        "uint16_t[1000]",
+        "struct bulk_item*",
+        "struct bulk_item[8]",
+        "struct bulk_item[8]",
+        "struct bulk_item*",
+        "struct bulk_item[4]",
+        "struct bulk_item[4]",
+        "int32_t",
+        "int32_t",
+        "struct audio_command[16]",
+        "struct mem_arena*",
+        "struct window_list",
+        "uint16_t",
+        "uint16_t",
+        "struct animation_control*",
+        "struct animation_control*",
+        "uint16_t",
+        "struct animation_control*",
+        "struct move",
+        "struct script_var_value_table",
+        "uint8_t",
+        "struct special_episode_type_8",
+        "struct file_stream",
+        "struct dungeon_id_8",
+        "uint8_t",
+        "uint32_t",
+        "uint8_t",
+        "",
+        "struct monster_id_16",
+        "struct level_up_entry[100]",
+        "struct team_member_table",
+        "",
+        "uint16_t",
+        "uint16_t",
+        "struct vram_banks_set",
+        "undefined4",
+        "undefined4",
+        "struct thread_info",
+        "uint32_t",
+        "struct mem_arena*",
+        "struct mem_arena*",
+        "bool[20]",
+        "struct mem_arena",
+        "struct mem_block[52]",
+        "uint8_t[408324]",
+        "struct sentry_duty",
+        "bool",
+        "struct loaded_attack_sprite_data*",
+        "bool[8]",
+        "uint32_t[8]",
+        "uint32_t[8]",
+        "bool",
+        "bool",
+        "bool",
+        "bool",
+        "int",
+        "int",
+        "int",
+        "int",
+        "struct floor_generation_status",
+        "struct stairs_menu*",
+    ),
+    multi={
+        10: ((0x2A3E8C, 0x2A3EDC), (0x22A3E8C, 0x22A3EDC)),
+    },
+)
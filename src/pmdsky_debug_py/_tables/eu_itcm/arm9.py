@@ -0,0 +1,6316 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the arm9 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "Svc_SoftReset",
+        "Svc_WaitByLoop",
+        "Svc_CpuSet",
+        "_start",
+        "InitI_CpuClear32",
+        "MIi_UncompressBackward",
+        "do_autoload",
+        "StartAutoloadDoneCallback",
+        "init_cp15",
+        "OSi_ReferSymbol",
+        "NitroMain",
+        "InitMemAllocTable",
+        "SetMemAllocatorParams",
+        "GetAllocArenaDefault",
+        "GetFreeArenaDefault",
+        "InitMemArena",
+        "MemAllocFlagsToBlockType",
+        "FindAvailableMemBlock",
+        "SplitMemBlock",
+        "MemAlloc",
+        "MemFree",
+        "MemArenaAlloc",
+        "CreateMemArena",
+        "MemLocateSet",
+        "MemLocateUnset",
+        "RoundUpDiv256",
+        "UFixedPoint64CmpLt",
+        "MultiplyByFixedPoint",
+        "UMultiplyByFixedPoint",
+        "IntToFixedPoint64",
+        "FixedPoint64ToInt",
+        "FixedPoint32To64",
+        "NegateFixedPoint64",
+        "FixedPoint64IsZero",
+        "FixedPoint64IsNegative",
+        "FixedPoint64CmpLt",
+        "MultiplyFixedPoint64",
+        "DivideFixedPoint64",
+        "UMultiplyFixedPoint64",
+        "UDivideFixedPoint64",
+        "AddFixedPoint64",
+        "ClampedLn",
+        "GetRngSeed",
+        "SetRngSeed",
+        "Rand16Bit",
+        "RandInt",
+        "RandRange",
+        "Rand32Bit",
+        "RandIntSafe",
+        "RandRangeSafe",
+        "WaitForever",
+        "InterruptMasterDisable",
+        "InterruptMasterEnable",
+        "InitMemAllocTableVeneer",
+        "ZInit8",
+        "PointsToZero",
+        "MemZero",
+        "MemZero16",
+        "MemZero32",
+        "MemsetSimple",
+        "Memset32",
+        "MemcpySimple",
+        "Memcpy16",
+        "Memcpy32",
+        "TaskProcBoot",
+        "EnableAllInterrupts",
+        "GetTime",
+        "DisableAllInterrupts",
+        "SoundResume",
+        "CardPullOutWithStatus",
+        "CardPullOut",
+        "CardBackupError",
+        "HaltProcessDisp",
+        "OverlayIsLoaded",
+        "LoadOverlay",
+        "UnloadOverlay",
+        "GetDsFirmwareUserSettingsVeneer",
+        "Rgb8ToRgb5",
+        "EuclideanNorm",
+        "ClampComponentAbs",
+        "GetHeldButtons",
+        "GetPressedButtons",
+        "GetReleasedStylus",
+        "KeyWaitInit",
+        "DebugPrintSystemClock",
+        "GetSystemClock",
+        "SprintfSystemClock",
+        "DataTransferInit",
+        "DataTransferStop",
+        "FileInitVeneer",
+        "FileOpen",
+        "FileGetSize",
+        "FileRead",
+        "FileSeek",
+        "FileClose",
+        "UnloadFile",
+        "LoadFileFromRom",
+        "TransformPaletteDataWithFlushDivideFade",
+        "UpdateFadeStatus",
+        "HandleFades",
+        "GetFadeStatus",
+        "InitDebug",
+        "InitDebugFlag",
+        "GetDebugFlag",
+        "SetDebugFlag",
+        "InitDebugStripped6",
+        "AppendProgPos",
+        "InitDebugStripped5",
+        "DebugPrintTrace",
+        "DebugDisplay",
+        "DebugPrint0",
+        "InitDebugLogFlag",
+        "GetDebugLogFlag",
+        "SetDebugLogFlag",
+        "DebugPrint",
+        "InitDebugStripped4",
+        "InitDebugStripped3",
+        "InitDebugStripped2",
+        "InitDebugStripped1",
+        "FatalError",
+        "OpenAllPackFiles",
+        "GetFileLengthInPackWithPackNb",
+        "LoadFileInPackWithPackId",
+        "AllocAndLoadFileInPack",
+        "OpenPackFile",
+        "GetFileLengthInPack",
+        "LoadFileInPack",
+        "GetDungeonResultMsg",
+        "GetDamageSource",
+        "GetItemCategoryVeneer",
+        "GetItemMoveId16",
+        "IsThrownItem",
+        "IsNotMoney",
+        "IsEdible",
+        "IsHM",
+        "IsGummi",
+        "IsAuraBow",
+        "IsLosableItem",
+        "IsTreasureBox",
+        "IsStorableItem",
+        "IsShoppableItem",
+        "IsValidTargetItem",
+        "IsItemUsableNow",
+        "IsTicketItem",
+        "InitItem",
+        "InitStandardItem",
+        "InitBulkItem",
+        "BulkItemToItem",
+        "ItemToBulkItem",
+        "GetDisplayedBuyPrice",
+        "GetDisplayedSellPrice",
+        "GetActualBuyPrice",
+        "GetActualSellPrice",
+        "FindItemInInventory",
+        "SprintfStatic",
+        "ItemZInit",
+        "AreItemsEquivalent",
+        "WriteItemsToSave",
+        "ReadItemsFromSave",
+        "IsItemAvailableInDungeonGroup",
+        "GetItemIdFromList",
+        "NormalizeTreasureBox",
+        "SortItemList",
+        "RemoveEmptyItems",
+        "LoadItemPspi2n",
+        "GetExclusiveItemType",
+        "GetExclusiveItemOffsetEnsureValid",
+        "IsItemValid",
+        "GetExclusiveItemParameter",
+        "GetItemCategory",
+        "EnsureValidItem",
+        "GetItemName",
+        "GetItemNameFormatted",
+        "GetItemBuyPrice",
+        "GetItemSellPrice",
+        "GetItemSpriteId",
+        "GetItemPaletteId",
+        "GetItemActionName",
+        "GetThrownItemQuantityLimit",
+        "GetItemMoveId",
+        "TestItemAiFlag",
+        "IsItemInTimeDarkness",
+        "IsItemValidVeneer",
+        "SetActiveInventoryToMain",
+        "AllInventoriesZInit",
+        "SpecialEpisodeInventoryZInit",
+        "RescueInventoryZInit",
+        "SetActiveInventory",
+        "GetMoneyCarried",
+        "SetMoneyCarried",
+        "AddMoneyCarried",
+        "GetCurrentBagCapacity",
+        "IsBagFull",
+        "GetNbItemsInBag",
+        "CountNbItemsOfTypeInBag",
+        "CountItemTypeInBag",
+        "IsItemInBag",
+        "IsItemWithFlagsInBag",
+        "IsItemInTreasureBoxes",
+        "IsHeldItemInBag",
+        "IsItemForSpecialSpawnInBag",
+        "HasStorableItems",
+        "GetItemIndex",
+        "GetEquivItemIndex",
+        "GetEquippedThrowableItem",
+        "GetFirstUnequippedItemOfType",
+        "CopyItemAtIdx",
+        "GetItemAtIdx",
+        "RemoveEmptyItemsInBag",
+        "RemoveItemNoHole",
+        "RemoveItem",
+        "RemoveHeldItemNoHole",
+        "RemoveItemByIdAndStackNoHole",
+        "RemoveEquivItem",
+        "RemoveEquivItemNoHole",
+        "DecrementStackItem",
+        "RemoveItemNoHoleCheck",
+        "RemoveFirstUnequippedItemOfType",
+        "RemoveAllItems",
+        "RemoveAllItemsStartingAt",
+        "SpecialProcAddItemToBag",
+        "AddItemToBagNoHeld",
+        "AddItemToBag",
+        "CleanStickyItemsInBag",
+        "CountStickyItemsInBag",
+        "TransmuteHeldItemInBag",
+        "SetFlagsForHeldItemInBag",
+        "RemoveHolderForItemInBag",
+        "SetHolderForItemInBag",
+        "SortItemsInBag",
+        "RemovePokeItemsInBag",
+        "IsStorageFull",
+        "CountNbOfItemsInStorage",
+        "CountNbOfValidItemsInStorage",
+        "CountNbOfValidItemsInTimeDarknessInStorage",
+        "CountNbItemsOfTypeInStorage",
+        "CountItemTypeInStorage",
+        "GetEquivBulkItemIdxInStorage",
+        "ConvertStorageItemAtIdxToBulkItem",
+        "ConvertStorageItemAtIdxToItem",
+        "RemoveItemAtIdxInStorage",
+        "RemoveBulkItemInStorage",
+        "RemoveItemInStorage",
+        "StorageZInit",
+        "AddBulkItemToStorage",
+        "AddItemToStorage",
+        "SortItemsInStorage",
+        "AllKecleonShopsZInit",
+        "SpecialEpisodeKecleonShopZInit",
+        "SetActiveKecleonShop",
+        "GetMoneyStored",
+        "SetMoneyStored",
+        "AddMoneyStored",
+        "SortKecleonItems1",
+        "GenerateKecleonItems1",
+        "SortKecleonItems2",
+        "GenerateKecleonItems2",
+        "GetExclusiveItemOffset",
+        "ApplyExclusiveItemStatBoosts",
+        "SetExclusiveItemEffect",
+        "ExclusiveItemEffectFlagTest",
+        "IsExclusiveItemIdForMonster",
+        "IsExclusiveItemForMonster",
+        "BagHasExclusiveItemTypeForMonster",
+        "GetExclusiveItemForMonsterFromBag",
+        "GetHpBoostFromExclusiveItems",
+        "ApplyGummiBoostsToGroundMonster",
+        "ApplyGummiBoostsToTeamMember",
+        "ApplySitrusBerryBoostToGroundMonster",
+        "ApplyLifeSeedBoostToGroundMonster",
+        "ApplyGinsengToGroundMonster",
+        "ApplyProteinBoostToGroundMonster",
+        "ApplyCalciumBoostToGroundMonster",
+        "ApplyIronBoostToGroundMonster",
+        "ApplyZincBoostToGroundMonster",
+        "ApplyNectarBoostToGroundMonster",
+        "IsMonsterAffectedByGravelyrockGroundMode",
+        "ApplyGravelyrockBoostToGroundMonster",
+        "ApplyGummiBoostsGroundMode",
+        "LoadSynthBin",
+        "CloseSynthBin",
+        "GetSynthItem",
+        "LoadWazaP",
+        "LoadWazaP2",
+        "UnloadCurrentWazaP",
+        "GetMoveName",
+        "FormatMoveString",
+        "FormatMoveStringMore",
+        "InitMove",
+        "InitMoveCheckId",
+        "GetInfoMoveGround",
+        "GetMoveTargetAndRange",
+        "GetMoveType",
+        "GetMovesetLevelUpPtr",
+        "IsInvalidMoveset",
+        "GetMovesetHmTmPtr",
+        "GetMovesetEggPtr",
+        "GetMoveAiWeight",
+        "GetMoveNbStrikes",
+        "GetMoveBasePower",
+        "GetMoveBasePowerGround",
+        "GetMoveAccuracyOrAiChance",
+        "GetMoveBasePp",
+        "GetMaxPp",
+        "GetMoveMaxGinsengBoost",
+        "GetMoveMaxGinsengBoostGround",
+        "GetMoveCritChance",
+        "IsThawingMove",
+        "IsAffectedByTaunt",
+        "GetMoveRangeId",
+        "GetMoveActualAccuracy",
+        "GetMoveBasePowerFromId",
+        "IsMoveRangeString19",
+        "GetMoveMessageFromId",
+        "GetNbMoves",
+        "GetMovesetIdx",
+        "IsReflectedByMagicCoat",
+        "CanBeSnatched",
+        "FailsWhileMuzzled",
+        "IsSoundMove",
+        "IsRecoilMove",
+        "AllManip1",
+        "AllManip2",
+        "ManipMoves1v1",
+        "ManipMoves1v2",
+        "ManipMoves2v1",
+        "ManipMoves2v2",
+        "DungeonMoveToGroundMove",
+        "GroundToDungeonMoveset",
+        "DungeonToGroundMoveset",
+        "GetInfoGroundMoveset",
+        "FindFirstFreeMovesetIdx",
+        "LearnMoves",
+        "CopyMoveTo",
+        "CopyMoveFrom",
+        "CopyMovesetTo",
+        "CopyMovesetFrom",
+        "Is2TurnsMove",
+        "IsRegularAttackOrProjectile",
+        "IsPunchMove",
+        "IsHealingWishOrLunarDance",
+        "IsCopyingMove",
+        "IsTrappingMove",
+        "IsOneHitKoMove",
+        "IsNot2TurnsMoveOrSketch",
+        "IsRealMove",
+        "IsMovesetValid",
+        "IsRealMoveInTimeDarkness",
+        "IsMovesetValidInTimeDarkness",
+        "GetFirstNotRealMoveInTimeDarkness",
+        "IsSameMove",
+        "GetMoveCategory",
+        "GetPpIncrease",
+        "OpenWaza",
+        "SelectWaza",
+        "PlayBgmByIdVeneer",
+        "PlayBgmByIdVolumeVeneer",
+        "PlaySeVolumeWrapper",
+        "PlayBgmById",
+        "PlayBgmByIdVolume",
+        "StopBgmCommand",
+        "PlaySeByIdVolume",
+        "SendAudioCommand2",
+        "AllocAudioCommand",
+        "SendAudioCommand",
+        "InitSoundSystem",
+        "ManipBgmPlayback",
+        "SoundDriverReset",
+        "LoadDseFile",
+        "PlaySeLoad",
+        "IsSongOver",
+        "PlayBgm",
+        "StopBgm",
+        "ChangeBgm",
+        "PlayBgm2",
+        "StopBgm2",
+        "ChangeBgm2",
+        "PlayME",
+        "StopME",
+        "PlaySe",
+        "PlaySeFullSpec",
+        "SeChangeVolume",
+        "SeChangePan",
+        "StopSe",
+        "CopyAndInterleaveWrapper",
+        "InitAnimationControl",
+        "InitAnimationControlWithSet",
+        "SetSpriteIdForAnimationControl",
+        "SetAnimationForAnimationControlInternal",
+        "SetAnimationForAnimationControl",
+        "GetWanForAnimationControl",
+        "SetAndPlayAnimationForAnimationControl",
+        "SwitchAnimationControlToNextFrame",
+        "LoadAnimationFrameAndIncrementInAnimationControl",
+        "AnimationControlGetAllocForMaxFrame",
+        "DeleteWanTableEntry",
+        "AllocateWanTableEntry",
+        "FindWanTableEntry",
+        "GetLoadedWanTableEntry",
+        "InitWanTable",
+        "LoadWanTableEntry",
+        "LoadWanTableEntryFromPack",
+        "LoadWanTableEntryFromPackUseProvidedMemory",
+        "ReplaceWanFromBinFile",
+        "DeleteWanTableEntryVeneer",
+        "WanHasAnimationGroup",
+        "WanTableSpriteHasAnimationGroup",
+        "SpriteTypeInWanTable",
+        "LoadWteFromRom",
+        "LoadWteFromFileDirectory",
+        "UnloadWte",
+        "LoadWtuFromBin",
+        "ProcessWte",
+        "GeomSetTexImageParam",
+        "GeomSetVertexCoord16",
+        "InitRender3dData",
+        "GeomSwapBuffers",
+        "InitRender3dElement64",
+        "Render3d64Texture0x7",
+        "Render3d64WindowFrame",
+        "EnqueueRender3d64Tiling",
+        "Render3d64Tiling",
+        "Render3d64Quadrilateral",
+        "Render3d64RectangleMulticolor",
+        "Render3d64Rectangle",
+        "Render3d64Nothing",
+        "Render3d64Texture",
+        "Render3dElement64",
+        "HandleSir0Translation",
+        "ConvertPointersSir0",
+        "HandleSir0TranslationVeneer",
+        "DecompressAtNormalVeneer",
+        "DecompressAtNormal",
+        "DecompressAtHalf",
+        "DecompressAtFromMemoryPointerVeneer",
+        "DecompressAtFromMemoryPointer",
+        "WriteByteFromMemoryPointer",
+        "GetAtSize",
+        "GetLanguageType",
+        "GetLanguage",
+        "StrcmpTag",
+        "AtoiTag",
+        "AnalyzeText",
+        "PreprocessString",
+        "PreprocessStringFromId",
+        "StrcmpTagVeneer",
+        "AtoiTagVeneer",
+        "InitPreprocessorArgs",
+        "SetStringAccuracy",
+        "SetStringPower",
+        "GetRankString",
+        "GetCurrentTeamNameString",
+        "GetBagNameString",
+        "GetDungeonResultString",
+        "SetQuestionMarks",
+        "StrcpySimple",
+        "StrncpySimple",
+        "StrncpySimpleNoPad",
+        "StrncmpSimple",
+        "StrncpySimpleNoPadSafe",
+        "StrcpyName",
+        "StrncpyName",
+        "GetStringFromFile",
+        "LoadStringFile",
+        "AllocateTemp1024ByteBufferFromPool",
+        "GetStringFromFileVeneer",
+        "StringFromId",
+        "CopyStringFromId",
+        "CopyNStringFromId",
+        "LoadTblTalk",
+        "GetTalkLine",
+        "IsAOrBPressed",
+        "DrawTextInWindow",
+        "GetCharWidth",
+        "GetColorCodePaletteOffset",
+        "DrawChar",
+        "GetWindow",
+        "NewWindowScreenCheck",
+        "NewWindow",
+        "SetScreenWindowsColor",
+        "SetBothScreensWindowsColor",
+        "UpdateWindow",
+        "ClearWindow",
+        "DeleteWindow",
+        "GetWindowRectangle",
+        "GetWindowContents",
+        "LoadCursors",
+        "InitWindowTrailer",
+        "Arm9LoadUnkFieldNa0x2029EC8",
+        "Arm9StoreUnkFieldNa0x2029ED8",
+        "LoadAlert",
+        "PrintClearMark",
+        "PrintBadgeMark",
+        "PrintMark",
+        "CreateParentMenuFromStringIds",
+        "IsEmptyString",
+        "CreateParentMenu",
+        "CreateParentMenuWrapper",
+        "CreateParentMenuInternal",
+        "ResumeParentMenu",
+        "SetParentMenuState7",
+        "CloseParentMenu",
+        "IsParentMenuActive",
+        "CheckParentMenuField0x1A0",
+        "UpdateParentMenu",
+        "CreateSimpleMenuFromStringIds",
+        "CreateSimpleMenu",
+        "CreateSimpleMenuInternal",
+        "ResumeSimpleMenu",
+        "CloseSimpleMenu",
+        "IsSimpleMenuActive",
+        "CheckSimpleMenuField0x1A0",
+        "GetSimpleMenuField0x1A4",
+        "GetSimpleMenuResult",
+        "UpdateSimpleMenu",
+        "SetSimpleMenuField0x1AC",
+        "CreateAdvancedMenu",
+        "ResumeAdvancedMenu",
+        "CloseAdvancedMenu",
+        "IsAdvancedMenuActive2",
+        "IsAdvancedMenuActive",
+        "GetAdvancedMenuCurrentOption",
+        "GetAdvancedMenuResult",
+        "UpdateAdvancedMenu",
+        "CreateCollectionMenu",
+        "SetCollectionMenuField0x1BC",
+        "SetCollectionMenuWidth",
+        "CloseCollectionMenu",
+        "IsCollectionMenuActive",
+        "SetCollectionMenuField0x1C8",
+        "SetCollectionMenuField0x1A0",
+        "SetCollectionMenuField0x1A4",
+        "SetCollectionMenuVoidFn",
+        "UpdateCollectionMenu",
+        "SetCollectionMenuField0x1B2",
+        "IsCollectionMenuState3",
+        "CreateOptionsMenu",
+        "CloseOptionsMenu",
+        "IsOptionsMenuActive",
+        "CheckOptionsMenuField0x1A4",
+        "GetOptionsMenuStates",
+        "GetOptionsMenuResult",
+        "UpdateOptionsMenu",
+        "CreateDebugMenu",
+        "CloseDebugMenu",
+        "IsDebugMenuActive",
+        "CheckDebugMenuField0x1A4",
+        "UpdateDebugMenu",
+        "CreateScrollBoxSingle",
+        "CreateScrollBoxMulti",
+        "SetScrollBoxState7",
+        "CloseScrollBox",
+        "IsScrollBoxActive",
+        "UpdateScrollBox",
+        "CreateDialogueBox",
+        "CloseDialogueBox",
+        "IsDialogueBoxActive",
+        "ShowStringIdInDialogueBox",
+        "ShowStringInDialogueBox",
+        "ShowDialogueBox",
+        "ReadStringFromDialogueBox",
+        "UpdateDialogueBox",
+        "CreatePortraitBox",
+        "ClosePortraitBox",
+        "PortraitBoxNeedsUpdate",
+        "ShowPortraitInPortraitBox",
+        "HidePortraitBox",
+        "UpdatePortraitBox",
+        "CreateTextBox",
+        "CreateTextBoxWithArg",
+        "CloseTextBox",
+        "CloseTextBox2",
+        "CreateTextBoxInternal",
+        "UpdateTextBox",
+        "IsTextBoxActive",
+        "CreateAreaNameBox",
+        "SetAreaNameBoxState3",
+        "CloseAreaNameBox",
+        "IsAreaNameBoxActive",
+        "UpdateAreaNameBox",
+        "CreateControlsChart",
+        "CloseControlsChart",
+        "IsControlsChartActive",
+        "UpdateControlsChart",
+        "CreateAlertBox",
+        "CloseAlertBox",
+        "IsAlertBoxActive",
+        "UpdateAlertBox",
+        "CreateAdvancedTextBox",
+        "CreateAdvancedTextBoxWithArg",
+        "CreateAdvancedTextBoxInternal",
+        "SetAdvancedTextBoxPartialMenu",
+        "SetAdvancedTextBoxField0x1C4",
+        "SetAdvancedTextBoxField0x1C2",
+        "CloseAdvancedTextBox2",
+        "SetAdvancedTextBoxState5",
+        "CloseAdvancedTextBox",
+        "IsAdvancedTextBoxActive",
+        "GetAdvancedTextBoxFlags2",
+        "SetUnkAdvancedTextBoxFn",
+        "SetUnkAdvancedTextBoxWindowFn",
+        "UpdateAdvancedTextBox",
+        "PlayAdvancedTextBoxInputSound",
+        "CreateTeamSelectionMenu",
+        "CloseTeamSelectionMenu",
+        "IsTeamSelectionMenuActive",
+        "UpdateTeamSelectionMenu",
+        "IsTeamSelectionMenuState3",
+        "CalcMenuHeightDiv8",
+        "InitWindowInput",
+        "IsMenuOptionActive",
+        "PlayWindowInputSound",
+        "InitInventoryMenuInput",
+        "ShowKeyboard",
+        "GetKeyboardStatus",
+        "GetKeyboardStringResult",
+        "TeamSelectionMenuGetItem",
+        "PrintMoveOptionMenu",
+        "PrintIqSkillsMenu",
+        "GetNotifyNote",
+        "SetNotifyNote",
+        "InitSpecialEpisodeHero",
+        "EventFlagBackupVeneer",
+        "InitMainTeamAfterQuiz",
+        "InitSpecialEpisodePartners",
+        "InitSpecialEpisodeExtraPartner",
+        "ReadStringSave",
+        "CheckStringSave",
+        "WriteSaveFile",
+        "ReadSaveFile",
+        "CalcChecksum",
+        "CheckChecksumInvalid",
+        "NoteSaveBase",
+        "WriteQuickSaveInfo",
+        "ReadSaveHeader",
+        "NoteLoadBase",
+        "ReadQuickSaveInfo",
+        "GetGameMode",
+        "InitScriptVariableValues",
+        "InitEventFlagScriptVars",
+        "ZinitScriptVariable",
+        "LoadScriptVariableRaw",
+        "LoadScriptVariableValue",
+        "LoadScriptVariableValueAtIndex",
+        "SaveScriptVariableValue",
+        "SaveScriptVariableValueAtIndex",
+        "LoadScriptVariableValueSum",
+        "LoadScriptVariableValueBytes",
+        "SaveScriptVariableValueBytes",
+        "ScriptVariablesEqual",
+        "EventFlagResume",
+        "EventFlagBackup",
+        "DumpScriptVariableValues",
+        "RestoreScriptVariableValues",
+        "InitScenarioScriptVars",
+        "SetScenarioScriptVar",
+        "GetSpecialEpisodeType",
+        "SetSpecialEpisodeType",
+        "GetExecuteSpecialEpisodeType",
+        "IsSpecialEpisodeOpen",
+        "HasPlayedOldGame",
+        "GetPerformanceFlagWithChecks",
+        "GetScenarioBalance",
+        "ScenarioFlagBackup",
+        "InitWorldMapScriptVars",
+        "InitDungeonListScriptVars",
+        "SetDungeonConquest",
+        "GetDungeonMode",
+        "GlobalProgressAlloc",
+        "ResetGlobalProgress",
+        "SetMonsterFlag1",
+        "GetMonsterFlag1",
+        "SetMonsterFlag2",
+        "HasMonsterBeenAttackedInDungeons",
+        "SetDungeonTipShown",
+        "GetDungeonTipShown",
+        "SetMaxReachedFloor",
+        "GetMaxReachedFloor",
+        "IncrementNbAdventures",
+        "GetNbAdventures",
+        "CanMonsterSpawn",
+        "IncrementExclusiveMonsterCounts",
+        "CopyProgressInfoTo",
+        "CopyProgressInfoFromScratchTo",
+        "CopyProgressInfoFrom",
+        "CopyProgressInfoFromScratchFrom",
+        "InitKaomadoStream",
+        "InitPortraitParams",
+        "InitPortraitParamsWithMonsterId",
+        "SetPortraitEmotion",
+        "SetPortraitLayout",
+        "SetPortraitOffset",
+        "AllowPortraitDefault",
+        "IsValidPortrait",
+        "LoadPortrait",
+        "WonderMailPasswordToMission",
+        "SetEnterDungeon",
+        "InitDungeonInit",
+        "IsNoLossPenaltyDungeon",
+        "CheckMissionRestrictions",
+        "GetNbFloors",
+        "GetNbFloorsPlusOne",
+        "GetDungeonGroup",
+        "GetNbPrecedingFloors",
+        "GetNbFloorsDungeonGroup",
+        "DungeonFloorToGroupFloor",
+        "GetMissionRank",
+        "GetOutlawLevel",
+        "GetOutlawLeaderLevel",
+        "GetOutlawMinionLevel",
+        "AddGuestMonster",
+        "GetGroundNameId",
+        "SetAdventureLogStructLocation",
+        "SetAdventureLogDungeonFloor",
+        "GetAdventureLogDungeonFloor",
+        "ClearAdventureLogStruct",
+        "SetAdventureLogCompleted",
+        "IsAdventureLogNotEmpty",
+        "GetAdventureLogCompleted",
+        "IncrementNbDungeonsCleared",
+        "GetNbDungeonsCleared",
+        "IncrementNbFriendRescues",
+        "GetNbFriendRescues",
+        "IncrementNbEvolutions",
+        "GetNbEvolutions",
+        "IncrementNbSteals",
+        "IncrementNbEggsHatched",
+        "GetNbEggsHatched",
+        "GetNbPokemonJoined",
+        "GetNbMovesLearned",
+        "SetVictoriesOnOneFloor",
+        "GetVictoriesOnOneFloor",
+        "SetPokemonJoined",
+        "SetPokemonBattled",
+        "GetNbPokemonBattled",
+        "IncrementNbBigTreasureWins",
+        "SetNbBigTreasureWins",
+        "GetNbBigTreasureWins",
+        "SetNbRecycled",
+        "GetNbRecycled",
+        "IncrementNbSkyGiftsSent",
+        "SetNbSkyGiftsSent",
+        "GetNbSkyGiftsSent",
+        "ComputeSpecialCounters",
+        "RecruitSpecialPokemonLog",
+        "IncrementNbFainted",
+        "GetNbFainted",
+        "SetItemAcquired",
+        "GetNbItemAcquired",
+        "SetChallengeLetterCleared",
+        "GetSentryDutyGamePoints",
+        "SetSentryDutyGamePoints",
+        "CopyLogTo",
+        "CopyLogFrom",
+        "GetAbilityString",
+        "GetAbilityDescStringId",
+        "GetTypeStringId",
+        "GetConversion2ConvertToType",
+        "CopyBitsTo",
+        "CopyBitsFrom",
+        "StoreDefaultTeamData",
+        "GetMainTeamNameWithCheck",
+        "GetMainTeamName",
+        "SetMainTeamName",
+        "GetRankupPoints",
+        "GetRank",
+        "GetRankStorageSize",
+        "ResetPlayTimer",
+        "PlayTimerTick",
+        "GetPlayTimeSeconds",
+        "SubFixedPoint",
+        "BinToDecFixedPoint",
+        "CeilFixedPoint",
+        "DungeonGoesUp",
+        "GetTurnLimit",
+        "DoesNotSaveWhenEntering",
+        "TreasureBoxDropsEnabled",
+        "IsLevelResetDungeon",
+        "GetMaxItemsAllowed",
+        "IsMoneyAllowed",
+        "GetMaxRescueAttempts",
+        "IsRecruitingAllowed",
+        "GetLeaderChangeFlag",
+        "GetRandomMovementChance",
+        "CanEnemyEvolve",
+        "GetMaxMembersAllowed",
+        "IsIqEnabled",
+        "IsTrapInvisibleWhenAttacking",
+        "JoinedAtRangeCheck",
+        "IsDojoDungeon",
+        "IsFutureDungeon",
+        "IsSpecialEpisodeDungeon",
+        "RetrieveFromItemList1",
+        "IsForbiddenFloor",
+        "Copy16BitsFrom",
+        "RetrieveFromItemList2",
+        "IsInvalidForMission",
+        "IsExpEnabledInDungeon",
+        "IsSkyExclusiveDungeon",
+        "JoinedAtRangeCheck2",
+        "GetBagCapacity",
+        "GetBagCapacitySpecialEpisode",
+        "GetRankUpEntry",
+        "GetBgRegionArea",
+        "LoadMonsterMd",
+        "GetNameRaw",
+        "GetName",
+        "GetNameWithGender",
+        "GetSpeciesString",
+        "GetNameString",
+        "GetSpriteIndex",
+        "GetDexNumber",
+        "GetCategoryString",
+        "GetMonsterGender",
+        "GetBodySize",
+        "GetSpriteSize",
+        "GetSpriteFileSize",
+        "GetShadowSize",
+        "GetSpeedStatus",
+        "GetMobilityType",
+        "GetRegenSpeed",
+        "GetCanMoveFlag",
+        "GetChanceAsleep",
+        "GetWeightMultiplier",
+        "GetSize",
+        "GetBaseHp",
+        "CanThrowItems",
+        "CanEvolve",
+        "GetMonsterPreEvolution",
+        "GetBaseOffensiveStat",
+        "GetBaseDefensiveStat",
+        "GetType",
+        "GetAbility",
+        "GetRecruitRate2",
+        "GetRecruitRate1",
+        "GetExp",
+        "GetEvoParameters",
+        "GetTreasureBoxChances",
+        "GetIqGroup",
+        "GetSpawnThreshold",
+        "NeedsItemToSpawn",
+        "GetExclusiveItem",
+        "GetFamilyIndex",
+        "LoadM2nAndN2m",
+        "GuestMonsterToGroundMonster",
+        "StrcmpMonsterName",
+        "GetLvlUpEntry",
+        "GetEncodedHalfword",
+        "GetEvoFamily",
+        "GetEvolutions",
+        "ShuffleHiddenPower",
+        "GetBaseForm",
+        "GetBaseFormBurmyWormadamShellosGastrodonCherrim",
+        "GetBaseFormCastformCherrimDeoxys",
+        "GetAllBaseForms",
+        "GetDexNumberVeneer",
+        "GetMonsterIdFromSpawnEntry",
+        "SetMonsterId",
+        "SetMonsterLevelAndId",
+        "GetMonsterLevelFromSpawnEntry",
+        "GetMonsterGenderVeneer",
+        "IsMonsterValid",
+        "IsUnown",
+        "IsShaymin",
+        "IsCastform",
+        "IsCherrim",
+        "IsDeoxys",
+        "GetSecondFormIfValid",
+        "FemaleToMaleForm",
+        "GetBaseFormCastformDeoxysCherrim",
+        "BaseFormsEqual",
+        "DexNumbersEqual",
+        "GendersEqual",
+        "GendersEqualNotGenderless",
+        "GendersNotEqualNotGenderless",
+        "IsMonsterOnTeam",
+        "GetNbRecruited",
+        "IsValidTeamMember",
+        "IsMainCharacter",
+        "GetTeamMember",
+        "GetHeroMemberIdx",
+        "GetPartnerMemberIdx",
+        "GetMainCharacter1MemberIdx",
+        "GetMainCharacter2MemberIdx",
+        "GetMainCharacter3MemberIdx",
+        "GetHero",
+        "GetPartner",
+        "GetMainCharacter1",
+        "GetMainCharacter2",
+        "GetMainCharacter3",
+        "GetFirstMatchingMemberIdx",
+        "GetFirstEmptyMemberIdx",
+        "IsMonsterNotNicknamed",
+        "RemoveActiveMembersFromAllTeams",
+        "RemoveActiveMembersFromSpecialEpisodeTeam",
+        "RemoveActiveMembersFromRescueTeam",
+        "CheckTeamMemberIdx",
+        "IsMonsterIdInNormalRange",
+        "SetActiveTeam",
+        "GetActiveTeamMember",
+        "GetActiveRosterIndex",
+        "TryAddMonsterToActiveTeam",
+        "RemoveActiveMembersFromMainTeam",
+        "SetTeamSetupHeroAndPartnerOnly",
+        "SetTeamSetupHeroOnly",
+        "GetPartyMembers",
+        "RefillTeam",
+        "ClearItem",
+        "ChangeGiratinaFormIfSkyDungeon",
+        "GetIqSkillStringId",
+        "DoesTacticFollowLeader",
+        "GetUnlockedTactics",
+        "GetUnlockedTacticFlags",
+        "CanLearnIqSkill",
+        "GetLearnableIqSkills",
+        "DisableIqSkill",
+        "EnableIqSkill",
+        "GetSpeciesIqSkill",
+        "DisableAllIqSkills",
+        "EnableAllLearnableIqSkills",
+        "IqSkillFlagTest",
+        "GetNextIqSkill",
+        "GetExplorerMazeTeamName",
+        "GetExplorerMazeMonster",
+        "WriteMonsterInfoToSave",
+        "ReadMonsterInfoFromSave",
+        "WriteMonsterToSave",
+        "ReadMonsterFromSave",
+        "GetEvolutionPossibilities",
+        "GetMonsterEvoStatus",
+        "CopyTacticString",
+        "GetStatBoostsForMonsterSummary",
+        "CreateMonsterSummaryFromTeamMember",
+        "GetSosMailCount",
+        "IsMissionSuspendedAndValid",
+        "AreMissionsEquivalent",
+        "IsMissionValid",
+        "GenerateMission",
+        "IsMissionTypeSpecialEpisode",
+        "GenerateDailyMissions",
+        "AlreadyHaveMission",
+        "CountJobListMissions",
+        "DungeonRequestsDone",
+        "DungeonRequestsDoneWrapper",
+        "AnyDungeonRequestsDone",
+        "AddMissionToJobList",
+        "GetAcceptedMission",
+        "GetMissionByTypeAndDungeon",
+        "CheckAcceptedMissionByTypeAndDungeon",
+        "GetAllPossibleMonsters",
+        "GenerateAllPossibleMonstersList",
+        "DeleteAllPossibleMonstersList",
+        "GenerateAllPossibleDungeonsList",
+        "DeleteAllPossibleDungeonsList",
+        "GenerateAllPossibleDeliverList",
+        "DeleteAllPossibleDeliverList",
+        "ClearMissionData",
+        "IsMonsterMissionAllowed",
+        "CanMonsterBeUsedForMissionWrapper",
+        "CanMonsterBeUsedForMission",
+        "IsMonsterMissionAllowedStory",
+        "CanDungeonBeUsedForMission",
+        "CanSendItem",
+        "IsAvailableItem",
+        "GetAvailableItemDeliveryList",
+        "GetActorMatchingStorageId",
+        "SetActorTalkMainAndActorTalkSub",
+        "SetActorTalkMain",
+        "SetActorTalkSub",
+        "RandomizeDemoActors",
+        "ItemAtTableIdx",
+        "MainLoop",
+        "CreateJobSummary",
+        "DungeonSwapIdToIdx",
+        "DungeonSwapIdxToId",
+        "GetDungeonModeSpecial",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            16,
+            16,
+            16,
+            17,
+            1,
+            18,
+            18,
+            18,
+            1,
+            18,
+            19,
+            20,
+            21,
+            22,
+            23,
+            24,
+            25,
+            26,
+            27,
+            28,
+            29,
+            30,
+            31,
+            32,
+            33,
+            34,
+            35,
+            36,
+            37,
+            38,
+            39,
+            40,
+            41,
+            42,
+            43,
+            44,
+            45,
+            46,
+            47,
+            48,
+            49,
+            50,
+            51,
+            52,
+            53,
+            54,
+            55,
+            56,
+            57,
+            58,
+            59,
+            60,
+            60,
+            61,
+            62,
+            63,
+            64,
+            65,
+            66,
+            67,
+            68,
+            69,
+            70,
+            71,
+            72,
+            73,
+            74,
+            75,
+            76,
+            77,
+            78,
+            79,
+            80,
+            81,
+            82,
+            83,
+            84,
+            85,
+            86,
+            87,
+            88,
+            88,
+            89,
+            90,
+            91,
+            92,
+            93,
+            94,
+            95,
+            96,
+            97,
+            98,
+            99,
+            100,
+            101,
+            102,
+            103,
+            104,
+            105,
+            106,
+            107,
+            108,
+            109,
+            110,
+            111,
+            112,
+            113,
+            112,
+            114,
+            115,
+            116,
+            117,
+            118,
+            119,
+            120,
+            112,
+            112,
+            112,
+            112,
+            121,
+            122,
+            123,
+            124,
+            125,
+            126,
+            127,
+            128,
+            129,
+            130,
+            131,
+            132,
+            133,
+            134,
+            135,
+            136,
+            137,
+            138,
+            139,
+            140,
+            141,
+            142,
+            143,
+            144,
+            145,
+            146,
+            147,
+            148,
+            149,
+            150,
+            151,
+            152,
+            151,
+            152,
+            153,
+            154,
+            155,
+            156,
+            157,
+            157,
+            158,
+            159,
+            160,
+            161,
+            162,
+            163,
+            164,
+            165,
+            166,
+            164,
+            167,
+            168,
+            169,
+            170,
+            171,
+            172,
+            173,
+            174,
+            175,
+            176,
+            177,
+            178,
+            136,
+            179,
+            180,
+            181,
+            182,
+            183,
+            184,
+            185,
+            186,
+            187,
+            188,
+            189,
+            190,
+            191,
+            192,
+            193,
+            194,
+            136,
+            195,
+            196,
+            196,
+            197,
+            197,
+            198,
+            199,
+            200,
+            201,
+            163,
+            202,
+            203,
+            204,
+            205,
+            205,
+            205,
+            205,
+            202,
+            164,
+            206,
+            203,
+            207,
+            208,
+            209,
+            210,
+            211,
+            212,
+            213,
+            214,
+            215,
+            216,
+            217,
+            218,
+            219,
+            220,
+            221,
+            222,
+            223,
+            224,
+            225,
+            226,
+            227,
+            228,
+            229,
+            230,
+            231,
+            232,
+            233,
+            234,
+            235,
+            236,
+            237,
+            238,
+            239,
+            240,
+            241,
+            242,
+            243,
+            244,
+            245,
+            246,
+            247,
+            248,
+            249,
+            250,
+            251,
+            252,
+            253,
+            254,
+            255,
+            256,
+            257,
+            258,
+            259,
+            260,
+            261,
+            262,
+            263,
+            264,
+            265,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            267,
+            268,
+            269,
+            270,
+            271,
+            272,
+            273,
+            274,
+            275,
+            276,
+            277,
+            277,
+            278,
+            279,
+            280,
+            281,
+            282,
+            283,
+            284,
+            285,
+            286,
+            287,
+            288,
+            289,
+            290,
+            291,
+            292,
+            293,
+            294,
+            295,
+            296,
+            297,
+            297,
+            298,
+            288,
+            299,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            300,
+            301,
+            302,
+            303,
+            304,
+            303,
+            305,
+            306,
+            305,
+            306,
+            297,
+            307,
+            308,
+            309,
+            310,
+            297,
+            297,
+            297,
+            297,
+            311,
+            312,
+            311,
+            313,
+            314,
+            315,
+            316,
+            317,
+            317,
+            318,
+            319,
+            320,
+            321,
+            322,
+            323,
+            324,
+            325,
+            326,
+            327,
+            328,
+            329,
+            330,
+            331,
+            266,
+            332,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            333,
+            266,
+            266,
+            266,
+            266,
+            266,
+            334,
+            335,
+            336,
+            337,
+            338,
+            339,
+            340,
+            341,
+            342,
+            343,
+            344,
+            345,
+            346,
+            347,
+            348,
+            349,
+            350,
+            351,
+            352,
+            353,
+            354,
+            355,
+            356,
+            357,
+            358,
+            359,
+            360,
+            361,
+            362,
+            363,
+            364,
+            365,
+            366,
+            367,
+            368,
+            369,
+            370,
+            371,
+            372,
+            373,
+            374,
+            375,
+            376,
+            377,
+            378,
+            379,
+            380,
+            381,
+            382,
+            383,
+            384,
+            382,
+            385,
+            386,
+            387,
+            388,
+            389,
+            390,
+            391,
+            392,
+            393,
+            394,
+            395,
+            396,
+            266,
+            266,
+            397,
+            398,
+            399,
+            400,
+            401,
+            402,
+            403,
+            404,
+            405,
+            406,
+            407,
+            408,
+            409,
+            163,
+            410,
+            411,
+            412,
+            413,
+            414,
+            163,
+            415,
+            416,
+            417,
+            418,
+            419,
+            420,
+            421,
+            422,
+            423,
+            424,
+            425,
+            426,
+            427,
+            428,
+            429,
+            430,
+            431,
+            432,
+            433,
+            434,
+            435,
+            436,
+            437,
+            438,
+            439,
+            440,
+            441,
+            442,
+            443,
+            444,
+            445,
+            446,
+            447,
+            448,
+            449,
+            450,
+            451,
+            452,
+            453,
+            454,
+            455,
+            456,
+            457,
+            458,
+            459,
+            460,
+            461,
+            462,
+            463,
+            464,
+            465,
+            458,
+            458,
+            466,
+            467,
+            468,
+            469,
+            470,
+            471,
+            472,
+            473,
+            474,
+            475,
+            476,
+            477,
+            478,
+            479,
+            480,
+            481,
+            482,
+            483,
+            484,
+            485,
+            486,
+            487,
+            488,
+            489,
+            490,
+            491,
+            492,
+            493,
+            494,
+            495,
+            496,
+            497,
+            498,
+            499,
+            500,
+            501,
+            502,
+            503,
+            504,
+            505,
+            506,
+            507,
+            508,
+            509,
+            510,
+            511,
+            512,
+            513,
+            514,
+            515,
+            516,
+            517,
+            518,
+            519,
+            520,
+            521,
+            522,
+            523,
+            524,
+            525,
+            526,
+            527,
+            528,
+            529,
+            530,
+            531,
+            532,
+            533,
+            534,
+            535,
+            536,
+            537,
+            538,
+            539,
+            540,
+            541,
+            542,
+            543,
+            544,
+            545,
+            546,
+            547,
+            548,
+            549,
+            550,
+            551,
+            552,
+            553,
+            554,
+            555,
+            556,
+            557,
+            557,
+            558,
+            163,
+            559,
+            560,
+            561,
+            562,
+            563,
+            564,
+            565,
+            566,
+            567,
+            568,
+            569,
+            569,
+            570,
+            571,
+            572,
+            573,
+            266,
+            574,
+            575,
+            576,
+            577,
+            578,
+            579,
+            580,
+            581,
+            582,
+            583,
+            584,
+            585,
+            586,
+            587,
+            588,
+            589,
+            590,
+            591,
+            592,
+            593,
+            594,
+            595,
+            596,
+            597,
+            598,
+            599,
+            600,
+            601,
+            602,
+            603,
+            604,
+            605,
+            606,
+            607,
+            608,
+            609,
+            277,
+            609,
+            610,
+            611,
+            612,
+            613,
+            614,
+            163,
+            615,
+            616,
+            609,
+            617,
+            157,
+            618,
+            619,
+            620,
+            621,
+            622,
+            623,
+            624,
+            625,
+            626,
+            627,
+            628,
+            629,
+            630,
+            631,
+            632,
+            633,
+            634,
+            635,
+            636,
+            637,
+            638,
+            639,
+            640,
+            641,
+            642,
+            643,
+            644,
+            266,
+            645,
+            646,
+            647,
+            648,
+            649,
+            650,
+            651,
+            652,
+            653,
+            654,
+            655,
+            656,
+            657,
+            658,
+            659,
+            660,
+            661,
+            662,
+            663,
+            664,
+            665,
+            666,
+            667,
+            668,
+            669,
+            670,
+            671,
+            672,
+            673,
+            674,
+            675,
+            676,
+            677,
+            678,
+            679,
+            680,
+            681,
+            682,
+            683,
+            684,
+            685,
+            618,
+            686,
+            687,
+            688,
+            689,
+            690,
+            691,
+            692,
+            693,
+            694,
+            695,
+            696,
+            697,
+            698,
+            699,
+            700,
+            701,
+            702,
+            703,
+            704,
+            705,
+            706,
+            707,
+            708,
+            707,
+            709,
+            707,
+            710,
+            707,
+            711,
+            712,
+            707,
+            713,
+            707,
+            707,
+            714,
+            715,
+            716,
+            717,
+            718,
+            719,
+            306,
+            720,
+            721,
+            722,
+            723,
+            724,
+            725,
+            726,
+            727,
+            728,
+            163,
+            729,
+            730,
+            730,
+            729,
+            731,
+            732,
+            733,
+            734,
+            735,
+            736,
+            737,
+            738,
+            739,
+            740,
+            741,
+            742,
+            743,
+            744,
+            745,
+            746,
+            747,
+            748,
+            748,
+            749,
+            750,
+            751,
+            752,
+            753,
+            754,
+            755,
+            756,
+            757,
+            758,
+            759,
+            760,
+            748,
+            761,
+            762,
+            163,
+            763,
+            764,
+            765,
+            766,
+            767,
+            768,
+            769,
+            770,
+            771,
+            771,
+            771,
+            772,
+            773,
+            774,
+            775,
+            776,
+            777,
+            778,
+            779,
+            780,
+            781,
+            782,
+            783,
+            784,
+            785,
+            771,
+            786,
+            787,
+            788,
+            789,
+            790,
+            791,
+            792,
+            793,
+            794,
+            795,
+            796,
+            797,
+            798,
+            799,
+            800,
+            801,
+            802,
+            803,
+            804,
+            805,
+            806,
+            807,
+            808,
+            809,
+            810,
+            811,
+            812,
+            813,
+            814,
+            815,
+            816,
+            817,
+            818,
+            819,
+            820,
+            821,
+            163,
+            822,
+            823,
+            824,
+            825,
+            826,
+            827,
+            828,
+            829,
+            830,
+            831,
+            832,
+            833,
+            834,
+            835,
+            836,
+            837,
+            838,
+            157,
+            619,
+            839,
+            840,
+            841,
+            842,
+            843,
+            844,
+            845,
+            846,
+            847,
+            848,
+            849,
+            850,
+            851,
+            852,
+            853,
+            854,
+            855,
+            856,
+            857,
+            858,
+            859,
+            860,
+            861,
+            862,
+            863,
+            864,
+            865,
+            866,
+            867,
+            868,
+            869,
+            870,
+            871,
+            872,
+            873,
+            874,
+            875,
+            876,
+            877,
+            878,
+            879,
+            880,
+            881,
+            882,
+            883,
+            884,
+            885,
+            886,
+            887,
+            888,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "SECURE",
+        "START_MODULE_PARAMS",
+        "DEFAULT_MEMORY_ARENA_SIZE",
+        "LOG_MAX_ARG",
+        "DAMAGE_SOURCE_CODE_ORB_ITEM",
+        "DAMAGE_SOURCE_CODE_NON_ORB_ITEM",
+        "AURA_BOW_ID_LAST",
+        "NUMBER_OF_ITEMS",
+        "MAX_MONEY_CARRIED",
+        "MAX_MONEY_STORED",
+        "WINDOW_LIST_PTR",
+        "SCRIPT_VARS_VALUES_PTR",
+        "MAX_PLAY_TIME",
+        "MONSTER_ID_LIMIT",
+        "MAX_RECRUITABLE_TEAM_MEMBERS",
+        "NATURAL_LOG_VALUE_TABLE",
+        "CART_REMOVED_IMG_DATA",
+        "STRING_DEBUG_EMPTY",
+        "STRING_DEBUG_FORMAT_LINE_FILE",
+        "STRING_DEBUG_NO_PROG_POS",
+        "STRING_DEBUG_SPACED_PRINT",
+        "STRING_DEBUG_FATAL",
+        "STRING_DEBUG_NEWLINE",
+        "STRING_DEBUG_LOG_NULL",
+        "STRING_DEBUG_STRING_NEWLINE",
+        "STRING_EFFECT_EFFECT_BIN",
+        "STRING_MONSTER_MONSTER_BIN",
+        "STRING_BALANCE_M_LEVEL_BIN",
+        "STRING_DUNGEON_DUNGEON_BIN",
+        "STRING_MONSTER_M_ATTACK_BIN",
+        "STRING_MONSTER_M_GROUND_BIN",
+        "STRING_FILE_DIRECTORY_INIT",
+        "AVAILABLE_ITEMS_IN_GROUP_TABLE",
+        "ARM9_UNKNOWN_TABLE__NA_2097FF8",
+        "KECLEON_SHOP_ITEM_TABLE_LISTS_1",
+        "KECLEON_SHOP_ITEM_TABLE_LISTS_2",
+        "EXCLUSIVE_ITEM_STAT_BOOST_DATA",
+        "EXCLUSIVE_ITEM_DEFENSE_BOOSTS",
+        "EXCLUSIVE_ITEM_SPECIAL_ATTACK_BOOSTS",
+        "EXCLUSIVE_ITEM_SPECIAL_DEFENSE_BOOSTS",
+        "EXCLUSIVE_ITEM_EFFECT_DATA",
+        "EXCLUSIVE_ITEM_STAT_BOOST_DATA_INDEXES",
+        "RECYCLE_SHOP_ITEM_LIST",
+        "TYPE_SPECIFIC_EXCLUSIVE_ITEMS",
+        "RECOIL_MOVE_LIST",
+        "PUNCH_MOVE_LIST",
+        "MOVE_POWER_STARS_TABLE",
+        "MOVE_ACCURACY_STARS_TABLE",
+        "PARENT_MENU_DEFAULT_WINDOW_PARAMS",
+        "SIMPLE_MENU_DEFAULT_WINDOW_PARAMS",
+        "ADVANCED_MENU_DEFAULT_WINDOW_PARAMS",
+        "COLLECTION_MENU_DEFAULT_WINDOW_PARAMS",
+        "OPTIONS_MENU_DEFAULT_WINDOW_PARAMS",
+        "DEBUG_MENU_DEFAULT_WINDOW_PARAMS",
+        "SCROLL_BOX_DEFAULT_WINDOW_PARAMS",
+        "DIALOGUE_BOX_DEFAULT_WINDOW_PARAMS",
+        "PORTRAIT_BOX_DEFAULT_WINDOW_PARAMS",
+        "TEXT_BOX_DEFAULT_WINDOW_PARAMS",
+        "AREA_NAME_BOX_DEFAULT_WINDOW_PARAMS",
+        "CONTROLS_CHART_DEFAULT_WINDOW_PARAMS",
+        "ALERT_BOX_DEFAULT_WINDOW_PARAMS",
+        "ADVANCED_TEXT_BOX_DEFAULT_WINDOW_PARAMS",
+        "TEAM_SELECTION_MENU_DEFAULT_WINDOW_PARAMS",
+        "PARTNER_TALK_KIND_TABLE",
+        "SCRIPT_VARS_LOCALS",
+        "SCRIPT_VARS",
+        "PORTRAIT_LAYOUTS",
+        "KAOMADO_FILEPATH",
+        "WONDER_MAIL_BITS_MAP",
+        "WONDER_MAIL_BITS_SWAP",
+        "ARM9_UNKNOWN_TABLE__NA_209E12C",
+        "ARM9_UNKNOWN_TABLE__NA_209E164",
+        "ARM9_UNKNOWN_TABLE__NA_209E280",
+        "WONDER_MAIL_ENCRYPTION_TABLE",
+        "DUNGEON_DATA_LIST",
+        "ADVENTURE_LOG_ENCOUNTERS_MONSTER_IDS",
+        "ARM9_UNKNOWN_DATA__NA_209E6BC",
+        "TACTIC_NAME_STRING_IDS",
+        "STATUS_NAME_STRING_IDS",
+        "DUNGEON_RETURN_STATUS_TABLE",
+        "STATUSES_FULL_DESCRIPTION_STRING_IDS",
+        "ARM9_UNKNOWN_DATA__NA_209EAAC",
+        "MISSION_FLOOR_RANKS_AND_ITEM_LISTS_1",
+        "MISSION_FLOORS_FORBIDDEN",
+        "MISSION_FLOOR_RANKS_AND_ITEM_LISTS_2",
+        "MISSION_FLOOR_RANKS_PTRS",
+        "DUNGEON_RESTRICTIONS",
+        "SPECIAL_BAND_STAT_BOOST",
+        "MUNCH_BELT_STAT_BOOST",
+        "GUMMI_STAT_BOOST",
+        "MIN_IQ_EXCLUSIVE_MOVE_USER",
+        "WONDER_GUMMI_IQ_GAIN",
+        "AURA_BOW_STAT_BOOST",
+        "MIN_IQ_ITEM_MASTER",
+        "DEF_SCARF_STAT_BOOST",
+        "POWER_BAND_STAT_BOOST",
+        "WONDER_GUMMI_STAT_BOOST",
+        "ZINC_BAND_STAT_BOOST",
+        "EGG_HP_BONUS",
+        "EVOLUTION_HP_BONUS",
+        "DAMAGE_FORMULA_FLV_SHIFT",
+        "EVOLUTION_PHYSICAL_STAT_BONUSES",
+        "DAMAGE_FORMULA_CONSTANT_SHIFT",
+        "DAMAGE_FORMULA_FLV_DEFICIT_DIVISOR",
+        "EGG_STAT_BONUSES",
+        "EVOLUTION_SPECIAL_STAT_BONUSES",
+        "DAMAGE_FORMULA_NON_TEAM_MEMBER_MODIFIER",
+        "DAMAGE_FORMULA_LN_PREFACTOR",
+        "DAMAGE_FORMULA_DEF_PREFACTOR",
+        "DAMAGE_FORMULA_AT_PREFACTOR",
+        "DAMAGE_FORMULA_LN_ARG_PREFACTOR",
+        "FORBIDDEN_FORGOT_MOVE_LIST",
+        "TACTICS_UNLOCK_LEVEL_TABLE",
+        "CLIENT_LEVEL_TABLE",
+        "OUTLAW_LEVEL_TABLE",
+        "OUTLAW_MINION_LEVEL_TABLE",
+        "HIDDEN_POWER_BASE_POWER_TABLE",
+        "VERSION_EXCLUSIVE_MONSTERS",
+        "IQ_SKILL_RESTRICTIONS",
+        "SECONDARY_TERRAIN_TYPES",
+        "SENTRY_DUTY_MONSTER_IDS",
+        "IQ_SKILLS",
+        "IQ_GROUP_SKILLS",
+        "MONEY_QUANTITY_TABLE",
+        "ARM9_UNKNOWN_TABLE__NA_20A20B0",
+        "IQ_GUMMI_GAIN_TABLE",
+        "GUMMI_BELLY_RESTORE_TABLE",
+        "BAG_CAPACITY_TABLE_SPECIAL_EPISODES",
+        "BAG_CAPACITY_TABLE",
+        "SPECIAL_EPISODE_MAIN_CHARACTERS",
+        "GUEST_MONSTER_DATA",
+        "RANK_UP_TABLE",
+        "DS_DOWNLOAD_TEAMS",
+        "ARM9_UNKNOWN_PTR__NA_20A2C84",
+        "UNOWN_SPECIES_ADDITIONAL_CHARS",
+        "MONSTER_SPRITE_DATA",
+        "REMOTE_STRINGS",
+        "RANK_STRINGS_1",
+        "MISSION_MENU_STRING_IDS_1",
+        "RANK_STRINGS_2",
+        "MISSION_MENU_STRING_IDS_2",
+        "RANK_STRINGS_3",
+        "MISSION_DUNGEON_UNLOCK_TABLE",
+        "NO_SEND_ITEM_TABLE",
+        "ARM9_UNKNOWN_TABLE__NA_20A3CC8",
+        "ARM9_UNKNOWN_TABLE__NA_20A3CE4",
+        "ARM9_UNKNOWN_FUNCTION_TABLE__NA_20A3CF4",
+        "MISSION_BANNED_STORY_MONSTERS",
+        "ITEM_DELIVERY_TABLE",
+        "MISSION_RANK_POINTS",
+        "MISSION_BANNED_MONSTERS",
+        "MISSION_STRING_IDS",
+        "LEVEL_LIST",
+        "EVENTS",
+        "ARM9_UNKNOWN_TABLE__NA_20A68BC",
+        "DEMO_TEAMS",
+        "ACTOR_LIST",
+        "ENTITIES",
+        "JOB_WINDOW_PARAMS_1",
+        "JOB_MENU_ITEMS_1",
+        "JOB_MENU_ITEMS_2",
+        "JOB_MENU_ITEMS_3",
+        "JOB_MENU_ITEMS_4",
+        "JOB_MENU_ITEMS_5",
+        "JOB_MENU_ITEMS_6",
+        "JOB_MENU_ITEMS_7",
+        "JOB_MENU_ITEMS_8",
+        "JOB_MENU_ITEMS_9",
+        "JOB_MENU_ITEMS_10",
+        "JOB_MENU_ITEMS_11",
+        "JOB_MENU_ITEMS_12",
+        "JOB_MENU_ITEMS_13",
+        "JOB_WINDOW_PARAMS_2",
+        "DUNGEON_SWAP_ID_TABLE",
+        "MAP_MARKER_PLACEMENTS",
+        "LFO_OUTPUT_VOICE_UPDATE_FLAGS",
+        "TRIG_TABLE",
+        "FX_ATAN_IDX_TABLE",
+        "TEX_PLTT_START_ADDR_TABLE",
+        "TEX_START_ADDR_TABLE",
+        "ARM9_UNKNOWN_TABLE__NA_20AE924",
+        "MEMORY_ALLOCATION_ARENA_GETTERS",
+        "PRNG_SEQUENCE_NUM",
+        "LOADED_OVERLAY_GROUP_0",
+        "LOADED_OVERLAY_GROUP_1",
+        "LOADED_OVERLAY_GROUP_2",
+        "DEBUG_IS_INITIALIZED",
+        "PACK_FILES_OPENED",
+        "PACK_FILE_PATHS_TABLE",
+        "GAME_STATE_VALUES",
+        "BAG_ITEMS_PTR_MIRROR",
+        "ITEM_DATA_TABLE_PTRS",
+        "DUNGEON_MOVE_TABLES",
+        "MOVE_DATA_TABLE_PTR",
+        "WAN_TABLE",
+        "RENDER_3D",
+        "RENDER_3D_FUNCTIONS_64",
+        "LANGUAGE_INFO_DATA",
+        "TBL_TALK_GROUP_STRING_ID_START",
+        "KEYBOARD_STRING_IDS",
+        "NOTIFY_NOTE",
+        "DEFAULT_HERO_ID",
+        "DEFAULT_PARTNER_ID",
+        "GAME_MODE",
+        "GLOBAL_PROGRESS_PTR",
+        "ADVENTURE_LOG_PTR",
+        "ITEM_TABLES_PTRS_1",
+        "UNOWN_SPECIES_ADDITIONAL_CHAR_PTR_TABLE",
+        "TEAM_MEMBER_TABLE_PTR",
+        "MISSION_DELIVER_LIST_PTR",
+        "MISSION_DELIVER_COUNT",
+        "MISSION_DUNGEON_LIST_PTR",
+        "MISSION_DUNGEON_COUNT",
+        "MISSION_MONSTER_LIST_PTR",
+        "MISSION_MONSTER_COUNT",
+        "MISSION_LIST_PTR",
+        "REMOTE_STRING_PTR_TABLE",
+        "RANK_STRING_PTR_TABLE",
+        "SMD_EVENTS_FUN_TABLE",
+        "MUSIC_DURATION_LOOKUP_TABLE_1",
+        "MUSIC_DURATION_LOOKUP_TABLE_2",
+        "LFO_WAVEFORM_CALLBACKS",
+        "IS_DISP_ON",
+        "GXI_DMA_ID",
+        "JUICE_BAR_NECTAR_IQ_GAIN",
+        "DEBUG_TEXT_SPEED",
+        "REGULAR_TEXT_SPEED",
+        "HERO_START_LEVEL",
+        "PARTNER_START_LEVEL",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            889,
+            890,
+            891,
+            892,
+            893,
+            894,
+            895,
+            896,
+            897,
+            898,
+            899,
+            900,
+            901,
+            902,
+            903,
+            904,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            905,
+            906,
+            907,
+            907,
+            908,
+            909,
+            910,
+            911,
+            912,
+            913,
+            266,
+            914,
+            915,
+            916,
+            917,
+            918,
+            919,
+            920,
+            921,
+            922,
+            923,
+            924,
+            925,
+            926,
+            927,
+            928,
+            929,
+            930,
+            931,
+            932,
+            933,
+            934,
+            935,
+            936,
+            937,
+            938,
+            939,
+            940,
+            941,
+            942,
+            943,
+            944,
+            945,
+            946,
+            266,
+            947,
+            948,
+            949,
+            950,
+            266,
+            266,
+            951,
+            266,
+            952,
+            953,
+            954,
+            955,
+            956,
+            957,
+            958,
+            959,
+            960,
+            961,
+            962,
+            963,
+            964,
+            266,
+            266,
+            965,
+            966,
+            967,
+            968,
+            969,
+            970,
+            971,
+            972,
+            973,
+            974,
+            975,
+            976,
+            977,
+            978,
+            979,
+            980,
+            981,
+            982,
+            983,
+            984,
+            985,
+            986,
+            987,
+            988,
+            989,
+            990,
+            990,
+            991,
+            992,
+            993,
+            994,
+            1,
+            995,
+            266,
+            996,
+            997,
+            266,
+            266,
+            998,
+            266,
+            998,
+            266,
+            999,
+            1000,
+            1001,
+            1002,
+            1003,
+            1004,
+            1005,
+            1006,
+            1007,
+            1008,
+            266,
+            1009,
+            1010,
+            1011,
+            266,
+            1012,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1013,
+            1014,
+            1,
+            1015,
+            1016,
+            1,
+            1,
+            1017,
+            1018,
+            1019,
+            1020,
+            1021,
+            1022,
+            1,
+            1023,
+            1024,
+            1025,
+            1026,
+            1027,
+            1028,
+            1029,
+            1030,
+            1031,
+            1032,
+            1025,
+            1033,
+            1034,
+            1035,
+            1036,
+            1037,
+            1038,
+            1039,
+            1040,
+            1041,
+            1042,
+            1043,
+            1044,
+            1045,
+            1046,
+            1047,
+            1048,
+            1049,
+            266,
+            1050,
+            1051,
+            1052,
+            1053,
+            1054,
+            1,
+            1,
+            1,
+            1055,
+            1056,
+            1057,
+            1058,
+            1059,
+        ),
+    ),
+    c_types=(
+        "",
+        "struct start_module_params*",
+        "uint32_t",
+        "int",
+        "enum damage_source_non_move",
+        "enum damage_source_non_move",
+        "enum item_id",
+        "uint32_t",
+        "uint32_t",
+        "uint32_t",
+        "struct window_list*",
+        "struct script_var_value_table*",
+        "uint32_t",
+        "uint32_t",
+        "uint32_t",
+        "fx16_12[2048]",
+        "undefined[0]",
+        "char[4]",
+        "char[28]",
+        "char[24]",
+        "char[12]",
+        "char[20]",
+        "char[4]",
+        "char[8]",
+        "char[4]",
+        "char[20]",
+        "char[20]",
+        "char[20]",
+        "char[20]",
+        "char[24]",
+        "char[24]",
+        "char[40]",
+        "",
+        "",
+        "enum item_id[4]",
+        "enum item_id[4]",
+        "struct exclusive_item_stat_boost_entry[15]",
+        "",
+        "",
+        "",
+        "struct exclusive_item_effect_entry[956]",
+        "",
+        "",
+        "struct item_id_16[17][4]",
+        "struct move_id_16[11]",
+        "struct move_id_16[16]",
+        "int[6]",
+        "int[8]",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct partner_talk_kind_table_entry[11]",
+        "struct script_local_var_table",
+        "struct script_var_table",
+        "struct portrait_layout[32]",
+        "char[20]",
+        "uint8_t[32]",
+        "uint8_t[36]",
+        "",
+        "",
+        "",
+        "uint8_t[256]",
+        "struct dungeon_data_list_entry[180]",
+        "struct monster_id_16[38]",
+        "",
+        "int16_t[12]",
+        "int16_t[102]",
+        "struct dungeon_return_status[91]",
+        "struct status_description[103]",
+        "",
+        "",
+        "struct mission_floors_forbidden[100]",
+        "",
+        "undefined*[100]",
+        "struct dungeon_restriction[256]",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int32_t",
+        "int16_t",
+        "int16_t",
+        "int32_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "fx32_8",
+        "int16_t[2]",
+        "fx32_8",
+        "fx32_8",
+        "int16_t[4]",
+        "int16_t[2]",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "struct forbidden_forgot_move_entry[3]",
+        "int16_t[12]",
+        "int16_t[16]",
+        "int16_t[16]",
+        "int16_t[16]",
+        "int[10]",
+        "struct version_exclusive_monster[23]",
+        "int16_t[69]",
+        "struct secondary_terrain_type_8[200]",
+        "struct monster_id_16[102]",
+        "int32_t[69]",
+        "uint8_t[400]",
+        "int[100]",
+        "",
+        "int16_t[18][18]",
+        "int16_t[18][18]",
+        "uint32_t[5]",
+        "uint32_t[8]",
+        "struct monster_id_16[100]",
+        "struct guest_monster[18]",
+        "struct rankup_table_entry[13]",
+        "struct monster_id_16[56]",
+        "",
+        "enum monster_id[28]",
+        "struct monster_sprite_data_entry[600]",
+        "",
+        "",
+        "int16_t[8]",
+        "",
+        "int16_t[8]",
+        "",
+        "struct dungeon_unlock_entry[3]",
+        "struct item_id_16[3]",
+        "",
+        "",
+        "",
+        "struct monster_id_16[21]",
+        "struct item_id_16[23]",
+        "int[16]",
+        "struct monster_id_16[124]",
+        "int16_t[964]",
+        "",
+        "struct script_level[0]",
+        "",
+        "struct monster_id_16[18][2]",
+        "",
+        "struct script_entity[386]",
+        "struct window_params",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct window_params",
+        "struct dungeon_id_8[212]",
+        "struct map_marker[310]",
+        "struct dse_voice_update_flags",
+        "struct trig_values[4096]",
+        "fx16_14[129]",
+        "int16_t[8]",
+        "int16_t[48]",
+        "",
+        "struct mem_arena_getters",
+        "uint16_t",
+        "enum overlay_group_id",
+        "enum overlay_group_id",
+        "enum overlay_group_id",
+        "bool",
+        "struct pack_file_opened*",
+        "char*[6]",
+        "",
+        "struct item*",
+        "void*[3]",
+        "",
+        "struct move_data_table*",
+        "struct wan_table*",
+        "struct render_3d_global",
+        "render_3d_element_64_fn_t[8]",
+        "",
+        "int16_t[6]",
+        "int16_t[30]",
+        "bool",
+        "struct monster_id_16",
+        "struct monster_id_16",
+        "uint8_t",
+        "struct global_progress*",
+        "struct adventure_log*",
+        "void*[26]",
+        "enum monster_id*[28]",
+        "struct team_member_table*",
+        "undefined*",
+        "int",
+        "undefined*",
+        "int",
+        "undefined*",
+        "int",
+        "undefined*",
+        "char*[7]",
+        "char*[16]",
+        "void*[127]",
+        "int16_t[128]",
+        "int32_t[128]",
+        "sound_lfo_waveform_callback[16]",
+        "bool",
+        "uint32_t",
+        "struct data_processing_instruction",
+        "struct data_processing_instruction",
+        "struct data_processing_instruction",
+        "struct data_processing_instruction",
+        "struct data_processing_instruction",
+    ),
+    multi={},
+)
@@ -0,0 +1,246 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the itcm section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "CopyAndInterleave",
+        "Render3dSetTextureParams",
+        "Render3dSetPaletteBase",
+        "Render3dRectangle",
+        "GeomSetPolygonAttributes",
+        "Render3dQuadrilateral",
+        "Render3dTiling",
+        "Render3dTextureInternal",
+        "Render3dTexture",
+        "Render3dTextureNoSetup",
+        "NewRender3dElement",
+        "EnqueueRender3dTexture",
+        "EnqueueRender3dTiling",
+        "NewRender3dRectangle",
+        "NewRender3dQuadrilateral",
+        "NewRender3dTexture",
+        "NewRender3dTiling",
+        "Render3dProcessQueue",
+        "GetKeyN2MSwitch",
+        "GetKeyN2M",
+        "GetKeyN2MBaseForm",
+        "GetKeyM2NSwitch",
+        "GetKeyM2N",
+        "GetKeyM2NBaseForm",
+        "HardwareInterrupt",
+        "ReturnFromInterrupt",
+        "InitDmaTransfer_Standard",
+        "ShouldMonsterRunAwayVariationOutlawCheck",
+        "AiMovement",
+        "CalculateAiTargetPos",
+        "ChooseAiMove",
+        "LightningRodStormDrainCheck",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x0,
+            0x130,
+            0x1CC,
+            0x224,
+            0x480,
+            0x49C,
+            0x728,
+            0xA10,
+            0xC28,
+            0xC60,
+            0xC78,
+            0xCAC,
+            0xCDC,
+            0xD0C,
+            0xD3C,
+            0xD6C,
+            0xD9C,
+            0xDCC,
+            0x1434,
+            0x1468,
+            0x14D4,
+            0x150C,
+            0x1540,
+            0x15AC,
+            0x15E8,
+            0x1650,
+            0x1A68,
+            0x2390,
+            0x23C4,
+            0x32C8,
+            0x3658,
+            0x3E5C,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x1FF8000,
+            0x1FF8130,
+            0x1FF81CC,
+            0x1FF8224,
+            0x1FF8480,
+            0x1FF849C,
+            0x1FF8728,
+            0x1FF8A10,
+            0x1FF8C28,
+            0x1FF8C60,
+            0x1FF8C78,
+            0x1FF8CAC,
+            0x1FF8CDC,
+            0x1FF8D0C,
+            0x1FF8D3C,
+            0x1FF8D6C,
+            0x1FF8D9C,
+            0x1FF8DCC,
+            0x1FF9434,
+            0x1FF9468,
+            0x1FF94D4,
+            0x1FF950C,
+            0x1FF9540,
+            0x1FF95AC,
+            0x1FF95E8,
+            0x1FF9650,
+            0x1FF9A68,
+            0x1FFA390,
+            0x1FFA3C4,
+            0x1FFB2C8,
+            0x1FFB658,
+            0x1FFBE5C,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1060,
+            1061,
+            1062,
+            1063,
+            1064,
+            1065,
+            1066,
+            1067,
+            1068,
+            1069,
+            1070,
+            1071,
+            1072,
+            1073,
+            1074,
+            1075,
+            1076,
+            1077,
+            1078,
+            1079,
+            1079,
+            1080,
+            1081,
+            1081,
+            1082,
+            4,
+            1083,
+            1084,
+            1085,
+            1086,
+            1087,
+            1088,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "MEMORY_ALLOCATION_TABLE",
+        "DEFAULT_MEMORY_ARENA",
+        "DEFAULT_MEMORY_ARENA_BLOCKS",
+        "RENDER_3D_FUNCTIONS",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x120,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x1FF8120,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1089,
+            1090,
+            1091,
+            1092,
+        ),
+    ),
+    c_types=(
+        "struct mem_alloc_table",
+        "struct mem_arena",
+        "struct mem_block[256]",
+        "render_3d_element_fn_t[4]",
+    ),
+    multi={},
+)
@@ -0,0 +1,1324 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay10 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "CreateInventoryMenu",
+        "SetInventoryMenuState0",
+        "SetInventoryMenuState6",
+        "CloseInventoryMenu",
+        "IsInventoryMenuActive",
+        "CheckInventoryMenuField0x1A0",
+        "PopInventoryMenuField0x1A3",
+        "UpdateInventoryMenu",
+        "IsInventoryMenuState3",
+        "SprintfStatic",
+        "GetEffectAnimationField0x19",
+        "AnimationHasMoreFrames",
+        "GetEffectAnimation",
+        "GetMoveAnimation",
+        "GetSpecialMonsterMoveAnimation",
+        "GetTrapAnimation",
+        "GetItemAnimation1",
+        "GetItemAnimation2",
+        "GetMoveAnimationSpeed",
+        "DrawTeamStats",
+        "UpdateTeamStats",
+        "FreeTeamStats",
+        "FreeMapAndTeam",
+        "ProcessTeamStatsLvHp",
+        "ProcessTeamStatsNameGender",
+        "IsBackgroundTileset",
+        "InitTilesetBuffer",
+        "MainGame",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1534,
+            1535,
+            1536,
+            1537,
+            1538,
+            1539,
+            1540,
+            1541,
+            1542,
+            1543,
+            1544,
+            1545,
+            1546,
+            1547,
+            1548,
+            1549,
+            1550,
+            1551,
+            1552,
+            1553,
+            1554,
+            1555,
+            1556,
+            1557,
+            1558,
+            1559,
+            1560,
+            1561,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "INVENTORY_MENU_DEFAULT_WINDOW_PARAMS",
+        "FIRST_DUNGEON_WITH_MONSTER_HOUSE_TRAPS",
+        "BAD_POISON_DAMAGE_COOLDOWN",
+        "PROTEIN_STAT_BOOST",
+        "WATERFALL_CRINGE_CHANCE",
+        "AURORA_BEAM_LOWER_ATTACK_CHANCE",
+        "SPAWN_CAP_NO_MONSTER_HOUSE",
+        "OREN_BERRY_DAMAGE",
+        "IRON_TAIL_LOWER_DEFENSE_CHANCE",
+        "TWINEEDLE_POISON_CHANCE",
+        "EXTRASENSORY_CRINGE_CHANCE",
+        "ROCK_SLIDE_CRINGE_CHANCE",
+        "CRUNCH_LOWER_DEFENSE_CHANCE",
+        "FOREWARN_FORCED_MISS_CHANCE",
+        "UNOWN_STONE_DROP_CHANCE",
+        "SITRUS_BERRY_HP_RESTORATION",
+        "MUDDY_WATER_LOWER_ACCURACY_CHANCE",
+        "SILVER_WIND_BOOST_CHANCE",
+        "POISON_TAIL_POISON_CHANCE",
+        "THUNDERSHOCK_PARALYZE_CHANCE",
+        "BOUNCE_PARALYZE_CHANCE",
+        "HEADBUTT_CRINGE_CHANCE",
+        "FIRE_FANG_CRINGE_CHANCE",
+        "SACRED_FIRE_BURN_CHANCE",
+        "WHIRLPOOL_CONSTRICTION_CHANCE",
+        "EXP_ELITE_EXP_BOOST",
+        "MONSTER_HOUSE_MAX_NON_MONSTER_SPAWNS",
+        "HEAL_ORDER_HP_RESTORATION",
+        "STEEL_WING_BOOST_DEFENSE_CHANCE",
+        "GOLD_THORN_POWER",
+        "BURN_DAMAGE",
+        "POISON_DAMAGE",
+        "SPAWN_COOLDOWN",
+        "MIST_BALL_LOWER_SPECIAL_ATTACK_CHANCE",
+        "CHARGE_BEAM_BOOST_SPECIAL_ATTACK_CHANCE",
+        "ORAN_BERRY_FULL_HP_BOOST",
+        "LIFE_SEED_HP_BOOST",
+        "OCTAZOOKA_LOWER_ACCURACY_CHANCE",
+        "LUSTER_PURGE_LOWER_SPECIAL_DEFENSE_CHANCE",
+        "SUPER_LUCK_CRIT_RATE_BOOST",
+        "CONSTRICT_LOWER_SPEED_CHANCE",
+        "ICE_FANG_FREEZE_CHANCE",
+        "SMOG_POISON_CHANCE",
+        "LICK_PARALYZE_CHANCE",
+        "THUNDER_FANG_PARALYZE_CHANCE",
+        "BITE_CRINGE_CHANCE",
+        "SKY_ATTACK_CRINGE_CHANCE",
+        "ICE_FANG_CRINGE_CHANCE",
+        "BLAZE_KICK_BURN_CHANCE",
+        "FLAMETHROWER_BURN_CHANCE",
+        "DIZZY_PUNCH_CONFUSE_CHANCE",
+        "SECRET_POWER_EFFECT_CHANCE",
+        "METAL_CLAW_BOOST_ATTACK_CHANCE",
+        "TECHNICIAN_MOVE_POWER_THRESHOLD",
+        "SONICBOOM_FIXED_DAMAGE",
+        "RAIN_ABILITY_BONUS_REGEN",
+        "LEECH_SEED_HP_DRAIN",
+        "EXCLUSIVE_ITEM_EXP_BOOST",
+        "AFTERMATH_CHANCE",
+        "SET_DAMAGE_STATUS_DAMAGE",
+        "INTIMIDATOR_ACTIVATION_CHANCE",
+        "TYPE_ADVANTAGE_MASTER_CRIT_RATE",
+        "ORAN_BERRY_HP_RESTORATION",
+        "SITRUS_BERRY_FULL_HP_BOOST",
+        "SNORE_CRINGE_CHANCE",
+        "METEOR_MASH_BOOST_ATTACK_CHANCE",
+        "CRUSH_CLAW_LOWER_DEFENSE_CHANCE",
+        "BURN_DAMAGE_COOLDOWN",
+        "SHADOW_BALL_LOWER_SPECIAL_DEFENSE_CHANCE",
+        "STICK_POWER",
+        "BUBBLE_LOWER_SPEED_CHANCE",
+        "ICE_BODY_BONUS_REGEN",
+        "POWDER_SNOW_FREEZE_CHANCE",
+        "POISON_STING_POISON_CHANCE",
+        "SPAWN_COOLDOWN_THIEF_ALERT",
+        "POISON_FANG_POISON_CHANCE",
+        "WEATHER_MOVE_TURN_COUNT",
+        "THUNDER_PARALYZE_CHANCE",
+        "THUNDERBOLT_PARALYZE_CHANCE",
+        "MONSTER_HOUSE_MAX_MONSTER_SPAWNS",
+        "TWISTER_CRINGE_CHANCE",
+        "SPEED_BOOST_TURNS",
+        "FAKE_OUT_CRINGE_CHANCE",
+        "THUNDER_FANG_CRINGE_CHANCE",
+        "FLARE_BLITZ_BURN_CHANCE",
+        "FLAME_WHEEL_BURN_CHANCE",
+        "PSYBEAM_CONFUSE_CHANCE",
+        "TRI_ATTACK_STATUS_CHANCE",
+        "MIRACLE_CHEST_EXP_BOOST",
+        "WONDER_CHEST_EXP_BOOST",
+        "SPAWN_CAP_WITH_MONSTER_HOUSE",
+        "POISON_DAMAGE_COOLDOWN",
+        "LEECH_SEED_DAMAGE_COOLDOWN",
+        "THROWN_ITEM_HIT_CHANCE",
+        "GEO_PEBBLE_DAMAGE",
+        "GRAVELEROCK_DAMAGE",
+        "RARE_FOSSIL_DAMAGE",
+        "GINSENG_CHANCE_3",
+        "ZINC_STAT_BOOST",
+        "IRON_STAT_BOOST",
+        "CALCIUM_STAT_BOOST",
+        "WISH_BONUS_REGEN",
+        "DRAGON_RAGE_FIXED_DAMAGE",
+        "CORSOLA_TWIG_POWER",
+        "CACNEA_SPIKE_POWER",
+        "GOLD_FANG_POWER",
+        "SILVER_SPIKE_POWER",
+        "IRON_THORN_POWER",
+        "SCOPE_LENS_CRIT_RATE_BOOST",
+        "HEALING_WISH_HP_RESTORATION",
+        "ME_FIRST_MULTIPLIER",
+        "FACADE_DAMAGE_MULTIPLIER",
+        "IMPRISON_TURN_RANGE",
+        "SLEEP_TURN_RANGE",
+        "NIGHTMARE_TURN_RANGE",
+        "BURN_DAMAGE_MULTIPLIER",
+        "REST_TURN_RANGE",
+        "MATCHUP_SUPER_EFFECTIVE_MULTIPLIER_ERRATIC_PLAYER",
+        "MATCHUP_IMMUNE_MULTIPLIER",
+        "SPORT_CONDITION_TURN_RANGE",
+        "SURE_SHOT_TURN_RANGE",
+        "DETECT_BAND_MOVE_ACCURACY_DROP",
+        "TINTED_LENS_MULTIPLIER",
+        "SMOKESCREEN_TURN_RANGE",
+        "PERISH_SONG_TURN_RANGE",
+        "SHADOW_FORCE_DAMAGE_MULTIPLIER",
+        "DIG_DAMAGE_MULTIPLIER",
+        "DIVE_DAMAGE_MULTIPLIER",
+        "BOUNCE_DAMAGE_MULTIPLIER",
+        "POWER_PITCHER_DAMAGE_MULTIPLIER",
+        "QUICK_DODGER_MOVE_ACCURACY_DROP",
+        "MATCHUP_NOT_VERY_EFFECTIVE_MULTIPLIER",
+        "MATCHUP_SUPER_EFFECTIVE_MULTIPLIER",
+        "MATCHUP_NEUTRAL_MULTIPLIER",
+        "MATCHUP_IMMUNE_MULTIPLIER_ERRATIC_PLAYER",
+        "MATCHUP_NOT_VERY_EFFECTIVE_MULTIPLIER_ERRATIC_PLAYER",
+        "MATCHUP_NEUTRAL_MULTIPLIER_ERRATIC_PLAYER",
+        "AIR_BLADE_DAMAGE_MULTIPLIER",
+        "KECLEON_SHOP_BOOST_CHANCE_MULTIPLIER",
+        "HIDDEN_STAIRS_SPAWN_CHANCE_MULTIPLIER",
+        "YAWN_TURN_RANGE",
+        "SPEED_BOOST_TURN_RANGE",
+        "SOLARBEAM_DAMAGE_MULTIPLIER",
+        "SKY_ATTACK_DAMAGE_MULTIPLIER",
+        "RAZOR_WIND_DAMAGE_MULTIPLIER",
+        "FOCUS_PUNCH_DAMAGE_MULTIPLIER",
+        "SKULL_BASH_DAMAGE_MULTIPLIER",
+        "FLY_DAMAGE_MULTIPLIER",
+        "WEATHER_BALL_TYPE_TABLE",
+        "LAST_RESORT_DAMAGE_MULT_TABLE",
+        "SYNTHESIS_HP_RESTORATION_TABLE",
+        "ROOST_HP_RESTORATION_TABLE",
+        "MOONLIGHT_HP_RESTORATION_TABLE",
+        "MORNING_SUN_HP_RESTORATION_TABLE",
+        "REVERSAL_DAMAGE_MULT_TABLE",
+        "WATER_SPOUT_DAMAGE_MULT_TABLE",
+        "WRING_OUT_DAMAGE_MULT_TABLE",
+        "ERUPTION_DAMAGE_MULT_TABLE",
+        "WEATHER_BALL_DAMAGE_MULT_TABLE",
+        "EAT_ITEM_EFFECT_IGNORE_LIST",
+        "CASTFORM_WEATHER_ATTRIBUTE_TABLE",
+        "BAD_POISON_DAMAGE_TABLE",
+        "TYPE_MATCHUP_COMBINATOR_TABLE",
+        "OFFENSIVE_STAT_STAGE_MULTIPLIERS",
+        "DEFENSIVE_STAT_STAGE_MULTIPLIERS",
+        "NATURE_POWER_TABLE",
+        "APPLES_AND_BERRIES_ITEM_IDS",
+        "RECRUITMENT_LEVEL_BOOST_TABLE",
+        "NATURAL_GIFT_ITEM_TABLE",
+        "RANDOM_MUSIC_ID_TABLE",
+        "SHOP_ITEM_CHANCES",
+        "MALE_ACCURACY_STAGE_MULTIPLIERS",
+        "MALE_EVASION_STAGE_MULTIPLIERS",
+        "FEMALE_ACCURACY_STAGE_MULTIPLIERS",
+        "FEMALE_EVASION_STAGE_MULTIPLIERS",
+        "MUSIC_ID_TABLE",
+        "TYPE_MATCHUP_TABLE",
+        "FIXED_ROOM_MONSTER_SPAWN_STATS_TABLE",
+        "METRONOME_TABLE",
+        "TILESET_PROPERTIES",
+        "FIXED_ROOM_PROPERTIES_TABLE",
+        "TRAP_ANIMATION_INFO",
+        "ITEM_ANIMATION_INFO",
+        "MOVE_ANIMATION_INFO",
+        "EFFECT_ANIMATION_INFO",
+        "SPECIAL_MONSTER_MOVE_ANIMATION_INFO",
+        "DEFEAT_ITEM_LOSS_CHANCE",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1562,
+            1563,
+            1564,
+            1565,
+            1566,
+            1567,
+            1568,
+            1569,
+            1570,
+            1571,
+            1572,
+            1573,
+            1574,
+            1575,
+            1576,
+            1577,
+            1578,
+            1579,
+            1580,
+            1581,
+            1582,
+            1583,
+            1584,
+            1585,
+            1586,
+            1587,
+            1588,
+            1589,
+            1590,
+            1591,
+            1592,
+            1593,
+            1594,
+            1595,
+            1596,
+            1597,
+            1598,
+            1599,
+            1600,
+            1601,
+            1602,
+            1603,
+            1604,
+            1605,
+            1606,
+            1607,
+            1608,
+            1609,
+            1610,
+            1611,
+            1612,
+            1613,
+            1614,
+            1615,
+            1616,
+            1617,
+            1618,
+            1619,
+            1620,
+            1621,
+            1622,
+            1623,
+            1624,
+            1625,
+            1626,
+            1627,
+            1628,
+            1629,
+            1630,
+            1631,
+            1632,
+            1633,
+            1634,
+            1635,
+            1636,
+            1637,
+            1638,
+            1639,
+            1640,
+            1641,
+            1642,
+            1643,
+            1644,
+            1645,
+            1646,
+            1647,
+            1648,
+            1649,
+            1650,
+            1651,
+            1652,
+            1653,
+            1654,
+            1655,
+            1656,
+            1657,
+            1658,
+            1659,
+            1660,
+            1661,
+            1662,
+            1663,
+            1664,
+            1665,
+            1666,
+            1667,
+            1668,
+            1669,
+            1670,
+            1671,
+            1672,
+            1673,
+            1674,
+            1675,
+            1676,
+            1677,
+            1678,
+            1679,
+            1680,
+            1681,
+            1682,
+            1683,
+            1684,
+            1685,
+            1686,
+            1687,
+            1688,
+            1689,
+            1690,
+            1691,
+            1692,
+            1693,
+            1694,
+            1695,
+            1696,
+            1697,
+            1698,
+            1699,
+            1700,
+            1701,
+            1702,
+            1703,
+            1704,
+            1705,
+            1706,
+            1707,
+            1708,
+            1709,
+            1710,
+            1711,
+            1712,
+            1713,
+            1714,
+            1715,
+            1716,
+            1717,
+            1718,
+            1719,
+            1720,
+            1721,
+            1722,
+            1723,
+            1724,
+            1725,
+            1726,
+            1727,
+            1728,
+            948,
+            1729,
+            1730,
+            1731,
+            1732,
+            1733,
+            1734,
+            1735,
+            1736,
+            1737,
+            1738,
+            1739,
+            1740,
+            1741,
+            1742,
+            1743,
+            1744,
+            1745,
+            1746,
+            1747,
+        ),
+    ),
+    c_types=(
+        "struct window_params",
+        "struct dungeon_id_8",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "fx32_8",
+        "fx32_8",
+        "int16_t[2]",
+        "int16_t[2]",
+        "int16_t[2]",
+        "fx32_8",
+        "int16_t[2]",
+        "fx32_8",
+        "fx32_8",
+        "int16_t[2]",
+        "int16_t[2]",
+        "int",
+        "fx32_8",
+        "int16_t[2]",
+        "int16_t[2]",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "int",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "int16_t[2]",
+        "int16_t[2]",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "struct type_id_8[8]",
+        "fx32_8[4]",
+        "int16_t[8]",
+        "int16_t[8]",
+        "int16_t[8]",
+        "int16_t[8]",
+        "fx32_8[4]",
+        "fx32_8[4]",
+        "fx32_8[4]",
+        "fx32_8[4]",
+        "fx32_8[8]",
+        "struct item_id_16[36]",
+        "struct castform_weather_attributes[8]",
+        "int16_t[30]",
+        "struct type_matchup_combinator_table",
+        "fx32_8[21]",
+        "fx32_8[21]",
+        "struct wildcard_move_desc[15]",
+        "struct item_id_16[66]",
+        "int16_t[102]",
+        "struct natural_gift_item_info[34]",
+        "struct music_id_16[30][4]",
+        "int16_t[144]",
+        "fx32_8[21]",
+        "fx32_8[21]",
+        "fx32_8[21]",
+        "fx32_8[21]",
+        "struct music_id_16[170]",
+        "struct type_matchup_table",
+        "struct fixed_room_monster_spawn_stats_entry[99]",
+        "struct wildcard_move_desc[168]",
+        "struct tileset_property[199]",
+        "struct fixed_room_properties_entry[256]",
+        "struct trap_animation[26]",
+        "struct item_animation[1400]",
+        "struct move_animation[563]",
+        "struct effect_animation[700]",
+        "struct special_monster_move_animation[7422]",
+        "struct data_processing_instruction",
+    ),
+    multi={},
+)
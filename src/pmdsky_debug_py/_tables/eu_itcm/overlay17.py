@@ -0,0 +1,155 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay17 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+
+DATA = SymbolTable(
+    names=(
+        "ASSEMBLY_WINDOW_PARAMS_1",
+        "ASSEMBLY_WINDOW_PARAMS_2",
+        "ASSEMBLY_WINDOW_PARAMS_3",
+        "ASSEMBLY_WINDOW_PARAMS_4",
+        "ASSEMBLY_WINDOW_PARAMS_5",
+        "ASSEMBLY_MENU_ITEMS_CONFIRM",
+        "ASSEMBLY_MAIN_MENU_ITEMS_1",
+        "ASSEMBLY_MAIN_MENU_ITEMS_2",
+        "ASSEMBLY_SUBMENU_ITEMS_1",
+        "ASSEMBLY_SUBMENU_ITEMS_2",
+        "ASSEMBLY_SUBMENU_ITEMS_3",
+        "ASSEMBLY_SUBMENU_ITEMS_4",
+        "ASSEMBLY_SUBMENU_ITEMS_5",
+        "ASSEMBLY_SUBMENU_ITEMS_6",
+        "ASSEMBLY_SUBMENU_ITEMS_7",
+        "OVERLAY17_FUNCTION_POINTER_TABLE",
+        "OVERLAY17_RESERVED_SPACE",
+        "OVERLAY17_UNKNOWN_POINTER__NA_238BE00",
+        "OVERLAY17_UNKNOWN_POINTER__NA_238BE04",
+        "OVERLAY17_UNKNOWN_POINTER__NA_238BE08",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            266,
+            266,
+            266,
+            266,
+            266,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[5]",
+        "struct simple_menu_id_item[6]",
+        "struct simple_menu_id_item[6]",
+        "struct simple_menu_id_item[7]",
+        "struct simple_menu_id_item[7]",
+        "struct simple_menu_id_item[7]",
+        "struct simple_menu_id_item[8]",
+        "void*[42]",
+        "",
+        "",
+        "",
+        "",
+    ),
+    multi={},
+)
@@ -0,0 +1,185 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay18 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+
+DATA = SymbolTable(
+    names=(
+        "LINK_SHOP_WINDOW_PARAMS_1",
+        "LINK_SHOP_WINDOW_PARAMS_2",
+        "LINK_SHOP_WINDOW_PARAMS_3",
+        "LINK_SHOP_WINDOW_PARAMS_4",
+        "LINK_SHOP_WINDOW_PARAMS_5",
+        "LINK_SHOP_WINDOW_PARAMS_6",
+        "LINK_SHOP_WINDOW_PARAMS_7",
+        "LINK_SHOP_WINDOW_PARAMS_8",
+        "LINK_SHOP_WINDOW_PARAMS_9",
+        "LINK_SHOP_WINDOW_PARAMS_10",
+        "LINK_SHOP_WINDOW_PARAMS_11",
+        "LINK_SHOP_MENU_ITEMS_CONFIRM",
+        "LINK_SHOP_SUBMENU_ITEMS_1",
+        "LINK_SHOP_SUBMENU_ITEMS_2",
+        "LINK_SHOP_MAIN_MENU_ITEMS",
+        "LINK_SHOP_SUBMENU_ITEMS_3",
+        "LINK_SHOP_SUBMENU_ITEMS_4",
+        "LINK_SHOP_SUBMENU_ITEMS_5",
+        "LINK_SHOP_SUBMENU_ITEMS_6",
+        "LINK_SHOP_SUBMENU_ITEMS_7",
+        "OVERLAY18_FUNCTION_POINTER_TABLE",
+        "OVERLAY18_RESERVED_SPACE",
+        "OVERLAY18_UNKNOWN_POINTER__NA_238D620",
+        "OVERLAY18_UNKNOWN_POINTER__NA_238D624",
+        "OVERLAY18_UNKNOWN_POINTER__NA_238D628",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[5]",
+        "struct simple_menu_id_item[6]",
+        "struct simple_menu_id_item[9]",
+        "struct simple_menu_id_item[9]",
+        "struct simple_menu_id_item[9]",
+        "void*[76]",
+        "",
+        "",
+        "",
+        "",
+    ),
+    multi={},
+)
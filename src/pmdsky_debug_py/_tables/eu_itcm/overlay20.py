@@ -0,0 +1,185 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay20 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+
+DATA = SymbolTable(
+    names=(
+        "OVERLAY20_UNKNOWN_POINTER__NA_238CF7C",
+        "RECYCLE_MENU_ITEMS_CONFIRM_1",
+        "RECYCLE_MENU_ITEMS_CONFIRM_2",
+        "RECYCLE_SUBMENU_ITEMS_1",
+        "RECYCLE_SUBMENU_ITEMS_2",
+        "RECYCLE_MAIN_MENU_ITEMS_1",
+        "OVERLAY20_UNKNOWN_TABLE__NA_238D014",
+        "RECYCLE_WINDOW_PARAMS_1",
+        "RECYCLE_WINDOW_PARAMS_2",
+        "RECYCLE_WINDOW_PARAMS_3",
+        "RECYCLE_WINDOW_PARAMS_4",
+        "RECYCLE_WINDOW_PARAMS_5",
+        "RECYCLE_WINDOW_PARAMS_6",
+        "RECYCLE_MAIN_MENU_ITEMS_2",
+        "RECYCLE_WINDOW_PARAMS_7",
+        "RECYCLE_WINDOW_PARAMS_8",
+        "RECYCLE_WINDOW_PARAMS_9",
+        "RECYCLE_WINDOW_PARAMS_10",
+        "RECYCLE_WINDOW_PARAMS_11",
+        "RECYCLE_MAIN_MENU_ITEMS_3",
+        "OVERLAY20_RESERVED_SPACE",
+        "OVERLAY20_UNKNOWN_POINTER__NA_238D120",
+        "OVERLAY20_UNKNOWN_POINTER__NA_238D124",
+        "OVERLAY20_UNKNOWN_POINTER__NA_238D128",
+        "OVERLAY20_UNKNOWN_POINTER__NA_238D12C",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            266,
+            1,
+            1,
+            1,
+            1,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[5]",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[4]",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[3]",
+        "",
+        "",
+        "",
+        "",
+        "",
+    ),
+    multi={},
+)
@@ -0,0 +1,155 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay21 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+
+DATA = SymbolTable(
+    names=(
+        "SWAP_SHOP_WINDOW_PARAMS_1",
+        "SWAP_SHOP_MENU_ITEMS_CONFIRM",
+        "SWAP_SHOP_SUBMENU_ITEMS_1",
+        "SWAP_SHOP_SUBMENU_ITEMS_2",
+        "SWAP_SHOP_MAIN_MENU_ITEMS_1",
+        "SWAP_SHOP_MAIN_MENU_ITEMS_2",
+        "SWAP_SHOP_SUBMENU_ITEMS_3",
+        "OVERLAY21_UNKNOWN_STRING_IDS",
+        "SWAP_SHOP_WINDOW_PARAMS_2",
+        "SWAP_SHOP_WINDOW_PARAMS_3",
+        "SWAP_SHOP_WINDOW_PARAMS_4",
+        "SWAP_SHOP_WINDOW_PARAMS_5",
+        "SWAP_SHOP_WINDOW_PARAMS_6",
+        "SWAP_SHOP_WINDOW_PARAMS_7",
+        "SWAP_SHOP_WINDOW_PARAMS_8",
+        "SWAP_SHOP_WINDOW_PARAMS_9",
+        "OVERLAY21_JP_STRING",
+        "OVERLAY21_RESERVED_SPACE",
+        "OVERLAY21_UNKNOWN_POINTER__NA_238CF40",
+        "OVERLAY21_UNKNOWN_POINTER__NA_238CF44",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            266,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1891,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "struct window_params",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[5]",
+        "struct simple_menu_id_item[6]",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "",
+        "",
+        "",
+    ),
+    multi={},
+)
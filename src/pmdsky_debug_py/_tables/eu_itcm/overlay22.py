@@ -0,0 +1,167 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay22 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+
+DATA = SymbolTable(
+    names=(
+        "SHOP_WINDOW_PARAMS_1",
+        "SHOP_WINDOW_PARAMS_2",
+        "OVERLAY22_UNKNOWN_STRUCT__NA_238E85C",
+        "SHOP_MENU_ITEMS_CONFIRM",
+        "SHOP_MAIN_MENU_ITEMS_1",
+        "SHOP_MAIN_MENU_ITEMS_2",
+        "SHOP_MAIN_MENU_ITEMS_3",
+        "OVERLAY22_UNKNOWN_STRING_IDS",
+        "SHOP_WINDOW_PARAMS_3",
+        "SHOP_WINDOW_PARAMS_4",
+        "SHOP_WINDOW_PARAMS_5",
+        "SHOP_WINDOW_PARAMS_6",
+        "SHOP_WINDOW_PARAMS_7",
+        "SHOP_WINDOW_PARAMS_8",
+        "SHOP_WINDOW_PARAMS_9",
+        "SHOP_WINDOW_PARAMS_10",
+        "OVERLAY22_RESERVED_SPACE",
+        "OVERLAY22_UNKNOWN_POINTER__NA_238EC60",
+        "OVERLAY22_UNKNOWN_POINTER__NA_238EC64",
+        "OVERLAY22_UNKNOWN_POINTER__NA_238EC68",
+        "OVERLAY22_UNKNOWN_POINTER__NA_238EC6C",
+        "OVERLAY22_UNKNOWN_POINTER__NA_238EC70",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            266,
+            266,
+            266,
+            1,
+            1,
+            1,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "struct window_params",
+        "struct window_params",
+        "",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[6]",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+    ),
+    multi={},
+)
@@ -0,0 +1,105 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay34 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=("ExplorersOfSkyMain",),
+    addresses=array("I", (0xFFFFFFFF,)),
+    absolute_addresses=array("I", (0xFFFFFFFF,)),
+    lengths=array("I", (0xFFFFFFFF,)),
+    descriptions=array("I", (2759,)),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "OVERLAY34_UNKNOWN_STRUCT__NA_22DD014",
+        "START_MENU_ITEMS_CONFIRM",
+        "OVERLAY34_UNKNOWN_STRUCT__NA_22DD03C",
+        "DUNGEON_DEBUG_MENU_ITEMS",
+        "OVERLAY34_RESERVED_SPACE",
+        "OVERLAY34_UNKNOWN_POINTER__NA_22DD080",
+        "OVERLAY34_UNKNOWN_POINTER__NA_22DD084",
+        "OVERLAY34_UNKNOWN_POINTER__NA_22DD088",
+        "OVERLAY34_UNKNOWN_POINTER__NA_22DD08C",
+        "OVERLAY34_UNKNOWN_POINTER__NA_22DD090",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            2760,
+            1,
+            2760,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "",
+        "struct simple_menu_id_item[3]",
+        "",
+        "struct simple_menu_id_item[5]",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+    ),
+    multi={},
+)
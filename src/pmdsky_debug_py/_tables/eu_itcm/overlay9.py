@@ -0,0 +1,146 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay9 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "CreateJukeboxTrackMenu",
+        "CloseJukeboxTrackMenu",
+        "IsJukeboxTrackMenuActive",
+        "UpdateJukeboxTrackMenu",
+        "CreatePlaybackControlsMenu",
+        "ClosePlaybackControlsMenu",
+        "IsPlaybackControlsMenuActive",
+        "UpdatePlaybackControlsMenu",
+        "CreateInputLockBox",
+        "CloseInputLockBox",
+        "IsInputLockBoxActive",
+        "UpdateInputLockBox",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            2761,
+            2762,
+            2763,
+            2764,
+            2765,
+            2766,
+            2767,
+            2768,
+            2769,
+            2770,
+            2771,
+            2772,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "JUKEBOX_TRACK_MENU_DEFAULT_WINDOW_PARAMS",
+        "PLAYBACK_CONTROLS_MENU_DEFAULT_WINDOW_PARAMS",
+        "INPUT_LOCK_BOX_DEFAULT_WINDOW_PARAMS",
+        "TOP_MENU_RETURN_MUSIC_ID",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            2773,
+            2774,
+            2775,
+            2776,
+        ),
+    ),
+    c_types=(
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct data_processing_instruction",
+    ),
+    multi={},
+)
@@ -0,0 +1,128 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the arm7 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "_start_arm7",
+        "do_autoload_arm7",
+        "StartAutoloadDoneCallbackArm7",
+        "NitroSpMain",
+        "HardwareInterrupt",
+        "ReturnFromInterrupt",
+        "AudioInterrupt",
+        "ClearImeFlag",
+        "ClearIeFlag",
+        "GetCurrentPlaybackTime",
+        "ClearIrqFlag",
+        "EnableIrqFlag",
+        "SetIrqFlag",
+        "EnableIrqFiqFlags",
+        "SetIrqFiqFlags",
+        "GetProcessorMode",
+        "_s32_div_f",
+        "_u32_div_f",
+        "_u32_div_not_0_f",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x0,
+            0x118,
+            0x188,
+            0x1E8,
+            0x3670,
+            0x36DC,
+            0x3824,
+            0x3AC0,
+            0x3B10,
+            0x5404,
+            0x5ED4,
+            0x5EE8,
+            0x5EFC,
+            0x5F14,
+            0x5F28,
+            0x5F40,
+            0xEDB0,
+            0xEFBC,
+            0xEFC4,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x2380000,
+            0x2380118,
+            0x2380188,
+            0x23801E8,
+            0x2383670,
+            0x23836DC,
+            0x2383824,
+            0x2383AC0,
+            0x2383B10,
+            0x2385404,
+            0x2385ED4,
+            0x2385EE8,
+            0x2385EFC,
+            0x2385F14,
+            0x2385F28,
+            0x2385F40,
+            0x238EDB0,
+            0x238EFBC,
+            0x238EFC4,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            0,
+            1,
+            1,
+            2,
+            3,
+            4,
+            5,
+            6,
+            7,
+            8,
+            9,
+            10,
+            11,
+            12,
+            13,
+            14,
+            15,
+            15,
+            15,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
@@ -0,0 +1,6360 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the arm9 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "Svc_SoftReset",
+        "Svc_WaitByLoop",
+        "Svc_CpuSet",
+        "_start",
+        "InitI_CpuClear32",
+        "MIi_UncompressBackward",
+        "do_autoload",
+        "StartAutoloadDoneCallback",
+        "init_cp15",
+        "OSi_ReferSymbol",
+        "NitroMain",
+        "InitMemAllocTable",
+        "SetMemAllocatorParams",
+        "GetAllocArenaDefault",
+        "GetFreeArenaDefault",
+        "InitMemArena",
+        "MemAllocFlagsToBlockType",
+        "FindAvailableMemBlock",
+        "SplitMemBlock",
+        "MemAlloc",
+        "MemFree",
+        "MemArenaAlloc",
+        "CreateMemArena",
+        "MemLocateSet",
+        "MemLocateUnset",
+        "RoundUpDiv256",
+        "UFixedPoint64CmpLt",
+        "MultiplyByFixedPoint",
+        "UMultiplyByFixedPoint",
+        "IntToFixedPoint64",
+        "FixedPoint64ToInt",
+        "FixedPoint32To64",
+        "NegateFixedPoint64",
+        "FixedPoint64IsZero",
+        "FixedPoint64IsNegative",
+        "FixedPoint64CmpLt",
+        "MultiplyFixedPoint64",
+        "DivideFixedPoint64",
+        "UMultiplyFixedPoint64",
+        "UDivideFixedPoint64",
+        "AddFixedPoint64",
+        "ClampedLn",
+        "GetRngSeed",
+        "SetRngSeed",
+        "Rand16Bit",
+        "RandInt",
+        "RandRange",
+        "Rand32Bit",
+        "RandIntSafe",
+        "RandRangeSafe",
+        "WaitForever",
+        "InterruptMasterDisable",
+        "InterruptMasterEnable",
+        "InitMemAllocTableVeneer",
+        "ZInit8",
+        "PointsToZero",
+        "MemZero",
+        "MemZero16",
+        "MemZero32",
+        "MemsetSimple",
+        "Memset32",
+        "MemcpySimple",
+        "Memcpy16",
+        "Memcpy32",
+        "TaskProcBoot",
+        "EnableAllInterrupts",
+        "GetTime",
+        "DisableAllInterrupts",
+        "SoundResume",
+        "CardPullOutWithStatus",
+        "CardPullOut",
+        "CardBackupError",
+        "HaltProcessDisp",
+        "OverlayIsLoaded",
+        "LoadOverlay",
+        "UnloadOverlay",
+        "GetDsFirmwareUserSettingsVeneer",
+        "Rgb8ToRgb5",
+        "EuclideanNorm",
+        "ClampComponentAbs",
+        "GetHeldButtons",
+        "GetPressedButtons",
+        "GetReleasedStylus",
+        "KeyWaitInit",
+        "DebugPrintSystemClock",
+        "GetSystemClock",
+        "SprintfSystemClock",
+        "DataTransferInit",
+        "DataTransferStop",
+        "FileInitVeneer",
+        "FileOpen",
+        "FileGetSize",
+        "FileRead",
+        "FileSeek",
+        "FileClose",
+        "UnloadFile",
+        "LoadFileFromRom",
+        "TransformPaletteDataWithFlushDivideFade",
+        "UpdateFadeStatus",
+        "HandleFades",
+        "GetFadeStatus",
+        "InitDebug",
+        "InitDebugFlag",
+        "GetDebugFlag",
+        "SetDebugFlag",
+        "InitDebugStripped6",
+        "AppendProgPos",
+        "InitDebugStripped5",
+        "DebugPrintTrace",
+        "DebugDisplay",
+        "DebugPrint0",
+        "InitDebugLogFlag",
+        "GetDebugLogFlag",
+        "SetDebugLogFlag",
+        "DebugPrint",
+        "InitDebugStripped4",
+        "InitDebugStripped3",
+        "InitDebugStripped2",
+        "InitDebugStripped1",
+        "FatalError",
+        "OpenAllPackFiles",
+        "GetFileLengthInPackWithPackNb",
+        "LoadFileInPackWithPackId",
+        "AllocAndLoadFileInPack",
+        "OpenPackFile",
+        "GetFileLengthInPack",
+        "LoadFileInPack",
+        "GetDungeonResultMsg",
+        "GetDamageSource",
+        "GetItemCategoryVeneer",
+        "GetItemMoveId16",
+        "IsThrownItem",
+        "IsNotMoney",
+        "IsEdible",
+        "IsHM",
+        "IsGummi",
+        "IsAuraBow",
+        "IsLosableItem",
+        "IsTreasureBox",
+        "IsStorableItem",
+        "IsShoppableItem",
+        "IsValidTargetItem",
+        "IsItemUsableNow",
+        "IsTicketItem",
+        "InitItem",
+        "InitStandardItem",
+        "InitBulkItem",
+        "BulkItemToItem",
+        "ItemToBulkItem",
+        "GetDisplayedBuyPrice",
+        "GetDisplayedSellPrice",
+        "GetActualBuyPrice",
+        "GetActualSellPrice",
+        "FindItemInInventory",
+        "SprintfStatic",
+        "ItemZInit",
+        "AreItemsEquivalent",
+        "WriteItemsToSave",
+        "ReadItemsFromSave",
+        "IsItemAvailableInDungeonGroup",
+        "GetItemIdFromList",
+        "NormalizeTreasureBox",
+        "SortItemList",
+        "RemoveEmptyItems",
+        "LoadItemPspi2n",
+        "GetExclusiveItemType",
+        "GetExclusiveItemOffsetEnsureValid",
+        "IsItemValid",
+        "GetExclusiveItemParameter",
+        "GetItemCategory",
+        "EnsureValidItem",
+        "GetItemName",
+        "GetItemNameFormatted",
+        "GetItemBuyPrice",
+        "GetItemSellPrice",
+        "GetItemSpriteId",
+        "GetItemPaletteId",
+        "GetItemActionName",
+        "GetThrownItemQuantityLimit",
+        "GetItemMoveId",
+        "TestItemAiFlag",
+        "IsItemInTimeDarkness",
+        "IsItemValidVeneer",
+        "SetActiveInventoryToMain",
+        "AllInventoriesZInit",
+        "SpecialEpisodeInventoryZInit",
+        "RescueInventoryZInit",
+        "SetActiveInventory",
+        "GetMoneyCarried",
+        "SetMoneyCarried",
+        "AddMoneyCarried",
+        "GetCurrentBagCapacity",
+        "IsBagFull",
+        "GetNbItemsInBag",
+        "CountNbItemsOfTypeInBag",
+        "CountItemTypeInBag",
+        "IsItemInBag",
+        "IsItemWithFlagsInBag",
+        "IsItemInTreasureBoxes",
+        "IsHeldItemInBag",
+        "IsItemForSpecialSpawnInBag",
+        "HasStorableItems",
+        "GetItemIndex",
+        "GetEquivItemIndex",
+        "GetEquippedThrowableItem",
+        "GetFirstUnequippedItemOfType",
+        "CopyItemAtIdx",
+        "GetItemAtIdx",
+        "RemoveEmptyItemsInBag",
+        "RemoveItemNoHole",
+        "RemoveItem",
+        "RemoveHeldItemNoHole",
+        "RemoveItemByIdAndStackNoHole",
+        "RemoveEquivItem",
+        "RemoveEquivItemNoHole",
+        "DecrementStackItem",
+        "RemoveItemNoHoleCheck",
+        "RemoveFirstUnequippedItemOfType",
+        "RemoveAllItems",
+        "RemoveAllItemsStartingAt",
+        "SpecialProcAddItemToBag",
+        "AddItemToBagNoHeld",
+        "AddItemToBag",
+        "CleanStickyItemsInBag",
+        "CountStickyItemsInBag",
+        "TransmuteHeldItemInBag",
+        "SetFlagsForHeldItemInBag",
+        "RemoveHolderForItemInBag",
+        "SetHolderForItemInBag",
+        "SortItemsInBag",
+        "RemovePokeItemsInBag",
+        "IsStorageFull",
+        "CountNbOfItemsInStorage",
+        "CountNbOfValidItemsInStorage",
+        "CountNbOfValidItemsInTimeDarknessInStorage",
+        "CountNbItemsOfTypeInStorage",
+        "CountItemTypeInStorage",
+        "GetEquivBulkItemIdxInStorage",
+        "ConvertStorageItemAtIdxToBulkItem",
+        "ConvertStorageItemAtIdxToItem",
+        "RemoveItemAtIdxInStorage",
+        "RemoveBulkItemInStorage",
+        "RemoveItemInStorage",
+        "StorageZInit",
+        "AddBulkItemToStorage",
+        "AddItemToStorage",
+        "SortItemsInStorage",
+        "AllKecleonShopsZInit",
+        "SpecialEpisodeKecleonShopZInit",
+        "SetActiveKecleonShop",
+        "GetMoneyStored",
+        "SetMoneyStored",
+        "AddMoneyStored",
+        "SortKecleonItems1",
+        "GenerateKecleonItems1",
+        "SortKecleonItems2",
+        "GenerateKecleonItems2",
+        "GetExclusiveItemOffset",
+        "ApplyExclusiveItemStatBoosts",
+        "SetExclusiveItemEffect",
+        "ExclusiveItemEffectFlagTest",
+        "IsExclusiveItemIdForMonster",
+        "IsExclusiveItemForMonster",
+        "BagHasExclusiveItemTypeForMonster",
+        "GetExclusiveItemForMonsterFromBag",
+        "GetHpBoostFromExclusiveItems",
+        "ApplyGummiBoostsToGroundMonster",
+        "ApplyGummiBoostsToTeamMember",
+        "ApplySitrusBerryBoostToGroundMonster",
+        "ApplyLifeSeedBoostToGroundMonster",
+        "ApplyGinsengToGroundMonster",
+        "ApplyProteinBoostToGroundMonster",
+        "ApplyCalciumBoostToGroundMonster",
+        "ApplyIronBoostToGroundMonster",
+        "ApplyZincBoostToGroundMonster",
+        "ApplyNectarBoostToGroundMonster",
+        "IsMonsterAffectedByGravelyrockGroundMode",
+        "ApplyGravelyrockBoostToGroundMonster",
+        "ApplyGummiBoostsGroundMode",
+        "LoadSynthBin",
+        "CloseSynthBin",
+        "GetSynthItem",
+        "LoadWazaP",
+        "LoadWazaP2",
+        "UnloadCurrentWazaP",
+        "GetMoveName",
+        "FormatMoveString",
+        "FormatMoveStringMore",
+        "InitMove",
+        "InitMoveCheckId",
+        "GetInfoMoveGround",
+        "GetMoveTargetAndRange",
+        "GetMoveType",
+        "GetMovesetLevelUpPtr",
+        "IsInvalidMoveset",
+        "GetMovesetHmTmPtr",
+        "GetMovesetEggPtr",
+        "GetMoveAiWeight",
+        "GetMoveNbStrikes",
+        "GetMoveBasePower",
+        "GetMoveBasePowerGround",
+        "GetMoveAccuracyOrAiChance",
+        "GetMoveBasePp",
+        "GetMaxPp",
+        "GetMoveMaxGinsengBoost",
+        "GetMoveMaxGinsengBoostGround",
+        "GetMoveCritChance",
+        "IsThawingMove",
+        "IsAffectedByTaunt",
+        "GetMoveRangeId",
+        "GetMoveActualAccuracy",
+        "GetMoveBasePowerFromId",
+        "IsMoveRangeString19",
+        "GetMoveMessageFromId",
+        "GetNbMoves",
+        "GetMovesetIdx",
+        "IsReflectedByMagicCoat",
+        "CanBeSnatched",
+        "FailsWhileMuzzled",
+        "IsSoundMove",
+        "IsRecoilMove",
+        "AllManip1",
+        "AllManip2",
+        "ManipMoves1v1",
+        "ManipMoves1v2",
+        "ManipMoves2v1",
+        "ManipMoves2v2",
+        "DungeonMoveToGroundMove",
+        "GroundToDungeonMoveset",
+        "DungeonToGroundMoveset",
+        "GetInfoGroundMoveset",
+        "FindFirstFreeMovesetIdx",
+        "LearnMoves",
+        "CopyMoveTo",
+        "CopyMoveFrom",
+        "CopyMovesetTo",
+        "CopyMovesetFrom",
+        "Is2TurnsMove",
+        "IsRegularAttackOrProjectile",
+        "IsPunchMove",
+        "IsHealingWishOrLunarDance",
+        "IsCopyingMove",
+        "IsTrappingMove",
+        "IsOneHitKoMove",
+        "IsNot2TurnsMoveOrSketch",
+        "IsRealMove",
+        "IsMovesetValid",
+        "IsRealMoveInTimeDarkness",
+        "IsMovesetValidInTimeDarkness",
+        "GetFirstNotRealMoveInTimeDarkness",
+        "IsSameMove",
+        "GetMoveCategory",
+        "GetPpIncrease",
+        "OpenWaza",
+        "SelectWaza",
+        "PlayBgmByIdVeneer",
+        "PlayBgmByIdVolumeVeneer",
+        "PlaySeVolumeWrapper",
+        "PlayBgmById",
+        "PlayBgmByIdVolume",
+        "StopBgmCommand",
+        "PlaySeByIdVolume",
+        "SendAudioCommand2",
+        "AllocAudioCommand",
+        "SendAudioCommand",
+        "InitSoundSystem",
+        "ManipBgmPlayback",
+        "SoundDriverReset",
+        "LoadDseFile",
+        "PlaySeLoad",
+        "IsSongOver",
+        "PlayBgm",
+        "StopBgm",
+        "ChangeBgm",
+        "PlayBgm2",
+        "StopBgm2",
+        "ChangeBgm2",
+        "PlayME",
+        "StopME",
+        "PlaySe",
+        "PlaySeFullSpec",
+        "SeChangeVolume",
+        "SeChangePan",
+        "StopSe",
+        "CopyAndInterleaveWrapper",
+        "InitAnimationControl",
+        "InitAnimationControlWithSet",
+        "SetSpriteIdForAnimationControl",
+        "SetAnimationForAnimationControlInternal",
+        "SetAnimationForAnimationControl",
+        "GetWanForAnimationControl",
+        "SetAndPlayAnimationForAnimationControl",
+        "SwitchAnimationControlToNextFrame",
+        "LoadAnimationFrameAndIncrementInAnimationControl",
+        "AnimationControlGetAllocForMaxFrame",
+        "DeleteWanTableEntry",
+        "AllocateWanTableEntry",
+        "FindWanTableEntry",
+        "GetLoadedWanTableEntry",
+        "InitWanTable",
+        "LoadWanTableEntry",
+        "LoadWanTableEntryFromPack",
+        "LoadWanTableEntryFromPackUseProvidedMemory",
+        "ReplaceWanFromBinFile",
+        "DeleteWanTableEntryVeneer",
+        "WanHasAnimationGroup",
+        "WanTableSpriteHasAnimationGroup",
+        "SpriteTypeInWanTable",
+        "LoadWteFromRom",
+        "LoadWteFromFileDirectory",
+        "UnloadWte",
+        "LoadWtuFromBin",
+        "ProcessWte",
+        "GeomSetTexImageParam",
+        "GeomSetVertexCoord16",
+        "InitRender3dData",
+        "GeomSwapBuffers",
+        "InitRender3dElement64",
+        "Render3d64Texture0x7",
+        "Render3d64WindowFrame",
+        "EnqueueRender3d64Tiling",
+        "Render3d64Tiling",
+        "Render3d64Quadrilateral",
+        "Render3d64RectangleMulticolor",
+        "Render3d64Rectangle",
+        "Render3d64Nothing",
+        "Render3d64Texture",
+        "Render3dElement64",
+        "HandleSir0Translation",
+        "ConvertPointersSir0",
+        "HandleSir0TranslationVeneer",
+        "DecompressAtNormalVeneer",
+        "DecompressAtNormal",
+        "DecompressAtHalf",
+        "DecompressAtFromMemoryPointerVeneer",
+        "DecompressAtFromMemoryPointer",
+        "WriteByteFromMemoryPointer",
+        "GetAtSize",
+        "GetLanguageType",
+        "GetLanguage",
+        "StrcmpTag",
+        "AtoiTag",
+        "AnalyzeText",
+        "PreprocessString",
+        "PreprocessStringFromId",
+        "StrcmpTagVeneer",
+        "AtoiTagVeneer",
+        "InitPreprocessorArgs",
+        "SetStringAccuracy",
+        "SetStringPower",
+        "GetRankString",
+        "GetCurrentTeamNameString",
+        "GetBagNameString",
+        "GetDungeonResultString",
+        "SetQuestionMarks",
+        "StrcpySimple",
+        "StrncpySimple",
+        "StrncpySimpleNoPad",
+        "StrncmpSimple",
+        "StrncpySimpleNoPadSafe",
+        "StrcpyName",
+        "StrncpyName",
+        "GetStringFromFile",
+        "LoadStringFile",
+        "AllocateTemp1024ByteBufferFromPool",
+        "GetStringFromFileVeneer",
+        "StringFromId",
+        "CopyStringFromId",
+        "CopyNStringFromId",
+        "LoadTblTalk",
+        "GetTalkLine",
+        "IsAOrBPressed",
+        "DrawTextInWindow",
+        "GetCharWidth",
+        "GetColorCodePaletteOffset",
+        "DrawChar",
+        "GetWindow",
+        "NewWindowScreenCheck",
+        "NewWindow",
+        "SetScreenWindowsColor",
+        "SetBothScreensWindowsColor",
+        "UpdateWindow",
+        "ClearWindow",
+        "DeleteWindow",
+        "GetWindowRectangle",
+        "GetWindowContents",
+        "LoadCursors",
+        "InitWindowTrailer",
+        "Arm9LoadUnkFieldNa0x2029EC8",
+        "Arm9StoreUnkFieldNa0x2029ED8",
+        "LoadAlert",
+        "PrintClearMark",
+        "PrintBadgeMark",
+        "PrintMark",
+        "CreateParentMenuFromStringIds",
+        "IsEmptyString",
+        "CreateParentMenu",
+        "CreateParentMenuWrapper",
+        "CreateParentMenuInternal",
+        "ResumeParentMenu",
+        "SetParentMenuState7",
+        "CloseParentMenu",
+        "IsParentMenuActive",
+        "CheckParentMenuField0x1A0",
+        "UpdateParentMenu",
+        "CreateSimpleMenuFromStringIds",
+        "CreateSimpleMenu",
+        "CreateSimpleMenuInternal",
+        "ResumeSimpleMenu",
+        "CloseSimpleMenu",
+        "IsSimpleMenuActive",
+        "CheckSimpleMenuField0x1A0",
+        "GetSimpleMenuField0x1A4",
+        "GetSimpleMenuResult",
+        "UpdateSimpleMenu",
+        "SetSimpleMenuField0x1AC",
+        "CreateAdvancedMenu",
+        "ResumeAdvancedMenu",
+        "CloseAdvancedMenu",
+        "IsAdvancedMenuActive2",
+        "IsAdvancedMenuActive",
+        "GetAdvancedMenuCurrentOption",
+        "GetAdvancedMenuResult",
+        "UpdateAdvancedMenu",
+        "CreateCollectionMenu",
+        "SetCollectionMenuField0x1BC",
+        "SetCollectionMenuWidth",
+        "CloseCollectionMenu",
+        "IsCollectionMenuActive",
+        "SetCollectionMenuField0x1C8",
+        "SetCollectionMenuField0x1A0",
+        "SetCollectionMenuField0x1A4",
+        "SetCollectionMenuVoidFn",
+        "UpdateCollectionMenu",
+        "SetCollectionMenuField0x1B2",
+        "IsCollectionMenuState3",
+        "CreateOptionsMenu",
+        "CloseOptionsMenu",
+        "IsOptionsMenuActive",
+        "CheckOptionsMenuField0x1A4",
+        "GetOptionsMenuStates",
+        "GetOptionsMenuResult",
+        "UpdateOptionsMenu",
+        "CreateDebugMenu",
+        "CloseDebugMenu",
+        "IsDebugMenuActive",
+        "CheckDebugMenuField0x1A4",
+        "UpdateDebugMenu",
+        "CreateScrollBoxSingle",
+        "CreateScrollBoxMulti",
+        "SetScrollBoxState7",
+        "CloseScrollBox",
+        "IsScrollBoxActive",
+        "UpdateScrollBox",
+        "CreateDialogueBox",
+        "CloseDialogueBox",
+        "IsDialogueBoxActive",
+        "ShowStringIdInDialogueBox",
+        "ShowStringInDialogueBox",
+        "ShowDialogueBox",
+        "ReadStringFromDialogueBox",
+        "UpdateDialogueBox",
+        "CreatePortraitBox",
+        "ClosePortraitBox",
+        "PortraitBoxNeedsUpdate",
+        "ShowPortraitInPortraitBox",
+        "HidePortraitBox",
+        "UpdatePortraitBox",
+        "CreateTextBox",
+        "CreateTextBoxWithArg",
+        "CloseTextBox",
+        "CloseTextBox2",
+        "CreateTextBoxInternal",
+        "UpdateTextBox",
+        "IsTextBoxActive",
+        "CreateAreaNameBox",
+        "SetAreaNameBoxState3",
+        "CloseAreaNameBox",
+        "IsAreaNameBoxActive",
+        "UpdateAreaNameBox",
+        "CreateControlsChart",
+        "CloseControlsChart",
+        "IsControlsChartActive",
+        "UpdateControlsChart",
+        "CreateAlertBox",
+        "CloseAlertBox",
+        "IsAlertBoxActive",
+        "UpdateAlertBox",
+        "CreateAdvancedTextBox",
+        "CreateAdvancedTextBoxWithArg",
+        "CreateAdvancedTextBoxInternal",
+        "SetAdvancedTextBoxPartialMenu",
+        "SetAdvancedTextBoxField0x1C4",
+        "SetAdvancedTextBoxField0x1C2",
+        "CloseAdvancedTextBox2",
+        "SetAdvancedTextBoxState5",
+        "CloseAdvancedTextBox",
+        "IsAdvancedTextBoxActive",
+        "GetAdvancedTextBoxFlags2",
+        "SetUnkAdvancedTextBoxFn",
+        "SetUnkAdvancedTextBoxWindowFn",
+        "UpdateAdvancedTextBox",
+        "PlayAdvancedTextBoxInputSound",
+        "CreateTeamSelectionMenu",
+        "CloseTeamSelectionMenu",
+        "IsTeamSelectionMenuActive",
+        "UpdateTeamSelectionMenu",
+        "IsTeamSelectionMenuState3",
+        "CalcMenuHeightDiv8",
+        "InitWindowInput",
+        "IsMenuOptionActive",
+        "PlayWindowInputSound",
+        "InitInventoryMenuInput",
+        "ShowKeyboard",
+        "GetKeyboardStatus",
+        "GetKeyboardStringResult",
+        "TeamSelectionMenuGetItem",
+        "PrintMoveOptionMenu",
+        "PrintIqSkillsMenu",
+        "GetNotifyNote",
+        "SetNotifyNote",
+        "InitSpecialEpisodeHero",
+        "EventFlagBackupVeneer",
+        "InitMainTeamAfterQuiz",
+        "InitSpecialEpisodePartners",
+        "InitSpecialEpisodeExtraPartner",
+        "ReadStringSave",
+        "CheckStringSave",
+        "WriteSaveFile",
+        "ReadSaveFile",
+        "CalcChecksum",
+        "CheckChecksumInvalid",
+        "NoteSaveBase",
+        "WriteQuickSaveInfo",
+        "ReadSaveHeader",
+        "NoteLoadBase",
+        "ReadQuickSaveInfo",
+        "GetGameMode",
+        "InitScriptVariableValues",
+        "InitEventFlagScriptVars",
+        "ZinitScriptVariable",
+        "LoadScriptVariableRaw",
+        "LoadScriptVariableValue",
+        "LoadScriptVariableValueAtIndex",
+        "SaveScriptVariableValue",
+        "SaveScriptVariableValueAtIndex",
+        "LoadScriptVariableValueSum",
+        "LoadScriptVariableValueBytes",
+        "SaveScriptVariableValueBytes",
+        "ScriptVariablesEqual",
+        "EventFlagResume",
+        "EventFlagBackup",
+        "DumpScriptVariableValues",
+        "RestoreScriptVariableValues",
+        "InitScenarioScriptVars",
+        "SetScenarioScriptVar",
+        "GetSpecialEpisodeType",
+        "SetSpecialEpisodeType",
+        "GetExecuteSpecialEpisodeType",
+        "IsSpecialEpisodeOpen",
+        "HasPlayedOldGame",
+        "GetPerformanceFlagWithChecks",
+        "GetScenarioBalance",
+        "ScenarioFlagBackup",
+        "InitWorldMapScriptVars",
+        "InitDungeonListScriptVars",
+        "SetDungeonConquest",
+        "GetDungeonMode",
+        "GlobalProgressAlloc",
+        "ResetGlobalProgress",
+        "SetMonsterFlag1",
+        "GetMonsterFlag1",
+        "SetMonsterFlag2",
+        "HasMonsterBeenAttackedInDungeons",
+        "SetDungeonTipShown",
+        "GetDungeonTipShown",
+        "SetMaxReachedFloor",
+        "GetMaxReachedFloor",
+        "IncrementNbAdventures",
+        "GetNbAdventures",
+        "CanMonsterSpawn",
+        "IncrementExclusiveMonsterCounts",
+        "CopyProgressInfoTo",
+        "CopyProgressInfoFromScratchTo",
+        "CopyProgressInfoFrom",
+        "CopyProgressInfoFromScratchFrom",
+        "InitKaomadoStream",
+        "InitPortraitParams",
+        "InitPortraitParamsWithMonsterId",
+        "SetPortraitEmotion",
+        "SetPortraitLayout",
+        "SetPortraitOffset",
+        "AllowPortraitDefault",
+        "IsValidPortrait",
+        "LoadPortrait",
+        "WonderMailPasswordToMission",
+        "SetEnterDungeon",
+        "InitDungeonInit",
+        "IsNoLossPenaltyDungeon",
+        "CheckMissionRestrictions",
+        "GetNbFloors",
+        "GetNbFloorsPlusOne",
+        "GetDungeonGroup",
+        "GetNbPrecedingFloors",
+        "GetNbFloorsDungeonGroup",
+        "DungeonFloorToGroupFloor",
+        "GetMissionRank",
+        "GetOutlawLevel",
+        "GetOutlawLeaderLevel",
+        "GetOutlawMinionLevel",
+        "AddGuestMonster",
+        "GetGroundNameId",
+        "SetAdventureLogStructLocation",
+        "SetAdventureLogDungeonFloor",
+        "GetAdventureLogDungeonFloor",
+        "ClearAdventureLogStruct",
+        "SetAdventureLogCompleted",
+        "IsAdventureLogNotEmpty",
+        "GetAdventureLogCompleted",
+        "IncrementNbDungeonsCleared",
+        "GetNbDungeonsCleared",
+        "IncrementNbFriendRescues",
+        "GetNbFriendRescues",
+        "IncrementNbEvolutions",
+        "GetNbEvolutions",
+        "IncrementNbSteals",
+        "IncrementNbEggsHatched",
+        "GetNbEggsHatched",
+        "GetNbPokemonJoined",
+        "GetNbMovesLearned",
+        "SetVictoriesOnOneFloor",
+        "GetVictoriesOnOneFloor",
+        "SetPokemonJoined",
+        "SetPokemonBattled",
+        "GetNbPokemonBattled",
+        "IncrementNbBigTreasureWins",
+        "SetNbBigTreasureWins",
+        "GetNbBigTreasureWins",
+        "SetNbRecycled",
+        "GetNbRecycled",
+        "IncrementNbSkyGiftsSent",
+        "SetNbSkyGiftsSent",
+        "GetNbSkyGiftsSent",
+        "ComputeSpecialCounters",
+        "RecruitSpecialPokemonLog",
+        "IncrementNbFainted",
+        "GetNbFainted",
+        "SetItemAcquired",
+        "GetNbItemAcquired",
+        "SetChallengeLetterCleared",
+        "GetSentryDutyGamePoints",
+        "SetSentryDutyGamePoints",
+        "CopyLogTo",
+        "CopyLogFrom",
+        "GetAbilityString",
+        "GetAbilityDescStringId",
+        "GetTypeStringId",
+        "GetConversion2ConvertToType",
+        "CopyBitsTo",
+        "CopyBitsFrom",
+        "StoreDefaultTeamData",
+        "GetMainTeamNameWithCheck",
+        "GetMainTeamName",
+        "SetMainTeamName",
+        "GetRankupPoints",
+        "GetRank",
+        "GetRankStorageSize",
+        "ResetPlayTimer",
+        "PlayTimerTick",
+        "GetPlayTimeSeconds",
+        "SubFixedPoint",
+        "BinToDecFixedPoint",
+        "CeilFixedPoint",
+        "DungeonGoesUp",
+        "GetTurnLimit",
+        "DoesNotSaveWhenEntering",
+        "TreasureBoxDropsEnabled",
+        "IsLevelResetDungeon",
+        "GetMaxItemsAllowed",
+        "IsMoneyAllowed",
+        "GetMaxRescueAttempts",
+        "IsRecruitingAllowed",
+        "GetLeaderChangeFlag",
+        "GetRandomMovementChance",
+        "CanEnemyEvolve",
+        "GetMaxMembersAllowed",
+        "IsIqEnabled",
+        "IsTrapInvisibleWhenAttacking",
+        "JoinedAtRangeCheck",
+        "IsDojoDungeon",
+        "IsFutureDungeon",
+        "IsSpecialEpisodeDungeon",
+        "RetrieveFromItemList1",
+        "IsForbiddenFloor",
+        "Copy16BitsFrom",
+        "RetrieveFromItemList2",
+        "IsInvalidForMission",
+        "IsExpEnabledInDungeon",
+        "IsSkyExclusiveDungeon",
+        "JoinedAtRangeCheck2",
+        "GetBagCapacity",
+        "GetBagCapacitySpecialEpisode",
+        "GetRankUpEntry",
+        "GetBgRegionArea",
+        "LoadMonsterMd",
+        "GetNameRaw",
+        "GetName",
+        "GetNameWithGender",
+        "GetSpeciesString",
+        "GetNameString",
+        "GetSpriteIndex",
+        "GetDexNumber",
+        "GetCategoryString",
+        "GetMonsterGender",
+        "GetBodySize",
+        "GetSpriteSize",
+        "GetSpriteFileSize",
+        "GetShadowSize",
+        "GetSpeedStatus",
+        "GetMobilityType",
+        "GetRegenSpeed",
+        "GetCanMoveFlag",
+        "GetChanceAsleep",
+        "GetWeightMultiplier",
+        "GetSize",
+        "GetBaseHp",
+        "CanThrowItems",
+        "CanEvolve",
+        "GetMonsterPreEvolution",
+        "GetBaseOffensiveStat",
+        "GetBaseDefensiveStat",
+        "GetType",
+        "GetAbility",
+        "GetRecruitRate2",
+        "GetRecruitRate1",
+        "GetExp",
+        "GetEvoParameters",
+        "GetTreasureBoxChances",
+        "GetIqGroup",
+        "GetSpawnThreshold",
+        "NeedsItemToSpawn",
+        "GetExclusiveItem",
+        "GetFamilyIndex",
+        "LoadM2nAndN2m",
+        "GuestMonsterToGroundMonster",
+        "StrcmpMonsterName",
+        "GetLvlUpEntry",
+        "GetEncodedHalfword",
+        "GetEvoFamily",
+        "GetEvolutions",
+        "ShuffleHiddenPower",
+        "GetBaseForm",
+        "GetBaseFormBurmyWormadamShellosGastrodonCherrim",
+        "GetBaseFormCastformCherrimDeoxys",
+        "GetAllBaseForms",
+        "GetDexNumberVeneer",
+        "GetMonsterIdFromSpawnEntry",
+        "SetMonsterId",
+        "SetMonsterLevelAndId",
+        "GetMonsterLevelFromSpawnEntry",
+        "GetMonsterGenderVeneer",
+        "IsMonsterValid",
+        "IsUnown",
+        "IsShaymin",
+        "IsCastform",
+        "IsCherrim",
+        "IsDeoxys",
+        "GetSecondFormIfValid",
+        "FemaleToMaleForm",
+        "GetBaseFormCastformDeoxysCherrim",
+        "BaseFormsEqual",
+        "DexNumbersEqual",
+        "GendersEqual",
+        "GendersEqualNotGenderless",
+        "GendersNotEqualNotGenderless",
+        "IsMonsterOnTeam",
+        "GetNbRecruited",
+        "IsValidTeamMember",
+        "IsMainCharacter",
+        "GetTeamMember",
+        "GetHeroMemberIdx",
+        "GetPartnerMemberIdx",
+        "GetMainCharacter1MemberIdx",
+        "GetMainCharacter2MemberIdx",
+        "GetMainCharacter3MemberIdx",
+        "GetHero",
+        "GetPartner",
+        "GetMainCharacter1",
+        "GetMainCharacter2",
+        "GetMainCharacter3",
+        "GetFirstMatchingMemberIdx",
+        "GetFirstEmptyMemberIdx",
+        "IsMonsterNotNicknamed",
+        "RemoveActiveMembersFromAllTeams",
+        "RemoveActiveMembersFromSpecialEpisodeTeam",
+        "RemoveActiveMembersFromRescueTeam",
+        "CheckTeamMemberIdx",
+        "IsMonsterIdInNormalRange",
+        "SetActiveTeam",
+        "GetActiveTeamMember",
+        "GetActiveRosterIndex",
+        "TryAddMonsterToActiveTeam",
+        "RemoveActiveMembersFromMainTeam",
+        "SetTeamSetupHeroAndPartnerOnly",
+        "SetTeamSetupHeroOnly",
+        "GetPartyMembers",
+        "RefillTeam",
+        "ClearItem",
+        "ChangeGiratinaFormIfSkyDungeon",
+        "GetIqSkillStringId",
+        "DoesTacticFollowLeader",
+        "GetUnlockedTactics",
+        "GetUnlockedTacticFlags",
+        "CanLearnIqSkill",
+        "GetLearnableIqSkills",
+        "DisableIqSkill",
+        "EnableIqSkill",
+        "GetSpeciesIqSkill",
+        "DisableAllIqSkills",
+        "EnableAllLearnableIqSkills",
+        "IqSkillFlagTest",
+        "GetNextIqSkill",
+        "GetExplorerMazeTeamName",
+        "GetExplorerMazeMonster",
+        "WriteMonsterInfoToSave",
+        "ReadMonsterInfoFromSave",
+        "WriteMonsterToSave",
+        "ReadMonsterFromSave",
+        "GetEvolutionPossibilities",
+        "GetMonsterEvoStatus",
+        "CopyTacticString",
+        "GetStatBoostsForMonsterSummary",
+        "CreateMonsterSummaryFromTeamMember",
+        "GetSosMailCount",
+        "IsMissionSuspendedAndValid",
+        "AreMissionsEquivalent",
+        "IsMissionValid",
+        "GenerateMission",
+        "IsMissionTypeSpecialEpisode",
+        "GenerateDailyMissions",
+        "AlreadyHaveMission",
+        "CountJobListMissions",
+        "DungeonRequestsDone",
+        "DungeonRequestsDoneWrapper",
+        "AnyDungeonRequestsDone",
+        "AddMissionToJobList",
+        "GetAcceptedMission",
+        "GetMissionByTypeAndDungeon",
+        "CheckAcceptedMissionByTypeAndDungeon",
+        "GetAllPossibleMonsters",
+        "GenerateAllPossibleMonstersList",
+        "DeleteAllPossibleMonstersList",
+        "GenerateAllPossibleDungeonsList",
+        "DeleteAllPossibleDungeonsList",
+        "GenerateAllPossibleDeliverList",
+        "DeleteAllPossibleDeliverList",
+        "ClearMissionData",
+        "IsMonsterMissionAllowed",
+        "CanMonsterBeUsedForMissionWrapper",
+        "CanMonsterBeUsedForMission",
+        "IsMonsterMissionAllowedStory",
+        "CanDungeonBeUsedForMission",
+        "CanSendItem",
+        "IsAvailableItem",
+        "GetAvailableItemDeliveryList",
+        "GetActorMatchingStorageId",
+        "SetActorTalkMainAndActorTalkSub",
+        "SetActorTalkMain",
+        "SetActorTalkSub",
+        "RandomizeDemoActors",
+        "ItemAtTableIdx",
+        "MainLoop",
+        "CreateJobSummary",
+        "DungeonSwapIdToIdx",
+        "DungeonSwapIdxToId",
+        "GetDungeonModeSpecial",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x154,
+            0x73A,
+            0x226,
+            0x800,
+            0x954,
+            0x970,
+            0xA1C,
+            0xAAC,
+            0xAB0,
+            0xB9C,
+            0xC6C,
+            0xDE0,
+            0xE70,
+            0xEC0,
+            0xEC4,
+            0xEC8,
+            0xF44,
+            0xF88,
+            0x1070,
+            0x1170,
+            0x1188,
+            0x119C,
+            0x1280,
+            0x1390,
+            0x1638,
+            0x1894,
+            0x1A30,
+            0x1A54,
+            0x1B0C,
+            0x1C80,
+            0x1CB0,
+            0x1CD4,
+            0x1CF8,
+            0x1D28,
+            0x1D50,
+            0x1D68,
+            0x1DF4,
+            0x1EC8,
+            0x1FA0,
+            0x2084,
+            0x21C8,
+            0x21F4,
+            0x222C,
+            0x223C,
+            0x224C,
+            0x2274,
+            0x228C,
+            0x22AC,
+            0x22F8,
+            0x2318,
+            0x2438,
+            0x30CC,
+            0x30E4,
+            0x321C,
+            0x3228,
+            0x3238,
+            0x3250,
+            0x326C,
+            0x3288,
+            0x32A4,
+            0x32BC,
+            0x32D4,
+            0x32F0,
+            0x330C,
+            0x3328,
+            0x3608,
+            0x37B4,
+            0x3824,
+            0x3CC4,
+            0x3D2C,
+            0x3D70,
+            0x3D94,
+            0x3DB8,
+            0x3ED0,
+            0x40AC,
+            0x4868,
+            0x4F74,
+            0x4FCC,
+            0xFFFFFFFF,
+            0x5110,
+            0x61EC,
+            0x625C,
+            0x6C1C,
+            0x6DA4,
+            0x6EF8,
+            0x6F68,
+            0x6FB8,
+            0x8168,
+            0x8194,
+            0x8204,
+            0x8210,
+            0x8244,
+            0x8254,
+            0x82A8,
+            0x82C4,
+            0x8BD4,
+            0x8C3C,
+            0xAE38,
+            0xB990,
+            0xBA08,
+            0xBD2C,
+            0xC0D4,
+            0xC10C,
+            0xC110,
+            0xC118,
+            0xC11C,
+            0xC120,
+            0xC168,
+            0xC16C,
+            0xC1C8,
+            0xC1FC,
+            0xC230,
+            0xC234,
+            0xC23C,
+            0xC240,
+            0xC24C,
+            0xC250,
+            0xC254,
+            0xC258,
+            0xC25C,
+            0xC2DC,
+            0xC33C,
+            0xC35C,
+            0xC388,
+            0xC3E0,
+            0xC474,
+            0xC484,
+            0xC4FC,
+            0xCA54,
+            0xCAF0,
+            0xCAFC,
+            0xCB10,
+            0xCB2C,
+            0xCB4C,
+            0xCB70,
+            0xCBF4,
+            0xCC14,
+            0xCC38,
+            0xCC84,
+            0xCCA8,
+            0xCCE0,
+            0xCDAC,
+            0xCDF8,
+            0xCE74,
+            0xCE9C,
+            0xCF58,
+            0xCF78,
+            0xCFF0,
+            0xD0A0,
+            0xD0D0,
+            0xD118,
+            0xD160,
+            0xD1A8,
+            0xD278,
+            0xFFFFFFFF,
+            0xD84C,
+            0xD864,
+            0xD98C,
+            0xDC74,
+            0xE03C,
+            0xE084,
+            0xE228,
+            0xE3D0,
+            0xE640,
+            0xE708,
+            0xE790,
+            0xE7AC,
+            0xE7F0,
+            0xE818,
+            0xE838,
+            0xE858,
+            0xE894,
+            0xE8B4,
+            0xE9E8,
+            0xEA08,
+            0xEA28,
+            0xEA48,
+            0xEA68,
+            0xEA88,
+            0xEAB0,
+            0xEAD0,
+            0xEB60,
+            0xEB88,
+            0xEBFC,
+            0xEC0C,
+            0xEC78,
+            0xECC0,
+            0xED08,
+            0xED2C,
+            0xED4C,
+            0xED88,
+            0xEDB4,
+            0xEDF0,
+            0xEE2C,
+            0xEE7C,
+            0xEEB8,
+            0xEF10,
+            0xEF50,
+            0xFFFFFFFF,
+            0xEF9C,
+            0xF020,
+            0xF0B4,
+            0xF11C,
+            0xF15C,
+            0xF1D8,
+            0xF23C,
+            0xF2B0,
+            0xF318,
+            0xF340,
+            0xF360,
+            0xF3D4,
+            0xF424,
+            0xF4A4,
+            0xF528,
+            0xF5D0,
+            0xF664,
+            0xF6E8,
+            0xF768,
+            0xF778,
+            0xF7AC,
+            0xF81C,
+            0xF844,
+            0xF854,
+            0xF8E0,
+            0xF910,
+            0xFA38,
+            0xFABC,
+            0xFB24,
+            0xFBB0,
+            0xFBF4,
+            0xFC7C,
+            0xFD24,
+            0xFD48,
+            0xFD80,
+            0xFDD0,
+            0xFE78,
+            0xFEB4,
+            0xFF20,
+            0xFF7C,
+            0xFFC4,
+            0x10170,
+            0x101B4,
+            0x10230,
+            0x102AC,
+            0x102EC,
+            0x1037C,
+            0x103F4,
+            0x10564,
+            0x10624,
+            0x10694,
+            0x106DC,
+            0x106F4,
+            0x10728,
+            0x10924,
+            0x10A1C,
+            0x10C30,
+            0x10D28,
+            0x10E10,
+            0x10E34,
+            0x10F50,
+            0x10F74,
+            0x10F94,
+            0x11064,
+            0x110A8,
+            0x1113C,
+            0x11364,
+            0x114F8,
+            0x11524,
+            0x11550,
+            0x1158C,
+            0x115C8,
+            0x116DC,
+            0x11718,
+            0x11754,
+            0x11790,
+            0x117CC,
+            0x11800,
+            0x11820,
+            0x1186C,
+            0x12AB0,
+            0x12B04,
+            0x13220,
+            0x13394,
+            0x133BC,
+            0x133E4,
+            0x13424,
+            0x13448,
+            0x13750,
+            0x13788,
+            0x137B8,
+            0x137F8,
+            0x13810,
+            0x13834,
+            0x13854,
+            0x1389C,
+            0x138C4,
+            0x13910,
+            0x1395C,
+            0x1397C,
+            0x1399C,
+            0x139BC,
+            0x139DC,
+            0x13A00,
+            0x13A20,
+            0x13AA0,
+            0x13AC0,
+            0x13AE0,
+            0x13B00,
+            0x13B20,
+            0x13B40,
+            0x13B60,
+            0x13BB8,
+            0x13BD4,
+            0x13C00,
+            0x13C34,
+            0xFFFFFFFF,
+            0x13CD8,
+            0x13CF4,
+            0x13D10,
+            0x13D2C,
+            0x13DE4,
+            0x141B0,
+            0x141D8,
+            0x1426C,
+            0x1430C,
+            0x14474,
+            0x14514,
+            0x1467C,
+            0x146B4,
+            0x14748,
+            0x14788,
+            0x14830,
+            0x1487C,
+            0x14A1C,
+            0x14A54,
+            0x14A8C,
+            0x14ABC,
+            0x14C34,
+            0x14CBC,
+            0x14CE8,
+            0x14D28,
+            0x14D54,
+            0x14D8C,
+            0x14DD0,
+            0x14E08,
+            0x14E34,
+            0x14EC8,
+            0x14F34,
+            0x14FD4,
+            0x14FF4,
+            0x1511C,
+            0x15198,
+            0x151B4,
+            0x15264,
+            0x152CC,
+            0x17BB0,
+            0x17BBC,
+            0x17D24,
+            0x17E4C,
+            0x17EC8,
+            0x17F40,
+            0x18310,
+            0x18B3C,
+            0x18BC4,
+            0x18C00,
+            0x18C80,
+            0x18EFC,
+            0x19120,
+            0x193E4,
+            0x195CC,
+            0x198A8,
+            0x19910,
+            0x19B80,
+            0x19CA8,
+            0x19DDC,
+            0x1A040,
+            0x1A140,
+            0x1A220,
+            0x1A464,
+            0x1A554,
+            0x1A6C4,
+            0x1A880,
+            0x1A958,
+            0x1AA3C,
+            0x1C048,
+            0x1C0A8,
+            0xFFFFFFFF,
+            0x1C140,
+            0x1C1D4,
+            0x1C324,
+            0x1C440,
+            0x1C470,
+            0x1C4B0,
+            0x1C5B8,
+            0x1D1C8,
+            0x1D234,
+            0x1D29C,
+            0x1D32C,
+            0x1D38C,
+            0x1D414,
+            0x1D434,
+            0x1D4DC,
+            0x1D5E8,
+            0x1D6DC,
+            0x1D784,
+            0x1DA9C,
+            0x1DAD8,
+            0x1DCC8,
+            0x1DEA4,
+            0x1DF1C,
+            0x1DF70,
+            0x1E00C,
+            0x1E108,
+            0x1E4EC,
+            0x1E52C,
+            0x1E55C,
+            0x1E774,
+            0x1E788,
+            0x1E89C,
+            0x1EA44,
+            0x1ECF4,
+            0x1EDE0,
+            0x1EEA8,
+            0x1EF48,
+            0x1F0B4,
+            0x1F160,
+            0x1F164,
+            0x1F22C,
+            0x1F50C,
+            0x1F58C,
+            0x1F5E4,
+            0x1F618,
+            0x1F624,
+            0x1FA68,
+            0x1FFA4,
+            0x1FFB0,
+            0x204C8,
+            0x20544,
+            0x205F8,
+            0x20608,
+            0x20918,
+            0x2095C,
+            0x20E18,
+            0x22440,
+            0x23608,
+            0x23648,
+            0x23654,
+            0x236E0,
+            0x243B0,
+            0x24478,
+            0x24B44,
+            0x24CBC,
+            0x24E4C,
+            0x25028,
+            0x25134,
+            0x25150,
+            0x2516C,
+            0x251C0,
+            0x251FC,
+            0x25268,
+            0x252B8,
+            0x2536C,
+            0x25768,
+            0x257F8,
+            0x25868,
+            0x25898,
+            0x258A4,
+            0x258C4,
+            0x258EC,
+            0x2591C,
+            0x2596C,
+            0x25FC0,
+            0x262EC,
+            0x26624,
+            0x2669C,
+            0x26844,
+            0x27940,
+            0x279A8,
+            0x27A20,
+            0x27DC8,
+            0x27DE0,
+            0x27E50,
+            0x27EB8,
+            0x284F4,
+            0x285E4,
+            0x2869C,
+            0x29864,
+            0x299C8,
+            0x2A220,
+            0x2A230,
+            0x2A240,
+            0x2A73C,
+            0x2A78C,
+            0x2A7B4,
+            0x2A924,
+            0x2A9C4,
+            0x2A9E8,
+            0x2AA88,
+            0x2AAB4,
+            0x2ACAC,
+            0x2AE00,
+            0x2AE14,
+            0x2AE98,
+            0x2AEB8,
+            0x2AF54,
+            0x2B444,
+            0x2B504,
+            0x2B5DC,
+            0x2B7E8,
+            0x2B81C,
+            0x2B848,
+            0x2B868,
+            0x2B8B0,
+            0x2B8D4,
+            0x2B920,
+            0x2BD64,
+            0x2BD78,
+            0x2BF48,
+            0x2BF9C,
+            0x2C014,
+            0x2C034,
+            0x2C054,
+            0x2C068,
+            0x2C0BC,
+            0x2C700,
+            0x2C938,
+            0x2C94C,
+            0x2CA64,
+            0x2CA80,
+            0x2CAEC,
+            0x2CB00,
+            0x2CB14,
+            0x2CB28,
+            0x2CB60,
+            0x2D430,
+            0x2D46C,
+            0x2D548,
+            0x2D888,
+            0x2D8B4,
+            0x2D8D4,
+            0x2D908,
+            0x2D93C,
+            0x2D970,
+            0x2DFA8,
+            0x2E24C,
+            0x2E278,
+            0x2E298,
+            0x2E2EC,
+            0x2E720,
+            0x2E86C,
+            0x2EA04,
+            0x2EA1C,
+            0x2EA38,
+            0x2EA5C,
+            0x2F3F4,
+            0x2F48C,
+            0x2F4C4,
+            0x2F4F8,
+            0x2F580,
+            0x2F6E8,
+            0x2F790,
+            0x2F7CC,
+            0x2F8F0,
+            0x2F994,
+            0x2F9B0,
+            0x2F9D4,
+            0x2FA20,
+            0x2FA50,
+            0x2FC08,
+            0x2FC20,
+            0x2FC40,
+            0x2FC5C,
+            0x2FD20,
+            0x2FDA0,
+            0x2FEE0,
+            0x2FF00,
+            0x30080,
+            0x30094,
+            0x300B0,
+            0x300D0,
+            0x30170,
+            0x30218,
+            0x30234,
+            0x30254,
+            0x302F4,
+            0x30388,
+            0x30538,
+            0x305B8,
+            0x308F8,
+            0x30928,
+            0x30960,
+            0x30AC0,
+            0x30AE8,
+            0x30B80,
+            0x30B94,
+            0x30BD0,
+            0x30BE4,
+            0x30C08,
+            0x30D60,
+            0x30DE0,
+            0x30DF4,
+            0x30E08,
+            0x31248,
+            0x31264,
+            0x314B8,
+            0x314D4,
+            0x3155C,
+            0x31BD0,
+            0xFFFFFFFF,
+            0x31E18,
+            0x32794,
+            0x32C80,
+            0x32D58,
+            0x36B08,
+            0x36FF0,
+            0x3789C,
+            0x3AB68,
+            0x4064C,
+            0x41DA8,
+            0x4880C,
+            0x4881C,
+            0x48854,
+            0x48AC4,
+            0x48B30,
+            0x48D78,
+            0x48DF0,
+            0x48F20,
+            0x48F3C,
+            0x491E0,
+            0x4923C,
+            0x49290,
+            0x492B8,
+            0x492F0,
+            0x495B4,
+            0x495D8,
+            0x496DC,
+            0x49994,
+            0x4B328,
+            0x4B3B4,
+            0x4B668,
+            0x4B794,
+            0x4B7FC,
+            0x4B84C,
+            0x4B9D8,
+            0x4BB80,
+            0x4BCE8,
+            0x4BE60,
+            0x4BEC4,
+            0x4BF2C,
+            0x4BF78,
+            0x4C320,
+            0x4C544,
+            0x4C768,
+            0x4C790,
+            0x4C7E8,
+            0x4C978,
+            0x4CC4C,
+            0x4CC60,
+            0x4CC98,
+            0x4CCAC,
+            0x4CDD0,
+            0x4CDF4,
+            0x4CEF4,
+            0x4D018,
+            0x4D0E8,
+            0x4D1F0,
+            0x4D298,
+            0x4D2FC,
+            0x4D468,
+            0x4D490,
+            0x4D4AC,
+            0x4D4E8,
+            0x4D524,
+            0x4D568,
+            0x4D5B0,
+            0x4D5F0,
+            0x4D63C,
+            0x4D658,
+            0x4D678,
+            0x4D6AC,
+            0x4D6C0,
+            0x4D6C8,
+            0x4D720,
+            0x4D8A8,
+            0x4D8E0,
+            0x4DAA8,
+            0x4DAE0,
+            0x4DAFC,
+            0x4DB34,
+            0x4DB54,
+            0x4DB64,
+            0x4DBA8,
+            0x4DBF4,
+            0x4DBFC,
+            0x4DC1C,
+            0x4E0E0,
+            0x4ECA4,
+            0x4EDB4,
+            0x4F338,
+            0x4F71C,
+            0x4F8D4,
+            0x4F90C,
+            0x4F920,
+            0x4F938,
+            0x4F950,
+            0x4F9A4,
+            0x4FB68,
+            0x4FBE0,
+            0x4FBFC,
+            0x4FC18,
+            0x4FC34,
+            0x4FCAC,
+            0x4FD70,
+            0x4FD88,
+            0x4FDA8,
+            0x4FDBC,
+            0x4FEE8,
+            0x4FF10,
+            0x4FF48,
+            0x4FF74,
+            0x4FFB8,
+            0x4FFCC,
+            0x50014,
+            0x50028,
+            0x50070,
+            0x50084,
+            0x50088,
+            0x500C4,
+            0x500D8,
+            0x500EC,
+            0x50100,
+            0x50134,
+            0x50148,
+            0x501A4,
+            0x50200,
+            0x50214,
+            0x50234,
+            0x5026C,
+            0x50280,
+            0x502B8,
+            0x502CC,
+            0x502EC,
+            0x50324,
+            0x50338,
+            0x50590,
+            0x505FC,
+            0x50638,
+            0x5064C,
+            0x50718,
+            0x5076C,
+            0x507F0,
+            0x50808,
+            0x50898,
+            0x50A84,
+            0x50C68,
+            0x50C88,
+            0x50C9C,
+            0x50CB0,
+            0x50D0C,
+            0x50D8C,
+            0x50E18,
+            0x50E60,
+            0x50ECC,
+            0x50EE4,
+            0x50F08,
+            0x50FC4,
+            0x51034,
+            0x51158,
+            0x51168,
+            0x511A4,
+            0x51260,
+            0x51370,
+            0x513B4,
+            0x515D8,
+            0x51600,
+            0x51618,
+            0x51640,
+            0x51668,
+            0x51690,
+            0x516A8,
+            0x516D0,
+            0x516E8,
+            0x51710,
+            0x51738,
+            0x51750,
+            0x51778,
+            0x51790,
+            0x517B8,
+            0x517E0,
+            0x51800,
+            0x5181C,
+            0x51838,
+            0x51854,
+            0x518B8,
+            0x5193C,
+            0x519CC,
+            0x51A2C,
+            0x51A6C,
+            0x51A94,
+            0x51AB0,
+            0x51B24,
+            0x51B34,
+            0x51B44,
+            0x521DC,
+            0x526A8,
+            0x526E4,
+            0x52720,
+            0x52790,
+            0x5283C,
+            0x52A04,
+            0xFFFFFFFF,
+            0x52A7C,
+            0x52A98,
+            0x52AE0,
+            0x52AFC,
+            0x52B18,
+            0x52B54,
+            0x52B74,
+            0x52B90,
+            0x52BAC,
+            0x52BC8,
+            0x52BEC,
+            0x52C18,
+            0x52C34,
+            0x52C50,
+            0x52C6C,
+            0x52C88,
+            0x52CB4,
+            0x52CE0,
+            0x52CFC,
+            0x52D1C,
+            0x52D3C,
+            0x52D5C,
+            0x52D7C,
+            0x52D98,
+            0x52DB4,
+            0x52DE8,
+            0x52E18,
+            0x52E60,
+            0x52E7C,
+            0x52E98,
+            0x52EC4,
+            0x52EF0,
+            0x52F0C,
+            0x53188,
+            0x532E8,
+            0x53AD4,
+            0x53B84,
+            0x54108,
+            0x541C0,
+            0x54300,
+            0x5435C,
+            0x54588,
+            0x546D0,
+            0x5479C,
+            0x547AC,
+            0x547B8,
+            0x547D8,
+            0x547E0,
+            0x547F0,
+            0x54A98,
+            0x54AA4,
+            0x54DC0,
+            0x54DDC,
+            0x54E0C,
+            0x54E64,
+            0x54EAC,
+            0x54EDC,
+            0x54F18,
+            0x54F5C,
+            0x55010,
+            0x550FC,
+            0x55184,
+            0x551B0,
+            0x55200,
+            0x55480,
+            0x55610,
+            0x5572C,
+            0x558C4,
+            0x55944,
+            0x559EC,
+            0x55A18,
+            0x55A44,
+            0x55A88,
+            0x55ACC,
+            0x55B0C,
+            0x55B34,
+            0x55B60,
+            0x55BA8,
+            0x55BF0,
+            0x55C90,
+            0x55D00,
+            0x5640C,
+            0x56464,
+            0x564F4,
+            0x5655C,
+            0x56600,
+            0x56630,
+            0x56668,
+            0x56728,
+            0x56758,
+            0x56AF0,
+            0x56CFC,
+            0x56D68,
+            0x56E48,
+            0x56FB4,
+            0x580EC,
+            0x584F0,
+            0x588D8,
+            0x58F18,
+            0x58F38,
+            0x58F48,
+            0x58F98,
+            0x58FD4,
+            0x59000,
+            0x590A0,
+            0x590F0,
+            0x59164,
+            0x59188,
+            0x591AC,
+            0x59200,
+            0x59220,
+            0x5935C,
+            0x593F4,
+            0x59414,
+            0x59520,
+            0x59630,
+            0x59740,
+            0x59E14,
+            0x5A50C,
+            0x5A72C,
+            0x5A74C,
+            0x5B128,
+            0x5BC7C,
+            0x5CB54,
+            0x5CC34,
+            0x5CD40,
+            0x5D524,
+            0x5E538,
+            0x5E8D0,
+            0x5EF98,
+            0x5F084,
+            0x5F0A4,
+            0x5F110,
+            0x5F120,
+            0x5F3B8,
+            0x5F3D8,
+            0x5F69C,
+            0x5F794,
+            0x5FA28,
+            0x5FA48,
+            0x5FAB4,
+            0x5FAE4,
+            0x5FB90,
+            0x5FBC0,
+            0x5FBFC,
+            0x5FCA8,
+            0x62CFC,
+            0x62D40,
+            0x62D50,
+            0x62DCC,
+            0x62EA0,
+            0x630C4,
+            0x63744,
+            0x63790,
+            0x65C80,
+            0x65E24,
+            0x65E38,
+            0x65E48,
+            0x65F30,
+            0x65FE0,
+            0x66004,
+            0x69AF0,
+            0x6AA08,
+            0x6AA44,
+            0x6AA60,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x2000154,
+            0x200073A,
+            0x2000226,
+            0x2000800,
+            0x2000954,
+            0x2000970,
+            0x2000A1C,
+            0x2000AAC,
+            0x2000AB0,
+            0x2000B9C,
+            0x2000C6C,
+            0x2000DE0,
+            0x2000E70,
+            0x2000EC0,
+            0x2000EC4,
+            0x2000EC8,
+            0x2000F44,
+            0x2000F88,
+            0x2001070,
+            0x2001170,
+            0x2001188,
+            0x200119C,
+            0x2001280,
+            0x2001390,
+            0x2001638,
+            0x2001894,
+            0x2001A30,
+            0x2001A54,
+            0x2001B0C,
+            0x2001C80,
+            0x2001CB0,
+            0x2001CD4,
+            0x2001CF8,
+            0x2001D28,
+            0x2001D50,
+            0x2001D68,
+            0x2001DF4,
+            0x2001EC8,
+            0x2001FA0,
+            0x2002084,
+            0x20021C8,
+            0x20021F4,
+            0x200222C,
+            0x200223C,
+            0x200224C,
+            0x2002274,
+            0x200228C,
+            0x20022AC,
+            0x20022F8,
+            0x2002318,
+            0x2002438,
+            0x20030CC,
+            0x20030E4,
+            0x200321C,
+            0x2003228,
+            0x2003238,
+            0x2003250,
+            0x200326C,
+            0x2003288,
+            0x20032A4,
+            0x20032BC,
+            0x20032D4,
+            0x20032F0,
+            0x200330C,
+            0x2003328,
+            0x2003608,
+            0x20037B4,
+            0x2003824,
+            0x2003CC4,
+            0x2003D2C,
+            0x2003D70,
+            0x2003D94,
+            0x2003DB8,
+            0x2003ED0,
+            0x20040AC,
+            0x2004868,
+            0x2004F74,
+            0x2004FCC,
+            0xFFFFFFFF,
+            0x2005110,
+            0x20061EC,
+            0x200625C,
+            0x2006C1C,
+            0x2006DA4,
+            0x2006EF8,
+            0x2006F68,
+            0x2006FB8,
+            0x2008168,
+            0x2008194,
+            0x2008204,
+            0x2008210,
+            0x2008244,
+            0x2008254,
+            0x20082A8,
+            0x20082C4,
+            0x2008BD4,
+            0x2008C3C,
+            0x200AE38,
+            0x200B990,
+            0x200BA08,
+            0x200BD2C,
+            0x200C0D4,
+            0x200C10C,
+            0x200C110,
+            0x200C118,
+            0x200C11C,
+            0x200C120,
+            0x200C168,
+            0x200C16C,
+            0x200C1C8,
+            0x200C1FC,
+            0x200C230,
+            0x200C234,
+            0x200C23C,
+            0x200C240,
+            0x200C24C,
+            0x200C250,
+            0x200C254,
+            0x200C258,
+            0x200C25C,
+            0x200C2DC,
+            0x200C33C,
+            0x200C35C,
+            0x200C388,
+            0x200C3E0,
+            0x200C474,
+            0x200C484,
+            0x200C4FC,
+            0x200CA54,
+            0x200CAF0,
+            0x200CAFC,
+            0x200CB10,
+            0x200CB2C,
+            0x200CB4C,
+            0x200CB70,
+            0x200CBF4,
+            0x200CC14,
+            0x200CC38,
+            0x200CC84,
+            0x200CCA8,
+            0x200CCE0,
+            0x200CDAC,
+            0x200CDF8,
+            0x200CE74,
+            0x200CE9C,
+            0x200CF58,
+            0x200CF78,
+            0x200CFF0,
+            0x200D0A0,
+            0x200D0D0,
+            0x200D118,
+            0x200D160,
+            0x200D1A8,
+            0x200D278,
+            0xFFFFFFFF,
+            0x200D84C,
+            0x200D864,
+            0x200D98C,
+            0x200DC74,
+            0x200E03C,
+            0x200E084,
+            0x200E228,
+            0x200E3D0,
+            0x200E640,
+            0x200E708,
+            0x200E790,
+            0x200E7AC,
+            0x200E7F0,
+            0x200E818,
+            0x200E838,
+            0x200E858,
+            0x200E894,
+            0x200E8B4,
+            0x200E9E8,
+            0x200EA08,
+            0x200EA28,
+            0x200EA48,
+            0x200EA68,
+            0x200EA88,
+            0x200EAB0,
+            0x200EAD0,
+            0x200EB60,
+            0x200EB88,
+            0x200EBFC,
+            0x200EC0C,
+            0x200EC78,
+            0x200ECC0,
+            0x200ED08,
+            0x200ED2C,
+            0x200ED4C,
+            0x200ED88,
+            0x200EDB4,
+            0x200EDF0,
+            0x200EE2C,
+            0x200EE7C,
+            0x200EEB8,
+            0x200EF10,
+            0x200EF50,
+            0xFFFFFFFF,
+            0x200EF9C,
+            0x200F020,
+            0x200F0B4,
+            0x200F11C,
+            0x200F15C,
+            0x200F1D8,
+            0x200F23C,
+            0x200F2B0,
+            0x200F318,
+            0x200F340,
+            0x200F360,
+            0x200F3D4,
+            0x200F424,
+            0x200F4A4,
+            0x200F528,
+            0x200F5D0,
+            0x200F664,
+            0x200F6E8,
+            0x200F768,
+            0x200F778,
+            0x200F7AC,
+            0x200F81C,
+            0x200F844,
+            0x200F854,
+            0x200F8E0,
+            0x200F910,
+            0x200FA38,
+            0x200FABC,
+            0x200FB24,
+            0x200FBB0,
+            0x200FBF4,
+            0x200FC7C,
+            0x200FD24,
+            0x200FD48,
+            0x200FD80,
+            0x200FDD0,
+            0x200FE78,
+            0x200FEB4,
+            0x200FF20,
+            0x200FF7C,
+            0x200FFC4,
+            0x2010170,
+            0x20101B4,
+            0x2010230,
+            0x20102AC,
+            0x20102EC,
+            0x201037C,
+            0x20103F4,
+            0x2010564,
+            0x2010624,
+            0x2010694,
+            0x20106DC,
+            0x20106F4,
+            0x2010728,
+            0x2010924,
+            0x2010A1C,
+            0x2010C30,
+            0x2010D28,
+            0x2010E10,
+            0x2010E34,
+            0x2010F50,
+            0x2010F74,
+            0x2010F94,
+            0x2011064,
+            0x20110A8,
+            0x201113C,
+            0x2011364,
+            0x20114F8,
+            0x2011524,
+            0x2011550,
+            0x201158C,
+            0x20115C8,
+            0x20116DC,
+            0x2011718,
+            0x2011754,
+            0x2011790,
+            0x20117CC,
+            0x2011800,
+            0x2011820,
+            0x201186C,
+            0x2012AB0,
+            0x2012B04,
+            0x2013220,
+            0x2013394,
+            0x20133BC,
+            0x20133E4,
+            0x2013424,
+            0x2013448,
+            0x2013750,
+            0x2013788,
+            0x20137B8,
+            0x20137F8,
+            0x2013810,
+            0x2013834,
+            0x2013854,
+            0x201389C,
+            0x20138C4,
+            0x2013910,
+            0x201395C,
+            0x201397C,
+            0x201399C,
+            0x20139BC,
+            0x20139DC,
+            0x2013A00,
+            0x2013A20,
+            0x2013AA0,
+            0x2013AC0,
+            0x2013AE0,
+            0x2013B00,
+            0x2013B20,
+            0x2013B40,
+            0x2013B60,
+            0x2013BB8,
+            0x2013BD4,
+            0x2013C00,
+            0x2013C34,
+            0xFFFFFFFF,
+            0x2013CD8,
+            0x2013CF4,
+            0x2013D10,
+            0x2013D2C,
+            0x2013DE4,
+            0x20141B0,
+            0x20141D8,
+            0x201426C,
+            0x201430C,
+            0x2014474,
+            0x2014514,
+            0x201467C,
+            0x20146B4,
+            0x2014748,
+            0x2014788,
+            0x2014830,
+            0x201487C,
+            0x2014A1C,
+            0x2014A54,
+            0x2014A8C,
+            0x2014ABC,
+            0x2014C34,
+            0x2014CBC,
+            0x2014CE8,
+            0x2014D28,
+            0x2014D54,
+            0x2014D8C,
+            0x2014DD0,
+            0x2014E08,
+            0x2014E34,
+            0x2014EC8,
+            0x2014F34,
+            0x2014FD4,
+            0x2014FF4,
+            0x201511C,
+            0x2015198,
+            0x20151B4,
+            0x2015264,
+            0x20152CC,
+            0x2017BB0,
+            0x2017BBC,
+            0x2017D24,
+            0x2017E4C,
+            0x2017EC8,
+            0x2017F40,
+            0x2018310,
+            0x2018B3C,
+            0x2018BC4,
+            0x2018C00,
+            0x2018C80,
+            0x2018EFC,
+            0x2019120,
+            0x20193E4,
+            0x20195CC,
+            0x20198A8,
+            0x2019910,
+            0x2019B80,
+            0x2019CA8,
+            0x2019DDC,
+            0x201A040,
+            0x201A140,
+            0x201A220,
+            0x201A464,
+            0x201A554,
+            0x201A6C4,
+            0x201A880,
+            0x201A958,
+            0x201AA3C,
+            0x201C048,
+            0x201C0A8,
+            0xFFFFFFFF,
+            0x201C140,
+            0x201C1D4,
+            0x201C324,
+            0x201C440,
+            0x201C470,
+            0x201C4B0,
+            0x201C5B8,
+            0x201D1C8,
+            0x201D234,
+            0x201D29C,
+            0x201D32C,
+            0x201D38C,
+            0x201D414,
+            0x201D434,
+            0x201D4DC,
+            0x201D5E8,
+            0x201D6DC,
+            0x201D784,
+            0x201DA9C,
+            0x201DAD8,
+            0x201DCC8,
+            0x201DEA4,
+            0x201DF1C,
+            0x201DF70,
+            0x201E00C,
+            0x201E108,
+            0x201E4EC,
+            0x201E52C,
+            0x201E55C,
+            0x201E774,
+            0x201E788,
+            0x201E89C,
+            0x201EA44,
+            0x201ECF4,
+            0x201EDE0,
+            0x201EEA8,
+            0x201EF48,
+            0x201F0B4,
+            0x201F160,
+            0x201F164,
+            0x201F22C,
+            0x201F50C,
+            0x201F58C,
+            0x201F5E4,
+            0x201F618,
+            0x201F624,
+            0x201FA68,
+            0x201FFA4,
+            0x201FFB0,
+            0x20204C8,
+            0x2020544,
+            0x20205F8,
+            0x2020608,
+            0x2020918,
+            0x202095C,
+            0x2020E18,
+            0x2022440,
+            0x2023608,
+            0x2023648,
+            0x2023654,
+            0x20236E0,
+            0x20243B0,
+            0x2024478,
+            0x2024B44,
+            0x2024CBC,
+            0x2024E4C,
+            0x2025028,
+            0x2025134,
+            0x2025150,
+            0x202516C,
+            0x20251C0,
+            0x20251FC,
+            0x2025268,
+            0x20252B8,
+            0x202536C,
+            0x2025768,
+            0x20257F8,
+            0x2025868,
+            0x2025898,
+            0x20258A4,
+            0x20258C4,
+            0x20258EC,
+            0x202591C,
+            0x202596C,
+            0x2025FC0,
+            0x20262EC,
+            0x2026624,
+            0x202669C,
+            0x2026844,
+            0x2027940,
+            0x20279A8,
+            0x2027A20,
+            0x2027DC8,
+            0x2027DE0,
+            0x2027E50,
+            0x2027EB8,
+            0x20284F4,
+            0x20285E4,
+            0x202869C,
+            0x2029864,
+            0x20299C8,
+            0x202A220,
+            0x202A230,
+            0x202A240,
+            0x202A73C,
+            0x202A78C,
+            0x202A7B4,
+            0x202A924,
+            0x202A9C4,
+            0x202A9E8,
+            0x202AA88,
+            0x202AAB4,
+            0x202ACAC,
+            0x202AE00,
+            0x202AE14,
+            0x202AE98,
+            0x202AEB8,
+            0x202AF54,
+            0x202B444,
+            0x202B504,
+            0x202B5DC,
+            0x202B7E8,
+            0x202B81C,
+            0x202B848,
+            0x202B868,
+            0x202B8B0,
+            0x202B8D4,
+            0x202B920,
+            0x202BD64,
+            0x202BD78,
+            0x202BF48,
+            0x202BF9C,
+            0x202C014,
+            0x202C034,
+            0x202C054,
+            0x202C068,
+            0x202C0BC,
+            0x202C700,
+            0x202C938,
+            0x202C94C,
+            0x202CA64,
+            0x202CA80,
+            0x202CAEC,
+            0x202CB00,
+            0x202CB14,
+            0x202CB28,
+            0x202CB60,
+            0x202D430,
+            0x202D46C,
+            0x202D548,
+            0x202D888,
+            0x202D8B4,
+            0x202D8D4,
+            0x202D908,
+            0x202D93C,
+            0x202D970,
+            0x202DFA8,
+            0x202E24C,
+            0x202E278,
+            0x202E298,
+            0x202E2EC,
+            0x202E720,
+            0x202E86C,
+            0x202EA04,
+            0x202EA1C,
+            0x202EA38,
+            0x202EA5C,
+            0x202F3F4,
+            0x202F48C,
+            0x202F4C4,
+            0x202F4F8,
+            0x202F580,
+            0x202F6E8,
+            0x202F790,
+            0x202F7CC,
+            0x202F8F0,
+            0x202F994,
+            0x202F9B0,
+            0x202F9D4,
+            0x202FA20,
+            0x202FA50,
+            0x202FC08,
+            0x202FC20,
+            0x202FC40,
+            0x202FC5C,
+            0x202FD20,
+            0x202FDA0,
+            0x202FEE0,
+            0x202FF00,
+            0x2030080,
+            0x2030094,
+            0x20300B0,
+            0x20300D0,
+            0x2030170,
+            0x2030218,
+            0x2030234,
+            0x2030254,
+            0x20302F4,
+            0x2030388,
+            0x2030538,
+            0x20305B8,
+            0x20308F8,
+            0x2030928,
+            0x2030960,
+            0x2030AC0,
+            0x2030AE8,
+            0x2030B80,
+            0x2030B94,
+            0x2030BD0,
+            0x2030BE4,
+            0x2030C08,
+            0x2030D60,
+            0x2030DE0,
+            0x2030DF4,
+            0x2030E08,
+            0x2031248,
+            0x2031264,
+            0x20314B8,
+            0x20314D4,
+            0x203155C,
+            0x2031BD0,
+            0xFFFFFFFF,
+            0x2031E18,
+            0x2032794,
+            0x2032C80,
+            0x2032D58,
+            0x2036B08,
+            0x2036FF0,
+            0x203789C,
+            0x203AB68,
+            0x204064C,
+            0x2041DA8,
+            0x204880C,
+            0x204881C,
+            0x2048854,
+            0x2048AC4,
+            0x2048B30,
+            0x2048D78,
+            0x2048DF0,
+            0x2048F20,
+            0x2048F3C,
+            0x20491E0,
+            0x204923C,
+            0x2049290,
+            0x20492B8,
+            0x20492F0,
+            0x20495B4,
+            0x20495D8,
+            0x20496DC,
+            0x2049994,
+            0x204B328,
+            0x204B3B4,
+            0x204B668,
+            0x204B794,
+            0x204B7FC,
+            0x204B84C,
+            0x204B9D8,
+            0x204BB80,
+            0x204BCE8,
+            0x204BE60,
+            0x204BEC4,
+            0x204BF2C,
+            0x204BF78,
+            0x204C320,
+            0x204C544,
+            0x204C768,
+            0x204C790,
+            0x204C7E8,
+            0x204C978,
+            0x204CC4C,
+            0x204CC60,
+            0x204CC98,
+            0x204CCAC,
+            0x204CDD0,
+            0x204CDF4,
+            0x204CEF4,
+            0x204D018,
+            0x204D0E8,
+            0x204D1F0,
+            0x204D298,
+            0x204D2FC,
+            0x204D468,
+            0x204D490,
+            0x204D4AC,
+            0x204D4E8,
+            0x204D524,
+            0x204D568,
+            0x204D5B0,
+            0x204D5F0,
+            0x204D63C,
+            0x204D658,
+            0x204D678,
+            0x204D6AC,
+            0x204D6C0,
+            0x204D6C8,
+            0x204D720,
+            0x204D8A8,
+            0x204D8E0,
+            0x204DAA8,
+            0x204DAE0,
+            0x204DAFC,
+            0x204DB34,
+            0x204DB54,
+            0x204DB64,
+            0x204DBA8,
+            0x204DBF4,
+            0x204DBFC,
+            0x204DC1C,
+            0x204E0E0,
+            0x204ECA4,
+            0x204EDB4,
+            0x204F338,
+            0x204F71C,
+            0x204F8D4,
+            0x204F90C,
+            0x204F920,
+            0x204F938,
+            0x204F950,
+            0x204F9A4,
+            0x204FB68,
+            0x204FBE0,
+            0x204FBFC,
+            0x204FC18,
+            0x204FC34,
+            0x204FCAC,
+            0x204FD70,
+            0x204FD88,
+            0x204FDA8,
+            0x204FDBC,
+            0x204FEE8,
+            0x204FF10,
+            0x204FF48,
+            0x204FF74,
+            0x204FFB8,
+            0x204FFCC,
+            0x2050014,
+            0x2050028,
+            0x2050070,
+            0x2050084,
+            0x2050088,
+            0x20500C4,
+            0x20500D8,
+            0x20500EC,
+            0x2050100,
+            0x2050134,
+            0x2050148,
+            0x20501A4,
+            0x2050200,
+            0x2050214,
+            0x2050234,
+            0x205026C,
+            0x2050280,
+            0x20502B8,
+            0x20502CC,
+            0x20502EC,
+            0x2050324,
+            0x2050338,
+            0x2050590,
+            0x20505FC,
+            0x2050638,
+            0x205064C,
+            0x2050718,
+            0x205076C,
+            0x20507F0,
+            0x2050808,
+            0x2050898,
+            0x2050A84,
+            0x2050C68,
+            0x2050C88,
+            0x2050C9C,
+            0x2050CB0,
+            0x2050D0C,
+            0x2050D8C,
+            0x2050E18,
+            0x2050E60,
+            0x2050ECC,
+            0x2050EE4,
+            0x2050F08,
+            0x2050FC4,
+            0x2051034,
+            0x2051158,
+            0x2051168,
+            0x20511A4,
+            0x2051260,
+            0x2051370,
+            0x20513B4,
+            0x20515D8,
+            0x2051600,
+            0x2051618,
+            0x2051640,
+            0x2051668,
+            0x2051690,
+            0x20516A8,
+            0x20516D0,
+            0x20516E8,
+            0x2051710,
+            0x2051738,
+            0x2051750,
+            0x2051778,
+            0x2051790,
+            0x20517B8,
+            0x20517E0,
+            0x2051800,
+            0x205181C,
+            0x2051838,
+            0x2051854,
+            0x20518B8,
+            0x205193C,
+            0x20519CC,
+            0x2051A2C,
+            0x2051A6C,
+            0x2051A94,
+            0x2051AB0,
+            0x2051B24,
+            0x2051B34,
+            0x2051B44,
+            0x20521DC,
+            0x20526A8,
+            0x20526E4,
+            0x2052720,
+            0x2052790,
+            0x205283C,
+            0x2052A04,
+            0xFFFFFFFF,
+            0x2052A7C,
+            0x2052A98,
+            0x2052AE0,
+            0x2052AFC,
+            0x2052B18,
+            0x2052B54,
+            0x2052B74,
+            0x2052B90,
+            0x2052BAC,
+            0x2052BC8,
+            0x2052BEC,
+            0x2052C18,
+            0x2052C34,
+            0x2052C50,
+            0x2052C6C,
+            0x2052C88,
+            0x2052CB4,
+            0x2052CE0,
+            0x2052CFC,
+            0x2052D1C,
+            0x2052D3C,
+            0x2052D5C,
+            0x2052D7C,
+            0x2052D98,
+            0x2052DB4,
+            0x2052DE8,
+            0x2052E18,
+            0x2052E60,
+            0x2052E7C,
+            0x2052E98,
+            0x2052EC4,
+            0x2052EF0,
+            0x2052F0C,
+            0x2053188,
+            0x20532E8,
+            0x2053AD4,
+            0x2053B84,
+            0x2054108,
+            0x20541C0,
+            0x2054300,
+            0x205435C,
+            0x2054588,
+            0x20546D0,
+            0x205479C,
+            0x20547AC,
+            0x20547B8,
+            0x20547D8,
+            0x20547E0,
+            0x20547F0,
+            0x2054A98,
+            0x2054AA4,
+            0x2054DC0,
+            0x2054DDC,
+            0x2054E0C,
+            0x2054E64,
+            0x2054EAC,
+            0x2054EDC,
+            0x2054F18,
+            0x2054F5C,
+            0x2055010,
+            0x20550FC,
+            0x2055184,
+            0x20551B0,
+            0x2055200,
+            0x2055480,
+            0x2055610,
+            0x205572C,
+            0x20558C4,
+            0x2055944,
+            0x20559EC,
+            0x2055A18,
+            0x2055A44,
+            0x2055A88,
+            0x2055ACC,
+            0x2055B0C,
+            0x2055B34,
+            0x2055B60,
+            0x2055BA8,
+            0x2055BF0,
+            0x2055C90,
+            0x2055D00,
+            0x205640C,
+            0x2056464,
+            0x20564F4,
+            0x205655C,
+            0x2056600,
+            0x2056630,
+            0x2056668,
+            0x2056728,
+            0x2056758,
+            0x2056AF0,
+            0x2056CFC,
+            0x2056D68,
+            0x2056E48,
+            0x2056FB4,
+            0x20580EC,
+            0x20584F0,
+            0x20588D8,
+            0x2058F18,
+            0x2058F38,
+            0x2058F48,
+            0x2058F98,
+            0x2058FD4,
+            0x2059000,
+            0x20590A0,
+            0x20590F0,
+            0x2059164,
+            0x2059188,
+            0x20591AC,
+            0x2059200,
+            0x2059220,
+            0x205935C,
+            0x20593F4,
+            0x2059414,
+            0x2059520,
+            0x2059630,
+            0x2059740,
+            0x2059E14,
+            0x205A50C,
+            0x205A72C,
+            0x205A74C,
+            0x205B128,
+            0x205BC7C,
+            0x205CB54,
+            0x205CC34,
+            0x205CD40,
+            0x205D524,
+            0x205E538,
+            0x205E8D0,
+            0x205EF98,
+            0x205F084,
+            0x205F0A4,
+            0x205F110,
+            0x205F120,
+            0x205F3B8,
+            0x205F3D8,
+            0x205F69C,
+            0x205F794,
+            0x205FA28,
+            0x205FA48,
+            0x205FAB4,
+            0x205FAE4,
+            0x205FB90,
+            0x205FBC0,
+            0x205FBFC,
+            0x205FCA8,
+            0x2062CFC,
+            0x2062D40,
+            0x2062D50,
+            0x2062DCC,
+            0x2062EA0,
+            0x20630C4,
+            0x2063744,
+            0x2063790,
+            0x2065C80,
+            0x2065E24,
+            0x2065E38,
+            0x2065E48,
+            0x2065F30,
+            0x2065FE0,
+            0x2066004,
+            0x2069AF0,
+            0x206AA08,
+            0x206AA44,
+            0x206AA60,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            16,
+            16,
+            16,
+            17,
+            1,
+            18,
+            18,
+            18,
+            1,
+            18,
+            19,
+            20,
+            21,
+            22,
+            23,
+            24,
+            25,
+            26,
+            27,
+            28,
+            29,
+            30,
+            31,
+            32,
+            33,
+            34,
+            35,
+            36,
+            37,
+            38,
+            39,
+            40,
+            41,
+            42,
+            43,
+            44,
+            45,
+            46,
+            47,
+            48,
+            49,
+            50,
+            51,
+            52,
+            53,
+            54,
+            55,
+            56,
+            57,
+            58,
+            59,
+            60,
+            60,
+            61,
+            62,
+            63,
+            64,
+            65,
+            66,
+            67,
+            68,
+            69,
+            70,
+            71,
+            72,
+            73,
+            74,
+            75,
+            76,
+            77,
+            78,
+            79,
+            80,
+            81,
+            82,
+            83,
+            84,
+            85,
+            86,
+            87,
+            88,
+            88,
+            89,
+            90,
+            91,
+            92,
+            93,
+            94,
+            95,
+            96,
+            97,
+            98,
+            99,
+            100,
+            101,
+            102,
+            103,
+            104,
+            105,
+            106,
+            107,
+            108,
+            109,
+            110,
+            111,
+            112,
+            113,
+            112,
+            114,
+            115,
+            116,
+            117,
+            118,
+            119,
+            120,
+            112,
+            112,
+            112,
+            112,
+            121,
+            122,
+            123,
+            124,
+            125,
+            126,
+            127,
+            128,
+            129,
+            130,
+            131,
+            132,
+            133,
+            134,
+            135,
+            136,
+            137,
+            138,
+            139,
+            140,
+            141,
+            142,
+            143,
+            144,
+            145,
+            146,
+            147,
+            148,
+            149,
+            150,
+            151,
+            152,
+            151,
+            152,
+            153,
+            154,
+            155,
+            156,
+            157,
+            157,
+            158,
+            159,
+            160,
+            161,
+            162,
+            163,
+            164,
+            165,
+            166,
+            164,
+            167,
+            168,
+            169,
+            170,
+            171,
+            172,
+            173,
+            174,
+            175,
+            176,
+            177,
+            178,
+            136,
+            179,
+            180,
+            181,
+            182,
+            183,
+            184,
+            185,
+            186,
+            187,
+            188,
+            189,
+            190,
+            191,
+            192,
+            193,
+            194,
+            136,
+            195,
+            196,
+            196,
+            197,
+            197,
+            198,
+            199,
+            200,
+            201,
+            163,
+            202,
+            203,
+            204,
+            205,
+            205,
+            205,
+            205,
+            202,
+            164,
+            206,
+            203,
+            207,
+            208,
+            209,
+            210,
+            211,
+            212,
+            213,
+            214,
+            215,
+            216,
+            217,
+            218,
+            219,
+            220,
+            221,
+            222,
+            223,
+            224,
+            225,
+            226,
+            227,
+            228,
+            229,
+            230,
+            231,
+            232,
+            233,
+            234,
+            235,
+            236,
+            237,
+            238,
+            239,
+            240,
+            241,
+            242,
+            243,
+            244,
+            245,
+            246,
+            247,
+            248,
+            249,
+            250,
+            251,
+            252,
+            253,
+            254,
+            255,
+            256,
+            257,
+            258,
+            259,
+            260,
+            261,
+            262,
+            263,
+            264,
+            265,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            267,
+            268,
+            269,
+            270,
+            271,
+            272,
+            273,
+            274,
+            275,
+            276,
+            277,
+            277,
+            278,
+            279,
+            280,
+            281,
+            282,
+            283,
+            284,
+            285,
+            286,
+            287,
+            288,
+            289,
+            290,
+            291,
+            292,
+            293,
+            294,
+            295,
+            296,
+            297,
+            297,
+            298,
+            288,
+            299,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            300,
+            301,
+            302,
+            303,
+            304,
+            303,
+            305,
+            306,
+            305,
+            306,
+            297,
+            307,
+            308,
+            309,
+            310,
+            297,
+            297,
+            297,
+            297,
+            311,
+            312,
+            311,
+            313,
+            314,
+            315,
+            316,
+            317,
+            317,
+            318,
+            319,
+            320,
+            321,
+            322,
+            323,
+            324,
+            325,
+            326,
+            327,
+            328,
+            329,
+            330,
+            331,
+            266,
+            332,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            333,
+            266,
+            266,
+            266,
+            266,
+            266,
+            334,
+            335,
+            336,
+            337,
+            338,
+            339,
+            340,
+            341,
+            342,
+            343,
+            344,
+            345,
+            346,
+            347,
+            348,
+            349,
+            350,
+            351,
+            352,
+            353,
+            354,
+            355,
+            356,
+            357,
+            358,
+            359,
+            360,
+            361,
+            362,
+            363,
+            364,
+            365,
+            366,
+            367,
+            368,
+            369,
+            370,
+            371,
+            372,
+            373,
+            374,
+            375,
+            376,
+            377,
+            378,
+            379,
+            380,
+            381,
+            382,
+            383,
+            384,
+            382,
+            385,
+            386,
+            387,
+            388,
+            389,
+            390,
+            391,
+            392,
+            393,
+            394,
+            395,
+            396,
+            266,
+            266,
+            397,
+            398,
+            399,
+            400,
+            401,
+            402,
+            403,
+            404,
+            405,
+            406,
+            407,
+            408,
+            409,
+            163,
+            410,
+            411,
+            412,
+            413,
+            414,
+            163,
+            415,
+            416,
+            417,
+            418,
+            419,
+            420,
+            421,
+            422,
+            423,
+            424,
+            425,
+            426,
+            427,
+            428,
+            429,
+            430,
+            431,
+            432,
+            433,
+            434,
+            435,
+            436,
+            437,
+            438,
+            439,
+            440,
+            441,
+            442,
+            443,
+            444,
+            445,
+            446,
+            447,
+            448,
+            449,
+            450,
+            451,
+            452,
+            453,
+            454,
+            455,
+            456,
+            457,
+            458,
+            459,
+            460,
+            461,
+            462,
+            463,
+            464,
+            465,
+            458,
+            458,
+            466,
+            467,
+            468,
+            469,
+            470,
+            471,
+            472,
+            473,
+            474,
+            475,
+            476,
+            477,
+            478,
+            479,
+            480,
+            481,
+            482,
+            483,
+            484,
+            485,
+            486,
+            487,
+            488,
+            489,
+            490,
+            491,
+            492,
+            493,
+            494,
+            495,
+            496,
+            497,
+            498,
+            499,
+            500,
+            501,
+            502,
+            503,
+            504,
+            505,
+            506,
+            507,
+            508,
+            509,
+            510,
+            511,
+            512,
+            513,
+            514,
+            515,
+            516,
+            517,
+            518,
+            519,
+            520,
+            521,
+            522,
+            523,
+            524,
+            525,
+            526,
+            527,
+            528,
+            529,
+            530,
+            531,
+            532,
+            533,
+            534,
+            535,
+            536,
+            537,
+            538,
+            539,
+            540,
+            541,
+            542,
+            543,
+            544,
+            545,
+            546,
+            547,
+            548,
+            549,
+            550,
+            551,
+            552,
+            553,
+            554,
+            555,
+            556,
+            557,
+            557,
+            558,
+            163,
+            559,
+            560,
+            561,
+            562,
+            563,
+            564,
+            565,
+            566,
+            567,
+            568,
+            569,
+            569,
+            570,
+            571,
+            572,
+            573,
+            266,
+            574,
+            575,
+            576,
+            577,
+            578,
+            579,
+            580,
+            581,
+            582,
+            583,
+            584,
+            585,
+            586,
+            587,
+            588,
+            589,
+            590,
+            591,
+            592,
+            593,
+            594,
+            595,
+            596,
+            597,
+            598,
+            599,
+            600,
+            601,
+            602,
+            603,
+            604,
+            605,
+            606,
+            607,
+            608,
+            609,
+            277,
+            609,
+            610,
+            611,
+            612,
+            613,
+            614,
+            163,
+            615,
+            616,
+            609,
+            617,
+            157,
+            618,
+            619,
+            620,
+            621,
+            622,
+            623,
+            624,
+            625,
+            626,
+            627,
+            628,
+            629,
+            630,
+            631,
+            632,
+            633,
+            634,
+            635,
+            636,
+            637,
+            638,
+            639,
+            640,
+            641,
+            642,
+            643,
+            644,
+            266,
+            645,
+            646,
+            647,
+            648,
+            649,
+            650,
+            651,
+            652,
+            653,
+            654,
+            655,
+            656,
+            657,
+            658,
+            659,
+            660,
+            661,
+            662,
+            663,
+            664,
+            665,
+            666,
+            667,
+            668,
+            669,
+            670,
+            671,
+            672,
+            673,
+            674,
+            675,
+            676,
+            677,
+            678,
+            679,
+            680,
+            681,
+            682,
+            683,
+            684,
+            685,
+            618,
+            686,
+            687,
+            688,
+            689,
+            690,
+            691,
+            692,
+            693,
+            694,
+            695,
+            696,
+            697,
+            698,
+            699,
+            700,
+            701,
+            702,
+            703,
+            704,
+            705,
+            706,
+            707,
+            708,
+            707,
+            709,
+            707,
+            710,
+            707,
+            711,
+            712,
+            707,
+            713,
+            707,
+            707,
+            714,
+            715,
+            716,
+            717,
+            718,
+            719,
+            306,
+            720,
+            721,
+            722,
+            723,
+            724,
+            725,
+            726,
+            727,
+            728,
+            163,
+            729,
+            730,
+            730,
+            729,
+            731,
+            732,
+            733,
+            734,
+            735,
+            736,
+            737,
+            738,
+            739,
+            740,
+            741,
+            742,
+            743,
+            744,
+            745,
+            746,
+            747,
+            748,
+            748,
+            749,
+            750,
+            751,
+            752,
+            753,
+            754,
+            755,
+            756,
+            757,
+            758,
+            759,
+            760,
+            748,
+            761,
+            762,
+            163,
+            763,
+            764,
+            765,
+            766,
+            767,
+            768,
+            769,
+            770,
+            771,
+            771,
+            771,
+            772,
+            773,
+            774,
+            775,
+            776,
+            777,
+            778,
+            779,
+            780,
+            781,
+            782,
+            783,
+            784,
+            785,
+            771,
+            786,
+            787,
+            788,
+            789,
+            790,
+            791,
+            792,
+            793,
+            794,
+            795,
+            796,
+            797,
+            798,
+            799,
+            800,
+            801,
+            802,
+            803,
+            804,
+            805,
+            806,
+            807,
+            808,
+            809,
+            810,
+            811,
+            812,
+            813,
+            814,
+            815,
+            816,
+            817,
+            818,
+            819,
+            820,
+            821,
+            163,
+            822,
+            823,
+            824,
+            825,
+            826,
+            827,
+            828,
+            829,
+            830,
+            831,
+            832,
+            833,
+            834,
+            835,
+            836,
+            837,
+            838,
+            157,
+            619,
+            839,
+            840,
+            841,
+            842,
+            843,
+            844,
+            845,
+            846,
+            847,
+            848,
+            849,
+            850,
+            851,
+            852,
+            853,
+            854,
+            855,
+            856,
+            857,
+            858,
+            859,
+            860,
+            861,
+            862,
+            863,
+            864,
+            865,
+            866,
+            867,
+            868,
+            869,
+            870,
+            871,
+            872,
+            873,
+            874,
+            875,
+            876,
+            877,
+            878,
+            879,
+            880,
+            881,
+            882,
+            883,
+            884,
+            885,
+            886,
+            887,
+            888,
+        ),
+    ),
+    c_types=None,
+    multi={
+        78: ((0x5050, 0x50B0), (0x2005050, 0x20050B0)),
+        154: (
+            (
+                0xD634,
+                0xE9C0,
+                0x13728,
+                0x17740,
+                0x17A98,
+                0x235E0,
+                0x237DC,
+                0x381FC,
+                0x39840,
+                0x3AD6C,
+                0x3D38C,
+                0x41AB4,
+                0x42DF4,
+                0x52768,
+                0x54D98,
+                0x60CD8,
+            ),
+            (
+                0x200D634,
+                0x200E9C0,
+                0x2013728,
+                0x2017740,
+                0x2017A98,
+                0x20235E0,
+                0x20237DC,
+                0x20381FC,
+                0x2039840,
+                0x203AD6C,
+                0x203D38C,
+                0x2041AB4,
+                0x2042DF4,
+                0x2052768,
+                0x2054D98,
+                0x2060CD8,
+            ),
+        ),
+        315: ((0x13C7C, 0x147D4), (0x2013C7C, 0x20147D4)),
+        386: ((0x1C108, 0x1C124), (0x201C108, 0x201C124)),
+        608: ((0x31DC4, 0x32D04), (0x2031DC4, 0x2032D04)),
+        810: ((0x52A28, 0x52A44, 0x52A60), (0x2052A28, 0x2052A44, 0x2052A60)),
+    },
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "SECURE",
+        "START_MODULE_PARAMS",
+        "DEFAULT_MEMORY_ARENA_SIZE",
+        "LOG_MAX_ARG",
+        "DAMAGE_SOURCE_CODE_ORB_ITEM",
+        "DAMAGE_SOURCE_CODE_NON_ORB_ITEM",
+        "AURA_BOW_ID_LAST",
+        "NUMBER_OF_ITEMS",
+        "MAX_MONEY_CARRIED",
+        "MAX_MONEY_STORED",
+        "WINDOW_LIST_PTR",
+        "SCRIPT_VARS_VALUES_PTR",
+        "MAX_PLAY_TIME",
+        "MONSTER_ID_LIMIT",
+        "MAX_RECRUITABLE_TEAM_MEMBERS",
+        "NATURAL_LOG_VALUE_TABLE",
+        "CART_REMOVED_IMG_DATA",
+        "STRING_DEBUG_EMPTY",
+        "STRING_DEBUG_FORMAT_LINE_FILE",
+        "STRING_DEBUG_NO_PROG_POS",
+        "STRING_DEBUG_SPACED_PRINT",
+        "STRING_DEBUG_FATAL",
+        "STRING_DEBUG_NEWLINE",
+        "STRING_DEBUG_LOG_NULL",
+        "STRING_DEBUG_STRING_NEWLINE",
+        "STRING_EFFECT_EFFECT_BIN",
+        "STRING_MONSTER_MONSTER_BIN",
+        "STRING_BALANCE_M_LEVEL_BIN",
+        "STRING_DUNGEON_DUNGEON_BIN",
+        "STRING_MONSTER_M_ATTACK_BIN",
+        "STRING_MONSTER_M_GROUND_BIN",
+        "STRING_FILE_DIRECTORY_INIT",
+        "AVAILABLE_ITEMS_IN_GROUP_TABLE",
+        "ARM9_UNKNOWN_TABLE__NA_2097FF8",
+        "KECLEON_SHOP_ITEM_TABLE_LISTS_1",
+        "KECLEON_SHOP_ITEM_TABLE_LISTS_2",
+        "EXCLUSIVE_ITEM_STAT_BOOST_DATA",
+        "EXCLUSIVE_ITEM_DEFENSE_BOOSTS",
+        "EXCLUSIVE_ITEM_SPECIAL_ATTACK_BOOSTS",
+        "EXCLUSIVE_ITEM_SPECIAL_DEFENSE_BOOSTS",
+        "EXCLUSIVE_ITEM_EFFECT_DATA",
+        "EXCLUSIVE_ITEM_STAT_BOOST_DATA_INDEXES",
+        "RECYCLE_SHOP_ITEM_LIST",
+        "TYPE_SPECIFIC_EXCLUSIVE_ITEMS",
+        "RECOIL_MOVE_LIST",
+        "PUNCH_MOVE_LIST",
+        "MOVE_POWER_STARS_TABLE",
+        "MOVE_ACCURACY_STARS_TABLE",
+        "PARENT_MENU_DEFAULT_WINDOW_PARAMS",
+        "SIMPLE_MENU_DEFAULT_WINDOW_PARAMS",
+        "ADVANCED_MENU_DEFAULT_WINDOW_PARAMS",
+        "COLLECTION_MENU_DEFAULT_WINDOW_PARAMS",
+        "OPTIONS_MENU_DEFAULT_WINDOW_PARAMS",
+        "DEBUG_MENU_DEFAULT_WINDOW_PARAMS",
+        "SCROLL_BOX_DEFAULT_WINDOW_PARAMS",
+        "DIALOGUE_BOX_DEFAULT_WINDOW_PARAMS",
+        "PORTRAIT_BOX_DEFAULT_WINDOW_PARAMS",
+        "TEXT_BOX_DEFAULT_WINDOW_PARAMS",
+        "AREA_NAME_BOX_DEFAULT_WINDOW_PARAMS",
+        "CONTROLS_CHART_DEFAULT_WINDOW_PARAMS",
+        "ALERT_BOX_DEFAULT_WINDOW_PARAMS",
+        "ADVANCED_TEXT_BOX_DEFAULT_WINDOW_PARAMS",
+        "TEAM_SELECTION_MENU_DEFAULT_WINDOW_PARAMS",
+        "PARTNER_TALK_KIND_TABLE",
+        "SCRIPT_VARS_LOCALS",
+        "SCRIPT_VARS",
+        "PORTRAIT_LAYOUTS",
+        "KAOMADO_FILEPATH",
+        "WONDER_MAIL_BITS_MAP",
+        "WONDER_MAIL_BITS_SWAP",
+        "ARM9_UNKNOWN_TABLE__NA_209E12C",
+        "ARM9_UNKNOWN_TABLE__NA_209E164",
+        "ARM9_UNKNOWN_TABLE__NA_209E280",
+        "WONDER_MAIL_ENCRYPTION_TABLE",
+        "DUNGEON_DATA_LIST",
+        "ADVENTURE_LOG_ENCOUNTERS_MONSTER_IDS",
+        "ARM9_UNKNOWN_DATA__NA_209E6BC",
+        "TACTIC_NAME_STRING_IDS",
+        "STATUS_NAME_STRING_IDS",
+        "DUNGEON_RETURN_STATUS_TABLE",
+        "STATUSES_FULL_DESCRIPTION_STRING_IDS",
+        "ARM9_UNKNOWN_DATA__NA_209EAAC",
+        "MISSION_FLOOR_RANKS_AND_ITEM_LISTS_1",
+        "MISSION_FLOORS_FORBIDDEN",
+        "MISSION_FLOOR_RANKS_AND_ITEM_LISTS_2",
+        "MISSION_FLOOR_RANKS_PTRS",
+        "DUNGEON_RESTRICTIONS",
+        "SPECIAL_BAND_STAT_BOOST",
+        "MUNCH_BELT_STAT_BOOST",
+        "GUMMI_STAT_BOOST",
+        "MIN_IQ_EXCLUSIVE_MOVE_USER",
+        "WONDER_GUMMI_IQ_GAIN",
+        "AURA_BOW_STAT_BOOST",
+        "MIN_IQ_ITEM_MASTER",
+        "DEF_SCARF_STAT_BOOST",
+        "POWER_BAND_STAT_BOOST",
+        "WONDER_GUMMI_STAT_BOOST",
+        "ZINC_BAND_STAT_BOOST",
+        "EGG_HP_BONUS",
+        "EVOLUTION_HP_BONUS",
+        "DAMAGE_FORMULA_FLV_SHIFT",
+        "EVOLUTION_PHYSICAL_STAT_BONUSES",
+        "DAMAGE_FORMULA_CONSTANT_SHIFT",
+        "DAMAGE_FORMULA_FLV_DEFICIT_DIVISOR",
+        "EGG_STAT_BONUSES",
+        "EVOLUTION_SPECIAL_STAT_BONUSES",
+        "DAMAGE_FORMULA_NON_TEAM_MEMBER_MODIFIER",
+        "DAMAGE_FORMULA_LN_PREFACTOR",
+        "DAMAGE_FORMULA_DEF_PREFACTOR",
+        "DAMAGE_FORMULA_AT_PREFACTOR",
+        "DAMAGE_FORMULA_LN_ARG_PREFACTOR",
+        "FORBIDDEN_FORGOT_MOVE_LIST",
+        "TACTICS_UNLOCK_LEVEL_TABLE",
+        "CLIENT_LEVEL_TABLE",
+        "OUTLAW_LEVEL_TABLE",
+        "OUTLAW_MINION_LEVEL_TABLE",
+        "HIDDEN_POWER_BASE_POWER_TABLE",
+        "VERSION_EXCLUSIVE_MONSTERS",
+        "IQ_SKILL_RESTRICTIONS",
+        "SECONDARY_TERRAIN_TYPES",
+        "SENTRY_DUTY_MONSTER_IDS",
+        "IQ_SKILLS",
+        "IQ_GROUP_SKILLS",
+        "MONEY_QUANTITY_TABLE",
+        "ARM9_UNKNOWN_TABLE__NA_20A20B0",
+        "IQ_GUMMI_GAIN_TABLE",
+        "GUMMI_BELLY_RESTORE_TABLE",
+        "BAG_CAPACITY_TABLE_SPECIAL_EPISODES",
+        "BAG_CAPACITY_TABLE",
+        "SPECIAL_EPISODE_MAIN_CHARACTERS",
+        "GUEST_MONSTER_DATA",
+        "RANK_UP_TABLE",
+        "DS_DOWNLOAD_TEAMS",
+        "ARM9_UNKNOWN_PTR__NA_20A2C84",
+        "UNOWN_SPECIES_ADDITIONAL_CHARS",
+        "MONSTER_SPRITE_DATA",
+        "REMOTE_STRINGS",
+        "RANK_STRINGS_1",
+        "MISSION_MENU_STRING_IDS_1",
+        "RANK_STRINGS_2",
+        "MISSION_MENU_STRING_IDS_2",
+        "RANK_STRINGS_3",
+        "MISSION_DUNGEON_UNLOCK_TABLE",
+        "NO_SEND_ITEM_TABLE",
+        "ARM9_UNKNOWN_TABLE__NA_20A3CC8",
+        "ARM9_UNKNOWN_TABLE__NA_20A3CE4",
+        "ARM9_UNKNOWN_FUNCTION_TABLE__NA_20A3CF4",
+        "MISSION_BANNED_STORY_MONSTERS",
+        "ITEM_DELIVERY_TABLE",
+        "MISSION_RANK_POINTS",
+        "MISSION_BANNED_MONSTERS",
+        "MISSION_STRING_IDS",
+        "LEVEL_LIST",
+        "EVENTS",
+        "ARM9_UNKNOWN_TABLE__NA_20A68BC",
+        "DEMO_TEAMS",
+        "ACTOR_LIST",
+        "ENTITIES",
+        "JOB_WINDOW_PARAMS_1",
+        "JOB_MENU_ITEMS_1",
+        "JOB_MENU_ITEMS_2",
+        "JOB_MENU_ITEMS_3",
+        "JOB_MENU_ITEMS_4",
+        "JOB_MENU_ITEMS_5",
+        "JOB_MENU_ITEMS_6",
+        "JOB_MENU_ITEMS_7",
+        "JOB_MENU_ITEMS_8",
+        "JOB_MENU_ITEMS_9",
+        "JOB_MENU_ITEMS_10",
+        "JOB_MENU_ITEMS_11",
+        "JOB_MENU_ITEMS_12",
+        "JOB_MENU_ITEMS_13",
+        "JOB_WINDOW_PARAMS_2",
+        "DUNGEON_SWAP_ID_TABLE",
+        "MAP_MARKER_PLACEMENTS",
+        "LFO_OUTPUT_VOICE_UPDATE_FLAGS",
+        "TRIG_TABLE",
+        "FX_ATAN_IDX_TABLE",
+        "TEX_PLTT_START_ADDR_TABLE",
+        "TEX_START_ADDR_TABLE",
+        "ARM9_UNKNOWN_TABLE__NA_20AE924",
+        "MEMORY_ALLOCATION_ARENA_GETTERS",
+        "PRNG_SEQUENCE_NUM",
+        "LOADED_OVERLAY_GROUP_0",
+        "LOADED_OVERLAY_GROUP_1",
+        "LOADED_OVERLAY_GROUP_2",
+        "DEBUG_IS_INITIALIZED",
+        "PACK_FILES_OPENED",
+        "PACK_FILE_PATHS_TABLE",
+        "GAME_STATE_VALUES",
+        "BAG_ITEMS_PTR_MIRROR",
+        "ITEM_DATA_TABLE_PTRS",
+        "DUNGEON_MOVE_TABLES",
+        "MOVE_DATA_TABLE_PTR",
+        "WAN_TABLE",
+        "RENDER_3D",
+        "RENDER_3D_FUNCTIONS_64",
+        "LANGUAGE_INFO_DATA",
+        "TBL_TALK_GROUP_STRING_ID_START",
+        "KEYBOARD_STRING_IDS",
+        "NOTIFY_NOTE",
+        "DEFAULT_HERO_ID",
+        "DEFAULT_PARTNER_ID",
+        "GAME_MODE",
+        "GLOBAL_PROGRESS_PTR",
+        "ADVENTURE_LOG_PTR",
+        "ITEM_TABLES_PTRS_1",
+        "UNOWN_SPECIES_ADDITIONAL_CHAR_PTR_TABLE",
+        "TEAM_MEMBER_TABLE_PTR",
+        "MISSION_DELIVER_LIST_PTR",
+        "MISSION_DELIVER_COUNT",
+        "MISSION_DUNGEON_LIST_PTR",
+        "MISSION_DUNGEON_COUNT",
+        "MISSION_MONSTER_LIST_PTR",
+        "MISSION_MONSTER_COUNT",
+        "MISSION_LIST_PTR",
+        "REMOTE_STRING_PTR_TABLE",
+        "RANK_STRING_PTR_TABLE",
+        "SMD_EVENTS_FUN_TABLE",
+        "MUSIC_DURATION_LOOKUP_TABLE_1",
+        "MUSIC_DURATION_LOOKUP_TABLE_2",
+        "LFO_WAVEFORM_CALLBACKS",
+        "IS_DISP_ON",
+        "GXI_DMA_ID",
+        "JUICE_BAR_NECTAR_IQ_GAIN",
+        "DEBUG_TEXT_SPEED",
+        "REGULAR_TEXT_SPEED",
+        "HERO_START_LEVEL",
+        "PARTNER_START_LEVEL",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x0,
+            0xBA0,
+            0xE58,
+            0x2220,
+            0xCA84,
+            0xCA88,
+            0xCC34,
+            0xFFFFFFFF,
+            0xED80,
+            0x10720,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x91730,
+            0x92DD0,
+            0x94DE4,
+            0x94DE8,
+            0x94E04,
+            0x94E1C,
+            0x94E28,
+            0x94E3C,
+            0x94E40,
+            0x94E48,
+            0x94E4C,
+            0x94E60,
+            0x94E74,
+            0x94E88,
+            0x94E9C,
+            0x94EB4,
+            0x94ECC,
+            0x95028,
+            0x982EC,
+            0x983B4,
+            0x983C4,
+            0x983DC,
+            0x983DD,
+            0x983DE,
+            0x983DF,
+            0x98418,
+            0x98419,
+            0x98BC0,
+            0x98F20,
+            0x99068,
+            0x9907E,
+            0x99FC8,
+            0x99FE0,
+            0x9B7E4,
+            0x9B7F4,
+            0x9B804,
+            0x9B814,
+            0x9B824,
+            0x9B860,
+            0x9B870,
+            0x9B880,
+            0x9B890,
+            0x9B8A0,
+            0x9B8B0,
+            0x9B8CC,
+            0x9B8E8,
+            0x9B8F8,
+            0x9B908,
+            0x9E0B8,
+            0x9E2A0,
+            0x9EC44,
+            0x9F3E8,
+            0x9F4A8,
+            0x9F4BC,
+            0x9F4DC,
+            0x9F500,
+            0x9F538,
+            0x9F654,
+            0x9F674,
+            0x9F774,
+            0x9FA44,
+            0x9FA90,
+            0x9FA94,
+            0x9FAAC,
+            0x9FB78,
+            0x9FCE4,
+            0x9FE80,
+            0x9FE84,
+            0xA0AE8,
+            0xA0BB0,
+            0xA1EA8,
+            0xA2038,
+            0xA2C40,
+            0xA2C50,
+            0xA2C5C,
+            0xA2C60,
+            0xA2C64,
+            0xA2C6C,
+            0xA2C78,
+            0xA2C7C,
+            0xA2C80,
+            0xA2C84,
+            0xA2C88,
+            0xA2C8C,
+            0xA2C98,
+            0xA2CA0,
+            0xA2CA4,
+            0xA2CA8,
+            0xA2CAC,
+            0xA2CB0,
+            0xA2CB8,
+            0xA2CBC,
+            0xA2CC0,
+            0xA2CC4,
+            0xA2CC8,
+            0xA2CCC,
+            0xA2CEC,
+            0xA2D14,
+            0xA2D4C,
+            0xA2D6C,
+            0xA2D8C,
+            0xA2DAC,
+            0xA2DD4,
+            0xA2E30,
+            0xA2EBC,
+            0xA2F84,
+            0xA3050,
+            0xA3164,
+            0xA32F4,
+            0xA3484,
+            0xA3684,
+            0xA390C,
+            0xA3B94,
+            0xA3BA8,
+            0xA3BC8,
+            0xA3C90,
+            0xA3F18,
+            0xA3FE8,
+            0xA4058,
+            0xA405C,
+            0xA40DC,
+            0xA4F24,
+            0xA4F60,
+            0xA4F50,
+            0xA4F90,
+            0xA4FC0,
+            0xA4FD0,
+            0xA5090,
+            0xA5096,
+            0xA50AC,
+            0xA50C8,
+            0xA50D8,
+            0xA50F8,
+            0xA5122,
+            0xA5150,
+            0xA5190,
+            0xA5288,
+            0xA5AD0,
+            0xA6894,
+            0xA7D04,
+            0xA7D10,
+            0xA7D58,
+            0xA9438,
+            0xAA660,
+            0xAA670,
+            0xAA690,
+            0xAA700,
+            0xAA718,
+            0xAA730,
+            0xAA748,
+            0xAA760,
+            0xAA778,
+            0xAA790,
+            0xAA7A8,
+            0xAA7C0,
+            0xAA7D8,
+            0xAA7F8,
+            0xAA818,
+            0xAA828,
+            0xAA918,
+            0xAB3E8,
+            0xAB3F8,
+            0xAF3F8,
+            0xAF4FC,
+            0xAF50C,
+            0xAFD6C,
+            0xB0340,
+            0xB036C,
+            0xB0670,
+            0xB0674,
+            0xFFFFFFFF,
+            0xB0AD8,
+            0xB0ADC,
+            0xB0AE0,
+            0xB0AF8,
+            0xB0AF8,
+            0xB0B00,
+            0xB0B1C,
+            0xFFFFFFFF,
+            0xB10A8,
+            0xB10C0,
+            0xB1104,
+            0xB1128,
+            0xB1140,
+            0xB1240,
+            0xB176C,
+            0xB1770,
+            0xB1772,
+            0xB17E4,
+            0xB17E8,
+            0xB17EC,
+            0xB21BC,
+            0xB224C,
+            0xB22BC,
+            0xB22D4,
+            0xB22D8,
+            0xB22DC,
+            0xB22E0,
+            0xB22E4,
+            0xB22E8,
+            0xB22EC,
+            0xB22F0,
+            0xB230C,
+            0xB2404,
+            0xB27C4,
+            0xB28C4,
+            0xB2AC4,
+            0xB4408,
+            0xB440C,
+            0x117E0,
+            0x20CE4,
+            0x20CE8,
+            0x48BEC,
+            0x48C5C,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x2000000,
+            0x2000BA0,
+            0x2000E58,
+            0x2002220,
+            0x200CA84,
+            0x200CA88,
+            0x200CC34,
+            0xFFFFFFFF,
+            0x200ED80,
+            0x2010720,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2091730,
+            0x2092DD0,
+            0x2094DE4,
+            0x2094DE8,
+            0x2094E04,
+            0x2094E1C,
+            0x2094E28,
+            0x2094E3C,
+            0x2094E40,
+            0x2094E48,
+            0x2094E4C,
+            0x2094E60,
+            0x2094E74,
+            0x2094E88,
+            0x2094E9C,
+            0x2094EB4,
+            0x2094ECC,
+            0x2095028,
+            0x20982EC,
+            0x20983B4,
+            0x20983C4,
+            0x20983DC,
+            0x20983DD,
+            0x20983DE,
+            0x20983DF,
+            0x2098418,
+            0x2098419,
+            0x2098BC0,
+            0x2098F20,
+            0x2099068,
+            0x209907E,
+            0x2099FC8,
+            0x2099FE0,
+            0x209B7E4,
+            0x209B7F4,
+            0x209B804,
+            0x209B814,
+            0x209B824,
+            0x209B860,
+            0x209B870,
+            0x209B880,
+            0x209B890,
+            0x209B8A0,
+            0x209B8B0,
+            0x209B8CC,
+            0x209B8E8,
+            0x209B8F8,
+            0x209B908,
+            0x209E0B8,
+            0x209E2A0,
+            0x209EC44,
+            0x209F3E8,
+            0x209F4A8,
+            0x209F4BC,
+            0x209F4DC,
+            0x209F500,
+            0x209F538,
+            0x209F654,
+            0x209F674,
+            0x209F774,
+            0x209FA44,
+            0x209FA90,
+            0x209FA94,
+            0x209FAAC,
+            0x209FB78,
+            0x209FCE4,
+            0x209FE80,
+            0x209FE84,
+            0x20A0AE8,
+            0x20A0BB0,
+            0x20A1EA8,
+            0x20A2038,
+            0x20A2C40,
+            0x20A2C50,
+            0x20A2C5C,
+            0x20A2C60,
+            0x20A2C64,
+            0x20A2C6C,
+            0x20A2C78,
+            0x20A2C7C,
+            0x20A2C80,
+            0x20A2C84,
+            0x20A2C88,
+            0x20A2C8C,
+            0x20A2C98,
+            0x20A2CA0,
+            0x20A2CA4,
+            0x20A2CA8,
+            0x20A2CAC,
+            0x20A2CB0,
+            0x20A2CB8,
+            0x20A2CBC,
+            0x20A2CC0,
+            0x20A2CC4,
+            0x20A2CC8,
+            0x20A2CCC,
+            0x20A2CEC,
+            0x20A2D14,
+            0x20A2D4C,
+            0x20A2D6C,
+            0x20A2D8C,
+            0x20A2DAC,
+            0x20A2DD4,
+            0x20A2E30,
+            0x20A2EBC,
+            0x20A2F84,
+            0x20A3050,
+            0x20A3164,
+            0x20A32F4,
+            0x20A3484,
+            0x20A3684,
+            0x20A390C,
+            0x20A3B94,
+            0x20A3BA8,
+            0x20A3BC8,
+            0x20A3C90,
+            0x20A3F18,
+            0x20A3FE8,
+            0x20A4058,
+            0x20A405C,
+            0x20A40DC,
+            0x20A4F24,
+            0x20A4F60,
+            0x20A4F50,
+            0x20A4F90,
+            0x20A4FC0,
+            0x20A4FD0,
+            0x20A5090,
+            0x20A5096,
+            0x20A50AC,
+            0x20A50C8,
+            0x20A50D8,
+            0x20A50F8,
+            0x20A5122,
+            0x20A5150,
+            0x20A5190,
+            0x20A5288,
+            0x20A5AD0,
+            0x20A6894,
+            0x20A7D04,
+            0x20A7D10,
+            0x20A7D58,
+            0x20A9438,
+            0x20AA660,
+            0x20AA670,
+            0x20AA690,
+            0x20AA700,
+            0x20AA718,
+            0x20AA730,
+            0x20AA748,
+            0x20AA760,
+            0x20AA778,
+            0x20AA790,
+            0x20AA7A8,
+            0x20AA7C0,
+            0x20AA7D8,
+            0x20AA7F8,
+            0x20AA818,
+            0x20AA828,
+            0x20AA918,
+            0x20AB3E8,
+            0x20AB3F8,
+            0x20AF3F8,
+            0x20AF4FC,
+            0x20AF50C,
+            0x20AFD6C,
+            0x20B0340,
+            0x20B036C,
+            0x20B0670,
+            0x20B0674,
+            0xFFFFFFFF,
+            0x20B0AD8,
+            0x20B0ADC,
+            0x20B0AE0,
+            0x20B0AF8,
+            0x20B0AF8,
+            0x20B0B00,
+            0x20B0B1C,
+            0xFFFFFFFF,
+            0x20B10A8,
+            0x20B10C0,
+            0x20B1104,
+            0x20B1128,
+            0x20B1140,
+            0x20B1240,
+            0x20B176C,
+            0x20B1770,
+            0x20B1772,
+            0x20B17E4,
+            0x20B17E8,
+            0x20B17EC,
+            0x20B21BC,
+            0x20B224C,
+            0x20B22BC,
+            0x20B22D4,
+            0x20B22D8,
+            0x20B22DC,
+            0x20B22E0,
+            0x20B22E4,
+            0x20B22E8,
+            0x20B22EC,
+            0x20B22F0,
+            0x20B230C,
+            0x20B2404,
+            0x20B27C4,
+            0x20B28C4,
+            0x20B2AC4,
+            0x20B4408,
+            0x20B440C,
+            0x20117E0,
+            0x2020CE4,
+            0x2020CE8,
+            0x2048BEC,
+            0x2048C5C,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0x800,
+            0xCC,
+            0x4,
+            0x4,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x4,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2000,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x3200,
+            0x40,
+            0x10,
+            0x10,
+            0x3C,
+            0x39,
+            0x39,
+            0x39,
+            0x778,
+            0xFFFFFFFF,
+            0x360,
+            0x88,
+            0x16,
+            0x20,
+            0x18,
+            0x20,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x58,
+            0x40,
+            0x730,
+            0xC0,
+            0xFFFFFFFF,
+            0x20,
+            0x24,
+            0x38,
+            0x100,
+            0x20,
+            0x100,
+            0x2D0,
+            0x4C,
+            0x4,
+            0x18,
+            0xCC,
+            0x16C,
+            0x19C,
+            0x4,
+            0xC64,
+            0xC8,
+            0x12F8,
+            0x190,
+            0xC00,
+            0x2,
+            0x2,
+            0x2,
+            0x4,
+            0x2,
+            0x2,
+            0x4,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x8,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x12,
+            0x18,
+            0x20,
+            0x20,
+            0x20,
+            0x28,
+            0x5C,
+            0x8A,
+            0xC8,
+            0xCC,
+            0x114,
+            0x190,
+            0x190,
+            0x200,
+            0x288,
+            0x288,
+            0x14,
+            0x20,
+            0xC8,
+            0x288,
+            0xD0,
+            0x70,
+            0x4,
+            0x80,
+            0x4B0,
+            0x2C,
+            0x30,
+            0x10,
+            0x30,
+            0x10,
+            0xB4,
+            0x6,
+            0x6,
+            0x1C,
+            0x10,
+            0x20,
+            0x2A,
+            0x2E,
+            0x40,
+            0xF8,
+            0x788,
+            0x2234,
+            0x1470,
+            0xC,
+            0x48,
+            0x28F8,
+            0x1218,
+            0x10,
+            0x20,
+            0x20,
+            0x18,
+            0x18,
+            0x18,
+            0x18,
+            0x18,
+            0x18,
+            0x18,
+            0x18,
+            0x18,
+            0x20,
+            0x20,
+            0x10,
+            0xD4,
+            0x9B0,
+            0xFFFFFFFF,
+            0x4974,
+            0x102,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2D4,
+            0xFFFFFFFF,
+            0x2,
+            0xFFFFFFFF,
+            0x4,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x4,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x3C,
+            0x1,
+            0x2,
+            0x2,
+            0x1,
+            0xFFFFFFFF,
+            0x4,
+            0x68,
+            0x70,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x1C,
+            0x40,
+            0xFFFFFFFF,
+            0x100,
+            0x200,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            889,
+            890,
+            891,
+            892,
+            893,
+            894,
+            895,
+            896,
+            897,
+            898,
+            899,
+            900,
+            901,
+            902,
+            903,
+            904,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            905,
+            906,
+            907,
+            907,
+            908,
+            909,
+            910,
+            911,
+            912,
+            913,
+            266,
+            914,
+            915,
+            916,
+            917,
+            918,
+            919,
+            920,
+            921,
+            922,
+            923,
+            924,
+            925,
+            926,
+            927,
+            928,
+            929,
+            930,
+            931,
+            932,
+            933,
+            934,
+            935,
+            936,
+            937,
+            938,
+            939,
+            940,
+            941,
+            942,
+            943,
+            944,
+            945,
+            946,
+            266,
+            947,
+            948,
+            949,
+            950,
+            266,
+            266,
+            951,
+            266,
+            952,
+            953,
+            954,
+            955,
+            956,
+            957,
+            958,
+            959,
+            960,
+            961,
+            962,
+            963,
+            964,
+            266,
+            266,
+            965,
+            966,
+            967,
+            968,
+            969,
+            970,
+            971,
+            972,
+            973,
+            974,
+            975,
+            976,
+            977,
+            978,
+            979,
+            980,
+            981,
+            982,
+            983,
+            984,
+            985,
+            986,
+            987,
+            988,
+            989,
+            990,
+            990,
+            991,
+            992,
+            993,
+            994,
+            1,
+            995,
+            266,
+            996,
+            997,
+            266,
+            266,
+            998,
+            266,
+            998,
+            266,
+            999,
+            1000,
+            1001,
+            1002,
+            1003,
+            1004,
+            1005,
+            1006,
+            1007,
+            1008,
+            266,
+            1009,
+            1010,
+            1011,
+            266,
+            1012,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1013,
+            1014,
+            1,
+            1015,
+            1016,
+            1,
+            1,
+            1017,
+            1018,
+            1019,
+            1020,
+            1021,
+            1022,
+            1,
+            1023,
+            1024,
+            1025,
+            1026,
+            1027,
+            1028,
+            1029,
+            1030,
+            1031,
+            1032,
+            1025,
+            1033,
+            1034,
+            1035,
+            1036,
+            1037,
+            1038,
+            1039,
+            1040,
+            1041,
+            1042,
+            1043,
+            1044,
+            1045,
+            1046,
+            1047,
+            1048,
+            1049,
+            266,
+            1050,
+            1051,
+            1052,
+            1053,
+            1054,
+            1,
+            1,
+            1,
+            1055,
+            1056,
+            1057,
+            1058,
+            1059,
+        ),
+    ),
+    c_types=(
+        "",
+        "struct start_module_params*",
+        "uint32_t",
+        "int",
+        "enum damage_source_non_move",
+        "enum damage_source_non_move",
+        "enum item_id",
+        "uint32_t",
+        "uint32_t",
+        "uint32_t",
+        "struct window_list*",
+        "struct script_var_value_table*",
+        "uint32_t",
+        "uint32_t",
+        "uint32_t",
+        "fx16_12[2048]",
+        "undefined[0]",
+        "char[4]",
+        "char[28]",
+        "char[24]",
+        "char[12]",
+        "char[20]",
+        "char[4]",
+        "char[8]",
+        "char[4]",
+        "char[20]",
+        "char[20]",
+        "char[20]",
+        "char[20]",
+        "char[24]",
+        "char[24]",
+        "char[40]",
+        "",
+        "",
+        "enum item_id[4]",
+        "enum item_id[4]",
+        "struct exclusive_item_stat_boost_entry[15]",
+        "",
+        "",
+        "",
+        "struct exclusive_item_effect_entry[956]",
+        "",
+        "",
+        "struct item_id_16[17][4]",
+        "struct move_id_16[11]",
+        "struct move_id_16[16]",
+        "int[6]",
+        "int[8]",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct partner_talk_kind_table_entry[11]",
+        "struct script_local_var_table",
+        "struct script_var_table",
+        "struct portrait_layout[32]",
+        "char[20]",
+        "uint8_t[32]",
+        "uint8_t[36]",
+        "",
+        "",
+        "",
+        "uint8_t[256]",
+        "struct dungeon_data_list_entry[180]",
+        "struct monster_id_16[38]",
+        "",
+        "int16_t[12]",
+        "int16_t[102]",
+        "struct dungeon_return_status[91]",
+        "struct status_description[103]",
+        "",
+        "",
+        "struct mission_floors_forbidden[100]",
+        "",
+        "undefined*[100]",
+        "struct dungeon_restriction[256]",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int32_t",
+        "int16_t",
+        "int16_t",
+        "int32_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "fx32_8",
+        "int16_t[2]",
+        "fx32_8",
+        "fx32_8",
+        "int16_t[4]",
+        "int16_t[2]",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "struct forbidden_forgot_move_entry[3]",
+        "int16_t[12]",
+        "int16_t[16]",
+        "int16_t[16]",
+        "int16_t[16]",
+        "int[10]",
+        "struct version_exclusive_monster[23]",
+        "int16_t[69]",
+        "struct secondary_terrain_type_8[200]",
+        "struct monster_id_16[102]",
+        "int32_t[69]",
+        "uint8_t[400]",
+        "int[100]",
+        "",
+        "int16_t[18][18]",
+        "int16_t[18][18]",
+        "uint32_t[5]",
+        "uint32_t[8]",
+        "struct monster_id_16[100]",
+        "struct guest_monster[18]",
+        "struct rankup_table_entry[13]",
+        "struct monster_id_16[56]",
+        "",
+        "enum monster_id[28]",
+        "struct monster_sprite_data_entry[600]",
+        "",
+        "",
+        "int16_t[8]",
+        "",
+        "int16_t[8]",
+        "",
+        "struct dungeon_unlock_entry[3]",
+        "struct item_id_16[3]",
+        "",
+        "",
+        "",
+        "struct monster_id_16[21]",
+        "struct item_id_16[23]",
+        "int[16]",
+        "struct monster_id_16[124]",
+        "int16_t[964]",
+        "",
+        "struct script_level[0]",
+        "",
+        "struct monster_id_16[18][2]",
+        "",
+        "struct script_entity[386]",
+        "struct window_params",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct window_params",
+        "struct dungeon_id_8[212]",
+        "struct map_marker[310]",
+        "struct dse_voice_update_flags",
+        "struct trig_values[4096]",
+        "fx16_14[129]",
+        "int16_t[8]",
+        "int16_t[48]",
+        "",
+        "struct mem_arena_getters",
+        "uint16_t",
+        "enum overlay_group_id",
+        "enum overlay_group_id",
+        "enum overlay_group_id",
+        "bool",
+        "struct pack_file_opened*",
+        "char*[6]",
+        "",
+        "struct item*",
+        "void*[3]",
+        "",
+        "struct move_data_table*",
+        "struct wan_table*",
+        "struct render_3d_global",
+        "render_3d_element_64_fn_t[8]",
+        "",
+        "int16_t[6]",
+        "int16_t[30]",
+        "bool",
+        "struct monster_id_16",
+        "struct monster_id_16",
+        "uint8_t",
+        "struct global_progress*",
+        "struct adventure_log*",
+        "void*[26]",
+        "enum monster_id*[28]",
+        "struct team_member_table*",
+        "undefined*",
+        "int",
+        "undefined*",
+        "int",
+        "undefined*",
+        "int",
+        "undefined*",
+        "char*[7]",
+        "char*[16]",
+        "void*[127]",
+        "int16_t[128]",
+        "int32_t[128]",
+        "sound_lfo_waveform_callback[16]",
+        "bool",
+        "uint32_t",
+        "struct data_processing_instruction",
+        "struct data_processing_instruction",
+        "struct data_processing_instruction",
+        "struct data_processing_instruction",
+        "struct data_processing_instruction",
+    ),
+    multi={},
+)
@@ -0,0 +1,246 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the itcm section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "CopyAndInterleave",
+        "Render3dSetTextureParams",
+        "Render3dSetPaletteBase",
+        "Render3dRectangle",
+        "GeomSetPolygonAttributes",
+        "Render3dQuadrilateral",
+        "Render3dTiling",
+        "Render3dTextureInternal",
+        "Render3dTexture",
+        "Render3dTextureNoSetup",
+        "NewRender3dElement",
+        "EnqueueRender3dTexture",
+        "EnqueueRender3dTiling",
+        "NewRender3dRectangle",
+        "NewRender3dQuadrilateral",
+        "NewRender3dTexture",
+        "NewRender3dTiling",
+        "Render3dProcessQueue",
+        "GetKeyN2MSwitch",
+        "GetKeyN2M",
+        "GetKeyN2MBaseForm",
+        "GetKeyM2NSwitch",
+        "GetKeyM2N",
+        "GetKeyM2NBaseForm",
+        "HardwareInterrupt",
+        "ReturnFromInterrupt",
+        "InitDmaTransfer_Standard",
+        "ShouldMonsterRunAwayVariationOutlawCheck",
+        "AiMovement",
+        "CalculateAiTargetPos",
+        "ChooseAiMove",
+        "LightningRodStormDrainCheck",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x0,
+            0x130,
+            0x1CC,
+            0x224,
+            0x480,
+            0x49C,
+            0x728,
+            0xA10,
+            0xC28,
+            0xC60,
+            0xC78,
+            0xCAC,
+            0xCDC,
+            0xD0C,
+            0xD3C,
+            0xD6C,
+            0xD9C,
+            0xDCC,
+            0x149C,
+            0x14D0,
+            0x153C,
+            0x1574,
+            0x15A8,
+            0x1614,
+            0x1650,
+            0x16B8,
+            0x1AD0,
+            0x23F8,
+            0x242C,
+            0x3330,
+            0x36C0,
+            0x3EC4,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x20B4BE0,
+            0x20B4D10,
+            0x20B4DAC,
+            0x20B4E04,
+            0x20B5060,
+            0x20B507C,
+            0x20B5308,
+            0x20B55F0,
+            0x20B5808,
+            0x20B5840,
+            0x20B5858,
+            0x20B588C,
+            0x20B58BC,
+            0x20B58EC,
+            0x20B591C,
+            0x20B594C,
+            0x20B597C,
+            0x20B59AC,
+            0x20B607C,
+            0x20B60B0,
+            0x20B611C,
+            0x20B6154,
+            0x20B6188,
+            0x20B61F4,
+            0x20B6230,
+            0x20B6298,
+            0x20B66B0,
+            0x20B6FD8,
+            0x20B700C,
+            0x20B7F10,
+            0x20B82A0,
+            0x20B8AA4,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1060,
+            1061,
+            1062,
+            1063,
+            1064,
+            1065,
+            1066,
+            1067,
+            1068,
+            1069,
+            1070,
+            1071,
+            1072,
+            1073,
+            1074,
+            1075,
+            1076,
+            1077,
+            1078,
+            1079,
+            1079,
+            1080,
+            1081,
+            1081,
+            1082,
+            4,
+            1083,
+            1084,
+            1085,
+            1086,
+            1087,
+            1088,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "MEMORY_ALLOCATION_TABLE",
+        "DEFAULT_MEMORY_ARENA",
+        "DEFAULT_MEMORY_ARENA_BLOCKS",
+        "RENDER_3D_FUNCTIONS",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x0,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x20B4BE0,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1089,
+            1090,
+            1091,
+            1092,
+        ),
+    ),
+    c_types=(
+        "struct mem_alloc_table",
+        "struct mem_arena",
+        "struct mem_block[256]",
+        "render_3d_element_fn_t[4]",
+    ),
+    multi={},
+)
@@ -0,0 +1,2183 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the libs section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "DseDriver_LoadDefaultSettings",
+        "DseDriver_IsSettingsValid",
+        "DseDriver_ConfigureHeap",
+        "DseDriver_Init",
+        "Dse_SetError",
+        "Dse_SetError2",
+        "DseUtil_ByteSwap32",
+        "SoundUtil_GetRandomNumber",
+        "DseMem_Init",
+        "DseMem_Quit",
+        "DseMem_AllocateUser",
+        "DseMem_Allocate",
+        "DseMem_AllocateThreadStack",
+        "DseMem_Free",
+        "DseMem_Clear",
+        "DseFile_CheckHeader",
+        "DseSwd_SysInit",
+        "DseSwd_SysQuit",
+        "DseSwd_SampleLoaderMain",
+        "DseSwd_MainBankDummyCallback",
+        "DseSwd_LoadMainBank",
+        "DseSwd_LoadBank",
+        "DseSwd_IsBankLoading",
+        "DseSwd_LoadWaves",
+        "DseSwd_LoadWavesInternal",
+        "DseSwd_Unload",
+        "ReadWaviEntry",
+        "DseSwd_GetInstrument",
+        "DseSwd_GetNextSplitInRange",
+        "DseSwd_GetMainBankById",
+        "DseSwd_GetBankById",
+        "DseSwd_InitMainBankFileReader",
+        "DseSwd_OpenMainBankFileReader",
+        "DseSwd_CloseMainBankFileReader",
+        "DseSwd_ReadMainBank",
+        "DseBgm_DefaultSignalCallback",
+        "DseBgm_Load",
+        "DseBgm_Unload",
+        "DseBgm_SetSignalCallback",
+        "DseBgm_IsPlaying",
+        "ResumeBgm",
+        "DseBgm_Stop",
+        "DseBgm_StopAll",
+        "DseBgm_SetFades",
+        "DseSequence_Start",
+        "DseSequence_PauseList",
+        "DseSequence_SetFades",
+        "DseSequence_GetParameter",
+        "DseSequence_GetSmallestNumLoops",
+        "DseSequence_Reset",
+        "DseSequence_Stop",
+        "FindSmdlSongChunk",
+        "DseSequence_LoadSong",
+        "DseSequence_GetById",
+        "DseSequence_AllocateNew",
+        "DseSequence_Unload",
+        "DseSequence_InitTracks",
+        "DseBgm_SysSetupNoteList",
+        "DseSe_SysReset",
+        "DseSe_Load",
+        "DseSe_Unload",
+        "DseSe_GetUsedBankIDs",
+        "DseSe_HasPlayingInstances",
+        "DseSe_Play",
+        "DseSe_GetEffectSong",
+        "DseSe_CheckTooManyInstances",
+        "DseSe_CheckTooManyInstancesInGroup",
+        "DseSe_GetBestSeqAllocation",
+        "DseSe_GetById",
+        "DseSe_Stop",
+        "DseSe_StopAll",
+        "DseSe_StopSeq",
+        "FlushChannels",
+        "DseDriver_StartMainThread",
+        "DseDriver_StartTickTimer",
+        "DseDriver_NotifyTick",
+        "DseDriver_Main",
+        "DseSequence_TickNotes",
+        "ParseDseEvent",
+        "UpdateSequencerTracks",
+        "DseSequence_TickFades",
+        "DseTrackEvent_Invalid",
+        "DseTrackEvent_WaitSame",
+        "DseTrackEvent_WaitDelta",
+        "DseTrackEvent_Wait8",
+        "DseTrackEvent_Wait16",
+        "DseTrackEvent_Wait24",
+        "DseTrackEvent_WaitUntilFadeout",
+        "DseTrackEvent_EndTrack",
+        "DseTrackEvent_MainLoopBegin",
+        "DseTrackEvent_SubLoopBegin",
+        "DseTrackEvent_SubLoopEnd",
+        "DseTrackEvent_SubLoopBreakOnLastIteration",
+        "DseTrackEvent_SetOctave",
+        "DseTrackEvent_OctaveDelta",
+        "DseTrackEvent_SetBpm",
+        "DseTrackEvent_SetBpm2",
+        "DseTrackEvent_SetBank",
+        "DseTrackEvent_SetBankMsb",
+        "DseTrackEvent_SetBankLsb",
+        "DseTrackEvent_Dummy1Byte",
+        "DseTrackEvent_SetInstrument",
+        "DseTrackEvent_SongVolumeFade",
+        "DseTrackEvent_RestoreEnvelopeDefaults",
+        "DseTrackEvent_SetEnvelopeAttackBegin",
+        "DseTrackEvent_SetEnvelopeAttackTime",
+        "DseTrackEvent_SetEnvelopeHoldTime",
+        "DseTrackEvent_SetEnvelopeDecayTimeAndSustainLevel",
+        "DseTrackEvent_SetEnvelopeSustainTime",
+        "DseTrackEvent_SetEnvelopeReleaseTime",
+        "DseTrackEvent_SetNoteDurationMultiplier",
+        "DseTrackEvent_ForceLfoEnvelopeLevel",
+        "DseTrackEvent_SetHoldNotes",
+        "DseTrackEvent_SetFlagBit1Unknown",
+        "DseTrackEvent_SetOptionalVolume",
+        "DseTrackEvent_Dummy2Bytes",
+        "DseTrackEvent_SetTuning",
+        "DseTrackEvent_TuningDeltaCoarse",
+        "DseTrackEvent_TuningDeltaFine",
+        "DseTrackEvent_TuningDeltaFull",
+        "DseTrackEvent_TuningFade",
+        "DseTrackEvent_SetNoteRandomRegion",
+        "DseTrackEvent_SetTuningJitterAmplitude",
+        "DseTrackEvent_SetKeyBend",
+        "DseTrackEvent_SetUnknown2",
+        "DseTrackEvent_SetKeyBendRange",
+        "DseTrackEvent_SetupKeyBendLfo",
+        "DseTrackEvent_SetupKeyBendLfoEnvelope",
+        "DseTrackEvent_UseKeyBendLfo",
+        "DseTrackEvent_SetVolume",
+        "DseTrackEvent_VolumeDelta",
+        "DseTrackEvent_VolumeFade",
+        "DseTrackEvent_SetExpression",
+        "DseTrackEvent_SetupVolumeLfo",
+        "DseTrackEvent_SetupVolumeLfoEnvelope",
+        "DseTrackEvent_UseVolumeLfo",
+        "DseTrackEvent_SetPan",
+        "DseTrackEvent_PanDelta",
+        "DseTrackEvent_PanFade",
+        "DseTrackEvent_SetupPanLfo",
+        "DseTrackEvent_SetupPanLfoEnvelope",
+        "DseTrackEvent_UsePanLfo",
+        "DseTrackEvent_SetupLfo",
+        "DseTrackEvent_SetupLfoEnvelope",
+        "DseTrackEvent_SetLfoParameter",
+        "DseTrackEvent_UseLfo",
+        "DseTrackEvent_Signal",
+        "DseTrackEvent_Dummy2Bytes2",
+        "DseSynth_Reset",
+        "DseSynth_AllocateNew",
+        "DseSynth_Unload",
+        "DseSynth_ClearHeldNotes",
+        "DseSynth_ResetAndSetBankAndSequence",
+        "DseSynth_StopChannels",
+        "DseSynth_ResetAllVoiceTimersAndVolumes",
+        "DseSynth_RestoreHeldNotes",
+        "DseSynth_SetGlobalVolumeIndex",
+        "DseSynth_SetBend",
+        "DseSynth_SetVolume",
+        "DseSynth_SetPan",
+        "DseSynth_SetBankAndSequence",
+        "DseChannel_Init",
+        "DseChannel_DeallocateVoices",
+        "DseChannel_ResetTimerAndVolumeForVoices",
+        "DseChannel_SetBank",
+        "DseChannel_SetInstrument",
+        "DseChannel_SetLfoConstEnvelopeLevel",
+        "DseChannel_SetKeyBend",
+        "DseChannel_AllocateNote",
+        "DseChannel_ReleaseNoteInternal",
+        "DseChannel_ChangeNote",
+        "DseChannel_ReleaseNote",
+        "DseVoice_PlayNote",
+        "DseVoice_ReleaseNote",
+        "DseVoice_UpdateParameters",
+        "DseVoice_ResetAll",
+        "DseVoice_ResetHW",
+        "UpdateChannels",
+        "DseVoice_Cleanup",
+        "DseVoice_Allocate",
+        "DseVoice_Start",
+        "DseVoice_ReleaseHeld",
+        "DseVoice_Release",
+        "DseVoice_Deallocate",
+        "DseVoice_FlagForActivation",
+        "DseVoice_FlagForDeactivation",
+        "DseVoice_CountNumActiveInChannel",
+        "DseVoice_UpdateHardware",
+        "SoundEnvelope_Reset",
+        "SoundEnvelopeParameters_Reset",
+        "SoundEnvelopeParameters_CheckValidity",
+        "SoundEnvelope_SetParameters",
+        "SoundEnvelope_SetSlide",
+        "UpdateTrackVolumeEnvelopes",
+        "SoundEnvelope_Release",
+        "SoundEnvelope_Stop",
+        "SoundEnvelope_ForceVolume",
+        "SoundEnvelope_Stop2",
+        "SoundEnvelope_Tick",
+        "SoundLfoBank_Reset",
+        "SoundLfoBank_Set",
+        "SoundLfoBank_SetConstEnvelopes",
+        "SoundLfoBank_Tick",
+        "SoundLfoWave_InvalidFunc",
+        "SoundLfoWave_HalfSquareFunc",
+        "SoundLfoWave_FullSquareFunc",
+        "SoundLfoWave_HalfTriangleFunc",
+        "SoundLfoWave_FullTriangleFunc",
+        "SoundLfoWave_SawFunc",
+        "SoundLfoWave_ReverseSawFunc",
+        "SoundLfoWave_HalfNoiseFunc",
+        "SoundLfoWave_FullNoiseFunc",
+        "Crypto_RC4Init",
+        "Mtx_LookAt",
+        "Mtx_OrthoW",
+        "FX_Div",
+        "FX_GetDivResultFx64c",
+        "FX_GetDivResult",
+        "FX_InvAsync",
+        "FX_DivAsync",
+        "FX_DivS32",
+        "FX_ModS32",
+        "Vec_DotProduct",
+        "Vec_CrossProduct",
+        "Vec_Normalize",
+        "Vec_Distance",
+        "FX_Atan2Idx",
+        "GX_Init",
+        "GX_HBlankIntr",
+        "GX_VBlankIntr",
+        "GX_DispOff",
+        "GX_DispOn",
+        "GX_SetGraphicsMode",
+        "Gxs_SetGraphicsMode",
+        "GXx_SetMasterBrightness",
+        "GX_InitGxState",
+        "EnableVramBanksInSetDontSave",
+        "GX_SetBankForBg",
+        "GX_SetBankForObj",
+        "GX_SetBankForBgExtPltt",
+        "GX_SetBankForObjExtPltt",
+        "GX_SetBankForTex",
+        "GX_SetBankForTexPltt",
+        "GX_SetBankForClearImage",
+        "GX_SetBankForArm7",
+        "GX_SetBankForLcdc",
+        "GX_SetBankForSubBg",
+        "GX_SetBankForSubObj",
+        "GX_SetBankForSubBgExtPltt",
+        "GX_SetBankForSubObjExtPltt",
+        "EnableVramBanksInSet",
+        "GX_ResetBankForBgExtPltt",
+        "GX_ResetBankForObjExtPltt",
+        "GX_ResetBankForTex",
+        "GX_ResetBankForTexPltt",
+        "GX_ResetBankForSubBgExtPltt",
+        "GX_ResetBankForSubObjExtPltt",
+        "DisableBankForX",
+        "GX_DisableBankForBg",
+        "GX_DisableBankForObj",
+        "GX_DisableBankForBgExtPltt",
+        "GX_DisableBankForObjExtPltt",
+        "GX_DisableBankForTex",
+        "GX_DisableBankForTexPltt",
+        "GX_DisableBankForClearImage",
+        "GX_DisableBankForArm7",
+        "GX_DisableBankForLcdc",
+        "GX_DisableBankForSubBg",
+        "GX_DisableBankForSubObj",
+        "GX_DisableBankForSubBgExtPltt",
+        "GX_DisableBankForSubObjExtPltt",
+        "G2_GetBG0ScrPtr",
+        "G2S_GetBG0ScrPtr",
+        "G2_GetBG1ScrPtr",
+        "G2S_GetBG1ScrPtr",
+        "G2_GetBG2ScrPtr",
+        "G2_GetBG3ScrPtr",
+        "G2_GetBG0CharPtr",
+        "G2S_GetBG0CharPtr",
+        "G2_GetBG1CharPtr",
+        "G2S_GetBG1CharPtr",
+        "G2_GetBG2CharPtr",
+        "G2_GetBG3CharPtr",
+        "G2x_SetBlendAlpha",
+        "G2x_SetBlendBrightness",
+        "G2x_ChangeBlendBrightness",
+        "G3_LoadMtx44",
+        "G3_LoadMtx43",
+        "G3_MultMtx43",
+        "G3X_Init",
+        "G3X_Reset",
+        "G3X_ClearFifo",
+        "G3X_InitMtxStack",
+        "G3X_ResetMtxStack",
+        "G3X_SetClearColor",
+        "G3X_InitTable",
+        "G3X_GetMtxStackLevelPV",
+        "G3X_GetMtxStackLevelPJ",
+        "GXi_NopClearFifo128",
+        "G3i_OrthoW",
+        "G3i_LookAt",
+        "GX_LoadBgPltt",
+        "Gxs_LoadBgPltt",
+        "GX_LoadObjPltt",
+        "Gxs_LoadObjPltt",
+        "GX_LoadOam",
+        "Gxs_LoadOam",
+        "GX_LoadObj",
+        "Gxs_LoadObj",
+        "GX_LoadBg0Scr",
+        "GX_LoadBg1Scr",
+        "Gxs_LoadBg1Scr",
+        "GX_LoadBg2Scr",
+        "GX_LoadBg3Scr",
+        "GX_LoadBg0Char",
+        "Gxs_LoadBg0Char",
+        "GX_LoadBg1Char",
+        "Gxs_LoadBg1Char",
+        "GX_LoadBg2Char",
+        "GX_LoadBg3Char",
+        "GX_BeginLoadBgExtPltt",
+        "GX_EndLoadBgExtPltt",
+        "GX_BeginLoadObjExtPltt",
+        "GX_EndLoadObjExtPltt",
+        "Gxs_BeginLoadBgExtPltt",
+        "Gxs_EndLoadBgExtPltt",
+        "Gxs_BeginLoadObjExtPltt",
+        "Gxs_EndLoadObjExtPltt",
+        "GX_BeginLoadTex",
+        "GX_LoadTex",
+        "GX_EndLoadTex",
+        "GX_BeginLoadTexPltt",
+        "GX_LoadTexPltt",
+        "GX_EndLoadTexPltt",
+        "GeomGxFifoSendMtx4x3",
+        "GX_SendFifo64B",
+        "OS_GetLockID",
+        "IncrementThreadCount",
+        "InsertThreadIntoList",
+        "StartThread",
+        "ThreadExit",
+        "SetThreadField0xB4",
+        "InitThread",
+        "GetTimer0Control",
+        "ClearIrqFlag",
+        "EnableIrqFlag",
+        "SetIrqFlag",
+        "EnableIrqFiqFlags",
+        "SetIrqFiqFlags",
+        "GetIrqFlag",
+        "GetProcessorMode",
+        "GetDsFirmwareUserSettings",
+        "CountLeadingZeros",
+        "WaitForever2",
+        "WaitForInterrupt",
+        "ArrayFill16",
+        "ArrayCopy16",
+        "ArrayFill32",
+        "ArrayCopy32",
+        "ArrayFill32Fast",
+        "ArrayCopy32Fast",
+        "MemsetFast",
+        "MemcpyFast",
+        "AtomicExchange",
+        "FileInit",
+        "GetOverlayInfo",
+        "LoadOverlayInternal",
+        "InitOverlay",
+        "abs",
+        "mbtowc",
+        "TryAssignByte",
+        "TryAssignByteWrapper",
+        "wcstombs",
+        "memcpy",
+        "memmove",
+        "memset",
+        "memchr",
+        "memcmp",
+        "memset_internal",
+        "__vsprintf_internal_slice",
+        "TryAppendToSlice",
+        "__vsprintf_internal",
+        "vsprintf",
+        "snprintf",
+        "sprintf",
+        "strlen",
+        "strcpy",
+        "strncpy",
+        "strcat",
+        "strncat",
+        "strcmp",
+        "strncmp",
+        "strchr",
+        "strcspn",
+        "strstr",
+        "wcslen",
+        "_dadd",
+        "_d2f",
+        "_ll_ufrom_d",
+        "_dflt",
+        "_dfltu",
+        "_dmul",
+        "_dsqrt",
+        "_dsub",
+        "_fadd",
+        "_dgeq",
+        "_dleq",
+        "_dls",
+        "_deq",
+        "_dneq",
+        "_fls",
+        "_fdiv",
+        "_f2d",
+        "_ffix",
+        "_fflt",
+        "_ffltu",
+        "_fmul",
+        "sqrtf",
+        "_fsub",
+        "_ll_mod",
+        "_ll_sdiv",
+        "_ll_udiv",
+        "_ull_mod",
+        "_ll_mul",
+        "_s32_div_f",
+        "_u32_div_f",
+        "_u32_div_not_0_f",
+        "_drdiv",
+        "_ddiv",
+        "_fp_init",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xE8,
+            0x180,
+            0x264,
+            0x308,
+            0x77C,
+            0x7B0,
+            0x7EC,
+            0x81C,
+            0x844,
+            0x8B4,
+            0x8D0,
+            0x8E4,
+            0x9F4,
+            0xB3C,
+            0xBE4,
+            0xC44,
+            0xCC4,
+            0xD50,
+            0xD90,
+            0xDF0,
+            0xDF8,
+            0x1030,
+            0x1234,
+            0x1250,
+            0x1300,
+            0x140C,
+            0x1480,
+            0x14B8,
+            0x14F0,
+            0x1578,
+            0x15C8,
+            0x1618,
+            0x1628,
+            0x1654,
+            0x1664,
+            0x1728,
+            0x1730,
+            0x1834,
+            0x186C,
+            0x18CC,
+            0x18E4,
+            0x19C4,
+            0x1A04,
+            0x1A64,
+            0x1AA4,
+            0x1B34,
+            0x1C98,
+            0x1F8C,
+            0x2140,
+            0x2194,
+            0x22EC,
+            0x2410,
+            0x247C,
+            0x257C,
+            0x25C8,
+            0x2700,
+            0x2784,
+            0x27D4,
+            0x2848,
+            0x2940,
+            0x2AF4,
+            0x2B84,
+            0x2C58,
+            0x2D24,
+            0x2ED8,
+            0x2F20,
+            0x3028,
+            0x31EC,
+            0x3268,
+            0x32B4,
+            0x3408,
+            0x3474,
+            0x459C,
+            0x4D34,
+            0x4E04,
+            0x4EFC,
+            0x4F3C,
+            0x5088,
+            0x514C,
+            0x5310,
+            0x56AC,
+            0x5844,
+            0x5850,
+            0x585C,
+            0x5874,
+            0x5884,
+            0x58A0,
+            0x58C4,
+            0x58F0,
+            0x593C,
+            0x5944,
+            0x5984,
+            0x59C0,
+            0x59E8,
+            0x59F4,
+            0x5A08,
+            0x5A48,
+            0x5A88,
+            0x5AB4,
+            0x5AE4,
+            0x5B14,
+            0x5B1C,
+            0x5B64,
+            0x5BF0,
+            0x5C08,
+            0x5C28,
+            0x5C48,
+            0x5C68,
+            0x5C98,
+            0x5CB8,
+            0x5CD8,
+            0x5CE4,
+            0x5D00,
+            0x5D38,
+            0x5D48,
+            0x5D54,
+            0x5D5C,
+            0x5DDC,
+            0x5E64,
+            0x5EEC,
+            0x5F7C,
+            0x606C,
+            0x6094,
+            0x60AC,
+            0x60D8,
+            0x60F0,
+            0x60FC,
+            0x6154,
+            0x617C,
+            0x61A4,
+            0x6238,
+            0x62E8,
+            0x6344,
+            0x63D0,
+            0x642C,
+            0x6454,
+            0x647C,
+            0x64FC,
+            0x6590,
+            0x65EC,
+            0x6648,
+            0x6670,
+            0x6698,
+            0x66F0,
+            0x6724,
+            0x6860,
+            0x6894,
+            0x68C4,
+            0x7130,
+            0x71A8,
+            0x7278,
+            0x72E4,
+            0x7380,
+            0x73A8,
+            0x73D4,
+            0x742C,
+            0x7494,
+            0x757C,
+            0x7610,
+            0x76E0,
+            0x7774,
+            0x7804,
+            0x79B8,
+            0x7A3C,
+            0x7AB8,
+            0x7AF0,
+            0x7B84,
+            0x7BB8,
+            0x7C00,
+            0x7C90,
+            0x7D38,
+            0x7DC8,
+            0x7E04,
+            0x8078,
+            0x80BC,
+            0x8260,
+            0x8304,
+            0x83B4,
+            0x84A4,
+            0x8540,
+            0x86A8,
+            0x8704,
+            0x8784,
+            0x87C8,
+            0x88CC,
+            0x891C,
+            0x8954,
+            0x8980,
+            0x8B98,
+            0x8BAC,
+            0x8BC8,
+            0x8C1C,
+            0x8C80,
+            0x8D34,
+            0x8E00,
+            0x8E2C,
+            0x8E44,
+            0x8E64,
+            0x8E7C,
+            0x8FC4,
+            0x8FDC,
+            0x91D4,
+            0x9220,
+            0x92D4,
+            0x92E8,
+            0x9324,
+            0x936C,
+            0x93C0,
+            0x9424,
+            0x9460,
+            0x949C,
+            0x94E0,
+            0x9648,
+            0x9750,
+            0x9858,
+            0x9A60,
+            0x9A70,
+            0x9A94,
+            0x9ACC,
+            0x9AFC,
+            0x9B24,
+            0x9B60,
+            0x9B9C,
+            0x9BD8,
+            0x9C5C,
+            0x9D74,
+            0x9DF0,
+            0x9F9C,
+            0xA0E8,
+            0xA110,
+            0xA144,
+            0xA180,
+            0xA1C8,
+            0xA230,
+            0xA24C,
+            0xA274,
+            0xA2D4,
+            0xA38C,
+            0xA61C,
+            0xA76C,
+            0xA86C,
+            0xA918,
+            0xAAF0,
+            0xABD8,
+            0xAD0C,
+            0xADB8,
+            0xADD8,
+            0xAE80,
+            0xAEF0,
+            0xAF70,
+            0xAFF0,
+            0xB024,
+            0xB048,
+            0xB06C,
+            0xB080,
+            0xB094,
+            0xB0BC,
+            0xB0E4,
+            0xB1C4,
+            0xB1D8,
+            0xB1EC,
+            0xB210,
+            0xB234,
+            0xB248,
+            0xB25C,
+            0xB270,
+            0xB284,
+            0xB298,
+            0xB2AC,
+            0xB2C0,
+            0xB2E8,
+            0xB310,
+            0xB344,
+            0xB364,
+            0xB398,
+            0xB3B8,
+            0xB43C,
+            0xB4C0,
+            0xB4F4,
+            0xB514,
+            0xB548,
+            0xB568,
+            0xB5B8,
+            0xB610,
+            0xB62C,
+            0xB654,
+            0xB698,
+            0xB6B4,
+            0xB6D0,
+            0xB6EC,
+            0xB7F8,
+            0xB864,
+            0xB88C,
+            0xB924,
+            0xB9B4,
+            0xB9DC,
+            0xBA7C,
+            0xBAAC,
+            0xBADC,
+            0xBB70,
+            0xBBD4,
+            0xBC20,
+            0xBC74,
+            0xBCCC,
+            0xBD24,
+            0xBD7C,
+            0xBDD0,
+            0xBE28,
+            0xBE80,
+            0xBED8,
+            0xBF38,
+            0xBF98,
+            0xBFF8,
+            0xC058,
+            0xC0B8,
+            0xC118,
+            0xC178,
+            0xC1D8,
+            0xC238,
+            0xC298,
+            0xC2F8,
+            0xC398,
+            0xC3E0,
+            0xC428,
+            0xC46C,
+            0xC484,
+            0xC4C4,
+            0xC4DC,
+            0xC51C,
+            0xC578,
+            0xC6B8,
+            0xC704,
+            0xC738,
+            0xC7A4,
+            0xC7E8,
+            0xC80C,
+            0xCF54,
+            0xD078,
+            0xD1C0,
+            0xD488,
+            0xD584,
+            0xDBA4,
+            0xDBAC,
+            0xEE0C,
+            0xF6F8,
+            0xF70C,
+            0xF720,
+            0xF738,
+            0xF74C,
+            0xF764,
+            0xF770,
+            0xF930,
+            0xF9B4,
+            0xFB48,
+            0xFB58,
+            0x101E0,
+            0x10208,
+            0x1023C,
+            0x10258,
+            0x10280,
+            0x102DC,
+            0x10334,
+            0x103F0,
+            0x10570,
+            0x1330C,
+            0x13BC4,
+            0x13CC0,
+            0x13DE4,
+            0x1A484,
+            0x1B0E4,
+            0x1B11C,
+            0x1B130,
+            0x1B14C,
+            0x1B1C4,
+            0x1B1E4,
+            0x1B230,
+            0x1B244,
+            0x1B270,
+            0x1B2B0,
+            0x1CB9C,
+            0x1D3C0,
+            0x1D404,
+            0x1D46C,
+            0x1D484,
+            0x1D4AC,
+            0x1D5A0,
+            0x1D5BC,
+            0x1D684,
+            0x1D6D4,
+            0x1D704,
+            0x1D754,
+            0x1D868,
+            0x1D89C,
+            0x1D8D8,
+            0x1D998,
+            0x1F310,
+            0x21DF0,
+            0x22108,
+            0x2220C,
+            0x22298,
+            0x222D8,
+            0x22314,
+            0x22678,
+            0x2282C,
+            0x22BE0,
+            0x22E04,
+            0x22E9C,
+            0x22F40,
+            0x22FDC,
+            0x23068,
+            0x230F4,
+            0x2315C,
+            0x23514,
+            0x23598,
+            0x235CC,
+            0x23614,
+            0x2365C,
+            0x2383C,
+            0x2392C,
+            0x23BA4,
+            0x23BB4,
+            0x23D64,
+            0x23D70,
+            0x23DAC,
+            0x23DCC,
+            0x23FD8,
+            0x23FE0,
+            0x241BC,
+            0x241D4,
+            0x24718,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x206C4A8,
+            0x206C540,
+            0x206C624,
+            0x206C6C8,
+            0x206CB3C,
+            0x206CB70,
+            0x206CBAC,
+            0x206CBDC,
+            0x206CC04,
+            0x206CC74,
+            0x206CC90,
+            0x206CCA4,
+            0x206CDB4,
+            0x206CEFC,
+            0x206CFA4,
+            0x206D004,
+            0x206D084,
+            0x206D110,
+            0x206D150,
+            0x206D1B0,
+            0x206D1B8,
+            0x206D3F0,
+            0x206D5F4,
+            0x206D610,
+            0x206D6C0,
+            0x206D7CC,
+            0x206D840,
+            0x206D878,
+            0x206D8B0,
+            0x206D938,
+            0x206D988,
+            0x206D9D8,
+            0x206D9E8,
+            0x206DA14,
+            0x206DA24,
+            0x206DAE8,
+            0x206DAF0,
+            0x206DBF4,
+            0x206DC2C,
+            0x206DC8C,
+            0x206DCA4,
+            0x206DD84,
+            0x206DDC4,
+            0x206DE24,
+            0x206DE64,
+            0x206DEF4,
+            0x206E058,
+            0x206E34C,
+            0x206E500,
+            0x206E554,
+            0x206E6AC,
+            0x206E7D0,
+            0x206E83C,
+            0x206E93C,
+            0x206E988,
+            0x206EAC0,
+            0x206EB44,
+            0x206EB94,
+            0x206EC08,
+            0x206ED00,
+            0x206EEB4,
+            0x206EF44,
+            0x206F018,
+            0x206F0E4,
+            0x206F298,
+            0x206F2E0,
+            0x206F3E8,
+            0x206F5AC,
+            0x206F628,
+            0x206F674,
+            0x206F7C8,
+            0x206F834,
+            0x207095C,
+            0x20710F4,
+            0x20711C4,
+            0x20712BC,
+            0x20712FC,
+            0x2071448,
+            0x207150C,
+            0x20716D0,
+            0x2071A6C,
+            0x2071C04,
+            0x2071C10,
+            0x2071C1C,
+            0x2071C34,
+            0x2071C44,
+            0x2071C60,
+            0x2071C84,
+            0x2071CB0,
+            0x2071CFC,
+            0x2071D04,
+            0x2071D44,
+            0x2071D80,
+            0x2071DA8,
+            0x2071DB4,
+            0x2071DC8,
+            0x2071E08,
+            0x2071E48,
+            0x2071E74,
+            0x2071EA4,
+            0x2071ED4,
+            0x2071EDC,
+            0x2071F24,
+            0x2071FB0,
+            0x2071FC8,
+            0x2071FE8,
+            0x2072008,
+            0x2072028,
+            0x2072058,
+            0x2072078,
+            0x2072098,
+            0x20720A4,
+            0x20720C0,
+            0x20720F8,
+            0x2072108,
+            0x2072114,
+            0x207211C,
+            0x207219C,
+            0x2072224,
+            0x20722AC,
+            0x207233C,
+            0x207242C,
+            0x2072454,
+            0x207246C,
+            0x2072498,
+            0x20724B0,
+            0x20724BC,
+            0x2072514,
+            0x207253C,
+            0x2072564,
+            0x20725F8,
+            0x20726A8,
+            0x2072704,
+            0x2072790,
+            0x20727EC,
+            0x2072814,
+            0x207283C,
+            0x20728BC,
+            0x2072950,
+            0x20729AC,
+            0x2072A08,
+            0x2072A30,
+            0x2072A58,
+            0x2072AB0,
+            0x2072AE4,
+            0x2072C20,
+            0x2072C54,
+            0x2072C84,
+            0x20734F0,
+            0x2073568,
+            0x2073638,
+            0x20736A4,
+            0x2073740,
+            0x2073768,
+            0x2073794,
+            0x20737EC,
+            0x2073854,
+            0x207393C,
+            0x20739D0,
+            0x2073AA0,
+            0x2073B34,
+            0x2073BC4,
+            0x2073D78,
+            0x2073DFC,
+            0x2073E78,
+            0x2073EB0,
+            0x2073F44,
+            0x2073F78,
+            0x2073FC0,
+            0x2074050,
+            0x20740F8,
+            0x2074188,
+            0x20741C4,
+            0x2074438,
+            0x207447C,
+            0x2074620,
+            0x20746C4,
+            0x2074774,
+            0x2074864,
+            0x2074900,
+            0x2074A68,
+            0x2074AC4,
+            0x2074B44,
+            0x2074B88,
+            0x2074C8C,
+            0x2074CDC,
+            0x2074D14,
+            0x2074D40,
+            0x2074F58,
+            0x2074F6C,
+            0x2074F88,
+            0x2074FDC,
+            0x2075040,
+            0x20750F4,
+            0x20751C0,
+            0x20751EC,
+            0x2075204,
+            0x2075224,
+            0x207523C,
+            0x2075384,
+            0x207539C,
+            0x2075594,
+            0x20755E0,
+            0x2075694,
+            0x20756A8,
+            0x20756E4,
+            0x207572C,
+            0x2075780,
+            0x20757E4,
+            0x2075820,
+            0x207585C,
+            0x20758A0,
+            0x2075A08,
+            0x2075B10,
+            0x2075C18,
+            0x2075E20,
+            0x2075E30,
+            0x2075E54,
+            0x2075E8C,
+            0x2075EBC,
+            0x2075EE4,
+            0x2075F20,
+            0x2075F5C,
+            0x2075F98,
+            0x207601C,
+            0x2076134,
+            0x20761B0,
+            0x207635C,
+            0x20764A8,
+            0x20764D0,
+            0x2076504,
+            0x2076540,
+            0x2076588,
+            0x20765F0,
+            0x207660C,
+            0x2076634,
+            0x2076694,
+            0x207674C,
+            0x20769DC,
+            0x2076B2C,
+            0x2076C2C,
+            0x2076CD8,
+            0x2076EB0,
+            0x2076F98,
+            0x20770CC,
+            0x2077178,
+            0x2077198,
+            0x2077240,
+            0x20772B0,
+            0x2077330,
+            0x20773B0,
+            0x20773E4,
+            0x2077408,
+            0x207742C,
+            0x2077440,
+            0x2077454,
+            0x207747C,
+            0x20774A4,
+            0x2077584,
+            0x2077598,
+            0x20775AC,
+            0x20775D0,
+            0x20775F4,
+            0x2077608,
+            0x207761C,
+            0x2077630,
+            0x2077644,
+            0x2077658,
+            0x207766C,
+            0x2077680,
+            0x20776A8,
+            0x20776D0,
+            0x2077704,
+            0x2077724,
+            0x2077758,
+            0x2077778,
+            0x20777FC,
+            0x2077880,
+            0x20778B4,
+            0x20778D4,
+            0x2077908,
+            0x2077928,
+            0x2077978,
+            0x20779D0,
+            0x20779EC,
+            0x2077A14,
+            0x2077A58,
+            0x2077A74,
+            0x2077A90,
+            0x2077AAC,
+            0x2077BB8,
+            0x2077C24,
+            0x2077C4C,
+            0x2077CE4,
+            0x2077D74,
+            0x2077D9C,
+            0x2077E3C,
+            0x2077E6C,
+            0x2077E9C,
+            0x2077F30,
+            0x2077F94,
+            0x2077FE0,
+            0x2078034,
+            0x207808C,
+            0x20780E4,
+            0x207813C,
+            0x2078190,
+            0x20781E8,
+            0x2078240,
+            0x2078298,
+            0x20782F8,
+            0x2078358,
+            0x20783B8,
+            0x2078418,
+            0x2078478,
+            0x20784D8,
+            0x2078538,
+            0x2078598,
+            0x20785F8,
+            0x2078658,
+            0x20786B8,
+            0x2078758,
+            0x20787A0,
+            0x20787E8,
+            0x207882C,
+            0x2078844,
+            0x2078884,
+            0x207889C,
+            0x20788DC,
+            0x2078938,
+            0x2078A78,
+            0x2078AC4,
+            0x2078AF8,
+            0x2078B64,
+            0x2078BA8,
+            0x2078BCC,
+            0x2079314,
+            0x2079438,
+            0x2079580,
+            0x2079848,
+            0x2079944,
+            0x2079F64,
+            0x2079F6C,
+            0x207B1CC,
+            0x207BAB8,
+            0x207BACC,
+            0x207BAE0,
+            0x207BAF8,
+            0x207BB0C,
+            0x207BB24,
+            0x207BB30,
+            0x207BCF0,
+            0x207BD74,
+            0x207BF08,
+            0x207BF18,
+            0x207C5A0,
+            0x207C5C8,
+            0x207C5FC,
+            0x207C618,
+            0x207C640,
+            0x207C69C,
+            0x207C6F4,
+            0x207C7B0,
+            0x207C930,
+            0x207F6CC,
+            0x207FF84,
+            0x2080080,
+            0x20801A4,
+            0x2086844,
+            0x20874A4,
+            0x20874DC,
+            0x20874F0,
+            0x208750C,
+            0x2087584,
+            0x20875A4,
+            0x20875F0,
+            0x2087604,
+            0x2087630,
+            0x2087670,
+            0x2088F5C,
+            0x2089780,
+            0x20897C4,
+            0x208982C,
+            0x2089844,
+            0x208986C,
+            0x2089960,
+            0x208997C,
+            0x2089A44,
+            0x2089A94,
+            0x2089AC4,
+            0x2089B14,
+            0x2089C28,
+            0x2089C5C,
+            0x2089C98,
+            0x2089D58,
+            0x208B6D0,
+            0x208E1B0,
+            0x208E4C8,
+            0x208E5CC,
+            0x208E658,
+            0x208E698,
+            0x208E6D4,
+            0x208EA38,
+            0x208EBEC,
+            0x208EFA0,
+            0x208F1C4,
+            0x208F25C,
+            0x208F300,
+            0x208F39C,
+            0x208F428,
+            0x208F4B4,
+            0x208F51C,
+            0x208F8D4,
+            0x208F958,
+            0x208F98C,
+            0x208F9D4,
+            0x208FA1C,
+            0x208FBFC,
+            0x208FCEC,
+            0x208FF64,
+            0x208FF74,
+            0x2090124,
+            0x2090130,
+            0x209016C,
+            0x209018C,
+            0x2090398,
+            0x20903A0,
+            0x209057C,
+            0x2090594,
+            0x2090AD8,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1,
+            1093,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1094,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1095,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            330,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1096,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            266,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1097,
+            1098,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1099,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1100,
+            1101,
+            1101,
+            1102,
+            1103,
+            1104,
+            1100,
+            1100,
+            1105,
+            1100,
+            1106,
+            1107,
+            1108,
+            1109,
+            1110,
+            1111,
+            1112,
+            1112,
+            1112,
+            1112,
+            1112,
+            1112,
+            1112,
+            1112,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1113,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1114,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1115,
+            1116,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1117,
+            1,
+            1,
+            1118,
+            1119,
+            1120,
+            1121,
+            1122,
+            1123,
+            1124,
+            1125,
+            1126,
+            1127,
+            1128,
+            1129,
+            1130,
+            1131,
+            1132,
+            1133,
+            1134,
+            1135,
+            1136,
+            1137,
+            1138,
+            1139,
+            1140,
+            1141,
+            1142,
+            1143,
+            1144,
+            1145,
+            1146,
+            1147,
+            1148,
+            1149,
+            1150,
+            1151,
+            1152,
+            1153,
+            1154,
+            1155,
+            1156,
+            1157,
+            1158,
+            1159,
+            1160,
+            1161,
+            1162,
+            1163,
+            1164,
+            1165,
+            1166,
+            1167,
+            1168,
+            1169,
+            1170,
+            1171,
+            1172,
+            1173,
+            1174,
+            1175,
+            1176,
+            1177,
+            1178,
+            1179,
+            1180,
+            1181,
+            1182,
+            1183,
+            1184,
+            1185,
+            1186,
+            1187,
+            1188,
+            1189,
+            1190,
+            1191,
+            1192,
+            1193,
+            1194,
+            1195,
+            1196,
+            1197,
+            1198,
+            1199,
+            1200,
+            1201,
+            1202,
+            1203,
+            1204,
+            1205,
+            1206,
+            1207,
+            1208,
+            1209,
+            1210,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
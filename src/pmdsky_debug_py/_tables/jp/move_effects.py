@@ -0,0 +1,1663 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the move_effects section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "DoMoveDamage",
+        "DoMoveIronTail",
+        "DoMoveDamageMultihitUntilMiss",
+        "DoMoveYawn",
+        "DoMoveSleep",
+        "DoMoveNightmare",
+        "DoMoveMorningSun",
+        "DoMoveVitalThrow",
+        "DoMoveDig",
+        "DoMoveSweetScent",
+        "DoMoveCharm",
+        "DoMoveRainDance",
+        "DoMoveHail",
+        "DoMoveHealStatus",
+        "DoMoveBubble",
+        "DoMoveEncore",
+        "DoMoveRage",
+        "DoMoveSuperFang",
+        "DoMovePainSplit",
+        "DoMoveTorment",
+        "DoMoveStringShot",
+        "DoMoveSwagger",
+        "DoMoveSnore",
+        "DoMoveScreech",
+        "DoMoveDamageCringe30",
+        "DoMoveWeatherBall",
+        "DoMoveWhirlpool",
+        "DoMoveFakeTears",
+        "DoMoveSpite",
+        "DoMoveFocusEnergy",
+        "DoMoveSmokescreen",
+        "DoMoveMirrorMove",
+        "DoMoveOverheat",
+        "DoMoveAuroraBeam",
+        "DoMoveMemento",
+        "DoMoveOctazooka",
+        "DoMoveFlatter",
+        "DoMoveWillOWisp",
+        "DoMoveReturn",
+        "DoMoveGrudge",
+        "DoMoveCounter",
+        "DoMoveDamageBurn10FlameWheel",
+        "DoMoveDamageBurn10",
+        "DoMoveExpose",
+        "DoMoveDoubleTeam",
+        "DoMoveGust",
+        "DoMoveBoostDefense1",
+        "DoMoveParalyze",
+        "DoMoveBoostAttack1",
+        "DoMoveRazorWind",
+        "DoMoveBide",
+        "DoMoveBideUnleash",
+        "DoMoveCrunch",
+        "DoMoveDamageCringe20",
+        "DoMoveDamageParalyze20",
+        "DoMoveEndeavor",
+        "DoMoveFacade",
+        "DoMoveDamageLowerSpeed20",
+        "DoMoveBrickBreak",
+        "DoMoveDamageLowerSpeed100",
+        "DoMoveFocusPunch",
+        "DoMoveDamageDrain",
+        "DoMoveReversal",
+        "DoMoveSmellingSalt",
+        "DoMoveMetalSound",
+        "DoMoveTickle",
+        "DoMoveShadowHold",
+        "DoMoveHaze",
+        "DoMoveDamageMultihitFatigue",
+        "DoMoveDamageWeightDependent",
+        "DoMoveDamageBoostAllStats",
+        "DoMoveSynthesis",
+        "DoMoveBoostSpeed1",
+        "DoMoveRapidSpin",
+        "DoMoveSureShot",
+        "DoMoveCosmicPower",
+        "DoMoveSkyAttack",
+        "DoMoveDamageFreeze15",
+        "DoMoveMeteorMash",
+        "DoMoveEndure",
+        "DoMoveLowerSpeed1",
+        "DoMoveDamageConfuse10",
+        "DoMovePsywave",
+        "DoMoveDamageLowerDefensiveStatVariable",
+        "DoMovePsychoBoost",
+        "DoMoveUproar",
+        "DoMoveWaterSpout",
+        "DoMovePsychUp",
+        "DoMoveDamageWithRecoil",
+        "EntityIsValidMoveEffects",
+        "DoMoveRecoverHp",
+        "DoMoveEarthquake",
+        "GetNaturePowerVariant",
+        "DoMoveNaturePower",
+        "DoMoveDamageParalyze10",
+        "DoMoveSelfdestruct",
+        "DoMoveShadowBall",
+        "DoMoveCharge",
+        "DoMoveThunderbolt",
+        "DoMoveMist",
+        "DoMoveFissure",
+        "DoMoveDamageCringe10",
+        "DoMoveSafeguard",
+        "DoMoveAbsorb",
+        "DefenderAbilityIsActiveMoveEffects",
+        "DoMoveSkillSwap",
+        "DoMoveSketch",
+        "DoMoveHeadbutt",
+        "DoMoveDoubleEdge",
+        "DoMoveSandstorm",
+        "DoMoveLowerAccuracy1",
+        "DoMoveDamagePoison40",
+        "DoMoveGrowth",
+        "DoMoveSacredFire",
+        "DoMoveOhko",
+        "DoMoveSolarBeam",
+        "DoMoveSonicBoom",
+        "DoMoveFly",
+        "DoMoveExplosion",
+        "DoMoveDive",
+        "DoMoveWaterfall",
+        "DoMoveDamageLowerAccuracy40",
+        "DoMoveStockpile",
+        "DoMoveTwister",
+        "DoMoveTwineedle",
+        "DoMoveRecoverHpTeam",
+        "DoMoveMinimize",
+        "DoMoveSeismicToss",
+        "DoMoveConfuse",
+        "DoMoveTaunt",
+        "DoMoveMoonlight",
+        "DoMoveHornDrill",
+        "DoMoveSwordsDance",
+        "DoMoveConversion",
+        "DoMoveConversion2",
+        "DoMoveHelpingHand",
+        "DoMoveBoostDefense2",
+        "DoMoveWarp",
+        "DoMoveThundershock",
+        "DoMoveThunderWave",
+        "DoMoveZapCannon",
+        "DoMoveBlock",
+        "DoMovePoison",
+        "DoMoveToxic",
+        "DoMovePoisonFang",
+        "DoMoveDamagePoison18",
+        "DoMoveJumpKick",
+        "DoMoveBounce",
+        "DoMoveHiJumpKick",
+        "DoMoveTriAttack",
+        "DoMoveSwapItems",
+        "DoMoveTripleKick",
+        "DoMoveSport",
+        "DoMoveMudSlap",
+        "DoMoveDamageStealItem",
+        "DoMoveAmnesia",
+        "DoMoveNightShade",
+        "DoMoveGrowl",
+        "DoMoveSurf",
+        "DoMoveRolePlay",
+        "DoMoveSunnyDay",
+        "DoMoveLowerDefense1",
+        "DoMoveWish",
+        "DoMoveFakeOut",
+        "DoMoveSleepTalk",
+        "DoMovePayDay",
+        "DoMoveAssist",
+        "DoMoveRest",
+        "DoMoveIngrain",
+        "DoMoveSwallow",
+        "DoMoveCurse",
+        "DoMoveSuperpower",
+        "DoMoveSteelWing",
+        "DoMoveSpitUp",
+        "DoMoveDynamicPunch",
+        "DoMoveKnockOff",
+        "DoMoveSplash",
+        "DoMoveSetDamage",
+        "DoMoveBellyDrum",
+        "DoMoveLightScreen",
+        "DoMoveSecretPower",
+        "DoMoveDamageConfuse30",
+        "DoMoveBulkUp",
+        "DoMovePause",
+        "DoMoveFeatherDance",
+        "DoMoveBeatUp",
+        "DoMoveBlastBurn",
+        "DoMoveCrushClaw",
+        "DoMoveBlazeKick",
+        "DoMovePresent",
+        "DoMoveEruption",
+        "DoMoveTransform",
+        "DoMovePoisonTail",
+        "DoMoveBlowback",
+        "DoMoveCamouflage",
+        "DoMoveTailGlow",
+        "DoMoveDamageConstrict10",
+        "DoMovePerishSong",
+        "DoMoveWrap",
+        "DoMoveSpikes",
+        "DoMoveMagnitude",
+        "DoMoveMagicCoat",
+        "DoMoveProtect",
+        "DoMoveDefenseCurl",
+        "DoMoveDecoy",
+        "DoMoveMistBall",
+        "DoMoveDestinyBond",
+        "DoMoveMirrorCoat",
+        "DoMoveCalmMind",
+        "DoMoveHiddenPower",
+        "DoMoveMetalClaw",
+        "DoMoveAttract",
+        "DoMoveCopycat",
+        "DoMoveFrustration",
+        "DoMoveLeechSeed",
+        "DoMoveMetronome",
+        "DoMoveDreamEater",
+        "DoMoveSnatch",
+        "DoMoveRecycle",
+        "DoMoveReflect",
+        "DoMoveDragonRage",
+        "DoMoveDragonDance",
+        "DoMoveSkullBash",
+        "DoMoveDamageLowerSpecialDefense50",
+        "DoMoveStruggle",
+        "DoMoveRockSmash",
+        "DoMoveSeeTrap",
+        "DoMoveTakeaway",
+        "DoMoveRebound",
+        "DoMoveSwitchPositions",
+        "DoMoveStayAway",
+        "DoMoveCleanse",
+        "DoMoveSiesta",
+        "DoMoveTwoEdge",
+        "DoMoveNoMove",
+        "DoMoveScan",
+        "DoMovePowerEars",
+        "DoMoveTransfer",
+        "DoMoveSlowDown",
+        "DoMoveSearchlight",
+        "DoMovePetrify",
+        "DoMovePounce",
+        "DoMoveTrawl",
+        "DoMoveEscape",
+        "DoMoveDrought",
+        "DoMoveTrapBuster",
+        "DoMoveWildCall",
+        "DoMoveInvisify",
+        "DoMoveOneShot",
+        "DoMoveHpGauge",
+        "DoMoveVacuumCut",
+        "DoMoveReviver",
+        "DoMoveShocker",
+        "DoMoveEcho",
+        "DoMoveFamish",
+        "DoMoveOneRoom",
+        "DoMoveFillIn",
+        "DoMoveTrapper",
+        "DoMoveItemize",
+        "DoMoveHurl",
+        "DoMoveMobile",
+        "DoMoveSeeStairs",
+        "DoMoveLongToss",
+        "DoMovePierce",
+        "DoMoveHammerArm",
+        "DoMoveAquaRing",
+        "DoMoveGastroAcid",
+        "DoMoveHealingWish",
+        "DoMoveCloseCombat",
+        "DoMoveLuckyChant",
+        "DoMoveGuardSwap",
+        "DoMoveHealOrder",
+        "DoMoveHealBlock",
+        "DoMoveThunderFang",
+        "DoMoveDefog",
+        "DoMoveTrumpCard",
+        "DoMoveIceFang",
+        "DoMovePsychoShift",
+        "DoMoveEmbargo",
+        "DoMoveBrine",
+        "DoMoveNaturalGift",
+        "DoMoveGyroBall",
+        "DoMoveShadowForce",
+        "DoMoveGravity",
+        "DoMoveStealthRock",
+        "DoMoveChargeBeam",
+        "DoMoveDamageEatItem",
+        "DoMoveAcupressure",
+        "DoMoveMagnetRise",
+        "DoMoveToxicSpikes",
+        "DoMoveLastResort",
+        "DoMoveTrickRoom",
+        "DoMoveWorrySeed",
+        "DoMoveDamageHpDependent",
+        "DoMoveHeartSwap",
+        "DoMoveRoost",
+        "DoMovePowerSwap",
+        "DoMovePowerTrick",
+        "DoMoveFeint",
+        "DoMoveFlareBlitz",
+        "DoMoveDefendOrder",
+        "DoMoveFireFang",
+        "DoMoveLunarDance",
+        "DoMoveMiracleEye",
+        "DoMoveWakeUpSlap",
+        "DoMoveMetalBurst",
+        "DoMoveHeadSmash",
+        "DoMoveCaptivate",
+        "DoMoveLeafStorm",
+        "DoMoveDracoMeteor",
+        "DoMoveRockPolish",
+        "DoMoveNastyPlot",
+        "DoMoveTag0x1AB",
+        "DoMoveTag0x1A6",
+        "DoMoveTag0x1A7",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0x24,
+            0xA4,
+            0x104,
+            0x140,
+            0x17C,
+            0x1B4,
+            0x1F4,
+            0x204,
+            0x2C8,
+            0x2E8,
+            0x310,
+            0x36C,
+            0x3C8,
+            0x3E0,
+            0x44C,
+            0x460,
+            0x4A4,
+            0x55C,
+            0x648,
+            0x790,
+            0x7A8,
+            0x7E4,
+            0x888,
+            0x8B0,
+            0x91C,
+            0x990,
+            0xA18,
+            0xA4C,
+            0xAF8,
+            0xB08,
+            0xB44,
+            0xB68,
+            0xBCC,
+            0xC48,
+            0xCB0,
+            0xD24,
+            0xD60,
+            0xDFC,
+            0xEE0,
+            0xEF0,
+            0xF04,
+            0xF8C,
+            0x1014,
+            0x1040,
+            0x105C,
+            0x109C,
+            0xFFFFFFFF,
+            0x10D4,
+            0x10F4,
+            0x1184,
+            0x11C8,
+            0x1270,
+            0x12F0,
+            0x135C,
+            0x13C8,
+            0x1488,
+            0x14C8,
+            0x1534,
+            0x15A4,
+            0x1608,
+            0x1694,
+            0x17D4,
+            0x1888,
+            0x18F0,
+            0x1924,
+            0x1980,
+            0x1994,
+            0x19A8,
+            0x19F4,
+            0x1A40,
+            0x1B24,
+            0x1B64,
+            0x1B7C,
+            0x1BE8,
+            0x1C20,
+            0x1C64,
+            0x1D30,
+            0x1D98,
+            0x1E1C,
+            0x1E2C,
+            0x1E44,
+            0x1EB0,
+            0x1F14,
+            0x1F9C,
+            0x200C,
+            0x201C,
+            0x20D0,
+            0x2170,
+            0xFFFFFFFF,
+            0x226C,
+            0x22B0,
+            0x2310,
+            0x234C,
+            0x23A8,
+            0x2414,
+            0x2484,
+            0x2504,
+            0x2564,
+            0x25D0,
+            0x25E0,
+            0x26F8,
+            0x2764,
+            0x2774,
+            0xFFFFFFFF,
+            0x28CC,
+            0x29C8,
+            0x2AF8,
+            0x2B64,
+            0x2C2C,
+            0x2C88,
+            0x2CA8,
+            0x2D14,
+            0x2D34,
+            0x2DBC,
+            0x2EA8,
+            0x2F78,
+            0x3018,
+            0x30A8,
+            0x3100,
+            0x31C8,
+            0x3234,
+            0x32A8,
+            0x3300,
+            0x3390,
+            0x3428,
+            0x3470,
+            0x348C,
+            0x3600,
+            0x3618,
+            0x362C,
+            0x366C,
+            0x3768,
+            0x3788,
+            0x3898,
+            0x38A8,
+            0x390C,
+            0x392C,
+            0x3944,
+            0x39B0,
+            0x3A20,
+            0x3A84,
+            0x3A98,
+            0x3AB0,
+            0x3AC8,
+            0x3B34,
+            0x3BA0,
+            0x3CCC,
+            0x3D98,
+            0x3EC4,
+            0x3F80,
+            0x419C,
+            0x41D8,
+            0x4204,
+            0x4270,
+            0x427C,
+            0x429C,
+            0x433C,
+            0x436C,
+            0x43AC,
+            0x4444,
+            0x44A0,
+            0x44D0,
+            0x44E0,
+            0x454C,
+            0x4564,
+            0x4620,
+            0x4638,
+            0x46A4,
+            0x46B4,
+            0x470C,
+            0x4748,
+            0x47D0,
+            0x4860,
+            0x48A8,
+            0x490C,
+            0x4B08,
+            0x4E58,
+            0x4E68,
+            0x4F1C,
+            0x4F2C,
+            0x5104,
+            0x5170,
+            0x51B4,
+            0x5204,
+            0x5238,
+            0x532C,
+            0x5378,
+            0x53F8,
+            0x5480,
+            0x557C,
+            0x5660,
+            0x56A8,
+            0x5714,
+            0x572C,
+            0x57D8,
+            0x57F8,
+            0x58B4,
+            0x58C8,
+            0x58D8,
+            0x5938,
+            0x59C0,
+            0x59D0,
+            0x59E0,
+            0x5A00,
+            0x5A20,
+            0x5AA0,
+            0x5AD4,
+            0x5AE4,
+            0x5B28,
+            0x5B40,
+            0x5BD0,
+            0x5C48,
+            0x5D54,
+            0x5E3C,
+            0x5E6C,
+            0x5ECC,
+            0x6034,
+            0x6044,
+            0x6178,
+            0x6188,
+            0x6228,
+            0x6264,
+            0x62F4,
+            0x63A4,
+            0x647C,
+            0x6500,
+            0x6510,
+            0x671C,
+            0x6730,
+            0x6758,
+            0x6770,
+            0x68B0,
+            0x68EC,
+            0x6A14,
+            0x6A28,
+            0x6A38,
+            0x6A48,
+            0x6C10,
+            0x6C28,
+            0x6C38,
+            0x6C48,
+            0x6C5C,
+            0x6C6C,
+            0x6D04,
+            0x6D14,
+            0x6EC0,
+            0x6F8C,
+            0x6FA0,
+            0x703C,
+            0x704C,
+            0x7078,
+            0x7090,
+            0x70A8,
+            0x7150,
+            0x7170,
+            0x7180,
+            0x72EC,
+            0x7340,
+            0x73D4,
+            0x73E4,
+            0x73F4,
+            0x7404,
+            0x7414,
+            0x7424,
+            0x7468,
+            0x7478,
+            0x7490,
+            0x74E0,
+            0x7560,
+            0x7570,
+            0x75D0,
+            0x75F8,
+            0x7610,
+            0x76A4,
+            0x7758,
+            0x7818,
+            0x78A8,
+            0x78C8,
+            0x78E0,
+            0x7930,
+            0x79F0,
+            0x7A58,
+            0x7AF4,
+            0x7B04,
+            0x7B64,
+            0x7BCC,
+            0x7CA0,
+            0x7E20,
+            0x7E30,
+            0x7E90,
+            0x7F34,
+            0x7F68,
+            0x8038,
+            0x80EC,
+            0x817C,
+            0x8238,
+            0x8298,
+            0x82AC,
+            0x82E4,
+            0x8428,
+            0x846C,
+            0x851C,
+            0x8584,
+            0x85B4,
+            0x8640,
+            0x8654,
+            0x8714,
+            0x87D4,
+            0x882C,
+            0x8890,
+            0x88C4,
+            0x88E4,
+            0x8900,
+            0x8944,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0x2327270,
+            0x23272F0,
+            0x2327350,
+            0x232738C,
+            0x23273C8,
+            0x2327400,
+            0x2327440,
+            0x2327450,
+            0x2327514,
+            0x2327534,
+            0x232755C,
+            0x23275B8,
+            0x2327614,
+            0x232762C,
+            0x2327698,
+            0x23276AC,
+            0x23276F0,
+            0x23277A8,
+            0x2327894,
+            0x23279DC,
+            0x23279F4,
+            0x2327A30,
+            0x2327AD4,
+            0x2327AFC,
+            0x2327B68,
+            0x2327BDC,
+            0x2327C64,
+            0x2327C98,
+            0x2327D44,
+            0x2327D54,
+            0x2327D90,
+            0x2327DB4,
+            0x2327E18,
+            0x2327E94,
+            0x2327EFC,
+            0x2327F70,
+            0x2327FAC,
+            0x2328048,
+            0x232812C,
+            0x232813C,
+            0x2328150,
+            0x23281D8,
+            0x2328260,
+            0x232828C,
+            0x23282A8,
+            0x23282E8,
+            0xFFFFFFFF,
+            0x2328320,
+            0x2328340,
+            0x23283D0,
+            0x2328414,
+            0x23284BC,
+            0x232853C,
+            0x23285A8,
+            0x2328614,
+            0x23286D4,
+            0x2328714,
+            0x2328780,
+            0x23287F0,
+            0x2328854,
+            0x23288E0,
+            0x2328A20,
+            0x2328AD4,
+            0x2328B3C,
+            0x2328B70,
+            0x2328BCC,
+            0x2328BE0,
+            0x2328BF4,
+            0x2328C40,
+            0x2328C8C,
+            0x2328D70,
+            0x2328DB0,
+            0x2328DC8,
+            0x2328E34,
+            0x2328E6C,
+            0x2328EB0,
+            0x2328F7C,
+            0x2328FE4,
+            0x2329068,
+            0x2329078,
+            0x2329090,
+            0x23290FC,
+            0x2329160,
+            0x23291E8,
+            0x2329258,
+            0x2329268,
+            0x232931C,
+            0x23293BC,
+            0xFFFFFFFF,
+            0x23294B8,
+            0x23294FC,
+            0x232955C,
+            0x2329598,
+            0x23295F4,
+            0x2329660,
+            0x23296D0,
+            0x2329750,
+            0x23297B0,
+            0x232981C,
+            0x232982C,
+            0x2329944,
+            0x23299B0,
+            0x23299C0,
+            0xFFFFFFFF,
+            0x2329B18,
+            0x2329C14,
+            0x2329D44,
+            0x2329DB0,
+            0x2329E78,
+            0x2329ED4,
+            0x2329EF4,
+            0x2329F60,
+            0x2329F80,
+            0x232A008,
+            0x232A0F4,
+            0x232A1C4,
+            0x232A264,
+            0x232A2F4,
+            0x232A34C,
+            0x232A414,
+            0x232A480,
+            0x232A4F4,
+            0x232A54C,
+            0x232A5DC,
+            0x232A674,
+            0x232A6BC,
+            0x232A6D8,
+            0x232A84C,
+            0x232A864,
+            0x232A878,
+            0x232A8B8,
+            0x232A9B4,
+            0x232A9D4,
+            0x232AAE4,
+            0x232AAF4,
+            0x232AB58,
+            0x232AB78,
+            0x232AB90,
+            0x232ABFC,
+            0x232AC6C,
+            0x232ACD0,
+            0x232ACE4,
+            0x232ACFC,
+            0x232AD14,
+            0x232AD80,
+            0x232ADEC,
+            0x232AF18,
+            0x232AFE4,
+            0x232B110,
+            0x232B1CC,
+            0x232B3E8,
+            0x232B424,
+            0x232B450,
+            0x232B4BC,
+            0x232B4C8,
+            0x232B4E8,
+            0x232B588,
+            0x232B5B8,
+            0x232B5F8,
+            0x232B690,
+            0x232B6EC,
+            0x232B71C,
+            0x232B72C,
+            0x232B798,
+            0x232B7B0,
+            0x232B86C,
+            0x232B884,
+            0x232B8F0,
+            0x232B900,
+            0x232B958,
+            0x232B994,
+            0x232BA1C,
+            0x232BAAC,
+            0x232BAF4,
+            0x232BB58,
+            0x232BD54,
+            0x232C0A4,
+            0x232C0B4,
+            0x232C168,
+            0x232C178,
+            0x232C350,
+            0x232C3BC,
+            0x232C400,
+            0x232C450,
+            0x232C484,
+            0x232C578,
+            0x232C5C4,
+            0x232C644,
+            0x232C6CC,
+            0x232C7C8,
+            0x232C8AC,
+            0x232C8F4,
+            0x232C960,
+            0x232C978,
+            0x232CA24,
+            0x232CA44,
+            0x232CB00,
+            0x232CB14,
+            0x232CB24,
+            0x232CB84,
+            0x232CC0C,
+            0x232CC1C,
+            0x232CC2C,
+            0x232CC4C,
+            0x232CC6C,
+            0x232CCEC,
+            0x232CD20,
+            0x232CD30,
+            0x232CD74,
+            0x232CD8C,
+            0x232CE1C,
+            0x232CE94,
+            0x232CFA0,
+            0x232D088,
+            0x232D0B8,
+            0x232D118,
+            0x232D280,
+            0x232D290,
+            0x232D3C4,
+            0x232D3D4,
+            0x232D474,
+            0x232D4B0,
+            0x232D540,
+            0x232D5F0,
+            0x232D6C8,
+            0x232D74C,
+            0x232D75C,
+            0x232D968,
+            0x232D97C,
+            0x232D9A4,
+            0x232D9BC,
+            0x232DAFC,
+            0x232DB38,
+            0x232DC60,
+            0x232DC74,
+            0x232DC84,
+            0x232DC94,
+            0x232DE5C,
+            0x232DE74,
+            0x232DE84,
+            0x232DE94,
+            0x232DEA8,
+            0x232DEB8,
+            0x232DF50,
+            0x232DF60,
+            0x232E10C,
+            0x232E1D8,
+            0x232E1EC,
+            0x232E288,
+            0x232E298,
+            0x232E2C4,
+            0x232E2DC,
+            0x232E2F4,
+            0x232E39C,
+            0x232E3BC,
+            0x232E3CC,
+            0x232E538,
+            0x232E58C,
+            0x232E620,
+            0x232E630,
+            0x232E640,
+            0x232E650,
+            0x232E660,
+            0x232E670,
+            0x232E6B4,
+            0x232E6C4,
+            0x232E6DC,
+            0x232E72C,
+            0x232E7AC,
+            0x232E7BC,
+            0x232E81C,
+            0x232E844,
+            0x232E85C,
+            0x232E8F0,
+            0x232E9A4,
+            0x232EA64,
+            0x232EAF4,
+            0x232EB14,
+            0x232EB2C,
+            0x232EB7C,
+            0x232EC3C,
+            0x232ECA4,
+            0x232ED40,
+            0x232ED50,
+            0x232EDB0,
+            0x232EE18,
+            0x232EEEC,
+            0x232F06C,
+            0x232F07C,
+            0x232F0DC,
+            0x232F180,
+            0x232F1B4,
+            0x232F284,
+            0x232F338,
+            0x232F3C8,
+            0x232F484,
+            0x232F4E4,
+            0x232F4F8,
+            0x232F530,
+            0x232F674,
+            0x232F6B8,
+            0x232F768,
+            0x232F7D0,
+            0x232F800,
+            0x232F88C,
+            0x232F8A0,
+            0x232F960,
+            0x232FA20,
+            0x232FA78,
+            0x232FADC,
+            0x232FB10,
+            0x232FB30,
+            0x232FB4C,
+            0x232FB90,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1211,
+            1212,
+            1213,
+            1214,
+            1215,
+            1216,
+            1217,
+            1218,
+            1219,
+            1220,
+            1221,
+            1222,
+            1223,
+            1224,
+            1225,
+            1226,
+            1227,
+            1228,
+            1229,
+            1230,
+            1231,
+            1232,
+            1233,
+            1234,
+            1235,
+            1236,
+            1237,
+            1238,
+            1239,
+            1240,
+            1241,
+            1242,
+            1243,
+            1244,
+            1245,
+            1246,
+            1247,
+            1248,
+            1249,
+            1250,
+            1251,
+            1252,
+            1253,
+            1254,
+            1255,
+            1256,
+            1257,
+            1258,
+            1259,
+            1260,
+            1261,
+            1262,
+            1263,
+            1264,
+            1265,
+            1266,
+            1267,
+            1268,
+            1269,
+            1270,
+            1271,
+            1272,
+            1273,
+            1274,
+            1275,
+            1276,
+            1277,
+            1278,
+            1279,
+            1280,
+            1281,
+            1282,
+            1283,
+            1284,
+            1285,
+            1286,
+            1287,
+            1288,
+            1289,
+            1290,
+            1291,
+            1292,
+            1293,
+            1294,
+            1295,
+            1296,
+            1297,
+            1298,
+            1299,
+            1300,
+            1301,
+            1302,
+            1303,
+            1304,
+            1305,
+            1306,
+            1307,
+            1308,
+            1309,
+            1310,
+            1311,
+            1312,
+            1313,
+            1314,
+            1315,
+            1316,
+            1317,
+            1318,
+            1319,
+            1320,
+            1321,
+            1322,
+            1323,
+            1324,
+            1325,
+            1326,
+            1327,
+            1328,
+            1329,
+            1330,
+            1331,
+            1332,
+            1333,
+            1334,
+            1335,
+            1336,
+            1337,
+            1338,
+            1339,
+            1340,
+            1341,
+            1342,
+            1343,
+            1344,
+            1345,
+            1346,
+            1347,
+            1348,
+            1349,
+            1350,
+            1351,
+            1352,
+            1353,
+            1354,
+            1355,
+            1356,
+            1357,
+            1358,
+            1359,
+            1360,
+            1361,
+            1362,
+            1363,
+            1364,
+            1365,
+            1366,
+            1367,
+            1368,
+            1369,
+            1370,
+            1371,
+            1372,
+            1373,
+            1374,
+            1375,
+            1376,
+            1377,
+            1378,
+            1379,
+            1380,
+            1381,
+            1382,
+            1383,
+            1384,
+            1385,
+            1386,
+            1387,
+            1388,
+            1389,
+            1390,
+            1391,
+            1392,
+            1393,
+            1394,
+            1395,
+            1396,
+            1397,
+            1398,
+            1399,
+            1400,
+            1401,
+            1402,
+            1403,
+            1404,
+            1405,
+            1406,
+            1407,
+            1408,
+            1409,
+            1410,
+            1411,
+            1412,
+            1413,
+            1414,
+            1415,
+            1416,
+            1417,
+            1418,
+            1419,
+            1420,
+            1421,
+            1422,
+            1423,
+            1424,
+            1425,
+            1426,
+            1427,
+            1428,
+            1429,
+            1430,
+            1431,
+            1432,
+            1433,
+            1434,
+            1435,
+            1436,
+            1437,
+            1438,
+            1439,
+            1440,
+            1441,
+            1442,
+            1443,
+            1444,
+            1445,
+            1446,
+            1447,
+            1448,
+            1449,
+            1450,
+            1451,
+            1452,
+            1453,
+            1454,
+            1455,
+            1456,
+            1457,
+            1458,
+            1459,
+            1460,
+            1461,
+            1462,
+            1463,
+            1464,
+            1465,
+            1466,
+            1467,
+            1468,
+            1469,
+            1470,
+            1471,
+            1472,
+            1473,
+            1474,
+            1475,
+            1476,
+            1477,
+            1478,
+            1479,
+            1480,
+            1481,
+            1482,
+            1483,
+            1484,
+            1485,
+            1486,
+            1487,
+            1488,
+            1489,
+            1490,
+            1491,
+            1492,
+            1493,
+            1494,
+            1495,
+            1496,
+            1497,
+            1498,
+            1499,
+            1500,
+            1501,
+            1502,
+            1503,
+            1504,
+            1505,
+            1506,
+            1507,
+            1508,
+            1509,
+            1510,
+            1511,
+            1512,
+            1513,
+            1514,
+            1515,
+            1516,
+            1517,
+            1518,
+            1519,
+            1520,
+            1521,
+            1522,
+            1523,
+            1524,
+            1525,
+        ),
+    ),
+    c_types=None,
+    multi={
+        0: (
+            (0x0, 0x4724, 0x5AB0, 0x7F44),
+            (0x232724C, 0x232B970, 0x232CCFC, 0x232F190),
+        ),
+        47: ((0x10BC, 0x246C, 0x5648), (0x2328308, 0x23296B8, 0x232C894)),
+        89: (
+            (0x2248, 0x45FC, 0x66F8, 0x8404),
+            (0x2329494, 0x232B848, 0x232D944, 0x232F650),
+        ),
+        104: (
+            (0x286C, 0x413C, 0x5FD4, 0x7FD8),
+            (0x2329AB8, 0x232B388, 0x232D220, 0x232F224),
+        ),
+    },
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "MAX_HP_CAP_MOVE_EFFECTS",
+        "LUNAR_DANCE_PP_RESTORATION",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1526,
+            1527,
+        ),
+    ),
+    c_types=(
+        "int32_t",
+        "int32_t",
+    ),
+    multi={},
+)
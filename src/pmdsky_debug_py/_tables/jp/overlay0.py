@@ -0,0 +1,17 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay0 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+
+DATA = SymbolTable(
+    names=("TOP_MENU_MUSIC_ID",),
+    addresses=array("I", (0x1728,)),
+    absolute_addresses=array("I", (0x22BF948,)),
+    lengths=array("I", (0xFFFFFFFF,)),
+    descriptions=array("I", (1528,)),
+    c_types=("struct data_processing_instruction",),
+    multi={},
+)
@@ -0,0 +1,190 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay1 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "CreateMainMenus",
+        "AddMainMenuOption",
+        "AddSubMenuOption",
+        "ProcessContinueScreenContents",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x7BC8,
+            0x8038,
+            0x8110,
+            0x99E4,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x2332888,
+            0x2332CF8,
+            0x2332DD0,
+            0x23346A4,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1529,
+            1530,
+            1531,
+            1532,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "PRINTS_STRINGS",
+        "PRINTS_STRUCT",
+        "MAIN_MENU_WINDOW_PARAMS_1",
+        "MAIN_MENU_WINDOW_PARAMS_2",
+        "MAIN_MENU_WINDOW_PARAMS_3",
+        "MAIN_MENU_WINDOW_PARAMS_4",
+        "CONTINUE_CHOICE",
+        "SUBMENU",
+        "MAIN_MENU",
+        "MAIN_MENU_WINDOW_PARAMS_5",
+        "MAIN_MENU_WINDOW_PARAMS_6",
+        "MAIN_MENU_WINDOW_PARAMS_7",
+        "MAIN_MENU_ITEMS_CONFIRM",
+        "MAIN_MENU_WINDOW_PARAMS_8",
+        "MAIN_MENU_WINDOW_PARAMS_9",
+        "MAIN_DEBUG_MENU_ITEMS_1",
+        "MAIN_MENU_WINDOW_PARAMS_10",
+        "MAIN_DEBUG_MENU_ITEMS_2",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x11CEC,
+            0x11ED4,
+            0x120D8,
+            0x120E8,
+            0x120F8,
+            0x12108,
+            0x12128,
+            0x12148,
+            0x12190,
+            0x122D4,
+            0x122E4,
+            0x122F4,
+            0x12304,
+            0x12388,
+            0x123A8,
+            0x123C8,
+            0x12428,
+            0x12448,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x233C9AC,
+            0x233CB94,
+            0x233CD98,
+            0x233CDA8,
+            0x233CDB8,
+            0x233CDC8,
+            0x233CDE8,
+            0x233CE08,
+            0x233CE50,
+            0x233CF94,
+            0x233CFA4,
+            0x233CFB4,
+            0x233CFC4,
+            0x233D048,
+            0x233D068,
+            0x233D088,
+            0x233D0E8,
+            0x233D108,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x20,
+            0x48,
+            0xA0,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x60,
+            0xFFFFFFFF,
+            0x38,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            266,
+            1533,
+            266,
+            266,
+            266,
+            266,
+            1,
+            1,
+            1,
+            266,
+            266,
+            266,
+            1,
+            266,
+            266,
+            1,
+            266,
+            1,
+        ),
+    ),
+    c_types=(
+        "",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[3]",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[12]",
+        "struct window_params",
+        "struct simple_menu_id_item[7]",
+    ),
+    multi={},
+)
@@ -0,0 +1,1326 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay10 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "CreateInventoryMenu",
+        "SetInventoryMenuState0",
+        "SetInventoryMenuState6",
+        "CloseInventoryMenu",
+        "IsInventoryMenuActive",
+        "CheckInventoryMenuField0x1A0",
+        "PopInventoryMenuField0x1A3",
+        "UpdateInventoryMenu",
+        "IsInventoryMenuState3",
+        "SprintfStatic",
+        "GetEffectAnimationField0x19",
+        "AnimationHasMoreFrames",
+        "GetEffectAnimation",
+        "GetMoveAnimation",
+        "GetSpecialMonsterMoveAnimation",
+        "GetTrapAnimation",
+        "GetItemAnimation1",
+        "GetItemAnimation2",
+        "GetMoveAnimationSpeed",
+        "DrawTeamStats",
+        "UpdateTeamStats",
+        "FreeTeamStats",
+        "FreeMapAndTeam",
+        "ProcessTeamStatsLvHp",
+        "ProcessTeamStatsNameGender",
+        "IsBackgroundTileset",
+        "InitTilesetBuffer",
+        "MainGame",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x0,
+            0x24C,
+            0x260,
+            0x274,
+            0x2E8,
+            0x308,
+            0x3D8,
+            0x3F4,
+            0x8F4,
+            0xFFFFFFFF,
+            0x1438,
+            0x2E88,
+            0x3424,
+            0x3438,
+            0x344C,
+            0x3460,
+            0x3474,
+            0x3488,
+            0x349C,
+            0x3F6C,
+            0x4268,
+            0x48E8,
+            0x4C0C,
+            0x4C7C,
+            0x4DB0,
+            0x5A3C,
+            0x5B84,
+            0x5D54,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x22BE220,
+            0x22BE46C,
+            0x22BE480,
+            0x22BE494,
+            0x22BE508,
+            0x22BE528,
+            0x22BE5F8,
+            0x22BE614,
+            0x22BEB14,
+            0xFFFFFFFF,
+            0x22BF658,
+            0x22C10A8,
+            0x22C1644,
+            0x22C1658,
+            0x22C166C,
+            0x22C1680,
+            0x22C1694,
+            0x22C16A8,
+            0x22C16BC,
+            0x22C218C,
+            0x22C2488,
+            0x22C2B08,
+            0x22C2E2C,
+            0x22C2E9C,
+            0x22C2FD0,
+            0x22C3C5C,
+            0x22C3DA4,
+            0x22C3F74,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1534,
+            1535,
+            1536,
+            1537,
+            1538,
+            1539,
+            1540,
+            1541,
+            1542,
+            1543,
+            1544,
+            1545,
+            1546,
+            1547,
+            1548,
+            1549,
+            1550,
+            1551,
+            1552,
+            1553,
+            1554,
+            1555,
+            1556,
+            1557,
+            1558,
+            1559,
+            1560,
+            1561,
+        ),
+    ),
+    c_types=None,
+    multi={
+        9: ((0x9CC, 0x4D88), (0x22BEBEC, 0x22C2FA8)),
+    },
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "INVENTORY_MENU_DEFAULT_WINDOW_PARAMS",
+        "FIRST_DUNGEON_WITH_MONSTER_HOUSE_TRAPS",
+        "BAD_POISON_DAMAGE_COOLDOWN",
+        "PROTEIN_STAT_BOOST",
+        "WATERFALL_CRINGE_CHANCE",
+        "AURORA_BEAM_LOWER_ATTACK_CHANCE",
+        "SPAWN_CAP_NO_MONSTER_HOUSE",
+        "OREN_BERRY_DAMAGE",
+        "IRON_TAIL_LOWER_DEFENSE_CHANCE",
+        "TWINEEDLE_POISON_CHANCE",
+        "EXTRASENSORY_CRINGE_CHANCE",
+        "ROCK_SLIDE_CRINGE_CHANCE",
+        "CRUNCH_LOWER_DEFENSE_CHANCE",
+        "FOREWARN_FORCED_MISS_CHANCE",
+        "UNOWN_STONE_DROP_CHANCE",
+        "SITRUS_BERRY_HP_RESTORATION",
+        "MUDDY_WATER_LOWER_ACCURACY_CHANCE",
+        "SILVER_WIND_BOOST_CHANCE",
+        "POISON_TAIL_POISON_CHANCE",
+        "THUNDERSHOCK_PARALYZE_CHANCE",
+        "BOUNCE_PARALYZE_CHANCE",
+        "HEADBUTT_CRINGE_CHANCE",
+        "FIRE_FANG_CRINGE_CHANCE",
+        "SACRED_FIRE_BURN_CHANCE",
+        "WHIRLPOOL_CONSTRICTION_CHANCE",
+        "EXP_ELITE_EXP_BOOST",
+        "MONSTER_HOUSE_MAX_NON_MONSTER_SPAWNS",
+        "HEAL_ORDER_HP_RESTORATION",
+        "STEEL_WING_BOOST_DEFENSE_CHANCE",
+        "GOLD_THORN_POWER",
+        "BURN_DAMAGE",
+        "POISON_DAMAGE",
+        "SPAWN_COOLDOWN",
+        "MIST_BALL_LOWER_SPECIAL_ATTACK_CHANCE",
+        "CHARGE_BEAM_BOOST_SPECIAL_ATTACK_CHANCE",
+        "ORAN_BERRY_FULL_HP_BOOST",
+        "LIFE_SEED_HP_BOOST",
+        "OCTAZOOKA_LOWER_ACCURACY_CHANCE",
+        "LUSTER_PURGE_LOWER_SPECIAL_DEFENSE_CHANCE",
+        "SUPER_LUCK_CRIT_RATE_BOOST",
+        "CONSTRICT_LOWER_SPEED_CHANCE",
+        "ICE_FANG_FREEZE_CHANCE",
+        "SMOG_POISON_CHANCE",
+        "LICK_PARALYZE_CHANCE",
+        "THUNDER_FANG_PARALYZE_CHANCE",
+        "BITE_CRINGE_CHANCE",
+        "SKY_ATTACK_CRINGE_CHANCE",
+        "ICE_FANG_CRINGE_CHANCE",
+        "BLAZE_KICK_BURN_CHANCE",
+        "FLAMETHROWER_BURN_CHANCE",
+        "DIZZY_PUNCH_CONFUSE_CHANCE",
+        "SECRET_POWER_EFFECT_CHANCE",
+        "METAL_CLAW_BOOST_ATTACK_CHANCE",
+        "TECHNICIAN_MOVE_POWER_THRESHOLD",
+        "SONICBOOM_FIXED_DAMAGE",
+        "RAIN_ABILITY_BONUS_REGEN",
+        "LEECH_SEED_HP_DRAIN",
+        "EXCLUSIVE_ITEM_EXP_BOOST",
+        "AFTERMATH_CHANCE",
+        "SET_DAMAGE_STATUS_DAMAGE",
+        "INTIMIDATOR_ACTIVATION_CHANCE",
+        "TYPE_ADVANTAGE_MASTER_CRIT_RATE",
+        "ORAN_BERRY_HP_RESTORATION",
+        "SITRUS_BERRY_FULL_HP_BOOST",
+        "SNORE_CRINGE_CHANCE",
+        "METEOR_MASH_BOOST_ATTACK_CHANCE",
+        "CRUSH_CLAW_LOWER_DEFENSE_CHANCE",
+        "BURN_DAMAGE_COOLDOWN",
+        "SHADOW_BALL_LOWER_SPECIAL_DEFENSE_CHANCE",
+        "STICK_POWER",
+        "BUBBLE_LOWER_SPEED_CHANCE",
+        "ICE_BODY_BONUS_REGEN",
+        "POWDER_SNOW_FREEZE_CHANCE",
+        "POISON_STING_POISON_CHANCE",
+        "SPAWN_COOLDOWN_THIEF_ALERT",
+        "POISON_FANG_POISON_CHANCE",
+        "WEATHER_MOVE_TURN_COUNT",
+        "THUNDER_PARALYZE_CHANCE",
+        "THUNDERBOLT_PARALYZE_CHANCE",
+        "MONSTER_HOUSE_MAX_MONSTER_SPAWNS",
+        "TWISTER_CRINGE_CHANCE",
+        "SPEED_BOOST_TURNS",
+        "FAKE_OUT_CRINGE_CHANCE",
+        "THUNDER_FANG_CRINGE_CHANCE",
+        "FLARE_BLITZ_BURN_CHANCE",
+        "FLAME_WHEEL_BURN_CHANCE",
+        "PSYBEAM_CONFUSE_CHANCE",
+        "TRI_ATTACK_STATUS_CHANCE",
+        "MIRACLE_CHEST_EXP_BOOST",
+        "WONDER_CHEST_EXP_BOOST",
+        "SPAWN_CAP_WITH_MONSTER_HOUSE",
+        "POISON_DAMAGE_COOLDOWN",
+        "LEECH_SEED_DAMAGE_COOLDOWN",
+        "THROWN_ITEM_HIT_CHANCE",
+        "GEO_PEBBLE_DAMAGE",
+        "GRAVELEROCK_DAMAGE",
+        "RARE_FOSSIL_DAMAGE",
+        "GINSENG_CHANCE_3",
+        "ZINC_STAT_BOOST",
+        "IRON_STAT_BOOST",
+        "CALCIUM_STAT_BOOST",
+        "WISH_BONUS_REGEN",
+        "DRAGON_RAGE_FIXED_DAMAGE",
+        "CORSOLA_TWIG_POWER",
+        "CACNEA_SPIKE_POWER",
+        "GOLD_FANG_POWER",
+        "SILVER_SPIKE_POWER",
+        "IRON_THORN_POWER",
+        "SCOPE_LENS_CRIT_RATE_BOOST",
+        "HEALING_WISH_HP_RESTORATION",
+        "ME_FIRST_MULTIPLIER",
+        "FACADE_DAMAGE_MULTIPLIER",
+        "IMPRISON_TURN_RANGE",
+        "SLEEP_TURN_RANGE",
+        "NIGHTMARE_TURN_RANGE",
+        "BURN_DAMAGE_MULTIPLIER",
+        "REST_TURN_RANGE",
+        "MATCHUP_SUPER_EFFECTIVE_MULTIPLIER_ERRATIC_PLAYER",
+        "MATCHUP_IMMUNE_MULTIPLIER",
+        "SPORT_CONDITION_TURN_RANGE",
+        "SURE_SHOT_TURN_RANGE",
+        "DETECT_BAND_MOVE_ACCURACY_DROP",
+        "TINTED_LENS_MULTIPLIER",
+        "SMOKESCREEN_TURN_RANGE",
+        "PERISH_SONG_TURN_RANGE",
+        "SHADOW_FORCE_DAMAGE_MULTIPLIER",
+        "DIG_DAMAGE_MULTIPLIER",
+        "DIVE_DAMAGE_MULTIPLIER",
+        "BOUNCE_DAMAGE_MULTIPLIER",
+        "POWER_PITCHER_DAMAGE_MULTIPLIER",
+        "QUICK_DODGER_MOVE_ACCURACY_DROP",
+        "MATCHUP_NOT_VERY_EFFECTIVE_MULTIPLIER",
+        "MATCHUP_SUPER_EFFECTIVE_MULTIPLIER",
+        "MATCHUP_NEUTRAL_MULTIPLIER",
+        "MATCHUP_IMMUNE_MULTIPLIER_ERRATIC_PLAYER",
+        "MATCHUP_NOT_VERY_EFFECTIVE_MULTIPLIER_ERRATIC_PLAYER",
+        "MATCHUP_NEUTRAL_MULTIPLIER_ERRATIC_PLAYER",
+        "AIR_BLADE_DAMAGE_MULTIPLIER",
+        "KECLEON_SHOP_BOOST_CHANCE_MULTIPLIER",
+        "HIDDEN_STAIRS_SPAWN_CHANCE_MULTIPLIER",
+        "YAWN_TURN_RANGE",
+        "SPEED_BOOST_TURN_RANGE",
+        "SOLARBEAM_DAMAGE_MULTIPLIER",
+        "SKY_ATTACK_DAMAGE_MULTIPLIER",
+        "RAZOR_WIND_DAMAGE_MULTIPLIER",
+        "FOCUS_PUNCH_DAMAGE_MULTIPLIER",
+        "SKULL_BASH_DAMAGE_MULTIPLIER",
+        "FLY_DAMAGE_MULTIPLIER",
+        "WEATHER_BALL_TYPE_TABLE",
+        "LAST_RESORT_DAMAGE_MULT_TABLE",
+        "SYNTHESIS_HP_RESTORATION_TABLE",
+        "ROOST_HP_RESTORATION_TABLE",
+        "MOONLIGHT_HP_RESTORATION_TABLE",
+        "MORNING_SUN_HP_RESTORATION_TABLE",
+        "REVERSAL_DAMAGE_MULT_TABLE",
+        "WATER_SPOUT_DAMAGE_MULT_TABLE",
+        "WRING_OUT_DAMAGE_MULT_TABLE",
+        "ERUPTION_DAMAGE_MULT_TABLE",
+        "WEATHER_BALL_DAMAGE_MULT_TABLE",
+        "EAT_ITEM_EFFECT_IGNORE_LIST",
+        "CASTFORM_WEATHER_ATTRIBUTE_TABLE",
+        "BAD_POISON_DAMAGE_TABLE",
+        "TYPE_MATCHUP_COMBINATOR_TABLE",
+        "OFFENSIVE_STAT_STAGE_MULTIPLIERS",
+        "DEFENSIVE_STAT_STAGE_MULTIPLIERS",
+        "NATURE_POWER_TABLE",
+        "APPLES_AND_BERRIES_ITEM_IDS",
+        "RECRUITMENT_LEVEL_BOOST_TABLE",
+        "NATURAL_GIFT_ITEM_TABLE",
+        "RANDOM_MUSIC_ID_TABLE",
+        "SHOP_ITEM_CHANCES",
+        "MALE_ACCURACY_STAGE_MULTIPLIERS",
+        "MALE_EVASION_STAGE_MULTIPLIERS",
+        "FEMALE_ACCURACY_STAGE_MULTIPLIERS",
+        "FEMALE_EVASION_STAGE_MULTIPLIERS",
+        "MUSIC_ID_TABLE",
+        "TYPE_MATCHUP_TABLE",
+        "FIXED_ROOM_MONSTER_SPAWN_STATS_TABLE",
+        "METRONOME_TABLE",
+        "TILESET_PROPERTIES",
+        "FIXED_ROOM_PROPERTIES_TABLE",
+        "TRAP_ANIMATION_INFO",
+        "ITEM_ANIMATION_INFO",
+        "MOVE_ANIMATION_INFO",
+        "EFFECT_ANIMATION_INFO",
+        "SPECIAL_MONSTER_MOVE_ANIMATION_INFO",
+        "DEFEAT_ITEM_LOSS_CHANCE",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x785C,
+            0x78D4,
+            0x78DC,
+            0x78E8,
+            0x78EC,
+            0x78F0,
+            0x78F8,
+            0x7900,
+            0x7908,
+            0x790C,
+            0x7910,
+            0x7914,
+            0x7918,
+            0x7930,
+            0x793C,
+            0x7940,
+            0x794C,
+            0x7950,
+            0x7954,
+            0x7958,
+            0x795C,
+            0x7960,
+            0x7964,
+            0x7968,
+            0x796C,
+            0x7970,
+            0x7974,
+            0x7980,
+            0x798C,
+            0x7998,
+            0x799C,
+            0x79A0,
+            0x79A4,
+            0x79A8,
+            0x79B8,
+            0x79BC,
+            0x79C0,
+            0x79C8,
+            0x79D4,
+            0x79D8,
+            0x79DC,
+            0x79E0,
+            0x79E4,
+            0x79F0,
+            0x79F4,
+            0x79FC,
+            0x7A00,
+            0x7A04,
+            0x7A08,
+            0x7A0C,
+            0x7A10,
+            0x7A14,
+            0x7A1C,
+            0x7A24,
+            0x7A30,
+            0x7A40,
+            0x7A50,
+            0x7A54,
+            0x7A5C,
+            0x7A60,
+            0x7A80,
+            0x7AA8,
+            0x7AB4,
+            0x7ABC,
+            0x7AC8,
+            0x7ACC,
+            0x7AD0,
+            0x7AD8,
+            0x7AE4,
+            0x7AEC,
+            0x7AF4,
+            0x7AF8,
+            0x7AFC,
+            0x7B04,
+            0x7B08,
+            0x7B0C,
+            0x7B1C,
+            0x7B20,
+            0x7B24,
+            0x7B28,
+            0x7B30,
+            0x7B34,
+            0x7B38,
+            0x7B40,
+            0x7B4C,
+            0x7B50,
+            0x7B58,
+            0x7B5C,
+            0x7B60,
+            0x7B64,
+            0x7B6C,
+            0x7B70,
+            0x7B74,
+            0x7B78,
+            0x7B7C,
+            0x7B80,
+            0x7B84,
+            0x7B88,
+            0x7B8C,
+            0x7B90,
+            0x7B94,
+            0x7B98,
+            0x7B9C,
+            0x7BA0,
+            0x7BA4,
+            0x7BA8,
+            0x7BAC,
+            0x7BB0,
+            0x7BB8,
+            0x7BBC,
+            0x7BD8,
+            0x7BE0,
+            0x7BE4,
+            0x7BE8,
+            0x7BEC,
+            0x7C0C,
+            0x7C10,
+            0x7C14,
+            0x7C20,
+            0x7C54,
+            0x7C60,
+            0x7C70,
+            0x7C88,
+            0x7C8C,
+            0x7C98,
+            0x7CA4,
+            0x7CAC,
+            0x7CB0,
+            0x7CB4,
+            0x7CC0,
+            0x7CD0,
+            0x7CD8,
+            0x7CE0,
+            0x7CE4,
+            0x7CE8,
+            0x7CEC,
+            0x7CF4,
+            0x7D0C,
+            0x7D14,
+            0x7D18,
+            0x7D28,
+            0x7D50,
+            0x7D6C,
+            0x7D70,
+            0x7D78,
+            0x7D7C,
+            0x7D84,
+            0x7D88,
+            0x7DA4,
+            0x7E0C,
+            0x7E1C,
+            0x7E2C,
+            0x7E3C,
+            0x7E4C,
+            0x7E5C,
+            0x7E6C,
+            0x7E7C,
+            0x7E8C,
+            0x801C,
+            0x803C,
+            0x8134,
+            0x8164,
+            0x81DC,
+            0x8260,
+            0x82B4,
+            0x8308,
+            0x8380,
+            0x852C,
+            0x85F8,
+            0x86C4,
+            0x87B4,
+            0x88D4,
+            0x8928,
+            0x897C,
+            0x89D0,
+            0x8A24,
+            0x8B78,
+            0x8E00,
+            0x92A4,
+            0x97E4,
+            0xA138,
+            0xAF18,
+            0xAF4C,
+            0xC52C,
+            0xF9F4,
+            0x14684,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x22C5A7C,
+            0x22C5AF4,
+            0x22C5AFC,
+            0x22C5B08,
+            0x22C5B0C,
+            0x22C5B10,
+            0x22C5B18,
+            0x22C5B20,
+            0x22C5B28,
+            0x22C5B2C,
+            0x22C5B30,
+            0x22C5B34,
+            0x22C5B38,
+            0x22C5B50,
+            0x22C5B5C,
+            0x22C5B60,
+            0x22C5B6C,
+            0x22C5B70,
+            0x22C5B74,
+            0x22C5B78,
+            0x22C5B7C,
+            0x22C5B80,
+            0x22C5B84,
+            0x22C5B88,
+            0x22C5B8C,
+            0x22C5B90,
+            0x22C5B94,
+            0x22C5BA0,
+            0x22C5BAC,
+            0x22C5BB8,
+            0x22C5BBC,
+            0x22C5BC0,
+            0x22C5BC4,
+            0x22C5BC8,
+            0x22C5BD8,
+            0x22C5BDC,
+            0x22C5BE0,
+            0x22C5BE8,
+            0x22C5BF4,
+            0x22C5BF8,
+            0x22C5BFC,
+            0x22C5C00,
+            0x22C5C04,
+            0x22C5C10,
+            0x22C5C14,
+            0x22C5C1C,
+            0x22C5C20,
+            0x22C5C24,
+            0x22C5C28,
+            0x22C5C2C,
+            0x22C5C30,
+            0x22C5C34,
+            0x22C5C3C,
+            0x22C5C44,
+            0x22C5C50,
+            0x22C5C60,
+            0x22C5C70,
+            0x22C5C74,
+            0x22C5C7C,
+            0x22C5C80,
+            0x22C5CA0,
+            0x22C5CC8,
+            0x22C5CD4,
+            0x22C5CDC,
+            0x22C5CE8,
+            0x22C5CEC,
+            0x22C5CF0,
+            0x22C5CF8,
+            0x22C5D04,
+            0x22C5D0C,
+            0x22C5D14,
+            0x22C5D18,
+            0x22C5D1C,
+            0x22C5D24,
+            0x22C5D28,
+            0x22C5D2C,
+            0x22C5D3C,
+            0x22C5D40,
+            0x22C5D44,
+            0x22C5D48,
+            0x22C5D50,
+            0x22C5D54,
+            0x22C5D58,
+            0x22C5D60,
+            0x22C5D6C,
+            0x22C5D70,
+            0x22C5D78,
+            0x22C5D7C,
+            0x22C5D80,
+            0x22C5D84,
+            0x22C5D8C,
+            0x22C5D90,
+            0x22C5D94,
+            0x22C5D98,
+            0x22C5D9C,
+            0x22C5DA0,
+            0x22C5DA4,
+            0x22C5DA8,
+            0x22C5DAC,
+            0x22C5DB0,
+            0x22C5DB4,
+            0x22C5DB8,
+            0x22C5DBC,
+            0x22C5DC0,
+            0x22C5DC4,
+            0x22C5DC8,
+            0x22C5DCC,
+            0x22C5DD0,
+            0x22C5DD8,
+            0x22C5DDC,
+            0x22C5DF8,
+            0x22C5E00,
+            0x22C5E04,
+            0x22C5E08,
+            0x22C5E0C,
+            0x22C5E2C,
+            0x22C5E30,
+            0x22C5E34,
+            0x22C5E40,
+            0x22C5E74,
+            0x22C5E80,
+            0x22C5E90,
+            0x22C5EA8,
+            0x22C5EAC,
+            0x22C5EB8,
+            0x22C5EC4,
+            0x22C5ECC,
+            0x22C5ED0,
+            0x22C5ED4,
+            0x22C5EE0,
+            0x22C5EF0,
+            0x22C5EF8,
+            0x22C5F00,
+            0x22C5F04,
+            0x22C5F08,
+            0x22C5F0C,
+            0x22C5F14,
+            0x22C5F2C,
+            0x22C5F34,
+            0x22C5F38,
+            0x22C5F48,
+            0x22C5F70,
+            0x22C5F8C,
+            0x22C5F90,
+            0x22C5F98,
+            0x22C5F9C,
+            0x22C5FA4,
+            0x22C5FA8,
+            0x22C5FC4,
+            0x22C602C,
+            0x22C603C,
+            0x22C604C,
+            0x22C605C,
+            0x22C606C,
+            0x22C607C,
+            0x22C608C,
+            0x22C609C,
+            0x22C60AC,
+            0x22C623C,
+            0x22C625C,
+            0x22C6354,
+            0x22C6384,
+            0x22C63FC,
+            0x22C6480,
+            0x22C64D4,
+            0x22C6528,
+            0x22C65A0,
+            0x22C674C,
+            0x22C6818,
+            0x22C68E4,
+            0x22C69D4,
+            0x22C6AF4,
+            0x22C6B48,
+            0x22C6B9C,
+            0x22C6BF0,
+            0x22C6C44,
+            0x22C6D98,
+            0x22C7020,
+            0x22C74C4,
+            0x22C7A04,
+            0x22C8358,
+            0x22C9138,
+            0x22C916C,
+            0x22CA74C,
+            0x22CDC14,
+            0x22D28A4,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0x1,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0xFFFFFFFF,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0xFFFFFFFF,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0xFFFFFFFF,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0xFFFFFFFF,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0xFFFFFFFF,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0xFFFFFFFF,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0xFFFFFFFF,
+            0x4,
+            0x4,
+            0x8,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x20,
+            0xFFFFFFFF,
+            0x30,
+            0xFFFFFFFF,
+            0x40,
+            0x54,
+            0x54,
+            0x78,
+            0x84,
+            0xCC,
+            0xCC,
+            0xF0,
+            0x120,
+            0x54,
+            0x54,
+            0x54,
+            0x54,
+            0x154,
+            0x288,
+            0x4A4,
+            0x540,
+            0x954,
+            0xC00,
+            0x34,
+            0x15E0,
+            0x34C8,
+            0x4C90,
+            0xADF4,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1562,
+            1563,
+            1564,
+            1565,
+            1566,
+            1567,
+            1568,
+            1569,
+            1570,
+            1571,
+            1572,
+            1573,
+            1574,
+            1575,
+            1576,
+            1577,
+            1578,
+            1579,
+            1580,
+            1581,
+            1582,
+            1583,
+            1584,
+            1585,
+            1586,
+            1587,
+            1588,
+            1589,
+            1590,
+            1591,
+            1592,
+            1593,
+            1594,
+            1595,
+            1596,
+            1597,
+            1598,
+            1599,
+            1600,
+            1601,
+            1602,
+            1603,
+            1604,
+            1605,
+            1606,
+            1607,
+            1608,
+            1609,
+            1610,
+            1611,
+            1612,
+            1613,
+            1614,
+            1615,
+            1616,
+            1617,
+            1618,
+            1619,
+            1620,
+            1621,
+            1622,
+            1623,
+            1624,
+            1625,
+            1626,
+            1627,
+            1628,
+            1629,
+            1630,
+            1631,
+            1632,
+            1633,
+            1634,
+            1635,
+            1636,
+            1637,
+            1638,
+            1639,
+            1640,
+            1641,
+            1642,
+            1643,
+            1644,
+            1645,
+            1646,
+            1647,
+            1648,
+            1649,
+            1650,
+            1651,
+            1652,
+            1653,
+            1654,
+            1655,
+            1656,
+            1657,
+            1658,
+            1659,
+            1660,
+            1661,
+            1662,
+            1663,
+            1664,
+            1665,
+            1666,
+            1667,
+            1668,
+            1669,
+            1670,
+            1671,
+            1672,
+            1673,
+            1674,
+            1675,
+            1676,
+            1677,
+            1678,
+            1679,
+            1680,
+            1681,
+            1682,
+            1683,
+            1684,
+            1685,
+            1686,
+            1687,
+            1688,
+            1689,
+            1690,
+            1691,
+            1692,
+            1693,
+            1694,
+            1695,
+            1696,
+            1697,
+            1698,
+            1699,
+            1700,
+            1701,
+            1702,
+            1703,
+            1704,
+            1705,
+            1706,
+            1707,
+            1708,
+            1709,
+            1710,
+            1711,
+            1712,
+            1713,
+            1714,
+            1715,
+            1716,
+            1717,
+            1718,
+            1719,
+            1720,
+            1721,
+            1722,
+            1723,
+            1724,
+            1725,
+            1726,
+            1727,
+            1728,
+            948,
+            1729,
+            1730,
+            1731,
+            1732,
+            1733,
+            1734,
+            1735,
+            1736,
+            1737,
+            1738,
+            1739,
+            1740,
+            1741,
+            1742,
+            1743,
+            1744,
+            1745,
+            1746,
+            1747,
+        ),
+    ),
+    c_types=(
+        "struct window_params",
+        "struct dungeon_id_8",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "fx32_8",
+        "fx32_8",
+        "int16_t[2]",
+        "int16_t[2]",
+        "int16_t[2]",
+        "fx32_8",
+        "int16_t[2]",
+        "fx32_8",
+        "fx32_8",
+        "int16_t[2]",
+        "int16_t[2]",
+        "int",
+        "fx32_8",
+        "int16_t[2]",
+        "int16_t[2]",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "int",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "int16_t[2]",
+        "int16_t[2]",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "struct type_id_8[8]",
+        "fx32_8[4]",
+        "int16_t[8]",
+        "int16_t[8]",
+        "int16_t[8]",
+        "int16_t[8]",
+        "fx32_8[4]",
+        "fx32_8[4]",
+        "fx32_8[4]",
+        "fx32_8[4]",
+        "fx32_8[8]",
+        "struct item_id_16[36]",
+        "struct castform_weather_attributes[8]",
+        "int16_t[30]",
+        "struct type_matchup_combinator_table",
+        "fx32_8[21]",
+        "fx32_8[21]",
+        "struct wildcard_move_desc[15]",
+        "struct item_id_16[66]",
+        "int16_t[102]",
+        "struct natural_gift_item_info[34]",
+        "struct music_id_16[30][4]",
+        "int16_t[144]",
+        "fx32_8[21]",
+        "fx32_8[21]",
+        "fx32_8[21]",
+        "fx32_8[21]",
+        "struct music_id_16[170]",
+        "struct type_matchup_table",
+        "struct fixed_room_monster_spawn_stats_entry[99]",
+        "struct wildcard_move_desc[168]",
+        "struct tileset_property[199]",
+        "struct fixed_room_properties_entry[256]",
+        "struct trap_animation[26]",
+        "struct item_animation[1400]",
+        "struct move_animation[563]",
+        "struct effect_animation[700]",
+        "struct special_monster_move_animation[7422]",
+        "struct data_processing_instruction",
+    ),
+    multi={},
+)
@@ -0,0 +1,516 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay11 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "UnlockScriptingLock",
+        "FuncThatCallsRunNextOpcode",
+        "RunNextOpcode",
+        "HandleUnlocks",
+        "LoadFileFromRomVeneer",
+        "SsbLoad2",
+        "ScriptParamToInt",
+        "ScriptParamToFixedPoint16",
+        "StationLoadHanger",
+        "ScriptStationLoadTalk",
+        "SsbLoad1",
+        "ScriptSpecialProcessCall",
+        "GetCoroutineInfo",
+        "GetSpecialRecruitmentSpecies",
+        "PrepareMenuAcceptTeamMember",
+        "InitRandomNpcJobs",
+        "GetRandomNpcJobType",
+        "GetRandomNpcJobSubtype",
+        "GetRandomNpcJobStillAvailable",
+        "AcceptRandomNpcJob",
+        "GroundMainLoop",
+        "GetAllocArenaGround",
+        "GetFreeArenaGround",
+        "GroundMainReturnDungeon",
+        "GroundMainNextDay",
+        "JumpToTitleScreen",
+        "ReturnToTitleScreen",
+        "ScriptSpecialProcess0x16",
+        "IsScreenFadeInProgress",
+        "LoadBackgroundAttributes",
+        "LoadMapType10",
+        "LoadMapType11",
+        "GetSpecialLayoutBackground",
+        "SetAnimDataFields",
+        "SetAnimDataFieldsWrapper",
+        "InitAnimDataFromOtherAnimData",
+        "SetAnimDataFields2",
+        "GetIdleAnimationType",
+        "LoadObjectAnimData",
+        "InitAnimDataFromOtherAnimDataVeneer",
+        "AnimRelatedFunction",
+        "AllocAndInitPartnerFollowDataAndLiveActorList",
+        "InitPartnerFollowDataAndLiveActorList",
+        "DeleteLiveActor",
+        "ChangeActorAnimation",
+        "InitPartnerFollowData",
+        "GetDirectionLiveActor",
+        "SetDirectionLiveActor",
+        "CreateTeamInfoBox",
+        "CloseTeamInfoBox",
+        "IsTeamInfoBoxActive",
+        "UpdateTeamInfoBox",
+        "CreateTopGroundMenu",
+        "CloseTopGroundMenu",
+        "UpdateTopGroundMenu",
+        "IsBagNotEmpty",
+        "SprintfStatic",
+        "GetExclusiveItemRequirements",
+        "HandleControlsTopScreenGround",
+        "GetDungeonMapPos",
+        "WorldMapSetMode",
+        "WorldMapSetCamera",
+        "StatusUpdate",
+        "HandleTeamStatsGround",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xEF0,
+            0xF24,
+            0x1B24,
+            0x809C,
+            0x8428,
+            0x8448,
+            0x85F8,
+            0x862C,
+            0x8920,
+            0x9130,
+            0x9A9C,
+            0xAE6C,
+            0xBD0C,
+            0xBD90,
+            0xBDD4,
+            0xBE78,
+            0xBF10,
+            0xBF28,
+            0xBF44,
+            0xBFAC,
+            0xC4C8,
+            0xD0B0,
+            0xD114,
+            0xD168,
+            0xD18C,
+            0xD330,
+            0xD3E8,
+            0xD448,
+            0xDCCC,
+            0xF894,
+            0x10A78,
+            0x10F98,
+            0x152C8,
+            0x18594,
+            0x186D4,
+            0x18A08,
+            0x1908C,
+            0x19AF4,
+            0x1AC04,
+            0x1ACAC,
+            0xFFFFFFFF,
+            0x1BA60,
+            0x1BABC,
+            0x1C31C,
+            0x1D16C,
+            0x1F7CC,
+            0x20F40,
+            0x20F50,
+            0x22C1C,
+            0x22CD4,
+            0x22D0C,
+            0x22D2C,
+            0x24AFC,
+            0x24C68,
+            0x24CC4,
+            0x28848,
+            0x2CB98,
+            0x2EBFC,
+            0x322E4,
+            0x32A14,
+            0x32CD0,
+            0x32D90,
+            0x3771C,
+            0x37760,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x22DE7D0,
+            0x22DE804,
+            0x22DF404,
+            0x22E597C,
+            0x22E5D08,
+            0x22E5D28,
+            0x22E5ED8,
+            0x22E5F0C,
+            0x22E6200,
+            0x22E6A10,
+            0x22E737C,
+            0x22E874C,
+            0x22E95EC,
+            0x22E9670,
+            0x22E96B4,
+            0x22E9758,
+            0x22E97F0,
+            0x22E9808,
+            0x22E9824,
+            0x22E988C,
+            0x22E9DA8,
+            0x22EA990,
+            0x22EA9F4,
+            0x22EAA48,
+            0x22EAA6C,
+            0x22EAC10,
+            0x22EACC8,
+            0x22EAD28,
+            0x22EB5AC,
+            0x22ED174,
+            0x22EE358,
+            0x22EE878,
+            0x22F2BA8,
+            0x22F5E74,
+            0x22F5FB4,
+            0x22F62E8,
+            0x22F696C,
+            0x22F73D4,
+            0x22F84E4,
+            0x22F858C,
+            0xFFFFFFFF,
+            0x22F9340,
+            0x22F939C,
+            0x22F9BFC,
+            0x22FAA4C,
+            0x22FD0AC,
+            0x22FE820,
+            0x22FE830,
+            0x23004FC,
+            0x23005B4,
+            0x23005EC,
+            0x230060C,
+            0x23023DC,
+            0x2302548,
+            0x23025A4,
+            0x2306128,
+            0x230A478,
+            0x230C4DC,
+            0x230FBC4,
+            0x23102F4,
+            0x23105B0,
+            0x2310670,
+            0x2314FFC,
+            0x2315040,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1748,
+            1749,
+            1750,
+            1751,
+            1752,
+            1,
+            1753,
+            1754,
+            1,
+            1,
+            1,
+            1755,
+            1756,
+            1757,
+            1758,
+            1759,
+            1760,
+            1761,
+            1762,
+            1763,
+            1764,
+            1765,
+            1766,
+            1767,
+            1768,
+            1769,
+            1770,
+            1771,
+            1772,
+            1773,
+            1774,
+            1774,
+            1775,
+            1776,
+            1777,
+            1778,
+            1779,
+            1780,
+            1781,
+            1782,
+            1783,
+            1784,
+            1785,
+            1786,
+            1787,
+            1788,
+            1789,
+            1790,
+            1791,
+            1792,
+            1793,
+            1794,
+            1795,
+            1796,
+            1797,
+            1798,
+            1799,
+            1800,
+            1801,
+            1802,
+            1803,
+            1804,
+            1805,
+            1806,
+        ),
+    ),
+    c_types=None,
+    multi={
+        40: ((0x1ACB8, 0x1AE08), (0x22F8598, 0x22F86E8)),
+    },
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "OVERLAY11_UNKNOWN_TABLE__NA_2316A38",
+        "SCRIPT_COMMAND_PARSING_DATA",
+        "SCRIPT_OP_CODE_NAMES",
+        "SCRIPT_OP_CODES",
+        "OVERLAY11_DEBUG_STRINGS",
+        "C_ROUTINE_NAMES",
+        "C_ROUTINES",
+        "GROUND_WEATHER_TABLE",
+        "GROUND_WAN_FILES_TABLE",
+        "OBJECTS",
+        "RECRUITMENT_TABLE_LOCATIONS",
+        "RECRUITMENT_TABLE_LEVELS",
+        "RECRUITMENT_TABLE_SPECIES",
+        "LEVEL_TILEMAP_LIST",
+        "SETANIMATION_TABLE",
+        "TEAM_INFO_BOX_DEFAULT_WINDOW_PARAMS",
+        "OVERLAY11_OVERLAY_LOAD_TABLE",
+        "UNIONALL_RAM_ADDRESS",
+        "GROUND_STATE_MAP",
+        "GROUND_STATE_WEATHER",
+        "GROUND_STATE_PTRS",
+        "WORLD_MAP_MODE",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0x3A75C,
+            0x3A77C,
+            0x3C294,
+            0x3CE8C,
+            0x3D770,
+            0x404AC,
+            0x41A94,
+            0x41AC4,
+            0x42AD8,
+            0x44518,
+            0x44530,
+            0x4455C,
+            0x449B0,
+            0x45550,
+            0x460E0,
+            0x46D08,
+            0x48924,
+            0x48940,
+            0xFFFFFFFF,
+            0x48974,
+            0x48A64,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0x231803C,
+            0x231805C,
+            0x2319B74,
+            0x231A76C,
+            0x231B050,
+            0x231DD8C,
+            0x231F374,
+            0x231F3A4,
+            0x23203B8,
+            0x2321DF8,
+            0x2321E10,
+            0x2321E3C,
+            0x2322290,
+            0x2322E30,
+            0x23239C0,
+            0x23245E8,
+            0x2326204,
+            0x2326220,
+            0xFFFFFFFF,
+            0x2326254,
+            0x2326344,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xBF8,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x15E8,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x1A04,
+            0x16,
+            0x2C,
+            0x2C,
+            0x288,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x18,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1807,
+            1808,
+            1809,
+            1810,
+            1811,
+            1812,
+            1813,
+            1814,
+            1815,
+            1816,
+            1817,
+            1818,
+            1819,
+            1820,
+            1821,
+            1822,
+            1823,
+            1025,
+            1025,
+            1824,
+            1825,
+            1826,
+        ),
+    ),
+    c_types=(
+        "",
+        "undefined[32]",
+        "char[0]",
+        "struct script_opcode_table",
+        "char[0]",
+        "char[0]",
+        "struct common_routine_table",
+        "struct ground_weather_entry[12]",
+        "char[343][12]",
+        "struct script_object[0]",
+        "struct dungeon_id_16[22]",
+        "int16_t[22]",
+        "struct monster_id_16[22]",
+        "struct level_tilemap_list_entry[81]",
+        "struct animation_data[84]",
+        "struct window_params",
+        "struct overlay_load_entry[21]",
+        "",
+        "",
+        "",
+        "struct main_ground_data",
+        "uint32_t",
+    ),
+    multi={},
+)
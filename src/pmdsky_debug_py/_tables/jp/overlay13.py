@@ -0,0 +1,247 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay13 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "EntryOverlay13",
+        "ExitOverlay13",
+        "Overlay13SwitchFunctionNa238A1C8",
+        "Overlay13SwitchFunctionNa238A574",
+        "GetPersonality",
+        "GetOptionStringFromID",
+        "WaitForNextStep",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x0,
+            0x50,
+            0x88,
+            0x434,
+            0x1C6C,
+            0x1CB4,
+            0x1D10,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238B6A0,
+            0x238B6F0,
+            0x238B728,
+            0x238BAD4,
+            0x238D30C,
+            0x238D354,
+            0x238D3B0,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1827,
+            163,
+            1828,
+            1829,
+            1830,
+            1831,
+            1832,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "QUIZ_BORDER_COLOR_TABLE",
+        "PORTRAIT_ATTRIBUTES",
+        "QUIZ_MALE_FEMALE_BOOST_TABLE",
+        "OVERLAY13_UNKNOWN_STRUCT__NA_238C024",
+        "QUIZ_WINDOW_PARAMS_1",
+        "QUIZ_WINDOW_PARAMS_2",
+        "QUIZ_WINDOW_PARAMS_3",
+        "QUIZ_WINDOW_PARAMS_4",
+        "QUIZ_MENU_ITEMS_1",
+        "STARTERS_PARTNER_IDS",
+        "STARTERS_HERO_IDS",
+        "STARTERS_TYPE_INCOMPATIBILITY_TABLE",
+        "STARTERS_STRINGS",
+        "QUIZ_QUESTION_STRINGS",
+        "QUIZ_ANSWER_STRINGS",
+        "QUIZ_ANSWER_POINTS",
+        "OVERLAY13_RESERVED_SPACE",
+        "OVERLAY13_UNKNOWN_POINTER__NA_238CEA0",
+        "OVERLAY13_UNKNOWN_POINTER__NA_238CEA4",
+        "OVERLAY13_UNKNOWN_POINTER__NA_238CEA8",
+        "QUIZ_WINDOW_PARAMS_5",
+        "QUIZ_WINDOW_PARAMS_6",
+        "QUIZ_DEBUG_MENU_ITEMS",
+        "OVERLAY13_UNKNOWN_STRUCT__NA_238CF14",
+        "QUIZ_QUESTION_ANSWER_ASSOCIATIONS",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x1ED8,
+            0x1EDC,
+            0x1EE4,
+            0x1EEC,
+            0x1EFC,
+            0x1F0C,
+            0x1F1C,
+            0x1F2C,
+            0x1F3C,
+            0x1F54,
+            0x1F80,
+            0x1FC0,
+            0x2014,
+            0x2074,
+            0x20F8,
+            0x2258,
+            0x2D58,
+            0x2D60,
+            0x2D64,
+            0x2D70,
+            0x2D6C,
+            0x2D7C,
+            0x2D8C,
+            0x2DDC,
+            0x2DE4,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238D578,
+            0x238D57C,
+            0x238D584,
+            0x238D58C,
+            0x238D59C,
+            0x238D5AC,
+            0x238D5BC,
+            0x238D5CC,
+            0x238D5DC,
+            0x238D5F4,
+            0x238D620,
+            0x238D660,
+            0x238D6B4,
+            0x238D714,
+            0x238D798,
+            0x238D8F8,
+            0x238E3F8,
+            0x238E400,
+            0x238E404,
+            0x238E410,
+            0x238E40C,
+            0x238E41C,
+            0x238E42C,
+            0x238E47C,
+            0x238E484,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0x4,
+            0x8,
+            0x8,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x18,
+            0x2A,
+            0x40,
+            0x54,
+            0x60,
+            0x84,
+            0x160,
+            0xAE0,
+            0x10,
+            0x4,
+            0x4,
+            0x4,
+            0x10,
+            0x10,
+            0x48,
+            0x10,
+            0x84,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1833,
+            1834,
+            266,
+            1835,
+            1836,
+            1837,
+            1838,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1839,
+        ),
+    ),
+    c_types=(
+        "",
+        "",
+        "",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[3]",
+        "struct monster_id_16[21]",
+        "struct monster_id_16[32]",
+        "",
+        "uint16_t[48]",
+        "uint16_t[66]",
+        "uint16_t[176]",
+        "struct quiz_answer_points_entry[174]",
+        "",
+        "",
+        "",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[9]",
+        "",
+        "uint16_t[66]",
+    ),
+    multi={},
+)
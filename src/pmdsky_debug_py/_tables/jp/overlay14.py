@@ -0,0 +1,395 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay14 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "SentrySetupState",
+        "SentryUpdateDisplay",
+        "SentrySetExitingState",
+        "SentryRunState",
+        "SentrySetStateIntermediate",
+        "SentryState0",
+        "SentryState1",
+        "SentryState2",
+        "SentryState3",
+        "SentryState4",
+        "SentryStateExit",
+        "SentryState6",
+        "SentryState7",
+        "SentryState8",
+        "SentryState9",
+        "SentryStateA",
+        "SentryStateB",
+        "SentryStateGenerateChoices",
+        "SentryStateGetUserChoice",
+        "SentryStateFinalizeRound",
+        "SentryStateF",
+        "SentryState10",
+        "SentryState11",
+        "SentryState12",
+        "SentryState13",
+        "SentryState14",
+        "SentryState15",
+        "SentryState16",
+        "SentryState17",
+        "SentryState18",
+        "SentryState19",
+        "SentryState1A",
+        "SentryStateFinalizePoints",
+        "SentryState1C",
+        "SentryState1D",
+        "SentryState1E",
+        "SentryState1F",
+        "SentryState20",
+        "SentryState21",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x0,
+            0xCC0,
+            0x159C,
+            0x16C0,
+            0x2090,
+            0x20B0,
+            0x20D4,
+            0x212C,
+            0x2150,
+            0x2278,
+            0x229C,
+            0x22A8,
+            0x22CC,
+            0x22E4,
+            0x2308,
+            0x232C,
+            0x2344,
+            0x235C,
+            0x295C,
+            0x2E8C,
+            0x31D0,
+            0x31E8,
+            0x3260,
+            0x3278,
+            0x32B0,
+            0x32D8,
+            0x32F0,
+            0x3330,
+            0x3388,
+            0x3400,
+            0x3438,
+            0x3450,
+            0x3490,
+            0x3520,
+            0x3564,
+            0x35C8,
+            0x35E0,
+            0x365C,
+            0x3674,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238B6A0,
+            0x238C360,
+            0x238CC3C,
+            0x238CD60,
+            0x238D730,
+            0x238D750,
+            0x238D774,
+            0x238D7CC,
+            0x238D7F0,
+            0x238D918,
+            0x238D93C,
+            0x238D948,
+            0x238D96C,
+            0x238D984,
+            0x238D9A8,
+            0x238D9CC,
+            0x238D9E4,
+            0x238D9FC,
+            0x238DFFC,
+            0x238E52C,
+            0x238E870,
+            0x238E888,
+            0x238E900,
+            0x238E918,
+            0x238E950,
+            0x238E978,
+            0x238E990,
+            0x238E9D0,
+            0x238EA28,
+            0x238EAA0,
+            0x238EAD8,
+            0x238EAF0,
+            0x238EB30,
+            0x238EBC0,
+            0x238EC04,
+            0x238EC68,
+            0x238EC80,
+            0x238ECFC,
+            0x238ED14,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1840,
+            1841,
+            1842,
+            1843,
+            1844,
+            1845,
+            1845,
+            1845,
+            1845,
+            1845,
+            1846,
+            1845,
+            1847,
+            1845,
+            1845,
+            1848,
+            1845,
+            1849,
+            1850,
+            1851,
+            1845,
+            1845,
+            1852,
+            1845,
+            1853,
+            1854,
+            1845,
+            1845,
+            1855,
+            1845,
+            1856,
+            1845,
+            1857,
+            1858,
+            1845,
+            1859,
+            1845,
+            1860,
+            1845,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "SENTRY_DUTY_STRUCT_SIZE",
+        "SENTRY_LOUDRED_MONSTER_ID",
+        "STRING_ID_SENTRY_TOP_SESSIONS",
+        "STRING_ID_SENTRY_INSTRUCTIONS",
+        "STRING_ID_SENTRY_HERE_COMES",
+        "STRING_ID_SENTRY_WHOSE_FOOTPRINT",
+        "STRING_ID_SENTRY_TRY_AGAIN",
+        "STRING_ID_SENTRY_OUT_OF_TIME",
+        "STRING_ID_SENTRY_FOOTPRINT_IS_6EE",
+        "STRING_ID_SENTRY_COME_IN_6EF",
+        "STRING_ID_SENTRY_WRONG",
+        "STRING_ID_SENTRY_BUCK_UP",
+        "STRING_ID_SENTRY_FOOTPRINT_IS_6EC",
+        "STRING_ID_SENTRY_COME_IN_6ED",
+        "STRING_ID_SENTRY_KEEP_YOU_WAITING",
+        "STRING_ID_SENTRY_THATLL_DO_IT",
+        "SENTRY_CHATOT_MONSTER_ID",
+        "STRING_ID_SENTRY_NO_MORE_VISITORS",
+        "STRING_ID_SENTRY_THATS_ALL",
+        "SENTRY_GROVYLE_MONSTER_ID",
+        "SENTRY_DEBUG_MENU_ITEMS",
+        "SENTRY_DUTY_PTR",
+        "SENTRY_DUTY_STATE_HANDLER_TABLE",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2060,
+            0x2064,
+            0x2068,
+            0x292C,
+            0x3968,
+            0x3A40,
+            0x3A54,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x238D700,
+            0x238D704,
+            0x238D708,
+            0x238DFCC,
+            0x238F008,
+            0x238F0E0,
+            0x238F0F4,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x4,
+            0xFFFFFFFF,
+            0x4,
+            0x4,
+            0x48,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1861,
+            1862,
+            1863,
+            1864,
+            1865,
+            1866,
+            1867,
+            1868,
+            1869,
+            1870,
+            1871,
+            1872,
+            1873,
+            1874,
+            1875,
+            1876,
+            1877,
+            1878,
+            1879,
+            1880,
+            1,
+            1881,
+            1882,
+        ),
+    ),
+    c_types=(
+        "uint32_t",
+        "enum monster_id",
+        "int",
+        "int",
+        "int",
+        "int",
+        "int",
+        "int",
+        "int",
+        "int",
+        "int",
+        "int",
+        "int",
+        "int",
+        "int",
+        "int",
+        "enum monster_id",
+        "int",
+        "int",
+        "enum monster_id",
+        "struct simple_menu_id_item[9]",
+        "struct sentry_duty*",
+        "state_handler_fn_t[35]",
+    ),
+    multi={},
+)
@@ -0,0 +1,155 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay17 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+
+DATA = SymbolTable(
+    names=(
+        "ASSEMBLY_WINDOW_PARAMS_1",
+        "ASSEMBLY_WINDOW_PARAMS_2",
+        "ASSEMBLY_WINDOW_PARAMS_3",
+        "ASSEMBLY_WINDOW_PARAMS_4",
+        "ASSEMBLY_WINDOW_PARAMS_5",
+        "ASSEMBLY_MENU_ITEMS_CONFIRM",
+        "ASSEMBLY_MAIN_MENU_ITEMS_1",
+        "ASSEMBLY_MAIN_MENU_ITEMS_2",
+        "ASSEMBLY_SUBMENU_ITEMS_1",
+        "ASSEMBLY_SUBMENU_ITEMS_2",
+        "ASSEMBLY_SUBMENU_ITEMS_3",
+        "ASSEMBLY_SUBMENU_ITEMS_4",
+        "ASSEMBLY_SUBMENU_ITEMS_5",
+        "ASSEMBLY_SUBMENU_ITEMS_6",
+        "ASSEMBLY_SUBMENU_ITEMS_7",
+        "OVERLAY17_FUNCTION_POINTER_TABLE",
+        "OVERLAY17_RESERVED_SPACE",
+        "OVERLAY17_UNKNOWN_POINTER__NA_238BE00",
+        "OVERLAY17_UNKNOWN_POINTER__NA_238BE04",
+        "OVERLAY17_UNKNOWN_POINTER__NA_238BE08",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x19F0,
+            0x1A00,
+            0x1A10,
+            0x1A20,
+            0x1A30,
+            0x1A40,
+            0x1A58,
+            0x1A70,
+            0x1A90,
+            0x1AB8,
+            0x1AE8,
+            0x1B18,
+            0x1B50,
+            0x1B88,
+            0x1BC0,
+            0x1C00,
+            0xFFFFFFFF,
+            0x1CC0,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238D090,
+            0x238D0A0,
+            0x238D0B0,
+            0x238D0C0,
+            0x238D0D0,
+            0x238D0E0,
+            0x238D0F8,
+            0x238D110,
+            0x238D130,
+            0x238D158,
+            0x238D188,
+            0x238D1B8,
+            0x238D1F0,
+            0x238D228,
+            0x238D260,
+            0x238D2A0,
+            0xFFFFFFFF,
+            0x238D360,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x18,
+            0x18,
+            0x20,
+            0x28,
+            0x30,
+            0x30,
+            0x38,
+            0x38,
+            0x38,
+            0x40,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            266,
+            266,
+            266,
+            266,
+            266,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[5]",
+        "struct simple_menu_id_item[6]",
+        "struct simple_menu_id_item[6]",
+        "struct simple_menu_id_item[7]",
+        "struct simple_menu_id_item[7]",
+        "struct simple_menu_id_item[7]",
+        "struct simple_menu_id_item[8]",
+        "void*[42]",
+        "",
+        "",
+        "",
+        "",
+    ),
+    multi={},
+)
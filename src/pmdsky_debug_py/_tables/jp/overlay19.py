@@ -0,0 +1,196 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay19 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "GetBarItem",
+        "GetRecruitableMonsterAll",
+        "GetRecruitableMonsterList",
+        "GetRecruitableMonsterListRestricted",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x0,
+            0x84,
+            0x134,
+            0x1DC,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238B6A0,
+            0x238B724,
+            0x238B7D4,
+            0x238B87C,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1884,
+            1885,
+            1885,
+            1885,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "OVERLAY19_UNKNOWN_TABLE__NA_238DAE0",
+        "BAR_UNLOCKABLE_DUNGEONS_TABLE",
+        "BAR_RECRUITABLE_MONSTER_TABLE",
+        "BAR_AVAILABLE_ITEMS",
+        "OVERLAY19_UNKNOWN_STRING_IDS__NA_238E178",
+        "OVERLAY19_UNKNOWN_STRUCT__NA_238E1A4",
+        "OVERLAY19_UNKNOWN_STRING_IDS__NA_238E1CC",
+        "BAR_WINDOW_PARAMS_1",
+        "BAR_WINDOW_PARAMS_2",
+        "BAR_WINDOW_PARAMS_3",
+        "BAR_MENU_ITEMS_CONFIRM_1",
+        "BAR_MENU_ITEMS_CONFIRM_2",
+        "OVERLAY19_UNKNOWN_STRING_IDS__NA_238E238",
+        "BAR_MAIN_MENU_ITEMS",
+        "BAR_SUBMENU_ITEMS_1",
+        "BAR_SUBMENU_ITEMS_2",
+        "OVERLAY19_RESERVED_SPACE",
+        "OVERLAY19_UNKNOWN_POINTER__NA_238E360",
+        "OVERLAY19_UNKNOWN_POINTER__NA_238E364",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x3998,
+            0x39A0,
+            0x39AC,
+            0x3A84,
+            0x4030,
+            0x405C,
+            0x4084,
+            0x4090,
+            0x40A0,
+            0x40B0,
+            0x40C0,
+            0x40D8,
+            0x40F0,
+            0x4108,
+            0x4128,
+            0x4148,
+            0xFFFFFFFF,
+            0x4200,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238F038,
+            0x238F040,
+            0x238F04C,
+            0x238F124,
+            0x238F6D0,
+            0x238F6FC,
+            0x238F724,
+            0x238F730,
+            0x238F740,
+            0x238F750,
+            0x238F760,
+            0x238F778,
+            0x238F790,
+            0x238F7A8,
+            0x238F7C8,
+            0x238F7E8,
+            0xFFFFFFFF,
+            0x238F8A0,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xD8,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x18,
+            0x18,
+            0xFFFFFFFF,
+            0x20,
+            0x20,
+            0x30,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1886,
+            1887,
+            1888,
+            1889,
+            266,
+            1890,
+            266,
+            266,
+            266,
+            266,
+            1,
+            1,
+            266,
+            1,
+            1,
+            1,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "",
+        "struct dungeon_id_16[6]",
+        "struct monster_id_16[108]",
+        "struct bar_item[66]",
+        "",
+        "",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[6]",
+        "",
+        "",
+        "",
+    ),
+    multi={},
+)
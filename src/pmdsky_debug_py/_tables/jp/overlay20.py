@@ -0,0 +1,185 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay20 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+
+DATA = SymbolTable(
+    names=(
+        "OVERLAY20_UNKNOWN_POINTER__NA_238CF7C",
+        "RECYCLE_MENU_ITEMS_CONFIRM_1",
+        "RECYCLE_MENU_ITEMS_CONFIRM_2",
+        "RECYCLE_SUBMENU_ITEMS_1",
+        "RECYCLE_SUBMENU_ITEMS_2",
+        "RECYCLE_MAIN_MENU_ITEMS_1",
+        "OVERLAY20_UNKNOWN_TABLE__NA_238D014",
+        "RECYCLE_WINDOW_PARAMS_1",
+        "RECYCLE_WINDOW_PARAMS_2",
+        "RECYCLE_WINDOW_PARAMS_3",
+        "RECYCLE_WINDOW_PARAMS_4",
+        "RECYCLE_WINDOW_PARAMS_5",
+        "RECYCLE_WINDOW_PARAMS_6",
+        "RECYCLE_MAIN_MENU_ITEMS_2",
+        "RECYCLE_WINDOW_PARAMS_7",
+        "RECYCLE_WINDOW_PARAMS_8",
+        "RECYCLE_WINDOW_PARAMS_9",
+        "RECYCLE_WINDOW_PARAMS_10",
+        "RECYCLE_WINDOW_PARAMS_11",
+        "RECYCLE_MAIN_MENU_ITEMS_3",
+        "OVERLAY20_RESERVED_SPACE",
+        "OVERLAY20_UNKNOWN_POINTER__NA_238D120",
+        "OVERLAY20_UNKNOWN_POINTER__NA_238D124",
+        "OVERLAY20_UNKNOWN_POINTER__NA_238D128",
+        "OVERLAY20_UNKNOWN_POINTER__NA_238D12C",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x2E38,
+            0x2E40,
+            0x2E58,
+            0x2E70,
+            0x2E88,
+            0x2EA8,
+            0x2ED0,
+            0x2EE4,
+            0x2EF4,
+            0x2F04,
+            0x2F14,
+            0x2F24,
+            0x2F34,
+            0x2F44,
+            0x2F64,
+            0x2F74,
+            0x2F84,
+            0x2F94,
+            0x2FA4,
+            0x2FB4,
+            0xFFFFFFFF,
+            0x2FE0,
+            0x2FE4,
+            0x2FE8,
+            0x2FEC,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238E4D8,
+            0x238E4E0,
+            0x238E4F8,
+            0x238E510,
+            0x238E528,
+            0x238E548,
+            0x238E570,
+            0x238E584,
+            0x238E594,
+            0x238E5A4,
+            0x238E5B4,
+            0x238E5C4,
+            0x238E5D4,
+            0x238E5E4,
+            0x238E604,
+            0x238E614,
+            0x238E624,
+            0x238E634,
+            0x238E644,
+            0x238E654,
+            0xFFFFFFFF,
+            0x238E680,
+            0x238E684,
+            0x238E688,
+            0x238E68C,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0x18,
+            0x18,
+            0x18,
+            0x20,
+            0x28,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x20,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x18,
+            0xFFFFFFFF,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            266,
+            1,
+            1,
+            1,
+            1,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[5]",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[4]",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[3]",
+        "",
+        "",
+        "",
+        "",
+        "",
+    ),
+    multi={},
+)
@@ -0,0 +1,167 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay22 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+
+DATA = SymbolTable(
+    names=(
+        "SHOP_WINDOW_PARAMS_1",
+        "SHOP_WINDOW_PARAMS_2",
+        "OVERLAY22_UNKNOWN_STRUCT__NA_238E85C",
+        "SHOP_MENU_ITEMS_CONFIRM",
+        "SHOP_MAIN_MENU_ITEMS_1",
+        "SHOP_MAIN_MENU_ITEMS_2",
+        "SHOP_MAIN_MENU_ITEMS_3",
+        "OVERLAY22_UNKNOWN_STRING_IDS",
+        "SHOP_WINDOW_PARAMS_3",
+        "SHOP_WINDOW_PARAMS_4",
+        "SHOP_WINDOW_PARAMS_5",
+        "SHOP_WINDOW_PARAMS_6",
+        "SHOP_WINDOW_PARAMS_7",
+        "SHOP_WINDOW_PARAMS_8",
+        "SHOP_WINDOW_PARAMS_9",
+        "SHOP_WINDOW_PARAMS_10",
+        "OVERLAY22_RESERVED_SPACE",
+        "OVERLAY22_UNKNOWN_POINTER__NA_238EC60",
+        "OVERLAY22_UNKNOWN_POINTER__NA_238EC64",
+        "OVERLAY22_UNKNOWN_POINTER__NA_238EC68",
+        "OVERLAY22_UNKNOWN_POINTER__NA_238EC6C",
+        "OVERLAY22_UNKNOWN_POINTER__NA_238EC70",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x46DC,
+            0x46FC,
+            0x471C,
+            0x4728,
+            0x4740,
+            0x4760,
+            0x4780,
+            0x47B0,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x4840,
+            0x4850,
+            0x4860,
+            0x4870,
+            0x4880,
+            0xFFFFFFFF,
+            0x4B20,
+            0xFFFFFFFF,
+            0x4B28,
+            0xFFFFFFFF,
+            0x4B30,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238FD7C,
+            0x238FD9C,
+            0x238FDBC,
+            0x238FDC8,
+            0x238FDE0,
+            0x238FE00,
+            0x238FE20,
+            0x238FE50,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x238FEE0,
+            0x238FEF0,
+            0x238FF00,
+            0x238FF10,
+            0x238FF20,
+            0xFFFFFFFF,
+            0x23901C0,
+            0xFFFFFFFF,
+            0x23901C8,
+            0xFFFFFFFF,
+            0x23901D0,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x18,
+            0x20,
+            0x20,
+            0x30,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            266,
+            266,
+            266,
+            1,
+            1,
+            1,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "struct window_params",
+        "struct window_params",
+        "",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[6]",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+    ),
+    multi={},
+)
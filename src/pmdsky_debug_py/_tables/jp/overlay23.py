@@ -0,0 +1,149 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay23 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+
+DATA = SymbolTable(
+    names=(
+        "OVERLAY23_UNKNOWN_VALUE__NA_238D2E8",
+        "OVERLAY23_UNKNOWN_VALUE__NA_238D2EC",
+        "OVERLAY23_UNKNOWN_STRUCT__NA_238D2F0",
+        "STORAGE_MENU_ITEMS_CONFIRM",
+        "STORAGE_MAIN_MENU_ITEMS_1",
+        "STORAGE_MAIN_MENU_ITEMS_2",
+        "STORAGE_MAIN_MENU_ITEMS_3",
+        "STORAGE_MAIN_MENU_ITEMS_4",
+        "OVERLAY23_UNKNOWN_STRING_IDS",
+        "STORAGE_WINDOW_PARAMS_1",
+        "STORAGE_WINDOW_PARAMS_2",
+        "STORAGE_WINDOW_PARAMS_3",
+        "STORAGE_WINDOW_PARAMS_4",
+        "STORAGE_WINDOW_PARAMS_5",
+        "STORAGE_WINDOW_PARAMS_6",
+        "STORAGE_WINDOW_PARAMS_7",
+        "STORAGE_WINDOW_PARAMS_8",
+        "OVERLAY23_RESERVED_SPACE",
+        "OVERLAY23_UNKNOWN_POINTER__NA_238D8A0",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x3200,
+            0x3204,
+            0x3208,
+            0x3214,
+            0x322C,
+            0x324C,
+            0x326C,
+            0x328C,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x3310,
+            0x3320,
+            0x3330,
+            0x3340,
+            0x3350,
+            0xFFFFFFFF,
+            0x37C0,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238E8A0,
+            0x238E8A4,
+            0x238E8A8,
+            0x238E8B4,
+            0x238E8CC,
+            0x238E8EC,
+            0x238E90C,
+            0x238E92C,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x238E9B0,
+            0x238E9C0,
+            0x238E9D0,
+            0x238E9E0,
+            0x238E9F0,
+            0xFFFFFFFF,
+            0x238EE60,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x18,
+            0x20,
+            0x20,
+            0x20,
+            0x28,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            266,
+            266,
+            266,
+            1,
+            1,
+            1,
+            1,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "",
+        "",
+        "",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[5]",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "",
+    ),
+    multi={},
+)
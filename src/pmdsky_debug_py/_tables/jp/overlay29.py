@@ -0,0 +1,4670 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay29 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "GetWeatherColorTable",
+        "DungeonAlloc",
+        "GetDungeonPtrMaster",
+        "DungeonZInit",
+        "DungeonFree",
+        "RunDungeon",
+        "EntityIsValid",
+        "GetFloorType",
+        "TryForcedLoss",
+        "IsBossFight",
+        "IsCurrentFixedRoomBossFight",
+        "IsMarowakTrainingMaze",
+        "FixedRoomIsSubstituteRoom",
+        "StoryRestrictionsEnabled",
+        "GetScenarioBalanceVeneer",
+        "FadeToBlack",
+        "CheckTouchscreenArea",
+        "GetTrapInfo",
+        "GetItemInfo",
+        "GetTileAtEntity",
+        "UpdateEntityPixelPos",
+        "SetEntityPixelPosXY",
+        "IncrementEntityPixelPosXY",
+        "CreateEnemyEntity",
+        "SpawnTrap",
+        "SpawnItemEntity",
+        "ShouldMinimapDisplayEntity",
+        "ShouldDisplayEntity",
+        "ShouldDisplayEntityWrapper",
+        "CanSeeTarget",
+        "CanTargetEntity",
+        "CanTargetPosition",
+        "PopulateActiveMonsterPtrs",
+        "GetTeamMemberIndex",
+        "SubstitutePlaceholderStringTags",
+        "UpdateMapSurveyorFlag",
+        "PointCameraToMonster",
+        "UpdateCamera",
+        "ItemIsActive",
+        "GetVisibilityRange",
+        "RevealWholeFloor",
+        "PlayEffectAnimationEntity",
+        "PlayEffectAnimationPos",
+        "PlayEffectAnimationPixelPos",
+        "AnimationDelayOrSomething",
+        "UpdateStatusIconFlags",
+        "PlayEffectAnimation0x171Full",
+        "PlayEffectAnimation0x171",
+        "ShowPpRestoreEffect",
+        "ShouldDisplayEntityAdvanced",
+        "PlayEffectAnimation0x1A9",
+        "PlayEffectAnimation0x18E",
+        "LoadMappaFileAttributes",
+        "GetItemIdToSpawn",
+        "CopySpawnEntriesMaster",
+        "MonsterSpawnListPartialCopy",
+        "IsOnMonsterSpawnList",
+        "GetMonsterIdToSpawn",
+        "GetMonsterLevelToSpawn",
+        "AllocTopScreenStatus",
+        "FreeTopScreenStatus",
+        "InitializeTeamStats",
+        "UpdateTeamStatsWrapper",
+        "FreeTeamStatsWrapper",
+        "AssignTopScreenHandlers",
+        "HandleTopScreenFades",
+        "FreeTopScreen",
+        "GetDirectionTowardsPosition",
+        "GetChebyshevDistance",
+        "IsPositionActuallyInSight",
+        "IsPositionInSight",
+        "GetLeader",
+        "GetLeaderMonster",
+        "GetRandomTile",
+        "FindNearbyUnoccupiedTile",
+        "FindClosestUnoccupiedTileWithin2",
+        "FindFarthestUnoccupiedTileWithin2",
+        "FindUnoccupiedTileWithin3",
+        "TickStatusTurnCounter",
+        "AdvanceFrame",
+        "DisplayAnimatedNumbers",
+        "SetDungeonRngPreseed23Bit",
+        "GenerateDungeonRngSeed",
+        "GetDungeonRngPreseed",
+        "SetDungeonRngPreseed",
+        "InitDungeonRng",
+        "DungeonRand16Bit",
+        "DungeonRandInt",
+        "DungeonRandRange",
+        "DungeonRandOutcome",
+        "CalcStatusDuration",
+        "DungeonRngUnsetSecondary",
+        "DungeonRngSetSecondary",
+        "DungeonRngSetPrimary",
+        "MusicTableIdxToMusicId",
+        "ChangeDungeonMusic",
+        "TrySwitchPlace",
+        "SetLeaderActionFields",
+        "ClearMonsterActionFields",
+        "SetMonsterActionFields",
+        "SetActionPassTurnOrWalk",
+        "GetItemToUseByIndex",
+        "GetItemToUse",
+        "GetItemAction",
+        "RemoveUsedItem",
+        "AddDungeonSubMenuOption",
+        "DisableDungeonSubMenuOption",
+        "SetActionRegularAttack",
+        "SetActionUseMovePlayer",
+        "SetActionUseMoveAi",
+        "RunFractionalTurn",
+        "RunLeaderTurn",
+        "TrySpawnMonsterAndActivatePlusMinus",
+        "IsFloorOver",
+        "DecrementWindCounter",
+        "IsDungeonEndReasonFailure",
+        "SetForcedLossReason",
+        "GetForcedLossReason",
+        "BindTrapToTile",
+        "AreLateGameTrapsEnabledWrapper",
+        "SpawnEnemyTrapAtPos",
+        "PrepareTrapperTrap",
+        "TrySpawnTrap",
+        "TrySpawnTrapperTrap",
+        "TryRemoveTrap",
+        "TryTriggerTrap",
+        "ApplyMudTrapEffect",
+        "ApplyStickyTrapEffect",
+        "ApplyGrimyTrapEffect",
+        "ApplyPitfallTrapEffect",
+        "ApplySummonTrapEffect",
+        "ApplyPpZeroTrapEffect",
+        "ApplyPokemonTrapEffect",
+        "ApplyTripTrapEffect",
+        "ApplyStealthRockTrapEffect",
+        "ApplyToxicSpikesTrapEffect",
+        "ApplyRandomTrapEffect",
+        "ApplyGrudgeTrapEffect",
+        "ApplyTrapEffect",
+        "RevealTrapsNearby",
+        "ShouldRunMonsterAi",
+        "DebugRecruitingEnabled",
+        "TryActivateIqBooster",
+        "IsSecretBazaarNpcBehavior",
+        "GetLeaderAction",
+        "GetEntityTouchscreenArea",
+        "SetLeaderAction",
+        "ShouldLeaderKeepRunning",
+        "CheckLeaderTile",
+        "ChangeLeader",
+        "UseSingleUseItemWrapper",
+        "UseSingleUseItem",
+        "UseThrowableItem",
+        "ResetDamageData",
+        "FreeLoadedAttackSpriteAndMore",
+        "SetAndLoadCurrentAttackAnimation",
+        "ClearLoadedAttackSprite",
+        "GetLoadedAttackSpriteId",
+        "DungeonGetTotalSpriteFileSize",
+        "DungeonGetSpriteIndex",
+        "JoinedAtRangeCheck2Veneer",
+        "FloorNumberIsEven",
+        "GetKecleonIdToSpawnByFloor",
+        "StoreSpriteFileIndexBothGenders",
+        "LoadMonsterSpriteInner",
+        "SwapMonsterWanFileIndex",
+        "LoadMonsterSprite",
+        "DeleteMonsterSpriteFile",
+        "DeleteAllMonsterSpriteFiles",
+        "EuFaintCheck",
+        "HandleFaint",
+        "MoveMonsterToPos",
+        "CreateMonsterSummaryFromMonster",
+        "UpdateAiTargetPos",
+        "SetMonsterTypeAndAbility",
+        "TryActivateSlowStart",
+        "TryActivateArtificialWeatherAbilities",
+        "GetMonsterApparentId",
+        "TryActivateTraceAndColorChange",
+        "DefenderAbilityIsActive",
+        "IsMonster",
+        "TryActivateConversion2",
+        "TryActivateTruant",
+        "TryPointCameraToMonster",
+        "ReevaluateSnatchMonster",
+        "GetRandomExplorerMazeMonster",
+        "RestorePpAllMovesSetFlags",
+        "CheckTeamMemberIdxVeneer",
+        "IsMonsterIdInNormalRangeVeneer",
+        "BoostIQ",
+        "ShouldMonsterHeadToStairs",
+        "MewSpawnCheck",
+        "TryEndStatusWithAbility",
+        "ExclusiveItemEffectIsActive",
+        "GetTeamMemberWithIqSkill",
+        "TeamMemberHasEnabledIqSkill",
+        "TeamLeaderIqSkillIsEnabled",
+        "CountMovesOutOfPp",
+        "HasSuperEffectiveMoveAgainstUser",
+        "TryEatItem",
+        "SetDecoyAiTracker",
+        "CheckSpawnThreshold",
+        "HasLowHealth",
+        "AreEntitiesAdjacent",
+        "IsSpecialStoryAlly",
+        "IsExperienceLocked",
+        "InitOtherMonsterData",
+        "InitEnemySpawnStats",
+        "InitEnemyStatsAndMoves",
+        "SpawnTeam",
+        "SpawnInitialMonsters",
+        "SpawnMonster",
+        "InitTeamMember",
+        "InitMonster",
+        "SubInitMonster",
+        "MarkShopkeeperSpawn",
+        "SpawnShopkeepers",
+        "GetMaxHpAtLevel",
+        "GetOffensiveStatAtLevel",
+        "GetDefensiveStatAtLevel",
+        "GetOutlawSpawnData",
+        "ExecuteMonsterAction",
+        "TryActivateFlashFireOnAllMonsters",
+        "HasStatusThatPreventsActing",
+        "GetMobilityTypeCheckSlip",
+        "GetMobilityTypeCheckSlipAndFloating",
+        "IsInvalidSpawnTile",
+        "GetMobilityTypeAfterIqSkills",
+        "CannotStandOnTile",
+        "CalcSpeedStage",
+        "CalcSpeedStageWrapper",
+        "GetNumberOfAttacks",
+        "GetMonsterDisplayNameType",
+        "GetMonsterName",
+        "SprintfStatic",
+        "IsMonsterDrowsy",
+        "MonsterHasNonvolatileNonsleepStatus",
+        "MonsterHasImmobilizingStatus",
+        "MonsterHasAttackInterferingStatus",
+        "MonsterHasSkillInterferingStatus",
+        "MonsterHasLeechSeedStatus",
+        "MonsterHasWhifferStatus",
+        "IsMonsterVisuallyImpaired",
+        "IsMonsterMuzzled",
+        "MonsterHasMiracleEyeStatus",
+        "MonsterHasNegativeStatus",
+        "IsMonsterSleeping",
+        "CheckVariousStatuses2",
+        "CheckVariousConditions",
+        "CheckVariousStatuses",
+        "CanMonsterMoveInDirection",
+        "GetDirectionalMobilityType",
+        "IsMonsterCornered",
+        "CanAttackInDirection",
+        "CanAiMonsterMoveInDirection",
+        "ShouldMonsterRunAway",
+        "ShouldMonsterRunAwayVariation",
+        "GetTreatmentBetweenMonsters",
+        "SafeguardIsActive",
+        "LeafGuardIsActive",
+        "IsProtectedFromStatDrops",
+        "NoGastroAcidStatus",
+        "AbilityIsActive",
+        "AbilityIsActiveVeneer",
+        "OtherMonsterAbilityIsActive",
+        "LevitateIsActive",
+        "MonsterIsType",
+        "IsTypeAffectedByGravity",
+        "HasTypeAffectedByGravity",
+        "CanSeeInvisibleMonsters",
+        "IsTacticSet",
+        "HasDropeyeStatus",
+        "IqSkillIsEnabled",
+        "UpdateIqSkills",
+        "GetMoveTypeForMonster",
+        "GetMovePower",
+        "MonsterCanThrowItems",
+        "UpdateStateFlags",
+        "IsProtectedFromNegativeStatus",
+        "AddExpSpecial",
+        "EnemyEvolution",
+        "LevelUpItemEffect",
+        "TryDecreaseLevel",
+        "LevelUp",
+        "GetMonsterMoves",
+        "EvolveMonster",
+        "ChangeMonsterAnimation",
+        "GetIdleAnimationId",
+        "DetermineAllMonsterShadow",
+        "DetermineMonsterShadow",
+        "DisplayActions",
+        "CheckNonLeaderTile",
+        "EndNegativeStatusCondition",
+        "EndNegativeStatusConditionWrapper",
+        "TransferNegativeStatusCondition",
+        "EndSleepClassStatus",
+        "EndBurnClassStatus",
+        "EndFrozenClassStatus",
+        "EndCringeClassStatus",
+        "EndReflectClassStatus",
+        "TryRemoveSnatchedMonsterFromDungeonStruct",
+        "EndCurseClassStatus",
+        "EndLeechSeedClassStatus",
+        "EndSureShotClassStatus",
+        "EndInvisibleClassStatus",
+        "EndBlinkerClassStatus",
+        "EndMuzzledStatus",
+        "EndMiracleEyeStatus",
+        "EndMagnetRiseStatus",
+        "TransferNegativeBlinkerClassStatus",
+        "EndFrozenStatus",
+        "EndProtectStatus",
+        "TryRestoreRoostTyping",
+        "TryTriggerMonsterHouse",
+        "ShouldMonsterFollowLeader",
+        "RunMonsterAi",
+        "ApplyDamageAndEffects",
+        "ApplyDamage",
+        "AftermathCheck",
+        "GetTypeMatchupBothTypes",
+        "ScrappyShouldActivate",
+        "IsTypeIneffectiveAgainstGhost",
+        "GhostImmunityIsActive",
+        "GetTypeMatchup",
+        "CalcTypeBasedDamageEffects",
+        "CalcDamage",
+        "ApplyDamageAndEffectsWrapper",
+        "CalcRecoilDamageFixed",
+        "CalcDamageFixed",
+        "CalcDamageFixedNoCategory",
+        "CalcDamageFixedWrapper",
+        "UpdateShopkeeperModeAfterAttack",
+        "UpdateShopkeeperModeAfterTrap",
+        "ResetDamageCalcDiagnostics",
+        "SpecificRecruitCheck",
+        "RecruitCheck",
+        "TryRecruit",
+        "TrySpawnMonsterAndTickSpawnCounter",
+        "AiDecideUseItem",
+        "GetPossibleAiThrownItemDirections",
+        "GetPossibleAiArcItemTargets",
+        "TryNonLeaderItemPickUp",
+        "GetExclusiveItemWithEffectFromBag",
+        "AuraBowIsActive",
+        "ExclusiveItemOffenseBoost",
+        "ExclusiveItemDefenseBoost",
+        "TeamMemberHasItemActive",
+        "TeamMemberHasExclusiveItemEffectActive",
+        "TrySpawnEnemyItemDrop",
+        "TickNoSlipCap",
+        "TickStatusAndHealthRegen",
+        "InflictSleepStatusSingle",
+        "TryInflictSleepStatus",
+        "IsProtectedFromSleepClassStatus",
+        "TryInflictNightmareStatus",
+        "TryInflictNappingStatus",
+        "TryInflictYawningStatus",
+        "TryInflictSleeplessStatus",
+        "TryInflictPausedStatus",
+        "TryInflictInfatuatedStatus",
+        "TryInflictBurnStatus",
+        "TryInflictBurnStatusWholeTeam",
+        "TryInflictPoisonedStatus",
+        "TryInflictBadlyPoisonedStatus",
+        "TryInflictFrozenStatus",
+        "TryInflictConstrictionStatus",
+        "TryInflictShadowHoldStatus",
+        "TryInflictIngrainStatus",
+        "TryInflictWrappedStatus",
+        "FreeOtherWrappedMonsters",
+        "TryInflictPetrifiedStatus",
+        "LowerOffensiveStat",
+        "LowerDefensiveStat",
+        "BoostOffensiveStat",
+        "BoostDefensiveStat",
+        "FlashFireShouldActivate",
+        "ActivateFlashFire",
+        "ApplyOffensiveStatMultiplier",
+        "ApplyDefensiveStatMultiplier",
+        "BoostHitChanceStat",
+        "LowerHitChanceStat",
+        "TryInflictCringeStatus",
+        "TryInflictParalysisStatus",
+        "BoostSpeed",
+        "BoostSpeedOneStage",
+        "LowerSpeed",
+        "TrySealMove",
+        "BoostOrLowerSpeed",
+        "ResetHitChanceStat",
+        "ExclusiveItemEffectIsActiveWithLogging",
+        "TryActivateQuickFeet",
+        "TryInflictTerrifiedStatus",
+        "TryInflictGrudgeStatus",
+        "TryInflictConfusedStatus",
+        "TryInflictCoweringStatus",
+        "TryRestoreHp",
+        "TryIncreaseHp",
+        "RevealItems",
+        "RevealStairs",
+        "RevealEnemies",
+        "TryInflictLeechSeedStatus",
+        "TryInflictDestinyBondStatus",
+        "TryInflictSureShotStatus",
+        "TryInflictWhifferStatus",
+        "TryInflictSetDamageStatus",
+        "TryInflictFocusEnergyStatus",
+        "TryInflictDecoyStatus",
+        "TryInflictCurseStatus",
+        "TryInflictSnatchStatus",
+        "TryInflictTauntStatus",
+        "TryInflictStockpileStatus",
+        "TryInflictInvisibleStatus",
+        "TryInflictPerishSongStatus",
+        "TryInflictEncoreStatus",
+        "TryDecreaseBelly",
+        "TryIncreaseBelly",
+        "TryInflictMuzzledStatus",
+        "TryTransform",
+        "TryInflictMobileStatus",
+        "TryInflictExposedStatus",
+        "TryActivateIdentifyCondition",
+        "TryInflictBlinkerStatus",
+        "IsBlinded",
+        "TryInflictCrossEyedStatus",
+        "TryInflictEyedropStatus",
+        "TryInflictSlipStatus",
+        "TryInflictDropeyeStatus",
+        "RestoreAllMovePP",
+        "RestoreOneMovePP",
+        "RestoreRandomMovePP",
+        "ApplyProteinEffect",
+        "ApplyCalciumEffect",
+        "ApplyIronEffect",
+        "ApplyZincEffect",
+        "TryInflictLongTossStatus",
+        "TryInflictPierceStatus",
+        "TryInflictGastroAcidStatus",
+        "SetAquaRingHealingCountdownTo4",
+        "ApplyAquaRingHealing",
+        "TryInflictAquaRingStatus",
+        "TryInflictLuckyChantStatus",
+        "TryInflictHealBlockStatus",
+        "MonsterHasEmbargoStatus",
+        "LogItemBlockedByEmbargo",
+        "TryInflictEmbargoStatus",
+        "TryInflictMiracleEyeStatus",
+        "TryInflictMagnetRiseStatus",
+        "IsFloating",
+        "TryInflictSafeguardStatus",
+        "TryInflictMistStatus",
+        "TryInflictWishStatus",
+        "TryInflictMagicCoatStatus",
+        "TryInflictLightScreenStatus",
+        "TryInflictReflectStatus",
+        "TryInflictProtectStatus",
+        "TryInflictMirrorCoatStatus",
+        "TryInflictEndureStatus",
+        "TryInflictMirrorMoveStatus",
+        "TryInflictConversion2Status",
+        "TryInflictVitalThrowStatus",
+        "TryResetStatChanges",
+        "MirrorMoveIsActive",
+        "MistIsActive",
+        "Conversion2IsActive",
+        "AiConsiderMove",
+        "TryAddTargetToAiTargetList",
+        "IsAiTargetEligible",
+        "IsTargetInRange",
+        "ShouldUsePp",
+        "GetEntityMoveTargetAndRange",
+        "GetEntityNaturalGiftInfo",
+        "GetEntityWeatherBallType",
+        "ActivateMotorDrive",
+        "TryActivateFrisk",
+        "TryActivateBadDreams",
+        "ActivateStench",
+        "TryActivateSteadfast",
+        "IsInSpawnList",
+        "ChangeShayminForme",
+        "ApplyItemEffect",
+        "ApplyCheriBerryEffect",
+        "ApplyPechaBerryEffect",
+        "ApplyRawstBerryEffect",
+        "ApplyHungerSeedEffect",
+        "ApplyVileSeedEffect",
+        "ApplyViolentSeedEffect",
+        "ApplyGinsengEffect",
+        "ApplyBlastSeedEffect",
+        "ApplyGummiBoostsDungeonMode",
+        "CanMonsterUseItem",
+        "ApplyGrimyFoodEffect",
+        "ApplyMixElixirEffect",
+        "ApplyDoughSeedEffect",
+        "ApplyViaSeedEffect",
+        "ApplyGravelyrockEffect",
+        "ApplyGonePebbleEffect",
+        "ApplyGracideaEffect",
+        "GetAiUseItemProbability",
+        "IsAdjacentToEnemy",
+        "ShouldTryEatItem",
+        "GetMaxPpWrapper",
+        "MoveIsNotPhysical",
+        "CategoryIsNotPhysical",
+        "TryDrought",
+        "TryPounce",
+        "TryBlowAway",
+        "TryExplosion",
+        "TryAftermathExplosion",
+        "TryWarp",
+        "EnsureCanStandCurrentTile",
+        "TryActivateNondamagingDefenderAbility",
+        "TryActivateNondamagingDefenderExclusiveItem",
+        "GetMoveRangeDistance",
+        "MoveHitCheck",
+        "IsHyperBeamVariant",
+        "IsChargingTwoTurnMove",
+        "IsChargingAnyTwoTurnMove",
+        "HasMaxGinsengBoost99",
+        "TwoTurnMoveForcedMiss",
+        "DungeonRandOutcomeUserTargetInteraction",
+        "DungeonRandOutcomeUserAction",
+        "CanAiUseMove",
+        "CanMonsterUseMove",
+        "UpdateMovePp",
+        "GetDamageSourceWrapper",
+        "LowerSshort",
+        "PlayMoveAnimation",
+        "GetMoveAnimationId",
+        "ShouldMovePlayAlternativeAnimation",
+        "ExecuteMoveEffect",
+        "DoMoveDamageInlined",
+        "DealDamage",
+        "DealDamageWithTypeAndPowerBoost",
+        "DealDamageProjectile",
+        "DealDamageWithType",
+        "PerformDamageSequence",
+        "CanHitWithRegularAttack",
+        "StatusCheckerCheck",
+        "GetApparentWeather",
+        "TryWeatherFormChange",
+        "ActivateSportCondition",
+        "TryActivateWeather",
+        "DigitCount",
+        "LoadTextureUi",
+        "DisplayNumberTextureUi",
+        "DisplayCharTextureUi",
+        "DisplayUi",
+        "GetTile",
+        "GetTileSafe",
+        "IsFullFloorFixedRoom",
+        "IsCurrentTilesetBackground",
+        "TrySpawnGoldenChamber",
+        "CountItemsOnFloorForAcuteSniffer",
+        "GetStairsSpawnPosition",
+        "PositionIsOnStairs",
+        "GetStairsRoom",
+        "GetDefaultTileTextureId",
+        "DetermineAllTilesWalkableNeighbors",
+        "DetermineTileWalkableNeighbors",
+        "UpdateTrapsVisibility",
+        "DrawTileGrid",
+        "HideTileGrid",
+        "DiscoverMinimap",
+        "PositionHasItem",
+        "PositionHasMonster",
+        "TrySmashWall",
+        "IsWaterTileset",
+        "GetRandomSpawnMonsterID",
+        "NearbyAllyIqSkillIsEnabled",
+        "ResetGravity",
+        "GravityIsActive",
+        "TryActivateGravity",
+        "ShouldBoostKecleonShopSpawnChance",
+        "SetShouldBoostKecleonShopSpawnChance",
+        "UpdateShouldBoostKecleonShopSpawnChance",
+        "GetDoughSeedFlag",
+        "SetDoughSeedFlag",
+        "TrySpawnDoughSeedPoke",
+        "IsSecretBazaar",
+        "ShouldBoostHiddenStairsSpawnChance",
+        "SetShouldBoostHiddenStairsSpawnChance",
+        "UpdateShouldBoostHiddenStairsSpawnChance",
+        "IsSecretRoom",
+        "IsSecretFloor",
+        "GetCurrentHiddenStairsType",
+        "HiddenStairsPresent",
+        "PositionIsOnHiddenStairs",
+        "HiddenStairsTrigger",
+        "GetHiddenStairsField",
+        "SetHiddenStairsField",
+        "GetHiddenFloorField",
+        "SetHiddenFloorField",
+        "LoadWeather3DFiles",
+        "RenderWeather3D",
+        "GetMinimapData",
+        "DrawMinimapTile",
+        "FlashLeaderIcon",
+        "UpdateMinimap",
+        "SetMinimapDataE447",
+        "GetMinimapDataE447",
+        "SetMinimapDataE448",
+        "InitWeirdMinimapMatrix",
+        "InitMinimapDisplayTile",
+        "LoadFixedRoomDataVeneer",
+        "UnloadFixedRoomData",
+        "IsNormalFloor",
+        "GenerateFloor",
+        "GetTileTerrain",
+        "DungeonRand100",
+        "ClearHiddenStairs",
+        "FlagHallwayJunctions",
+        "GenerateStandardFloor",
+        "GenerateOuterRingFloor",
+        "GenerateCrossroadsFloor",
+        "GenerateLineFloor",
+        "GenerateCrossFloor",
+        "GenerateBeetleFloor",
+        "MergeRoomsVertically",
+        "GenerateOuterRoomsFloor",
+        "IsNotFullFloorFixedRoom",
+        "GenerateFixedRoom",
+        "GenerateOneRoomMonsterHouseFloor",
+        "GenerateTwoRoomsWithMonsterHouseFloor",
+        "GenerateExtraHallways",
+        "GetGridPositions",
+        "InitDungeonGrid",
+        "AssignRooms",
+        "CreateRoomsAndAnchors",
+        "GenerateSecondaryStructures",
+        "AssignGridCellConnections",
+        "CreateGridCellConnections",
+        "GenerateRoomImperfections",
+        "CreateHallway",
+        "EnsureConnectedGrid",
+        "SetTerrainObstacleChecked",
+        "FinalizeJunctions",
+        "GenerateKecleonShop",
+        "GenerateMonsterHouse",
+        "GenerateMazeRoom",
+        "GenerateMaze",
+        "GenerateMazeLine",
+        "SetSpawnFlag5",
+        "IsNextToHallway",
+        "ResolveInvalidSpawns",
+        "ConvertSecondaryTerrainToChasms",
+        "EnsureImpassableTilesAreWalls",
+        "InitializeTile",
+        "ResetFloor",
+        "PosIsOutOfBounds",
+        "ShuffleSpawnPositions",
+        "MarkNonEnemySpawns",
+        "MarkEnemySpawns",
+        "SetSecondaryTerrainOnWall",
+        "GenerateSecondaryTerrainFormations",
+        "StairsAlwaysReachable",
+        "GetNextFixedRoomAction",
+        "ConvertWallsToChasms",
+        "ResetInnerBoundaryTileRows",
+        "ResetImportantSpawnPositions",
+        "SpawnStairs",
+        "GetHiddenStairsType",
+        "GetFinalKecleonShopSpawnChance",
+        "ResetHiddenStairsSpawn",
+        "PlaceFixedRoomTile",
+        "FixedRoomActionParamToDirection",
+        "ApplyKeyEffect",
+        "LoadFixedRoomData",
+        "LoadFixedRoom",
+        "OpenFixedBin",
+        "CloseFixedBin",
+        "AreOrbsAllowed",
+        "AreTileJumpsAllowed",
+        "AreTrawlOrbsAllowed",
+        "AreOrbsAllowedVeneer",
+        "AreLateGameTrapsEnabled",
+        "AreMovesEnabled",
+        "IsRoomIlluminated",
+        "GetMatchingMonsterId",
+        "GenerateItemExplicit",
+        "GenerateAndSpawnItem",
+        "IsHiddenStairsFloor",
+        "IsSecretBazaarVeneer",
+        "GenerateStandardItem",
+        "GenerateCleanItem",
+        "TryLeaderItemPickUp",
+        "SpawnItem",
+        "RemoveGroundItem",
+        "SpawnDroppedItemWrapper",
+        "SpawnDroppedItem",
+        "TryGenerateUnownStoneDrop",
+        "HasHeldItem",
+        "GenerateMoneyQuantity",
+        "CheckTeamItemsFlags",
+        "AddHeldItemToBag",
+        "RemoveEmptyItemsInBagWrapper",
+        "GenerateItem",
+        "DoesProjectileHitTarget",
+        "DisplayFloorCard",
+        "HandleFloorCard",
+        "CheckActiveChallengeRequest",
+        "GetMissionDestination",
+        "IsOutlawOrChallengeRequestFloor",
+        "IsDestinationFloor",
+        "IsCurrentMissionType",
+        "IsCurrentMissionTypeExact",
+        "IsOutlawMonsterHouseFloor",
+        "IsGoldenChamber",
+        "IsLegendaryChallengeFloor",
+        "IsJirachiChallengeFloor",
+        "IsDestinationFloorWithMonster",
+        "LoadMissionMonsterSprites",
+        "MissionTargetEnemyIsDefeated",
+        "SetMissionTargetEnemyDefeated",
+        "IsDestinationFloorWithFixedRoom",
+        "GetItemToRetrieve",
+        "GetItemToDeliver",
+        "GetSpecialTargetItem",
+        "IsDestinationFloorWithItem",
+        "IsDestinationFloorWithHiddenOutlaw",
+        "IsDestinationFloorWithFleeingOutlaw",
+        "GetMissionTargetEnemy",
+        "GetMissionEnemyMinionGroup",
+        "SetTargetMonsterNotFoundFlag",
+        "GetTargetMonsterNotFoundFlag",
+        "FloorHasMissionMonster",
+        "GenerateMissionEggMonster",
+        "LogMessageByIdWithPopupCheckParticipants",
+        "LogMessageByIdWithPopupCheckUser",
+        "LogMessageWithPopupCheckUser",
+        "LogMessageByIdQuiet",
+        "LogMessageQuiet",
+        "LogMessageByIdWithPopupCheckUserTarget",
+        "LogMessageWithPopupCheckUserTarget",
+        "LogMessageByIdQuietCheckUserTarget",
+        "LogMessageByIdWithPopupCheckUserUnknown",
+        "LogMessageByIdWithPopup",
+        "LogMessageWithPopup",
+        "LogMessage",
+        "LogMessageById",
+        "InitPortraitDungeon",
+        "OpenMessageLog",
+        "RunDungeonMode",
+        "StartFadeDungeon",
+        "StartFadeDungeonWrapper",
+        "HandleFadesDungeon",
+        "HandleFadesDungeonBothScreens",
+        "DisplayFloorTip",
+        "DisplayItemTip",
+        "DisplayDungeonTip",
+        "SetBothScreensWindowColorToDefault",
+        "GetPersonalityIndex",
+        "DisplayMessage",
+        "DisplayMessage2",
+        "YesNoMenu",
+        "DisplayMessageInternal",
+        "OpenMenu",
+        "OthersMenuLoop",
+        "OthersMenu",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x23E0,
+            0x281C,
+            0x2840,
+            0x2850,
+            0x2870,
+            0x2CF8,
+            0xFFFFFFFF,
+            0x4168,
+            0x43CC,
+            0x4614,
+            0x4630,
+            0x4650,
+            0x467C,
+            0x46D8,
+            0x470C,
+            0x4718,
+            0x4A68,
+            0x53B8,
+            0x53C0,
+            0x53D8,
+            0x57F0,
+            0x5834,
+            0x5840,
+            0x5E70,
+            0x6010,
+            0x60C4,
+            0x624C,
+            0x6328,
+            0x64E0,
+            0x6500,
+            0x65C4,
+            0x6708,
+            0x672C,
+            0x67EC,
+            0x688C,
+            0xFFFFFFFF,
+            0x6BE4,
+            0x6C54,
+            0xFFFFFFFF,
+            0x70CC,
+            0x71C0,
+            0x7374,
+            0x756C,
+            0x75B0,
+            0x7670,
+            0x7844,
+            0x7DA8,
+            0x7DFC,
+            0x86F4,
+            0x9C60,
+            0xFFFFFFFF,
+            0xA168,
+            0xAD4C,
+            0xB850,
+            0xB974,
+            0xB9EC,
+            0xBAD4,
+            0xBB28,
+            0xBBE0,
+            0xBC4C,
+            0xBCCC,
+            0xBEB8,
+            0xBF18,
+            0xBF70,
+            0xC450,
+            0xC5F4,
+            0xC9D4,
+            0xCDA8,
+            0xCE14,
+            0xCE54,
+            0xCF2C,
+            0xD308,
+            0xD3A0,
+            0xD3B0,
+            0xD5CC,
+            0xD778,
+            0xD794,
+            0xD7B0,
+            0xD7CC,
+            0xDD68,
+            0xE4A0,
+            0xE6F0,
+            0xE708,
+            0xE754,
+            0xE764,
+            0xE774,
+            0xE7A8,
+            0xE820,
+            0xE848,
+            0xFFFFFFFF,
+            0xE908,
+            0xE9BC,
+            0xE9D4,
+            0xE9EC,
+            0xEA88,
+            0xEB9C,
+            0xEF00,
+            0xF150,
+            0xF17C,
+            0xF190,
+            0xF1A4,
+            0xF1D4,
+            0xF2D4,
+            0xF360,
+            0xF394,
+            0xF5A4,
+            0xF67C,
+            0xF9D8,
+            0xFA20,
+            0xFA44,
+            0xFA90,
+            0x10090,
+            0x10464,
+            0x10570,
+            0x108CC,
+            0x10CC8,
+            0x10D8C,
+            0x10DA0,
+            0x115DC,
+            0x115EC,
+            0x116F4,
+            0x11958,
+            0x11A40,
+            0x11B58,
+            0x11C00,
+            0x11D24,
+            0x120E8,
+            0x121B0,
+            0x123AC,
+            0x125A0,
+            0x12708,
+            0x127A4,
+            0x1288C,
+            0x12AA0,
+            0x12BC4,
+            0xFFFFFFFF,
+            0x12C60,
+            0x12D8C,
+            0x12E50,
+            0x132FC,
+            0x13710,
+            0x13790,
+            0x13798,
+            0x13828,
+            0x148AC,
+            0x148CC,
+            0x14BFC,
+            0x16DA4,
+            0x1734C,
+            0x1764C,
+            0x18FE4,
+            0x19010,
+            0x191D4,
+            0x1AB1C,
+            0x1ABFC,
+            0x1AC54,
+            0x1ACF4,
+            0x1AD3C,
+            0x1AD54,
+            0x1B074,
+            0x1B090,
+            0x1B09C,
+            0x1B0D4,
+            0x1B0F4,
+            0x1B1BC,
+            0x1B2B8,
+            0x1B338,
+            0x1B44C,
+            0x1B4E4,
+            0xFFFFFFFF,
+            0x1BC10,
+            0x1C2D4,
+            0x1C6B0,
+            0x1CE28,
+            0x1CE78,
+            0x1CF20,
+            0x1CFBC,
+            0x1D0EC,
+            0x1D1D4,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x1D41C,
+            0x1D4C8,
+            0x1D58C,
+            0x1D648,
+            0x1D6C4,
+            0x1D74C,
+            0x1D918,
+            0x1D940,
+            0x1DE0C,
+            0x1E0F8,
+            0x1E2B8,
+            0x1E4A4,
+            0xFFFFFFFF,
+            0x1ECA0,
+            0x1ED0C,
+            0x1ED28,
+            0x1ED50,
+            0x1EDB4,
+            0x1EEBC,
+            0xFFFFFFFF,
+            0x1F1E0,
+            0x1F204,
+            0x1F26C,
+            0x1F6C4,
+            0x1F6E4,
+            0x1F968,
+            0x1FA68,
+            0x1FD44,
+            0x2001C,
+            0x2088C,
+            0x20B98,
+            0x20EC8,
+            0x214E4,
+            0x218D0,
+            0x21CA0,
+            0x21D54,
+            0x21E04,
+            0x21E58,
+            0x21EC0,
+            0x21F28,
+            0x21FC4,
+            0x22C78,
+            0x22CD8,
+            0x2313C,
+            0x23184,
+            0x231D4,
+            0xFFFFFFFF,
+            0x237CC,
+            0x23944,
+            0x23A9C,
+            0x23AAC,
+            0xFFFFFFFF,
+            0x23C58,
+            0x23DF0,
+            0x23FB4,
+            0x23FE8,
+            0x24004,
+            0x24024,
+            0x24040,
+            0x2408C,
+            0x240A8,
+            0x240C4,
+            0x24100,
+            0x2411C,
+            0x24138,
+            0x242AC,
+            0x2431C,
+            0x24644,
+            0x247B4,
+            0x2497C,
+            0xFFFFFFFF,
+            0x24C3C,
+            0x24DB4,
+            0x24ED8,
+            0x25248,
+            0x25338,
+            0x253EC,
+            0x255CC,
+            0x25620,
+            0x257AC,
+            0x25954,
+            0x25988,
+            0x259F0,
+            0x259FC,
+            0x25A88,
+            0x25AC0,
+            0x25AF8,
+            0x25B1C,
+            0x25B5C,
+            0x25B90,
+            0x25BC0,
+            0x25BF0,
+            0x25C2C,
+            0x25EEC,
+            0x25F8C,
+            0x25FD8,
+            0x26030,
+            0x260A0,
+            0x261AC,
+            0x2636C,
+            0x266CC,
+            0x26BF4,
+            0x26CA8,
+            0x27788,
+            0x278EC,
+            0x28618,
+            0x28724,
+            0x287D4,
+            0x2881C,
+            0x28C50,
+            0x29304,
+            0x29534,
+            0x29898,
+            0x298AC,
+            0x29C4C,
+            0x29E18,
+            0x29EC8,
+            0x2A024,
+            0x2A144,
+            0x2A328,
+            0x2A378,
+            0x2A514,
+            0x2A5A0,
+            0x2A650,
+            0x2A778,
+            0x2A848,
+            0x2A8B4,
+            0x2A920,
+            0x2B53C,
+            0x2B8C8,
+            0x2B968,
+            0x2B9A4,
+            0x2BBA0,
+            0x2BEF4,
+            0x2BF94,
+            0x2C33C,
+            0x2CCB8,
+            0x2E6A8,
+            0x2E724,
+            0x2E7F0,
+            0x2E888,
+            0x2E89C,
+            0x2E8F0,
+            0x2E99C,
+            0x2F820,
+            0x30D7C,
+            0x30DEC,
+            0x30EA0,
+            0x31004,
+            0x31050,
+            0x3109C,
+            0x310D8,
+            0x31184,
+            0x31774,
+            0x31830,
+            0x31CC4,
+            0x32318,
+            0x32570,
+            0x32A0C,
+            0x32C88,
+            0x32DC0,
+            0x332B0,
+            0x33324,
+            0x333D4,
+            0x333E4,
+            0x333F4,
+            0x3349C,
+            0x33634,
+            0x337EC,
+            0x34CD0,
+            0x3545C,
+            0x35510,
+            0x3561C,
+            0x35878,
+            0x35988,
+            0x35A94,
+            0x35BA4,
+            0x35C90,
+            0x35DD0,
+            0x35F58,
+            0x36234,
+            0x36280,
+            0x36554,
+            0x3680C,
+            0x36A30,
+            0x36B88,
+            0x36D3C,
+            0x36E00,
+            0x36FFC,
+            0x37078,
+            0x37208,
+            0x3741C,
+            0x375A4,
+            0x37710,
+            0x3787C,
+            0x378E8,
+            0x37944,
+            0x37B64,
+            0x37CE4,
+            0x37E2C,
+            0x37FE4,
+            0x3813C,
+            0x38404,
+            0x38530,
+            0x38548,
+            0x386B0,
+            0x38820,
+            0x38880,
+            0x38934,
+            0x38A10,
+            0x38A54,
+            0x38AAC,
+            0x38B30,
+            0x38D64,
+            0x38E64,
+            0x38EDC,
+            0x39208,
+            0x39298,
+            0x39354,
+            0x393E4,
+            0x39648,
+            0x39768,
+            0x397F8,
+            0x398E0,
+            0x3997C,
+            0x39A1C,
+            0x39CD4,
+            0x39E78,
+            0x39FA0,
+            0x3A0CC,
+            0x3A170,
+            0x3A220,
+            0x3A314,
+            0x3A4C8,
+            0x3A7A0,
+            0x3AD14,
+            0x3AE0C,
+            0x3AFFC,
+            0x3B0B8,
+            0x3B238,
+            0x3B2BC,
+            0x3B3D4,
+            0x3B434,
+            0x3B54C,
+            0x3B5FC,
+            0x3B6E4,
+            0x3B810,
+            0x3B948,
+            0x3BA78,
+            0x3BB40,
+            0x3BBD4,
+            0x3BC68,
+            0x3BCFC,
+            0x3BD90,
+            0x3BE00,
+            0x3BE6C,
+            0x3BFB0,
+            0x3BFD8,
+            0x3C04C,
+            0x3C0F8,
+            0x3C198,
+            0x3C2BC,
+            0x3C2F0,
+            0x3C31C,
+            0x3C440,
+            0x3C574,
+            0x3C63C,
+            0x3CA60,
+            0x3CB00,
+            0x3CB9C,
+            0x3CC3C,
+            0x3CCDC,
+            0x3CD7C,
+            0x3CE1C,
+            0x3CECC,
+            0x3CF68,
+            0x3D008,
+            0x3D0A8,
+            0x3D174,
+            0x3D214,
+            0x3D338,
+            0x3D3BC,
+            0x3D404,
+            0x3D470,
+            0x3DBA0,
+            0x3DC94,
+            0x3E284,
+            0x3E390,
+            0x3E89C,
+            0x3EA80,
+            0x3EAFC,
+            0x3EC50,
+            0x3EC90,
+            0x3EDA4,
+            0x3EF28,
+            0x3EF50,
+            0x3EFE8,
+            0x3F0D8,
+            0x3F278,
+            0x407D8,
+            0x40804,
+            0x40838,
+            0x40880,
+            0x4096C,
+            0x40A08,
+            0x40A4C,
+            0x40B6C,
+            0x40CA8,
+            0x4108C,
+            0x4111C,
+            0x41268,
+            0x412C8,
+            0x41334,
+            0x413A8,
+            0x41420,
+            0x4159C,
+            0x41C28,
+            0x424BC,
+            0x4255C,
+            0x425BC,
+            0x425E4,
+            0x425FC,
+            0x43160,
+            0x437EC,
+            0x439AC,
+            0x44014,
+            0x44354,
+            0x448D4,
+            0x44CD0,
+            0x45644,
+            0x458BC,
+            0x45E70,
+            0x47808,
+            0x480E4,
+            0x48154,
+            0x481CC,
+            0x48348,
+            0x48404,
+            0x484E4,
+            0x485CC,
+            0x48620,
+            0x486D0,
+            0x48938,
+            0x489F0,
+            0x48A10,
+            0x49260,
+            0x496BC,
+            0x49824,
+            0x52380,
+            0x56580,
+            0x56630,
+            0x566C8,
+            0x5675C,
+            0x567EC,
+            0x5687C,
+            0x56AD4,
+            0x56B80,
+            0x58814,
+            0x58C7C,
+            0x58F58,
+            0x58FD0,
+            0x5917C,
+            0x591CC,
+            0x59370,
+            0x59478,
+            0x59500,
+            0x59BEC,
+            0x59C54,
+            0x59CC4,
+            0x59CF4,
+            0x59D14,
+            0x59D50,
+            0x59EB0,
+            0x59EDC,
+            0x59F18,
+            0x59F40,
+            0x5A534,
+            0x5A56C,
+            0x5AA34,
+            0x5AF10,
+            0x5B280,
+            0x5B520,
+            0x5B610,
+            0x5B64C,
+            0x5B680,
+            0x5B978,
+            0x5BA7C,
+            0x5BD6C,
+            0x5BE50,
+            0x5BE74,
+            0x5BEA0,
+            0x5BFA4,
+            0x5BFBC,
+            0x5BFD4,
+            0x5C014,
+            0x5C02C,
+            0x5C044,
+            0x5C0A8,
+            0x5C0D0,
+            0x5C0E8,
+            0x5C100,
+            0x5C140,
+            0x5C168,
+            0x5C194,
+            0x5C1BC,
+            0x5C1EC,
+            0x5C278,
+            0x5C334,
+            0x5C34C,
+            0x5C364,
+            0x5C37C,
+            0x5C394,
+            0x5C5A8,
+            0x5CBFC,
+            0x5CCD0,
+            0x5D508,
+            0x5D7CC,
+            0x5DCFC,
+            0xFFFFFFFF,
+            0x5DD14,
+            0x5DD74,
+            0x5DDD4,
+            0x5E108,
+            0x5E114,
+            0x5E138,
+            0x5E1BC,
+            0x5E95C,
+            0x5E968,
+            0x5E978,
+            0x5E9F0,
+            0x5EB0C,
+            0x5EC74,
+            0x5F100,
+            0x5F560,
+            0x5F6C0,
+            0x5F858,
+            0x5FA14,
+            0x5FB60,
+            0x5FDF4,
+            0x5FE10,
+            0x60254,
+            0x60324,
+            0x604C8,
+            0x60A64,
+            0x60AE4,
+            0x60BE4,
+            0x60DF8,
+            0x61154,
+            0x61B3C,
+            0x61F1C,
+            0x62814,
+            0x62C00,
+            0x62F04,
+            0x633E0,
+            0x6341C,
+            0x636C8,
+            0x63A7C,
+            0x63D04,
+            0x63F38,
+            0x641B4,
+            0x6435C,
+            0x643B0,
+            0x64454,
+            0x644EC,
+            0x64558,
+            0x645B4,
+            0x645EC,
+            0x6478C,
+            0x647C4,
+            0x6482C,
+            0x64F50,
+            0x6524C,
+            0x6528C,
+            0x6594C,
+            0x65FB0,
+            0x66028,
+            0x6665C,
+            0x66748,
+            0x6676C,
+            0x6687C,
+            0x669A0,
+            0x669EC,
+            0x66A14,
+            0x67450,
+            0x677BC,
+            0x67874,
+            0x67904,
+            0x67B38,
+            0x67B6C,
+            0x67B90,
+            0x67BC0,
+            0x67BF0,
+            0x67C20,
+            0x67C2C,
+            0x67C44,
+            0x67C5C,
+            0x67C74,
+            0x67E98,
+            0x67F14,
+            0x67FF0,
+            0x6801C,
+            0x686B4,
+            0x686C8,
+            0x68B3C,
+            0x6901C,
+            0x691A0,
+            0x69520,
+            0x695BC,
+            0x69B44,
+            0x6A2B4,
+            0x6A304,
+            0x6A6AC,
+            0x6A9F4,
+            0x6AB10,
+            0x6ADA4,
+            0x6BAC8,
+            0x6BD7C,
+            0x6BDB4,
+            0x6CB94,
+            0x6CBEC,
+            0x6CC0C,
+            0x6CC50,
+            0x6CC64,
+            0x6CC98,
+            0x6CCD4,
+            0x6CCF8,
+            0x6CD1C,
+            0x6CD5C,
+            0x6CD94,
+            0x6CE40,
+            0x6CEB8,
+            0x6CED8,
+            0x6CEEC,
+            0x6CF14,
+            0x6CF38,
+            0x6CF64,
+            0x6CFAC,
+            0x6D00C,
+            0x6D030,
+            0x6D068,
+            0x6D080,
+            0x6D10C,
+            0x6D120,
+            0x6D190,
+            0x6D2B0,
+            0x6EBE0,
+            0x6EC34,
+            0x6EC74,
+            0x6ECAC,
+            0x6ECD0,
+            0x6ECE0,
+            0x6ED34,
+            0x6ED80,
+            0x6EDD4,
+            0x6EE28,
+            0x6EE4C,
+            0x6EE98,
+            0x6F0A4,
+            0x6F444,
+            0x6F4E0,
+            0x6F8AC,
+            0x6FD8C,
+            0x6FFEC,
+            0x70158,
+            0x70368,
+            0x7050C,
+            0x70638,
+            0x70874,
+            0x708E4,
+            0x70970,
+            0x70C04,
+            0x70C58,
+            0x70EC4,
+            0x70F3C,
+            0x717A0,
+            0x73160,
+            0x733C4,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x22DFCC0,
+            0x22E00FC,
+            0x22E0120,
+            0x22E0130,
+            0x22E0150,
+            0x22E05D8,
+            0xFFFFFFFF,
+            0x22E1A48,
+            0x22E1CAC,
+            0x22E1EF4,
+            0x22E1F10,
+            0x22E1F30,
+            0x22E1F5C,
+            0x22E1FB8,
+            0x22E1FEC,
+            0x22E1FF8,
+            0x22E2348,
+            0x22E2C98,
+            0x22E2CA0,
+            0x22E2CB8,
+            0x22E30D0,
+            0x22E3114,
+            0x22E3120,
+            0x22E3750,
+            0x22E38F0,
+            0x22E39A4,
+            0x22E3B2C,
+            0x22E3C08,
+            0x22E3DC0,
+            0x22E3DE0,
+            0x22E3EA4,
+            0x22E3FE8,
+            0x22E400C,
+            0x22E40CC,
+            0x22E416C,
+            0xFFFFFFFF,
+            0x22E44C4,
+            0x22E4534,
+            0xFFFFFFFF,
+            0x22E49AC,
+            0x22E4AA0,
+            0x22E4C54,
+            0x22E4E4C,
+            0x22E4E90,
+            0x22E4F50,
+            0x22E5124,
+            0x22E5688,
+            0x22E56DC,
+            0x22E5FD4,
+            0x22E7540,
+            0xFFFFFFFF,
+            0x22E7A48,
+            0x22E862C,
+            0x22E9130,
+            0x22E9254,
+            0x22E92CC,
+            0x22E93B4,
+            0x22E9408,
+            0x22E94C0,
+            0x22E952C,
+            0x22E95AC,
+            0x22E9798,
+            0x22E97F8,
+            0x22E9850,
+            0x22E9D30,
+            0x22E9ED4,
+            0x22EA2B4,
+            0x22EA688,
+            0x22EA6F4,
+            0x22EA734,
+            0x22EA80C,
+            0x22EABE8,
+            0x22EAC80,
+            0x22EAC90,
+            0x22EAEAC,
+            0x22EB058,
+            0x22EB074,
+            0x22EB090,
+            0x22EB0AC,
+            0x22EB648,
+            0x22EBD80,
+            0x22EBFD0,
+            0x22EBFE8,
+            0x22EC034,
+            0x22EC044,
+            0x22EC054,
+            0x22EC088,
+            0x22EC100,
+            0x22EC128,
+            0xFFFFFFFF,
+            0x22EC1E8,
+            0x22EC29C,
+            0x22EC2B4,
+            0x22EC2CC,
+            0x22EC368,
+            0x22EC47C,
+            0x22EC7E0,
+            0x22ECA30,
+            0x22ECA5C,
+            0x22ECA70,
+            0x22ECA84,
+            0x22ECAB4,
+            0x22ECBB4,
+            0x22ECC40,
+            0x22ECC74,
+            0x22ECE84,
+            0x22ECF5C,
+            0x22ED2B8,
+            0x22ED300,
+            0x22ED324,
+            0x22ED370,
+            0x22ED970,
+            0x22EDD44,
+            0x22EDE50,
+            0x22EE1AC,
+            0x22EE5A8,
+            0x22EE66C,
+            0x22EE680,
+            0x22EEEBC,
+            0x22EEECC,
+            0x22EEFD4,
+            0x22EF238,
+            0x22EF320,
+            0x22EF438,
+            0x22EF4E0,
+            0x22EF604,
+            0x22EF9C8,
+            0x22EFA90,
+            0x22EFC8C,
+            0x22EFE80,
+            0x22EFFE8,
+            0x22F0084,
+            0x22F016C,
+            0x22F0380,
+            0x22F04A4,
+            0xFFFFFFFF,
+            0x22F0540,
+            0x22F066C,
+            0x22F0730,
+            0x22F0BDC,
+            0x22F0FF0,
+            0x22F1070,
+            0x22F1078,
+            0x22F1108,
+            0x22F218C,
+            0x22F21AC,
+            0x22F24DC,
+            0x22F4684,
+            0x22F4C2C,
+            0x22F4F2C,
+            0x22F68C4,
+            0x22F68F0,
+            0x22F6AB4,
+            0x22F83FC,
+            0x22F84DC,
+            0x22F8534,
+            0x22F85D4,
+            0x22F861C,
+            0x22F8634,
+            0x22F8954,
+            0x22F8970,
+            0x22F897C,
+            0x22F89B4,
+            0x22F89D4,
+            0x22F8A9C,
+            0x22F8B98,
+            0x22F8C18,
+            0x22F8D2C,
+            0x22F8DC4,
+            0xFFFFFFFF,
+            0x22F94F0,
+            0x22F9BB4,
+            0x22F9F90,
+            0x22FA708,
+            0x22FA758,
+            0x22FA800,
+            0x22FA89C,
+            0x22FA9CC,
+            0x22FAAB4,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x22FACFC,
+            0x22FADA8,
+            0x22FAE6C,
+            0x22FAF28,
+            0x22FAFA4,
+            0x22FB02C,
+            0x22FB1F8,
+            0x22FB220,
+            0x22FB6EC,
+            0x22FB9D8,
+            0x22FBB98,
+            0x22FBD84,
+            0xFFFFFFFF,
+            0x22FC580,
+            0x22FC5EC,
+            0x22FC608,
+            0x22FC630,
+            0x22FC694,
+            0x22FC79C,
+            0xFFFFFFFF,
+            0x22FCAC0,
+            0x22FCAE4,
+            0x22FCB4C,
+            0x22FCFA4,
+            0x22FCFC4,
+            0x22FD248,
+            0x22FD348,
+            0x22FD624,
+            0x22FD8FC,
+            0x22FE16C,
+            0x22FE478,
+            0x22FE7A8,
+            0x22FEDC4,
+            0x22FF1B0,
+            0x22FF580,
+            0x22FF634,
+            0x22FF6E4,
+            0x22FF738,
+            0x22FF7A0,
+            0x22FF808,
+            0x22FF8A4,
+            0x2300558,
+            0x23005B8,
+            0x2300A1C,
+            0x2300A64,
+            0x2300AB4,
+            0xFFFFFFFF,
+            0x23010AC,
+            0x2301224,
+            0x230137C,
+            0x230138C,
+            0xFFFFFFFF,
+            0x2301538,
+            0x23016D0,
+            0x2301894,
+            0x23018C8,
+            0x23018E4,
+            0x2301904,
+            0x2301920,
+            0x230196C,
+            0x2301988,
+            0x23019A4,
+            0x23019E0,
+            0x23019FC,
+            0x2301A18,
+            0x2301B8C,
+            0x2301BFC,
+            0x2301F24,
+            0x2302094,
+            0x230225C,
+            0xFFFFFFFF,
+            0x230251C,
+            0x2302694,
+            0x23027B8,
+            0x2302B28,
+            0x2302C18,
+            0x2302CCC,
+            0x2302EAC,
+            0x2302F00,
+            0x230308C,
+            0x2303234,
+            0x2303268,
+            0x23032D0,
+            0x23032DC,
+            0x2303368,
+            0x23033A0,
+            0x23033D8,
+            0x23033FC,
+            0x230343C,
+            0x2303470,
+            0x23034A0,
+            0x23034D0,
+            0x230350C,
+            0x23037CC,
+            0x230386C,
+            0x23038B8,
+            0x2303910,
+            0x2303980,
+            0x2303A8C,
+            0x2303C4C,
+            0x2303FAC,
+            0x23044D4,
+            0x2304588,
+            0x2305068,
+            0x23051CC,
+            0x2305EF8,
+            0x2306004,
+            0x23060B4,
+            0x23060FC,
+            0x2306530,
+            0x2306BE4,
+            0x2306E14,
+            0x2307178,
+            0x230718C,
+            0x230752C,
+            0x23076F8,
+            0x23077A8,
+            0x2307904,
+            0x2307A24,
+            0x2307C08,
+            0x2307C58,
+            0x2307DF4,
+            0x2307E80,
+            0x2307F30,
+            0x2308058,
+            0x2308128,
+            0x2308194,
+            0x2308200,
+            0x2308E1C,
+            0x23091A8,
+            0x2309248,
+            0x2309284,
+            0x2309480,
+            0x23097D4,
+            0x2309874,
+            0x2309C1C,
+            0x230A598,
+            0x230BF88,
+            0x230C004,
+            0x230C0D0,
+            0x230C168,
+            0x230C17C,
+            0x230C1D0,
+            0x230C27C,
+            0x230D100,
+            0x230E65C,
+            0x230E6CC,
+            0x230E780,
+            0x230E8E4,
+            0x230E930,
+            0x230E97C,
+            0x230E9B8,
+            0x230EA64,
+            0x230F054,
+            0x230F110,
+            0x230F5A4,
+            0x230FBF8,
+            0x230FE50,
+            0x23102EC,
+            0x2310568,
+            0x23106A0,
+            0x2310B90,
+            0x2310C04,
+            0x2310CB4,
+            0x2310CC4,
+            0x2310CD4,
+            0x2310D7C,
+            0x2310F14,
+            0x23110CC,
+            0x23125B0,
+            0x2312D3C,
+            0x2312DF0,
+            0x2312EFC,
+            0x2313158,
+            0x2313268,
+            0x2313374,
+            0x2313484,
+            0x2313570,
+            0x23136B0,
+            0x2313838,
+            0x2313B14,
+            0x2313B60,
+            0x2313E34,
+            0x23140EC,
+            0x2314310,
+            0x2314468,
+            0x231461C,
+            0x23146E0,
+            0x23148DC,
+            0x2314958,
+            0x2314AE8,
+            0x2314CFC,
+            0x2314E84,
+            0x2314FF0,
+            0x231515C,
+            0x23151C8,
+            0x2315224,
+            0x2315444,
+            0x23155C4,
+            0x231570C,
+            0x23158C4,
+            0x2315A1C,
+            0x2315CE4,
+            0x2315E10,
+            0x2315E28,
+            0x2315F90,
+            0x2316100,
+            0x2316160,
+            0x2316214,
+            0x23162F0,
+            0x2316334,
+            0x231638C,
+            0x2316410,
+            0x2316644,
+            0x2316744,
+            0x23167BC,
+            0x2316AE8,
+            0x2316B78,
+            0x2316C34,
+            0x2316CC4,
+            0x2316F28,
+            0x2317048,
+            0x23170D8,
+            0x23171C0,
+            0x231725C,
+            0x23172FC,
+            0x23175B4,
+            0x2317758,
+            0x2317880,
+            0x23179AC,
+            0x2317A50,
+            0x2317B00,
+            0x2317BF4,
+            0x2317DA8,
+            0x2318080,
+            0x23185F4,
+            0x23186EC,
+            0x23188DC,
+            0x2318998,
+            0x2318B18,
+            0x2318B9C,
+            0x2318CB4,
+            0x2318D14,
+            0x2318E2C,
+            0x2318EDC,
+            0x2318FC4,
+            0x23190F0,
+            0x2319228,
+            0x2319358,
+            0x2319420,
+            0x23194B4,
+            0x2319548,
+            0x23195DC,
+            0x2319670,
+            0x23196E0,
+            0x231974C,
+            0x2319890,
+            0x23198B8,
+            0x231992C,
+            0x23199D8,
+            0x2319A78,
+            0x2319B9C,
+            0x2319BD0,
+            0x2319BFC,
+            0x2319D20,
+            0x2319E54,
+            0x2319F1C,
+            0x231A340,
+            0x231A3E0,
+            0x231A47C,
+            0x231A51C,
+            0x231A5BC,
+            0x231A65C,
+            0x231A6FC,
+            0x231A7AC,
+            0x231A848,
+            0x231A8E8,
+            0x231A988,
+            0x231AA54,
+            0x231AAF4,
+            0x231AC18,
+            0x231AC9C,
+            0x231ACE4,
+            0x231AD50,
+            0x231B480,
+            0x231B574,
+            0x231BB64,
+            0x231BC70,
+            0x231C17C,
+            0x231C360,
+            0x231C3DC,
+            0x231C530,
+            0x231C570,
+            0x231C684,
+            0x231C808,
+            0x231C830,
+            0x231C8C8,
+            0x231C9B8,
+            0x231CB58,
+            0x231E0B8,
+            0x231E0E4,
+            0x231E118,
+            0x231E160,
+            0x231E24C,
+            0x231E2E8,
+            0x231E32C,
+            0x231E44C,
+            0x231E588,
+            0x231E96C,
+            0x231E9FC,
+            0x231EB48,
+            0x231EBA8,
+            0x231EC14,
+            0x231EC88,
+            0x231ED00,
+            0x231EE7C,
+            0x231F508,
+            0x231FD9C,
+            0x231FE3C,
+            0x231FE9C,
+            0x231FEC4,
+            0x231FEDC,
+            0x2320A40,
+            0x23210CC,
+            0x232128C,
+            0x23218F4,
+            0x2321C34,
+            0x23221B4,
+            0x23225B0,
+            0x2322F24,
+            0x232319C,
+            0x2323750,
+            0x23250E8,
+            0x23259C4,
+            0x2325A34,
+            0x2325AAC,
+            0x2325C28,
+            0x2325CE4,
+            0x2325DC4,
+            0x2325EAC,
+            0x2325F00,
+            0x2325FB0,
+            0x2326218,
+            0x23262D0,
+            0x23262F0,
+            0x2326B40,
+            0x2326F9C,
+            0x2327104,
+            0x232FC60,
+            0x2333E60,
+            0x2333F10,
+            0x2333FA8,
+            0x233403C,
+            0x23340CC,
+            0x233415C,
+            0x23343B4,
+            0x2334460,
+            0x23360F4,
+            0x233655C,
+            0x2336838,
+            0x23368B0,
+            0x2336A5C,
+            0x2336AAC,
+            0x2336C50,
+            0x2336D58,
+            0x2336DE0,
+            0x23374CC,
+            0x2337534,
+            0x23375A4,
+            0x23375D4,
+            0x23375F4,
+            0x2337630,
+            0x2337790,
+            0x23377BC,
+            0x23377F8,
+            0x2337820,
+            0x2337E14,
+            0x2337E4C,
+            0x2338314,
+            0x23387F0,
+            0x2338B60,
+            0x2338E00,
+            0x2338EF0,
+            0x2338F2C,
+            0x2338F60,
+            0x2339258,
+            0x233935C,
+            0x233964C,
+            0x2339730,
+            0x2339754,
+            0x2339780,
+            0x2339884,
+            0x233989C,
+            0x23398B4,
+            0x23398F4,
+            0x233990C,
+            0x2339924,
+            0x2339988,
+            0x23399B0,
+            0x23399C8,
+            0x23399E0,
+            0x2339A20,
+            0x2339A48,
+            0x2339A74,
+            0x2339A9C,
+            0x2339ACC,
+            0x2339B58,
+            0x2339C14,
+            0x2339C2C,
+            0x2339C44,
+            0x2339C5C,
+            0x2339C74,
+            0x2339E88,
+            0x233A4DC,
+            0x233A5B0,
+            0x233ADE8,
+            0x233B0AC,
+            0x233B5DC,
+            0xFFFFFFFF,
+            0x233B5F4,
+            0x233B654,
+            0x233B6B4,
+            0x233B9E8,
+            0x233B9F4,
+            0x233BA18,
+            0x233BA9C,
+            0x233C23C,
+            0x233C248,
+            0x233C258,
+            0x233C2D0,
+            0x233C3EC,
+            0x233C554,
+            0x233C9E0,
+            0x233CE40,
+            0x233CFA0,
+            0x233D138,
+            0x233D2F4,
+            0x233D440,
+            0x233D6D4,
+            0x233D6F0,
+            0x233DB34,
+            0x233DC04,
+            0x233DDA8,
+            0x233E344,
+            0x233E3C4,
+            0x233E4C4,
+            0x233E6D8,
+            0x233EA34,
+            0x233F41C,
+            0x233F7FC,
+            0x23400F4,
+            0x23404E0,
+            0x23407E4,
+            0x2340CC0,
+            0x2340CFC,
+            0x2340FA8,
+            0x234135C,
+            0x23415E4,
+            0x2341818,
+            0x2341A94,
+            0x2341C3C,
+            0x2341C90,
+            0x2341D34,
+            0x2341DCC,
+            0x2341E38,
+            0x2341E94,
+            0x2341ECC,
+            0x234206C,
+            0x23420A4,
+            0x234210C,
+            0x2342830,
+            0x2342B2C,
+            0x2342B6C,
+            0x234322C,
+            0x2343890,
+            0x2343908,
+            0x2343F3C,
+            0x2344028,
+            0x234404C,
+            0x234415C,
+            0x2344280,
+            0x23442CC,
+            0x23442F4,
+            0x2344D30,
+            0x234509C,
+            0x2345154,
+            0x23451E4,
+            0x2345418,
+            0x234544C,
+            0x2345470,
+            0x23454A0,
+            0x23454D0,
+            0x2345500,
+            0x234550C,
+            0x2345524,
+            0x234553C,
+            0x2345554,
+            0x2345778,
+            0x23457F4,
+            0x23458D0,
+            0x23458FC,
+            0x2345F94,
+            0x2345FA8,
+            0x234641C,
+            0x23468FC,
+            0x2346A80,
+            0x2346E00,
+            0x2346E9C,
+            0x2347424,
+            0x2347B94,
+            0x2347BE4,
+            0x2347F8C,
+            0x23482D4,
+            0x23483F0,
+            0x2348684,
+            0x23493A8,
+            0x234965C,
+            0x2349694,
+            0x234A474,
+            0x234A4CC,
+            0x234A4EC,
+            0x234A530,
+            0x234A544,
+            0x234A578,
+            0x234A5B4,
+            0x234A5D8,
+            0x234A5FC,
+            0x234A63C,
+            0x234A674,
+            0x234A720,
+            0x234A798,
+            0x234A7B8,
+            0x234A7CC,
+            0x234A7F4,
+            0x234A818,
+            0x234A844,
+            0x234A88C,
+            0x234A8EC,
+            0x234A910,
+            0x234A948,
+            0x234A960,
+            0x234A9EC,
+            0x234AA00,
+            0x234AA70,
+            0x234AB90,
+            0x234C4C0,
+            0x234C514,
+            0x234C554,
+            0x234C58C,
+            0x234C5B0,
+            0x234C5C0,
+            0x234C614,
+            0x234C660,
+            0x234C6B4,
+            0x234C708,
+            0x234C72C,
+            0x234C778,
+            0x234C984,
+            0x234CD24,
+            0x234CDC0,
+            0x234D18C,
+            0x234D66C,
+            0x234D8CC,
+            0x234DA38,
+            0x234DC48,
+            0x234DDEC,
+            0x234DF18,
+            0x234E154,
+            0x234E1C4,
+            0x234E250,
+            0x234E4E4,
+            0x234E538,
+            0x234E7A4,
+            0x234E81C,
+            0x234F080,
+            0x2350A40,
+            0x2350CA4,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1893,
+            1894,
+            1895,
+            1896,
+            1897,
+            1898,
+            1899,
+            1900,
+            1901,
+            1902,
+            196,
+            1903,
+            1904,
+            1905,
+            1906,
+            1907,
+            1908,
+            1909,
+            1910,
+            1911,
+            1912,
+            1913,
+            1913,
+            1914,
+            1915,
+            1916,
+            1917,
+            1918,
+            1919,
+            1920,
+            1921,
+            1922,
+            1923,
+            1924,
+            1925,
+            1926,
+            1927,
+            1928,
+            1929,
+            1930,
+            1931,
+            1932,
+            1933,
+            1934,
+            1935,
+            1936,
+            1937,
+            1938,
+            1939,
+            1940,
+            1941,
+            1942,
+            1943,
+            1944,
+            1945,
+            1946,
+            1947,
+            1948,
+            1949,
+            1950,
+            1951,
+            1952,
+            1953,
+            1954,
+            1955,
+            1956,
+            1957,
+            1958,
+            1959,
+            1960,
+            1961,
+            1962,
+            1963,
+            1964,
+            1965,
+            1966,
+            1967,
+            1968,
+            1969,
+            1970,
+            1971,
+            1972,
+            1973,
+            1974,
+            1975,
+            1976,
+            1977,
+            1978,
+            1979,
+            1980,
+            1981,
+            1982,
+            1983,
+            1984,
+            1985,
+            1986,
+            1987,
+            1988,
+            1989,
+            1990,
+            1991,
+            1992,
+            1993,
+            1994,
+            1995,
+            1996,
+            1997,
+            1998,
+            1999,
+            2000,
+            2001,
+            2002,
+            2003,
+            2004,
+            2005,
+            2006,
+            2007,
+            2008,
+            2009,
+            2010,
+            2011,
+            2012,
+            2013,
+            2014,
+            2015,
+            2016,
+            2017,
+            2018,
+            2019,
+            2020,
+            2021,
+            2022,
+            2023,
+            2024,
+            2025,
+            2026,
+            2027,
+            2028,
+            2029,
+            2030,
+            2031,
+            2032,
+            2033,
+            2034,
+            2035,
+            2036,
+            2037,
+            2038,
+            2039,
+            2040,
+            2041,
+            2042,
+            2043,
+            2044,
+            2045,
+            2046,
+            2047,
+            2048,
+            2049,
+            2050,
+            2051,
+            2052,
+            2053,
+            2054,
+            2055,
+            2056,
+            2057,
+            609,
+            163,
+            2058,
+            2059,
+            2060,
+            2061,
+            2062,
+            2063,
+            2064,
+            2065,
+            2066,
+            2067,
+            2068,
+            2069,
+            2070,
+            2071,
+            2072,
+            2073,
+            2074,
+            2075,
+            2076,
+            2077,
+            2078,
+            2079,
+            2080,
+            2081,
+            2082,
+            2083,
+            2084,
+            2085,
+            2086,
+            2087,
+            2088,
+            2089,
+            2090,
+            2091,
+            2092,
+            2093,
+            2094,
+            2095,
+            2096,
+            2097,
+            2098,
+            2099,
+            2100,
+            2101,
+            2102,
+            2103,
+            2104,
+            2105,
+            2106,
+            2107,
+            2108,
+            2109,
+            2110,
+            2111,
+            2112,
+            2113,
+            2114,
+            2115,
+            2116,
+            2117,
+            2118,
+            2119,
+            2120,
+            2121,
+            2122,
+            2123,
+            2124,
+            2125,
+            2126,
+            2127,
+            2128,
+            2129,
+            2130,
+            2131,
+            2132,
+            2133,
+            2134,
+            2135,
+            2136,
+            2137,
+            2138,
+            2139,
+            2140,
+            2141,
+            2142,
+            2143,
+            2144,
+            2145,
+            2146,
+            2147,
+            2148,
+            2149,
+            2150,
+            2151,
+            2152,
+            2153,
+            2154,
+            2155,
+            2156,
+            2157,
+            2158,
+            2159,
+            2160,
+            2161,
+            2162,
+            2163,
+            2164,
+            2165,
+            2166,
+            2167,
+            2168,
+            2169,
+            2170,
+            2171,
+            2172,
+            2173,
+            2174,
+            2175,
+            2176,
+            2177,
+            2178,
+            2179,
+            2180,
+            2181,
+            2182,
+            2183,
+            2184,
+            2185,
+            2186,
+            2187,
+            2188,
+            2189,
+            2190,
+            2191,
+            2192,
+            2193,
+            2194,
+            2195,
+            2196,
+            2197,
+            2198,
+            2199,
+            2200,
+            2201,
+            2202,
+            2203,
+            2204,
+            2205,
+            2206,
+            2207,
+            2208,
+            2209,
+            2210,
+            2211,
+            2212,
+            2213,
+            2214,
+            2215,
+            2216,
+            2217,
+            2218,
+            2219,
+            2220,
+            2221,
+            2222,
+            2223,
+            2224,
+            2225,
+            2226,
+            2227,
+            2228,
+            2229,
+            2230,
+            2231,
+            2232,
+            2233,
+            2234,
+            2235,
+            2236,
+            2237,
+            2238,
+            2239,
+            2240,
+            2241,
+            2242,
+            2243,
+            2244,
+            2245,
+            2246,
+            2247,
+            2248,
+            2249,
+            2250,
+            2251,
+            2252,
+            2253,
+            2254,
+            2255,
+            2256,
+            2257,
+            2258,
+            2259,
+            2260,
+            2261,
+            2262,
+            2263,
+            2264,
+            2265,
+            2266,
+            2267,
+            2268,
+            2269,
+            2270,
+            2271,
+            2272,
+            2273,
+            2274,
+            2275,
+            2276,
+            2277,
+            2278,
+            2279,
+            2280,
+            2281,
+            2282,
+            2283,
+            2284,
+            2285,
+            2286,
+            2286,
+            2286,
+            2287,
+            2288,
+            2289,
+            2290,
+            2291,
+            2292,
+            2293,
+            2294,
+            2295,
+            2296,
+            2297,
+            2298,
+            2299,
+            2300,
+            2301,
+            2302,
+            2303,
+            2304,
+            2305,
+            2306,
+            2307,
+            2308,
+            2309,
+            2310,
+            2311,
+            2312,
+            2313,
+            2314,
+            2315,
+            2316,
+            2317,
+            2318,
+            2319,
+            2320,
+            2321,
+            2322,
+            2323,
+            2324,
+            2325,
+            2326,
+            2327,
+            2328,
+            2329,
+            2330,
+            2331,
+            2332,
+            2333,
+            2334,
+            2335,
+            2336,
+            2337,
+            2338,
+            2339,
+            2340,
+            2341,
+            2342,
+            2343,
+            2344,
+            2345,
+            2346,
+            2347,
+            2348,
+            2349,
+            2350,
+            2351,
+            2352,
+            2353,
+            2354,
+            2355,
+            2356,
+            2357,
+            2358,
+            2359,
+            2360,
+            2361,
+            2362,
+            2363,
+            2364,
+            2365,
+            2366,
+            2367,
+            2368,
+            2369,
+            2370,
+            2371,
+            2372,
+            2373,
+            2374,
+            2375,
+            2376,
+            2377,
+            2378,
+            2379,
+            2380,
+            2381,
+            2382,
+            2383,
+            2384,
+            2385,
+            2386,
+            2387,
+            2388,
+            2389,
+            2390,
+            2391,
+            2392,
+            2393,
+            2394,
+            2395,
+            2396,
+            2397,
+            2398,
+            2399,
+            2400,
+            2401,
+            2402,
+            2403,
+            2404,
+            2405,
+            2406,
+            2407,
+            2408,
+            2409,
+            2410,
+            2411,
+            2412,
+            2413,
+            2414,
+            2415,
+            2416,
+            2417,
+            2418,
+            2419,
+            2420,
+            2421,
+            2422,
+            2423,
+            2424,
+            2425,
+            2426,
+            2427,
+            2428,
+            2429,
+            163,
+            2430,
+            2431,
+            163,
+            2432,
+            2433,
+            2434,
+            2435,
+            2436,
+            2437,
+            2438,
+            2439,
+            2440,
+            2441,
+            2442,
+            2443,
+            2444,
+            2445,
+            2446,
+            2447,
+            2448,
+            2449,
+            2450,
+            2451,
+            2452,
+            2453,
+            2454,
+            2455,
+            2456,
+            2457,
+            2458,
+            2459,
+            2460,
+            2461,
+            2462,
+            2463,
+            2464,
+            2465,
+            2466,
+            2467,
+            2468,
+            2469,
+            2470,
+            2471,
+            2472,
+            2473,
+            2474,
+            2475,
+            2476,
+            2477,
+            2478,
+            2479,
+            2480,
+            2481,
+            2482,
+            2483,
+            2484,
+            2485,
+            2486,
+            2487,
+            2488,
+            2489,
+            2490,
+            2491,
+            2492,
+            2493,
+            2494,
+            2495,
+            2496,
+            2497,
+            2498,
+            2499,
+            2500,
+            2501,
+            2502,
+            2503,
+            2504,
+            2505,
+            2506,
+            2507,
+            2508,
+            2509,
+            2510,
+            2511,
+            2512,
+            2513,
+            2514,
+            2515,
+            2516,
+            2517,
+            2518,
+            2519,
+            2520,
+            2521,
+            2522,
+            2523,
+            2524,
+            2525,
+            2526,
+            2527,
+            2528,
+            2529,
+            2530,
+            2531,
+            2532,
+            2533,
+            2534,
+            2535,
+            2536,
+            2537,
+            2538,
+            2539,
+            2540,
+            2541,
+            2542,
+            2543,
+            2544,
+            2545,
+            2546,
+            2547,
+            2548,
+            2549,
+            2550,
+            2551,
+            266,
+            163,
+            163,
+            2552,
+            2553,
+            2554,
+            2555,
+            2556,
+            2557,
+            2558,
+            2559,
+            2560,
+            2561,
+            2562,
+            2563,
+            2564,
+            2565,
+            2566,
+            2567,
+            2568,
+            2569,
+            2570,
+            2571,
+            2572,
+            2573,
+            2574,
+            2575,
+            2576,
+            2577,
+            2578,
+            2579,
+            2580,
+            2581,
+            2582,
+            2583,
+            2584,
+            2585,
+            2586,
+            2587,
+            2588,
+            2589,
+            2590,
+            2591,
+            2592,
+            2593,
+            2594,
+            2595,
+            2596,
+            2597,
+            2598,
+            2599,
+            2600,
+            2601,
+            2602,
+            2603,
+            2604,
+            2605,
+            2606,
+            2607,
+            2608,
+            2609,
+            2610,
+            2611,
+            2612,
+            2613,
+            2614,
+            2615,
+            2616,
+            2617,
+            2618,
+            2619,
+            2620,
+            2621,
+            2622,
+            2623,
+            2624,
+            2625,
+            2626,
+            2627,
+            2628,
+            2629,
+            2630,
+            2631,
+            2632,
+            2633,
+            2634,
+            2635,
+            2636,
+            2637,
+            2638,
+            2639,
+        ),
+    ),
+    c_types=None,
+    multi={
+        6: (
+            (
+                0x410C,
+                0x57CC,
+                0x7078,
+                0x7548,
+                0xD37C,
+                0x10390,
+                0x10B44,
+                0x120C4,
+                0x134C4,
+                0x142B4,
+                0x18FA4,
+                0x19FAC,
+                0x1B050,
+                0x204B0,
+                0x228A8,
+                0x23C34,
+                0x266A8,
+                0x28428,
+                0x291FC,
+                0x29874,
+                0x2BB4C,
+                0x2BED0,
+                0x2CC94,
+                0x3254C,
+                0x32C64,
+                0x34C58,
+                0x354EC,
+                0x38D10,
+                0x3C924,
+                0x3CA3C,
+                0x3DB7C,
+                0x3ED80,
+                0x407B4,
+                0x429A4,
+                0x4313C,
+                0x437C8,
+                0x43D48,
+                0x44330,
+                0x45004,
+                0x491CC,
+                0x5235C,
+                0x57AB8,
+                0x58BE4,
+                0x5B78C,
+                0x685DC,
+                0x6917C,
+                0x6D28C,
+                0x7177C,
+                0x725B8,
+            ),
+            (
+                0x22E19EC,
+                0x22E30AC,
+                0x22E4958,
+                0x22E4E28,
+                0x22EAC5C,
+                0x22EDC70,
+                0x22EE424,
+                0x22EF9A4,
+                0x22F0DA4,
+                0x22F1B94,
+                0x22F6884,
+                0x22F788C,
+                0x22F8930,
+                0x22FDD90,
+                0x2300188,
+                0x2301514,
+                0x2303F88,
+                0x2305D08,
+                0x2306ADC,
+                0x2307154,
+                0x230942C,
+                0x23097B0,
+                0x230A574,
+                0x230FE2C,
+                0x2310544,
+                0x2312538,
+                0x2312DCC,
+                0x23165F0,
+                0x231A204,
+                0x231A31C,
+                0x231B45C,
+                0x231C660,
+                0x231E094,
+                0x2320284,
+                0x2320A1C,
+                0x23210A8,
+                0x2321628,
+                0x2321C10,
+                0x23228E4,
+                0x2326AAC,
+                0x232FC3C,
+                0x2335398,
+                0x23364C4,
+                0x233906C,
+                0x2345EBC,
+                0x2346A5C,
+                0x234AB6C,
+                0x234F05C,
+                0x234FE98,
+            ),
+        ),
+        38: (
+            (
+                0x709C,
+                0x12094,
+                0x196B0,
+                0x233C8,
+                0x2633C,
+                0x2BB70,
+                0x2E678,
+                0x321D4,
+                0x3346C,
+                0x34C7C,
+                0x35824,
+                0x38D34,
+                0x6B620,
+            ),
+            (
+                0x22E497C,
+                0x22EF974,
+                0x22F6F90,
+                0x2300CA8,
+                0x2303C1C,
+                0x2309450,
+                0x230BF58,
+                0x230FAB4,
+                0x2310D4C,
+                0x231255C,
+                0x2313104,
+                0x2316614,
+                0x2348F00,
+            ),
+        ),
+        50: (
+            (0x9EC0, 0x9F0C, 0x9F58, 0x9FA4, 0xA254, 0xA2A0),
+            (0x22E77A0, 0x22E77EC, 0x22E7838, 0x22E7884, 0x22E7B34, 0x22E7B80),
+        ),
+        89: ((0xE8A8, 0xE8D8), (0x22EC188, 0x22EC1B8)),
+        179: (
+            (0x1D3AC, 0x25694, 0x2E5E4, 0x357C4, 0x4692C, 0x56520),
+            (0x22FAC8C, 0x2302F74, 0x230BEC4, 0x23130A4, 0x232420C, 0x2333E00),
+        ),
+        180: (
+            (
+                0x1D3F8,
+                0x256E0,
+                0x2E630,
+                0x335DC,
+                0x3C6A0,
+                0x3E5C4,
+                0x3EF04,
+                0x46978,
+                0x70E0C,
+            ),
+            (
+                0x22FACD8,
+                0x2302FC0,
+                0x230BF10,
+                0x2310EBC,
+                0x2319F80,
+                0x231BEA4,
+                0x231C7E4,
+                0x2324258,
+                0x234E6EC,
+            ),
+        ),
+        193: (
+            (
+                0x1E944,
+                0x23A78,
+                0x2E654,
+                0x33508,
+                0x34CAC,
+                0x383E0,
+                0x3D398,
+                0x3E46C,
+                0x474D8,
+                0x564FC,
+                0x6B650,
+                0x6BD58,
+            ),
+            (
+                0x22FC224,
+                0x2301358,
+                0x230BF34,
+                0x2310DE8,
+                0x231258C,
+                0x2315CC0,
+                0x231AC78,
+                0x231BD4C,
+                0x2324DB8,
+                0x2333DDC,
+                0x2348F30,
+                0x2349638,
+            ),
+        ),
+    },
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "DUNGEON_STRUCT_SIZE",
+        "MAX_HP_CAP",
+        "OFFSET_OF_DUNGEON_FLOOR_PROPERTIES",
+        "SPAWN_RAND_MAX",
+        "DUNGEON_PRNG_LCG_MULTIPLIER",
+        "DUNGEON_PRNG_LCG_INCREMENT_SECONDARY",
+        "ATTACK_SPRITE_BUFFER_SIZE",
+        "KECLEON_FEMALE_ID",
+        "KECLEON_MALE_ID",
+        "MSG_ID_SLOW_START",
+        "EXPERIENCE_POINT_GAIN_CAP",
+        "JUDGMENT_MOVE_ID",
+        "REGULAR_ATTACK_MOVE_ID",
+        "DEOXYS_ATTACK_ID",
+        "DEOXYS_SPEED_ID",
+        "GIRATINA_ALTERED_ID",
+        "PUNISHMENT_MOVE_ID",
+        "OFFENSE_STAT_MAX",
+        "PROJECTILE_MOVE_ID",
+        "BELLY_LOST_PER_TURN",
+        "MONSTER_HEAL_HP_MAX",
+        "MOVE_TARGET_AND_RANGE_SPECIAL_USER_HEALING",
+        "PLAIN_SEED_STRING_ID",
+        "MAX_ELIXIR_PP_RESTORATION",
+        "SLIP_SEED_FAIL_STRING_ID",
+        "ROCK_WRECKER_MOVE_ID",
+        "CASTFORM_NORMAL_FORM_MALE_ID",
+        "CASTFORM_NORMAL_FORM_FEMALE_ID",
+        "CHERRIM_SUNSHINE_FORM_MALE_ID",
+        "CHERRIM_OVERCAST_FORM_FEMALE_ID",
+        "CHERRIM_SUNSHINE_FORM_FEMALE_ID",
+        "FLOOR_GENERATION_STATUS_PTR",
+        "OFFSET_OF_DUNGEON_N_NORMAL_ITEM_SPAWNS",
+        "DUNGEON_GRID_COLUMN_BYTES",
+        "DEFAULT_MAX_POSITION",
+        "OFFSET_OF_DUNGEON_GUARANTEED_ITEM_ID",
+        "FIXED_ROOM_TILE_SPAWN_TABLE",
+        "TREASURE_BOX_1_ITEM_IDS",
+        "FIXED_ROOM_REVISIT_OVERRIDES",
+        "FIXED_ROOM_MONSTER_SPAWN_TABLE",
+        "FIXED_ROOM_ITEM_SPAWN_TABLE",
+        "FIXED_ROOM_ENTITY_SPAWN_TABLE",
+        "STATUS_ICON_ARRAY_MUZZLED",
+        "STATUS_ICON_ARRAY_MAGNET_RISE",
+        "STATUS_ICON_ARRAY_MIRACLE_EYE",
+        "STATUS_ICON_ARRAY_LEECH_SEED",
+        "STATUS_ICON_ARRAY_LONG_TOSS",
+        "STATUS_ICON_ARRAY_BLINDED",
+        "STATUS_ICON_ARRAY_BURN",
+        "STATUS_ICON_ARRAY_SURE_SHOT",
+        "STATUS_ICON_ARRAY_INVISIBLE",
+        "STATUS_ICON_ARRAY_SLEEP",
+        "STATUS_ICON_ARRAY_CURSE",
+        "STATUS_ICON_ARRAY_FREEZE",
+        "STATUS_ICON_ARRAY_CRINGE",
+        "STATUS_ICON_ARRAY_BIDE",
+        "STATUS_ICON_ARRAY_REFLECT",
+        "DIRECTIONS_XY",
+        "DISPLACEMENTS_WITHIN_2_LARGEST_FIRST",
+        "DISPLACEMENTS_WITHIN_2_SMALLEST_FIRST",
+        "DISPLACEMENTS_WITHIN_3",
+        "ITEM_CATEGORY_ACTIONS",
+        "FRACTIONAL_TURN_SEQUENCE",
+        "BELLY_DRAIN_IN_WALLS_INT",
+        "BELLY_DRAIN_IN_WALLS_THOUSANDTHS",
+        "DAMAGE_MULTIPLIER_0_5",
+        "DAMAGE_MULTIPLIER_1_5",
+        "DAMAGE_MULTIPLIER_2",
+        "CLOUDY_DAMAGE_MULTIPLIER",
+        "SOLID_ROCK_MULTIPLIER",
+        "DAMAGE_FORMULA_MAX_BASE",
+        "WONDER_GUARD_MULTIPLIER",
+        "DAMAGE_FORMULA_MIN_BASE",
+        "TYPE_DAMAGE_NEGATING_EXCLUSIVE_ITEM_EFFECTS",
+        "TWO_TURN_STATUSES",
+        "TWO_TURN_MOVES_AND_STATUSES",
+        "SPATK_STAT_IDX",
+        "ATK_STAT_IDX",
+        "ROLLOUT_DAMAGE_MULT_TABLE",
+        "MAP_COLOR_TABLE",
+        "CORNER_CARDINAL_NEIGHBOR_IS_OPEN",
+        "GUMMI_LIKE_STRING_IDS",
+        "GUMMI_IQ_STRING_IDS",
+        "DAMAGE_STRING_IDS",
+        "DUNGEON_PTR",
+        "DUNGEON_PTR_MASTER",
+        "TOP_SCREEN_STATUS_PTR",
+        "LEADER_PTR",
+        "DUNGEON_PRNG_STATE",
+        "DUNGEON_PRNG_STATE_SECONDARY_VALUES",
+        "LOADED_ATTACK_SPRITE_FILE_INDEX",
+        "LOADED_ATTACK_SPRITE_PACK_ID",
+        "EXCL_ITEM_EFFECTS_WEATHER_ATK_SPEED_BOOST",
+        "EXCL_ITEM_EFFECTS_WEATHER_MOVE_SPEED_BOOST",
+        "EXCL_ITEM_EFFECTS_WEATHER_NO_STATUS",
+        "AI_THROWN_ITEM_ACTION_CHOICE_COUNT",
+        "EXCL_ITEM_EFFECTS_EVASION_BOOST",
+        "DEFAULT_TILE",
+        "HIDDEN_STAIRS_SPAWN_BLOCKED",
+        "FIXED_ROOM_DATA_PTR",
+        "DUNGEON_FADES_PTR",
+        "NECTAR_IQ_BOOST",
+        "COMPRESSED_SPRITE_BUFFER_SIZE",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x1ABC8,
+            0x1B0EC,
+            0x1B0F0,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x300C8,
+            0x300CC,
+            0x300D0,
+            0x300D4,
+            0x300D8,
+            0x300DC,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x346B8,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x58F44,
+            0x58F48,
+            0x58F4C,
+            0x58F50,
+            0x58F54,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x73770,
+            0x7379C,
+            0x737B4,
+            0x738B4,
+            0x73A94,
+            0x73C8C,
+            0x74B5C,
+            0x74B6C,
+            0x74B8C,
+            0x74B9C,
+            0x74BB4,
+            0x74C0C,
+            0x74C34,
+            0x74C5C,
+            0x74C84,
+            0x74CAC,
+            0x74CDC,
+            0x74D14,
+            0x74D54,
+            0x74D94,
+            0x74E94,
+            0x750BC,
+            0x7517C,
+            0x751E4,
+            0x7524C,
+            0x759B0,
+            0x75C24,
+            0x76108,
+            0x7610A,
+            0x761DC,
+            0x761E4,
+            0x761EC,
+            0x761FC,
+            0x76204,
+            0x7620C,
+            0xFFFFFFFF,
+            0x7621C,
+            0x76244,
+            0x76400,
+            0x7644C,
+            0x76488,
+            0x7648C,
+            0x76490,
+            0x76970,
+            0x769B0,
+            0x76C70,
+            0x76CC4,
+            0x76CD0,
+            0x76ED8,
+            0xFFFFFFFF,
+            0x76EF4,
+            0x76EFC,
+            0x76F10,
+            0x76F24,
+            0x76F4C,
+            0xFFFFFFFF,
+            0x76F50,
+            0x76F58,
+            0x76F60,
+            0x7709C,
+            0x770B0,
+            0x770BC,
+            0x77124,
+            0x7712C,
+            0x77178,
+            0x3FF70,
+            0x6F8F0,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x22F84A8,
+            0x22F89CC,
+            0x22F89D0,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x230D9A8,
+            0x230D9AC,
+            0x230D9B0,
+            0x230D9B4,
+            0x230D9B8,
+            0x230D9BC,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2311F98,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2336824,
+            0x2336828,
+            0x233682C,
+            0x2336830,
+            0x2336834,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2351050,
+            0x235107C,
+            0x2351094,
+            0x2351194,
+            0x2351374,
+            0x235156C,
+            0x235243C,
+            0x235244C,
+            0x235246C,
+            0x235247C,
+            0x2352494,
+            0x23524EC,
+            0x2352514,
+            0x235253C,
+            0x2352564,
+            0x235258C,
+            0x23525BC,
+            0x23525F4,
+            0x2352634,
+            0x2352674,
+            0x2352774,
+            0x235299C,
+            0x2352A5C,
+            0x2352AC4,
+            0x2352B2C,
+            0x2353290,
+            0x2353504,
+            0x23539E8,
+            0x23539EA,
+            0x2353ABC,
+            0x2353AC4,
+            0x2353ACC,
+            0x2353ADC,
+            0x2353AE4,
+            0x2353AEC,
+            0xFFFFFFFF,
+            0x2353AFC,
+            0x2353B24,
+            0x2353CE0,
+            0x2353D2C,
+            0x2353D68,
+            0x2353D6C,
+            0x2353D70,
+            0x2354250,
+            0x2354290,
+            0x2354550,
+            0x23545A4,
+            0x23545B0,
+            0x23547B8,
+            0xFFFFFFFF,
+            0x23547D4,
+            0x23547DC,
+            0x23547F0,
+            0x2354804,
+            0x235482C,
+            0xFFFFFFFF,
+            0x2354830,
+            0x2354838,
+            0x2354840,
+            0x235497C,
+            0x2354990,
+            0x235499C,
+            0x2354A04,
+            0x2354A0C,
+            0x2354A58,
+            0x231D850,
+            0x234D1D0,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x4,
+            0x4,
+            0x4,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x4,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2C,
+            0x18,
+            0x100,
+            0x1E0,
+            0x1F8,
+            0xC9C,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x2,
+            0x2,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xB,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x4,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            2640,
+            2641,
+            2642,
+            2643,
+            2644,
+            2645,
+            2646,
+            2647,
+            2648,
+            2649,
+            2650,
+            2651,
+            2652,
+            2653,
+            2654,
+            2655,
+            2656,
+            2657,
+            2658,
+            2659,
+            2641,
+            2660,
+            2661,
+            2662,
+            2663,
+            2664,
+            2665,
+            2666,
+            2667,
+            2668,
+            2669,
+            2670,
+            2671,
+            2672,
+            2673,
+            2674,
+            2675,
+            2676,
+            2677,
+            2678,
+            2679,
+            2680,
+            2681,
+            2682,
+            2683,
+            2684,
+            2685,
+            2686,
+            2687,
+            2688,
+            2689,
+            2690,
+            2691,
+            2692,
+            2693,
+            2694,
+            2695,
+            2696,
+            2697,
+            2698,
+            2699,
+            2700,
+            2701,
+            2702,
+            2703,
+            2704,
+            2705,
+            2706,
+            2707,
+            2708,
+            2709,
+            2710,
+            2711,
+            2712,
+            2713,
+            2714,
+            2715,
+            2716,
+            2717,
+            2718,
+            2719,
+            2720,
+            2721,
+            2722,
+            2723,
+            2724,
+            2725,
+            2726,
+            2727,
+            2728,
+            2729,
+            2730,
+            2731,
+            2732,
+            2733,
+            2734,
+            2735,
+            2736,
+            2737,
+            2738,
+            2739,
+            2740,
+            2741,
+        ),
+    ),
+    c_types=(
+        "uint32_t",
+        "int32_t",
+        "uint32_t",
+        "int32_t",
+        "uint32_t",
+        "uint32_t",
+        "int32_t",
+        "enum monster_id",
+        "enum monster_id",
+        "int32_t",
+        "int32_t",
+        "enum move_id",
+        "enum move_id",
+        "enum monster_id",
+        "enum monster_id",
+        "enum monster_id",
+        "enum move_id",
+        "int32_t",
+        "enum move_id",
+        "fx32_16",
+        "int",
+        "struct move_target_and_range",
+        "int32_t",
+        "int32_t",
+        "int32_t",
+        "enum move_id",
+        "enum monster_id",
+        "enum monster_id",
+        "enum monster_id",
+        "enum monster_id",
+        "enum monster_id",
+        "struct floor_generation_status*",
+        "uint32_t",
+        "uint32_t",
+        "int32_t",
+        "uint32_t",
+        "struct fixed_room_tile_spawn_entry[11]",
+        "struct item_id_16[12]",
+        "struct fixed_room_id_8[256]",
+        "struct fixed_room_monster_spawn_entry[120]",
+        "struct fixed_room_item_spawn_entry[63]",
+        "struct fixed_room_entity_spawn_entry[269]",
+        "struct status_icon_flags[2]",
+        "struct status_icon_flags[2]",
+        "struct status_icon_flags[3]",
+        "struct status_icon_flags[3]",
+        "struct status_icon_flags[3]",
+        "struct status_icon_flags[5]",
+        "struct status_icon_flags[5]",
+        "struct status_icon_flags[5]",
+        "struct status_icon_flags[5]",
+        "struct status_icon_flags[8]",
+        "struct status_icon_flags[7]",
+        "struct status_icon_flags[8]",
+        "struct status_icon_flags[8]",
+        "struct status_icon_flags[14]",
+        "struct status_icon_flags[18]",
+        "int16_t[8][2]",
+        "struct position[26]",
+        "struct position[26]",
+        "struct position[50]",
+        "struct action_16[16]",
+        "int16_t[125]",
+        "uint16_t",
+        "uint16_t",
+        "struct fx64_16",
+        "struct fx64_16",
+        "struct fx64_16",
+        "struct fx64_16",
+        "struct fx64_16",
+        "struct fx64_16",
+        "struct fx64_16",
+        "struct fx64_16",
+        "struct damage_negating_exclusive_eff_entry[28]",
+        "struct status_two_turn_id_8[11]",
+        "struct two_turn_move_and_status[22]",
+        "int32_t",
+        "int32_t",
+        "fx32_8[10]",
+        "struct rgba[9]",
+        "bool[4][8]",
+        "int16_t[4]",
+        "int16_t[5]",
+        "int16_t[27]",
+        "struct dungeon*",
+        "struct dungeon*",
+        "struct top_screen_status*",
+        "struct entity*",
+        "struct prng_state",
+        "uint32_t[5]",
+        "uint16_t",
+        "enum pack_file_id",
+        "struct exclusive_item_effect_id_8[8]",
+        "struct exclusive_item_effect_id_8[8]",
+        "struct exclusive_item_effect_id_8[8]",
+        "uint32_t",
+        "struct exclusive_item_effect_id_8[8]",
+        "struct tile",
+        "bool",
+        "void*",
+        "struct dungeon_fades*",
+        "struct data_processing_instruction",
+        "struct data_processing_instruction",
+    ),
+    multi={},
+)
@@ -0,0 +1,492 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay31 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "EntryOverlay31",
+        "DrawDungeonMenuStatusWindow",
+        "DungeonMenuSwitch",
+        "CreateStairsMenuState",
+        "StairsSubheadingCallback",
+        "HandleStairsMenu",
+        "MovesMenu",
+        "HandleMovesMenuWrapper0",
+        "HandleMovesMenuWrapper1",
+        "HandleMovesMenu",
+        "TeamMenu",
+        "RestMenu",
+        "RecruitmentSearchMenuLoop",
+        "HelpMenuLoop",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x0,
+            0x44,
+            0x2A0,
+            0x6B4,
+            0x748,
+            0x79C,
+            0x2990,
+            0x2B8C,
+            0x2BB0,
+            0x2BD4,
+            0x4828,
+            0x5F4C,
+            0x63DC,
+            0x6A20,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x2383AA0,
+            0x2383AE4,
+            0x2383D40,
+            0x2384154,
+            0x23841E8,
+            0x238423C,
+            0x2386430,
+            0x238662C,
+            0x2386650,
+            0x2386674,
+            0x23882C8,
+            0x23899EC,
+            0x2389E7C,
+            0x238A4C0,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            163,
+            2745,
+            2746,
+            2747,
+            2748,
+            2749,
+            2750,
+            2751,
+            2752,
+            2753,
+            2754,
+            2755,
+            2756,
+            2757,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "DUNGEON_WINDOW_PARAMS_1",
+        "DUNGEON_WINDOW_PARAMS_2",
+        "DUNGEON_WINDOW_PARAMS_3",
+        "DUNGEON_WINDOW_PARAMS_4",
+        "DUNGEON_MAIN_MENU_ITEMS",
+        "DUNGEON_MENU_SWITCH_STR1",
+        "OVERLAY31_UNKNOWN_STRING_IDS",
+        "OVERLAY31_UNKNOWN_STRUCT__NA_2389E30",
+        "DUNGEON_WINDOW_PARAMS_5",
+        "DUNGEON_WINDOW_PARAMS_6",
+        "DUNGEON_WINDOW_PARAMS_7",
+        "DUNGEON_SUBMENU_ITEMS_1",
+        "DUNGEON_SUBMENU_ITEMS_2",
+        "DUNGEON_SUBMENU_ITEMS_3",
+        "DUNGEON_SUBMENU_ITEMS_4",
+        "OVERLAY31_UNKNOWN_STRUCT__NA_2389EF0",
+        "DUNGEON_WINDOW_PARAMS_8",
+        "DUNGEON_WINDOW_PARAMS_9",
+        "DUNGEON_WINDOW_PARAMS_10",
+        "DUNGEON_WINDOW_PARAMS_11",
+        "DUNGEON_WINDOW_PARAMS_12",
+        "DUNGEON_WINDOW_PARAMS_13",
+        "OVERLAY31_JP_STRING",
+        "DUNGEON_WINDOW_PARAMS_14",
+        "DUNGEON_WINDOW_PARAMS_15",
+        "DUNGEON_WINDOW_PARAMS_16",
+        "DUNGEON_WINDOW_PARAMS_17",
+        "DUNGEON_WINDOW_PARAMS_18",
+        "DUNGEON_WINDOW_PARAMS_19",
+        "OVERLAY31_UNKNOWN_STRUCT__NA_2389FE8",
+        "DUNGEON_WINDOW_PARAMS_20",
+        "DUNGEON_WINDOW_PARAMS_21",
+        "DUNGEON_WINDOW_PARAMS_22",
+        "DUNGEON_WINDOW_PARAMS_23",
+        "DUNGEON_WINDOW_PARAMS_24",
+        "DUNGEON_WINDOW_PARAMS_25",
+        "DUNGEON_SUBMENU_ITEMS_5",
+        "DUNGEON_WINDOW_PARAMS_26",
+        "OVERLAY31_UNKNOWN_STRUCT__NA_238A144",
+        "DUNGEON_WINDOW_PARAMS_27",
+        "DUNGEON_WINDOW_PARAMS_28",
+        "OVERLAY31_UNKNOWN_STRUCT__NA_238A190",
+        "DUNGEON_SUBMENU_ITEMS_6",
+        "DUNGEON_WINDOW_PARAMS_29",
+        "DUNGEON_WINDOW_PARAMS_30",
+        "DUNGEON_WINDOW_PARAMS_31",
+        "DUNGEON_WINDOW_PARAMS_32",
+        "OVERLAY31_RESERVED_SPACE",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A260",
+        "OVERLAY31_UNKNOWN_VALUE__NA_238A264",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A268",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A26C",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A270",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A274",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A278",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A27C",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A280",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A284",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A288",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A28C",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x75BC,
+            0x75CC,
+            0x75DC,
+            0x75EC,
+            0x75FC,
+            0x763C,
+            0x7648,
+            0x7658,
+            0x7668,
+            0x7678,
+            0x7688,
+            0x7698,
+            0x76B8,
+            0x76D8,
+            0x76F8,
+            0x7718,
+            0x7724,
+            0x7734,
+            0x7744,
+            0x7754,
+            0x7764,
+            0x7774,
+            0x778C,
+            0x77B0,
+            0x77C0,
+            0x77D0,
+            0x77E0,
+            0x77F0,
+            0x7800,
+            0x7810,
+            0x781C,
+            0x782C,
+            0x783C,
+            0x784C,
+            0x785C,
+            0x7934,
+            0x7944,
+            0x795C,
+            0x796C,
+            0x7998,
+            0x79A8,
+            0x79B8,
+            0x79C8,
+            0x7A10,
+            0x7A20,
+            0x7A30,
+            0x7A40,
+            0x7A78,
+            0x7A80,
+            0x7A84,
+            0x7A88,
+            0x7A8C,
+            0x7A90,
+            0x7A9C,
+            0x7AA0,
+            0x7AA4,
+            0x7AA8,
+            0x7AAC,
+            0x7AB0,
+            0x7AB4,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238B05C,
+            0x238B06C,
+            0x238B07C,
+            0x238B08C,
+            0x238B09C,
+            0x238B0DC,
+            0x238B0E8,
+            0x238B0F8,
+            0x238B108,
+            0x238B118,
+            0x238B128,
+            0x238B138,
+            0x238B158,
+            0x238B178,
+            0x238B198,
+            0x238B1B8,
+            0x238B1C4,
+            0x238B1D4,
+            0x238B1E4,
+            0x238B1F4,
+            0x238B204,
+            0x238B214,
+            0x238B22C,
+            0x238B250,
+            0x238B260,
+            0x238B270,
+            0x238B280,
+            0x238B290,
+            0x238B2A0,
+            0x238B2B0,
+            0x238B2BC,
+            0x238B2CC,
+            0x238B2DC,
+            0x238B2EC,
+            0x238B2FC,
+            0x238B3D4,
+            0x238B3E4,
+            0x238B3FC,
+            0x238B40C,
+            0x238B438,
+            0x238B448,
+            0x238B458,
+            0x238B468,
+            0x238B4B0,
+            0x238B4C0,
+            0x238B4D0,
+            0x238B4E0,
+            0x238B518,
+            0x238B520,
+            0x238B524,
+            0x238B528,
+            0x238B52C,
+            0x238B530,
+            0x238B53C,
+            0x238B540,
+            0x238B544,
+            0x238B548,
+            0x238B54C,
+            0x238B550,
+            0x238B554,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x40,
+            0xC,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x20,
+            0x20,
+            0x20,
+            0x20,
+            0xC,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x24,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0xC,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x18,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x48,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            266,
+            266,
+            266,
+            266,
+            1,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1,
+            1,
+            1,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            2758,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[8]",
+        "char[12]",
+        "",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[3]",
+        "struct window_params",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "struct simple_menu_id_item[9]",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+    ),
+    multi={},
+)
@@ -0,0 +1,146 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay9 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "CreateJukeboxTrackMenu",
+        "CloseJukeboxTrackMenu",
+        "IsJukeboxTrackMenuActive",
+        "UpdateJukeboxTrackMenu",
+        "CreatePlaybackControlsMenu",
+        "ClosePlaybackControlsMenu",
+        "IsPlaybackControlsMenuActive",
+        "UpdatePlaybackControlsMenu",
+        "CreateInputLockBox",
+        "CloseInputLockBox",
+        "IsInputLockBoxActive",
+        "UpdateInputLockBox",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x1558,
+            0x1874,
+            0x18AC,
+            0x1904,
+            0x1E44,
+            0x2184,
+            0x2228,
+            0x22B0,
+            0x273C,
+            0x28EC,
+            0x2908,
+            0x2928,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x233F858,
+            0x233FB74,
+            0x233FBAC,
+            0x233FC04,
+            0x2340144,
+            0x2340484,
+            0x2340528,
+            0x23405B0,
+            0x2340A3C,
+            0x2340BEC,
+            0x2340C08,
+            0x2340C28,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            2761,
+            2762,
+            2763,
+            2764,
+            2765,
+            2766,
+            2767,
+            2768,
+            2769,
+            2770,
+            2771,
+            2772,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "JUKEBOX_TRACK_MENU_DEFAULT_WINDOW_PARAMS",
+        "PLAYBACK_CONTROLS_MENU_DEFAULT_WINDOW_PARAMS",
+        "INPUT_LOCK_BOX_DEFAULT_WINDOW_PARAMS",
+        "TOP_MENU_RETURN_MUSIC_ID",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x2CC0,
+            0x2CD0,
+            0x2CE0,
+            0xE20,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x2340FC0,
+            0x2340FD0,
+            0x2340FE0,
+            0x233F120,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            2773,
+            2774,
+            2775,
+            2776,
+        ),
+    ),
+    c_types=(
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct data_processing_instruction",
+    ),
+    multi={},
+)
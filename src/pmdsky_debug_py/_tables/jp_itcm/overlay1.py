@@ -0,0 +1,190 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay1 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "CreateMainMenus",
+        "AddMainMenuOption",
+        "AddSubMenuOption",
+        "ProcessContinueScreenContents",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1529,
+            1530,
+            1531,
+            1532,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "PRINTS_STRINGS",
+        "PRINTS_STRUCT",
+        "MAIN_MENU_WINDOW_PARAMS_1",
+        "MAIN_MENU_WINDOW_PARAMS_2",
+        "MAIN_MENU_WINDOW_PARAMS_3",
+        "MAIN_MENU_WINDOW_PARAMS_4",
+        "CONTINUE_CHOICE",
+        "SUBMENU",
+        "MAIN_MENU",
+        "MAIN_MENU_WINDOW_PARAMS_5",
+        "MAIN_MENU_WINDOW_PARAMS_6",
+        "MAIN_MENU_WINDOW_PARAMS_7",
+        "MAIN_MENU_ITEMS_CONFIRM",
+        "MAIN_MENU_WINDOW_PARAMS_8",
+        "MAIN_MENU_WINDOW_PARAMS_9",
+        "MAIN_DEBUG_MENU_ITEMS_1",
+        "MAIN_MENU_WINDOW_PARAMS_10",
+        "MAIN_DEBUG_MENU_ITEMS_2",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            266,
+            1533,
+            266,
+            266,
+            266,
+            266,
+            1,
+            1,
+            1,
+            266,
+            266,
+            266,
+            1,
+            266,
+            266,
+            1,
+            266,
+            1,
+        ),
+    ),
+    c_types=(
+        "",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[3]",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[12]",
+        "struct window_params",
+        "struct simple_menu_id_item[7]",
+    ),
+    multi={},
+)
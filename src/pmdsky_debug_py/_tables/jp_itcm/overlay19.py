@@ -0,0 +1,196 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay19 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "GetBarItem",
+        "GetRecruitableMonsterAll",
+        "GetRecruitableMonsterList",
+        "GetRecruitableMonsterListRestricted",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1884,
+            1885,
+            1885,
+            1885,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "OVERLAY19_UNKNOWN_TABLE__NA_238DAE0",
+        "BAR_UNLOCKABLE_DUNGEONS_TABLE",
+        "BAR_RECRUITABLE_MONSTER_TABLE",
+        "BAR_AVAILABLE_ITEMS",
+        "OVERLAY19_UNKNOWN_STRING_IDS__NA_238E178",
+        "OVERLAY19_UNKNOWN_STRUCT__NA_238E1A4",
+        "OVERLAY19_UNKNOWN_STRING_IDS__NA_238E1CC",
+        "BAR_WINDOW_PARAMS_1",
+        "BAR_WINDOW_PARAMS_2",
+        "BAR_WINDOW_PARAMS_3",
+        "BAR_MENU_ITEMS_CONFIRM_1",
+        "BAR_MENU_ITEMS_CONFIRM_2",
+        "OVERLAY19_UNKNOWN_STRING_IDS__NA_238E238",
+        "BAR_MAIN_MENU_ITEMS",
+        "BAR_SUBMENU_ITEMS_1",
+        "BAR_SUBMENU_ITEMS_2",
+        "OVERLAY19_RESERVED_SPACE",
+        "OVERLAY19_UNKNOWN_POINTER__NA_238E360",
+        "OVERLAY19_UNKNOWN_POINTER__NA_238E364",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1886,
+            1887,
+            1888,
+            1889,
+            266,
+            1890,
+            266,
+            266,
+            266,
+            266,
+            1,
+            1,
+            266,
+            1,
+            1,
+            1,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "",
+        "struct dungeon_id_16[6]",
+        "struct monster_id_16[108]",
+        "struct bar_item[66]",
+        "",
+        "",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[6]",
+        "",
+        "",
+        "",
+    ),
+    multi={},
+)
@@ -0,0 +1,6367 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the arm9 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "Svc_SoftReset",
+        "Svc_WaitByLoop",
+        "Svc_CpuSet",
+        "_start",
+        "InitI_CpuClear32",
+        "MIi_UncompressBackward",
+        "do_autoload",
+        "StartAutoloadDoneCallback",
+        "init_cp15",
+        "OSi_ReferSymbol",
+        "NitroMain",
+        "InitMemAllocTable",
+        "SetMemAllocatorParams",
+        "GetAllocArenaDefault",
+        "GetFreeArenaDefault",
+        "InitMemArena",
+        "MemAllocFlagsToBlockType",
+        "FindAvailableMemBlock",
+        "SplitMemBlock",
+        "MemAlloc",
+        "MemFree",
+        "MemArenaAlloc",
+        "CreateMemArena",
+        "MemLocateSet",
+        "MemLocateUnset",
+        "RoundUpDiv256",
+        "UFixedPoint64CmpLt",
+        "MultiplyByFixedPoint",
+        "UMultiplyByFixedPoint",
+        "IntToFixedPoint64",
+        "FixedPoint64ToInt",
+        "FixedPoint32To64",
+        "NegateFixedPoint64",
+        "FixedPoint64IsZero",
+        "FixedPoint64IsNegative",
+        "FixedPoint64CmpLt",
+        "MultiplyFixedPoint64",
+        "DivideFixedPoint64",
+        "UMultiplyFixedPoint64",
+        "UDivideFixedPoint64",
+        "AddFixedPoint64",
+        "ClampedLn",
+        "GetRngSeed",
+        "SetRngSeed",
+        "Rand16Bit",
+        "RandInt",
+        "RandRange",
+        "Rand32Bit",
+        "RandIntSafe",
+        "RandRangeSafe",
+        "WaitForever",
+        "InterruptMasterDisable",
+        "InterruptMasterEnable",
+        "InitMemAllocTableVeneer",
+        "ZInit8",
+        "PointsToZero",
+        "MemZero",
+        "MemZero16",
+        "MemZero32",
+        "MemsetSimple",
+        "Memset32",
+        "MemcpySimple",
+        "Memcpy16",
+        "Memcpy32",
+        "TaskProcBoot",
+        "EnableAllInterrupts",
+        "GetTime",
+        "DisableAllInterrupts",
+        "SoundResume",
+        "CardPullOutWithStatus",
+        "CardPullOut",
+        "CardBackupError",
+        "HaltProcessDisp",
+        "OverlayIsLoaded",
+        "LoadOverlay",
+        "UnloadOverlay",
+        "GetDsFirmwareUserSettingsVeneer",
+        "Rgb8ToRgb5",
+        "EuclideanNorm",
+        "ClampComponentAbs",
+        "GetHeldButtons",
+        "GetPressedButtons",
+        "GetReleasedStylus",
+        "KeyWaitInit",
+        "DebugPrintSystemClock",
+        "GetSystemClock",
+        "SprintfSystemClock",
+        "DataTransferInit",
+        "DataTransferStop",
+        "FileInitVeneer",
+        "FileOpen",
+        "FileGetSize",
+        "FileRead",
+        "FileSeek",
+        "FileClose",
+        "UnloadFile",
+        "LoadFileFromRom",
+        "TransformPaletteDataWithFlushDivideFade",
+        "UpdateFadeStatus",
+        "HandleFades",
+        "GetFadeStatus",
+        "InitDebug",
+        "InitDebugFlag",
+        "GetDebugFlag",
+        "SetDebugFlag",
+        "InitDebugStripped6",
+        "AppendProgPos",
+        "InitDebugStripped5",
+        "DebugPrintTrace",
+        "DebugDisplay",
+        "DebugPrint0",
+        "InitDebugLogFlag",
+        "GetDebugLogFlag",
+        "SetDebugLogFlag",
+        "DebugPrint",
+        "InitDebugStripped4",
+        "InitDebugStripped3",
+        "InitDebugStripped2",
+        "InitDebugStripped1",
+        "FatalError",
+        "OpenAllPackFiles",
+        "GetFileLengthInPackWithPackNb",
+        "LoadFileInPackWithPackId",
+        "AllocAndLoadFileInPack",
+        "OpenPackFile",
+        "GetFileLengthInPack",
+        "LoadFileInPack",
+        "GetDungeonResultMsg",
+        "GetDamageSource",
+        "GetItemCategoryVeneer",
+        "GetItemMoveId16",
+        "IsThrownItem",
+        "IsNotMoney",
+        "IsEdible",
+        "IsHM",
+        "IsGummi",
+        "IsAuraBow",
+        "IsLosableItem",
+        "IsTreasureBox",
+        "IsStorableItem",
+        "IsShoppableItem",
+        "IsValidTargetItem",
+        "IsItemUsableNow",
+        "IsTicketItem",
+        "InitItem",
+        "InitStandardItem",
+        "InitBulkItem",
+        "BulkItemToItem",
+        "ItemToBulkItem",
+        "GetDisplayedBuyPrice",
+        "GetDisplayedSellPrice",
+        "GetActualBuyPrice",
+        "GetActualSellPrice",
+        "FindItemInInventory",
+        "SprintfStatic",
+        "ItemZInit",
+        "AreItemsEquivalent",
+        "WriteItemsToSave",
+        "ReadItemsFromSave",
+        "IsItemAvailableInDungeonGroup",
+        "GetItemIdFromList",
+        "NormalizeTreasureBox",
+        "SortItemList",
+        "RemoveEmptyItems",
+        "LoadItemPspi2n",
+        "GetExclusiveItemType",
+        "GetExclusiveItemOffsetEnsureValid",
+        "IsItemValid",
+        "GetExclusiveItemParameter",
+        "GetItemCategory",
+        "EnsureValidItem",
+        "GetItemName",
+        "GetItemNameFormatted",
+        "GetItemBuyPrice",
+        "GetItemSellPrice",
+        "GetItemSpriteId",
+        "GetItemPaletteId",
+        "GetItemActionName",
+        "GetThrownItemQuantityLimit",
+        "GetItemMoveId",
+        "TestItemAiFlag",
+        "IsItemInTimeDarkness",
+        "IsItemValidVeneer",
+        "SetActiveInventoryToMain",
+        "AllInventoriesZInit",
+        "SpecialEpisodeInventoryZInit",
+        "RescueInventoryZInit",
+        "SetActiveInventory",
+        "GetMoneyCarried",
+        "SetMoneyCarried",
+        "AddMoneyCarried",
+        "GetCurrentBagCapacity",
+        "IsBagFull",
+        "GetNbItemsInBag",
+        "CountNbItemsOfTypeInBag",
+        "CountItemTypeInBag",
+        "IsItemInBag",
+        "IsItemWithFlagsInBag",
+        "IsItemInTreasureBoxes",
+        "IsHeldItemInBag",
+        "IsItemForSpecialSpawnInBag",
+        "HasStorableItems",
+        "GetItemIndex",
+        "GetEquivItemIndex",
+        "GetEquippedThrowableItem",
+        "GetFirstUnequippedItemOfType",
+        "CopyItemAtIdx",
+        "GetItemAtIdx",
+        "RemoveEmptyItemsInBag",
+        "RemoveItemNoHole",
+        "RemoveItem",
+        "RemoveHeldItemNoHole",
+        "RemoveItemByIdAndStackNoHole",
+        "RemoveEquivItem",
+        "RemoveEquivItemNoHole",
+        "DecrementStackItem",
+        "RemoveItemNoHoleCheck",
+        "RemoveFirstUnequippedItemOfType",
+        "RemoveAllItems",
+        "RemoveAllItemsStartingAt",
+        "SpecialProcAddItemToBag",
+        "AddItemToBagNoHeld",
+        "AddItemToBag",
+        "CleanStickyItemsInBag",
+        "CountStickyItemsInBag",
+        "TransmuteHeldItemInBag",
+        "SetFlagsForHeldItemInBag",
+        "RemoveHolderForItemInBag",
+        "SetHolderForItemInBag",
+        "SortItemsInBag",
+        "RemovePokeItemsInBag",
+        "IsStorageFull",
+        "CountNbOfItemsInStorage",
+        "CountNbOfValidItemsInStorage",
+        "CountNbOfValidItemsInTimeDarknessInStorage",
+        "CountNbItemsOfTypeInStorage",
+        "CountItemTypeInStorage",
+        "GetEquivBulkItemIdxInStorage",
+        "ConvertStorageItemAtIdxToBulkItem",
+        "ConvertStorageItemAtIdxToItem",
+        "RemoveItemAtIdxInStorage",
+        "RemoveBulkItemInStorage",
+        "RemoveItemInStorage",
+        "StorageZInit",
+        "AddBulkItemToStorage",
+        "AddItemToStorage",
+        "SortItemsInStorage",
+        "AllKecleonShopsZInit",
+        "SpecialEpisodeKecleonShopZInit",
+        "SetActiveKecleonShop",
+        "GetMoneyStored",
+        "SetMoneyStored",
+        "AddMoneyStored",
+        "SortKecleonItems1",
+        "GenerateKecleonItems1",
+        "SortKecleonItems2",
+        "GenerateKecleonItems2",
+        "GetExclusiveItemOffset",
+        "ApplyExclusiveItemStatBoosts",
+        "SetExclusiveItemEffect",
+        "ExclusiveItemEffectFlagTest",
+        "IsExclusiveItemIdForMonster",
+        "IsExclusiveItemForMonster",
+        "BagHasExclusiveItemTypeForMonster",
+        "GetExclusiveItemForMonsterFromBag",
+        "GetHpBoostFromExclusiveItems",
+        "ApplyGummiBoostsToGroundMonster",
+        "ApplyGummiBoostsToTeamMember",
+        "ApplySitrusBerryBoostToGroundMonster",
+        "ApplyLifeSeedBoostToGroundMonster",
+        "ApplyGinsengToGroundMonster",
+        "ApplyProteinBoostToGroundMonster",
+        "ApplyCalciumBoostToGroundMonster",
+        "ApplyIronBoostToGroundMonster",
+        "ApplyZincBoostToGroundMonster",
+        "ApplyNectarBoostToGroundMonster",
+        "IsMonsterAffectedByGravelyrockGroundMode",
+        "ApplyGravelyrockBoostToGroundMonster",
+        "ApplyGummiBoostsGroundMode",
+        "LoadSynthBin",
+        "CloseSynthBin",
+        "GetSynthItem",
+        "LoadWazaP",
+        "LoadWazaP2",
+        "UnloadCurrentWazaP",
+        "GetMoveName",
+        "FormatMoveString",
+        "FormatMoveStringMore",
+        "InitMove",
+        "InitMoveCheckId",
+        "GetInfoMoveGround",
+        "GetMoveTargetAndRange",
+        "GetMoveType",
+        "GetMovesetLevelUpPtr",
+        "IsInvalidMoveset",
+        "GetMovesetHmTmPtr",
+        "GetMovesetEggPtr",
+        "GetMoveAiWeight",
+        "GetMoveNbStrikes",
+        "GetMoveBasePower",
+        "GetMoveBasePowerGround",
+        "GetMoveAccuracyOrAiChance",
+        "GetMoveBasePp",
+        "GetMaxPp",
+        "GetMoveMaxGinsengBoost",
+        "GetMoveMaxGinsengBoostGround",
+        "GetMoveCritChance",
+        "IsThawingMove",
+        "IsAffectedByTaunt",
+        "GetMoveRangeId",
+        "GetMoveActualAccuracy",
+        "GetMoveBasePowerFromId",
+        "IsMoveRangeString19",
+        "GetMoveMessageFromId",
+        "GetNbMoves",
+        "GetMovesetIdx",
+        "IsReflectedByMagicCoat",
+        "CanBeSnatched",
+        "FailsWhileMuzzled",
+        "IsSoundMove",
+        "IsRecoilMove",
+        "AllManip1",
+        "AllManip2",
+        "ManipMoves1v1",
+        "ManipMoves1v2",
+        "ManipMoves2v1",
+        "ManipMoves2v2",
+        "DungeonMoveToGroundMove",
+        "GroundToDungeonMoveset",
+        "DungeonToGroundMoveset",
+        "GetInfoGroundMoveset",
+        "FindFirstFreeMovesetIdx",
+        "LearnMoves",
+        "CopyMoveTo",
+        "CopyMoveFrom",
+        "CopyMovesetTo",
+        "CopyMovesetFrom",
+        "Is2TurnsMove",
+        "IsRegularAttackOrProjectile",
+        "IsPunchMove",
+        "IsHealingWishOrLunarDance",
+        "IsCopyingMove",
+        "IsTrappingMove",
+        "IsOneHitKoMove",
+        "IsNot2TurnsMoveOrSketch",
+        "IsRealMove",
+        "IsMovesetValid",
+        "IsRealMoveInTimeDarkness",
+        "IsMovesetValidInTimeDarkness",
+        "GetFirstNotRealMoveInTimeDarkness",
+        "IsSameMove",
+        "GetMoveCategory",
+        "GetPpIncrease",
+        "OpenWaza",
+        "SelectWaza",
+        "PlayBgmByIdVeneer",
+        "PlayBgmByIdVolumeVeneer",
+        "PlaySeVolumeWrapper",
+        "PlayBgmById",
+        "PlayBgmByIdVolume",
+        "StopBgmCommand",
+        "PlaySeByIdVolume",
+        "SendAudioCommand2",
+        "AllocAudioCommand",
+        "SendAudioCommand",
+        "InitSoundSystem",
+        "ManipBgmPlayback",
+        "SoundDriverReset",
+        "LoadDseFile",
+        "PlaySeLoad",
+        "IsSongOver",
+        "PlayBgm",
+        "StopBgm",
+        "ChangeBgm",
+        "PlayBgm2",
+        "StopBgm2",
+        "ChangeBgm2",
+        "PlayME",
+        "StopME",
+        "PlaySe",
+        "PlaySeFullSpec",
+        "SeChangeVolume",
+        "SeChangePan",
+        "StopSe",
+        "CopyAndInterleaveWrapper",
+        "InitAnimationControl",
+        "InitAnimationControlWithSet",
+        "SetSpriteIdForAnimationControl",
+        "SetAnimationForAnimationControlInternal",
+        "SetAnimationForAnimationControl",
+        "GetWanForAnimationControl",
+        "SetAndPlayAnimationForAnimationControl",
+        "SwitchAnimationControlToNextFrame",
+        "LoadAnimationFrameAndIncrementInAnimationControl",
+        "AnimationControlGetAllocForMaxFrame",
+        "DeleteWanTableEntry",
+        "AllocateWanTableEntry",
+        "FindWanTableEntry",
+        "GetLoadedWanTableEntry",
+        "InitWanTable",
+        "LoadWanTableEntry",
+        "LoadWanTableEntryFromPack",
+        "LoadWanTableEntryFromPackUseProvidedMemory",
+        "ReplaceWanFromBinFile",
+        "DeleteWanTableEntryVeneer",
+        "WanHasAnimationGroup",
+        "WanTableSpriteHasAnimationGroup",
+        "SpriteTypeInWanTable",
+        "LoadWteFromRom",
+        "LoadWteFromFileDirectory",
+        "UnloadWte",
+        "LoadWtuFromBin",
+        "ProcessWte",
+        "GeomSetTexImageParam",
+        "GeomSetVertexCoord16",
+        "InitRender3dData",
+        "GeomSwapBuffers",
+        "InitRender3dElement64",
+        "Render3d64Texture0x7",
+        "Render3d64WindowFrame",
+        "EnqueueRender3d64Tiling",
+        "Render3d64Tiling",
+        "Render3d64Quadrilateral",
+        "Render3d64RectangleMulticolor",
+        "Render3d64Rectangle",
+        "Render3d64Nothing",
+        "Render3d64Texture",
+        "Render3dElement64",
+        "HandleSir0Translation",
+        "ConvertPointersSir0",
+        "HandleSir0TranslationVeneer",
+        "DecompressAtNormalVeneer",
+        "DecompressAtNormal",
+        "DecompressAtHalf",
+        "DecompressAtFromMemoryPointerVeneer",
+        "DecompressAtFromMemoryPointer",
+        "WriteByteFromMemoryPointer",
+        "GetAtSize",
+        "GetLanguageType",
+        "GetLanguage",
+        "StrcmpTag",
+        "AtoiTag",
+        "AnalyzeText",
+        "PreprocessString",
+        "PreprocessStringFromId",
+        "StrcmpTagVeneer",
+        "AtoiTagVeneer",
+        "InitPreprocessorArgs",
+        "SetStringAccuracy",
+        "SetStringPower",
+        "GetRankString",
+        "GetCurrentTeamNameString",
+        "GetBagNameString",
+        "GetDungeonResultString",
+        "SetQuestionMarks",
+        "StrcpySimple",
+        "StrncpySimple",
+        "StrncpySimpleNoPad",
+        "StrncmpSimple",
+        "StrncpySimpleNoPadSafe",
+        "StrcpyName",
+        "StrncpyName",
+        "GetStringFromFile",
+        "LoadStringFile",
+        "AllocateTemp1024ByteBufferFromPool",
+        "GetStringFromFileVeneer",
+        "StringFromId",
+        "CopyStringFromId",
+        "CopyNStringFromId",
+        "LoadTblTalk",
+        "GetTalkLine",
+        "IsAOrBPressed",
+        "DrawTextInWindow",
+        "GetCharWidth",
+        "GetColorCodePaletteOffset",
+        "DrawChar",
+        "GetWindow",
+        "NewWindowScreenCheck",
+        "NewWindow",
+        "SetScreenWindowsColor",
+        "SetBothScreensWindowsColor",
+        "UpdateWindow",
+        "ClearWindow",
+        "DeleteWindow",
+        "GetWindowRectangle",
+        "GetWindowContents",
+        "LoadCursors",
+        "InitWindowTrailer",
+        "Arm9LoadUnkFieldNa0x2029EC8",
+        "Arm9StoreUnkFieldNa0x2029ED8",
+        "LoadAlert",
+        "PrintClearMark",
+        "PrintBadgeMark",
+        "PrintMark",
+        "CreateParentMenuFromStringIds",
+        "IsEmptyString",
+        "CreateParentMenu",
+        "CreateParentMenuWrapper",
+        "CreateParentMenuInternal",
+        "ResumeParentMenu",
+        "SetParentMenuState7",
+        "CloseParentMenu",
+        "IsParentMenuActive",
+        "CheckParentMenuField0x1A0",
+        "UpdateParentMenu",
+        "CreateSimpleMenuFromStringIds",
+        "CreateSimpleMenu",
+        "CreateSimpleMenuInternal",
+        "ResumeSimpleMenu",
+        "CloseSimpleMenu",
+        "IsSimpleMenuActive",
+        "CheckSimpleMenuField0x1A0",
+        "GetSimpleMenuField0x1A4",
+        "GetSimpleMenuResult",
+        "UpdateSimpleMenu",
+        "SetSimpleMenuField0x1AC",
+        "CreateAdvancedMenu",
+        "ResumeAdvancedMenu",
+        "CloseAdvancedMenu",
+        "IsAdvancedMenuActive2",
+        "IsAdvancedMenuActive",
+        "GetAdvancedMenuCurrentOption",
+        "GetAdvancedMenuResult",
+        "UpdateAdvancedMenu",
+        "CreateCollectionMenu",
+        "SetCollectionMenuField0x1BC",
+        "SetCollectionMenuWidth",
+        "CloseCollectionMenu",
+        "IsCollectionMenuActive",
+        "SetCollectionMenuField0x1C8",
+        "SetCollectionMenuField0x1A0",
+        "SetCollectionMenuField0x1A4",
+        "SetCollectionMenuVoidFn",
+        "UpdateCollectionMenu",
+        "SetCollectionMenuField0x1B2",
+        "IsCollectionMenuState3",
+        "CreateOptionsMenu",
+        "CloseOptionsMenu",
+        "IsOptionsMenuActive",
+        "CheckOptionsMenuField0x1A4",
+        "GetOptionsMenuStates",
+        "GetOptionsMenuResult",
+        "UpdateOptionsMenu",
+        "CreateDebugMenu",
+        "CloseDebugMenu",
+        "IsDebugMenuActive",
+        "CheckDebugMenuField0x1A4",
+        "UpdateDebugMenu",
+        "CreateScrollBoxSingle",
+        "CreateScrollBoxMulti",
+        "SetScrollBoxState7",
+        "CloseScrollBox",
+        "IsScrollBoxActive",
+        "UpdateScrollBox",
+        "CreateDialogueBox",
+        "CloseDialogueBox",
+        "IsDialogueBoxActive",
+        "ShowStringIdInDialogueBox",
+        "ShowStringInDialogueBox",
+        "ShowDialogueBox",
+        "ReadStringFromDialogueBox",
+        "UpdateDialogueBox",
+        "CreatePortraitBox",
+        "ClosePortraitBox",
+        "PortraitBoxNeedsUpdate",
+        "ShowPortraitInPortraitBox",
+        "HidePortraitBox",
+        "UpdatePortraitBox",
+        "CreateTextBox",
+        "CreateTextBoxWithArg",
+        "CloseTextBox",
+        "CloseTextBox2",
+        "CreateTextBoxInternal",
+        "UpdateTextBox",
+        "IsTextBoxActive",
+        "CreateAreaNameBox",
+        "SetAreaNameBoxState3",
+        "CloseAreaNameBox",
+        "IsAreaNameBoxActive",
+        "UpdateAreaNameBox",
+        "CreateControlsChart",
+        "CloseControlsChart",
+        "IsControlsChartActive",
+        "UpdateControlsChart",
+        "CreateAlertBox",
+        "CloseAlertBox",
+        "IsAlertBoxActive",
+        "UpdateAlertBox",
+        "CreateAdvancedTextBox",
+        "CreateAdvancedTextBoxWithArg",
+        "CreateAdvancedTextBoxInternal",
+        "SetAdvancedTextBoxPartialMenu",
+        "SetAdvancedTextBoxField0x1C4",
+        "SetAdvancedTextBoxField0x1C2",
+        "CloseAdvancedTextBox2",
+        "SetAdvancedTextBoxState5",
+        "CloseAdvancedTextBox",
+        "IsAdvancedTextBoxActive",
+        "GetAdvancedTextBoxFlags2",
+        "SetUnkAdvancedTextBoxFn",
+        "SetUnkAdvancedTextBoxWindowFn",
+        "UpdateAdvancedTextBox",
+        "PlayAdvancedTextBoxInputSound",
+        "CreateTeamSelectionMenu",
+        "CloseTeamSelectionMenu",
+        "IsTeamSelectionMenuActive",
+        "UpdateTeamSelectionMenu",
+        "IsTeamSelectionMenuState3",
+        "CalcMenuHeightDiv8",
+        "InitWindowInput",
+        "IsMenuOptionActive",
+        "PlayWindowInputSound",
+        "InitInventoryMenuInput",
+        "ShowKeyboard",
+        "GetKeyboardStatus",
+        "GetKeyboardStringResult",
+        "TeamSelectionMenuGetItem",
+        "PrintMoveOptionMenu",
+        "PrintIqSkillsMenu",
+        "GetNotifyNote",
+        "SetNotifyNote",
+        "InitSpecialEpisodeHero",
+        "EventFlagBackupVeneer",
+        "InitMainTeamAfterQuiz",
+        "InitSpecialEpisodePartners",
+        "InitSpecialEpisodeExtraPartner",
+        "ReadStringSave",
+        "CheckStringSave",
+        "WriteSaveFile",
+        "ReadSaveFile",
+        "CalcChecksum",
+        "CheckChecksumInvalid",
+        "NoteSaveBase",
+        "WriteQuickSaveInfo",
+        "ReadSaveHeader",
+        "NoteLoadBase",
+        "ReadQuickSaveInfo",
+        "GetGameMode",
+        "InitScriptVariableValues",
+        "InitEventFlagScriptVars",
+        "ZinitScriptVariable",
+        "LoadScriptVariableRaw",
+        "LoadScriptVariableValue",
+        "LoadScriptVariableValueAtIndex",
+        "SaveScriptVariableValue",
+        "SaveScriptVariableValueAtIndex",
+        "LoadScriptVariableValueSum",
+        "LoadScriptVariableValueBytes",
+        "SaveScriptVariableValueBytes",
+        "ScriptVariablesEqual",
+        "EventFlagResume",
+        "EventFlagBackup",
+        "DumpScriptVariableValues",
+        "RestoreScriptVariableValues",
+        "InitScenarioScriptVars",
+        "SetScenarioScriptVar",
+        "GetSpecialEpisodeType",
+        "SetSpecialEpisodeType",
+        "GetExecuteSpecialEpisodeType",
+        "IsSpecialEpisodeOpen",
+        "HasPlayedOldGame",
+        "GetPerformanceFlagWithChecks",
+        "GetScenarioBalance",
+        "ScenarioFlagBackup",
+        "InitWorldMapScriptVars",
+        "InitDungeonListScriptVars",
+        "SetDungeonConquest",
+        "GetDungeonMode",
+        "GlobalProgressAlloc",
+        "ResetGlobalProgress",
+        "SetMonsterFlag1",
+        "GetMonsterFlag1",
+        "SetMonsterFlag2",
+        "HasMonsterBeenAttackedInDungeons",
+        "SetDungeonTipShown",
+        "GetDungeonTipShown",
+        "SetMaxReachedFloor",
+        "GetMaxReachedFloor",
+        "IncrementNbAdventures",
+        "GetNbAdventures",
+        "CanMonsterSpawn",
+        "IncrementExclusiveMonsterCounts",
+        "CopyProgressInfoTo",
+        "CopyProgressInfoFromScratchTo",
+        "CopyProgressInfoFrom",
+        "CopyProgressInfoFromScratchFrom",
+        "InitKaomadoStream",
+        "InitPortraitParams",
+        "InitPortraitParamsWithMonsterId",
+        "SetPortraitEmotion",
+        "SetPortraitLayout",
+        "SetPortraitOffset",
+        "AllowPortraitDefault",
+        "IsValidPortrait",
+        "LoadPortrait",
+        "WonderMailPasswordToMission",
+        "SetEnterDungeon",
+        "InitDungeonInit",
+        "IsNoLossPenaltyDungeon",
+        "CheckMissionRestrictions",
+        "GetNbFloors",
+        "GetNbFloorsPlusOne",
+        "GetDungeonGroup",
+        "GetNbPrecedingFloors",
+        "GetNbFloorsDungeonGroup",
+        "DungeonFloorToGroupFloor",
+        "GetMissionRank",
+        "GetOutlawLevel",
+        "GetOutlawLeaderLevel",
+        "GetOutlawMinionLevel",
+        "AddGuestMonster",
+        "GetGroundNameId",
+        "SetAdventureLogStructLocation",
+        "SetAdventureLogDungeonFloor",
+        "GetAdventureLogDungeonFloor",
+        "ClearAdventureLogStruct",
+        "SetAdventureLogCompleted",
+        "IsAdventureLogNotEmpty",
+        "GetAdventureLogCompleted",
+        "IncrementNbDungeonsCleared",
+        "GetNbDungeonsCleared",
+        "IncrementNbFriendRescues",
+        "GetNbFriendRescues",
+        "IncrementNbEvolutions",
+        "GetNbEvolutions",
+        "IncrementNbSteals",
+        "IncrementNbEggsHatched",
+        "GetNbEggsHatched",
+        "GetNbPokemonJoined",
+        "GetNbMovesLearned",
+        "SetVictoriesOnOneFloor",
+        "GetVictoriesOnOneFloor",
+        "SetPokemonJoined",
+        "SetPokemonBattled",
+        "GetNbPokemonBattled",
+        "IncrementNbBigTreasureWins",
+        "SetNbBigTreasureWins",
+        "GetNbBigTreasureWins",
+        "SetNbRecycled",
+        "GetNbRecycled",
+        "IncrementNbSkyGiftsSent",
+        "SetNbSkyGiftsSent",
+        "GetNbSkyGiftsSent",
+        "ComputeSpecialCounters",
+        "RecruitSpecialPokemonLog",
+        "IncrementNbFainted",
+        "GetNbFainted",
+        "SetItemAcquired",
+        "GetNbItemAcquired",
+        "SetChallengeLetterCleared",
+        "GetSentryDutyGamePoints",
+        "SetSentryDutyGamePoints",
+        "CopyLogTo",
+        "CopyLogFrom",
+        "GetAbilityString",
+        "GetAbilityDescStringId",
+        "GetTypeStringId",
+        "GetConversion2ConvertToType",
+        "CopyBitsTo",
+        "CopyBitsFrom",
+        "StoreDefaultTeamData",
+        "GetMainTeamNameWithCheck",
+        "GetMainTeamName",
+        "SetMainTeamName",
+        "GetRankupPoints",
+        "GetRank",
+        "GetRankStorageSize",
+        "ResetPlayTimer",
+        "PlayTimerTick",
+        "GetPlayTimeSeconds",
+        "SubFixedPoint",
+        "BinToDecFixedPoint",
+        "CeilFixedPoint",
+        "DungeonGoesUp",
+        "GetTurnLimit",
+        "DoesNotSaveWhenEntering",
+        "TreasureBoxDropsEnabled",
+        "IsLevelResetDungeon",
+        "GetMaxItemsAllowed",
+        "IsMoneyAllowed",
+        "GetMaxRescueAttempts",
+        "IsRecruitingAllowed",
+        "GetLeaderChangeFlag",
+        "GetRandomMovementChance",
+        "CanEnemyEvolve",
+        "GetMaxMembersAllowed",
+        "IsIqEnabled",
+        "IsTrapInvisibleWhenAttacking",
+        "JoinedAtRangeCheck",
+        "IsDojoDungeon",
+        "IsFutureDungeon",
+        "IsSpecialEpisodeDungeon",
+        "RetrieveFromItemList1",
+        "IsForbiddenFloor",
+        "Copy16BitsFrom",
+        "RetrieveFromItemList2",
+        "IsInvalidForMission",
+        "IsExpEnabledInDungeon",
+        "IsSkyExclusiveDungeon",
+        "JoinedAtRangeCheck2",
+        "GetBagCapacity",
+        "GetBagCapacitySpecialEpisode",
+        "GetRankUpEntry",
+        "GetBgRegionArea",
+        "LoadMonsterMd",
+        "GetNameRaw",
+        "GetName",
+        "GetNameWithGender",
+        "GetSpeciesString",
+        "GetNameString",
+        "GetSpriteIndex",
+        "GetDexNumber",
+        "GetCategoryString",
+        "GetMonsterGender",
+        "GetBodySize",
+        "GetSpriteSize",
+        "GetSpriteFileSize",
+        "GetShadowSize",
+        "GetSpeedStatus",
+        "GetMobilityType",
+        "GetRegenSpeed",
+        "GetCanMoveFlag",
+        "GetChanceAsleep",
+        "GetWeightMultiplier",
+        "GetSize",
+        "GetBaseHp",
+        "CanThrowItems",
+        "CanEvolve",
+        "GetMonsterPreEvolution",
+        "GetBaseOffensiveStat",
+        "GetBaseDefensiveStat",
+        "GetType",
+        "GetAbility",
+        "GetRecruitRate2",
+        "GetRecruitRate1",
+        "GetExp",
+        "GetEvoParameters",
+        "GetTreasureBoxChances",
+        "GetIqGroup",
+        "GetSpawnThreshold",
+        "NeedsItemToSpawn",
+        "GetExclusiveItem",
+        "GetFamilyIndex",
+        "LoadM2nAndN2m",
+        "GuestMonsterToGroundMonster",
+        "StrcmpMonsterName",
+        "GetLvlUpEntry",
+        "GetEncodedHalfword",
+        "GetEvoFamily",
+        "GetEvolutions",
+        "ShuffleHiddenPower",
+        "GetBaseForm",
+        "GetBaseFormBurmyWormadamShellosGastrodonCherrim",
+        "GetBaseFormCastformCherrimDeoxys",
+        "GetAllBaseForms",
+        "GetDexNumberVeneer",
+        "GetMonsterIdFromSpawnEntry",
+        "SetMonsterId",
+        "SetMonsterLevelAndId",
+        "GetMonsterLevelFromSpawnEntry",
+        "GetMonsterGenderVeneer",
+        "IsMonsterValid",
+        "IsUnown",
+        "IsShaymin",
+        "IsCastform",
+        "IsCherrim",
+        "IsDeoxys",
+        "GetSecondFormIfValid",
+        "FemaleToMaleForm",
+        "GetBaseFormCastformDeoxysCherrim",
+        "BaseFormsEqual",
+        "DexNumbersEqual",
+        "GendersEqual",
+        "GendersEqualNotGenderless",
+        "GendersNotEqualNotGenderless",
+        "IsMonsterOnTeam",
+        "GetNbRecruited",
+        "IsValidTeamMember",
+        "IsMainCharacter",
+        "GetTeamMember",
+        "GetHeroMemberIdx",
+        "GetPartnerMemberIdx",
+        "GetMainCharacter1MemberIdx",
+        "GetMainCharacter2MemberIdx",
+        "GetMainCharacter3MemberIdx",
+        "GetHero",
+        "GetPartner",
+        "GetMainCharacter1",
+        "GetMainCharacter2",
+        "GetMainCharacter3",
+        "GetFirstMatchingMemberIdx",
+        "GetFirstEmptyMemberIdx",
+        "IsMonsterNotNicknamed",
+        "RemoveActiveMembersFromAllTeams",
+        "RemoveActiveMembersFromSpecialEpisodeTeam",
+        "RemoveActiveMembersFromRescueTeam",
+        "CheckTeamMemberIdx",
+        "IsMonsterIdInNormalRange",
+        "SetActiveTeam",
+        "GetActiveTeamMember",
+        "GetActiveRosterIndex",
+        "TryAddMonsterToActiveTeam",
+        "RemoveActiveMembersFromMainTeam",
+        "SetTeamSetupHeroAndPartnerOnly",
+        "SetTeamSetupHeroOnly",
+        "GetPartyMembers",
+        "RefillTeam",
+        "ClearItem",
+        "ChangeGiratinaFormIfSkyDungeon",
+        "GetIqSkillStringId",
+        "DoesTacticFollowLeader",
+        "GetUnlockedTactics",
+        "GetUnlockedTacticFlags",
+        "CanLearnIqSkill",
+        "GetLearnableIqSkills",
+        "DisableIqSkill",
+        "EnableIqSkill",
+        "GetSpeciesIqSkill",
+        "DisableAllIqSkills",
+        "EnableAllLearnableIqSkills",
+        "IqSkillFlagTest",
+        "GetNextIqSkill",
+        "GetExplorerMazeTeamName",
+        "GetExplorerMazeMonster",
+        "WriteMonsterInfoToSave",
+        "ReadMonsterInfoFromSave",
+        "WriteMonsterToSave",
+        "ReadMonsterFromSave",
+        "GetEvolutionPossibilities",
+        "GetMonsterEvoStatus",
+        "CopyTacticString",
+        "GetStatBoostsForMonsterSummary",
+        "CreateMonsterSummaryFromTeamMember",
+        "GetSosMailCount",
+        "IsMissionSuspendedAndValid",
+        "AreMissionsEquivalent",
+        "IsMissionValid",
+        "GenerateMission",
+        "IsMissionTypeSpecialEpisode",
+        "GenerateDailyMissions",
+        "AlreadyHaveMission",
+        "CountJobListMissions",
+        "DungeonRequestsDone",
+        "DungeonRequestsDoneWrapper",
+        "AnyDungeonRequestsDone",
+        "AddMissionToJobList",
+        "GetAcceptedMission",
+        "GetMissionByTypeAndDungeon",
+        "CheckAcceptedMissionByTypeAndDungeon",
+        "GetAllPossibleMonsters",
+        "GenerateAllPossibleMonstersList",
+        "DeleteAllPossibleMonstersList",
+        "GenerateAllPossibleDungeonsList",
+        "DeleteAllPossibleDungeonsList",
+        "GenerateAllPossibleDeliverList",
+        "DeleteAllPossibleDeliverList",
+        "ClearMissionData",
+        "IsMonsterMissionAllowed",
+        "CanMonsterBeUsedForMissionWrapper",
+        "CanMonsterBeUsedForMission",
+        "IsMonsterMissionAllowedStory",
+        "CanDungeonBeUsedForMission",
+        "CanSendItem",
+        "IsAvailableItem",
+        "GetAvailableItemDeliveryList",
+        "GetActorMatchingStorageId",
+        "SetActorTalkMainAndActorTalkSub",
+        "SetActorTalkMain",
+        "SetActorTalkSub",
+        "RandomizeDemoActors",
+        "ItemAtTableIdx",
+        "MainLoop",
+        "CreateJobSummary",
+        "DungeonSwapIdToIdx",
+        "DungeonSwapIdxToId",
+        "GetDungeonModeSpecial",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x566,
+            0x88,
+            0x78E,
+            0x800,
+            0x954,
+            0x970,
+            0xA1C,
+            0xAAC,
+            0xAB0,
+            0xB9C,
+            0xC6C,
+            0xDE0,
+            0xE70,
+            0xEC0,
+            0xEC4,
+            0xEC8,
+            0xF44,
+            0xF88,
+            0x1070,
+            0x1170,
+            0x1188,
+            0x119C,
+            0x1280,
+            0x1390,
+            0x1638,
+            0x1894,
+            0x1A30,
+            0x1A54,
+            0x1B0C,
+            0x1C80,
+            0x1CB0,
+            0x1CD4,
+            0x1CF8,
+            0x1D28,
+            0x1D50,
+            0x1D68,
+            0x1DF4,
+            0x1EC8,
+            0x1FA0,
+            0x2084,
+            0x21C8,
+            0x21F4,
+            0x222C,
+            0x223C,
+            0x224C,
+            0x2274,
+            0x228C,
+            0x22AC,
+            0x22F8,
+            0x2318,
+            0x2438,
+            0x30CC,
+            0x30E4,
+            0x321C,
+            0x3228,
+            0x3238,
+            0x3250,
+            0x326C,
+            0x3288,
+            0x32A4,
+            0x32BC,
+            0x32D4,
+            0x32F0,
+            0x330C,
+            0x3328,
+            0x3608,
+            0x37B4,
+            0x3824,
+            0x3CC4,
+            0x3D2C,
+            0x3D70,
+            0x3D94,
+            0x3DB8,
+            0x3ED0,
+            0x40AC,
+            0x4868,
+            0x4F74,
+            0x4FCC,
+            0xFFFFFFFF,
+            0x5110,
+            0x61EC,
+            0x625C,
+            0x6C1C,
+            0x6DA4,
+            0x6EF8,
+            0x6F68,
+            0x6FB8,
+            0x8168,
+            0x8194,
+            0x8204,
+            0x8210,
+            0x8244,
+            0x8254,
+            0x82A8,
+            0x82C4,
+            0x8BD4,
+            0x8C3C,
+            0xAE38,
+            0xB990,
+            0xBA08,
+            0xBD2C,
+            0xC0D4,
+            0xC10C,
+            0xC110,
+            0xC118,
+            0xC11C,
+            0xC120,
+            0xC168,
+            0xC16C,
+            0xC1C8,
+            0xC1FC,
+            0xC230,
+            0xC234,
+            0xC23C,
+            0xC240,
+            0xC24C,
+            0xC250,
+            0xC254,
+            0xC258,
+            0xC25C,
+            0xC2DC,
+            0xC33C,
+            0xC35C,
+            0xC388,
+            0xC3E0,
+            0xC474,
+            0xC484,
+            0xC4FC,
+            0xCA54,
+            0xCAF0,
+            0xCAFC,
+            0xCB10,
+            0xCB2C,
+            0xCB4C,
+            0xCB70,
+            0xCBF4,
+            0xCC14,
+            0xCC38,
+            0xCC84,
+            0xCCA8,
+            0xCCE0,
+            0xCDAC,
+            0xCDF8,
+            0xCE74,
+            0xCE9C,
+            0xCF58,
+            0xCF78,
+            0xCFF0,
+            0xD0A0,
+            0xD0D0,
+            0xD118,
+            0xD160,
+            0xD1A8,
+            0xD278,
+            0xFFFFFFFF,
+            0xD81C,
+            0xD834,
+            0xD95C,
+            0xDC44,
+            0xE00C,
+            0xE054,
+            0xE1F8,
+            0xE3A0,
+            0xE610,
+            0xE6D8,
+            0xE760,
+            0xE77C,
+            0xE7C0,
+            0xE7E8,
+            0xE808,
+            0xE828,
+            0xE864,
+            0xE884,
+            0xE9B8,
+            0xE9D8,
+            0xE9F8,
+            0xEA18,
+            0xEA38,
+            0xEA58,
+            0xEA80,
+            0xEAA0,
+            0xEB30,
+            0xEB58,
+            0xEBCC,
+            0xEBDC,
+            0xEC48,
+            0xEC90,
+            0xECD8,
+            0xECFC,
+            0xED1C,
+            0xED58,
+            0xED84,
+            0xEDC0,
+            0xEDFC,
+            0xEE4C,
+            0xEE88,
+            0xEEE0,
+            0xEF20,
+            0xEF6C,
+            0xEFCC,
+            0xF050,
+            0xF0E4,
+            0xF14C,
+            0xF18C,
+            0xF208,
+            0xF26C,
+            0xF2E0,
+            0xF348,
+            0xF370,
+            0xF390,
+            0xF404,
+            0xF454,
+            0xF4D4,
+            0xF558,
+            0xF600,
+            0xF694,
+            0xF718,
+            0xF798,
+            0xF7A8,
+            0xF7DC,
+            0xF84C,
+            0xF874,
+            0xF884,
+            0xF910,
+            0xF940,
+            0xFA68,
+            0xFAEC,
+            0xFB54,
+            0xFBE0,
+            0xFC24,
+            0xFCAC,
+            0xFD54,
+            0xFD78,
+            0xFDB0,
+            0xFE00,
+            0xFEA8,
+            0xFEE4,
+            0xFF50,
+            0xFFAC,
+            0xFFF4,
+            0x101A0,
+            0x101E4,
+            0x10260,
+            0x102DC,
+            0x1031C,
+            0x103AC,
+            0x10424,
+            0x10594,
+            0x10654,
+            0x106C4,
+            0x1070C,
+            0x10724,
+            0x10758,
+            0x10954,
+            0x10A4C,
+            0x10C60,
+            0x10D58,
+            0x10E40,
+            0x10E64,
+            0x10F80,
+            0x10FA4,
+            0x10FC4,
+            0x11094,
+            0x110D8,
+            0x1116C,
+            0x11394,
+            0x11528,
+            0x11554,
+            0x11580,
+            0x115BC,
+            0x115F8,
+            0x1170C,
+            0x11748,
+            0x11784,
+            0x117C0,
+            0x117FC,
+            0x11830,
+            0x11850,
+            0x1189C,
+            0x12AE0,
+            0x12B34,
+            0x13250,
+            0x133C4,
+            0x133EC,
+            0x13414,
+            0x13454,
+            0x13478,
+            0x13780,
+            0x137B8,
+            0x137E8,
+            0x13828,
+            0x13840,
+            0x13864,
+            0x13884,
+            0x138CC,
+            0x138F4,
+            0x13940,
+            0x1398C,
+            0x139AC,
+            0x139CC,
+            0x139EC,
+            0x13A0C,
+            0x13A30,
+            0x13A50,
+            0x13AD0,
+            0x13AF0,
+            0x13B10,
+            0x13B30,
+            0x13B50,
+            0x13B70,
+            0x13B90,
+            0x13BE8,
+            0x13C04,
+            0x13C30,
+            0x13C64,
+            0xFFFFFFFF,
+            0x13D08,
+            0x13D24,
+            0x13D40,
+            0x13D5C,
+            0x13E14,
+            0x141E0,
+            0x14208,
+            0x1429C,
+            0x1433C,
+            0x144A4,
+            0x14544,
+            0x146AC,
+            0x146E4,
+            0x14778,
+            0x147B8,
+            0x14860,
+            0x148AC,
+            0x14A4C,
+            0x14A84,
+            0x14ABC,
+            0x14AEC,
+            0x14C64,
+            0x14CEC,
+            0x14D18,
+            0x14D58,
+            0x14D84,
+            0x14DBC,
+            0x14E00,
+            0x14E38,
+            0x14E64,
+            0x14EF8,
+            0x14F64,
+            0x15004,
+            0x15024,
+            0x1514C,
+            0x151C8,
+            0x151E4,
+            0x15294,
+            0x152FC,
+            0x17B58,
+            0x17B64,
+            0x17CCC,
+            0x17DF4,
+            0x17E70,
+            0x17EE8,
+            0x182B8,
+            0x18AE4,
+            0x18B6C,
+            0x18BA8,
+            0x18C28,
+            0x18EA4,
+            0x190C8,
+            0x1938C,
+            0x19574,
+            0x19850,
+            0x198B8,
+            0x19B28,
+            0x19C50,
+            0x19D84,
+            0x19FE8,
+            0x1A0E8,
+            0x1A1C8,
+            0x1A40C,
+            0x1A4FC,
+            0x1A66C,
+            0x1A828,
+            0x1A900,
+            0x1A9E4,
+            0x1BFF0,
+            0x1C050,
+            0xFFFFFFFF,
+            0x1C0E8,
+            0x1C17C,
+            0x1C2CC,
+            0x1C3E8,
+            0x1C418,
+            0x1C458,
+            0x1C560,
+            0x1D170,
+            0x1D1DC,
+            0x1D244,
+            0x1D2D4,
+            0x1D334,
+            0x1D3BC,
+            0x1D3DC,
+            0x1D484,
+            0x1D590,
+            0x1D684,
+            0x1D72C,
+            0x1DA44,
+            0x1DA80,
+            0x1DC70,
+            0x1DE4C,
+            0x1DEC4,
+            0x1DF18,
+            0x1DFB4,
+            0x1E0B0,
+            0x1E494,
+            0x1E4D4,
+            0x1E504,
+            0x1E71C,
+            0x1E730,
+            0x1E844,
+            0x1E9EC,
+            0x1EC9C,
+            0x1ED88,
+            0x1EE50,
+            0x1EEF0,
+            0x1F05C,
+            0x1F108,
+            0x1F10C,
+            0x1F1D4,
+            0x1F4B4,
+            0x1F534,
+            0x1F58C,
+            0x1F5C0,
+            0x1F5CC,
+            0x1FA10,
+            0x1FF4C,
+            0x1FF58,
+            0x20470,
+            0x204EC,
+            0x205A0,
+            0x205B0,
+            0x208C8,
+            0x2090C,
+            0x20DC8,
+            0x223F0,
+            0x235B8,
+            0x235F8,
+            0x23604,
+            0x23690,
+            0x24360,
+            0x24428,
+            0x24AF4,
+            0x24C6C,
+            0x24DFC,
+            0x24FD8,
+            0x250E4,
+            0x25100,
+            0x2511C,
+            0x25170,
+            0x251AC,
+            0x251F4,
+            0x25230,
+            0x25314,
+            0x25788,
+            0x25818,
+            0x25888,
+            0x258B8,
+            0x258C4,
+            0x258E4,
+            0x2590C,
+            0x2593C,
+            0x2598C,
+            0x25EE8,
+            0x26214,
+            0x2654C,
+            0x265C4,
+            0x2676C,
+            0x275F8,
+            0x27648,
+            0x276C0,
+            0x27A68,
+            0x27A80,
+            0x27AF0,
+            0x27B58,
+            0x28194,
+            0x28284,
+            0x2833C,
+            0x2950C,
+            0x29670,
+            0x29EC8,
+            0x29ED8,
+            0x29EE8,
+            0x2A3E4,
+            0x2A434,
+            0x2A45C,
+            0x2A5CC,
+            0x2A66C,
+            0x2A690,
+            0x2A730,
+            0x2A75C,
+            0x2A954,
+            0x2AAA8,
+            0x2AABC,
+            0x2AB40,
+            0x2AB60,
+            0x2ABFC,
+            0x2B0EC,
+            0x2B1AC,
+            0x2B284,
+            0x2B490,
+            0x2B4C4,
+            0x2B4F0,
+            0x2B510,
+            0x2B558,
+            0x2B57C,
+            0x2B5C8,
+            0x2BA0C,
+            0x2BA20,
+            0x2BBF0,
+            0x2BC44,
+            0x2BCBC,
+            0x2BCDC,
+            0x2BCFC,
+            0x2BD10,
+            0x2BD64,
+            0x2C3A8,
+            0x2C5E0,
+            0x2C5F4,
+            0x2C70C,
+            0x2C728,
+            0x2C794,
+            0x2C7A8,
+            0x2C7BC,
+            0x2C7D0,
+            0x2C808,
+            0x2D0D8,
+            0x2D114,
+            0x2D1F0,
+            0x2D530,
+            0x2D55C,
+            0x2D57C,
+            0x2D5B0,
+            0x2D5E4,
+            0x2D618,
+            0x2DC50,
+            0x2DEF8,
+            0x2DF24,
+            0x2DF44,
+            0x2DF98,
+            0x2E3CC,
+            0x2E518,
+            0x2E6B0,
+            0x2E6C8,
+            0x2E6E4,
+            0x2E708,
+            0x2F0B0,
+            0x2F148,
+            0x2F180,
+            0x2F1B4,
+            0x2F23C,
+            0x2F3A4,
+            0x2F44C,
+            0x2F488,
+            0x2F5AC,
+            0x2F650,
+            0x2F66C,
+            0x2F690,
+            0x2F6DC,
+            0x2F70C,
+            0x2F8C4,
+            0x2F8DC,
+            0x2F8FC,
+            0x2F918,
+            0x2F9DC,
+            0x2FA5C,
+            0x2FB9C,
+            0x2FBBC,
+            0x2FD3C,
+            0x2FD50,
+            0x2FD6C,
+            0x2FD8C,
+            0x2FE2C,
+            0x2FED4,
+            0x2FEF0,
+            0x2FF10,
+            0x2FFB0,
+            0x30044,
+            0x301F4,
+            0x30274,
+            0x305B4,
+            0x305E4,
+            0x3061C,
+            0x3077C,
+            0x307A4,
+            0x3083C,
+            0x30850,
+            0x3088C,
+            0x308A0,
+            0x308C4,
+            0x30A40,
+            0x30AC0,
+            0x30AD4,
+            0x30AE8,
+            0x30F28,
+            0x30F44,
+            0x31198,
+            0x311B4,
+            0x3123C,
+            0x318B0,
+            0xFFFFFFFF,
+            0x31AF8,
+            0x32474,
+            0x32960,
+            0x32A38,
+            0x367F0,
+            0x36CD4,
+            0x3755C,
+            0x3A75C,
+            0x402C0,
+            0x41A40,
+            0x484A0,
+            0x484B0,
+            0x484E8,
+            0x48758,
+            0x487C4,
+            0x48A0C,
+            0x48A84,
+            0x48BB4,
+            0x48BD0,
+            0x48E74,
+            0x48ED0,
+            0x48F24,
+            0x48F4C,
+            0x48F84,
+            0x49248,
+            0x4926C,
+            0x49370,
+            0x49628,
+            0x4AFC0,
+            0x4B04C,
+            0x4B304,
+            0x4B434,
+            0x4B49C,
+            0x4B4EC,
+            0x4B678,
+            0x4B820,
+            0x4B988,
+            0x4BB00,
+            0x4BB64,
+            0x4BBCC,
+            0x4BC18,
+            0x4BFC0,
+            0x4C1E4,
+            0x4C408,
+            0x4C430,
+            0x4C488,
+            0x4C618,
+            0x4C8EC,
+            0x4C900,
+            0x4C938,
+            0x4C94C,
+            0x4CA70,
+            0x4CA94,
+            0x4CB94,
+            0x4CCB8,
+            0x4CD88,
+            0x4CE90,
+            0x4CF38,
+            0x4CF9C,
+            0x4D108,
+            0x4D130,
+            0x4D14C,
+            0x4D188,
+            0x4D1C4,
+            0x4D208,
+            0x4D250,
+            0x4D290,
+            0x4D2DC,
+            0x4D2F8,
+            0x4D318,
+            0x4D34C,
+            0x4D360,
+            0x4D368,
+            0x4D3C0,
+            0x4D548,
+            0x4D580,
+            0x4D748,
+            0x4D780,
+            0x4D79C,
+            0x4D7D4,
+            0x4D7F4,
+            0x4D804,
+            0x4D848,
+            0x4D894,
+            0x4D89C,
+            0x4D8BC,
+            0x4DD80,
+            0x4E94C,
+            0x4EA5C,
+            0x4EFE0,
+            0x4F3C4,
+            0x4F57C,
+            0x4F5B4,
+            0x4F5C8,
+            0x4F5E0,
+            0x4F5F8,
+            0x4F64C,
+            0x4F814,
+            0x4F88C,
+            0x4F8A8,
+            0x4F8C4,
+            0x4F8E0,
+            0x4F958,
+            0x4FA24,
+            0x4FA3C,
+            0x4FA5C,
+            0x4FA70,
+            0x4FB9C,
+            0x4FBC4,
+            0x4FBFC,
+            0x4FC28,
+            0x4FC6C,
+            0x4FC80,
+            0x4FCC8,
+            0x4FCDC,
+            0x4FD24,
+            0x4FD38,
+            0x4FD3C,
+            0x4FD78,
+            0x4FD8C,
+            0x4FDA0,
+            0x4FDB4,
+            0x4FDE8,
+            0x4FDFC,
+            0x4FE58,
+            0x4FEB4,
+            0x4FEC8,
+            0x4FEE8,
+            0x4FF20,
+            0x4FF34,
+            0x4FF6C,
+            0x4FF80,
+            0x4FFA0,
+            0x4FFD8,
+            0x4FFEC,
+            0x50244,
+            0x502B0,
+            0x502EC,
+            0x50300,
+            0x503CC,
+            0x50420,
+            0x504A4,
+            0x504BC,
+            0x5054C,
+            0x50738,
+            0x5091C,
+            0x5093C,
+            0x50950,
+            0x50964,
+            0x509C0,
+            0x50A40,
+            0x50ACC,
+            0x50B10,
+            0x50B7C,
+            0x50B94,
+            0x50BB8,
+            0x50C74,
+            0x50CE4,
+            0x50E08,
+            0x50E18,
+            0x50E54,
+            0x50F10,
+            0x51020,
+            0x51064,
+            0x51288,
+            0x512B0,
+            0x512C8,
+            0x512F0,
+            0x51318,
+            0x51340,
+            0x51358,
+            0x51380,
+            0x51398,
+            0x513C0,
+            0x513E8,
+            0x51400,
+            0x51428,
+            0x51440,
+            0x51468,
+            0x51490,
+            0x514B0,
+            0x514CC,
+            0x514E8,
+            0x51504,
+            0x51568,
+            0x515EC,
+            0x5167C,
+            0x516DC,
+            0x5171C,
+            0x51744,
+            0x51760,
+            0x517D4,
+            0x517E4,
+            0x517F4,
+            0x51E8C,
+            0x52358,
+            0x52394,
+            0x523D0,
+            0x52440,
+            0x52500,
+            0x526C8,
+            0xFFFFFFFF,
+            0x52740,
+            0x5275C,
+            0x527A8,
+            0x527C4,
+            0x527E0,
+            0x5281C,
+            0x5283C,
+            0x52858,
+            0x52874,
+            0x52890,
+            0x528B4,
+            0x528E0,
+            0x528FC,
+            0x52918,
+            0x52934,
+            0x52950,
+            0x5297C,
+            0x529A8,
+            0x529C4,
+            0x529E4,
+            0x52A04,
+            0x52A24,
+            0x52A44,
+            0x52A60,
+            0x52A7C,
+            0x52AB0,
+            0x52AE0,
+            0x52B28,
+            0x52B44,
+            0x52B60,
+            0x52B8C,
+            0x52BB8,
+            0x52BD4,
+            0x52E50,
+            0x52FB0,
+            0x5379C,
+            0x5384C,
+            0x53DD0,
+            0x53E88,
+            0x53FC8,
+            0x54024,
+            0x54250,
+            0x54398,
+            0x54464,
+            0x54474,
+            0x54480,
+            0x544A0,
+            0x544A8,
+            0x544B8,
+            0x54760,
+            0x5476C,
+            0x54A88,
+            0x54AA4,
+            0x54AD4,
+            0x54B2C,
+            0x54B74,
+            0x54BA4,
+            0x54BE0,
+            0x54C24,
+            0x54CD8,
+            0x54DC4,
+            0x54E4C,
+            0x54E78,
+            0x54EC8,
+            0x55148,
+            0x55274,
+            0x55390,
+            0x55528,
+            0x555A8,
+            0x55650,
+            0x5567C,
+            0x556A8,
+            0x556EC,
+            0x55730,
+            0x55770,
+            0x55798,
+            0x557C4,
+            0x5580C,
+            0x55854,
+            0x558F4,
+            0x55964,
+            0x56070,
+            0x560C8,
+            0x56158,
+            0x561C0,
+            0x56264,
+            0x56294,
+            0x562CC,
+            0x5638C,
+            0x563BC,
+            0x56754,
+            0x56960,
+            0x569CC,
+            0x56AB0,
+            0x56C20,
+            0x57D58,
+            0x581F0,
+            0x585D8,
+            0x58C1C,
+            0x58C3C,
+            0x58C4C,
+            0x58C9C,
+            0x58CD8,
+            0x58D04,
+            0x58DA4,
+            0x58DF4,
+            0x58E68,
+            0x58E8C,
+            0x58EB0,
+            0x58F04,
+            0x58F24,
+            0x59060,
+            0x590F8,
+            0x59118,
+            0x59224,
+            0x59334,
+            0x59444,
+            0x59B18,
+            0x5A210,
+            0x5A430,
+            0x5A450,
+            0x5AE28,
+            0x5B97C,
+            0x5C854,
+            0x5C934,
+            0x5CA40,
+            0x5D224,
+            0x5E238,
+            0x5E5D0,
+            0x5EC98,
+            0x5ED84,
+            0x5EDA4,
+            0x5EE10,
+            0x5EE20,
+            0x5F0B8,
+            0x5F0D8,
+            0x5F3AC,
+            0x5F4A4,
+            0x5F738,
+            0x5F758,
+            0x5F7C4,
+            0x5F7F4,
+            0x5F8A0,
+            0x5F8D0,
+            0x5F90C,
+            0x5F9B8,
+            0x62A14,
+            0x62A58,
+            0x62A68,
+            0x62AE4,
+            0x62BB8,
+            0x62DDC,
+            0x6345C,
+            0x634A8,
+            0x65998,
+            0x65B3C,
+            0x65B50,
+            0x65B60,
+            0x65C48,
+            0x65CF8,
+            0x65D1C,
+            0x69800,
+            0x6A714,
+            0x6A750,
+            0x6A76C,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x2000566,
+            0x2000088,
+            0x200078E,
+            0x2000800,
+            0x2000954,
+            0x2000970,
+            0x2000A1C,
+            0x2000AAC,
+            0x2000AB0,
+            0x2000B9C,
+            0x2000C6C,
+            0x2000DE0,
+            0x2000E70,
+            0x2000EC0,
+            0x2000EC4,
+            0x2000EC8,
+            0x2000F44,
+            0x2000F88,
+            0x2001070,
+            0x2001170,
+            0x2001188,
+            0x200119C,
+            0x2001280,
+            0x2001390,
+            0x2001638,
+            0x2001894,
+            0x2001A30,
+            0x2001A54,
+            0x2001B0C,
+            0x2001C80,
+            0x2001CB0,
+            0x2001CD4,
+            0x2001CF8,
+            0x2001D28,
+            0x2001D50,
+            0x2001D68,
+            0x2001DF4,
+            0x2001EC8,
+            0x2001FA0,
+            0x2002084,
+            0x20021C8,
+            0x20021F4,
+            0x200222C,
+            0x200223C,
+            0x200224C,
+            0x2002274,
+            0x200228C,
+            0x20022AC,
+            0x20022F8,
+            0x2002318,
+            0x2002438,
+            0x20030CC,
+            0x20030E4,
+            0x200321C,
+            0x2003228,
+            0x2003238,
+            0x2003250,
+            0x200326C,
+            0x2003288,
+            0x20032A4,
+            0x20032BC,
+            0x20032D4,
+            0x20032F0,
+            0x200330C,
+            0x2003328,
+            0x2003608,
+            0x20037B4,
+            0x2003824,
+            0x2003CC4,
+            0x2003D2C,
+            0x2003D70,
+            0x2003D94,
+            0x2003DB8,
+            0x2003ED0,
+            0x20040AC,
+            0x2004868,
+            0x2004F74,
+            0x2004FCC,
+            0xFFFFFFFF,
+            0x2005110,
+            0x20061EC,
+            0x200625C,
+            0x2006C1C,
+            0x2006DA4,
+            0x2006EF8,
+            0x2006F68,
+            0x2006FB8,
+            0x2008168,
+            0x2008194,
+            0x2008204,
+            0x2008210,
+            0x2008244,
+            0x2008254,
+            0x20082A8,
+            0x20082C4,
+            0x2008BD4,
+            0x2008C3C,
+            0x200AE38,
+            0x200B990,
+            0x200BA08,
+            0x200BD2C,
+            0x200C0D4,
+            0x200C10C,
+            0x200C110,
+            0x200C118,
+            0x200C11C,
+            0x200C120,
+            0x200C168,
+            0x200C16C,
+            0x200C1C8,
+            0x200C1FC,
+            0x200C230,
+            0x200C234,
+            0x200C23C,
+            0x200C240,
+            0x200C24C,
+            0x200C250,
+            0x200C254,
+            0x200C258,
+            0x200C25C,
+            0x200C2DC,
+            0x200C33C,
+            0x200C35C,
+            0x200C388,
+            0x200C3E0,
+            0x200C474,
+            0x200C484,
+            0x200C4FC,
+            0x200CA54,
+            0x200CAF0,
+            0x200CAFC,
+            0x200CB10,
+            0x200CB2C,
+            0x200CB4C,
+            0x200CB70,
+            0x200CBF4,
+            0x200CC14,
+            0x200CC38,
+            0x200CC84,
+            0x200CCA8,
+            0x200CCE0,
+            0x200CDAC,
+            0x200CDF8,
+            0x200CE74,
+            0x200CE9C,
+            0x200CF58,
+            0x200CF78,
+            0x200CFF0,
+            0x200D0A0,
+            0x200D0D0,
+            0x200D118,
+            0x200D160,
+            0x200D1A8,
+            0x200D278,
+            0xFFFFFFFF,
+            0x200D81C,
+            0x200D834,
+            0x200D95C,
+            0x200DC44,
+            0x200E00C,
+            0x200E054,
+            0x200E1F8,
+            0x200E3A0,
+            0x200E610,
+            0x200E6D8,
+            0x200E760,
+            0x200E77C,
+            0x200E7C0,
+            0x200E7E8,
+            0x200E808,
+            0x200E828,
+            0x200E864,
+            0x200E884,
+            0x200E9B8,
+            0x200E9D8,
+            0x200E9F8,
+            0x200EA18,
+            0x200EA38,
+            0x200EA58,
+            0x200EA80,
+            0x200EAA0,
+            0x200EB30,
+            0x200EB58,
+            0x200EBCC,
+            0x200EBDC,
+            0x200EC48,
+            0x200EC90,
+            0x200ECD8,
+            0x200ECFC,
+            0x200ED1C,
+            0x200ED58,
+            0x200ED84,
+            0x200EDC0,
+            0x200EDFC,
+            0x200EE4C,
+            0x200EE88,
+            0x200EEE0,
+            0x200EF20,
+            0x200EF6C,
+            0x200EFCC,
+            0x200F050,
+            0x200F0E4,
+            0x200F14C,
+            0x200F18C,
+            0x200F208,
+            0x200F26C,
+            0x200F2E0,
+            0x200F348,
+            0x200F370,
+            0x200F390,
+            0x200F404,
+            0x200F454,
+            0x200F4D4,
+            0x200F558,
+            0x200F600,
+            0x200F694,
+            0x200F718,
+            0x200F798,
+            0x200F7A8,
+            0x200F7DC,
+            0x200F84C,
+            0x200F874,
+            0x200F884,
+            0x200F910,
+            0x200F940,
+            0x200FA68,
+            0x200FAEC,
+            0x200FB54,
+            0x200FBE0,
+            0x200FC24,
+            0x200FCAC,
+            0x200FD54,
+            0x200FD78,
+            0x200FDB0,
+            0x200FE00,
+            0x200FEA8,
+            0x200FEE4,
+            0x200FF50,
+            0x200FFAC,
+            0x200FFF4,
+            0x20101A0,
+            0x20101E4,
+            0x2010260,
+            0x20102DC,
+            0x201031C,
+            0x20103AC,
+            0x2010424,
+            0x2010594,
+            0x2010654,
+            0x20106C4,
+            0x201070C,
+            0x2010724,
+            0x2010758,
+            0x2010954,
+            0x2010A4C,
+            0x2010C60,
+            0x2010D58,
+            0x2010E40,
+            0x2010E64,
+            0x2010F80,
+            0x2010FA4,
+            0x2010FC4,
+            0x2011094,
+            0x20110D8,
+            0x201116C,
+            0x2011394,
+            0x2011528,
+            0x2011554,
+            0x2011580,
+            0x20115BC,
+            0x20115F8,
+            0x201170C,
+            0x2011748,
+            0x2011784,
+            0x20117C0,
+            0x20117FC,
+            0x2011830,
+            0x2011850,
+            0x201189C,
+            0x2012AE0,
+            0x2012B34,
+            0x2013250,
+            0x20133C4,
+            0x20133EC,
+            0x2013414,
+            0x2013454,
+            0x2013478,
+            0x2013780,
+            0x20137B8,
+            0x20137E8,
+            0x2013828,
+            0x2013840,
+            0x2013864,
+            0x2013884,
+            0x20138CC,
+            0x20138F4,
+            0x2013940,
+            0x201398C,
+            0x20139AC,
+            0x20139CC,
+            0x20139EC,
+            0x2013A0C,
+            0x2013A30,
+            0x2013A50,
+            0x2013AD0,
+            0x2013AF0,
+            0x2013B10,
+            0x2013B30,
+            0x2013B50,
+            0x2013B70,
+            0x2013B90,
+            0x2013BE8,
+            0x2013C04,
+            0x2013C30,
+            0x2013C64,
+            0xFFFFFFFF,
+            0x2013D08,
+            0x2013D24,
+            0x2013D40,
+            0x2013D5C,
+            0x2013E14,
+            0x20141E0,
+            0x2014208,
+            0x201429C,
+            0x201433C,
+            0x20144A4,
+            0x2014544,
+            0x20146AC,
+            0x20146E4,
+            0x2014778,
+            0x20147B8,
+            0x2014860,
+            0x20148AC,
+            0x2014A4C,
+            0x2014A84,
+            0x2014ABC,
+            0x2014AEC,
+            0x2014C64,
+            0x2014CEC,
+            0x2014D18,
+            0x2014D58,
+            0x2014D84,
+            0x2014DBC,
+            0x2014E00,
+            0x2014E38,
+            0x2014E64,
+            0x2014EF8,
+            0x2014F64,
+            0x2015004,
+            0x2015024,
+            0x201514C,
+            0x20151C8,
+            0x20151E4,
+            0x2015294,
+            0x20152FC,
+            0x2017B58,
+            0x2017B64,
+            0x2017CCC,
+            0x2017DF4,
+            0x2017E70,
+            0x2017EE8,
+            0x20182B8,
+            0x2018AE4,
+            0x2018B6C,
+            0x2018BA8,
+            0x2018C28,
+            0x2018EA4,
+            0x20190C8,
+            0x201938C,
+            0x2019574,
+            0x2019850,
+            0x20198B8,
+            0x2019B28,
+            0x2019C50,
+            0x2019D84,
+            0x2019FE8,
+            0x201A0E8,
+            0x201A1C8,
+            0x201A40C,
+            0x201A4FC,
+            0x201A66C,
+            0x201A828,
+            0x201A900,
+            0x201A9E4,
+            0x201BFF0,
+            0x201C050,
+            0xFFFFFFFF,
+            0x201C0E8,
+            0x201C17C,
+            0x201C2CC,
+            0x201C3E8,
+            0x201C418,
+            0x201C458,
+            0x201C560,
+            0x201D170,
+            0x201D1DC,
+            0x201D244,
+            0x201D2D4,
+            0x201D334,
+            0x201D3BC,
+            0x201D3DC,
+            0x201D484,
+            0x201D590,
+            0x201D684,
+            0x201D72C,
+            0x201DA44,
+            0x201DA80,
+            0x201DC70,
+            0x201DE4C,
+            0x201DEC4,
+            0x201DF18,
+            0x201DFB4,
+            0x201E0B0,
+            0x201E494,
+            0x201E4D4,
+            0x201E504,
+            0x201E71C,
+            0x201E730,
+            0x201E844,
+            0x201E9EC,
+            0x201EC9C,
+            0x201ED88,
+            0x201EE50,
+            0x201EEF0,
+            0x201F05C,
+            0x201F108,
+            0x201F10C,
+            0x201F1D4,
+            0x201F4B4,
+            0x201F534,
+            0x201F58C,
+            0x201F5C0,
+            0x201F5CC,
+            0x201FA10,
+            0x201FF4C,
+            0x201FF58,
+            0x2020470,
+            0x20204EC,
+            0x20205A0,
+            0x20205B0,
+            0x20208C8,
+            0x202090C,
+            0x2020DC8,
+            0x20223F0,
+            0x20235B8,
+            0x20235F8,
+            0x2023604,
+            0x2023690,
+            0x2024360,
+            0x2024428,
+            0x2024AF4,
+            0x2024C6C,
+            0x2024DFC,
+            0x2024FD8,
+            0x20250E4,
+            0x2025100,
+            0x202511C,
+            0x2025170,
+            0x20251AC,
+            0x20251F4,
+            0x2025230,
+            0x2025314,
+            0x2025788,
+            0x2025818,
+            0x2025888,
+            0x20258B8,
+            0x20258C4,
+            0x20258E4,
+            0x202590C,
+            0x202593C,
+            0x202598C,
+            0x2025EE8,
+            0x2026214,
+            0x202654C,
+            0x20265C4,
+            0x202676C,
+            0x20275F8,
+            0x2027648,
+            0x20276C0,
+            0x2027A68,
+            0x2027A80,
+            0x2027AF0,
+            0x2027B58,
+            0x2028194,
+            0x2028284,
+            0x202833C,
+            0x202950C,
+            0x2029670,
+            0x2029EC8,
+            0x2029ED8,
+            0x2029EE8,
+            0x202A3E4,
+            0x202A434,
+            0x202A45C,
+            0x202A5CC,
+            0x202A66C,
+            0x202A690,
+            0x202A730,
+            0x202A75C,
+            0x202A954,
+            0x202AAA8,
+            0x202AABC,
+            0x202AB40,
+            0x202AB60,
+            0x202ABFC,
+            0x202B0EC,
+            0x202B1AC,
+            0x202B284,
+            0x202B490,
+            0x202B4C4,
+            0x202B4F0,
+            0x202B510,
+            0x202B558,
+            0x202B57C,
+            0x202B5C8,
+            0x202BA0C,
+            0x202BA20,
+            0x202BBF0,
+            0x202BC44,
+            0x202BCBC,
+            0x202BCDC,
+            0x202BCFC,
+            0x202BD10,
+            0x202BD64,
+            0x202C3A8,
+            0x202C5E0,
+            0x202C5F4,
+            0x202C70C,
+            0x202C728,
+            0x202C794,
+            0x202C7A8,
+            0x202C7BC,
+            0x202C7D0,
+            0x202C808,
+            0x202D0D8,
+            0x202D114,
+            0x202D1F0,
+            0x202D530,
+            0x202D55C,
+            0x202D57C,
+            0x202D5B0,
+            0x202D5E4,
+            0x202D618,
+            0x202DC50,
+            0x202DEF8,
+            0x202DF24,
+            0x202DF44,
+            0x202DF98,
+            0x202E3CC,
+            0x202E518,
+            0x202E6B0,
+            0x202E6C8,
+            0x202E6E4,
+            0x202E708,
+            0x202F0B0,
+            0x202F148,
+            0x202F180,
+            0x202F1B4,
+            0x202F23C,
+            0x202F3A4,
+            0x202F44C,
+            0x202F488,
+            0x202F5AC,
+            0x202F650,
+            0x202F66C,
+            0x202F690,
+            0x202F6DC,
+            0x202F70C,
+            0x202F8C4,
+            0x202F8DC,
+            0x202F8FC,
+            0x202F918,
+            0x202F9DC,
+            0x202FA5C,
+            0x202FB9C,
+            0x202FBBC,
+            0x202FD3C,
+            0x202FD50,
+            0x202FD6C,
+            0x202FD8C,
+            0x202FE2C,
+            0x202FED4,
+            0x202FEF0,
+            0x202FF10,
+            0x202FFB0,
+            0x2030044,
+            0x20301F4,
+            0x2030274,
+            0x20305B4,
+            0x20305E4,
+            0x203061C,
+            0x203077C,
+            0x20307A4,
+            0x203083C,
+            0x2030850,
+            0x203088C,
+            0x20308A0,
+            0x20308C4,
+            0x2030A40,
+            0x2030AC0,
+            0x2030AD4,
+            0x2030AE8,
+            0x2030F28,
+            0x2030F44,
+            0x2031198,
+            0x20311B4,
+            0x203123C,
+            0x20318B0,
+            0xFFFFFFFF,
+            0x2031AF8,
+            0x2032474,
+            0x2032960,
+            0x2032A38,
+            0x20367F0,
+            0x2036CD4,
+            0x203755C,
+            0x203A75C,
+            0x20402C0,
+            0x2041A40,
+            0x20484A0,
+            0x20484B0,
+            0x20484E8,
+            0x2048758,
+            0x20487C4,
+            0x2048A0C,
+            0x2048A84,
+            0x2048BB4,
+            0x2048BD0,
+            0x2048E74,
+            0x2048ED0,
+            0x2048F24,
+            0x2048F4C,
+            0x2048F84,
+            0x2049248,
+            0x204926C,
+            0x2049370,
+            0x2049628,
+            0x204AFC0,
+            0x204B04C,
+            0x204B304,
+            0x204B434,
+            0x204B49C,
+            0x204B4EC,
+            0x204B678,
+            0x204B820,
+            0x204B988,
+            0x204BB00,
+            0x204BB64,
+            0x204BBCC,
+            0x204BC18,
+            0x204BFC0,
+            0x204C1E4,
+            0x204C408,
+            0x204C430,
+            0x204C488,
+            0x204C618,
+            0x204C8EC,
+            0x204C900,
+            0x204C938,
+            0x204C94C,
+            0x204CA70,
+            0x204CA94,
+            0x204CB94,
+            0x204CCB8,
+            0x204CD88,
+            0x204CE90,
+            0x204CF38,
+            0x204CF9C,
+            0x204D108,
+            0x204D130,
+            0x204D14C,
+            0x204D188,
+            0x204D1C4,
+            0x204D208,
+            0x204D250,
+            0x204D290,
+            0x204D2DC,
+            0x204D2F8,
+            0x204D318,
+            0x204D34C,
+            0x204D360,
+            0x204D368,
+            0x204D3C0,
+            0x204D548,
+            0x204D580,
+            0x204D748,
+            0x204D780,
+            0x204D79C,
+            0x204D7D4,
+            0x204D7F4,
+            0x204D804,
+            0x204D848,
+            0x204D894,
+            0x204D89C,
+            0x204D8BC,
+            0x204DD80,
+            0x204E94C,
+            0x204EA5C,
+            0x204EFE0,
+            0x204F3C4,
+            0x204F57C,
+            0x204F5B4,
+            0x204F5C8,
+            0x204F5E0,
+            0x204F5F8,
+            0x204F64C,
+            0x204F814,
+            0x204F88C,
+            0x204F8A8,
+            0x204F8C4,
+            0x204F8E0,
+            0x204F958,
+            0x204FA24,
+            0x204FA3C,
+            0x204FA5C,
+            0x204FA70,
+            0x204FB9C,
+            0x204FBC4,
+            0x204FBFC,
+            0x204FC28,
+            0x204FC6C,
+            0x204FC80,
+            0x204FCC8,
+            0x204FCDC,
+            0x204FD24,
+            0x204FD38,
+            0x204FD3C,
+            0x204FD78,
+            0x204FD8C,
+            0x204FDA0,
+            0x204FDB4,
+            0x204FDE8,
+            0x204FDFC,
+            0x204FE58,
+            0x204FEB4,
+            0x204FEC8,
+            0x204FEE8,
+            0x204FF20,
+            0x204FF34,
+            0x204FF6C,
+            0x204FF80,
+            0x204FFA0,
+            0x204FFD8,
+            0x204FFEC,
+            0x2050244,
+            0x20502B0,
+            0x20502EC,
+            0x2050300,
+            0x20503CC,
+            0x2050420,
+            0x20504A4,
+            0x20504BC,
+            0x205054C,
+            0x2050738,
+            0x205091C,
+            0x205093C,
+            0x2050950,
+            0x2050964,
+            0x20509C0,
+            0x2050A40,
+            0x2050ACC,
+            0x2050B10,
+            0x2050B7C,
+            0x2050B94,
+            0x2050BB8,
+            0x2050C74,
+            0x2050CE4,
+            0x2050E08,
+            0x2050E18,
+            0x2050E54,
+            0x2050F10,
+            0x2051020,
+            0x2051064,
+            0x2051288,
+            0x20512B0,
+            0x20512C8,
+            0x20512F0,
+            0x2051318,
+            0x2051340,
+            0x2051358,
+            0x2051380,
+            0x2051398,
+            0x20513C0,
+            0x20513E8,
+            0x2051400,
+            0x2051428,
+            0x2051440,
+            0x2051468,
+            0x2051490,
+            0x20514B0,
+            0x20514CC,
+            0x20514E8,
+            0x2051504,
+            0x2051568,
+            0x20515EC,
+            0x205167C,
+            0x20516DC,
+            0x205171C,
+            0x2051744,
+            0x2051760,
+            0x20517D4,
+            0x20517E4,
+            0x20517F4,
+            0x2051E8C,
+            0x2052358,
+            0x2052394,
+            0x20523D0,
+            0x2052440,
+            0x2052500,
+            0x20526C8,
+            0xFFFFFFFF,
+            0x2052740,
+            0x205275C,
+            0x20527A8,
+            0x20527C4,
+            0x20527E0,
+            0x205281C,
+            0x205283C,
+            0x2052858,
+            0x2052874,
+            0x2052890,
+            0x20528B4,
+            0x20528E0,
+            0x20528FC,
+            0x2052918,
+            0x2052934,
+            0x2052950,
+            0x205297C,
+            0x20529A8,
+            0x20529C4,
+            0x20529E4,
+            0x2052A04,
+            0x2052A24,
+            0x2052A44,
+            0x2052A60,
+            0x2052A7C,
+            0x2052AB0,
+            0x2052AE0,
+            0x2052B28,
+            0x2052B44,
+            0x2052B60,
+            0x2052B8C,
+            0x2052BB8,
+            0x2052BD4,
+            0x2052E50,
+            0x2052FB0,
+            0x205379C,
+            0x205384C,
+            0x2053DD0,
+            0x2053E88,
+            0x2053FC8,
+            0x2054024,
+            0x2054250,
+            0x2054398,
+            0x2054464,
+            0x2054474,
+            0x2054480,
+            0x20544A0,
+            0x20544A8,
+            0x20544B8,
+            0x2054760,
+            0x205476C,
+            0x2054A88,
+            0x2054AA4,
+            0x2054AD4,
+            0x2054B2C,
+            0x2054B74,
+            0x2054BA4,
+            0x2054BE0,
+            0x2054C24,
+            0x2054CD8,
+            0x2054DC4,
+            0x2054E4C,
+            0x2054E78,
+            0x2054EC8,
+            0x2055148,
+            0x2055274,
+            0x2055390,
+            0x2055528,
+            0x20555A8,
+            0x2055650,
+            0x205567C,
+            0x20556A8,
+            0x20556EC,
+            0x2055730,
+            0x2055770,
+            0x2055798,
+            0x20557C4,
+            0x205580C,
+            0x2055854,
+            0x20558F4,
+            0x2055964,
+            0x2056070,
+            0x20560C8,
+            0x2056158,
+            0x20561C0,
+            0x2056264,
+            0x2056294,
+            0x20562CC,
+            0x205638C,
+            0x20563BC,
+            0x2056754,
+            0x2056960,
+            0x20569CC,
+            0x2056AB0,
+            0x2056C20,
+            0x2057D58,
+            0x20581F0,
+            0x20585D8,
+            0x2058C1C,
+            0x2058C3C,
+            0x2058C4C,
+            0x2058C9C,
+            0x2058CD8,
+            0x2058D04,
+            0x2058DA4,
+            0x2058DF4,
+            0x2058E68,
+            0x2058E8C,
+            0x2058EB0,
+            0x2058F04,
+            0x2058F24,
+            0x2059060,
+            0x20590F8,
+            0x2059118,
+            0x2059224,
+            0x2059334,
+            0x2059444,
+            0x2059B18,
+            0x205A210,
+            0x205A430,
+            0x205A450,
+            0x205AE28,
+            0x205B97C,
+            0x205C854,
+            0x205C934,
+            0x205CA40,
+            0x205D224,
+            0x205E238,
+            0x205E5D0,
+            0x205EC98,
+            0x205ED84,
+            0x205EDA4,
+            0x205EE10,
+            0x205EE20,
+            0x205F0B8,
+            0x205F0D8,
+            0x205F3AC,
+            0x205F4A4,
+            0x205F738,
+            0x205F758,
+            0x205F7C4,
+            0x205F7F4,
+            0x205F8A0,
+            0x205F8D0,
+            0x205F90C,
+            0x205F9B8,
+            0x2062A14,
+            0x2062A58,
+            0x2062A68,
+            0x2062AE4,
+            0x2062BB8,
+            0x2062DDC,
+            0x206345C,
+            0x20634A8,
+            0x2065998,
+            0x2065B3C,
+            0x2065B50,
+            0x2065B60,
+            0x2065C48,
+            0x2065CF8,
+            0x2065D1C,
+            0x2069800,
+            0x206A714,
+            0x206A750,
+            0x206A76C,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            16,
+            16,
+            16,
+            17,
+            1,
+            18,
+            18,
+            18,
+            1,
+            18,
+            19,
+            20,
+            21,
+            22,
+            23,
+            24,
+            25,
+            26,
+            27,
+            28,
+            29,
+            30,
+            31,
+            32,
+            33,
+            34,
+            35,
+            36,
+            37,
+            38,
+            39,
+            40,
+            41,
+            42,
+            43,
+            44,
+            45,
+            46,
+            47,
+            48,
+            49,
+            50,
+            51,
+            52,
+            53,
+            54,
+            55,
+            56,
+            57,
+            58,
+            59,
+            60,
+            60,
+            61,
+            62,
+            63,
+            64,
+            65,
+            66,
+            67,
+            68,
+            69,
+            70,
+            71,
+            72,
+            73,
+            74,
+            75,
+            76,
+            77,
+            78,
+            79,
+            80,
+            81,
+            82,
+            83,
+            84,
+            85,
+            86,
+            87,
+            88,
+            88,
+            89,
+            90,
+            91,
+            92,
+            93,
+            94,
+            95,
+            96,
+            97,
+            98,
+            99,
+            100,
+            101,
+            102,
+            103,
+            104,
+            105,
+            106,
+            107,
+            108,
+            109,
+            110,
+            111,
+            112,
+            113,
+            112,
+            114,
+            115,
+            116,
+            117,
+            118,
+            119,
+            120,
+            112,
+            112,
+            112,
+            112,
+            121,
+            122,
+            123,
+            124,
+            125,
+            126,
+            127,
+            128,
+            129,
+            130,
+            131,
+            132,
+            133,
+            134,
+            135,
+            136,
+            137,
+            138,
+            139,
+            140,
+            141,
+            142,
+            143,
+            144,
+            145,
+            146,
+            147,
+            148,
+            149,
+            150,
+            151,
+            152,
+            151,
+            152,
+            153,
+            154,
+            155,
+            156,
+            157,
+            157,
+            158,
+            159,
+            160,
+            161,
+            162,
+            163,
+            164,
+            165,
+            166,
+            164,
+            167,
+            168,
+            169,
+            170,
+            171,
+            172,
+            173,
+            174,
+            175,
+            176,
+            177,
+            178,
+            136,
+            179,
+            180,
+            181,
+            182,
+            183,
+            184,
+            185,
+            186,
+            187,
+            188,
+            189,
+            190,
+            191,
+            192,
+            193,
+            194,
+            136,
+            195,
+            196,
+            196,
+            197,
+            197,
+            198,
+            199,
+            200,
+            201,
+            163,
+            202,
+            203,
+            204,
+            205,
+            205,
+            205,
+            205,
+            202,
+            164,
+            206,
+            203,
+            207,
+            208,
+            209,
+            210,
+            211,
+            212,
+            213,
+            214,
+            215,
+            216,
+            217,
+            218,
+            219,
+            220,
+            221,
+            222,
+            223,
+            224,
+            225,
+            226,
+            227,
+            228,
+            229,
+            230,
+            231,
+            232,
+            233,
+            234,
+            235,
+            236,
+            237,
+            238,
+            239,
+            240,
+            241,
+            242,
+            243,
+            244,
+            245,
+            246,
+            247,
+            248,
+            249,
+            250,
+            251,
+            252,
+            253,
+            254,
+            255,
+            256,
+            257,
+            258,
+            259,
+            260,
+            261,
+            262,
+            263,
+            264,
+            265,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            267,
+            268,
+            269,
+            270,
+            271,
+            272,
+            273,
+            274,
+            275,
+            276,
+            277,
+            277,
+            278,
+            279,
+            280,
+            281,
+            282,
+            283,
+            284,
+            285,
+            286,
+            287,
+            288,
+            289,
+            290,
+            291,
+            292,
+            293,
+            294,
+            295,
+            296,
+            297,
+            297,
+            298,
+            288,
+            299,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            300,
+            301,
+            302,
+            303,
+            304,
+            303,
+            305,
+            306,
+            305,
+            306,
+            297,
+            307,
+            308,
+            309,
+            310,
+            297,
+            297,
+            297,
+            297,
+            311,
+            312,
+            311,
+            313,
+            314,
+            315,
+            316,
+            317,
+            317,
+            318,
+            319,
+            320,
+            321,
+            322,
+            323,
+            324,
+            325,
+            326,
+            327,
+            328,
+            329,
+            330,
+            331,
+            266,
+            332,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            333,
+            266,
+            266,
+            266,
+            266,
+            266,
+            334,
+            335,
+            336,
+            337,
+            338,
+            339,
+            340,
+            341,
+            342,
+            343,
+            344,
+            345,
+            346,
+            347,
+            348,
+            349,
+            350,
+            351,
+            352,
+            353,
+            354,
+            355,
+            356,
+            357,
+            358,
+            359,
+            360,
+            361,
+            362,
+            363,
+            364,
+            365,
+            366,
+            367,
+            368,
+            369,
+            370,
+            371,
+            372,
+            373,
+            374,
+            375,
+            376,
+            377,
+            378,
+            379,
+            380,
+            381,
+            382,
+            383,
+            384,
+            382,
+            385,
+            386,
+            387,
+            388,
+            389,
+            390,
+            391,
+            392,
+            393,
+            394,
+            395,
+            396,
+            266,
+            266,
+            397,
+            398,
+            399,
+            400,
+            401,
+            402,
+            403,
+            404,
+            405,
+            406,
+            407,
+            408,
+            409,
+            163,
+            410,
+            411,
+            412,
+            413,
+            414,
+            163,
+            415,
+            416,
+            417,
+            418,
+            419,
+            420,
+            421,
+            422,
+            423,
+            424,
+            425,
+            426,
+            427,
+            428,
+            429,
+            430,
+            431,
+            432,
+            433,
+            434,
+            435,
+            436,
+            437,
+            438,
+            439,
+            440,
+            441,
+            442,
+            443,
+            444,
+            445,
+            446,
+            447,
+            448,
+            449,
+            450,
+            451,
+            452,
+            453,
+            454,
+            455,
+            456,
+            457,
+            458,
+            459,
+            460,
+            461,
+            462,
+            463,
+            464,
+            465,
+            458,
+            458,
+            466,
+            467,
+            468,
+            469,
+            470,
+            471,
+            472,
+            473,
+            474,
+            475,
+            476,
+            477,
+            478,
+            479,
+            480,
+            481,
+            482,
+            483,
+            484,
+            485,
+            486,
+            487,
+            488,
+            489,
+            490,
+            491,
+            492,
+            493,
+            494,
+            495,
+            496,
+            497,
+            498,
+            499,
+            500,
+            501,
+            502,
+            503,
+            504,
+            505,
+            506,
+            507,
+            508,
+            509,
+            510,
+            511,
+            512,
+            513,
+            514,
+            515,
+            516,
+            517,
+            518,
+            519,
+            520,
+            521,
+            522,
+            523,
+            524,
+            525,
+            526,
+            527,
+            528,
+            529,
+            530,
+            531,
+            532,
+            533,
+            534,
+            535,
+            536,
+            537,
+            538,
+            539,
+            540,
+            541,
+            542,
+            543,
+            544,
+            545,
+            546,
+            547,
+            548,
+            549,
+            550,
+            551,
+            552,
+            553,
+            554,
+            555,
+            556,
+            557,
+            557,
+            558,
+            163,
+            559,
+            560,
+            561,
+            562,
+            563,
+            564,
+            565,
+            566,
+            567,
+            568,
+            569,
+            569,
+            570,
+            571,
+            572,
+            573,
+            266,
+            574,
+            575,
+            576,
+            577,
+            578,
+            579,
+            580,
+            581,
+            582,
+            583,
+            584,
+            585,
+            586,
+            587,
+            588,
+            589,
+            590,
+            591,
+            592,
+            593,
+            594,
+            595,
+            596,
+            597,
+            598,
+            599,
+            600,
+            601,
+            602,
+            603,
+            604,
+            605,
+            606,
+            607,
+            608,
+            609,
+            277,
+            609,
+            610,
+            611,
+            612,
+            613,
+            614,
+            163,
+            615,
+            616,
+            609,
+            617,
+            157,
+            618,
+            619,
+            620,
+            621,
+            622,
+            623,
+            624,
+            625,
+            626,
+            627,
+            628,
+            629,
+            630,
+            631,
+            632,
+            633,
+            634,
+            635,
+            636,
+            637,
+            638,
+            639,
+            640,
+            641,
+            642,
+            643,
+            644,
+            266,
+            645,
+            646,
+            647,
+            648,
+            649,
+            650,
+            651,
+            652,
+            653,
+            654,
+            655,
+            656,
+            657,
+            658,
+            659,
+            660,
+            661,
+            662,
+            663,
+            664,
+            665,
+            666,
+            667,
+            668,
+            669,
+            670,
+            671,
+            672,
+            673,
+            674,
+            675,
+            676,
+            677,
+            678,
+            679,
+            680,
+            681,
+            682,
+            683,
+            684,
+            685,
+            618,
+            686,
+            687,
+            688,
+            689,
+            690,
+            691,
+            692,
+            693,
+            694,
+            695,
+            696,
+            697,
+            698,
+            699,
+            700,
+            701,
+            702,
+            703,
+            704,
+            705,
+            706,
+            707,
+            708,
+            707,
+            709,
+            707,
+            710,
+            707,
+            711,
+            712,
+            707,
+            713,
+            707,
+            707,
+            714,
+            715,
+            716,
+            717,
+            718,
+            719,
+            306,
+            720,
+            721,
+            722,
+            723,
+            724,
+            725,
+            726,
+            727,
+            728,
+            163,
+            729,
+            730,
+            730,
+            729,
+            731,
+            732,
+            733,
+            734,
+            735,
+            736,
+            737,
+            738,
+            739,
+            740,
+            741,
+            742,
+            743,
+            744,
+            745,
+            746,
+            747,
+            748,
+            748,
+            749,
+            750,
+            751,
+            752,
+            753,
+            754,
+            755,
+            756,
+            757,
+            758,
+            759,
+            760,
+            748,
+            761,
+            762,
+            163,
+            763,
+            764,
+            765,
+            766,
+            767,
+            768,
+            769,
+            770,
+            771,
+            771,
+            771,
+            772,
+            773,
+            774,
+            775,
+            776,
+            777,
+            778,
+            779,
+            780,
+            781,
+            782,
+            783,
+            784,
+            785,
+            771,
+            786,
+            787,
+            788,
+            789,
+            790,
+            791,
+            792,
+            793,
+            794,
+            795,
+            796,
+            797,
+            798,
+            799,
+            800,
+            801,
+            802,
+            803,
+            804,
+            805,
+            806,
+            807,
+            808,
+            809,
+            810,
+            811,
+            812,
+            813,
+            814,
+            815,
+            816,
+            817,
+            818,
+            819,
+            820,
+            821,
+            163,
+            822,
+            823,
+            824,
+            825,
+            826,
+            827,
+            828,
+            829,
+            830,
+            831,
+            832,
+            833,
+            834,
+            835,
+            836,
+            837,
+            838,
+            157,
+            619,
+            839,
+            840,
+            841,
+            842,
+            843,
+            844,
+            845,
+            846,
+            847,
+            848,
+            849,
+            850,
+            851,
+            852,
+            853,
+            854,
+            855,
+            856,
+            857,
+            858,
+            859,
+            860,
+            861,
+            862,
+            863,
+            864,
+            865,
+            866,
+            867,
+            868,
+            869,
+            870,
+            871,
+            872,
+            873,
+            874,
+            875,
+            876,
+            877,
+            878,
+            879,
+            880,
+            881,
+            882,
+            883,
+            884,
+            885,
+            886,
+            887,
+            888,
+        ),
+    ),
+    c_types=None,
+    multi={
+        78: ((0x5050, 0x50B0), (0x2005050, 0x20050B0)),
+        154: (
+            (
+                0xD634,
+                0xE990,
+                0x13758,
+                0x176E4,
+                0x17A40,
+                0x23590,
+                0x2378C,
+                0x37F30,
+                0x39438,
+                0x3A970,
+                0x3CFA4,
+                0x4174C,
+                0x42A84,
+                0x52418,
+                0x54A60,
+                0x609E8,
+            ),
+            (
+                0x200D634,
+                0x200E990,
+                0x2013758,
+                0x20176E4,
+                0x2017A40,
+                0x2023590,
+                0x202378C,
+                0x2037F30,
+                0x2039438,
+                0x203A970,
+                0x203CFA4,
+                0x204174C,
+                0x2042A84,
+                0x2052418,
+                0x2054A60,
+                0x20609E8,
+            ),
+        ),
+        315: ((0x13CAC, 0x14804), (0x2013CAC, 0x2014804)),
+        386: ((0x1C0B0, 0x1C0CC), (0x201C0B0, 0x201C0CC)),
+        608: ((0x31AA4, 0x329E4), (0x2031AA4, 0x20329E4)),
+        810: ((0x526EC, 0x52708, 0x52724), (0x20526EC, 0x2052708, 0x2052724)),
+    },
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "SECURE",
+        "START_MODULE_PARAMS",
+        "DEFAULT_MEMORY_ARENA_SIZE",
+        "LOG_MAX_ARG",
+        "DAMAGE_SOURCE_CODE_ORB_ITEM",
+        "DAMAGE_SOURCE_CODE_NON_ORB_ITEM",
+        "AURA_BOW_ID_LAST",
+        "NUMBER_OF_ITEMS",
+        "MAX_MONEY_CARRIED",
+        "MAX_MONEY_STORED",
+        "WINDOW_LIST_PTR",
+        "SCRIPT_VARS_VALUES_PTR",
+        "MAX_PLAY_TIME",
+        "MONSTER_ID_LIMIT",
+        "MAX_RECRUITABLE_TEAM_MEMBERS",
+        "NATURAL_LOG_VALUE_TABLE",
+        "CART_REMOVED_IMG_DATA",
+        "STRING_DEBUG_EMPTY",
+        "STRING_DEBUG_FORMAT_LINE_FILE",
+        "STRING_DEBUG_NO_PROG_POS",
+        "STRING_DEBUG_SPACED_PRINT",
+        "STRING_DEBUG_FATAL",
+        "STRING_DEBUG_NEWLINE",
+        "STRING_DEBUG_LOG_NULL",
+        "STRING_DEBUG_STRING_NEWLINE",
+        "STRING_EFFECT_EFFECT_BIN",
+        "STRING_MONSTER_MONSTER_BIN",
+        "STRING_BALANCE_M_LEVEL_BIN",
+        "STRING_DUNGEON_DUNGEON_BIN",
+        "STRING_MONSTER_M_ATTACK_BIN",
+        "STRING_MONSTER_M_GROUND_BIN",
+        "STRING_FILE_DIRECTORY_INIT",
+        "AVAILABLE_ITEMS_IN_GROUP_TABLE",
+        "ARM9_UNKNOWN_TABLE__NA_2097FF8",
+        "KECLEON_SHOP_ITEM_TABLE_LISTS_1",
+        "KECLEON_SHOP_ITEM_TABLE_LISTS_2",
+        "EXCLUSIVE_ITEM_STAT_BOOST_DATA",
+        "EXCLUSIVE_ITEM_DEFENSE_BOOSTS",
+        "EXCLUSIVE_ITEM_SPECIAL_ATTACK_BOOSTS",
+        "EXCLUSIVE_ITEM_SPECIAL_DEFENSE_BOOSTS",
+        "EXCLUSIVE_ITEM_EFFECT_DATA",
+        "EXCLUSIVE_ITEM_STAT_BOOST_DATA_INDEXES",
+        "RECYCLE_SHOP_ITEM_LIST",
+        "TYPE_SPECIFIC_EXCLUSIVE_ITEMS",
+        "RECOIL_MOVE_LIST",
+        "PUNCH_MOVE_LIST",
+        "MOVE_POWER_STARS_TABLE",
+        "MOVE_ACCURACY_STARS_TABLE",
+        "PARENT_MENU_DEFAULT_WINDOW_PARAMS",
+        "SIMPLE_MENU_DEFAULT_WINDOW_PARAMS",
+        "ADVANCED_MENU_DEFAULT_WINDOW_PARAMS",
+        "COLLECTION_MENU_DEFAULT_WINDOW_PARAMS",
+        "OPTIONS_MENU_DEFAULT_WINDOW_PARAMS",
+        "DEBUG_MENU_DEFAULT_WINDOW_PARAMS",
+        "SCROLL_BOX_DEFAULT_WINDOW_PARAMS",
+        "DIALOGUE_BOX_DEFAULT_WINDOW_PARAMS",
+        "PORTRAIT_BOX_DEFAULT_WINDOW_PARAMS",
+        "TEXT_BOX_DEFAULT_WINDOW_PARAMS",
+        "AREA_NAME_BOX_DEFAULT_WINDOW_PARAMS",
+        "CONTROLS_CHART_DEFAULT_WINDOW_PARAMS",
+        "ALERT_BOX_DEFAULT_WINDOW_PARAMS",
+        "ADVANCED_TEXT_BOX_DEFAULT_WINDOW_PARAMS",
+        "TEAM_SELECTION_MENU_DEFAULT_WINDOW_PARAMS",
+        "PARTNER_TALK_KIND_TABLE",
+        "SCRIPT_VARS_LOCALS",
+        "SCRIPT_VARS",
+        "PORTRAIT_LAYOUTS",
+        "KAOMADO_FILEPATH",
+        "WONDER_MAIL_BITS_MAP",
+        "WONDER_MAIL_BITS_SWAP",
+        "ARM9_UNKNOWN_TABLE__NA_209E12C",
+        "ARM9_UNKNOWN_TABLE__NA_209E164",
+        "ARM9_UNKNOWN_TABLE__NA_209E280",
+        "WONDER_MAIL_ENCRYPTION_TABLE",
+        "DUNGEON_DATA_LIST",
+        "ADVENTURE_LOG_ENCOUNTERS_MONSTER_IDS",
+        "ARM9_UNKNOWN_DATA__NA_209E6BC",
+        "TACTIC_NAME_STRING_IDS",
+        "STATUS_NAME_STRING_IDS",
+        "DUNGEON_RETURN_STATUS_TABLE",
+        "STATUSES_FULL_DESCRIPTION_STRING_IDS",
+        "ARM9_UNKNOWN_DATA__NA_209EAAC",
+        "MISSION_FLOOR_RANKS_AND_ITEM_LISTS_1",
+        "MISSION_FLOORS_FORBIDDEN",
+        "MISSION_FLOOR_RANKS_AND_ITEM_LISTS_2",
+        "MISSION_FLOOR_RANKS_PTRS",
+        "DUNGEON_RESTRICTIONS",
+        "SPECIAL_BAND_STAT_BOOST",
+        "MUNCH_BELT_STAT_BOOST",
+        "GUMMI_STAT_BOOST",
+        "MIN_IQ_EXCLUSIVE_MOVE_USER",
+        "WONDER_GUMMI_IQ_GAIN",
+        "AURA_BOW_STAT_BOOST",
+        "MIN_IQ_ITEM_MASTER",
+        "DEF_SCARF_STAT_BOOST",
+        "POWER_BAND_STAT_BOOST",
+        "WONDER_GUMMI_STAT_BOOST",
+        "ZINC_BAND_STAT_BOOST",
+        "EGG_HP_BONUS",
+        "EVOLUTION_HP_BONUS",
+        "DAMAGE_FORMULA_FLV_SHIFT",
+        "EVOLUTION_PHYSICAL_STAT_BONUSES",
+        "DAMAGE_FORMULA_CONSTANT_SHIFT",
+        "DAMAGE_FORMULA_FLV_DEFICIT_DIVISOR",
+        "EGG_STAT_BONUSES",
+        "EVOLUTION_SPECIAL_STAT_BONUSES",
+        "DAMAGE_FORMULA_NON_TEAM_MEMBER_MODIFIER",
+        "DAMAGE_FORMULA_LN_PREFACTOR",
+        "DAMAGE_FORMULA_DEF_PREFACTOR",
+        "DAMAGE_FORMULA_AT_PREFACTOR",
+        "DAMAGE_FORMULA_LN_ARG_PREFACTOR",
+        "FORBIDDEN_FORGOT_MOVE_LIST",
+        "TACTICS_UNLOCK_LEVEL_TABLE",
+        "CLIENT_LEVEL_TABLE",
+        "OUTLAW_LEVEL_TABLE",
+        "OUTLAW_MINION_LEVEL_TABLE",
+        "HIDDEN_POWER_BASE_POWER_TABLE",
+        "VERSION_EXCLUSIVE_MONSTERS",
+        "IQ_SKILL_RESTRICTIONS",
+        "SECONDARY_TERRAIN_TYPES",
+        "SENTRY_DUTY_MONSTER_IDS",
+        "IQ_SKILLS",
+        "IQ_GROUP_SKILLS",
+        "MONEY_QUANTITY_TABLE",
+        "ARM9_UNKNOWN_TABLE__NA_20A20B0",
+        "IQ_GUMMI_GAIN_TABLE",
+        "GUMMI_BELLY_RESTORE_TABLE",
+        "BAG_CAPACITY_TABLE_SPECIAL_EPISODES",
+        "BAG_CAPACITY_TABLE",
+        "SPECIAL_EPISODE_MAIN_CHARACTERS",
+        "GUEST_MONSTER_DATA",
+        "RANK_UP_TABLE",
+        "DS_DOWNLOAD_TEAMS",
+        "ARM9_UNKNOWN_PTR__NA_20A2C84",
+        "UNOWN_SPECIES_ADDITIONAL_CHARS",
+        "MONSTER_SPRITE_DATA",
+        "REMOTE_STRINGS",
+        "RANK_STRINGS_1",
+        "MISSION_MENU_STRING_IDS_1",
+        "RANK_STRINGS_2",
+        "MISSION_MENU_STRING_IDS_2",
+        "RANK_STRINGS_3",
+        "MISSION_DUNGEON_UNLOCK_TABLE",
+        "NO_SEND_ITEM_TABLE",
+        "ARM9_UNKNOWN_TABLE__NA_20A3CC8",
+        "ARM9_UNKNOWN_TABLE__NA_20A3CE4",
+        "ARM9_UNKNOWN_FUNCTION_TABLE__NA_20A3CF4",
+        "MISSION_BANNED_STORY_MONSTERS",
+        "ITEM_DELIVERY_TABLE",
+        "MISSION_RANK_POINTS",
+        "MISSION_BANNED_MONSTERS",
+        "MISSION_STRING_IDS",
+        "LEVEL_LIST",
+        "EVENTS",
+        "ARM9_UNKNOWN_TABLE__NA_20A68BC",
+        "DEMO_TEAMS",
+        "ACTOR_LIST",
+        "ENTITIES",
+        "JOB_WINDOW_PARAMS_1",
+        "JOB_MENU_ITEMS_1",
+        "JOB_MENU_ITEMS_2",
+        "JOB_MENU_ITEMS_3",
+        "JOB_MENU_ITEMS_4",
+        "JOB_MENU_ITEMS_5",
+        "JOB_MENU_ITEMS_6",
+        "JOB_MENU_ITEMS_7",
+        "JOB_MENU_ITEMS_8",
+        "JOB_MENU_ITEMS_9",
+        "JOB_MENU_ITEMS_10",
+        "JOB_MENU_ITEMS_11",
+        "JOB_MENU_ITEMS_12",
+        "JOB_MENU_ITEMS_13",
+        "JOB_WINDOW_PARAMS_2",
+        "DUNGEON_SWAP_ID_TABLE",
+        "MAP_MARKER_PLACEMENTS",
+        "LFO_OUTPUT_VOICE_UPDATE_FLAGS",
+        "TRIG_TABLE",
+        "FX_ATAN_IDX_TABLE",
+        "TEX_PLTT_START_ADDR_TABLE",
+        "TEX_START_ADDR_TABLE",
+        "ARM9_UNKNOWN_TABLE__NA_20AE924",
+        "MEMORY_ALLOCATION_ARENA_GETTERS",
+        "PRNG_SEQUENCE_NUM",
+        "LOADED_OVERLAY_GROUP_0",
+        "LOADED_OVERLAY_GROUP_1",
+        "LOADED_OVERLAY_GROUP_2",
+        "DEBUG_IS_INITIALIZED",
+        "PACK_FILES_OPENED",
+        "PACK_FILE_PATHS_TABLE",
+        "GAME_STATE_VALUES",
+        "BAG_ITEMS_PTR_MIRROR",
+        "ITEM_DATA_TABLE_PTRS",
+        "DUNGEON_MOVE_TABLES",
+        "MOVE_DATA_TABLE_PTR",
+        "WAN_TABLE",
+        "RENDER_3D",
+        "RENDER_3D_FUNCTIONS_64",
+        "LANGUAGE_INFO_DATA",
+        "TBL_TALK_GROUP_STRING_ID_START",
+        "KEYBOARD_STRING_IDS",
+        "NOTIFY_NOTE",
+        "DEFAULT_HERO_ID",
+        "DEFAULT_PARTNER_ID",
+        "GAME_MODE",
+        "GLOBAL_PROGRESS_PTR",
+        "ADVENTURE_LOG_PTR",
+        "ITEM_TABLES_PTRS_1",
+        "UNOWN_SPECIES_ADDITIONAL_CHAR_PTR_TABLE",
+        "TEAM_MEMBER_TABLE_PTR",
+        "MISSION_DELIVER_LIST_PTR",
+        "MISSION_DELIVER_COUNT",
+        "MISSION_DUNGEON_LIST_PTR",
+        "MISSION_DUNGEON_COUNT",
+        "MISSION_MONSTER_LIST_PTR",
+        "MISSION_MONSTER_COUNT",
+        "MISSION_LIST_PTR",
+        "REMOTE_STRING_PTR_TABLE",
+        "RANK_STRING_PTR_TABLE",
+        "SMD_EVENTS_FUN_TABLE",
+        "MUSIC_DURATION_LOOKUP_TABLE_1",
+        "MUSIC_DURATION_LOOKUP_TABLE_2",
+        "LFO_WAVEFORM_CALLBACKS",
+        "IS_DISP_ON",
+        "GXI_DMA_ID",
+        "JUICE_BAR_NECTAR_IQ_GAIN",
+        "DEBUG_TEXT_SPEED",
+        "REGULAR_TEXT_SPEED",
+        "HERO_START_LEVEL",
+        "PARTNER_START_LEVEL",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x0,
+            0xBA0,
+            0xE58,
+            0x2220,
+            0xCA84,
+            0xCA88,
+            0xCC34,
+            0xFFFFFFFF,
+            0xED50,
+            0x10750,
+            0x28350,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x5449C,
+            0xFFFFFFFF,
+            0x91448,
+            0x92AE8,
+            0x94AFC,
+            0x94B00,
+            0x94B1C,
+            0x94B34,
+            0x94B40,
+            0x94B54,
+            0x94B58,
+            0x94B60,
+            0x94B64,
+            0x94B78,
+            0x94B8C,
+            0x94BA0,
+            0x94BB4,
+            0x94BCC,
+            0x94BE4,
+            0x94D34,
+            0x97FF8,
+            0x980C0,
+            0x980D0,
+            0x980E8,
+            0x980E9,
+            0x980EA,
+            0x980EB,
+            0x98124,
+            0x98125,
+            0x988CC,
+            0x98C2C,
+            0x98D74,
+            0x98D8A,
+            0x99CD4,
+            0x99CEC,
+            0x9AE90,
+            0x9AEA0,
+            0x9AEB0,
+            0x9AEC0,
+            0x9AED0,
+            0x9AF0C,
+            0x9AF1C,
+            0x9AF2C,
+            0x9AF3C,
+            0x9AF4C,
+            0x9AF5C,
+            0x9AF78,
+            0x9AF94,
+            0x9AFA4,
+            0x9AFB4,
+            0x9CCE4,
+            0x9CECC,
+            0x9D870,
+            0x9E014,
+            0x9E0D4,
+            0x9E0E8,
+            0x9E108,
+            0x9E12C,
+            0x9E164,
+            0x9E280,
+            0x9E2A0,
+            0x9E3A0,
+            0x9E670,
+            0x9E6BC,
+            0x9E6C0,
+            0x9E6D8,
+            0x9E7A4,
+            0x9E910,
+            0x9EAAC,
+            0x9EAB0,
+            0x9F714,
+            0x9F7DC,
+            0xA0AD4,
+            0xA0C64,
+            0xA186C,
+            0xA187C,
+            0xA1888,
+            0xA188C,
+            0xA1890,
+            0xA1898,
+            0xA18A4,
+            0xA18A8,
+            0xA18AC,
+            0xA18B0,
+            0xA18B4,
+            0xA18B8,
+            0xA18C4,
+            0xA18CC,
+            0xA18D0,
+            0xA18D4,
+            0xA18D8,
+            0xA18DC,
+            0xA18E4,
+            0xA18E8,
+            0xA18EC,
+            0xA18F0,
+            0xA18F4,
+            0xA18F8,
+            0xA1918,
+            0xA1940,
+            0xA1978,
+            0xA1998,
+            0xA19B8,
+            0xA19D8,
+            0xA1A00,
+            0xA1A5C,
+            0xA1AE8,
+            0xA1BB0,
+            0xA1C7C,
+            0xA1D90,
+            0xA1F20,
+            0xA20B0,
+            0xA22B0,
+            0xA2538,
+            0xA27C0,
+            0xA27D4,
+            0xA27F4,
+            0xA28BC,
+            0xA2B44,
+            0xA2C14,
+            0xA2C84,
+            0xA2C88,
+            0xA2D08,
+            0xA3B40,
+            0xA3B6C,
+            0xA3B9C,
+            0xA3BAC,
+            0xA3BDC,
+            0xA3BEC,
+            0xA3CAC,
+            0xA3CB2,
+            0xA3CC8,
+            0xA3CE4,
+            0xA3CF4,
+            0xA3D14,
+            0xA3D3E,
+            0xA3D6C,
+            0xA3DAC,
+            0xA3EA4,
+            0xA46EC,
+            0xA5488,
+            0xA68BC,
+            0xA68C8,
+            0xA6910,
+            0xA7FF0,
+            0xA9218,
+            0xA9228,
+            0xA9248,
+            0xA92B8,
+            0xA92D0,
+            0xA92E8,
+            0xA9300,
+            0xA9318,
+            0xA9330,
+            0xA9348,
+            0xA9360,
+            0xA9378,
+            0xA9390,
+            0xA93B0,
+            0xA93D0,
+            0xA93E0,
+            0xA94D0,
+            0xA9FA0,
+            0xA9FB0,
+            0xADFB0,
+            0xAE0B4,
+            0xAE0C4,
+            0xAE924,
+            0xAEF00,
+            0xAEF2C,
+            0xAF230,
+            0xAF234,
+            0xAF238,
+            0xAF698,
+            0xAF69C,
+            0xAF6A0,
+            0xAF6B8,
+            0xAF6B8,
+            0xAF6C0,
+            0xAF6DC,
+            0xAF6E4,
+            0xAFC68,
+            0xAFC80,
+            0xAFCC4,
+            0xAFCE8,
+            0xAFCF8,
+            0xAFDFC,
+            0xAFEF8,
+            0xAFEFC,
+            0xAFEFE,
+            0xAFF70,
+            0xAFF74,
+            0xAFF78,
+            0xB0948,
+            0xB09D8,
+            0xB0A48,
+            0xB0A60,
+            0xB0A64,
+            0xB0A68,
+            0xB0A6C,
+            0xB0A70,
+            0xB0A74,
+            0xB0A78,
+            0xB0A7C,
+            0xB0A98,
+            0xB0B90,
+            0xB0F50,
+            0xB1050,
+            0xB1250,
+            0xB2B94,
+            0xB2B98,
+            0x11810,
+            0x20C94,
+            0x20C98,
+            0x48880,
+            0x488F0,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x2000000,
+            0x2000BA0,
+            0x2000E58,
+            0x2002220,
+            0x200CA84,
+            0x200CA88,
+            0x200CC34,
+            0xFFFFFFFF,
+            0x200ED50,
+            0x2010750,
+            0x2028350,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x205449C,
+            0xFFFFFFFF,
+            0x2091448,
+            0x2092AE8,
+            0x2094AFC,
+            0x2094B00,
+            0x2094B1C,
+            0x2094B34,
+            0x2094B40,
+            0x2094B54,
+            0x2094B58,
+            0x2094B60,
+            0x2094B64,
+            0x2094B78,
+            0x2094B8C,
+            0x2094BA0,
+            0x2094BB4,
+            0x2094BCC,
+            0x2094BE4,
+            0x2094D34,
+            0x2097FF8,
+            0x20980C0,
+            0x20980D0,
+            0x20980E8,
+            0x20980E9,
+            0x20980EA,
+            0x20980EB,
+            0x2098124,
+            0x2098125,
+            0x20988CC,
+            0x2098C2C,
+            0x2098D74,
+            0x2098D8A,
+            0x2099CD4,
+            0x2099CEC,
+            0x209AE90,
+            0x209AEA0,
+            0x209AEB0,
+            0x209AEC0,
+            0x209AED0,
+            0x209AF0C,
+            0x209AF1C,
+            0x209AF2C,
+            0x209AF3C,
+            0x209AF4C,
+            0x209AF5C,
+            0x209AF78,
+            0x209AF94,
+            0x209AFA4,
+            0x209AFB4,
+            0x209CCE4,
+            0x209CECC,
+            0x209D870,
+            0x209E014,
+            0x209E0D4,
+            0x209E0E8,
+            0x209E108,
+            0x209E12C,
+            0x209E164,
+            0x209E280,
+            0x209E2A0,
+            0x209E3A0,
+            0x209E670,
+            0x209E6BC,
+            0x209E6C0,
+            0x209E6D8,
+            0x209E7A4,
+            0x209E910,
+            0x209EAAC,
+            0x209EAB0,
+            0x209F714,
+            0x209F7DC,
+            0x20A0AD4,
+            0x20A0C64,
+            0x20A186C,
+            0x20A187C,
+            0x20A1888,
+            0x20A188C,
+            0x20A1890,
+            0x20A1898,
+            0x20A18A4,
+            0x20A18A8,
+            0x20A18AC,
+            0x20A18B0,
+            0x20A18B4,
+            0x20A18B8,
+            0x20A18C4,
+            0x20A18CC,
+            0x20A18D0,
+            0x20A18D4,
+            0x20A18D8,
+            0x20A18DC,
+            0x20A18E4,
+            0x20A18E8,
+            0x20A18EC,
+            0x20A18F0,
+            0x20A18F4,
+            0x20A18F8,
+            0x20A1918,
+            0x20A1940,
+            0x20A1978,
+            0x20A1998,
+            0x20A19B8,
+            0x20A19D8,
+            0x20A1A00,
+            0x20A1A5C,
+            0x20A1AE8,
+            0x20A1BB0,
+            0x20A1C7C,
+            0x20A1D90,
+            0x20A1F20,
+            0x20A20B0,
+            0x20A22B0,
+            0x20A2538,
+            0x20A27C0,
+            0x20A27D4,
+            0x20A27F4,
+            0x20A28BC,
+            0x20A2B44,
+            0x20A2C14,
+            0x20A2C84,
+            0x20A2C88,
+            0x20A2D08,
+            0x20A3B40,
+            0x20A3B6C,
+            0x20A3B9C,
+            0x20A3BAC,
+            0x20A3BDC,
+            0x20A3BEC,
+            0x20A3CAC,
+            0x20A3CB2,
+            0x20A3CC8,
+            0x20A3CE4,
+            0x20A3CF4,
+            0x20A3D14,
+            0x20A3D3E,
+            0x20A3D6C,
+            0x20A3DAC,
+            0x20A3EA4,
+            0x20A46EC,
+            0x20A5488,
+            0x20A68BC,
+            0x20A68C8,
+            0x20A6910,
+            0x20A7FF0,
+            0x20A9218,
+            0x20A9228,
+            0x20A9248,
+            0x20A92B8,
+            0x20A92D0,
+            0x20A92E8,
+            0x20A9300,
+            0x20A9318,
+            0x20A9330,
+            0x20A9348,
+            0x20A9360,
+            0x20A9378,
+            0x20A9390,
+            0x20A93B0,
+            0x20A93D0,
+            0x20A93E0,
+            0x20A94D0,
+            0x20A9FA0,
+            0x20A9FB0,
+            0x20ADFB0,
+            0x20AE0B4,
+            0x20AE0C4,
+            0x20AE924,
+            0x20AEF00,
+            0x20AEF2C,
+            0x20AF230,
+            0x20AF234,
+            0x20AF238,
+            0x20AF698,
+            0x20AF69C,
+            0x20AF6A0,
+            0x20AF6B8,
+            0x20AF6B8,
+            0x20AF6C0,
+            0x20AF6DC,
+            0x20AF6E4,
+            0x20AFC68,
+            0x20AFC80,
+            0x20AFCC4,
+            0x20AFCE8,
+            0x20AFCF8,
+            0x20AFDFC,
+            0x20AFEF8,
+            0x20AFEFC,
+            0x20AFEFE,
+            0x20AFF70,
+            0x20AFF74,
+            0x20AFF78,
+            0x20B0948,
+            0x20B09D8,
+            0x20B0A48,
+            0x20B0A60,
+            0x20B0A64,
+            0x20B0A68,
+            0x20B0A6C,
+            0x20B0A70,
+            0x20B0A74,
+            0x20B0A78,
+            0x20B0A7C,
+            0x20B0A98,
+            0x20B0B90,
+            0x20B0F50,
+            0x20B1050,
+            0x20B1250,
+            0x20B2B94,
+            0x20B2B98,
+            0x2011810,
+            0x2020C94,
+            0x2020C98,
+            0x2048880,
+            0x20488F0,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0x800,
+            0xCC,
+            0x4,
+            0x4,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0xFFFFFFFF,
+            0x4,
+            0x4,
+            0x1000,
+            0x2000,
+            0x4,
+            0x1C,
+            0x18,
+            0xC,
+            0x14,
+            0x4,
+            0x8,
+            0x4,
+            0x14,
+            0x14,
+            0x14,
+            0x14,
+            0x18,
+            0x18,
+            0x28,
+            0x3200,
+            0x40,
+            0x10,
+            0x10,
+            0x3C,
+            0x39,
+            0x39,
+            0x39,
+            0x778,
+            0x777,
+            0x360,
+            0x88,
+            0x16,
+            0x20,
+            0x18,
+            0x20,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x58,
+            0x40,
+            0x730,
+            0xC0,
+            0x14,
+            0x20,
+            0x24,
+            0x38,
+            0x100,
+            0x20,
+            0x100,
+            0x2D0,
+            0x4C,
+            0x4,
+            0x18,
+            0xCC,
+            0x16C,
+            0x19C,
+            0x4,
+            0xC64,
+            0xC8,
+            0x12F8,
+            0x190,
+            0xC00,
+            0x2,
+            0x2,
+            0x2,
+            0x4,
+            0x2,
+            0x2,
+            0x4,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x8,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x12,
+            0x18,
+            0x20,
+            0x20,
+            0x20,
+            0x28,
+            0x5C,
+            0x8A,
+            0xC8,
+            0xCC,
+            0x114,
+            0x190,
+            0x190,
+            0x200,
+            0x288,
+            0x288,
+            0x14,
+            0x20,
+            0xC8,
+            0x288,
+            0xD0,
+            0x70,
+            0x4,
+            0x80,
+            0x4B0,
+            0x2C,
+            0x30,
+            0x10,
+            0x30,
+            0x10,
+            0xB4,
+            0x6,
+            0x6,
+            0x1C,
+            0x10,
+            0x20,
+            0x2A,
+            0x2E,
+            0x40,
+            0xF8,
+            0x788,
+            0x21D0,
+            0x1434,
+            0xC,
+            0x48,
+            0x28F8,
+            0x1218,
+            0x10,
+            0x20,
+            0x20,
+            0x18,
+            0x18,
+            0x18,
+            0x18,
+            0x18,
+            0x18,
+            0x18,
+            0x18,
+            0x18,
+            0x20,
+            0x20,
+            0x10,
+            0xD4,
+            0x9B0,
+            0x10,
+            0x4974,
+            0x102,
+            0x10,
+            0x60,
+            0x2D4,
+            0x8,
+            0x2,
+            0x4,
+            0x4,
+            0x4,
+            0x1,
+            0x4,
+            0x18,
+            0xFFFFFFFF,
+            0x4,
+            0xC,
+            0xFFFFFFFF,
+            0x4,
+            0x4,
+            0x44,
+            0x20,
+            0xFFFFFFFF,
+            0xC,
+            0x3C,
+            0x1,
+            0x2,
+            0x2,
+            0x1,
+            0x4,
+            0x4,
+            0x68,
+            0x70,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x1C,
+            0x40,
+            0x1FC,
+            0x100,
+            0x200,
+            0x40,
+            0x1,
+            0x4,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            889,
+            890,
+            891,
+            892,
+            893,
+            894,
+            895,
+            896,
+            897,
+            898,
+            899,
+            900,
+            901,
+            902,
+            903,
+            904,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            905,
+            906,
+            907,
+            907,
+            908,
+            909,
+            910,
+            911,
+            912,
+            913,
+            266,
+            914,
+            915,
+            916,
+            917,
+            918,
+            919,
+            920,
+            921,
+            922,
+            923,
+            924,
+            925,
+            926,
+            927,
+            928,
+            929,
+            930,
+            931,
+            932,
+            933,
+            934,
+            935,
+            936,
+            937,
+            938,
+            939,
+            940,
+            941,
+            942,
+            943,
+            944,
+            945,
+            946,
+            266,
+            947,
+            948,
+            949,
+            950,
+            266,
+            266,
+            951,
+            266,
+            952,
+            953,
+            954,
+            955,
+            956,
+            957,
+            958,
+            959,
+            960,
+            961,
+            962,
+            963,
+            964,
+            266,
+            266,
+            965,
+            966,
+            967,
+            968,
+            969,
+            970,
+            971,
+            972,
+            973,
+            974,
+            975,
+            976,
+            977,
+            978,
+            979,
+            980,
+            981,
+            982,
+            983,
+            984,
+            985,
+            986,
+            987,
+            988,
+            989,
+            990,
+            990,
+            991,
+            992,
+            993,
+            994,
+            1,
+            995,
+            266,
+            996,
+            997,
+            266,
+            266,
+            998,
+            266,
+            998,
+            266,
+            999,
+            1000,
+            1001,
+            1002,
+            1003,
+            1004,
+            1005,
+            1006,
+            1007,
+            1008,
+            266,
+            1009,
+            1010,
+            1011,
+            266,
+            1012,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1013,
+            1014,
+            1,
+            1015,
+            1016,
+            1,
+            1,
+            1017,
+            1018,
+            1019,
+            1020,
+            1021,
+            1022,
+            1,
+            1023,
+            1024,
+            1025,
+            1026,
+            1027,
+            1028,
+            1029,
+            1030,
+            1031,
+            1032,
+            1025,
+            1033,
+            1034,
+            1035,
+            1036,
+            1037,
+            1038,
+            1039,
+            1040,
+            1041,
+            1042,
+            1043,
+            1044,
+            1045,
+            1046,
+            1047,
+            1048,
+            1049,
+            266,
+            1050,
+            1051,
+            1052,
+            1053,
+            1054,
+            1,
+            1,
+            1,
+            1055,
+            1056,
+            1057,
+            1058,
+            1059,
+        ),
+    ),
+    c_types=(
+        "",
+        "struct start_module_params*",
+        "uint32_t",
+        "int",
+        "enum damage_source_non_move",
+        "enum damage_source_non_move",
+        "enum item_id",
+        "uint32_t",
+        "uint32_t",
+        "uint32_t",
+        "struct window_list*",
+        "struct script_var_value_table*",
+        "uint32_t",
+        "uint32_t",
+        "uint32_t",
+        "fx16_12[2048]",
+        "undefined[0]",
+        "char[4]",
+        "char[28]",
+        "char[24]",
+        "char[12]",
+        "char[20]",
+        "char[4]",
+        "char[8]",
+        "char[4]",
+        "char[20]",
+        "char[20]",
+        "char[20]",
+        "char[20]",
+        "char[24]",
+        "char[24]",
+        "char[40]",
+        "",
+        "",
+        "enum item_id[4]",
+        "enum item_id[4]",
+        "struct exclusive_item_stat_boost_entry[15]",
+        "",
+        "",
+        "",
+        "struct exclusive_item_effect_entry[956]",
+        "",
+        "",
+        "struct item_id_16[17][4]",
+        "struct move_id_16[11]",
+        "struct move_id_16[16]",
+        "int[6]",
+        "int[8]",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct partner_talk_kind_table_entry[11]",
+        "struct script_local_var_table",
+        "struct script_var_table",
+        "struct portrait_layout[32]",
+        "char[20]",
+        "uint8_t[32]",
+        "uint8_t[36]",
+        "",
+        "",
+        "",
+        "uint8_t[256]",
+        "struct dungeon_data_list_entry[180]",
+        "struct monster_id_16[38]",
+        "",
+        "int16_t[12]",
+        "int16_t[102]",
+        "struct dungeon_return_status[91]",
+        "struct status_description[103]",
+        "",
+        "",
+        "struct mission_floors_forbidden[100]",
+        "",
+        "undefined*[100]",
+        "struct dungeon_restriction[256]",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int32_t",
+        "int16_t",
+        "int16_t",
+        "int32_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "fx32_8",
+        "int16_t[2]",
+        "fx32_8",
+        "fx32_8",
+        "int16_t[4]",
+        "int16_t[2]",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "struct forbidden_forgot_move_entry[3]",
+        "int16_t[12]",
+        "int16_t[16]",
+        "int16_t[16]",
+        "int16_t[16]",
+        "int[10]",
+        "struct version_exclusive_monster[23]",
+        "int16_t[69]",
+        "struct secondary_terrain_type_8[200]",
+        "struct monster_id_16[102]",
+        "int32_t[69]",
+        "uint8_t[400]",
+        "int[100]",
+        "",
+        "int16_t[18][18]",
+        "int16_t[18][18]",
+        "uint32_t[5]",
+        "uint32_t[8]",
+        "struct monster_id_16[100]",
+        "struct guest_monster[18]",
+        "struct rankup_table_entry[13]",
+        "struct monster_id_16[56]",
+        "",
+        "enum monster_id[28]",
+        "struct monster_sprite_data_entry[600]",
+        "",
+        "",
+        "int16_t[8]",
+        "",
+        "int16_t[8]",
+        "",
+        "struct dungeon_unlock_entry[3]",
+        "struct item_id_16[3]",
+        "",
+        "",
+        "",
+        "struct monster_id_16[21]",
+        "struct item_id_16[23]",
+        "int[16]",
+        "struct monster_id_16[124]",
+        "int16_t[964]",
+        "",
+        "struct script_level[0]",
+        "",
+        "struct monster_id_16[18][2]",
+        "",
+        "struct script_entity[386]",
+        "struct window_params",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct window_params",
+        "struct dungeon_id_8[212]",
+        "struct map_marker[310]",
+        "struct dse_voice_update_flags",
+        "struct trig_values[4096]",
+        "fx16_14[129]",
+        "int16_t[8]",
+        "int16_t[48]",
+        "",
+        "struct mem_arena_getters",
+        "uint16_t",
+        "enum overlay_group_id",
+        "enum overlay_group_id",
+        "enum overlay_group_id",
+        "bool",
+        "struct pack_file_opened*",
+        "char*[6]",
+        "",
+        "struct item*",
+        "void*[3]",
+        "",
+        "struct move_data_table*",
+        "struct wan_table*",
+        "struct render_3d_global",
+        "render_3d_element_64_fn_t[8]",
+        "",
+        "int16_t[6]",
+        "int16_t[30]",
+        "bool",
+        "struct monster_id_16",
+        "struct monster_id_16",
+        "uint8_t",
+        "struct global_progress*",
+        "struct adventure_log*",
+        "void*[26]",
+        "enum monster_id*[28]",
+        "struct team_member_table*",
+        "undefined*",
+        "int",
+        "undefined*",
+        "int",
+        "undefined*",
+        "int",
+        "undefined*",
+        "char*[7]",
+        "char*[16]",
+        "void*[127]",
+        "int16_t[128]",
+        "int32_t[128]",
+        "sound_lfo_waveform_callback[16]",
+        "bool",
+        "uint32_t",
+        "struct data_processing_instruction",
+        "struct data_processing_instruction",
+        "struct data_processing_instruction",
+        "struct data_processing_instruction",
+        "struct data_processing_instruction",
+    ),
+    multi={
+        7: ((0xE7BC, 0xE860), (0x200E7BC, 0x200E860)),
+        11: (
+            (0x4B2F8, 0x4B4E4, 0x4C42C, 0x4C484),
+            (0x204B2F8, 0x204B4E4, 0x204C42C, 0x204C484),
+        ),
+        14: ((0x55238, 0x5564C), (0x2055238, 0x205564C)),
+    },
+)
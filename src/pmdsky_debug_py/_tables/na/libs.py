@@ -0,0 +1,2183 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the libs section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "DseDriver_LoadDefaultSettings",
+        "DseDriver_IsSettingsValid",
+        "DseDriver_ConfigureHeap",
+        "DseDriver_Init",
+        "Dse_SetError",
+        "Dse_SetError2",
+        "DseUtil_ByteSwap32",
+        "SoundUtil_GetRandomNumber",
+        "DseMem_Init",
+        "DseMem_Quit",
+        "DseMem_AllocateUser",
+        "DseMem_Allocate",
+        "DseMem_AllocateThreadStack",
+        "DseMem_Free",
+        "DseMem_Clear",
+        "DseFile_CheckHeader",
+        "DseSwd_SysInit",
+        "DseSwd_SysQuit",
+        "DseSwd_SampleLoaderMain",
+        "DseSwd_MainBankDummyCallback",
+        "DseSwd_LoadMainBank",
+        "DseSwd_LoadBank",
+        "DseSwd_IsBankLoading",
+        "DseSwd_LoadWaves",
+        "DseSwd_LoadWavesInternal",
+        "DseSwd_Unload",
+        "ReadWaviEntry",
+        "DseSwd_GetInstrument",
+        "DseSwd_GetNextSplitInRange",
+        "DseSwd_GetMainBankById",
+        "DseSwd_GetBankById",
+        "DseSwd_InitMainBankFileReader",
+        "DseSwd_OpenMainBankFileReader",
+        "DseSwd_CloseMainBankFileReader",
+        "DseSwd_ReadMainBank",
+        "DseBgm_DefaultSignalCallback",
+        "DseBgm_Load",
+        "DseBgm_Unload",
+        "DseBgm_SetSignalCallback",
+        "DseBgm_IsPlaying",
+        "ResumeBgm",
+        "DseBgm_Stop",
+        "DseBgm_StopAll",
+        "DseBgm_SetFades",
+        "DseSequence_Start",
+        "DseSequence_PauseList",
+        "DseSequence_SetFades",
+        "DseSequence_GetParameter",
+        "DseSequence_GetSmallestNumLoops",
+        "DseSequence_Reset",
+        "DseSequence_Stop",
+        "FindSmdlSongChunk",
+        "DseSequence_LoadSong",
+        "DseSequence_GetById",
+        "DseSequence_AllocateNew",
+        "DseSequence_Unload",
+        "DseSequence_InitTracks",
+        "DseBgm_SysSetupNoteList",
+        "DseSe_SysReset",
+        "DseSe_Load",
+        "DseSe_Unload",
+        "DseSe_GetUsedBankIDs",
+        "DseSe_HasPlayingInstances",
+        "DseSe_Play",
+        "DseSe_GetEffectSong",
+        "DseSe_CheckTooManyInstances",
+        "DseSe_CheckTooManyInstancesInGroup",
+        "DseSe_GetBestSeqAllocation",
+        "DseSe_GetById",
+        "DseSe_Stop",
+        "DseSe_StopAll",
+        "DseSe_StopSeq",
+        "FlushChannels",
+        "DseDriver_StartMainThread",
+        "DseDriver_StartTickTimer",
+        "DseDriver_NotifyTick",
+        "DseDriver_Main",
+        "DseSequence_TickNotes",
+        "ParseDseEvent",
+        "UpdateSequencerTracks",
+        "DseSequence_TickFades",
+        "DseTrackEvent_Invalid",
+        "DseTrackEvent_WaitSame",
+        "DseTrackEvent_WaitDelta",
+        "DseTrackEvent_Wait8",
+        "DseTrackEvent_Wait16",
+        "DseTrackEvent_Wait24",
+        "DseTrackEvent_WaitUntilFadeout",
+        "DseTrackEvent_EndTrack",
+        "DseTrackEvent_MainLoopBegin",
+        "DseTrackEvent_SubLoopBegin",
+        "DseTrackEvent_SubLoopEnd",
+        "DseTrackEvent_SubLoopBreakOnLastIteration",
+        "DseTrackEvent_SetOctave",
+        "DseTrackEvent_OctaveDelta",
+        "DseTrackEvent_SetBpm",
+        "DseTrackEvent_SetBpm2",
+        "DseTrackEvent_SetBank",
+        "DseTrackEvent_SetBankMsb",
+        "DseTrackEvent_SetBankLsb",
+        "DseTrackEvent_Dummy1Byte",
+        "DseTrackEvent_SetInstrument",
+        "DseTrackEvent_SongVolumeFade",
+        "DseTrackEvent_RestoreEnvelopeDefaults",
+        "DseTrackEvent_SetEnvelopeAttackBegin",
+        "DseTrackEvent_SetEnvelopeAttackTime",
+        "DseTrackEvent_SetEnvelopeHoldTime",
+        "DseTrackEvent_SetEnvelopeDecayTimeAndSustainLevel",
+        "DseTrackEvent_SetEnvelopeSustainTime",
+        "DseTrackEvent_SetEnvelopeReleaseTime",
+        "DseTrackEvent_SetNoteDurationMultiplier",
+        "DseTrackEvent_ForceLfoEnvelopeLevel",
+        "DseTrackEvent_SetHoldNotes",
+        "DseTrackEvent_SetFlagBit1Unknown",
+        "DseTrackEvent_SetOptionalVolume",
+        "DseTrackEvent_Dummy2Bytes",
+        "DseTrackEvent_SetTuning",
+        "DseTrackEvent_TuningDeltaCoarse",
+        "DseTrackEvent_TuningDeltaFine",
+        "DseTrackEvent_TuningDeltaFull",
+        "DseTrackEvent_TuningFade",
+        "DseTrackEvent_SetNoteRandomRegion",
+        "DseTrackEvent_SetTuningJitterAmplitude",
+        "DseTrackEvent_SetKeyBend",
+        "DseTrackEvent_SetUnknown2",
+        "DseTrackEvent_SetKeyBendRange",
+        "DseTrackEvent_SetupKeyBendLfo",
+        "DseTrackEvent_SetupKeyBendLfoEnvelope",
+        "DseTrackEvent_UseKeyBendLfo",
+        "DseTrackEvent_SetVolume",
+        "DseTrackEvent_VolumeDelta",
+        "DseTrackEvent_VolumeFade",
+        "DseTrackEvent_SetExpression",
+        "DseTrackEvent_SetupVolumeLfo",
+        "DseTrackEvent_SetupVolumeLfoEnvelope",
+        "DseTrackEvent_UseVolumeLfo",
+        "DseTrackEvent_SetPan",
+        "DseTrackEvent_PanDelta",
+        "DseTrackEvent_PanFade",
+        "DseTrackEvent_SetupPanLfo",
+        "DseTrackEvent_SetupPanLfoEnvelope",
+        "DseTrackEvent_UsePanLfo",
+        "DseTrackEvent_SetupLfo",
+        "DseTrackEvent_SetupLfoEnvelope",
+        "DseTrackEvent_SetLfoParameter",
+        "DseTrackEvent_UseLfo",
+        "DseTrackEvent_Signal",
+        "DseTrackEvent_Dummy2Bytes2",
+        "DseSynth_Reset",
+        "DseSynth_AllocateNew",
+        "DseSynth_Unload",
+        "DseSynth_ClearHeldNotes",
+        "DseSynth_ResetAndSetBankAndSequence",
+        "DseSynth_StopChannels",
+        "DseSynth_ResetAllVoiceTimersAndVolumes",
+        "DseSynth_RestoreHeldNotes",
+        "DseSynth_SetGlobalVolumeIndex",
+        "DseSynth_SetBend",
+        "DseSynth_SetVolume",
+        "DseSynth_SetPan",
+        "DseSynth_SetBankAndSequence",
+        "DseChannel_Init",
+        "DseChannel_DeallocateVoices",
+        "DseChannel_ResetTimerAndVolumeForVoices",
+        "DseChannel_SetBank",
+        "DseChannel_SetInstrument",
+        "DseChannel_SetLfoConstEnvelopeLevel",
+        "DseChannel_SetKeyBend",
+        "DseChannel_AllocateNote",
+        "DseChannel_ReleaseNoteInternal",
+        "DseChannel_ChangeNote",
+        "DseChannel_ReleaseNote",
+        "DseVoice_PlayNote",
+        "DseVoice_ReleaseNote",
+        "DseVoice_UpdateParameters",
+        "DseVoice_ResetAll",
+        "DseVoice_ResetHW",
+        "UpdateChannels",
+        "DseVoice_Cleanup",
+        "DseVoice_Allocate",
+        "DseVoice_Start",
+        "DseVoice_ReleaseHeld",
+        "DseVoice_Release",
+        "DseVoice_Deallocate",
+        "DseVoice_FlagForActivation",
+        "DseVoice_FlagForDeactivation",
+        "DseVoice_CountNumActiveInChannel",
+        "DseVoice_UpdateHardware",
+        "SoundEnvelope_Reset",
+        "SoundEnvelopeParameters_Reset",
+        "SoundEnvelopeParameters_CheckValidity",
+        "SoundEnvelope_SetParameters",
+        "SoundEnvelope_SetSlide",
+        "UpdateTrackVolumeEnvelopes",
+        "SoundEnvelope_Release",
+        "SoundEnvelope_Stop",
+        "SoundEnvelope_ForceVolume",
+        "SoundEnvelope_Stop2",
+        "SoundEnvelope_Tick",
+        "SoundLfoBank_Reset",
+        "SoundLfoBank_Set",
+        "SoundLfoBank_SetConstEnvelopes",
+        "SoundLfoBank_Tick",
+        "SoundLfoWave_InvalidFunc",
+        "SoundLfoWave_HalfSquareFunc",
+        "SoundLfoWave_FullSquareFunc",
+        "SoundLfoWave_HalfTriangleFunc",
+        "SoundLfoWave_FullTriangleFunc",
+        "SoundLfoWave_SawFunc",
+        "SoundLfoWave_ReverseSawFunc",
+        "SoundLfoWave_HalfNoiseFunc",
+        "SoundLfoWave_FullNoiseFunc",
+        "Crypto_RC4Init",
+        "Mtx_LookAt",
+        "Mtx_OrthoW",
+        "FX_Div",
+        "FX_GetDivResultFx64c",
+        "FX_GetDivResult",
+        "FX_InvAsync",
+        "FX_DivAsync",
+        "FX_DivS32",
+        "FX_ModS32",
+        "Vec_DotProduct",
+        "Vec_CrossProduct",
+        "Vec_Normalize",
+        "Vec_Distance",
+        "FX_Atan2Idx",
+        "GX_Init",
+        "GX_HBlankIntr",
+        "GX_VBlankIntr",
+        "GX_DispOff",
+        "GX_DispOn",
+        "GX_SetGraphicsMode",
+        "Gxs_SetGraphicsMode",
+        "GXx_SetMasterBrightness",
+        "GX_InitGxState",
+        "EnableVramBanksInSetDontSave",
+        "GX_SetBankForBg",
+        "GX_SetBankForObj",
+        "GX_SetBankForBgExtPltt",
+        "GX_SetBankForObjExtPltt",
+        "GX_SetBankForTex",
+        "GX_SetBankForTexPltt",
+        "GX_SetBankForClearImage",
+        "GX_SetBankForArm7",
+        "GX_SetBankForLcdc",
+        "GX_SetBankForSubBg",
+        "GX_SetBankForSubObj",
+        "GX_SetBankForSubBgExtPltt",
+        "GX_SetBankForSubObjExtPltt",
+        "EnableVramBanksInSet",
+        "GX_ResetBankForBgExtPltt",
+        "GX_ResetBankForObjExtPltt",
+        "GX_ResetBankForTex",
+        "GX_ResetBankForTexPltt",
+        "GX_ResetBankForSubBgExtPltt",
+        "GX_ResetBankForSubObjExtPltt",
+        "DisableBankForX",
+        "GX_DisableBankForBg",
+        "GX_DisableBankForObj",
+        "GX_DisableBankForBgExtPltt",
+        "GX_DisableBankForObjExtPltt",
+        "GX_DisableBankForTex",
+        "GX_DisableBankForTexPltt",
+        "GX_DisableBankForClearImage",
+        "GX_DisableBankForArm7",
+        "GX_DisableBankForLcdc",
+        "GX_DisableBankForSubBg",
+        "GX_DisableBankForSubObj",
+        "GX_DisableBankForSubBgExtPltt",
+        "GX_DisableBankForSubObjExtPltt",
+        "G2_GetBG0ScrPtr",
+        "G2S_GetBG0ScrPtr",
+        "G2_GetBG1ScrPtr",
+        "G2S_GetBG1ScrPtr",
+        "G2_GetBG2ScrPtr",
+        "G2_GetBG3ScrPtr",
+        "G2_GetBG0CharPtr",
+        "G2S_GetBG0CharPtr",
+        "G2_GetBG1CharPtr",
+        "G2S_GetBG1CharPtr",
+        "G2_GetBG2CharPtr",
+        "G2_GetBG3CharPtr",
+        "G2x_SetBlendAlpha",
+        "G2x_SetBlendBrightness",
+        "G2x_ChangeBlendBrightness",
+        "G3_LoadMtx44",
+        "G3_LoadMtx43",
+        "G3_MultMtx43",
+        "G3X_Init",
+        "G3X_Reset",
+        "G3X_ClearFifo",
+        "G3X_InitMtxStack",
+        "G3X_ResetMtxStack",
+        "G3X_SetClearColor",
+        "G3X_InitTable",
+        "G3X_GetMtxStackLevelPV",
+        "G3X_GetMtxStackLevelPJ",
+        "GXi_NopClearFifo128",
+        "G3i_OrthoW",
+        "G3i_LookAt",
+        "GX_LoadBgPltt",
+        "Gxs_LoadBgPltt",
+        "GX_LoadObjPltt",
+        "Gxs_LoadObjPltt",
+        "GX_LoadOam",
+        "Gxs_LoadOam",
+        "GX_LoadObj",
+        "Gxs_LoadObj",
+        "GX_LoadBg0Scr",
+        "GX_LoadBg1Scr",
+        "Gxs_LoadBg1Scr",
+        "GX_LoadBg2Scr",
+        "GX_LoadBg3Scr",
+        "GX_LoadBg0Char",
+        "Gxs_LoadBg0Char",
+        "GX_LoadBg1Char",
+        "Gxs_LoadBg1Char",
+        "GX_LoadBg2Char",
+        "GX_LoadBg3Char",
+        "GX_BeginLoadBgExtPltt",
+        "GX_EndLoadBgExtPltt",
+        "GX_BeginLoadObjExtPltt",
+        "GX_EndLoadObjExtPltt",
+        "Gxs_BeginLoadBgExtPltt",
+        "Gxs_EndLoadBgExtPltt",
+        "Gxs_BeginLoadObjExtPltt",
+        "Gxs_EndLoadObjExtPltt",
+        "GX_BeginLoadTex",
+        "GX_LoadTex",
+        "GX_EndLoadTex",
+        "GX_BeginLoadTexPltt",
+        "GX_LoadTexPltt",
+        "GX_EndLoadTexPltt",
+        "GeomGxFifoSendMtx4x3",
+        "GX_SendFifo64B",
+        "OS_GetLockID",
+        "IncrementThreadCount",
+        "InsertThreadIntoList",
+        "StartThread",
+        "ThreadExit",
+        "SetThreadField0xB4",
+        "InitThread",
+        "GetTimer0Control",
+        "ClearIrqFlag",
+        "EnableIrqFlag",
+        "SetIrqFlag",
+        "EnableIrqFiqFlags",
+        "SetIrqFiqFlags",
+        "GetIrqFlag",
+        "GetProcessorMode",
+        "GetDsFirmwareUserSettings",
+        "CountLeadingZeros",
+        "WaitForever2",
+        "WaitForInterrupt",
+        "ArrayFill16",
+        "ArrayCopy16",
+        "ArrayFill32",
+        "ArrayCopy32",
+        "ArrayFill32Fast",
+        "ArrayCopy32Fast",
+        "MemsetFast",
+        "MemcpyFast",
+        "AtomicExchange",
+        "FileInit",
+        "GetOverlayInfo",
+        "LoadOverlayInternal",
+        "InitOverlay",
+        "abs",
+        "mbtowc",
+        "TryAssignByte",
+        "TryAssignByteWrapper",
+        "wcstombs",
+        "memcpy",
+        "memmove",
+        "memset",
+        "memchr",
+        "memcmp",
+        "memset_internal",
+        "__vsprintf_internal_slice",
+        "TryAppendToSlice",
+        "__vsprintf_internal",
+        "vsprintf",
+        "snprintf",
+        "sprintf",
+        "strlen",
+        "strcpy",
+        "strncpy",
+        "strcat",
+        "strncat",
+        "strcmp",
+        "strncmp",
+        "strchr",
+        "strcspn",
+        "strstr",
+        "wcslen",
+        "_dadd",
+        "_d2f",
+        "_ll_ufrom_d",
+        "_dflt",
+        "_dfltu",
+        "_dmul",
+        "_dsqrt",
+        "_dsub",
+        "_fadd",
+        "_dgeq",
+        "_dleq",
+        "_dls",
+        "_deq",
+        "_dneq",
+        "_fls",
+        "_fdiv",
+        "_f2d",
+        "_ffix",
+        "_fflt",
+        "_ffltu",
+        "_fmul",
+        "sqrtf",
+        "_fsub",
+        "_ll_mod",
+        "_ll_sdiv",
+        "_ll_udiv",
+        "_ull_mod",
+        "_ll_mul",
+        "_s32_div_f",
+        "_u32_div_f",
+        "_u32_div_not_0_f",
+        "_drdiv",
+        "_ddiv",
+        "_fp_init",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xE8,
+            0x180,
+            0x264,
+            0x308,
+            0x77C,
+            0x7B0,
+            0x7EC,
+            0x81C,
+            0x844,
+            0x8B4,
+            0x8D0,
+            0x8E4,
+            0x9F4,
+            0xB3C,
+            0xBE4,
+            0xC44,
+            0xCC4,
+            0xD50,
+            0xD90,
+            0xDF0,
+            0xDF8,
+            0x1030,
+            0x1234,
+            0x1250,
+            0x1300,
+            0x140C,
+            0x1480,
+            0x14B8,
+            0x14F0,
+            0x1578,
+            0x15C8,
+            0x1618,
+            0x1628,
+            0x1654,
+            0x1664,
+            0x1728,
+            0x1730,
+            0x1834,
+            0x186C,
+            0x18CC,
+            0x18E4,
+            0x19C4,
+            0x1A04,
+            0x1A64,
+            0x1AA4,
+            0x1B34,
+            0x1C98,
+            0x1F8C,
+            0x2140,
+            0x2194,
+            0x22EC,
+            0x2410,
+            0x247C,
+            0x257C,
+            0x25C8,
+            0x2700,
+            0x2784,
+            0x27D4,
+            0x2848,
+            0x2940,
+            0x2AF4,
+            0x2B84,
+            0x2C58,
+            0x2D24,
+            0x2ED8,
+            0x2F20,
+            0x3028,
+            0x31EC,
+            0x3268,
+            0x32B4,
+            0x3408,
+            0x3474,
+            0x459C,
+            0x4D34,
+            0x4E04,
+            0x4EFC,
+            0x4F3C,
+            0x5088,
+            0x514C,
+            0x5310,
+            0x56AC,
+            0x5844,
+            0x5850,
+            0x585C,
+            0x5874,
+            0x5884,
+            0x58A0,
+            0x58C4,
+            0x58F0,
+            0x593C,
+            0x5944,
+            0x5984,
+            0x59C0,
+            0x59E8,
+            0x59F4,
+            0x5A08,
+            0x5A48,
+            0x5A88,
+            0x5AB4,
+            0x5AE4,
+            0x5B14,
+            0x5B1C,
+            0x5B64,
+            0x5BF0,
+            0x5C08,
+            0x5C28,
+            0x5C48,
+            0x5C68,
+            0x5C98,
+            0x5CB8,
+            0x5CD8,
+            0x5CE4,
+            0x5D00,
+            0x5D38,
+            0x5D48,
+            0x5D54,
+            0x5D5C,
+            0x5DDC,
+            0x5E64,
+            0x5EEC,
+            0x5F7C,
+            0x606C,
+            0x6094,
+            0x60AC,
+            0x60D8,
+            0x60F0,
+            0x60FC,
+            0x6154,
+            0x617C,
+            0x61A4,
+            0x6238,
+            0x62E8,
+            0x6344,
+            0x63D0,
+            0x642C,
+            0x6454,
+            0x647C,
+            0x64FC,
+            0x6590,
+            0x65EC,
+            0x6648,
+            0x6670,
+            0x6698,
+            0x66F0,
+            0x6724,
+            0x6860,
+            0x6894,
+            0x68C4,
+            0x7130,
+            0x71A8,
+            0x7278,
+            0x72E4,
+            0x7380,
+            0x73A8,
+            0x73D4,
+            0x742C,
+            0x7494,
+            0x757C,
+            0x7610,
+            0x76E0,
+            0x7774,
+            0x7804,
+            0x79B8,
+            0x7A3C,
+            0x7AB8,
+            0x7AF0,
+            0x7B84,
+            0x7BB8,
+            0x7C00,
+            0x7C90,
+            0x7D38,
+            0x7DC8,
+            0x7E04,
+            0x8078,
+            0x80BC,
+            0x8260,
+            0x8304,
+            0x83B4,
+            0x84A4,
+            0x8540,
+            0x86A8,
+            0x8704,
+            0x8784,
+            0x87C8,
+            0x88CC,
+            0x891C,
+            0x8954,
+            0x8980,
+            0x8B98,
+            0x8BAC,
+            0x8BC8,
+            0x8C1C,
+            0x8C80,
+            0x8D34,
+            0x8E00,
+            0x8E2C,
+            0x8E44,
+            0x8E64,
+            0x8E7C,
+            0x8FC4,
+            0x8FDC,
+            0x91D4,
+            0x9220,
+            0x92D4,
+            0x92E8,
+            0x9324,
+            0x936C,
+            0x93C0,
+            0x9424,
+            0x9460,
+            0x949C,
+            0x94E0,
+            0x9648,
+            0x9750,
+            0x9858,
+            0x9A60,
+            0x9A70,
+            0x9A94,
+            0x9ACC,
+            0x9AFC,
+            0x9B24,
+            0x9B60,
+            0x9B9C,
+            0x9BD8,
+            0x9C5C,
+            0x9D74,
+            0x9DF0,
+            0x9F9C,
+            0xA0E8,
+            0xA110,
+            0xA144,
+            0xA180,
+            0xA1C8,
+            0xA230,
+            0xA24C,
+            0xA274,
+            0xA2D4,
+            0xA38C,
+            0xA61C,
+            0xA76C,
+            0xA86C,
+            0xA918,
+            0xAAF0,
+            0xABD8,
+            0xAD0C,
+            0xADB8,
+            0xADD8,
+            0xAE80,
+            0xAEF0,
+            0xAF70,
+            0xAFF0,
+            0xB024,
+            0xB048,
+            0xB06C,
+            0xB080,
+            0xB094,
+            0xB0BC,
+            0xB0E4,
+            0xB1C4,
+            0xB1D8,
+            0xB1EC,
+            0xB210,
+            0xB234,
+            0xB248,
+            0xB25C,
+            0xB270,
+            0xB284,
+            0xB298,
+            0xB2AC,
+            0xB2C0,
+            0xB2E8,
+            0xB310,
+            0xB344,
+            0xB364,
+            0xB398,
+            0xB3B8,
+            0xB43C,
+            0xB4C0,
+            0xB4F4,
+            0xB514,
+            0xB548,
+            0xB568,
+            0xB5B8,
+            0xB610,
+            0xB62C,
+            0xB654,
+            0xB698,
+            0xB6B4,
+            0xB6D0,
+            0xB6EC,
+            0xB7F8,
+            0xB864,
+            0xB88C,
+            0xB924,
+            0xB9B4,
+            0xB9DC,
+            0xBA7C,
+            0xBAAC,
+            0xBADC,
+            0xBB70,
+            0xBBD4,
+            0xBC20,
+            0xBC74,
+            0xBCCC,
+            0xBD24,
+            0xBD7C,
+            0xBDD0,
+            0xBE28,
+            0xBE80,
+            0xBED8,
+            0xBF38,
+            0xBF98,
+            0xBFF8,
+            0xC058,
+            0xC0B8,
+            0xC118,
+            0xC178,
+            0xC1D8,
+            0xC238,
+            0xC298,
+            0xC2F8,
+            0xC398,
+            0xC3E0,
+            0xC428,
+            0xC46C,
+            0xC484,
+            0xC4C4,
+            0xC4DC,
+            0xC51C,
+            0xC578,
+            0xC6B8,
+            0xC704,
+            0xC738,
+            0xC7A4,
+            0xC7E8,
+            0xC80C,
+            0xCF54,
+            0xD078,
+            0xD1C0,
+            0xD488,
+            0xD584,
+            0xDBA4,
+            0xDBAC,
+            0xEE0C,
+            0xF6F8,
+            0xF70C,
+            0xF720,
+            0xF738,
+            0xF74C,
+            0xF764,
+            0xF770,
+            0xF930,
+            0xF9B4,
+            0xFB48,
+            0xFB58,
+            0x101E0,
+            0x10208,
+            0x1023C,
+            0x10258,
+            0x10280,
+            0x102DC,
+            0x10334,
+            0x103F0,
+            0x10570,
+            0x1330C,
+            0x13BC4,
+            0x13CC0,
+            0x13DE4,
+            0x1A484,
+            0x1B0E4,
+            0x1B11C,
+            0x1B130,
+            0x1B14C,
+            0x1B1C4,
+            0x1B1E4,
+            0x1B230,
+            0x1B244,
+            0x1B270,
+            0x1B2B0,
+            0x1CB9C,
+            0x1D3C0,
+            0x1D404,
+            0x1D46C,
+            0x1D484,
+            0x1D4AC,
+            0x1D5A0,
+            0x1D5BC,
+            0x1D684,
+            0x1D6D4,
+            0x1D704,
+            0x1D754,
+            0x1D868,
+            0x1D89C,
+            0x1D8D8,
+            0x1D998,
+            0x1F310,
+            0x21DF0,
+            0x22108,
+            0x2220C,
+            0x22298,
+            0x222D8,
+            0x22314,
+            0x22678,
+            0x2282C,
+            0x22BE0,
+            0x22E04,
+            0x22E9C,
+            0x22F40,
+            0x22FDC,
+            0x23068,
+            0x230F4,
+            0x2315C,
+            0x23514,
+            0x23598,
+            0x235CC,
+            0x23614,
+            0x2365C,
+            0x2383C,
+            0x2392C,
+            0x23BA4,
+            0x23BB4,
+            0x23D64,
+            0x23D70,
+            0x23DAC,
+            0x23DCC,
+            0x23FD8,
+            0x23FE0,
+            0x241BC,
+            0x241D4,
+            0x24718,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x206C1C0,
+            0x206C258,
+            0x206C33C,
+            0x206C3E0,
+            0x206C854,
+            0x206C888,
+            0x206C8C4,
+            0x206C8F4,
+            0x206C91C,
+            0x206C98C,
+            0x206C9A8,
+            0x206C9BC,
+            0x206CACC,
+            0x206CC14,
+            0x206CCBC,
+            0x206CD1C,
+            0x206CD9C,
+            0x206CE28,
+            0x206CE68,
+            0x206CEC8,
+            0x206CED0,
+            0x206D108,
+            0x206D30C,
+            0x206D328,
+            0x206D3D8,
+            0x206D4E4,
+            0x206D558,
+            0x206D590,
+            0x206D5C8,
+            0x206D650,
+            0x206D6A0,
+            0x206D6F0,
+            0x206D700,
+            0x206D72C,
+            0x206D73C,
+            0x206D800,
+            0x206D808,
+            0x206D90C,
+            0x206D944,
+            0x206D9A4,
+            0x206D9BC,
+            0x206DA9C,
+            0x206DADC,
+            0x206DB3C,
+            0x206DB7C,
+            0x206DC0C,
+            0x206DD70,
+            0x206E064,
+            0x206E218,
+            0x206E26C,
+            0x206E3C4,
+            0x206E4E8,
+            0x206E554,
+            0x206E654,
+            0x206E6A0,
+            0x206E7D8,
+            0x206E85C,
+            0x206E8AC,
+            0x206E920,
+            0x206EA18,
+            0x206EBCC,
+            0x206EC5C,
+            0x206ED30,
+            0x206EDFC,
+            0x206EFB0,
+            0x206EFF8,
+            0x206F100,
+            0x206F2C4,
+            0x206F340,
+            0x206F38C,
+            0x206F4E0,
+            0x206F54C,
+            0x2070674,
+            0x2070E0C,
+            0x2070EDC,
+            0x2070FD4,
+            0x2071014,
+            0x2071160,
+            0x2071224,
+            0x20713E8,
+            0x2071784,
+            0x207191C,
+            0x2071928,
+            0x2071934,
+            0x207194C,
+            0x207195C,
+            0x2071978,
+            0x207199C,
+            0x20719C8,
+            0x2071A14,
+            0x2071A1C,
+            0x2071A5C,
+            0x2071A98,
+            0x2071AC0,
+            0x2071ACC,
+            0x2071AE0,
+            0x2071B20,
+            0x2071B60,
+            0x2071B8C,
+            0x2071BBC,
+            0x2071BEC,
+            0x2071BF4,
+            0x2071C3C,
+            0x2071CC8,
+            0x2071CE0,
+            0x2071D00,
+            0x2071D20,
+            0x2071D40,
+            0x2071D70,
+            0x2071D90,
+            0x2071DB0,
+            0x2071DBC,
+            0x2071DD8,
+            0x2071E10,
+            0x2071E20,
+            0x2071E2C,
+            0x2071E34,
+            0x2071EB4,
+            0x2071F3C,
+            0x2071FC4,
+            0x2072054,
+            0x2072144,
+            0x207216C,
+            0x2072184,
+            0x20721B0,
+            0x20721C8,
+            0x20721D4,
+            0x207222C,
+            0x2072254,
+            0x207227C,
+            0x2072310,
+            0x20723C0,
+            0x207241C,
+            0x20724A8,
+            0x2072504,
+            0x207252C,
+            0x2072554,
+            0x20725D4,
+            0x2072668,
+            0x20726C4,
+            0x2072720,
+            0x2072748,
+            0x2072770,
+            0x20727C8,
+            0x20727FC,
+            0x2072938,
+            0x207296C,
+            0x207299C,
+            0x2073208,
+            0x2073280,
+            0x2073350,
+            0x20733BC,
+            0x2073458,
+            0x2073480,
+            0x20734AC,
+            0x2073504,
+            0x207356C,
+            0x2073654,
+            0x20736E8,
+            0x20737B8,
+            0x207384C,
+            0x20738DC,
+            0x2073A90,
+            0x2073B14,
+            0x2073B90,
+            0x2073BC8,
+            0x2073C5C,
+            0x2073C90,
+            0x2073CD8,
+            0x2073D68,
+            0x2073E10,
+            0x2073EA0,
+            0x2073EDC,
+            0x2074150,
+            0x2074194,
+            0x2074338,
+            0x20743DC,
+            0x207448C,
+            0x207457C,
+            0x2074618,
+            0x2074780,
+            0x20747DC,
+            0x207485C,
+            0x20748A0,
+            0x20749A4,
+            0x20749F4,
+            0x2074A2C,
+            0x2074A58,
+            0x2074C70,
+            0x2074C84,
+            0x2074CA0,
+            0x2074CF4,
+            0x2074D58,
+            0x2074E0C,
+            0x2074ED8,
+            0x2074F04,
+            0x2074F1C,
+            0x2074F3C,
+            0x2074F54,
+            0x207509C,
+            0x20750B4,
+            0x20752AC,
+            0x20752F8,
+            0x20753AC,
+            0x20753C0,
+            0x20753FC,
+            0x2075444,
+            0x2075498,
+            0x20754FC,
+            0x2075538,
+            0x2075574,
+            0x20755B8,
+            0x2075720,
+            0x2075828,
+            0x2075930,
+            0x2075B38,
+            0x2075B48,
+            0x2075B6C,
+            0x2075BA4,
+            0x2075BD4,
+            0x2075BFC,
+            0x2075C38,
+            0x2075C74,
+            0x2075CB0,
+            0x2075D34,
+            0x2075E4C,
+            0x2075EC8,
+            0x2076074,
+            0x20761C0,
+            0x20761E8,
+            0x207621C,
+            0x2076258,
+            0x20762A0,
+            0x2076308,
+            0x2076324,
+            0x207634C,
+            0x20763AC,
+            0x2076464,
+            0x20766F4,
+            0x2076844,
+            0x2076944,
+            0x20769F0,
+            0x2076BC8,
+            0x2076CB0,
+            0x2076DE4,
+            0x2076E90,
+            0x2076EB0,
+            0x2076F58,
+            0x2076FC8,
+            0x2077048,
+            0x20770C8,
+            0x20770FC,
+            0x2077120,
+            0x2077144,
+            0x2077158,
+            0x207716C,
+            0x2077194,
+            0x20771BC,
+            0x207729C,
+            0x20772B0,
+            0x20772C4,
+            0x20772E8,
+            0x207730C,
+            0x2077320,
+            0x2077334,
+            0x2077348,
+            0x207735C,
+            0x2077370,
+            0x2077384,
+            0x2077398,
+            0x20773C0,
+            0x20773E8,
+            0x207741C,
+            0x207743C,
+            0x2077470,
+            0x2077490,
+            0x2077514,
+            0x2077598,
+            0x20775CC,
+            0x20775EC,
+            0x2077620,
+            0x2077640,
+            0x2077690,
+            0x20776E8,
+            0x2077704,
+            0x207772C,
+            0x2077770,
+            0x207778C,
+            0x20777A8,
+            0x20777C4,
+            0x20778D0,
+            0x207793C,
+            0x2077964,
+            0x20779FC,
+            0x2077A8C,
+            0x2077AB4,
+            0x2077B54,
+            0x2077B84,
+            0x2077BB4,
+            0x2077C48,
+            0x2077CAC,
+            0x2077CF8,
+            0x2077D4C,
+            0x2077DA4,
+            0x2077DFC,
+            0x2077E54,
+            0x2077EA8,
+            0x2077F00,
+            0x2077F58,
+            0x2077FB0,
+            0x2078010,
+            0x2078070,
+            0x20780D0,
+            0x2078130,
+            0x2078190,
+            0x20781F0,
+            0x2078250,
+            0x20782B0,
+            0x2078310,
+            0x2078370,
+            0x20783D0,
+            0x2078470,
+            0x20784B8,
+            0x2078500,
+            0x2078544,
+            0x207855C,
+            0x207859C,
+            0x20785B4,
+            0x20785F4,
+            0x2078650,
+            0x2078790,
+            0x20787DC,
+            0x2078810,
+            0x207887C,
+            0x20788C0,
+            0x20788E4,
+            0x207902C,
+            0x2079150,
+            0x2079298,
+            0x2079560,
+            0x207965C,
+            0x2079C7C,
+            0x2079C84,
+            0x207AEE4,
+            0x207B7D0,
+            0x207B7E4,
+            0x207B7F8,
+            0x207B810,
+            0x207B824,
+            0x207B83C,
+            0x207B848,
+            0x207BA08,
+            0x207BA8C,
+            0x207BC20,
+            0x207BC30,
+            0x207C2B8,
+            0x207C2E0,
+            0x207C314,
+            0x207C330,
+            0x207C358,
+            0x207C3B4,
+            0x207C40C,
+            0x207C4C8,
+            0x207C648,
+            0x207F3E4,
+            0x207FC9C,
+            0x207FD98,
+            0x207FEBC,
+            0x208655C,
+            0x20871BC,
+            0x20871F4,
+            0x2087208,
+            0x2087224,
+            0x208729C,
+            0x20872BC,
+            0x2087308,
+            0x208731C,
+            0x2087348,
+            0x2087388,
+            0x2088C74,
+            0x2089498,
+            0x20894DC,
+            0x2089544,
+            0x208955C,
+            0x2089584,
+            0x2089678,
+            0x2089694,
+            0x208975C,
+            0x20897AC,
+            0x20897DC,
+            0x208982C,
+            0x2089940,
+            0x2089974,
+            0x20899B0,
+            0x2089A70,
+            0x208B3E8,
+            0x208DEC8,
+            0x208E1E0,
+            0x208E2E4,
+            0x208E370,
+            0x208E3B0,
+            0x208E3EC,
+            0x208E750,
+            0x208E904,
+            0x208ECB8,
+            0x208EEDC,
+            0x208EF74,
+            0x208F018,
+            0x208F0B4,
+            0x208F140,
+            0x208F1CC,
+            0x208F234,
+            0x208F5EC,
+            0x208F670,
+            0x208F6A4,
+            0x208F6EC,
+            0x208F734,
+            0x208F914,
+            0x208FA04,
+            0x208FC7C,
+            0x208FC8C,
+            0x208FE3C,
+            0x208FE48,
+            0x208FE84,
+            0x208FEA4,
+            0x20900B0,
+            0x20900B8,
+            0x2090294,
+            0x20902AC,
+            0x20907F0,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1,
+            1093,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1094,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1095,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            330,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1096,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            266,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1097,
+            1098,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1099,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1100,
+            1101,
+            1101,
+            1102,
+            1103,
+            1104,
+            1100,
+            1100,
+            1105,
+            1100,
+            1106,
+            1107,
+            1108,
+            1109,
+            1110,
+            1111,
+            1112,
+            1112,
+            1112,
+            1112,
+            1112,
+            1112,
+            1112,
+            1112,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1113,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1114,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1115,
+            1116,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1117,
+            1,
+            1,
+            1118,
+            1119,
+            1120,
+            1121,
+            1122,
+            1123,
+            1124,
+            1125,
+            1126,
+            1127,
+            1128,
+            1129,
+            1130,
+            1131,
+            1132,
+            1133,
+            1134,
+            1135,
+            1136,
+            1137,
+            1138,
+            1139,
+            1140,
+            1141,
+            1142,
+            1143,
+            1144,
+            1145,
+            1146,
+            1147,
+            1148,
+            1149,
+            1150,
+            1151,
+            1152,
+            1153,
+            1154,
+            1155,
+            1156,
+            1157,
+            1158,
+            1159,
+            1160,
+            1161,
+            1162,
+            1163,
+            1164,
+            1165,
+            1166,
+            1167,
+            1168,
+            1169,
+            1170,
+            1171,
+            1172,
+            1173,
+            1174,
+            1175,
+            1176,
+            1177,
+            1178,
+            1179,
+            1180,
+            1181,
+            1182,
+            1183,
+            1184,
+            1185,
+            1186,
+            1187,
+            1188,
+            1189,
+            1190,
+            1191,
+            1192,
+            1193,
+            1194,
+            1195,
+            1196,
+            1197,
+            1198,
+            1199,
+            1200,
+            1201,
+            1202,
+            1203,
+            1204,
+            1205,
+            1206,
+            1207,
+            1208,
+            1209,
+            1210,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
@@ -0,0 +1,1668 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the move_effects section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "DoMoveDamage",
+        "DoMoveIronTail",
+        "DoMoveDamageMultihitUntilMiss",
+        "DoMoveYawn",
+        "DoMoveSleep",
+        "DoMoveNightmare",
+        "DoMoveMorningSun",
+        "DoMoveVitalThrow",
+        "DoMoveDig",
+        "DoMoveSweetScent",
+        "DoMoveCharm",
+        "DoMoveRainDance",
+        "DoMoveHail",
+        "DoMoveHealStatus",
+        "DoMoveBubble",
+        "DoMoveEncore",
+        "DoMoveRage",
+        "DoMoveSuperFang",
+        "DoMovePainSplit",
+        "DoMoveTorment",
+        "DoMoveStringShot",
+        "DoMoveSwagger",
+        "DoMoveSnore",
+        "DoMoveScreech",
+        "DoMoveDamageCringe30",
+        "DoMoveWeatherBall",
+        "DoMoveWhirlpool",
+        "DoMoveFakeTears",
+        "DoMoveSpite",
+        "DoMoveFocusEnergy",
+        "DoMoveSmokescreen",
+        "DoMoveMirrorMove",
+        "DoMoveOverheat",
+        "DoMoveAuroraBeam",
+        "DoMoveMemento",
+        "DoMoveOctazooka",
+        "DoMoveFlatter",
+        "DoMoveWillOWisp",
+        "DoMoveReturn",
+        "DoMoveGrudge",
+        "DoMoveCounter",
+        "DoMoveDamageBurn10FlameWheel",
+        "DoMoveDamageBurn10",
+        "DoMoveExpose",
+        "DoMoveDoubleTeam",
+        "DoMoveGust",
+        "DoMoveBoostDefense1",
+        "DoMoveParalyze",
+        "DoMoveBoostAttack1",
+        "DoMoveRazorWind",
+        "DoMoveBide",
+        "DoMoveBideUnleash",
+        "DoMoveCrunch",
+        "DoMoveDamageCringe20",
+        "DoMoveDamageParalyze20",
+        "DoMoveEndeavor",
+        "DoMoveFacade",
+        "DoMoveDamageLowerSpeed20",
+        "DoMoveBrickBreak",
+        "DoMoveDamageLowerSpeed100",
+        "DoMoveFocusPunch",
+        "DoMoveDamageDrain",
+        "DoMoveReversal",
+        "DoMoveSmellingSalt",
+        "DoMoveMetalSound",
+        "DoMoveTickle",
+        "DoMoveShadowHold",
+        "DoMoveHaze",
+        "DoMoveDamageMultihitFatigue",
+        "DoMoveDamageWeightDependent",
+        "DoMoveDamageBoostAllStats",
+        "DoMoveSynthesis",
+        "DoMoveBoostSpeed1",
+        "DoMoveRapidSpin",
+        "DoMoveSureShot",
+        "DoMoveCosmicPower",
+        "DoMoveSkyAttack",
+        "DoMoveDamageFreeze15",
+        "DoMoveMeteorMash",
+        "DoMoveEndure",
+        "DoMoveLowerSpeed1",
+        "DoMoveDamageConfuse10",
+        "DoMovePsywave",
+        "DoMoveDamageLowerDefensiveStatVariable",
+        "DoMovePsychoBoost",
+        "DoMoveUproar",
+        "DoMoveWaterSpout",
+        "DoMovePsychUp",
+        "DoMoveDamageWithRecoil",
+        "EntityIsValidMoveEffects",
+        "DoMoveRecoverHp",
+        "DoMoveEarthquake",
+        "GetNaturePowerVariant",
+        "DoMoveNaturePower",
+        "DoMoveDamageParalyze10",
+        "DoMoveSelfdestruct",
+        "DoMoveShadowBall",
+        "DoMoveCharge",
+        "DoMoveThunderbolt",
+        "DoMoveMist",
+        "DoMoveFissure",
+        "DoMoveDamageCringe10",
+        "DoMoveSafeguard",
+        "DoMoveAbsorb",
+        "DefenderAbilityIsActiveMoveEffects",
+        "DoMoveSkillSwap",
+        "DoMoveSketch",
+        "DoMoveHeadbutt",
+        "DoMoveDoubleEdge",
+        "DoMoveSandstorm",
+        "DoMoveLowerAccuracy1",
+        "DoMoveDamagePoison40",
+        "DoMoveGrowth",
+        "DoMoveSacredFire",
+        "DoMoveOhko",
+        "DoMoveSolarBeam",
+        "DoMoveSonicBoom",
+        "DoMoveFly",
+        "DoMoveExplosion",
+        "DoMoveDive",
+        "DoMoveWaterfall",
+        "DoMoveDamageLowerAccuracy40",
+        "DoMoveStockpile",
+        "DoMoveTwister",
+        "DoMoveTwineedle",
+        "DoMoveRecoverHpTeam",
+        "DoMoveMinimize",
+        "DoMoveSeismicToss",
+        "DoMoveConfuse",
+        "DoMoveTaunt",
+        "DoMoveMoonlight",
+        "DoMoveHornDrill",
+        "DoMoveSwordsDance",
+        "DoMoveConversion",
+        "DoMoveConversion2",
+        "DoMoveHelpingHand",
+        "DoMoveBoostDefense2",
+        "DoMoveWarp",
+        "DoMoveThundershock",
+        "DoMoveThunderWave",
+        "DoMoveZapCannon",
+        "DoMoveBlock",
+        "DoMovePoison",
+        "DoMoveToxic",
+        "DoMovePoisonFang",
+        "DoMoveDamagePoison18",
+        "DoMoveJumpKick",
+        "DoMoveBounce",
+        "DoMoveHiJumpKick",
+        "DoMoveTriAttack",
+        "DoMoveSwapItems",
+        "DoMoveTripleKick",
+        "DoMoveSport",
+        "DoMoveMudSlap",
+        "DoMoveDamageStealItem",
+        "DoMoveAmnesia",
+        "DoMoveNightShade",
+        "DoMoveGrowl",
+        "DoMoveSurf",
+        "DoMoveRolePlay",
+        "DoMoveSunnyDay",
+        "DoMoveLowerDefense1",
+        "DoMoveWish",
+        "DoMoveFakeOut",
+        "DoMoveSleepTalk",
+        "DoMovePayDay",
+        "DoMoveAssist",
+        "DoMoveRest",
+        "DoMoveIngrain",
+        "DoMoveSwallow",
+        "DoMoveCurse",
+        "DoMoveSuperpower",
+        "DoMoveSteelWing",
+        "DoMoveSpitUp",
+        "DoMoveDynamicPunch",
+        "DoMoveKnockOff",
+        "DoMoveSplash",
+        "DoMoveSetDamage",
+        "DoMoveBellyDrum",
+        "DoMoveLightScreen",
+        "DoMoveSecretPower",
+        "DoMoveDamageConfuse30",
+        "DoMoveBulkUp",
+        "DoMovePause",
+        "DoMoveFeatherDance",
+        "DoMoveBeatUp",
+        "DoMoveBlastBurn",
+        "DoMoveCrushClaw",
+        "DoMoveBlazeKick",
+        "DoMovePresent",
+        "DoMoveEruption",
+        "DoMoveTransform",
+        "DoMovePoisonTail",
+        "DoMoveBlowback",
+        "DoMoveCamouflage",
+        "DoMoveTailGlow",
+        "DoMoveDamageConstrict10",
+        "DoMovePerishSong",
+        "DoMoveWrap",
+        "DoMoveSpikes",
+        "DoMoveMagnitude",
+        "DoMoveMagicCoat",
+        "DoMoveProtect",
+        "DoMoveDefenseCurl",
+        "DoMoveDecoy",
+        "DoMoveMistBall",
+        "DoMoveDestinyBond",
+        "DoMoveMirrorCoat",
+        "DoMoveCalmMind",
+        "DoMoveHiddenPower",
+        "DoMoveMetalClaw",
+        "DoMoveAttract",
+        "DoMoveCopycat",
+        "DoMoveFrustration",
+        "DoMoveLeechSeed",
+        "DoMoveMetronome",
+        "DoMoveDreamEater",
+        "DoMoveSnatch",
+        "DoMoveRecycle",
+        "DoMoveReflect",
+        "DoMoveDragonRage",
+        "DoMoveDragonDance",
+        "DoMoveSkullBash",
+        "DoMoveDamageLowerSpecialDefense50",
+        "DoMoveStruggle",
+        "DoMoveRockSmash",
+        "DoMoveSeeTrap",
+        "DoMoveTakeaway",
+        "DoMoveRebound",
+        "DoMoveSwitchPositions",
+        "DoMoveStayAway",
+        "DoMoveCleanse",
+        "DoMoveSiesta",
+        "DoMoveTwoEdge",
+        "DoMoveNoMove",
+        "DoMoveScan",
+        "DoMovePowerEars",
+        "DoMoveTransfer",
+        "DoMoveSlowDown",
+        "DoMoveSearchlight",
+        "DoMovePetrify",
+        "DoMovePounce",
+        "DoMoveTrawl",
+        "DoMoveEscape",
+        "DoMoveDrought",
+        "DoMoveTrapBuster",
+        "DoMoveWildCall",
+        "DoMoveInvisify",
+        "DoMoveOneShot",
+        "DoMoveHpGauge",
+        "DoMoveVacuumCut",
+        "DoMoveReviver",
+        "DoMoveShocker",
+        "DoMoveEcho",
+        "DoMoveFamish",
+        "DoMoveOneRoom",
+        "DoMoveFillIn",
+        "DoMoveTrapper",
+        "DoMoveItemize",
+        "DoMoveHurl",
+        "DoMoveMobile",
+        "DoMoveSeeStairs",
+        "DoMoveLongToss",
+        "DoMovePierce",
+        "DoMoveHammerArm",
+        "DoMoveAquaRing",
+        "DoMoveGastroAcid",
+        "DoMoveHealingWish",
+        "DoMoveCloseCombat",
+        "DoMoveLuckyChant",
+        "DoMoveGuardSwap",
+        "DoMoveHealOrder",
+        "DoMoveHealBlock",
+        "DoMoveThunderFang",
+        "DoMoveDefog",
+        "DoMoveTrumpCard",
+        "DoMoveIceFang",
+        "DoMovePsychoShift",
+        "DoMoveEmbargo",
+        "DoMoveBrine",
+        "DoMoveNaturalGift",
+        "DoMoveGyroBall",
+        "DoMoveShadowForce",
+        "DoMoveGravity",
+        "DoMoveStealthRock",
+        "DoMoveChargeBeam",
+        "DoMoveDamageEatItem",
+        "DoMoveAcupressure",
+        "DoMoveMagnetRise",
+        "DoMoveToxicSpikes",
+        "DoMoveLastResort",
+        "DoMoveTrickRoom",
+        "DoMoveWorrySeed",
+        "DoMoveDamageHpDependent",
+        "DoMoveHeartSwap",
+        "DoMoveRoost",
+        "DoMovePowerSwap",
+        "DoMovePowerTrick",
+        "DoMoveFeint",
+        "DoMoveFlareBlitz",
+        "DoMoveDefendOrder",
+        "DoMoveFireFang",
+        "DoMoveLunarDance",
+        "DoMoveMiracleEye",
+        "DoMoveWakeUpSlap",
+        "DoMoveMetalBurst",
+        "DoMoveHeadSmash",
+        "DoMoveCaptivate",
+        "DoMoveLeafStorm",
+        "DoMoveDracoMeteor",
+        "DoMoveRockPolish",
+        "DoMoveNastyPlot",
+        "DoMoveTag0x1AB",
+        "DoMoveTag0x1A6",
+        "DoMoveTag0x1A7",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0x24,
+            0xA4,
+            0x104,
+            0x140,
+            0x17C,
+            0x1B4,
+            0x1F4,
+            0x204,
+            0x2C8,
+            0x2E8,
+            0x310,
+            0x36C,
+            0x3C8,
+            0x3E0,
+            0x44C,
+            0x460,
+            0x4A4,
+            0x55C,
+            0x648,
+            0x790,
+            0x7A8,
+            0x7E4,
+            0x888,
+            0x8B0,
+            0x91C,
+            0x990,
+            0xA18,
+            0xA4C,
+            0xAFC,
+            0xB0C,
+            0xB48,
+            0xB6C,
+            0xBD0,
+            0xC4C,
+            0xCB4,
+            0xD28,
+            0xD64,
+            0xE00,
+            0xEE4,
+            0xEF4,
+            0xF08,
+            0xF90,
+            0x1018,
+            0x1044,
+            0x1060,
+            0x10A0,
+            0xFFFFFFFF,
+            0x10D8,
+            0x10F8,
+            0x1188,
+            0x11CC,
+            0x1274,
+            0x12F4,
+            0x1360,
+            0x13CC,
+            0x148C,
+            0x14CC,
+            0x1538,
+            0x15A8,
+            0x160C,
+            0x1698,
+            0x17D8,
+            0x188C,
+            0x18F4,
+            0x1928,
+            0x1984,
+            0x1998,
+            0x19AC,
+            0x19F8,
+            0x1A44,
+            0x1B28,
+            0x1B68,
+            0x1B80,
+            0x1BEC,
+            0x1C24,
+            0x1C68,
+            0x1D34,
+            0x1D9C,
+            0x1E20,
+            0x1E30,
+            0x1E48,
+            0x1EB4,
+            0x1F18,
+            0x1FA0,
+            0x2010,
+            0x2020,
+            0x20D4,
+            0x2174,
+            0xFFFFFFFF,
+            0x2270,
+            0x22B4,
+            0x2314,
+            0x2350,
+            0x23AC,
+            0x2418,
+            0x2488,
+            0x2508,
+            0x2568,
+            0x25D4,
+            0x25E4,
+            0x26FC,
+            0x2768,
+            0x2778,
+            0xFFFFFFFF,
+            0x28D8,
+            0x29D4,
+            0x2B04,
+            0x2B70,
+            0x2C38,
+            0x2C94,
+            0x2CB4,
+            0x2D20,
+            0x2D40,
+            0x2DC8,
+            0x2EB4,
+            0x2F84,
+            0x3024,
+            0x30B4,
+            0x310C,
+            0x31D4,
+            0x3240,
+            0x32B4,
+            0x330C,
+            0x339C,
+            0x3434,
+            0x347C,
+            0x3498,
+            0x360C,
+            0x3624,
+            0x3638,
+            0x3678,
+            0x3774,
+            0x3794,
+            0x38A4,
+            0x38B4,
+            0x3918,
+            0x3938,
+            0x3950,
+            0x39BC,
+            0x3A30,
+            0x3A94,
+            0x3AA8,
+            0x3AC0,
+            0x3AD8,
+            0x3B44,
+            0x3BB0,
+            0x3CDC,
+            0x3DA8,
+            0x3ED4,
+            0x3F90,
+            0x41B8,
+            0x41F4,
+            0x4220,
+            0x428C,
+            0x4298,
+            0x42B8,
+            0x4358,
+            0x4388,
+            0x43C8,
+            0x4460,
+            0x44BC,
+            0x44EC,
+            0x44FC,
+            0x4568,
+            0x4580,
+            0x463C,
+            0x4654,
+            0x46C0,
+            0x46D0,
+            0x4728,
+            0x4764,
+            0x47EC,
+            0x4880,
+            0x48C8,
+            0x492C,
+            0x4B2C,
+            0x4E84,
+            0x4E94,
+            0x4F48,
+            0x4F58,
+            0x5130,
+            0x519C,
+            0x51E0,
+            0x5230,
+            0x5264,
+            0x5358,
+            0x53A4,
+            0x5424,
+            0x54AC,
+            0x55A8,
+            0x568C,
+            0x56D4,
+            0x5740,
+            0x5758,
+            0x5808,
+            0x5828,
+            0x58E4,
+            0x58F8,
+            0x5908,
+            0x5978,
+            0x5A00,
+            0x5A10,
+            0x5A20,
+            0x5A40,
+            0x5A60,
+            0x5AE0,
+            0x5B14,
+            0x5B24,
+            0x5B68,
+            0x5B80,
+            0x5C10,
+            0x5C84,
+            0x5D8C,
+            0x5E74,
+            0x5EA4,
+            0x5F04,
+            0x6074,
+            0x6084,
+            0x61B8,
+            0x61C8,
+            0x6268,
+            0x62A4,
+            0x6334,
+            0x63E4,
+            0x64BC,
+            0x6540,
+            0x6550,
+            0x6764,
+            0x6778,
+            0x67A0,
+            0x67B8,
+            0x68F4,
+            0x6930,
+            0x6A58,
+            0x6A6C,
+            0x6A7C,
+            0x6A8C,
+            0x6C54,
+            0x6C6C,
+            0x6C7C,
+            0x6C8C,
+            0x6CA0,
+            0x6CB0,
+            0x6D48,
+            0x6D58,
+            0x6F04,
+            0x6FD0,
+            0x6FE4,
+            0x7080,
+            0x7090,
+            0x70BC,
+            0x70D4,
+            0x70EC,
+            0x7194,
+            0x71B4,
+            0x71C4,
+            0x7330,
+            0x7388,
+            0x741C,
+            0x742C,
+            0x743C,
+            0x744C,
+            0x745C,
+            0x746C,
+            0x74B0,
+            0x74C0,
+            0x74D8,
+            0x7528,
+            0x75A8,
+            0x75B8,
+            0x7618,
+            0x7640,
+            0x7658,
+            0x76EC,
+            0x77A0,
+            0x7860,
+            0x78F0,
+            0x7910,
+            0x7928,
+            0x7978,
+            0x7A38,
+            0x7AA0,
+            0x7B3C,
+            0x7B4C,
+            0x7BBC,
+            0x7C24,
+            0x7D10,
+            0x7E94,
+            0x7EA4,
+            0x7F14,
+            0x7FB8,
+            0x7FEC,
+            0x80C4,
+            0x8178,
+            0x8208,
+            0x82C4,
+            0x8324,
+            0x8338,
+            0x8370,
+            0x84B4,
+            0x84F8,
+            0x85A8,
+            0x8610,
+            0x8640,
+            0x86CC,
+            0x86E0,
+            0x87A0,
+            0x8864,
+            0x88BC,
+            0x8920,
+            0x8954,
+            0x8974,
+            0x8990,
+            0x89D4,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0x2325DE4,
+            0x2325E64,
+            0x2325EC4,
+            0x2325F00,
+            0x2325F3C,
+            0x2325F74,
+            0x2325FB4,
+            0x2325FC4,
+            0x2326088,
+            0x23260A8,
+            0x23260D0,
+            0x232612C,
+            0x2326188,
+            0x23261A0,
+            0x232620C,
+            0x2326220,
+            0x2326264,
+            0x232631C,
+            0x2326408,
+            0x2326550,
+            0x2326568,
+            0x23265A4,
+            0x2326648,
+            0x2326670,
+            0x23266DC,
+            0x2326750,
+            0x23267D8,
+            0x232680C,
+            0x23268BC,
+            0x23268CC,
+            0x2326908,
+            0x232692C,
+            0x2326990,
+            0x2326A0C,
+            0x2326A74,
+            0x2326AE8,
+            0x2326B24,
+            0x2326BC0,
+            0x2326CA4,
+            0x2326CB4,
+            0x2326CC8,
+            0x2326D50,
+            0x2326DD8,
+            0x2326E04,
+            0x2326E20,
+            0x2326E60,
+            0xFFFFFFFF,
+            0x2326E98,
+            0x2326EB8,
+            0x2326F48,
+            0x2326F8C,
+            0x2327034,
+            0x23270B4,
+            0x2327120,
+            0x232718C,
+            0x232724C,
+            0x232728C,
+            0x23272F8,
+            0x2327368,
+            0x23273CC,
+            0x2327458,
+            0x2327598,
+            0x232764C,
+            0x23276B4,
+            0x23276E8,
+            0x2327744,
+            0x2327758,
+            0x232776C,
+            0x23277B8,
+            0x2327804,
+            0x23278E8,
+            0x2327928,
+            0x2327940,
+            0x23279AC,
+            0x23279E4,
+            0x2327A28,
+            0x2327AF4,
+            0x2327B5C,
+            0x2327BE0,
+            0x2327BF0,
+            0x2327C08,
+            0x2327C74,
+            0x2327CD8,
+            0x2327D60,
+            0x2327DD0,
+            0x2327DE0,
+            0x2327E94,
+            0x2327F34,
+            0xFFFFFFFF,
+            0x2328030,
+            0x2328074,
+            0x23280D4,
+            0x2328110,
+            0x232816C,
+            0x23281D8,
+            0x2328248,
+            0x23282C8,
+            0x2328328,
+            0x2328394,
+            0x23283A4,
+            0x23284BC,
+            0x2328528,
+            0x2328538,
+            0xFFFFFFFF,
+            0x2328698,
+            0x2328794,
+            0x23288C4,
+            0x2328930,
+            0x23289F8,
+            0x2328A54,
+            0x2328A74,
+            0x2328AE0,
+            0x2328B00,
+            0x2328B88,
+            0x2328C74,
+            0x2328D44,
+            0x2328DE4,
+            0x2328E74,
+            0x2328ECC,
+            0x2328F94,
+            0x2329000,
+            0x2329074,
+            0x23290CC,
+            0x232915C,
+            0x23291F4,
+            0x232923C,
+            0x2329258,
+            0x23293CC,
+            0x23293E4,
+            0x23293F8,
+            0x2329438,
+            0x2329534,
+            0x2329554,
+            0x2329664,
+            0x2329674,
+            0x23296D8,
+            0x23296F8,
+            0x2329710,
+            0x232977C,
+            0x23297F0,
+            0x2329854,
+            0x2329868,
+            0x2329880,
+            0x2329898,
+            0x2329904,
+            0x2329970,
+            0x2329A9C,
+            0x2329B68,
+            0x2329C94,
+            0x2329D50,
+            0x2329F78,
+            0x2329FB4,
+            0x2329FE0,
+            0x232A04C,
+            0x232A058,
+            0x232A078,
+            0x232A118,
+            0x232A148,
+            0x232A188,
+            0x232A220,
+            0x232A27C,
+            0x232A2AC,
+            0x232A2BC,
+            0x232A328,
+            0x232A340,
+            0x232A3FC,
+            0x232A414,
+            0x232A480,
+            0x232A490,
+            0x232A4E8,
+            0x232A524,
+            0x232A5AC,
+            0x232A640,
+            0x232A688,
+            0x232A6EC,
+            0x232A8EC,
+            0x232AC44,
+            0x232AC54,
+            0x232AD08,
+            0x232AD18,
+            0x232AEF0,
+            0x232AF5C,
+            0x232AFA0,
+            0x232AFF0,
+            0x232B024,
+            0x232B118,
+            0x232B164,
+            0x232B1E4,
+            0x232B26C,
+            0x232B368,
+            0x232B44C,
+            0x232B494,
+            0x232B500,
+            0x232B518,
+            0x232B5C8,
+            0x232B5E8,
+            0x232B6A4,
+            0x232B6B8,
+            0x232B6C8,
+            0x232B738,
+            0x232B7C0,
+            0x232B7D0,
+            0x232B7E0,
+            0x232B800,
+            0x232B820,
+            0x232B8A0,
+            0x232B8D4,
+            0x232B8E4,
+            0x232B928,
+            0x232B940,
+            0x232B9D0,
+            0x232BA44,
+            0x232BB4C,
+            0x232BC34,
+            0x232BC64,
+            0x232BCC4,
+            0x232BE34,
+            0x232BE44,
+            0x232BF78,
+            0x232BF88,
+            0x232C028,
+            0x232C064,
+            0x232C0F4,
+            0x232C1A4,
+            0x232C27C,
+            0x232C300,
+            0x232C310,
+            0x232C524,
+            0x232C538,
+            0x232C560,
+            0x232C578,
+            0x232C6B4,
+            0x232C6F0,
+            0x232C818,
+            0x232C82C,
+            0x232C83C,
+            0x232C84C,
+            0x232CA14,
+            0x232CA2C,
+            0x232CA3C,
+            0x232CA4C,
+            0x232CA60,
+            0x232CA70,
+            0x232CB08,
+            0x232CB18,
+            0x232CCC4,
+            0x232CD90,
+            0x232CDA4,
+            0x232CE40,
+            0x232CE50,
+            0x232CE7C,
+            0x232CE94,
+            0x232CEAC,
+            0x232CF54,
+            0x232CF74,
+            0x232CF84,
+            0x232D0F0,
+            0x232D148,
+            0x232D1DC,
+            0x232D1EC,
+            0x232D1FC,
+            0x232D20C,
+            0x232D21C,
+            0x232D22C,
+            0x232D270,
+            0x232D280,
+            0x232D298,
+            0x232D2E8,
+            0x232D368,
+            0x232D378,
+            0x232D3D8,
+            0x232D400,
+            0x232D418,
+            0x232D4AC,
+            0x232D560,
+            0x232D620,
+            0x232D6B0,
+            0x232D6D0,
+            0x232D6E8,
+            0x232D738,
+            0x232D7F8,
+            0x232D860,
+            0x232D8FC,
+            0x232D90C,
+            0x232D97C,
+            0x232D9E4,
+            0x232DAD0,
+            0x232DC54,
+            0x232DC64,
+            0x232DCD4,
+            0x232DD78,
+            0x232DDAC,
+            0x232DE84,
+            0x232DF38,
+            0x232DFC8,
+            0x232E084,
+            0x232E0E4,
+            0x232E0F8,
+            0x232E130,
+            0x232E274,
+            0x232E2B8,
+            0x232E368,
+            0x232E3D0,
+            0x232E400,
+            0x232E48C,
+            0x232E4A0,
+            0x232E560,
+            0x232E624,
+            0x232E67C,
+            0x232E6E0,
+            0x232E714,
+            0x232E734,
+            0x232E750,
+            0x232E794,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1211,
+            1212,
+            1213,
+            1214,
+            1215,
+            1216,
+            1217,
+            1218,
+            1219,
+            1220,
+            1221,
+            1222,
+            1223,
+            1224,
+            1225,
+            1226,
+            1227,
+            1228,
+            1229,
+            1230,
+            1231,
+            1232,
+            1233,
+            1234,
+            1235,
+            1236,
+            1237,
+            1238,
+            1239,
+            1240,
+            1241,
+            1242,
+            1243,
+            1244,
+            1245,
+            1246,
+            1247,
+            1248,
+            1249,
+            1250,
+            1251,
+            1252,
+            1253,
+            1254,
+            1255,
+            1256,
+            1257,
+            1258,
+            1259,
+            1260,
+            1261,
+            1262,
+            1263,
+            1264,
+            1265,
+            1266,
+            1267,
+            1268,
+            1269,
+            1270,
+            1271,
+            1272,
+            1273,
+            1274,
+            1275,
+            1276,
+            1277,
+            1278,
+            1279,
+            1280,
+            1281,
+            1282,
+            1283,
+            1284,
+            1285,
+            1286,
+            1287,
+            1288,
+            1289,
+            1290,
+            1291,
+            1292,
+            1293,
+            1294,
+            1295,
+            1296,
+            1297,
+            1298,
+            1299,
+            1300,
+            1301,
+            1302,
+            1303,
+            1304,
+            1305,
+            1306,
+            1307,
+            1308,
+            1309,
+            1310,
+            1311,
+            1312,
+            1313,
+            1314,
+            1315,
+            1316,
+            1317,
+            1318,
+            1319,
+            1320,
+            1321,
+            1322,
+            1323,
+            1324,
+            1325,
+            1326,
+            1327,
+            1328,
+            1329,
+            1330,
+            1331,
+            1332,
+            1333,
+            1334,
+            1335,
+            1336,
+            1337,
+            1338,
+            1339,
+            1340,
+            1341,
+            1342,
+            1343,
+            1344,
+            1345,
+            1346,
+            1347,
+            1348,
+            1349,
+            1350,
+            1351,
+            1352,
+            1353,
+            1354,
+            1355,
+            1356,
+            1357,
+            1358,
+            1359,
+            1360,
+            1361,
+            1362,
+            1363,
+            1364,
+            1365,
+            1366,
+            1367,
+            1368,
+            1369,
+            1370,
+            1371,
+            1372,
+            1373,
+            1374,
+            1375,
+            1376,
+            1377,
+            1378,
+            1379,
+            1380,
+            1381,
+            1382,
+            1383,
+            1384,
+            1385,
+            1386,
+            1387,
+            1388,
+            1389,
+            1390,
+            1391,
+            1392,
+            1393,
+            1394,
+            1395,
+            1396,
+            1397,
+            1398,
+            1399,
+            1400,
+            1401,
+            1402,
+            1403,
+            1404,
+            1405,
+            1406,
+            1407,
+            1408,
+            1409,
+            1410,
+            1411,
+            1412,
+            1413,
+            1414,
+            1415,
+            1416,
+            1417,
+            1418,
+            1419,
+            1420,
+            1421,
+            1422,
+            1423,
+            1424,
+            1425,
+            1426,
+            1427,
+            1428,
+            1429,
+            1430,
+            1431,
+            1432,
+            1433,
+            1434,
+            1435,
+            1436,
+            1437,
+            1438,
+            1439,
+            1440,
+            1441,
+            1442,
+            1443,
+            1444,
+            1445,
+            1446,
+            1447,
+            1448,
+            1449,
+            1450,
+            1451,
+            1452,
+            1453,
+            1454,
+            1455,
+            1456,
+            1457,
+            1458,
+            1459,
+            1460,
+            1461,
+            1462,
+            1463,
+            1464,
+            1465,
+            1466,
+            1467,
+            1468,
+            1469,
+            1470,
+            1471,
+            1472,
+            1473,
+            1474,
+            1475,
+            1476,
+            1477,
+            1478,
+            1479,
+            1480,
+            1481,
+            1482,
+            1483,
+            1484,
+            1485,
+            1486,
+            1487,
+            1488,
+            1489,
+            1490,
+            1491,
+            1492,
+            1493,
+            1494,
+            1495,
+            1496,
+            1497,
+            1498,
+            1499,
+            1500,
+            1501,
+            1502,
+            1503,
+            1504,
+            1505,
+            1506,
+            1507,
+            1508,
+            1509,
+            1510,
+            1511,
+            1512,
+            1513,
+            1514,
+            1515,
+            1516,
+            1517,
+            1518,
+            1519,
+            1520,
+            1521,
+            1522,
+            1523,
+            1524,
+            1525,
+        ),
+    ),
+    c_types=None,
+    multi={
+        0: (
+            (0x0, 0x4740, 0x5AF0, 0x7FC8),
+            (0x2325DC0, 0x232A500, 0x232B8B0, 0x232DD88),
+        ),
+        47: ((0x10C0, 0x2470, 0x5674), (0x2326E80, 0x2328230, 0x232B434)),
+        89: (
+            (0x224C, 0x4618, 0x6740, 0x8490),
+            (0x232800C, 0x232A3D8, 0x232C500, 0x232E250),
+        ),
+        104: (
+            (0x2874, 0x4154, 0x6010, 0x8060),
+            (0x2328634, 0x2329F14, 0x232BDD0, 0x232DE20),
+        ),
+    },
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "MAX_HP_CAP_MOVE_EFFECTS",
+        "LUNAR_DANCE_PP_RESTORATION",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0x860C,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0x232E3CC,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0x4,
+            0x4,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1526,
+            1527,
+        ),
+    ),
+    c_types=(
+        "int32_t",
+        "int32_t",
+    ),
+    multi={
+        0: (
+            (0x1884, 0x20CC, 0x566C, 0x7974, 0x8170),
+            (0x2327644, 0x2327E8C, 0x232B42C, 0x232D734, 0x232DF30),
+        ),
+    },
+)
@@ -0,0 +1,190 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay1 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "CreateMainMenus",
+        "AddMainMenuOption",
+        "AddSubMenuOption",
+        "ProcessContinueScreenContents",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x7BC4,
+            0x8038,
+            0x8110,
+            0x99D4,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x23310E4,
+            0x2331558,
+            0x2331630,
+            0x2332EF4,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1529,
+            1530,
+            1531,
+            1532,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "PRINTS_STRINGS",
+        "PRINTS_STRUCT",
+        "MAIN_MENU_WINDOW_PARAMS_1",
+        "MAIN_MENU_WINDOW_PARAMS_2",
+        "MAIN_MENU_WINDOW_PARAMS_3",
+        "MAIN_MENU_WINDOW_PARAMS_4",
+        "CONTINUE_CHOICE",
+        "SUBMENU",
+        "MAIN_MENU",
+        "MAIN_MENU_WINDOW_PARAMS_5",
+        "MAIN_MENU_WINDOW_PARAMS_6",
+        "MAIN_MENU_WINDOW_PARAMS_7",
+        "MAIN_MENU_ITEMS_CONFIRM",
+        "MAIN_MENU_WINDOW_PARAMS_8",
+        "MAIN_MENU_WINDOW_PARAMS_9",
+        "MAIN_DEBUG_MENU_ITEMS_1",
+        "MAIN_MENU_WINDOW_PARAMS_10",
+        "MAIN_DEBUG_MENU_ITEMS_2",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x11C0C,
+            0x11DF4,
+            0x11FF8,
+            0x12008,
+            0x12018,
+            0x12028,
+            0x12048,
+            0x12068,
+            0x120B0,
+            0x121FC,
+            0x1220C,
+            0x1221C,
+            0x1222C,
+            0x122B0,
+            0x122D0,
+            0x122F0,
+            0x12350,
+            0x12370,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x233B12C,
+            0x233B314,
+            0x233B518,
+            0x233B528,
+            0x233B538,
+            0x233B548,
+            0x233B568,
+            0x233B588,
+            0x233B5D0,
+            0x233B71C,
+            0x233B72C,
+            0x233B73C,
+            0x233B74C,
+            0x233B7D0,
+            0x233B7F0,
+            0x233B810,
+            0x233B870,
+            0x233B890,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0x1E8,
+            0x1F0,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x20,
+            0x48,
+            0xA0,
+            0x10,
+            0x10,
+            0x10,
+            0x18,
+            0x10,
+            0x10,
+            0x60,
+            0x10,
+            0x38,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            266,
+            1533,
+            266,
+            266,
+            266,
+            266,
+            1,
+            1,
+            1,
+            266,
+            266,
+            266,
+            1,
+            266,
+            266,
+            1,
+            266,
+            1,
+        ),
+    ),
+    c_types=(
+        "",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[3]",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[12]",
+        "struct window_params",
+        "struct simple_menu_id_item[7]",
+    ),
+    multi={},
+)
@@ -0,0 +1,1326 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay10 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "CreateInventoryMenu",
+        "SetInventoryMenuState0",
+        "SetInventoryMenuState6",
+        "CloseInventoryMenu",
+        "IsInventoryMenuActive",
+        "CheckInventoryMenuField0x1A0",
+        "PopInventoryMenuField0x1A3",
+        "UpdateInventoryMenu",
+        "IsInventoryMenuState3",
+        "SprintfStatic",
+        "GetEffectAnimationField0x19",
+        "AnimationHasMoreFrames",
+        "GetEffectAnimation",
+        "GetMoveAnimation",
+        "GetSpecialMonsterMoveAnimation",
+        "GetTrapAnimation",
+        "GetItemAnimation1",
+        "GetItemAnimation2",
+        "GetMoveAnimationSpeed",
+        "DrawTeamStats",
+        "UpdateTeamStats",
+        "FreeTeamStats",
+        "FreeMapAndTeam",
+        "ProcessTeamStatsLvHp",
+        "ProcessTeamStatsNameGender",
+        "IsBackgroundTileset",
+        "InitTilesetBuffer",
+        "MainGame",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x0,
+            0x24C,
+            0x260,
+            0x274,
+            0x2E8,
+            0x308,
+            0x3D8,
+            0x3F4,
+            0x8F4,
+            0xFFFFFFFF,
+            0x1434,
+            0x2E84,
+            0x3420,
+            0x3434,
+            0x3448,
+            0x345C,
+            0x3470,
+            0x3484,
+            0x3498,
+            0x3F68,
+            0x4260,
+            0x4934,
+            0x4C58,
+            0x4CC8,
+            0x4DE4,
+            0x5AF4,
+            0x5C3C,
+            0x5E0C,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x22BCA80,
+            0x22BCCCC,
+            0x22BCCE0,
+            0x22BCCF4,
+            0x22BCD68,
+            0x22BCD88,
+            0x22BCE58,
+            0x22BCE74,
+            0x22BD374,
+            0xFFFFFFFF,
+            0x22BDEB4,
+            0x22BF904,
+            0x22BFEA0,
+            0x22BFEB4,
+            0x22BFEC8,
+            0x22BFEDC,
+            0x22BFEF0,
+            0x22BFF04,
+            0x22BFF18,
+            0x22C09E8,
+            0x22C0CE0,
+            0x22C13B4,
+            0x22C16D8,
+            0x22C1748,
+            0x22C1864,
+            0x22C2574,
+            0x22C26BC,
+            0x22C288C,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1534,
+            1535,
+            1536,
+            1537,
+            1538,
+            1539,
+            1540,
+            1541,
+            1542,
+            1543,
+            1544,
+            1545,
+            1546,
+            1547,
+            1548,
+            1549,
+            1550,
+            1551,
+            1552,
+            1553,
+            1554,
+            1555,
+            1556,
+            1557,
+            1558,
+            1559,
+            1560,
+            1561,
+        ),
+    ),
+    c_types=None,
+    multi={
+        9: ((0x9CC, 0x4DBC), (0x22BD44C, 0x22C183C)),
+    },
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "INVENTORY_MENU_DEFAULT_WINDOW_PARAMS",
+        "FIRST_DUNGEON_WITH_MONSTER_HOUSE_TRAPS",
+        "BAD_POISON_DAMAGE_COOLDOWN",
+        "PROTEIN_STAT_BOOST",
+        "WATERFALL_CRINGE_CHANCE",
+        "AURORA_BEAM_LOWER_ATTACK_CHANCE",
+        "SPAWN_CAP_NO_MONSTER_HOUSE",
+        "OREN_BERRY_DAMAGE",
+        "IRON_TAIL_LOWER_DEFENSE_CHANCE",
+        "TWINEEDLE_POISON_CHANCE",
+        "EXTRASENSORY_CRINGE_CHANCE",
+        "ROCK_SLIDE_CRINGE_CHANCE",
+        "CRUNCH_LOWER_DEFENSE_CHANCE",
+        "FOREWARN_FORCED_MISS_CHANCE",
+        "UNOWN_STONE_DROP_CHANCE",
+        "SITRUS_BERRY_HP_RESTORATION",
+        "MUDDY_WATER_LOWER_ACCURACY_CHANCE",
+        "SILVER_WIND_BOOST_CHANCE",
+        "POISON_TAIL_POISON_CHANCE",
+        "THUNDERSHOCK_PARALYZE_CHANCE",
+        "BOUNCE_PARALYZE_CHANCE",
+        "HEADBUTT_CRINGE_CHANCE",
+        "FIRE_FANG_CRINGE_CHANCE",
+        "SACRED_FIRE_BURN_CHANCE",
+        "WHIRLPOOL_CONSTRICTION_CHANCE",
+        "EXP_ELITE_EXP_BOOST",
+        "MONSTER_HOUSE_MAX_NON_MONSTER_SPAWNS",
+        "HEAL_ORDER_HP_RESTORATION",
+        "STEEL_WING_BOOST_DEFENSE_CHANCE",
+        "GOLD_THORN_POWER",
+        "BURN_DAMAGE",
+        "POISON_DAMAGE",
+        "SPAWN_COOLDOWN",
+        "MIST_BALL_LOWER_SPECIAL_ATTACK_CHANCE",
+        "CHARGE_BEAM_BOOST_SPECIAL_ATTACK_CHANCE",
+        "ORAN_BERRY_FULL_HP_BOOST",
+        "LIFE_SEED_HP_BOOST",
+        "OCTAZOOKA_LOWER_ACCURACY_CHANCE",
+        "LUSTER_PURGE_LOWER_SPECIAL_DEFENSE_CHANCE",
+        "SUPER_LUCK_CRIT_RATE_BOOST",
+        "CONSTRICT_LOWER_SPEED_CHANCE",
+        "ICE_FANG_FREEZE_CHANCE",
+        "SMOG_POISON_CHANCE",
+        "LICK_PARALYZE_CHANCE",
+        "THUNDER_FANG_PARALYZE_CHANCE",
+        "BITE_CRINGE_CHANCE",
+        "SKY_ATTACK_CRINGE_CHANCE",
+        "ICE_FANG_CRINGE_CHANCE",
+        "BLAZE_KICK_BURN_CHANCE",
+        "FLAMETHROWER_BURN_CHANCE",
+        "DIZZY_PUNCH_CONFUSE_CHANCE",
+        "SECRET_POWER_EFFECT_CHANCE",
+        "METAL_CLAW_BOOST_ATTACK_CHANCE",
+        "TECHNICIAN_MOVE_POWER_THRESHOLD",
+        "SONICBOOM_FIXED_DAMAGE",
+        "RAIN_ABILITY_BONUS_REGEN",
+        "LEECH_SEED_HP_DRAIN",
+        "EXCLUSIVE_ITEM_EXP_BOOST",
+        "AFTERMATH_CHANCE",
+        "SET_DAMAGE_STATUS_DAMAGE",
+        "INTIMIDATOR_ACTIVATION_CHANCE",
+        "TYPE_ADVANTAGE_MASTER_CRIT_RATE",
+        "ORAN_BERRY_HP_RESTORATION",
+        "SITRUS_BERRY_FULL_HP_BOOST",
+        "SNORE_CRINGE_CHANCE",
+        "METEOR_MASH_BOOST_ATTACK_CHANCE",
+        "CRUSH_CLAW_LOWER_DEFENSE_CHANCE",
+        "BURN_DAMAGE_COOLDOWN",
+        "SHADOW_BALL_LOWER_SPECIAL_DEFENSE_CHANCE",
+        "STICK_POWER",
+        "BUBBLE_LOWER_SPEED_CHANCE",
+        "ICE_BODY_BONUS_REGEN",
+        "POWDER_SNOW_FREEZE_CHANCE",
+        "POISON_STING_POISON_CHANCE",
+        "SPAWN_COOLDOWN_THIEF_ALERT",
+        "POISON_FANG_POISON_CHANCE",
+        "WEATHER_MOVE_TURN_COUNT",
+        "THUNDER_PARALYZE_CHANCE",
+        "THUNDERBOLT_PARALYZE_CHANCE",
+        "MONSTER_HOUSE_MAX_MONSTER_SPAWNS",
+        "TWISTER_CRINGE_CHANCE",
+        "SPEED_BOOST_TURNS",
+        "FAKE_OUT_CRINGE_CHANCE",
+        "THUNDER_FANG_CRINGE_CHANCE",
+        "FLARE_BLITZ_BURN_CHANCE",
+        "FLAME_WHEEL_BURN_CHANCE",
+        "PSYBEAM_CONFUSE_CHANCE",
+        "TRI_ATTACK_STATUS_CHANCE",
+        "MIRACLE_CHEST_EXP_BOOST",
+        "WONDER_CHEST_EXP_BOOST",
+        "SPAWN_CAP_WITH_MONSTER_HOUSE",
+        "POISON_DAMAGE_COOLDOWN",
+        "LEECH_SEED_DAMAGE_COOLDOWN",
+        "THROWN_ITEM_HIT_CHANCE",
+        "GEO_PEBBLE_DAMAGE",
+        "GRAVELEROCK_DAMAGE",
+        "RARE_FOSSIL_DAMAGE",
+        "GINSENG_CHANCE_3",
+        "ZINC_STAT_BOOST",
+        "IRON_STAT_BOOST",
+        "CALCIUM_STAT_BOOST",
+        "WISH_BONUS_REGEN",
+        "DRAGON_RAGE_FIXED_DAMAGE",
+        "CORSOLA_TWIG_POWER",
+        "CACNEA_SPIKE_POWER",
+        "GOLD_FANG_POWER",
+        "SILVER_SPIKE_POWER",
+        "IRON_THORN_POWER",
+        "SCOPE_LENS_CRIT_RATE_BOOST",
+        "HEALING_WISH_HP_RESTORATION",
+        "ME_FIRST_MULTIPLIER",
+        "FACADE_DAMAGE_MULTIPLIER",
+        "IMPRISON_TURN_RANGE",
+        "SLEEP_TURN_RANGE",
+        "NIGHTMARE_TURN_RANGE",
+        "BURN_DAMAGE_MULTIPLIER",
+        "REST_TURN_RANGE",
+        "MATCHUP_SUPER_EFFECTIVE_MULTIPLIER_ERRATIC_PLAYER",
+        "MATCHUP_IMMUNE_MULTIPLIER",
+        "SPORT_CONDITION_TURN_RANGE",
+        "SURE_SHOT_TURN_RANGE",
+        "DETECT_BAND_MOVE_ACCURACY_DROP",
+        "TINTED_LENS_MULTIPLIER",
+        "SMOKESCREEN_TURN_RANGE",
+        "PERISH_SONG_TURN_RANGE",
+        "SHADOW_FORCE_DAMAGE_MULTIPLIER",
+        "DIG_DAMAGE_MULTIPLIER",
+        "DIVE_DAMAGE_MULTIPLIER",
+        "BOUNCE_DAMAGE_MULTIPLIER",
+        "POWER_PITCHER_DAMAGE_MULTIPLIER",
+        "QUICK_DODGER_MOVE_ACCURACY_DROP",
+        "MATCHUP_NOT_VERY_EFFECTIVE_MULTIPLIER",
+        "MATCHUP_SUPER_EFFECTIVE_MULTIPLIER",
+        "MATCHUP_NEUTRAL_MULTIPLIER",
+        "MATCHUP_IMMUNE_MULTIPLIER_ERRATIC_PLAYER",
+        "MATCHUP_NOT_VERY_EFFECTIVE_MULTIPLIER_ERRATIC_PLAYER",
+        "MATCHUP_NEUTRAL_MULTIPLIER_ERRATIC_PLAYER",
+        "AIR_BLADE_DAMAGE_MULTIPLIER",
+        "KECLEON_SHOP_BOOST_CHANCE_MULTIPLIER",
+        "HIDDEN_STAIRS_SPAWN_CHANCE_MULTIPLIER",
+        "YAWN_TURN_RANGE",
+        "SPEED_BOOST_TURN_RANGE",
+        "SOLARBEAM_DAMAGE_MULTIPLIER",
+        "SKY_ATTACK_DAMAGE_MULTIPLIER",
+        "RAZOR_WIND_DAMAGE_MULTIPLIER",
+        "FOCUS_PUNCH_DAMAGE_MULTIPLIER",
+        "SKULL_BASH_DAMAGE_MULTIPLIER",
+        "FLY_DAMAGE_MULTIPLIER",
+        "WEATHER_BALL_TYPE_TABLE",
+        "LAST_RESORT_DAMAGE_MULT_TABLE",
+        "SYNTHESIS_HP_RESTORATION_TABLE",
+        "ROOST_HP_RESTORATION_TABLE",
+        "MOONLIGHT_HP_RESTORATION_TABLE",
+        "MORNING_SUN_HP_RESTORATION_TABLE",
+        "REVERSAL_DAMAGE_MULT_TABLE",
+        "WATER_SPOUT_DAMAGE_MULT_TABLE",
+        "WRING_OUT_DAMAGE_MULT_TABLE",
+        "ERUPTION_DAMAGE_MULT_TABLE",
+        "WEATHER_BALL_DAMAGE_MULT_TABLE",
+        "EAT_ITEM_EFFECT_IGNORE_LIST",
+        "CASTFORM_WEATHER_ATTRIBUTE_TABLE",
+        "BAD_POISON_DAMAGE_TABLE",
+        "TYPE_MATCHUP_COMBINATOR_TABLE",
+        "OFFENSIVE_STAT_STAGE_MULTIPLIERS",
+        "DEFENSIVE_STAT_STAGE_MULTIPLIERS",
+        "NATURE_POWER_TABLE",
+        "APPLES_AND_BERRIES_ITEM_IDS",
+        "RECRUITMENT_LEVEL_BOOST_TABLE",
+        "NATURAL_GIFT_ITEM_TABLE",
+        "RANDOM_MUSIC_ID_TABLE",
+        "SHOP_ITEM_CHANCES",
+        "MALE_ACCURACY_STAGE_MULTIPLIERS",
+        "MALE_EVASION_STAGE_MULTIPLIERS",
+        "FEMALE_ACCURACY_STAGE_MULTIPLIERS",
+        "FEMALE_EVASION_STAGE_MULTIPLIERS",
+        "MUSIC_ID_TABLE",
+        "TYPE_MATCHUP_TABLE",
+        "FIXED_ROOM_MONSTER_SPAWN_STATS_TABLE",
+        "METRONOME_TABLE",
+        "TILESET_PROPERTIES",
+        "FIXED_ROOM_PROPERTIES_TABLE",
+        "TRAP_ANIMATION_INFO",
+        "ITEM_ANIMATION_INFO",
+        "MOVE_ANIMATION_INFO",
+        "EFFECT_ANIMATION_INFO",
+        "SPECIAL_MONSTER_MOVE_ANIMATION_INFO",
+        "DEFEAT_ITEM_LOSS_CHANCE",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x7914,
+            0x798C,
+            0x7994,
+            0x79A0,
+            0x79A4,
+            0x79A8,
+            0x79B0,
+            0x79B8,
+            0x79C0,
+            0x79C4,
+            0x79C8,
+            0x79CC,
+            0x79D0,
+            0x79E8,
+            0x79F4,
+            0x79F8,
+            0x7A04,
+            0x7A08,
+            0x7A0C,
+            0x7A10,
+            0x7A14,
+            0x7A18,
+            0x7A1C,
+            0x7A20,
+            0x7A24,
+            0x7A28,
+            0x7A2C,
+            0x7A38,
+            0x7A44,
+            0x7A50,
+            0x7A54,
+            0x7A58,
+            0x7A5C,
+            0x7A60,
+            0x7A70,
+            0x7A74,
+            0x7A78,
+            0x7A80,
+            0x7A8C,
+            0x7A90,
+            0x7A94,
+            0x7A98,
+            0x7A9C,
+            0x7AA8,
+            0x7AAC,
+            0x7AB4,
+            0x7AB8,
+            0x7ABC,
+            0x7AC0,
+            0x7AC4,
+            0x7AC8,
+            0x7ACC,
+            0x7AD4,
+            0x7ADC,
+            0x7AE8,
+            0x7AF8,
+            0x7B08,
+            0x7B0C,
+            0x7B14,
+            0x7B18,
+            0x7B38,
+            0x7B60,
+            0x7B6C,
+            0x7B74,
+            0x7B80,
+            0x7B84,
+            0x7B88,
+            0x7B90,
+            0x7B9C,
+            0x7BA4,
+            0x7BAC,
+            0x7BB0,
+            0x7BB4,
+            0x7BBC,
+            0x7BC0,
+            0x7BC4,
+            0x7BD4,
+            0x7BD8,
+            0x7BDC,
+            0x7BE0,
+            0x7BE8,
+            0x7BEC,
+            0x7BF0,
+            0x7BF8,
+            0x7C04,
+            0x7C08,
+            0x7C10,
+            0x7C14,
+            0x7C18,
+            0x7C1C,
+            0x7C24,
+            0x7C28,
+            0x7C2C,
+            0x7C30,
+            0x7C34,
+            0x7C38,
+            0x7C3C,
+            0x7C40,
+            0x7C44,
+            0x7C48,
+            0x7C4C,
+            0x7C50,
+            0x7C54,
+            0x7C58,
+            0x7C5C,
+            0x7C60,
+            0x7C64,
+            0x7C68,
+            0x7C70,
+            0x7C74,
+            0x7C90,
+            0x7C98,
+            0x7C9C,
+            0x7CA0,
+            0x7CA4,
+            0x7CC4,
+            0x7CC8,
+            0x7CCC,
+            0x7CD8,
+            0x7D0C,
+            0x7D18,
+            0x7D28,
+            0x7D40,
+            0x7D44,
+            0x7D50,
+            0x7D5C,
+            0x7D64,
+            0x7D68,
+            0x7D6C,
+            0x7D78,
+            0x7D88,
+            0x7D90,
+            0x7D98,
+            0x7D9C,
+            0x7DA0,
+            0x7DA4,
+            0x7DAC,
+            0x7DC4,
+            0x7DCC,
+            0x7DD0,
+            0x7DE0,
+            0x7E08,
+            0x7E24,
+            0x7E28,
+            0x7E30,
+            0x7E34,
+            0x7E3C,
+            0x7E40,
+            0x7E5C,
+            0x7EC4,
+            0x7ED4,
+            0x7EE4,
+            0x7EF4,
+            0x7F04,
+            0x7F14,
+            0x7F24,
+            0x7F34,
+            0x7F44,
+            0x80D4,
+            0x80F4,
+            0x81EC,
+            0x821C,
+            0x8294,
+            0x8318,
+            0x836C,
+            0x83C0,
+            0x8438,
+            0x85E4,
+            0x86B0,
+            0x877C,
+            0x886C,
+            0x898C,
+            0x89E0,
+            0x8A34,
+            0x8A88,
+            0x8ADC,
+            0x8C30,
+            0x8EB8,
+            0x935C,
+            0x989C,
+            0xA1F0,
+            0xAFD0,
+            0xB004,
+            0xC5E4,
+            0xFAAC,
+            0x1473C,
+            0x6188,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x22C4394,
+            0x22C440C,
+            0x22C4414,
+            0x22C4420,
+            0x22C4424,
+            0x22C4428,
+            0x22C4430,
+            0x22C4438,
+            0x22C4440,
+            0x22C4444,
+            0x22C4448,
+            0x22C444C,
+            0x22C4450,
+            0x22C4468,
+            0x22C4474,
+            0x22C4478,
+            0x22C4484,
+            0x22C4488,
+            0x22C448C,
+            0x22C4490,
+            0x22C4494,
+            0x22C4498,
+            0x22C449C,
+            0x22C44A0,
+            0x22C44A4,
+            0x22C44A8,
+            0x22C44AC,
+            0x22C44B8,
+            0x22C44C4,
+            0x22C44D0,
+            0x22C44D4,
+            0x22C44D8,
+            0x22C44DC,
+            0x22C44E0,
+            0x22C44F0,
+            0x22C44F4,
+            0x22C44F8,
+            0x22C4500,
+            0x22C450C,
+            0x22C4510,
+            0x22C4514,
+            0x22C4518,
+            0x22C451C,
+            0x22C4528,
+            0x22C452C,
+            0x22C4534,
+            0x22C4538,
+            0x22C453C,
+            0x22C4540,
+            0x22C4544,
+            0x22C4548,
+            0x22C454C,
+            0x22C4554,
+            0x22C455C,
+            0x22C4568,
+            0x22C4578,
+            0x22C4588,
+            0x22C458C,
+            0x22C4594,
+            0x22C4598,
+            0x22C45B8,
+            0x22C45E0,
+            0x22C45EC,
+            0x22C45F4,
+            0x22C4600,
+            0x22C4604,
+            0x22C4608,
+            0x22C4610,
+            0x22C461C,
+            0x22C4624,
+            0x22C462C,
+            0x22C4630,
+            0x22C4634,
+            0x22C463C,
+            0x22C4640,
+            0x22C4644,
+            0x22C4654,
+            0x22C4658,
+            0x22C465C,
+            0x22C4660,
+            0x22C4668,
+            0x22C466C,
+            0x22C4670,
+            0x22C4678,
+            0x22C4684,
+            0x22C4688,
+            0x22C4690,
+            0x22C4694,
+            0x22C4698,
+            0x22C469C,
+            0x22C46A4,
+            0x22C46A8,
+            0x22C46AC,
+            0x22C46B0,
+            0x22C46B4,
+            0x22C46B8,
+            0x22C46BC,
+            0x22C46C0,
+            0x22C46C4,
+            0x22C46C8,
+            0x22C46CC,
+            0x22C46D0,
+            0x22C46D4,
+            0x22C46D8,
+            0x22C46DC,
+            0x22C46E0,
+            0x22C46E4,
+            0x22C46E8,
+            0x22C46F0,
+            0x22C46F4,
+            0x22C4710,
+            0x22C4718,
+            0x22C471C,
+            0x22C4720,
+            0x22C4724,
+            0x22C4744,
+            0x22C4748,
+            0x22C474C,
+            0x22C4758,
+            0x22C478C,
+            0x22C4798,
+            0x22C47A8,
+            0x22C47C0,
+            0x22C47C4,
+            0x22C47D0,
+            0x22C47DC,
+            0x22C47E4,
+            0x22C47E8,
+            0x22C47EC,
+            0x22C47F8,
+            0x22C4808,
+            0x22C4810,
+            0x22C4818,
+            0x22C481C,
+            0x22C4820,
+            0x22C4824,
+            0x22C482C,
+            0x22C4844,
+            0x22C484C,
+            0x22C4850,
+            0x22C4860,
+            0x22C4888,
+            0x22C48A4,
+            0x22C48A8,
+            0x22C48B0,
+            0x22C48B4,
+            0x22C48BC,
+            0x22C48C0,
+            0x22C48DC,
+            0x22C4944,
+            0x22C4954,
+            0x22C4964,
+            0x22C4974,
+            0x22C4984,
+            0x22C4994,
+            0x22C49A4,
+            0x22C49B4,
+            0x22C49C4,
+            0x22C4B54,
+            0x22C4B74,
+            0x22C4C6C,
+            0x22C4C9C,
+            0x22C4D14,
+            0x22C4D98,
+            0x22C4DEC,
+            0x22C4E40,
+            0x22C4EB8,
+            0x22C5064,
+            0x22C5130,
+            0x22C51FC,
+            0x22C52EC,
+            0x22C540C,
+            0x22C5460,
+            0x22C54B4,
+            0x22C5508,
+            0x22C555C,
+            0x22C56B0,
+            0x22C5938,
+            0x22C5DDC,
+            0x22C631C,
+            0x22C6C70,
+            0x22C7A50,
+            0x22C7A84,
+            0x22C9064,
+            0x22CC52C,
+            0x22D11BC,
+            0x22C2C08,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0x10,
+            0x1,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0xFFFFFFFF,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x2,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x8,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x20,
+            0x48,
+            0x30,
+            0x3C,
+            0x40,
+            0x54,
+            0x54,
+            0x78,
+            0x84,
+            0xCC,
+            0xCC,
+            0xF0,
+            0x120,
+            0x54,
+            0x54,
+            0x54,
+            0x54,
+            0x154,
+            0x288,
+            0x4A4,
+            0x540,
+            0x954,
+            0xC00,
+            0x34,
+            0x15E0,
+            0x34C8,
+            0x4C90,
+            0xADF4,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1562,
+            1563,
+            1564,
+            1565,
+            1566,
+            1567,
+            1568,
+            1569,
+            1570,
+            1571,
+            1572,
+            1573,
+            1574,
+            1575,
+            1576,
+            1577,
+            1578,
+            1579,
+            1580,
+            1581,
+            1582,
+            1583,
+            1584,
+            1585,
+            1586,
+            1587,
+            1588,
+            1589,
+            1590,
+            1591,
+            1592,
+            1593,
+            1594,
+            1595,
+            1596,
+            1597,
+            1598,
+            1599,
+            1600,
+            1601,
+            1602,
+            1603,
+            1604,
+            1605,
+            1606,
+            1607,
+            1608,
+            1609,
+            1610,
+            1611,
+            1612,
+            1613,
+            1614,
+            1615,
+            1616,
+            1617,
+            1618,
+            1619,
+            1620,
+            1621,
+            1622,
+            1623,
+            1624,
+            1625,
+            1626,
+            1627,
+            1628,
+            1629,
+            1630,
+            1631,
+            1632,
+            1633,
+            1634,
+            1635,
+            1636,
+            1637,
+            1638,
+            1639,
+            1640,
+            1641,
+            1642,
+            1643,
+            1644,
+            1645,
+            1646,
+            1647,
+            1648,
+            1649,
+            1650,
+            1651,
+            1652,
+            1653,
+            1654,
+            1655,
+            1656,
+            1657,
+            1658,
+            1659,
+            1660,
+            1661,
+            1662,
+            1663,
+            1664,
+            1665,
+            1666,
+            1667,
+            1668,
+            1669,
+            1670,
+            1671,
+            1672,
+            1673,
+            1674,
+            1675,
+            1676,
+            1677,
+            1678,
+            1679,
+            1680,
+            1681,
+            1682,
+            1683,
+            1684,
+            1685,
+            1686,
+            1687,
+            1688,
+            1689,
+            1690,
+            1691,
+            1692,
+            1693,
+            1694,
+            1695,
+            1696,
+            1697,
+            1698,
+            1699,
+            1700,
+            1701,
+            1702,
+            1703,
+            1704,
+            1705,
+            1706,
+            1707,
+            1708,
+            1709,
+            1710,
+            1711,
+            1712,
+            1713,
+            1714,
+            1715,
+            1716,
+            1717,
+            1718,
+            1719,
+            1720,
+            1721,
+            1722,
+            1723,
+            1724,
+            1725,
+            1726,
+            1727,
+            1728,
+            948,
+            1729,
+            1730,
+            1731,
+            1732,
+            1733,
+            1734,
+            1735,
+            1736,
+            1737,
+            1738,
+            1739,
+            1740,
+            1741,
+            1742,
+            1743,
+            1744,
+            1745,
+            1746,
+            1747,
+        ),
+    ),
+    c_types=(
+        "struct window_params",
+        "struct dungeon_id_8",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "int16_t",
+        "fx32_8",
+        "fx32_8",
+        "int16_t[2]",
+        "int16_t[2]",
+        "int16_t[2]",
+        "fx32_8",
+        "int16_t[2]",
+        "fx32_8",
+        "fx32_8",
+        "int16_t[2]",
+        "int16_t[2]",
+        "int",
+        "fx32_8",
+        "int16_t[2]",
+        "int16_t[2]",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "int",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "int16_t[2]",
+        "int16_t[2]",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "fx32_8",
+        "struct type_id_8[8]",
+        "fx32_8[4]",
+        "int16_t[8]",
+        "int16_t[8]",
+        "int16_t[8]",
+        "int16_t[8]",
+        "fx32_8[4]",
+        "fx32_8[4]",
+        "fx32_8[4]",
+        "fx32_8[4]",
+        "fx32_8[8]",
+        "struct item_id_16[36]",
+        "struct castform_weather_attributes[8]",
+        "int16_t[30]",
+        "struct type_matchup_combinator_table",
+        "fx32_8[21]",
+        "fx32_8[21]",
+        "struct wildcard_move_desc[15]",
+        "struct item_id_16[66]",
+        "int16_t[102]",
+        "struct natural_gift_item_info[34]",
+        "struct music_id_16[30][4]",
+        "int16_t[144]",
+        "fx32_8[21]",
+        "fx32_8[21]",
+        "fx32_8[21]",
+        "fx32_8[21]",
+        "struct music_id_16[170]",
+        "struct type_matchup_table",
+        "struct fixed_room_monster_spawn_stats_entry[99]",
+        "struct wildcard_move_desc[168]",
+        "struct tileset_property[199]",
+        "struct fixed_room_properties_entry[256]",
+        "struct trap_animation[26]",
+        "struct item_animation[1400]",
+        "struct move_animation[563]",
+        "struct effect_animation[700]",
+        "struct special_monster_move_animation[7422]",
+        "struct data_processing_instruction",
+    ),
+    multi={},
+)
@@ -0,0 +1,516 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay11 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "UnlockScriptingLock",
+        "FuncThatCallsRunNextOpcode",
+        "RunNextOpcode",
+        "HandleUnlocks",
+        "LoadFileFromRomVeneer",
+        "SsbLoad2",
+        "ScriptParamToInt",
+        "ScriptParamToFixedPoint16",
+        "StationLoadHanger",
+        "ScriptStationLoadTalk",
+        "SsbLoad1",
+        "ScriptSpecialProcessCall",
+        "GetCoroutineInfo",
+        "GetSpecialRecruitmentSpecies",
+        "PrepareMenuAcceptTeamMember",
+        "InitRandomNpcJobs",
+        "GetRandomNpcJobType",
+        "GetRandomNpcJobSubtype",
+        "GetRandomNpcJobStillAvailable",
+        "AcceptRandomNpcJob",
+        "GroundMainLoop",
+        "GetAllocArenaGround",
+        "GetFreeArenaGround",
+        "GroundMainReturnDungeon",
+        "GroundMainNextDay",
+        "JumpToTitleScreen",
+        "ReturnToTitleScreen",
+        "ScriptSpecialProcess0x16",
+        "IsScreenFadeInProgress",
+        "LoadBackgroundAttributes",
+        "LoadMapType10",
+        "LoadMapType11",
+        "GetSpecialLayoutBackground",
+        "SetAnimDataFields",
+        "SetAnimDataFieldsWrapper",
+        "InitAnimDataFromOtherAnimData",
+        "SetAnimDataFields2",
+        "GetIdleAnimationType",
+        "LoadObjectAnimData",
+        "InitAnimDataFromOtherAnimDataVeneer",
+        "AnimRelatedFunction",
+        "AllocAndInitPartnerFollowDataAndLiveActorList",
+        "InitPartnerFollowDataAndLiveActorList",
+        "DeleteLiveActor",
+        "ChangeActorAnimation",
+        "InitPartnerFollowData",
+        "GetDirectionLiveActor",
+        "SetDirectionLiveActor",
+        "CreateTeamInfoBox",
+        "CloseTeamInfoBox",
+        "IsTeamInfoBoxActive",
+        "UpdateTeamInfoBox",
+        "CreateTopGroundMenu",
+        "CloseTopGroundMenu",
+        "UpdateTopGroundMenu",
+        "IsBagNotEmpty",
+        "SprintfStatic",
+        "GetExclusiveItemRequirements",
+        "HandleControlsTopScreenGround",
+        "GetDungeonMapPos",
+        "WorldMapSetMode",
+        "WorldMapSetCamera",
+        "StatusUpdate",
+        "HandleTeamStatsGround",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xEF0,
+            0xF24,
+            0x1B24,
+            0x8110,
+            0x849C,
+            0x84BC,
+            0x866C,
+            0x86A0,
+            0x8994,
+            0x91A4,
+            0x9B10,
+            0xAED8,
+            0xBD78,
+            0xBDFC,
+            0xBE40,
+            0xBEE4,
+            0xBF7C,
+            0xBF94,
+            0xBFB0,
+            0xC018,
+            0xC534,
+            0xD11C,
+            0xD180,
+            0xD1D4,
+            0xD1F8,
+            0xD39C,
+            0xD454,
+            0xD4B4,
+            0xDD38,
+            0xF900,
+            0x10AE4,
+            0x11004,
+            0x1531C,
+            0x185DC,
+            0x1871C,
+            0x18A24,
+            0x190A8,
+            0x19B10,
+            0x1AC20,
+            0x1ACC8,
+            0xFFFFFFFF,
+            0x1BA7C,
+            0x1BAD8,
+            0x1C338,
+            0x1D188,
+            0x1F7E8,
+            0x20F68,
+            0x20F78,
+            0x22C54,
+            0x22D0C,
+            0x22D44,
+            0x22D64,
+            0x24B48,
+            0x24CB4,
+            0x24D10,
+            0x28884,
+            0x2CC8C,
+            0x2ECF8,
+            0x323D8,
+            0x32B08,
+            0x32DC4,
+            0x32E84,
+            0x37858,
+            0x3789C,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x22DD130,
+            0x22DD164,
+            0x22DDD64,
+            0x22E4350,
+            0x22E46DC,
+            0x22E46FC,
+            0x22E48AC,
+            0x22E48E0,
+            0x22E4BD4,
+            0x22E53E4,
+            0x22E5D50,
+            0x22E7118,
+            0x22E7FB8,
+            0x22E803C,
+            0x22E8080,
+            0x22E8124,
+            0x22E81BC,
+            0x22E81D4,
+            0x22E81F0,
+            0x22E8258,
+            0x22E8774,
+            0x22E935C,
+            0x22E93C0,
+            0x22E9414,
+            0x22E9438,
+            0x22E95DC,
+            0x22E9694,
+            0x22E96F4,
+            0x22E9F78,
+            0x22EBB40,
+            0x22ECD24,
+            0x22ED244,
+            0x22F155C,
+            0x22F481C,
+            0x22F495C,
+            0x22F4C64,
+            0x22F52E8,
+            0x22F5D50,
+            0x22F6E60,
+            0x22F6F08,
+            0xFFFFFFFF,
+            0x22F7CBC,
+            0x22F7D18,
+            0x22F8578,
+            0x22F93C8,
+            0x22FBA28,
+            0x22FD1A8,
+            0x22FD1B8,
+            0x22FEE94,
+            0x22FEF4C,
+            0x22FEF84,
+            0x22FEFA4,
+            0x2300D88,
+            0x2300EF4,
+            0x2300F50,
+            0x2304AC4,
+            0x2308ECC,
+            0x230AF38,
+            0x230E618,
+            0x230ED48,
+            0x230F004,
+            0x230F0C4,
+            0x2313A98,
+            0x2313ADC,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1748,
+            1749,
+            1750,
+            1751,
+            1752,
+            1,
+            1753,
+            1754,
+            1,
+            1,
+            1,
+            1755,
+            1756,
+            1757,
+            1758,
+            1759,
+            1760,
+            1761,
+            1762,
+            1763,
+            1764,
+            1765,
+            1766,
+            1767,
+            1768,
+            1769,
+            1770,
+            1771,
+            1772,
+            1773,
+            1774,
+            1774,
+            1775,
+            1776,
+            1777,
+            1778,
+            1779,
+            1780,
+            1781,
+            1782,
+            1783,
+            1784,
+            1785,
+            1786,
+            1787,
+            1788,
+            1789,
+            1790,
+            1791,
+            1792,
+            1793,
+            1794,
+            1795,
+            1796,
+            1797,
+            1798,
+            1799,
+            1800,
+            1801,
+            1802,
+            1803,
+            1804,
+            1805,
+            1806,
+        ),
+    ),
+    c_types=None,
+    multi={
+        40: ((0x1ACD4, 0x1AE24), (0x22F6F14, 0x22F7064)),
+    },
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "OVERLAY11_UNKNOWN_TABLE__NA_2316A38",
+        "SCRIPT_COMMAND_PARSING_DATA",
+        "SCRIPT_OP_CODE_NAMES",
+        "SCRIPT_OP_CODES",
+        "OVERLAY11_DEBUG_STRINGS",
+        "C_ROUTINE_NAMES",
+        "C_ROUTINES",
+        "GROUND_WEATHER_TABLE",
+        "GROUND_WAN_FILES_TABLE",
+        "OBJECTS",
+        "RECRUITMENT_TABLE_LOCATIONS",
+        "RECRUITMENT_TABLE_LEVELS",
+        "RECRUITMENT_TABLE_SPECIES",
+        "LEVEL_TILEMAP_LIST",
+        "SETANIMATION_TABLE",
+        "TEAM_INFO_BOX_DEFAULT_WINDOW_PARAMS",
+        "OVERLAY11_OVERLAY_LOAD_TABLE",
+        "UNIONALL_RAM_ADDRESS",
+        "GROUND_STATE_MAP",
+        "GROUND_STATE_WEATHER",
+        "GROUND_STATE_PTRS",
+        "WORLD_MAP_MODE",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x3A7F8,
+            0x3A898,
+            0x3A8B8,
+            0x3C3D0,
+            0x3CFC8,
+            0x3D8AC,
+            0x405E8,
+            0x41BD0,
+            0x41C00,
+            0x42C14,
+            0x44654,
+            0x4466C,
+            0x44698,
+            0x44AEC,
+            0x4568C,
+            0x4621C,
+            0x46E2C,
+            0x48A64,
+            0x48A80,
+            0xFFFFFFFF,
+            0x48AB4,
+            0x48BA4,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x2316A38,
+            0x2316AD8,
+            0x2316AF8,
+            0x2318610,
+            0x2319208,
+            0x2319AEC,
+            0x231C828,
+            0x231DE10,
+            0x231DE40,
+            0x231EE54,
+            0x2320894,
+            0x23208AC,
+            0x23208D8,
+            0x2320D2C,
+            0x23218CC,
+            0x232245C,
+            0x232306C,
+            0x2324CA4,
+            0x2324CC0,
+            0xFFFFFFFF,
+            0x2324CF4,
+            0x2324DE4,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xA0,
+            0x20,
+            0x1B18,
+            0xBF8,
+            0x8E4,
+            0x2D3C,
+            0x15E8,
+            0x30,
+            0x1014,
+            0x1A04,
+            0x16,
+            0x2C,
+            0x2C,
+            0x288,
+            0xA8,
+            0x10,
+            0x150,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x18,
+            0x4,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1807,
+            1808,
+            1809,
+            1810,
+            1811,
+            1812,
+            1813,
+            1814,
+            1815,
+            1816,
+            1817,
+            1818,
+            1819,
+            1820,
+            1821,
+            1822,
+            1823,
+            1025,
+            1025,
+            1824,
+            1825,
+            1826,
+        ),
+    ),
+    c_types=(
+        "",
+        "undefined[32]",
+        "char[0]",
+        "struct script_opcode_table",
+        "char[0]",
+        "char[0]",
+        "struct common_routine_table",
+        "struct ground_weather_entry[12]",
+        "char[343][12]",
+        "struct script_object[0]",
+        "struct dungeon_id_16[22]",
+        "int16_t[22]",
+        "struct monster_id_16[22]",
+        "struct level_tilemap_list_entry[81]",
+        "struct animation_data[84]",
+        "struct window_params",
+        "struct overlay_load_entry[21]",
+        "",
+        "",
+        "",
+        "struct main_ground_data",
+        "uint32_t",
+    ),
+    multi={},
+)
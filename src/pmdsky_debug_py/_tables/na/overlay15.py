@@ -0,0 +1,83 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay15 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+
+DATA = SymbolTable(
+    names=(
+        "BANK_MAIN_MENU_ITEMS",
+        "BANK_WINDOW_PARAMS_1",
+        "BANK_WINDOW_PARAMS_2",
+        "BANK_WINDOW_PARAMS_3",
+        "BANK_WINDOW_PARAMS_4",
+        "BANK_WINDOW_PARAMS_5",
+        "OVERLAY15_RESERVED_SPACE",
+        "OVERLAY15_UNKNOWN_POINTER__NA_238B180",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xF14,
+            0xF3C,
+            0xF4C,
+            0xF5C,
+            0xF6C,
+            0xF7C,
+            0x1024,
+            0x1040,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238B054,
+            0x238B07C,
+            0x238B08C,
+            0x238B09C,
+            0x238B0AC,
+            0x238B0BC,
+            0x238B164,
+            0x238B180,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0x28,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x1C,
+            0x4,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "struct simple_menu_id_item[5]",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "",
+    ),
+    multi={},
+)
@@ -0,0 +1,119 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay16 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+
+DATA = SymbolTable(
+    names=(
+        "EVO_MENU_ITEMS_CONFIRM",
+        "EVO_SUBMENU_ITEMS",
+        "EVO_MAIN_MENU_ITEMS",
+        "EVO_MENU_STRING_IDS",
+        "EVO_WINDOW_PARAMS_1",
+        "EVO_WINDOW_PARAMS_2",
+        "EVO_WINDOW_PARAMS_3",
+        "EVO_WINDOW_PARAMS_4",
+        "EVO_WINDOW_PARAMS_5",
+        "EVO_WINDOW_PARAMS_6",
+        "EVO_WINDOW_PARAMS_7",
+        "OVERLAY16_RESERVED_SPACE",
+        "OVERLAY16_UNKNOWN_POINTER__NA_238CE40",
+        "OVERLAY16_UNKNOWN_POINTER__NA_238CE58",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x2BC8,
+            0x2BE0,
+            0x2C00,
+            0x2C20,
+            0x2C54,
+            0x2C64,
+            0x2C74,
+            0x2C84,
+            0x2C94,
+            0x2CA4,
+            0x2CB4,
+            0x2CF4,
+            0x2D00,
+            0x2D18,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238CD08,
+            0x238CD20,
+            0x238CD40,
+            0x238CD60,
+            0x238CD94,
+            0x238CDA4,
+            0x238CDB4,
+            0x238CDC4,
+            0x238CDD4,
+            0x238CDE4,
+            0x238CDF4,
+            0x238CE34,
+            0x238CE40,
+            0x238CE58,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0x18,
+            0x20,
+            0x20,
+            0x34,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0xC,
+            0x4,
+            0x4,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1,
+            1,
+            1,
+            1883,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "uint16_t[26]",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "",
+        "",
+    ),
+    multi={},
+)
@@ -0,0 +1,155 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay17 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+
+DATA = SymbolTable(
+    names=(
+        "ASSEMBLY_WINDOW_PARAMS_1",
+        "ASSEMBLY_WINDOW_PARAMS_2",
+        "ASSEMBLY_WINDOW_PARAMS_3",
+        "ASSEMBLY_WINDOW_PARAMS_4",
+        "ASSEMBLY_WINDOW_PARAMS_5",
+        "ASSEMBLY_MENU_ITEMS_CONFIRM",
+        "ASSEMBLY_MAIN_MENU_ITEMS_1",
+        "ASSEMBLY_MAIN_MENU_ITEMS_2",
+        "ASSEMBLY_SUBMENU_ITEMS_1",
+        "ASSEMBLY_SUBMENU_ITEMS_2",
+        "ASSEMBLY_SUBMENU_ITEMS_3",
+        "ASSEMBLY_SUBMENU_ITEMS_4",
+        "ASSEMBLY_SUBMENU_ITEMS_5",
+        "ASSEMBLY_SUBMENU_ITEMS_6",
+        "ASSEMBLY_SUBMENU_ITEMS_7",
+        "OVERLAY17_FUNCTION_POINTER_TABLE",
+        "OVERLAY17_RESERVED_SPACE",
+        "OVERLAY17_UNKNOWN_POINTER__NA_238BE00",
+        "OVERLAY17_UNKNOWN_POINTER__NA_238BE04",
+        "OVERLAY17_UNKNOWN_POINTER__NA_238BE08",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x19F4,
+            0x1A04,
+            0x1A14,
+            0x1A24,
+            0x1A34,
+            0x1A44,
+            0x1A5C,
+            0x1A74,
+            0x1A94,
+            0x1ABC,
+            0x1AEC,
+            0x1B1C,
+            0x1B54,
+            0x1B8C,
+            0x1BC4,
+            0x1C04,
+            0x1CAC,
+            0x1CC0,
+            0x1CC4,
+            0x1CC8,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238BB34,
+            0x238BB44,
+            0x238BB54,
+            0x238BB64,
+            0x238BB74,
+            0x238BB84,
+            0x238BB9C,
+            0x238BBB4,
+            0x238BBD4,
+            0x238BBFC,
+            0x238BC2C,
+            0x238BC5C,
+            0x238BC94,
+            0x238BCCC,
+            0x238BD04,
+            0x238BD44,
+            0x238BDEC,
+            0x238BE00,
+            0x238BE04,
+            0x238BE08,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x18,
+            0x18,
+            0x20,
+            0x28,
+            0x30,
+            0x30,
+            0x38,
+            0x38,
+            0x38,
+            0x40,
+            0xA8,
+            0x14,
+            0x4,
+            0x4,
+            0x4,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            266,
+            266,
+            266,
+            266,
+            266,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[5]",
+        "struct simple_menu_id_item[6]",
+        "struct simple_menu_id_item[6]",
+        "struct simple_menu_id_item[7]",
+        "struct simple_menu_id_item[7]",
+        "struct simple_menu_id_item[7]",
+        "struct simple_menu_id_item[8]",
+        "void*[42]",
+        "",
+        "",
+        "",
+        "",
+    ),
+    multi={},
+)
@@ -0,0 +1,196 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay19 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "GetBarItem",
+        "GetRecruitableMonsterAll",
+        "GetRecruitableMonsterList",
+        "GetRecruitableMonsterListRestricted",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x0,
+            0x84,
+            0x134,
+            0x1DC,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238A140,
+            0x238A1C4,
+            0x238A274,
+            0x238A31C,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1884,
+            1885,
+            1885,
+            1885,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "OVERLAY19_UNKNOWN_TABLE__NA_238DAE0",
+        "BAR_UNLOCKABLE_DUNGEONS_TABLE",
+        "BAR_RECRUITABLE_MONSTER_TABLE",
+        "BAR_AVAILABLE_ITEMS",
+        "OVERLAY19_UNKNOWN_STRING_IDS__NA_238E178",
+        "OVERLAY19_UNKNOWN_STRUCT__NA_238E1A4",
+        "OVERLAY19_UNKNOWN_STRING_IDS__NA_238E1CC",
+        "BAR_WINDOW_PARAMS_1",
+        "BAR_WINDOW_PARAMS_2",
+        "BAR_WINDOW_PARAMS_3",
+        "BAR_MENU_ITEMS_CONFIRM_1",
+        "BAR_MENU_ITEMS_CONFIRM_2",
+        "OVERLAY19_UNKNOWN_STRING_IDS__NA_238E238",
+        "BAR_MAIN_MENU_ITEMS",
+        "BAR_SUBMENU_ITEMS_1",
+        "BAR_SUBMENU_ITEMS_2",
+        "OVERLAY19_RESERVED_SPACE",
+        "OVERLAY19_UNKNOWN_POINTER__NA_238E360",
+        "OVERLAY19_UNKNOWN_POINTER__NA_238E364",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x39A0,
+            0x39A8,
+            0x39B4,
+            0x3A8C,
+            0x4038,
+            0x4064,
+            0x408C,
+            0x4098,
+            0x40A8,
+            0x40B8,
+            0x40C8,
+            0x40E0,
+            0x40F8,
+            0x4110,
+            0x4130,
+            0x4150,
+            0x4204,
+            0x4220,
+            0x4224,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238DAE0,
+            0x238DAE8,
+            0x238DAF4,
+            0x238DBCC,
+            0x238E178,
+            0x238E1A4,
+            0x238E1CC,
+            0x238E1D8,
+            0x238E1E8,
+            0x238E1F8,
+            0x238E208,
+            0x238E220,
+            0x238E238,
+            0x238E250,
+            0x238E270,
+            0x238E290,
+            0x238E344,
+            0x238E360,
+            0x238E364,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0x8,
+            0xC,
+            0xD8,
+            0x5AC,
+            0x2C,
+            0x28,
+            0xC,
+            0x10,
+            0x10,
+            0x10,
+            0x18,
+            0x18,
+            0x18,
+            0x20,
+            0x20,
+            0x30,
+            0x1C,
+            0x4,
+            0x4,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1886,
+            1887,
+            1888,
+            1889,
+            266,
+            1890,
+            266,
+            266,
+            266,
+            266,
+            1,
+            1,
+            266,
+            1,
+            1,
+            1,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "",
+        "struct dungeon_id_16[6]",
+        "struct monster_id_16[108]",
+        "struct bar_item[66]",
+        "",
+        "",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[6]",
+        "",
+        "",
+        "",
+    ),
+    multi={},
+)
@@ -0,0 +1,185 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay20 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+
+DATA = SymbolTable(
+    names=(
+        "OVERLAY20_UNKNOWN_POINTER__NA_238CF7C",
+        "RECYCLE_MENU_ITEMS_CONFIRM_1",
+        "RECYCLE_MENU_ITEMS_CONFIRM_2",
+        "RECYCLE_SUBMENU_ITEMS_1",
+        "RECYCLE_SUBMENU_ITEMS_2",
+        "RECYCLE_MAIN_MENU_ITEMS_1",
+        "OVERLAY20_UNKNOWN_TABLE__NA_238D014",
+        "RECYCLE_WINDOW_PARAMS_1",
+        "RECYCLE_WINDOW_PARAMS_2",
+        "RECYCLE_WINDOW_PARAMS_3",
+        "RECYCLE_WINDOW_PARAMS_4",
+        "RECYCLE_WINDOW_PARAMS_5",
+        "RECYCLE_WINDOW_PARAMS_6",
+        "RECYCLE_MAIN_MENU_ITEMS_2",
+        "RECYCLE_WINDOW_PARAMS_7",
+        "RECYCLE_WINDOW_PARAMS_8",
+        "RECYCLE_WINDOW_PARAMS_9",
+        "RECYCLE_WINDOW_PARAMS_10",
+        "RECYCLE_WINDOW_PARAMS_11",
+        "RECYCLE_MAIN_MENU_ITEMS_3",
+        "OVERLAY20_RESERVED_SPACE",
+        "OVERLAY20_UNKNOWN_POINTER__NA_238D120",
+        "OVERLAY20_UNKNOWN_POINTER__NA_238D124",
+        "OVERLAY20_UNKNOWN_POINTER__NA_238D128",
+        "OVERLAY20_UNKNOWN_POINTER__NA_238D12C",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x2E3C,
+            0x2E44,
+            0x2E5C,
+            0x2E74,
+            0x2E8C,
+            0x2EAC,
+            0x2ED4,
+            0x2EE8,
+            0x2EF8,
+            0x2F08,
+            0x2F18,
+            0x2F28,
+            0x2F38,
+            0x2F48,
+            0x2F68,
+            0x2F78,
+            0x2F88,
+            0x2F98,
+            0x2FA8,
+            0x2FB8,
+            0x2FD0,
+            0x2FE0,
+            0x2FE4,
+            0x2FE8,
+            0x2FEC,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238CF7C,
+            0x238CF84,
+            0x238CF9C,
+            0x238CFB4,
+            0x238CFCC,
+            0x238CFEC,
+            0x238D014,
+            0x238D028,
+            0x238D038,
+            0x238D048,
+            0x238D058,
+            0x238D068,
+            0x238D078,
+            0x238D088,
+            0x238D0A8,
+            0x238D0B8,
+            0x238D0C8,
+            0x238D0D8,
+            0x238D0E8,
+            0x238D0F8,
+            0x238D110,
+            0x238D120,
+            0x238D124,
+            0x238D128,
+            0x238D12C,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0x8,
+            0x18,
+            0x18,
+            0x18,
+            0x20,
+            0x28,
+            0x14,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x20,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x18,
+            0x10,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            266,
+            1,
+            1,
+            1,
+            1,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[5]",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[4]",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[3]",
+        "",
+        "",
+        "",
+        "",
+        "",
+    ),
+    multi={},
+)
@@ -0,0 +1,155 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay21 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+
+DATA = SymbolTable(
+    names=(
+        "SWAP_SHOP_WINDOW_PARAMS_1",
+        "SWAP_SHOP_MENU_ITEMS_CONFIRM",
+        "SWAP_SHOP_SUBMENU_ITEMS_1",
+        "SWAP_SHOP_SUBMENU_ITEMS_2",
+        "SWAP_SHOP_MAIN_MENU_ITEMS_1",
+        "SWAP_SHOP_MAIN_MENU_ITEMS_2",
+        "SWAP_SHOP_SUBMENU_ITEMS_3",
+        "OVERLAY21_UNKNOWN_STRING_IDS",
+        "SWAP_SHOP_WINDOW_PARAMS_2",
+        "SWAP_SHOP_WINDOW_PARAMS_3",
+        "SWAP_SHOP_WINDOW_PARAMS_4",
+        "SWAP_SHOP_WINDOW_PARAMS_5",
+        "SWAP_SHOP_WINDOW_PARAMS_6",
+        "SWAP_SHOP_WINDOW_PARAMS_7",
+        "SWAP_SHOP_WINDOW_PARAMS_8",
+        "SWAP_SHOP_WINDOW_PARAMS_9",
+        "OVERLAY21_JP_STRING",
+        "OVERLAY21_RESERVED_SPACE",
+        "OVERLAY21_UNKNOWN_POINTER__NA_238CF40",
+        "OVERLAY21_UNKNOWN_POINTER__NA_238CF44",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x28E8,
+            0x28F8,
+            0x2910,
+            0x2928,
+            0x2948,
+            0x2968,
+            0x2990,
+            0x29C0,
+            0x29F8,
+            0x2A08,
+            0x2A18,
+            0x2A28,
+            0x2A38,
+            0x2A48,
+            0x2A58,
+            0x2A68,
+            0x2DDC,
+            0x2DF8,
+            0x2E00,
+            0x2E04,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238CA28,
+            0x238CA38,
+            0x238CA50,
+            0x238CA68,
+            0x238CA88,
+            0x238CAA8,
+            0x238CAD0,
+            0x238CB00,
+            0x238CB38,
+            0x238CB48,
+            0x238CB58,
+            0x238CB68,
+            0x238CB78,
+            0x238CB88,
+            0x238CB98,
+            0x238CBA8,
+            0x238CF1C,
+            0x238CF38,
+            0x238CF40,
+            0x238CF44,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0x10,
+            0x18,
+            0x18,
+            0x20,
+            0x20,
+            0x28,
+            0x30,
+            0x38,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x8,
+            0x8,
+            0x4,
+            0x4,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            266,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1891,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "struct window_params",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[5]",
+        "struct simple_menu_id_item[6]",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "",
+        "",
+        "",
+    ),
+    multi={},
+)
@@ -0,0 +1,149 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay23 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+
+DATA = SymbolTable(
+    names=(
+        "OVERLAY23_UNKNOWN_VALUE__NA_238D2E8",
+        "OVERLAY23_UNKNOWN_VALUE__NA_238D2EC",
+        "OVERLAY23_UNKNOWN_STRUCT__NA_238D2F0",
+        "STORAGE_MENU_ITEMS_CONFIRM",
+        "STORAGE_MAIN_MENU_ITEMS_1",
+        "STORAGE_MAIN_MENU_ITEMS_2",
+        "STORAGE_MAIN_MENU_ITEMS_3",
+        "STORAGE_MAIN_MENU_ITEMS_4",
+        "OVERLAY23_UNKNOWN_STRING_IDS",
+        "STORAGE_WINDOW_PARAMS_1",
+        "STORAGE_WINDOW_PARAMS_2",
+        "STORAGE_WINDOW_PARAMS_3",
+        "STORAGE_WINDOW_PARAMS_4",
+        "STORAGE_WINDOW_PARAMS_5",
+        "STORAGE_WINDOW_PARAMS_6",
+        "STORAGE_WINDOW_PARAMS_7",
+        "STORAGE_WINDOW_PARAMS_8",
+        "OVERLAY23_RESERVED_SPACE",
+        "OVERLAY23_UNKNOWN_POINTER__NA_238D8A0",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x31A8,
+            0x31AC,
+            0x31B0,
+            0x31BC,
+            0x31D4,
+            0x31F4,
+            0x3214,
+            0x3234,
+            0x325C,
+            0x3288,
+            0x3298,
+            0x32A8,
+            0x32B8,
+            0x32C8,
+            0x32D8,
+            0x32E8,
+            0x32F8,
+            0x3748,
+            0x3760,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238D2E8,
+            0x238D2EC,
+            0x238D2F0,
+            0x238D2FC,
+            0x238D314,
+            0x238D334,
+            0x238D354,
+            0x238D374,
+            0x238D39C,
+            0x238D3C8,
+            0x238D3D8,
+            0x238D3E8,
+            0x238D3F8,
+            0x238D408,
+            0x238D418,
+            0x238D428,
+            0x238D438,
+            0x238D888,
+            0x238D8A0,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0x4,
+            0x4,
+            0xC,
+            0x18,
+            0x20,
+            0x20,
+            0x20,
+            0x28,
+            0x2C,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x18,
+            0x4,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            266,
+            266,
+            266,
+            1,
+            1,
+            1,
+            1,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "",
+        "",
+        "",
+        "struct simple_menu_id_item[3]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[5]",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "",
+    ),
+    multi={},
+)
@@ -0,0 +1,77 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay26 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+
+DATA = SymbolTable(
+    names=(
+        "OVERLAY26_UNKNOWN_TABLE__NA_238AE20",
+        "OVERLAY26_RESERVED_SPACE",
+        "OVERLAY26_UNKNOWN_POINTER__NA_238AF60",
+        "OVERLAY26_UNKNOWN_POINTER__NA_238AF64",
+        "OVERLAY26_UNKNOWN_POINTER__NA_238AF68",
+        "OVERLAY26_UNKNOWN_POINTER__NA_238AF6C",
+        "OVERLAY26_UNKNOWN_POINTER5__NA_238AF70",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xCE0,
+            0xE08,
+            0xE20,
+            0xE24,
+            0xE28,
+            0xE2C,
+            0xE30,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x238AE20,
+            0x238AF48,
+            0x238AF60,
+            0x238AF64,
+            0x238AF68,
+            0x238AF6C,
+            0x238AF70,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0x8C,
+            0x18,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1892,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+    ),
+    multi={},
+)
@@ -0,0 +1,4789 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay29 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "GetWeatherColorTable",
+        "DungeonAlloc",
+        "GetDungeonPtrMaster",
+        "DungeonZInit",
+        "DungeonFree",
+        "RunDungeon",
+        "EntityIsValid",
+        "GetFloorType",
+        "TryForcedLoss",
+        "IsBossFight",
+        "IsCurrentFixedRoomBossFight",
+        "IsMarowakTrainingMaze",
+        "FixedRoomIsSubstituteRoom",
+        "StoryRestrictionsEnabled",
+        "GetScenarioBalanceVeneer",
+        "FadeToBlack",
+        "CheckTouchscreenArea",
+        "GetTrapInfo",
+        "GetItemInfo",
+        "GetTileAtEntity",
+        "UpdateEntityPixelPos",
+        "SetEntityPixelPosXY",
+        "IncrementEntityPixelPosXY",
+        "CreateEnemyEntity",
+        "SpawnTrap",
+        "SpawnItemEntity",
+        "ShouldMinimapDisplayEntity",
+        "ShouldDisplayEntity",
+        "ShouldDisplayEntityWrapper",
+        "CanSeeTarget",
+        "CanTargetEntity",
+        "CanTargetPosition",
+        "PopulateActiveMonsterPtrs",
+        "GetTeamMemberIndex",
+        "SubstitutePlaceholderStringTags",
+        "UpdateMapSurveyorFlag",
+        "PointCameraToMonster",
+        "UpdateCamera",
+        "ItemIsActive",
+        "GetVisibilityRange",
+        "RevealWholeFloor",
+        "PlayEffectAnimationEntity",
+        "PlayEffectAnimationPos",
+        "PlayEffectAnimationPixelPos",
+        "AnimationDelayOrSomething",
+        "UpdateStatusIconFlags",
+        "PlayEffectAnimation0x171Full",
+        "PlayEffectAnimation0x171",
+        "ShowPpRestoreEffect",
+        "ShouldDisplayEntityAdvanced",
+        "PlayEffectAnimation0x1A9",
+        "PlayEffectAnimation0x18E",
+        "LoadMappaFileAttributes",
+        "GetItemIdToSpawn",
+        "CopySpawnEntriesMaster",
+        "MonsterSpawnListPartialCopy",
+        "IsOnMonsterSpawnList",
+        "GetMonsterIdToSpawn",
+        "GetMonsterLevelToSpawn",
+        "AllocTopScreenStatus",
+        "FreeTopScreenStatus",
+        "InitializeTeamStats",
+        "UpdateTeamStatsWrapper",
+        "FreeTeamStatsWrapper",
+        "AssignTopScreenHandlers",
+        "HandleTopScreenFades",
+        "FreeTopScreen",
+        "GetDirectionTowardsPosition",
+        "GetChebyshevDistance",
+        "IsPositionActuallyInSight",
+        "IsPositionInSight",
+        "GetLeader",
+        "GetLeaderMonster",
+        "GetRandomTile",
+        "FindNearbyUnoccupiedTile",
+        "FindClosestUnoccupiedTileWithin2",
+        "FindFarthestUnoccupiedTileWithin2",
+        "FindUnoccupiedTileWithin3",
+        "TickStatusTurnCounter",
+        "AdvanceFrame",
+        "DisplayAnimatedNumbers",
+        "SetDungeonRngPreseed23Bit",
+        "GenerateDungeonRngSeed",
+        "GetDungeonRngPreseed",
+        "SetDungeonRngPreseed",
+        "InitDungeonRng",
+        "DungeonRand16Bit",
+        "DungeonRandInt",
+        "DungeonRandRange",
+        "DungeonRandOutcome",
+        "CalcStatusDuration",
+        "DungeonRngUnsetSecondary",
+        "DungeonRngSetSecondary",
+        "DungeonRngSetPrimary",
+        "MusicTableIdxToMusicId",
+        "ChangeDungeonMusic",
+        "TrySwitchPlace",
+        "SetLeaderActionFields",
+        "ClearMonsterActionFields",
+        "SetMonsterActionFields",
+        "SetActionPassTurnOrWalk",
+        "GetItemToUseByIndex",
+        "GetItemToUse",
+        "GetItemAction",
+        "RemoveUsedItem",
+        "AddDungeonSubMenuOption",
+        "DisableDungeonSubMenuOption",
+        "SetActionRegularAttack",
+        "SetActionUseMovePlayer",
+        "SetActionUseMoveAi",
+        "RunFractionalTurn",
+        "RunLeaderTurn",
+        "TrySpawnMonsterAndActivatePlusMinus",
+        "IsFloorOver",
+        "DecrementWindCounter",
+        "IsDungeonEndReasonFailure",
+        "SetForcedLossReason",
+        "GetForcedLossReason",
+        "BindTrapToTile",
+        "AreLateGameTrapsEnabledWrapper",
+        "SpawnEnemyTrapAtPos",
+        "PrepareTrapperTrap",
+        "TrySpawnTrap",
+        "TrySpawnTrapperTrap",
+        "TryRemoveTrap",
+        "TryTriggerTrap",
+        "ApplyMudTrapEffect",
+        "ApplyStickyTrapEffect",
+        "ApplyGrimyTrapEffect",
+        "ApplyPitfallTrapEffect",
+        "ApplySummonTrapEffect",
+        "ApplyPpZeroTrapEffect",
+        "ApplyPokemonTrapEffect",
+        "ApplyTripTrapEffect",
+        "ApplyStealthRockTrapEffect",
+        "ApplyToxicSpikesTrapEffect",
+        "ApplyRandomTrapEffect",
+        "ApplyGrudgeTrapEffect",
+        "ApplyTrapEffect",
+        "RevealTrapsNearby",
+        "ShouldRunMonsterAi",
+        "DebugRecruitingEnabled",
+        "TryActivateIqBooster",
+        "IsSecretBazaarNpcBehavior",
+        "GetLeaderAction",
+        "GetEntityTouchscreenArea",
+        "SetLeaderAction",
+        "ShouldLeaderKeepRunning",
+        "CheckLeaderTile",
+        "ChangeLeader",
+        "UseSingleUseItemWrapper",
+        "UseSingleUseItem",
+        "UseThrowableItem",
+        "ResetDamageData",
+        "FreeLoadedAttackSpriteAndMore",
+        "SetAndLoadCurrentAttackAnimation",
+        "ClearLoadedAttackSprite",
+        "GetLoadedAttackSpriteId",
+        "DungeonGetTotalSpriteFileSize",
+        "DungeonGetSpriteIndex",
+        "JoinedAtRangeCheck2Veneer",
+        "FloorNumberIsEven",
+        "GetKecleonIdToSpawnByFloor",
+        "StoreSpriteFileIndexBothGenders",
+        "LoadMonsterSpriteInner",
+        "SwapMonsterWanFileIndex",
+        "LoadMonsterSprite",
+        "DeleteMonsterSpriteFile",
+        "DeleteAllMonsterSpriteFiles",
+        "EuFaintCheck",
+        "HandleFaint",
+        "MoveMonsterToPos",
+        "CreateMonsterSummaryFromMonster",
+        "UpdateAiTargetPos",
+        "SetMonsterTypeAndAbility",
+        "TryActivateSlowStart",
+        "TryActivateArtificialWeatherAbilities",
+        "GetMonsterApparentId",
+        "TryActivateTraceAndColorChange",
+        "DefenderAbilityIsActive",
+        "IsMonster",
+        "TryActivateConversion2",
+        "TryActivateTruant",
+        "TryPointCameraToMonster",
+        "ReevaluateSnatchMonster",
+        "GetRandomExplorerMazeMonster",
+        "RestorePpAllMovesSetFlags",
+        "CheckTeamMemberIdxVeneer",
+        "IsMonsterIdInNormalRangeVeneer",
+        "BoostIQ",
+        "ShouldMonsterHeadToStairs",
+        "MewSpawnCheck",
+        "TryEndStatusWithAbility",
+        "ExclusiveItemEffectIsActive",
+        "GetTeamMemberWithIqSkill",
+        "TeamMemberHasEnabledIqSkill",
+        "TeamLeaderIqSkillIsEnabled",
+        "CountMovesOutOfPp",
+        "HasSuperEffectiveMoveAgainstUser",
+        "TryEatItem",
+        "SetDecoyAiTracker",
+        "CheckSpawnThreshold",
+        "HasLowHealth",
+        "AreEntitiesAdjacent",
+        "IsSpecialStoryAlly",
+        "IsExperienceLocked",
+        "InitOtherMonsterData",
+        "InitEnemySpawnStats",
+        "InitEnemyStatsAndMoves",
+        "SpawnTeam",
+        "SpawnInitialMonsters",
+        "SpawnMonster",
+        "InitTeamMember",
+        "InitMonster",
+        "SubInitMonster",
+        "MarkShopkeeperSpawn",
+        "SpawnShopkeepers",
+        "GetMaxHpAtLevel",
+        "GetOffensiveStatAtLevel",
+        "GetDefensiveStatAtLevel",
+        "GetOutlawSpawnData",
+        "ExecuteMonsterAction",
+        "TryActivateFlashFireOnAllMonsters",
+        "HasStatusThatPreventsActing",
+        "GetMobilityTypeCheckSlip",
+        "GetMobilityTypeCheckSlipAndFloating",
+        "IsInvalidSpawnTile",
+        "GetMobilityTypeAfterIqSkills",
+        "CannotStandOnTile",
+        "CalcSpeedStage",
+        "CalcSpeedStageWrapper",
+        "GetNumberOfAttacks",
+        "GetMonsterDisplayNameType",
+        "GetMonsterName",
+        "SprintfStatic",
+        "IsMonsterDrowsy",
+        "MonsterHasNonvolatileNonsleepStatus",
+        "MonsterHasImmobilizingStatus",
+        "MonsterHasAttackInterferingStatus",
+        "MonsterHasSkillInterferingStatus",
+        "MonsterHasLeechSeedStatus",
+        "MonsterHasWhifferStatus",
+        "IsMonsterVisuallyImpaired",
+        "IsMonsterMuzzled",
+        "MonsterHasMiracleEyeStatus",
+        "MonsterHasNegativeStatus",
+        "IsMonsterSleeping",
+        "CheckVariousStatuses2",
+        "CheckVariousConditions",
+        "CheckVariousStatuses",
+        "CanMonsterMoveInDirection",
+        "GetDirectionalMobilityType",
+        "IsMonsterCornered",
+        "CanAttackInDirection",
+        "CanAiMonsterMoveInDirection",
+        "ShouldMonsterRunAway",
+        "ShouldMonsterRunAwayVariation",
+        "GetTreatmentBetweenMonsters",
+        "SafeguardIsActive",
+        "LeafGuardIsActive",
+        "IsProtectedFromStatDrops",
+        "NoGastroAcidStatus",
+        "AbilityIsActive",
+        "AbilityIsActiveVeneer",
+        "OtherMonsterAbilityIsActive",
+        "LevitateIsActive",
+        "MonsterIsType",
+        "IsTypeAffectedByGravity",
+        "HasTypeAffectedByGravity",
+        "CanSeeInvisibleMonsters",
+        "IsTacticSet",
+        "HasDropeyeStatus",
+        "IqSkillIsEnabled",
+        "UpdateIqSkills",
+        "GetMoveTypeForMonster",
+        "GetMovePower",
+        "MonsterCanThrowItems",
+        "UpdateStateFlags",
+        "IsProtectedFromNegativeStatus",
+        "AddExpSpecial",
+        "EnemyEvolution",
+        "LevelUpItemEffect",
+        "TryDecreaseLevel",
+        "LevelUp",
+        "GetMonsterMoves",
+        "EvolveMonster",
+        "ChangeMonsterAnimation",
+        "GetIdleAnimationId",
+        "DetermineAllMonsterShadow",
+        "DetermineMonsterShadow",
+        "DisplayActions",
+        "CheckNonLeaderTile",
+        "EndNegativeStatusCondition",
+        "EndNegativeStatusConditionWrapper",
+        "TransferNegativeStatusCondition",
+        "EndSleepClassStatus",
+        "EndBurnClassStatus",
+        "EndFrozenClassStatus",
+        "EndCringeClassStatus",
+        "EndReflectClassStatus",
+        "TryRemoveSnatchedMonsterFromDungeonStruct",
+        "EndCurseClassStatus",
+        "EndLeechSeedClassStatus",
+        "EndSureShotClassStatus",
+        "EndInvisibleClassStatus",
+        "EndBlinkerClassStatus",
+        "EndMuzzledStatus",
+        "EndMiracleEyeStatus",
+        "EndMagnetRiseStatus",
+        "TransferNegativeBlinkerClassStatus",
+        "EndFrozenStatus",
+        "EndProtectStatus",
+        "TryRestoreRoostTyping",
+        "TryTriggerMonsterHouse",
+        "ShouldMonsterFollowLeader",
+        "RunMonsterAi",
+        "ApplyDamageAndEffects",
+        "ApplyDamage",
+        "AftermathCheck",
+        "GetTypeMatchupBothTypes",
+        "ScrappyShouldActivate",
+        "IsTypeIneffectiveAgainstGhost",
+        "GhostImmunityIsActive",
+        "GetTypeMatchup",
+        "CalcTypeBasedDamageEffects",
+        "CalcDamage",
+        "ApplyDamageAndEffectsWrapper",
+        "CalcRecoilDamageFixed",
+        "CalcDamageFixed",
+        "CalcDamageFixedNoCategory",
+        "CalcDamageFixedWrapper",
+        "UpdateShopkeeperModeAfterAttack",
+        "UpdateShopkeeperModeAfterTrap",
+        "ResetDamageCalcDiagnostics",
+        "SpecificRecruitCheck",
+        "RecruitCheck",
+        "TryRecruit",
+        "TrySpawnMonsterAndTickSpawnCounter",
+        "AiDecideUseItem",
+        "GetPossibleAiThrownItemDirections",
+        "GetPossibleAiArcItemTargets",
+        "TryNonLeaderItemPickUp",
+        "GetExclusiveItemWithEffectFromBag",
+        "AuraBowIsActive",
+        "ExclusiveItemOffenseBoost",
+        "ExclusiveItemDefenseBoost",
+        "TeamMemberHasItemActive",
+        "TeamMemberHasExclusiveItemEffectActive",
+        "TrySpawnEnemyItemDrop",
+        "TickNoSlipCap",
+        "TickStatusAndHealthRegen",
+        "InflictSleepStatusSingle",
+        "TryInflictSleepStatus",
+        "IsProtectedFromSleepClassStatus",
+        "TryInflictNightmareStatus",
+        "TryInflictNappingStatus",
+        "TryInflictYawningStatus",
+        "TryInflictSleeplessStatus",
+        "TryInflictPausedStatus",
+        "TryInflictInfatuatedStatus",
+        "TryInflictBurnStatus",
+        "TryInflictBurnStatusWholeTeam",
+        "TryInflictPoisonedStatus",
+        "TryInflictBadlyPoisonedStatus",
+        "TryInflictFrozenStatus",
+        "TryInflictConstrictionStatus",
+        "TryInflictShadowHoldStatus",
+        "TryInflictIngrainStatus",
+        "TryInflictWrappedStatus",
+        "FreeOtherWrappedMonsters",
+        "TryInflictPetrifiedStatus",
+        "LowerOffensiveStat",
+        "LowerDefensiveStat",
+        "BoostOffensiveStat",
+        "BoostDefensiveStat",
+        "FlashFireShouldActivate",
+        "ActivateFlashFire",
+        "ApplyOffensiveStatMultiplier",
+        "ApplyDefensiveStatMultiplier",
+        "BoostHitChanceStat",
+        "LowerHitChanceStat",
+        "TryInflictCringeStatus",
+        "TryInflictParalysisStatus",
+        "BoostSpeed",
+        "BoostSpeedOneStage",
+        "LowerSpeed",
+        "TrySealMove",
+        "BoostOrLowerSpeed",
+        "ResetHitChanceStat",
+        "ExclusiveItemEffectIsActiveWithLogging",
+        "TryActivateQuickFeet",
+        "TryInflictTerrifiedStatus",
+        "TryInflictGrudgeStatus",
+        "TryInflictConfusedStatus",
+        "TryInflictCoweringStatus",
+        "TryRestoreHp",
+        "TryIncreaseHp",
+        "RevealItems",
+        "RevealStairs",
+        "RevealEnemies",
+        "TryInflictLeechSeedStatus",
+        "TryInflictDestinyBondStatus",
+        "TryInflictSureShotStatus",
+        "TryInflictWhifferStatus",
+        "TryInflictSetDamageStatus",
+        "TryInflictFocusEnergyStatus",
+        "TryInflictDecoyStatus",
+        "TryInflictCurseStatus",
+        "TryInflictSnatchStatus",
+        "TryInflictTauntStatus",
+        "TryInflictStockpileStatus",
+        "TryInflictInvisibleStatus",
+        "TryInflictPerishSongStatus",
+        "TryInflictEncoreStatus",
+        "TryDecreaseBelly",
+        "TryIncreaseBelly",
+        "TryInflictMuzzledStatus",
+        "TryTransform",
+        "TryInflictMobileStatus",
+        "TryInflictExposedStatus",
+        "TryActivateIdentifyCondition",
+        "TryInflictBlinkerStatus",
+        "IsBlinded",
+        "TryInflictCrossEyedStatus",
+        "TryInflictEyedropStatus",
+        "TryInflictSlipStatus",
+        "TryInflictDropeyeStatus",
+        "RestoreAllMovePP",
+        "RestoreOneMovePP",
+        "RestoreRandomMovePP",
+        "ApplyProteinEffect",
+        "ApplyCalciumEffect",
+        "ApplyIronEffect",
+        "ApplyZincEffect",
+        "TryInflictLongTossStatus",
+        "TryInflictPierceStatus",
+        "TryInflictGastroAcidStatus",
+        "SetAquaRingHealingCountdownTo4",
+        "ApplyAquaRingHealing",
+        "TryInflictAquaRingStatus",
+        "TryInflictLuckyChantStatus",
+        "TryInflictHealBlockStatus",
+        "MonsterHasEmbargoStatus",
+        "LogItemBlockedByEmbargo",
+        "TryInflictEmbargoStatus",
+        "TryInflictMiracleEyeStatus",
+        "TryInflictMagnetRiseStatus",
+        "IsFloating",
+        "TryInflictSafeguardStatus",
+        "TryInflictMistStatus",
+        "TryInflictWishStatus",
+        "TryInflictMagicCoatStatus",
+        "TryInflictLightScreenStatus",
+        "TryInflictReflectStatus",
+        "TryInflictProtectStatus",
+        "TryInflictMirrorCoatStatus",
+        "TryInflictEndureStatus",
+        "TryInflictMirrorMoveStatus",
+        "TryInflictConversion2Status",
+        "TryInflictVitalThrowStatus",
+        "TryResetStatChanges",
+        "MirrorMoveIsActive",
+        "MistIsActive",
+        "Conversion2IsActive",
+        "AiConsiderMove",
+        "TryAddTargetToAiTargetList",
+        "IsAiTargetEligible",
+        "IsTargetInRange",
+        "ShouldUsePp",
+        "GetEntityMoveTargetAndRange",
+        "GetEntityNaturalGiftInfo",
+        "GetEntityWeatherBallType",
+        "ActivateMotorDrive",
+        "TryActivateFrisk",
+        "TryActivateBadDreams",
+        "ActivateStench",
+        "TryActivateSteadfast",
+        "IsInSpawnList",
+        "ChangeShayminForme",
+        "ApplyItemEffect",
+        "ApplyCheriBerryEffect",
+        "ApplyPechaBerryEffect",
+        "ApplyRawstBerryEffect",
+        "ApplyHungerSeedEffect",
+        "ApplyVileSeedEffect",
+        "ApplyViolentSeedEffect",
+        "ApplyGinsengEffect",
+        "ApplyBlastSeedEffect",
+        "ApplyGummiBoostsDungeonMode",
+        "CanMonsterUseItem",
+        "ApplyGrimyFoodEffect",
+        "ApplyMixElixirEffect",
+        "ApplyDoughSeedEffect",
+        "ApplyViaSeedEffect",
+        "ApplyGravelyrockEffect",
+        "ApplyGonePebbleEffect",
+        "ApplyGracideaEffect",
+        "GetAiUseItemProbability",
+        "IsAdjacentToEnemy",
+        "ShouldTryEatItem",
+        "GetMaxPpWrapper",
+        "MoveIsNotPhysical",
+        "CategoryIsNotPhysical",
+        "TryDrought",
+        "TryPounce",
+        "TryBlowAway",
+        "TryExplosion",
+        "TryAftermathExplosion",
+        "TryWarp",
+        "EnsureCanStandCurrentTile",
+        "TryActivateNondamagingDefenderAbility",
+        "TryActivateNondamagingDefenderExclusiveItem",
+        "GetMoveRangeDistance",
+        "MoveHitCheck",
+        "IsHyperBeamVariant",
+        "IsChargingTwoTurnMove",
+        "IsChargingAnyTwoTurnMove",
+        "HasMaxGinsengBoost99",
+        "TwoTurnMoveForcedMiss",
+        "DungeonRandOutcomeUserTargetInteraction",
+        "DungeonRandOutcomeUserAction",
+        "CanAiUseMove",
+        "CanMonsterUseMove",
+        "UpdateMovePp",
+        "GetDamageSourceWrapper",
+        "LowerSshort",
+        "PlayMoveAnimation",
+        "GetMoveAnimationId",
+        "ShouldMovePlayAlternativeAnimation",
+        "ExecuteMoveEffect",
+        "DoMoveDamageInlined",
+        "DealDamage",
+        "DealDamageWithTypeAndPowerBoost",
+        "DealDamageProjectile",
+        "DealDamageWithType",
+        "PerformDamageSequence",
+        "CanHitWithRegularAttack",
+        "StatusCheckerCheck",
+        "GetApparentWeather",
+        "TryWeatherFormChange",
+        "ActivateSportCondition",
+        "TryActivateWeather",
+        "DigitCount",
+        "LoadTextureUi",
+        "DisplayNumberTextureUi",
+        "DisplayCharTextureUi",
+        "DisplayUi",
+        "GetTile",
+        "GetTileSafe",
+        "IsFullFloorFixedRoom",
+        "IsCurrentTilesetBackground",
+        "TrySpawnGoldenChamber",
+        "CountItemsOnFloorForAcuteSniffer",
+        "GetStairsSpawnPosition",
+        "PositionIsOnStairs",
+        "GetStairsRoom",
+        "GetDefaultTileTextureId",
+        "DetermineAllTilesWalkableNeighbors",
+        "DetermineTileWalkableNeighbors",
+        "UpdateTrapsVisibility",
+        "DrawTileGrid",
+        "HideTileGrid",
+        "DiscoverMinimap",
+        "PositionHasItem",
+        "PositionHasMonster",
+        "TrySmashWall",
+        "IsWaterTileset",
+        "GetRandomSpawnMonsterID",
+        "NearbyAllyIqSkillIsEnabled",
+        "ResetGravity",
+        "GravityIsActive",
+        "TryActivateGravity",
+        "ShouldBoostKecleonShopSpawnChance",
+        "SetShouldBoostKecleonShopSpawnChance",
+        "UpdateShouldBoostKecleonShopSpawnChance",
+        "GetDoughSeedFlag",
+        "SetDoughSeedFlag",
+        "TrySpawnDoughSeedPoke",
+        "IsSecretBazaar",
+        "ShouldBoostHiddenStairsSpawnChance",
+        "SetShouldBoostHiddenStairsSpawnChance",
+        "UpdateShouldBoostHiddenStairsSpawnChance",
+        "IsSecretRoom",
+        "IsSecretFloor",
+        "GetCurrentHiddenStairsType",
+        "HiddenStairsPresent",
+        "PositionIsOnHiddenStairs",
+        "HiddenStairsTrigger",
+        "GetHiddenStairsField",
+        "SetHiddenStairsField",
+        "GetHiddenFloorField",
+        "SetHiddenFloorField",
+        "LoadWeather3DFiles",
+        "RenderWeather3D",
+        "GetMinimapData",
+        "DrawMinimapTile",
+        "FlashLeaderIcon",
+        "UpdateMinimap",
+        "SetMinimapDataE447",
+        "GetMinimapDataE447",
+        "SetMinimapDataE448",
+        "InitWeirdMinimapMatrix",
+        "InitMinimapDisplayTile",
+        "LoadFixedRoomDataVeneer",
+        "UnloadFixedRoomData",
+        "IsNormalFloor",
+        "GenerateFloor",
+        "GetTileTerrain",
+        "DungeonRand100",
+        "ClearHiddenStairs",
+        "FlagHallwayJunctions",
+        "GenerateStandardFloor",
+        "GenerateOuterRingFloor",
+        "GenerateCrossroadsFloor",
+        "GenerateLineFloor",
+        "GenerateCrossFloor",
+        "GenerateBeetleFloor",
+        "MergeRoomsVertically",
+        "GenerateOuterRoomsFloor",
+        "IsNotFullFloorFixedRoom",
+        "GenerateFixedRoom",
+        "GenerateOneRoomMonsterHouseFloor",
+        "GenerateTwoRoomsWithMonsterHouseFloor",
+        "GenerateExtraHallways",
+        "GetGridPositions",
+        "InitDungeonGrid",
+        "AssignRooms",
+        "CreateRoomsAndAnchors",
+        "GenerateSecondaryStructures",
+        "AssignGridCellConnections",
+        "CreateGridCellConnections",
+        "GenerateRoomImperfections",
+        "CreateHallway",
+        "EnsureConnectedGrid",
+        "SetTerrainObstacleChecked",
+        "FinalizeJunctions",
+        "GenerateKecleonShop",
+        "GenerateMonsterHouse",
+        "GenerateMazeRoom",
+        "GenerateMaze",
+        "GenerateMazeLine",
+        "SetSpawnFlag5",
+        "IsNextToHallway",
+        "ResolveInvalidSpawns",
+        "ConvertSecondaryTerrainToChasms",
+        "EnsureImpassableTilesAreWalls",
+        "InitializeTile",
+        "ResetFloor",
+        "PosIsOutOfBounds",
+        "ShuffleSpawnPositions",
+        "MarkNonEnemySpawns",
+        "MarkEnemySpawns",
+        "SetSecondaryTerrainOnWall",
+        "GenerateSecondaryTerrainFormations",
+        "StairsAlwaysReachable",
+        "GetNextFixedRoomAction",
+        "ConvertWallsToChasms",
+        "ResetInnerBoundaryTileRows",
+        "ResetImportantSpawnPositions",
+        "SpawnStairs",
+        "GetHiddenStairsType",
+        "GetFinalKecleonShopSpawnChance",
+        "ResetHiddenStairsSpawn",
+        "PlaceFixedRoomTile",
+        "FixedRoomActionParamToDirection",
+        "ApplyKeyEffect",
+        "LoadFixedRoomData",
+        "LoadFixedRoom",
+        "OpenFixedBin",
+        "CloseFixedBin",
+        "AreOrbsAllowed",
+        "AreTileJumpsAllowed",
+        "AreTrawlOrbsAllowed",
+        "AreOrbsAllowedVeneer",
+        "AreLateGameTrapsEnabled",
+        "AreMovesEnabled",
+        "IsRoomIlluminated",
+        "GetMatchingMonsterId",
+        "GenerateItemExplicit",
+        "GenerateAndSpawnItem",
+        "IsHiddenStairsFloor",
+        "IsSecretBazaarVeneer",
+        "GenerateStandardItem",
+        "GenerateCleanItem",
+        "TryLeaderItemPickUp",
+        "SpawnItem",
+        "RemoveGroundItem",
+        "SpawnDroppedItemWrapper",
+        "SpawnDroppedItem",
+        "TryGenerateUnownStoneDrop",
+        "HasHeldItem",
+        "GenerateMoneyQuantity",
+        "CheckTeamItemsFlags",
+        "AddHeldItemToBag",
+        "RemoveEmptyItemsInBagWrapper",
+        "GenerateItem",
+        "DoesProjectileHitTarget",
+        "DisplayFloorCard",
+        "HandleFloorCard",
+        "CheckActiveChallengeRequest",
+        "GetMissionDestination",
+        "IsOutlawOrChallengeRequestFloor",
+        "IsDestinationFloor",
+        "IsCurrentMissionType",
+        "IsCurrentMissionTypeExact",
+        "IsOutlawMonsterHouseFloor",
+        "IsGoldenChamber",
+        "IsLegendaryChallengeFloor",
+        "IsJirachiChallengeFloor",
+        "IsDestinationFloorWithMonster",
+        "LoadMissionMonsterSprites",
+        "MissionTargetEnemyIsDefeated",
+        "SetMissionTargetEnemyDefeated",
+        "IsDestinationFloorWithFixedRoom",
+        "GetItemToRetrieve",
+        "GetItemToDeliver",
+        "GetSpecialTargetItem",
+        "IsDestinationFloorWithItem",
+        "IsDestinationFloorWithHiddenOutlaw",
+        "IsDestinationFloorWithFleeingOutlaw",
+        "GetMissionTargetEnemy",
+        "GetMissionEnemyMinionGroup",
+        "SetTargetMonsterNotFoundFlag",
+        "GetTargetMonsterNotFoundFlag",
+        "FloorHasMissionMonster",
+        "GenerateMissionEggMonster",
+        "LogMessageByIdWithPopupCheckParticipants",
+        "LogMessageByIdWithPopupCheckUser",
+        "LogMessageWithPopupCheckUser",
+        "LogMessageByIdQuiet",
+        "LogMessageQuiet",
+        "LogMessageByIdWithPopupCheckUserTarget",
+        "LogMessageWithPopupCheckUserTarget",
+        "LogMessageByIdQuietCheckUserTarget",
+        "LogMessageByIdWithPopupCheckUserUnknown",
+        "LogMessageByIdWithPopup",
+        "LogMessageWithPopup",
+        "LogMessage",
+        "LogMessageById",
+        "InitPortraitDungeon",
+        "OpenMessageLog",
+        "RunDungeonMode",
+        "StartFadeDungeon",
+        "StartFadeDungeonWrapper",
+        "HandleFadesDungeon",
+        "HandleFadesDungeonBothScreens",
+        "DisplayFloorTip",
+        "DisplayItemTip",
+        "DisplayDungeonTip",
+        "SetBothScreensWindowColorToDefault",
+        "GetPersonalityIndex",
+        "DisplayMessage",
+        "DisplayMessage2",
+        "YesNoMenu",
+        "DisplayMessageInternal",
+        "OpenMenu",
+        "OthersMenuLoop",
+        "OthersMenu",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x23E0,
+            0x281C,
+            0x2840,
+            0x2850,
+            0x2870,
+            0x2CF8,
+            0xFFFFFFFF,
+            0x4170,
+            0x43E0,
+            0x4624,
+            0x4640,
+            0x4660,
+            0x468C,
+            0x46E8,
+            0x471C,
+            0x4728,
+            0x4A78,
+            0x53C8,
+            0x53D0,
+            0x53E8,
+            0x5800,
+            0x5844,
+            0x5850,
+            0x5E80,
+            0x6020,
+            0x60D4,
+            0x6258,
+            0x6334,
+            0x64EC,
+            0x650C,
+            0x65D0,
+            0x6714,
+            0x6738,
+            0x67F8,
+            0x6898,
+            0x6B98,
+            0x6C14,
+            0x6C84,
+            0xFFFFFFFF,
+            0x70FC,
+            0x71F0,
+            0x73A4,
+            0x759C,
+            0x75E0,
+            0x76A0,
+            0x7874,
+            0x7DD8,
+            0x7E2C,
+            0x8724,
+            0x9C90,
+            0xFFFFFFFF,
+            0xA198,
+            0xAD7C,
+            0xB884,
+            0xB9A8,
+            0xBA20,
+            0xBB0C,
+            0xBB60,
+            0xBC18,
+            0xBC84,
+            0xBD04,
+            0xBEF0,
+            0xBF50,
+            0xBFA8,
+            0xC488,
+            0xC62C,
+            0xCA0C,
+            0xCDE0,
+            0xCE4C,
+            0xCE8C,
+            0xCF64,
+            0xD340,
+            0xD3D8,
+            0xD3E8,
+            0xD604,
+            0xD7B0,
+            0xD7CC,
+            0xD7E8,
+            0xD804,
+            0xDDA0,
+            0xE4D8,
+            0xE728,
+            0xE740,
+            0xE78C,
+            0xE79C,
+            0xE7AC,
+            0xE7E0,
+            0xE858,
+            0xE880,
+            0xFFFFFFFF,
+            0xE940,
+            0xE9F4,
+            0xEA0C,
+            0xEA24,
+            0xEAC0,
+            0xEBD4,
+            0xEF38,
+            0xF188,
+            0xF1B4,
+            0xF1C8,
+            0xF1DC,
+            0xF20C,
+            0xF30C,
+            0xF398,
+            0xF3CC,
+            0xF5DC,
+            0xF6B4,
+            0xFA10,
+            0xFA58,
+            0xFA7C,
+            0xFAC8,
+            0x100C8,
+            0x1049C,
+            0x105A8,
+            0x10908,
+            0x10D04,
+            0x10DC8,
+            0x10DDC,
+            0x11618,
+            0x11628,
+            0x11730,
+            0x11994,
+            0x11A7C,
+            0x11B94,
+            0x11C3C,
+            0x11D60,
+            0x1212C,
+            0x121F4,
+            0x123EC,
+            0x125E0,
+            0x12754,
+            0x127F0,
+            0x128D8,
+            0x12AEC,
+            0x12C10,
+            0x12CAC,
+            0x12D00,
+            0x12E34,
+            0x12F14,
+            0x13398,
+            0x137AC,
+            0x1382C,
+            0x13834,
+            0x138C4,
+            0x1494C,
+            0x1496C,
+            0x14C9C,
+            0x16E4C,
+            0x173F4,
+            0x176F4,
+            0x1908C,
+            0x190B8,
+            0x1927C,
+            0x1ABD8,
+            0x1ACD0,
+            0x1AD28,
+            0x1ADC8,
+            0x1AE10,
+            0x1AE28,
+            0x1B148,
+            0x1B168,
+            0x1B174,
+            0x1B1AC,
+            0x1B1CC,
+            0x1B294,
+            0x1B394,
+            0x1B414,
+            0x1B528,
+            0x1B5C4,
+            0xFFFFFFFF,
+            0x1BCF0,
+            0x1C3B0,
+            0x1C78C,
+            0x1CF04,
+            0x1CF54,
+            0x1CFFC,
+            0x1D098,
+            0x1D1C8,
+            0x1D2B0,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x1D504,
+            0x1D5B0,
+            0x1D674,
+            0x1D730,
+            0x1D7AC,
+            0x1D834,
+            0x1DA00,
+            0x1DA28,
+            0x1DF04,
+            0x1E1F0,
+            0x1E3B0,
+            0x1E59C,
+            0xFFFFFFFF,
+            0x1EDB8,
+            0x1EE24,
+            0x1EE40,
+            0x1EE68,
+            0x1EECC,
+            0x1EFD4,
+            0x1F2F8,
+            0x1F3AC,
+            0x1F3D0,
+            0x1F438,
+            0x1F890,
+            0x1F8B0,
+            0x1FC18,
+            0x1FD18,
+            0x1FFF4,
+            0x202CC,
+            0x20B38,
+            0x20E44,
+            0x21174,
+            0x21794,
+            0x21B80,
+            0x21F58,
+            0x2200C,
+            0x220BC,
+            0x22110,
+            0x22178,
+            0x221E0,
+            0x2227C,
+            0x22F28,
+            0x22F88,
+            0x233EC,
+            0x23434,
+            0x23484,
+            0x23688,
+            0x23A5C,
+            0x23BB4,
+            0x23D0C,
+            0x23D1C,
+            0x23EC8,
+            0x23F24,
+            0x24088,
+            0x24270,
+            0x242A4,
+            0x242C0,
+            0x242E0,
+            0x242FC,
+            0x24348,
+            0x24364,
+            0x24380,
+            0x243BC,
+            0x243D8,
+            0x243F4,
+            0x24568,
+            0x245D8,
+            0x24900,
+            0x24A70,
+            0x24C38,
+            0x24CF0,
+            0x24ED8,
+            0x24FF4,
+            0x250B8,
+            0x25378,
+            0x25468,
+            0x2551C,
+            0x25700,
+            0x25754,
+            0x258EC,
+            0x25A9C,
+            0x25AD0,
+            0x25B38,
+            0x25B44,
+            0x25BD8,
+            0x25C10,
+            0x25C48,
+            0x25C6C,
+            0x25CAC,
+            0x25CE0,
+            0x25D10,
+            0x25D40,
+            0x25D7C,
+            0x2603C,
+            0x260DC,
+            0x26128,
+            0x26180,
+            0x261F0,
+            0x262FC,
+            0x264BC,
+            0x2681C,
+            0x26D48,
+            0x26DFC,
+            0x278D8,
+            0x27A3C,
+            0x28768,
+            0x28874,
+            0x28924,
+            0x2896C,
+            0x28DA0,
+            0x29454,
+            0x29684,
+            0x299E8,
+            0x299FC,
+            0x29D9C,
+            0x29F68,
+            0x2A018,
+            0x2A194,
+            0x2A2B4,
+            0x2A498,
+            0x2A4E8,
+            0x2A684,
+            0x2A710,
+            0x2A7C0,
+            0x2A8E8,
+            0x2A9B8,
+            0x2AA24,
+            0x2AA90,
+            0x2B6AC,
+            0x2BA38,
+            0x2BAD8,
+            0x2BB14,
+            0x2BD0C,
+            0x2C060,
+            0x2C100,
+            0x2C3FC,
+            0x2CDA0,
+            0x2E7CC,
+            0x2E84C,
+            0x2E918,
+            0x2E9B0,
+            0x2E9C4,
+            0x2EA18,
+            0x2EAC4,
+            0x2F96C,
+            0x30EDC,
+            0x30F4C,
+            0x31000,
+            0x31168,
+            0x311B4,
+            0x31200,
+            0x3123C,
+            0x312E8,
+            0x318D4,
+            0x31990,
+            0x31E24,
+            0x3247C,
+            0x326D4,
+            0x32B70,
+            0x32DEC,
+            0x32F24,
+            0x33414,
+            0x33488,
+            0x33538,
+            0x33548,
+            0x33558,
+            0x33600,
+            0x33798,
+            0x33950,
+            0x34E48,
+            0x355E4,
+            0x35698,
+            0x357A4,
+            0x35A0C,
+            0x35B20,
+            0x35C30,
+            0x35D40,
+            0x35E2C,
+            0x35F6C,
+            0x360F8,
+            0x363D8,
+            0x36424,
+            0x366FC,
+            0x369B8,
+            0x36BE0,
+            0x36D38,
+            0x36EF0,
+            0x36FB4,
+            0x371B0,
+            0x3722C,
+            0x373BC,
+            0x375D4,
+            0x3775C,
+            0x378C8,
+            0x37A34,
+            0x37AA4,
+            0x37B00,
+            0x37D24,
+            0x37EA4,
+            0x37FEC,
+            0x381A8,
+            0x38304,
+            0x385D0,
+            0x386FC,
+            0x38714,
+            0x3887C,
+            0x389EC,
+            0x38A4C,
+            0x38B00,
+            0x38BDC,
+            0x38C20,
+            0x38C78,
+            0x38CF8,
+            0x38F2C,
+            0x3902C,
+            0x390A4,
+            0x393D0,
+            0x39460,
+            0x3951C,
+            0x395AC,
+            0x39810,
+            0x39930,
+            0x399C0,
+            0x39AA8,
+            0x39B44,
+            0x39BE4,
+            0x39E9C,
+            0x3A040,
+            0x3A168,
+            0x3A298,
+            0x3A33C,
+            0x3A3EC,
+            0x3A4E0,
+            0x3A698,
+            0x3A970,
+            0x3AEE4,
+            0x3AFDC,
+            0x3B1CC,
+            0x3B288,
+            0x3B408,
+            0x3B48C,
+            0x3B5A4,
+            0x3B604,
+            0x3B71C,
+            0x3B7CC,
+            0x3B8B4,
+            0x3B9E0,
+            0x3BB18,
+            0x3BC48,
+            0x3BD10,
+            0x3BDA4,
+            0x3BE38,
+            0x3BECC,
+            0x3BF60,
+            0x3BFD0,
+            0x3C03C,
+            0x3C180,
+            0x3C1A8,
+            0x3C21C,
+            0x3C2C8,
+            0x3C368,
+            0x3C48C,
+            0x3C4C0,
+            0x3C4EC,
+            0x3C610,
+            0x3C744,
+            0x3C80C,
+            0x3CC30,
+            0x3CCD0,
+            0x3CD6C,
+            0x3CE0C,
+            0x3CEAC,
+            0x3CF4C,
+            0x3CFEC,
+            0x3D09C,
+            0x3D138,
+            0x3D1D8,
+            0x3D278,
+            0x3D344,
+            0x3D3E4,
+            0x3D508,
+            0x3D58C,
+            0x3D5D4,
+            0x3D640,
+            0x3DD70,
+            0x3DE64,
+            0x3E454,
+            0x3E560,
+            0x3EA6C,
+            0x3EC50,
+            0x3ECCC,
+            0x3EE20,
+            0x3EE64,
+            0x3EF78,
+            0x3F0FC,
+            0x3F124,
+            0x3F1BC,
+            0x3F2AC,
+            0x3F44C,
+            0x409AC,
+            0x409D8,
+            0x40A0C,
+            0x40A54,
+            0x40B40,
+            0x40BDC,
+            0x40C28,
+            0x40D44,
+            0x40E80,
+            0x41264,
+            0x412F4,
+            0x41440,
+            0x414A0,
+            0x4150C,
+            0x41580,
+            0x415F8,
+            0x41780,
+            0x41E1C,
+            0x426B0,
+            0x42750,
+            0x427B0,
+            0x427D8,
+            0x427F0,
+            0x43354,
+            0x439E0,
+            0x43BA0,
+            0x44208,
+            0x44548,
+            0x44AC8,
+            0x44EC4,
+            0x45838,
+            0x45AB0,
+            0x46064,
+            0x47A08,
+            0x482F4,
+            0x48364,
+            0x483DC,
+            0x48558,
+            0x48614,
+            0x486F4,
+            0x487E0,
+            0x48834,
+            0x488E4,
+            0x48B4C,
+            0x48C04,
+            0x48C24,
+            0x49474,
+            0x498D0,
+            0x49A38,
+            0x52624,
+            0x56830,
+            0x568E0,
+            0x56978,
+            0x56A0C,
+            0x56A9C,
+            0x56B2C,
+            0x56D88,
+            0x56E34,
+            0x58AC8,
+            0x58F30,
+            0x5920C,
+            0x59284,
+            0x59430,
+            0x59480,
+            0x59640,
+            0x59748,
+            0x597D0,
+            0x59EBC,
+            0x59F24,
+            0x59F94,
+            0x59FC4,
+            0x59FE4,
+            0x5A020,
+            0x5A180,
+            0x5A1AC,
+            0x5A1E8,
+            0x5A210,
+            0x5A80C,
+            0x5A844,
+            0x5AD0C,
+            0x5B1E8,
+            0x5B55C,
+            0x5B7FC,
+            0x5B8EC,
+            0x5B928,
+            0x5B95C,
+            0x5BC54,
+            0x5BD58,
+            0x5C048,
+            0x5C12C,
+            0x5C150,
+            0x5C17C,
+            0x5C280,
+            0x5C298,
+            0x5C2B0,
+            0x5C2F0,
+            0x5C308,
+            0x5C320,
+            0x5C384,
+            0x5C3AC,
+            0x5C3C4,
+            0x5C3DC,
+            0x5C41C,
+            0x5C444,
+            0x5C470,
+            0x5C498,
+            0x5C4C8,
+            0x5C554,
+            0x5C610,
+            0x5C628,
+            0x5C640,
+            0x5C658,
+            0x5C670,
+            0x5C884,
+            0x5CED8,
+            0x5CFAC,
+            0x5D7E4,
+            0x5DAA8,
+            0x5DFD8,
+            0xFFFFFFFF,
+            0x5DFF0,
+            0x5E050,
+            0x5E0B0,
+            0x5E3E4,
+            0x5E3F0,
+            0x5E414,
+            0x5E498,
+            0x5EC38,
+            0x5EC44,
+            0x5EC54,
+            0x5ECCC,
+            0x5EDE8,
+            0x5EF50,
+            0x5F3DC,
+            0x5F83C,
+            0x5F99C,
+            0x5FB34,
+            0x5FCF0,
+            0x5FE3C,
+            0x600D0,
+            0x600EC,
+            0x60534,
+            0x60604,
+            0x607A8,
+            0x60D44,
+            0x60DC4,
+            0x60EC4,
+            0x610D8,
+            0x61434,
+            0x61E1C,
+            0x621FC,
+            0x62AF4,
+            0x62EE0,
+            0x631E4,
+            0x636C0,
+            0x636FC,
+            0x639A8,
+            0x63D5C,
+            0x63FE4,
+            0x64218,
+            0x64494,
+            0x6463C,
+            0x64690,
+            0x64734,
+            0x647CC,
+            0x64838,
+            0x64894,
+            0x648CC,
+            0x64A6C,
+            0x64AA4,
+            0x64B0C,
+            0x65230,
+            0x6552C,
+            0x6556C,
+            0x65C2C,
+            0x66290,
+            0x66308,
+            0x6693C,
+            0x66A28,
+            0x66A4C,
+            0x66B5C,
+            0x66C7C,
+            0x66CC8,
+            0x66CF0,
+            0x6772C,
+            0x67A98,
+            0x67B50,
+            0x67BE0,
+            0x67E14,
+            0x67E48,
+            0x67E6C,
+            0x67E9C,
+            0x67ECC,
+            0x67EFC,
+            0x67F08,
+            0x67F20,
+            0x67F38,
+            0x67F50,
+            0x68174,
+            0x681F0,
+            0x682CC,
+            0x682F8,
+            0x68990,
+            0x689A4,
+            0x68E18,
+            0x692F8,
+            0x6947C,
+            0x697FC,
+            0x69898,
+            0x69E20,
+            0x6A5A4,
+            0x6A5F4,
+            0x6A998,
+            0x6ACD4,
+            0x6ADF0,
+            0x6B084,
+            0x6BDE0,
+            0x6C094,
+            0x6C0CC,
+            0x6CF0C,
+            0x6CF64,
+            0x6CF84,
+            0x6CFC8,
+            0x6CFDC,
+            0x6D010,
+            0x6D04C,
+            0x6D070,
+            0x6D094,
+            0x6D0D4,
+            0x6D10C,
+            0x6D1B8,
+            0x6D230,
+            0x6D250,
+            0x6D264,
+            0x6D28C,
+            0x6D2B0,
+            0x6D2DC,
+            0x6D324,
+            0x6D384,
+            0x6D3A8,
+            0x6D3E0,
+            0x6D3F8,
+            0x6D484,
+            0x6D498,
+            0x6D508,
+            0x6D660,
+            0x6F010,
+            0x6F064,
+            0x6F0A4,
+            0x6F0DC,
+            0x6F100,
+            0x6F110,
+            0x6F164,
+            0x6F1B0,
+            0x6F204,
+            0x6F258,
+            0x6F27C,
+            0x6F2C8,
+            0x6F4D4,
+            0x6F880,
+            0x6F91C,
+            0x6FCE8,
+            0x701C8,
+            0x70428,
+            0x70594,
+            0x707A4,
+            0x70948,
+            0x70A74,
+            0x70CB0,
+            0x70D20,
+            0x70DAC,
+            0x71018,
+            0x7106C,
+            0x712D8,
+            0x71350,
+            0x71BB4,
+            0x73580,
+            0x737E4,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x22DE620,
+            0x22DEA5C,
+            0x22DEA80,
+            0x22DEA90,
+            0x22DEAB0,
+            0x22DEF38,
+            0xFFFFFFFF,
+            0x22E03B0,
+            0x22E0620,
+            0x22E0864,
+            0x22E0880,
+            0x22E08A0,
+            0x22E08CC,
+            0x22E0928,
+            0x22E095C,
+            0x22E0968,
+            0x22E0CB8,
+            0x22E1608,
+            0x22E1610,
+            0x22E1628,
+            0x22E1A40,
+            0x22E1A84,
+            0x22E1A90,
+            0x22E20C0,
+            0x22E2260,
+            0x22E2314,
+            0x22E2498,
+            0x22E2574,
+            0x22E272C,
+            0x22E274C,
+            0x22E2810,
+            0x22E2954,
+            0x22E2978,
+            0x22E2A38,
+            0x22E2AD8,
+            0x22E2DD8,
+            0x22E2E54,
+            0x22E2EC4,
+            0xFFFFFFFF,
+            0x22E333C,
+            0x22E3430,
+            0x22E35E4,
+            0x22E37DC,
+            0x22E3820,
+            0x22E38E0,
+            0x22E3AB4,
+            0x22E4018,
+            0x22E406C,
+            0x22E4964,
+            0x22E5ED0,
+            0xFFFFFFFF,
+            0x22E63D8,
+            0x22E6FBC,
+            0x22E7AC4,
+            0x22E7BE8,
+            0x22E7C60,
+            0x22E7D4C,
+            0x22E7DA0,
+            0x22E7E58,
+            0x22E7EC4,
+            0x22E7F44,
+            0x22E8130,
+            0x22E8190,
+            0x22E81E8,
+            0x22E86C8,
+            0x22E886C,
+            0x22E8C4C,
+            0x22E9020,
+            0x22E908C,
+            0x22E90CC,
+            0x22E91A4,
+            0x22E9580,
+            0x22E9618,
+            0x22E9628,
+            0x22E9844,
+            0x22E99F0,
+            0x22E9A0C,
+            0x22E9A28,
+            0x22E9A44,
+            0x22E9FE0,
+            0x22EA718,
+            0x22EA968,
+            0x22EA980,
+            0x22EA9CC,
+            0x22EA9DC,
+            0x22EA9EC,
+            0x22EAA20,
+            0x22EAA98,
+            0x22EAAC0,
+            0xFFFFFFFF,
+            0x22EAB80,
+            0x22EAC34,
+            0x22EAC4C,
+            0x22EAC64,
+            0x22EAD00,
+            0x22EAE14,
+            0x22EB178,
+            0x22EB3C8,
+            0x22EB3F4,
+            0x22EB408,
+            0x22EB41C,
+            0x22EB44C,
+            0x22EB54C,
+            0x22EB5D8,
+            0x22EB60C,
+            0x22EB81C,
+            0x22EB8F4,
+            0x22EBC50,
+            0x22EBC98,
+            0x22EBCBC,
+            0x22EBD08,
+            0x22EC308,
+            0x22EC6DC,
+            0x22EC7E8,
+            0x22ECB48,
+            0x22ECF44,
+            0x22ED008,
+            0x22ED01C,
+            0x22ED858,
+            0x22ED868,
+            0x22ED970,
+            0x22EDBD4,
+            0x22EDCBC,
+            0x22EDDD4,
+            0x22EDE7C,
+            0x22EDFA0,
+            0x22EE36C,
+            0x22EE434,
+            0x22EE62C,
+            0x22EE820,
+            0x22EE994,
+            0x22EEA30,
+            0x22EEB18,
+            0x22EED2C,
+            0x22EEE50,
+            0x22EEEEC,
+            0x22EEF40,
+            0x22EF074,
+            0x22EF154,
+            0x22EF5D8,
+            0x22EF9EC,
+            0x22EFA6C,
+            0x22EFA74,
+            0x22EFB04,
+            0x22F0B8C,
+            0x22F0BAC,
+            0x22F0EDC,
+            0x22F308C,
+            0x22F3634,
+            0x22F3934,
+            0x22F52CC,
+            0x22F52F8,
+            0x22F54BC,
+            0x22F6E18,
+            0x22F6F10,
+            0x22F6F68,
+            0x22F7008,
+            0x22F7050,
+            0x22F7068,
+            0x22F7388,
+            0x22F73A8,
+            0x22F73B4,
+            0x22F73EC,
+            0x22F740C,
+            0x22F74D4,
+            0x22F75D4,
+            0x22F7654,
+            0x22F7768,
+            0x22F7804,
+            0xFFFFFFFF,
+            0x22F7F30,
+            0x22F85F0,
+            0x22F89CC,
+            0x22F9144,
+            0x22F9194,
+            0x22F923C,
+            0x22F92D8,
+            0x22F9408,
+            0x22F94F0,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x22F9744,
+            0x22F97F0,
+            0x22F98B4,
+            0x22F9970,
+            0x22F99EC,
+            0x22F9A74,
+            0x22F9C40,
+            0x22F9C68,
+            0x22FA144,
+            0x22FA430,
+            0x22FA5F0,
+            0x22FA7DC,
+            0xFFFFFFFF,
+            0x22FAFF8,
+            0x22FB064,
+            0x22FB080,
+            0x22FB0A8,
+            0x22FB10C,
+            0x22FB214,
+            0x22FB538,
+            0x22FB5EC,
+            0x22FB610,
+            0x22FB678,
+            0x22FBAD0,
+            0x22FBAF0,
+            0x22FBE58,
+            0x22FBF58,
+            0x22FC234,
+            0x22FC50C,
+            0x22FCD78,
+            0x22FD084,
+            0x22FD3B4,
+            0x22FD9D4,
+            0x22FDDC0,
+            0x22FE198,
+            0x22FE24C,
+            0x22FE2FC,
+            0x22FE350,
+            0x22FE3B8,
+            0x22FE420,
+            0x22FE4BC,
+            0x22FF168,
+            0x22FF1C8,
+            0x22FF62C,
+            0x22FF674,
+            0x22FF6C4,
+            0x22FF8C8,
+            0x22FFC9C,
+            0x22FFDF4,
+            0x22FFF4C,
+            0x22FFF5C,
+            0x2300108,
+            0x2300164,
+            0x23002C8,
+            0x23004B0,
+            0x23004E4,
+            0x2300500,
+            0x2300520,
+            0x230053C,
+            0x2300588,
+            0x23005A4,
+            0x23005C0,
+            0x23005FC,
+            0x2300618,
+            0x2300634,
+            0x23007A8,
+            0x2300818,
+            0x2300B40,
+            0x2300CB0,
+            0x2300E78,
+            0x2300F30,
+            0x2301118,
+            0x2301234,
+            0x23012F8,
+            0x23015B8,
+            0x23016A8,
+            0x230175C,
+            0x2301940,
+            0x2301994,
+            0x2301B2C,
+            0x2301CDC,
+            0x2301D10,
+            0x2301D78,
+            0x2301D84,
+            0x2301E18,
+            0x2301E50,
+            0x2301E88,
+            0x2301EAC,
+            0x2301EEC,
+            0x2301F20,
+            0x2301F50,
+            0x2301F80,
+            0x2301FBC,
+            0x230227C,
+            0x230231C,
+            0x2302368,
+            0x23023C0,
+            0x2302430,
+            0x230253C,
+            0x23026FC,
+            0x2302A5C,
+            0x2302F88,
+            0x230303C,
+            0x2303B18,
+            0x2303C7C,
+            0x23049A8,
+            0x2304AB4,
+            0x2304B64,
+            0x2304BAC,
+            0x2304FE0,
+            0x2305694,
+            0x23058C4,
+            0x2305C28,
+            0x2305C3C,
+            0x2305FDC,
+            0x23061A8,
+            0x2306258,
+            0x23063D4,
+            0x23064F4,
+            0x23066D8,
+            0x2306728,
+            0x23068C4,
+            0x2306950,
+            0x2306A00,
+            0x2306B28,
+            0x2306BF8,
+            0x2306C64,
+            0x2306CD0,
+            0x23078EC,
+            0x2307C78,
+            0x2307D18,
+            0x2307D54,
+            0x2307F4C,
+            0x23082A0,
+            0x2308340,
+            0x230863C,
+            0x2308FE0,
+            0x230AA0C,
+            0x230AA8C,
+            0x230AB58,
+            0x230ABF0,
+            0x230AC04,
+            0x230AC58,
+            0x230AD04,
+            0x230BBAC,
+            0x230D11C,
+            0x230D18C,
+            0x230D240,
+            0x230D3A8,
+            0x230D3F4,
+            0x230D440,
+            0x230D47C,
+            0x230D528,
+            0x230DB14,
+            0x230DBD0,
+            0x230E064,
+            0x230E6BC,
+            0x230E914,
+            0x230EDB0,
+            0x230F02C,
+            0x230F164,
+            0x230F654,
+            0x230F6C8,
+            0x230F778,
+            0x230F788,
+            0x230F798,
+            0x230F840,
+            0x230F9D8,
+            0x230FB90,
+            0x2311088,
+            0x2311824,
+            0x23118D8,
+            0x23119E4,
+            0x2311C4C,
+            0x2311D60,
+            0x2311E70,
+            0x2311F80,
+            0x231206C,
+            0x23121AC,
+            0x2312338,
+            0x2312618,
+            0x2312664,
+            0x231293C,
+            0x2312BF8,
+            0x2312E20,
+            0x2312F78,
+            0x2313130,
+            0x23131F4,
+            0x23133F0,
+            0x231346C,
+            0x23135FC,
+            0x2313814,
+            0x231399C,
+            0x2313B08,
+            0x2313C74,
+            0x2313CE4,
+            0x2313D40,
+            0x2313F64,
+            0x23140E4,
+            0x231422C,
+            0x23143E8,
+            0x2314544,
+            0x2314810,
+            0x231493C,
+            0x2314954,
+            0x2314ABC,
+            0x2314C2C,
+            0x2314C8C,
+            0x2314D40,
+            0x2314E1C,
+            0x2314E60,
+            0x2314EB8,
+            0x2314F38,
+            0x231516C,
+            0x231526C,
+            0x23152E4,
+            0x2315610,
+            0x23156A0,
+            0x231575C,
+            0x23157EC,
+            0x2315A50,
+            0x2315B70,
+            0x2315C00,
+            0x2315CE8,
+            0x2315D84,
+            0x2315E24,
+            0x23160DC,
+            0x2316280,
+            0x23163A8,
+            0x23164D8,
+            0x231657C,
+            0x231662C,
+            0x2316720,
+            0x23168D8,
+            0x2316BB0,
+            0x2317124,
+            0x231721C,
+            0x231740C,
+            0x23174C8,
+            0x2317648,
+            0x23176CC,
+            0x23177E4,
+            0x2317844,
+            0x231795C,
+            0x2317A0C,
+            0x2317AF4,
+            0x2317C20,
+            0x2317D58,
+            0x2317E88,
+            0x2317F50,
+            0x2317FE4,
+            0x2318078,
+            0x231810C,
+            0x23181A0,
+            0x2318210,
+            0x231827C,
+            0x23183C0,
+            0x23183E8,
+            0x231845C,
+            0x2318508,
+            0x23185A8,
+            0x23186CC,
+            0x2318700,
+            0x231872C,
+            0x2318850,
+            0x2318984,
+            0x2318A4C,
+            0x2318E70,
+            0x2318F10,
+            0x2318FAC,
+            0x231904C,
+            0x23190EC,
+            0x231918C,
+            0x231922C,
+            0x23192DC,
+            0x2319378,
+            0x2319418,
+            0x23194B8,
+            0x2319584,
+            0x2319624,
+            0x2319748,
+            0x23197CC,
+            0x2319814,
+            0x2319880,
+            0x2319FB0,
+            0x231A0A4,
+            0x231A694,
+            0x231A7A0,
+            0x231ACAC,
+            0x231AE90,
+            0x231AF0C,
+            0x231B060,
+            0x231B0A4,
+            0x231B1B8,
+            0x231B33C,
+            0x231B364,
+            0x231B3FC,
+            0x231B4EC,
+            0x231B68C,
+            0x231CBEC,
+            0x231CC18,
+            0x231CC4C,
+            0x231CC94,
+            0x231CD80,
+            0x231CE1C,
+            0x231CE68,
+            0x231CF84,
+            0x231D0C0,
+            0x231D4A4,
+            0x231D534,
+            0x231D680,
+            0x231D6E0,
+            0x231D74C,
+            0x231D7C0,
+            0x231D838,
+            0x231D9C0,
+            0x231E05C,
+            0x231E8F0,
+            0x231E990,
+            0x231E9F0,
+            0x231EA18,
+            0x231EA30,
+            0x231F594,
+            0x231FC20,
+            0x231FDE0,
+            0x2320448,
+            0x2320788,
+            0x2320D08,
+            0x2321104,
+            0x2321A78,
+            0x2321CF0,
+            0x23222A4,
+            0x2323C48,
+            0x2324534,
+            0x23245A4,
+            0x232461C,
+            0x2324798,
+            0x2324854,
+            0x2324934,
+            0x2324A20,
+            0x2324A74,
+            0x2324B24,
+            0x2324D8C,
+            0x2324E44,
+            0x2324E64,
+            0x23256B4,
+            0x2325B10,
+            0x2325C78,
+            0x232E864,
+            0x2332A70,
+            0x2332B20,
+            0x2332BB8,
+            0x2332C4C,
+            0x2332CDC,
+            0x2332D6C,
+            0x2332FC8,
+            0x2333074,
+            0x2334D08,
+            0x2335170,
+            0x233544C,
+            0x23354C4,
+            0x2335670,
+            0x23356C0,
+            0x2335880,
+            0x2335988,
+            0x2335A10,
+            0x23360FC,
+            0x2336164,
+            0x23361D4,
+            0x2336204,
+            0x2336224,
+            0x2336260,
+            0x23363C0,
+            0x23363EC,
+            0x2336428,
+            0x2336450,
+            0x2336A4C,
+            0x2336A84,
+            0x2336F4C,
+            0x2337428,
+            0x233779C,
+            0x2337A3C,
+            0x2337B2C,
+            0x2337B68,
+            0x2337B9C,
+            0x2337E94,
+            0x2337F98,
+            0x2338288,
+            0x233836C,
+            0x2338390,
+            0x23383BC,
+            0x23384C0,
+            0x23384D8,
+            0x23384F0,
+            0x2338530,
+            0x2338548,
+            0x2338560,
+            0x23385C4,
+            0x23385EC,
+            0x2338604,
+            0x233861C,
+            0x233865C,
+            0x2338684,
+            0x23386B0,
+            0x23386D8,
+            0x2338708,
+            0x2338794,
+            0x2338850,
+            0x2338868,
+            0x2338880,
+            0x2338898,
+            0x23388B0,
+            0x2338AC4,
+            0x2339118,
+            0x23391EC,
+            0x2339A24,
+            0x2339CE8,
+            0x233A218,
+            0xFFFFFFFF,
+            0x233A230,
+            0x233A290,
+            0x233A2F0,
+            0x233A624,
+            0x233A630,
+            0x233A654,
+            0x233A6D8,
+            0x233AE78,
+            0x233AE84,
+            0x233AE94,
+            0x233AF0C,
+            0x233B028,
+            0x233B190,
+            0x233B61C,
+            0x233BA7C,
+            0x233BBDC,
+            0x233BD74,
+            0x233BF30,
+            0x233C07C,
+            0x233C310,
+            0x233C32C,
+            0x233C774,
+            0x233C844,
+            0x233C9E8,
+            0x233CF84,
+            0x233D004,
+            0x233D104,
+            0x233D318,
+            0x233D674,
+            0x233E05C,
+            0x233E43C,
+            0x233ED34,
+            0x233F120,
+            0x233F424,
+            0x233F900,
+            0x233F93C,
+            0x233FBE8,
+            0x233FF9C,
+            0x2340224,
+            0x2340458,
+            0x23406D4,
+            0x234087C,
+            0x23408D0,
+            0x2340974,
+            0x2340A0C,
+            0x2340A78,
+            0x2340AD4,
+            0x2340B0C,
+            0x2340CAC,
+            0x2340CE4,
+            0x2340D4C,
+            0x2341470,
+            0x234176C,
+            0x23417AC,
+            0x2341E6C,
+            0x23424D0,
+            0x2342548,
+            0x2342B7C,
+            0x2342C68,
+            0x2342C8C,
+            0x2342D9C,
+            0x2342EBC,
+            0x2342F08,
+            0x2342F30,
+            0x234396C,
+            0x2343CD8,
+            0x2343D90,
+            0x2343E20,
+            0x2344054,
+            0x2344088,
+            0x23440AC,
+            0x23440DC,
+            0x234410C,
+            0x234413C,
+            0x2344148,
+            0x2344160,
+            0x2344178,
+            0x2344190,
+            0x23443B4,
+            0x2344430,
+            0x234450C,
+            0x2344538,
+            0x2344BD0,
+            0x2344BE4,
+            0x2345058,
+            0x2345538,
+            0x23456BC,
+            0x2345A3C,
+            0x2345AD8,
+            0x2346060,
+            0x23467E4,
+            0x2346834,
+            0x2346BD8,
+            0x2346F14,
+            0x2347030,
+            0x23472C4,
+            0x2348020,
+            0x23482D4,
+            0x234830C,
+            0x234914C,
+            0x23491A4,
+            0x23491C4,
+            0x2349208,
+            0x234921C,
+            0x2349250,
+            0x234928C,
+            0x23492B0,
+            0x23492D4,
+            0x2349314,
+            0x234934C,
+            0x23493F8,
+            0x2349470,
+            0x2349490,
+            0x23494A4,
+            0x23494CC,
+            0x23494F0,
+            0x234951C,
+            0x2349564,
+            0x23495C4,
+            0x23495E8,
+            0x2349620,
+            0x2349638,
+            0x23496C4,
+            0x23496D8,
+            0x2349748,
+            0x23498A0,
+            0x234B250,
+            0x234B2A4,
+            0x234B2E4,
+            0x234B31C,
+            0x234B340,
+            0x234B350,
+            0x234B3A4,
+            0x234B3F0,
+            0x234B444,
+            0x234B498,
+            0x234B4BC,
+            0x234B508,
+            0x234B714,
+            0x234BAC0,
+            0x234BB5C,
+            0x234BF28,
+            0x234C408,
+            0x234C668,
+            0x234C7D4,
+            0x234C9E4,
+            0x234CB88,
+            0x234CCB4,
+            0x234CEF0,
+            0x234CF60,
+            0x234CFEC,
+            0x234D258,
+            0x234D2AC,
+            0x234D518,
+            0x234D590,
+            0x234DDF4,
+            0x234F7C0,
+            0x234FA24,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1893,
+            1894,
+            1895,
+            1896,
+            1897,
+            1898,
+            1899,
+            1900,
+            1901,
+            1902,
+            196,
+            1903,
+            1904,
+            1905,
+            1906,
+            1907,
+            1908,
+            1909,
+            1910,
+            1911,
+            1912,
+            1913,
+            1913,
+            1914,
+            1915,
+            1916,
+            1917,
+            1918,
+            1919,
+            1920,
+            1921,
+            1922,
+            1923,
+            1924,
+            1925,
+            1926,
+            1927,
+            1928,
+            1929,
+            1930,
+            1931,
+            1932,
+            1933,
+            1934,
+            1935,
+            1936,
+            1937,
+            1938,
+            1939,
+            1940,
+            1941,
+            1942,
+            1943,
+            1944,
+            1945,
+            1946,
+            1947,
+            1948,
+            1949,
+            1950,
+            1951,
+            1952,
+            1953,
+            1954,
+            1955,
+            1956,
+            1957,
+            1958,
+            1959,
+            1960,
+            1961,
+            1962,
+            1963,
+            1964,
+            1965,
+            1966,
+            1967,
+            1968,
+            1969,
+            1970,
+            1971,
+            1972,
+            1973,
+            1974,
+            1975,
+            1976,
+            1977,
+            1978,
+            1979,
+            1980,
+            1981,
+            1982,
+            1983,
+            1984,
+            1985,
+            1986,
+            1987,
+            1988,
+            1989,
+            1990,
+            1991,
+            1992,
+            1993,
+            1994,
+            1995,
+            1996,
+            1997,
+            1998,
+            1999,
+            2000,
+            2001,
+            2002,
+            2003,
+            2004,
+            2005,
+            2006,
+            2007,
+            2008,
+            2009,
+            2010,
+            2011,
+            2012,
+            2013,
+            2014,
+            2015,
+            2016,
+            2017,
+            2018,
+            2019,
+            2020,
+            2021,
+            2022,
+            2023,
+            2024,
+            2025,
+            2026,
+            2027,
+            2028,
+            2029,
+            2030,
+            2031,
+            2032,
+            2033,
+            2034,
+            2035,
+            2036,
+            2037,
+            2038,
+            2039,
+            2040,
+            2041,
+            2042,
+            2043,
+            2044,
+            2045,
+            2046,
+            2047,
+            2048,
+            2049,
+            2050,
+            2051,
+            2052,
+            2053,
+            2054,
+            2055,
+            2056,
+            2057,
+            609,
+            163,
+            2058,
+            2059,
+            2060,
+            2061,
+            2062,
+            2063,
+            2064,
+            2065,
+            2066,
+            2067,
+            2068,
+            2069,
+            2070,
+            2071,
+            2072,
+            2073,
+            2074,
+            2075,
+            2076,
+            2077,
+            2078,
+            2079,
+            2080,
+            2081,
+            2082,
+            2083,
+            2084,
+            2085,
+            2086,
+            2087,
+            2088,
+            2089,
+            2090,
+            2091,
+            2092,
+            2093,
+            2094,
+            2095,
+            2096,
+            2097,
+            2098,
+            2099,
+            2100,
+            2101,
+            2102,
+            2103,
+            2104,
+            2105,
+            2106,
+            2107,
+            2108,
+            2109,
+            2110,
+            2111,
+            2112,
+            2113,
+            2114,
+            2115,
+            2116,
+            2117,
+            2118,
+            2119,
+            2120,
+            2121,
+            2122,
+            2123,
+            2124,
+            2125,
+            2126,
+            2127,
+            2128,
+            2129,
+            2130,
+            2131,
+            2132,
+            2133,
+            2134,
+            2135,
+            2136,
+            2137,
+            2138,
+            2139,
+            2140,
+            2141,
+            2142,
+            2143,
+            2144,
+            2145,
+            2146,
+            2147,
+            2148,
+            2149,
+            2150,
+            2151,
+            2152,
+            2153,
+            2154,
+            2155,
+            2156,
+            2157,
+            2158,
+            2159,
+            2160,
+            2161,
+            2162,
+            2163,
+            2164,
+            2165,
+            2166,
+            2167,
+            2168,
+            2169,
+            2170,
+            2171,
+            2172,
+            2173,
+            2174,
+            2175,
+            2176,
+            2177,
+            2178,
+            2179,
+            2180,
+            2181,
+            2182,
+            2183,
+            2184,
+            2185,
+            2186,
+            2187,
+            2188,
+            2189,
+            2190,
+            2191,
+            2192,
+            2193,
+            2194,
+            2195,
+            2196,
+            2197,
+            2198,
+            2199,
+            2200,
+            2201,
+            2202,
+            2203,
+            2204,
+            2205,
+            2206,
+            2207,
+            2208,
+            2209,
+            2210,
+            2211,
+            2212,
+            2213,
+            2214,
+            2215,
+            2216,
+            2217,
+            2218,
+            2219,
+            2220,
+            2221,
+            2222,
+            2223,
+            2224,
+            2225,
+            2226,
+            2227,
+            2228,
+            2229,
+            2230,
+            2231,
+            2232,
+            2233,
+            2234,
+            2235,
+            2236,
+            2237,
+            2238,
+            2239,
+            2240,
+            2241,
+            2242,
+            2243,
+            2244,
+            2245,
+            2246,
+            2247,
+            2248,
+            2249,
+            2250,
+            2251,
+            2252,
+            2253,
+            2254,
+            2255,
+            2256,
+            2257,
+            2258,
+            2259,
+            2260,
+            2261,
+            2262,
+            2263,
+            2264,
+            2265,
+            2266,
+            2267,
+            2268,
+            2269,
+            2270,
+            2271,
+            2272,
+            2273,
+            2274,
+            2275,
+            2276,
+            2277,
+            2278,
+            2279,
+            2280,
+            2281,
+            2282,
+            2283,
+            2284,
+            2285,
+            2286,
+            2286,
+            2286,
+            2287,
+            2288,
+            2289,
+            2290,
+            2291,
+            2292,
+            2293,
+            2294,
+            2295,
+            2296,
+            2297,
+            2298,
+            2299,
+            2300,
+            2301,
+            2302,
+            2303,
+            2304,
+            2305,
+            2306,
+            2307,
+            2308,
+            2309,
+            2310,
+            2311,
+            2312,
+            2313,
+            2314,
+            2315,
+            2316,
+            2317,
+            2318,
+            2319,
+            2320,
+            2321,
+            2322,
+            2323,
+            2324,
+            2325,
+            2326,
+            2327,
+            2328,
+            2329,
+            2330,
+            2331,
+            2332,
+            2333,
+            2334,
+            2335,
+            2336,
+            2337,
+            2338,
+            2339,
+            2340,
+            2341,
+            2342,
+            2343,
+            2344,
+            2345,
+            2346,
+            2347,
+            2348,
+            2349,
+            2350,
+            2351,
+            2352,
+            2353,
+            2354,
+            2355,
+            2356,
+            2357,
+            2358,
+            2359,
+            2360,
+            2361,
+            2362,
+            2363,
+            2364,
+            2365,
+            2366,
+            2367,
+            2368,
+            2369,
+            2370,
+            2371,
+            2372,
+            2373,
+            2374,
+            2375,
+            2376,
+            2377,
+            2378,
+            2379,
+            2380,
+            2381,
+            2382,
+            2383,
+            2384,
+            2385,
+            2386,
+            2387,
+            2388,
+            2389,
+            2390,
+            2391,
+            2392,
+            2393,
+            2394,
+            2395,
+            2396,
+            2397,
+            2398,
+            2399,
+            2400,
+            2401,
+            2402,
+            2403,
+            2404,
+            2405,
+            2406,
+            2407,
+            2408,
+            2409,
+            2410,
+            2411,
+            2412,
+            2413,
+            2414,
+            2415,
+            2416,
+            2417,
+            2418,
+            2419,
+            2420,
+            2421,
+            2422,
+            2423,
+            2424,
+            2425,
+            2426,
+            2427,
+            2428,
+            2429,
+            163,
+            2430,
+            2431,
+            163,
+            2432,
+            2433,
+            2434,
+            2435,
+            2436,
+            2437,
+            2438,
+            2439,
+            2440,
+            2441,
+            2442,
+            2443,
+            2444,
+            2445,
+            2446,
+            2447,
+            2448,
+            2449,
+            2450,
+            2451,
+            2452,
+            2453,
+            2454,
+            2455,
+            2456,
+            2457,
+            2458,
+            2459,
+            2460,
+            2461,
+            2462,
+            2463,
+            2464,
+            2465,
+            2466,
+            2467,
+            2468,
+            2469,
+            2470,
+            2471,
+            2472,
+            2473,
+            2474,
+            2475,
+            2476,
+            2477,
+            2478,
+            2479,
+            2480,
+            2481,
+            2482,
+            2483,
+            2484,
+            2485,
+            2486,
+            2487,
+            2488,
+            2489,
+            2490,
+            2491,
+            2492,
+            2493,
+            2494,
+            2495,
+            2496,
+            2497,
+            2498,
+            2499,
+            2500,
+            2501,
+            2502,
+            2503,
+            2504,
+            2505,
+            2506,
+            2507,
+            2508,
+            2509,
+            2510,
+            2511,
+            2512,
+            2513,
+            2514,
+            2515,
+            2516,
+            2517,
+            2518,
+            2519,
+            2520,
+            2521,
+            2522,
+            2523,
+            2524,
+            2525,
+            2526,
+            2527,
+            2528,
+            2529,
+            2530,
+            2531,
+            2532,
+            2533,
+            2534,
+            2535,
+            2536,
+            2537,
+            2538,
+            2539,
+            2540,
+            2541,
+            2542,
+            2543,
+            2544,
+            2545,
+            2546,
+            2547,
+            2548,
+            2549,
+            2550,
+            2551,
+            266,
+            163,
+            163,
+            2552,
+            2553,
+            2554,
+            2555,
+            2556,
+            2557,
+            2558,
+            2559,
+            2560,
+            2561,
+            2562,
+            2563,
+            2564,
+            2565,
+            2566,
+            2567,
+            2568,
+            2569,
+            2570,
+            2571,
+            2572,
+            2573,
+            2574,
+            2575,
+            2576,
+            2577,
+            2578,
+            2579,
+            2580,
+            2581,
+            2582,
+            2583,
+            2584,
+            2585,
+            2586,
+            2587,
+            2588,
+            2589,
+            2590,
+            2591,
+            2592,
+            2593,
+            2594,
+            2595,
+            2596,
+            2597,
+            2598,
+            2599,
+            2600,
+            2601,
+            2602,
+            2603,
+            2604,
+            2605,
+            2606,
+            2607,
+            2608,
+            2609,
+            2610,
+            2611,
+            2612,
+            2613,
+            2614,
+            2615,
+            2616,
+            2617,
+            2618,
+            2619,
+            2620,
+            2621,
+            2622,
+            2623,
+            2624,
+            2625,
+            2626,
+            2627,
+            2628,
+            2629,
+            2630,
+            2631,
+            2632,
+            2633,
+            2634,
+            2635,
+            2636,
+            2637,
+            2638,
+            2639,
+        ),
+    ),
+    c_types=None,
+    multi={
+        6: (
+            (
+                0x4114,
+                0x57DC,
+                0x70A8,
+                0x7578,
+                0xD3B4,
+                0x103C8,
+                0x10B80,
+                0x12108,
+                0x13560,
+                0x14350,
+                0x1904C,
+                0x1A068,
+                0x1B124,
+                0x2075C,
+                0x22B58,
+                0x23EA4,
+                0x267F8,
+                0x28578,
+                0x2934C,
+                0x299C4,
+                0x2BCB8,
+                0x2C03C,
+                0x2CD7C,
+                0x326B0,
+                0x32DC8,
+                0x34DD0,
+                0x35674,
+                0x38ED8,
+                0x3CAF4,
+                0x3CC0C,
+                0x3DD4C,
+                0x3EF54,
+                0x40988,
+                0x42B98,
+                0x43330,
+                0x439BC,
+                0x43F3C,
+                0x44524,
+                0x451F8,
+                0x493E0,
+                0x52600,
+                0x57D6C,
+                0x58E98,
+                0x5BA68,
+                0x688B8,
+                0x69458,
+                0x6B964,
+                0x6D63C,
+                0x71B90,
+                0x729D4,
+            ),
+            (
+                0x22E0354,
+                0x22E1A1C,
+                0x22E32E8,
+                0x22E37B8,
+                0x22E95F4,
+                0x22EC608,
+                0x22ECDC0,
+                0x22EE348,
+                0x22EF7A0,
+                0x22F0590,
+                0x22F528C,
+                0x22F62A8,
+                0x22F7364,
+                0x22FC99C,
+                0x22FED98,
+                0x23000E4,
+                0x2302A38,
+                0x23047B8,
+                0x230558C,
+                0x2305C04,
+                0x2307EF8,
+                0x230827C,
+                0x2308FBC,
+                0x230E8F0,
+                0x230F008,
+                0x2311010,
+                0x23118B4,
+                0x2315118,
+                0x2318D34,
+                0x2318E4C,
+                0x2319F8C,
+                0x231B194,
+                0x231CBC8,
+                0x231EDD8,
+                0x231F570,
+                0x231FBFC,
+                0x232017C,
+                0x2320764,
+                0x2321438,
+                0x2325620,
+                0x232E840,
+                0x2333FAC,
+                0x23350D8,
+                0x2337CA8,
+                0x2344AF8,
+                0x2345698,
+                0x2347BA4,
+                0x234987C,
+                0x234DDD0,
+                0x234EC14,
+            ),
+        ),
+        38: (
+            (
+                0x70CC,
+                0x120D8,
+                0x19754,
+                0x23658,
+                0x2648C,
+                0x2BCDC,
+                0x2E79C,
+                0x32338,
+                0x335D0,
+                0x34DF4,
+                0x359B8,
+                0x38EFC,
+                0x6B910,
+            ),
+            (
+                0x22E330C,
+                0x22EE318,
+                0x22F5994,
+                0x22FF898,
+                0x23026CC,
+                0x2307F1C,
+                0x230A9DC,
+                0x230E578,
+                0x230F810,
+                0x2311034,
+                0x2311BF8,
+                0x231513C,
+                0x2347B50,
+            ),
+        ),
+        50: (
+            (0x9EF0, 0x9F3C, 0x9F88, 0x9FD4, 0xA284, 0xA2D0),
+            (0x22E6130, 0x22E617C, 0x22E61C8, 0x22E6214, 0x22E64C4, 0x22E6510),
+        ),
+        89: ((0xE8E0, 0xE910), (0x22EAB20, 0x22EAB50)),
+        179: (
+            (0x1D48C, 0x257CC, 0x2E700, 0x35954, 0x46B24, 0x567CC),
+            (0x22F96CC, 0x2301A0C, 0x230A940, 0x2311B94, 0x2322D64, 0x2332A0C),
+        ),
+        180: (
+            (
+                0x1D4E0,
+                0x25820,
+                0x2E754,
+                0x33740,
+                0x3C870,
+                0x3E794,
+                0x3F0D8,
+                0x46B78,
+                0x71220,
+            ),
+            (
+                0x22F9720,
+                0x2301A60,
+                0x230A994,
+                0x230F980,
+                0x2318AB0,
+                0x231A9D4,
+                0x231B318,
+                0x2322DB8,
+                0x234D460,
+            ),
+        ),
+        193: (
+            (
+                0x1EA58,
+                0x23CE8,
+                0x2E778,
+                0x3366C,
+                0x34E24,
+                0x385AC,
+                0x3D568,
+                0x3E63C,
+                0x476D8,
+                0x567A8,
+                0x6B940,
+                0x6C070,
+            ),
+            (
+                0x22FAC98,
+                0x22FFF28,
+                0x230A9B8,
+                0x230F8AC,
+                0x2311064,
+                0x23147EC,
+                0x23197A8,
+                0x231A87C,
+                0x2323918,
+                0x23329E8,
+                0x2347B80,
+                0x23482B0,
+            ),
+        ),
+    },
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "DUNGEON_STRUCT_SIZE",
+        "MAX_HP_CAP",
+        "OFFSET_OF_DUNGEON_FLOOR_PROPERTIES",
+        "SPAWN_RAND_MAX",
+        "DUNGEON_PRNG_LCG_MULTIPLIER",
+        "DUNGEON_PRNG_LCG_INCREMENT_SECONDARY",
+        "ATTACK_SPRITE_BUFFER_SIZE",
+        "KECLEON_FEMALE_ID",
+        "KECLEON_MALE_ID",
+        "MSG_ID_SLOW_START",
+        "EXPERIENCE_POINT_GAIN_CAP",
+        "JUDGMENT_MOVE_ID",
+        "REGULAR_ATTACK_MOVE_ID",
+        "DEOXYS_ATTACK_ID",
+        "DEOXYS_SPEED_ID",
+        "GIRATINA_ALTERED_ID",
+        "PUNISHMENT_MOVE_ID",
+        "OFFENSE_STAT_MAX",
+        "PROJECTILE_MOVE_ID",
+        "BELLY_LOST_PER_TURN",
+        "MONSTER_HEAL_HP_MAX",
+        "MOVE_TARGET_AND_RANGE_SPECIAL_USER_HEALING",
+        "PLAIN_SEED_STRING_ID",
+        "MAX_ELIXIR_PP_RESTORATION",
+        "SLIP_SEED_FAIL_STRING_ID",
+        "ROCK_WRECKER_MOVE_ID",
+        "CASTFORM_NORMAL_FORM_MALE_ID",
+        "CASTFORM_NORMAL_FORM_FEMALE_ID",
+        "CHERRIM_SUNSHINE_FORM_MALE_ID",
+        "CHERRIM_OVERCAST_FORM_FEMALE_ID",
+        "CHERRIM_SUNSHINE_FORM_FEMALE_ID",
+        "FLOOR_GENERATION_STATUS_PTR",
+        "OFFSET_OF_DUNGEON_N_NORMAL_ITEM_SPAWNS",
+        "DUNGEON_GRID_COLUMN_BYTES",
+        "DEFAULT_MAX_POSITION",
+        "OFFSET_OF_DUNGEON_GUARANTEED_ITEM_ID",
+        "FIXED_ROOM_TILE_SPAWN_TABLE",
+        "TREASURE_BOX_1_ITEM_IDS",
+        "FIXED_ROOM_REVISIT_OVERRIDES",
+        "FIXED_ROOM_MONSTER_SPAWN_TABLE",
+        "FIXED_ROOM_ITEM_SPAWN_TABLE",
+        "FIXED_ROOM_ENTITY_SPAWN_TABLE",
+        "STATUS_ICON_ARRAY_MUZZLED",
+        "STATUS_ICON_ARRAY_MAGNET_RISE",
+        "STATUS_ICON_ARRAY_MIRACLE_EYE",
+        "STATUS_ICON_ARRAY_LEECH_SEED",
+        "STATUS_ICON_ARRAY_LONG_TOSS",
+        "STATUS_ICON_ARRAY_BLINDED",
+        "STATUS_ICON_ARRAY_BURN",
+        "STATUS_ICON_ARRAY_SURE_SHOT",
+        "STATUS_ICON_ARRAY_INVISIBLE",
+        "STATUS_ICON_ARRAY_SLEEP",
+        "STATUS_ICON_ARRAY_CURSE",
+        "STATUS_ICON_ARRAY_FREEZE",
+        "STATUS_ICON_ARRAY_CRINGE",
+        "STATUS_ICON_ARRAY_BIDE",
+        "STATUS_ICON_ARRAY_REFLECT",
+        "DIRECTIONS_XY",
+        "DISPLACEMENTS_WITHIN_2_LARGEST_FIRST",
+        "DISPLACEMENTS_WITHIN_2_SMALLEST_FIRST",
+        "DISPLACEMENTS_WITHIN_3",
+        "ITEM_CATEGORY_ACTIONS",
+        "FRACTIONAL_TURN_SEQUENCE",
+        "BELLY_DRAIN_IN_WALLS_INT",
+        "BELLY_DRAIN_IN_WALLS_THOUSANDTHS",
+        "DAMAGE_MULTIPLIER_0_5",
+        "DAMAGE_MULTIPLIER_1_5",
+        "DAMAGE_MULTIPLIER_2",
+        "CLOUDY_DAMAGE_MULTIPLIER",
+        "SOLID_ROCK_MULTIPLIER",
+        "DAMAGE_FORMULA_MAX_BASE",
+        "WONDER_GUARD_MULTIPLIER",
+        "DAMAGE_FORMULA_MIN_BASE",
+        "TYPE_DAMAGE_NEGATING_EXCLUSIVE_ITEM_EFFECTS",
+        "TWO_TURN_STATUSES",
+        "TWO_TURN_MOVES_AND_STATUSES",
+        "SPATK_STAT_IDX",
+        "ATK_STAT_IDX",
+        "ROLLOUT_DAMAGE_MULT_TABLE",
+        "MAP_COLOR_TABLE",
+        "CORNER_CARDINAL_NEIGHBOR_IS_OPEN",
+        "GUMMI_LIKE_STRING_IDS",
+        "GUMMI_IQ_STRING_IDS",
+        "DAMAGE_STRING_IDS",
+        "DUNGEON_PTR",
+        "DUNGEON_PTR_MASTER",
+        "TOP_SCREEN_STATUS_PTR",
+        "LEADER_PTR",
+        "DUNGEON_PRNG_STATE",
+        "DUNGEON_PRNG_STATE_SECONDARY_VALUES",
+        "LOADED_ATTACK_SPRITE_FILE_INDEX",
+        "LOADED_ATTACK_SPRITE_PACK_ID",
+        "EXCL_ITEM_EFFECTS_WEATHER_ATK_SPEED_BOOST",
+        "EXCL_ITEM_EFFECTS_WEATHER_MOVE_SPEED_BOOST",
+        "EXCL_ITEM_EFFECTS_WEATHER_NO_STATUS",
+        "AI_THROWN_ITEM_ACTION_CHOICE_COUNT",
+        "EXCL_ITEM_EFFECTS_EVASION_BOOST",
+        "DEFAULT_TILE",
+        "HIDDEN_STAIRS_SPAWN_BLOCKED",
+        "FIXED_ROOM_DATA_PTR",
+        "DUNGEON_FADES_PTR",
+        "NECTAR_IQ_BOOST",
+        "COMPRESSED_SPRITE_BUFFER_SIZE",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xBC10,
+            0xFFFFFFFF,
+            0xE854,
+            0x1AC98,
+            0x1B1C4,
+            0x1B1C8,
+            0x1D090,
+            0x26488,
+            0x30218,
+            0x3021C,
+            0x30220,
+            0x30224,
+            0x30228,
+            0x3022C,
+            0x3025C,
+            0xFFFFFFFF,
+            0x34830,
+            0x390A0,
+            0x3EAF4,
+            0x40508,
+            0x4050C,
+            0x4096C,
+            0x48360,
+            0x591F8,
+            0x591FC,
+            0x59200,
+            0x59204,
+            0x59208,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x63D58,
+            0xFFFFFFFF,
+            0x73B90,
+            0x73BBC,
+            0x73BD4,
+            0x73CD4,
+            0x73EB4,
+            0x740AC,
+            0x74F7C,
+            0x74F8C,
+            0x74FAC,
+            0x74FBC,
+            0x74FD4,
+            0x7502C,
+            0x75054,
+            0x7507C,
+            0x750A4,
+            0x750CC,
+            0x750FC,
+            0x75134,
+            0x75174,
+            0x751B4,
+            0x752B4,
+            0x754DC,
+            0x7559C,
+            0x75604,
+            0x7566C,
+            0x75DD0,
+            0x76044,
+            0x76528,
+            0x7652A,
+            0x765FC,
+            0x76604,
+            0x7660C,
+            0x7661C,
+            0x76624,
+            0x7662C,
+            0x76634,
+            0x7663C,
+            0x76664,
+            0x76820,
+            0x7686C,
+            0x768A8,
+            0x768AC,
+            0x768B0,
+            0x76D90,
+            0x76DD0,
+            0x77090,
+            0x770E4,
+            0x770F0,
+            0x772F8,
+            0x772FC,
+            0x77314,
+            0x7731C,
+            0x77330,
+            0x77344,
+            0x7736C,
+            0xFFFFFFFF,
+            0x77370,
+            0x77378,
+            0x77380,
+            0x774BC,
+            0x774D0,
+            0x774E4,
+            0x7754C,
+            0x77554,
+            0x775A0,
+            0x40144,
+            0x6FD2C,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x22E7E50,
+            0xFFFFFFFF,
+            0x22EAA94,
+            0x22F6ED8,
+            0x22F7404,
+            0x22F7408,
+            0x22F92D0,
+            0x23026C8,
+            0x230C458,
+            0x230C45C,
+            0x230C460,
+            0x230C464,
+            0x230C468,
+            0x230C46C,
+            0x230C49C,
+            0xFFFFFFFF,
+            0x2310A70,
+            0x23152E0,
+            0x231AD34,
+            0x231C748,
+            0x231C74C,
+            0x231CBAC,
+            0x23245A0,
+            0x2335438,
+            0x233543C,
+            0x2335440,
+            0x2335444,
+            0x2335448,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x233FF98,
+            0xFFFFFFFF,
+            0x234FDD0,
+            0x234FDFC,
+            0x234FE14,
+            0x234FF14,
+            0x23500F4,
+            0x23502EC,
+            0x23511BC,
+            0x23511CC,
+            0x23511EC,
+            0x23511FC,
+            0x2351214,
+            0x235126C,
+            0x2351294,
+            0x23512BC,
+            0x23512E4,
+            0x235130C,
+            0x235133C,
+            0x2351374,
+            0x23513B4,
+            0x23513F4,
+            0x23514F4,
+            0x235171C,
+            0x23517DC,
+            0x2351844,
+            0x23518AC,
+            0x2352010,
+            0x2352284,
+            0x2352768,
+            0x235276A,
+            0x235283C,
+            0x2352844,
+            0x235284C,
+            0x235285C,
+            0x2352864,
+            0x235286C,
+            0x2352874,
+            0x235287C,
+            0x23528A4,
+            0x2352A60,
+            0x2352AAC,
+            0x2352AE8,
+            0x2352AEC,
+            0x2352AF0,
+            0x2352FD0,
+            0x2353010,
+            0x23532D0,
+            0x2353324,
+            0x2353330,
+            0x2353538,
+            0x235353C,
+            0x2353554,
+            0x235355C,
+            0x2353570,
+            0x2353584,
+            0x23535AC,
+            0xFFFFFFFF,
+            0x23535B0,
+            0x23535B8,
+            0x23535C0,
+            0x23536FC,
+            0x2353710,
+            0x2353724,
+            0x235378C,
+            0x2353794,
+            0x23537E0,
+            0x231C384,
+            0x234BF6C,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x2C,
+            0x18,
+            0x100,
+            0x1E0,
+            0x1F8,
+            0xC9C,
+            0x10,
+            0x10,
+            0x18,
+            0x18,
+            0x18,
+            0x28,
+            0x28,
+            0x28,
+            0x28,
+            0x40,
+            0x38,
+            0x40,
+            0x40,
+            0x70,
+            0x90,
+            0x20,
+            0x68,
+            0x68,
+            0xC8,
+            0x20,
+            0xFA,
+            0x2,
+            0x2,
+            0x8,
+            0x8,
+            0x8,
+            0x8,
+            0x8,
+            0x8,
+            0x8,
+            0x8,
+            0xE0,
+            0xB,
+            0x2C,
+            0x4,
+            0x4,
+            0x28,
+            0x24,
+            0x20,
+            0x8,
+            0xA,
+            0x36,
+            0x4,
+            0x4,
+            0xFFFFFFFF,
+            0x4,
+            0x14,
+            0x14,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0x8,
+            0x8,
+            0x8,
+            0xFFFFFFFF,
+            0x8,
+            0x14,
+            0x1,
+            0x4,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            2640,
+            2641,
+            2642,
+            2643,
+            2644,
+            2645,
+            2646,
+            2647,
+            2648,
+            2649,
+            2650,
+            2651,
+            2652,
+            2653,
+            2654,
+            2655,
+            2656,
+            2657,
+            2658,
+            2659,
+            2641,
+            2660,
+            2661,
+            2662,
+            2663,
+            2664,
+            2665,
+            2666,
+            2667,
+            2668,
+            2669,
+            2670,
+            2671,
+            2672,
+            2673,
+            2674,
+            2675,
+            2676,
+            2677,
+            2678,
+            2679,
+            2680,
+            2681,
+            2682,
+            2683,
+            2684,
+            2685,
+            2686,
+            2687,
+            2688,
+            2689,
+            2690,
+            2691,
+            2692,
+            2693,
+            2694,
+            2695,
+            2696,
+            2697,
+            2698,
+            2699,
+            2700,
+            2701,
+            2702,
+            2703,
+            2704,
+            2705,
+            2706,
+            2707,
+            2708,
+            2709,
+            2710,
+            2711,
+            2712,
+            2713,
+            2714,
+            2715,
+            2716,
+            2717,
+            2718,
+            2719,
+            2720,
+            2721,
+            2722,
+            2723,
+            2724,
+            2725,
+            2726,
+            2727,
+            2728,
+            2729,
+            2730,
+            2731,
+            2732,
+            2733,
+            2734,
+            2735,
+            2736,
+            2737,
+            2738,
+            2739,
+            2740,
+            2741,
+        ),
+    ),
+    c_types=(
+        "uint32_t",
+        "int32_t",
+        "uint32_t",
+        "int32_t",
+        "uint32_t",
+        "uint32_t",
+        "int32_t",
+        "enum monster_id",
+        "enum monster_id",
+        "int32_t",
+        "int32_t",
+        "enum move_id",
+        "enum move_id",
+        "enum monster_id",
+        "enum monster_id",
+        "enum monster_id",
+        "enum move_id",
+        "int32_t",
+        "enum move_id",
+        "fx32_16",
+        "int",
+        "struct move_target_and_range",
+        "int32_t",
+        "int32_t",
+        "int32_t",
+        "enum move_id",
+        "enum monster_id",
+        "enum monster_id",
+        "enum monster_id",
+        "enum monster_id",
+        "enum monster_id",
+        "struct floor_generation_status*",
+        "uint32_t",
+        "uint32_t",
+        "int32_t",
+        "uint32_t",
+        "struct fixed_room_tile_spawn_entry[11]",
+        "struct item_id_16[12]",
+        "struct fixed_room_id_8[256]",
+        "struct fixed_room_monster_spawn_entry[120]",
+        "struct fixed_room_item_spawn_entry[63]",
+        "struct fixed_room_entity_spawn_entry[269]",
+        "struct status_icon_flags[2]",
+        "struct status_icon_flags[2]",
+        "struct status_icon_flags[3]",
+        "struct status_icon_flags[3]",
+        "struct status_icon_flags[3]",
+        "struct status_icon_flags[5]",
+        "struct status_icon_flags[5]",
+        "struct status_icon_flags[5]",
+        "struct status_icon_flags[5]",
+        "struct status_icon_flags[8]",
+        "struct status_icon_flags[7]",
+        "struct status_icon_flags[8]",
+        "struct status_icon_flags[8]",
+        "struct status_icon_flags[14]",
+        "struct status_icon_flags[18]",
+        "int16_t[8][2]",
+        "struct position[26]",
+        "struct position[26]",
+        "struct position[50]",
+        "struct action_16[16]",
+        "int16_t[125]",
+        "uint16_t",
+        "uint16_t",
+        "struct fx64_16",
+        "struct fx64_16",
+        "struct fx64_16",
+        "struct fx64_16",
+        "struct fx64_16",
+        "struct fx64_16",
+        "struct fx64_16",
+        "struct fx64_16",
+        "struct damage_negating_exclusive_eff_entry[28]",
+        "struct status_two_turn_id_8[11]",
+        "struct two_turn_move_and_status[22]",
+        "int32_t",
+        "int32_t",
+        "fx32_8[10]",
+        "struct rgba[9]",
+        "bool[4][8]",
+        "int16_t[4]",
+        "int16_t[5]",
+        "int16_t[27]",
+        "struct dungeon*",
+        "struct dungeon*",
+        "struct top_screen_status*",
+        "struct entity*",
+        "struct prng_state",
+        "uint32_t[5]",
+        "uint16_t",
+        "enum pack_file_id",
+        "struct exclusive_item_effect_id_8[8]",
+        "struct exclusive_item_effect_id_8[8]",
+        "struct exclusive_item_effect_id_8[8]",
+        "uint32_t",
+        "struct exclusive_item_effect_id_8[8]",
+        "struct tile",
+        "bool",
+        "void*",
+        "struct dungeon_fades*",
+        "struct data_processing_instruction",
+        "struct data_processing_instruction",
+    ),
+    multi={
+        0: ((0x2838, 0x286C), (0x22DEA78, 0x22DEAAC)),
+        1: (
+            (0x7B90, 0x2F578, 0x355D4, 0x3C214, 0x47DE0),
+            (0x22E3DD0, 0x230B7B8, 0x2311814, 0x2318454, 0x2324020),
+        ),
+        2: ((0xB7B8, 0x5EC28), (0x22E79F8, 0x233AE68)),
+        4: ((0xE788, 0xE84C), (0x22EA9C8, 0x22EAA8C)),
+        18: ((0x30E3C, 0x404C0), (0x230D07C, 0x231C700)),
+        31: (
+            (
+                0x5EC2C,
+                0x5ECC8,
+                0x5EF4C,
+                0x5F3D8,
+                0x5F838,
+                0x5F998,
+                0x5FB30,
+                0x5FCEC,
+                0x600CC,
+                0x6052C,
+                0x60D40,
+                0x60EC0,
+                0x610D0,
+                0x61430,
+                0x61E18,
+                0x63D50,
+                0x63FDC,
+                0x64490,
+                0x6521C,
+                0x65524,
+                0x65F38,
+                0x662D0,
+                0x665A0,
+                0x66934,
+                0x66A24,
+                0x66B58,
+                0x66CE8,
+            ),
+            (
+                0x233AE6C,
+                0x233AF08,
+                0x233B18C,
+                0x233B618,
+                0x233BA78,
+                0x233BBD8,
+                0x233BD70,
+                0x233BF2C,
+                0x233C30C,
+                0x233C76C,
+                0x233CF80,
+                0x233D100,
+                0x233D310,
+                0x233D670,
+                0x233E058,
+                0x233FF90,
+                0x234021C,
+                0x23406D0,
+                0x234145C,
+                0x2341764,
+                0x2342178,
+                0x2342510,
+                0x23427E0,
+                0x2342B74,
+                0x2342C64,
+                0x2342D98,
+                0x2342F28,
+            ),
+        ),
+        32: ((0x5EC34, 0x65224), (0x233AE74, 0x2341464)),
+        33: (
+            (
+                0x5F3D4,
+                0x5F834,
+                0x5FB2C,
+                0x5FCE8,
+                0x600C8,
+                0x60530,
+                0x607A4,
+                0x60D38,
+                0x60EBC,
+                0x610D4,
+                0x6142C,
+                0x61E14,
+                0x621F8,
+                0x62AF0,
+                0x62ED4,
+                0x636BC,
+                0x63D54,
+                0x63FE0,
+                0x64214,
+                0x6628C,
+            ),
+            (
+                0x233B614,
+                0x233BA74,
+                0x233BD6C,
+                0x233BF28,
+                0x233C308,
+                0x233C770,
+                0x233C9E4,
+                0x233CF78,
+                0x233D0FC,
+                0x233D314,
+                0x233D66C,
+                0x233E054,
+                0x233E438,
+                0x233ED30,
+                0x233F114,
+                0x233F8FC,
+                0x233FF94,
+                0x2340220,
+                0x2340454,
+                0x23424CC,
+            ),
+        ),
+        35: ((0x65220, 0x68C40), (0x2341460, 0x2344E80)),
+    },
+)
@@ -0,0 +1,492 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay31 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "EntryOverlay31",
+        "DrawDungeonMenuStatusWindow",
+        "DungeonMenuSwitch",
+        "CreateStairsMenuState",
+        "StairsSubheadingCallback",
+        "HandleStairsMenu",
+        "MovesMenu",
+        "HandleMovesMenuWrapper0",
+        "HandleMovesMenuWrapper1",
+        "HandleMovesMenu",
+        "TeamMenu",
+        "RestMenu",
+        "RecruitmentSearchMenuLoop",
+        "HelpMenuLoop",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x0,
+            0x44,
+            0x2A0,
+            0x6B4,
+            0x748,
+            0x79C,
+            0x29A0,
+            0x2B9C,
+            0x2BC0,
+            0x2BE4,
+            0x482C,
+            0x5F6C,
+            0x63E4,
+            0x69DC,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x2382820,
+            0x2382864,
+            0x2382AC0,
+            0x2382ED4,
+            0x2382F68,
+            0x2382FBC,
+            0x23851C0,
+            0x23853BC,
+            0x23853E0,
+            0x2385404,
+            0x238704C,
+            0x238878C,
+            0x2388C04,
+            0x23891FC,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            163,
+            2745,
+            2746,
+            2747,
+            2748,
+            2749,
+            2750,
+            2751,
+            2752,
+            2753,
+            2754,
+            2755,
+            2756,
+            2757,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "DUNGEON_WINDOW_PARAMS_1",
+        "DUNGEON_WINDOW_PARAMS_2",
+        "DUNGEON_WINDOW_PARAMS_3",
+        "DUNGEON_WINDOW_PARAMS_4",
+        "DUNGEON_MAIN_MENU_ITEMS",
+        "DUNGEON_MENU_SWITCH_STR1",
+        "OVERLAY31_UNKNOWN_STRING_IDS",
+        "OVERLAY31_UNKNOWN_STRUCT__NA_2389E30",
+        "DUNGEON_WINDOW_PARAMS_5",
+        "DUNGEON_WINDOW_PARAMS_6",
+        "DUNGEON_WINDOW_PARAMS_7",
+        "DUNGEON_SUBMENU_ITEMS_1",
+        "DUNGEON_SUBMENU_ITEMS_2",
+        "DUNGEON_SUBMENU_ITEMS_3",
+        "DUNGEON_SUBMENU_ITEMS_4",
+        "OVERLAY31_UNKNOWN_STRUCT__NA_2389EF0",
+        "DUNGEON_WINDOW_PARAMS_8",
+        "DUNGEON_WINDOW_PARAMS_9",
+        "DUNGEON_WINDOW_PARAMS_10",
+        "DUNGEON_WINDOW_PARAMS_11",
+        "DUNGEON_WINDOW_PARAMS_12",
+        "DUNGEON_WINDOW_PARAMS_13",
+        "OVERLAY31_JP_STRING",
+        "DUNGEON_WINDOW_PARAMS_14",
+        "DUNGEON_WINDOW_PARAMS_15",
+        "DUNGEON_WINDOW_PARAMS_16",
+        "DUNGEON_WINDOW_PARAMS_17",
+        "DUNGEON_WINDOW_PARAMS_18",
+        "DUNGEON_WINDOW_PARAMS_19",
+        "OVERLAY31_UNKNOWN_STRUCT__NA_2389FE8",
+        "DUNGEON_WINDOW_PARAMS_20",
+        "DUNGEON_WINDOW_PARAMS_21",
+        "DUNGEON_WINDOW_PARAMS_22",
+        "DUNGEON_WINDOW_PARAMS_23",
+        "DUNGEON_WINDOW_PARAMS_24",
+        "DUNGEON_WINDOW_PARAMS_25",
+        "DUNGEON_SUBMENU_ITEMS_5",
+        "DUNGEON_WINDOW_PARAMS_26",
+        "OVERLAY31_UNKNOWN_STRUCT__NA_238A144",
+        "DUNGEON_WINDOW_PARAMS_27",
+        "DUNGEON_WINDOW_PARAMS_28",
+        "OVERLAY31_UNKNOWN_STRUCT__NA_238A190",
+        "DUNGEON_SUBMENU_ITEMS_6",
+        "DUNGEON_WINDOW_PARAMS_29",
+        "DUNGEON_WINDOW_PARAMS_30",
+        "DUNGEON_WINDOW_PARAMS_31",
+        "DUNGEON_WINDOW_PARAMS_32",
+        "OVERLAY31_RESERVED_SPACE",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A260",
+        "OVERLAY31_UNKNOWN_VALUE__NA_238A264",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A268",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A26C",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A270",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A274",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A278",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A27C",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A280",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A284",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A288",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A28C",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x7574,
+            0x7584,
+            0x7594,
+            0x75A4,
+            0x75B4,
+            0x75F4,
+            0x7600,
+            0x7610,
+            0x7620,
+            0x7630,
+            0x7640,
+            0x7650,
+            0x7670,
+            0x7690,
+            0x76B0,
+            0x76D0,
+            0x76DC,
+            0x76EC,
+            0x76FC,
+            0x770C,
+            0x771C,
+            0x772C,
+            0x7744,
+            0x7768,
+            0x7778,
+            0x7788,
+            0x7798,
+            0x77A8,
+            0x77B8,
+            0x77C8,
+            0x77D4,
+            0x77E4,
+            0x77F4,
+            0x7804,
+            0x7814,
+            0x78EC,
+            0x78FC,
+            0x7914,
+            0x7924,
+            0x7950,
+            0x7960,
+            0x7970,
+            0x7980,
+            0x79C8,
+            0x79D8,
+            0x79E8,
+            0x79F8,
+            0x7A30,
+            0x7A40,
+            0x7A44,
+            0x7A48,
+            0x7A4C,
+            0x7A50,
+            0x7A54,
+            0x7A58,
+            0x7A5C,
+            0x7A60,
+            0x7A64,
+            0x7A68,
+            0x7A6C,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x2389D94,
+            0x2389DA4,
+            0x2389DB4,
+            0x2389DC4,
+            0x2389DD4,
+            0x2389E14,
+            0x2389E20,
+            0x2389E30,
+            0x2389E40,
+            0x2389E50,
+            0x2389E60,
+            0x2389E70,
+            0x2389E90,
+            0x2389EB0,
+            0x2389ED0,
+            0x2389EF0,
+            0x2389EFC,
+            0x2389F0C,
+            0x2389F1C,
+            0x2389F2C,
+            0x2389F3C,
+            0x2389F4C,
+            0x2389F64,
+            0x2389F88,
+            0x2389F98,
+            0x2389FA8,
+            0x2389FB8,
+            0x2389FC8,
+            0x2389FD8,
+            0x2389FE8,
+            0x2389FF4,
+            0x238A004,
+            0x238A014,
+            0x238A024,
+            0x238A034,
+            0x238A10C,
+            0x238A11C,
+            0x238A134,
+            0x238A144,
+            0x238A170,
+            0x238A180,
+            0x238A190,
+            0x238A1A0,
+            0x238A1E8,
+            0x238A1F8,
+            0x238A208,
+            0x238A218,
+            0x238A250,
+            0x238A260,
+            0x238A264,
+            0x238A268,
+            0x238A26C,
+            0x238A270,
+            0x238A274,
+            0x238A278,
+            0x238A27C,
+            0x238A280,
+            0x238A284,
+            0x238A288,
+            0x238A28C,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x40,
+            0xC,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x20,
+            0x20,
+            0x20,
+            0x20,
+            0xC,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x24,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0xC,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x18,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x48,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x10,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            266,
+            266,
+            266,
+            266,
+            1,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1,
+            1,
+            1,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            2758,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[8]",
+        "char[12]",
+        "",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[3]",
+        "struct window_params",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "struct simple_menu_id_item[9]",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+    ),
+    multi={},
+)
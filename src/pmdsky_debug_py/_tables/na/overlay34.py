@@ -0,0 +1,105 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay34 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=("ExplorersOfSkyMain",),
+    addresses=array("I", (0x0,)),
+    absolute_addresses=array("I", (0x22DC240,)),
+    lengths=array("I", (0xFFFFFFFF,)),
+    descriptions=array("I", (2759,)),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "OVERLAY34_UNKNOWN_STRUCT__NA_22DD014",
+        "START_MENU_ITEMS_CONFIRM",
+        "OVERLAY34_UNKNOWN_STRUCT__NA_22DD03C",
+        "DUNGEON_DEBUG_MENU_ITEMS",
+        "OVERLAY34_RESERVED_SPACE",
+        "OVERLAY34_UNKNOWN_POINTER__NA_22DD080",
+        "OVERLAY34_UNKNOWN_POINTER__NA_22DD084",
+        "OVERLAY34_UNKNOWN_POINTER__NA_22DD088",
+        "OVERLAY34_UNKNOWN_POINTER__NA_22DD08C",
+        "OVERLAY34_UNKNOWN_POINTER__NA_22DD090",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xDD4,
+            0xDE4,
+            0xDFC,
+            0xE0C,
+            0xE34,
+            0xE40,
+            0xE44,
+            0xE48,
+            0xE4C,
+            0xE50,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x22DD014,
+            0x22DD024,
+            0x22DD03C,
+            0x22DD04C,
+            0x22DD074,
+            0x22DD080,
+            0x22DD084,
+            0x22DD088,
+            0x22DD08C,
+            0x22DD090,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0x10,
+            0x18,
+            0x10,
+            0x28,
+            0xC,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+            0x4,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            2760,
+            1,
+            2760,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "",
+        "struct simple_menu_id_item[3]",
+        "",
+        "struct simple_menu_id_item[5]",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+    ),
+    multi={},
+)
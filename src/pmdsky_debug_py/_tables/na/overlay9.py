@@ -0,0 +1,146 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay9 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "CreateJukeboxTrackMenu",
+        "CloseJukeboxTrackMenu",
+        "IsJukeboxTrackMenuActive",
+        "UpdateJukeboxTrackMenu",
+        "CreatePlaybackControlsMenu",
+        "ClosePlaybackControlsMenu",
+        "IsPlaybackControlsMenuActive",
+        "UpdatePlaybackControlsMenu",
+        "CreateInputLockBox",
+        "CloseInputLockBox",
+        "IsInputLockBoxActive",
+        "UpdateInputLockBox",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x15B0,
+            0x18CC,
+            0x1904,
+            0x195C,
+            0x1E98,
+            0x21D8,
+            0x227C,
+            0x2304,
+            0x2790,
+            0x2940,
+            0x295C,
+            0x297C,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x233E030,
+            0x233E34C,
+            0x233E384,
+            0x233E3DC,
+            0x233E918,
+            0x233EC58,
+            0x233ECFC,
+            0x233ED84,
+            0x233F210,
+            0x233F3C0,
+            0x233F3DC,
+            0x233F3FC,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            2761,
+            2762,
+            2763,
+            2764,
+            2765,
+            2766,
+            2767,
+            2768,
+            2769,
+            2770,
+            2771,
+            2772,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "JUKEBOX_TRACK_MENU_DEFAULT_WINDOW_PARAMS",
+        "PLAYBACK_CONTROLS_MENU_DEFAULT_WINDOW_PARAMS",
+        "INPUT_LOCK_BOX_DEFAULT_WINDOW_PARAMS",
+        "TOP_MENU_RETURN_MUSIC_ID",
+    ),
+    addresses=array(
+        "I",
+        (
+            0x2D14,
+            0x2D24,
+            0x2D34,
+            0xE80,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0x233F794,
+            0x233F7A4,
+            0x233F7B4,
+            0x233D900,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0x10,
+            0x10,
+            0x10,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            2773,
+            2774,
+            2775,
+            2776,
+        ),
+    ),
+    c_types=(
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct data_processing_instruction",
+    ),
+    multi={},
+)
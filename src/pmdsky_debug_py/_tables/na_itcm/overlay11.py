@@ -0,0 +1,514 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay11 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "UnlockScriptingLock",
+        "FuncThatCallsRunNextOpcode",
+        "RunNextOpcode",
+        "HandleUnlocks",
+        "LoadFileFromRomVeneer",
+        "SsbLoad2",
+        "ScriptParamToInt",
+        "ScriptParamToFixedPoint16",
+        "StationLoadHanger",
+        "ScriptStationLoadTalk",
+        "SsbLoad1",
+        "ScriptSpecialProcessCall",
+        "GetCoroutineInfo",
+        "GetSpecialRecruitmentSpecies",
+        "PrepareMenuAcceptTeamMember",
+        "InitRandomNpcJobs",
+        "GetRandomNpcJobType",
+        "GetRandomNpcJobSubtype",
+        "GetRandomNpcJobStillAvailable",
+        "AcceptRandomNpcJob",
+        "GroundMainLoop",
+        "GetAllocArenaGround",
+        "GetFreeArenaGround",
+        "GroundMainReturnDungeon",
+        "GroundMainNextDay",
+        "JumpToTitleScreen",
+        "ReturnToTitleScreen",
+        "ScriptSpecialProcess0x16",
+        "IsScreenFadeInProgress",
+        "LoadBackgroundAttributes",
+        "LoadMapType10",
+        "LoadMapType11",
+        "GetSpecialLayoutBackground",
+        "SetAnimDataFields",
+        "SetAnimDataFieldsWrapper",
+        "InitAnimDataFromOtherAnimData",
+        "SetAnimDataFields2",
+        "GetIdleAnimationType",
+        "LoadObjectAnimData",
+        "InitAnimDataFromOtherAnimDataVeneer",
+        "AnimRelatedFunction",
+        "AllocAndInitPartnerFollowDataAndLiveActorList",
+        "InitPartnerFollowDataAndLiveActorList",
+        "DeleteLiveActor",
+        "ChangeActorAnimation",
+        "InitPartnerFollowData",
+        "GetDirectionLiveActor",
+        "SetDirectionLiveActor",
+        "CreateTeamInfoBox",
+        "CloseTeamInfoBox",
+        "IsTeamInfoBoxActive",
+        "UpdateTeamInfoBox",
+        "CreateTopGroundMenu",
+        "CloseTopGroundMenu",
+        "UpdateTopGroundMenu",
+        "IsBagNotEmpty",
+        "SprintfStatic",
+        "GetExclusiveItemRequirements",
+        "HandleControlsTopScreenGround",
+        "GetDungeonMapPos",
+        "WorldMapSetMode",
+        "WorldMapSetCamera",
+        "StatusUpdate",
+        "HandleTeamStatsGround",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1748,
+            1749,
+            1750,
+            1751,
+            1752,
+            1,
+            1753,
+            1754,
+            1,
+            1,
+            1,
+            1755,
+            1756,
+            1757,
+            1758,
+            1759,
+            1760,
+            1761,
+            1762,
+            1763,
+            1764,
+            1765,
+            1766,
+            1767,
+            1768,
+            1769,
+            1770,
+            1771,
+            1772,
+            1773,
+            1774,
+            1774,
+            1775,
+            1776,
+            1777,
+            1778,
+            1779,
+            1780,
+            1781,
+            1782,
+            1783,
+            1784,
+            1785,
+            1786,
+            1787,
+            1788,
+            1789,
+            1790,
+            1791,
+            1792,
+            1793,
+            1794,
+            1795,
+            1796,
+            1797,
+            1798,
+            1799,
+            1800,
+            1801,
+            1802,
+            1803,
+            1804,
+            1805,
+            1806,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "OVERLAY11_UNKNOWN_TABLE__NA_2316A38",
+        "SCRIPT_COMMAND_PARSING_DATA",
+        "SCRIPT_OP_CODE_NAMES",
+        "SCRIPT_OP_CODES",
+        "OVERLAY11_DEBUG_STRINGS",
+        "C_ROUTINE_NAMES",
+        "C_ROUTINES",
+        "GROUND_WEATHER_TABLE",
+        "GROUND_WAN_FILES_TABLE",
+        "OBJECTS",
+        "RECRUITMENT_TABLE_LOCATIONS",
+        "RECRUITMENT_TABLE_LEVELS",
+        "RECRUITMENT_TABLE_SPECIES",
+        "LEVEL_TILEMAP_LIST",
+        "SETANIMATION_TABLE",
+        "TEAM_INFO_BOX_DEFAULT_WINDOW_PARAMS",
+        "OVERLAY11_OVERLAY_LOAD_TABLE",
+        "UNIONALL_RAM_ADDRESS",
+        "GROUND_STATE_MAP",
+        "GROUND_STATE_WEATHER",
+        "GROUND_STATE_PTRS",
+        "WORLD_MAP_MODE",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1807,
+            1808,
+            1809,
+            1810,
+            1811,
+            1812,
+            1813,
+            1814,
+            1815,
+            1816,
+            1817,
+            1818,
+            1819,
+            1820,
+            1821,
+            1822,
+            1823,
+            1025,
+            1025,
+            1824,
+            1825,
+            1826,
+        ),
+    ),
+    c_types=(
+        "",
+        "undefined[32]",
+        "char[0]",
+        "struct script_opcode_table",
+        "char[0]",
+        "char[0]",
+        "struct common_routine_table",
+        "struct ground_weather_entry[12]",
+        "char[343][12]",
+        "struct script_object[0]",
+        "struct dungeon_id_16[22]",
+        "int16_t[22]",
+        "struct monster_id_16[22]",
+        "struct level_tilemap_list_entry[81]",
+        "struct animation_data[84]",
+        "struct window_params",
+        "struct overlay_load_entry[21]",
+        "",
+        "",
+        "",
+        "struct main_ground_data",
+        "uint32_t",
+    ),
+    multi={},
+)
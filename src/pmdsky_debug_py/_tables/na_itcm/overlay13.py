@@ -0,0 +1,247 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay13 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "EntryOverlay13",
+        "ExitOverlay13",
+        "Overlay13SwitchFunctionNa238A1C8",
+        "Overlay13SwitchFunctionNa238A574",
+        "GetPersonality",
+        "GetOptionStringFromID",
+        "WaitForNextStep",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            1827,
+            163,
+            1828,
+            1829,
+            1830,
+            1831,
+            1832,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "QUIZ_BORDER_COLOR_TABLE",
+        "PORTRAIT_ATTRIBUTES",
+        "QUIZ_MALE_FEMALE_BOOST_TABLE",
+        "OVERLAY13_UNKNOWN_STRUCT__NA_238C024",
+        "QUIZ_WINDOW_PARAMS_1",
+        "QUIZ_WINDOW_PARAMS_2",
+        "QUIZ_WINDOW_PARAMS_3",
+        "QUIZ_WINDOW_PARAMS_4",
+        "QUIZ_MENU_ITEMS_1",
+        "STARTERS_PARTNER_IDS",
+        "STARTERS_HERO_IDS",
+        "STARTERS_TYPE_INCOMPATIBILITY_TABLE",
+        "STARTERS_STRINGS",
+        "QUIZ_QUESTION_STRINGS",
+        "QUIZ_ANSWER_STRINGS",
+        "QUIZ_ANSWER_POINTS",
+        "OVERLAY13_RESERVED_SPACE",
+        "OVERLAY13_UNKNOWN_POINTER__NA_238CEA0",
+        "OVERLAY13_UNKNOWN_POINTER__NA_238CEA4",
+        "OVERLAY13_UNKNOWN_POINTER__NA_238CEA8",
+        "QUIZ_WINDOW_PARAMS_5",
+        "QUIZ_WINDOW_PARAMS_6",
+        "QUIZ_DEBUG_MENU_ITEMS",
+        "OVERLAY13_UNKNOWN_STRUCT__NA_238CF14",
+        "QUIZ_QUESTION_ANSWER_ASSOCIATIONS",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1833,
+            1834,
+            266,
+            1835,
+            1836,
+            1837,
+            1838,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1839,
+        ),
+    ),
+    c_types=(
+        "",
+        "",
+        "",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[3]",
+        "struct monster_id_16[21]",
+        "struct monster_id_16[32]",
+        "",
+        "uint16_t[48]",
+        "uint16_t[66]",
+        "uint16_t[176]",
+        "struct quiz_answer_points_entry[174]",
+        "",
+        "",
+        "",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[9]",
+        "",
+        "uint16_t[66]",
+    ),
+    multi={},
+)
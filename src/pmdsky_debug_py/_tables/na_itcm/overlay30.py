@@ -0,0 +1,57 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay30 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=("WriteQuicksaveData",),
+    addresses=array("I", (0xFFFFFFFF,)),
+    absolute_addresses=array("I", (0xFFFFFFFF,)),
+    lengths=array("I", (0xFFFFFFFF,)),
+    descriptions=array("I", (2742,)),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "OVERLAY30_JP_STRING_1",
+        "OVERLAY30_JP_STRING_2",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            2743,
+            2744,
+        ),
+    ),
+    c_types=(
+        "",
+        "",
+    ),
+    multi={},
+)
@@ -0,0 +1,492 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the overlay31 section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+FUNCTIONS = SymbolTable(
+    names=(
+        "EntryOverlay31",
+        "DrawDungeonMenuStatusWindow",
+        "DungeonMenuSwitch",
+        "CreateStairsMenuState",
+        "StairsSubheadingCallback",
+        "HandleStairsMenu",
+        "MovesMenu",
+        "HandleMovesMenuWrapper0",
+        "HandleMovesMenuWrapper1",
+        "HandleMovesMenu",
+        "TeamMenu",
+        "RestMenu",
+        "RecruitmentSearchMenuLoop",
+        "HelpMenuLoop",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            163,
+            2745,
+            2746,
+            2747,
+            2748,
+            2749,
+            2750,
+            2751,
+            2752,
+            2753,
+            2754,
+            2755,
+            2756,
+            2757,
+        ),
+    ),
+    c_types=None,
+    multi={},
+)
+
+
+DATA = SymbolTable(
+    names=(
+        "DUNGEON_WINDOW_PARAMS_1",
+        "DUNGEON_WINDOW_PARAMS_2",
+        "DUNGEON_WINDOW_PARAMS_3",
+        "DUNGEON_WINDOW_PARAMS_4",
+        "DUNGEON_MAIN_MENU_ITEMS",
+        "DUNGEON_MENU_SWITCH_STR1",
+        "OVERLAY31_UNKNOWN_STRING_IDS",
+        "OVERLAY31_UNKNOWN_STRUCT__NA_2389E30",
+        "DUNGEON_WINDOW_PARAMS_5",
+        "DUNGEON_WINDOW_PARAMS_6",
+        "DUNGEON_WINDOW_PARAMS_7",
+        "DUNGEON_SUBMENU_ITEMS_1",
+        "DUNGEON_SUBMENU_ITEMS_2",
+        "DUNGEON_SUBMENU_ITEMS_3",
+        "DUNGEON_SUBMENU_ITEMS_4",
+        "OVERLAY31_UNKNOWN_STRUCT__NA_2389EF0",
+        "DUNGEON_WINDOW_PARAMS_8",
+        "DUNGEON_WINDOW_PARAMS_9",
+        "DUNGEON_WINDOW_PARAMS_10",
+        "DUNGEON_WINDOW_PARAMS_11",
+        "DUNGEON_WINDOW_PARAMS_12",
+        "DUNGEON_WINDOW_PARAMS_13",
+        "OVERLAY31_JP_STRING",
+        "DUNGEON_WINDOW_PARAMS_14",
+        "DUNGEON_WINDOW_PARAMS_15",
+        "DUNGEON_WINDOW_PARAMS_16",
+        "DUNGEON_WINDOW_PARAMS_17",
+        "DUNGEON_WINDOW_PARAMS_18",
+        "DUNGEON_WINDOW_PARAMS_19",
+        "OVERLAY31_UNKNOWN_STRUCT__NA_2389FE8",
+        "DUNGEON_WINDOW_PARAMS_20",
+        "DUNGEON_WINDOW_PARAMS_21",
+        "DUNGEON_WINDOW_PARAMS_22",
+        "DUNGEON_WINDOW_PARAMS_23",
+        "DUNGEON_WINDOW_PARAMS_24",
+        "DUNGEON_WINDOW_PARAMS_25",
+        "DUNGEON_SUBMENU_ITEMS_5",
+        "DUNGEON_WINDOW_PARAMS_26",
+        "OVERLAY31_UNKNOWN_STRUCT__NA_238A144",
+        "DUNGEON_WINDOW_PARAMS_27",
+        "DUNGEON_WINDOW_PARAMS_28",
+        "OVERLAY31_UNKNOWN_STRUCT__NA_238A190",
+        "DUNGEON_SUBMENU_ITEMS_6",
+        "DUNGEON_WINDOW_PARAMS_29",
+        "DUNGEON_WINDOW_PARAMS_30",
+        "DUNGEON_WINDOW_PARAMS_31",
+        "DUNGEON_WINDOW_PARAMS_32",
+        "OVERLAY31_RESERVED_SPACE",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A260",
+        "OVERLAY31_UNKNOWN_VALUE__NA_238A264",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A268",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A26C",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A270",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A274",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A278",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A27C",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A280",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A284",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A288",
+        "OVERLAY31_UNKNOWN_POINTER__NA_238A28C",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            266,
+            266,
+            266,
+            266,
+            1,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1,
+            1,
+            1,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            2758,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            1,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+            266,
+        ),
+    ),
+    c_types=(
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[8]",
+        "char[12]",
+        "",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "struct simple_menu_id_item[4]",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct simple_menu_id_item[3]",
+        "struct window_params",
+        "",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "struct simple_menu_id_item[9]",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "struct window_params",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+    ),
+    multi={},
+)
@@ -0,0 +1,491 @@
+from array import array
+
+from ...protocol import SymbolTable
+
+# Symbol tables of the ram section. Only imported once a symbol of the section is accessed.
+# The values are stored as packed columns, ordered like the names.
+
+
+DATA = SymbolTable(
+    names=(
+        "DEFAULT_MEMORY_ARENA_MEMORY",
+        "GROUND_MEMORY_ARENA_2",
+        "GROUND_MEMORY_ARENA_2_BLOCKS",
+        "GROUND_MEMORY_ARENA_2_MEMORY",
+        "DUNGEON_COLORMAP_PTR",
+        "DUNGEON_STRUCT",
+        "MOVE_DATA_TABLE",
+        "SOUND_MEMORY_ARENA",
+        "SOUND_MEMORY_ARENA_BLOCKS",
+        "SOUND_MEMORY_ARENA_MEMORY",
+        "FRAMES_SINCE_LAUNCH",
+        "TOUCHSCREEN_STATUS",
+        "BAG_ITEMS",
+        "BAG_ITEMS_PTR",
+        "STORAGE_ITEMS",
+        "STORAGE_ITEM_QUANTITIES",
+        "KECLEON_SHOP_ITEMS_PTR",
+        "KECLEON_SHOP_ITEMS",
+        "UNUSED_KECLEON_SHOP_ITEMS",
+        "KECLEON_WARES_ITEMS_PTR",
+        "KECLEON_WARES_ITEMS",
+        "UNUSED_KECLEON_WARES_ITEMS",
+        "MONEY_CARRIED",
+        "MONEY_STORED",
+        "AUDIO_COMMANDS_BUFFER",
+        "SOUND_MEMORY_ARENA_PTR",
+        "WINDOW_LIST",
+        "CURSOR_16_SPRITE_ID",
+        "CURSOR_SPRITE_ID",
+        "CURSOR_ANIMATION_CONTROL",
+        "CURSOR_16_ANIMATION_CONTROL",
+        "ALERT_SPRITE_ID",
+        "ALERT_ANIMATION_CONTROL",
+        "LAST_NEW_MOVE",
+        "SCRIPT_VARS_VALUES",
+        "BAG_LEVEL",
+        "DEBUG_SPECIAL_EPISODE_NUMBER",
+        "KAOMADO_STREAM",
+        "PENDING_DUNGEON_ID",
+        "PENDING_STARTING_FLOOR",
+        "PLAY_TIME_SECONDS",
+        "PLAY_TIME_FRAME_COUNTER",
+        "TEAM_NAME",
+        "LEVEL_UP_DATA_MONSTER_ID",
+        "LEVEL_UP_DATA_DECOMPRESS_BUFFER",
+        "TEAM_MEMBER_TABLE",
+        "DRIVER_WORK",
+        "DISP_MODE",
+        "GXI_VRAM_LOCK_ID",
+        "ENABLED_VRAM_BANKS",
+        "SUB_BG_EXT_PLTT",
+        "CLR_IMG",
+        "THREAD_INFO_STRUCT",
+        "FRAMES_SINCE_LAUNCH_TIMES_THREE",
+        "GROUND_MEMORY_ARENA_1_PTR",
+        "GROUND_MEMORY_ARENA_2_PTR",
+        "LOCK_NOTIFY_ARRAY",
+        "GROUND_MEMORY_ARENA_1",
+        "GROUND_MEMORY_ARENA_1_BLOCKS",
+        "GROUND_MEMORY_ARENA_1_MEMORY",
+        "SENTRY_DUTY_STRUCT",
+        "TURNING_ON_THE_SPOT_FLAG",
+        "LOADED_ATTACK_SPRITE_DATA",
+        "AI_THROWN_ITEM_DIRECTION_IS_USED",
+        "AI_THROWN_ITEM_PROBABILITIES",
+        "AI_THROWN_ITEM_DIRECTIONS",
+        "ROLLOUT_ICE_BALL_MISSED",
+        "MULTIHIT_FATIGUE_MOVE_USED",
+        "TWINEEDLE_HIT_TRACKER",
+        "RAPID_SPIN_BINDING_REMOVAL",
+        "ROLLOUT_ICE_BALL_SUCCESSIVE_HITS",
+        "MULTIHIT_MOVE_SUCCESSIVE_HITS",
+        "TRIPLE_KICK_SUCCESSIVE_HITS",
+        "METRONOME_NEXT_INDEX",
+        "FLOOR_GENERATION_STATUS",
+        "STAIRS_MENU_PTR",
+    ),
+    addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    absolute_addresses=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    lengths=array(
+        "I",
+        (
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+            0xFFFFFFFF,
+        ),
+    ),
+    descriptions=array(
+        "I",
+        (
+            2777,
+            2778,
+            2779,
+            2780,
+            2781,
+            2782,
+            2783,
+            2784,
+            2785,
+            2786,
+            2787,
+            2788,
+            2789,
+            2790,
+            2791,
+            2792,
+            2793,
+            2794,
+            2795,
+            2796,
+            2797,
+            2798,
+            2799,
+            2800,
+            2801,
+            2802,
+            2803,
+            2804,
+            2805,
+            2806,
+            2807,
+            2808,
+            2809,
+            2810,
+            2811,
+            2812,
+            2813,
+            2814,
+            2815,
+            2816,
+            2817,
+            2818,
+            2819,
+            2820,
+            2821,
+            2822,
+            1,
+            1,
+            1,
+            2823,
+            1,
+            1,
+            2824,
+            2825,
+            2826,
+            2827,
+            2828,
+            2829,
+            2830,
+            2831,
+            1,
+            2832,
+            2833,
+            2834,
+            2835,
+            2836,
+            2837,
+            2838,
+            2839,
+            2840,
+            2841,
+            2842,
+            2843,
+            2844,
+            2845,
+            2846,
+        ),
+    ),
+    c_types=(
+        "uint8_t[1991680]",
+        "struct mem_arena",
+        "struct mem_block[32]",
+        "uint8_t[720100]",
+        "struct rgba*",
+        "struct dungeon",
+        "struct move_data_table",
+        "struct mem_arena",
+        "struct mem_block[20]",
+        "uint8_t[245252]",
+        "uint32_t",
+        "struct touchscreen_status",
+        "struct item[50]",
+        "struct item*",
+        "struct item_id_16[1000]",
+        "uint16_t[1000]",
+        "struct bulk_item*",
+        "struct bulk_item[8]",
+        "struct bulk_item[8]",
+        "struct bulk_item*",
+        "struct bulk_item[4]",
+        "struct bulk_item[4]",
+        "int32_t",
+        "int32_t",
+        "struct audio_command[16]",
+        "struct mem_arena*",
+        "struct window_list",
+        "uint16_t",
+        "uint16_t",
+        "struct animation_control*",
+        "struct animation_control*",
+        "uint16_t",
+        "struct animation_control*",
+        "struct move",
+        "struct script_var_value_table",
+        "uint8_t",
+        "struct special_episode_type_8",
+        "struct file_stream",
+        "struct dungeon_id_8",
+        "uint8_t",
+        "uint32_t",
+        "uint8_t",
+        "",
+        "struct monster_id_16",
+        "struct level_up_entry[100]",
+        "struct team_member_table",
+        "",
+        "uint16_t",
+        "uint16_t",
+        "struct vram_banks_set",
+        "undefined4",
+        "undefined4",
+        "struct thread_info",
+        "uint32_t",
+        "struct mem_arena*",
+        "struct mem_arena*",
+        "bool[20]",
+        "struct mem_arena",
+        "struct mem_block[52]",
+        "uint8_t[408324]",
+        "struct sentry_duty",
+        "bool",
+        "struct loaded_attack_sprite_data*",
+        "bool[8]",
+        "uint32_t[8]",
+        "uint32_t[8]",
+        "bool",
+        "bool",
+        "bool",
+        "bool",
+        "int",
+        "int",
+        "int",
+        "int",
+        "struct floor_generation_status",
+        "struct stairs_menu*",
+    ),
+    multi={},
+)
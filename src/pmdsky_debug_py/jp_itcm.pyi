@@ -0,0 +1,8767 @@
+# Type declarations of pmdsky_debug_py.jp_itcm.
+# The symbols are only created on first access at runtime, so they are declared here for type checkers.
+from collections.abc import Iterator
+from typing import ClassVar
+
+from .protocol import Symbol, Section, LazySymbols
+
+class JpItcmArm7Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    _start_arm7: ClassVar[Symbol[None, None]]
+
+    do_autoload_arm7: ClassVar[Symbol[None, None]]
+
+    StartAutoloadDoneCallbackArm7: ClassVar[Symbol[None, None]]
+
+    NitroSpMain: ClassVar[Symbol[None, None]]
+
+    HardwareInterrupt: ClassVar[Symbol[None, None]]
+
+    ReturnFromInterrupt: ClassVar[Symbol[None, None]]
+
+    AudioInterrupt: ClassVar[Symbol[None, None]]
+
+    ClearImeFlag: ClassVar[Symbol[None, None]]
+
+    ClearIeFlag: ClassVar[Symbol[None, None]]
+
+    GetCurrentPlaybackTime: ClassVar[Symbol[None, None]]
+
+    ClearIrqFlag: ClassVar[Symbol[None, None]]
+
+    EnableIrqFlag: ClassVar[Symbol[None, None]]
+
+    SetIrqFlag: ClassVar[Symbol[None, None]]
+
+    EnableIrqFiqFlags: ClassVar[Symbol[None, None]]
+
+    SetIrqFiqFlags: ClassVar[Symbol[None, None]]
+
+    GetProcessorMode: ClassVar[Symbol[None, None]]
+
+    _s32_div_f: ClassVar[Symbol[None, None]]
+
+    _u32_div_f: ClassVar[Symbol[None, None]]
+
+    _u32_div_not_0_f: ClassVar[Symbol[None, None]]
+
+    __divsi3: ClassVar[Symbol[None, None]]
+
+    __udivsi3: ClassVar[Symbol[None, None]]
+
+    __udivsi3_no_zero_check: ClassVar[Symbol[None, None]]
+
+class JpItcmArm7Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmArm7Section(
+    Section,
+    name="arm7",
+    description="The ARM7 binary.\n\nThis is the secondary binary that gets loaded when the game is launched.\n\nSpeaking generally, this is the program run by the Nintendo DS's secondary ARM7TDMI CPU, which handles the audio I/O, the touch screen, Wi-Fi functions, cryptography, and more.\n\nMemory map: (binary is initially loaded at 0x2380000)\n0x2380000-0x23801E8 => Contains _start_arm7 and two more methods, all related to memory mapping.\n0x23801E8-0x238F7F0 => Mapped to 0x37F8000, contains NitroSpMain and functions crucial to execution.\n0x238F7F0-0x23A7068 => Mapped to 0x27E0000, contains everything else that won't fit in the fast WRAM.\n\nNote that while the length for the main EU/NA/JP block is defined as 0x27080 above, after memory mappings, the block located at that address is only a 0x1E8 long ENTRY block, containing 3 functions solely used for the initial memory mapping. The memory following this block is reused and its purpose is undocumented at the moment.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmArm7Functions,
+    data=JpItcmArm7Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmArm7Functions]]
+    data: ClassVar[type[JpItcmArm7Data]]
+
+class JpItcmArm9Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    Svc_SoftReset: ClassVar[Symbol[None, None]]
+
+    Svc_WaitByLoop: ClassVar[Symbol[None, None]]
+
+    Svc_CpuSet: ClassVar[Symbol[None, None]]
+
+    _start: ClassVar[Symbol[None, None]]
+
+    InitI_CpuClear32: ClassVar[Symbol[None, None]]
+
+    MIi_UncompressBackward: ClassVar[Symbol[None, None]]
+
+    do_autoload: ClassVar[Symbol[None, None]]
+
+    StartAutoloadDoneCallback: ClassVar[Symbol[None, None]]
+
+    init_cp15: ClassVar[Symbol[None, None]]
+
+    OSi_ReferSymbol: ClassVar[Symbol[None, None]]
+
+    NitroMain: ClassVar[Symbol[None, None]]
+
+    InitMemAllocTable: ClassVar[Symbol[None, None]]
+
+    SetMemAllocatorParams: ClassVar[Symbol[None, None]]
+
+    GetAllocArenaDefault: ClassVar[Symbol[None, None]]
+
+    GetFreeArenaDefault: ClassVar[Symbol[None, None]]
+
+    InitMemArena: ClassVar[Symbol[None, None]]
+
+    MemAllocFlagsToBlockType: ClassVar[Symbol[None, None]]
+
+    FindAvailableMemBlock: ClassVar[Symbol[None, None]]
+
+    SplitMemBlock: ClassVar[Symbol[None, None]]
+
+    MemAlloc: ClassVar[Symbol[None, None]]
+
+    MemFree: ClassVar[Symbol[None, None]]
+
+    MemArenaAlloc: ClassVar[Symbol[None, None]]
+
+    CreateMemArena: ClassVar[Symbol[None, None]]
+
+    MemLocateSet: ClassVar[Symbol[None, None]]
+
+    MemLocateUnset: ClassVar[Symbol[None, None]]
+
+    RoundUpDiv256: ClassVar[Symbol[None, None]]
+
+    UFixedPoint64CmpLt: ClassVar[Symbol[None, None]]
+
+    MultiplyByFixedPoint: ClassVar[Symbol[None, None]]
+
+    UMultiplyByFixedPoint: ClassVar[Symbol[None, None]]
+
+    IntToFixedPoint64: ClassVar[Symbol[None, None]]
+
+    FixedPoint64ToInt: ClassVar[Symbol[None, None]]
+
+    FixedPoint32To64: ClassVar[Symbol[None, None]]
+
+    NegateFixedPoint64: ClassVar[Symbol[None, None]]
+
+    FixedPoint64IsZero: ClassVar[Symbol[None, None]]
+
+    FixedPoint64IsNegative: ClassVar[Symbol[None, None]]
+
+    FixedPoint64CmpLt: ClassVar[Symbol[None, None]]
+
+    MultiplyFixedPoint64: ClassVar[Symbol[None, None]]
+
+    DivideFixedPoint64: ClassVar[Symbol[None, None]]
+
+    UMultiplyFixedPoint64: ClassVar[Symbol[None, None]]
+
+    UDivideFixedPoint64: ClassVar[Symbol[None, None]]
+
+    AddFixedPoint64: ClassVar[Symbol[None, None]]
+
+    ClampedLn: ClassVar[Symbol[None, None]]
+
+    GetRngSeed: ClassVar[Symbol[None, None]]
+
+    SetRngSeed: ClassVar[Symbol[None, None]]
+
+    Rand16Bit: ClassVar[Symbol[None, None]]
+
+    RandInt: ClassVar[Symbol[None, None]]
+
+    RandRange: ClassVar[Symbol[None, None]]
+
+    Rand32Bit: ClassVar[Symbol[None, None]]
+
+    RandIntSafe: ClassVar[Symbol[None, None]]
+
+    RandRangeSafe: ClassVar[Symbol[None, None]]
+
+    WaitForever: ClassVar[Symbol[None, None]]
+
+    InterruptMasterDisable: ClassVar[Symbol[None, None]]
+
+    InterruptMasterEnable: ClassVar[Symbol[None, None]]
+
+    InitMemAllocTableVeneer: ClassVar[Symbol[None, None]]
+
+    ZInit8: ClassVar[Symbol[None, None]]
+
+    PointsToZero: ClassVar[Symbol[None, None]]
+
+    MemZero: ClassVar[Symbol[None, None]]
+
+    MemZero16: ClassVar[Symbol[None, None]]
+
+    MemZero32: ClassVar[Symbol[None, None]]
+
+    MemsetSimple: ClassVar[Symbol[None, None]]
+
+    Memset32: ClassVar[Symbol[None, None]]
+
+    MemcpySimple: ClassVar[Symbol[None, None]]
+
+    Memcpy16: ClassVar[Symbol[None, None]]
+
+    Memcpy32: ClassVar[Symbol[None, None]]
+
+    TaskProcBoot: ClassVar[Symbol[None, None]]
+
+    EnableAllInterrupts: ClassVar[Symbol[None, None]]
+
+    GetTime: ClassVar[Symbol[None, None]]
+
+    DisableAllInterrupts: ClassVar[Symbol[None, None]]
+
+    SoundResume: ClassVar[Symbol[None, None]]
+
+    CardPullOutWithStatus: ClassVar[Symbol[None, None]]
+
+    CardPullOut: ClassVar[Symbol[None, None]]
+
+    CardBackupError: ClassVar[Symbol[None, None]]
+
+    HaltProcessDisp: ClassVar[Symbol[None, None]]
+
+    OverlayIsLoaded: ClassVar[Symbol[None, None]]
+
+    LoadOverlay: ClassVar[Symbol[None, None]]
+
+    UnloadOverlay: ClassVar[Symbol[None, None]]
+
+    GetDsFirmwareUserSettingsVeneer: ClassVar[Symbol[None, None]]
+
+    Rgb8ToRgb5: ClassVar[Symbol[None, None]]
+
+    EuclideanNorm: ClassVar[Symbol[None, None]]
+
+    ClampComponentAbs: ClassVar[Symbol[None, None]]
+
+    GetHeldButtons: ClassVar[Symbol[None, None]]
+
+    GetPressedButtons: ClassVar[Symbol[None, None]]
+
+    GetReleasedStylus: ClassVar[Symbol[None, None]]
+
+    KeyWaitInit: ClassVar[Symbol[None, None]]
+
+    DebugPrintSystemClock: ClassVar[Symbol[None, None]]
+
+    GetSystemClock: ClassVar[Symbol[None, None]]
+
+    SprintfSystemClock: ClassVar[Symbol[None, None]]
+
+    DataTransferInit: ClassVar[Symbol[None, None]]
+
+    DataTransferStop: ClassVar[Symbol[None, None]]
+
+    FileInitVeneer: ClassVar[Symbol[None, None]]
+
+    FileOpen: ClassVar[Symbol[None, None]]
+
+    FileGetSize: ClassVar[Symbol[None, None]]
+
+    FileRead: ClassVar[Symbol[None, None]]
+
+    FileSeek: ClassVar[Symbol[None, None]]
+
+    FileClose: ClassVar[Symbol[None, None]]
+
+    UnloadFile: ClassVar[Symbol[None, None]]
+
+    LoadFileFromRom: ClassVar[Symbol[None, None]]
+
+    TransformPaletteDataWithFlushDivideFade: ClassVar[Symbol[None, None]]
+
+    UpdateFadeStatus: ClassVar[Symbol[None, None]]
+
+    HandleFades: ClassVar[Symbol[None, None]]
+
+    GetFadeStatus: ClassVar[Symbol[None, None]]
+
+    InitDebug: ClassVar[Symbol[None, None]]
+
+    InitDebugFlag: ClassVar[Symbol[None, None]]
+
+    GetDebugFlag: ClassVar[Symbol[None, None]]
+
+    SetDebugFlag: ClassVar[Symbol[None, None]]
+
+    InitDebugStripped6: ClassVar[Symbol[None, None]]
+
+    AppendProgPos: ClassVar[Symbol[None, None]]
+
+    InitDebugStripped5: ClassVar[Symbol[None, None]]
+
+    DebugPrintTrace: ClassVar[Symbol[None, None]]
+
+    DebugDisplay: ClassVar[Symbol[None, None]]
+
+    DebugPrint0: ClassVar[Symbol[None, None]]
+
+    InitDebugLogFlag: ClassVar[Symbol[None, None]]
+
+    GetDebugLogFlag: ClassVar[Symbol[None, None]]
+
+    SetDebugLogFlag: ClassVar[Symbol[None, None]]
+
+    DebugPrint: ClassVar[Symbol[None, None]]
+
+    InitDebugStripped4: ClassVar[Symbol[None, None]]
+
+    InitDebugStripped3: ClassVar[Symbol[None, None]]
+
+    InitDebugStripped2: ClassVar[Symbol[None, None]]
+
+    InitDebugStripped1: ClassVar[Symbol[None, None]]
+
+    FatalError: ClassVar[Symbol[None, None]]
+
+    OpenAllPackFiles: ClassVar[Symbol[None, None]]
+
+    GetFileLengthInPackWithPackNb: ClassVar[Symbol[None, None]]
+
+    LoadFileInPackWithPackId: ClassVar[Symbol[None, None]]
+
+    AllocAndLoadFileInPack: ClassVar[Symbol[None, None]]
+
+    OpenPackFile: ClassVar[Symbol[None, None]]
+
+    GetFileLengthInPack: ClassVar[Symbol[None, None]]
+
+    LoadFileInPack: ClassVar[Symbol[None, None]]
+
+    GetDungeonResultMsg: ClassVar[Symbol[None, None]]
+
+    GetDamageSource: ClassVar[Symbol[None, None]]
+
+    GetItemCategoryVeneer: ClassVar[Symbol[None, None]]
+
+    GetItemMoveId16: ClassVar[Symbol[None, None]]
+
+    IsThrownItem: ClassVar[Symbol[None, None]]
+
+    IsNotMoney: ClassVar[Symbol[None, None]]
+
+    IsEdible: ClassVar[Symbol[None, None]]
+
+    IsHM: ClassVar[Symbol[None, None]]
+
+    IsGummi: ClassVar[Symbol[None, None]]
+
+    IsAuraBow: ClassVar[Symbol[None, None]]
+
+    IsLosableItem: ClassVar[Symbol[None, None]]
+
+    IsTreasureBox: ClassVar[Symbol[None, None]]
+
+    IsStorableItem: ClassVar[Symbol[None, None]]
+
+    IsShoppableItem: ClassVar[Symbol[None, None]]
+
+    IsValidTargetItem: ClassVar[Symbol[None, None]]
+
+    IsItemUsableNow: ClassVar[Symbol[None, None]]
+
+    IsTicketItem: ClassVar[Symbol[None, None]]
+
+    InitItem: ClassVar[Symbol[None, None]]
+
+    InitStandardItem: ClassVar[Symbol[None, None]]
+
+    InitBulkItem: ClassVar[Symbol[None, None]]
+
+    BulkItemToItem: ClassVar[Symbol[None, None]]
+
+    ItemToBulkItem: ClassVar[Symbol[None, None]]
+
+    GetDisplayedBuyPrice: ClassVar[Symbol[None, None]]
+
+    GetDisplayedSellPrice: ClassVar[Symbol[None, None]]
+
+    GetActualBuyPrice: ClassVar[Symbol[None, None]]
+
+    GetActualSellPrice: ClassVar[Symbol[None, None]]
+
+    FindItemInInventory: ClassVar[Symbol[None, None]]
+
+    SprintfStatic: ClassVar[Symbol[None, None]]
+
+    ItemZInit: ClassVar[Symbol[None, None]]
+
+    AreItemsEquivalent: ClassVar[Symbol[None, None]]
+
+    WriteItemsToSave: ClassVar[Symbol[None, None]]
+
+    ReadItemsFromSave: ClassVar[Symbol[None, None]]
+
+    IsItemAvailableInDungeonGroup: ClassVar[Symbol[None, None]]
+
+    GetItemIdFromList: ClassVar[Symbol[None, None]]
+
+    NormalizeTreasureBox: ClassVar[Symbol[None, None]]
+
+    SortItemList: ClassVar[Symbol[None, None]]
+
+    RemoveEmptyItems: ClassVar[Symbol[None, None]]
+
+    LoadItemPspi2n: ClassVar[Symbol[None, None]]
+
+    GetExclusiveItemType: ClassVar[Symbol[None, None]]
+
+    GetExclusiveItemOffsetEnsureValid: ClassVar[Symbol[None, None]]
+
+    IsItemValid: ClassVar[Symbol[None, None]]
+
+    GetExclusiveItemParameter: ClassVar[Symbol[None, None]]
+
+    GetItemCategory: ClassVar[Symbol[None, None]]
+
+    EnsureValidItem: ClassVar[Symbol[None, None]]
+
+    GetItemName: ClassVar[Symbol[None, None]]
+
+    GetItemNameFormatted: ClassVar[Symbol[None, None]]
+
+    GetItemBuyPrice: ClassVar[Symbol[None, None]]
+
+    GetItemSellPrice: ClassVar[Symbol[None, None]]
+
+    GetItemSpriteId: ClassVar[Symbol[None, None]]
+
+    GetItemPaletteId: ClassVar[Symbol[None, None]]
+
+    GetItemActionName: ClassVar[Symbol[None, None]]
+
+    GetThrownItemQuantityLimit: ClassVar[Symbol[None, None]]
+
+    GetItemMoveId: ClassVar[Symbol[None, None]]
+
+    TestItemAiFlag: ClassVar[Symbol[None, None]]
+
+    IsItemInTimeDarkness: ClassVar[Symbol[None, None]]
+
+    IsItemValidVeneer: ClassVar[Symbol[None, None]]
+
+    SetActiveInventoryToMain: ClassVar[Symbol[None, None]]
+
+    AllInventoriesZInit: ClassVar[Symbol[None, None]]
+
+    SpecialEpisodeInventoryZInit: ClassVar[Symbol[None, None]]
+
+    RescueInventoryZInit: ClassVar[Symbol[None, None]]
+
+    SetActiveInventory: ClassVar[Symbol[None, None]]
+
+    GetMoneyCarried: ClassVar[Symbol[None, None]]
+
+    SetMoneyCarried: ClassVar[Symbol[None, None]]
+
+    AddMoneyCarried: ClassVar[Symbol[None, None]]
+
+    GetCurrentBagCapacity: ClassVar[Symbol[None, None]]
+
+    IsBagFull: ClassVar[Symbol[None, None]]
+
+    GetNbItemsInBag: ClassVar[Symbol[None, None]]
+
+    CountNbItemsOfTypeInBag: ClassVar[Symbol[None, None]]
+
+    CountItemTypeInBag: ClassVar[Symbol[None, None]]
+
+    IsItemInBag: ClassVar[Symbol[None, None]]
+
+    IsItemWithFlagsInBag: ClassVar[Symbol[None, None]]
+
+    IsItemInTreasureBoxes: ClassVar[Symbol[None, None]]
+
+    IsHeldItemInBag: ClassVar[Symbol[None, None]]
+
+    IsItemForSpecialSpawnInBag: ClassVar[Symbol[None, None]]
+
+    HasStorableItems: ClassVar[Symbol[None, None]]
+
+    GetItemIndex: ClassVar[Symbol[None, None]]
+
+    GetEquivItemIndex: ClassVar[Symbol[None, None]]
+
+    GetEquippedThrowableItem: ClassVar[Symbol[None, None]]
+
+    GetFirstUnequippedItemOfType: ClassVar[Symbol[None, None]]
+
+    CopyItemAtIdx: ClassVar[Symbol[None, None]]
+
+    GetItemAtIdx: ClassVar[Symbol[None, None]]
+
+    RemoveEmptyItemsInBag: ClassVar[Symbol[None, None]]
+
+    RemoveItemNoHole: ClassVar[Symbol[None, None]]
+
+    RemoveItem: ClassVar[Symbol[None, None]]
+
+    RemoveHeldItemNoHole: ClassVar[Symbol[None, None]]
+
+    RemoveItemByIdAndStackNoHole: ClassVar[Symbol[None, None]]
+
+    RemoveEquivItem: ClassVar[Symbol[None, None]]
+
+    RemoveEquivItemNoHole: ClassVar[Symbol[None, None]]
+
+    DecrementStackItem: ClassVar[Symbol[None, None]]
+
+    RemoveItemNoHoleCheck: ClassVar[Symbol[None, None]]
+
+    RemoveFirstUnequippedItemOfType: ClassVar[Symbol[None, None]]
+
+    RemoveAllItems: ClassVar[Symbol[None, None]]
+
+    RemoveAllItemsStartingAt: ClassVar[Symbol[None, None]]
+
+    SpecialProcAddItemToBag: ClassVar[Symbol[None, None]]
+
+    AddItemToBagNoHeld: ClassVar[Symbol[None, None]]
+
+    AddItemToBag: ClassVar[Symbol[None, None]]
+
+    CleanStickyItemsInBag: ClassVar[Symbol[None, None]]
+
+    CountStickyItemsInBag: ClassVar[Symbol[None, None]]
+
+    TransmuteHeldItemInBag: ClassVar[Symbol[None, None]]
+
+    SetFlagsForHeldItemInBag: ClassVar[Symbol[None, None]]
+
+    RemoveHolderForItemInBag: ClassVar[Symbol[None, None]]
+
+    SetHolderForItemInBag: ClassVar[Symbol[None, None]]
+
+    SortItemsInBag: ClassVar[Symbol[None, None]]
+
+    RemovePokeItemsInBag: ClassVar[Symbol[None, None]]
+
+    IsStorageFull: ClassVar[Symbol[None, None]]
+
+    CountNbOfItemsInStorage: ClassVar[Symbol[None, None]]
+
+    CountNbOfValidItemsInStorage: ClassVar[Symbol[None, None]]
+
+    CountNbOfValidItemsInTimeDarknessInStorage: ClassVar[Symbol[None, None]]
+
+    CountNbItemsOfTypeInStorage: ClassVar[Symbol[None, None]]
+
+    CountItemTypeInStorage: ClassVar[Symbol[None, None]]
+
+    GetEquivBulkItemIdxInStorage: ClassVar[Symbol[None, None]]
+
+    ConvertStorageItemAtIdxToBulkItem: ClassVar[Symbol[None, None]]
+
+    ConvertStorageItemAtIdxToItem: ClassVar[Symbol[None, None]]
+
+    RemoveItemAtIdxInStorage: ClassVar[Symbol[None, None]]
+
+    RemoveBulkItemInStorage: ClassVar[Symbol[None, None]]
+
+    RemoveItemInStorage: ClassVar[Symbol[None, None]]
+
+    StorageZInit: ClassVar[Symbol[None, None]]
+
+    AddBulkItemToStorage: ClassVar[Symbol[None, None]]
+
+    AddItemToStorage: ClassVar[Symbol[None, None]]
+
+    SortItemsInStorage: ClassVar[Symbol[None, None]]
+
+    AllKecleonShopsZInit: ClassVar[Symbol[None, None]]
+
+    SpecialEpisodeKecleonShopZInit: ClassVar[Symbol[None, None]]
+
+    SetActiveKecleonShop: ClassVar[Symbol[None, None]]
+
+    GetMoneyStored: ClassVar[Symbol[None, None]]
+
+    SetMoneyStored: ClassVar[Symbol[None, None]]
+
+    AddMoneyStored: ClassVar[Symbol[None, None]]
+
+    SortKecleonItems1: ClassVar[Symbol[None, None]]
+
+    GenerateKecleonItems1: ClassVar[Symbol[None, None]]
+
+    SortKecleonItems2: ClassVar[Symbol[None, None]]
+
+    GenerateKecleonItems2: ClassVar[Symbol[None, None]]
+
+    GetExclusiveItemOffset: ClassVar[Symbol[None, None]]
+
+    ApplyExclusiveItemStatBoosts: ClassVar[Symbol[None, None]]
+
+    SetExclusiveItemEffect: ClassVar[Symbol[None, None]]
+
+    ExclusiveItemEffectFlagTest: ClassVar[Symbol[None, None]]
+
+    IsExclusiveItemIdForMonster: ClassVar[Symbol[None, None]]
+
+    IsExclusiveItemForMonster: ClassVar[Symbol[None, None]]
+
+    BagHasExclusiveItemTypeForMonster: ClassVar[Symbol[None, None]]
+
+    GetExclusiveItemForMonsterFromBag: ClassVar[Symbol[None, None]]
+
+    GetHpBoostFromExclusiveItems: ClassVar[Symbol[None, None]]
+
+    ApplyGummiBoostsToGroundMonster: ClassVar[Symbol[None, None]]
+
+    ApplyGummiBoostsToTeamMember: ClassVar[Symbol[None, None]]
+
+    ApplySitrusBerryBoostToGroundMonster: ClassVar[Symbol[None, None]]
+
+    ApplyLifeSeedBoostToGroundMonster: ClassVar[Symbol[None, None]]
+
+    ApplyGinsengToGroundMonster: ClassVar[Symbol[None, None]]
+
+    ApplyProteinBoostToGroundMonster: ClassVar[Symbol[None, None]]
+
+    ApplyCalciumBoostToGroundMonster: ClassVar[Symbol[None, None]]
+
+    ApplyIronBoostToGroundMonster: ClassVar[Symbol[None, None]]
+
+    ApplyZincBoostToGroundMonster: ClassVar[Symbol[None, None]]
+
+    ApplyNectarBoostToGroundMonster: ClassVar[Symbol[None, None]]
+
+    IsMonsterAffectedByGravelyrockGroundMode: ClassVar[Symbol[None, None]]
+
+    ApplyGravelyrockBoostToGroundMonster: ClassVar[Symbol[None, None]]
+
+    ApplyGummiBoostsGroundMode: ClassVar[Symbol[None, None]]
+
+    LoadSynthBin: ClassVar[Symbol[None, None]]
+
+    CloseSynthBin: ClassVar[Symbol[None, None]]
+
+    GetSynthItem: ClassVar[Symbol[None, None]]
+
+    LoadWazaP: ClassVar[Symbol[None, None]]
+
+    LoadWazaP2: ClassVar[Symbol[None, None]]
+
+    UnloadCurrentWazaP: ClassVar[Symbol[None, None]]
+
+    GetMoveName: ClassVar[Symbol[None, None]]
+
+    FormatMoveString: ClassVar[Symbol[None, None]]
+
+    FormatMoveStringMore: ClassVar[Symbol[None, None]]
+
+    InitMove: ClassVar[Symbol[None, None]]
+
+    InitMoveCheckId: ClassVar[Symbol[None, None]]
+
+    GetInfoMoveGround: ClassVar[Symbol[None, None]]
+
+    GetMoveTargetAndRange: ClassVar[Symbol[None, None]]
+
+    GetMoveType: ClassVar[Symbol[None, None]]
+
+    GetMovesetLevelUpPtr: ClassVar[Symbol[None, None]]
+
+    IsInvalidMoveset: ClassVar[Symbol[None, None]]
+
+    GetMovesetHmTmPtr: ClassVar[Symbol[None, None]]
+
+    GetMovesetEggPtr: ClassVar[Symbol[None, None]]
+
+    GetMoveAiWeight: ClassVar[Symbol[None, None]]
+
+    GetMoveNbStrikes: ClassVar[Symbol[None, None]]
+
+    GetMoveBasePower: ClassVar[Symbol[None, None]]
+
+    GetMoveBasePowerGround: ClassVar[Symbol[None, None]]
+
+    GetMoveAccuracyOrAiChance: ClassVar[Symbol[None, None]]
+
+    GetMoveBasePp: ClassVar[Symbol[None, None]]
+
+    GetMaxPp: ClassVar[Symbol[None, None]]
+
+    GetMoveMaxGinsengBoost: ClassVar[Symbol[None, None]]
+
+    GetMoveMaxGinsengBoostGround: ClassVar[Symbol[None, None]]
+
+    GetMoveCritChance: ClassVar[Symbol[None, None]]
+
+    IsThawingMove: ClassVar[Symbol[None, None]]
+
+    IsAffectedByTaunt: ClassVar[Symbol[None, None]]
+
+    GetMoveRangeId: ClassVar[Symbol[None, None]]
+
+    GetMoveActualAccuracy: ClassVar[Symbol[None, None]]
+
+    GetMoveBasePowerFromId: ClassVar[Symbol[None, None]]
+
+    IsMoveRangeString19: ClassVar[Symbol[None, None]]
+
+    GetMoveMessageFromId: ClassVar[Symbol[None, None]]
+
+    GetNbMoves: ClassVar[Symbol[None, None]]
+
+    GetMovesetIdx: ClassVar[Symbol[None, None]]
+
+    IsReflectedByMagicCoat: ClassVar[Symbol[None, None]]
+
+    CanBeSnatched: ClassVar[Symbol[None, None]]
+
+    FailsWhileMuzzled: ClassVar[Symbol[None, None]]
+
+    IsSoundMove: ClassVar[Symbol[None, None]]
+
+    IsRecoilMove: ClassVar[Symbol[None, None]]
+
+    AllManip1: ClassVar[Symbol[None, None]]
+
+    AllManip2: ClassVar[Symbol[None, None]]
+
+    ManipMoves1v1: ClassVar[Symbol[None, None]]
+
+    ManipMoves1v2: ClassVar[Symbol[None, None]]
+
+    ManipMoves2v1: ClassVar[Symbol[None, None]]
+
+    ManipMoves2v2: ClassVar[Symbol[None, None]]
+
+    DungeonMoveToGroundMove: ClassVar[Symbol[None, None]]
+
+    GroundToDungeonMoveset: ClassVar[Symbol[None, None]]
+
+    DungeonToGroundMoveset: ClassVar[Symbol[None, None]]
+
+    GetInfoGroundMoveset: ClassVar[Symbol[None, None]]
+
+    FindFirstFreeMovesetIdx: ClassVar[Symbol[None, None]]
+
+    LearnMoves: ClassVar[Symbol[None, None]]
+
+    CopyMoveTo: ClassVar[Symbol[None, None]]
+
+    CopyMoveFrom: ClassVar[Symbol[None, None]]
+
+    CopyMovesetTo: ClassVar[Symbol[None, None]]
+
+    CopyMovesetFrom: ClassVar[Symbol[None, None]]
+
+    Is2TurnsMove: ClassVar[Symbol[None, None]]
+
+    IsRegularAttackOrProjectile: ClassVar[Symbol[None, None]]
+
+    IsPunchMove: ClassVar[Symbol[None, None]]
+
+    IsHealingWishOrLunarDance: ClassVar[Symbol[None, None]]
+
+    IsCopyingMove: ClassVar[Symbol[None, None]]
+
+    IsTrappingMove: ClassVar[Symbol[None, None]]
+
+    IsOneHitKoMove: ClassVar[Symbol[None, None]]
+
+    IsNot2TurnsMoveOrSketch: ClassVar[Symbol[None, None]]
+
+    IsRealMove: ClassVar[Symbol[None, None]]
+
+    IsMovesetValid: ClassVar[Symbol[None, None]]
+
+    IsRealMoveInTimeDarkness: ClassVar[Symbol[None, None]]
+
+    IsMovesetValidInTimeDarkness: ClassVar[Symbol[None, None]]
+
+    GetFirstNotRealMoveInTimeDarkness: ClassVar[Symbol[None, None]]
+
+    IsSameMove: ClassVar[Symbol[None, None]]
+
+    GetMoveCategory: ClassVar[Symbol[None, None]]
+
+    GetPpIncrease: ClassVar[Symbol[None, None]]
+
+    OpenWaza: ClassVar[Symbol[None, None]]
+
+    SelectWaza: ClassVar[Symbol[None, None]]
+
+    PlayBgmByIdVeneer: ClassVar[Symbol[None, None]]
+
+    PlayBgmByIdVolumeVeneer: ClassVar[Symbol[None, None]]
+
+    PlaySeVolumeWrapper: ClassVar[Symbol[None, None]]
+
+    PlayBgmById: ClassVar[Symbol[None, None]]
+
+    PlayBgmByIdVolume: ClassVar[Symbol[None, None]]
+
+    StopBgmCommand: ClassVar[Symbol[None, None]]
+
+    PlaySeByIdVolume: ClassVar[Symbol[None, None]]
+
+    SendAudioCommand2: ClassVar[Symbol[None, None]]
+
+    AllocAudioCommand: ClassVar[Symbol[None, None]]
+
+    SendAudioCommand: ClassVar[Symbol[None, None]]
+
+    InitSoundSystem: ClassVar[Symbol[None, None]]
+
+    ManipBgmPlayback: ClassVar[Symbol[None, None]]
+
+    SoundDriverReset: ClassVar[Symbol[None, None]]
+
+    LoadDseFile: ClassVar[Symbol[None, None]]
+
+    PlaySeLoad: ClassVar[Symbol[None, None]]
+
+    IsSongOver: ClassVar[Symbol[None, None]]
+
+    PlayBgm: ClassVar[Symbol[None, None]]
+
+    StopBgm: ClassVar[Symbol[None, None]]
+
+    ChangeBgm: ClassVar[Symbol[None, None]]
+
+    PlayBgm2: ClassVar[Symbol[None, None]]
+
+    StopBgm2: ClassVar[Symbol[None, None]]
+
+    ChangeBgm2: ClassVar[Symbol[None, None]]
+
+    PlayME: ClassVar[Symbol[None, None]]
+
+    StopME: ClassVar[Symbol[None, None]]
+
+    PlaySe: ClassVar[Symbol[None, None]]
+
+    PlaySeFullSpec: ClassVar[Symbol[None, None]]
+
+    SeChangeVolume: ClassVar[Symbol[None, None]]
+
+    SeChangePan: ClassVar[Symbol[None, None]]
+
+    StopSe: ClassVar[Symbol[None, None]]
+
+    CopyAndInterleaveWrapper: ClassVar[Symbol[None, None]]
+
+    InitAnimationControl: ClassVar[Symbol[None, None]]
+
+    InitAnimationControlWithSet: ClassVar[Symbol[None, None]]
+
+    SetSpriteIdForAnimationControl: ClassVar[Symbol[None, None]]
+
+    SetAnimationForAnimationControlInternal: ClassVar[Symbol[None, None]]
+
+    SetAnimationForAnimationControl: ClassVar[Symbol[None, None]]
+
+    GetWanForAnimationControl: ClassVar[Symbol[None, None]]
+
+    SetAndPlayAnimationForAnimationControl: ClassVar[Symbol[None, None]]
+
+    SwitchAnimationControlToNextFrame: ClassVar[Symbol[None, None]]
+
+    LoadAnimationFrameAndIncrementInAnimationControl: ClassVar[Symbol[None, None]]
+
+    AnimationControlGetAllocForMaxFrame: ClassVar[Symbol[None, None]]
+
+    DeleteWanTableEntry: ClassVar[Symbol[None, None]]
+
+    AllocateWanTableEntry: ClassVar[Symbol[None, None]]
+
+    FindWanTableEntry: ClassVar[Symbol[None, None]]
+
+    GetLoadedWanTableEntry: ClassVar[Symbol[None, None]]
+
+    InitWanTable: ClassVar[Symbol[None, None]]
+
+    LoadWanTableEntry: ClassVar[Symbol[None, None]]
+
+    LoadWanTableEntryFromPack: ClassVar[Symbol[None, None]]
+
+    LoadWanTableEntryFromPackUseProvidedMemory: ClassVar[Symbol[None, None]]
+
+    ReplaceWanFromBinFile: ClassVar[Symbol[None, None]]
+
+    DeleteWanTableEntryVeneer: ClassVar[Symbol[None, None]]
+
+    WanHasAnimationGroup: ClassVar[Symbol[None, None]]
+
+    WanTableSpriteHasAnimationGroup: ClassVar[Symbol[None, None]]
+
+    SpriteTypeInWanTable: ClassVar[Symbol[None, None]]
+
+    LoadWteFromRom: ClassVar[Symbol[None, None]]
+
+    LoadWteFromFileDirectory: ClassVar[Symbol[None, None]]
+
+    UnloadWte: ClassVar[Symbol[None, None]]
+
+    LoadWtuFromBin: ClassVar[Symbol[None, None]]
+
+    ProcessWte: ClassVar[Symbol[None, None]]
+
+    GeomSetTexImageParam: ClassVar[Symbol[None, None]]
+
+    GeomSetVertexCoord16: ClassVar[Symbol[None, None]]
+
+    InitRender3dData: ClassVar[Symbol[None, None]]
+
+    GeomSwapBuffers: ClassVar[Symbol[None, None]]
+
+    InitRender3dElement64: ClassVar[Symbol[None, None]]
+
+    Render3d64Texture0x7: ClassVar[Symbol[None, None]]
+
+    Render3d64WindowFrame: ClassVar[Symbol[None, None]]
+
+    EnqueueRender3d64Tiling: ClassVar[Symbol[None, None]]
+
+    Render3d64Tiling: ClassVar[Symbol[None, None]]
+
+    Render3d64Quadrilateral: ClassVar[Symbol[None, None]]
+
+    Render3d64RectangleMulticolor: ClassVar[Symbol[None, None]]
+
+    Render3d64Rectangle: ClassVar[Symbol[None, None]]
+
+    Render3d64Nothing: ClassVar[Symbol[None, None]]
+
+    Render3d64Texture: ClassVar[Symbol[None, None]]
+
+    Render3dElement64: ClassVar[Symbol[None, None]]
+
+    HandleSir0Translation: ClassVar[Symbol[None, None]]
+
+    ConvertPointersSir0: ClassVar[Symbol[None, None]]
+
+    HandleSir0TranslationVeneer: ClassVar[Symbol[None, None]]
+
+    DecompressAtNormalVeneer: ClassVar[Symbol[None, None]]
+
+    DecompressAtNormal: ClassVar[Symbol[None, None]]
+
+    DecompressAtHalf: ClassVar[Symbol[None, None]]
+
+    DecompressAtFromMemoryPointerVeneer: ClassVar[Symbol[None, None]]
+
+    DecompressAtFromMemoryPointer: ClassVar[Symbol[None, None]]
+
+    WriteByteFromMemoryPointer: ClassVar[Symbol[None, None]]
+
+    GetAtSize: ClassVar[Symbol[None, None]]
+
+    GetLanguageType: ClassVar[Symbol[None, None]]
+
+    GetLanguage: ClassVar[Symbol[None, None]]
+
+    StrcmpTag: ClassVar[Symbol[None, None]]
+
+    AtoiTag: ClassVar[Symbol[None, None]]
+
+    AnalyzeText: ClassVar[Symbol[None, None]]
+
+    PreprocessString: ClassVar[Symbol[None, None]]
+
+    PreprocessStringFromId: ClassVar[Symbol[None, None]]
+
+    StrcmpTagVeneer: ClassVar[Symbol[None, None]]
+
+    AtoiTagVeneer: ClassVar[Symbol[None, None]]
+
+    InitPreprocessorArgs: ClassVar[Symbol[None, None]]
+
+    SetStringAccuracy: ClassVar[Symbol[None, None]]
+
+    SetStringPower: ClassVar[Symbol[None, None]]
+
+    GetRankString: ClassVar[Symbol[None, None]]
+
+    GetCurrentTeamNameString: ClassVar[Symbol[None, None]]
+
+    GetBagNameString: ClassVar[Symbol[None, None]]
+
+    GetDungeonResultString: ClassVar[Symbol[None, None]]
+
+    SetQuestionMarks: ClassVar[Symbol[None, None]]
+
+    StrcpySimple: ClassVar[Symbol[None, None]]
+
+    StrncpySimple: ClassVar[Symbol[None, None]]
+
+    StrncpySimpleNoPad: ClassVar[Symbol[None, None]]
+
+    StrncmpSimple: ClassVar[Symbol[None, None]]
+
+    StrncpySimpleNoPadSafe: ClassVar[Symbol[None, None]]
+
+    StrcpyName: ClassVar[Symbol[None, None]]
+
+    StrncpyName: ClassVar[Symbol[None, None]]
+
+    GetStringFromFile: ClassVar[Symbol[None, None]]
+
+    LoadStringFile: ClassVar[Symbol[None, None]]
+
+    AllocateTemp1024ByteBufferFromPool: ClassVar[Symbol[None, None]]
+
+    GetStringFromFileVeneer: ClassVar[Symbol[None, None]]
+
+    StringFromId: ClassVar[Symbol[None, None]]
+
+    CopyStringFromId: ClassVar[Symbol[None, None]]
+
+    CopyNStringFromId: ClassVar[Symbol[None, None]]
+
+    LoadTblTalk: ClassVar[Symbol[None, None]]
+
+    GetTalkLine: ClassVar[Symbol[None, None]]
+
+    IsAOrBPressed: ClassVar[Symbol[None, None]]
+
+    DrawTextInWindow: ClassVar[Symbol[None, None]]
+
+    GetCharWidth: ClassVar[Symbol[None, None]]
+
+    GetColorCodePaletteOffset: ClassVar[Symbol[None, None]]
+
+    DrawChar: ClassVar[Symbol[None, None]]
+
+    GetWindow: ClassVar[Symbol[None, None]]
+
+    NewWindowScreenCheck: ClassVar[Symbol[None, None]]
+
+    NewWindow: ClassVar[Symbol[None, None]]
+
+    SetScreenWindowsColor: ClassVar[Symbol[None, None]]
+
+    SetBothScreensWindowsColor: ClassVar[Symbol[None, None]]
+
+    UpdateWindow: ClassVar[Symbol[None, None]]
+
+    ClearWindow: ClassVar[Symbol[None, None]]
+
+    DeleteWindow: ClassVar[Symbol[None, None]]
+
+    GetWindowRectangle: ClassVar[Symbol[None, None]]
+
+    GetWindowContents: ClassVar[Symbol[None, None]]
+
+    LoadCursors: ClassVar[Symbol[None, None]]
+
+    InitWindowTrailer: ClassVar[Symbol[None, None]]
+
+    Arm9LoadUnkFieldNa0x2029EC8: ClassVar[Symbol[None, None]]
+
+    Arm9StoreUnkFieldNa0x2029ED8: ClassVar[Symbol[None, None]]
+
+    LoadAlert: ClassVar[Symbol[None, None]]
+
+    PrintClearMark: ClassVar[Symbol[None, None]]
+
+    PrintBadgeMark: ClassVar[Symbol[None, None]]
+
+    PrintMark: ClassVar[Symbol[None, None]]
+
+    CreateParentMenuFromStringIds: ClassVar[Symbol[None, None]]
+
+    IsEmptyString: ClassVar[Symbol[None, None]]
+
+    CreateParentMenu: ClassVar[Symbol[None, None]]
+
+    CreateParentMenuWrapper: ClassVar[Symbol[None, None]]
+
+    CreateParentMenuInternal: ClassVar[Symbol[None, None]]
+
+    ResumeParentMenu: ClassVar[Symbol[None, None]]
+
+    SetParentMenuState7: ClassVar[Symbol[None, None]]
+
+    CloseParentMenu: ClassVar[Symbol[None, None]]
+
+    IsParentMenuActive: ClassVar[Symbol[None, None]]
+
+    CheckParentMenuField0x1A0: ClassVar[Symbol[None, None]]
+
+    UpdateParentMenu: ClassVar[Symbol[None, None]]
+
+    CreateSimpleMenuFromStringIds: ClassVar[Symbol[None, None]]
+
+    CreateSimpleMenu: ClassVar[Symbol[None, None]]
+
+    CreateSimpleMenuInternal: ClassVar[Symbol[None, None]]
+
+    ResumeSimpleMenu: ClassVar[Symbol[None, None]]
+
+    CloseSimpleMenu: ClassVar[Symbol[None, None]]
+
+    IsSimpleMenuActive: ClassVar[Symbol[None, None]]
+
+    CheckSimpleMenuField0x1A0: ClassVar[Symbol[None, None]]
+
+    GetSimpleMenuField0x1A4: ClassVar[Symbol[None, None]]
+
+    GetSimpleMenuResult: ClassVar[Symbol[None, None]]
+
+    UpdateSimpleMenu: ClassVar[Symbol[None, None]]
+
+    SetSimpleMenuField0x1AC: ClassVar[Symbol[None, None]]
+
+    CreateAdvancedMenu: ClassVar[Symbol[None, None]]
+
+    ResumeAdvancedMenu: ClassVar[Symbol[None, None]]
+
+    CloseAdvancedMenu: ClassVar[Symbol[None, None]]
+
+    IsAdvancedMenuActive2: ClassVar[Symbol[None, None]]
+
+    IsAdvancedMenuActive: ClassVar[Symbol[None, None]]
+
+    GetAdvancedMenuCurrentOption: ClassVar[Symbol[None, None]]
+
+    GetAdvancedMenuResult: ClassVar[Symbol[None, None]]
+
+    UpdateAdvancedMenu: ClassVar[Symbol[None, None]]
+
+    CreateCollectionMenu: ClassVar[Symbol[None, None]]
+
+    SetCollectionMenuField0x1BC: ClassVar[Symbol[None, None]]
+
+    SetCollectionMenuWidth: ClassVar[Symbol[None, None]]
+
+    CloseCollectionMenu: ClassVar[Symbol[None, None]]
+
+    IsCollectionMenuActive: ClassVar[Symbol[None, None]]
+
+    SetCollectionMenuField0x1C8: ClassVar[Symbol[None, None]]
+
+    SetCollectionMenuField0x1A0: ClassVar[Symbol[None, None]]
+
+    SetCollectionMenuField0x1A4: ClassVar[Symbol[None, None]]
+
+    SetCollectionMenuVoidFn: ClassVar[Symbol[None, None]]
+
+    UpdateCollectionMenu: ClassVar[Symbol[None, None]]
+
+    SetCollectionMenuField0x1B2: ClassVar[Symbol[None, None]]
+
+    IsCollectionMenuState3: ClassVar[Symbol[None, None]]
+
+    CreateOptionsMenu: ClassVar[Symbol[None, None]]
+
+    CloseOptionsMenu: ClassVar[Symbol[None, None]]
+
+    IsOptionsMenuActive: ClassVar[Symbol[None, None]]
+
+    CheckOptionsMenuField0x1A4: ClassVar[Symbol[None, None]]
+
+    GetOptionsMenuStates: ClassVar[Symbol[None, None]]
+
+    GetOptionsMenuResult: ClassVar[Symbol[None, None]]
+
+    UpdateOptionsMenu: ClassVar[Symbol[None, None]]
+
+    CreateDebugMenu: ClassVar[Symbol[None, None]]
+
+    CloseDebugMenu: ClassVar[Symbol[None, None]]
+
+    IsDebugMenuActive: ClassVar[Symbol[None, None]]
+
+    CheckDebugMenuField0x1A4: ClassVar[Symbol[None, None]]
+
+    UpdateDebugMenu: ClassVar[Symbol[None, None]]
+
+    CreateScrollBoxSingle: ClassVar[Symbol[None, None]]
+
+    CreateScrollBoxMulti: ClassVar[Symbol[None, None]]
+
+    SetScrollBoxState7: ClassVar[Symbol[None, None]]
+
+    CloseScrollBox: ClassVar[Symbol[None, None]]
+
+    IsScrollBoxActive: ClassVar[Symbol[None, None]]
+
+    UpdateScrollBox: ClassVar[Symbol[None, None]]
+
+    CreateDialogueBox: ClassVar[Symbol[None, None]]
+
+    CloseDialogueBox: ClassVar[Symbol[None, None]]
+
+    IsDialogueBoxActive: ClassVar[Symbol[None, None]]
+
+    ShowStringIdInDialogueBox: ClassVar[Symbol[None, None]]
+
+    ShowStringInDialogueBox: ClassVar[Symbol[None, None]]
+
+    ShowDialogueBox: ClassVar[Symbol[None, None]]
+
+    ReadStringFromDialogueBox: ClassVar[Symbol[None, None]]
+
+    UpdateDialogueBox: ClassVar[Symbol[None, None]]
+
+    CreatePortraitBox: ClassVar[Symbol[None, None]]
+
+    ClosePortraitBox: ClassVar[Symbol[None, None]]
+
+    PortraitBoxNeedsUpdate: ClassVar[Symbol[None, None]]
+
+    ShowPortraitInPortraitBox: ClassVar[Symbol[None, None]]
+
+    HidePortraitBox: ClassVar[Symbol[None, None]]
+
+    UpdatePortraitBox: ClassVar[Symbol[None, None]]
+
+    CreateTextBox: ClassVar[Symbol[None, None]]
+
+    CreateTextBoxWithArg: ClassVar[Symbol[None, None]]
+
+    CloseTextBox: ClassVar[Symbol[None, None]]
+
+    CloseTextBox2: ClassVar[Symbol[None, None]]
+
+    CreateTextBoxInternal: ClassVar[Symbol[None, None]]
+
+    UpdateTextBox: ClassVar[Symbol[None, None]]
+
+    IsTextBoxActive: ClassVar[Symbol[None, None]]
+
+    CreateAreaNameBox: ClassVar[Symbol[None, None]]
+
+    SetAreaNameBoxState3: ClassVar[Symbol[None, None]]
+
+    CloseAreaNameBox: ClassVar[Symbol[None, None]]
+
+    IsAreaNameBoxActive: ClassVar[Symbol[None, None]]
+
+    UpdateAreaNameBox: ClassVar[Symbol[None, None]]
+
+    CreateControlsChart: ClassVar[Symbol[None, None]]
+
+    CloseControlsChart: ClassVar[Symbol[None, None]]
+
+    IsControlsChartActive: ClassVar[Symbol[None, None]]
+
+    UpdateControlsChart: ClassVar[Symbol[None, None]]
+
+    CreateAlertBox: ClassVar[Symbol[None, None]]
+
+    CloseAlertBox: ClassVar[Symbol[None, None]]
+
+    IsAlertBoxActive: ClassVar[Symbol[None, None]]
+
+    UpdateAlertBox: ClassVar[Symbol[None, None]]
+
+    CreateAdvancedTextBox: ClassVar[Symbol[None, None]]
+
+    CreateAdvancedTextBoxWithArg: ClassVar[Symbol[None, None]]
+
+    CreateAdvancedTextBoxInternal: ClassVar[Symbol[None, None]]
+
+    SetAdvancedTextBoxPartialMenu: ClassVar[Symbol[None, None]]
+
+    SetAdvancedTextBoxField0x1C4: ClassVar[Symbol[None, None]]
+
+    SetAdvancedTextBoxField0x1C2: ClassVar[Symbol[None, None]]
+
+    CloseAdvancedTextBox2: ClassVar[Symbol[None, None]]
+
+    SetAdvancedTextBoxState5: ClassVar[Symbol[None, None]]
+
+    CloseAdvancedTextBox: ClassVar[Symbol[None, None]]
+
+    IsAdvancedTextBoxActive: ClassVar[Symbol[None, None]]
+
+    GetAdvancedTextBoxFlags2: ClassVar[Symbol[None, None]]
+
+    SetUnkAdvancedTextBoxFn: ClassVar[Symbol[None, None]]
+
+    SetUnkAdvancedTextBoxWindowFn: ClassVar[Symbol[None, None]]
+
+    UpdateAdvancedTextBox: ClassVar[Symbol[None, None]]
+
+    PlayAdvancedTextBoxInputSound: ClassVar[Symbol[None, None]]
+
+    CreateTeamSelectionMenu: ClassVar[Symbol[None, None]]
+
+    CloseTeamSelectionMenu: ClassVar[Symbol[None, None]]
+
+    IsTeamSelectionMenuActive: ClassVar[Symbol[None, None]]
+
+    UpdateTeamSelectionMenu: ClassVar[Symbol[None, None]]
+
+    IsTeamSelectionMenuState3: ClassVar[Symbol[None, None]]
+
+    CalcMenuHeightDiv8: ClassVar[Symbol[None, None]]
+
+    InitWindowInput: ClassVar[Symbol[None, None]]
+
+    IsMenuOptionActive: ClassVar[Symbol[None, None]]
+
+    PlayWindowInputSound: ClassVar[Symbol[None, None]]
+
+    InitInventoryMenuInput: ClassVar[Symbol[None, None]]
+
+    ShowKeyboard: ClassVar[Symbol[None, None]]
+
+    GetKeyboardStatus: ClassVar[Symbol[None, None]]
+
+    GetKeyboardStringResult: ClassVar[Symbol[None, None]]
+
+    TeamSelectionMenuGetItem: ClassVar[Symbol[None, None]]
+
+    PrintMoveOptionMenu: ClassVar[Symbol[None, None]]
+
+    PrintIqSkillsMenu: ClassVar[Symbol[None, None]]
+
+    GetNotifyNote: ClassVar[Symbol[None, None]]
+
+    SetNotifyNote: ClassVar[Symbol[None, None]]
+
+    InitSpecialEpisodeHero: ClassVar[Symbol[None, None]]
+
+    EventFlagBackupVeneer: ClassVar[Symbol[None, None]]
+
+    InitMainTeamAfterQuiz: ClassVar[Symbol[None, None]]
+
+    InitSpecialEpisodePartners: ClassVar[Symbol[None, None]]
+
+    InitSpecialEpisodeExtraPartner: ClassVar[Symbol[None, None]]
+
+    ReadStringSave: ClassVar[Symbol[None, None]]
+
+    CheckStringSave: ClassVar[Symbol[None, None]]
+
+    WriteSaveFile: ClassVar[Symbol[None, None]]
+
+    ReadSaveFile: ClassVar[Symbol[None, None]]
+
+    CalcChecksum: ClassVar[Symbol[None, None]]
+
+    CheckChecksumInvalid: ClassVar[Symbol[None, None]]
+
+    NoteSaveBase: ClassVar[Symbol[None, None]]
+
+    WriteQuickSaveInfo: ClassVar[Symbol[None, None]]
+
+    ReadSaveHeader: ClassVar[Symbol[None, None]]
+
+    NoteLoadBase: ClassVar[Symbol[None, None]]
+
+    ReadQuickSaveInfo: ClassVar[Symbol[None, None]]
+
+    GetGameMode: ClassVar[Symbol[None, None]]
+
+    InitScriptVariableValues: ClassVar[Symbol[None, None]]
+
+    InitEventFlagScriptVars: ClassVar[Symbol[None, None]]
+
+    ZinitScriptVariable: ClassVar[Symbol[None, None]]
+
+    LoadScriptVariableRaw: ClassVar[Symbol[None, None]]
+
+    LoadScriptVariableValue: ClassVar[Symbol[None, None]]
+
+    LoadScriptVariableValueAtIndex: ClassVar[Symbol[None, None]]
+
+    SaveScriptVariableValue: ClassVar[Symbol[None, None]]
+
+    SaveScriptVariableValueAtIndex: ClassVar[Symbol[None, None]]
+
+    LoadScriptVariableValueSum: ClassVar[Symbol[None, None]]
+
+    LoadScriptVariableValueBytes: ClassVar[Symbol[None, None]]
+
+    SaveScriptVariableValueBytes: ClassVar[Symbol[None, None]]
+
+    ScriptVariablesEqual: ClassVar[Symbol[None, None]]
+
+    EventFlagResume: ClassVar[Symbol[None, None]]
+
+    EventFlagBackup: ClassVar[Symbol[None, None]]
+
+    DumpScriptVariableValues: ClassVar[Symbol[None, None]]
+
+    RestoreScriptVariableValues: ClassVar[Symbol[None, None]]
+
+    InitScenarioScriptVars: ClassVar[Symbol[None, None]]
+
+    SetScenarioScriptVar: ClassVar[Symbol[None, None]]
+
+    GetSpecialEpisodeType: ClassVar[Symbol[None, None]]
+
+    SetSpecialEpisodeType: ClassVar[Symbol[None, None]]
+
+    GetExecuteSpecialEpisodeType: ClassVar[Symbol[None, None]]
+
+    IsSpecialEpisodeOpen: ClassVar[Symbol[None, None]]
+
+    HasPlayedOldGame: ClassVar[Symbol[None, None]]
+
+    GetPerformanceFlagWithChecks: ClassVar[Symbol[None, None]]
+
+    GetScenarioBalance: ClassVar[Symbol[None, None]]
+
+    ScenarioFlagBackup: ClassVar[Symbol[None, None]]
+
+    InitWorldMapScriptVars: ClassVar[Symbol[None, None]]
+
+    InitDungeonListScriptVars: ClassVar[Symbol[None, None]]
+
+    SetDungeonConquest: ClassVar[Symbol[None, None]]
+
+    GetDungeonMode: ClassVar[Symbol[None, None]]
+
+    GlobalProgressAlloc: ClassVar[Symbol[None, None]]
+
+    ResetGlobalProgress: ClassVar[Symbol[None, None]]
+
+    SetMonsterFlag1: ClassVar[Symbol[None, None]]
+
+    GetMonsterFlag1: ClassVar[Symbol[None, None]]
+
+    SetMonsterFlag2: ClassVar[Symbol[None, None]]
+
+    HasMonsterBeenAttackedInDungeons: ClassVar[Symbol[None, None]]
+
+    SetDungeonTipShown: ClassVar[Symbol[None, None]]
+
+    GetDungeonTipShown: ClassVar[Symbol[None, None]]
+
+    SetMaxReachedFloor: ClassVar[Symbol[None, None]]
+
+    GetMaxReachedFloor: ClassVar[Symbol[None, None]]
+
+    IncrementNbAdventures: ClassVar[Symbol[None, None]]
+
+    GetNbAdventures: ClassVar[Symbol[None, None]]
+
+    CanMonsterSpawn: ClassVar[Symbol[None, None]]
+
+    IncrementExclusiveMonsterCounts: ClassVar[Symbol[None, None]]
+
+    CopyProgressInfoTo: ClassVar[Symbol[None, None]]
+
+    CopyProgressInfoFromScratchTo: ClassVar[Symbol[None, None]]
+
+    CopyProgressInfoFrom: ClassVar[Symbol[None, None]]
+
+    CopyProgressInfoFromScratchFrom: ClassVar[Symbol[None, None]]
+
+    InitKaomadoStream: ClassVar[Symbol[None, None]]
+
+    InitPortraitParams: ClassVar[Symbol[None, None]]
+
+    InitPortraitParamsWithMonsterId: ClassVar[Symbol[None, None]]
+
+    SetPortraitEmotion: ClassVar[Symbol[None, None]]
+
+    SetPortraitLayout: ClassVar[Symbol[None, None]]
+
+    SetPortraitOffset: ClassVar[Symbol[None, None]]
+
+    AllowPortraitDefault: ClassVar[Symbol[None, None]]
+
+    IsValidPortrait: ClassVar[Symbol[None, None]]
+
+    LoadPortrait: ClassVar[Symbol[None, None]]
+
+    WonderMailPasswordToMission: ClassVar[Symbol[None, None]]
+
+    SetEnterDungeon: ClassVar[Symbol[None, None]]
+
+    InitDungeonInit: ClassVar[Symbol[None, None]]
+
+    IsNoLossPenaltyDungeon: ClassVar[Symbol[None, None]]
+
+    CheckMissionRestrictions: ClassVar[Symbol[None, None]]
+
+    GetNbFloors: ClassVar[Symbol[None, None]]
+
+    GetNbFloorsPlusOne: ClassVar[Symbol[None, None]]
+
+    GetDungeonGroup: ClassVar[Symbol[None, None]]
+
+    GetNbPrecedingFloors: ClassVar[Symbol[None, None]]
+
+    GetNbFloorsDungeonGroup: ClassVar[Symbol[None, None]]
+
+    DungeonFloorToGroupFloor: ClassVar[Symbol[None, None]]
+
+    GetMissionRank: ClassVar[Symbol[None, None]]
+
+    GetOutlawLevel: ClassVar[Symbol[None, None]]
+
+    GetOutlawLeaderLevel: ClassVar[Symbol[None, None]]
+
+    GetOutlawMinionLevel: ClassVar[Symbol[None, None]]
+
+    AddGuestMonster: ClassVar[Symbol[None, None]]
+
+    GetGroundNameId: ClassVar[Symbol[None, None]]
+
+    SetAdventureLogStructLocation: ClassVar[Symbol[None, None]]
+
+    SetAdventureLogDungeonFloor: ClassVar[Symbol[None, None]]
+
+    GetAdventureLogDungeonFloor: ClassVar[Symbol[None, None]]
+
+    ClearAdventureLogStruct: ClassVar[Symbol[None, None]]
+
+    SetAdventureLogCompleted: ClassVar[Symbol[None, None]]
+
+    IsAdventureLogNotEmpty: ClassVar[Symbol[None, None]]
+
+    GetAdventureLogCompleted: ClassVar[Symbol[None, None]]
+
+    IncrementNbDungeonsCleared: ClassVar[Symbol[None, None]]
+
+    GetNbDungeonsCleared: ClassVar[Symbol[None, None]]
+
+    IncrementNbFriendRescues: ClassVar[Symbol[None, None]]
+
+    GetNbFriendRescues: ClassVar[Symbol[None, None]]
+
+    IncrementNbEvolutions: ClassVar[Symbol[None, None]]
+
+    GetNbEvolutions: ClassVar[Symbol[None, None]]
+
+    IncrementNbSteals: ClassVar[Symbol[None, None]]
+
+    IncrementNbEggsHatched: ClassVar[Symbol[None, None]]
+
+    GetNbEggsHatched: ClassVar[Symbol[None, None]]
+
+    GetNbPokemonJoined: ClassVar[Symbol[None, None]]
+
+    GetNbMovesLearned: ClassVar[Symbol[None, None]]
+
+    SetVictoriesOnOneFloor: ClassVar[Symbol[None, None]]
+
+    GetVictoriesOnOneFloor: ClassVar[Symbol[None, None]]
+
+    SetPokemonJoined: ClassVar[Symbol[None, None]]
+
+    SetPokemonBattled: ClassVar[Symbol[None, None]]
+
+    GetNbPokemonBattled: ClassVar[Symbol[None, None]]
+
+    IncrementNbBigTreasureWins: ClassVar[Symbol[None, None]]
+
+    SetNbBigTreasureWins: ClassVar[Symbol[None, None]]
+
+    GetNbBigTreasureWins: ClassVar[Symbol[None, None]]
+
+    SetNbRecycled: ClassVar[Symbol[None, None]]
+
+    GetNbRecycled: ClassVar[Symbol[None, None]]
+
+    IncrementNbSkyGiftsSent: ClassVar[Symbol[None, None]]
+
+    SetNbSkyGiftsSent: ClassVar[Symbol[None, None]]
+
+    GetNbSkyGiftsSent: ClassVar[Symbol[None, None]]
+
+    ComputeSpecialCounters: ClassVar[Symbol[None, None]]
+
+    RecruitSpecialPokemonLog: ClassVar[Symbol[None, None]]
+
+    IncrementNbFainted: ClassVar[Symbol[None, None]]
+
+    GetNbFainted: ClassVar[Symbol[None, None]]
+
+    SetItemAcquired: ClassVar[Symbol[None, None]]
+
+    GetNbItemAcquired: ClassVar[Symbol[None, None]]
+
+    SetChallengeLetterCleared: ClassVar[Symbol[None, None]]
+
+    GetSentryDutyGamePoints: ClassVar[Symbol[None, None]]
+
+    SetSentryDutyGamePoints: ClassVar[Symbol[None, None]]
+
+    CopyLogTo: ClassVar[Symbol[None, None]]
+
+    CopyLogFrom: ClassVar[Symbol[None, None]]
+
+    GetAbilityString: ClassVar[Symbol[None, None]]
+
+    GetAbilityDescStringId: ClassVar[Symbol[None, None]]
+
+    GetTypeStringId: ClassVar[Symbol[None, None]]
+
+    GetConversion2ConvertToType: ClassVar[Symbol[None, None]]
+
+    CopyBitsTo: ClassVar[Symbol[None, None]]
+
+    CopyBitsFrom: ClassVar[Symbol[None, None]]
+
+    StoreDefaultTeamData: ClassVar[Symbol[None, None]]
+
+    GetMainTeamNameWithCheck: ClassVar[Symbol[None, None]]
+
+    GetMainTeamName: ClassVar[Symbol[None, None]]
+
+    SetMainTeamName: ClassVar[Symbol[None, None]]
+
+    GetRankupPoints: ClassVar[Symbol[None, None]]
+
+    GetRank: ClassVar[Symbol[None, None]]
+
+    GetRankStorageSize: ClassVar[Symbol[None, None]]
+
+    ResetPlayTimer: ClassVar[Symbol[None, None]]
+
+    PlayTimerTick: ClassVar[Symbol[None, None]]
+
+    GetPlayTimeSeconds: ClassVar[Symbol[None, None]]
+
+    SubFixedPoint: ClassVar[Symbol[None, None]]
+
+    BinToDecFixedPoint: ClassVar[Symbol[None, None]]
+
+    CeilFixedPoint: ClassVar[Symbol[None, None]]
+
+    DungeonGoesUp: ClassVar[Symbol[None, None]]
+
+    GetTurnLimit: ClassVar[Symbol[None, None]]
+
+    DoesNotSaveWhenEntering: ClassVar[Symbol[None, None]]
+
+    TreasureBoxDropsEnabled: ClassVar[Symbol[None, None]]
+
+    IsLevelResetDungeon: ClassVar[Symbol[None, None]]
+
+    GetMaxItemsAllowed: ClassVar[Symbol[None, None]]
+
+    IsMoneyAllowed: ClassVar[Symbol[None, None]]
+
+    GetMaxRescueAttempts: ClassVar[Symbol[None, None]]
+
+    IsRecruitingAllowed: ClassVar[Symbol[None, None]]
+
+    GetLeaderChangeFlag: ClassVar[Symbol[None, None]]
+
+    GetRandomMovementChance: ClassVar[Symbol[None, None]]
+
+    CanEnemyEvolve: ClassVar[Symbol[None, None]]
+
+    GetMaxMembersAllowed: ClassVar[Symbol[None, None]]
+
+    IsIqEnabled: ClassVar[Symbol[None, None]]
+
+    IsTrapInvisibleWhenAttacking: ClassVar[Symbol[None, None]]
+
+    JoinedAtRangeCheck: ClassVar[Symbol[None, None]]
+
+    IsDojoDungeon: ClassVar[Symbol[None, None]]
+
+    IsFutureDungeon: ClassVar[Symbol[None, None]]
+
+    IsSpecialEpisodeDungeon: ClassVar[Symbol[None, None]]
+
+    RetrieveFromItemList1: ClassVar[Symbol[None, None]]
+
+    IsForbiddenFloor: ClassVar[Symbol[None, None]]
+
+    Copy16BitsFrom: ClassVar[Symbol[None, None]]
+
+    RetrieveFromItemList2: ClassVar[Symbol[None, None]]
+
+    IsInvalidForMission: ClassVar[Symbol[None, None]]
+
+    IsExpEnabledInDungeon: ClassVar[Symbol[None, None]]
+
+    IsSkyExclusiveDungeon: ClassVar[Symbol[None, None]]
+
+    JoinedAtRangeCheck2: ClassVar[Symbol[None, None]]
+
+    GetBagCapacity: ClassVar[Symbol[None, None]]
+
+    GetBagCapacitySpecialEpisode: ClassVar[Symbol[None, None]]
+
+    GetRankUpEntry: ClassVar[Symbol[None, None]]
+
+    GetBgRegionArea: ClassVar[Symbol[None, None]]
+
+    LoadMonsterMd: ClassVar[Symbol[None, None]]
+
+    GetNameRaw: ClassVar[Symbol[None, None]]
+
+    GetName: ClassVar[Symbol[None, None]]
+
+    GetNameWithGender: ClassVar[Symbol[None, None]]
+
+    GetSpeciesString: ClassVar[Symbol[None, None]]
+
+    GetNameString: ClassVar[Symbol[None, None]]
+
+    GetSpriteIndex: ClassVar[Symbol[None, None]]
+
+    GetDexNumber: ClassVar[Symbol[None, None]]
+
+    GetCategoryString: ClassVar[Symbol[None, None]]
+
+    GetMonsterGender: ClassVar[Symbol[None, None]]
+
+    GetBodySize: ClassVar[Symbol[None, None]]
+
+    GetSpriteSize: ClassVar[Symbol[None, None]]
+
+    GetSpriteFileSize: ClassVar[Symbol[None, None]]
+
+    GetShadowSize: ClassVar[Symbol[None, None]]
+
+    GetSpeedStatus: ClassVar[Symbol[None, None]]
+
+    GetMobilityType: ClassVar[Symbol[None, None]]
+
+    GetRegenSpeed: ClassVar[Symbol[None, None]]
+
+    GetCanMoveFlag: ClassVar[Symbol[None, None]]
+
+    GetChanceAsleep: ClassVar[Symbol[None, None]]
+
+    GetWeightMultiplier: ClassVar[Symbol[None, None]]
+
+    GetSize: ClassVar[Symbol[None, None]]
+
+    GetBaseHp: ClassVar[Symbol[None, None]]
+
+    CanThrowItems: ClassVar[Symbol[None, None]]
+
+    CanEvolve: ClassVar[Symbol[None, None]]
+
+    GetMonsterPreEvolution: ClassVar[Symbol[None, None]]
+
+    GetBaseOffensiveStat: ClassVar[Symbol[None, None]]
+
+    GetBaseDefensiveStat: ClassVar[Symbol[None, None]]
+
+    GetType: ClassVar[Symbol[None, None]]
+
+    GetAbility: ClassVar[Symbol[None, None]]
+
+    GetRecruitRate2: ClassVar[Symbol[None, None]]
+
+    GetRecruitRate1: ClassVar[Symbol[None, None]]
+
+    GetExp: ClassVar[Symbol[None, None]]
+
+    GetEvoParameters: ClassVar[Symbol[None, None]]
+
+    GetTreasureBoxChances: ClassVar[Symbol[None, None]]
+
+    GetIqGroup: ClassVar[Symbol[None, None]]
+
+    GetSpawnThreshold: ClassVar[Symbol[None, None]]
+
+    NeedsItemToSpawn: ClassVar[Symbol[None, None]]
+
+    GetExclusiveItem: ClassVar[Symbol[None, None]]
+
+    GetFamilyIndex: ClassVar[Symbol[None, None]]
+
+    LoadM2nAndN2m: ClassVar[Symbol[None, None]]
+
+    GuestMonsterToGroundMonster: ClassVar[Symbol[None, None]]
+
+    StrcmpMonsterName: ClassVar[Symbol[None, None]]
+
+    GetLvlUpEntry: ClassVar[Symbol[None, None]]
+
+    GetEncodedHalfword: ClassVar[Symbol[None, None]]
+
+    GetEvoFamily: ClassVar[Symbol[None, None]]
+
+    GetEvolutions: ClassVar[Symbol[None, None]]
+
+    ShuffleHiddenPower: ClassVar[Symbol[None, None]]
+
+    GetBaseForm: ClassVar[Symbol[None, None]]
+
+    GetBaseFormBurmyWormadamShellosGastrodonCherrim: ClassVar[Symbol[None, None]]
+
+    GetBaseFormCastformCherrimDeoxys: ClassVar[Symbol[None, None]]
+
+    GetAllBaseForms: ClassVar[Symbol[None, None]]
+
+    GetDexNumberVeneer: ClassVar[Symbol[None, None]]
+
+    GetMonsterIdFromSpawnEntry: ClassVar[Symbol[None, None]]
+
+    SetMonsterId: ClassVar[Symbol[None, None]]
+
+    SetMonsterLevelAndId: ClassVar[Symbol[None, None]]
+
+    GetMonsterLevelFromSpawnEntry: ClassVar[Symbol[None, None]]
+
+    GetMonsterGenderVeneer: ClassVar[Symbol[None, None]]
+
+    IsMonsterValid: ClassVar[Symbol[None, None]]
+
+    IsUnown: ClassVar[Symbol[None, None]]
+
+    IsShaymin: ClassVar[Symbol[None, None]]
+
+    IsCastform: ClassVar[Symbol[None, None]]
+
+    IsCherrim: ClassVar[Symbol[None, None]]
+
+    IsDeoxys: ClassVar[Symbol[None, None]]
+
+    GetSecondFormIfValid: ClassVar[Symbol[None, None]]
+
+    FemaleToMaleForm: ClassVar[Symbol[None, None]]
+
+    GetBaseFormCastformDeoxysCherrim: ClassVar[Symbol[None, None]]
+
+    BaseFormsEqual: ClassVar[Symbol[None, None]]
+
+    DexNumbersEqual: ClassVar[Symbol[None, None]]
+
+    GendersEqual: ClassVar[Symbol[None, None]]
+
+    GendersEqualNotGenderless: ClassVar[Symbol[None, None]]
+
+    GendersNotEqualNotGenderless: ClassVar[Symbol[None, None]]
+
+    IsMonsterOnTeam: ClassVar[Symbol[None, None]]
+
+    GetNbRecruited: ClassVar[Symbol[None, None]]
+
+    IsValidTeamMember: ClassVar[Symbol[None, None]]
+
+    IsMainCharacter: ClassVar[Symbol[None, None]]
+
+    GetTeamMember: ClassVar[Symbol[None, None]]
+
+    GetHeroMemberIdx: ClassVar[Symbol[None, None]]
+
+    GetPartnerMemberIdx: ClassVar[Symbol[None, None]]
+
+    GetMainCharacter1MemberIdx: ClassVar[Symbol[None, None]]
+
+    GetMainCharacter2MemberIdx: ClassVar[Symbol[None, None]]
+
+    GetMainCharacter3MemberIdx: ClassVar[Symbol[None, None]]
+
+    GetHero: ClassVar[Symbol[None, None]]
+
+    GetPartner: ClassVar[Symbol[None, None]]
+
+    GetMainCharacter1: ClassVar[Symbol[None, None]]
+
+    GetMainCharacter2: ClassVar[Symbol[None, None]]
+
+    GetMainCharacter3: ClassVar[Symbol[None, None]]
+
+    GetFirstMatchingMemberIdx: ClassVar[Symbol[None, None]]
+
+    GetFirstEmptyMemberIdx: ClassVar[Symbol[None, None]]
+
+    IsMonsterNotNicknamed: ClassVar[Symbol[None, None]]
+
+    RemoveActiveMembersFromAllTeams: ClassVar[Symbol[None, None]]
+
+    RemoveActiveMembersFromSpecialEpisodeTeam: ClassVar[Symbol[None, None]]
+
+    RemoveActiveMembersFromRescueTeam: ClassVar[Symbol[None, None]]
+
+    CheckTeamMemberIdx: ClassVar[Symbol[None, None]]
+
+    IsMonsterIdInNormalRange: ClassVar[Symbol[None, None]]
+
+    SetActiveTeam: ClassVar[Symbol[None, None]]
+
+    GetActiveTeamMember: ClassVar[Symbol[None, None]]
+
+    GetActiveRosterIndex: ClassVar[Symbol[None, None]]
+
+    TryAddMonsterToActiveTeam: ClassVar[Symbol[None, None]]
+
+    RemoveActiveMembersFromMainTeam: ClassVar[Symbol[None, None]]
+
+    SetTeamSetupHeroAndPartnerOnly: ClassVar[Symbol[None, None]]
+
+    SetTeamSetupHeroOnly: ClassVar[Symbol[None, None]]
+
+    GetPartyMembers: ClassVar[Symbol[None, None]]
+
+    RefillTeam: ClassVar[Symbol[None, None]]
+
+    ClearItem: ClassVar[Symbol[None, None]]
+
+    ChangeGiratinaFormIfSkyDungeon: ClassVar[Symbol[None, None]]
+
+    GetIqSkillStringId: ClassVar[Symbol[None, None]]
+
+    DoesTacticFollowLeader: ClassVar[Symbol[None, None]]
+
+    GetUnlockedTactics: ClassVar[Symbol[None, None]]
+
+    GetUnlockedTacticFlags: ClassVar[Symbol[None, None]]
+
+    CanLearnIqSkill: ClassVar[Symbol[None, None]]
+
+    GetLearnableIqSkills: ClassVar[Symbol[None, None]]
+
+    DisableIqSkill: ClassVar[Symbol[None, None]]
+
+    EnableIqSkill: ClassVar[Symbol[None, None]]
+
+    GetSpeciesIqSkill: ClassVar[Symbol[None, None]]
+
+    DisableAllIqSkills: ClassVar[Symbol[None, None]]
+
+    EnableAllLearnableIqSkills: ClassVar[Symbol[None, None]]
+
+    IqSkillFlagTest: ClassVar[Symbol[None, None]]
+
+    GetNextIqSkill: ClassVar[Symbol[None, None]]
+
+    GetExplorerMazeTeamName: ClassVar[Symbol[None, None]]
+
+    GetExplorerMazeMonster: ClassVar[Symbol[None, None]]
+
+    WriteMonsterInfoToSave: ClassVar[Symbol[None, None]]
+
+    ReadMonsterInfoFromSave: ClassVar[Symbol[None, None]]
+
+    WriteMonsterToSave: ClassVar[Symbol[None, None]]
+
+    ReadMonsterFromSave: ClassVar[Symbol[None, None]]
+
+    GetEvolutionPossibilities: ClassVar[Symbol[None, None]]
+
+    GetMonsterEvoStatus: ClassVar[Symbol[None, None]]
+
+    CopyTacticString: ClassVar[Symbol[None, None]]
+
+    GetStatBoostsForMonsterSummary: ClassVar[Symbol[None, None]]
+
+    CreateMonsterSummaryFromTeamMember: ClassVar[Symbol[None, None]]
+
+    GetSosMailCount: ClassVar[Symbol[None, None]]
+
+    IsMissionSuspendedAndValid: ClassVar[Symbol[None, None]]
+
+    AreMissionsEquivalent: ClassVar[Symbol[None, None]]
+
+    IsMissionValid: ClassVar[Symbol[None, None]]
+
+    GenerateMission: ClassVar[Symbol[None, None]]
+
+    IsMissionTypeSpecialEpisode: ClassVar[Symbol[None, None]]
+
+    GenerateDailyMissions: ClassVar[Symbol[None, None]]
+
+    AlreadyHaveMission: ClassVar[Symbol[None, None]]
+
+    CountJobListMissions: ClassVar[Symbol[None, None]]
+
+    DungeonRequestsDone: ClassVar[Symbol[None, None]]
+
+    DungeonRequestsDoneWrapper: ClassVar[Symbol[None, None]]
+
+    AnyDungeonRequestsDone: ClassVar[Symbol[None, None]]
+
+    AddMissionToJobList: ClassVar[Symbol[None, None]]
+
+    GetAcceptedMission: ClassVar[Symbol[None, None]]
+
+    GetMissionByTypeAndDungeon: ClassVar[Symbol[None, None]]
+
+    CheckAcceptedMissionByTypeAndDungeon: ClassVar[Symbol[None, None]]
+
+    GetAllPossibleMonsters: ClassVar[Symbol[None, None]]
+
+    GenerateAllPossibleMonstersList: ClassVar[Symbol[None, None]]
+
+    DeleteAllPossibleMonstersList: ClassVar[Symbol[None, None]]
+
+    GenerateAllPossibleDungeonsList: ClassVar[Symbol[None, None]]
+
+    DeleteAllPossibleDungeonsList: ClassVar[Symbol[None, None]]
+
+    GenerateAllPossibleDeliverList: ClassVar[Symbol[None, None]]
+
+    DeleteAllPossibleDeliverList: ClassVar[Symbol[None, None]]
+
+    ClearMissionData: ClassVar[Symbol[None, None]]
+
+    IsMonsterMissionAllowed: ClassVar[Symbol[None, None]]
+
+    CanMonsterBeUsedForMissionWrapper: ClassVar[Symbol[None, None]]
+
+    CanMonsterBeUsedForMission: ClassVar[Symbol[None, None]]
+
+    IsMonsterMissionAllowedStory: ClassVar[Symbol[None, None]]
+
+    CanDungeonBeUsedForMission: ClassVar[Symbol[None, None]]
+
+    CanSendItem: ClassVar[Symbol[None, None]]
+
+    IsAvailableItem: ClassVar[Symbol[None, None]]
+
+    GetAvailableItemDeliveryList: ClassVar[Symbol[None, None]]
+
+    GetActorMatchingStorageId: ClassVar[Symbol[None, None]]
+
+    SetActorTalkMainAndActorTalkSub: ClassVar[Symbol[None, None]]
+
+    SetActorTalkMain: ClassVar[Symbol[None, None]]
+
+    SetActorTalkSub: ClassVar[Symbol[None, None]]
+
+    RandomizeDemoActors: ClassVar[Symbol[None, None]]
+
+    ItemAtTableIdx: ClassVar[Symbol[None, None]]
+
+    MainLoop: ClassVar[Symbol[None, None]]
+
+    CreateJobSummary: ClassVar[Symbol[None, None]]
+
+    DungeonSwapIdToIdx: ClassVar[Symbol[None, None]]
+
+    DungeonSwapIdxToId: ClassVar[Symbol[None, None]]
+
+    GetDungeonModeSpecial: ClassVar[Symbol[None, None]]
+
+    FileRom_InitDataTransfer: ClassVar[Symbol[None, None]]
+
+    FileRom_StopDataTransfer: ClassVar[Symbol[None, None]]
+
+    FileRom_Veneer_FileInit: ClassVar[Symbol[None, None]]
+
+    FileRom_HandleOpen: ClassVar[Symbol[None, None]]
+
+    FileRom_HandleRead: ClassVar[Symbol[None, None]]
+
+    FileRom_HandleSeek: ClassVar[Symbol[None, None]]
+
+    Debug_Init: ClassVar[Symbol[None, None]]
+
+    Debug_InitDebugFlag: ClassVar[Symbol[None, None]]
+
+    Debug_GetDebugFlag: ClassVar[Symbol[None, None]]
+
+    Debug_SetDebugFlag: ClassVar[Symbol[None, None]]
+
+    Debug_Stripped6: ClassVar[Symbol[None, None]]
+
+    Debug_Stripped5: ClassVar[Symbol[None, None]]
+
+    Debug_PrintTrace: ClassVar[Symbol[None, None]]
+
+    Debug_Print0: ClassVar[Symbol[None, None]]
+
+    Debug_InitLogFlag: ClassVar[Symbol[None, None]]
+
+    Debug_GetLogFlag: ClassVar[Symbol[None, None]]
+
+    Debug_SetLogFlag: ClassVar[Symbol[None, None]]
+
+    Debug_Print: ClassVar[Symbol[None, None]]
+
+    Debug_Stripped4: ClassVar[Symbol[None, None]]
+
+    Debug_Stripped3: ClassVar[Symbol[None, None]]
+
+    Debug_Stripped2: ClassVar[Symbol[None, None]]
+
+    Debug_Stripped1: ClassVar[Symbol[None, None]]
+
+    Debug_FatalError: ClassVar[Symbol[None, None]]
+
+    DirectoryFileMngr_ExtractAllDirectoryFiles: ClassVar[Symbol[None, None]]
+
+    DirectoryFileMngr_GetDirectoryFileSize: ClassVar[Symbol[None, None]]
+
+    DirectoryFileMngr_LoadDirectoryFile: ClassVar[Symbol[None, None]]
+
+    DirectoryFileMngr_OpenDirectoryFile: ClassVar[Symbol[None, None]]
+
+    DirectoryFile_ExtractDirectoryFile: ClassVar[Symbol[None, None]]
+
+    DirectoryFile_GetDirectoryFileSize: ClassVar[Symbol[None, None]]
+
+    DirectoryFile_LoadDirectoryFile: ClassVar[Symbol[None, None]]
+
+    GetLowKickMultiplier: ClassVar[Symbol[None, None]]
+
+class JpItcmArm9Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    SECURE: ClassVar[Symbol[None, None]]
+
+    START_MODULE_PARAMS: ClassVar[Symbol[None, None]]
+
+    DEFAULT_MEMORY_ARENA_SIZE: ClassVar[Symbol[None, None]]
+
+    LOG_MAX_ARG: ClassVar[Symbol[None, None]]
+
+    DAMAGE_SOURCE_CODE_ORB_ITEM: ClassVar[Symbol[None, None]]
+
+    DAMAGE_SOURCE_CODE_NON_ORB_ITEM: ClassVar[Symbol[None, None]]
+
+    AURA_BOW_ID_LAST: ClassVar[Symbol[None, None]]
+
+    NUMBER_OF_ITEMS: ClassVar[Symbol[None, None]]
+
+    MAX_MONEY_CARRIED: ClassVar[Symbol[None, None]]
+
+    MAX_MONEY_STORED: ClassVar[Symbol[None, None]]
+
+    WINDOW_LIST_PTR: ClassVar[Symbol[None, None]]
+
+    SCRIPT_VARS_VALUES_PTR: ClassVar[Symbol[None, None]]
+
+    MAX_PLAY_TIME: ClassVar[Symbol[None, None]]
+
+    MONSTER_ID_LIMIT: ClassVar[Symbol[None, None]]
+
+    MAX_RECRUITABLE_TEAM_MEMBERS: ClassVar[Symbol[None, None]]
+
+    NATURAL_LOG_VALUE_TABLE: ClassVar[Symbol[None, None]]
+
+    CART_REMOVED_IMG_DATA: ClassVar[Symbol[None, None]]
+
+    STRING_DEBUG_EMPTY: ClassVar[Symbol[None, None]]
+
+    STRING_DEBUG_FORMAT_LINE_FILE: ClassVar[Symbol[None, None]]
+
+    STRING_DEBUG_NO_PROG_POS: ClassVar[Symbol[None, None]]
+
+    STRING_DEBUG_SPACED_PRINT: ClassVar[Symbol[None, None]]
+
+    STRING_DEBUG_FATAL: ClassVar[Symbol[None, None]]
+
+    STRING_DEBUG_NEWLINE: ClassVar[Symbol[None, None]]
+
+    STRING_DEBUG_LOG_NULL: ClassVar[Symbol[None, None]]
+
+    STRING_DEBUG_STRING_NEWLINE: ClassVar[Symbol[None, None]]
+
+    STRING_EFFECT_EFFECT_BIN: ClassVar[Symbol[None, None]]
+
+    STRING_MONSTER_MONSTER_BIN: ClassVar[Symbol[None, None]]
+
+    STRING_BALANCE_M_LEVEL_BIN: ClassVar[Symbol[None, None]]
+
+    STRING_DUNGEON_DUNGEON_BIN: ClassVar[Symbol[None, None]]
+
+    STRING_MONSTER_M_ATTACK_BIN: ClassVar[Symbol[None, None]]
+
+    STRING_MONSTER_M_GROUND_BIN: ClassVar[Symbol[None, None]]
+
+    STRING_FILE_DIRECTORY_INIT: ClassVar[Symbol[None, None]]
+
+    AVAILABLE_ITEMS_IN_GROUP_TABLE: ClassVar[Symbol[None, None]]
+
+    ARM9_UNKNOWN_TABLE__NA_2097FF8: ClassVar[Symbol[None, None]]
+
+    KECLEON_SHOP_ITEM_TABLE_LISTS_1: ClassVar[Symbol[None, None]]
+
+    KECLEON_SHOP_ITEM_TABLE_LISTS_2: ClassVar[Symbol[None, None]]
+
+    EXCLUSIVE_ITEM_STAT_BOOST_DATA: ClassVar[Symbol[None, None]]
+
+    EXCLUSIVE_ITEM_DEFENSE_BOOSTS: ClassVar[Symbol[None, None]]
+
+    EXCLUSIVE_ITEM_SPECIAL_ATTACK_BOOSTS: ClassVar[Symbol[None, None]]
+
+    EXCLUSIVE_ITEM_SPECIAL_DEFENSE_BOOSTS: ClassVar[Symbol[None, None]]
+
+    EXCLUSIVE_ITEM_EFFECT_DATA: ClassVar[Symbol[None, None]]
+
+    EXCLUSIVE_ITEM_STAT_BOOST_DATA_INDEXES: ClassVar[Symbol[None, None]]
+
+    RECYCLE_SHOP_ITEM_LIST: ClassVar[Symbol[None, None]]
+
+    TYPE_SPECIFIC_EXCLUSIVE_ITEMS: ClassVar[Symbol[None, None]]
+
+    RECOIL_MOVE_LIST: ClassVar[Symbol[None, None]]
+
+    PUNCH_MOVE_LIST: ClassVar[Symbol[None, None]]
+
+    MOVE_POWER_STARS_TABLE: ClassVar[Symbol[None, None]]
+
+    MOVE_ACCURACY_STARS_TABLE: ClassVar[Symbol[None, None]]
+
+    PARENT_MENU_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[None, None]]
+
+    SIMPLE_MENU_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[None, None]]
+
+    ADVANCED_MENU_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[None, None]]
+
+    COLLECTION_MENU_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[None, None]]
+
+    OPTIONS_MENU_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[None, None]]
+
+    DEBUG_MENU_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[None, None]]
+
+    SCROLL_BOX_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[None, None]]
+
+    DIALOGUE_BOX_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[None, None]]
+
+    PORTRAIT_BOX_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[None, None]]
+
+    TEXT_BOX_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[None, None]]
+
+    AREA_NAME_BOX_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[None, None]]
+
+    CONTROLS_CHART_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[None, None]]
+
+    ALERT_BOX_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[None, None]]
+
+    ADVANCED_TEXT_BOX_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[None, None]]
+
+    TEAM_SELECTION_MENU_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[None, None]]
+
+    PARTNER_TALK_KIND_TABLE: ClassVar[Symbol[None, None]]
+
+    SCRIPT_VARS_LOCALS: ClassVar[Symbol[None, None]]
+
+    SCRIPT_VARS: ClassVar[Symbol[None, None]]
+
+    PORTRAIT_LAYOUTS: ClassVar[Symbol[None, None]]
+
+    KAOMADO_FILEPATH: ClassVar[Symbol[None, None]]
+
+    WONDER_MAIL_BITS_MAP: ClassVar[Symbol[None, None]]
+
+    WONDER_MAIL_BITS_SWAP: ClassVar[Symbol[None, None]]
+
+    ARM9_UNKNOWN_TABLE__NA_209E12C: ClassVar[Symbol[None, None]]
+
+    ARM9_UNKNOWN_TABLE__NA_209E164: ClassVar[Symbol[None, None]]
+
+    ARM9_UNKNOWN_TABLE__NA_209E280: ClassVar[Symbol[None, None]]
+
+    WONDER_MAIL_ENCRYPTION_TABLE: ClassVar[Symbol[None, None]]
+
+    DUNGEON_DATA_LIST: ClassVar[Symbol[None, None]]
+
+    ADVENTURE_LOG_ENCOUNTERS_MONSTER_IDS: ClassVar[Symbol[None, None]]
+
+    ARM9_UNKNOWN_DATA__NA_209E6BC: ClassVar[Symbol[None, None]]
+
+    TACTIC_NAME_STRING_IDS: ClassVar[Symbol[None, None]]
+
+    STATUS_NAME_STRING_IDS: ClassVar[Symbol[None, None]]
+
+    DUNGEON_RETURN_STATUS_TABLE: ClassVar[Symbol[None, None]]
+
+    STATUSES_FULL_DESCRIPTION_STRING_IDS: ClassVar[Symbol[None, None]]
+
+    ARM9_UNKNOWN_DATA__NA_209EAAC: ClassVar[Symbol[None, None]]
+
+    MISSION_FLOOR_RANKS_AND_ITEM_LISTS_1: ClassVar[Symbol[None, None]]
+
+    MISSION_FLOORS_FORBIDDEN: ClassVar[Symbol[None, None]]
+
+    MISSION_FLOOR_RANKS_AND_ITEM_LISTS_2: ClassVar[Symbol[None, None]]
+
+    MISSION_FLOOR_RANKS_PTRS: ClassVar[Symbol[None, None]]
+
+    DUNGEON_RESTRICTIONS: ClassVar[Symbol[None, None]]
+
+    SPECIAL_BAND_STAT_BOOST: ClassVar[Symbol[None, None]]
+
+    MUNCH_BELT_STAT_BOOST: ClassVar[Symbol[None, None]]
+
+    GUMMI_STAT_BOOST: ClassVar[Symbol[None, None]]
+
+    MIN_IQ_EXCLUSIVE_MOVE_USER: ClassVar[Symbol[None, None]]
+
+    WONDER_GUMMI_IQ_GAIN: ClassVar[Symbol[None, None]]
+
+    AURA_BOW_STAT_BOOST: ClassVar[Symbol[None, None]]
+
+    MIN_IQ_ITEM_MASTER: ClassVar[Symbol[None, None]]
+
+    DEF_SCARF_STAT_BOOST: ClassVar[Symbol[None, None]]
+
+    POWER_BAND_STAT_BOOST: ClassVar[Symbol[None, None]]
+
+    WONDER_GUMMI_STAT_BOOST: ClassVar[Symbol[None, None]]
+
+    ZINC_BAND_STAT_BOOST: ClassVar[Symbol[None, None]]
+
+    EGG_HP_BONUS: ClassVar[Symbol[None, None]]
+
+    EVOLUTION_HP_BONUS: ClassVar[Symbol[None, None]]
+
+    DAMAGE_FORMULA_FLV_SHIFT: ClassVar[Symbol[None, None]]
+
+    EVOLUTION_PHYSICAL_STAT_BONUSES: ClassVar[Symbol[None, None]]
+
+    DAMAGE_FORMULA_CONSTANT_SHIFT: ClassVar[Symbol[None, None]]
+
+    DAMAGE_FORMULA_FLV_DEFICIT_DIVISOR: ClassVar[Symbol[None, None]]
+
+    EGG_STAT_BONUSES: ClassVar[Symbol[None, None]]
+
+    EVOLUTION_SPECIAL_STAT_BONUSES: ClassVar[Symbol[None, None]]
+
+    DAMAGE_FORMULA_NON_TEAM_MEMBER_MODIFIER: ClassVar[Symbol[None, None]]
+
+    DAMAGE_FORMULA_LN_PREFACTOR: ClassVar[Symbol[None, None]]
+
+    DAMAGE_FORMULA_DEF_PREFACTOR: ClassVar[Symbol[None, None]]
+
+    DAMAGE_FORMULA_AT_PREFACTOR: ClassVar[Symbol[None, None]]
+
+    DAMAGE_FORMULA_LN_ARG_PREFACTOR: ClassVar[Symbol[None, None]]
+
+    FORBIDDEN_FORGOT_MOVE_LIST: ClassVar[Symbol[None, None]]
+
+    TACTICS_UNLOCK_LEVEL_TABLE: ClassVar[Symbol[None, None]]
+
+    CLIENT_LEVEL_TABLE: ClassVar[Symbol[None, None]]
+
+    OUTLAW_LEVEL_TABLE: ClassVar[Symbol[None, None]]
+
+    OUTLAW_MINION_LEVEL_TABLE: ClassVar[Symbol[None, None]]
+
+    HIDDEN_POWER_BASE_POWER_TABLE: ClassVar[Symbol[None, None]]
+
+    VERSION_EXCLUSIVE_MONSTERS: ClassVar[Symbol[None, None]]
+
+    IQ_SKILL_RESTRICTIONS: ClassVar[Symbol[None, None]]
+
+    SECONDARY_TERRAIN_TYPES: ClassVar[Symbol[None, None]]
+
+    SENTRY_DUTY_MONSTER_IDS: ClassVar[Symbol[None, None]]
+
+    IQ_SKILLS: ClassVar[Symbol[None, None]]
+
+    IQ_GROUP_SKILLS: ClassVar[Symbol[None, None]]
+
+    MONEY_QUANTITY_TABLE: ClassVar[Symbol[None, None]]
+
+    ARM9_UNKNOWN_TABLE__NA_20A20B0: ClassVar[Symbol[None, None]]
+
+    IQ_GUMMI_GAIN_TABLE: ClassVar[Symbol[None, None]]
+
+    GUMMI_BELLY_RESTORE_TABLE: ClassVar[Symbol[None, None]]
+
+    BAG_CAPACITY_TABLE_SPECIAL_EPISODES: ClassVar[Symbol[None, None]]
+
+    BAG_CAPACITY_TABLE: ClassVar[Symbol[None, None]]
+
+    SPECIAL_EPISODE_MAIN_CHARACTERS: ClassVar[Symbol[None, None]]
+
+    GUEST_MONSTER_DATA: ClassVar[Symbol[None, None]]
+
+    RANK_UP_TABLE: ClassVar[Symbol[None, None]]
+
+    DS_DOWNLOAD_TEAMS: ClassVar[Symbol[None, None]]
+
+    ARM9_UNKNOWN_PTR__NA_20A2C84: ClassVar[Symbol[None, None]]
+
+    UNOWN_SPECIES_ADDITIONAL_CHARS: ClassVar[Symbol[None, None]]
+
+    MONSTER_SPRITE_DATA: ClassVar[Symbol[None, None]]
+
+    REMOTE_STRINGS: ClassVar[Symbol[None, None]]
+
+    RANK_STRINGS_1: ClassVar[Symbol[None, None]]
+
+    MISSION_MENU_STRING_IDS_1: ClassVar[Symbol[None, None]]
+
+    RANK_STRINGS_2: ClassVar[Symbol[None, None]]
+
+    MISSION_MENU_STRING_IDS_2: ClassVar[Symbol[None, None]]
+
+    RANK_STRINGS_3: ClassVar[Symbol[None, None]]
+
+    MISSION_DUNGEON_UNLOCK_TABLE: ClassVar[Symbol[None, None]]
+
+    NO_SEND_ITEM_TABLE: ClassVar[Symbol[None, None]]
+
+    ARM9_UNKNOWN_TABLE__NA_20A3CC8: ClassVar[Symbol[None, None]]
+
+    ARM9_UNKNOWN_TABLE__NA_20A3CE4: ClassVar[Symbol[None, None]]
+
+    ARM9_UNKNOWN_FUNCTION_TABLE__NA_20A3CF4: ClassVar[Symbol[None, None]]
+
+    MISSION_BANNED_STORY_MONSTERS: ClassVar[Symbol[None, None]]
+
+    ITEM_DELIVERY_TABLE: ClassVar[Symbol[None, None]]
+
+    MISSION_RANK_POINTS: ClassVar[Symbol[None, None]]
+
+    MISSION_BANNED_MONSTERS: ClassVar[Symbol[None, None]]
+
+    MISSION_STRING_IDS: ClassVar[Symbol[None, None]]
+
+    LEVEL_LIST: ClassVar[Symbol[None, None]]
+
+    EVENTS: ClassVar[Symbol[None, None]]
+
+    ARM9_UNKNOWN_TABLE__NA_20A68BC: ClassVar[Symbol[None, None]]
+
+    DEMO_TEAMS: ClassVar[Symbol[None, None]]
+
+    ACTOR_LIST: ClassVar[Symbol[None, None]]
+
+    ENTITIES: ClassVar[Symbol[None, None]]
+
+    JOB_WINDOW_PARAMS_1: ClassVar[Symbol[None, None]]
+
+    JOB_MENU_ITEMS_1: ClassVar[Symbol[None, None]]
+
+    JOB_MENU_ITEMS_2: ClassVar[Symbol[None, None]]
+
+    JOB_MENU_ITEMS_3: ClassVar[Symbol[None, None]]
+
+    JOB_MENU_ITEMS_4: ClassVar[Symbol[None, None]]
+
+    JOB_MENU_ITEMS_5: ClassVar[Symbol[None, None]]
+
+    JOB_MENU_ITEMS_6: ClassVar[Symbol[None, None]]
+
+    JOB_MENU_ITEMS_7: ClassVar[Symbol[None, None]]
+
+    JOB_MENU_ITEMS_8: ClassVar[Symbol[None, None]]
+
+    JOB_MENU_ITEMS_9: ClassVar[Symbol[None, None]]
+
+    JOB_MENU_ITEMS_10: ClassVar[Symbol[None, None]]
+
+    JOB_MENU_ITEMS_11: ClassVar[Symbol[None, None]]
+
+    JOB_MENU_ITEMS_12: ClassVar[Symbol[None, None]]
+
+    JOB_MENU_ITEMS_13: ClassVar[Symbol[None, None]]
+
+    JOB_WINDOW_PARAMS_2: ClassVar[Symbol[None, None]]
+
+    DUNGEON_SWAP_ID_TABLE: ClassVar[Symbol[None, None]]
+
+    MAP_MARKER_PLACEMENTS: ClassVar[Symbol[None, None]]
+
+    LFO_OUTPUT_VOICE_UPDATE_FLAGS: ClassVar[Symbol[None, None]]
+
+    TRIG_TABLE: ClassVar[Symbol[None, None]]
+
+    FX_ATAN_IDX_TABLE: ClassVar[Symbol[None, None]]
+
+    TEX_PLTT_START_ADDR_TABLE: ClassVar[Symbol[None, None]]
+
+    TEX_START_ADDR_TABLE: ClassVar[Symbol[None, None]]
+
+    ARM9_UNKNOWN_TABLE__NA_20AE924: ClassVar[Symbol[None, None]]
+
+    MEMORY_ALLOCATION_ARENA_GETTERS: ClassVar[Symbol[None, None]]
+
+    PRNG_SEQUENCE_NUM: ClassVar[Symbol[None, None]]
+
+    LOADED_OVERLAY_GROUP_0: ClassVar[Symbol[None, None]]
+
+    LOADED_OVERLAY_GROUP_1: ClassVar[Symbol[None, None]]
+
+    LOADED_OVERLAY_GROUP_2: ClassVar[Symbol[None, None]]
+
+    DEBUG_IS_INITIALIZED: ClassVar[Symbol[None, None]]
+
+    PACK_FILES_OPENED: ClassVar[Symbol[None, None]]
+
+    PACK_FILE_PATHS_TABLE: ClassVar[Symbol[None, None]]
+
+    GAME_STATE_VALUES: ClassVar[Symbol[None, None]]
+
+    BAG_ITEMS_PTR_MIRROR: ClassVar[Symbol[None, None]]
+
+    ITEM_DATA_TABLE_PTRS: ClassVar[Symbol[None, None]]
+
+    DUNGEON_MOVE_TABLES: ClassVar[Symbol[None, None]]
+
+    MOVE_DATA_TABLE_PTR: ClassVar[Symbol[None, None]]
+
+    WAN_TABLE: ClassVar[Symbol[None, None]]
+
+    RENDER_3D: ClassVar[Symbol[None, None]]
+
+    RENDER_3D_FUNCTIONS_64: ClassVar[Symbol[None, None]]
+
+    LANGUAGE_INFO_DATA: ClassVar[Symbol[None, None]]
+
+    TBL_TALK_GROUP_STRING_ID_START: ClassVar[Symbol[None, None]]
+
+    KEYBOARD_STRING_IDS: ClassVar[Symbol[None, None]]
+
+    NOTIFY_NOTE: ClassVar[Symbol[None, None]]
+
+    DEFAULT_HERO_ID: ClassVar[Symbol[None, None]]
+
+    DEFAULT_PARTNER_ID: ClassVar[Symbol[None, None]]
+
+    GAME_MODE: ClassVar[Symbol[None, None]]
+
+    GLOBAL_PROGRESS_PTR: ClassVar[Symbol[None, None]]
+
+    ADVENTURE_LOG_PTR: ClassVar[Symbol[None, None]]
+
+    ITEM_TABLES_PTRS_1: ClassVar[Symbol[None, None]]
+
+    UNOWN_SPECIES_ADDITIONAL_CHAR_PTR_TABLE: ClassVar[Symbol[None, None]]
+
+    TEAM_MEMBER_TABLE_PTR: ClassVar[Symbol[None, None]]
+
+    MISSION_DELIVER_LIST_PTR: ClassVar[Symbol[None, None]]
+
+    MISSION_DELIVER_COUNT: ClassVar[Symbol[None, None]]
+
+    MISSION_DUNGEON_LIST_PTR: ClassVar[Symbol[None, None]]
+
+    MISSION_DUNGEON_COUNT: ClassVar[Symbol[None, None]]
+
+    MISSION_MONSTER_LIST_PTR: ClassVar[Symbol[None, None]]
+
+    MISSION_MONSTER_COUNT: ClassVar[Symbol[None, None]]
+
+    MISSION_LIST_PTR: ClassVar[Symbol[None, None]]
+
+    REMOTE_STRING_PTR_TABLE: ClassVar[Symbol[None, None]]
+
+    RANK_STRING_PTR_TABLE: ClassVar[Symbol[None, None]]
+
+    SMD_EVENTS_FUN_TABLE: ClassVar[Symbol[None, None]]
+
+    MUSIC_DURATION_LOOKUP_TABLE_1: ClassVar[Symbol[None, None]]
+
+    MUSIC_DURATION_LOOKUP_TABLE_2: ClassVar[Symbol[None, None]]
+
+    LFO_WAVEFORM_CALLBACKS: ClassVar[Symbol[None, None]]
+
+    IS_DISP_ON: ClassVar[Symbol[None, None]]
+
+    GXI_DMA_ID: ClassVar[Symbol[None, None]]
+
+    JUICE_BAR_NECTAR_IQ_GAIN: ClassVar[Symbol[None, None]]
+
+    DEBUG_TEXT_SPEED: ClassVar[Symbol[None, None]]
+
+    REGULAR_TEXT_SPEED: ClassVar[Symbol[None, None]]
+
+    HERO_START_LEVEL: ClassVar[Symbol[None, None]]
+
+    PARTNER_START_LEVEL: ClassVar[Symbol[None, None]]
+
+    EXCLUSIVE_ITEM_ATTACK_BOOSTS: ClassVar[Symbol[None, None]]
+
+    DIRECTORY_FILES_EXTRACTED: ClassVar[Symbol[None, None]]
+
+    DIRECTORY_FILE_TABLE: ClassVar[Symbol[None, None]]
+
+    TEXT_SPEED: ClassVar[Symbol[None, None]]
+
+class JpItcmArm9Section(
+    Section,
+    name="arm9",
+    description="The main ARM9 binary.\n\nThis is the main binary that gets loaded when the game is launched, and contains the core code that runs the game, low level facilities such as memory allocation, compression, other external dependencies (such as linked libraries), and the functions and tables necessary to load overlays and dispatch execution to them.\n\nSpeaking generally, this is the program run by the Nintendo DS's main ARM946E-S CPU, which handles all gameplay mechanisms and graphics rendering.",
+    loadaddress=0x1FF8000,
+    length=0x4060,
+    functions=JpItcmArm9Functions,
+    data=JpItcmArm9Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[JpItcmArm9Functions]]
+    data: ClassVar[type[JpItcmArm9Data]]
+
+class JpItcmItcmFunctions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    CopyAndInterleave: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Render3dSetTextureParams: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Render3dSetPaletteBase: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Render3dRectangle: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GeomSetPolygonAttributes: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Render3dQuadrilateral: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Render3dTiling: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Render3dTextureInternal: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Render3dTexture: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Render3dTextureNoSetup: ClassVar[Symbol[tuple[int, ...], None]]
+
+    NewRender3dElement: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EnqueueRender3dTexture: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EnqueueRender3dTiling: ClassVar[Symbol[tuple[int, ...], None]]
+
+    NewRender3dRectangle: ClassVar[Symbol[tuple[int, ...], None]]
+
+    NewRender3dQuadrilateral: ClassVar[Symbol[tuple[int, ...], None]]
+
+    NewRender3dTexture: ClassVar[Symbol[tuple[int, ...], None]]
+
+    NewRender3dTiling: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Render3dProcessQueue: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetKeyN2MSwitch: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetKeyN2M: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetKeyN2MBaseForm: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetKeyM2NSwitch: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetKeyM2N: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetKeyM2NBaseForm: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HardwareInterrupt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ReturnFromInterrupt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitDmaTransfer_Standard: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ShouldMonsterRunAwayVariationOutlawCheck: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AiMovement: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CalculateAiTargetPos: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ChooseAiMove: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LightningRodStormDrainCheck: ClassVar[Symbol[tuple[int, ...], None]]
+
+class JpItcmItcmData(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    MEMORY_ALLOCATION_TABLE: ClassVar[Symbol[None, None]]
+
+    DEFAULT_MEMORY_ARENA: ClassVar[Symbol[None, None]]
+
+    DEFAULT_MEMORY_ARENA_BLOCKS: ClassVar[Symbol[None, None]]
+
+    RENDER_3D_FUNCTIONS: ClassVar[Symbol[None, None]]
+
+class JpItcmItcmSection(
+    Section,
+    name="itcm",
+    description="The instruction TCM (tightly-coupled memory) and the corresponding region in the ARM9 binary.\n\nThe ITCM is a special area of low-latency memory meant for performance-critical routines. It's similar to an instruction cache, but more predictable. See the ARMv5 Architecture Reference Manual, Chapter B7 (https://developer.arm.com/documentation/ddi0100/i).\n\nThe Nintendo DS ITCM region is located at 0x0-0x7FFF in memory, but the 32 KiB segment is mirrored throughout the 16 MiB block from 0x0-0x1FFFFFF. The Explorers of Sky code seems to reference only the mirror at 0x1FF8000, the closest one to main memory.\n\nIn Explorers of Sky, a fixed region of the ARM9 binary appears to be loaded in the ITCM at all times, and seems to contain functions related to the dungeon AI, among other things. The ITCM has a max capacity of 0x8000, although not all of it is used.",
+    loadaddress=0x1FF8000,
+    length=0x4060,
+    functions=JpItcmItcmFunctions,
+    data=JpItcmItcmData,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[JpItcmItcmFunctions]]
+    data: ClassVar[type[JpItcmItcmData]]
+
+class JpItcmLibsFunctions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    DseDriver_LoadDefaultSettings: ClassVar[Symbol[None, None]]
+
+    DseDriver_IsSettingsValid: ClassVar[Symbol[None, None]]
+
+    DseDriver_ConfigureHeap: ClassVar[Symbol[None, None]]
+
+    DseDriver_Init: ClassVar[Symbol[None, None]]
+
+    Dse_SetError: ClassVar[Symbol[None, None]]
+
+    Dse_SetError2: ClassVar[Symbol[None, None]]
+
+    DseUtil_ByteSwap32: ClassVar[Symbol[None, None]]
+
+    SoundUtil_GetRandomNumber: ClassVar[Symbol[None, None]]
+
+    DseMem_Init: ClassVar[Symbol[None, None]]
+
+    DseMem_Quit: ClassVar[Symbol[None, None]]
+
+    DseMem_AllocateUser: ClassVar[Symbol[None, None]]
+
+    DseMem_Allocate: ClassVar[Symbol[None, None]]
+
+    DseMem_AllocateThreadStack: ClassVar[Symbol[None, None]]
+
+    DseMem_Free: ClassVar[Symbol[None, None]]
+
+    DseMem_Clear: ClassVar[Symbol[None, None]]
+
+    DseFile_CheckHeader: ClassVar[Symbol[None, None]]
+
+    DseSwd_SysInit: ClassVar[Symbol[None, None]]
+
+    DseSwd_SysQuit: ClassVar[Symbol[None, None]]
+
+    DseSwd_SampleLoaderMain: ClassVar[Symbol[None, None]]
+
+    DseSwd_MainBankDummyCallback: ClassVar[Symbol[None, None]]
+
+    DseSwd_LoadMainBank: ClassVar[Symbol[None, None]]
+
+    DseSwd_LoadBank: ClassVar[Symbol[None, None]]
+
+    DseSwd_IsBankLoading: ClassVar[Symbol[None, None]]
+
+    DseSwd_LoadWaves: ClassVar[Symbol[None, None]]
+
+    DseSwd_LoadWavesInternal: ClassVar[Symbol[None, None]]
+
+    DseSwd_Unload: ClassVar[Symbol[None, None]]
+
+    ReadWaviEntry: ClassVar[Symbol[None, None]]
+
+    DseSwd_GetInstrument: ClassVar[Symbol[None, None]]
+
+    DseSwd_GetNextSplitInRange: ClassVar[Symbol[None, None]]
+
+    DseSwd_GetMainBankById: ClassVar[Symbol[None, None]]
+
+    DseSwd_GetBankById: ClassVar[Symbol[None, None]]
+
+    DseSwd_InitMainBankFileReader: ClassVar[Symbol[None, None]]
+
+    DseSwd_OpenMainBankFileReader: ClassVar[Symbol[None, None]]
+
+    DseSwd_CloseMainBankFileReader: ClassVar[Symbol[None, None]]
+
+    DseSwd_ReadMainBank: ClassVar[Symbol[None, None]]
+
+    DseBgm_DefaultSignalCallback: ClassVar[Symbol[None, None]]
+
+    DseBgm_Load: ClassVar[Symbol[None, None]]
+
+    DseBgm_Unload: ClassVar[Symbol[None, None]]
+
+    DseBgm_SetSignalCallback: ClassVar[Symbol[None, None]]
+
+    DseBgm_IsPlaying: ClassVar[Symbol[None, None]]
+
+    ResumeBgm: ClassVar[Symbol[None, None]]
+
+    DseBgm_Stop: ClassVar[Symbol[None, None]]
+
+    DseBgm_StopAll: ClassVar[Symbol[None, None]]
+
+    DseBgm_SetFades: ClassVar[Symbol[None, None]]
+
+    DseSequence_Start: ClassVar[Symbol[None, None]]
+
+    DseSequence_PauseList: ClassVar[Symbol[None, None]]
+
+    DseSequence_SetFades: ClassVar[Symbol[None, None]]
+
+    DseSequence_GetParameter: ClassVar[Symbol[None, None]]
+
+    DseSequence_GetSmallestNumLoops: ClassVar[Symbol[None, None]]
+
+    DseSequence_Reset: ClassVar[Symbol[None, None]]
+
+    DseSequence_Stop: ClassVar[Symbol[None, None]]
+
+    FindSmdlSongChunk: ClassVar[Symbol[None, None]]
+
+    DseSequence_LoadSong: ClassVar[Symbol[None, None]]
+
+    DseSequence_GetById: ClassVar[Symbol[None, None]]
+
+    DseSequence_AllocateNew: ClassVar[Symbol[None, None]]
+
+    DseSequence_Unload: ClassVar[Symbol[None, None]]
+
+    DseSequence_InitTracks: ClassVar[Symbol[None, None]]
+
+    DseBgm_SysSetupNoteList: ClassVar[Symbol[None, None]]
+
+    DseSe_SysReset: ClassVar[Symbol[None, None]]
+
+    DseSe_Load: ClassVar[Symbol[None, None]]
+
+    DseSe_Unload: ClassVar[Symbol[None, None]]
+
+    DseSe_GetUsedBankIDs: ClassVar[Symbol[None, None]]
+
+    DseSe_HasPlayingInstances: ClassVar[Symbol[None, None]]
+
+    DseSe_Play: ClassVar[Symbol[None, None]]
+
+    DseSe_GetEffectSong: ClassVar[Symbol[None, None]]
+
+    DseSe_CheckTooManyInstances: ClassVar[Symbol[None, None]]
+
+    DseSe_CheckTooManyInstancesInGroup: ClassVar[Symbol[None, None]]
+
+    DseSe_GetBestSeqAllocation: ClassVar[Symbol[None, None]]
+
+    DseSe_GetById: ClassVar[Symbol[None, None]]
+
+    DseSe_Stop: ClassVar[Symbol[None, None]]
+
+    DseSe_StopAll: ClassVar[Symbol[None, None]]
+
+    DseSe_StopSeq: ClassVar[Symbol[None, None]]
+
+    FlushChannels: ClassVar[Symbol[None, None]]
+
+    DseDriver_StartMainThread: ClassVar[Symbol[None, None]]
+
+    DseDriver_StartTickTimer: ClassVar[Symbol[None, None]]
+
+    DseDriver_NotifyTick: ClassVar[Symbol[None, None]]
+
+    DseDriver_Main: ClassVar[Symbol[None, None]]
+
+    DseSequence_TickNotes: ClassVar[Symbol[None, None]]
+
+    ParseDseEvent: ClassVar[Symbol[None, None]]
+
+    UpdateSequencerTracks: ClassVar[Symbol[None, None]]
+
+    DseSequence_TickFades: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_Invalid: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_WaitSame: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_WaitDelta: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_Wait8: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_Wait16: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_Wait24: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_WaitUntilFadeout: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_EndTrack: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_MainLoopBegin: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SubLoopBegin: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SubLoopEnd: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SubLoopBreakOnLastIteration: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetOctave: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_OctaveDelta: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetBpm: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetBpm2: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetBank: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetBankMsb: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetBankLsb: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_Dummy1Byte: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetInstrument: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SongVolumeFade: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_RestoreEnvelopeDefaults: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetEnvelopeAttackBegin: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetEnvelopeAttackTime: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetEnvelopeHoldTime: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetEnvelopeDecayTimeAndSustainLevel: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetEnvelopeSustainTime: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetEnvelopeReleaseTime: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetNoteDurationMultiplier: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_ForceLfoEnvelopeLevel: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetHoldNotes: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetFlagBit1Unknown: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetOptionalVolume: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_Dummy2Bytes: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetTuning: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_TuningDeltaCoarse: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_TuningDeltaFine: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_TuningDeltaFull: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_TuningFade: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetNoteRandomRegion: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetTuningJitterAmplitude: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetKeyBend: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetUnknown2: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetKeyBendRange: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetupKeyBendLfo: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetupKeyBendLfoEnvelope: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_UseKeyBendLfo: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetVolume: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_VolumeDelta: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_VolumeFade: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetExpression: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetupVolumeLfo: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetupVolumeLfoEnvelope: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_UseVolumeLfo: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetPan: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_PanDelta: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_PanFade: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetupPanLfo: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetupPanLfoEnvelope: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_UsePanLfo: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetupLfo: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetupLfoEnvelope: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_SetLfoParameter: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_UseLfo: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_Signal: ClassVar[Symbol[None, None]]
+
+    DseTrackEvent_Dummy2Bytes2: ClassVar[Symbol[None, None]]
+
+    DseSynth_Reset: ClassVar[Symbol[None, None]]
+
+    DseSynth_AllocateNew: ClassVar[Symbol[None, None]]
+
+    DseSynth_Unload: ClassVar[Symbol[None, None]]
+
+    DseSynth_ClearHeldNotes: ClassVar[Symbol[None, None]]
+
+    DseSynth_ResetAndSetBankAndSequence: ClassVar[Symbol[None, None]]
+
+    DseSynth_StopChannels: ClassVar[Symbol[None, None]]
+
+    DseSynth_ResetAllVoiceTimersAndVolumes: ClassVar[Symbol[None, None]]
+
+    DseSynth_RestoreHeldNotes: ClassVar[Symbol[None, None]]
+
+    DseSynth_SetGlobalVolumeIndex: ClassVar[Symbol[None, None]]
+
+    DseSynth_SetBend: ClassVar[Symbol[None, None]]
+
+    DseSynth_SetVolume: ClassVar[Symbol[None, None]]
+
+    DseSynth_SetPan: ClassVar[Symbol[None, None]]
+
+    DseSynth_SetBankAndSequence: ClassVar[Symbol[None, None]]
+
+    DseChannel_Init: ClassVar[Symbol[None, None]]
+
+    DseChannel_DeallocateVoices: ClassVar[Symbol[None, None]]
+
+    DseChannel_ResetTimerAndVolumeForVoices: ClassVar[Symbol[None, None]]
+
+    DseChannel_SetBank: ClassVar[Symbol[None, None]]
+
+    DseChannel_SetInstrument: ClassVar[Symbol[None, None]]
+
+    DseChannel_SetLfoConstEnvelopeLevel: ClassVar[Symbol[None, None]]
+
+    DseChannel_SetKeyBend: ClassVar[Symbol[None, None]]
+
+    DseChannel_AllocateNote: ClassVar[Symbol[None, None]]
+
+    DseChannel_ReleaseNoteInternal: ClassVar[Symbol[None, None]]
+
+    DseChannel_ChangeNote: ClassVar[Symbol[None, None]]
+
+    DseChannel_ReleaseNote: ClassVar[Symbol[None, None]]
+
+    DseVoice_PlayNote: ClassVar[Symbol[None, None]]
+
+    DseVoice_ReleaseNote: ClassVar[Symbol[None, None]]
+
+    DseVoice_UpdateParameters: ClassVar[Symbol[None, None]]
+
+    DseVoice_ResetAll: ClassVar[Symbol[None, None]]
+
+    DseVoice_ResetHW: ClassVar[Symbol[None, None]]
+
+    UpdateChannels: ClassVar[Symbol[None, None]]
+
+    DseVoice_Cleanup: ClassVar[Symbol[None, None]]
+
+    DseVoice_Allocate: ClassVar[Symbol[None, None]]
+
+    DseVoice_Start: ClassVar[Symbol[None, None]]
+
+    DseVoice_ReleaseHeld: ClassVar[Symbol[None, None]]
+
+    DseVoice_Release: ClassVar[Symbol[None, None]]
+
+    DseVoice_Deallocate: ClassVar[Symbol[None, None]]
+
+    DseVoice_FlagForActivation: ClassVar[Symbol[None, None]]
+
+    DseVoice_FlagForDeactivation: ClassVar[Symbol[None, None]]
+
+    DseVoice_CountNumActiveInChannel: ClassVar[Symbol[None, None]]
+
+    DseVoice_UpdateHardware: ClassVar[Symbol[None, None]]
+
+    SoundEnvelope_Reset: ClassVar[Symbol[None, None]]
+
+    SoundEnvelopeParameters_Reset: ClassVar[Symbol[None, None]]
+
+    SoundEnvelopeParameters_CheckValidity: ClassVar[Symbol[None, None]]
+
+    SoundEnvelope_SetParameters: ClassVar[Symbol[None, None]]
+
+    SoundEnvelope_SetSlide: ClassVar[Symbol[None, None]]
+
+    UpdateTrackVolumeEnvelopes: ClassVar[Symbol[None, None]]
+
+    SoundEnvelope_Release: ClassVar[Symbol[None, None]]
+
+    SoundEnvelope_Stop: ClassVar[Symbol[None, None]]
+
+    SoundEnvelope_ForceVolume: ClassVar[Symbol[None, None]]
+
+    SoundEnvelope_Stop2: ClassVar[Symbol[None, None]]
+
+    SoundEnvelope_Tick: ClassVar[Symbol[None, None]]
+
+    SoundLfoBank_Reset: ClassVar[Symbol[None, None]]
+
+    SoundLfoBank_Set: ClassVar[Symbol[None, None]]
+
+    SoundLfoBank_SetConstEnvelopes: ClassVar[Symbol[None, None]]
+
+    SoundLfoBank_Tick: ClassVar[Symbol[None, None]]
+
+    SoundLfoWave_InvalidFunc: ClassVar[Symbol[None, None]]
+
+    SoundLfoWave_HalfSquareFunc: ClassVar[Symbol[None, None]]
+
+    SoundLfoWave_FullSquareFunc: ClassVar[Symbol[None, None]]
+
+    SoundLfoWave_HalfTriangleFunc: ClassVar[Symbol[None, None]]
+
+    SoundLfoWave_FullTriangleFunc: ClassVar[Symbol[None, None]]
+
+    SoundLfoWave_SawFunc: ClassVar[Symbol[None, None]]
+
+    SoundLfoWave_ReverseSawFunc: ClassVar[Symbol[None, None]]
+
+    SoundLfoWave_HalfNoiseFunc: ClassVar[Symbol[None, None]]
+
+    SoundLfoWave_FullNoiseFunc: ClassVar[Symbol[None, None]]
+
+    Crypto_RC4Init: ClassVar[Symbol[None, None]]
+
+    Mtx_LookAt: ClassVar[Symbol[None, None]]
+
+    Mtx_OrthoW: ClassVar[Symbol[None, None]]
+
+    FX_Div: ClassVar[Symbol[None, None]]
+
+    FX_GetDivResultFx64c: ClassVar[Symbol[None, None]]
+
+    FX_GetDivResult: ClassVar[Symbol[None, None]]
+
+    FX_InvAsync: ClassVar[Symbol[None, None]]
+
+    FX_DivAsync: ClassVar[Symbol[None, None]]
+
+    FX_DivS32: ClassVar[Symbol[None, None]]
+
+    FX_ModS32: ClassVar[Symbol[None, None]]
+
+    Vec_DotProduct: ClassVar[Symbol[None, None]]
+
+    Vec_CrossProduct: ClassVar[Symbol[None, None]]
+
+    Vec_Normalize: ClassVar[Symbol[None, None]]
+
+    Vec_Distance: ClassVar[Symbol[None, None]]
+
+    FX_Atan2Idx: ClassVar[Symbol[None, None]]
+
+    GX_Init: ClassVar[Symbol[None, None]]
+
+    GX_HBlankIntr: ClassVar[Symbol[None, None]]
+
+    GX_VBlankIntr: ClassVar[Symbol[None, None]]
+
+    GX_DispOff: ClassVar[Symbol[None, None]]
+
+    GX_DispOn: ClassVar[Symbol[None, None]]
+
+    GX_SetGraphicsMode: ClassVar[Symbol[None, None]]
+
+    Gxs_SetGraphicsMode: ClassVar[Symbol[None, None]]
+
+    GXx_SetMasterBrightness: ClassVar[Symbol[None, None]]
+
+    GX_InitGxState: ClassVar[Symbol[None, None]]
+
+    EnableVramBanksInSetDontSave: ClassVar[Symbol[None, None]]
+
+    GX_SetBankForBg: ClassVar[Symbol[None, None]]
+
+    GX_SetBankForObj: ClassVar[Symbol[None, None]]
+
+    GX_SetBankForBgExtPltt: ClassVar[Symbol[None, None]]
+
+    GX_SetBankForObjExtPltt: ClassVar[Symbol[None, None]]
+
+    GX_SetBankForTex: ClassVar[Symbol[None, None]]
+
+    GX_SetBankForTexPltt: ClassVar[Symbol[None, None]]
+
+    GX_SetBankForClearImage: ClassVar[Symbol[None, None]]
+
+    GX_SetBankForArm7: ClassVar[Symbol[None, None]]
+
+    GX_SetBankForLcdc: ClassVar[Symbol[None, None]]
+
+    GX_SetBankForSubBg: ClassVar[Symbol[None, None]]
+
+    GX_SetBankForSubObj: ClassVar[Symbol[None, None]]
+
+    GX_SetBankForSubBgExtPltt: ClassVar[Symbol[None, None]]
+
+    GX_SetBankForSubObjExtPltt: ClassVar[Symbol[None, None]]
+
+    EnableVramBanksInSet: ClassVar[Symbol[None, None]]
+
+    GX_ResetBankForBgExtPltt: ClassVar[Symbol[None, None]]
+
+    GX_ResetBankForObjExtPltt: ClassVar[Symbol[None, None]]
+
+    GX_ResetBankForTex: ClassVar[Symbol[None, None]]
+
+    GX_ResetBankForTexPltt: ClassVar[Symbol[None, None]]
+
+    GX_ResetBankForSubBgExtPltt: ClassVar[Symbol[None, None]]
+
+    GX_ResetBankForSubObjExtPltt: ClassVar[Symbol[None, None]]
+
+    DisableBankForX: ClassVar[Symbol[None, None]]
+
+    GX_DisableBankForBg: ClassVar[Symbol[None, None]]
+
+    GX_DisableBankForObj: ClassVar[Symbol[None, None]]
+
+    GX_DisableBankForBgExtPltt: ClassVar[Symbol[None, None]]
+
+    GX_DisableBankForObjExtPltt: ClassVar[Symbol[None, None]]
+
+    GX_DisableBankForTex: ClassVar[Symbol[None, None]]
+
+    GX_DisableBankForTexPltt: ClassVar[Symbol[None, None]]
+
+    GX_DisableBankForClearImage: ClassVar[Symbol[None, None]]
+
+    GX_DisableBankForArm7: ClassVar[Symbol[None, None]]
+
+    GX_DisableBankForLcdc: ClassVar[Symbol[None, None]]
+
+    GX_DisableBankForSubBg: ClassVar[Symbol[None, None]]
+
+    GX_DisableBankForSubObj: ClassVar[Symbol[None, None]]
+
+    GX_DisableBankForSubBgExtPltt: ClassVar[Symbol[None, None]]
+
+    GX_DisableBankForSubObjExtPltt: ClassVar[Symbol[None, None]]
+
+    G2_GetBG0ScrPtr: ClassVar[Symbol[None, None]]
+
+    G2S_GetBG0ScrPtr: ClassVar[Symbol[None, None]]
+
+    G2_GetBG1ScrPtr: ClassVar[Symbol[None, None]]
+
+    G2S_GetBG1ScrPtr: ClassVar[Symbol[None, None]]
+
+    G2_GetBG2ScrPtr: ClassVar[Symbol[None, None]]
+
+    G2_GetBG3ScrPtr: ClassVar[Symbol[None, None]]
+
+    G2_GetBG0CharPtr: ClassVar[Symbol[None, None]]
+
+    G2S_GetBG0CharPtr: ClassVar[Symbol[None, None]]
+
+    G2_GetBG1CharPtr: ClassVar[Symbol[None, None]]
+
+    G2S_GetBG1CharPtr: ClassVar[Symbol[None, None]]
+
+    G2_GetBG2CharPtr: ClassVar[Symbol[None, None]]
+
+    G2_GetBG3CharPtr: ClassVar[Symbol[None, None]]
+
+    G2x_SetBlendAlpha: ClassVar[Symbol[None, None]]
+
+    G2x_SetBlendBrightness: ClassVar[Symbol[None, None]]
+
+    G2x_ChangeBlendBrightness: ClassVar[Symbol[None, None]]
+
+    G3_LoadMtx44: ClassVar[Symbol[None, None]]
+
+    G3_LoadMtx43: ClassVar[Symbol[None, None]]
+
+    G3_MultMtx43: ClassVar[Symbol[None, None]]
+
+    G3X_Init: ClassVar[Symbol[None, None]]
+
+    G3X_Reset: ClassVar[Symbol[None, None]]
+
+    G3X_ClearFifo: ClassVar[Symbol[None, None]]
+
+    G3X_InitMtxStack: ClassVar[Symbol[None, None]]
+
+    G3X_ResetMtxStack: ClassVar[Symbol[None, None]]
+
+    G3X_SetClearColor: ClassVar[Symbol[None, None]]
+
+    G3X_InitTable: ClassVar[Symbol[None, None]]
+
+    G3X_GetMtxStackLevelPV: ClassVar[Symbol[None, None]]
+
+    G3X_GetMtxStackLevelPJ: ClassVar[Symbol[None, None]]
+
+    GXi_NopClearFifo128: ClassVar[Symbol[None, None]]
+
+    G3i_OrthoW: ClassVar[Symbol[None, None]]
+
+    G3i_LookAt: ClassVar[Symbol[None, None]]
+
+    GX_LoadBgPltt: ClassVar[Symbol[None, None]]
+
+    Gxs_LoadBgPltt: ClassVar[Symbol[None, None]]
+
+    GX_LoadObjPltt: ClassVar[Symbol[None, None]]
+
+    Gxs_LoadObjPltt: ClassVar[Symbol[None, None]]
+
+    GX_LoadOam: ClassVar[Symbol[None, None]]
+
+    Gxs_LoadOam: ClassVar[Symbol[None, None]]
+
+    GX_LoadObj: ClassVar[Symbol[None, None]]
+
+    Gxs_LoadObj: ClassVar[Symbol[None, None]]
+
+    GX_LoadBg0Scr: ClassVar[Symbol[None, None]]
+
+    GX_LoadBg1Scr: ClassVar[Symbol[None, None]]
+
+    Gxs_LoadBg1Scr: ClassVar[Symbol[None, None]]
+
+    GX_LoadBg2Scr: ClassVar[Symbol[None, None]]
+
+    GX_LoadBg3Scr: ClassVar[Symbol[None, None]]
+
+    GX_LoadBg0Char: ClassVar[Symbol[None, None]]
+
+    Gxs_LoadBg0Char: ClassVar[Symbol[None, None]]
+
+    GX_LoadBg1Char: ClassVar[Symbol[None, None]]
+
+    Gxs_LoadBg1Char: ClassVar[Symbol[None, None]]
+
+    GX_LoadBg2Char: ClassVar[Symbol[None, None]]
+
+    GX_LoadBg3Char: ClassVar[Symbol[None, None]]
+
+    GX_BeginLoadBgExtPltt: ClassVar[Symbol[None, None]]
+
+    GX_EndLoadBgExtPltt: ClassVar[Symbol[None, None]]
+
+    GX_BeginLoadObjExtPltt: ClassVar[Symbol[None, None]]
+
+    GX_EndLoadObjExtPltt: ClassVar[Symbol[None, None]]
+
+    Gxs_BeginLoadBgExtPltt: ClassVar[Symbol[None, None]]
+
+    Gxs_EndLoadBgExtPltt: ClassVar[Symbol[None, None]]
+
+    Gxs_BeginLoadObjExtPltt: ClassVar[Symbol[None, None]]
+
+    Gxs_EndLoadObjExtPltt: ClassVar[Symbol[None, None]]
+
+    GX_BeginLoadTex: ClassVar[Symbol[None, None]]
+
+    GX_LoadTex: ClassVar[Symbol[None, None]]
+
+    GX_EndLoadTex: ClassVar[Symbol[None, None]]
+
+    GX_BeginLoadTexPltt: ClassVar[Symbol[None, None]]
+
+    GX_LoadTexPltt: ClassVar[Symbol[None, None]]
+
+    GX_EndLoadTexPltt: ClassVar[Symbol[None, None]]
+
+    GeomGxFifoSendMtx4x3: ClassVar[Symbol[None, None]]
+
+    GX_SendFifo64B: ClassVar[Symbol[None, None]]
+
+    OS_GetLockID: ClassVar[Symbol[None, None]]
+
+    IncrementThreadCount: ClassVar[Symbol[None, None]]
+
+    InsertThreadIntoList: ClassVar[Symbol[None, None]]
+
+    StartThread: ClassVar[Symbol[None, None]]
+
+    ThreadExit: ClassVar[Symbol[None, None]]
+
+    SetThreadField0xB4: ClassVar[Symbol[None, None]]
+
+    InitThread: ClassVar[Symbol[None, None]]
+
+    GetTimer0Control: ClassVar[Symbol[None, None]]
+
+    ClearIrqFlag: ClassVar[Symbol[None, None]]
+
+    EnableIrqFlag: ClassVar[Symbol[None, None]]
+
+    SetIrqFlag: ClassVar[Symbol[None, None]]
+
+    EnableIrqFiqFlags: ClassVar[Symbol[None, None]]
+
+    SetIrqFiqFlags: ClassVar[Symbol[None, None]]
+
+    GetIrqFlag: ClassVar[Symbol[None, None]]
+
+    GetProcessorMode: ClassVar[Symbol[None, None]]
+
+    GetDsFirmwareUserSettings: ClassVar[Symbol[None, None]]
+
+    CountLeadingZeros: ClassVar[Symbol[None, None]]
+
+    WaitForever2: ClassVar[Symbol[None, None]]
+
+    WaitForInterrupt: ClassVar[Symbol[None, None]]
+
+    ArrayFill16: ClassVar[Symbol[None, None]]
+
+    ArrayCopy16: ClassVar[Symbol[None, None]]
+
+    ArrayFill32: ClassVar[Symbol[None, None]]
+
+    ArrayCopy32: ClassVar[Symbol[None, None]]
+
+    ArrayFill32Fast: ClassVar[Symbol[None, None]]
+
+    ArrayCopy32Fast: ClassVar[Symbol[None, None]]
+
+    MemsetFast: ClassVar[Symbol[None, None]]
+
+    MemcpyFast: ClassVar[Symbol[None, None]]
+
+    AtomicExchange: ClassVar[Symbol[None, None]]
+
+    FileInit: ClassVar[Symbol[None, None]]
+
+    GetOverlayInfo: ClassVar[Symbol[None, None]]
+
+    LoadOverlayInternal: ClassVar[Symbol[None, None]]
+
+    InitOverlay: ClassVar[Symbol[None, None]]
+
+    abs: ClassVar[Symbol[None, None]]
+
+    mbtowc: ClassVar[Symbol[None, None]]
+
+    TryAssignByte: ClassVar[Symbol[None, None]]
+
+    TryAssignByteWrapper: ClassVar[Symbol[None, None]]
+
+    wcstombs: ClassVar[Symbol[None, None]]
+
+    memcpy: ClassVar[Symbol[None, None]]
+
+    memmove: ClassVar[Symbol[None, None]]
+
+    memset: ClassVar[Symbol[None, None]]
+
+    memchr: ClassVar[Symbol[None, None]]
+
+    memcmp: ClassVar[Symbol[None, None]]
+
+    memset_internal: ClassVar[Symbol[None, None]]
+
+    __vsprintf_internal_slice: ClassVar[Symbol[None, None]]
+
+    TryAppendToSlice: ClassVar[Symbol[None, None]]
+
+    __vsprintf_internal: ClassVar[Symbol[None, None]]
+
+    vsprintf: ClassVar[Symbol[None, None]]
+
+    snprintf: ClassVar[Symbol[None, None]]
+
+    sprintf: ClassVar[Symbol[None, None]]
+
+    strlen: ClassVar[Symbol[None, None]]
+
+    strcpy: ClassVar[Symbol[None, None]]
+
+    strncpy: ClassVar[Symbol[None, None]]
+
+    strcat: ClassVar[Symbol[None, None]]
+
+    strncat: ClassVar[Symbol[None, None]]
+
+    strcmp: ClassVar[Symbol[None, None]]
+
+    strncmp: ClassVar[Symbol[None, None]]
+
+    strchr: ClassVar[Symbol[None, None]]
+
+    strcspn: ClassVar[Symbol[None, None]]
+
+    strstr: ClassVar[Symbol[None, None]]
+
+    wcslen: ClassVar[Symbol[None, None]]
+
+    _dadd: ClassVar[Symbol[None, None]]
+
+    _d2f: ClassVar[Symbol[None, None]]
+
+    _ll_ufrom_d: ClassVar[Symbol[None, None]]
+
+    _dflt: ClassVar[Symbol[None, None]]
+
+    _dfltu: ClassVar[Symbol[None, None]]
+
+    _dmul: ClassVar[Symbol[None, None]]
+
+    _dsqrt: ClassVar[Symbol[None, None]]
+
+    _dsub: ClassVar[Symbol[None, None]]
+
+    _fadd: ClassVar[Symbol[None, None]]
+
+    _dgeq: ClassVar[Symbol[None, None]]
+
+    _dleq: ClassVar[Symbol[None, None]]
+
+    _dls: ClassVar[Symbol[None, None]]
+
+    _deq: ClassVar[Symbol[None, None]]
+
+    _dneq: ClassVar[Symbol[None, None]]
+
+    _fls: ClassVar[Symbol[None, None]]
+
+    _fdiv: ClassVar[Symbol[None, None]]
+
+    _f2d: ClassVar[Symbol[None, None]]
+
+    _ffix: ClassVar[Symbol[None, None]]
+
+    _fflt: ClassVar[Symbol[None, None]]
+
+    _ffltu: ClassVar[Symbol[None, None]]
+
+    _fmul: ClassVar[Symbol[None, None]]
+
+    sqrtf: ClassVar[Symbol[None, None]]
+
+    _fsub: ClassVar[Symbol[None, None]]
+
+    _ll_mod: ClassVar[Symbol[None, None]]
+
+    _ll_sdiv: ClassVar[Symbol[None, None]]
+
+    _ll_udiv: ClassVar[Symbol[None, None]]
+
+    _ull_mod: ClassVar[Symbol[None, None]]
+
+    _ll_mul: ClassVar[Symbol[None, None]]
+
+    _s32_div_f: ClassVar[Symbol[None, None]]
+
+    _u32_div_f: ClassVar[Symbol[None, None]]
+
+    _u32_div_not_0_f: ClassVar[Symbol[None, None]]
+
+    _drdiv: ClassVar[Symbol[None, None]]
+
+    _ddiv: ClassVar[Symbol[None, None]]
+
+    _fp_init: ClassVar[Symbol[None, None]]
+
+    DseUtil_GetRandomNumber: ClassVar[Symbol[None, None]]
+
+    __addsf3: ClassVar[Symbol[None, None]]
+
+    __divsf3: ClassVar[Symbol[None, None]]
+
+    __extendsfdf2: ClassVar[Symbol[None, None]]
+
+    __fixsfsi: ClassVar[Symbol[None, None]]
+
+    __floatsisf: ClassVar[Symbol[None, None]]
+
+    __floatunsisf: ClassVar[Symbol[None, None]]
+
+    __mulsf3: ClassVar[Symbol[None, None]]
+
+    __subsf3: ClassVar[Symbol[None, None]]
+
+    __divsi3: ClassVar[Symbol[None, None]]
+
+    __udivsi3: ClassVar[Symbol[None, None]]
+
+    __udivsi3_no_zero_check: ClassVar[Symbol[None, None]]
+
+class JpItcmLibsData(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmLibsSection(
+    Section,
+    name="libs",
+    description="System libraries linked to the main ARM9 binary.\n\nThis includes code from common NDS system libraries like the Nitro SDK (which contains NDS-specific functionality as well as utilities akin to libc and libgcc).\n\nWhere the library region starts and ends is a guess, but there appear to be fairly sharp boundaries. The function directly before it calls functions at lower memory addresses outside of the region, while all functions in the region only call other functions within the region. The bytes after the region seem to be the start of a global data region, used by both the libraries and the rest of ARM9.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmLibsFunctions,
+    data=JpItcmLibsData,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmLibsFunctions]]
+    data: ClassVar[type[JpItcmLibsData]]
+
+class JpItcmMove_effectsFunctions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    DoMoveDamage: ClassVar[Symbol[None, None]]
+
+    DoMoveIronTail: ClassVar[Symbol[None, None]]
+
+    DoMoveDamageMultihitUntilMiss: ClassVar[Symbol[None, None]]
+
+    DoMoveYawn: ClassVar[Symbol[None, None]]
+
+    DoMoveSleep: ClassVar[Symbol[None, None]]
+
+    DoMoveNightmare: ClassVar[Symbol[None, None]]
+
+    DoMoveMorningSun: ClassVar[Symbol[None, None]]
+
+    DoMoveVitalThrow: ClassVar[Symbol[None, None]]
+
+    DoMoveDig: ClassVar[Symbol[None, None]]
+
+    DoMoveSweetScent: ClassVar[Symbol[None, None]]
+
+    DoMoveCharm: ClassVar[Symbol[None, None]]
+
+    DoMoveRainDance: ClassVar[Symbol[None, None]]
+
+    DoMoveHail: ClassVar[Symbol[None, None]]
+
+    DoMoveHealStatus: ClassVar[Symbol[None, None]]
+
+    DoMoveBubble: ClassVar[Symbol[None, None]]
+
+    DoMoveEncore: ClassVar[Symbol[None, None]]
+
+    DoMoveRage: ClassVar[Symbol[None, None]]
+
+    DoMoveSuperFang: ClassVar[Symbol[None, None]]
+
+    DoMovePainSplit: ClassVar[Symbol[None, None]]
+
+    DoMoveTorment: ClassVar[Symbol[None, None]]
+
+    DoMoveStringShot: ClassVar[Symbol[None, None]]
+
+    DoMoveSwagger: ClassVar[Symbol[None, None]]
+
+    DoMoveSnore: ClassVar[Symbol[None, None]]
+
+    DoMoveScreech: ClassVar[Symbol[None, None]]
+
+    DoMoveDamageCringe30: ClassVar[Symbol[None, None]]
+
+    DoMoveWeatherBall: ClassVar[Symbol[None, None]]
+
+    DoMoveWhirlpool: ClassVar[Symbol[None, None]]
+
+    DoMoveFakeTears: ClassVar[Symbol[None, None]]
+
+    DoMoveSpite: ClassVar[Symbol[None, None]]
+
+    DoMoveFocusEnergy: ClassVar[Symbol[None, None]]
+
+    DoMoveSmokescreen: ClassVar[Symbol[None, None]]
+
+    DoMoveMirrorMove: ClassVar[Symbol[None, None]]
+
+    DoMoveOverheat: ClassVar[Symbol[None, None]]
+
+    DoMoveAuroraBeam: ClassVar[Symbol[None, None]]
+
+    DoMoveMemento: ClassVar[Symbol[None, None]]
+
+    DoMoveOctazooka: ClassVar[Symbol[None, None]]
+
+    DoMoveFlatter: ClassVar[Symbol[None, None]]
+
+    DoMoveWillOWisp: ClassVar[Symbol[None, None]]
+
+    DoMoveReturn: ClassVar[Symbol[None, None]]
+
+    DoMoveGrudge: ClassVar[Symbol[None, None]]
+
+    DoMoveCounter: ClassVar[Symbol[None, None]]
+
+    DoMoveDamageBurn10FlameWheel: ClassVar[Symbol[None, None]]
+
+    DoMoveDamageBurn10: ClassVar[Symbol[None, None]]
+
+    DoMoveExpose: ClassVar[Symbol[None, None]]
+
+    DoMoveDoubleTeam: ClassVar[Symbol[None, None]]
+
+    DoMoveGust: ClassVar[Symbol[None, None]]
+
+    DoMoveBoostDefense1: ClassVar[Symbol[None, None]]
+
+    DoMoveParalyze: ClassVar[Symbol[None, None]]
+
+    DoMoveBoostAttack1: ClassVar[Symbol[None, None]]
+
+    DoMoveRazorWind: ClassVar[Symbol[None, None]]
+
+    DoMoveBide: ClassVar[Symbol[None, None]]
+
+    DoMoveBideUnleash: ClassVar[Symbol[None, None]]
+
+    DoMoveCrunch: ClassVar[Symbol[None, None]]
+
+    DoMoveDamageCringe20: ClassVar[Symbol[None, None]]
+
+    DoMoveDamageParalyze20: ClassVar[Symbol[None, None]]
+
+    DoMoveEndeavor: ClassVar[Symbol[None, None]]
+
+    DoMoveFacade: ClassVar[Symbol[None, None]]
+
+    DoMoveDamageLowerSpeed20: ClassVar[Symbol[None, None]]
+
+    DoMoveBrickBreak: ClassVar[Symbol[None, None]]
+
+    DoMoveDamageLowerSpeed100: ClassVar[Symbol[None, None]]
+
+    DoMoveFocusPunch: ClassVar[Symbol[None, None]]
+
+    DoMoveDamageDrain: ClassVar[Symbol[None, None]]
+
+    DoMoveReversal: ClassVar[Symbol[None, None]]
+
+    DoMoveSmellingSalt: ClassVar[Symbol[None, None]]
+
+    DoMoveMetalSound: ClassVar[Symbol[None, None]]
+
+    DoMoveTickle: ClassVar[Symbol[None, None]]
+
+    DoMoveShadowHold: ClassVar[Symbol[None, None]]
+
+    DoMoveHaze: ClassVar[Symbol[None, None]]
+
+    DoMoveDamageMultihitFatigue: ClassVar[Symbol[None, None]]
+
+    DoMoveDamageWeightDependent: ClassVar[Symbol[None, None]]
+
+    DoMoveDamageBoostAllStats: ClassVar[Symbol[None, None]]
+
+    DoMoveSynthesis: ClassVar[Symbol[None, None]]
+
+    DoMoveBoostSpeed1: ClassVar[Symbol[None, None]]
+
+    DoMoveRapidSpin: ClassVar[Symbol[None, None]]
+
+    DoMoveSureShot: ClassVar[Symbol[None, None]]
+
+    DoMoveCosmicPower: ClassVar[Symbol[None, None]]
+
+    DoMoveSkyAttack: ClassVar[Symbol[None, None]]
+
+    DoMoveDamageFreeze15: ClassVar[Symbol[None, None]]
+
+    DoMoveMeteorMash: ClassVar[Symbol[None, None]]
+
+    DoMoveEndure: ClassVar[Symbol[None, None]]
+
+    DoMoveLowerSpeed1: ClassVar[Symbol[None, None]]
+
+    DoMoveDamageConfuse10: ClassVar[Symbol[None, None]]
+
+    DoMovePsywave: ClassVar[Symbol[None, None]]
+
+    DoMoveDamageLowerDefensiveStatVariable: ClassVar[Symbol[None, None]]
+
+    DoMovePsychoBoost: ClassVar[Symbol[None, None]]
+
+    DoMoveUproar: ClassVar[Symbol[None, None]]
+
+    DoMoveWaterSpout: ClassVar[Symbol[None, None]]
+
+    DoMovePsychUp: ClassVar[Symbol[None, None]]
+
+    DoMoveDamageWithRecoil: ClassVar[Symbol[None, None]]
+
+    EntityIsValidMoveEffects: ClassVar[Symbol[None, None]]
+
+    DoMoveRecoverHp: ClassVar[Symbol[None, None]]
+
+    DoMoveEarthquake: ClassVar[Symbol[None, None]]
+
+    GetNaturePowerVariant: ClassVar[Symbol[None, None]]
+
+    DoMoveNaturePower: ClassVar[Symbol[None, None]]
+
+    DoMoveDamageParalyze10: ClassVar[Symbol[None, None]]
+
+    DoMoveSelfdestruct: ClassVar[Symbol[None, None]]
+
+    DoMoveShadowBall: ClassVar[Symbol[None, None]]
+
+    DoMoveCharge: ClassVar[Symbol[None, None]]
+
+    DoMoveThunderbolt: ClassVar[Symbol[None, None]]
+
+    DoMoveMist: ClassVar[Symbol[None, None]]
+
+    DoMoveFissure: ClassVar[Symbol[None, None]]
+
+    DoMoveDamageCringe10: ClassVar[Symbol[None, None]]
+
+    DoMoveSafeguard: ClassVar[Symbol[None, None]]
+
+    DoMoveAbsorb: ClassVar[Symbol[None, None]]
+
+    DefenderAbilityIsActiveMoveEffects: ClassVar[Symbol[None, None]]
+
+    DoMoveSkillSwap: ClassVar[Symbol[None, None]]
+
+    DoMoveSketch: ClassVar[Symbol[None, None]]
+
+    DoMoveHeadbutt: ClassVar[Symbol[None, None]]
+
+    DoMoveDoubleEdge: ClassVar[Symbol[None, None]]
+
+    DoMoveSandstorm: ClassVar[Symbol[None, None]]
+
+    DoMoveLowerAccuracy1: ClassVar[Symbol[None, None]]
+
+    DoMoveDamagePoison40: ClassVar[Symbol[None, None]]
+
+    DoMoveGrowth: ClassVar[Symbol[None, None]]
+
+    DoMoveSacredFire: ClassVar[Symbol[None, None]]
+
+    DoMoveOhko: ClassVar[Symbol[None, None]]
+
+    DoMoveSolarBeam: ClassVar[Symbol[None, None]]
+
+    DoMoveSonicBoom: ClassVar[Symbol[None, None]]
+
+    DoMoveFly: ClassVar[Symbol[None, None]]
+
+    DoMoveExplosion: ClassVar[Symbol[None, None]]
+
+    DoMoveDive: ClassVar[Symbol[None, None]]
+
+    DoMoveWaterfall: ClassVar[Symbol[None, None]]
+
+    DoMoveDamageLowerAccuracy40: ClassVar[Symbol[None, None]]
+
+    DoMoveStockpile: ClassVar[Symbol[None, None]]
+
+    DoMoveTwister: ClassVar[Symbol[None, None]]
+
+    DoMoveTwineedle: ClassVar[Symbol[None, None]]
+
+    DoMoveRecoverHpTeam: ClassVar[Symbol[None, None]]
+
+    DoMoveMinimize: ClassVar[Symbol[None, None]]
+
+    DoMoveSeismicToss: ClassVar[Symbol[None, None]]
+
+    DoMoveConfuse: ClassVar[Symbol[None, None]]
+
+    DoMoveTaunt: ClassVar[Symbol[None, None]]
+
+    DoMoveMoonlight: ClassVar[Symbol[None, None]]
+
+    DoMoveHornDrill: ClassVar[Symbol[None, None]]
+
+    DoMoveSwordsDance: ClassVar[Symbol[None, None]]
+
+    DoMoveConversion: ClassVar[Symbol[None, None]]
+
+    DoMoveConversion2: ClassVar[Symbol[None, None]]
+
+    DoMoveHelpingHand: ClassVar[Symbol[None, None]]
+
+    DoMoveBoostDefense2: ClassVar[Symbol[None, None]]
+
+    DoMoveWarp: ClassVar[Symbol[None, None]]
+
+    DoMoveThundershock: ClassVar[Symbol[None, None]]
+
+    DoMoveThunderWave: ClassVar[Symbol[None, None]]
+
+    DoMoveZapCannon: ClassVar[Symbol[None, None]]
+
+    DoMoveBlock: ClassVar[Symbol[None, None]]
+
+    DoMovePoison: ClassVar[Symbol[None, None]]
+
+    DoMoveToxic: ClassVar[Symbol[None, None]]
+
+    DoMovePoisonFang: ClassVar[Symbol[None, None]]
+
+    DoMoveDamagePoison18: ClassVar[Symbol[None, None]]
+
+    DoMoveJumpKick: ClassVar[Symbol[None, None]]
+
+    DoMoveBounce: ClassVar[Symbol[None, None]]
+
+    DoMoveHiJumpKick: ClassVar[Symbol[None, None]]
+
+    DoMoveTriAttack: ClassVar[Symbol[None, None]]
+
+    DoMoveSwapItems: ClassVar[Symbol[None, None]]
+
+    DoMoveTripleKick: ClassVar[Symbol[None, None]]
+
+    DoMoveSport: ClassVar[Symbol[None, None]]
+
+    DoMoveMudSlap: ClassVar[Symbol[None, None]]
+
+    DoMoveDamageStealItem: ClassVar[Symbol[None, None]]
+
+    DoMoveAmnesia: ClassVar[Symbol[None, None]]
+
+    DoMoveNightShade: ClassVar[Symbol[None, None]]
+
+    DoMoveGrowl: ClassVar[Symbol[None, None]]
+
+    DoMoveSurf: ClassVar[Symbol[None, None]]
+
+    DoMoveRolePlay: ClassVar[Symbol[None, None]]
+
+    DoMoveSunnyDay: ClassVar[Symbol[None, None]]
+
+    DoMoveLowerDefense1: ClassVar[Symbol[None, None]]
+
+    DoMoveWish: ClassVar[Symbol[None, None]]
+
+    DoMoveFakeOut: ClassVar[Symbol[None, None]]
+
+    DoMoveSleepTalk: ClassVar[Symbol[None, None]]
+
+    DoMovePayDay: ClassVar[Symbol[None, None]]
+
+    DoMoveAssist: ClassVar[Symbol[None, None]]
+
+    DoMoveRest: ClassVar[Symbol[None, None]]
+
+    DoMoveIngrain: ClassVar[Symbol[None, None]]
+
+    DoMoveSwallow: ClassVar[Symbol[None, None]]
+
+    DoMoveCurse: ClassVar[Symbol[None, None]]
+
+    DoMoveSuperpower: ClassVar[Symbol[None, None]]
+
+    DoMoveSteelWing: ClassVar[Symbol[None, None]]
+
+    DoMoveSpitUp: ClassVar[Symbol[None, None]]
+
+    DoMoveDynamicPunch: ClassVar[Symbol[None, None]]
+
+    DoMoveKnockOff: ClassVar[Symbol[None, None]]
+
+    DoMoveSplash: ClassVar[Symbol[None, None]]
+
+    DoMoveSetDamage: ClassVar[Symbol[None, None]]
+
+    DoMoveBellyDrum: ClassVar[Symbol[None, None]]
+
+    DoMoveLightScreen: ClassVar[Symbol[None, None]]
+
+    DoMoveSecretPower: ClassVar[Symbol[None, None]]
+
+    DoMoveDamageConfuse30: ClassVar[Symbol[None, None]]
+
+    DoMoveBulkUp: ClassVar[Symbol[None, None]]
+
+    DoMovePause: ClassVar[Symbol[None, None]]
+
+    DoMoveFeatherDance: ClassVar[Symbol[None, None]]
+
+    DoMoveBeatUp: ClassVar[Symbol[None, None]]
+
+    DoMoveBlastBurn: ClassVar[Symbol[None, None]]
+
+    DoMoveCrushClaw: ClassVar[Symbol[None, None]]
+
+    DoMoveBlazeKick: ClassVar[Symbol[None, None]]
+
+    DoMovePresent: ClassVar[Symbol[None, None]]
+
+    DoMoveEruption: ClassVar[Symbol[None, None]]
+
+    DoMoveTransform: ClassVar[Symbol[None, None]]
+
+    DoMovePoisonTail: ClassVar[Symbol[None, None]]
+
+    DoMoveBlowback: ClassVar[Symbol[None, None]]
+
+    DoMoveCamouflage: ClassVar[Symbol[None, None]]
+
+    DoMoveTailGlow: ClassVar[Symbol[None, None]]
+
+    DoMoveDamageConstrict10: ClassVar[Symbol[None, None]]
+
+    DoMovePerishSong: ClassVar[Symbol[None, None]]
+
+    DoMoveWrap: ClassVar[Symbol[None, None]]
+
+    DoMoveSpikes: ClassVar[Symbol[None, None]]
+
+    DoMoveMagnitude: ClassVar[Symbol[None, None]]
+
+    DoMoveMagicCoat: ClassVar[Symbol[None, None]]
+
+    DoMoveProtect: ClassVar[Symbol[None, None]]
+
+    DoMoveDefenseCurl: ClassVar[Symbol[None, None]]
+
+    DoMoveDecoy: ClassVar[Symbol[None, None]]
+
+    DoMoveMistBall: ClassVar[Symbol[None, None]]
+
+    DoMoveDestinyBond: ClassVar[Symbol[None, None]]
+
+    DoMoveMirrorCoat: ClassVar[Symbol[None, None]]
+
+    DoMoveCalmMind: ClassVar[Symbol[None, None]]
+
+    DoMoveHiddenPower: ClassVar[Symbol[None, None]]
+
+    DoMoveMetalClaw: ClassVar[Symbol[None, None]]
+
+    DoMoveAttract: ClassVar[Symbol[None, None]]
+
+    DoMoveCopycat: ClassVar[Symbol[None, None]]
+
+    DoMoveFrustration: ClassVar[Symbol[None, None]]
+
+    DoMoveLeechSeed: ClassVar[Symbol[None, None]]
+
+    DoMoveMetronome: ClassVar[Symbol[None, None]]
+
+    DoMoveDreamEater: ClassVar[Symbol[None, None]]
+
+    DoMoveSnatch: ClassVar[Symbol[None, None]]
+
+    DoMoveRecycle: ClassVar[Symbol[None, None]]
+
+    DoMoveReflect: ClassVar[Symbol[None, None]]
+
+    DoMoveDragonRage: ClassVar[Symbol[None, None]]
+
+    DoMoveDragonDance: ClassVar[Symbol[None, None]]
+
+    DoMoveSkullBash: ClassVar[Symbol[None, None]]
+
+    DoMoveDamageLowerSpecialDefense50: ClassVar[Symbol[None, None]]
+
+    DoMoveStruggle: ClassVar[Symbol[None, None]]
+
+    DoMoveRockSmash: ClassVar[Symbol[None, None]]
+
+    DoMoveSeeTrap: ClassVar[Symbol[None, None]]
+
+    DoMoveTakeaway: ClassVar[Symbol[None, None]]
+
+    DoMoveRebound: ClassVar[Symbol[None, None]]
+
+    DoMoveSwitchPositions: ClassVar[Symbol[None, None]]
+
+    DoMoveStayAway: ClassVar[Symbol[None, None]]
+
+    DoMoveCleanse: ClassVar[Symbol[None, None]]
+
+    DoMoveSiesta: ClassVar[Symbol[None, None]]
+
+    DoMoveTwoEdge: ClassVar[Symbol[None, None]]
+
+    DoMoveNoMove: ClassVar[Symbol[None, None]]
+
+    DoMoveScan: ClassVar[Symbol[None, None]]
+
+    DoMovePowerEars: ClassVar[Symbol[None, None]]
+
+    DoMoveTransfer: ClassVar[Symbol[None, None]]
+
+    DoMoveSlowDown: ClassVar[Symbol[None, None]]
+
+    DoMoveSearchlight: ClassVar[Symbol[None, None]]
+
+    DoMovePetrify: ClassVar[Symbol[None, None]]
+
+    DoMovePounce: ClassVar[Symbol[None, None]]
+
+    DoMoveTrawl: ClassVar[Symbol[None, None]]
+
+    DoMoveEscape: ClassVar[Symbol[None, None]]
+
+    DoMoveDrought: ClassVar[Symbol[None, None]]
+
+    DoMoveTrapBuster: ClassVar[Symbol[None, None]]
+
+    DoMoveWildCall: ClassVar[Symbol[None, None]]
+
+    DoMoveInvisify: ClassVar[Symbol[None, None]]
+
+    DoMoveOneShot: ClassVar[Symbol[None, None]]
+
+    DoMoveHpGauge: ClassVar[Symbol[None, None]]
+
+    DoMoveVacuumCut: ClassVar[Symbol[None, None]]
+
+    DoMoveReviver: ClassVar[Symbol[None, None]]
+
+    DoMoveShocker: ClassVar[Symbol[None, None]]
+
+    DoMoveEcho: ClassVar[Symbol[None, None]]
+
+    DoMoveFamish: ClassVar[Symbol[None, None]]
+
+    DoMoveOneRoom: ClassVar[Symbol[None, None]]
+
+    DoMoveFillIn: ClassVar[Symbol[None, None]]
+
+    DoMoveTrapper: ClassVar[Symbol[None, None]]
+
+    DoMoveItemize: ClassVar[Symbol[None, None]]
+
+    DoMoveHurl: ClassVar[Symbol[None, None]]
+
+    DoMoveMobile: ClassVar[Symbol[None, None]]
+
+    DoMoveSeeStairs: ClassVar[Symbol[None, None]]
+
+    DoMoveLongToss: ClassVar[Symbol[None, None]]
+
+    DoMovePierce: ClassVar[Symbol[None, None]]
+
+    DoMoveHammerArm: ClassVar[Symbol[None, None]]
+
+    DoMoveAquaRing: ClassVar[Symbol[None, None]]
+
+    DoMoveGastroAcid: ClassVar[Symbol[None, None]]
+
+    DoMoveHealingWish: ClassVar[Symbol[None, None]]
+
+    DoMoveCloseCombat: ClassVar[Symbol[None, None]]
+
+    DoMoveLuckyChant: ClassVar[Symbol[None, None]]
+
+    DoMoveGuardSwap: ClassVar[Symbol[None, None]]
+
+    DoMoveHealOrder: ClassVar[Symbol[None, None]]
+
+    DoMoveHealBlock: ClassVar[Symbol[None, None]]
+
+    DoMoveThunderFang: ClassVar[Symbol[None, None]]
+
+    DoMoveDefog: ClassVar[Symbol[None, None]]
+
+    DoMoveTrumpCard: ClassVar[Symbol[None, None]]
+
+    DoMoveIceFang: ClassVar[Symbol[None, None]]
+
+    DoMovePsychoShift: ClassVar[Symbol[None, None]]
+
+    DoMoveEmbargo: ClassVar[Symbol[None, None]]
+
+    DoMoveBrine: ClassVar[Symbol[None, None]]
+
+    DoMoveNaturalGift: ClassVar[Symbol[None, None]]
+
+    DoMoveGyroBall: ClassVar[Symbol[None, None]]
+
+    DoMoveShadowForce: ClassVar[Symbol[None, None]]
+
+    DoMoveGravity: ClassVar[Symbol[None, None]]
+
+    DoMoveStealthRock: ClassVar[Symbol[None, None]]
+
+    DoMoveChargeBeam: ClassVar[Symbol[None, None]]
+
+    DoMoveDamageEatItem: ClassVar[Symbol[None, None]]
+
+    DoMoveAcupressure: ClassVar[Symbol[None, None]]
+
+    DoMoveMagnetRise: ClassVar[Symbol[None, None]]
+
+    DoMoveToxicSpikes: ClassVar[Symbol[None, None]]
+
+    DoMoveLastResort: ClassVar[Symbol[None, None]]
+
+    DoMoveTrickRoom: ClassVar[Symbol[None, None]]
+
+    DoMoveWorrySeed: ClassVar[Symbol[None, None]]
+
+    DoMoveDamageHpDependent: ClassVar[Symbol[None, None]]
+
+    DoMoveHeartSwap: ClassVar[Symbol[None, None]]
+
+    DoMoveRoost: ClassVar[Symbol[None, None]]
+
+    DoMovePowerSwap: ClassVar[Symbol[None, None]]
+
+    DoMovePowerTrick: ClassVar[Symbol[None, None]]
+
+    DoMoveFeint: ClassVar[Symbol[None, None]]
+
+    DoMoveFlareBlitz: ClassVar[Symbol[None, None]]
+
+    DoMoveDefendOrder: ClassVar[Symbol[None, None]]
+
+    DoMoveFireFang: ClassVar[Symbol[None, None]]
+
+    DoMoveLunarDance: ClassVar[Symbol[None, None]]
+
+    DoMoveMiracleEye: ClassVar[Symbol[None, None]]
+
+    DoMoveWakeUpSlap: ClassVar[Symbol[None, None]]
+
+    DoMoveMetalBurst: ClassVar[Symbol[None, None]]
+
+    DoMoveHeadSmash: ClassVar[Symbol[None, None]]
+
+    DoMoveCaptivate: ClassVar[Symbol[None, None]]
+
+    DoMoveLeafStorm: ClassVar[Symbol[None, None]]
+
+    DoMoveDracoMeteor: ClassVar[Symbol[None, None]]
+
+    DoMoveRockPolish: ClassVar[Symbol[None, None]]
+
+    DoMoveNastyPlot: ClassVar[Symbol[None, None]]
+
+    DoMoveTag0x1AB: ClassVar[Symbol[None, None]]
+
+    DoMoveTag0x1A6: ClassVar[Symbol[None, None]]
+
+    DoMoveTag0x1A7: ClassVar[Symbol[None, None]]
+
+class JpItcmMove_effectsData(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    MAX_HP_CAP_MOVE_EFFECTS: ClassVar[Symbol[None, None]]
+
+    LUNAR_DANCE_PP_RESTORATION: ClassVar[Symbol[None, None]]
+
+class JpItcmMove_effectsSection(
+    Section,
+    name="move_effects",
+    description="Move effect handlers for individual moves, called by ExecuteMoveEffect (and also the Metronome and Nature Power tables).\n\nThis subregion contains only the move effect handlers themselves, and not necessarily all the utility functions used by the move effect handlers (such as the damage calculation functions). These supporting utilities are in the main overlay29 block.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmMove_effectsFunctions,
+    data=JpItcmMove_effectsData,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmMove_effectsFunctions]]
+    data: ClassVar[type[JpItcmMove_effectsData]]
+
+class JpItcmOverlay0Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay0Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    TOP_MENU_MUSIC_ID: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay0Section(
+    Section,
+    name="overlay0",
+    description="Likely contains supporting data and code related to the top menu.\n\nThis is loaded together with overlay 1 while in the top menu. Since it's in overlay group 2 (together with overlay 10, which is another 'data' overlay), this overlay probably plays a similar role. It mentions several files from the BACK folder that are known backgrounds for the top menu.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay0Functions,
+    data=JpItcmOverlay0Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay0Functions]]
+    data: ClassVar[type[JpItcmOverlay0Data]]
+
+class JpItcmOverlay1Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    CreateMainMenus: ClassVar[Symbol[None, None]]
+
+    AddMainMenuOption: ClassVar[Symbol[None, None]]
+
+    AddSubMenuOption: ClassVar[Symbol[None, None]]
+
+    ProcessContinueScreenContents: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay1Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    PRINTS_STRINGS: ClassVar[Symbol[None, None]]
+
+    PRINTS_STRUCT: ClassVar[Symbol[None, None]]
+
+    MAIN_MENU_WINDOW_PARAMS_1: ClassVar[Symbol[None, None]]
+
+    MAIN_MENU_WINDOW_PARAMS_2: ClassVar[Symbol[None, None]]
+
+    MAIN_MENU_WINDOW_PARAMS_3: ClassVar[Symbol[None, None]]
+
+    MAIN_MENU_WINDOW_PARAMS_4: ClassVar[Symbol[None, None]]
+
+    CONTINUE_CHOICE: ClassVar[Symbol[None, None]]
+
+    SUBMENU: ClassVar[Symbol[None, None]]
+
+    MAIN_MENU: ClassVar[Symbol[None, None]]
+
+    MAIN_MENU_WINDOW_PARAMS_5: ClassVar[Symbol[None, None]]
+
+    MAIN_MENU_WINDOW_PARAMS_6: ClassVar[Symbol[None, None]]
+
+    MAIN_MENU_WINDOW_PARAMS_7: ClassVar[Symbol[None, None]]
+
+    MAIN_MENU_ITEMS_CONFIRM: ClassVar[Symbol[None, None]]
+
+    MAIN_MENU_WINDOW_PARAMS_8: ClassVar[Symbol[None, None]]
+
+    MAIN_MENU_WINDOW_PARAMS_9: ClassVar[Symbol[None, None]]
+
+    MAIN_DEBUG_MENU_ITEMS_1: ClassVar[Symbol[None, None]]
+
+    MAIN_MENU_WINDOW_PARAMS_10: ClassVar[Symbol[None, None]]
+
+    MAIN_DEBUG_MENU_ITEMS_2: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay1Section(
+    Section,
+    name="overlay1",
+    description="Likely controls the top menu.\n\nThis is loaded together with overlay 0 while in the top menu. Since it's in overlay group 1 (together with other 'main' overlays like overlay 11 and overlay 29), this is probably the controller.\n\nSeems to contain code related to Wi-Fi rescue. It mentions several files from the GROUND and BACK folders.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay1Functions,
+    data=JpItcmOverlay1Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay1Functions]]
+    data: ClassVar[type[JpItcmOverlay1Data]]
+
+class JpItcmOverlay10Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    CreateInventoryMenu: ClassVar[Symbol[None, None]]
+
+    SetInventoryMenuState0: ClassVar[Symbol[None, None]]
+
+    SetInventoryMenuState6: ClassVar[Symbol[None, None]]
+
+    CloseInventoryMenu: ClassVar[Symbol[None, None]]
+
+    IsInventoryMenuActive: ClassVar[Symbol[None, None]]
+
+    CheckInventoryMenuField0x1A0: ClassVar[Symbol[None, None]]
+
+    PopInventoryMenuField0x1A3: ClassVar[Symbol[None, None]]
+
+    UpdateInventoryMenu: ClassVar[Symbol[None, None]]
+
+    IsInventoryMenuState3: ClassVar[Symbol[None, None]]
+
+    SprintfStatic: ClassVar[Symbol[None, None]]
+
+    GetEffectAnimationField0x19: ClassVar[Symbol[None, None]]
+
+    AnimationHasMoreFrames: ClassVar[Symbol[None, None]]
+
+    GetEffectAnimation: ClassVar[Symbol[None, None]]
+
+    GetMoveAnimation: ClassVar[Symbol[None, None]]
+
+    GetSpecialMonsterMoveAnimation: ClassVar[Symbol[None, None]]
+
+    GetTrapAnimation: ClassVar[Symbol[None, None]]
+
+    GetItemAnimation1: ClassVar[Symbol[None, None]]
+
+    GetItemAnimation2: ClassVar[Symbol[None, None]]
+
+    GetMoveAnimationSpeed: ClassVar[Symbol[None, None]]
+
+    DrawTeamStats: ClassVar[Symbol[None, None]]
+
+    UpdateTeamStats: ClassVar[Symbol[None, None]]
+
+    FreeTeamStats: ClassVar[Symbol[None, None]]
+
+    FreeMapAndTeam: ClassVar[Symbol[None, None]]
+
+    ProcessTeamStatsLvHp: ClassVar[Symbol[None, None]]
+
+    ProcessTeamStatsNameGender: ClassVar[Symbol[None, None]]
+
+    IsBackgroundTileset: ClassVar[Symbol[None, None]]
+
+    InitTilesetBuffer: ClassVar[Symbol[None, None]]
+
+    MainGame: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay10Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    INVENTORY_MENU_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[None, None]]
+
+    FIRST_DUNGEON_WITH_MONSTER_HOUSE_TRAPS: ClassVar[Symbol[None, None]]
+
+    BAD_POISON_DAMAGE_COOLDOWN: ClassVar[Symbol[None, None]]
+
+    PROTEIN_STAT_BOOST: ClassVar[Symbol[None, None]]
+
+    WATERFALL_CRINGE_CHANCE: ClassVar[Symbol[None, None]]
+
+    AURORA_BEAM_LOWER_ATTACK_CHANCE: ClassVar[Symbol[None, None]]
+
+    SPAWN_CAP_NO_MONSTER_HOUSE: ClassVar[Symbol[None, None]]
+
+    OREN_BERRY_DAMAGE: ClassVar[Symbol[None, None]]
+
+    IRON_TAIL_LOWER_DEFENSE_CHANCE: ClassVar[Symbol[None, None]]
+
+    TWINEEDLE_POISON_CHANCE: ClassVar[Symbol[None, None]]
+
+    EXTRASENSORY_CRINGE_CHANCE: ClassVar[Symbol[None, None]]
+
+    ROCK_SLIDE_CRINGE_CHANCE: ClassVar[Symbol[None, None]]
+
+    CRUNCH_LOWER_DEFENSE_CHANCE: ClassVar[Symbol[None, None]]
+
+    FOREWARN_FORCED_MISS_CHANCE: ClassVar[Symbol[None, None]]
+
+    UNOWN_STONE_DROP_CHANCE: ClassVar[Symbol[None, None]]
+
+    SITRUS_BERRY_HP_RESTORATION: ClassVar[Symbol[None, None]]
+
+    MUDDY_WATER_LOWER_ACCURACY_CHANCE: ClassVar[Symbol[None, None]]
+
+    SILVER_WIND_BOOST_CHANCE: ClassVar[Symbol[None, None]]
+
+    POISON_TAIL_POISON_CHANCE: ClassVar[Symbol[None, None]]
+
+    THUNDERSHOCK_PARALYZE_CHANCE: ClassVar[Symbol[None, None]]
+
+    BOUNCE_PARALYZE_CHANCE: ClassVar[Symbol[None, None]]
+
+    HEADBUTT_CRINGE_CHANCE: ClassVar[Symbol[None, None]]
+
+    FIRE_FANG_CRINGE_CHANCE: ClassVar[Symbol[None, None]]
+
+    SACRED_FIRE_BURN_CHANCE: ClassVar[Symbol[None, None]]
+
+    WHIRLPOOL_CONSTRICTION_CHANCE: ClassVar[Symbol[None, None]]
+
+    EXP_ELITE_EXP_BOOST: ClassVar[Symbol[None, None]]
+
+    MONSTER_HOUSE_MAX_NON_MONSTER_SPAWNS: ClassVar[Symbol[None, None]]
+
+    HEAL_ORDER_HP_RESTORATION: ClassVar[Symbol[None, None]]
+
+    STEEL_WING_BOOST_DEFENSE_CHANCE: ClassVar[Symbol[None, None]]
+
+    GOLD_THORN_POWER: ClassVar[Symbol[None, None]]
+
+    BURN_DAMAGE: ClassVar[Symbol[None, None]]
+
+    POISON_DAMAGE: ClassVar[Symbol[None, None]]
+
+    SPAWN_COOLDOWN: ClassVar[Symbol[None, None]]
+
+    MIST_BALL_LOWER_SPECIAL_ATTACK_CHANCE: ClassVar[Symbol[None, None]]
+
+    CHARGE_BEAM_BOOST_SPECIAL_ATTACK_CHANCE: ClassVar[Symbol[None, None]]
+
+    ORAN_BERRY_FULL_HP_BOOST: ClassVar[Symbol[None, None]]
+
+    LIFE_SEED_HP_BOOST: ClassVar[Symbol[None, None]]
+
+    OCTAZOOKA_LOWER_ACCURACY_CHANCE: ClassVar[Symbol[None, None]]
+
+    LUSTER_PURGE_LOWER_SPECIAL_DEFENSE_CHANCE: ClassVar[Symbol[None, None]]
+
+    SUPER_LUCK_CRIT_RATE_BOOST: ClassVar[Symbol[None, None]]
+
+    CONSTRICT_LOWER_SPEED_CHANCE: ClassVar[Symbol[None, None]]
+
+    ICE_FANG_FREEZE_CHANCE: ClassVar[Symbol[None, None]]
+
+    SMOG_POISON_CHANCE: ClassVar[Symbol[None, None]]
+
+    LICK_PARALYZE_CHANCE: ClassVar[Symbol[None, None]]
+
+    THUNDER_FANG_PARALYZE_CHANCE: ClassVar[Symbol[None, None]]
+
+    BITE_CRINGE_CHANCE: ClassVar[Symbol[None, None]]
+
+    SKY_ATTACK_CRINGE_CHANCE: ClassVar[Symbol[None, None]]
+
+    ICE_FANG_CRINGE_CHANCE: ClassVar[Symbol[None, None]]
+
+    BLAZE_KICK_BURN_CHANCE: ClassVar[Symbol[None, None]]
+
+    FLAMETHROWER_BURN_CHANCE: ClassVar[Symbol[None, None]]
+
+    DIZZY_PUNCH_CONFUSE_CHANCE: ClassVar[Symbol[None, None]]
+
+    SECRET_POWER_EFFECT_CHANCE: ClassVar[Symbol[None, None]]
+
+    METAL_CLAW_BOOST_ATTACK_CHANCE: ClassVar[Symbol[None, None]]
+
+    TECHNICIAN_MOVE_POWER_THRESHOLD: ClassVar[Symbol[None, None]]
+
+    SONICBOOM_FIXED_DAMAGE: ClassVar[Symbol[None, None]]
+
+    RAIN_ABILITY_BONUS_REGEN: ClassVar[Symbol[None, None]]
+
+    LEECH_SEED_HP_DRAIN: ClassVar[Symbol[None, None]]
+
+    EXCLUSIVE_ITEM_EXP_BOOST: ClassVar[Symbol[None, None]]
+
+    AFTERMATH_CHANCE: ClassVar[Symbol[None, None]]
+
+    SET_DAMAGE_STATUS_DAMAGE: ClassVar[Symbol[None, None]]
+
+    INTIMIDATOR_ACTIVATION_CHANCE: ClassVar[Symbol[None, None]]
+
+    TYPE_ADVANTAGE_MASTER_CRIT_RATE: ClassVar[Symbol[None, None]]
+
+    ORAN_BERRY_HP_RESTORATION: ClassVar[Symbol[None, None]]
+
+    SITRUS_BERRY_FULL_HP_BOOST: ClassVar[Symbol[None, None]]
+
+    SNORE_CRINGE_CHANCE: ClassVar[Symbol[None, None]]
+
+    METEOR_MASH_BOOST_ATTACK_CHANCE: ClassVar[Symbol[None, None]]
+
+    CRUSH_CLAW_LOWER_DEFENSE_CHANCE: ClassVar[Symbol[None, None]]
+
+    BURN_DAMAGE_COOLDOWN: ClassVar[Symbol[None, None]]
+
+    SHADOW_BALL_LOWER_SPECIAL_DEFENSE_CHANCE: ClassVar[Symbol[None, None]]
+
+    STICK_POWER: ClassVar[Symbol[None, None]]
+
+    BUBBLE_LOWER_SPEED_CHANCE: ClassVar[Symbol[None, None]]
+
+    ICE_BODY_BONUS_REGEN: ClassVar[Symbol[None, None]]
+
+    POWDER_SNOW_FREEZE_CHANCE: ClassVar[Symbol[None, None]]
+
+    POISON_STING_POISON_CHANCE: ClassVar[Symbol[None, None]]
+
+    SPAWN_COOLDOWN_THIEF_ALERT: ClassVar[Symbol[None, None]]
+
+    POISON_FANG_POISON_CHANCE: ClassVar[Symbol[None, None]]
+
+    WEATHER_MOVE_TURN_COUNT: ClassVar[Symbol[None, None]]
+
+    THUNDER_PARALYZE_CHANCE: ClassVar[Symbol[None, None]]
+
+    THUNDERBOLT_PARALYZE_CHANCE: ClassVar[Symbol[None, None]]
+
+    MONSTER_HOUSE_MAX_MONSTER_SPAWNS: ClassVar[Symbol[None, None]]
+
+    TWISTER_CRINGE_CHANCE: ClassVar[Symbol[None, None]]
+
+    SPEED_BOOST_TURNS: ClassVar[Symbol[None, None]]
+
+    FAKE_OUT_CRINGE_CHANCE: ClassVar[Symbol[None, None]]
+
+    THUNDER_FANG_CRINGE_CHANCE: ClassVar[Symbol[None, None]]
+
+    FLARE_BLITZ_BURN_CHANCE: ClassVar[Symbol[None, None]]
+
+    FLAME_WHEEL_BURN_CHANCE: ClassVar[Symbol[None, None]]
+
+    PSYBEAM_CONFUSE_CHANCE: ClassVar[Symbol[None, None]]
+
+    TRI_ATTACK_STATUS_CHANCE: ClassVar[Symbol[None, None]]
+
+    MIRACLE_CHEST_EXP_BOOST: ClassVar[Symbol[None, None]]
+
+    WONDER_CHEST_EXP_BOOST: ClassVar[Symbol[None, None]]
+
+    SPAWN_CAP_WITH_MONSTER_HOUSE: ClassVar[Symbol[None, None]]
+
+    POISON_DAMAGE_COOLDOWN: ClassVar[Symbol[None, None]]
+
+    LEECH_SEED_DAMAGE_COOLDOWN: ClassVar[Symbol[None, None]]
+
+    THROWN_ITEM_HIT_CHANCE: ClassVar[Symbol[None, None]]
+
+    GEO_PEBBLE_DAMAGE: ClassVar[Symbol[None, None]]
+
+    GRAVELEROCK_DAMAGE: ClassVar[Symbol[None, None]]
+
+    RARE_FOSSIL_DAMAGE: ClassVar[Symbol[None, None]]
+
+    GINSENG_CHANCE_3: ClassVar[Symbol[None, None]]
+
+    ZINC_STAT_BOOST: ClassVar[Symbol[None, None]]
+
+    IRON_STAT_BOOST: ClassVar[Symbol[None, None]]
+
+    CALCIUM_STAT_BOOST: ClassVar[Symbol[None, None]]
+
+    WISH_BONUS_REGEN: ClassVar[Symbol[None, None]]
+
+    DRAGON_RAGE_FIXED_DAMAGE: ClassVar[Symbol[None, None]]
+
+    CORSOLA_TWIG_POWER: ClassVar[Symbol[None, None]]
+
+    CACNEA_SPIKE_POWER: ClassVar[Symbol[None, None]]
+
+    GOLD_FANG_POWER: ClassVar[Symbol[None, None]]
+
+    SILVER_SPIKE_POWER: ClassVar[Symbol[None, None]]
+
+    IRON_THORN_POWER: ClassVar[Symbol[None, None]]
+
+    SCOPE_LENS_CRIT_RATE_BOOST: ClassVar[Symbol[None, None]]
+
+    HEALING_WISH_HP_RESTORATION: ClassVar[Symbol[None, None]]
+
+    ME_FIRST_MULTIPLIER: ClassVar[Symbol[None, None]]
+
+    FACADE_DAMAGE_MULTIPLIER: ClassVar[Symbol[None, None]]
+
+    IMPRISON_TURN_RANGE: ClassVar[Symbol[None, None]]
+
+    SLEEP_TURN_RANGE: ClassVar[Symbol[None, None]]
+
+    NIGHTMARE_TURN_RANGE: ClassVar[Symbol[None, None]]
+
+    BURN_DAMAGE_MULTIPLIER: ClassVar[Symbol[None, None]]
+
+    REST_TURN_RANGE: ClassVar[Symbol[None, None]]
+
+    MATCHUP_SUPER_EFFECTIVE_MULTIPLIER_ERRATIC_PLAYER: ClassVar[Symbol[None, None]]
+
+    MATCHUP_IMMUNE_MULTIPLIER: ClassVar[Symbol[None, None]]
+
+    SPORT_CONDITION_TURN_RANGE: ClassVar[Symbol[None, None]]
+
+    SURE_SHOT_TURN_RANGE: ClassVar[Symbol[None, None]]
+
+    DETECT_BAND_MOVE_ACCURACY_DROP: ClassVar[Symbol[None, None]]
+
+    TINTED_LENS_MULTIPLIER: ClassVar[Symbol[None, None]]
+
+    SMOKESCREEN_TURN_RANGE: ClassVar[Symbol[None, None]]
+
+    PERISH_SONG_TURN_RANGE: ClassVar[Symbol[None, None]]
+
+    SHADOW_FORCE_DAMAGE_MULTIPLIER: ClassVar[Symbol[None, None]]
+
+    DIG_DAMAGE_MULTIPLIER: ClassVar[Symbol[None, None]]
+
+    DIVE_DAMAGE_MULTIPLIER: ClassVar[Symbol[None, None]]
+
+    BOUNCE_DAMAGE_MULTIPLIER: ClassVar[Symbol[None, None]]
+
+    POWER_PITCHER_DAMAGE_MULTIPLIER: ClassVar[Symbol[None, None]]
+
+    QUICK_DODGER_MOVE_ACCURACY_DROP: ClassVar[Symbol[None, None]]
+
+    MATCHUP_NOT_VERY_EFFECTIVE_MULTIPLIER: ClassVar[Symbol[None, None]]
+
+    MATCHUP_SUPER_EFFECTIVE_MULTIPLIER: ClassVar[Symbol[None, None]]
+
+    MATCHUP_NEUTRAL_MULTIPLIER: ClassVar[Symbol[None, None]]
+
+    MATCHUP_IMMUNE_MULTIPLIER_ERRATIC_PLAYER: ClassVar[Symbol[None, None]]
+
+    MATCHUP_NOT_VERY_EFFECTIVE_MULTIPLIER_ERRATIC_PLAYER: ClassVar[Symbol[None, None]]
+
+    MATCHUP_NEUTRAL_MULTIPLIER_ERRATIC_PLAYER: ClassVar[Symbol[None, None]]
+
+    AIR_BLADE_DAMAGE_MULTIPLIER: ClassVar[Symbol[None, None]]
+
+    KECLEON_SHOP_BOOST_CHANCE_MULTIPLIER: ClassVar[Symbol[None, None]]
+
+    HIDDEN_STAIRS_SPAWN_CHANCE_MULTIPLIER: ClassVar[Symbol[None, None]]
+
+    YAWN_TURN_RANGE: ClassVar[Symbol[None, None]]
+
+    SPEED_BOOST_TURN_RANGE: ClassVar[Symbol[None, None]]
+
+    SOLARBEAM_DAMAGE_MULTIPLIER: ClassVar[Symbol[None, None]]
+
+    SKY_ATTACK_DAMAGE_MULTIPLIER: ClassVar[Symbol[None, None]]
+
+    RAZOR_WIND_DAMAGE_MULTIPLIER: ClassVar[Symbol[None, None]]
+
+    FOCUS_PUNCH_DAMAGE_MULTIPLIER: ClassVar[Symbol[None, None]]
+
+    SKULL_BASH_DAMAGE_MULTIPLIER: ClassVar[Symbol[None, None]]
+
+    FLY_DAMAGE_MULTIPLIER: ClassVar[Symbol[None, None]]
+
+    WEATHER_BALL_TYPE_TABLE: ClassVar[Symbol[None, None]]
+
+    LAST_RESORT_DAMAGE_MULT_TABLE: ClassVar[Symbol[None, None]]
+
+    SYNTHESIS_HP_RESTORATION_TABLE: ClassVar[Symbol[None, None]]
+
+    ROOST_HP_RESTORATION_TABLE: ClassVar[Symbol[None, None]]
+
+    MOONLIGHT_HP_RESTORATION_TABLE: ClassVar[Symbol[None, None]]
+
+    MORNING_SUN_HP_RESTORATION_TABLE: ClassVar[Symbol[None, None]]
+
+    REVERSAL_DAMAGE_MULT_TABLE: ClassVar[Symbol[None, None]]
+
+    WATER_SPOUT_DAMAGE_MULT_TABLE: ClassVar[Symbol[None, None]]
+
+    WRING_OUT_DAMAGE_MULT_TABLE: ClassVar[Symbol[None, None]]
+
+    ERUPTION_DAMAGE_MULT_TABLE: ClassVar[Symbol[None, None]]
+
+    WEATHER_BALL_DAMAGE_MULT_TABLE: ClassVar[Symbol[None, None]]
+
+    EAT_ITEM_EFFECT_IGNORE_LIST: ClassVar[Symbol[None, None]]
+
+    CASTFORM_WEATHER_ATTRIBUTE_TABLE: ClassVar[Symbol[None, None]]
+
+    BAD_POISON_DAMAGE_TABLE: ClassVar[Symbol[None, None]]
+
+    TYPE_MATCHUP_COMBINATOR_TABLE: ClassVar[Symbol[None, None]]
+
+    OFFENSIVE_STAT_STAGE_MULTIPLIERS: ClassVar[Symbol[None, None]]
+
+    DEFENSIVE_STAT_STAGE_MULTIPLIERS: ClassVar[Symbol[None, None]]
+
+    NATURE_POWER_TABLE: ClassVar[Symbol[None, None]]
+
+    APPLES_AND_BERRIES_ITEM_IDS: ClassVar[Symbol[None, None]]
+
+    RECRUITMENT_LEVEL_BOOST_TABLE: ClassVar[Symbol[None, None]]
+
+    NATURAL_GIFT_ITEM_TABLE: ClassVar[Symbol[None, None]]
+
+    RANDOM_MUSIC_ID_TABLE: ClassVar[Symbol[None, None]]
+
+    SHOP_ITEM_CHANCES: ClassVar[Symbol[None, None]]
+
+    MALE_ACCURACY_STAGE_MULTIPLIERS: ClassVar[Symbol[None, None]]
+
+    MALE_EVASION_STAGE_MULTIPLIERS: ClassVar[Symbol[None, None]]
+
+    FEMALE_ACCURACY_STAGE_MULTIPLIERS: ClassVar[Symbol[None, None]]
+
+    FEMALE_EVASION_STAGE_MULTIPLIERS: ClassVar[Symbol[None, None]]
+
+    MUSIC_ID_TABLE: ClassVar[Symbol[None, None]]
+
+    TYPE_MATCHUP_TABLE: ClassVar[Symbol[None, None]]
+
+    FIXED_ROOM_MONSTER_SPAWN_STATS_TABLE: ClassVar[Symbol[None, None]]
+
+    METRONOME_TABLE: ClassVar[Symbol[None, None]]
+
+    TILESET_PROPERTIES: ClassVar[Symbol[None, None]]
+
+    FIXED_ROOM_PROPERTIES_TABLE: ClassVar[Symbol[None, None]]
+
+    TRAP_ANIMATION_INFO: ClassVar[Symbol[None, None]]
+
+    ITEM_ANIMATION_INFO: ClassVar[Symbol[None, None]]
+
+    MOVE_ANIMATION_INFO: ClassVar[Symbol[None, None]]
+
+    EFFECT_ANIMATION_INFO: ClassVar[Symbol[None, None]]
+
+    SPECIAL_MONSTER_MOVE_ANIMATION_INFO: ClassVar[Symbol[None, None]]
+
+    DEFEAT_ITEM_LOSS_CHANCE: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay10Section(
+    Section,
+    name="overlay10",
+    description="Appears to be used both during ground mode and dungeon mode. With dungeon mode, whereas overlay 29 contains the main dungeon engine, this overlay seems to contain routines and data for dungeon mechanics.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay10Functions,
+    data=JpItcmOverlay10Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay10Functions]]
+    data: ClassVar[type[JpItcmOverlay10Data]]
+
+class JpItcmOverlay11Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    UnlockScriptingLock: ClassVar[Symbol[None, None]]
+
+    FuncThatCallsRunNextOpcode: ClassVar[Symbol[None, None]]
+
+    RunNextOpcode: ClassVar[Symbol[None, None]]
+
+    HandleUnlocks: ClassVar[Symbol[None, None]]
+
+    LoadFileFromRomVeneer: ClassVar[Symbol[None, None]]
+
+    SsbLoad2: ClassVar[Symbol[None, None]]
+
+    ScriptParamToInt: ClassVar[Symbol[None, None]]
+
+    ScriptParamToFixedPoint16: ClassVar[Symbol[None, None]]
+
+    StationLoadHanger: ClassVar[Symbol[None, None]]
+
+    ScriptStationLoadTalk: ClassVar[Symbol[None, None]]
+
+    SsbLoad1: ClassVar[Symbol[None, None]]
+
+    ScriptSpecialProcessCall: ClassVar[Symbol[None, None]]
+
+    GetCoroutineInfo: ClassVar[Symbol[None, None]]
+
+    GetSpecialRecruitmentSpecies: ClassVar[Symbol[None, None]]
+
+    PrepareMenuAcceptTeamMember: ClassVar[Symbol[None, None]]
+
+    InitRandomNpcJobs: ClassVar[Symbol[None, None]]
+
+    GetRandomNpcJobType: ClassVar[Symbol[None, None]]
+
+    GetRandomNpcJobSubtype: ClassVar[Symbol[None, None]]
+
+    GetRandomNpcJobStillAvailable: ClassVar[Symbol[None, None]]
+
+    AcceptRandomNpcJob: ClassVar[Symbol[None, None]]
+
+    GroundMainLoop: ClassVar[Symbol[None, None]]
+
+    GetAllocArenaGround: ClassVar[Symbol[None, None]]
+
+    GetFreeArenaGround: ClassVar[Symbol[None, None]]
+
+    GroundMainReturnDungeon: ClassVar[Symbol[None, None]]
+
+    GroundMainNextDay: ClassVar[Symbol[None, None]]
+
+    JumpToTitleScreen: ClassVar[Symbol[None, None]]
+
+    ReturnToTitleScreen: ClassVar[Symbol[None, None]]
+
+    ScriptSpecialProcess0x16: ClassVar[Symbol[None, None]]
+
+    IsScreenFadeInProgress: ClassVar[Symbol[None, None]]
+
+    LoadBackgroundAttributes: ClassVar[Symbol[None, None]]
+
+    LoadMapType10: ClassVar[Symbol[None, None]]
+
+    LoadMapType11: ClassVar[Symbol[None, None]]
+
+    GetSpecialLayoutBackground: ClassVar[Symbol[None, None]]
+
+    SetAnimDataFields: ClassVar[Symbol[None, None]]
+
+    SetAnimDataFieldsWrapper: ClassVar[Symbol[None, None]]
+
+    InitAnimDataFromOtherAnimData: ClassVar[Symbol[None, None]]
+
+    SetAnimDataFields2: ClassVar[Symbol[None, None]]
+
+    GetIdleAnimationType: ClassVar[Symbol[None, None]]
+
+    LoadObjectAnimData: ClassVar[Symbol[None, None]]
+
+    InitAnimDataFromOtherAnimDataVeneer: ClassVar[Symbol[None, None]]
+
+    AnimRelatedFunction: ClassVar[Symbol[None, None]]
+
+    AllocAndInitPartnerFollowDataAndLiveActorList: ClassVar[Symbol[None, None]]
+
+    InitPartnerFollowDataAndLiveActorList: ClassVar[Symbol[None, None]]
+
+    DeleteLiveActor: ClassVar[Symbol[None, None]]
+
+    ChangeActorAnimation: ClassVar[Symbol[None, None]]
+
+    InitPartnerFollowData: ClassVar[Symbol[None, None]]
+
+    GetDirectionLiveActor: ClassVar[Symbol[None, None]]
+
+    SetDirectionLiveActor: ClassVar[Symbol[None, None]]
+
+    CreateTeamInfoBox: ClassVar[Symbol[None, None]]
+
+    CloseTeamInfoBox: ClassVar[Symbol[None, None]]
+
+    IsTeamInfoBoxActive: ClassVar[Symbol[None, None]]
+
+    UpdateTeamInfoBox: ClassVar[Symbol[None, None]]
+
+    CreateTopGroundMenu: ClassVar[Symbol[None, None]]
+
+    CloseTopGroundMenu: ClassVar[Symbol[None, None]]
+
+    UpdateTopGroundMenu: ClassVar[Symbol[None, None]]
+
+    IsBagNotEmpty: ClassVar[Symbol[None, None]]
+
+    SprintfStatic: ClassVar[Symbol[None, None]]
+
+    GetExclusiveItemRequirements: ClassVar[Symbol[None, None]]
+
+    HandleControlsTopScreenGround: ClassVar[Symbol[None, None]]
+
+    GetDungeonMapPos: ClassVar[Symbol[None, None]]
+
+    WorldMapSetMode: ClassVar[Symbol[None, None]]
+
+    WorldMapSetCamera: ClassVar[Symbol[None, None]]
+
+    StatusUpdate: ClassVar[Symbol[None, None]]
+
+    HandleTeamStatsGround: ClassVar[Symbol[None, None]]
+
+    ProcessScriptParam: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay11Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    OVERLAY11_UNKNOWN_TABLE__NA_2316A38: ClassVar[Symbol[None, None]]
+
+    SCRIPT_COMMAND_PARSING_DATA: ClassVar[Symbol[None, None]]
+
+    SCRIPT_OP_CODE_NAMES: ClassVar[Symbol[None, None]]
+
+    SCRIPT_OP_CODES: ClassVar[Symbol[None, None]]
+
+    OVERLAY11_DEBUG_STRINGS: ClassVar[Symbol[None, None]]
+
+    C_ROUTINE_NAMES: ClassVar[Symbol[None, None]]
+
+    C_ROUTINES: ClassVar[Symbol[None, None]]
+
+    GROUND_WEATHER_TABLE: ClassVar[Symbol[None, None]]
+
+    GROUND_WAN_FILES_TABLE: ClassVar[Symbol[None, None]]
+
+    OBJECTS: ClassVar[Symbol[None, None]]
+
+    RECRUITMENT_TABLE_LOCATIONS: ClassVar[Symbol[None, None]]
+
+    RECRUITMENT_TABLE_LEVELS: ClassVar[Symbol[None, None]]
+
+    RECRUITMENT_TABLE_SPECIES: ClassVar[Symbol[None, None]]
+
+    LEVEL_TILEMAP_LIST: ClassVar[Symbol[None, None]]
+
+    SETANIMATION_TABLE: ClassVar[Symbol[None, None]]
+
+    TEAM_INFO_BOX_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[None, None]]
+
+    OVERLAY11_OVERLAY_LOAD_TABLE: ClassVar[Symbol[None, None]]
+
+    UNIONALL_RAM_ADDRESS: ClassVar[Symbol[None, None]]
+
+    GROUND_STATE_MAP: ClassVar[Symbol[None, None]]
+
+    GROUND_STATE_WEATHER: ClassVar[Symbol[None, None]]
+
+    GROUND_STATE_PTRS: ClassVar[Symbol[None, None]]
+
+    WORLD_MAP_MODE: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay11Section(
+    Section,
+    name="overlay11",
+    description="The script engine.\n\nThis is the 'main' overlay of ground mode. The script engine is what runs the ground mode scripts contained in the SCRIPT folder, which are written in a custom scripting language. These scripts encode things like cutscenes, screen transitions, ground mode events, and tons of other things related to ground mode.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay11Functions,
+    data=JpItcmOverlay11Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay11Functions]]
+    data: ClassVar[type[JpItcmOverlay11Data]]
+
+class JpItcmOverlay12Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay12Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay12Section(
+    Section,
+    name="overlay12",
+    description="Unused; all zeroes.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay12Functions,
+    data=JpItcmOverlay12Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay12Functions]]
+    data: ClassVar[type[JpItcmOverlay12Data]]
+
+class JpItcmOverlay13Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    EntryOverlay13: ClassVar[Symbol[None, None]]
+
+    ExitOverlay13: ClassVar[Symbol[None, None]]
+
+    Overlay13SwitchFunctionNa238A1C8: ClassVar[Symbol[None, None]]
+
+    Overlay13SwitchFunctionNa238A574: ClassVar[Symbol[None, None]]
+
+    GetPersonality: ClassVar[Symbol[None, None]]
+
+    GetOptionStringFromID: ClassVar[Symbol[None, None]]
+
+    WaitForNextStep: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay13Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    QUIZ_BORDER_COLOR_TABLE: ClassVar[Symbol[None, None]]
+
+    PORTRAIT_ATTRIBUTES: ClassVar[Symbol[None, None]]
+
+    QUIZ_MALE_FEMALE_BOOST_TABLE: ClassVar[Symbol[None, None]]
+
+    OVERLAY13_UNKNOWN_STRUCT__NA_238C024: ClassVar[Symbol[None, None]]
+
+    QUIZ_WINDOW_PARAMS_1: ClassVar[Symbol[None, None]]
+
+    QUIZ_WINDOW_PARAMS_2: ClassVar[Symbol[None, None]]
+
+    QUIZ_WINDOW_PARAMS_3: ClassVar[Symbol[None, None]]
+
+    QUIZ_WINDOW_PARAMS_4: ClassVar[Symbol[None, None]]
+
+    QUIZ_MENU_ITEMS_1: ClassVar[Symbol[None, None]]
+
+    STARTERS_PARTNER_IDS: ClassVar[Symbol[None, None]]
+
+    STARTERS_HERO_IDS: ClassVar[Symbol[None, None]]
+
+    STARTERS_TYPE_INCOMPATIBILITY_TABLE: ClassVar[Symbol[None, None]]
+
+    STARTERS_STRINGS: ClassVar[Symbol[None, None]]
+
+    QUIZ_QUESTION_STRINGS: ClassVar[Symbol[None, None]]
+
+    QUIZ_ANSWER_STRINGS: ClassVar[Symbol[None, None]]
+
+    QUIZ_ANSWER_POINTS: ClassVar[Symbol[None, None]]
+
+    OVERLAY13_RESERVED_SPACE: ClassVar[Symbol[None, None]]
+
+    OVERLAY13_UNKNOWN_POINTER__NA_238CEA0: ClassVar[Symbol[None, None]]
+
+    OVERLAY13_UNKNOWN_POINTER__NA_238CEA4: ClassVar[Symbol[None, None]]
+
+    OVERLAY13_UNKNOWN_POINTER__NA_238CEA8: ClassVar[Symbol[None, None]]
+
+    QUIZ_WINDOW_PARAMS_5: ClassVar[Symbol[None, None]]
+
+    QUIZ_WINDOW_PARAMS_6: ClassVar[Symbol[None, None]]
+
+    QUIZ_DEBUG_MENU_ITEMS: ClassVar[Symbol[None, None]]
+
+    OVERLAY13_UNKNOWN_STRUCT__NA_238CF14: ClassVar[Symbol[None, None]]
+
+    QUIZ_QUESTION_ANSWER_ASSOCIATIONS: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay13Section(
+    Section,
+    name="overlay13",
+    description="Controls the personality test, including the available partners and playable Pokémon. The actual personality test questions are stored in the MESSAGE folder.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay13Functions,
+    data=JpItcmOverlay13Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay13Functions]]
+    data: ClassVar[type[JpItcmOverlay13Data]]
+
+class JpItcmOverlay14Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    SentrySetupState: ClassVar[Symbol[None, None]]
+
+    SentryUpdateDisplay: ClassVar[Symbol[None, None]]
+
+    SentrySetExitingState: ClassVar[Symbol[None, None]]
+
+    SentryRunState: ClassVar[Symbol[None, None]]
+
+    SentrySetStateIntermediate: ClassVar[Symbol[None, None]]
+
+    SentryState0: ClassVar[Symbol[None, None]]
+
+    SentryState1: ClassVar[Symbol[None, None]]
+
+    SentryState2: ClassVar[Symbol[None, None]]
+
+    SentryState3: ClassVar[Symbol[None, None]]
+
+    SentryState4: ClassVar[Symbol[None, None]]
+
+    SentryStateExit: ClassVar[Symbol[None, None]]
+
+    SentryState6: ClassVar[Symbol[None, None]]
+
+    SentryState7: ClassVar[Symbol[None, None]]
+
+    SentryState8: ClassVar[Symbol[None, None]]
+
+    SentryState9: ClassVar[Symbol[None, None]]
+
+    SentryStateA: ClassVar[Symbol[None, None]]
+
+    SentryStateB: ClassVar[Symbol[None, None]]
+
+    SentryStateGenerateChoices: ClassVar[Symbol[None, None]]
+
+    SentryStateGetUserChoice: ClassVar[Symbol[None, None]]
+
+    SentryStateFinalizeRound: ClassVar[Symbol[None, None]]
+
+    SentryStateF: ClassVar[Symbol[None, None]]
+
+    SentryState10: ClassVar[Symbol[None, None]]
+
+    SentryState11: ClassVar[Symbol[None, None]]
+
+    SentryState12: ClassVar[Symbol[None, None]]
+
+    SentryState13: ClassVar[Symbol[None, None]]
+
+    SentryState14: ClassVar[Symbol[None, None]]
+
+    SentryState15: ClassVar[Symbol[None, None]]
+
+    SentryState16: ClassVar[Symbol[None, None]]
+
+    SentryState17: ClassVar[Symbol[None, None]]
+
+    SentryState18: ClassVar[Symbol[None, None]]
+
+    SentryState19: ClassVar[Symbol[None, None]]
+
+    SentryState1A: ClassVar[Symbol[None, None]]
+
+    SentryStateFinalizePoints: ClassVar[Symbol[None, None]]
+
+    SentryState1C: ClassVar[Symbol[None, None]]
+
+    SentryState1D: ClassVar[Symbol[None, None]]
+
+    SentryState1E: ClassVar[Symbol[None, None]]
+
+    SentryState1F: ClassVar[Symbol[None, None]]
+
+    SentryState20: ClassVar[Symbol[None, None]]
+
+    SentryState21: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay14Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    SENTRY_DUTY_STRUCT_SIZE: ClassVar[Symbol[None, None]]
+
+    SENTRY_LOUDRED_MONSTER_ID: ClassVar[Symbol[None, None]]
+
+    STRING_ID_SENTRY_TOP_SESSIONS: ClassVar[Symbol[None, None]]
+
+    STRING_ID_SENTRY_INSTRUCTIONS: ClassVar[Symbol[None, None]]
+
+    STRING_ID_SENTRY_HERE_COMES: ClassVar[Symbol[None, None]]
+
+    STRING_ID_SENTRY_WHOSE_FOOTPRINT: ClassVar[Symbol[None, None]]
+
+    STRING_ID_SENTRY_TRY_AGAIN: ClassVar[Symbol[None, None]]
+
+    STRING_ID_SENTRY_OUT_OF_TIME: ClassVar[Symbol[None, None]]
+
+    STRING_ID_SENTRY_FOOTPRINT_IS_6EE: ClassVar[Symbol[None, None]]
+
+    STRING_ID_SENTRY_COME_IN_6EF: ClassVar[Symbol[None, None]]
+
+    STRING_ID_SENTRY_WRONG: ClassVar[Symbol[None, None]]
+
+    STRING_ID_SENTRY_BUCK_UP: ClassVar[Symbol[None, None]]
+
+    STRING_ID_SENTRY_FOOTPRINT_IS_6EC: ClassVar[Symbol[None, None]]
+
+    STRING_ID_SENTRY_COME_IN_6ED: ClassVar[Symbol[None, None]]
+
+    STRING_ID_SENTRY_KEEP_YOU_WAITING: ClassVar[Symbol[None, None]]
+
+    STRING_ID_SENTRY_THATLL_DO_IT: ClassVar[Symbol[None, None]]
+
+    SENTRY_CHATOT_MONSTER_ID: ClassVar[Symbol[None, None]]
+
+    STRING_ID_SENTRY_NO_MORE_VISITORS: ClassVar[Symbol[None, None]]
+
+    STRING_ID_SENTRY_THATS_ALL: ClassVar[Symbol[None, None]]
+
+    SENTRY_GROVYLE_MONSTER_ID: ClassVar[Symbol[None, None]]
+
+    SENTRY_DEBUG_MENU_ITEMS: ClassVar[Symbol[None, None]]
+
+    SENTRY_DUTY_PTR: ClassVar[Symbol[None, None]]
+
+    SENTRY_DUTY_STATE_HANDLER_TABLE: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay14Section(
+    Section,
+    name="overlay14",
+    description="Runs the sentry duty minigame.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay14Functions,
+    data=JpItcmOverlay14Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay14Functions]]
+    data: ClassVar[type[JpItcmOverlay14Data]]
+
+class JpItcmOverlay15Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay15Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    BANK_MAIN_MENU_ITEMS: ClassVar[Symbol[None, None]]
+
+    BANK_WINDOW_PARAMS_1: ClassVar[Symbol[None, None]]
+
+    BANK_WINDOW_PARAMS_2: ClassVar[Symbol[None, None]]
+
+    BANK_WINDOW_PARAMS_3: ClassVar[Symbol[None, None]]
+
+    BANK_WINDOW_PARAMS_4: ClassVar[Symbol[None, None]]
+
+    BANK_WINDOW_PARAMS_5: ClassVar[Symbol[None, None]]
+
+    OVERLAY15_RESERVED_SPACE: ClassVar[Symbol[None, None]]
+
+    OVERLAY15_UNKNOWN_POINTER__NA_238B180: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay15Section(
+    Section,
+    name="overlay15",
+    description="Controls the Duskull Bank.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay15Functions,
+    data=JpItcmOverlay15Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay15Functions]]
+    data: ClassVar[type[JpItcmOverlay15Data]]
+
+class JpItcmOverlay16Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay16Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    EVO_MENU_ITEMS_CONFIRM: ClassVar[Symbol[None, None]]
+
+    EVO_SUBMENU_ITEMS: ClassVar[Symbol[None, None]]
+
+    EVO_MAIN_MENU_ITEMS: ClassVar[Symbol[None, None]]
+
+    EVO_MENU_STRING_IDS: ClassVar[Symbol[None, None]]
+
+    EVO_WINDOW_PARAMS_1: ClassVar[Symbol[None, None]]
+
+    EVO_WINDOW_PARAMS_2: ClassVar[Symbol[None, None]]
+
+    EVO_WINDOW_PARAMS_3: ClassVar[Symbol[None, None]]
+
+    EVO_WINDOW_PARAMS_4: ClassVar[Symbol[None, None]]
+
+    EVO_WINDOW_PARAMS_5: ClassVar[Symbol[None, None]]
+
+    EVO_WINDOW_PARAMS_6: ClassVar[Symbol[None, None]]
+
+    EVO_WINDOW_PARAMS_7: ClassVar[Symbol[None, None]]
+
+    OVERLAY16_RESERVED_SPACE: ClassVar[Symbol[None, None]]
+
+    OVERLAY16_UNKNOWN_POINTER__NA_238CE40: ClassVar[Symbol[None, None]]
+
+    OVERLAY16_UNKNOWN_POINTER__NA_238CE58: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay16Section(
+    Section,
+    name="overlay16",
+    description="Controls Luminous Spring.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay16Functions,
+    data=JpItcmOverlay16Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay16Functions]]
+    data: ClassVar[type[JpItcmOverlay16Data]]
+
+class JpItcmOverlay17Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay17Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    ASSEMBLY_WINDOW_PARAMS_1: ClassVar[Symbol[None, None]]
+
+    ASSEMBLY_WINDOW_PARAMS_2: ClassVar[Symbol[None, None]]
+
+    ASSEMBLY_WINDOW_PARAMS_3: ClassVar[Symbol[None, None]]
+
+    ASSEMBLY_WINDOW_PARAMS_4: ClassVar[Symbol[None, None]]
+
+    ASSEMBLY_WINDOW_PARAMS_5: ClassVar[Symbol[None, None]]
+
+    ASSEMBLY_MENU_ITEMS_CONFIRM: ClassVar[Symbol[None, None]]
+
+    ASSEMBLY_MAIN_MENU_ITEMS_1: ClassVar[Symbol[None, None]]
+
+    ASSEMBLY_MAIN_MENU_ITEMS_2: ClassVar[Symbol[None, None]]
+
+    ASSEMBLY_SUBMENU_ITEMS_1: ClassVar[Symbol[None, None]]
+
+    ASSEMBLY_SUBMENU_ITEMS_2: ClassVar[Symbol[None, None]]
+
+    ASSEMBLY_SUBMENU_ITEMS_3: ClassVar[Symbol[None, None]]
+
+    ASSEMBLY_SUBMENU_ITEMS_4: ClassVar[Symbol[None, None]]
+
+    ASSEMBLY_SUBMENU_ITEMS_5: ClassVar[Symbol[None, None]]
+
+    ASSEMBLY_SUBMENU_ITEMS_6: ClassVar[Symbol[None, None]]
+
+    ASSEMBLY_SUBMENU_ITEMS_7: ClassVar[Symbol[None, None]]
+
+    OVERLAY17_FUNCTION_POINTER_TABLE: ClassVar[Symbol[None, None]]
+
+    OVERLAY17_RESERVED_SPACE: ClassVar[Symbol[None, None]]
+
+    OVERLAY17_UNKNOWN_POINTER__NA_238BE00: ClassVar[Symbol[None, None]]
+
+    OVERLAY17_UNKNOWN_POINTER__NA_238BE04: ClassVar[Symbol[None, None]]
+
+    OVERLAY17_UNKNOWN_POINTER__NA_238BE08: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay17Section(
+    Section,
+    name="overlay17",
+    description="Controls the Chimecho Assembly.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay17Functions,
+    data=JpItcmOverlay17Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay17Functions]]
+    data: ClassVar[type[JpItcmOverlay17Data]]
+
+class JpItcmOverlay18Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay18Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    LINK_SHOP_WINDOW_PARAMS_1: ClassVar[Symbol[None, None]]
+
+    LINK_SHOP_WINDOW_PARAMS_2: ClassVar[Symbol[None, None]]
+
+    LINK_SHOP_WINDOW_PARAMS_3: ClassVar[Symbol[None, None]]
+
+    LINK_SHOP_WINDOW_PARAMS_4: ClassVar[Symbol[None, None]]
+
+    LINK_SHOP_WINDOW_PARAMS_5: ClassVar[Symbol[None, None]]
+
+    LINK_SHOP_WINDOW_PARAMS_6: ClassVar[Symbol[None, None]]
+
+    LINK_SHOP_WINDOW_PARAMS_7: ClassVar[Symbol[None, None]]
+
+    LINK_SHOP_WINDOW_PARAMS_8: ClassVar[Symbol[None, None]]
+
+    LINK_SHOP_WINDOW_PARAMS_9: ClassVar[Symbol[None, None]]
+
+    LINK_SHOP_WINDOW_PARAMS_10: ClassVar[Symbol[None, None]]
+
+    LINK_SHOP_WINDOW_PARAMS_11: ClassVar[Symbol[None, None]]
+
+    LINK_SHOP_MENU_ITEMS_CONFIRM: ClassVar[Symbol[None, None]]
+
+    LINK_SHOP_SUBMENU_ITEMS_1: ClassVar[Symbol[None, None]]
+
+    LINK_SHOP_SUBMENU_ITEMS_2: ClassVar[Symbol[None, None]]
+
+    LINK_SHOP_MAIN_MENU_ITEMS: ClassVar[Symbol[None, None]]
+
+    LINK_SHOP_SUBMENU_ITEMS_3: ClassVar[Symbol[None, None]]
+
+    LINK_SHOP_SUBMENU_ITEMS_4: ClassVar[Symbol[None, None]]
+
+    LINK_SHOP_SUBMENU_ITEMS_5: ClassVar[Symbol[None, None]]
+
+    LINK_SHOP_SUBMENU_ITEMS_6: ClassVar[Symbol[None, None]]
+
+    LINK_SHOP_SUBMENU_ITEMS_7: ClassVar[Symbol[None, None]]
+
+    OVERLAY18_FUNCTION_POINTER_TABLE: ClassVar[Symbol[None, None]]
+
+    OVERLAY18_RESERVED_SPACE: ClassVar[Symbol[None, None]]
+
+    OVERLAY18_UNKNOWN_POINTER__NA_238D620: ClassVar[Symbol[None, None]]
+
+    OVERLAY18_UNKNOWN_POINTER__NA_238D624: ClassVar[Symbol[None, None]]
+
+    OVERLAY18_UNKNOWN_POINTER__NA_238D628: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay18Section(
+    Section,
+    name="overlay18",
+    description="Controls the Electivire Link Shop.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay18Functions,
+    data=JpItcmOverlay18Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay18Functions]]
+    data: ClassVar[type[JpItcmOverlay18Data]]
+
+class JpItcmOverlay19Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    GetBarItem: ClassVar[Symbol[None, None]]
+
+    GetRecruitableMonsterAll: ClassVar[Symbol[None, None]]
+
+    GetRecruitableMonsterList: ClassVar[Symbol[None, None]]
+
+    GetRecruitableMonsterListRestricted: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay19Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    OVERLAY19_UNKNOWN_TABLE__NA_238DAE0: ClassVar[Symbol[None, None]]
+
+    BAR_UNLOCKABLE_DUNGEONS_TABLE: ClassVar[Symbol[None, None]]
+
+    BAR_RECRUITABLE_MONSTER_TABLE: ClassVar[Symbol[None, None]]
+
+    BAR_AVAILABLE_ITEMS: ClassVar[Symbol[None, None]]
+
+    OVERLAY19_UNKNOWN_STRING_IDS__NA_238E178: ClassVar[Symbol[None, None]]
+
+    OVERLAY19_UNKNOWN_STRUCT__NA_238E1A4: ClassVar[Symbol[None, None]]
+
+    OVERLAY19_UNKNOWN_STRING_IDS__NA_238E1CC: ClassVar[Symbol[None, None]]
+
+    BAR_WINDOW_PARAMS_1: ClassVar[Symbol[None, None]]
+
+    BAR_WINDOW_PARAMS_2: ClassVar[Symbol[None, None]]
+
+    BAR_WINDOW_PARAMS_3: ClassVar[Symbol[None, None]]
+
+    BAR_MENU_ITEMS_CONFIRM_1: ClassVar[Symbol[None, None]]
+
+    BAR_MENU_ITEMS_CONFIRM_2: ClassVar[Symbol[None, None]]
+
+    OVERLAY19_UNKNOWN_STRING_IDS__NA_238E238: ClassVar[Symbol[None, None]]
+
+    BAR_MAIN_MENU_ITEMS: ClassVar[Symbol[None, None]]
+
+    BAR_SUBMENU_ITEMS_1: ClassVar[Symbol[None, None]]
+
+    BAR_SUBMENU_ITEMS_2: ClassVar[Symbol[None, None]]
+
+    OVERLAY19_RESERVED_SPACE: ClassVar[Symbol[None, None]]
+
+    OVERLAY19_UNKNOWN_POINTER__NA_238E360: ClassVar[Symbol[None, None]]
+
+    OVERLAY19_UNKNOWN_POINTER__NA_238E364: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay19Section(
+    Section,
+    name="overlay19",
+    description="Controls Spinda's Juice Bar.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay19Functions,
+    data=JpItcmOverlay19Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay19Functions]]
+    data: ClassVar[type[JpItcmOverlay19Data]]
+
+class JpItcmOverlay2Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay2Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay2Section(
+    Section,
+    name="overlay2",
+    description="Controls the Nintendo WFC Settings interface, accessed from the top menu (Other > Nintendo WFC > Nintendo WFC Settings). Presumably contains code for Nintendo Wi-Fi setup.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay2Functions,
+    data=JpItcmOverlay2Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay2Functions]]
+    data: ClassVar[type[JpItcmOverlay2Data]]
+
+class JpItcmOverlay20Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay20Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    OVERLAY20_UNKNOWN_POINTER__NA_238CF7C: ClassVar[Symbol[None, None]]
+
+    RECYCLE_MENU_ITEMS_CONFIRM_1: ClassVar[Symbol[None, None]]
+
+    RECYCLE_MENU_ITEMS_CONFIRM_2: ClassVar[Symbol[None, None]]
+
+    RECYCLE_SUBMENU_ITEMS_1: ClassVar[Symbol[None, None]]
+
+    RECYCLE_SUBMENU_ITEMS_2: ClassVar[Symbol[None, None]]
+
+    RECYCLE_MAIN_MENU_ITEMS_1: ClassVar[Symbol[None, None]]
+
+    OVERLAY20_UNKNOWN_TABLE__NA_238D014: ClassVar[Symbol[None, None]]
+
+    RECYCLE_WINDOW_PARAMS_1: ClassVar[Symbol[None, None]]
+
+    RECYCLE_WINDOW_PARAMS_2: ClassVar[Symbol[None, None]]
+
+    RECYCLE_WINDOW_PARAMS_3: ClassVar[Symbol[None, None]]
+
+    RECYCLE_WINDOW_PARAMS_4: ClassVar[Symbol[None, None]]
+
+    RECYCLE_WINDOW_PARAMS_5: ClassVar[Symbol[None, None]]
+
+    RECYCLE_WINDOW_PARAMS_6: ClassVar[Symbol[None, None]]
+
+    RECYCLE_MAIN_MENU_ITEMS_2: ClassVar[Symbol[None, None]]
+
+    RECYCLE_WINDOW_PARAMS_7: ClassVar[Symbol[None, None]]
+
+    RECYCLE_WINDOW_PARAMS_8: ClassVar[Symbol[None, None]]
+
+    RECYCLE_WINDOW_PARAMS_9: ClassVar[Symbol[None, None]]
+
+    RECYCLE_WINDOW_PARAMS_10: ClassVar[Symbol[None, None]]
+
+    RECYCLE_WINDOW_PARAMS_11: ClassVar[Symbol[None, None]]
+
+    RECYCLE_MAIN_MENU_ITEMS_3: ClassVar[Symbol[None, None]]
+
+    OVERLAY20_RESERVED_SPACE: ClassVar[Symbol[None, None]]
+
+    OVERLAY20_UNKNOWN_POINTER__NA_238D120: ClassVar[Symbol[None, None]]
+
+    OVERLAY20_UNKNOWN_POINTER__NA_238D124: ClassVar[Symbol[None, None]]
+
+    OVERLAY20_UNKNOWN_POINTER__NA_238D128: ClassVar[Symbol[None, None]]
+
+    OVERLAY20_UNKNOWN_POINTER__NA_238D12C: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay20Section(
+    Section,
+    name="overlay20",
+    description="Controls the Recycle Shop.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay20Functions,
+    data=JpItcmOverlay20Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay20Functions]]
+    data: ClassVar[type[JpItcmOverlay20Data]]
+
+class JpItcmOverlay21Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay21Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    SWAP_SHOP_WINDOW_PARAMS_1: ClassVar[Symbol[None, None]]
+
+    SWAP_SHOP_MENU_ITEMS_CONFIRM: ClassVar[Symbol[None, None]]
+
+    SWAP_SHOP_SUBMENU_ITEMS_1: ClassVar[Symbol[None, None]]
+
+    SWAP_SHOP_SUBMENU_ITEMS_2: ClassVar[Symbol[None, None]]
+
+    SWAP_SHOP_MAIN_MENU_ITEMS_1: ClassVar[Symbol[None, None]]
+
+    SWAP_SHOP_MAIN_MENU_ITEMS_2: ClassVar[Symbol[None, None]]
+
+    SWAP_SHOP_SUBMENU_ITEMS_3: ClassVar[Symbol[None, None]]
+
+    OVERLAY21_UNKNOWN_STRING_IDS: ClassVar[Symbol[None, None]]
+
+    SWAP_SHOP_WINDOW_PARAMS_2: ClassVar[Symbol[None, None]]
+
+    SWAP_SHOP_WINDOW_PARAMS_3: ClassVar[Symbol[None, None]]
+
+    SWAP_SHOP_WINDOW_PARAMS_4: ClassVar[Symbol[None, None]]
+
+    SWAP_SHOP_WINDOW_PARAMS_5: ClassVar[Symbol[None, None]]
+
+    SWAP_SHOP_WINDOW_PARAMS_6: ClassVar[Symbol[None, None]]
+
+    SWAP_SHOP_WINDOW_PARAMS_7: ClassVar[Symbol[None, None]]
+
+    SWAP_SHOP_WINDOW_PARAMS_8: ClassVar[Symbol[None, None]]
+
+    SWAP_SHOP_WINDOW_PARAMS_9: ClassVar[Symbol[None, None]]
+
+    OVERLAY21_JP_STRING: ClassVar[Symbol[None, None]]
+
+    OVERLAY21_RESERVED_SPACE: ClassVar[Symbol[None, None]]
+
+    OVERLAY21_UNKNOWN_POINTER__NA_238CF40: ClassVar[Symbol[None, None]]
+
+    OVERLAY21_UNKNOWN_POINTER__NA_238CF44: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay21Section(
+    Section,
+    name="overlay21",
+    description="Controls the Croagunk Swap Shop.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay21Functions,
+    data=JpItcmOverlay21Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay21Functions]]
+    data: ClassVar[type[JpItcmOverlay21Data]]
+
+class JpItcmOverlay22Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay22Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    SHOP_WINDOW_PARAMS_1: ClassVar[Symbol[None, None]]
+
+    SHOP_WINDOW_PARAMS_2: ClassVar[Symbol[None, None]]
+
+    OVERLAY22_UNKNOWN_STRUCT__NA_238E85C: ClassVar[Symbol[None, None]]
+
+    SHOP_MENU_ITEMS_CONFIRM: ClassVar[Symbol[None, None]]
+
+    SHOP_MAIN_MENU_ITEMS_1: ClassVar[Symbol[None, None]]
+
+    SHOP_MAIN_MENU_ITEMS_2: ClassVar[Symbol[None, None]]
+
+    SHOP_MAIN_MENU_ITEMS_3: ClassVar[Symbol[None, None]]
+
+    OVERLAY22_UNKNOWN_STRING_IDS: ClassVar[Symbol[None, None]]
+
+    SHOP_WINDOW_PARAMS_3: ClassVar[Symbol[None, None]]
+
+    SHOP_WINDOW_PARAMS_4: ClassVar[Symbol[None, None]]
+
+    SHOP_WINDOW_PARAMS_5: ClassVar[Symbol[None, None]]
+
+    SHOP_WINDOW_PARAMS_6: ClassVar[Symbol[None, None]]
+
+    SHOP_WINDOW_PARAMS_7: ClassVar[Symbol[None, None]]
+
+    SHOP_WINDOW_PARAMS_8: ClassVar[Symbol[None, None]]
+
+    SHOP_WINDOW_PARAMS_9: ClassVar[Symbol[None, None]]
+
+    SHOP_WINDOW_PARAMS_10: ClassVar[Symbol[None, None]]
+
+    OVERLAY22_RESERVED_SPACE: ClassVar[Symbol[None, None]]
+
+    OVERLAY22_UNKNOWN_POINTER__NA_238EC60: ClassVar[Symbol[None, None]]
+
+    OVERLAY22_UNKNOWN_POINTER__NA_238EC64: ClassVar[Symbol[None, None]]
+
+    OVERLAY22_UNKNOWN_POINTER__NA_238EC68: ClassVar[Symbol[None, None]]
+
+    OVERLAY22_UNKNOWN_POINTER__NA_238EC6C: ClassVar[Symbol[None, None]]
+
+    OVERLAY22_UNKNOWN_POINTER__NA_238EC70: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay22Section(
+    Section,
+    name="overlay22",
+    description="Controls the Kecleon Shop in Treasure Town.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay22Functions,
+    data=JpItcmOverlay22Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay22Functions]]
+    data: ClassVar[type[JpItcmOverlay22Data]]
+
+class JpItcmOverlay23Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay23Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    OVERLAY23_UNKNOWN_VALUE__NA_238D2E8: ClassVar[Symbol[None, None]]
+
+    OVERLAY23_UNKNOWN_VALUE__NA_238D2EC: ClassVar[Symbol[None, None]]
+
+    OVERLAY23_UNKNOWN_STRUCT__NA_238D2F0: ClassVar[Symbol[None, None]]
+
+    STORAGE_MENU_ITEMS_CONFIRM: ClassVar[Symbol[None, None]]
+
+    STORAGE_MAIN_MENU_ITEMS_1: ClassVar[Symbol[None, None]]
+
+    STORAGE_MAIN_MENU_ITEMS_2: ClassVar[Symbol[None, None]]
+
+    STORAGE_MAIN_MENU_ITEMS_3: ClassVar[Symbol[None, None]]
+
+    STORAGE_MAIN_MENU_ITEMS_4: ClassVar[Symbol[None, None]]
+
+    OVERLAY23_UNKNOWN_STRING_IDS: ClassVar[Symbol[None, None]]
+
+    STORAGE_WINDOW_PARAMS_1: ClassVar[Symbol[None, None]]
+
+    STORAGE_WINDOW_PARAMS_2: ClassVar[Symbol[None, None]]
+
+    STORAGE_WINDOW_PARAMS_3: ClassVar[Symbol[None, None]]
+
+    STORAGE_WINDOW_PARAMS_4: ClassVar[Symbol[None, None]]
+
+    STORAGE_WINDOW_PARAMS_5: ClassVar[Symbol[None, None]]
+
+    STORAGE_WINDOW_PARAMS_6: ClassVar[Symbol[None, None]]
+
+    STORAGE_WINDOW_PARAMS_7: ClassVar[Symbol[None, None]]
+
+    STORAGE_WINDOW_PARAMS_8: ClassVar[Symbol[None, None]]
+
+    OVERLAY23_RESERVED_SPACE: ClassVar[Symbol[None, None]]
+
+    OVERLAY23_UNKNOWN_POINTER__NA_238D8A0: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay23Section(
+    Section,
+    name="overlay23",
+    description="Controls Kangaskhan Storage (both in Treasure Town and via Kangaskhan Rocks).",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay23Functions,
+    data=JpItcmOverlay23Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay23Functions]]
+    data: ClassVar[type[JpItcmOverlay23Data]]
+
+class JpItcmOverlay24Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay24Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    OVERLAY24_UNKNOWN_STRUCT__NA_238C508: ClassVar[Symbol[None, None]]
+
+    OVERLAY24_UNKNOWN_STRUCT__NA_238C514: ClassVar[Symbol[None, None]]
+
+    DAYCARE_MENU_ITEMS_CONFIRM: ClassVar[Symbol[None, None]]
+
+    DAYCARE_MAIN_MENU_ITEMS: ClassVar[Symbol[None, None]]
+
+    OVERLAY24_UNKNOWN_STRING_IDS: ClassVar[Symbol[None, None]]
+
+    DAYCARE_WINDOW_PARAMS_1: ClassVar[Symbol[None, None]]
+
+    DAYCARE_WINDOW_PARAMS_2: ClassVar[Symbol[None, None]]
+
+    DAYCARE_WINDOW_PARAMS_3: ClassVar[Symbol[None, None]]
+
+    DAYCARE_WINDOW_PARAMS_4: ClassVar[Symbol[None, None]]
+
+    DAYCARE_WINDOW_PARAMS_5: ClassVar[Symbol[None, None]]
+
+    OVERLAY24_RESERVED_SPACE: ClassVar[Symbol[None, None]]
+
+    OVERLAY24_UNKNOWN_POINTER__NA_238C600: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay24Section(
+    Section,
+    name="overlay24",
+    description="Controls the Chansey Day Care.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay24Functions,
+    data=JpItcmOverlay24Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay24Functions]]
+    data: ClassVar[type[JpItcmOverlay24Data]]
+
+class JpItcmOverlay25Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay25Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    OVERLAY25_UNKNOWN_STRUCT__NA_238B498: ClassVar[Symbol[None, None]]
+
+    APPRAISAL_WINDOW_PARAMS_1: ClassVar[Symbol[None, None]]
+
+    APPRAISAL_MENU_ITEMS_CONFIRM: ClassVar[Symbol[None, None]]
+
+    APPRAISAL_MAIN_MENU_ITEMS: ClassVar[Symbol[None, None]]
+
+    APPRAISAL_SUBMENU_ITEMS: ClassVar[Symbol[None, None]]
+
+    OVERLAY25_UNKNOWN_STRING_IDS: ClassVar[Symbol[None, None]]
+
+    APPRAISAL_WINDOW_PARAMS_2: ClassVar[Symbol[None, None]]
+
+    APPRAISAL_WINDOW_PARAMS_3: ClassVar[Symbol[None, None]]
+
+    APPRAISAL_WINDOW_PARAMS_4: ClassVar[Symbol[None, None]]
+
+    APPRAISAL_WINDOW_PARAMS_5: ClassVar[Symbol[None, None]]
+
+    APPRAISAL_WINDOW_PARAMS_6: ClassVar[Symbol[None, None]]
+
+    APPRAISAL_WINDOW_PARAMS_7: ClassVar[Symbol[None, None]]
+
+    APPRAISAL_WINDOW_PARAMS_8: ClassVar[Symbol[None, None]]
+
+    OVERLAY25_RESERVED_SPACE: ClassVar[Symbol[None, None]]
+
+    OVERLAY25_UNKNOWN_POINTER__NA_238B5E0: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay25Section(
+    Section,
+    name="overlay25",
+    description="Controls Xatu Appraisal.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay25Functions,
+    data=JpItcmOverlay25Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay25Functions]]
+    data: ClassVar[type[JpItcmOverlay25Data]]
+
+class JpItcmOverlay26Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay26Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    OVERLAY26_UNKNOWN_TABLE__NA_238AE20: ClassVar[Symbol[None, None]]
+
+    OVERLAY26_RESERVED_SPACE: ClassVar[Symbol[None, None]]
+
+    OVERLAY26_UNKNOWN_POINTER__NA_238AF60: ClassVar[Symbol[None, None]]
+
+    OVERLAY26_UNKNOWN_POINTER__NA_238AF64: ClassVar[Symbol[None, None]]
+
+    OVERLAY26_UNKNOWN_POINTER__NA_238AF68: ClassVar[Symbol[None, None]]
+
+    OVERLAY26_UNKNOWN_POINTER__NA_238AF6C: ClassVar[Symbol[None, None]]
+
+    OVERLAY26_UNKNOWN_POINTER5__NA_238AF70: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay26Section(
+    Section,
+    name="overlay26",
+    description="Related to mission completion. It's loaded when the dungeon completion summary is shown upon exiting a dungeon, and during the cutscenes where you collect mission rewards from clients.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay26Functions,
+    data=JpItcmOverlay26Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay26Functions]]
+    data: ClassVar[type[JpItcmOverlay26Data]]
+
+class JpItcmOverlay27Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay27Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    OVERLAY27_UNKNOWN_VALUE__NA_238C948: ClassVar[Symbol[None, None]]
+
+    OVERLAY27_UNKNOWN_VALUE__NA_238C94C: ClassVar[Symbol[None, None]]
+
+    OVERLAY27_UNKNOWN_STRUCT__NA_238C950: ClassVar[Symbol[None, None]]
+
+    DISCARD_ITEMS_MENU_ITEMS_CONFIRM: ClassVar[Symbol[None, None]]
+
+    DISCARD_ITEMS_SUBMENU_ITEMS_1: ClassVar[Symbol[None, None]]
+
+    DISCARD_ITEMS_SUBMENU_ITEMS_2: ClassVar[Symbol[None, None]]
+
+    DISCARD_ITEMS_MAIN_MENU_ITEMS: ClassVar[Symbol[None, None]]
+
+    OVERLAY27_UNKNOWN_STRING_IDS: ClassVar[Symbol[None, None]]
+
+    DISCARD_WINDOW_PARAMS_1: ClassVar[Symbol[None, None]]
+
+    DISCARD_WINDOW_PARAMS_2: ClassVar[Symbol[None, None]]
+
+    DISCARD_WINDOW_PARAMS_3: ClassVar[Symbol[None, None]]
+
+    DISCARD_WINDOW_PARAMS_4: ClassVar[Symbol[None, None]]
+
+    DISCARD_WINDOW_PARAMS_5: ClassVar[Symbol[None, None]]
+
+    DISCARD_WINDOW_PARAMS_6: ClassVar[Symbol[None, None]]
+
+    DISCARD_WINDOW_PARAMS_7: ClassVar[Symbol[None, None]]
+
+    DISCARD_WINDOW_PARAMS_8: ClassVar[Symbol[None, None]]
+
+    OVERLAY27_RESERVED_SPACE: ClassVar[Symbol[None, None]]
+
+    OVERLAY27_UNKNOWN_POINTER__NA_238CE80: ClassVar[Symbol[None, None]]
+
+    OVERLAY27_UNKNOWN_POINTER__NA_238CE84: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay27Section(
+    Section,
+    name="overlay27",
+    description="Controls the special episode item discard menu.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay27Functions,
+    data=JpItcmOverlay27Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay27Functions]]
+    data: ClassVar[type[JpItcmOverlay27Data]]
+
+class JpItcmOverlay28Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay28Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay28Section(
+    Section,
+    name="overlay28",
+    description="Controls the staff credits sequence.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay28Functions,
+    data=JpItcmOverlay28Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay28Functions]]
+    data: ClassVar[type[JpItcmOverlay28Data]]
+
+class JpItcmOverlay29Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    GetWeatherColorTable: ClassVar[Symbol[None, None]]
+
+    DungeonAlloc: ClassVar[Symbol[None, None]]
+
+    GetDungeonPtrMaster: ClassVar[Symbol[None, None]]
+
+    DungeonZInit: ClassVar[Symbol[None, None]]
+
+    DungeonFree: ClassVar[Symbol[None, None]]
+
+    RunDungeon: ClassVar[Symbol[None, None]]
+
+    EntityIsValid: ClassVar[Symbol[None, None]]
+
+    GetFloorType: ClassVar[Symbol[None, None]]
+
+    TryForcedLoss: ClassVar[Symbol[None, None]]
+
+    IsBossFight: ClassVar[Symbol[None, None]]
+
+    IsCurrentFixedRoomBossFight: ClassVar[Symbol[None, None]]
+
+    IsMarowakTrainingMaze: ClassVar[Symbol[None, None]]
+
+    FixedRoomIsSubstituteRoom: ClassVar[Symbol[None, None]]
+
+    StoryRestrictionsEnabled: ClassVar[Symbol[None, None]]
+
+    GetScenarioBalanceVeneer: ClassVar[Symbol[None, None]]
+
+    FadeToBlack: ClassVar[Symbol[None, None]]
+
+    CheckTouchscreenArea: ClassVar[Symbol[None, None]]
+
+    GetTrapInfo: ClassVar[Symbol[None, None]]
+
+    GetItemInfo: ClassVar[Symbol[None, None]]
+
+    GetTileAtEntity: ClassVar[Symbol[None, None]]
+
+    UpdateEntityPixelPos: ClassVar[Symbol[None, None]]
+
+    SetEntityPixelPosXY: ClassVar[Symbol[None, None]]
+
+    IncrementEntityPixelPosXY: ClassVar[Symbol[None, None]]
+
+    CreateEnemyEntity: ClassVar[Symbol[None, None]]
+
+    SpawnTrap: ClassVar[Symbol[None, None]]
+
+    SpawnItemEntity: ClassVar[Symbol[None, None]]
+
+    ShouldMinimapDisplayEntity: ClassVar[Symbol[None, None]]
+
+    ShouldDisplayEntity: ClassVar[Symbol[None, None]]
+
+    ShouldDisplayEntityWrapper: ClassVar[Symbol[None, None]]
+
+    CanSeeTarget: ClassVar[Symbol[None, None]]
+
+    CanTargetEntity: ClassVar[Symbol[None, None]]
+
+    CanTargetPosition: ClassVar[Symbol[None, None]]
+
+    PopulateActiveMonsterPtrs: ClassVar[Symbol[None, None]]
+
+    GetTeamMemberIndex: ClassVar[Symbol[None, None]]
+
+    SubstitutePlaceholderStringTags: ClassVar[Symbol[None, None]]
+
+    UpdateMapSurveyorFlag: ClassVar[Symbol[None, None]]
+
+    PointCameraToMonster: ClassVar[Symbol[None, None]]
+
+    UpdateCamera: ClassVar[Symbol[None, None]]
+
+    ItemIsActive: ClassVar[Symbol[None, None]]
+
+    GetVisibilityRange: ClassVar[Symbol[None, None]]
+
+    RevealWholeFloor: ClassVar[Symbol[None, None]]
+
+    PlayEffectAnimationEntity: ClassVar[Symbol[None, None]]
+
+    PlayEffectAnimationPos: ClassVar[Symbol[None, None]]
+
+    PlayEffectAnimationPixelPos: ClassVar[Symbol[None, None]]
+
+    AnimationDelayOrSomething: ClassVar[Symbol[None, None]]
+
+    UpdateStatusIconFlags: ClassVar[Symbol[None, None]]
+
+    PlayEffectAnimation0x171Full: ClassVar[Symbol[None, None]]
+
+    PlayEffectAnimation0x171: ClassVar[Symbol[None, None]]
+
+    ShowPpRestoreEffect: ClassVar[Symbol[None, None]]
+
+    ShouldDisplayEntityAdvanced: ClassVar[Symbol[None, None]]
+
+    PlayEffectAnimation0x1A9: ClassVar[Symbol[None, None]]
+
+    PlayEffectAnimation0x18E: ClassVar[Symbol[None, None]]
+
+    LoadMappaFileAttributes: ClassVar[Symbol[None, None]]
+
+    GetItemIdToSpawn: ClassVar[Symbol[None, None]]
+
+    CopySpawnEntriesMaster: ClassVar[Symbol[None, None]]
+
+    MonsterSpawnListPartialCopy: ClassVar[Symbol[None, None]]
+
+    IsOnMonsterSpawnList: ClassVar[Symbol[None, None]]
+
+    GetMonsterIdToSpawn: ClassVar[Symbol[None, None]]
+
+    GetMonsterLevelToSpawn: ClassVar[Symbol[None, None]]
+
+    AllocTopScreenStatus: ClassVar[Symbol[None, None]]
+
+    FreeTopScreenStatus: ClassVar[Symbol[None, None]]
+
+    InitializeTeamStats: ClassVar[Symbol[None, None]]
+
+    UpdateTeamStatsWrapper: ClassVar[Symbol[None, None]]
+
+    FreeTeamStatsWrapper: ClassVar[Symbol[None, None]]
+
+    AssignTopScreenHandlers: ClassVar[Symbol[None, None]]
+
+    HandleTopScreenFades: ClassVar[Symbol[None, None]]
+
+    FreeTopScreen: ClassVar[Symbol[None, None]]
+
+    GetDirectionTowardsPosition: ClassVar[Symbol[None, None]]
+
+    GetChebyshevDistance: ClassVar[Symbol[None, None]]
+
+    IsPositionActuallyInSight: ClassVar[Symbol[None, None]]
+
+    IsPositionInSight: ClassVar[Symbol[None, None]]
+
+    GetLeader: ClassVar[Symbol[None, None]]
+
+    GetLeaderMonster: ClassVar[Symbol[None, None]]
+
+    GetRandomTile: ClassVar[Symbol[None, None]]
+
+    FindNearbyUnoccupiedTile: ClassVar[Symbol[None, None]]
+
+    FindClosestUnoccupiedTileWithin2: ClassVar[Symbol[None, None]]
+
+    FindFarthestUnoccupiedTileWithin2: ClassVar[Symbol[None, None]]
+
+    FindUnoccupiedTileWithin3: ClassVar[Symbol[None, None]]
+
+    TickStatusTurnCounter: ClassVar[Symbol[None, None]]
+
+    AdvanceFrame: ClassVar[Symbol[None, None]]
+
+    DisplayAnimatedNumbers: ClassVar[Symbol[None, None]]
+
+    SetDungeonRngPreseed23Bit: ClassVar[Symbol[None, None]]
+
+    GenerateDungeonRngSeed: ClassVar[Symbol[None, None]]
+
+    GetDungeonRngPreseed: ClassVar[Symbol[None, None]]
+
+    SetDungeonRngPreseed: ClassVar[Symbol[None, None]]
+
+    InitDungeonRng: ClassVar[Symbol[None, None]]
+
+    DungeonRand16Bit: ClassVar[Symbol[None, None]]
+
+    DungeonRandInt: ClassVar[Symbol[None, None]]
+
+    DungeonRandRange: ClassVar[Symbol[None, None]]
+
+    DungeonRandOutcome: ClassVar[Symbol[None, None]]
+
+    CalcStatusDuration: ClassVar[Symbol[None, None]]
+
+    DungeonRngUnsetSecondary: ClassVar[Symbol[None, None]]
+
+    DungeonRngSetSecondary: ClassVar[Symbol[None, None]]
+
+    DungeonRngSetPrimary: ClassVar[Symbol[None, None]]
+
+    MusicTableIdxToMusicId: ClassVar[Symbol[None, None]]
+
+    ChangeDungeonMusic: ClassVar[Symbol[None, None]]
+
+    TrySwitchPlace: ClassVar[Symbol[None, None]]
+
+    SetLeaderActionFields: ClassVar[Symbol[None, None]]
+
+    ClearMonsterActionFields: ClassVar[Symbol[None, None]]
+
+    SetMonsterActionFields: ClassVar[Symbol[None, None]]
+
+    SetActionPassTurnOrWalk: ClassVar[Symbol[None, None]]
+
+    GetItemToUseByIndex: ClassVar[Symbol[None, None]]
+
+    GetItemToUse: ClassVar[Symbol[None, None]]
+
+    GetItemAction: ClassVar[Symbol[None, None]]
+
+    RemoveUsedItem: ClassVar[Symbol[None, None]]
+
+    AddDungeonSubMenuOption: ClassVar[Symbol[None, None]]
+
+    DisableDungeonSubMenuOption: ClassVar[Symbol[None, None]]
+
+    SetActionRegularAttack: ClassVar[Symbol[None, None]]
+
+    SetActionUseMovePlayer: ClassVar[Symbol[None, None]]
+
+    SetActionUseMoveAi: ClassVar[Symbol[None, None]]
+
+    RunFractionalTurn: ClassVar[Symbol[None, None]]
+
+    RunLeaderTurn: ClassVar[Symbol[None, None]]
+
+    TrySpawnMonsterAndActivatePlusMinus: ClassVar[Symbol[None, None]]
+
+    IsFloorOver: ClassVar[Symbol[None, None]]
+
+    DecrementWindCounter: ClassVar[Symbol[None, None]]
+
+    IsDungeonEndReasonFailure: ClassVar[Symbol[None, None]]
+
+    SetForcedLossReason: ClassVar[Symbol[None, None]]
+
+    GetForcedLossReason: ClassVar[Symbol[None, None]]
+
+    BindTrapToTile: ClassVar[Symbol[None, None]]
+
+    AreLateGameTrapsEnabledWrapper: ClassVar[Symbol[None, None]]
+
+    SpawnEnemyTrapAtPos: ClassVar[Symbol[None, None]]
+
+    PrepareTrapperTrap: ClassVar[Symbol[None, None]]
+
+    TrySpawnTrap: ClassVar[Symbol[None, None]]
+
+    TrySpawnTrapperTrap: ClassVar[Symbol[None, None]]
+
+    TryRemoveTrap: ClassVar[Symbol[None, None]]
+
+    TryTriggerTrap: ClassVar[Symbol[None, None]]
+
+    ApplyMudTrapEffect: ClassVar[Symbol[None, None]]
+
+    ApplyStickyTrapEffect: ClassVar[Symbol[None, None]]
+
+    ApplyGrimyTrapEffect: ClassVar[Symbol[None, None]]
+
+    ApplyPitfallTrapEffect: ClassVar[Symbol[None, None]]
+
+    ApplySummonTrapEffect: ClassVar[Symbol[None, None]]
+
+    ApplyPpZeroTrapEffect: ClassVar[Symbol[None, None]]
+
+    ApplyPokemonTrapEffect: ClassVar[Symbol[None, None]]
+
+    ApplyTripTrapEffect: ClassVar[Symbol[None, None]]
+
+    ApplyStealthRockTrapEffect: ClassVar[Symbol[None, None]]
+
+    ApplyToxicSpikesTrapEffect: ClassVar[Symbol[None, None]]
+
+    ApplyRandomTrapEffect: ClassVar[Symbol[None, None]]
+
+    ApplyGrudgeTrapEffect: ClassVar[Symbol[None, None]]
+
+    ApplyTrapEffect: ClassVar[Symbol[None, None]]
+
+    RevealTrapsNearby: ClassVar[Symbol[None, None]]
+
+    ShouldRunMonsterAi: ClassVar[Symbol[None, None]]
+
+    DebugRecruitingEnabled: ClassVar[Symbol[None, None]]
+
+    TryActivateIqBooster: ClassVar[Symbol[None, None]]
+
+    IsSecretBazaarNpcBehavior: ClassVar[Symbol[None, None]]
+
+    GetLeaderAction: ClassVar[Symbol[None, None]]
+
+    GetEntityTouchscreenArea: ClassVar[Symbol[None, None]]
+
+    SetLeaderAction: ClassVar[Symbol[None, None]]
+
+    ShouldLeaderKeepRunning: ClassVar[Symbol[None, None]]
+
+    CheckLeaderTile: ClassVar[Symbol[None, None]]
+
+    ChangeLeader: ClassVar[Symbol[None, None]]
+
+    UseSingleUseItemWrapper: ClassVar[Symbol[None, None]]
+
+    UseSingleUseItem: ClassVar[Symbol[None, None]]
+
+    UseThrowableItem: ClassVar[Symbol[None, None]]
+
+    ResetDamageData: ClassVar[Symbol[None, None]]
+
+    FreeLoadedAttackSpriteAndMore: ClassVar[Symbol[None, None]]
+
+    SetAndLoadCurrentAttackAnimation: ClassVar[Symbol[None, None]]
+
+    ClearLoadedAttackSprite: ClassVar[Symbol[None, None]]
+
+    GetLoadedAttackSpriteId: ClassVar[Symbol[None, None]]
+
+    DungeonGetTotalSpriteFileSize: ClassVar[Symbol[None, None]]
+
+    DungeonGetSpriteIndex: ClassVar[Symbol[None, None]]
+
+    JoinedAtRangeCheck2Veneer: ClassVar[Symbol[None, None]]
+
+    FloorNumberIsEven: ClassVar[Symbol[None, None]]
+
+    GetKecleonIdToSpawnByFloor: ClassVar[Symbol[None, None]]
+
+    StoreSpriteFileIndexBothGenders: ClassVar[Symbol[None, None]]
+
+    LoadMonsterSpriteInner: ClassVar[Symbol[None, None]]
+
+    SwapMonsterWanFileIndex: ClassVar[Symbol[None, None]]
+
+    LoadMonsterSprite: ClassVar[Symbol[None, None]]
+
+    DeleteMonsterSpriteFile: ClassVar[Symbol[None, None]]
+
+    DeleteAllMonsterSpriteFiles: ClassVar[Symbol[None, None]]
+
+    EuFaintCheck: ClassVar[Symbol[None, None]]
+
+    HandleFaint: ClassVar[Symbol[None, None]]
+
+    MoveMonsterToPos: ClassVar[Symbol[None, None]]
+
+    CreateMonsterSummaryFromMonster: ClassVar[Symbol[None, None]]
+
+    UpdateAiTargetPos: ClassVar[Symbol[None, None]]
+
+    SetMonsterTypeAndAbility: ClassVar[Symbol[None, None]]
+
+    TryActivateSlowStart: ClassVar[Symbol[None, None]]
+
+    TryActivateArtificialWeatherAbilities: ClassVar[Symbol[None, None]]
+
+    GetMonsterApparentId: ClassVar[Symbol[None, None]]
+
+    TryActivateTraceAndColorChange: ClassVar[Symbol[None, None]]
+
+    DefenderAbilityIsActive: ClassVar[Symbol[None, None]]
+
+    IsMonster: ClassVar[Symbol[None, None]]
+
+    TryActivateConversion2: ClassVar[Symbol[None, None]]
+
+    TryActivateTruant: ClassVar[Symbol[None, None]]
+
+    TryPointCameraToMonster: ClassVar[Symbol[None, None]]
+
+    ReevaluateSnatchMonster: ClassVar[Symbol[None, None]]
+
+    GetRandomExplorerMazeMonster: ClassVar[Symbol[None, None]]
+
+    RestorePpAllMovesSetFlags: ClassVar[Symbol[None, None]]
+
+    CheckTeamMemberIdxVeneer: ClassVar[Symbol[None, None]]
+
+    IsMonsterIdInNormalRangeVeneer: ClassVar[Symbol[None, None]]
+
+    BoostIQ: ClassVar[Symbol[None, None]]
+
+    ShouldMonsterHeadToStairs: ClassVar[Symbol[None, None]]
+
+    MewSpawnCheck: ClassVar[Symbol[None, None]]
+
+    TryEndStatusWithAbility: ClassVar[Symbol[None, None]]
+
+    ExclusiveItemEffectIsActive: ClassVar[Symbol[None, None]]
+
+    GetTeamMemberWithIqSkill: ClassVar[Symbol[None, None]]
+
+    TeamMemberHasEnabledIqSkill: ClassVar[Symbol[None, None]]
+
+    TeamLeaderIqSkillIsEnabled: ClassVar[Symbol[None, None]]
+
+    CountMovesOutOfPp: ClassVar[Symbol[None, None]]
+
+    HasSuperEffectiveMoveAgainstUser: ClassVar[Symbol[None, None]]
+
+    TryEatItem: ClassVar[Symbol[None, None]]
+
+    SetDecoyAiTracker: ClassVar[Symbol[None, None]]
+
+    CheckSpawnThreshold: ClassVar[Symbol[None, None]]
+
+    HasLowHealth: ClassVar[Symbol[None, None]]
+
+    AreEntitiesAdjacent: ClassVar[Symbol[None, None]]
+
+    IsSpecialStoryAlly: ClassVar[Symbol[None, None]]
+
+    IsExperienceLocked: ClassVar[Symbol[None, None]]
+
+    InitOtherMonsterData: ClassVar[Symbol[None, None]]
+
+    InitEnemySpawnStats: ClassVar[Symbol[None, None]]
+
+    InitEnemyStatsAndMoves: ClassVar[Symbol[None, None]]
+
+    SpawnTeam: ClassVar[Symbol[None, None]]
+
+    SpawnInitialMonsters: ClassVar[Symbol[None, None]]
+
+    SpawnMonster: ClassVar[Symbol[None, None]]
+
+    InitTeamMember: ClassVar[Symbol[None, None]]
+
+    InitMonster: ClassVar[Symbol[None, None]]
+
+    SubInitMonster: ClassVar[Symbol[None, None]]
+
+    MarkShopkeeperSpawn: ClassVar[Symbol[None, None]]
+
+    SpawnShopkeepers: ClassVar[Symbol[None, None]]
+
+    GetMaxHpAtLevel: ClassVar[Symbol[None, None]]
+
+    GetOffensiveStatAtLevel: ClassVar[Symbol[None, None]]
+
+    GetDefensiveStatAtLevel: ClassVar[Symbol[None, None]]
+
+    GetOutlawSpawnData: ClassVar[Symbol[None, None]]
+
+    ExecuteMonsterAction: ClassVar[Symbol[None, None]]
+
+    TryActivateFlashFireOnAllMonsters: ClassVar[Symbol[None, None]]
+
+    HasStatusThatPreventsActing: ClassVar[Symbol[None, None]]
+
+    GetMobilityTypeCheckSlip: ClassVar[Symbol[None, None]]
+
+    GetMobilityTypeCheckSlipAndFloating: ClassVar[Symbol[None, None]]
+
+    IsInvalidSpawnTile: ClassVar[Symbol[None, None]]
+
+    GetMobilityTypeAfterIqSkills: ClassVar[Symbol[None, None]]
+
+    CannotStandOnTile: ClassVar[Symbol[None, None]]
+
+    CalcSpeedStage: ClassVar[Symbol[None, None]]
+
+    CalcSpeedStageWrapper: ClassVar[Symbol[None, None]]
+
+    GetNumberOfAttacks: ClassVar[Symbol[None, None]]
+
+    GetMonsterDisplayNameType: ClassVar[Symbol[None, None]]
+
+    GetMonsterName: ClassVar[Symbol[None, None]]
+
+    SprintfStatic: ClassVar[Symbol[None, None]]
+
+    IsMonsterDrowsy: ClassVar[Symbol[None, None]]
+
+    MonsterHasNonvolatileNonsleepStatus: ClassVar[Symbol[None, None]]
+
+    MonsterHasImmobilizingStatus: ClassVar[Symbol[None, None]]
+
+    MonsterHasAttackInterferingStatus: ClassVar[Symbol[None, None]]
+
+    MonsterHasSkillInterferingStatus: ClassVar[Symbol[None, None]]
+
+    MonsterHasLeechSeedStatus: ClassVar[Symbol[None, None]]
+
+    MonsterHasWhifferStatus: ClassVar[Symbol[None, None]]
+
+    IsMonsterVisuallyImpaired: ClassVar[Symbol[None, None]]
+
+    IsMonsterMuzzled: ClassVar[Symbol[None, None]]
+
+    MonsterHasMiracleEyeStatus: ClassVar[Symbol[None, None]]
+
+    MonsterHasNegativeStatus: ClassVar[Symbol[None, None]]
+
+    IsMonsterSleeping: ClassVar[Symbol[None, None]]
+
+    CheckVariousStatuses2: ClassVar[Symbol[None, None]]
+
+    CheckVariousConditions: ClassVar[Symbol[None, None]]
+
+    CheckVariousStatuses: ClassVar[Symbol[None, None]]
+
+    CanMonsterMoveInDirection: ClassVar[Symbol[None, None]]
+
+    GetDirectionalMobilityType: ClassVar[Symbol[None, None]]
+
+    IsMonsterCornered: ClassVar[Symbol[None, None]]
+
+    CanAttackInDirection: ClassVar[Symbol[None, None]]
+
+    CanAiMonsterMoveInDirection: ClassVar[Symbol[None, None]]
+
+    ShouldMonsterRunAway: ClassVar[Symbol[None, None]]
+
+    ShouldMonsterRunAwayVariation: ClassVar[Symbol[None, None]]
+
+    GetTreatmentBetweenMonsters: ClassVar[Symbol[None, None]]
+
+    SafeguardIsActive: ClassVar[Symbol[None, None]]
+
+    LeafGuardIsActive: ClassVar[Symbol[None, None]]
+
+    IsProtectedFromStatDrops: ClassVar[Symbol[None, None]]
+
+    NoGastroAcidStatus: ClassVar[Symbol[None, None]]
+
+    AbilityIsActive: ClassVar[Symbol[None, None]]
+
+    AbilityIsActiveVeneer: ClassVar[Symbol[None, None]]
+
+    OtherMonsterAbilityIsActive: ClassVar[Symbol[None, None]]
+
+    LevitateIsActive: ClassVar[Symbol[None, None]]
+
+    MonsterIsType: ClassVar[Symbol[None, None]]
+
+    IsTypeAffectedByGravity: ClassVar[Symbol[None, None]]
+
+    HasTypeAffectedByGravity: ClassVar[Symbol[None, None]]
+
+    CanSeeInvisibleMonsters: ClassVar[Symbol[None, None]]
+
+    IsTacticSet: ClassVar[Symbol[None, None]]
+
+    HasDropeyeStatus: ClassVar[Symbol[None, None]]
+
+    IqSkillIsEnabled: ClassVar[Symbol[None, None]]
+
+    UpdateIqSkills: ClassVar[Symbol[None, None]]
+
+    GetMoveTypeForMonster: ClassVar[Symbol[None, None]]
+
+    GetMovePower: ClassVar[Symbol[None, None]]
+
+    MonsterCanThrowItems: ClassVar[Symbol[None, None]]
+
+    UpdateStateFlags: ClassVar[Symbol[None, None]]
+
+    IsProtectedFromNegativeStatus: ClassVar[Symbol[None, None]]
+
+    AddExpSpecial: ClassVar[Symbol[None, None]]
+
+    EnemyEvolution: ClassVar[Symbol[None, None]]
+
+    LevelUpItemEffect: ClassVar[Symbol[None, None]]
+
+    TryDecreaseLevel: ClassVar[Symbol[None, None]]
+
+    LevelUp: ClassVar[Symbol[None, None]]
+
+    GetMonsterMoves: ClassVar[Symbol[None, None]]
+
+    EvolveMonster: ClassVar[Symbol[None, None]]
+
+    ChangeMonsterAnimation: ClassVar[Symbol[None, None]]
+
+    GetIdleAnimationId: ClassVar[Symbol[None, None]]
+
+    DetermineAllMonsterShadow: ClassVar[Symbol[None, None]]
+
+    DetermineMonsterShadow: ClassVar[Symbol[None, None]]
+
+    DisplayActions: ClassVar[Symbol[None, None]]
+
+    CheckNonLeaderTile: ClassVar[Symbol[None, None]]
+
+    EndNegativeStatusCondition: ClassVar[Symbol[None, None]]
+
+    EndNegativeStatusConditionWrapper: ClassVar[Symbol[None, None]]
+
+    TransferNegativeStatusCondition: ClassVar[Symbol[None, None]]
+
+    EndSleepClassStatus: ClassVar[Symbol[None, None]]
+
+    EndBurnClassStatus: ClassVar[Symbol[None, None]]
+
+    EndFrozenClassStatus: ClassVar[Symbol[None, None]]
+
+    EndCringeClassStatus: ClassVar[Symbol[None, None]]
+
+    EndReflectClassStatus: ClassVar[Symbol[None, None]]
+
+    TryRemoveSnatchedMonsterFromDungeonStruct: ClassVar[Symbol[None, None]]
+
+    EndCurseClassStatus: ClassVar[Symbol[None, None]]
+
+    EndLeechSeedClassStatus: ClassVar[Symbol[None, None]]
+
+    EndSureShotClassStatus: ClassVar[Symbol[None, None]]
+
+    EndInvisibleClassStatus: ClassVar[Symbol[None, None]]
+
+    EndBlinkerClassStatus: ClassVar[Symbol[None, None]]
+
+    EndMuzzledStatus: ClassVar[Symbol[None, None]]
+
+    EndMiracleEyeStatus: ClassVar[Symbol[None, None]]
+
+    EndMagnetRiseStatus: ClassVar[Symbol[None, None]]
+
+    TransferNegativeBlinkerClassStatus: ClassVar[Symbol[None, None]]
+
+    EndFrozenStatus: ClassVar[Symbol[None, None]]
+
+    EndProtectStatus: ClassVar[Symbol[None, None]]
+
+    TryRestoreRoostTyping: ClassVar[Symbol[None, None]]
+
+    TryTriggerMonsterHouse: ClassVar[Symbol[None, None]]
+
+    ShouldMonsterFollowLeader: ClassVar[Symbol[None, None]]
+
+    RunMonsterAi: ClassVar[Symbol[None, None]]
+
+    ApplyDamageAndEffects: ClassVar[Symbol[None, None]]
+
+    ApplyDamage: ClassVar[Symbol[None, None]]
+
+    AftermathCheck: ClassVar[Symbol[None, None]]
+
+    GetTypeMatchupBothTypes: ClassVar[Symbol[None, None]]
+
+    ScrappyShouldActivate: ClassVar[Symbol[None, None]]
+
+    IsTypeIneffectiveAgainstGhost: ClassVar[Symbol[None, None]]
+
+    GhostImmunityIsActive: ClassVar[Symbol[None, None]]
+
+    GetTypeMatchup: ClassVar[Symbol[None, None]]
+
+    CalcTypeBasedDamageEffects: ClassVar[Symbol[None, None]]
+
+    CalcDamage: ClassVar[Symbol[None, None]]
+
+    ApplyDamageAndEffectsWrapper: ClassVar[Symbol[None, None]]
+
+    CalcRecoilDamageFixed: ClassVar[Symbol[None, None]]
+
+    CalcDamageFixed: ClassVar[Symbol[None, None]]
+
+    CalcDamageFixedNoCategory: ClassVar[Symbol[None, None]]
+
+    CalcDamageFixedWrapper: ClassVar[Symbol[None, None]]
+
+    UpdateShopkeeperModeAfterAttack: ClassVar[Symbol[None, None]]
+
+    UpdateShopkeeperModeAfterTrap: ClassVar[Symbol[None, None]]
+
+    ResetDamageCalcDiagnostics: ClassVar[Symbol[None, None]]
+
+    SpecificRecruitCheck: ClassVar[Symbol[None, None]]
+
+    RecruitCheck: ClassVar[Symbol[None, None]]
+
+    TryRecruit: ClassVar[Symbol[None, None]]
+
+    TrySpawnMonsterAndTickSpawnCounter: ClassVar[Symbol[None, None]]
+
+    AiDecideUseItem: ClassVar[Symbol[None, None]]
+
+    GetPossibleAiThrownItemDirections: ClassVar[Symbol[None, None]]
+
+    GetPossibleAiArcItemTargets: ClassVar[Symbol[None, None]]
+
+    TryNonLeaderItemPickUp: ClassVar[Symbol[None, None]]
+
+    GetExclusiveItemWithEffectFromBag: ClassVar[Symbol[None, None]]
+
+    AuraBowIsActive: ClassVar[Symbol[None, None]]
+
+    ExclusiveItemOffenseBoost: ClassVar[Symbol[None, None]]
+
+    ExclusiveItemDefenseBoost: ClassVar[Symbol[None, None]]
+
+    TeamMemberHasItemActive: ClassVar[Symbol[None, None]]
+
+    TeamMemberHasExclusiveItemEffectActive: ClassVar[Symbol[None, None]]
+
+    TrySpawnEnemyItemDrop: ClassVar[Symbol[None, None]]
+
+    TickNoSlipCap: ClassVar[Symbol[None, None]]
+
+    TickStatusAndHealthRegen: ClassVar[Symbol[None, None]]
+
+    InflictSleepStatusSingle: ClassVar[Symbol[None, None]]
+
+    TryInflictSleepStatus: ClassVar[Symbol[None, None]]
+
+    IsProtectedFromSleepClassStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictNightmareStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictNappingStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictYawningStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictSleeplessStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictPausedStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictInfatuatedStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictBurnStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictBurnStatusWholeTeam: ClassVar[Symbol[None, None]]
+
+    TryInflictPoisonedStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictBadlyPoisonedStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictFrozenStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictConstrictionStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictShadowHoldStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictIngrainStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictWrappedStatus: ClassVar[Symbol[None, None]]
+
+    FreeOtherWrappedMonsters: ClassVar[Symbol[None, None]]
+
+    TryInflictPetrifiedStatus: ClassVar[Symbol[None, None]]
+
+    LowerOffensiveStat: ClassVar[Symbol[None, None]]
+
+    LowerDefensiveStat: ClassVar[Symbol[None, None]]
+
+    BoostOffensiveStat: ClassVar[Symbol[None, None]]
+
+    BoostDefensiveStat: ClassVar[Symbol[None, None]]
+
+    FlashFireShouldActivate: ClassVar[Symbol[None, None]]
+
+    ActivateFlashFire: ClassVar[Symbol[None, None]]
+
+    ApplyOffensiveStatMultiplier: ClassVar[Symbol[None, None]]
+
+    ApplyDefensiveStatMultiplier: ClassVar[Symbol[None, None]]
+
+    BoostHitChanceStat: ClassVar[Symbol[None, None]]
+
+    LowerHitChanceStat: ClassVar[Symbol[None, None]]
+
+    TryInflictCringeStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictParalysisStatus: ClassVar[Symbol[None, None]]
+
+    BoostSpeed: ClassVar[Symbol[None, None]]
+
+    BoostSpeedOneStage: ClassVar[Symbol[None, None]]
+
+    LowerSpeed: ClassVar[Symbol[None, None]]
+
+    TrySealMove: ClassVar[Symbol[None, None]]
+
+    BoostOrLowerSpeed: ClassVar[Symbol[None, None]]
+
+    ResetHitChanceStat: ClassVar[Symbol[None, None]]
+
+    ExclusiveItemEffectIsActiveWithLogging: ClassVar[Symbol[None, None]]
+
+    TryActivateQuickFeet: ClassVar[Symbol[None, None]]
+
+    TryInflictTerrifiedStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictGrudgeStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictConfusedStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictCoweringStatus: ClassVar[Symbol[None, None]]
+
+    TryRestoreHp: ClassVar[Symbol[None, None]]
+
+    TryIncreaseHp: ClassVar[Symbol[None, None]]
+
+    RevealItems: ClassVar[Symbol[None, None]]
+
+    RevealStairs: ClassVar[Symbol[None, None]]
+
+    RevealEnemies: ClassVar[Symbol[None, None]]
+
+    TryInflictLeechSeedStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictDestinyBondStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictSureShotStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictWhifferStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictSetDamageStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictFocusEnergyStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictDecoyStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictCurseStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictSnatchStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictTauntStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictStockpileStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictInvisibleStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictPerishSongStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictEncoreStatus: ClassVar[Symbol[None, None]]
+
+    TryDecreaseBelly: ClassVar[Symbol[None, None]]
+
+    TryIncreaseBelly: ClassVar[Symbol[None, None]]
+
+    TryInflictMuzzledStatus: ClassVar[Symbol[None, None]]
+
+    TryTransform: ClassVar[Symbol[None, None]]
+
+    TryInflictMobileStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictExposedStatus: ClassVar[Symbol[None, None]]
+
+    TryActivateIdentifyCondition: ClassVar[Symbol[None, None]]
+
+    TryInflictBlinkerStatus: ClassVar[Symbol[None, None]]
+
+    IsBlinded: ClassVar[Symbol[None, None]]
+
+    TryInflictCrossEyedStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictEyedropStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictSlipStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictDropeyeStatus: ClassVar[Symbol[None, None]]
+
+    RestoreAllMovePP: ClassVar[Symbol[None, None]]
+
+    RestoreOneMovePP: ClassVar[Symbol[None, None]]
+
+    RestoreRandomMovePP: ClassVar[Symbol[None, None]]
+
+    ApplyProteinEffect: ClassVar[Symbol[None, None]]
+
+    ApplyCalciumEffect: ClassVar[Symbol[None, None]]
+
+    ApplyIronEffect: ClassVar[Symbol[None, None]]
+
+    ApplyZincEffect: ClassVar[Symbol[None, None]]
+
+    TryInflictLongTossStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictPierceStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictGastroAcidStatus: ClassVar[Symbol[None, None]]
+
+    SetAquaRingHealingCountdownTo4: ClassVar[Symbol[None, None]]
+
+    ApplyAquaRingHealing: ClassVar[Symbol[None, None]]
+
+    TryInflictAquaRingStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictLuckyChantStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictHealBlockStatus: ClassVar[Symbol[None, None]]
+
+    MonsterHasEmbargoStatus: ClassVar[Symbol[None, None]]
+
+    LogItemBlockedByEmbargo: ClassVar[Symbol[None, None]]
+
+    TryInflictEmbargoStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictMiracleEyeStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictMagnetRiseStatus: ClassVar[Symbol[None, None]]
+
+    IsFloating: ClassVar[Symbol[None, None]]
+
+    TryInflictSafeguardStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictMistStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictWishStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictMagicCoatStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictLightScreenStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictReflectStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictProtectStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictMirrorCoatStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictEndureStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictMirrorMoveStatus: ClassVar[Symbol[None, None]]
+
+    TryInflictConversion2Status: ClassVar[Symbol[None, None]]
+
+    TryInflictVitalThrowStatus: ClassVar[Symbol[None, None]]
+
+    TryResetStatChanges: ClassVar[Symbol[None, None]]
+
+    MirrorMoveIsActive: ClassVar[Symbol[None, None]]
+
+    MistIsActive: ClassVar[Symbol[None, None]]
+
+    Conversion2IsActive: ClassVar[Symbol[None, None]]
+
+    AiConsiderMove: ClassVar[Symbol[None, None]]
+
+    TryAddTargetToAiTargetList: ClassVar[Symbol[None, None]]
+
+    IsAiTargetEligible: ClassVar[Symbol[None, None]]
+
+    IsTargetInRange: ClassVar[Symbol[None, None]]
+
+    ShouldUsePp: ClassVar[Symbol[None, None]]
+
+    GetEntityMoveTargetAndRange: ClassVar[Symbol[None, None]]
+
+    GetEntityNaturalGiftInfo: ClassVar[Symbol[None, None]]
+
+    GetEntityWeatherBallType: ClassVar[Symbol[None, None]]
+
+    ActivateMotorDrive: ClassVar[Symbol[None, None]]
+
+    TryActivateFrisk: ClassVar[Symbol[None, None]]
+
+    TryActivateBadDreams: ClassVar[Symbol[None, None]]
+
+    ActivateStench: ClassVar[Symbol[None, None]]
+
+    TryActivateSteadfast: ClassVar[Symbol[None, None]]
+
+    IsInSpawnList: ClassVar[Symbol[None, None]]
+
+    ChangeShayminForme: ClassVar[Symbol[None, None]]
+
+    ApplyItemEffect: ClassVar[Symbol[None, None]]
+
+    ApplyCheriBerryEffect: ClassVar[Symbol[None, None]]
+
+    ApplyPechaBerryEffect: ClassVar[Symbol[None, None]]
+
+    ApplyRawstBerryEffect: ClassVar[Symbol[None, None]]
+
+    ApplyHungerSeedEffect: ClassVar[Symbol[None, None]]
+
+    ApplyVileSeedEffect: ClassVar[Symbol[None, None]]
+
+    ApplyViolentSeedEffect: ClassVar[Symbol[None, None]]
+
+    ApplyGinsengEffect: ClassVar[Symbol[None, None]]
+
+    ApplyBlastSeedEffect: ClassVar[Symbol[None, None]]
+
+    ApplyGummiBoostsDungeonMode: ClassVar[Symbol[None, None]]
+
+    CanMonsterUseItem: ClassVar[Symbol[None, None]]
+
+    ApplyGrimyFoodEffect: ClassVar[Symbol[None, None]]
+
+    ApplyMixElixirEffect: ClassVar[Symbol[None, None]]
+
+    ApplyDoughSeedEffect: ClassVar[Symbol[None, None]]
+
+    ApplyViaSeedEffect: ClassVar[Symbol[None, None]]
+
+    ApplyGravelyrockEffect: ClassVar[Symbol[None, None]]
+
+    ApplyGonePebbleEffect: ClassVar[Symbol[None, None]]
+
+    ApplyGracideaEffect: ClassVar[Symbol[None, None]]
+
+    GetAiUseItemProbability: ClassVar[Symbol[None, None]]
+
+    IsAdjacentToEnemy: ClassVar[Symbol[None, None]]
+
+    ShouldTryEatItem: ClassVar[Symbol[None, None]]
+
+    GetMaxPpWrapper: ClassVar[Symbol[None, None]]
+
+    MoveIsNotPhysical: ClassVar[Symbol[None, None]]
+
+    CategoryIsNotPhysical: ClassVar[Symbol[None, None]]
+
+    TryDrought: ClassVar[Symbol[None, None]]
+
+    TryPounce: ClassVar[Symbol[None, None]]
+
+    TryBlowAway: ClassVar[Symbol[None, None]]
+
+    TryExplosion: ClassVar[Symbol[None, None]]
+
+    TryAftermathExplosion: ClassVar[Symbol[None, None]]
+
+    TryWarp: ClassVar[Symbol[None, None]]
+
+    EnsureCanStandCurrentTile: ClassVar[Symbol[None, None]]
+
+    TryActivateNondamagingDefenderAbility: ClassVar[Symbol[None, None]]
+
+    TryActivateNondamagingDefenderExclusiveItem: ClassVar[Symbol[None, None]]
+
+    GetMoveRangeDistance: ClassVar[Symbol[None, None]]
+
+    MoveHitCheck: ClassVar[Symbol[None, None]]
+
+    IsHyperBeamVariant: ClassVar[Symbol[None, None]]
+
+    IsChargingTwoTurnMove: ClassVar[Symbol[None, None]]
+
+    IsChargingAnyTwoTurnMove: ClassVar[Symbol[None, None]]
+
+    HasMaxGinsengBoost99: ClassVar[Symbol[None, None]]
+
+    TwoTurnMoveForcedMiss: ClassVar[Symbol[None, None]]
+
+    DungeonRandOutcomeUserTargetInteraction: ClassVar[Symbol[None, None]]
+
+    DungeonRandOutcomeUserAction: ClassVar[Symbol[None, None]]
+
+    CanAiUseMove: ClassVar[Symbol[None, None]]
+
+    CanMonsterUseMove: ClassVar[Symbol[None, None]]
+
+    UpdateMovePp: ClassVar[Symbol[None, None]]
+
+    GetDamageSourceWrapper: ClassVar[Symbol[None, None]]
+
+    LowerSshort: ClassVar[Symbol[None, None]]
+
+    PlayMoveAnimation: ClassVar[Symbol[None, None]]
+
+    GetMoveAnimationId: ClassVar[Symbol[None, None]]
+
+    ShouldMovePlayAlternativeAnimation: ClassVar[Symbol[None, None]]
+
+    ExecuteMoveEffect: ClassVar[Symbol[None, None]]
+
+    DoMoveDamageInlined: ClassVar[Symbol[None, None]]
+
+    DealDamage: ClassVar[Symbol[None, None]]
+
+    DealDamageWithTypeAndPowerBoost: ClassVar[Symbol[None, None]]
+
+    DealDamageProjectile: ClassVar[Symbol[None, None]]
+
+    DealDamageWithType: ClassVar[Symbol[None, None]]
+
+    PerformDamageSequence: ClassVar[Symbol[None, None]]
+
+    CanHitWithRegularAttack: ClassVar[Symbol[None, None]]
+
+    StatusCheckerCheck: ClassVar[Symbol[None, None]]
+
+    GetApparentWeather: ClassVar[Symbol[None, None]]
+
+    TryWeatherFormChange: ClassVar[Symbol[None, None]]
+
+    ActivateSportCondition: ClassVar[Symbol[None, None]]
+
+    TryActivateWeather: ClassVar[Symbol[None, None]]
+
+    DigitCount: ClassVar[Symbol[None, None]]
+
+    LoadTextureUi: ClassVar[Symbol[None, None]]
+
+    DisplayNumberTextureUi: ClassVar[Symbol[None, None]]
+
+    DisplayCharTextureUi: ClassVar[Symbol[None, None]]
+
+    DisplayUi: ClassVar[Symbol[None, None]]
+
+    GetTile: ClassVar[Symbol[None, None]]
+
+    GetTileSafe: ClassVar[Symbol[None, None]]
+
+    IsFullFloorFixedRoom: ClassVar[Symbol[None, None]]
+
+    IsCurrentTilesetBackground: ClassVar[Symbol[None, None]]
+
+    TrySpawnGoldenChamber: ClassVar[Symbol[None, None]]
+
+    CountItemsOnFloorForAcuteSniffer: ClassVar[Symbol[None, None]]
+
+    GetStairsSpawnPosition: ClassVar[Symbol[None, None]]
+
+    PositionIsOnStairs: ClassVar[Symbol[None, None]]
+
+    GetStairsRoom: ClassVar[Symbol[None, None]]
+
+    GetDefaultTileTextureId: ClassVar[Symbol[None, None]]
+
+    DetermineAllTilesWalkableNeighbors: ClassVar[Symbol[None, None]]
+
+    DetermineTileWalkableNeighbors: ClassVar[Symbol[None, None]]
+
+    UpdateTrapsVisibility: ClassVar[Symbol[None, None]]
+
+    DrawTileGrid: ClassVar[Symbol[None, None]]
+
+    HideTileGrid: ClassVar[Symbol[None, None]]
+
+    DiscoverMinimap: ClassVar[Symbol[None, None]]
+
+    PositionHasItem: ClassVar[Symbol[None, None]]
+
+    PositionHasMonster: ClassVar[Symbol[None, None]]
+
+    TrySmashWall: ClassVar[Symbol[None, None]]
+
+    IsWaterTileset: ClassVar[Symbol[None, None]]
+
+    GetRandomSpawnMonsterID: ClassVar[Symbol[None, None]]
+
+    NearbyAllyIqSkillIsEnabled: ClassVar[Symbol[None, None]]
+
+    ResetGravity: ClassVar[Symbol[None, None]]
+
+    GravityIsActive: ClassVar[Symbol[None, None]]
+
+    TryActivateGravity: ClassVar[Symbol[None, None]]
+
+    ShouldBoostKecleonShopSpawnChance: ClassVar[Symbol[None, None]]
+
+    SetShouldBoostKecleonShopSpawnChance: ClassVar[Symbol[None, None]]
+
+    UpdateShouldBoostKecleonShopSpawnChance: ClassVar[Symbol[None, None]]
+
+    GetDoughSeedFlag: ClassVar[Symbol[None, None]]
+
+    SetDoughSeedFlag: ClassVar[Symbol[None, None]]
+
+    TrySpawnDoughSeedPoke: ClassVar[Symbol[None, None]]
+
+    IsSecretBazaar: ClassVar[Symbol[None, None]]
+
+    ShouldBoostHiddenStairsSpawnChance: ClassVar[Symbol[None, None]]
+
+    SetShouldBoostHiddenStairsSpawnChance: ClassVar[Symbol[None, None]]
+
+    UpdateShouldBoostHiddenStairsSpawnChance: ClassVar[Symbol[None, None]]
+
+    IsSecretRoom: ClassVar[Symbol[None, None]]
+
+    IsSecretFloor: ClassVar[Symbol[None, None]]
+
+    GetCurrentHiddenStairsType: ClassVar[Symbol[None, None]]
+
+    HiddenStairsPresent: ClassVar[Symbol[None, None]]
+
+    PositionIsOnHiddenStairs: ClassVar[Symbol[None, None]]
+
+    HiddenStairsTrigger: ClassVar[Symbol[None, None]]
+
+    GetHiddenStairsField: ClassVar[Symbol[None, None]]
+
+    SetHiddenStairsField: ClassVar[Symbol[None, None]]
+
+    GetHiddenFloorField: ClassVar[Symbol[None, None]]
+
+    SetHiddenFloorField: ClassVar[Symbol[None, None]]
+
+    LoadWeather3DFiles: ClassVar[Symbol[None, None]]
+
+    RenderWeather3D: ClassVar[Symbol[None, None]]
+
+    GetMinimapData: ClassVar[Symbol[None, None]]
+
+    DrawMinimapTile: ClassVar[Symbol[None, None]]
+
+    FlashLeaderIcon: ClassVar[Symbol[None, None]]
+
+    UpdateMinimap: ClassVar[Symbol[None, None]]
+
+    SetMinimapDataE447: ClassVar[Symbol[None, None]]
+
+    GetMinimapDataE447: ClassVar[Symbol[None, None]]
+
+    SetMinimapDataE448: ClassVar[Symbol[None, None]]
+
+    InitWeirdMinimapMatrix: ClassVar[Symbol[None, None]]
+
+    InitMinimapDisplayTile: ClassVar[Symbol[None, None]]
+
+    LoadFixedRoomDataVeneer: ClassVar[Symbol[None, None]]
+
+    UnloadFixedRoomData: ClassVar[Symbol[None, None]]
+
+    IsNormalFloor: ClassVar[Symbol[None, None]]
+
+    GenerateFloor: ClassVar[Symbol[None, None]]
+
+    GetTileTerrain: ClassVar[Symbol[None, None]]
+
+    DungeonRand100: ClassVar[Symbol[None, None]]
+
+    ClearHiddenStairs: ClassVar[Symbol[None, None]]
+
+    FlagHallwayJunctions: ClassVar[Symbol[None, None]]
+
+    GenerateStandardFloor: ClassVar[Symbol[None, None]]
+
+    GenerateOuterRingFloor: ClassVar[Symbol[None, None]]
+
+    GenerateCrossroadsFloor: ClassVar[Symbol[None, None]]
+
+    GenerateLineFloor: ClassVar[Symbol[None, None]]
+
+    GenerateCrossFloor: ClassVar[Symbol[None, None]]
+
+    GenerateBeetleFloor: ClassVar[Symbol[None, None]]
+
+    MergeRoomsVertically: ClassVar[Symbol[None, None]]
+
+    GenerateOuterRoomsFloor: ClassVar[Symbol[None, None]]
+
+    IsNotFullFloorFixedRoom: ClassVar[Symbol[None, None]]
+
+    GenerateFixedRoom: ClassVar[Symbol[None, None]]
+
+    GenerateOneRoomMonsterHouseFloor: ClassVar[Symbol[None, None]]
+
+    GenerateTwoRoomsWithMonsterHouseFloor: ClassVar[Symbol[None, None]]
+
+    GenerateExtraHallways: ClassVar[Symbol[None, None]]
+
+    GetGridPositions: ClassVar[Symbol[None, None]]
+
+    InitDungeonGrid: ClassVar[Symbol[None, None]]
+
+    AssignRooms: ClassVar[Symbol[None, None]]
+
+    CreateRoomsAndAnchors: ClassVar[Symbol[None, None]]
+
+    GenerateSecondaryStructures: ClassVar[Symbol[None, None]]
+
+    AssignGridCellConnections: ClassVar[Symbol[None, None]]
+
+    CreateGridCellConnections: ClassVar[Symbol[None, None]]
+
+    GenerateRoomImperfections: ClassVar[Symbol[None, None]]
+
+    CreateHallway: ClassVar[Symbol[None, None]]
+
+    EnsureConnectedGrid: ClassVar[Symbol[None, None]]
+
+    SetTerrainObstacleChecked: ClassVar[Symbol[None, None]]
+
+    FinalizeJunctions: ClassVar[Symbol[None, None]]
+
+    GenerateKecleonShop: ClassVar[Symbol[None, None]]
+
+    GenerateMonsterHouse: ClassVar[Symbol[None, None]]
+
+    GenerateMazeRoom: ClassVar[Symbol[None, None]]
+
+    GenerateMaze: ClassVar[Symbol[None, None]]
+
+    GenerateMazeLine: ClassVar[Symbol[None, None]]
+
+    SetSpawnFlag5: ClassVar[Symbol[None, None]]
+
+    IsNextToHallway: ClassVar[Symbol[None, None]]
+
+    ResolveInvalidSpawns: ClassVar[Symbol[None, None]]
+
+    ConvertSecondaryTerrainToChasms: ClassVar[Symbol[None, None]]
+
+    EnsureImpassableTilesAreWalls: ClassVar[Symbol[None, None]]
+
+    InitializeTile: ClassVar[Symbol[None, None]]
+
+    ResetFloor: ClassVar[Symbol[None, None]]
+
+    PosIsOutOfBounds: ClassVar[Symbol[None, None]]
+
+    ShuffleSpawnPositions: ClassVar[Symbol[None, None]]
+
+    MarkNonEnemySpawns: ClassVar[Symbol[None, None]]
+
+    MarkEnemySpawns: ClassVar[Symbol[None, None]]
+
+    SetSecondaryTerrainOnWall: ClassVar[Symbol[None, None]]
+
+    GenerateSecondaryTerrainFormations: ClassVar[Symbol[None, None]]
+
+    StairsAlwaysReachable: ClassVar[Symbol[None, None]]
+
+    GetNextFixedRoomAction: ClassVar[Symbol[None, None]]
+
+    ConvertWallsToChasms: ClassVar[Symbol[None, None]]
+
+    ResetInnerBoundaryTileRows: ClassVar[Symbol[None, None]]
+
+    ResetImportantSpawnPositions: ClassVar[Symbol[None, None]]
+
+    SpawnStairs: ClassVar[Symbol[None, None]]
+
+    GetHiddenStairsType: ClassVar[Symbol[None, None]]
+
+    GetFinalKecleonShopSpawnChance: ClassVar[Symbol[None, None]]
+
+    ResetHiddenStairsSpawn: ClassVar[Symbol[None, None]]
+
+    PlaceFixedRoomTile: ClassVar[Symbol[None, None]]
+
+    FixedRoomActionParamToDirection: ClassVar[Symbol[None, None]]
+
+    ApplyKeyEffect: ClassVar[Symbol[None, None]]
+
+    LoadFixedRoomData: ClassVar[Symbol[None, None]]
+
+    LoadFixedRoom: ClassVar[Symbol[None, None]]
+
+    OpenFixedBin: ClassVar[Symbol[None, None]]
+
+    CloseFixedBin: ClassVar[Symbol[None, None]]
+
+    AreOrbsAllowed: ClassVar[Symbol[None, None]]
+
+    AreTileJumpsAllowed: ClassVar[Symbol[None, None]]
+
+    AreTrawlOrbsAllowed: ClassVar[Symbol[None, None]]
+
+    AreOrbsAllowedVeneer: ClassVar[Symbol[None, None]]
+
+    AreLateGameTrapsEnabled: ClassVar[Symbol[None, None]]
+
+    AreMovesEnabled: ClassVar[Symbol[None, None]]
+
+    IsRoomIlluminated: ClassVar[Symbol[None, None]]
+
+    GetMatchingMonsterId: ClassVar[Symbol[None, None]]
+
+    GenerateItemExplicit: ClassVar[Symbol[None, None]]
+
+    GenerateAndSpawnItem: ClassVar[Symbol[None, None]]
+
+    IsHiddenStairsFloor: ClassVar[Symbol[None, None]]
+
+    IsSecretBazaarVeneer: ClassVar[Symbol[None, None]]
+
+    GenerateStandardItem: ClassVar[Symbol[None, None]]
+
+    GenerateCleanItem: ClassVar[Symbol[None, None]]
+
+    TryLeaderItemPickUp: ClassVar[Symbol[None, None]]
+
+    SpawnItem: ClassVar[Symbol[None, None]]
+
+    RemoveGroundItem: ClassVar[Symbol[None, None]]
+
+    SpawnDroppedItemWrapper: ClassVar[Symbol[None, None]]
+
+    SpawnDroppedItem: ClassVar[Symbol[None, None]]
+
+    TryGenerateUnownStoneDrop: ClassVar[Symbol[None, None]]
+
+    HasHeldItem: ClassVar[Symbol[None, None]]
+
+    GenerateMoneyQuantity: ClassVar[Symbol[None, None]]
+
+    CheckTeamItemsFlags: ClassVar[Symbol[None, None]]
+
+    AddHeldItemToBag: ClassVar[Symbol[None, None]]
+
+    RemoveEmptyItemsInBagWrapper: ClassVar[Symbol[None, None]]
+
+    GenerateItem: ClassVar[Symbol[None, None]]
+
+    DoesProjectileHitTarget: ClassVar[Symbol[None, None]]
+
+    DisplayFloorCard: ClassVar[Symbol[None, None]]
+
+    HandleFloorCard: ClassVar[Symbol[None, None]]
+
+    CheckActiveChallengeRequest: ClassVar[Symbol[None, None]]
+
+    GetMissionDestination: ClassVar[Symbol[None, None]]
+
+    IsOutlawOrChallengeRequestFloor: ClassVar[Symbol[None, None]]
+
+    IsDestinationFloor: ClassVar[Symbol[None, None]]
+
+    IsCurrentMissionType: ClassVar[Symbol[None, None]]
+
+    IsCurrentMissionTypeExact: ClassVar[Symbol[None, None]]
+
+    IsOutlawMonsterHouseFloor: ClassVar[Symbol[None, None]]
+
+    IsGoldenChamber: ClassVar[Symbol[None, None]]
+
+    IsLegendaryChallengeFloor: ClassVar[Symbol[None, None]]
+
+    IsJirachiChallengeFloor: ClassVar[Symbol[None, None]]
+
+    IsDestinationFloorWithMonster: ClassVar[Symbol[None, None]]
+
+    LoadMissionMonsterSprites: ClassVar[Symbol[None, None]]
+
+    MissionTargetEnemyIsDefeated: ClassVar[Symbol[None, None]]
+
+    SetMissionTargetEnemyDefeated: ClassVar[Symbol[None, None]]
+
+    IsDestinationFloorWithFixedRoom: ClassVar[Symbol[None, None]]
+
+    GetItemToRetrieve: ClassVar[Symbol[None, None]]
+
+    GetItemToDeliver: ClassVar[Symbol[None, None]]
+
+    GetSpecialTargetItem: ClassVar[Symbol[None, None]]
+
+    IsDestinationFloorWithItem: ClassVar[Symbol[None, None]]
+
+    IsDestinationFloorWithHiddenOutlaw: ClassVar[Symbol[None, None]]
+
+    IsDestinationFloorWithFleeingOutlaw: ClassVar[Symbol[None, None]]
+
+    GetMissionTargetEnemy: ClassVar[Symbol[None, None]]
+
+    GetMissionEnemyMinionGroup: ClassVar[Symbol[None, None]]
+
+    SetTargetMonsterNotFoundFlag: ClassVar[Symbol[None, None]]
+
+    GetTargetMonsterNotFoundFlag: ClassVar[Symbol[None, None]]
+
+    FloorHasMissionMonster: ClassVar[Symbol[None, None]]
+
+    GenerateMissionEggMonster: ClassVar[Symbol[None, None]]
+
+    LogMessageByIdWithPopupCheckParticipants: ClassVar[Symbol[None, None]]
+
+    LogMessageByIdWithPopupCheckUser: ClassVar[Symbol[None, None]]
+
+    LogMessageWithPopupCheckUser: ClassVar[Symbol[None, None]]
+
+    LogMessageByIdQuiet: ClassVar[Symbol[None, None]]
+
+    LogMessageQuiet: ClassVar[Symbol[None, None]]
+
+    LogMessageByIdWithPopupCheckUserTarget: ClassVar[Symbol[None, None]]
+
+    LogMessageWithPopupCheckUserTarget: ClassVar[Symbol[None, None]]
+
+    LogMessageByIdQuietCheckUserTarget: ClassVar[Symbol[None, None]]
+
+    LogMessageByIdWithPopupCheckUserUnknown: ClassVar[Symbol[None, None]]
+
+    LogMessageByIdWithPopup: ClassVar[Symbol[None, None]]
+
+    LogMessageWithPopup: ClassVar[Symbol[None, None]]
+
+    LogMessage: ClassVar[Symbol[None, None]]
+
+    LogMessageById: ClassVar[Symbol[None, None]]
+
+    InitPortraitDungeon: ClassVar[Symbol[None, None]]
+
+    OpenMessageLog: ClassVar[Symbol[None, None]]
+
+    RunDungeonMode: ClassVar[Symbol[None, None]]
+
+    StartFadeDungeon: ClassVar[Symbol[None, None]]
+
+    StartFadeDungeonWrapper: ClassVar[Symbol[None, None]]
+
+    HandleFadesDungeon: ClassVar[Symbol[None, None]]
+
+    HandleFadesDungeonBothScreens: ClassVar[Symbol[None, None]]
+
+    DisplayFloorTip: ClassVar[Symbol[None, None]]
+
+    DisplayItemTip: ClassVar[Symbol[None, None]]
+
+    DisplayDungeonTip: ClassVar[Symbol[None, None]]
+
+    SetBothScreensWindowColorToDefault: ClassVar[Symbol[None, None]]
+
+    GetPersonalityIndex: ClassVar[Symbol[None, None]]
+
+    DisplayMessage: ClassVar[Symbol[None, None]]
+
+    DisplayMessage2: ClassVar[Symbol[None, None]]
+
+    YesNoMenu: ClassVar[Symbol[None, None]]
+
+    DisplayMessageInternal: ClassVar[Symbol[None, None]]
+
+    OpenMenu: ClassVar[Symbol[None, None]]
+
+    OthersMenuLoop: ClassVar[Symbol[None, None]]
+
+    OthersMenu: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay29Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    DUNGEON_STRUCT_SIZE: ClassVar[Symbol[None, None]]
+
+    MAX_HP_CAP: ClassVar[Symbol[None, None]]
+
+    OFFSET_OF_DUNGEON_FLOOR_PROPERTIES: ClassVar[Symbol[None, None]]
+
+    SPAWN_RAND_MAX: ClassVar[Symbol[None, None]]
+
+    DUNGEON_PRNG_LCG_MULTIPLIER: ClassVar[Symbol[None, None]]
+
+    DUNGEON_PRNG_LCG_INCREMENT_SECONDARY: ClassVar[Symbol[None, None]]
+
+    ATTACK_SPRITE_BUFFER_SIZE: ClassVar[Symbol[None, None]]
+
+    KECLEON_FEMALE_ID: ClassVar[Symbol[None, None]]
+
+    KECLEON_MALE_ID: ClassVar[Symbol[None, None]]
+
+    MSG_ID_SLOW_START: ClassVar[Symbol[None, None]]
+
+    EXPERIENCE_POINT_GAIN_CAP: ClassVar[Symbol[None, None]]
+
+    JUDGMENT_MOVE_ID: ClassVar[Symbol[None, None]]
+
+    REGULAR_ATTACK_MOVE_ID: ClassVar[Symbol[None, None]]
+
+    DEOXYS_ATTACK_ID: ClassVar[Symbol[None, None]]
+
+    DEOXYS_SPEED_ID: ClassVar[Symbol[None, None]]
+
+    GIRATINA_ALTERED_ID: ClassVar[Symbol[None, None]]
+
+    PUNISHMENT_MOVE_ID: ClassVar[Symbol[None, None]]
+
+    OFFENSE_STAT_MAX: ClassVar[Symbol[None, None]]
+
+    PROJECTILE_MOVE_ID: ClassVar[Symbol[None, None]]
+
+    BELLY_LOST_PER_TURN: ClassVar[Symbol[None, None]]
+
+    MONSTER_HEAL_HP_MAX: ClassVar[Symbol[None, None]]
+
+    MOVE_TARGET_AND_RANGE_SPECIAL_USER_HEALING: ClassVar[Symbol[None, None]]
+
+    PLAIN_SEED_STRING_ID: ClassVar[Symbol[None, None]]
+
+    MAX_ELIXIR_PP_RESTORATION: ClassVar[Symbol[None, None]]
+
+    SLIP_SEED_FAIL_STRING_ID: ClassVar[Symbol[None, None]]
+
+    ROCK_WRECKER_MOVE_ID: ClassVar[Symbol[None, None]]
+
+    CASTFORM_NORMAL_FORM_MALE_ID: ClassVar[Symbol[None, None]]
+
+    CASTFORM_NORMAL_FORM_FEMALE_ID: ClassVar[Symbol[None, None]]
+
+    CHERRIM_SUNSHINE_FORM_MALE_ID: ClassVar[Symbol[None, None]]
+
+    CHERRIM_OVERCAST_FORM_FEMALE_ID: ClassVar[Symbol[None, None]]
+
+    CHERRIM_SUNSHINE_FORM_FEMALE_ID: ClassVar[Symbol[None, None]]
+
+    FLOOR_GENERATION_STATUS_PTR: ClassVar[Symbol[None, None]]
+
+    OFFSET_OF_DUNGEON_N_NORMAL_ITEM_SPAWNS: ClassVar[Symbol[None, None]]
+
+    DUNGEON_GRID_COLUMN_BYTES: ClassVar[Symbol[None, None]]
+
+    DEFAULT_MAX_POSITION: ClassVar[Symbol[None, None]]
+
+    OFFSET_OF_DUNGEON_GUARANTEED_ITEM_ID: ClassVar[Symbol[None, None]]
+
+    FIXED_ROOM_TILE_SPAWN_TABLE: ClassVar[Symbol[None, None]]
+
+    TREASURE_BOX_1_ITEM_IDS: ClassVar[Symbol[None, None]]
+
+    FIXED_ROOM_REVISIT_OVERRIDES: ClassVar[Symbol[None, None]]
+
+    FIXED_ROOM_MONSTER_SPAWN_TABLE: ClassVar[Symbol[None, None]]
+
+    FIXED_ROOM_ITEM_SPAWN_TABLE: ClassVar[Symbol[None, None]]
+
+    FIXED_ROOM_ENTITY_SPAWN_TABLE: ClassVar[Symbol[None, None]]
+
+    STATUS_ICON_ARRAY_MUZZLED: ClassVar[Symbol[None, None]]
+
+    STATUS_ICON_ARRAY_MAGNET_RISE: ClassVar[Symbol[None, None]]
+
+    STATUS_ICON_ARRAY_MIRACLE_EYE: ClassVar[Symbol[None, None]]
+
+    STATUS_ICON_ARRAY_LEECH_SEED: ClassVar[Symbol[None, None]]
+
+    STATUS_ICON_ARRAY_LONG_TOSS: ClassVar[Symbol[None, None]]
+
+    STATUS_ICON_ARRAY_BLINDED: ClassVar[Symbol[None, None]]
+
+    STATUS_ICON_ARRAY_BURN: ClassVar[Symbol[None, None]]
+
+    STATUS_ICON_ARRAY_SURE_SHOT: ClassVar[Symbol[None, None]]
+
+    STATUS_ICON_ARRAY_INVISIBLE: ClassVar[Symbol[None, None]]
+
+    STATUS_ICON_ARRAY_SLEEP: ClassVar[Symbol[None, None]]
+
+    STATUS_ICON_ARRAY_CURSE: ClassVar[Symbol[None, None]]
+
+    STATUS_ICON_ARRAY_FREEZE: ClassVar[Symbol[None, None]]
+
+    STATUS_ICON_ARRAY_CRINGE: ClassVar[Symbol[None, None]]
+
+    STATUS_ICON_ARRAY_BIDE: ClassVar[Symbol[None, None]]
+
+    STATUS_ICON_ARRAY_REFLECT: ClassVar[Symbol[None, None]]
+
+    DIRECTIONS_XY: ClassVar[Symbol[None, None]]
+
+    DISPLACEMENTS_WITHIN_2_LARGEST_FIRST: ClassVar[Symbol[None, None]]
+
+    DISPLACEMENTS_WITHIN_2_SMALLEST_FIRST: ClassVar[Symbol[None, None]]
+
+    DISPLACEMENTS_WITHIN_3: ClassVar[Symbol[None, None]]
+
+    ITEM_CATEGORY_ACTIONS: ClassVar[Symbol[None, None]]
+
+    FRACTIONAL_TURN_SEQUENCE: ClassVar[Symbol[None, None]]
+
+    BELLY_DRAIN_IN_WALLS_INT: ClassVar[Symbol[None, None]]
+
+    BELLY_DRAIN_IN_WALLS_THOUSANDTHS: ClassVar[Symbol[None, None]]
+
+    DAMAGE_MULTIPLIER_0_5: ClassVar[Symbol[None, None]]
+
+    DAMAGE_MULTIPLIER_1_5: ClassVar[Symbol[None, None]]
+
+    DAMAGE_MULTIPLIER_2: ClassVar[Symbol[None, None]]
+
+    CLOUDY_DAMAGE_MULTIPLIER: ClassVar[Symbol[None, None]]
+
+    SOLID_ROCK_MULTIPLIER: ClassVar[Symbol[None, None]]
+
+    DAMAGE_FORMULA_MAX_BASE: ClassVar[Symbol[None, None]]
+
+    WONDER_GUARD_MULTIPLIER: ClassVar[Symbol[None, None]]
+
+    DAMAGE_FORMULA_MIN_BASE: ClassVar[Symbol[None, None]]
+
+    TYPE_DAMAGE_NEGATING_EXCLUSIVE_ITEM_EFFECTS: ClassVar[Symbol[None, None]]
+
+    TWO_TURN_STATUSES: ClassVar[Symbol[None, None]]
+
+    TWO_TURN_MOVES_AND_STATUSES: ClassVar[Symbol[None, None]]
+
+    SPATK_STAT_IDX: ClassVar[Symbol[None, None]]
+
+    ATK_STAT_IDX: ClassVar[Symbol[None, None]]
+
+    ROLLOUT_DAMAGE_MULT_TABLE: ClassVar[Symbol[None, None]]
+
+    MAP_COLOR_TABLE: ClassVar[Symbol[None, None]]
+
+    CORNER_CARDINAL_NEIGHBOR_IS_OPEN: ClassVar[Symbol[None, None]]
+
+    GUMMI_LIKE_STRING_IDS: ClassVar[Symbol[None, None]]
+
+    GUMMI_IQ_STRING_IDS: ClassVar[Symbol[None, None]]
+
+    DAMAGE_STRING_IDS: ClassVar[Symbol[None, None]]
+
+    DUNGEON_PTR: ClassVar[Symbol[None, None]]
+
+    DUNGEON_PTR_MASTER: ClassVar[Symbol[None, None]]
+
+    TOP_SCREEN_STATUS_PTR: ClassVar[Symbol[None, None]]
+
+    LEADER_PTR: ClassVar[Symbol[None, None]]
+
+    DUNGEON_PRNG_STATE: ClassVar[Symbol[None, None]]
+
+    DUNGEON_PRNG_STATE_SECONDARY_VALUES: ClassVar[Symbol[None, None]]
+
+    LOADED_ATTACK_SPRITE_FILE_INDEX: ClassVar[Symbol[None, None]]
+
+    LOADED_ATTACK_SPRITE_PACK_ID: ClassVar[Symbol[None, None]]
+
+    EXCL_ITEM_EFFECTS_WEATHER_ATK_SPEED_BOOST: ClassVar[Symbol[None, None]]
+
+    EXCL_ITEM_EFFECTS_WEATHER_MOVE_SPEED_BOOST: ClassVar[Symbol[None, None]]
+
+    EXCL_ITEM_EFFECTS_WEATHER_NO_STATUS: ClassVar[Symbol[None, None]]
+
+    AI_THROWN_ITEM_ACTION_CHOICE_COUNT: ClassVar[Symbol[None, None]]
+
+    EXCL_ITEM_EFFECTS_EVASION_BOOST: ClassVar[Symbol[None, None]]
+
+    DEFAULT_TILE: ClassVar[Symbol[None, None]]
+
+    HIDDEN_STAIRS_SPAWN_BLOCKED: ClassVar[Symbol[None, None]]
+
+    FIXED_ROOM_DATA_PTR: ClassVar[Symbol[None, None]]
+
+    DUNGEON_FADES_PTR: ClassVar[Symbol[None, None]]
+
+    NECTAR_IQ_BOOST: ClassVar[Symbol[None, None]]
+
+    COMPRESSED_SPRITE_BUFFER_SIZE: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay29Section(
+    Section,
+    name="overlay29",
+    description="The dungeon engine.\n\nThis is the 'main' overlay of dungeon mode. It controls most things that happen in a Mystery Dungeon, such as dungeon layout generation, dungeon menus, enemy AI, and generally just running each turn while within a dungeon.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay29Functions,
+    data=JpItcmOverlay29Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay29Functions]]
+    data: ClassVar[type[JpItcmOverlay29Data]]
+
+class JpItcmOverlay3Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay3Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay3Section(
+    Section,
+    name="overlay3",
+    description="Controls the Friend Rescue submenu within the top menu.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay3Functions,
+    data=JpItcmOverlay3Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay3Functions]]
+    data: ClassVar[type[JpItcmOverlay3Data]]
+
+class JpItcmOverlay30Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    WriteQuicksaveData: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay30Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    OVERLAY30_JP_STRING_1: ClassVar[Symbol[None, None]]
+
+    OVERLAY30_JP_STRING_2: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay30Section(
+    Section,
+    name="overlay30",
+    description="Controls quicksaving in dungeons.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay30Functions,
+    data=JpItcmOverlay30Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay30Functions]]
+    data: ClassVar[type[JpItcmOverlay30Data]]
+
+class JpItcmOverlay31Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    EntryOverlay31: ClassVar[Symbol[None, None]]
+
+    DrawDungeonMenuStatusWindow: ClassVar[Symbol[None, None]]
+
+    DungeonMenuSwitch: ClassVar[Symbol[None, None]]
+
+    CreateStairsMenuState: ClassVar[Symbol[None, None]]
+
+    StairsSubheadingCallback: ClassVar[Symbol[None, None]]
+
+    HandleStairsMenu: ClassVar[Symbol[None, None]]
+
+    MovesMenu: ClassVar[Symbol[None, None]]
+
+    HandleMovesMenuWrapper0: ClassVar[Symbol[None, None]]
+
+    HandleMovesMenuWrapper1: ClassVar[Symbol[None, None]]
+
+    HandleMovesMenu: ClassVar[Symbol[None, None]]
+
+    TeamMenu: ClassVar[Symbol[None, None]]
+
+    RestMenu: ClassVar[Symbol[None, None]]
+
+    RecruitmentSearchMenuLoop: ClassVar[Symbol[None, None]]
+
+    HelpMenuLoop: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay31Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    DUNGEON_WINDOW_PARAMS_1: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_2: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_3: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_4: ClassVar[Symbol[None, None]]
+
+    DUNGEON_MAIN_MENU_ITEMS: ClassVar[Symbol[None, None]]
+
+    DUNGEON_MENU_SWITCH_STR1: ClassVar[Symbol[None, None]]
+
+    OVERLAY31_UNKNOWN_STRING_IDS: ClassVar[Symbol[None, None]]
+
+    OVERLAY31_UNKNOWN_STRUCT__NA_2389E30: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_5: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_6: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_7: ClassVar[Symbol[None, None]]
+
+    DUNGEON_SUBMENU_ITEMS_1: ClassVar[Symbol[None, None]]
+
+    DUNGEON_SUBMENU_ITEMS_2: ClassVar[Symbol[None, None]]
+
+    DUNGEON_SUBMENU_ITEMS_3: ClassVar[Symbol[None, None]]
+
+    DUNGEON_SUBMENU_ITEMS_4: ClassVar[Symbol[None, None]]
+
+    OVERLAY31_UNKNOWN_STRUCT__NA_2389EF0: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_8: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_9: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_10: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_11: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_12: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_13: ClassVar[Symbol[None, None]]
+
+    OVERLAY31_JP_STRING: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_14: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_15: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_16: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_17: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_18: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_19: ClassVar[Symbol[None, None]]
+
+    OVERLAY31_UNKNOWN_STRUCT__NA_2389FE8: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_20: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_21: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_22: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_23: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_24: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_25: ClassVar[Symbol[None, None]]
+
+    DUNGEON_SUBMENU_ITEMS_5: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_26: ClassVar[Symbol[None, None]]
+
+    OVERLAY31_UNKNOWN_STRUCT__NA_238A144: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_27: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_28: ClassVar[Symbol[None, None]]
+
+    OVERLAY31_UNKNOWN_STRUCT__NA_238A190: ClassVar[Symbol[None, None]]
+
+    DUNGEON_SUBMENU_ITEMS_6: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_29: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_30: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_31: ClassVar[Symbol[None, None]]
+
+    DUNGEON_WINDOW_PARAMS_32: ClassVar[Symbol[None, None]]
+
+    OVERLAY31_RESERVED_SPACE: ClassVar[Symbol[None, None]]
+
+    OVERLAY31_UNKNOWN_POINTER__NA_238A260: ClassVar[Symbol[None, None]]
+
+    OVERLAY31_UNKNOWN_VALUE__NA_238A264: ClassVar[Symbol[None, None]]
+
+    OVERLAY31_UNKNOWN_POINTER__NA_238A268: ClassVar[Symbol[None, None]]
+
+    OVERLAY31_UNKNOWN_POINTER__NA_238A26C: ClassVar[Symbol[None, None]]
+
+    OVERLAY31_UNKNOWN_POINTER__NA_238A270: ClassVar[Symbol[None, None]]
+
+    OVERLAY31_UNKNOWN_POINTER__NA_238A274: ClassVar[Symbol[None, None]]
+
+    OVERLAY31_UNKNOWN_POINTER__NA_238A278: ClassVar[Symbol[None, None]]
+
+    OVERLAY31_UNKNOWN_POINTER__NA_238A27C: ClassVar[Symbol[None, None]]
+
+    OVERLAY31_UNKNOWN_POINTER__NA_238A280: ClassVar[Symbol[None, None]]
+
+    OVERLAY31_UNKNOWN_POINTER__NA_238A284: ClassVar[Symbol[None, None]]
+
+    OVERLAY31_UNKNOWN_POINTER__NA_238A288: ClassVar[Symbol[None, None]]
+
+    OVERLAY31_UNKNOWN_POINTER__NA_238A28C: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay31Section(
+    Section,
+    name="overlay31",
+    description="Controls the dungeon menu (during dungeon mode).",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay31Functions,
+    data=JpItcmOverlay31Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay31Functions]]
+    data: ClassVar[type[JpItcmOverlay31Data]]
+
+class JpItcmOverlay32Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay32Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay32Section(
+    Section,
+    name="overlay32",
+    description="Unused; all zeroes.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay32Functions,
+    data=JpItcmOverlay32Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay32Functions]]
+    data: ClassVar[type[JpItcmOverlay32Data]]
+
+class JpItcmOverlay33Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay33Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay33Section(
+    Section,
+    name="overlay33",
+    description="Unused; all zeroes.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay33Functions,
+    data=JpItcmOverlay33Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay33Functions]]
+    data: ClassVar[type[JpItcmOverlay33Data]]
+
+class JpItcmOverlay34Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    ExplorersOfSkyMain: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay34Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    OVERLAY34_UNKNOWN_STRUCT__NA_22DD014: ClassVar[Symbol[None, None]]
+
+    START_MENU_ITEMS_CONFIRM: ClassVar[Symbol[None, None]]
+
+    OVERLAY34_UNKNOWN_STRUCT__NA_22DD03C: ClassVar[Symbol[None, None]]
+
+    DUNGEON_DEBUG_MENU_ITEMS: ClassVar[Symbol[None, None]]
+
+    OVERLAY34_RESERVED_SPACE: ClassVar[Symbol[None, None]]
+
+    OVERLAY34_UNKNOWN_POINTER__NA_22DD080: ClassVar[Symbol[None, None]]
+
+    OVERLAY34_UNKNOWN_POINTER__NA_22DD084: ClassVar[Symbol[None, None]]
+
+    OVERLAY34_UNKNOWN_POINTER__NA_22DD088: ClassVar[Symbol[None, None]]
+
+    OVERLAY34_UNKNOWN_POINTER__NA_22DD08C: ClassVar[Symbol[None, None]]
+
+    OVERLAY34_UNKNOWN_POINTER__NA_22DD090: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay34Section(
+    Section,
+    name="overlay34",
+    description="Related to launching the game.\n\nThere are mention in the strings of logos like the ESRB logo. This only seems to be loaded during the ESRB rating splash screen, so this is likely the sole purpose of this overlay.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay34Functions,
+    data=JpItcmOverlay34Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay34Functions]]
+    data: ClassVar[type[JpItcmOverlay34Data]]
+
+class JpItcmOverlay35Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay35Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay35Section(
+    Section,
+    name="overlay35",
+    description="Unused; all zeroes.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay35Functions,
+    data=JpItcmOverlay35Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay35Functions]]
+    data: ClassVar[type[JpItcmOverlay35Data]]
+
+class JpItcmOverlay4Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay4Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay4Section(
+    Section,
+    name="overlay4",
+    description="Controls the Trade Items submenu within the top menu.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay4Functions,
+    data=JpItcmOverlay4Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay4Functions]]
+    data: ClassVar[type[JpItcmOverlay4Data]]
+
+class JpItcmOverlay5Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay5Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay5Section(
+    Section,
+    name="overlay5",
+    description="Controls the Trade Team submenu within the top menu.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay5Functions,
+    data=JpItcmOverlay5Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay5Functions]]
+    data: ClassVar[type[JpItcmOverlay5Data]]
+
+class JpItcmOverlay6Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay6Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay6Section(
+    Section,
+    name="overlay6",
+    description="Controls the Wonder Mail S submenu within the top menu.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay6Functions,
+    data=JpItcmOverlay6Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay6Functions]]
+    data: ClassVar[type[JpItcmOverlay6Data]]
+
+class JpItcmOverlay7Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay7Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay7Section(
+    Section,
+    name="overlay7",
+    description="Controls the Nintendo WFC submenu within the top menu (under 'Other').",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay7Functions,
+    data=JpItcmOverlay7Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay7Functions]]
+    data: ClassVar[type[JpItcmOverlay7Data]]
+
+class JpItcmOverlay8Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay8Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmOverlay8Section(
+    Section,
+    name="overlay8",
+    description="Controls the Send Demo Dungeon submenu within the top menu (under 'Other').",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay8Functions,
+    data=JpItcmOverlay8Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay8Functions]]
+    data: ClassVar[type[JpItcmOverlay8Data]]
+
+class JpItcmOverlay9Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    CreateJukeboxTrackMenu: ClassVar[Symbol[None, None]]
+
+    CloseJukeboxTrackMenu: ClassVar[Symbol[None, None]]
+
+    IsJukeboxTrackMenuActive: ClassVar[Symbol[None, None]]
+
+    UpdateJukeboxTrackMenu: ClassVar[Symbol[None, None]]
+
+    CreatePlaybackControlsMenu: ClassVar[Symbol[None, None]]
+
+    ClosePlaybackControlsMenu: ClassVar[Symbol[None, None]]
+
+    IsPlaybackControlsMenuActive: ClassVar[Symbol[None, None]]
+
+    UpdatePlaybackControlsMenu: ClassVar[Symbol[None, None]]
+
+    CreateInputLockBox: ClassVar[Symbol[None, None]]
+
+    CloseInputLockBox: ClassVar[Symbol[None, None]]
+
+    IsInputLockBoxActive: ClassVar[Symbol[None, None]]
+
+    UpdateInputLockBox: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay9Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    JUKEBOX_TRACK_MENU_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[None, None]]
+
+    PLAYBACK_CONTROLS_MENU_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[None, None]]
+
+    INPUT_LOCK_BOX_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[None, None]]
+
+    TOP_MENU_RETURN_MUSIC_ID: ClassVar[Symbol[None, None]]
+
+class JpItcmOverlay9Section(
+    Section,
+    name="overlay9",
+    description="Controls the Sky Jukebox.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmOverlay9Functions,
+    data=JpItcmOverlay9Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmOverlay9Functions]]
+    data: ClassVar[type[JpItcmOverlay9Data]]
+
+class JpItcmRamFunctions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class JpItcmRamData(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    DEFAULT_MEMORY_ARENA_MEMORY: ClassVar[Symbol[None, None]]
+
+    GROUND_MEMORY_ARENA_2: ClassVar[Symbol[None, None]]
+
+    GROUND_MEMORY_ARENA_2_BLOCKS: ClassVar[Symbol[None, None]]
+
+    GROUND_MEMORY_ARENA_2_MEMORY: ClassVar[Symbol[None, None]]
+
+    DUNGEON_COLORMAP_PTR: ClassVar[Symbol[None, None]]
+
+    DUNGEON_STRUCT: ClassVar[Symbol[None, None]]
+
+    MOVE_DATA_TABLE: ClassVar[Symbol[None, None]]
+
+    SOUND_MEMORY_ARENA: ClassVar[Symbol[None, None]]
+
+    SOUND_MEMORY_ARENA_BLOCKS: ClassVar[Symbol[None, None]]
+
+    SOUND_MEMORY_ARENA_MEMORY: ClassVar[Symbol[None, None]]
+
+    FRAMES_SINCE_LAUNCH: ClassVar[Symbol[None, None]]
+
+    TOUCHSCREEN_STATUS: ClassVar[Symbol[None, None]]
+
+    BAG_ITEMS: ClassVar[Symbol[None, None]]
+
+    BAG_ITEMS_PTR: ClassVar[Symbol[None, None]]
+
+    STORAGE_ITEMS: ClassVar[Symbol[None, None]]
+
+    STORAGE_ITEM_QUANTITIES: ClassVar[Symbol[None, None]]
+
+    KECLEON_SHOP_ITEMS_PTR: ClassVar[Symbol[None, None]]
+
+    KECLEON_SHOP_ITEMS: ClassVar[Symbol[None, None]]
+
+    UNUSED_KECLEON_SHOP_ITEMS: ClassVar[Symbol[None, None]]
+
+    KECLEON_WARES_ITEMS_PTR: ClassVar[Symbol[None, None]]
+
+    KECLEON_WARES_ITEMS: ClassVar[Symbol[None, None]]
+
+    UNUSED_KECLEON_WARES_ITEMS: ClassVar[Symbol[None, None]]
+
+    MONEY_CARRIED: ClassVar[Symbol[None, None]]
+
+    MONEY_STORED: ClassVar[Symbol[None, None]]
+
+    AUDIO_COMMANDS_BUFFER: ClassVar[Symbol[None, None]]
+
+    SOUND_MEMORY_ARENA_PTR: ClassVar[Symbol[None, None]]
+
+    WINDOW_LIST: ClassVar[Symbol[None, None]]
+
+    CURSOR_16_SPRITE_ID: ClassVar[Symbol[None, None]]
+
+    CURSOR_SPRITE_ID: ClassVar[Symbol[None, None]]
+
+    CURSOR_ANIMATION_CONTROL: ClassVar[Symbol[None, None]]
+
+    CURSOR_16_ANIMATION_CONTROL: ClassVar[Symbol[None, None]]
+
+    ALERT_SPRITE_ID: ClassVar[Symbol[None, None]]
+
+    ALERT_ANIMATION_CONTROL: ClassVar[Symbol[None, None]]
+
+    LAST_NEW_MOVE: ClassVar[Symbol[None, None]]
+
+    SCRIPT_VARS_VALUES: ClassVar[Symbol[None, None]]
+
+    BAG_LEVEL: ClassVar[Symbol[None, None]]
+
+    DEBUG_SPECIAL_EPISODE_NUMBER: ClassVar[Symbol[None, None]]
+
+    KAOMADO_STREAM: ClassVar[Symbol[None, None]]
+
+    PENDING_DUNGEON_ID: ClassVar[Symbol[None, None]]
+
+    PENDING_STARTING_FLOOR: ClassVar[Symbol[None, None]]
+
+    PLAY_TIME_SECONDS: ClassVar[Symbol[None, None]]
+
+    PLAY_TIME_FRAME_COUNTER: ClassVar[Symbol[None, None]]
+
+    TEAM_NAME: ClassVar[Symbol[None, None]]
+
+    LEVEL_UP_DATA_MONSTER_ID: ClassVar[Symbol[None, None]]
+
+    LEVEL_UP_DATA_DECOMPRESS_BUFFER: ClassVar[Symbol[None, None]]
+
+    TEAM_MEMBER_TABLE: ClassVar[Symbol[None, None]]
+
+    DRIVER_WORK: ClassVar[Symbol[None, None]]
+
+    DISP_MODE: ClassVar[Symbol[None, None]]
+
+    GXI_VRAM_LOCK_ID: ClassVar[Symbol[None, None]]
+
+    ENABLED_VRAM_BANKS: ClassVar[Symbol[None, None]]
+
+    SUB_BG_EXT_PLTT: ClassVar[Symbol[None, None]]
+
+    CLR_IMG: ClassVar[Symbol[None, None]]
+
+    THREAD_INFO_STRUCT: ClassVar[Symbol[None, None]]
+
+    FRAMES_SINCE_LAUNCH_TIMES_THREE: ClassVar[Symbol[None, None]]
+
+    GROUND_MEMORY_ARENA_1_PTR: ClassVar[Symbol[None, None]]
+
+    GROUND_MEMORY_ARENA_2_PTR: ClassVar[Symbol[None, None]]
+
+    LOCK_NOTIFY_ARRAY: ClassVar[Symbol[None, None]]
+
+    GROUND_MEMORY_ARENA_1: ClassVar[Symbol[None, None]]
+
+    GROUND_MEMORY_ARENA_1_BLOCKS: ClassVar[Symbol[None, None]]
+
+    GROUND_MEMORY_ARENA_1_MEMORY: ClassVar[Symbol[None, None]]
+
+    SENTRY_DUTY_STRUCT: ClassVar[Symbol[None, None]]
+
+    TURNING_ON_THE_SPOT_FLAG: ClassVar[Symbol[None, None]]
+
+    LOADED_ATTACK_SPRITE_DATA: ClassVar[Symbol[None, None]]
+
+    AI_THROWN_ITEM_DIRECTION_IS_USED: ClassVar[Symbol[None, None]]
+
+    AI_THROWN_ITEM_PROBABILITIES: ClassVar[Symbol[None, None]]
+
+    AI_THROWN_ITEM_DIRECTIONS: ClassVar[Symbol[None, None]]
+
+    ROLLOUT_ICE_BALL_MISSED: ClassVar[Symbol[None, None]]
+
+    MULTIHIT_FATIGUE_MOVE_USED: ClassVar[Symbol[None, None]]
+
+    TWINEEDLE_HIT_TRACKER: ClassVar[Symbol[None, None]]
+
+    RAPID_SPIN_BINDING_REMOVAL: ClassVar[Symbol[None, None]]
+
+    ROLLOUT_ICE_BALL_SUCCESSIVE_HITS: ClassVar[Symbol[None, None]]
+
+    MULTIHIT_MOVE_SUCCESSIVE_HITS: ClassVar[Symbol[None, None]]
+
+    TRIPLE_KICK_SUCCESSIVE_HITS: ClassVar[Symbol[None, None]]
+
+    METRONOME_NEXT_INDEX: ClassVar[Symbol[None, None]]
+
+    FLOOR_GENERATION_STATUS: ClassVar[Symbol[None, None]]
+
+    STAIRS_MENU_PTR: ClassVar[Symbol[None, None]]
+
+class JpItcmRamSection(
+    Section,
+    name="ram",
+    description="Main memory.\nData in this file aren't located in the ROM itself, and are instead constructs loaded at runtime.\n\nMore specifically, this file is a dumping ground for addresses that are useful to know about, but don't fall in the address ranges of any of the other files. Dynamically loaded constructs that do fall within the address range of a relevant binary should be listed in the corresponding YAML file of that binary, since it still has direct utility when reverse-engineering that particular binary.",
+    loadaddress=None,
+    length=None,
+    functions=JpItcmRamFunctions,
+    data=JpItcmRamData,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[None]
+    length: ClassVar[None]
+    functions: ClassVar[type[JpItcmRamFunctions]]
+    data: ClassVar[type[JpItcmRamData]]
+
+class JpItcmSections:
+
+    arm7: ClassVar[type[JpItcmArm7Section]]
+
+    arm9: ClassVar[type[JpItcmArm9Section]]
+
+    itcm: ClassVar[type[JpItcmItcmSection]]
+
+    libs: ClassVar[type[JpItcmLibsSection]]
+
+    move_effects: ClassVar[type[JpItcmMove_effectsSection]]
+
+    overlay0: ClassVar[type[JpItcmOverlay0Section]]
+
+    overlay1: ClassVar[type[JpItcmOverlay1Section]]
+
+    overlay10: ClassVar[type[JpItcmOverlay10Section]]
+
+    overlay11: ClassVar[type[JpItcmOverlay11Section]]
+
+    overlay12: ClassVar[type[JpItcmOverlay12Section]]
+
+    overlay13: ClassVar[type[JpItcmOverlay13Section]]
+
+    overlay14: ClassVar[type[JpItcmOverlay14Section]]
+
+    overlay15: ClassVar[type[JpItcmOverlay15Section]]
+
+    overlay16: ClassVar[type[JpItcmOverlay16Section]]
+
+    overlay17: ClassVar[type[JpItcmOverlay17Section]]
+
+    overlay18: ClassVar[type[JpItcmOverlay18Section]]
+
+    overlay19: ClassVar[type[JpItcmOverlay19Section]]
+
+    overlay2: ClassVar[type[JpItcmOverlay2Section]]
+
+    overlay20: ClassVar[type[JpItcmOverlay20Section]]
+
+    overlay21: ClassVar[type[JpItcmOverlay21Section]]
+
+    overlay22: ClassVar[type[JpItcmOverlay22Section]]
+
+    overlay23: ClassVar[type[JpItcmOverlay23Section]]
+
+    overlay24: ClassVar[type[JpItcmOverlay24Section]]
+
+    overlay25: ClassVar[type[JpItcmOverlay25Section]]
+
+    overlay26: ClassVar[type[JpItcmOverlay26Section]]
+
+    overlay27: ClassVar[type[JpItcmOverlay27Section]]
+
+    overlay28: ClassVar[type[JpItcmOverlay28Section]]
+
+    overlay29: ClassVar[type[JpItcmOverlay29Section]]
+
+    overlay3: ClassVar[type[JpItcmOverlay3Section]]
+
+    overlay30: ClassVar[type[JpItcmOverlay30Section]]
+
+    overlay31: ClassVar[type[JpItcmOverlay31Section]]
+
+    overlay32: ClassVar[type[JpItcmOverlay32Section]]
+
+    overlay33: ClassVar[type[JpItcmOverlay33Section]]
+
+    overlay34: ClassVar[type[JpItcmOverlay34Section]]
+
+    overlay35: ClassVar[type[JpItcmOverlay35Section]]
+
+    overlay4: ClassVar[type[JpItcmOverlay4Section]]
+
+    overlay5: ClassVar[type[JpItcmOverlay5Section]]
+
+    overlay6: ClassVar[type[JpItcmOverlay6Section]]
+
+    overlay7: ClassVar[type[JpItcmOverlay7Section]]
+
+    overlay8: ClassVar[type[JpItcmOverlay8Section]]
+
+    overlay9: ClassVar[type[JpItcmOverlay9Section]]
+
+    ram: ClassVar[type[JpItcmRamSection]]
+
+SECTIONS: dict[str, type[Section]]
+SYMBOLS_BY_ABSOLUTE_ADDRESS: dict[int, list[tuple[str, Symbol]]]
+
+def sections_at(address: int) -> list[type[Section]]: ...
+def symbols_named(name: str) -> list[tuple[str, Symbol]]: ...
+def resolve(address: int) -> list[tuple[str, Symbol]]: ...
@@ -0,0 +1,8779 @@
+# Type declarations of pmdsky_debug_py.na.
+# The symbols are only created on first access at runtime, so they are declared here for type checkers.
+from collections.abc import Iterator
+from typing import ClassVar
+
+from .protocol import Symbol, Section, LazySymbols
+
+class NaArm7Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    _start_arm7: ClassVar[Symbol[tuple[int, ...], None]]
+
+    do_autoload_arm7: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StartAutoloadDoneCallbackArm7: ClassVar[Symbol[tuple[int, ...], None]]
+
+    NitroSpMain: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HardwareInterrupt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ReturnFromInterrupt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AudioInterrupt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ClearImeFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ClearIeFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetCurrentPlaybackTime: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ClearIrqFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EnableIrqFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetIrqFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EnableIrqFiqFlags: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetIrqFiqFlags: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetProcessorMode: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _s32_div_f: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _u32_div_f: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _u32_div_not_0_f: ClassVar[Symbol[tuple[int, ...], None]]
+
+    __divsi3: ClassVar[Symbol[tuple[int, ...], None]]
+
+    __udivsi3: ClassVar[Symbol[tuple[int, ...], None]]
+
+    __udivsi3_no_zero_check: ClassVar[Symbol[tuple[int, ...], None]]
+
+class NaArm7Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaArm7Section(
+    Section,
+    name="arm7",
+    description="The ARM7 binary.\n\nThis is the secondary binary that gets loaded when the game is launched.\n\nSpeaking generally, this is the program run by the Nintendo DS's secondary ARM7TDMI CPU, which handles the audio I/O, the touch screen, Wi-Fi functions, cryptography, and more.\n\nMemory map: (binary is initially loaded at 0x2380000)\n0x2380000-0x23801E8 => Contains _start_arm7 and two more methods, all related to memory mapping.\n0x23801E8-0x238F7F0 => Mapped to 0x37F8000, contains NitroSpMain and functions crucial to execution.\n0x238F7F0-0x23A7068 => Mapped to 0x27E0000, contains everything else that won't fit in the fast WRAM.\n\nNote that while the length for the main EU/NA/JP block is defined as 0x27080 above, after memory mappings, the block located at that address is only a 0x1E8 long ENTRY block, containing 3 functions solely used for the initial memory mapping. The memory following this block is reused and its purpose is undocumented at the moment.",
+    loadaddress=0x2380000,
+    length=0x27080,
+    functions=NaArm7Functions,
+    data=NaArm7Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaArm7Functions]]
+    data: ClassVar[type[NaArm7Data]]
+
+class NaArm9Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    Svc_SoftReset: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Svc_WaitByLoop: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Svc_CpuSet: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _start: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitI_CpuClear32: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MIi_UncompressBackward: ClassVar[Symbol[tuple[int, ...], None]]
+
+    do_autoload: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StartAutoloadDoneCallback: ClassVar[Symbol[tuple[int, ...], None]]
+
+    init_cp15: ClassVar[Symbol[tuple[int, ...], None]]
+
+    OSi_ReferSymbol: ClassVar[Symbol[tuple[int, ...], None]]
+
+    NitroMain: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitMemAllocTable: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetMemAllocatorParams: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetAllocArenaDefault: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetFreeArenaDefault: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitMemArena: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MemAllocFlagsToBlockType: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FindAvailableMemBlock: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SplitMemBlock: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MemAlloc: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MemFree: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MemArenaAlloc: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateMemArena: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MemLocateSet: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MemLocateUnset: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RoundUpDiv256: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UFixedPoint64CmpLt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MultiplyByFixedPoint: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UMultiplyByFixedPoint: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IntToFixedPoint64: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FixedPoint64ToInt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FixedPoint32To64: ClassVar[Symbol[tuple[int, ...], None]]
+
+    NegateFixedPoint64: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FixedPoint64IsZero: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FixedPoint64IsNegative: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FixedPoint64CmpLt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MultiplyFixedPoint64: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DivideFixedPoint64: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UMultiplyFixedPoint64: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UDivideFixedPoint64: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AddFixedPoint64: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ClampedLn: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetRngSeed: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetRngSeed: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Rand16Bit: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RandInt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RandRange: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Rand32Bit: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RandIntSafe: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RandRangeSafe: ClassVar[Symbol[tuple[int, ...], None]]
+
+    WaitForever: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InterruptMasterDisable: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InterruptMasterEnable: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitMemAllocTableVeneer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ZInit8: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PointsToZero: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MemZero: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MemZero16: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MemZero32: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MemsetSimple: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Memset32: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MemcpySimple: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Memcpy16: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Memcpy32: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TaskProcBoot: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EnableAllInterrupts: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetTime: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DisableAllInterrupts: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SoundResume: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CardPullOutWithStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CardPullOut: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CardBackupError: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HaltProcessDisp: ClassVar[Symbol[tuple[int, ...], None]]
+
+    OverlayIsLoaded: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadOverlay: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UnloadOverlay: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetDsFirmwareUserSettingsVeneer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Rgb8ToRgb5: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EuclideanNorm: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ClampComponentAbs: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetHeldButtons: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetPressedButtons: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetReleasedStylus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    KeyWaitInit: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DebugPrintSystemClock: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetSystemClock: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SprintfSystemClock: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DataTransferInit: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DataTransferStop: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FileInitVeneer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FileOpen: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FileGetSize: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FileRead: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FileSeek: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FileClose: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UnloadFile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadFileFromRom: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TransformPaletteDataWithFlushDivideFade: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateFadeStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HandleFades: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetFadeStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitDebug: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitDebugFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetDebugFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetDebugFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitDebugStripped6: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AppendProgPos: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitDebugStripped5: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DebugPrintTrace: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DebugDisplay: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DebugPrint0: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitDebugLogFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetDebugLogFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetDebugLogFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DebugPrint: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitDebugStripped4: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitDebugStripped3: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitDebugStripped2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitDebugStripped1: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FatalError: ClassVar[Symbol[tuple[int, ...], None]]
+
+    OpenAllPackFiles: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetFileLengthInPackWithPackNb: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadFileInPackWithPackId: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AllocAndLoadFileInPack: ClassVar[Symbol[tuple[int, ...], None]]
+
+    OpenPackFile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetFileLengthInPack: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadFileInPack: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetDungeonResultMsg: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetDamageSource: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetItemCategoryVeneer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetItemMoveId16: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsThrownItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsNotMoney: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsEdible: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsHM: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsGummi: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsAuraBow: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsLosableItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsTreasureBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsStorableItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsShoppableItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsValidTargetItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsItemUsableNow: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsTicketItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitStandardItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitBulkItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    BulkItemToItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ItemToBulkItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetDisplayedBuyPrice: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetDisplayedSellPrice: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetActualBuyPrice: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetActualSellPrice: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FindItemInInventory: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SprintfStatic: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ItemZInit: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AreItemsEquivalent: ClassVar[Symbol[tuple[int, ...], None]]
+
+    WriteItemsToSave: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ReadItemsFromSave: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsItemAvailableInDungeonGroup: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetItemIdFromList: ClassVar[Symbol[tuple[int, ...], None]]
+
+    NormalizeTreasureBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SortItemList: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RemoveEmptyItems: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadItemPspi2n: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetExclusiveItemType: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetExclusiveItemOffsetEnsureValid: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsItemValid: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetExclusiveItemParameter: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetItemCategory: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EnsureValidItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetItemName: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetItemNameFormatted: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetItemBuyPrice: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetItemSellPrice: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetItemSpriteId: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetItemPaletteId: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetItemActionName: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetThrownItemQuantityLimit: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetItemMoveId: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TestItemAiFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsItemInTimeDarkness: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsItemValidVeneer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetActiveInventoryToMain: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AllInventoriesZInit: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SpecialEpisodeInventoryZInit: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RescueInventoryZInit: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetActiveInventory: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMoneyCarried: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetMoneyCarried: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AddMoneyCarried: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetCurrentBagCapacity: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsBagFull: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetNbItemsInBag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CountNbItemsOfTypeInBag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CountItemTypeInBag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsItemInBag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsItemWithFlagsInBag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsItemInTreasureBoxes: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsHeldItemInBag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsItemForSpecialSpawnInBag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HasStorableItems: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetItemIndex: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetEquivItemIndex: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetEquippedThrowableItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetFirstUnequippedItemOfType: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CopyItemAtIdx: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetItemAtIdx: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RemoveEmptyItemsInBag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RemoveItemNoHole: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RemoveItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RemoveHeldItemNoHole: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RemoveItemByIdAndStackNoHole: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RemoveEquivItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RemoveEquivItemNoHole: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DecrementStackItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RemoveItemNoHoleCheck: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RemoveFirstUnequippedItemOfType: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RemoveAllItems: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RemoveAllItemsStartingAt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SpecialProcAddItemToBag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AddItemToBagNoHeld: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AddItemToBag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CleanStickyItemsInBag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CountStickyItemsInBag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TransmuteHeldItemInBag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetFlagsForHeldItemInBag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RemoveHolderForItemInBag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetHolderForItemInBag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SortItemsInBag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RemovePokeItemsInBag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsStorageFull: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CountNbOfItemsInStorage: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CountNbOfValidItemsInStorage: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CountNbOfValidItemsInTimeDarknessInStorage: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CountNbItemsOfTypeInStorage: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CountItemTypeInStorage: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetEquivBulkItemIdxInStorage: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ConvertStorageItemAtIdxToBulkItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ConvertStorageItemAtIdxToItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RemoveItemAtIdxInStorage: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RemoveBulkItemInStorage: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RemoveItemInStorage: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StorageZInit: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AddBulkItemToStorage: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AddItemToStorage: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SortItemsInStorage: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AllKecleonShopsZInit: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SpecialEpisodeKecleonShopZInit: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetActiveKecleonShop: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMoneyStored: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetMoneyStored: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AddMoneyStored: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SortKecleonItems1: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateKecleonItems1: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SortKecleonItems2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateKecleonItems2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetExclusiveItemOffset: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyExclusiveItemStatBoosts: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetExclusiveItemEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ExclusiveItemEffectFlagTest: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsExclusiveItemIdForMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsExclusiveItemForMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    BagHasExclusiveItemTypeForMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetExclusiveItemForMonsterFromBag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetHpBoostFromExclusiveItems: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyGummiBoostsToGroundMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyGummiBoostsToTeamMember: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplySitrusBerryBoostToGroundMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyLifeSeedBoostToGroundMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyGinsengToGroundMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyProteinBoostToGroundMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyCalciumBoostToGroundMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyIronBoostToGroundMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyZincBoostToGroundMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyNectarBoostToGroundMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsMonsterAffectedByGravelyrockGroundMode: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyGravelyrockBoostToGroundMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyGummiBoostsGroundMode: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadSynthBin: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CloseSynthBin: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetSynthItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadWazaP: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadWazaP2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UnloadCurrentWazaP: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMoveName: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FormatMoveString: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FormatMoveStringMore: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitMove: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitMoveCheckId: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetInfoMoveGround: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMoveTargetAndRange: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMoveType: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMovesetLevelUpPtr: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsInvalidMoveset: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMovesetHmTmPtr: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMovesetEggPtr: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMoveAiWeight: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMoveNbStrikes: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMoveBasePower: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMoveBasePowerGround: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMoveAccuracyOrAiChance: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMoveBasePp: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMaxPp: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMoveMaxGinsengBoost: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMoveMaxGinsengBoostGround: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMoveCritChance: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsThawingMove: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsAffectedByTaunt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMoveRangeId: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMoveActualAccuracy: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMoveBasePowerFromId: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsMoveRangeString19: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMoveMessageFromId: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetNbMoves: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMovesetIdx: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsReflectedByMagicCoat: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CanBeSnatched: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FailsWhileMuzzled: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsSoundMove: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsRecoilMove: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AllManip1: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AllManip2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ManipMoves1v1: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ManipMoves1v2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ManipMoves2v1: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ManipMoves2v2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DungeonMoveToGroundMove: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GroundToDungeonMoveset: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DungeonToGroundMoveset: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetInfoGroundMoveset: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FindFirstFreeMovesetIdx: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LearnMoves: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CopyMoveTo: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CopyMoveFrom: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CopyMovesetTo: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CopyMovesetFrom: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Is2TurnsMove: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsRegularAttackOrProjectile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsPunchMove: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsHealingWishOrLunarDance: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsCopyingMove: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsTrappingMove: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsOneHitKoMove: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsNot2TurnsMoveOrSketch: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsRealMove: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsMovesetValid: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsRealMoveInTimeDarkness: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsMovesetValidInTimeDarkness: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetFirstNotRealMoveInTimeDarkness: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsSameMove: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMoveCategory: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetPpIncrease: ClassVar[Symbol[tuple[int, ...], None]]
+
+    OpenWaza: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SelectWaza: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PlayBgmByIdVeneer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PlayBgmByIdVolumeVeneer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PlaySeVolumeWrapper: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PlayBgmById: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PlayBgmByIdVolume: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StopBgmCommand: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PlaySeByIdVolume: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SendAudioCommand2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AllocAudioCommand: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SendAudioCommand: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitSoundSystem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ManipBgmPlayback: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SoundDriverReset: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadDseFile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PlaySeLoad: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsSongOver: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PlayBgm: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StopBgm: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ChangeBgm: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PlayBgm2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StopBgm2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ChangeBgm2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PlayME: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StopME: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PlaySe: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PlaySeFullSpec: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SeChangeVolume: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SeChangePan: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StopSe: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CopyAndInterleaveWrapper: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitAnimationControl: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitAnimationControlWithSet: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetSpriteIdForAnimationControl: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetAnimationForAnimationControlInternal: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetAnimationForAnimationControl: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetWanForAnimationControl: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetAndPlayAnimationForAnimationControl: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SwitchAnimationControlToNextFrame: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadAnimationFrameAndIncrementInAnimationControl: ClassVar[
+        Symbol[tuple[int, ...], None]
+    ]
+
+    AnimationControlGetAllocForMaxFrame: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DeleteWanTableEntry: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AllocateWanTableEntry: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FindWanTableEntry: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetLoadedWanTableEntry: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitWanTable: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadWanTableEntry: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadWanTableEntryFromPack: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadWanTableEntryFromPackUseProvidedMemory: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ReplaceWanFromBinFile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DeleteWanTableEntryVeneer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    WanHasAnimationGroup: ClassVar[Symbol[tuple[int, ...], None]]
+
+    WanTableSpriteHasAnimationGroup: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SpriteTypeInWanTable: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadWteFromRom: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadWteFromFileDirectory: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UnloadWte: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadWtuFromBin: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ProcessWte: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GeomSetTexImageParam: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GeomSetVertexCoord16: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitRender3dData: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GeomSwapBuffers: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitRender3dElement64: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Render3d64Texture0x7: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Render3d64WindowFrame: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EnqueueRender3d64Tiling: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Render3d64Tiling: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Render3d64Quadrilateral: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Render3d64RectangleMulticolor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Render3d64Rectangle: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Render3d64Nothing: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Render3d64Texture: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Render3dElement64: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HandleSir0Translation: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ConvertPointersSir0: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HandleSir0TranslationVeneer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DecompressAtNormalVeneer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DecompressAtNormal: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DecompressAtHalf: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DecompressAtFromMemoryPointerVeneer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DecompressAtFromMemoryPointer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    WriteByteFromMemoryPointer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetAtSize: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetLanguageType: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetLanguage: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StrcmpTag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AtoiTag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AnalyzeText: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PreprocessString: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PreprocessStringFromId: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StrcmpTagVeneer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AtoiTagVeneer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitPreprocessorArgs: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetStringAccuracy: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetStringPower: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetRankString: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetCurrentTeamNameString: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetBagNameString: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetDungeonResultString: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetQuestionMarks: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StrcpySimple: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StrncpySimple: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StrncpySimpleNoPad: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StrncmpSimple: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StrncpySimpleNoPadSafe: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StrcpyName: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StrncpyName: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetStringFromFile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadStringFile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AllocateTemp1024ByteBufferFromPool: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetStringFromFileVeneer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StringFromId: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CopyStringFromId: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CopyNStringFromId: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadTblTalk: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetTalkLine: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsAOrBPressed: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DrawTextInWindow: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetCharWidth: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetColorCodePaletteOffset: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DrawChar: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetWindow: ClassVar[Symbol[tuple[int, ...], None]]
+
+    NewWindowScreenCheck: ClassVar[Symbol[tuple[int, ...], None]]
+
+    NewWindow: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetScreenWindowsColor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetBothScreensWindowsColor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateWindow: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ClearWindow: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DeleteWindow: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetWindowRectangle: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetWindowContents: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadCursors: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitWindowTrailer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Arm9LoadUnkFieldNa0x2029EC8: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Arm9StoreUnkFieldNa0x2029ED8: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadAlert: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PrintClearMark: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PrintBadgeMark: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PrintMark: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateParentMenuFromStringIds: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsEmptyString: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateParentMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateParentMenuWrapper: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateParentMenuInternal: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ResumeParentMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetParentMenuState7: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CloseParentMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsParentMenuActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CheckParentMenuField0x1A0: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateParentMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateSimpleMenuFromStringIds: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateSimpleMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateSimpleMenuInternal: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ResumeSimpleMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CloseSimpleMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsSimpleMenuActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CheckSimpleMenuField0x1A0: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetSimpleMenuField0x1A4: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetSimpleMenuResult: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateSimpleMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetSimpleMenuField0x1AC: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateAdvancedMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ResumeAdvancedMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CloseAdvancedMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsAdvancedMenuActive2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsAdvancedMenuActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetAdvancedMenuCurrentOption: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetAdvancedMenuResult: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateAdvancedMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateCollectionMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetCollectionMenuField0x1BC: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetCollectionMenuWidth: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CloseCollectionMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsCollectionMenuActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetCollectionMenuField0x1C8: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetCollectionMenuField0x1A0: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetCollectionMenuField0x1A4: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetCollectionMenuVoidFn: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateCollectionMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetCollectionMenuField0x1B2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsCollectionMenuState3: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateOptionsMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CloseOptionsMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsOptionsMenuActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CheckOptionsMenuField0x1A4: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetOptionsMenuStates: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetOptionsMenuResult: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateOptionsMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateDebugMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CloseDebugMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsDebugMenuActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CheckDebugMenuField0x1A4: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateDebugMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateScrollBoxSingle: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateScrollBoxMulti: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetScrollBoxState7: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CloseScrollBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsScrollBoxActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateScrollBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateDialogueBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CloseDialogueBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsDialogueBoxActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ShowStringIdInDialogueBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ShowStringInDialogueBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ShowDialogueBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ReadStringFromDialogueBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateDialogueBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreatePortraitBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ClosePortraitBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PortraitBoxNeedsUpdate: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ShowPortraitInPortraitBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HidePortraitBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdatePortraitBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateTextBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateTextBoxWithArg: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CloseTextBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CloseTextBox2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateTextBoxInternal: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateTextBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsTextBoxActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateAreaNameBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetAreaNameBoxState3: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CloseAreaNameBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsAreaNameBoxActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateAreaNameBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateControlsChart: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CloseControlsChart: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsControlsChartActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateControlsChart: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateAlertBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CloseAlertBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsAlertBoxActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateAlertBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateAdvancedTextBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateAdvancedTextBoxWithArg: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateAdvancedTextBoxInternal: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetAdvancedTextBoxPartialMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetAdvancedTextBoxField0x1C4: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetAdvancedTextBoxField0x1C2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CloseAdvancedTextBox2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetAdvancedTextBoxState5: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CloseAdvancedTextBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsAdvancedTextBoxActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetAdvancedTextBoxFlags2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetUnkAdvancedTextBoxFn: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetUnkAdvancedTextBoxWindowFn: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateAdvancedTextBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PlayAdvancedTextBoxInputSound: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateTeamSelectionMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CloseTeamSelectionMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsTeamSelectionMenuActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateTeamSelectionMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsTeamSelectionMenuState3: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CalcMenuHeightDiv8: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitWindowInput: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsMenuOptionActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PlayWindowInputSound: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitInventoryMenuInput: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ShowKeyboard: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetKeyboardStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetKeyboardStringResult: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TeamSelectionMenuGetItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PrintMoveOptionMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PrintIqSkillsMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetNotifyNote: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetNotifyNote: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitSpecialEpisodeHero: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EventFlagBackupVeneer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitMainTeamAfterQuiz: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitSpecialEpisodePartners: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitSpecialEpisodeExtraPartner: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ReadStringSave: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CheckStringSave: ClassVar[Symbol[tuple[int, ...], None]]
+
+    WriteSaveFile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ReadSaveFile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CalcChecksum: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CheckChecksumInvalid: ClassVar[Symbol[tuple[int, ...], None]]
+
+    NoteSaveBase: ClassVar[Symbol[tuple[int, ...], None]]
+
+    WriteQuickSaveInfo: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ReadSaveHeader: ClassVar[Symbol[tuple[int, ...], None]]
+
+    NoteLoadBase: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ReadQuickSaveInfo: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetGameMode: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitScriptVariableValues: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitEventFlagScriptVars: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ZinitScriptVariable: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadScriptVariableRaw: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadScriptVariableValue: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadScriptVariableValueAtIndex: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SaveScriptVariableValue: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SaveScriptVariableValueAtIndex: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadScriptVariableValueSum: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadScriptVariableValueBytes: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SaveScriptVariableValueBytes: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ScriptVariablesEqual: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EventFlagResume: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EventFlagBackup: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DumpScriptVariableValues: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RestoreScriptVariableValues: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitScenarioScriptVars: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetScenarioScriptVar: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetSpecialEpisodeType: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetSpecialEpisodeType: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetExecuteSpecialEpisodeType: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsSpecialEpisodeOpen: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HasPlayedOldGame: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetPerformanceFlagWithChecks: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetScenarioBalance: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ScenarioFlagBackup: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitWorldMapScriptVars: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitDungeonListScriptVars: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetDungeonConquest: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetDungeonMode: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GlobalProgressAlloc: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ResetGlobalProgress: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetMonsterFlag1: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMonsterFlag1: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetMonsterFlag2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HasMonsterBeenAttackedInDungeons: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetDungeonTipShown: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetDungeonTipShown: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetMaxReachedFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMaxReachedFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IncrementNbAdventures: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetNbAdventures: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CanMonsterSpawn: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IncrementExclusiveMonsterCounts: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CopyProgressInfoTo: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CopyProgressInfoFromScratchTo: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CopyProgressInfoFrom: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CopyProgressInfoFromScratchFrom: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitKaomadoStream: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitPortraitParams: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitPortraitParamsWithMonsterId: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetPortraitEmotion: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetPortraitLayout: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetPortraitOffset: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AllowPortraitDefault: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsValidPortrait: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadPortrait: ClassVar[Symbol[tuple[int, ...], None]]
+
+    WonderMailPasswordToMission: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetEnterDungeon: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitDungeonInit: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsNoLossPenaltyDungeon: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CheckMissionRestrictions: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetNbFloors: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetNbFloorsPlusOne: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetDungeonGroup: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetNbPrecedingFloors: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetNbFloorsDungeonGroup: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DungeonFloorToGroupFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMissionRank: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetOutlawLevel: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetOutlawLeaderLevel: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetOutlawMinionLevel: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AddGuestMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetGroundNameId: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetAdventureLogStructLocation: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetAdventureLogDungeonFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetAdventureLogDungeonFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ClearAdventureLogStruct: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetAdventureLogCompleted: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsAdventureLogNotEmpty: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetAdventureLogCompleted: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IncrementNbDungeonsCleared: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetNbDungeonsCleared: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IncrementNbFriendRescues: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetNbFriendRescues: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IncrementNbEvolutions: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetNbEvolutions: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IncrementNbSteals: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IncrementNbEggsHatched: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetNbEggsHatched: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetNbPokemonJoined: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetNbMovesLearned: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetVictoriesOnOneFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetVictoriesOnOneFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetPokemonJoined: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetPokemonBattled: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetNbPokemonBattled: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IncrementNbBigTreasureWins: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetNbBigTreasureWins: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetNbBigTreasureWins: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetNbRecycled: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetNbRecycled: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IncrementNbSkyGiftsSent: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetNbSkyGiftsSent: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetNbSkyGiftsSent: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ComputeSpecialCounters: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RecruitSpecialPokemonLog: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IncrementNbFainted: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetNbFainted: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetItemAcquired: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetNbItemAcquired: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetChallengeLetterCleared: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetSentryDutyGamePoints: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetSentryDutyGamePoints: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CopyLogTo: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CopyLogFrom: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetAbilityString: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetAbilityDescStringId: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetTypeStringId: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetConversion2ConvertToType: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CopyBitsTo: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CopyBitsFrom: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StoreDefaultTeamData: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMainTeamNameWithCheck: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMainTeamName: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetMainTeamName: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetRankupPoints: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetRank: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetRankStorageSize: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ResetPlayTimer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PlayTimerTick: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetPlayTimeSeconds: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SubFixedPoint: ClassVar[Symbol[tuple[int, ...], None]]
+
+    BinToDecFixedPoint: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CeilFixedPoint: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DungeonGoesUp: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetTurnLimit: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoesNotSaveWhenEntering: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TreasureBoxDropsEnabled: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsLevelResetDungeon: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMaxItemsAllowed: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsMoneyAllowed: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMaxRescueAttempts: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsRecruitingAllowed: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetLeaderChangeFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetRandomMovementChance: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CanEnemyEvolve: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMaxMembersAllowed: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsIqEnabled: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsTrapInvisibleWhenAttacking: ClassVar[Symbol[tuple[int, ...], None]]
+
+    JoinedAtRangeCheck: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsDojoDungeon: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsFutureDungeon: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsSpecialEpisodeDungeon: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RetrieveFromItemList1: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsForbiddenFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Copy16BitsFrom: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RetrieveFromItemList2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsInvalidForMission: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsExpEnabledInDungeon: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsSkyExclusiveDungeon: ClassVar[Symbol[tuple[int, ...], None]]
+
+    JoinedAtRangeCheck2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetBagCapacity: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetBagCapacitySpecialEpisode: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetRankUpEntry: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetBgRegionArea: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadMonsterMd: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetNameRaw: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetName: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetNameWithGender: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetSpeciesString: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetNameString: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetSpriteIndex: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetDexNumber: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetCategoryString: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMonsterGender: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetBodySize: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetSpriteSize: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetSpriteFileSize: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetShadowSize: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetSpeedStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMobilityType: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetRegenSpeed: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetCanMoveFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetChanceAsleep: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetWeightMultiplier: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetSize: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetBaseHp: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CanThrowItems: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CanEvolve: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMonsterPreEvolution: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetBaseOffensiveStat: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetBaseDefensiveStat: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetType: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetAbility: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetRecruitRate2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetRecruitRate1: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetExp: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetEvoParameters: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetTreasureBoxChances: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetIqGroup: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetSpawnThreshold: ClassVar[Symbol[tuple[int, ...], None]]
+
+    NeedsItemToSpawn: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetExclusiveItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetFamilyIndex: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadM2nAndN2m: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GuestMonsterToGroundMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StrcmpMonsterName: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetLvlUpEntry: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetEncodedHalfword: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetEvoFamily: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetEvolutions: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ShuffleHiddenPower: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetBaseForm: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetBaseFormBurmyWormadamShellosGastrodonCherrim: ClassVar[
+        Symbol[tuple[int, ...], None]
+    ]
+
+    GetBaseFormCastformCherrimDeoxys: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetAllBaseForms: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetDexNumberVeneer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMonsterIdFromSpawnEntry: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetMonsterId: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetMonsterLevelAndId: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMonsterLevelFromSpawnEntry: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMonsterGenderVeneer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsMonsterValid: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsUnown: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsShaymin: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsCastform: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsCherrim: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsDeoxys: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetSecondFormIfValid: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FemaleToMaleForm: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetBaseFormCastformDeoxysCherrim: ClassVar[Symbol[tuple[int, ...], None]]
+
+    BaseFormsEqual: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DexNumbersEqual: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GendersEqual: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GendersEqualNotGenderless: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GendersNotEqualNotGenderless: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsMonsterOnTeam: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetNbRecruited: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsValidTeamMember: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsMainCharacter: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetTeamMember: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetHeroMemberIdx: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetPartnerMemberIdx: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMainCharacter1MemberIdx: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMainCharacter2MemberIdx: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMainCharacter3MemberIdx: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetHero: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetPartner: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMainCharacter1: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMainCharacter2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMainCharacter3: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetFirstMatchingMemberIdx: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetFirstEmptyMemberIdx: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsMonsterNotNicknamed: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RemoveActiveMembersFromAllTeams: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RemoveActiveMembersFromSpecialEpisodeTeam: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RemoveActiveMembersFromRescueTeam: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CheckTeamMemberIdx: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsMonsterIdInNormalRange: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetActiveTeam: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetActiveTeamMember: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetActiveRosterIndex: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryAddMonsterToActiveTeam: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RemoveActiveMembersFromMainTeam: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetTeamSetupHeroAndPartnerOnly: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetTeamSetupHeroOnly: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetPartyMembers: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RefillTeam: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ClearItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ChangeGiratinaFormIfSkyDungeon: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetIqSkillStringId: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoesTacticFollowLeader: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetUnlockedTactics: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetUnlockedTacticFlags: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CanLearnIqSkill: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetLearnableIqSkills: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DisableIqSkill: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EnableIqSkill: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetSpeciesIqSkill: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DisableAllIqSkills: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EnableAllLearnableIqSkills: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IqSkillFlagTest: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetNextIqSkill: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetExplorerMazeTeamName: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetExplorerMazeMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    WriteMonsterInfoToSave: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ReadMonsterInfoFromSave: ClassVar[Symbol[tuple[int, ...], None]]
+
+    WriteMonsterToSave: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ReadMonsterFromSave: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetEvolutionPossibilities: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMonsterEvoStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CopyTacticString: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetStatBoostsForMonsterSummary: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateMonsterSummaryFromTeamMember: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetSosMailCount: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsMissionSuspendedAndValid: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AreMissionsEquivalent: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsMissionValid: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateMission: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsMissionTypeSpecialEpisode: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateDailyMissions: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AlreadyHaveMission: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CountJobListMissions: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DungeonRequestsDone: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DungeonRequestsDoneWrapper: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AnyDungeonRequestsDone: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AddMissionToJobList: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetAcceptedMission: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMissionByTypeAndDungeon: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CheckAcceptedMissionByTypeAndDungeon: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetAllPossibleMonsters: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateAllPossibleMonstersList: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DeleteAllPossibleMonstersList: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateAllPossibleDungeonsList: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DeleteAllPossibleDungeonsList: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateAllPossibleDeliverList: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DeleteAllPossibleDeliverList: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ClearMissionData: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsMonsterMissionAllowed: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CanMonsterBeUsedForMissionWrapper: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CanMonsterBeUsedForMission: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsMonsterMissionAllowedStory: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CanDungeonBeUsedForMission: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CanSendItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsAvailableItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetAvailableItemDeliveryList: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetActorMatchingStorageId: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetActorTalkMainAndActorTalkSub: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetActorTalkMain: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetActorTalkSub: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RandomizeDemoActors: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ItemAtTableIdx: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MainLoop: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateJobSummary: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DungeonSwapIdToIdx: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DungeonSwapIdxToId: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetDungeonModeSpecial: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FileRom_InitDataTransfer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FileRom_StopDataTransfer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FileRom_Veneer_FileInit: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FileRom_HandleOpen: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FileRom_HandleRead: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FileRom_HandleSeek: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Debug_Init: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Debug_InitDebugFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Debug_GetDebugFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Debug_SetDebugFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Debug_Stripped6: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Debug_Stripped5: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Debug_PrintTrace: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Debug_Print0: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Debug_InitLogFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Debug_GetLogFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Debug_SetLogFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Debug_Print: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Debug_Stripped4: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Debug_Stripped3: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Debug_Stripped2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Debug_Stripped1: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Debug_FatalError: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DirectoryFileMngr_ExtractAllDirectoryFiles: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DirectoryFileMngr_GetDirectoryFileSize: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DirectoryFileMngr_LoadDirectoryFile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DirectoryFileMngr_OpenDirectoryFile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DirectoryFile_ExtractDirectoryFile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DirectoryFile_GetDirectoryFileSize: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DirectoryFile_LoadDirectoryFile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetLowKickMultiplier: ClassVar[Symbol[tuple[int, ...], None]]
+
+class NaArm9Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    SECURE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    START_MODULE_PARAMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DEFAULT_MEMORY_ARENA_SIZE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LOG_MAX_ARG: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DAMAGE_SOURCE_CODE_ORB_ITEM: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DAMAGE_SOURCE_CODE_NON_ORB_ITEM: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AURA_BOW_ID_LAST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    NUMBER_OF_ITEMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MAX_MONEY_CARRIED: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MAX_MONEY_STORED: ClassVar[Symbol[tuple[int, ...], int]]
+
+    WINDOW_LIST_PTR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SCRIPT_VARS_VALUES_PTR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MAX_PLAY_TIME: ClassVar[Symbol[None, None]]
+
+    MONSTER_ID_LIMIT: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MAX_RECRUITABLE_TEAM_MEMBERS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    NATURAL_LOG_VALUE_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    CART_REMOVED_IMG_DATA: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_DEBUG_EMPTY: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_DEBUG_FORMAT_LINE_FILE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_DEBUG_NO_PROG_POS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_DEBUG_SPACED_PRINT: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_DEBUG_FATAL: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_DEBUG_NEWLINE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_DEBUG_LOG_NULL: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_DEBUG_STRING_NEWLINE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_EFFECT_EFFECT_BIN: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_MONSTER_MONSTER_BIN: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_BALANCE_M_LEVEL_BIN: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_DUNGEON_DUNGEON_BIN: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_MONSTER_M_ATTACK_BIN: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_MONSTER_M_GROUND_BIN: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_FILE_DIRECTORY_INIT: ClassVar[Symbol[tuple[int, ...], int]]
+
+    AVAILABLE_ITEMS_IN_GROUP_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ARM9_UNKNOWN_TABLE__NA_2097FF8: ClassVar[Symbol[tuple[int, ...], int]]
+
+    KECLEON_SHOP_ITEM_TABLE_LISTS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    KECLEON_SHOP_ITEM_TABLE_LISTS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EXCLUSIVE_ITEM_STAT_BOOST_DATA: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EXCLUSIVE_ITEM_DEFENSE_BOOSTS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EXCLUSIVE_ITEM_SPECIAL_ATTACK_BOOSTS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EXCLUSIVE_ITEM_SPECIAL_DEFENSE_BOOSTS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EXCLUSIVE_ITEM_EFFECT_DATA: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EXCLUSIVE_ITEM_STAT_BOOST_DATA_INDEXES: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RECYCLE_SHOP_ITEM_LIST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TYPE_SPECIFIC_EXCLUSIVE_ITEMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RECOIL_MOVE_LIST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    PUNCH_MOVE_LIST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MOVE_POWER_STARS_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MOVE_ACCURACY_STARS_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    PARENT_MENU_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SIMPLE_MENU_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ADVANCED_MENU_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    COLLECTION_MENU_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OPTIONS_MENU_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DEBUG_MENU_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SCROLL_BOX_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DIALOGUE_BOX_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    PORTRAIT_BOX_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TEXT_BOX_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    AREA_NAME_BOX_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    CONTROLS_CHART_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ALERT_BOX_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ADVANCED_TEXT_BOX_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TEAM_SELECTION_MENU_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    PARTNER_TALK_KIND_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SCRIPT_VARS_LOCALS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SCRIPT_VARS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    PORTRAIT_LAYOUTS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    KAOMADO_FILEPATH: ClassVar[Symbol[tuple[int, ...], int]]
+
+    WONDER_MAIL_BITS_MAP: ClassVar[Symbol[tuple[int, ...], int]]
+
+    WONDER_MAIL_BITS_SWAP: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ARM9_UNKNOWN_TABLE__NA_209E12C: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ARM9_UNKNOWN_TABLE__NA_209E164: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ARM9_UNKNOWN_TABLE__NA_209E280: ClassVar[Symbol[tuple[int, ...], int]]
+
+    WONDER_MAIL_ENCRYPTION_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_DATA_LIST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ADVENTURE_LOG_ENCOUNTERS_MONSTER_IDS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ARM9_UNKNOWN_DATA__NA_209E6BC: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TACTIC_NAME_STRING_IDS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STATUS_NAME_STRING_IDS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_RETURN_STATUS_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STATUSES_FULL_DESCRIPTION_STRING_IDS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ARM9_UNKNOWN_DATA__NA_209EAAC: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MISSION_FLOOR_RANKS_AND_ITEM_LISTS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MISSION_FLOORS_FORBIDDEN: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MISSION_FLOOR_RANKS_AND_ITEM_LISTS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MISSION_FLOOR_RANKS_PTRS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_RESTRICTIONS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SPECIAL_BAND_STAT_BOOST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MUNCH_BELT_STAT_BOOST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    GUMMI_STAT_BOOST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MIN_IQ_EXCLUSIVE_MOVE_USER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    WONDER_GUMMI_IQ_GAIN: ClassVar[Symbol[tuple[int, ...], int]]
+
+    AURA_BOW_STAT_BOOST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MIN_IQ_ITEM_MASTER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DEF_SCARF_STAT_BOOST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    POWER_BAND_STAT_BOOST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    WONDER_GUMMI_STAT_BOOST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ZINC_BAND_STAT_BOOST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EGG_HP_BONUS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EVOLUTION_HP_BONUS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DAMAGE_FORMULA_FLV_SHIFT: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EVOLUTION_PHYSICAL_STAT_BONUSES: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DAMAGE_FORMULA_CONSTANT_SHIFT: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DAMAGE_FORMULA_FLV_DEFICIT_DIVISOR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EGG_STAT_BONUSES: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EVOLUTION_SPECIAL_STAT_BONUSES: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DAMAGE_FORMULA_NON_TEAM_MEMBER_MODIFIER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DAMAGE_FORMULA_LN_PREFACTOR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DAMAGE_FORMULA_DEF_PREFACTOR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DAMAGE_FORMULA_AT_PREFACTOR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DAMAGE_FORMULA_LN_ARG_PREFACTOR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    FORBIDDEN_FORGOT_MOVE_LIST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TACTICS_UNLOCK_LEVEL_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    CLIENT_LEVEL_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OUTLAW_LEVEL_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OUTLAW_MINION_LEVEL_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    HIDDEN_POWER_BASE_POWER_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    VERSION_EXCLUSIVE_MONSTERS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    IQ_SKILL_RESTRICTIONS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SECONDARY_TERRAIN_TYPES: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SENTRY_DUTY_MONSTER_IDS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    IQ_SKILLS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    IQ_GROUP_SKILLS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MONEY_QUANTITY_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ARM9_UNKNOWN_TABLE__NA_20A20B0: ClassVar[Symbol[tuple[int, ...], int]]
+
+    IQ_GUMMI_GAIN_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    GUMMI_BELLY_RESTORE_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BAG_CAPACITY_TABLE_SPECIAL_EPISODES: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BAG_CAPACITY_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SPECIAL_EPISODE_MAIN_CHARACTERS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    GUEST_MONSTER_DATA: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RANK_UP_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DS_DOWNLOAD_TEAMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ARM9_UNKNOWN_PTR__NA_20A2C84: ClassVar[Symbol[tuple[int, ...], int]]
+
+    UNOWN_SPECIES_ADDITIONAL_CHARS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MONSTER_SPRITE_DATA: ClassVar[Symbol[tuple[int, ...], int]]
+
+    REMOTE_STRINGS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RANK_STRINGS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MISSION_MENU_STRING_IDS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RANK_STRINGS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MISSION_MENU_STRING_IDS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RANK_STRINGS_3: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MISSION_DUNGEON_UNLOCK_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    NO_SEND_ITEM_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ARM9_UNKNOWN_TABLE__NA_20A3CC8: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ARM9_UNKNOWN_TABLE__NA_20A3CE4: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ARM9_UNKNOWN_FUNCTION_TABLE__NA_20A3CF4: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MISSION_BANNED_STORY_MONSTERS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ITEM_DELIVERY_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MISSION_RANK_POINTS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MISSION_BANNED_MONSTERS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MISSION_STRING_IDS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LEVEL_LIST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EVENTS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ARM9_UNKNOWN_TABLE__NA_20A68BC: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DEMO_TEAMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ACTOR_LIST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ENTITIES: ClassVar[Symbol[tuple[int, ...], int]]
+
+    JOB_WINDOW_PARAMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    JOB_MENU_ITEMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    JOB_MENU_ITEMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    JOB_MENU_ITEMS_3: ClassVar[Symbol[tuple[int, ...], int]]
+
+    JOB_MENU_ITEMS_4: ClassVar[Symbol[tuple[int, ...], int]]
+
+    JOB_MENU_ITEMS_5: ClassVar[Symbol[tuple[int, ...], int]]
+
+    JOB_MENU_ITEMS_6: ClassVar[Symbol[tuple[int, ...], int]]
+
+    JOB_MENU_ITEMS_7: ClassVar[Symbol[tuple[int, ...], int]]
+
+    JOB_MENU_ITEMS_8: ClassVar[Symbol[tuple[int, ...], int]]
+
+    JOB_MENU_ITEMS_9: ClassVar[Symbol[tuple[int, ...], int]]
+
+    JOB_MENU_ITEMS_10: ClassVar[Symbol[tuple[int, ...], int]]
+
+    JOB_MENU_ITEMS_11: ClassVar[Symbol[tuple[int, ...], int]]
+
+    JOB_MENU_ITEMS_12: ClassVar[Symbol[tuple[int, ...], int]]
+
+    JOB_MENU_ITEMS_13: ClassVar[Symbol[tuple[int, ...], int]]
+
+    JOB_WINDOW_PARAMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_SWAP_ID_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MAP_MARKER_PLACEMENTS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LFO_OUTPUT_VOICE_UPDATE_FLAGS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TRIG_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    FX_ATAN_IDX_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TEX_PLTT_START_ADDR_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TEX_START_ADDR_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ARM9_UNKNOWN_TABLE__NA_20AE924: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MEMORY_ALLOCATION_ARENA_GETTERS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    PRNG_SEQUENCE_NUM: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LOADED_OVERLAY_GROUP_0: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LOADED_OVERLAY_GROUP_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LOADED_OVERLAY_GROUP_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DEBUG_IS_INITIALIZED: ClassVar[Symbol[tuple[int, ...], int]]
+
+    PACK_FILES_OPENED: ClassVar[Symbol[tuple[int, ...], int]]
+
+    PACK_FILE_PATHS_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    GAME_STATE_VALUES: ClassVar[Symbol[tuple[int, ...], None]]
+
+    BAG_ITEMS_PTR_MIRROR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ITEM_DATA_TABLE_PTRS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_MOVE_TABLES: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MOVE_DATA_TABLE_PTR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    WAN_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RENDER_3D: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RENDER_3D_FUNCTIONS_64: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LANGUAGE_INFO_DATA: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TBL_TALK_GROUP_STRING_ID_START: ClassVar[Symbol[tuple[int, ...], int]]
+
+    KEYBOARD_STRING_IDS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    NOTIFY_NOTE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DEFAULT_HERO_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DEFAULT_PARTNER_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    GAME_MODE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    GLOBAL_PROGRESS_PTR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ADVENTURE_LOG_PTR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ITEM_TABLES_PTRS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    UNOWN_SPECIES_ADDITIONAL_CHAR_PTR_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TEAM_MEMBER_TABLE_PTR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MISSION_DELIVER_LIST_PTR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MISSION_DELIVER_COUNT: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MISSION_DUNGEON_LIST_PTR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MISSION_DUNGEON_COUNT: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MISSION_MONSTER_LIST_PTR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MISSION_MONSTER_COUNT: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MISSION_LIST_PTR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    REMOTE_STRING_PTR_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RANK_STRING_PTR_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SMD_EVENTS_FUN_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MUSIC_DURATION_LOOKUP_TABLE_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MUSIC_DURATION_LOOKUP_TABLE_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LFO_WAVEFORM_CALLBACKS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    IS_DISP_ON: ClassVar[Symbol[tuple[int, ...], int]]
+
+    GXI_DMA_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    JUICE_BAR_NECTAR_IQ_GAIN: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DEBUG_TEXT_SPEED: ClassVar[Symbol[tuple[int, ...], None]]
+
+    REGULAR_TEXT_SPEED: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HERO_START_LEVEL: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PARTNER_START_LEVEL: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EXCLUSIVE_ITEM_ATTACK_BOOSTS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DIRECTORY_FILES_EXTRACTED: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DIRECTORY_FILE_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TEXT_SPEED: ClassVar[Symbol[tuple[int, ...], None]]
+
+class NaArm9Section(
+    Section,
+    name="arm9",
+    description="The main ARM9 binary.\n\nThis is the main binary that gets loaded when the game is launched, and contains the core code that runs the game, low level facilities such as memory allocation, compression, other external dependencies (such as linked libraries), and the functions and tables necessary to load overlays and dispatch execution to them.\n\nSpeaking generally, this is the program run by the Nintendo DS's main ARM946E-S CPU, which handles all gameplay mechanisms and graphics rendering.",
+    loadaddress=0x2000000,
+    length=0xB73F8,
+    functions=NaArm9Functions,
+    data=NaArm9Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaArm9Functions]]
+    data: ClassVar[type[NaArm9Data]]
+
+class NaItcmFunctions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    CopyAndInterleave: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Render3dSetTextureParams: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Render3dSetPaletteBase: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Render3dRectangle: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GeomSetPolygonAttributes: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Render3dQuadrilateral: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Render3dTiling: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Render3dTextureInternal: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Render3dTexture: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Render3dTextureNoSetup: ClassVar[Symbol[tuple[int, ...], None]]
+
+    NewRender3dElement: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EnqueueRender3dTexture: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EnqueueRender3dTiling: ClassVar[Symbol[tuple[int, ...], None]]
+
+    NewRender3dRectangle: ClassVar[Symbol[tuple[int, ...], None]]
+
+    NewRender3dQuadrilateral: ClassVar[Symbol[tuple[int, ...], None]]
+
+    NewRender3dTexture: ClassVar[Symbol[tuple[int, ...], None]]
+
+    NewRender3dTiling: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Render3dProcessQueue: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetKeyN2MSwitch: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetKeyN2M: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetKeyN2MBaseForm: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetKeyM2NSwitch: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetKeyM2N: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetKeyM2NBaseForm: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HardwareInterrupt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ReturnFromInterrupt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitDmaTransfer_Standard: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ShouldMonsterRunAwayVariationOutlawCheck: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AiMovement: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CalculateAiTargetPos: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ChooseAiMove: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LightningRodStormDrainCheck: ClassVar[Symbol[tuple[int, ...], None]]
+
+class NaItcmData(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    MEMORY_ALLOCATION_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DEFAULT_MEMORY_ARENA: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DEFAULT_MEMORY_ARENA_BLOCKS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RENDER_3D_FUNCTIONS: ClassVar[Symbol[tuple[int, ...], None]]
+
+class NaItcmSection(
+    Section,
+    name="itcm",
+    description="The instruction TCM (tightly-coupled memory) and the corresponding region in the ARM9 binary.\n\nThe ITCM is a special area of low-latency memory meant for performance-critical routines. It's similar to an instruction cache, but more predictable. See the ARMv5 Architecture Reference Manual, Chapter B7 (https://developer.arm.com/documentation/ddi0100/i).\n\nThe Nintendo DS ITCM region is located at 0x0-0x7FFF in memory, but the 32 KiB segment is mirrored throughout the 16 MiB block from 0x0-0x1FFFFFF. The Explorers of Sky code seems to reference only the mirror at 0x1FF8000, the closest one to main memory.\n\nIn Explorers of Sky, a fixed region of the ARM9 binary appears to be loaded in the ITCM at all times, and seems to contain functions related to the dungeon AI, among other things. The ITCM has a max capacity of 0x8000, although not all of it is used.",
+    loadaddress=0x20B3380,
+    length=0x4000,
+    functions=NaItcmFunctions,
+    data=NaItcmData,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaItcmFunctions]]
+    data: ClassVar[type[NaItcmData]]
+
+class NaLibsFunctions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    DseDriver_LoadDefaultSettings: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseDriver_IsSettingsValid: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseDriver_ConfigureHeap: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseDriver_Init: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Dse_SetError: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Dse_SetError2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseUtil_ByteSwap32: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SoundUtil_GetRandomNumber: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseMem_Init: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseMem_Quit: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseMem_AllocateUser: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseMem_Allocate: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseMem_AllocateThreadStack: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseMem_Free: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseMem_Clear: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseFile_CheckHeader: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSwd_SysInit: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSwd_SysQuit: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSwd_SampleLoaderMain: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSwd_MainBankDummyCallback: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSwd_LoadMainBank: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSwd_LoadBank: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSwd_IsBankLoading: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSwd_LoadWaves: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSwd_LoadWavesInternal: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSwd_Unload: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ReadWaviEntry: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSwd_GetInstrument: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSwd_GetNextSplitInRange: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSwd_GetMainBankById: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSwd_GetBankById: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSwd_InitMainBankFileReader: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSwd_OpenMainBankFileReader: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSwd_CloseMainBankFileReader: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSwd_ReadMainBank: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseBgm_DefaultSignalCallback: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseBgm_Load: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseBgm_Unload: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseBgm_SetSignalCallback: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseBgm_IsPlaying: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ResumeBgm: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseBgm_Stop: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseBgm_StopAll: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseBgm_SetFades: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSequence_Start: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSequence_PauseList: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSequence_SetFades: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSequence_GetParameter: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSequence_GetSmallestNumLoops: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSequence_Reset: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSequence_Stop: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FindSmdlSongChunk: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSequence_LoadSong: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSequence_GetById: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSequence_AllocateNew: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSequence_Unload: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSequence_InitTracks: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseBgm_SysSetupNoteList: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSe_SysReset: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSe_Load: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSe_Unload: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSe_GetUsedBankIDs: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSe_HasPlayingInstances: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSe_Play: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSe_GetEffectSong: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSe_CheckTooManyInstances: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSe_CheckTooManyInstancesInGroup: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSe_GetBestSeqAllocation: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSe_GetById: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSe_Stop: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSe_StopAll: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSe_StopSeq: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FlushChannels: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseDriver_StartMainThread: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseDriver_StartTickTimer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseDriver_NotifyTick: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseDriver_Main: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSequence_TickNotes: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ParseDseEvent: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateSequencerTracks: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSequence_TickFades: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_Invalid: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_WaitSame: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_WaitDelta: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_Wait8: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_Wait16: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_Wait24: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_WaitUntilFadeout: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_EndTrack: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_MainLoopBegin: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SubLoopBegin: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SubLoopEnd: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SubLoopBreakOnLastIteration: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetOctave: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_OctaveDelta: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetBpm: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetBpm2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetBank: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetBankMsb: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetBankLsb: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_Dummy1Byte: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetInstrument: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SongVolumeFade: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_RestoreEnvelopeDefaults: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetEnvelopeAttackBegin: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetEnvelopeAttackTime: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetEnvelopeHoldTime: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetEnvelopeDecayTimeAndSustainLevel: ClassVar[
+        Symbol[tuple[int, ...], None]
+    ]
+
+    DseTrackEvent_SetEnvelopeSustainTime: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetEnvelopeReleaseTime: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetNoteDurationMultiplier: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_ForceLfoEnvelopeLevel: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetHoldNotes: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetFlagBit1Unknown: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetOptionalVolume: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_Dummy2Bytes: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetTuning: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_TuningDeltaCoarse: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_TuningDeltaFine: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_TuningDeltaFull: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_TuningFade: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetNoteRandomRegion: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetTuningJitterAmplitude: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetKeyBend: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetUnknown2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetKeyBendRange: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetupKeyBendLfo: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetupKeyBendLfoEnvelope: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_UseKeyBendLfo: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetVolume: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_VolumeDelta: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_VolumeFade: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetExpression: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetupVolumeLfo: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetupVolumeLfoEnvelope: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_UseVolumeLfo: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetPan: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_PanDelta: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_PanFade: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetupPanLfo: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetupPanLfoEnvelope: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_UsePanLfo: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetupLfo: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetupLfoEnvelope: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_SetLfoParameter: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_UseLfo: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_Signal: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseTrackEvent_Dummy2Bytes2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSynth_Reset: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSynth_AllocateNew: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSynth_Unload: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSynth_ClearHeldNotes: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSynth_ResetAndSetBankAndSequence: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSynth_StopChannels: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSynth_ResetAllVoiceTimersAndVolumes: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSynth_RestoreHeldNotes: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSynth_SetGlobalVolumeIndex: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSynth_SetBend: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSynth_SetVolume: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSynth_SetPan: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseSynth_SetBankAndSequence: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseChannel_Init: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseChannel_DeallocateVoices: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseChannel_ResetTimerAndVolumeForVoices: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseChannel_SetBank: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseChannel_SetInstrument: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseChannel_SetLfoConstEnvelopeLevel: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseChannel_SetKeyBend: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseChannel_AllocateNote: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseChannel_ReleaseNoteInternal: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseChannel_ChangeNote: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseChannel_ReleaseNote: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseVoice_PlayNote: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseVoice_ReleaseNote: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseVoice_UpdateParameters: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseVoice_ResetAll: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseVoice_ResetHW: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateChannels: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseVoice_Cleanup: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseVoice_Allocate: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseVoice_Start: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseVoice_ReleaseHeld: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseVoice_Release: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseVoice_Deallocate: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseVoice_FlagForActivation: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseVoice_FlagForDeactivation: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseVoice_CountNumActiveInChannel: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseVoice_UpdateHardware: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SoundEnvelope_Reset: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SoundEnvelopeParameters_Reset: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SoundEnvelopeParameters_CheckValidity: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SoundEnvelope_SetParameters: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SoundEnvelope_SetSlide: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateTrackVolumeEnvelopes: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SoundEnvelope_Release: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SoundEnvelope_Stop: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SoundEnvelope_ForceVolume: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SoundEnvelope_Stop2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SoundEnvelope_Tick: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SoundLfoBank_Reset: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SoundLfoBank_Set: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SoundLfoBank_SetConstEnvelopes: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SoundLfoBank_Tick: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SoundLfoWave_InvalidFunc: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SoundLfoWave_HalfSquareFunc: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SoundLfoWave_FullSquareFunc: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SoundLfoWave_HalfTriangleFunc: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SoundLfoWave_FullTriangleFunc: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SoundLfoWave_SawFunc: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SoundLfoWave_ReverseSawFunc: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SoundLfoWave_HalfNoiseFunc: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SoundLfoWave_FullNoiseFunc: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Crypto_RC4Init: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Mtx_LookAt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Mtx_OrthoW: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FX_Div: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FX_GetDivResultFx64c: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FX_GetDivResult: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FX_InvAsync: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FX_DivAsync: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FX_DivS32: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FX_ModS32: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Vec_DotProduct: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Vec_CrossProduct: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Vec_Normalize: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Vec_Distance: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FX_Atan2Idx: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_Init: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_HBlankIntr: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_VBlankIntr: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_DispOff: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_DispOn: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_SetGraphicsMode: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Gxs_SetGraphicsMode: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GXx_SetMasterBrightness: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_InitGxState: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EnableVramBanksInSetDontSave: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_SetBankForBg: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_SetBankForObj: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_SetBankForBgExtPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_SetBankForObjExtPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_SetBankForTex: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_SetBankForTexPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_SetBankForClearImage: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_SetBankForArm7: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_SetBankForLcdc: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_SetBankForSubBg: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_SetBankForSubObj: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_SetBankForSubBgExtPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_SetBankForSubObjExtPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EnableVramBanksInSet: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_ResetBankForBgExtPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_ResetBankForObjExtPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_ResetBankForTex: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_ResetBankForTexPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_ResetBankForSubBgExtPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_ResetBankForSubObjExtPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DisableBankForX: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_DisableBankForBg: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_DisableBankForObj: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_DisableBankForBgExtPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_DisableBankForObjExtPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_DisableBankForTex: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_DisableBankForTexPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_DisableBankForClearImage: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_DisableBankForArm7: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_DisableBankForLcdc: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_DisableBankForSubBg: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_DisableBankForSubObj: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_DisableBankForSubBgExtPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_DisableBankForSubObjExtPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G2_GetBG0ScrPtr: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G2S_GetBG0ScrPtr: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G2_GetBG1ScrPtr: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G2S_GetBG1ScrPtr: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G2_GetBG2ScrPtr: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G2_GetBG3ScrPtr: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G2_GetBG0CharPtr: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G2S_GetBG0CharPtr: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G2_GetBG1CharPtr: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G2S_GetBG1CharPtr: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G2_GetBG2CharPtr: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G2_GetBG3CharPtr: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G2x_SetBlendAlpha: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G2x_SetBlendBrightness: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G2x_ChangeBlendBrightness: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G3_LoadMtx44: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G3_LoadMtx43: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G3_MultMtx43: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G3X_Init: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G3X_Reset: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G3X_ClearFifo: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G3X_InitMtxStack: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G3X_ResetMtxStack: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G3X_SetClearColor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G3X_InitTable: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G3X_GetMtxStackLevelPV: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G3X_GetMtxStackLevelPJ: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GXi_NopClearFifo128: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G3i_OrthoW: ClassVar[Symbol[tuple[int, ...], None]]
+
+    G3i_LookAt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_LoadBgPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Gxs_LoadBgPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_LoadObjPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Gxs_LoadObjPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_LoadOam: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Gxs_LoadOam: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_LoadObj: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Gxs_LoadObj: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_LoadBg0Scr: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_LoadBg1Scr: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Gxs_LoadBg1Scr: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_LoadBg2Scr: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_LoadBg3Scr: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_LoadBg0Char: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Gxs_LoadBg0Char: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_LoadBg1Char: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Gxs_LoadBg1Char: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_LoadBg2Char: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_LoadBg3Char: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_BeginLoadBgExtPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_EndLoadBgExtPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_BeginLoadObjExtPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_EndLoadObjExtPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Gxs_BeginLoadBgExtPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Gxs_EndLoadBgExtPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Gxs_BeginLoadObjExtPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Gxs_EndLoadObjExtPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_BeginLoadTex: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_LoadTex: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_EndLoadTex: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_BeginLoadTexPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_LoadTexPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_EndLoadTexPltt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GeomGxFifoSendMtx4x3: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GX_SendFifo64B: ClassVar[Symbol[tuple[int, ...], None]]
+
+    OS_GetLockID: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IncrementThreadCount: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InsertThreadIntoList: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StartThread: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ThreadExit: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetThreadField0xB4: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitThread: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetTimer0Control: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ClearIrqFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EnableIrqFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetIrqFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EnableIrqFiqFlags: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetIrqFiqFlags: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetIrqFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetProcessorMode: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetDsFirmwareUserSettings: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CountLeadingZeros: ClassVar[Symbol[tuple[int, ...], None]]
+
+    WaitForever2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    WaitForInterrupt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ArrayFill16: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ArrayCopy16: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ArrayFill32: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ArrayCopy32: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ArrayFill32Fast: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ArrayCopy32Fast: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MemsetFast: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MemcpyFast: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AtomicExchange: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FileInit: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetOverlayInfo: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadOverlayInternal: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitOverlay: ClassVar[Symbol[tuple[int, ...], None]]
+
+    abs: ClassVar[Symbol[tuple[int, ...], None]]
+
+    mbtowc: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryAssignByte: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryAssignByteWrapper: ClassVar[Symbol[tuple[int, ...], None]]
+
+    wcstombs: ClassVar[Symbol[tuple[int, ...], None]]
+
+    memcpy: ClassVar[Symbol[tuple[int, ...], None]]
+
+    memmove: ClassVar[Symbol[tuple[int, ...], None]]
+
+    memset: ClassVar[Symbol[tuple[int, ...], None]]
+
+    memchr: ClassVar[Symbol[tuple[int, ...], None]]
+
+    memcmp: ClassVar[Symbol[tuple[int, ...], None]]
+
+    memset_internal: ClassVar[Symbol[tuple[int, ...], None]]
+
+    __vsprintf_internal_slice: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryAppendToSlice: ClassVar[Symbol[tuple[int, ...], None]]
+
+    __vsprintf_internal: ClassVar[Symbol[tuple[int, ...], None]]
+
+    vsprintf: ClassVar[Symbol[tuple[int, ...], None]]
+
+    snprintf: ClassVar[Symbol[tuple[int, ...], None]]
+
+    sprintf: ClassVar[Symbol[tuple[int, ...], None]]
+
+    strlen: ClassVar[Symbol[tuple[int, ...], None]]
+
+    strcpy: ClassVar[Symbol[tuple[int, ...], None]]
+
+    strncpy: ClassVar[Symbol[tuple[int, ...], None]]
+
+    strcat: ClassVar[Symbol[tuple[int, ...], None]]
+
+    strncat: ClassVar[Symbol[tuple[int, ...], None]]
+
+    strcmp: ClassVar[Symbol[tuple[int, ...], None]]
+
+    strncmp: ClassVar[Symbol[tuple[int, ...], None]]
+
+    strchr: ClassVar[Symbol[tuple[int, ...], None]]
+
+    strcspn: ClassVar[Symbol[tuple[int, ...], None]]
+
+    strstr: ClassVar[Symbol[tuple[int, ...], None]]
+
+    wcslen: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _dadd: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _d2f: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _ll_ufrom_d: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _dflt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _dfltu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _dmul: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _dsqrt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _dsub: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _fadd: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _dgeq: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _dleq: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _dls: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _deq: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _dneq: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _fls: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _fdiv: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _f2d: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _ffix: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _fflt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _ffltu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _fmul: ClassVar[Symbol[tuple[int, ...], None]]
+
+    sqrtf: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _fsub: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _ll_mod: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _ll_sdiv: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _ll_udiv: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _ull_mod: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _ll_mul: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _s32_div_f: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _u32_div_f: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _u32_div_not_0_f: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _drdiv: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _ddiv: ClassVar[Symbol[tuple[int, ...], None]]
+
+    _fp_init: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DseUtil_GetRandomNumber: ClassVar[Symbol[tuple[int, ...], None]]
+
+    __addsf3: ClassVar[Symbol[tuple[int, ...], None]]
+
+    __divsf3: ClassVar[Symbol[tuple[int, ...], None]]
+
+    __extendsfdf2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    __fixsfsi: ClassVar[Symbol[tuple[int, ...], None]]
+
+    __floatsisf: ClassVar[Symbol[tuple[int, ...], None]]
+
+    __floatunsisf: ClassVar[Symbol[tuple[int, ...], None]]
+
+    __mulsf3: ClassVar[Symbol[tuple[int, ...], None]]
+
+    __subsf3: ClassVar[Symbol[tuple[int, ...], None]]
+
+    __divsi3: ClassVar[Symbol[tuple[int, ...], None]]
+
+    __udivsi3: ClassVar[Symbol[tuple[int, ...], None]]
+
+    __udivsi3_no_zero_check: ClassVar[Symbol[tuple[int, ...], None]]
+
+class NaLibsData(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaLibsSection(
+    Section,
+    name="libs",
+    description="System libraries linked to the main ARM9 binary.\n\nThis includes code from common NDS system libraries like the Nitro SDK (which contains NDS-specific functionality as well as utilities akin to libc and libgcc).\n\nWhere the library region starts and ends is a guess, but there appear to be fairly sharp boundaries. The function directly before it calls functions at lower memory addresses outside of the region, while all functions in the region only call other functions within the region. The bytes after the region seem to be the start of a global data region, used by both the libraries and the rest of ARM9.",
+    loadaddress=0x206C0D8,
+    length=0x247FC,
+    functions=NaLibsFunctions,
+    data=NaLibsData,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaLibsFunctions]]
+    data: ClassVar[type[NaLibsData]]
+
+class NaMove_effectsFunctions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    DoMoveDamage: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveIronTail: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDamageMultihitUntilMiss: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveYawn: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSleep: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveNightmare: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveMorningSun: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveVitalThrow: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDig: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSweetScent: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveCharm: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveRainDance: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveHail: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveHealStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveBubble: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveEncore: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveRage: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSuperFang: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMovePainSplit: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveTorment: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveStringShot: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSwagger: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSnore: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveScreech: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDamageCringe30: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveWeatherBall: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveWhirlpool: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveFakeTears: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSpite: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveFocusEnergy: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSmokescreen: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveMirrorMove: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveOverheat: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveAuroraBeam: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveMemento: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveOctazooka: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveFlatter: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveWillOWisp: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveReturn: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveGrudge: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveCounter: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDamageBurn10FlameWheel: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDamageBurn10: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveExpose: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDoubleTeam: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveGust: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveBoostDefense1: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveParalyze: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveBoostAttack1: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveRazorWind: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveBide: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveBideUnleash: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveCrunch: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDamageCringe20: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDamageParalyze20: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveEndeavor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveFacade: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDamageLowerSpeed20: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveBrickBreak: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDamageLowerSpeed100: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveFocusPunch: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDamageDrain: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveReversal: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSmellingSalt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveMetalSound: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveTickle: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveShadowHold: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveHaze: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDamageMultihitFatigue: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDamageWeightDependent: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDamageBoostAllStats: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSynthesis: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveBoostSpeed1: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveRapidSpin: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSureShot: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveCosmicPower: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSkyAttack: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDamageFreeze15: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveMeteorMash: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveEndure: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveLowerSpeed1: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDamageConfuse10: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMovePsywave: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDamageLowerDefensiveStatVariable: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMovePsychoBoost: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveUproar: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveWaterSpout: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMovePsychUp: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDamageWithRecoil: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EntityIsValidMoveEffects: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveRecoverHp: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveEarthquake: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetNaturePowerVariant: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveNaturePower: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDamageParalyze10: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSelfdestruct: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveShadowBall: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveCharge: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveThunderbolt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveMist: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveFissure: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDamageCringe10: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSafeguard: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveAbsorb: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DefenderAbilityIsActiveMoveEffects: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSkillSwap: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSketch: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveHeadbutt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDoubleEdge: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSandstorm: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveLowerAccuracy1: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDamagePoison40: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveGrowth: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSacredFire: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveOhko: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSolarBeam: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSonicBoom: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveFly: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveExplosion: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveWaterfall: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDamageLowerAccuracy40: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveStockpile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveTwister: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveTwineedle: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveRecoverHpTeam: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveMinimize: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSeismicToss: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveConfuse: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveTaunt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveMoonlight: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveHornDrill: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSwordsDance: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveConversion: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveConversion2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveHelpingHand: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveBoostDefense2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveWarp: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveThundershock: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveThunderWave: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveZapCannon: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveBlock: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMovePoison: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveToxic: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMovePoisonFang: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDamagePoison18: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveJumpKick: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveBounce: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveHiJumpKick: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveTriAttack: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSwapItems: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveTripleKick: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSport: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveMudSlap: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDamageStealItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveAmnesia: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveNightShade: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveGrowl: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSurf: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveRolePlay: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSunnyDay: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveLowerDefense1: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveWish: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveFakeOut: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSleepTalk: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMovePayDay: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveAssist: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveRest: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveIngrain: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSwallow: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveCurse: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSuperpower: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSteelWing: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSpitUp: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDynamicPunch: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveKnockOff: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSplash: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSetDamage: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveBellyDrum: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveLightScreen: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSecretPower: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDamageConfuse30: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveBulkUp: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMovePause: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveFeatherDance: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveBeatUp: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveBlastBurn: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveCrushClaw: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveBlazeKick: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMovePresent: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveEruption: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveTransform: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMovePoisonTail: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveBlowback: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveCamouflage: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveTailGlow: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDamageConstrict10: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMovePerishSong: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveWrap: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSpikes: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveMagnitude: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveMagicCoat: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveProtect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDefenseCurl: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDecoy: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveMistBall: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDestinyBond: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveMirrorCoat: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveCalmMind: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveHiddenPower: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveMetalClaw: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveAttract: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveCopycat: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveFrustration: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveLeechSeed: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveMetronome: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDreamEater: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSnatch: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveRecycle: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveReflect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDragonRage: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDragonDance: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSkullBash: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDamageLowerSpecialDefense50: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveStruggle: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveRockSmash: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSeeTrap: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveTakeaway: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveRebound: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSwitchPositions: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveStayAway: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveCleanse: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSiesta: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveTwoEdge: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveNoMove: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveScan: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMovePowerEars: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveTransfer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSlowDown: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSearchlight: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMovePetrify: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMovePounce: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveTrawl: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveEscape: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDrought: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveTrapBuster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveWildCall: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveInvisify: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveOneShot: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveHpGauge: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveVacuumCut: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveReviver: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveShocker: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveEcho: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveFamish: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveOneRoom: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveFillIn: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveTrapper: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveItemize: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveHurl: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveMobile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveSeeStairs: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveLongToss: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMovePierce: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveHammerArm: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveAquaRing: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveGastroAcid: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveHealingWish: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveCloseCombat: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveLuckyChant: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveGuardSwap: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveHealOrder: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveHealBlock: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveThunderFang: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDefog: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveTrumpCard: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveIceFang: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMovePsychoShift: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveEmbargo: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveBrine: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveNaturalGift: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveGyroBall: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveShadowForce: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveGravity: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveStealthRock: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveChargeBeam: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDamageEatItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveAcupressure: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveMagnetRise: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveToxicSpikes: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveLastResort: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveTrickRoom: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveWorrySeed: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDamageHpDependent: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveHeartSwap: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveRoost: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMovePowerSwap: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMovePowerTrick: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveFeint: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveFlareBlitz: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDefendOrder: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveFireFang: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveLunarDance: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveMiracleEye: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveWakeUpSlap: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveMetalBurst: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveHeadSmash: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveCaptivate: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveLeafStorm: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDracoMeteor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveRockPolish: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveNastyPlot: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveTag0x1AB: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveTag0x1A6: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveTag0x1A7: ClassVar[Symbol[tuple[int, ...], None]]
+
+class NaMove_effectsData(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    MAX_HP_CAP_MOVE_EFFECTS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LUNAR_DANCE_PP_RESTORATION: ClassVar[Symbol[tuple[int, ...], int]]
+
+class NaMove_effectsSection(
+    Section,
+    name="move_effects",
+    description="Move effect handlers for individual moves, called by ExecuteMoveEffect (and also the Metronome and Nature Power tables).\n\nThis subregion contains only the move effect handlers themselves, and not necessarily all the utility functions used by the move effect handlers (such as the damage calculation functions). These supporting utilities are in the main overlay29 block.",
+    loadaddress=0x2325DC0,
+    length=0x8A4C,
+    functions=NaMove_effectsFunctions,
+    data=NaMove_effectsData,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaMove_effectsFunctions]]
+    data: ClassVar[type[NaMove_effectsData]]
+
+class NaOverlay0Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay0Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    TOP_MENU_MUSIC_ID: ClassVar[Symbol[tuple[int, ...], None]]
+
+class NaOverlay0Section(
+    Section,
+    name="overlay0",
+    description="Likely contains supporting data and code related to the top menu.\n\nThis is loaded together with overlay 1 while in the top menu. Since it's in overlay group 2 (together with overlay 10, which is another 'data' overlay), this overlay probably plays a similar role. It mentions several files from the BACK folder that are known backgrounds for the top menu.",
+    loadaddress=0x22BCA80,
+    length=0x609A0,
+    functions=NaOverlay0Functions,
+    data=NaOverlay0Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay0Functions]]
+    data: ClassVar[type[NaOverlay0Data]]
+
+class NaOverlay1Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    CreateMainMenus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AddMainMenuOption: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AddSubMenuOption: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ProcessContinueScreenContents: ClassVar[Symbol[tuple[int, ...], None]]
+
+class NaOverlay1Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    PRINTS_STRINGS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    PRINTS_STRUCT: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MAIN_MENU_WINDOW_PARAMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MAIN_MENU_WINDOW_PARAMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MAIN_MENU_WINDOW_PARAMS_3: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MAIN_MENU_WINDOW_PARAMS_4: ClassVar[Symbol[tuple[int, ...], int]]
+
+    CONTINUE_CHOICE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SUBMENU: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MAIN_MENU: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MAIN_MENU_WINDOW_PARAMS_5: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MAIN_MENU_WINDOW_PARAMS_6: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MAIN_MENU_WINDOW_PARAMS_7: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MAIN_MENU_ITEMS_CONFIRM: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MAIN_MENU_WINDOW_PARAMS_8: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MAIN_MENU_WINDOW_PARAMS_9: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MAIN_DEBUG_MENU_ITEMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MAIN_MENU_WINDOW_PARAMS_10: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MAIN_DEBUG_MENU_ITEMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+class NaOverlay1Section(
+    Section,
+    name="overlay1",
+    description="Likely controls the top menu.\n\nThis is loaded together with overlay 0 while in the top menu. Since it's in overlay group 1 (together with other 'main' overlays like overlay 11 and overlay 29), this is probably the controller.\n\nSeems to contain code related to Wi-Fi rescue. It mentions several files from the GROUND and BACK folders.",
+    loadaddress=0x2329520,
+    length=0x12D20,
+    functions=NaOverlay1Functions,
+    data=NaOverlay1Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay1Functions]]
+    data: ClassVar[type[NaOverlay1Data]]
+
+class NaOverlay10Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    CreateInventoryMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetInventoryMenuState0: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetInventoryMenuState6: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CloseInventoryMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsInventoryMenuActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CheckInventoryMenuField0x1A0: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PopInventoryMenuField0x1A3: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateInventoryMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsInventoryMenuState3: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SprintfStatic: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetEffectAnimationField0x19: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AnimationHasMoreFrames: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetEffectAnimation: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMoveAnimation: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetSpecialMonsterMoveAnimation: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetTrapAnimation: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetItemAnimation1: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetItemAnimation2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMoveAnimationSpeed: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DrawTeamStats: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateTeamStats: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FreeTeamStats: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FreeMapAndTeam: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ProcessTeamStatsLvHp: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ProcessTeamStatsNameGender: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsBackgroundTileset: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitTilesetBuffer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MainGame: ClassVar[Symbol[tuple[int, ...], None]]
+
+class NaOverlay10Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    INVENTORY_MENU_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    FIRST_DUNGEON_WITH_MONSTER_HOUSE_TRAPS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BAD_POISON_DAMAGE_COOLDOWN: ClassVar[Symbol[tuple[int, ...], int]]
+
+    PROTEIN_STAT_BOOST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    WATERFALL_CRINGE_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    AURORA_BEAM_LOWER_ATTACK_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SPAWN_CAP_NO_MONSTER_HOUSE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OREN_BERRY_DAMAGE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    IRON_TAIL_LOWER_DEFENSE_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TWINEEDLE_POISON_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EXTRASENSORY_CRINGE_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ROCK_SLIDE_CRINGE_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    CRUNCH_LOWER_DEFENSE_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    FOREWARN_FORCED_MISS_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    UNOWN_STONE_DROP_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SITRUS_BERRY_HP_RESTORATION: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MUDDY_WATER_LOWER_ACCURACY_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SILVER_WIND_BOOST_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    POISON_TAIL_POISON_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    THUNDERSHOCK_PARALYZE_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BOUNCE_PARALYZE_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    HEADBUTT_CRINGE_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    FIRE_FANG_CRINGE_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SACRED_FIRE_BURN_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    WHIRLPOOL_CONSTRICTION_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EXP_ELITE_EXP_BOOST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MONSTER_HOUSE_MAX_NON_MONSTER_SPAWNS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    HEAL_ORDER_HP_RESTORATION: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STEEL_WING_BOOST_DEFENSE_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    GOLD_THORN_POWER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BURN_DAMAGE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    POISON_DAMAGE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SPAWN_COOLDOWN: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MIST_BALL_LOWER_SPECIAL_ATTACK_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    CHARGE_BEAM_BOOST_SPECIAL_ATTACK_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ORAN_BERRY_FULL_HP_BOOST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LIFE_SEED_HP_BOOST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OCTAZOOKA_LOWER_ACCURACY_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LUSTER_PURGE_LOWER_SPECIAL_DEFENSE_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SUPER_LUCK_CRIT_RATE_BOOST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    CONSTRICT_LOWER_SPEED_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ICE_FANG_FREEZE_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SMOG_POISON_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LICK_PARALYZE_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    THUNDER_FANG_PARALYZE_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BITE_CRINGE_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SKY_ATTACK_CRINGE_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ICE_FANG_CRINGE_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BLAZE_KICK_BURN_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    FLAMETHROWER_BURN_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DIZZY_PUNCH_CONFUSE_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SECRET_POWER_EFFECT_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    METAL_CLAW_BOOST_ATTACK_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TECHNICIAN_MOVE_POWER_THRESHOLD: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SONICBOOM_FIXED_DAMAGE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RAIN_ABILITY_BONUS_REGEN: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LEECH_SEED_HP_DRAIN: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EXCLUSIVE_ITEM_EXP_BOOST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    AFTERMATH_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SET_DAMAGE_STATUS_DAMAGE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    INTIMIDATOR_ACTIVATION_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TYPE_ADVANTAGE_MASTER_CRIT_RATE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ORAN_BERRY_HP_RESTORATION: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SITRUS_BERRY_FULL_HP_BOOST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SNORE_CRINGE_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    METEOR_MASH_BOOST_ATTACK_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    CRUSH_CLAW_LOWER_DEFENSE_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BURN_DAMAGE_COOLDOWN: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SHADOW_BALL_LOWER_SPECIAL_DEFENSE_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STICK_POWER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BUBBLE_LOWER_SPEED_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ICE_BODY_BONUS_REGEN: ClassVar[Symbol[tuple[int, ...], None]]
+
+    POWDER_SNOW_FREEZE_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    POISON_STING_POISON_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SPAWN_COOLDOWN_THIEF_ALERT: ClassVar[Symbol[tuple[int, ...], int]]
+
+    POISON_FANG_POISON_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    WEATHER_MOVE_TURN_COUNT: ClassVar[Symbol[tuple[int, ...], int]]
+
+    THUNDER_PARALYZE_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    THUNDERBOLT_PARALYZE_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MONSTER_HOUSE_MAX_MONSTER_SPAWNS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TWISTER_CRINGE_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SPEED_BOOST_TURNS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    FAKE_OUT_CRINGE_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    THUNDER_FANG_CRINGE_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    FLARE_BLITZ_BURN_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    FLAME_WHEEL_BURN_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    PSYBEAM_CONFUSE_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TRI_ATTACK_STATUS_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MIRACLE_CHEST_EXP_BOOST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    WONDER_CHEST_EXP_BOOST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SPAWN_CAP_WITH_MONSTER_HOUSE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    POISON_DAMAGE_COOLDOWN: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LEECH_SEED_DAMAGE_COOLDOWN: ClassVar[Symbol[tuple[int, ...], int]]
+
+    THROWN_ITEM_HIT_CHANCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    GEO_PEBBLE_DAMAGE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    GRAVELEROCK_DAMAGE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RARE_FOSSIL_DAMAGE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    GINSENG_CHANCE_3: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ZINC_STAT_BOOST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    IRON_STAT_BOOST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    CALCIUM_STAT_BOOST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    WISH_BONUS_REGEN: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DRAGON_RAGE_FIXED_DAMAGE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    CORSOLA_TWIG_POWER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    CACNEA_SPIKE_POWER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    GOLD_FANG_POWER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SILVER_SPIKE_POWER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    IRON_THORN_POWER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SCOPE_LENS_CRIT_RATE_BOOST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    HEALING_WISH_HP_RESTORATION: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ME_FIRST_MULTIPLIER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    FACADE_DAMAGE_MULTIPLIER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    IMPRISON_TURN_RANGE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SLEEP_TURN_RANGE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    NIGHTMARE_TURN_RANGE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BURN_DAMAGE_MULTIPLIER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    REST_TURN_RANGE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MATCHUP_SUPER_EFFECTIVE_MULTIPLIER_ERRATIC_PLAYER: ClassVar[
+        Symbol[tuple[int, ...], int]
+    ]
+
+    MATCHUP_IMMUNE_MULTIPLIER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SPORT_CONDITION_TURN_RANGE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SURE_SHOT_TURN_RANGE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DETECT_BAND_MOVE_ACCURACY_DROP: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TINTED_LENS_MULTIPLIER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SMOKESCREEN_TURN_RANGE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    PERISH_SONG_TURN_RANGE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SHADOW_FORCE_DAMAGE_MULTIPLIER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DIG_DAMAGE_MULTIPLIER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DIVE_DAMAGE_MULTIPLIER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BOUNCE_DAMAGE_MULTIPLIER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    POWER_PITCHER_DAMAGE_MULTIPLIER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    QUICK_DODGER_MOVE_ACCURACY_DROP: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MATCHUP_NOT_VERY_EFFECTIVE_MULTIPLIER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MATCHUP_SUPER_EFFECTIVE_MULTIPLIER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MATCHUP_NEUTRAL_MULTIPLIER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MATCHUP_IMMUNE_MULTIPLIER_ERRATIC_PLAYER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MATCHUP_NOT_VERY_EFFECTIVE_MULTIPLIER_ERRATIC_PLAYER: ClassVar[
+        Symbol[tuple[int, ...], int]
+    ]
+
+    MATCHUP_NEUTRAL_MULTIPLIER_ERRATIC_PLAYER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    AIR_BLADE_DAMAGE_MULTIPLIER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    KECLEON_SHOP_BOOST_CHANCE_MULTIPLIER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    HIDDEN_STAIRS_SPAWN_CHANCE_MULTIPLIER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    YAWN_TURN_RANGE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SPEED_BOOST_TURN_RANGE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SOLARBEAM_DAMAGE_MULTIPLIER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SKY_ATTACK_DAMAGE_MULTIPLIER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RAZOR_WIND_DAMAGE_MULTIPLIER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    FOCUS_PUNCH_DAMAGE_MULTIPLIER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SKULL_BASH_DAMAGE_MULTIPLIER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    FLY_DAMAGE_MULTIPLIER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    WEATHER_BALL_TYPE_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LAST_RESORT_DAMAGE_MULT_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SYNTHESIS_HP_RESTORATION_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ROOST_HP_RESTORATION_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MOONLIGHT_HP_RESTORATION_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MORNING_SUN_HP_RESTORATION_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    REVERSAL_DAMAGE_MULT_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    WATER_SPOUT_DAMAGE_MULT_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    WRING_OUT_DAMAGE_MULT_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ERUPTION_DAMAGE_MULT_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    WEATHER_BALL_DAMAGE_MULT_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EAT_ITEM_EFFECT_IGNORE_LIST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    CASTFORM_WEATHER_ATTRIBUTE_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BAD_POISON_DAMAGE_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TYPE_MATCHUP_COMBINATOR_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OFFENSIVE_STAT_STAGE_MULTIPLIERS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DEFENSIVE_STAT_STAGE_MULTIPLIERS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    NATURE_POWER_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    APPLES_AND_BERRIES_ITEM_IDS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RECRUITMENT_LEVEL_BOOST_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    NATURAL_GIFT_ITEM_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RANDOM_MUSIC_ID_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SHOP_ITEM_CHANCES: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MALE_ACCURACY_STAGE_MULTIPLIERS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MALE_EVASION_STAGE_MULTIPLIERS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    FEMALE_ACCURACY_STAGE_MULTIPLIERS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    FEMALE_EVASION_STAGE_MULTIPLIERS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MUSIC_ID_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TYPE_MATCHUP_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    FIXED_ROOM_MONSTER_SPAWN_STATS_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    METRONOME_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TILESET_PROPERTIES: ClassVar[Symbol[tuple[int, ...], int]]
+
+    FIXED_ROOM_PROPERTIES_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TRAP_ANIMATION_INFO: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ITEM_ANIMATION_INFO: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MOVE_ANIMATION_INFO: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EFFECT_ANIMATION_INFO: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SPECIAL_MONSTER_MOVE_ANIMATION_INFO: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DEFEAT_ITEM_LOSS_CHANCE: ClassVar[Symbol[tuple[int, ...], None]]
+
+class NaOverlay10Section(
+    Section,
+    name="overlay10",
+    description="Appears to be used both during ground mode and dungeon mode. With dungeon mode, whereas overlay 29 contains the main dungeon engine, this overlay seems to contain routines and data for dungeon mechanics.",
+    loadaddress=0x22BCA80,
+    length=0x1F7A0,
+    functions=NaOverlay10Functions,
+    data=NaOverlay10Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay10Functions]]
+    data: ClassVar[type[NaOverlay10Data]]
+
+class NaOverlay11Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    UnlockScriptingLock: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FuncThatCallsRunNextOpcode: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RunNextOpcode: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HandleUnlocks: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadFileFromRomVeneer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SsbLoad2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ScriptParamToInt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ScriptParamToFixedPoint16: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StationLoadHanger: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ScriptStationLoadTalk: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SsbLoad1: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ScriptSpecialProcessCall: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetCoroutineInfo: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetSpecialRecruitmentSpecies: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PrepareMenuAcceptTeamMember: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitRandomNpcJobs: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetRandomNpcJobType: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetRandomNpcJobSubtype: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetRandomNpcJobStillAvailable: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AcceptRandomNpcJob: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GroundMainLoop: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetAllocArenaGround: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetFreeArenaGround: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GroundMainReturnDungeon: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GroundMainNextDay: ClassVar[Symbol[tuple[int, ...], None]]
+
+    JumpToTitleScreen: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ReturnToTitleScreen: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ScriptSpecialProcess0x16: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsScreenFadeInProgress: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadBackgroundAttributes: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadMapType10: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadMapType11: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetSpecialLayoutBackground: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetAnimDataFields: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetAnimDataFieldsWrapper: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitAnimDataFromOtherAnimData: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetAnimDataFields2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetIdleAnimationType: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadObjectAnimData: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitAnimDataFromOtherAnimDataVeneer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AnimRelatedFunction: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AllocAndInitPartnerFollowDataAndLiveActorList: ClassVar[
+        Symbol[tuple[int, ...], None]
+    ]
+
+    InitPartnerFollowDataAndLiveActorList: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DeleteLiveActor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ChangeActorAnimation: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitPartnerFollowData: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetDirectionLiveActor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetDirectionLiveActor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateTeamInfoBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CloseTeamInfoBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsTeamInfoBoxActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateTeamInfoBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateTopGroundMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CloseTopGroundMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateTopGroundMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsBagNotEmpty: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SprintfStatic: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetExclusiveItemRequirements: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HandleControlsTopScreenGround: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetDungeonMapPos: ClassVar[Symbol[tuple[int, ...], None]]
+
+    WorldMapSetMode: ClassVar[Symbol[tuple[int, ...], None]]
+
+    WorldMapSetCamera: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StatusUpdate: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HandleTeamStatsGround: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ProcessScriptParam: ClassVar[Symbol[tuple[int, ...], None]]
+
+class NaOverlay11Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    OVERLAY11_UNKNOWN_TABLE__NA_2316A38: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SCRIPT_COMMAND_PARSING_DATA: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SCRIPT_OP_CODE_NAMES: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SCRIPT_OP_CODES: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY11_DEBUG_STRINGS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    C_ROUTINE_NAMES: ClassVar[Symbol[tuple[int, ...], int]]
+
+    C_ROUTINES: ClassVar[Symbol[tuple[int, ...], int]]
+
+    GROUND_WEATHER_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    GROUND_WAN_FILES_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OBJECTS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RECRUITMENT_TABLE_LOCATIONS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RECRUITMENT_TABLE_LEVELS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RECRUITMENT_TABLE_SPECIES: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LEVEL_TILEMAP_LIST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SETANIMATION_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TEAM_INFO_BOX_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY11_OVERLAY_LOAD_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    UNIONALL_RAM_ADDRESS: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GROUND_STATE_MAP: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GROUND_STATE_WEATHER: ClassVar[Symbol[None, None]]
+
+    GROUND_STATE_PTRS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    WORLD_MAP_MODE: ClassVar[Symbol[tuple[int, ...], int]]
+
+class NaOverlay11Section(
+    Section,
+    name="overlay11",
+    description="The script engine.\n\nThis is the 'main' overlay of ground mode. The script engine is what runs the ground mode scripts contained in the SCRIPT folder, which are written in a custom scripting language. These scripts encode things like cutscenes, screen transitions, ground mode events, and tons of other things related to ground mode.",
+    loadaddress=0x22DC240,
+    length=0x48C40,
+    functions=NaOverlay11Functions,
+    data=NaOverlay11Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay11Functions]]
+    data: ClassVar[type[NaOverlay11Data]]
+
+class NaOverlay12Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay12Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay12Section(
+    Section,
+    name="overlay12",
+    description="Unused; all zeroes.",
+    loadaddress=0x238A140,
+    length=0x20,
+    functions=NaOverlay12Functions,
+    data=NaOverlay12Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay12Functions]]
+    data: ClassVar[type[NaOverlay12Data]]
+
+class NaOverlay13Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    EntryOverlay13: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ExitOverlay13: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Overlay13SwitchFunctionNa238A1C8: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Overlay13SwitchFunctionNa238A574: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetPersonality: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetOptionStringFromID: ClassVar[Symbol[tuple[int, ...], None]]
+
+    WaitForNextStep: ClassVar[Symbol[tuple[int, ...], None]]
+
+class NaOverlay13Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    QUIZ_BORDER_COLOR_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    PORTRAIT_ATTRIBUTES: ClassVar[Symbol[tuple[int, ...], int]]
+
+    QUIZ_MALE_FEMALE_BOOST_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY13_UNKNOWN_STRUCT__NA_238C024: ClassVar[Symbol[tuple[int, ...], int]]
+
+    QUIZ_WINDOW_PARAMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    QUIZ_WINDOW_PARAMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    QUIZ_WINDOW_PARAMS_3: ClassVar[Symbol[tuple[int, ...], int]]
+
+    QUIZ_WINDOW_PARAMS_4: ClassVar[Symbol[tuple[int, ...], int]]
+
+    QUIZ_MENU_ITEMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STARTERS_PARTNER_IDS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STARTERS_HERO_IDS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STARTERS_TYPE_INCOMPATIBILITY_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STARTERS_STRINGS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    QUIZ_QUESTION_STRINGS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    QUIZ_ANSWER_STRINGS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    QUIZ_ANSWER_POINTS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY13_RESERVED_SPACE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY13_UNKNOWN_POINTER__NA_238CEA0: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY13_UNKNOWN_POINTER__NA_238CEA4: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY13_UNKNOWN_POINTER__NA_238CEA8: ClassVar[Symbol[tuple[int, ...], int]]
+
+    QUIZ_WINDOW_PARAMS_5: ClassVar[Symbol[tuple[int, ...], int]]
+
+    QUIZ_WINDOW_PARAMS_6: ClassVar[Symbol[tuple[int, ...], int]]
+
+    QUIZ_DEBUG_MENU_ITEMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY13_UNKNOWN_STRUCT__NA_238CF14: ClassVar[Symbol[tuple[int, ...], int]]
+
+    QUIZ_QUESTION_ANSWER_ASSOCIATIONS: ClassVar[Symbol[tuple[int, ...], int]]
+
+class NaOverlay13Section(
+    Section,
+    name="overlay13",
+    description="Controls the personality test, including the available partners and playable Pokémon. The actual personality test questions are stored in the MESSAGE folder.",
+    loadaddress=0x238A140,
+    length=0x2E80,
+    functions=NaOverlay13Functions,
+    data=NaOverlay13Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay13Functions]]
+    data: ClassVar[type[NaOverlay13Data]]
+
+class NaOverlay14Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    SentrySetupState: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryUpdateDisplay: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentrySetExitingState: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryRunState: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentrySetStateIntermediate: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryState0: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryState1: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryState2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryState3: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryState4: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryStateExit: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryState6: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryState7: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryState8: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryState9: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryStateA: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryStateB: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryStateGenerateChoices: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryStateGetUserChoice: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryStateFinalizeRound: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryStateF: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryState10: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryState11: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryState12: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryState13: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryState14: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryState15: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryState16: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryState17: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryState18: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryState19: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryState1A: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryStateFinalizePoints: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryState1C: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryState1D: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryState1E: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryState1F: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryState20: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SentryState21: ClassVar[Symbol[tuple[int, ...], None]]
+
+class NaOverlay14Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    SENTRY_DUTY_STRUCT_SIZE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SENTRY_LOUDRED_MONSTER_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_ID_SENTRY_TOP_SESSIONS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_ID_SENTRY_INSTRUCTIONS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_ID_SENTRY_HERE_COMES: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_ID_SENTRY_WHOSE_FOOTPRINT: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_ID_SENTRY_TRY_AGAIN: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_ID_SENTRY_OUT_OF_TIME: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_ID_SENTRY_FOOTPRINT_IS_6EE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_ID_SENTRY_COME_IN_6EF: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_ID_SENTRY_WRONG: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_ID_SENTRY_BUCK_UP: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_ID_SENTRY_FOOTPRINT_IS_6EC: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_ID_SENTRY_COME_IN_6ED: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_ID_SENTRY_KEEP_YOU_WAITING: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_ID_SENTRY_THATLL_DO_IT: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SENTRY_CHATOT_MONSTER_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_ID_SENTRY_NO_MORE_VISITORS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STRING_ID_SENTRY_THATS_ALL: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SENTRY_GROVYLE_MONSTER_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SENTRY_DEBUG_MENU_ITEMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SENTRY_DUTY_PTR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SENTRY_DUTY_STATE_HANDLER_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+class NaOverlay14Section(
+    Section,
+    name="overlay14",
+    description="Runs the sentry duty minigame.",
+    loadaddress=0x238A140,
+    length=0x3AE0,
+    functions=NaOverlay14Functions,
+    data=NaOverlay14Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay14Functions]]
+    data: ClassVar[type[NaOverlay14Data]]
+
+class NaOverlay15Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay15Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    BANK_MAIN_MENU_ITEMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BANK_WINDOW_PARAMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BANK_WINDOW_PARAMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BANK_WINDOW_PARAMS_3: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BANK_WINDOW_PARAMS_4: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BANK_WINDOW_PARAMS_5: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY15_RESERVED_SPACE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY15_UNKNOWN_POINTER__NA_238B180: ClassVar[Symbol[tuple[int, ...], int]]
+
+class NaOverlay15Section(
+    Section,
+    name="overlay15",
+    description="Controls the Duskull Bank.",
+    loadaddress=0x238A140,
+    length=0x1060,
+    functions=NaOverlay15Functions,
+    data=NaOverlay15Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay15Functions]]
+    data: ClassVar[type[NaOverlay15Data]]
+
+class NaOverlay16Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay16Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    EVO_MENU_ITEMS_CONFIRM: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EVO_SUBMENU_ITEMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EVO_MAIN_MENU_ITEMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EVO_MENU_STRING_IDS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EVO_WINDOW_PARAMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EVO_WINDOW_PARAMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EVO_WINDOW_PARAMS_3: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EVO_WINDOW_PARAMS_4: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EVO_WINDOW_PARAMS_5: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EVO_WINDOW_PARAMS_6: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EVO_WINDOW_PARAMS_7: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY16_RESERVED_SPACE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY16_UNKNOWN_POINTER__NA_238CE40: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY16_UNKNOWN_POINTER__NA_238CE58: ClassVar[Symbol[tuple[int, ...], int]]
+
+class NaOverlay16Section(
+    Section,
+    name="overlay16",
+    description="Controls Luminous Spring.",
+    loadaddress=0x238A140,
+    length=0x2D20,
+    functions=NaOverlay16Functions,
+    data=NaOverlay16Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay16Functions]]
+    data: ClassVar[type[NaOverlay16Data]]
+
+class NaOverlay17Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay17Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    ASSEMBLY_WINDOW_PARAMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ASSEMBLY_WINDOW_PARAMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ASSEMBLY_WINDOW_PARAMS_3: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ASSEMBLY_WINDOW_PARAMS_4: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ASSEMBLY_WINDOW_PARAMS_5: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ASSEMBLY_MENU_ITEMS_CONFIRM: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ASSEMBLY_MAIN_MENU_ITEMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ASSEMBLY_MAIN_MENU_ITEMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ASSEMBLY_SUBMENU_ITEMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ASSEMBLY_SUBMENU_ITEMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ASSEMBLY_SUBMENU_ITEMS_3: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ASSEMBLY_SUBMENU_ITEMS_4: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ASSEMBLY_SUBMENU_ITEMS_5: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ASSEMBLY_SUBMENU_ITEMS_6: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ASSEMBLY_SUBMENU_ITEMS_7: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY17_FUNCTION_POINTER_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY17_RESERVED_SPACE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY17_UNKNOWN_POINTER__NA_238BE00: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY17_UNKNOWN_POINTER__NA_238BE04: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY17_UNKNOWN_POINTER__NA_238BE08: ClassVar[Symbol[tuple[int, ...], int]]
+
+class NaOverlay17Section(
+    Section,
+    name="overlay17",
+    description="Controls the Chimecho Assembly.",
+    loadaddress=0x238A140,
+    length=0x1CE0,
+    functions=NaOverlay17Functions,
+    data=NaOverlay17Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay17Functions]]
+    data: ClassVar[type[NaOverlay17Data]]
+
+class NaOverlay18Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay18Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    LINK_SHOP_WINDOW_PARAMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LINK_SHOP_WINDOW_PARAMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LINK_SHOP_WINDOW_PARAMS_3: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LINK_SHOP_WINDOW_PARAMS_4: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LINK_SHOP_WINDOW_PARAMS_5: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LINK_SHOP_WINDOW_PARAMS_6: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LINK_SHOP_WINDOW_PARAMS_7: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LINK_SHOP_WINDOW_PARAMS_8: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LINK_SHOP_WINDOW_PARAMS_9: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LINK_SHOP_WINDOW_PARAMS_10: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LINK_SHOP_WINDOW_PARAMS_11: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LINK_SHOP_MENU_ITEMS_CONFIRM: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LINK_SHOP_SUBMENU_ITEMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LINK_SHOP_SUBMENU_ITEMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LINK_SHOP_MAIN_MENU_ITEMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LINK_SHOP_SUBMENU_ITEMS_3: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LINK_SHOP_SUBMENU_ITEMS_4: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LINK_SHOP_SUBMENU_ITEMS_5: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LINK_SHOP_SUBMENU_ITEMS_6: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LINK_SHOP_SUBMENU_ITEMS_7: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY18_FUNCTION_POINTER_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY18_RESERVED_SPACE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY18_UNKNOWN_POINTER__NA_238D620: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY18_UNKNOWN_POINTER__NA_238D624: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY18_UNKNOWN_POINTER__NA_238D628: ClassVar[Symbol[tuple[int, ...], int]]
+
+class NaOverlay18Section(
+    Section,
+    name="overlay18",
+    description="Controls the Electivire Link Shop.",
+    loadaddress=0x238A140,
+    length=0x3500,
+    functions=NaOverlay18Functions,
+    data=NaOverlay18Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay18Functions]]
+    data: ClassVar[type[NaOverlay18Data]]
+
+class NaOverlay19Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    GetBarItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetRecruitableMonsterAll: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetRecruitableMonsterList: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetRecruitableMonsterListRestricted: ClassVar[Symbol[tuple[int, ...], None]]
+
+class NaOverlay19Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    OVERLAY19_UNKNOWN_TABLE__NA_238DAE0: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BAR_UNLOCKABLE_DUNGEONS_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BAR_RECRUITABLE_MONSTER_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BAR_AVAILABLE_ITEMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY19_UNKNOWN_STRING_IDS__NA_238E178: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY19_UNKNOWN_STRUCT__NA_238E1A4: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY19_UNKNOWN_STRING_IDS__NA_238E1CC: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BAR_WINDOW_PARAMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BAR_WINDOW_PARAMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BAR_WINDOW_PARAMS_3: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BAR_MENU_ITEMS_CONFIRM_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BAR_MENU_ITEMS_CONFIRM_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY19_UNKNOWN_STRING_IDS__NA_238E238: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BAR_MAIN_MENU_ITEMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BAR_SUBMENU_ITEMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BAR_SUBMENU_ITEMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY19_RESERVED_SPACE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY19_UNKNOWN_POINTER__NA_238E360: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY19_UNKNOWN_POINTER__NA_238E364: ClassVar[Symbol[tuple[int, ...], int]]
+
+class NaOverlay19Section(
+    Section,
+    name="overlay19",
+    description="Controls Spinda's Juice Bar.",
+    loadaddress=0x238A140,
+    length=0x4240,
+    functions=NaOverlay19Functions,
+    data=NaOverlay19Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay19Functions]]
+    data: ClassVar[type[NaOverlay19Data]]
+
+class NaOverlay2Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay2Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay2Section(
+    Section,
+    name="overlay2",
+    description="Controls the Nintendo WFC Settings interface, accessed from the top menu (Other > Nintendo WFC > Nintendo WFC Settings). Presumably contains code for Nintendo Wi-Fi setup.",
+    loadaddress=0x2329520,
+    length=0x2AFA0,
+    functions=NaOverlay2Functions,
+    data=NaOverlay2Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay2Functions]]
+    data: ClassVar[type[NaOverlay2Data]]
+
+class NaOverlay20Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay20Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    OVERLAY20_UNKNOWN_POINTER__NA_238CF7C: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RECYCLE_MENU_ITEMS_CONFIRM_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RECYCLE_MENU_ITEMS_CONFIRM_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RECYCLE_SUBMENU_ITEMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RECYCLE_SUBMENU_ITEMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RECYCLE_MAIN_MENU_ITEMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY20_UNKNOWN_TABLE__NA_238D014: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RECYCLE_WINDOW_PARAMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RECYCLE_WINDOW_PARAMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RECYCLE_WINDOW_PARAMS_3: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RECYCLE_WINDOW_PARAMS_4: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RECYCLE_WINDOW_PARAMS_5: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RECYCLE_WINDOW_PARAMS_6: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RECYCLE_MAIN_MENU_ITEMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RECYCLE_WINDOW_PARAMS_7: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RECYCLE_WINDOW_PARAMS_8: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RECYCLE_WINDOW_PARAMS_9: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RECYCLE_WINDOW_PARAMS_10: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RECYCLE_WINDOW_PARAMS_11: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RECYCLE_MAIN_MENU_ITEMS_3: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY20_RESERVED_SPACE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY20_UNKNOWN_POINTER__NA_238D120: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY20_UNKNOWN_POINTER__NA_238D124: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY20_UNKNOWN_POINTER__NA_238D128: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY20_UNKNOWN_POINTER__NA_238D12C: ClassVar[Symbol[tuple[int, ...], int]]
+
+class NaOverlay20Section(
+    Section,
+    name="overlay20",
+    description="Controls the Recycle Shop.",
+    loadaddress=0x238A140,
+    length=0x3000,
+    functions=NaOverlay20Functions,
+    data=NaOverlay20Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay20Functions]]
+    data: ClassVar[type[NaOverlay20Data]]
+
+class NaOverlay21Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay21Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    SWAP_SHOP_WINDOW_PARAMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SWAP_SHOP_MENU_ITEMS_CONFIRM: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SWAP_SHOP_SUBMENU_ITEMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SWAP_SHOP_SUBMENU_ITEMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SWAP_SHOP_MAIN_MENU_ITEMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SWAP_SHOP_MAIN_MENU_ITEMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SWAP_SHOP_SUBMENU_ITEMS_3: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY21_UNKNOWN_STRING_IDS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SWAP_SHOP_WINDOW_PARAMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SWAP_SHOP_WINDOW_PARAMS_3: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SWAP_SHOP_WINDOW_PARAMS_4: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SWAP_SHOP_WINDOW_PARAMS_5: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SWAP_SHOP_WINDOW_PARAMS_6: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SWAP_SHOP_WINDOW_PARAMS_7: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SWAP_SHOP_WINDOW_PARAMS_8: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SWAP_SHOP_WINDOW_PARAMS_9: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY21_JP_STRING: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY21_RESERVED_SPACE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY21_UNKNOWN_POINTER__NA_238CF40: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY21_UNKNOWN_POINTER__NA_238CF44: ClassVar[Symbol[tuple[int, ...], int]]
+
+class NaOverlay21Section(
+    Section,
+    name="overlay21",
+    description="Controls the Croagunk Swap Shop.",
+    loadaddress=0x238A140,
+    length=0x2E20,
+    functions=NaOverlay21Functions,
+    data=NaOverlay21Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay21Functions]]
+    data: ClassVar[type[NaOverlay21Data]]
+
+class NaOverlay22Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay22Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    SHOP_WINDOW_PARAMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SHOP_WINDOW_PARAMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY22_UNKNOWN_STRUCT__NA_238E85C: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SHOP_MENU_ITEMS_CONFIRM: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SHOP_MAIN_MENU_ITEMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SHOP_MAIN_MENU_ITEMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SHOP_MAIN_MENU_ITEMS_3: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY22_UNKNOWN_STRING_IDS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SHOP_WINDOW_PARAMS_3: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SHOP_WINDOW_PARAMS_4: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SHOP_WINDOW_PARAMS_5: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SHOP_WINDOW_PARAMS_6: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SHOP_WINDOW_PARAMS_7: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SHOP_WINDOW_PARAMS_8: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SHOP_WINDOW_PARAMS_9: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SHOP_WINDOW_PARAMS_10: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY22_RESERVED_SPACE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY22_UNKNOWN_POINTER__NA_238EC60: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY22_UNKNOWN_POINTER__NA_238EC64: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY22_UNKNOWN_POINTER__NA_238EC68: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY22_UNKNOWN_POINTER__NA_238EC6C: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY22_UNKNOWN_POINTER__NA_238EC70: ClassVar[Symbol[tuple[int, ...], int]]
+
+class NaOverlay22Section(
+    Section,
+    name="overlay22",
+    description="Controls the Kecleon Shop in Treasure Town.",
+    loadaddress=0x238A140,
+    length=0x4B40,
+    functions=NaOverlay22Functions,
+    data=NaOverlay22Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay22Functions]]
+    data: ClassVar[type[NaOverlay22Data]]
+
+class NaOverlay23Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay23Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    OVERLAY23_UNKNOWN_VALUE__NA_238D2E8: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY23_UNKNOWN_VALUE__NA_238D2EC: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY23_UNKNOWN_STRUCT__NA_238D2F0: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STORAGE_MENU_ITEMS_CONFIRM: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STORAGE_MAIN_MENU_ITEMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STORAGE_MAIN_MENU_ITEMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STORAGE_MAIN_MENU_ITEMS_3: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STORAGE_MAIN_MENU_ITEMS_4: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY23_UNKNOWN_STRING_IDS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STORAGE_WINDOW_PARAMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STORAGE_WINDOW_PARAMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STORAGE_WINDOW_PARAMS_3: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STORAGE_WINDOW_PARAMS_4: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STORAGE_WINDOW_PARAMS_5: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STORAGE_WINDOW_PARAMS_6: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STORAGE_WINDOW_PARAMS_7: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STORAGE_WINDOW_PARAMS_8: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY23_RESERVED_SPACE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY23_UNKNOWN_POINTER__NA_238D8A0: ClassVar[Symbol[tuple[int, ...], int]]
+
+class NaOverlay23Section(
+    Section,
+    name="overlay23",
+    description="Controls Kangaskhan Storage (both in Treasure Town and via Kangaskhan Rocks).",
+    loadaddress=0x238A140,
+    length=0x3780,
+    functions=NaOverlay23Functions,
+    data=NaOverlay23Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay23Functions]]
+    data: ClassVar[type[NaOverlay23Data]]
+
+class NaOverlay24Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay24Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    OVERLAY24_UNKNOWN_STRUCT__NA_238C508: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY24_UNKNOWN_STRUCT__NA_238C514: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DAYCARE_MENU_ITEMS_CONFIRM: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DAYCARE_MAIN_MENU_ITEMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY24_UNKNOWN_STRING_IDS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DAYCARE_WINDOW_PARAMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DAYCARE_WINDOW_PARAMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DAYCARE_WINDOW_PARAMS_3: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DAYCARE_WINDOW_PARAMS_4: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DAYCARE_WINDOW_PARAMS_5: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY24_RESERVED_SPACE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY24_UNKNOWN_POINTER__NA_238C600: ClassVar[Symbol[tuple[int, ...], int]]
+
+class NaOverlay24Section(
+    Section,
+    name="overlay24",
+    description="Controls the Chansey Day Care.",
+    loadaddress=0x238A140,
+    length=0x24E0,
+    functions=NaOverlay24Functions,
+    data=NaOverlay24Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay24Functions]]
+    data: ClassVar[type[NaOverlay24Data]]
+
+class NaOverlay25Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay25Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    OVERLAY25_UNKNOWN_STRUCT__NA_238B498: ClassVar[Symbol[tuple[int, ...], int]]
+
+    APPRAISAL_WINDOW_PARAMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    APPRAISAL_MENU_ITEMS_CONFIRM: ClassVar[Symbol[tuple[int, ...], int]]
+
+    APPRAISAL_MAIN_MENU_ITEMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    APPRAISAL_SUBMENU_ITEMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY25_UNKNOWN_STRING_IDS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    APPRAISAL_WINDOW_PARAMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    APPRAISAL_WINDOW_PARAMS_3: ClassVar[Symbol[tuple[int, ...], int]]
+
+    APPRAISAL_WINDOW_PARAMS_4: ClassVar[Symbol[tuple[int, ...], int]]
+
+    APPRAISAL_WINDOW_PARAMS_5: ClassVar[Symbol[tuple[int, ...], int]]
+
+    APPRAISAL_WINDOW_PARAMS_6: ClassVar[Symbol[tuple[int, ...], int]]
+
+    APPRAISAL_WINDOW_PARAMS_7: ClassVar[Symbol[tuple[int, ...], int]]
+
+    APPRAISAL_WINDOW_PARAMS_8: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY25_RESERVED_SPACE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY25_UNKNOWN_POINTER__NA_238B5E0: ClassVar[Symbol[tuple[int, ...], int]]
+
+class NaOverlay25Section(
+    Section,
+    name="overlay25",
+    description="Controls Xatu Appraisal.",
+    loadaddress=0x238A140,
+    length=0x14C0,
+    functions=NaOverlay25Functions,
+    data=NaOverlay25Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay25Functions]]
+    data: ClassVar[type[NaOverlay25Data]]
+
+class NaOverlay26Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay26Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    OVERLAY26_UNKNOWN_TABLE__NA_238AE20: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY26_RESERVED_SPACE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY26_UNKNOWN_POINTER__NA_238AF60: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY26_UNKNOWN_POINTER__NA_238AF64: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY26_UNKNOWN_POINTER__NA_238AF68: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY26_UNKNOWN_POINTER__NA_238AF6C: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY26_UNKNOWN_POINTER5__NA_238AF70: ClassVar[Symbol[tuple[int, ...], int]]
+
+class NaOverlay26Section(
+    Section,
+    name="overlay26",
+    description="Related to mission completion. It's loaded when the dungeon completion summary is shown upon exiting a dungeon, and during the cutscenes where you collect mission rewards from clients.",
+    loadaddress=0x238A140,
+    length=0xE40,
+    functions=NaOverlay26Functions,
+    data=NaOverlay26Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay26Functions]]
+    data: ClassVar[type[NaOverlay26Data]]
+
+class NaOverlay27Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay27Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    OVERLAY27_UNKNOWN_VALUE__NA_238C948: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY27_UNKNOWN_VALUE__NA_238C94C: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY27_UNKNOWN_STRUCT__NA_238C950: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DISCARD_ITEMS_MENU_ITEMS_CONFIRM: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DISCARD_ITEMS_SUBMENU_ITEMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DISCARD_ITEMS_SUBMENU_ITEMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DISCARD_ITEMS_MAIN_MENU_ITEMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY27_UNKNOWN_STRING_IDS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DISCARD_WINDOW_PARAMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DISCARD_WINDOW_PARAMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DISCARD_WINDOW_PARAMS_3: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DISCARD_WINDOW_PARAMS_4: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DISCARD_WINDOW_PARAMS_5: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DISCARD_WINDOW_PARAMS_6: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DISCARD_WINDOW_PARAMS_7: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DISCARD_WINDOW_PARAMS_8: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY27_RESERVED_SPACE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY27_UNKNOWN_POINTER__NA_238CE80: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY27_UNKNOWN_POINTER__NA_238CE84: ClassVar[Symbol[tuple[int, ...], int]]
+
+class NaOverlay27Section(
+    Section,
+    name="overlay27",
+    description="Controls the special episode item discard menu.",
+    loadaddress=0x238A140,
+    length=0x2D60,
+    functions=NaOverlay27Functions,
+    data=NaOverlay27Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay27Functions]]
+    data: ClassVar[type[NaOverlay27Data]]
+
+class NaOverlay28Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay28Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay28Section(
+    Section,
+    name="overlay28",
+    description="Controls the staff credits sequence.",
+    loadaddress=0x238A140,
+    length=0xC60,
+    functions=NaOverlay28Functions,
+    data=NaOverlay28Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay28Functions]]
+    data: ClassVar[type[NaOverlay28Data]]
+
+class NaOverlay29Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    GetWeatherColorTable: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DungeonAlloc: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetDungeonPtrMaster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DungeonZInit: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DungeonFree: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RunDungeon: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EntityIsValid: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetFloorType: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryForcedLoss: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsBossFight: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsCurrentFixedRoomBossFight: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsMarowakTrainingMaze: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FixedRoomIsSubstituteRoom: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StoryRestrictionsEnabled: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetScenarioBalanceVeneer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FadeToBlack: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CheckTouchscreenArea: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetTrapInfo: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetItemInfo: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetTileAtEntity: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateEntityPixelPos: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetEntityPixelPosXY: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IncrementEntityPixelPosXY: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateEnemyEntity: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SpawnTrap: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SpawnItemEntity: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ShouldMinimapDisplayEntity: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ShouldDisplayEntity: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ShouldDisplayEntityWrapper: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CanSeeTarget: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CanTargetEntity: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CanTargetPosition: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PopulateActiveMonsterPtrs: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetTeamMemberIndex: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SubstitutePlaceholderStringTags: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateMapSurveyorFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PointCameraToMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateCamera: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ItemIsActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetVisibilityRange: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RevealWholeFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PlayEffectAnimationEntity: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PlayEffectAnimationPos: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PlayEffectAnimationPixelPos: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AnimationDelayOrSomething: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateStatusIconFlags: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PlayEffectAnimation0x171Full: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PlayEffectAnimation0x171: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ShowPpRestoreEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ShouldDisplayEntityAdvanced: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PlayEffectAnimation0x1A9: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PlayEffectAnimation0x18E: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadMappaFileAttributes: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetItemIdToSpawn: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CopySpawnEntriesMaster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MonsterSpawnListPartialCopy: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsOnMonsterSpawnList: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMonsterIdToSpawn: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMonsterLevelToSpawn: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AllocTopScreenStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FreeTopScreenStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitializeTeamStats: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateTeamStatsWrapper: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FreeTeamStatsWrapper: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AssignTopScreenHandlers: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HandleTopScreenFades: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FreeTopScreen: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetDirectionTowardsPosition: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetChebyshevDistance: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsPositionActuallyInSight: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsPositionInSight: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetLeader: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetLeaderMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetRandomTile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FindNearbyUnoccupiedTile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FindClosestUnoccupiedTileWithin2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FindFarthestUnoccupiedTileWithin2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FindUnoccupiedTileWithin3: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TickStatusTurnCounter: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AdvanceFrame: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DisplayAnimatedNumbers: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetDungeonRngPreseed23Bit: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateDungeonRngSeed: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetDungeonRngPreseed: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetDungeonRngPreseed: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitDungeonRng: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DungeonRand16Bit: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DungeonRandInt: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DungeonRandRange: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DungeonRandOutcome: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CalcStatusDuration: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DungeonRngUnsetSecondary: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DungeonRngSetSecondary: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DungeonRngSetPrimary: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MusicTableIdxToMusicId: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ChangeDungeonMusic: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TrySwitchPlace: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetLeaderActionFields: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ClearMonsterActionFields: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetMonsterActionFields: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetActionPassTurnOrWalk: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetItemToUseByIndex: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetItemToUse: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetItemAction: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RemoveUsedItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AddDungeonSubMenuOption: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DisableDungeonSubMenuOption: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetActionRegularAttack: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetActionUseMovePlayer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetActionUseMoveAi: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RunFractionalTurn: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RunLeaderTurn: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TrySpawnMonsterAndActivatePlusMinus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsFloorOver: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DecrementWindCounter: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsDungeonEndReasonFailure: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetForcedLossReason: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetForcedLossReason: ClassVar[Symbol[tuple[int, ...], None]]
+
+    BindTrapToTile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AreLateGameTrapsEnabledWrapper: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SpawnEnemyTrapAtPos: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PrepareTrapperTrap: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TrySpawnTrap: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TrySpawnTrapperTrap: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryRemoveTrap: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryTriggerTrap: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyMudTrapEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyStickyTrapEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyGrimyTrapEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyPitfallTrapEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplySummonTrapEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyPpZeroTrapEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyPokemonTrapEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyTripTrapEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyStealthRockTrapEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyToxicSpikesTrapEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyRandomTrapEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyGrudgeTrapEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyTrapEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RevealTrapsNearby: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ShouldRunMonsterAi: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DebugRecruitingEnabled: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryActivateIqBooster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsSecretBazaarNpcBehavior: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetLeaderAction: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetEntityTouchscreenArea: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetLeaderAction: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ShouldLeaderKeepRunning: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CheckLeaderTile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ChangeLeader: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UseSingleUseItemWrapper: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UseSingleUseItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UseThrowableItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ResetDamageData: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FreeLoadedAttackSpriteAndMore: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetAndLoadCurrentAttackAnimation: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ClearLoadedAttackSprite: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetLoadedAttackSpriteId: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DungeonGetTotalSpriteFileSize: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DungeonGetSpriteIndex: ClassVar[Symbol[tuple[int, ...], None]]
+
+    JoinedAtRangeCheck2Veneer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FloorNumberIsEven: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetKecleonIdToSpawnByFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StoreSpriteFileIndexBothGenders: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadMonsterSpriteInner: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SwapMonsterWanFileIndex: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadMonsterSprite: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DeleteMonsterSpriteFile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DeleteAllMonsterSpriteFiles: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EuFaintCheck: ClassVar[Symbol[None, None]]
+
+    HandleFaint: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MoveMonsterToPos: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateMonsterSummaryFromMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateAiTargetPos: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetMonsterTypeAndAbility: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryActivateSlowStart: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryActivateArtificialWeatherAbilities: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMonsterApparentId: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryActivateTraceAndColorChange: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DefenderAbilityIsActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryActivateConversion2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryActivateTruant: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryPointCameraToMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ReevaluateSnatchMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetRandomExplorerMazeMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RestorePpAllMovesSetFlags: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CheckTeamMemberIdxVeneer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsMonsterIdInNormalRangeVeneer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    BoostIQ: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ShouldMonsterHeadToStairs: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MewSpawnCheck: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryEndStatusWithAbility: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ExclusiveItemEffectIsActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetTeamMemberWithIqSkill: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TeamMemberHasEnabledIqSkill: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TeamLeaderIqSkillIsEnabled: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CountMovesOutOfPp: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HasSuperEffectiveMoveAgainstUser: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryEatItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetDecoyAiTracker: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CheckSpawnThreshold: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HasLowHealth: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AreEntitiesAdjacent: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsSpecialStoryAlly: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsExperienceLocked: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitOtherMonsterData: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitEnemySpawnStats: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitEnemyStatsAndMoves: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SpawnTeam: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SpawnInitialMonsters: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SpawnMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitTeamMember: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SubInitMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MarkShopkeeperSpawn: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SpawnShopkeepers: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMaxHpAtLevel: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetOffensiveStatAtLevel: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetDefensiveStatAtLevel: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetOutlawSpawnData: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ExecuteMonsterAction: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryActivateFlashFireOnAllMonsters: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HasStatusThatPreventsActing: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMobilityTypeCheckSlip: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMobilityTypeCheckSlipAndFloating: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsInvalidSpawnTile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMobilityTypeAfterIqSkills: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CannotStandOnTile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CalcSpeedStage: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CalcSpeedStageWrapper: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetNumberOfAttacks: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMonsterDisplayNameType: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMonsterName: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SprintfStatic: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsMonsterDrowsy: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MonsterHasNonvolatileNonsleepStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MonsterHasImmobilizingStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MonsterHasAttackInterferingStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MonsterHasSkillInterferingStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MonsterHasLeechSeedStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MonsterHasWhifferStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsMonsterVisuallyImpaired: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsMonsterMuzzled: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MonsterHasMiracleEyeStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MonsterHasNegativeStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsMonsterSleeping: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CheckVariousStatuses2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CheckVariousConditions: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CheckVariousStatuses: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CanMonsterMoveInDirection: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetDirectionalMobilityType: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsMonsterCornered: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CanAttackInDirection: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CanAiMonsterMoveInDirection: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ShouldMonsterRunAway: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ShouldMonsterRunAwayVariation: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetTreatmentBetweenMonsters: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SafeguardIsActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LeafGuardIsActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsProtectedFromStatDrops: ClassVar[Symbol[tuple[int, ...], None]]
+
+    NoGastroAcidStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AbilityIsActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AbilityIsActiveVeneer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    OtherMonsterAbilityIsActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LevitateIsActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MonsterIsType: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsTypeAffectedByGravity: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HasTypeAffectedByGravity: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CanSeeInvisibleMonsters: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsTacticSet: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HasDropeyeStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IqSkillIsEnabled: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateIqSkills: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMoveTypeForMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMovePower: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MonsterCanThrowItems: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateStateFlags: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsProtectedFromNegativeStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AddExpSpecial: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EnemyEvolution: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LevelUpItemEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryDecreaseLevel: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LevelUp: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMonsterMoves: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EvolveMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ChangeMonsterAnimation: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetIdleAnimationId: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DetermineAllMonsterShadow: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DetermineMonsterShadow: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DisplayActions: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CheckNonLeaderTile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EndNegativeStatusCondition: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EndNegativeStatusConditionWrapper: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TransferNegativeStatusCondition: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EndSleepClassStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EndBurnClassStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EndFrozenClassStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EndCringeClassStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EndReflectClassStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryRemoveSnatchedMonsterFromDungeonStruct: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EndCurseClassStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EndLeechSeedClassStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EndSureShotClassStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EndInvisibleClassStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EndBlinkerClassStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EndMuzzledStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EndMiracleEyeStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EndMagnetRiseStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TransferNegativeBlinkerClassStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EndFrozenStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EndProtectStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryRestoreRoostTyping: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryTriggerMonsterHouse: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ShouldMonsterFollowLeader: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RunMonsterAi: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyDamageAndEffects: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyDamage: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AftermathCheck: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetTypeMatchupBothTypes: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ScrappyShouldActivate: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsTypeIneffectiveAgainstGhost: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GhostImmunityIsActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetTypeMatchup: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CalcTypeBasedDamageEffects: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CalcDamage: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyDamageAndEffectsWrapper: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CalcRecoilDamageFixed: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CalcDamageFixed: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CalcDamageFixedNoCategory: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CalcDamageFixedWrapper: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateShopkeeperModeAfterAttack: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateShopkeeperModeAfterTrap: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ResetDamageCalcDiagnostics: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SpecificRecruitCheck: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RecruitCheck: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryRecruit: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TrySpawnMonsterAndTickSpawnCounter: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AiDecideUseItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetPossibleAiThrownItemDirections: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetPossibleAiArcItemTargets: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryNonLeaderItemPickUp: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetExclusiveItemWithEffectFromBag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AuraBowIsActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ExclusiveItemOffenseBoost: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ExclusiveItemDefenseBoost: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TeamMemberHasItemActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TeamMemberHasExclusiveItemEffectActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TrySpawnEnemyItemDrop: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TickNoSlipCap: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TickStatusAndHealthRegen: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InflictSleepStatusSingle: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictSleepStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsProtectedFromSleepClassStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictNightmareStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictNappingStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictYawningStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictSleeplessStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictPausedStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictInfatuatedStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictBurnStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictBurnStatusWholeTeam: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictPoisonedStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictBadlyPoisonedStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictFrozenStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictConstrictionStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictShadowHoldStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictIngrainStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictWrappedStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FreeOtherWrappedMonsters: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictPetrifiedStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LowerOffensiveStat: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LowerDefensiveStat: ClassVar[Symbol[tuple[int, ...], None]]
+
+    BoostOffensiveStat: ClassVar[Symbol[tuple[int, ...], None]]
+
+    BoostDefensiveStat: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FlashFireShouldActivate: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ActivateFlashFire: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyOffensiveStatMultiplier: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyDefensiveStatMultiplier: ClassVar[Symbol[tuple[int, ...], None]]
+
+    BoostHitChanceStat: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LowerHitChanceStat: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictCringeStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictParalysisStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    BoostSpeed: ClassVar[Symbol[tuple[int, ...], None]]
+
+    BoostSpeedOneStage: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LowerSpeed: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TrySealMove: ClassVar[Symbol[tuple[int, ...], None]]
+
+    BoostOrLowerSpeed: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ResetHitChanceStat: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ExclusiveItemEffectIsActiveWithLogging: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryActivateQuickFeet: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictTerrifiedStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictGrudgeStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictConfusedStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictCoweringStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryRestoreHp: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryIncreaseHp: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RevealItems: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RevealStairs: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RevealEnemies: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictLeechSeedStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictDestinyBondStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictSureShotStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictWhifferStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictSetDamageStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictFocusEnergyStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictDecoyStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictCurseStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictSnatchStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictTauntStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictStockpileStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictInvisibleStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictPerishSongStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictEncoreStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryDecreaseBelly: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryIncreaseBelly: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictMuzzledStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryTransform: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictMobileStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictExposedStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryActivateIdentifyCondition: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictBlinkerStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsBlinded: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictCrossEyedStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictEyedropStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictSlipStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictDropeyeStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RestoreAllMovePP: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RestoreOneMovePP: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RestoreRandomMovePP: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyProteinEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyCalciumEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyIronEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyZincEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictLongTossStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictPierceStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictGastroAcidStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetAquaRingHealingCountdownTo4: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyAquaRingHealing: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictAquaRingStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictLuckyChantStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictHealBlockStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MonsterHasEmbargoStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LogItemBlockedByEmbargo: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictEmbargoStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictMiracleEyeStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictMagnetRiseStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsFloating: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictSafeguardStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictMistStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictWishStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictMagicCoatStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictLightScreenStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictReflectStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictProtectStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictMirrorCoatStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictEndureStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictMirrorMoveStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictConversion2Status: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryInflictVitalThrowStatus: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryResetStatChanges: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MirrorMoveIsActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MistIsActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    Conversion2IsActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AiConsiderMove: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryAddTargetToAiTargetList: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsAiTargetEligible: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsTargetInRange: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ShouldUsePp: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetEntityMoveTargetAndRange: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetEntityNaturalGiftInfo: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetEntityWeatherBallType: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ActivateMotorDrive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryActivateFrisk: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryActivateBadDreams: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ActivateStench: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryActivateSteadfast: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsInSpawnList: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ChangeShayminForme: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyItemEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyCheriBerryEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyPechaBerryEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyRawstBerryEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyHungerSeedEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyVileSeedEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyViolentSeedEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyGinsengEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyBlastSeedEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyGummiBoostsDungeonMode: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CanMonsterUseItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyGrimyFoodEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyMixElixirEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyDoughSeedEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyViaSeedEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyGravelyrockEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyGonePebbleEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyGracideaEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetAiUseItemProbability: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsAdjacentToEnemy: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ShouldTryEatItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMaxPpWrapper: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MoveIsNotPhysical: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CategoryIsNotPhysical: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryDrought: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryPounce: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryBlowAway: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryExplosion: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryAftermathExplosion: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryWarp: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EnsureCanStandCurrentTile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryActivateNondamagingDefenderAbility: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryActivateNondamagingDefenderExclusiveItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMoveRangeDistance: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MoveHitCheck: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsHyperBeamVariant: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsChargingTwoTurnMove: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsChargingAnyTwoTurnMove: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HasMaxGinsengBoost99: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TwoTurnMoveForcedMiss: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DungeonRandOutcomeUserTargetInteraction: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DungeonRandOutcomeUserAction: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CanAiUseMove: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CanMonsterUseMove: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateMovePp: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetDamageSourceWrapper: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LowerSshort: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PlayMoveAnimation: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMoveAnimationId: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ShouldMovePlayAlternativeAnimation: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ExecuteMoveEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoMoveDamageInlined: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DealDamage: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DealDamageWithTypeAndPowerBoost: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DealDamageProjectile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DealDamageWithType: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PerformDamageSequence: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CanHitWithRegularAttack: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StatusCheckerCheck: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetApparentWeather: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryWeatherFormChange: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ActivateSportCondition: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryActivateWeather: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DigitCount: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadTextureUi: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DisplayNumberTextureUi: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DisplayCharTextureUi: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DisplayUi: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetTile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetTileSafe: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsFullFloorFixedRoom: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsCurrentTilesetBackground: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TrySpawnGoldenChamber: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CountItemsOnFloorForAcuteSniffer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetStairsSpawnPosition: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PositionIsOnStairs: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetStairsRoom: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetDefaultTileTextureId: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DetermineAllTilesWalkableNeighbors: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DetermineTileWalkableNeighbors: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateTrapsVisibility: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DrawTileGrid: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HideTileGrid: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DiscoverMinimap: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PositionHasItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PositionHasMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TrySmashWall: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsWaterTileset: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetRandomSpawnMonsterID: ClassVar[Symbol[tuple[int, ...], None]]
+
+    NearbyAllyIqSkillIsEnabled: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ResetGravity: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GravityIsActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryActivateGravity: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ShouldBoostKecleonShopSpawnChance: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetShouldBoostKecleonShopSpawnChance: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateShouldBoostKecleonShopSpawnChance: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetDoughSeedFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetDoughSeedFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TrySpawnDoughSeedPoke: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsSecretBazaar: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ShouldBoostHiddenStairsSpawnChance: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetShouldBoostHiddenStairsSpawnChance: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateShouldBoostHiddenStairsSpawnChance: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsSecretRoom: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsSecretFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetCurrentHiddenStairsType: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HiddenStairsPresent: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PositionIsOnHiddenStairs: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HiddenStairsTrigger: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetHiddenStairsField: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetHiddenStairsField: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetHiddenFloorField: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetHiddenFloorField: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadWeather3DFiles: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RenderWeather3D: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMinimapData: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DrawMinimapTile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FlashLeaderIcon: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateMinimap: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetMinimapDataE447: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMinimapDataE447: ClassVar[Symbol[None, None]]
+
+    SetMinimapDataE448: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitWeirdMinimapMatrix: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitMinimapDisplayTile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadFixedRoomDataVeneer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UnloadFixedRoomData: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsNormalFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetTileTerrain: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DungeonRand100: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ClearHiddenStairs: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FlagHallwayJunctions: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateStandardFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateOuterRingFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateCrossroadsFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateLineFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateCrossFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateBeetleFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MergeRoomsVertically: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateOuterRoomsFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsNotFullFloorFixedRoom: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateFixedRoom: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateOneRoomMonsterHouseFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateTwoRoomsWithMonsterHouseFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateExtraHallways: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetGridPositions: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitDungeonGrid: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AssignRooms: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateRoomsAndAnchors: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateSecondaryStructures: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AssignGridCellConnections: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateGridCellConnections: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateRoomImperfections: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateHallway: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EnsureConnectedGrid: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetTerrainObstacleChecked: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FinalizeJunctions: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateKecleonShop: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateMonsterHouse: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateMazeRoom: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateMaze: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateMazeLine: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetSpawnFlag5: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsNextToHallway: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ResolveInvalidSpawns: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ConvertSecondaryTerrainToChasms: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EnsureImpassableTilesAreWalls: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitializeTile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ResetFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PosIsOutOfBounds: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ShuffleSpawnPositions: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MarkNonEnemySpawns: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MarkEnemySpawns: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetSecondaryTerrainOnWall: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateSecondaryTerrainFormations: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StairsAlwaysReachable: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetNextFixedRoomAction: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ConvertWallsToChasms: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ResetInnerBoundaryTileRows: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ResetImportantSpawnPositions: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SpawnStairs: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetHiddenStairsType: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetFinalKecleonShopSpawnChance: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ResetHiddenStairsSpawn: ClassVar[Symbol[tuple[int, ...], None]]
+
+    PlaceFixedRoomTile: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FixedRoomActionParamToDirection: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ApplyKeyEffect: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadFixedRoomData: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadFixedRoom: ClassVar[Symbol[tuple[int, ...], None]]
+
+    OpenFixedBin: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CloseFixedBin: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AreOrbsAllowed: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AreTileJumpsAllowed: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AreTrawlOrbsAllowed: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AreOrbsAllowedVeneer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AreLateGameTrapsEnabled: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AreMovesEnabled: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsRoomIlluminated: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMatchingMonsterId: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateItemExplicit: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateAndSpawnItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsHiddenStairsFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsSecretBazaarVeneer: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateStandardItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateCleanItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryLeaderItemPickUp: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SpawnItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RemoveGroundItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SpawnDroppedItemWrapper: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SpawnDroppedItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TryGenerateUnownStoneDrop: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HasHeldItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateMoneyQuantity: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CheckTeamItemsFlags: ClassVar[Symbol[tuple[int, ...], None]]
+
+    AddHeldItemToBag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RemoveEmptyItemsInBagWrapper: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DoesProjectileHitTarget: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DisplayFloorCard: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HandleFloorCard: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CheckActiveChallengeRequest: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMissionDestination: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsOutlawOrChallengeRequestFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsDestinationFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsCurrentMissionType: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsCurrentMissionTypeExact: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsOutlawMonsterHouseFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsGoldenChamber: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsLegendaryChallengeFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsJirachiChallengeFloor: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsDestinationFloorWithMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LoadMissionMonsterSprites: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MissionTargetEnemyIsDefeated: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetMissionTargetEnemyDefeated: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsDestinationFloorWithFixedRoom: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetItemToRetrieve: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetItemToDeliver: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetSpecialTargetItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsDestinationFloorWithItem: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsDestinationFloorWithHiddenOutlaw: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsDestinationFloorWithFleeingOutlaw: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMissionTargetEnemy: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetMissionEnemyMinionGroup: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetTargetMonsterNotFoundFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetTargetMonsterNotFoundFlag: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FloorHasMissionMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GenerateMissionEggMonster: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LogMessageByIdWithPopupCheckParticipants: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LogMessageByIdWithPopupCheckUser: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LogMessageWithPopupCheckUser: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LogMessageByIdQuiet: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LogMessageQuiet: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LogMessageByIdWithPopupCheckUserTarget: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LogMessageWithPopupCheckUserTarget: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LogMessageByIdQuietCheckUserTarget: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LogMessageByIdWithPopupCheckUserUnknown: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LogMessageByIdWithPopup: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LogMessageWithPopup: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LogMessage: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LogMessageById: ClassVar[Symbol[tuple[int, ...], None]]
+
+    InitPortraitDungeon: ClassVar[Symbol[tuple[int, ...], None]]
+
+    OpenMessageLog: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RunDungeonMode: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StartFadeDungeon: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StartFadeDungeonWrapper: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HandleFadesDungeon: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HandleFadesDungeonBothScreens: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DisplayFloorTip: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DisplayItemTip: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DisplayDungeonTip: ClassVar[Symbol[tuple[int, ...], None]]
+
+    SetBothScreensWindowColorToDefault: ClassVar[Symbol[tuple[int, ...], None]]
+
+    GetPersonalityIndex: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DisplayMessage: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DisplayMessage2: ClassVar[Symbol[tuple[int, ...], None]]
+
+    YesNoMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DisplayMessageInternal: ClassVar[Symbol[tuple[int, ...], None]]
+
+    OpenMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    OthersMenuLoop: ClassVar[Symbol[tuple[int, ...], None]]
+
+    OthersMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+class NaOverlay29Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    DUNGEON_STRUCT_SIZE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MAX_HP_CAP: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OFFSET_OF_DUNGEON_FLOOR_PROPERTIES: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SPAWN_RAND_MAX: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_PRNG_LCG_MULTIPLIER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_PRNG_LCG_INCREMENT_SECONDARY: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ATTACK_SPRITE_BUFFER_SIZE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    KECLEON_FEMALE_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    KECLEON_MALE_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MSG_ID_SLOW_START: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EXPERIENCE_POINT_GAIN_CAP: ClassVar[Symbol[tuple[int, ...], int]]
+
+    JUDGMENT_MOVE_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    REGULAR_ATTACK_MOVE_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DEOXYS_ATTACK_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DEOXYS_SPEED_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    GIRATINA_ALTERED_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    PUNISHMENT_MOVE_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OFFENSE_STAT_MAX: ClassVar[Symbol[tuple[int, ...], int]]
+
+    PROJECTILE_MOVE_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BELLY_LOST_PER_TURN: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MONSTER_HEAL_HP_MAX: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MOVE_TARGET_AND_RANGE_SPECIAL_USER_HEALING: ClassVar[Symbol[tuple[int, ...], int]]
+
+    PLAIN_SEED_STRING_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MAX_ELIXIR_PP_RESTORATION: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SLIP_SEED_FAIL_STRING_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ROCK_WRECKER_MOVE_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    CASTFORM_NORMAL_FORM_MALE_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    CASTFORM_NORMAL_FORM_FEMALE_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    CHERRIM_SUNSHINE_FORM_MALE_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    CHERRIM_OVERCAST_FORM_FEMALE_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    CHERRIM_SUNSHINE_FORM_FEMALE_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    FLOOR_GENERATION_STATUS_PTR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OFFSET_OF_DUNGEON_N_NORMAL_ITEM_SPAWNS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_GRID_COLUMN_BYTES: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DEFAULT_MAX_POSITION: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OFFSET_OF_DUNGEON_GUARANTEED_ITEM_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    FIXED_ROOM_TILE_SPAWN_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TREASURE_BOX_1_ITEM_IDS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    FIXED_ROOM_REVISIT_OVERRIDES: ClassVar[Symbol[tuple[int, ...], int]]
+
+    FIXED_ROOM_MONSTER_SPAWN_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    FIXED_ROOM_ITEM_SPAWN_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    FIXED_ROOM_ENTITY_SPAWN_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STATUS_ICON_ARRAY_MUZZLED: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STATUS_ICON_ARRAY_MAGNET_RISE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STATUS_ICON_ARRAY_MIRACLE_EYE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STATUS_ICON_ARRAY_LEECH_SEED: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STATUS_ICON_ARRAY_LONG_TOSS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STATUS_ICON_ARRAY_BLINDED: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STATUS_ICON_ARRAY_BURN: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STATUS_ICON_ARRAY_SURE_SHOT: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STATUS_ICON_ARRAY_INVISIBLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STATUS_ICON_ARRAY_SLEEP: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STATUS_ICON_ARRAY_CURSE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STATUS_ICON_ARRAY_FREEZE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STATUS_ICON_ARRAY_CRINGE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STATUS_ICON_ARRAY_BIDE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STATUS_ICON_ARRAY_REFLECT: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DIRECTIONS_XY: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DISPLACEMENTS_WITHIN_2_LARGEST_FIRST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DISPLACEMENTS_WITHIN_2_SMALLEST_FIRST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DISPLACEMENTS_WITHIN_3: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ITEM_CATEGORY_ACTIONS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    FRACTIONAL_TURN_SEQUENCE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BELLY_DRAIN_IN_WALLS_INT: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BELLY_DRAIN_IN_WALLS_THOUSANDTHS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DAMAGE_MULTIPLIER_0_5: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DAMAGE_MULTIPLIER_1_5: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DAMAGE_MULTIPLIER_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    CLOUDY_DAMAGE_MULTIPLIER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SOLID_ROCK_MULTIPLIER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DAMAGE_FORMULA_MAX_BASE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    WONDER_GUARD_MULTIPLIER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DAMAGE_FORMULA_MIN_BASE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TYPE_DAMAGE_NEGATING_EXCLUSIVE_ITEM_EFFECTS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TWO_TURN_STATUSES: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TWO_TURN_MOVES_AND_STATUSES: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SPATK_STAT_IDX: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ATK_STAT_IDX: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ROLLOUT_DAMAGE_MULT_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MAP_COLOR_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    CORNER_CARDINAL_NEIGHBOR_IS_OPEN: ClassVar[Symbol[tuple[int, ...], int]]
+
+    GUMMI_LIKE_STRING_IDS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    GUMMI_IQ_STRING_IDS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DAMAGE_STRING_IDS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_PTR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_PTR_MASTER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TOP_SCREEN_STATUS_PTR: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LEADER_PTR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_PRNG_STATE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_PRNG_STATE_SECONDARY_VALUES: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LOADED_ATTACK_SPRITE_FILE_INDEX: ClassVar[Symbol[tuple[int, ...], None]]
+
+    LOADED_ATTACK_SPRITE_PACK_ID: ClassVar[Symbol[None, None]]
+
+    EXCL_ITEM_EFFECTS_WEATHER_ATK_SPEED_BOOST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EXCL_ITEM_EFFECTS_WEATHER_MOVE_SPEED_BOOST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    EXCL_ITEM_EFFECTS_WEATHER_NO_STATUS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    AI_THROWN_ITEM_ACTION_CHOICE_COUNT: ClassVar[Symbol[tuple[int, ...], None]]
+
+    EXCL_ITEM_EFFECTS_EVASION_BOOST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DEFAULT_TILE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    HIDDEN_STAIRS_SPAWN_BLOCKED: ClassVar[Symbol[tuple[int, ...], int]]
+
+    FIXED_ROOM_DATA_PTR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_FADES_PTR: ClassVar[Symbol[tuple[int, ...], None]]
+
+    NECTAR_IQ_BOOST: ClassVar[Symbol[tuple[int, ...], None]]
+
+    COMPRESSED_SPRITE_BUFFER_SIZE: ClassVar[Symbol[tuple[int, ...], None]]
+
+class NaOverlay29Section(
+    Section,
+    name="overlay29",
+    description="The dungeon engine.\n\nThis is the 'main' overlay of dungeon mode. It controls most things that happen in a Mystery Dungeon, such as dungeon layout generation, dungeon menus, enemy AI, and generally just running each turn while within a dungeon.",
+    loadaddress=0x22DC240,
+    length=0x77620,
+    functions=NaOverlay29Functions,
+    data=NaOverlay29Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay29Functions]]
+    data: ClassVar[type[NaOverlay29Data]]
+
+class NaOverlay3Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay3Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay3Section(
+    Section,
+    name="overlay3",
+    description="Controls the Friend Rescue submenu within the top menu.",
+    loadaddress=0x233CA80,
+    length=0xA160,
+    functions=NaOverlay3Functions,
+    data=NaOverlay3Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay3Functions]]
+    data: ClassVar[type[NaOverlay3Data]]
+
+class NaOverlay30Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    WriteQuicksaveData: ClassVar[Symbol[tuple[int, ...], None]]
+
+class NaOverlay30Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    OVERLAY30_JP_STRING_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY30_JP_STRING_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+class NaOverlay30Section(
+    Section,
+    name="overlay30",
+    description="Controls quicksaving in dungeons.",
+    loadaddress=0x2382820,
+    length=0x38A0,
+    functions=NaOverlay30Functions,
+    data=NaOverlay30Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay30Functions]]
+    data: ClassVar[type[NaOverlay30Data]]
+
+class NaOverlay31Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    EntryOverlay31: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DrawDungeonMenuStatusWindow: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DungeonMenuSwitch: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateStairsMenuState: ClassVar[Symbol[tuple[int, ...], None]]
+
+    StairsSubheadingCallback: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HandleStairsMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    MovesMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HandleMovesMenuWrapper0: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HandleMovesMenuWrapper1: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HandleMovesMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    TeamMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RestMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    RecruitmentSearchMenuLoop: ClassVar[Symbol[tuple[int, ...], None]]
+
+    HelpMenuLoop: ClassVar[Symbol[tuple[int, ...], None]]
+
+class NaOverlay31Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    DUNGEON_WINDOW_PARAMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_3: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_4: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_MAIN_MENU_ITEMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_MENU_SWITCH_STR1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY31_UNKNOWN_STRING_IDS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY31_UNKNOWN_STRUCT__NA_2389E30: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_5: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_6: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_7: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_SUBMENU_ITEMS_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_SUBMENU_ITEMS_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_SUBMENU_ITEMS_3: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_SUBMENU_ITEMS_4: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY31_UNKNOWN_STRUCT__NA_2389EF0: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_8: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_9: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_10: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_11: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_12: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_13: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY31_JP_STRING: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_14: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_15: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_16: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_17: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_18: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_19: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY31_UNKNOWN_STRUCT__NA_2389FE8: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_20: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_21: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_22: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_23: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_24: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_25: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_SUBMENU_ITEMS_5: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_26: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY31_UNKNOWN_STRUCT__NA_238A144: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_27: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_28: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY31_UNKNOWN_STRUCT__NA_238A190: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_SUBMENU_ITEMS_6: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_29: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_30: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_31: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_WINDOW_PARAMS_32: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY31_RESERVED_SPACE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY31_UNKNOWN_POINTER__NA_238A260: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY31_UNKNOWN_VALUE__NA_238A264: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY31_UNKNOWN_POINTER__NA_238A268: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY31_UNKNOWN_POINTER__NA_238A26C: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY31_UNKNOWN_POINTER__NA_238A270: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY31_UNKNOWN_POINTER__NA_238A274: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY31_UNKNOWN_POINTER__NA_238A278: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY31_UNKNOWN_POINTER__NA_238A27C: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY31_UNKNOWN_POINTER__NA_238A280: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY31_UNKNOWN_POINTER__NA_238A284: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY31_UNKNOWN_POINTER__NA_238A288: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY31_UNKNOWN_POINTER__NA_238A28C: ClassVar[Symbol[tuple[int, ...], int]]
+
+class NaOverlay31Section(
+    Section,
+    name="overlay31",
+    description="Controls the dungeon menu (during dungeon mode).",
+    loadaddress=0x2382820,
+    length=0x7A80,
+    functions=NaOverlay31Functions,
+    data=NaOverlay31Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay31Functions]]
+    data: ClassVar[type[NaOverlay31Data]]
+
+class NaOverlay32Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay32Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay32Section(
+    Section,
+    name="overlay32",
+    description="Unused; all zeroes.",
+    loadaddress=0x2382820,
+    length=0x20,
+    functions=NaOverlay32Functions,
+    data=NaOverlay32Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay32Functions]]
+    data: ClassVar[type[NaOverlay32Data]]
+
+class NaOverlay33Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay33Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay33Section(
+    Section,
+    name="overlay33",
+    description="Unused; all zeroes.",
+    loadaddress=0x2382820,
+    length=0x20,
+    functions=NaOverlay33Functions,
+    data=NaOverlay33Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay33Functions]]
+    data: ClassVar[type[NaOverlay33Data]]
+
+class NaOverlay34Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    ExplorersOfSkyMain: ClassVar[Symbol[tuple[int, ...], None]]
+
+class NaOverlay34Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    OVERLAY34_UNKNOWN_STRUCT__NA_22DD014: ClassVar[Symbol[tuple[int, ...], int]]
+
+    START_MENU_ITEMS_CONFIRM: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY34_UNKNOWN_STRUCT__NA_22DD03C: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_DEBUG_MENU_ITEMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY34_RESERVED_SPACE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY34_UNKNOWN_POINTER__NA_22DD080: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY34_UNKNOWN_POINTER__NA_22DD084: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY34_UNKNOWN_POINTER__NA_22DD088: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY34_UNKNOWN_POINTER__NA_22DD08C: ClassVar[Symbol[tuple[int, ...], int]]
+
+    OVERLAY34_UNKNOWN_POINTER__NA_22DD090: ClassVar[Symbol[tuple[int, ...], int]]
+
+class NaOverlay34Section(
+    Section,
+    name="overlay34",
+    description="Related to launching the game.\n\nThere are mention in the strings of logos like the ESRB logo. This only seems to be loaded during the ESRB rating splash screen, so this is likely the sole purpose of this overlay.",
+    loadaddress=0x22DC240,
+    length=0xE60,
+    functions=NaOverlay34Functions,
+    data=NaOverlay34Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay34Functions]]
+    data: ClassVar[type[NaOverlay34Data]]
+
+class NaOverlay35Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay35Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay35Section(
+    Section,
+    name="overlay35",
+    description="Unused; all zeroes.",
+    loadaddress=0x22BCA80,
+    length=0x20,
+    functions=NaOverlay35Functions,
+    data=NaOverlay35Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay35Functions]]
+    data: ClassVar[type[NaOverlay35Data]]
+
+class NaOverlay4Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay4Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay4Section(
+    Section,
+    name="overlay4",
+    description="Controls the Trade Items submenu within the top menu.",
+    loadaddress=0x233CA80,
+    length=0x2BE0,
+    functions=NaOverlay4Functions,
+    data=NaOverlay4Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay4Functions]]
+    data: ClassVar[type[NaOverlay4Data]]
+
+class NaOverlay5Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay5Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay5Section(
+    Section,
+    name="overlay5",
+    description="Controls the Trade Team submenu within the top menu.",
+    loadaddress=0x233CA80,
+    length=0x3240,
+    functions=NaOverlay5Functions,
+    data=NaOverlay5Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay5Functions]]
+    data: ClassVar[type[NaOverlay5Data]]
+
+class NaOverlay6Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay6Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay6Section(
+    Section,
+    name="overlay6",
+    description="Controls the Wonder Mail S submenu within the top menu.",
+    loadaddress=0x233CA80,
+    length=0x2460,
+    functions=NaOverlay6Functions,
+    data=NaOverlay6Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay6Functions]]
+    data: ClassVar[type[NaOverlay6Data]]
+
+class NaOverlay7Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay7Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay7Section(
+    Section,
+    name="overlay7",
+    description="Controls the Nintendo WFC submenu within the top menu (under 'Other').",
+    loadaddress=0x233CA80,
+    length=0x5100,
+    functions=NaOverlay7Functions,
+    data=NaOverlay7Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay7Functions]]
+    data: ClassVar[type[NaOverlay7Data]]
+
+class NaOverlay8Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay8Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaOverlay8Section(
+    Section,
+    name="overlay8",
+    description="Controls the Send Demo Dungeon submenu within the top menu (under 'Other').",
+    loadaddress=0x233CA80,
+    length=0x2200,
+    functions=NaOverlay8Functions,
+    data=NaOverlay8Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay8Functions]]
+    data: ClassVar[type[NaOverlay8Data]]
+
+class NaOverlay9Functions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    CreateJukeboxTrackMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CloseJukeboxTrackMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsJukeboxTrackMenuActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateJukeboxTrackMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreatePlaybackControlsMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    ClosePlaybackControlsMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsPlaybackControlsMenuActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdatePlaybackControlsMenu: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CreateInputLockBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    CloseInputLockBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+    IsInputLockBoxActive: ClassVar[Symbol[tuple[int, ...], None]]
+
+    UpdateInputLockBox: ClassVar[Symbol[tuple[int, ...], None]]
+
+class NaOverlay9Data(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    JUKEBOX_TRACK_MENU_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    PLAYBACK_CONTROLS_MENU_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    INPUT_LOCK_BOX_DEFAULT_WINDOW_PARAMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TOP_MENU_RETURN_MUSIC_ID: ClassVar[Symbol[tuple[int, ...], None]]
+
+class NaOverlay9Section(
+    Section,
+    name="overlay9",
+    description="Controls the Sky Jukebox.",
+    loadaddress=0x233CA80,
+    length=0x2D80,
+    functions=NaOverlay9Functions,
+    data=NaOverlay9Data,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaOverlay9Functions]]
+    data: ClassVar[type[NaOverlay9Data]]
+
+class NaRamFunctions(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+class NaRamData(metaclass=LazySymbols):
+    @classmethod
+    def lookup(cls, name: str) -> Symbol: ...
+    @classmethod
+    def symbols(cls) -> Iterator[Symbol]: ...
+
+    DEFAULT_MEMORY_ARENA_MEMORY: ClassVar[Symbol[tuple[int, ...], int]]
+
+    GROUND_MEMORY_ARENA_2: ClassVar[Symbol[tuple[int, ...], int]]
+
+    GROUND_MEMORY_ARENA_2_BLOCKS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    GROUND_MEMORY_ARENA_2_MEMORY: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_COLORMAP_PTR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DUNGEON_STRUCT: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MOVE_DATA_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SOUND_MEMORY_ARENA: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SOUND_MEMORY_ARENA_BLOCKS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SOUND_MEMORY_ARENA_MEMORY: ClassVar[Symbol[tuple[int, ...], int]]
+
+    FRAMES_SINCE_LAUNCH: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TOUCHSCREEN_STATUS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BAG_ITEMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BAG_ITEMS_PTR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STORAGE_ITEMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STORAGE_ITEM_QUANTITIES: ClassVar[Symbol[tuple[int, ...], int]]
+
+    KECLEON_SHOP_ITEMS_PTR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    KECLEON_SHOP_ITEMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    UNUSED_KECLEON_SHOP_ITEMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    KECLEON_WARES_ITEMS_PTR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    KECLEON_WARES_ITEMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    UNUSED_KECLEON_WARES_ITEMS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MONEY_CARRIED: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MONEY_STORED: ClassVar[Symbol[tuple[int, ...], int]]
+
+    AUDIO_COMMANDS_BUFFER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SOUND_MEMORY_ARENA_PTR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    WINDOW_LIST: ClassVar[Symbol[tuple[int, ...], int]]
+
+    CURSOR_16_SPRITE_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    CURSOR_SPRITE_ID: ClassVar[Symbol[None, None]]
+
+    CURSOR_ANIMATION_CONTROL: ClassVar[Symbol[tuple[int, ...], int]]
+
+    CURSOR_16_ANIMATION_CONTROL: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ALERT_SPRITE_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ALERT_ANIMATION_CONTROL: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LAST_NEW_MOVE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SCRIPT_VARS_VALUES: ClassVar[Symbol[tuple[int, ...], int]]
+
+    BAG_LEVEL: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DEBUG_SPECIAL_EPISODE_NUMBER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    KAOMADO_STREAM: ClassVar[Symbol[tuple[int, ...], int]]
+
+    PENDING_DUNGEON_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    PENDING_STARTING_FLOOR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    PLAY_TIME_SECONDS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    PLAY_TIME_FRAME_COUNTER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TEAM_NAME: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LEVEL_UP_DATA_MONSTER_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LEVEL_UP_DATA_DECOMPRESS_BUFFER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TEAM_MEMBER_TABLE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    DRIVER_WORK: ClassVar[Symbol[tuple[int, ...], None]]
+
+    DISP_MODE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    GXI_VRAM_LOCK_ID: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ENABLED_VRAM_BANKS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SUB_BG_EXT_PLTT: ClassVar[Symbol[tuple[int, ...], int]]
+
+    CLR_IMG: ClassVar[Symbol[tuple[int, ...], int]]
+
+    THREAD_INFO_STRUCT: ClassVar[Symbol[tuple[int, ...], None]]
+
+    FRAMES_SINCE_LAUNCH_TIMES_THREE: ClassVar[Symbol[tuple[int, ...], int]]
+
+    GROUND_MEMORY_ARENA_1_PTR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    GROUND_MEMORY_ARENA_2_PTR: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LOCK_NOTIFY_ARRAY: ClassVar[Symbol[tuple[int, ...], int]]
+
+    GROUND_MEMORY_ARENA_1: ClassVar[Symbol[tuple[int, ...], int]]
+
+    GROUND_MEMORY_ARENA_1_BLOCKS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    GROUND_MEMORY_ARENA_1_MEMORY: ClassVar[Symbol[tuple[int, ...], int]]
+
+    SENTRY_DUTY_STRUCT: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TURNING_ON_THE_SPOT_FLAG: ClassVar[Symbol[tuple[int, ...], int]]
+
+    LOADED_ATTACK_SPRITE_DATA: ClassVar[Symbol[tuple[int, ...], int]]
+
+    AI_THROWN_ITEM_DIRECTION_IS_USED: ClassVar[Symbol[tuple[int, ...], int]]
+
+    AI_THROWN_ITEM_PROBABILITIES: ClassVar[Symbol[tuple[int, ...], int]]
+
+    AI_THROWN_ITEM_DIRECTIONS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ROLLOUT_ICE_BALL_MISSED: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MULTIHIT_FATIGUE_MOVE_USED: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TWINEEDLE_HIT_TRACKER: ClassVar[Symbol[tuple[int, ...], int]]
+
+    RAPID_SPIN_BINDING_REMOVAL: ClassVar[Symbol[tuple[int, ...], int]]
+
+    ROLLOUT_ICE_BALL_SUCCESSIVE_HITS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    MULTIHIT_MOVE_SUCCESSIVE_HITS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    TRIPLE_KICK_SUCCESSIVE_HITS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    METRONOME_NEXT_INDEX: ClassVar[Symbol[tuple[int, ...], int]]
+
+    FLOOR_GENERATION_STATUS: ClassVar[Symbol[tuple[int, ...], int]]
+
+    STAIRS_MENU_PTR: ClassVar[Symbol[None, None]]
+
+class NaRamSection(
+    Section,
+    name="ram",
+    description="Main memory.\nData in this file aren't located in the ROM itself, and are instead constructs loaded at runtime.\n\nMore specifically, this file is a dumping ground for addresses that are useful to know about, but don't fall in the address ranges of any of the other files. Dynamically loaded constructs that do fall within the address range of a relevant binary should be listed in the corresponding YAML file of that binary, since it still has direct utility when reverse-engineering that particular binary.",
+    loadaddress=0x2000000,
+    length=0x400000,
+    functions=NaRamFunctions,
+    data=NaRamData,
+):
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[int]
+    length: ClassVar[int]
+    functions: ClassVar[type[NaRamFunctions]]
+    data: ClassVar[type[NaRamData]]
+
+class NaSections:
+
+    arm7: ClassVar[type[NaArm7Section]]
+
+    arm9: ClassVar[type[NaArm9Section]]
+
+    itcm: ClassVar[type[NaItcmSection]]
+
+    libs: ClassVar[type[NaLibsSection]]
+
+    move_effects: ClassVar[type[NaMove_effectsSection]]
+
+    overlay0: ClassVar[type[NaOverlay0Section]]
+
+    overlay1: ClassVar[type[NaOverlay1Section]]
+
+    overlay10: ClassVar[type[NaOverlay10Section]]
+
+    overlay11: ClassVar[type[NaOverlay11Section]]
+
+    overlay12: ClassVar[type[NaOverlay12Section]]
+
+    overlay13: ClassVar[type[NaOverlay13Section]]
+
+    overlay14: ClassVar[type[NaOverlay14Section]]
+
+    overlay15: ClassVar[type[NaOverlay15Section]]
+
+    overlay16: ClassVar[type[NaOverlay16Section]]
+
+    overlay17: ClassVar[type[NaOverlay17Section]]
+
+    overlay18: ClassVar[type[NaOverlay18Section]]
+
+    overlay19: ClassVar[type[NaOverlay19Section]]
+
+    overlay2: ClassVar[type[NaOverlay2Section]]
+
+    overlay20: ClassVar[type[NaOverlay20Section]]
+
+    overlay21: ClassVar[type[NaOverlay21Section]]
+
+    overlay22: ClassVar[type[NaOverlay22Section]]
+
+    overlay23: ClassVar[type[NaOverlay23Section]]
+
+    overlay24: ClassVar[type[NaOverlay24Section]]
+
+    overlay25: ClassVar[type[NaOverlay25Section]]
+
+    overlay26: ClassVar[type[NaOverlay26Section]]
+
+    overlay27: ClassVar[type[NaOverlay27Section]]
+
+    overlay28: ClassVar[type[NaOverlay28Section]]
+
+    overlay29: ClassVar[type[NaOverlay29Section]]
+
+    overlay3: ClassVar[type[NaOverlay3Section]]
+
+    overlay30: ClassVar[type[NaOverlay30Section]]
+
+    overlay31: ClassVar[type[NaOverlay31Section]]
+
+    overlay32: ClassVar[type[NaOverlay32Section]]
+
+    overlay33: ClassVar[type[NaOverlay33Section]]
+
+    overlay34: ClassVar[type[NaOverlay34Section]]
+
+    overlay35: ClassVar[type[NaOverlay35Section]]
+
+    overlay4: ClassVar[type[NaOverlay4Section]]
+
+    overlay5: ClassVar[type[NaOverlay5Section]]
+
+    overlay6: ClassVar[type[NaOverlay6Section]]
+
+    overlay7: ClassVar[type[NaOverlay7Section]]
+
+    overlay8: ClassVar[type[NaOverlay8Section]]
+
+    overlay9: ClassVar[type[NaOverlay9Section]]
+
+    ram: ClassVar[type[NaRamSection]]
+
+SECTIONS: dict[str, type[Section]]
+SYMBOLS_BY_ABSOLUTE_ADDRESS: dict[int, list[tuple[str, Symbol]]]
+
+def sections_at(address: int) -> list[type[Section]]: ...
+def symbols_named(name: str) -> list[tuple[str, Symbol]]: ...
+def resolve(address: int) -> list[tuple[str, Symbol]]: ...
@@ -1,13 +1,24 @@
-from typing import Protocol, Optional, TypeVar, Generic, no_type_check
+from array import array
+from collections.abc import Iterator, Mapping
+from typing import (
+    TYPE_CHECKING,
+    ClassVar,
+    Protocol,
+    Optional,
+    TypeVar,
+    Generic,
+    no_type_check,
+)
 from dataclasses import dataclass
+from importlib import import_module
 
 A = TypeVar("A")
 B = TypeVar("B")
 
 
-@dataclass
+@dataclass(slots=True)
 class Symbol(Generic[A, B]):
-    # Either a list of at least one address or None if not defined for the region.
+    # Either a tuple of at least one address or None if not defined for the region.
     addresses: A
     # Like addresses but memory-absolute
     absolute_addresses: A
@@ -31,6 +42,174 @@ class Symbol(Generic[A, B]):
         return self.absolute_addresses[0]
 
 
+class SymbolTable(Mapping[str, tuple]):
+    """
+    Raw symbols of one generated function or data class, stored as packed columns.
+    Maps each symbol name to a tuple of its addresses, absolute addresses, length, description index and C type.
+    """
+
+    # Marks a missing address or length in a column.
+    NONE = 0xFFFFFFFF
+
+    __slots__ = (
+        "_index",
+        "_addresses",
+        "_absolute_addresses",
+        "_lengths",
+        "_descriptions",
+        "_c_types",
+        "_multi",
+    )
+
+    def __init__(
+        self,
+        names: tuple[str, ...],
+        addresses: array,
+        absolute_addresses: array,
+        lengths: array,
+        descriptions: array,
+        c_types: Optional[tuple[str, ...]],
+        multi: dict[int, tuple[Optional[tuple], Optional[tuple]]],
+    ):
+        self._index = {name: i for i, name in enumerate(names)}
+        self._addresses = addresses
+        self._absolute_addresses = absolute_addresses
+        self._lengths = lengths
+        self._descriptions = descriptions
+        # None for functions.
+        self._c_types = c_types
+        # Symbols with more than one address are not in the address columns, but stored here by index.
+        self._multi = multi
+
+    def __getitem__(self, name: str) -> tuple:
+        i = self._index[name]
+        if i in self._multi:
+            addresses, absolute_addresses = self._multi[i]
+        else:
+            address = self._addresses[i]
+            absolute_address = self._absolute_addresses[i]
+            addresses = None if address == self.NONE else (address,)
+            absolute_addresses = (
+                None if absolute_address == self.NONE else (absolute_address,)
+            )
+        length = self._lengths[i]
+        return (
+            addresses,
+            absolute_addresses,
+            None if length == self.NONE else length,
+            self._descriptions[i],
+            None if self._c_types is None else self._c_types[i],
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+# Table of all function and data classes without symbols, so they never have to import a table module.
+EMPTY_SYMBOL_TABLE = SymbolTable(
+    (), array("I"), array("I"), array("I"), array("I"), None, {}
+)
+
+
+class LazySymbols(type):
+    """
+    Metaclass of the generated function and data classes.
+    Symbols are stored as raw rows in the `SymbolTable` `_RAW` and only turned into `Symbol` objects on first access.
+    `_RAW` itself is imported on first access from the table module named by `_TABLE`.
+    """
+
+    _TABLE: tuple[str, str]
+    _RAW: SymbolTable
+
+    # Hidden from type checkers, so that accessing a symbol that is not declared on the class is an error.
+    if not TYPE_CHECKING:
+
+        def __getattr__(cls, name: str) -> Symbol:
+            if name == "_RAW":
+                module, table = cls._TABLE
+                raw = getattr(import_module(module, __package__), table)
+                cls._RAW = raw
+                return raw
+            if name not in cls._RAW:
+                raise AttributeError(
+                    f"type object {cls.__name__!r} has no attribute {name!r}"
+                )
+            return cls._create_symbol(name)
+
+    def _create_symbol(cls, name: str) -> Symbol:
+        addresses, absolute_addresses, length, description, c_type = cls._RAW[name]
+        # The descriptions make up most of the symbol data, so they are only loaded once a symbol is needed.
+        from ._descriptions import DESCRIPTIONS
+
+        symbol: Symbol = Symbol(
+            addresses,
+            absolute_addresses,
+            length,
+            name,
+            DESCRIPTIONS[description],
+            c_type,
+        )
+        # Cache the symbol on the class, so later lookups no longer go through __getattr__.
+        setattr(cls, name, symbol)
+        return symbol
+
+    def lookup(cls, name: str) -> Symbol:
+        """
+        Returns the symbol with the given name. Raises a KeyError if there is none.
+        Unlike getattr, this never returns deprecated aliases or other class attributes.
+        """
+        symbol = vars(cls).get(name)
+        if not isinstance(symbol, Symbol):
+            if name not in cls._RAW:
+                raise KeyError(name)
+            symbol = cls._create_symbol(name)
+        return symbol
+
+    def symbols(cls) -> Iterator[Symbol]:
+        """
+        Returns all symbols of the class, in the order of the symbol definitions.
+        Symbols are only stored on the class once accessed, so use this instead of iterating vars().
+        """
+        for name in cls._RAW:
+            yield cls.lookup(name)
+
+    def __dir__(cls):
+        return list(set(super().__dir__()) | cls._RAW.keys())
+
+
+class Section:
+    """Base class of the generated section classes. The section metadata is passed as class keywords."""
+
+    name: ClassVar[str]
+    description: ClassVar[str]
+    loadaddress: ClassVar[Optional[int]]
+    length: ClassVar[Optional[int]]
+    functions: ClassVar[LazySymbols]
+    data: ClassVar[LazySymbols]
+
+    def __init_subclass__(
+        cls,
+        *,
+        name: str,
+        description: str,
+        loadaddress: Optional[int],
+        length: Optional[int],
+        functions: LazySymbols,
+        data: LazySymbols,
+        **kwargs,
+    ):
+        super().__init_subclass__(**kwargs)
+        cls.name = name
+        cls.description = description
+        cls.loadaddress = loadaddress
+        cls.length = length
+        cls.functions = functions
+        cls.data = data
+
+
 T = TypeVar("T")
 U = TypeVar("U")
 L = TypeVar("L")
@@ -45,105 +224,111 @@ class SectionProtocol(Protocol[T, U, L]):
     data: U
 
 
-class Arm7FunctionsProtocol(Protocol):
+class SymbolLookupProtocol(Protocol):
+    def lookup(self, name: str) -> Symbol: ...
+
+    def symbols(self) -> Iterator[Symbol]: ...
+
+
+class Arm7FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     _start_arm7: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     do_autoload_arm7: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StartAutoloadDoneCallbackArm7: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     NitroSpMain: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HardwareInterrupt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ReturnFromInterrupt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AudioInterrupt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ClearImeFlag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ClearIeFlag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetCurrentPlaybackTime: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ClearIrqFlag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EnableIrqFlag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetIrqFlag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EnableIrqFiqFlags: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetIrqFiqFlags: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetProcessorMode: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _s32_div_f: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _u32_div_f: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _u32_div_not_0_f: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
 
-class Arm7DataProtocol(Protocol):
+class Arm7DataProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
@@ -155,6033 +340,6033 @@ Arm7Protocol = SectionProtocol[
 ]
 
 
-class Arm9FunctionsProtocol(Protocol):
+class Arm9FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     Svc_SoftReset: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Svc_WaitByLoop: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Svc_CpuSet: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _start: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitI_CpuClear32: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MIi_UncompressBackward: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     do_autoload: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StartAutoloadDoneCallback: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     init_cp15: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     OSi_ReferSymbol: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     NitroMain: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitMemAllocTable: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetMemAllocatorParams: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetAllocArenaDefault: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetFreeArenaDefault: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitMemArena: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MemAllocFlagsToBlockType: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FindAvailableMemBlock: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SplitMemBlock: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MemAlloc: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MemFree: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MemArenaAlloc: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateMemArena: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MemLocateSet: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MemLocateUnset: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RoundUpDiv256: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UFixedPoint64CmpLt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MultiplyByFixedPoint: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UMultiplyByFixedPoint: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IntToFixedPoint64: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FixedPoint64ToInt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FixedPoint32To64: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     NegateFixedPoint64: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FixedPoint64IsZero: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FixedPoint64IsNegative: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FixedPoint64CmpLt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MultiplyFixedPoint64: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DivideFixedPoint64: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UMultiplyFixedPoint64: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UDivideFixedPoint64: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AddFixedPoint64: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ClampedLn: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetRngSeed: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetRngSeed: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Rand16Bit: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RandInt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RandRange: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Rand32Bit: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RandIntSafe: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RandRangeSafe: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     WaitForever: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InterruptMasterDisable: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InterruptMasterEnable: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitMemAllocTableVeneer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ZInit8: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PointsToZero: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MemZero: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MemZero16: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MemZero32: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MemsetSimple: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Memset32: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MemcpySimple: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Memcpy16: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Memcpy32: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TaskProcBoot: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EnableAllInterrupts: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetTime: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DisableAllInterrupts: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SoundResume: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CardPullOutWithStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CardPullOut: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CardBackupError: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HaltProcessDisp: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     OverlayIsLoaded: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadOverlay: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UnloadOverlay: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetDsFirmwareUserSettingsVeneer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Rgb8ToRgb5: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EuclideanNorm: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ClampComponentAbs: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetHeldButtons: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetPressedButtons: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetReleasedStylus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     KeyWaitInit: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DebugPrintSystemClock: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetSystemClock: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SprintfSystemClock: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DataTransferInit: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DataTransferStop: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FileInitVeneer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FileOpen: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FileGetSize: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FileRead: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FileSeek: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FileClose: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UnloadFile: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadFileFromRom: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TransformPaletteDataWithFlushDivideFade: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateFadeStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HandleFades: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetFadeStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitDebug: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitDebugFlag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetDebugFlag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetDebugFlag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitDebugStripped6: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AppendProgPos: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitDebugStripped5: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DebugPrintTrace: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DebugDisplay: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DebugPrint0: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitDebugLogFlag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetDebugLogFlag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetDebugLogFlag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DebugPrint: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitDebugStripped4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitDebugStripped3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitDebugStripped2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitDebugStripped1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FatalError: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     OpenAllPackFiles: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetFileLengthInPackWithPackNb: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadFileInPackWithPackId: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AllocAndLoadFileInPack: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     OpenPackFile: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetFileLengthInPack: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadFileInPack: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetDungeonResultMsg: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetDamageSource: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetItemCategoryVeneer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetItemMoveId16: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsThrownItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsNotMoney: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsEdible: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsHM: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsGummi: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsAuraBow: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsLosableItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsTreasureBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsStorableItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsShoppableItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsValidTargetItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsItemUsableNow: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsTicketItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitStandardItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitBulkItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     BulkItemToItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ItemToBulkItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetDisplayedBuyPrice: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetDisplayedSellPrice: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetActualBuyPrice: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetActualSellPrice: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FindItemInInventory: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SprintfStatic: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ItemZInit: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AreItemsEquivalent: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     WriteItemsToSave: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ReadItemsFromSave: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsItemAvailableInDungeonGroup: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetItemIdFromList: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     NormalizeTreasureBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SortItemList: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RemoveEmptyItems: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadItemPspi2n: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetExclusiveItemType: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetExclusiveItemOffsetEnsureValid: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsItemValid: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetExclusiveItemParameter: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetItemCategory: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EnsureValidItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetItemName: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetItemNameFormatted: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetItemBuyPrice: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetItemSellPrice: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetItemSpriteId: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetItemPaletteId: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetItemActionName: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetThrownItemQuantityLimit: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetItemMoveId: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TestItemAiFlag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsItemInTimeDarkness: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsItemValidVeneer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetActiveInventoryToMain: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AllInventoriesZInit: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SpecialEpisodeInventoryZInit: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RescueInventoryZInit: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetActiveInventory: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMoneyCarried: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetMoneyCarried: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AddMoneyCarried: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetCurrentBagCapacity: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsBagFull: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetNbItemsInBag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CountNbItemsOfTypeInBag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CountItemTypeInBag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsItemInBag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsItemWithFlagsInBag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsItemInTreasureBoxes: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsHeldItemInBag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsItemForSpecialSpawnInBag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HasStorableItems: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetItemIndex: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetEquivItemIndex: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetEquippedThrowableItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetFirstUnequippedItemOfType: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CopyItemAtIdx: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetItemAtIdx: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RemoveEmptyItemsInBag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RemoveItemNoHole: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RemoveItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RemoveHeldItemNoHole: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RemoveItemByIdAndStackNoHole: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RemoveEquivItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RemoveEquivItemNoHole: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DecrementStackItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RemoveItemNoHoleCheck: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RemoveFirstUnequippedItemOfType: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RemoveAllItems: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RemoveAllItemsStartingAt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SpecialProcAddItemToBag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AddItemToBagNoHeld: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AddItemToBag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CleanStickyItemsInBag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CountStickyItemsInBag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TransmuteHeldItemInBag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetFlagsForHeldItemInBag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RemoveHolderForItemInBag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetHolderForItemInBag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SortItemsInBag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RemovePokeItemsInBag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsStorageFull: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CountNbOfItemsInStorage: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CountNbOfValidItemsInStorage: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CountNbOfValidItemsInTimeDarknessInStorage: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CountNbItemsOfTypeInStorage: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CountItemTypeInStorage: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetEquivBulkItemIdxInStorage: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ConvertStorageItemAtIdxToBulkItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ConvertStorageItemAtIdxToItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RemoveItemAtIdxInStorage: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RemoveBulkItemInStorage: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RemoveItemInStorage: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StorageZInit: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AddBulkItemToStorage: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AddItemToStorage: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SortItemsInStorage: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AllKecleonShopsZInit: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SpecialEpisodeKecleonShopZInit: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetActiveKecleonShop: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMoneyStored: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetMoneyStored: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AddMoneyStored: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SortKecleonItems1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateKecleonItems1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SortKecleonItems2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateKecleonItems2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetExclusiveItemOffset: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyExclusiveItemStatBoosts: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetExclusiveItemEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ExclusiveItemEffectFlagTest: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsExclusiveItemIdForMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsExclusiveItemForMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     BagHasExclusiveItemTypeForMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetExclusiveItemForMonsterFromBag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetHpBoostFromExclusiveItems: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyGummiBoostsToGroundMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyGummiBoostsToTeamMember: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplySitrusBerryBoostToGroundMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyLifeSeedBoostToGroundMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyGinsengToGroundMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyProteinBoostToGroundMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyCalciumBoostToGroundMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyIronBoostToGroundMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyZincBoostToGroundMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyNectarBoostToGroundMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsMonsterAffectedByGravelyrockGroundMode: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyGravelyrockBoostToGroundMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyGummiBoostsGroundMode: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadSynthBin: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CloseSynthBin: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetSynthItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadWazaP: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadWazaP2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UnloadCurrentWazaP: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMoveName: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FormatMoveString: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FormatMoveStringMore: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitMove: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitMoveCheckId: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetInfoMoveGround: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMoveTargetAndRange: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMoveType: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMovesetLevelUpPtr: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsInvalidMoveset: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMovesetHmTmPtr: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMovesetEggPtr: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMoveAiWeight: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMoveNbStrikes: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMoveBasePower: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMoveBasePowerGround: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMoveAccuracyOrAiChance: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMoveBasePp: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMaxPp: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMoveMaxGinsengBoost: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMoveMaxGinsengBoostGround: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMoveCritChance: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsThawingMove: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsAffectedByTaunt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMoveRangeId: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMoveActualAccuracy: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMoveBasePowerFromId: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsMoveRangeString19: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMoveMessageFromId: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetNbMoves: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMovesetIdx: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsReflectedByMagicCoat: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CanBeSnatched: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FailsWhileMuzzled: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsSoundMove: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsRecoilMove: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AllManip1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AllManip2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ManipMoves1v1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ManipMoves1v2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ManipMoves2v1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ManipMoves2v2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DungeonMoveToGroundMove: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GroundToDungeonMoveset: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DungeonToGroundMoveset: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetInfoGroundMoveset: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FindFirstFreeMovesetIdx: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LearnMoves: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CopyMoveTo: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CopyMoveFrom: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CopyMovesetTo: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CopyMovesetFrom: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Is2TurnsMove: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsRegularAttackOrProjectile: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsPunchMove: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsHealingWishOrLunarDance: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsCopyingMove: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsTrappingMove: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsOneHitKoMove: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsNot2TurnsMoveOrSketch: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsRealMove: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsMovesetValid: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsRealMoveInTimeDarkness: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsMovesetValidInTimeDarkness: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetFirstNotRealMoveInTimeDarkness: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsSameMove: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMoveCategory: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetPpIncrease: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     OpenWaza: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SelectWaza: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PlayBgmByIdVeneer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PlayBgmByIdVolumeVeneer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PlaySeVolumeWrapper: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PlayBgmById: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PlayBgmByIdVolume: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StopBgmCommand: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PlaySeByIdVolume: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SendAudioCommand2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AllocAudioCommand: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SendAudioCommand: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitSoundSystem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ManipBgmPlayback: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SoundDriverReset: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadDseFile: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PlaySeLoad: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsSongOver: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PlayBgm: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StopBgm: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ChangeBgm: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PlayBgm2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StopBgm2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ChangeBgm2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PlayME: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StopME: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PlaySe: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PlaySeFullSpec: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SeChangeVolume: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SeChangePan: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StopSe: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CopyAndInterleaveWrapper: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitAnimationControl: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitAnimationControlWithSet: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetSpriteIdForAnimationControl: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetAnimationForAnimationControlInternal: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetAnimationForAnimationControl: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetWanForAnimationControl: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetAndPlayAnimationForAnimationControl: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SwitchAnimationControlToNextFrame: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadAnimationFrameAndIncrementInAnimationControl: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AnimationControlGetAllocForMaxFrame: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DeleteWanTableEntry: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AllocateWanTableEntry: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FindWanTableEntry: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetLoadedWanTableEntry: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitWanTable: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadWanTableEntry: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadWanTableEntryFromPack: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadWanTableEntryFromPackUseProvidedMemory: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ReplaceWanFromBinFile: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DeleteWanTableEntryVeneer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     WanHasAnimationGroup: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     WanTableSpriteHasAnimationGroup: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SpriteTypeInWanTable: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadWteFromRom: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadWteFromFileDirectory: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UnloadWte: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadWtuFromBin: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ProcessWte: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GeomSetTexImageParam: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GeomSetVertexCoord16: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitRender3dData: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GeomSwapBuffers: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitRender3dElement64: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Render3d64Texture0x7: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Render3d64WindowFrame: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EnqueueRender3d64Tiling: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Render3d64Tiling: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Render3d64Quadrilateral: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Render3d64RectangleMulticolor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Render3d64Rectangle: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Render3d64Nothing: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Render3d64Texture: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Render3dElement64: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HandleSir0Translation: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ConvertPointersSir0: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HandleSir0TranslationVeneer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DecompressAtNormalVeneer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DecompressAtNormal: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DecompressAtHalf: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DecompressAtFromMemoryPointerVeneer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DecompressAtFromMemoryPointer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     WriteByteFromMemoryPointer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetAtSize: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetLanguageType: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetLanguage: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StrcmpTag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AtoiTag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AnalyzeText: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PreprocessString: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PreprocessStringFromId: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StrcmpTagVeneer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AtoiTagVeneer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitPreprocessorArgs: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetStringAccuracy: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetStringPower: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetRankString: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetCurrentTeamNameString: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetBagNameString: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetDungeonResultString: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetQuestionMarks: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StrcpySimple: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StrncpySimple: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StrncpySimpleNoPad: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StrncmpSimple: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StrncpySimpleNoPadSafe: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StrcpyName: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StrncpyName: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetStringFromFile: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadStringFile: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AllocateTemp1024ByteBufferFromPool: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetStringFromFileVeneer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StringFromId: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CopyStringFromId: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CopyNStringFromId: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadTblTalk: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetTalkLine: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsAOrBPressed: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DrawTextInWindow: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetCharWidth: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetColorCodePaletteOffset: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DrawChar: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetWindow: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     NewWindowScreenCheck: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     NewWindow: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetScreenWindowsColor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetBothScreensWindowsColor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateWindow: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ClearWindow: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DeleteWindow: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetWindowRectangle: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetWindowContents: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadCursors: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitWindowTrailer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Arm9LoadUnkFieldNa0x2029EC8: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Arm9StoreUnkFieldNa0x2029ED8: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadAlert: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PrintClearMark: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PrintBadgeMark: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PrintMark: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateParentMenuFromStringIds: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsEmptyString: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateParentMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateParentMenuWrapper: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateParentMenuInternal: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ResumeParentMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetParentMenuState7: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CloseParentMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsParentMenuActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CheckParentMenuField0x1A0: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateParentMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateSimpleMenuFromStringIds: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateSimpleMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateSimpleMenuInternal: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ResumeSimpleMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CloseSimpleMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsSimpleMenuActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CheckSimpleMenuField0x1A0: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetSimpleMenuField0x1A4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetSimpleMenuResult: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateSimpleMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetSimpleMenuField0x1AC: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateAdvancedMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ResumeAdvancedMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CloseAdvancedMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsAdvancedMenuActive2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsAdvancedMenuActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetAdvancedMenuCurrentOption: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetAdvancedMenuResult: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateAdvancedMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateCollectionMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetCollectionMenuField0x1BC: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetCollectionMenuWidth: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CloseCollectionMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsCollectionMenuActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetCollectionMenuField0x1C8: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetCollectionMenuField0x1A0: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetCollectionMenuField0x1A4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetCollectionMenuVoidFn: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateCollectionMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetCollectionMenuField0x1B2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsCollectionMenuState3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateOptionsMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CloseOptionsMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsOptionsMenuActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CheckOptionsMenuField0x1A4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetOptionsMenuStates: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetOptionsMenuResult: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateOptionsMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateDebugMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CloseDebugMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsDebugMenuActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CheckDebugMenuField0x1A4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateDebugMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateScrollBoxSingle: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateScrollBoxMulti: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetScrollBoxState7: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CloseScrollBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsScrollBoxActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateScrollBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateDialogueBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CloseDialogueBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsDialogueBoxActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ShowStringIdInDialogueBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ShowStringInDialogueBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ShowDialogueBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ReadStringFromDialogueBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateDialogueBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreatePortraitBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ClosePortraitBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PortraitBoxNeedsUpdate: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ShowPortraitInPortraitBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HidePortraitBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdatePortraitBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateTextBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateTextBoxWithArg: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CloseTextBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CloseTextBox2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateTextBoxInternal: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateTextBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsTextBoxActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateAreaNameBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetAreaNameBoxState3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CloseAreaNameBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsAreaNameBoxActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateAreaNameBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateControlsChart: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CloseControlsChart: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsControlsChartActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateControlsChart: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateAlertBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CloseAlertBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsAlertBoxActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateAlertBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateAdvancedTextBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateAdvancedTextBoxWithArg: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateAdvancedTextBoxInternal: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetAdvancedTextBoxPartialMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetAdvancedTextBoxField0x1C4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetAdvancedTextBoxField0x1C2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CloseAdvancedTextBox2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetAdvancedTextBoxState5: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CloseAdvancedTextBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsAdvancedTextBoxActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetAdvancedTextBoxFlags2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetUnkAdvancedTextBoxFn: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetUnkAdvancedTextBoxWindowFn: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateAdvancedTextBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PlayAdvancedTextBoxInputSound: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateTeamSelectionMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CloseTeamSelectionMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsTeamSelectionMenuActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateTeamSelectionMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsTeamSelectionMenuState3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CalcMenuHeightDiv8: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitWindowInput: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsMenuOptionActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PlayWindowInputSound: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitInventoryMenuInput: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ShowKeyboard: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetKeyboardStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetKeyboardStringResult: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TeamSelectionMenuGetItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PrintMoveOptionMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PrintIqSkillsMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetNotifyNote: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetNotifyNote: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitSpecialEpisodeHero: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EventFlagBackupVeneer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitMainTeamAfterQuiz: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitSpecialEpisodePartners: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitSpecialEpisodeExtraPartner: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ReadStringSave: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CheckStringSave: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     WriteSaveFile: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ReadSaveFile: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CalcChecksum: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CheckChecksumInvalid: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     NoteSaveBase: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     WriteQuickSaveInfo: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ReadSaveHeader: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     NoteLoadBase: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ReadQuickSaveInfo: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetGameMode: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitScriptVariableValues: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitEventFlagScriptVars: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ZinitScriptVariable: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadScriptVariableRaw: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadScriptVariableValue: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadScriptVariableValueAtIndex: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SaveScriptVariableValue: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SaveScriptVariableValueAtIndex: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadScriptVariableValueSum: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadScriptVariableValueBytes: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SaveScriptVariableValueBytes: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ScriptVariablesEqual: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EventFlagResume: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EventFlagBackup: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DumpScriptVariableValues: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RestoreScriptVariableValues: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitScenarioScriptVars: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetScenarioScriptVar: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetSpecialEpisodeType: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetSpecialEpisodeType: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetExecuteSpecialEpisodeType: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsSpecialEpisodeOpen: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HasPlayedOldGame: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetPerformanceFlagWithChecks: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetScenarioBalance: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ScenarioFlagBackup: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitWorldMapScriptVars: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitDungeonListScriptVars: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetDungeonConquest: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetDungeonMode: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GlobalProgressAlloc: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ResetGlobalProgress: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetMonsterFlag1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMonsterFlag1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetMonsterFlag2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HasMonsterBeenAttackedInDungeons: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetDungeonTipShown: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetDungeonTipShown: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetMaxReachedFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMaxReachedFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IncrementNbAdventures: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetNbAdventures: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CanMonsterSpawn: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IncrementExclusiveMonsterCounts: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CopyProgressInfoTo: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CopyProgressInfoFromScratchTo: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CopyProgressInfoFrom: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CopyProgressInfoFromScratchFrom: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitKaomadoStream: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitPortraitParams: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitPortraitParamsWithMonsterId: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetPortraitEmotion: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetPortraitLayout: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetPortraitOffset: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AllowPortraitDefault: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsValidPortrait: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadPortrait: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     WonderMailPasswordToMission: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetEnterDungeon: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitDungeonInit: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsNoLossPenaltyDungeon: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CheckMissionRestrictions: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetNbFloors: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetNbFloorsPlusOne: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetDungeonGroup: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetNbPrecedingFloors: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetNbFloorsDungeonGroup: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DungeonFloorToGroupFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMissionRank: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetOutlawLevel: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetOutlawLeaderLevel: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetOutlawMinionLevel: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AddGuestMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetGroundNameId: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetAdventureLogStructLocation: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetAdventureLogDungeonFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetAdventureLogDungeonFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ClearAdventureLogStruct: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetAdventureLogCompleted: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsAdventureLogNotEmpty: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetAdventureLogCompleted: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IncrementNbDungeonsCleared: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetNbDungeonsCleared: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IncrementNbFriendRescues: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetNbFriendRescues: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IncrementNbEvolutions: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetNbEvolutions: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IncrementNbSteals: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IncrementNbEggsHatched: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetNbEggsHatched: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetNbPokemonJoined: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetNbMovesLearned: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetVictoriesOnOneFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetVictoriesOnOneFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetPokemonJoined: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetPokemonBattled: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetNbPokemonBattled: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IncrementNbBigTreasureWins: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetNbBigTreasureWins: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetNbBigTreasureWins: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetNbRecycled: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetNbRecycled: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IncrementNbSkyGiftsSent: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetNbSkyGiftsSent: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetNbSkyGiftsSent: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ComputeSpecialCounters: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RecruitSpecialPokemonLog: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IncrementNbFainted: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetNbFainted: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetItemAcquired: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetNbItemAcquired: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetChallengeLetterCleared: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetSentryDutyGamePoints: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetSentryDutyGamePoints: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CopyLogTo: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CopyLogFrom: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetAbilityString: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetAbilityDescStringId: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetTypeStringId: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetConversion2ConvertToType: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CopyBitsTo: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CopyBitsFrom: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StoreDefaultTeamData: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMainTeamNameWithCheck: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMainTeamName: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetMainTeamName: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetRankupPoints: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetRank: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetRankStorageSize: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ResetPlayTimer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PlayTimerTick: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetPlayTimeSeconds: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SubFixedPoint: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     BinToDecFixedPoint: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CeilFixedPoint: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DungeonGoesUp: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetTurnLimit: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoesNotSaveWhenEntering: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TreasureBoxDropsEnabled: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsLevelResetDungeon: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMaxItemsAllowed: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsMoneyAllowed: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMaxRescueAttempts: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsRecruitingAllowed: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetLeaderChangeFlag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetRandomMovementChance: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CanEnemyEvolve: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMaxMembersAllowed: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsIqEnabled: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsTrapInvisibleWhenAttacking: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     JoinedAtRangeCheck: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsDojoDungeon: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsFutureDungeon: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsSpecialEpisodeDungeon: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RetrieveFromItemList1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsForbiddenFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Copy16BitsFrom: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RetrieveFromItemList2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsInvalidForMission: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsExpEnabledInDungeon: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsSkyExclusiveDungeon: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     JoinedAtRangeCheck2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetBagCapacity: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetBagCapacitySpecialEpisode: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetRankUpEntry: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetBgRegionArea: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadMonsterMd: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetNameRaw: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetName: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetNameWithGender: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetSpeciesString: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetNameString: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetSpriteIndex: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetDexNumber: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetCategoryString: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMonsterGender: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetBodySize: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetSpriteSize: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetSpriteFileSize: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetShadowSize: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetSpeedStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMobilityType: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetRegenSpeed: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetCanMoveFlag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetChanceAsleep: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetWeightMultiplier: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetSize: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetBaseHp: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CanThrowItems: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CanEvolve: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMonsterPreEvolution: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetBaseOffensiveStat: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetBaseDefensiveStat: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetType: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetAbility: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetRecruitRate2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetRecruitRate1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetExp: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetEvoParameters: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetTreasureBoxChances: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetIqGroup: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetSpawnThreshold: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     NeedsItemToSpawn: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetExclusiveItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetFamilyIndex: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadM2nAndN2m: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GuestMonsterToGroundMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StrcmpMonsterName: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetLvlUpEntry: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetEncodedHalfword: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetEvoFamily: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetEvolutions: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ShuffleHiddenPower: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetBaseForm: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetBaseFormBurmyWormadamShellosGastrodonCherrim: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetBaseFormCastformCherrimDeoxys: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetAllBaseForms: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetDexNumberVeneer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMonsterIdFromSpawnEntry: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetMonsterId: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetMonsterLevelAndId: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMonsterLevelFromSpawnEntry: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMonsterGenderVeneer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsMonsterValid: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsUnown: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsShaymin: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsCastform: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsCherrim: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsDeoxys: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetSecondFormIfValid: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FemaleToMaleForm: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetBaseFormCastformDeoxysCherrim: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     BaseFormsEqual: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DexNumbersEqual: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GendersEqual: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GendersEqualNotGenderless: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GendersNotEqualNotGenderless: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsMonsterOnTeam: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetNbRecruited: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsValidTeamMember: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsMainCharacter: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetTeamMember: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetHeroMemberIdx: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetPartnerMemberIdx: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMainCharacter1MemberIdx: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMainCharacter2MemberIdx: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMainCharacter3MemberIdx: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetHero: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetPartner: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMainCharacter1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMainCharacter2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMainCharacter3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetFirstMatchingMemberIdx: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetFirstEmptyMemberIdx: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsMonsterNotNicknamed: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RemoveActiveMembersFromAllTeams: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RemoveActiveMembersFromSpecialEpisodeTeam: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RemoveActiveMembersFromRescueTeam: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CheckTeamMemberIdx: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsMonsterIdInNormalRange: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetActiveTeam: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetActiveTeamMember: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetActiveRosterIndex: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryAddMonsterToActiveTeam: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RemoveActiveMembersFromMainTeam: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetTeamSetupHeroAndPartnerOnly: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetTeamSetupHeroOnly: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetPartyMembers: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RefillTeam: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ClearItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ChangeGiratinaFormIfSkyDungeon: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetIqSkillStringId: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoesTacticFollowLeader: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetUnlockedTactics: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetUnlockedTacticFlags: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CanLearnIqSkill: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetLearnableIqSkills: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DisableIqSkill: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EnableIqSkill: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetSpeciesIqSkill: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DisableAllIqSkills: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EnableAllLearnableIqSkills: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IqSkillFlagTest: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetNextIqSkill: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetExplorerMazeTeamName: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetExplorerMazeMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     WriteMonsterInfoToSave: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ReadMonsterInfoFromSave: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     WriteMonsterToSave: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ReadMonsterFromSave: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetEvolutionPossibilities: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMonsterEvoStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CopyTacticString: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetStatBoostsForMonsterSummary: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateMonsterSummaryFromTeamMember: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetSosMailCount: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsMissionSuspendedAndValid: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AreMissionsEquivalent: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsMissionValid: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateMission: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsMissionTypeSpecialEpisode: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateDailyMissions: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AlreadyHaveMission: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CountJobListMissions: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DungeonRequestsDone: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DungeonRequestsDoneWrapper: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AnyDungeonRequestsDone: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AddMissionToJobList: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetAcceptedMission: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMissionByTypeAndDungeon: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CheckAcceptedMissionByTypeAndDungeon: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetAllPossibleMonsters: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateAllPossibleMonstersList: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DeleteAllPossibleMonstersList: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateAllPossibleDungeonsList: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DeleteAllPossibleDungeonsList: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateAllPossibleDeliverList: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DeleteAllPossibleDeliverList: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ClearMissionData: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsMonsterMissionAllowed: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CanMonsterBeUsedForMissionWrapper: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CanMonsterBeUsedForMission: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsMonsterMissionAllowedStory: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CanDungeonBeUsedForMission: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CanSendItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsAvailableItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetAvailableItemDeliveryList: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetActorMatchingStorageId: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetActorTalkMainAndActorTalkSub: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetActorTalkMain: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetActorTalkSub: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RandomizeDemoActors: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ItemAtTableIdx: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MainLoop: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateJobSummary: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DungeonSwapIdToIdx: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DungeonSwapIdxToId: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetDungeonModeSpecial: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
 
-class Arm9DataProtocol(Protocol):
+class Arm9DataProtocol(SymbolLookupProtocol, Protocol):
 
     SECURE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     START_MODULE_PARAMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DEFAULT_MEMORY_ARENA_SIZE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LOG_MAX_ARG: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DAMAGE_SOURCE_CODE_ORB_ITEM: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DAMAGE_SOURCE_CODE_NON_ORB_ITEM: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AURA_BOW_ID_LAST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     NUMBER_OF_ITEMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MAX_MONEY_CARRIED: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MAX_MONEY_STORED: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     WINDOW_LIST_PTR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SCRIPT_VARS_VALUES_PTR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MAX_PLAY_TIME: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MONSTER_ID_LIMIT: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MAX_RECRUITABLE_TEAM_MEMBERS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     NATURAL_LOG_VALUE_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     CART_REMOVED_IMG_DATA: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_DEBUG_EMPTY: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_DEBUG_FORMAT_LINE_FILE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_DEBUG_NO_PROG_POS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_DEBUG_SPACED_PRINT: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_DEBUG_FATAL: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_DEBUG_NEWLINE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_DEBUG_LOG_NULL: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_DEBUG_STRING_NEWLINE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_EFFECT_EFFECT_BIN: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_MONSTER_MONSTER_BIN: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_BALANCE_M_LEVEL_BIN: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_DUNGEON_DUNGEON_BIN: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_MONSTER_M_ATTACK_BIN: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_MONSTER_M_GROUND_BIN: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_FILE_DIRECTORY_INIT: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     AVAILABLE_ITEMS_IN_GROUP_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ARM9_UNKNOWN_TABLE__NA_2097FF8: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     KECLEON_SHOP_ITEM_TABLE_LISTS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     KECLEON_SHOP_ITEM_TABLE_LISTS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EXCLUSIVE_ITEM_STAT_BOOST_DATA: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EXCLUSIVE_ITEM_DEFENSE_BOOSTS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EXCLUSIVE_ITEM_SPECIAL_ATTACK_BOOSTS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EXCLUSIVE_ITEM_SPECIAL_DEFENSE_BOOSTS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EXCLUSIVE_ITEM_EFFECT_DATA: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EXCLUSIVE_ITEM_STAT_BOOST_DATA_INDEXES: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RECYCLE_SHOP_ITEM_LIST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TYPE_SPECIFIC_EXCLUSIVE_ITEMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RECOIL_MOVE_LIST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     PUNCH_MOVE_LIST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MOVE_POWER_STARS_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MOVE_ACCURACY_STARS_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     PARENT_MENU_DEFAULT_WINDOW_PARAMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SIMPLE_MENU_DEFAULT_WINDOW_PARAMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ADVANCED_MENU_DEFAULT_WINDOW_PARAMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     COLLECTION_MENU_DEFAULT_WINDOW_PARAMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OPTIONS_MENU_DEFAULT_WINDOW_PARAMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DEBUG_MENU_DEFAULT_WINDOW_PARAMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SCROLL_BOX_DEFAULT_WINDOW_PARAMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DIALOGUE_BOX_DEFAULT_WINDOW_PARAMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     PORTRAIT_BOX_DEFAULT_WINDOW_PARAMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TEXT_BOX_DEFAULT_WINDOW_PARAMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     AREA_NAME_BOX_DEFAULT_WINDOW_PARAMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     CONTROLS_CHART_DEFAULT_WINDOW_PARAMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ALERT_BOX_DEFAULT_WINDOW_PARAMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ADVANCED_TEXT_BOX_DEFAULT_WINDOW_PARAMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TEAM_SELECTION_MENU_DEFAULT_WINDOW_PARAMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     PARTNER_TALK_KIND_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SCRIPT_VARS_LOCALS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SCRIPT_VARS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     PORTRAIT_LAYOUTS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     KAOMADO_FILEPATH: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     WONDER_MAIL_BITS_MAP: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     WONDER_MAIL_BITS_SWAP: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ARM9_UNKNOWN_TABLE__NA_209E12C: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ARM9_UNKNOWN_TABLE__NA_209E164: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ARM9_UNKNOWN_TABLE__NA_209E280: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     WONDER_MAIL_ENCRYPTION_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_DATA_LIST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ADVENTURE_LOG_ENCOUNTERS_MONSTER_IDS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ARM9_UNKNOWN_DATA__NA_209E6BC: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TACTIC_NAME_STRING_IDS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STATUS_NAME_STRING_IDS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_RETURN_STATUS_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STATUSES_FULL_DESCRIPTION_STRING_IDS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ARM9_UNKNOWN_DATA__NA_209EAAC: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MISSION_FLOOR_RANKS_AND_ITEM_LISTS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MISSION_FLOORS_FORBIDDEN: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MISSION_FLOOR_RANKS_AND_ITEM_LISTS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MISSION_FLOOR_RANKS_PTRS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_RESTRICTIONS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SPECIAL_BAND_STAT_BOOST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MUNCH_BELT_STAT_BOOST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     GUMMI_STAT_BOOST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MIN_IQ_EXCLUSIVE_MOVE_USER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     WONDER_GUMMI_IQ_GAIN: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     AURA_BOW_STAT_BOOST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MIN_IQ_ITEM_MASTER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DEF_SCARF_STAT_BOOST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     POWER_BAND_STAT_BOOST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     WONDER_GUMMI_STAT_BOOST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ZINC_BAND_STAT_BOOST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EGG_HP_BONUS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EVOLUTION_HP_BONUS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DAMAGE_FORMULA_FLV_SHIFT: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EVOLUTION_PHYSICAL_STAT_BONUSES: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DAMAGE_FORMULA_CONSTANT_SHIFT: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DAMAGE_FORMULA_FLV_DEFICIT_DIVISOR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EGG_STAT_BONUSES: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EVOLUTION_SPECIAL_STAT_BONUSES: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DAMAGE_FORMULA_NON_TEAM_MEMBER_MODIFIER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DAMAGE_FORMULA_LN_PREFACTOR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DAMAGE_FORMULA_DEF_PREFACTOR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DAMAGE_FORMULA_AT_PREFACTOR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DAMAGE_FORMULA_LN_ARG_PREFACTOR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     FORBIDDEN_FORGOT_MOVE_LIST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TACTICS_UNLOCK_LEVEL_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     CLIENT_LEVEL_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OUTLAW_LEVEL_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OUTLAW_MINION_LEVEL_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     HIDDEN_POWER_BASE_POWER_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     VERSION_EXCLUSIVE_MONSTERS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     IQ_SKILL_RESTRICTIONS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SECONDARY_TERRAIN_TYPES: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SENTRY_DUTY_MONSTER_IDS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     IQ_SKILLS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     IQ_GROUP_SKILLS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MONEY_QUANTITY_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ARM9_UNKNOWN_TABLE__NA_20A20B0: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     IQ_GUMMI_GAIN_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     GUMMI_BELLY_RESTORE_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BAG_CAPACITY_TABLE_SPECIAL_EPISODES: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BAG_CAPACITY_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SPECIAL_EPISODE_MAIN_CHARACTERS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     GUEST_MONSTER_DATA: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RANK_UP_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DS_DOWNLOAD_TEAMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ARM9_UNKNOWN_PTR__NA_20A2C84: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     UNOWN_SPECIES_ADDITIONAL_CHARS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MONSTER_SPRITE_DATA: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     REMOTE_STRINGS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RANK_STRINGS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MISSION_MENU_STRING_IDS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RANK_STRINGS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MISSION_MENU_STRING_IDS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RANK_STRINGS_3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MISSION_DUNGEON_UNLOCK_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     NO_SEND_ITEM_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ARM9_UNKNOWN_TABLE__NA_20A3CC8: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ARM9_UNKNOWN_TABLE__NA_20A3CE4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ARM9_UNKNOWN_FUNCTION_TABLE__NA_20A3CF4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MISSION_BANNED_STORY_MONSTERS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ITEM_DELIVERY_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MISSION_RANK_POINTS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MISSION_BANNED_MONSTERS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MISSION_STRING_IDS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LEVEL_LIST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EVENTS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ARM9_UNKNOWN_TABLE__NA_20A68BC: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DEMO_TEAMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ACTOR_LIST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ENTITIES: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     JOB_WINDOW_PARAMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     JOB_MENU_ITEMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     JOB_MENU_ITEMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     JOB_MENU_ITEMS_3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     JOB_MENU_ITEMS_4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     JOB_MENU_ITEMS_5: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     JOB_MENU_ITEMS_6: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     JOB_MENU_ITEMS_7: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     JOB_MENU_ITEMS_8: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     JOB_MENU_ITEMS_9: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     JOB_MENU_ITEMS_10: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     JOB_MENU_ITEMS_11: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     JOB_MENU_ITEMS_12: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     JOB_MENU_ITEMS_13: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     JOB_WINDOW_PARAMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_SWAP_ID_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MAP_MARKER_PLACEMENTS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LFO_OUTPUT_VOICE_UPDATE_FLAGS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TRIG_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     FX_ATAN_IDX_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TEX_PLTT_START_ADDR_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TEX_START_ADDR_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ARM9_UNKNOWN_TABLE__NA_20AE924: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MEMORY_ALLOCATION_ARENA_GETTERS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     PRNG_SEQUENCE_NUM: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LOADED_OVERLAY_GROUP_0: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LOADED_OVERLAY_GROUP_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LOADED_OVERLAY_GROUP_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DEBUG_IS_INITIALIZED: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     PACK_FILES_OPENED: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     PACK_FILE_PATHS_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     GAME_STATE_VALUES: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     BAG_ITEMS_PTR_MIRROR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ITEM_DATA_TABLE_PTRS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_MOVE_TABLES: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MOVE_DATA_TABLE_PTR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     WAN_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RENDER_3D: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RENDER_3D_FUNCTIONS_64: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LANGUAGE_INFO_DATA: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TBL_TALK_GROUP_STRING_ID_START: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     KEYBOARD_STRING_IDS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     NOTIFY_NOTE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DEFAULT_HERO_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DEFAULT_PARTNER_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     GAME_MODE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     GLOBAL_PROGRESS_PTR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ADVENTURE_LOG_PTR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ITEM_TABLES_PTRS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     UNOWN_SPECIES_ADDITIONAL_CHAR_PTR_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TEAM_MEMBER_TABLE_PTR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MISSION_DELIVER_LIST_PTR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MISSION_DELIVER_COUNT: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MISSION_DUNGEON_LIST_PTR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MISSION_DUNGEON_COUNT: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MISSION_MONSTER_LIST_PTR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MISSION_MONSTER_COUNT: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MISSION_LIST_PTR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     REMOTE_STRING_PTR_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RANK_STRING_PTR_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SMD_EVENTS_FUN_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MUSIC_DURATION_LOOKUP_TABLE_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MUSIC_DURATION_LOOKUP_TABLE_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LFO_WAVEFORM_CALLBACKS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     IS_DISP_ON: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     GXI_DMA_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     JUICE_BAR_NECTAR_IQ_GAIN: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DEBUG_TEXT_SPEED: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     REGULAR_TEXT_SPEED: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HERO_START_LEVEL: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PARTNER_START_LEVEL: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
@@ -6193,188 +6378,188 @@ Arm9Protocol = SectionProtocol[
 ]
 
 
-class ItcmFunctionsProtocol(Protocol):
+class ItcmFunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     CopyAndInterleave: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     Render3dSetTextureParams: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     Render3dSetPaletteBase: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     Render3dRectangle: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     GeomSetPolygonAttributes: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     Render3dQuadrilateral: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     Render3dTiling: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     Render3dTextureInternal: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     Render3dTexture: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     Render3dTextureNoSetup: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     NewRender3dElement: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     EnqueueRender3dTexture: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     EnqueueRender3dTiling: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     NewRender3dRectangle: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     NewRender3dQuadrilateral: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     NewRender3dTexture: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     NewRender3dTiling: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     Render3dProcessQueue: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     GetKeyN2MSwitch: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     GetKeyN2M: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     GetKeyN2MBaseForm: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     GetKeyM2NSwitch: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     GetKeyM2N: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     GetKeyM2NBaseForm: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     HardwareInterrupt: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     ReturnFromInterrupt: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     InitDmaTransfer_Standard: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     ShouldMonsterRunAwayVariationOutlawCheck: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     AiMovement: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     CalculateAiTargetPos: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     ChooseAiMove: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
     LightningRodStormDrainCheck: Symbol[
-        list[int],
+        tuple[int, ...],
         None,
     ]
 
 
-class ItcmDataProtocol(Protocol):
+class ItcmDataProtocol(SymbolLookupProtocol, Protocol):
 
     MEMORY_ALLOCATION_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DEFAULT_MEMORY_ARENA: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DEFAULT_MEMORY_ARENA_BLOCKS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RENDER_3D_FUNCTIONS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
@@ -6386,2160 +6571,2160 @@ ItcmProtocol = SectionProtocol[
 ]
 
 
-class LibsFunctionsProtocol(Protocol):
+class LibsFunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     DseDriver_LoadDefaultSettings: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseDriver_IsSettingsValid: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseDriver_ConfigureHeap: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseDriver_Init: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Dse_SetError: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Dse_SetError2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseUtil_ByteSwap32: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SoundUtil_GetRandomNumber: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseMem_Init: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseMem_Quit: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseMem_AllocateUser: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseMem_Allocate: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseMem_AllocateThreadStack: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseMem_Free: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseMem_Clear: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseFile_CheckHeader: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSwd_SysInit: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSwd_SysQuit: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSwd_SampleLoaderMain: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSwd_MainBankDummyCallback: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSwd_LoadMainBank: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSwd_LoadBank: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSwd_IsBankLoading: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSwd_LoadWaves: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSwd_LoadWavesInternal: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSwd_Unload: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ReadWaviEntry: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSwd_GetInstrument: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSwd_GetNextSplitInRange: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSwd_GetMainBankById: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSwd_GetBankById: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSwd_InitMainBankFileReader: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSwd_OpenMainBankFileReader: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSwd_CloseMainBankFileReader: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSwd_ReadMainBank: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseBgm_DefaultSignalCallback: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseBgm_Load: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseBgm_Unload: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseBgm_SetSignalCallback: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseBgm_IsPlaying: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ResumeBgm: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseBgm_Stop: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseBgm_StopAll: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseBgm_SetFades: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSequence_Start: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSequence_PauseList: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSequence_SetFades: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSequence_GetParameter: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSequence_GetSmallestNumLoops: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSequence_Reset: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSequence_Stop: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FindSmdlSongChunk: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSequence_LoadSong: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSequence_GetById: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSequence_AllocateNew: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSequence_Unload: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSequence_InitTracks: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseBgm_SysSetupNoteList: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSe_SysReset: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSe_Load: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSe_Unload: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSe_GetUsedBankIDs: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSe_HasPlayingInstances: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSe_Play: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSe_GetEffectSong: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSe_CheckTooManyInstances: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSe_CheckTooManyInstancesInGroup: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSe_GetBestSeqAllocation: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSe_GetById: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSe_Stop: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSe_StopAll: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSe_StopSeq: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FlushChannels: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseDriver_StartMainThread: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseDriver_StartTickTimer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseDriver_NotifyTick: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseDriver_Main: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSequence_TickNotes: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ParseDseEvent: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateSequencerTracks: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSequence_TickFades: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_Invalid: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_WaitSame: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_WaitDelta: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_Wait8: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_Wait16: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_Wait24: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_WaitUntilFadeout: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_EndTrack: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_MainLoopBegin: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SubLoopBegin: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SubLoopEnd: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SubLoopBreakOnLastIteration: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetOctave: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_OctaveDelta: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetBpm: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetBpm2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetBank: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetBankMsb: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetBankLsb: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_Dummy1Byte: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetInstrument: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SongVolumeFade: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_RestoreEnvelopeDefaults: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetEnvelopeAttackBegin: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetEnvelopeAttackTime: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetEnvelopeHoldTime: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetEnvelopeDecayTimeAndSustainLevel: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetEnvelopeSustainTime: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetEnvelopeReleaseTime: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetNoteDurationMultiplier: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_ForceLfoEnvelopeLevel: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetHoldNotes: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetFlagBit1Unknown: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetOptionalVolume: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_Dummy2Bytes: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetTuning: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_TuningDeltaCoarse: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_TuningDeltaFine: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_TuningDeltaFull: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_TuningFade: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetNoteRandomRegion: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetTuningJitterAmplitude: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetKeyBend: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetUnknown2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetKeyBendRange: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetupKeyBendLfo: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetupKeyBendLfoEnvelope: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_UseKeyBendLfo: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetVolume: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_VolumeDelta: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_VolumeFade: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetExpression: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetupVolumeLfo: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetupVolumeLfoEnvelope: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_UseVolumeLfo: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetPan: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_PanDelta: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_PanFade: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetupPanLfo: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetupPanLfoEnvelope: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_UsePanLfo: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetupLfo: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetupLfoEnvelope: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_SetLfoParameter: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_UseLfo: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_Signal: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseTrackEvent_Dummy2Bytes2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSynth_Reset: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSynth_AllocateNew: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSynth_Unload: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSynth_ClearHeldNotes: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSynth_ResetAndSetBankAndSequence: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSynth_StopChannels: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSynth_ResetAllVoiceTimersAndVolumes: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSynth_RestoreHeldNotes: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSynth_SetGlobalVolumeIndex: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSynth_SetBend: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSynth_SetVolume: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSynth_SetPan: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseSynth_SetBankAndSequence: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseChannel_Init: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseChannel_DeallocateVoices: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseChannel_ResetTimerAndVolumeForVoices: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseChannel_SetBank: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseChannel_SetInstrument: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseChannel_SetLfoConstEnvelopeLevel: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseChannel_SetKeyBend: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseChannel_AllocateNote: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseChannel_ReleaseNoteInternal: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseChannel_ChangeNote: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseChannel_ReleaseNote: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseVoice_PlayNote: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseVoice_ReleaseNote: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseVoice_UpdateParameters: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseVoice_ResetAll: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseVoice_ResetHW: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateChannels: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseVoice_Cleanup: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseVoice_Allocate: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseVoice_Start: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseVoice_ReleaseHeld: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseVoice_Release: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseVoice_Deallocate: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseVoice_FlagForActivation: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseVoice_FlagForDeactivation: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseVoice_CountNumActiveInChannel: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DseVoice_UpdateHardware: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SoundEnvelope_Reset: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SoundEnvelopeParameters_Reset: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SoundEnvelopeParameters_CheckValidity: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SoundEnvelope_SetParameters: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SoundEnvelope_SetSlide: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateTrackVolumeEnvelopes: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SoundEnvelope_Release: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SoundEnvelope_Stop: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SoundEnvelope_ForceVolume: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SoundEnvelope_Stop2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SoundEnvelope_Tick: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SoundLfoBank_Reset: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SoundLfoBank_Set: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SoundLfoBank_SetConstEnvelopes: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SoundLfoBank_Tick: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SoundLfoWave_InvalidFunc: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SoundLfoWave_HalfSquareFunc: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SoundLfoWave_FullSquareFunc: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SoundLfoWave_HalfTriangleFunc: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SoundLfoWave_FullTriangleFunc: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SoundLfoWave_SawFunc: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SoundLfoWave_ReverseSawFunc: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SoundLfoWave_HalfNoiseFunc: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SoundLfoWave_FullNoiseFunc: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Crypto_RC4Init: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Mtx_LookAt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Mtx_OrthoW: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FX_Div: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FX_GetDivResultFx64c: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FX_GetDivResult: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FX_InvAsync: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FX_DivAsync: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FX_DivS32: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FX_ModS32: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Vec_DotProduct: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Vec_CrossProduct: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Vec_Normalize: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Vec_Distance: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FX_Atan2Idx: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_Init: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_HBlankIntr: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_VBlankIntr: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_DispOff: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_DispOn: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_SetGraphicsMode: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Gxs_SetGraphicsMode: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GXx_SetMasterBrightness: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_InitGxState: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EnableVramBanksInSetDontSave: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_SetBankForBg: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_SetBankForObj: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_SetBankForBgExtPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_SetBankForObjExtPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_SetBankForTex: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_SetBankForTexPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_SetBankForClearImage: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_SetBankForArm7: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_SetBankForLcdc: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_SetBankForSubBg: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_SetBankForSubObj: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_SetBankForSubBgExtPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_SetBankForSubObjExtPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EnableVramBanksInSet: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_ResetBankForBgExtPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_ResetBankForObjExtPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_ResetBankForTex: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_ResetBankForTexPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_ResetBankForSubBgExtPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_ResetBankForSubObjExtPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DisableBankForX: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_DisableBankForBg: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_DisableBankForObj: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_DisableBankForBgExtPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_DisableBankForObjExtPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_DisableBankForTex: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_DisableBankForTexPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_DisableBankForClearImage: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_DisableBankForArm7: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_DisableBankForLcdc: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_DisableBankForSubBg: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_DisableBankForSubObj: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_DisableBankForSubBgExtPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_DisableBankForSubObjExtPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G2_GetBG0ScrPtr: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G2S_GetBG0ScrPtr: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G2_GetBG1ScrPtr: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G2S_GetBG1ScrPtr: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G2_GetBG2ScrPtr: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G2_GetBG3ScrPtr: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G2_GetBG0CharPtr: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G2S_GetBG0CharPtr: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G2_GetBG1CharPtr: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G2S_GetBG1CharPtr: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G2_GetBG2CharPtr: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G2_GetBG3CharPtr: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G2x_SetBlendAlpha: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G2x_SetBlendBrightness: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G2x_ChangeBlendBrightness: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G3_LoadMtx44: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G3_LoadMtx43: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G3_MultMtx43: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G3X_Init: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G3X_Reset: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G3X_ClearFifo: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G3X_InitMtxStack: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G3X_ResetMtxStack: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G3X_SetClearColor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G3X_InitTable: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G3X_GetMtxStackLevelPV: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G3X_GetMtxStackLevelPJ: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GXi_NopClearFifo128: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G3i_OrthoW: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     G3i_LookAt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_LoadBgPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Gxs_LoadBgPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_LoadObjPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Gxs_LoadObjPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_LoadOam: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Gxs_LoadOam: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_LoadObj: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Gxs_LoadObj: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_LoadBg0Scr: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_LoadBg1Scr: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Gxs_LoadBg1Scr: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_LoadBg2Scr: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_LoadBg3Scr: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_LoadBg0Char: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Gxs_LoadBg0Char: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_LoadBg1Char: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Gxs_LoadBg1Char: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_LoadBg2Char: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_LoadBg3Char: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_BeginLoadBgExtPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_EndLoadBgExtPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_BeginLoadObjExtPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_EndLoadObjExtPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Gxs_BeginLoadBgExtPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Gxs_EndLoadBgExtPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Gxs_BeginLoadObjExtPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Gxs_EndLoadObjExtPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_BeginLoadTex: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_LoadTex: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_EndLoadTex: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_BeginLoadTexPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_LoadTexPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_EndLoadTexPltt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GeomGxFifoSendMtx4x3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GX_SendFifo64B: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     OS_GetLockID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IncrementThreadCount: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InsertThreadIntoList: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StartThread: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ThreadExit: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetThreadField0xB4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitThread: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetTimer0Control: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ClearIrqFlag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EnableIrqFlag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetIrqFlag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EnableIrqFiqFlags: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetIrqFiqFlags: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetIrqFlag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetProcessorMode: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetDsFirmwareUserSettings: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CountLeadingZeros: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     WaitForever2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     WaitForInterrupt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ArrayFill16: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ArrayCopy16: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ArrayFill32: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ArrayCopy32: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ArrayFill32Fast: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ArrayCopy32Fast: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MemsetFast: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MemcpyFast: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AtomicExchange: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FileInit: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetOverlayInfo: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadOverlayInternal: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitOverlay: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     abs: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     mbtowc: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryAssignByte: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryAssignByteWrapper: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     wcstombs: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     memcpy: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     memmove: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     memset: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     memchr: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     memcmp: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     memset_internal: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     __vsprintf_internal_slice: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryAppendToSlice: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     __vsprintf_internal: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     vsprintf: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     snprintf: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     sprintf: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     strlen: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     strcpy: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     strncpy: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     strcat: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     strncat: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     strcmp: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     strncmp: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     strchr: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     strcspn: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     strstr: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     wcslen: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _dadd: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _d2f: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _ll_ufrom_d: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _dflt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _dfltu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _dmul: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _dsqrt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _dsub: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _fadd: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _dgeq: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _dleq: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _dls: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _deq: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _dneq: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _fls: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _fdiv: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _f2d: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _ffix: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _fflt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _ffltu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _fmul: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     sqrtf: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _fsub: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _ll_mod: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _ll_sdiv: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _ll_udiv: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _ull_mod: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _ll_mul: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _s32_div_f: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _u32_div_f: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _u32_div_not_0_f: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _drdiv: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _ddiv: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     _fp_init: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
 
-class LibsDataProtocol(Protocol):
+class LibsDataProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
@@ -8551,1593 +8736,1593 @@ LibsProtocol = SectionProtocol[
 ]
 
 
-class Move_effectsFunctionsProtocol(Protocol):
+class Move_effectsFunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     DoMoveDamage: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveIronTail: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDamageMultihitUntilMiss: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveYawn: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSleep: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveNightmare: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveMorningSun: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveVitalThrow: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDig: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSweetScent: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveCharm: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveRainDance: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveHail: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveHealStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveBubble: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveEncore: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveRage: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSuperFang: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMovePainSplit: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveTorment: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveStringShot: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSwagger: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSnore: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveScreech: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDamageCringe30: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveWeatherBall: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveWhirlpool: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveFakeTears: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSpite: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveFocusEnergy: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSmokescreen: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveMirrorMove: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveOverheat: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveAuroraBeam: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveMemento: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveOctazooka: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveFlatter: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveWillOWisp: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveReturn: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveGrudge: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveCounter: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDamageBurn10FlameWheel: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDamageBurn10: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveExpose: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDoubleTeam: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveGust: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveBoostDefense1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveParalyze: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveBoostAttack1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveRazorWind: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveBide: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveBideUnleash: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveCrunch: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDamageCringe20: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDamageParalyze20: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveEndeavor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveFacade: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDamageLowerSpeed20: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveBrickBreak: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDamageLowerSpeed100: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveFocusPunch: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDamageDrain: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveReversal: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSmellingSalt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveMetalSound: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveTickle: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveShadowHold: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveHaze: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDamageMultihitFatigue: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDamageWeightDependent: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDamageBoostAllStats: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSynthesis: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveBoostSpeed1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveRapidSpin: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSureShot: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveCosmicPower: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSkyAttack: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDamageFreeze15: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveMeteorMash: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveEndure: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveLowerSpeed1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDamageConfuse10: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMovePsywave: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDamageLowerDefensiveStatVariable: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMovePsychoBoost: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveUproar: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveWaterSpout: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMovePsychUp: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDamageWithRecoil: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EntityIsValidMoveEffects: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveRecoverHp: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveEarthquake: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetNaturePowerVariant: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveNaturePower: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDamageParalyze10: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSelfdestruct: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveShadowBall: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveCharge: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveThunderbolt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveMist: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveFissure: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDamageCringe10: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSafeguard: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveAbsorb: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DefenderAbilityIsActiveMoveEffects: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSkillSwap: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSketch: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveHeadbutt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDoubleEdge: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSandstorm: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveLowerAccuracy1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDamagePoison40: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveGrowth: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSacredFire: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveOhko: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSolarBeam: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSonicBoom: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveFly: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveExplosion: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveWaterfall: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDamageLowerAccuracy40: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveStockpile: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveTwister: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveTwineedle: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveRecoverHpTeam: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveMinimize: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSeismicToss: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveConfuse: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveTaunt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveMoonlight: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveHornDrill: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSwordsDance: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveConversion: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveConversion2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveHelpingHand: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveBoostDefense2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveWarp: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveThundershock: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveThunderWave: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveZapCannon: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveBlock: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMovePoison: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveToxic: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMovePoisonFang: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDamagePoison18: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveJumpKick: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveBounce: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveHiJumpKick: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveTriAttack: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSwapItems: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveTripleKick: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSport: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveMudSlap: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDamageStealItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveAmnesia: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveNightShade: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveGrowl: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSurf: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveRolePlay: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSunnyDay: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveLowerDefense1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveWish: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveFakeOut: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSleepTalk: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMovePayDay: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveAssist: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveRest: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveIngrain: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSwallow: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveCurse: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSuperpower: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSteelWing: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSpitUp: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDynamicPunch: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveKnockOff: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSplash: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSetDamage: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveBellyDrum: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveLightScreen: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSecretPower: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDamageConfuse30: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveBulkUp: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMovePause: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveFeatherDance: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveBeatUp: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveBlastBurn: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveCrushClaw: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveBlazeKick: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMovePresent: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveEruption: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveTransform: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMovePoisonTail: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveBlowback: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveCamouflage: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveTailGlow: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDamageConstrict10: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMovePerishSong: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveWrap: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSpikes: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveMagnitude: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveMagicCoat: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveProtect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDefenseCurl: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDecoy: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveMistBall: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDestinyBond: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveMirrorCoat: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveCalmMind: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveHiddenPower: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveMetalClaw: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveAttract: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveCopycat: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveFrustration: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveLeechSeed: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveMetronome: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDreamEater: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSnatch: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveRecycle: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveReflect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDragonRage: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDragonDance: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSkullBash: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDamageLowerSpecialDefense50: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveStruggle: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveRockSmash: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSeeTrap: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveTakeaway: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveRebound: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSwitchPositions: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveStayAway: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveCleanse: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSiesta: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveTwoEdge: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveNoMove: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveScan: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMovePowerEars: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveTransfer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSlowDown: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSearchlight: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMovePetrify: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMovePounce: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveTrawl: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveEscape: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDrought: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveTrapBuster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveWildCall: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveInvisify: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveOneShot: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveHpGauge: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveVacuumCut: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveReviver: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveShocker: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveEcho: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveFamish: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveOneRoom: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveFillIn: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveTrapper: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveItemize: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveHurl: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveMobile: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveSeeStairs: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveLongToss: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMovePierce: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveHammerArm: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveAquaRing: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveGastroAcid: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveHealingWish: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveCloseCombat: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveLuckyChant: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveGuardSwap: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveHealOrder: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveHealBlock: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveThunderFang: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDefog: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveTrumpCard: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveIceFang: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMovePsychoShift: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveEmbargo: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveBrine: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveNaturalGift: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveGyroBall: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveShadowForce: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveGravity: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveStealthRock: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveChargeBeam: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDamageEatItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveAcupressure: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveMagnetRise: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveToxicSpikes: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveLastResort: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveTrickRoom: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveWorrySeed: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDamageHpDependent: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveHeartSwap: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveRoost: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMovePowerSwap: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMovePowerTrick: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveFeint: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveFlareBlitz: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDefendOrder: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveFireFang: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveLunarDance: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveMiracleEye: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveWakeUpSlap: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveMetalBurst: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveHeadSmash: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveCaptivate: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveLeafStorm: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDracoMeteor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveRockPolish: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveNastyPlot: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveTag0x1AB: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveTag0x1A6: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveTag0x1A7: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
 
-class Move_effectsDataProtocol(Protocol):
+class Move_effectsDataProtocol(SymbolLookupProtocol, Protocol):
 
     MAX_HP_CAP_MOVE_EFFECTS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LUNAR_DANCE_PP_RESTORATION: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
@@ -10149,15 +10334,15 @@ Move_effectsProtocol = SectionProtocol[
 ]
 
 
-class Overlay0FunctionsProtocol(Protocol):
+class Overlay0FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
 
-class Overlay0DataProtocol(Protocol):
+class Overlay0DataProtocol(SymbolLookupProtocol, Protocol):
 
     TOP_MENU_MUSIC_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
@@ -10169,118 +10354,118 @@ Overlay0Protocol = SectionProtocol[
 ]
 
 
-class Overlay1FunctionsProtocol(Protocol):
+class Overlay1FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     CreateMainMenus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AddMainMenuOption: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AddSubMenuOption: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ProcessContinueScreenContents: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
 
-class Overlay1DataProtocol(Protocol):
+class Overlay1DataProtocol(SymbolLookupProtocol, Protocol):
 
     PRINTS_STRINGS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     PRINTS_STRUCT: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MAIN_MENU_WINDOW_PARAMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MAIN_MENU_WINDOW_PARAMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MAIN_MENU_WINDOW_PARAMS_3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MAIN_MENU_WINDOW_PARAMS_4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     CONTINUE_CHOICE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SUBMENU: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MAIN_MENU: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MAIN_MENU_WINDOW_PARAMS_5: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MAIN_MENU_WINDOW_PARAMS_6: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MAIN_MENU_WINDOW_PARAMS_7: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MAIN_MENU_ITEMS_CONFIRM: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MAIN_MENU_WINDOW_PARAMS_8: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MAIN_MENU_WINDOW_PARAMS_9: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MAIN_DEBUG_MENU_ITEMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MAIN_MENU_WINDOW_PARAMS_10: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MAIN_DEBUG_MENU_ITEMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
@@ -10292,1083 +10477,1083 @@ Overlay1Protocol = SectionProtocol[
 ]
 
 
-class Overlay10FunctionsProtocol(Protocol):
+class Overlay10FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     CreateInventoryMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetInventoryMenuState0: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetInventoryMenuState6: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CloseInventoryMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsInventoryMenuActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CheckInventoryMenuField0x1A0: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PopInventoryMenuField0x1A3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateInventoryMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsInventoryMenuState3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SprintfStatic: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetEffectAnimationField0x19: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AnimationHasMoreFrames: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetEffectAnimation: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMoveAnimation: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetSpecialMonsterMoveAnimation: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetTrapAnimation: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetItemAnimation1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetItemAnimation2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMoveAnimationSpeed: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DrawTeamStats: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateTeamStats: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FreeTeamStats: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FreeMapAndTeam: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ProcessTeamStatsLvHp: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ProcessTeamStatsNameGender: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsBackgroundTileset: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitTilesetBuffer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MainGame: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
 
-class Overlay10DataProtocol(Protocol):
+class Overlay10DataProtocol(SymbolLookupProtocol, Protocol):
 
     INVENTORY_MENU_DEFAULT_WINDOW_PARAMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     FIRST_DUNGEON_WITH_MONSTER_HOUSE_TRAPS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BAD_POISON_DAMAGE_COOLDOWN: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     PROTEIN_STAT_BOOST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     WATERFALL_CRINGE_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     AURORA_BEAM_LOWER_ATTACK_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SPAWN_CAP_NO_MONSTER_HOUSE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OREN_BERRY_DAMAGE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     IRON_TAIL_LOWER_DEFENSE_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TWINEEDLE_POISON_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EXTRASENSORY_CRINGE_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ROCK_SLIDE_CRINGE_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     CRUNCH_LOWER_DEFENSE_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     FOREWARN_FORCED_MISS_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     UNOWN_STONE_DROP_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SITRUS_BERRY_HP_RESTORATION: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MUDDY_WATER_LOWER_ACCURACY_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SILVER_WIND_BOOST_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     POISON_TAIL_POISON_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     THUNDERSHOCK_PARALYZE_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BOUNCE_PARALYZE_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     HEADBUTT_CRINGE_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     FIRE_FANG_CRINGE_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SACRED_FIRE_BURN_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     WHIRLPOOL_CONSTRICTION_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EXP_ELITE_EXP_BOOST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MONSTER_HOUSE_MAX_NON_MONSTER_SPAWNS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     HEAL_ORDER_HP_RESTORATION: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STEEL_WING_BOOST_DEFENSE_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     GOLD_THORN_POWER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BURN_DAMAGE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     POISON_DAMAGE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SPAWN_COOLDOWN: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MIST_BALL_LOWER_SPECIAL_ATTACK_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     CHARGE_BEAM_BOOST_SPECIAL_ATTACK_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ORAN_BERRY_FULL_HP_BOOST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LIFE_SEED_HP_BOOST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OCTAZOOKA_LOWER_ACCURACY_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LUSTER_PURGE_LOWER_SPECIAL_DEFENSE_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SUPER_LUCK_CRIT_RATE_BOOST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     CONSTRICT_LOWER_SPEED_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ICE_FANG_FREEZE_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SMOG_POISON_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LICK_PARALYZE_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     THUNDER_FANG_PARALYZE_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BITE_CRINGE_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SKY_ATTACK_CRINGE_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ICE_FANG_CRINGE_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BLAZE_KICK_BURN_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     FLAMETHROWER_BURN_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DIZZY_PUNCH_CONFUSE_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SECRET_POWER_EFFECT_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     METAL_CLAW_BOOST_ATTACK_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TECHNICIAN_MOVE_POWER_THRESHOLD: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SONICBOOM_FIXED_DAMAGE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RAIN_ABILITY_BONUS_REGEN: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LEECH_SEED_HP_DRAIN: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EXCLUSIVE_ITEM_EXP_BOOST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     AFTERMATH_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SET_DAMAGE_STATUS_DAMAGE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     INTIMIDATOR_ACTIVATION_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TYPE_ADVANTAGE_MASTER_CRIT_RATE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ORAN_BERRY_HP_RESTORATION: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SITRUS_BERRY_FULL_HP_BOOST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SNORE_CRINGE_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     METEOR_MASH_BOOST_ATTACK_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     CRUSH_CLAW_LOWER_DEFENSE_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BURN_DAMAGE_COOLDOWN: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SHADOW_BALL_LOWER_SPECIAL_DEFENSE_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STICK_POWER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BUBBLE_LOWER_SPEED_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ICE_BODY_BONUS_REGEN: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     POWDER_SNOW_FREEZE_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     POISON_STING_POISON_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SPAWN_COOLDOWN_THIEF_ALERT: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     POISON_FANG_POISON_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     WEATHER_MOVE_TURN_COUNT: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     THUNDER_PARALYZE_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     THUNDERBOLT_PARALYZE_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MONSTER_HOUSE_MAX_MONSTER_SPAWNS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TWISTER_CRINGE_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SPEED_BOOST_TURNS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     FAKE_OUT_CRINGE_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     THUNDER_FANG_CRINGE_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     FLARE_BLITZ_BURN_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     FLAME_WHEEL_BURN_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     PSYBEAM_CONFUSE_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TRI_ATTACK_STATUS_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MIRACLE_CHEST_EXP_BOOST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     WONDER_CHEST_EXP_BOOST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SPAWN_CAP_WITH_MONSTER_HOUSE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     POISON_DAMAGE_COOLDOWN: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LEECH_SEED_DAMAGE_COOLDOWN: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     THROWN_ITEM_HIT_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     GEO_PEBBLE_DAMAGE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     GRAVELEROCK_DAMAGE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RARE_FOSSIL_DAMAGE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     GINSENG_CHANCE_3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ZINC_STAT_BOOST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     IRON_STAT_BOOST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     CALCIUM_STAT_BOOST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     WISH_BONUS_REGEN: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DRAGON_RAGE_FIXED_DAMAGE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     CORSOLA_TWIG_POWER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     CACNEA_SPIKE_POWER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     GOLD_FANG_POWER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SILVER_SPIKE_POWER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     IRON_THORN_POWER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SCOPE_LENS_CRIT_RATE_BOOST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     HEALING_WISH_HP_RESTORATION: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ME_FIRST_MULTIPLIER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     FACADE_DAMAGE_MULTIPLIER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     IMPRISON_TURN_RANGE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SLEEP_TURN_RANGE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     NIGHTMARE_TURN_RANGE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BURN_DAMAGE_MULTIPLIER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     REST_TURN_RANGE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MATCHUP_SUPER_EFFECTIVE_MULTIPLIER_ERRATIC_PLAYER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MATCHUP_IMMUNE_MULTIPLIER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SPORT_CONDITION_TURN_RANGE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SURE_SHOT_TURN_RANGE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DETECT_BAND_MOVE_ACCURACY_DROP: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TINTED_LENS_MULTIPLIER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SMOKESCREEN_TURN_RANGE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     PERISH_SONG_TURN_RANGE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SHADOW_FORCE_DAMAGE_MULTIPLIER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DIG_DAMAGE_MULTIPLIER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DIVE_DAMAGE_MULTIPLIER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BOUNCE_DAMAGE_MULTIPLIER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     POWER_PITCHER_DAMAGE_MULTIPLIER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     QUICK_DODGER_MOVE_ACCURACY_DROP: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MATCHUP_NOT_VERY_EFFECTIVE_MULTIPLIER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MATCHUP_SUPER_EFFECTIVE_MULTIPLIER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MATCHUP_NEUTRAL_MULTIPLIER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MATCHUP_IMMUNE_MULTIPLIER_ERRATIC_PLAYER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MATCHUP_NOT_VERY_EFFECTIVE_MULTIPLIER_ERRATIC_PLAYER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MATCHUP_NEUTRAL_MULTIPLIER_ERRATIC_PLAYER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     AIR_BLADE_DAMAGE_MULTIPLIER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     KECLEON_SHOP_BOOST_CHANCE_MULTIPLIER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     HIDDEN_STAIRS_SPAWN_CHANCE_MULTIPLIER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     YAWN_TURN_RANGE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SPEED_BOOST_TURN_RANGE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SOLARBEAM_DAMAGE_MULTIPLIER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SKY_ATTACK_DAMAGE_MULTIPLIER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RAZOR_WIND_DAMAGE_MULTIPLIER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     FOCUS_PUNCH_DAMAGE_MULTIPLIER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SKULL_BASH_DAMAGE_MULTIPLIER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     FLY_DAMAGE_MULTIPLIER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     WEATHER_BALL_TYPE_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LAST_RESORT_DAMAGE_MULT_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SYNTHESIS_HP_RESTORATION_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ROOST_HP_RESTORATION_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MOONLIGHT_HP_RESTORATION_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MORNING_SUN_HP_RESTORATION_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     REVERSAL_DAMAGE_MULT_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     WATER_SPOUT_DAMAGE_MULT_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     WRING_OUT_DAMAGE_MULT_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ERUPTION_DAMAGE_MULT_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     WEATHER_BALL_DAMAGE_MULT_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EAT_ITEM_EFFECT_IGNORE_LIST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     CASTFORM_WEATHER_ATTRIBUTE_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BAD_POISON_DAMAGE_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TYPE_MATCHUP_COMBINATOR_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OFFENSIVE_STAT_STAGE_MULTIPLIERS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DEFENSIVE_STAT_STAGE_MULTIPLIERS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     NATURE_POWER_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     APPLES_AND_BERRIES_ITEM_IDS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RECRUITMENT_LEVEL_BOOST_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     NATURAL_GIFT_ITEM_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RANDOM_MUSIC_ID_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SHOP_ITEM_CHANCES: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MALE_ACCURACY_STAGE_MULTIPLIERS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MALE_EVASION_STAGE_MULTIPLIERS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     FEMALE_ACCURACY_STAGE_MULTIPLIERS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     FEMALE_EVASION_STAGE_MULTIPLIERS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MUSIC_ID_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TYPE_MATCHUP_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     FIXED_ROOM_MONSTER_SPAWN_STATS_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     METRONOME_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TILESET_PROPERTIES: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     FIXED_ROOM_PROPERTIES_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TRAP_ANIMATION_INFO: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ITEM_ANIMATION_INFO: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MOVE_ANIMATION_INFO: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EFFECT_ANIMATION_INFO: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SPECIAL_MONSTER_MOVE_ANIMATION_INFO: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DEFEAT_ITEM_LOSS_CHANCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
@@ -11380,438 +11565,438 @@ Overlay10Protocol = SectionProtocol[
 ]
 
 
-class Overlay11FunctionsProtocol(Protocol):
+class Overlay11FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     UnlockScriptingLock: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FuncThatCallsRunNextOpcode: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RunNextOpcode: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HandleUnlocks: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadFileFromRomVeneer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SsbLoad2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ScriptParamToInt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ScriptParamToFixedPoint16: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StationLoadHanger: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ScriptStationLoadTalk: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SsbLoad1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ScriptSpecialProcessCall: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetCoroutineInfo: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetSpecialRecruitmentSpecies: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PrepareMenuAcceptTeamMember: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitRandomNpcJobs: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetRandomNpcJobType: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetRandomNpcJobSubtype: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetRandomNpcJobStillAvailable: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AcceptRandomNpcJob: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GroundMainLoop: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetAllocArenaGround: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetFreeArenaGround: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GroundMainReturnDungeon: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GroundMainNextDay: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     JumpToTitleScreen: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ReturnToTitleScreen: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ScriptSpecialProcess0x16: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsScreenFadeInProgress: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadBackgroundAttributes: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadMapType10: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadMapType11: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetSpecialLayoutBackground: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetAnimDataFields: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetAnimDataFieldsWrapper: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitAnimDataFromOtherAnimData: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetAnimDataFields2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetIdleAnimationType: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadObjectAnimData: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitAnimDataFromOtherAnimDataVeneer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AnimRelatedFunction: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AllocAndInitPartnerFollowDataAndLiveActorList: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitPartnerFollowDataAndLiveActorList: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DeleteLiveActor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ChangeActorAnimation: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitPartnerFollowData: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetDirectionLiveActor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetDirectionLiveActor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateTeamInfoBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CloseTeamInfoBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsTeamInfoBoxActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateTeamInfoBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateTopGroundMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CloseTopGroundMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateTopGroundMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsBagNotEmpty: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SprintfStatic: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetExclusiveItemRequirements: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HandleControlsTopScreenGround: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetDungeonMapPos: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     WorldMapSetMode: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     WorldMapSetCamera: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StatusUpdate: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HandleTeamStatsGround: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
 
-class Overlay11DataProtocol(Protocol):
+class Overlay11DataProtocol(SymbolLookupProtocol, Protocol):
 
     OVERLAY11_UNKNOWN_TABLE__NA_2316A38: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SCRIPT_COMMAND_PARSING_DATA: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SCRIPT_OP_CODE_NAMES: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SCRIPT_OP_CODES: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY11_DEBUG_STRINGS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     C_ROUTINE_NAMES: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     C_ROUTINES: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     GROUND_WEATHER_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     GROUND_WAN_FILES_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OBJECTS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RECRUITMENT_TABLE_LOCATIONS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RECRUITMENT_TABLE_LEVELS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RECRUITMENT_TABLE_SPECIES: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LEVEL_TILEMAP_LIST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SETANIMATION_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TEAM_INFO_BOX_DEFAULT_WINDOW_PARAMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY11_OVERLAY_LOAD_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     UNIONALL_RAM_ADDRESS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GROUND_STATE_MAP: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GROUND_STATE_WEATHER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GROUND_STATE_PTRS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     WORLD_MAP_MODE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
@@ -11823,12 +12008,12 @@ Overlay11Protocol = SectionProtocol[
 ]
 
 
-class Overlay12FunctionsProtocol(Protocol):
+class Overlay12FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
 
-class Overlay12DataProtocol(Protocol):
+class Overlay12DataProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
@@ -11840,168 +12025,168 @@ Overlay12Protocol = SectionProtocol[
 ]
 
 
-class Overlay13FunctionsProtocol(Protocol):
+class Overlay13FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     EntryOverlay13: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ExitOverlay13: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Overlay13SwitchFunctionNa238A1C8: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Overlay13SwitchFunctionNa238A574: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetPersonality: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetOptionStringFromID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     WaitForNextStep: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
 
-class Overlay13DataProtocol(Protocol):
+class Overlay13DataProtocol(SymbolLookupProtocol, Protocol):
 
     QUIZ_BORDER_COLOR_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     PORTRAIT_ATTRIBUTES: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     QUIZ_MALE_FEMALE_BOOST_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY13_UNKNOWN_STRUCT__NA_238C024: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     QUIZ_WINDOW_PARAMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     QUIZ_WINDOW_PARAMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     QUIZ_WINDOW_PARAMS_3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     QUIZ_WINDOW_PARAMS_4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     QUIZ_MENU_ITEMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STARTERS_PARTNER_IDS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STARTERS_HERO_IDS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STARTERS_TYPE_INCOMPATIBILITY_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STARTERS_STRINGS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     QUIZ_QUESTION_STRINGS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     QUIZ_ANSWER_STRINGS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     QUIZ_ANSWER_POINTS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY13_RESERVED_SPACE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY13_UNKNOWN_POINTER__NA_238CEA0: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY13_UNKNOWN_POINTER__NA_238CEA4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY13_UNKNOWN_POINTER__NA_238CEA8: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     QUIZ_WINDOW_PARAMS_5: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     QUIZ_WINDOW_PARAMS_6: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     QUIZ_DEBUG_MENU_ITEMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY13_UNKNOWN_STRUCT__NA_238CF14: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     QUIZ_QUESTION_ANSWER_ASSOCIATIONS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
@@ -12013,318 +12198,318 @@ Overlay13Protocol = SectionProtocol[
 ]
 
 
-class Overlay14FunctionsProtocol(Protocol):
+class Overlay14FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     SentrySetupState: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryUpdateDisplay: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentrySetExitingState: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryRunState: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentrySetStateIntermediate: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryState0: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryState1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryState2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryState3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryState4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryStateExit: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryState6: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryState7: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryState8: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryState9: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryStateA: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryStateB: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryStateGenerateChoices: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryStateGetUserChoice: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryStateFinalizeRound: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryStateF: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryState10: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryState11: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryState12: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryState13: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryState14: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryState15: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryState16: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryState17: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryState18: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryState19: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryState1A: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryStateFinalizePoints: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryState1C: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryState1D: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryState1E: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryState1F: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryState20: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SentryState21: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
 
-class Overlay14DataProtocol(Protocol):
+class Overlay14DataProtocol(SymbolLookupProtocol, Protocol):
 
     SENTRY_DUTY_STRUCT_SIZE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SENTRY_LOUDRED_MONSTER_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_ID_SENTRY_TOP_SESSIONS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_ID_SENTRY_INSTRUCTIONS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_ID_SENTRY_HERE_COMES: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_ID_SENTRY_WHOSE_FOOTPRINT: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_ID_SENTRY_TRY_AGAIN: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_ID_SENTRY_OUT_OF_TIME: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_ID_SENTRY_FOOTPRINT_IS_6EE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_ID_SENTRY_COME_IN_6EF: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_ID_SENTRY_WRONG: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_ID_SENTRY_BUCK_UP: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_ID_SENTRY_FOOTPRINT_IS_6EC: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_ID_SENTRY_COME_IN_6ED: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_ID_SENTRY_KEEP_YOU_WAITING: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_ID_SENTRY_THATLL_DO_IT: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SENTRY_CHATOT_MONSTER_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_ID_SENTRY_NO_MORE_VISITORS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STRING_ID_SENTRY_THATS_ALL: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SENTRY_GROVYLE_MONSTER_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SENTRY_DEBUG_MENU_ITEMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SENTRY_DUTY_PTR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SENTRY_DUTY_STATE_HANDLER_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
@@ -12336,50 +12521,50 @@ Overlay14Protocol = SectionProtocol[
 ]
 
 
-class Overlay15FunctionsProtocol(Protocol):
+class Overlay15FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
 
-class Overlay15DataProtocol(Protocol):
+class Overlay15DataProtocol(SymbolLookupProtocol, Protocol):
 
     BANK_MAIN_MENU_ITEMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BANK_WINDOW_PARAMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BANK_WINDOW_PARAMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BANK_WINDOW_PARAMS_3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BANK_WINDOW_PARAMS_4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BANK_WINDOW_PARAMS_5: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY15_RESERVED_SPACE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY15_UNKNOWN_POINTER__NA_238B180: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
@@ -12391,80 +12576,80 @@ Overlay15Protocol = SectionProtocol[
 ]
 
 
-class Overlay16FunctionsProtocol(Protocol):
+class Overlay16FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
 
-class Overlay16DataProtocol(Protocol):
+class Overlay16DataProtocol(SymbolLookupProtocol, Protocol):
 
     EVO_MENU_ITEMS_CONFIRM: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EVO_SUBMENU_ITEMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EVO_MAIN_MENU_ITEMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EVO_MENU_STRING_IDS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EVO_WINDOW_PARAMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EVO_WINDOW_PARAMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EVO_WINDOW_PARAMS_3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EVO_WINDOW_PARAMS_4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EVO_WINDOW_PARAMS_5: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EVO_WINDOW_PARAMS_6: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EVO_WINDOW_PARAMS_7: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY16_RESERVED_SPACE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY16_UNKNOWN_POINTER__NA_238CE40: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY16_UNKNOWN_POINTER__NA_238CE58: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
@@ -12476,110 +12661,110 @@ Overlay16Protocol = SectionProtocol[
 ]
 
 
-class Overlay17FunctionsProtocol(Protocol):
+class Overlay17FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
 
-class Overlay17DataProtocol(Protocol):
+class Overlay17DataProtocol(SymbolLookupProtocol, Protocol):
 
     ASSEMBLY_WINDOW_PARAMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ASSEMBLY_WINDOW_PARAMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ASSEMBLY_WINDOW_PARAMS_3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ASSEMBLY_WINDOW_PARAMS_4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ASSEMBLY_WINDOW_PARAMS_5: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ASSEMBLY_MENU_ITEMS_CONFIRM: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ASSEMBLY_MAIN_MENU_ITEMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ASSEMBLY_MAIN_MENU_ITEMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ASSEMBLY_SUBMENU_ITEMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ASSEMBLY_SUBMENU_ITEMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ASSEMBLY_SUBMENU_ITEMS_3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ASSEMBLY_SUBMENU_ITEMS_4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ASSEMBLY_SUBMENU_ITEMS_5: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ASSEMBLY_SUBMENU_ITEMS_6: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ASSEMBLY_SUBMENU_ITEMS_7: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY17_FUNCTION_POINTER_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY17_RESERVED_SPACE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY17_UNKNOWN_POINTER__NA_238BE00: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY17_UNKNOWN_POINTER__NA_238BE04: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY17_UNKNOWN_POINTER__NA_238BE08: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
@@ -12591,135 +12776,135 @@ Overlay17Protocol = SectionProtocol[
 ]
 
 
-class Overlay18FunctionsProtocol(Protocol):
+class Overlay18FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
 
-class Overlay18DataProtocol(Protocol):
+class Overlay18DataProtocol(SymbolLookupProtocol, Protocol):
 
     LINK_SHOP_WINDOW_PARAMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LINK_SHOP_WINDOW_PARAMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LINK_SHOP_WINDOW_PARAMS_3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LINK_SHOP_WINDOW_PARAMS_4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LINK_SHOP_WINDOW_PARAMS_5: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LINK_SHOP_WINDOW_PARAMS_6: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LINK_SHOP_WINDOW_PARAMS_7: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LINK_SHOP_WINDOW_PARAMS_8: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LINK_SHOP_WINDOW_PARAMS_9: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LINK_SHOP_WINDOW_PARAMS_10: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LINK_SHOP_WINDOW_PARAMS_11: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LINK_SHOP_MENU_ITEMS_CONFIRM: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LINK_SHOP_SUBMENU_ITEMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LINK_SHOP_SUBMENU_ITEMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LINK_SHOP_MAIN_MENU_ITEMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LINK_SHOP_SUBMENU_ITEMS_3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LINK_SHOP_SUBMENU_ITEMS_4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LINK_SHOP_SUBMENU_ITEMS_5: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LINK_SHOP_SUBMENU_ITEMS_6: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LINK_SHOP_SUBMENU_ITEMS_7: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY18_FUNCTION_POINTER_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY18_RESERVED_SPACE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY18_UNKNOWN_POINTER__NA_238D620: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY18_UNKNOWN_POINTER__NA_238D624: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY18_UNKNOWN_POINTER__NA_238D628: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
@@ -12731,123 +12916,123 @@ Overlay18Protocol = SectionProtocol[
 ]
 
 
-class Overlay19FunctionsProtocol(Protocol):
+class Overlay19FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     GetBarItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetRecruitableMonsterAll: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetRecruitableMonsterList: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetRecruitableMonsterListRestricted: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
 
-class Overlay19DataProtocol(Protocol):
+class Overlay19DataProtocol(SymbolLookupProtocol, Protocol):
 
     OVERLAY19_UNKNOWN_TABLE__NA_238DAE0: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BAR_UNLOCKABLE_DUNGEONS_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BAR_RECRUITABLE_MONSTER_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BAR_AVAILABLE_ITEMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY19_UNKNOWN_STRING_IDS__NA_238E178: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY19_UNKNOWN_STRUCT__NA_238E1A4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY19_UNKNOWN_STRING_IDS__NA_238E1CC: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BAR_WINDOW_PARAMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BAR_WINDOW_PARAMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BAR_WINDOW_PARAMS_3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BAR_MENU_ITEMS_CONFIRM_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BAR_MENU_ITEMS_CONFIRM_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY19_UNKNOWN_STRING_IDS__NA_238E238: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BAR_MAIN_MENU_ITEMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BAR_SUBMENU_ITEMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BAR_SUBMENU_ITEMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY19_RESERVED_SPACE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY19_UNKNOWN_POINTER__NA_238E360: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY19_UNKNOWN_POINTER__NA_238E364: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
@@ -12859,12 +13044,12 @@ Overlay19Protocol = SectionProtocol[
 ]
 
 
-class Overlay2FunctionsProtocol(Protocol):
+class Overlay2FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
 
-class Overlay2DataProtocol(Protocol):
+class Overlay2DataProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
@@ -12876,135 +13061,135 @@ Overlay2Protocol = SectionProtocol[
 ]
 
 
-class Overlay20FunctionsProtocol(Protocol):
+class Overlay20FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
 
-class Overlay20DataProtocol(Protocol):
+class Overlay20DataProtocol(SymbolLookupProtocol, Protocol):
 
     OVERLAY20_UNKNOWN_POINTER__NA_238CF7C: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RECYCLE_MENU_ITEMS_CONFIRM_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RECYCLE_MENU_ITEMS_CONFIRM_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RECYCLE_SUBMENU_ITEMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RECYCLE_SUBMENU_ITEMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RECYCLE_MAIN_MENU_ITEMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY20_UNKNOWN_TABLE__NA_238D014: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RECYCLE_WINDOW_PARAMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RECYCLE_WINDOW_PARAMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RECYCLE_WINDOW_PARAMS_3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RECYCLE_WINDOW_PARAMS_4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RECYCLE_WINDOW_PARAMS_5: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RECYCLE_WINDOW_PARAMS_6: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RECYCLE_MAIN_MENU_ITEMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RECYCLE_WINDOW_PARAMS_7: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RECYCLE_WINDOW_PARAMS_8: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RECYCLE_WINDOW_PARAMS_9: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RECYCLE_WINDOW_PARAMS_10: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RECYCLE_WINDOW_PARAMS_11: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RECYCLE_MAIN_MENU_ITEMS_3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY20_RESERVED_SPACE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY20_UNKNOWN_POINTER__NA_238D120: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY20_UNKNOWN_POINTER__NA_238D124: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY20_UNKNOWN_POINTER__NA_238D128: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY20_UNKNOWN_POINTER__NA_238D12C: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
@@ -13016,110 +13201,110 @@ Overlay20Protocol = SectionProtocol[
 ]
 
 
-class Overlay21FunctionsProtocol(Protocol):
+class Overlay21FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
 
-class Overlay21DataProtocol(Protocol):
+class Overlay21DataProtocol(SymbolLookupProtocol, Protocol):
 
     SWAP_SHOP_WINDOW_PARAMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SWAP_SHOP_MENU_ITEMS_CONFIRM: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SWAP_SHOP_SUBMENU_ITEMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SWAP_SHOP_SUBMENU_ITEMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SWAP_SHOP_MAIN_MENU_ITEMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SWAP_SHOP_MAIN_MENU_ITEMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SWAP_SHOP_SUBMENU_ITEMS_3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY21_UNKNOWN_STRING_IDS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SWAP_SHOP_WINDOW_PARAMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SWAP_SHOP_WINDOW_PARAMS_3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SWAP_SHOP_WINDOW_PARAMS_4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SWAP_SHOP_WINDOW_PARAMS_5: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SWAP_SHOP_WINDOW_PARAMS_6: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SWAP_SHOP_WINDOW_PARAMS_7: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SWAP_SHOP_WINDOW_PARAMS_8: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SWAP_SHOP_WINDOW_PARAMS_9: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY21_JP_STRING: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY21_RESERVED_SPACE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY21_UNKNOWN_POINTER__NA_238CF40: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY21_UNKNOWN_POINTER__NA_238CF44: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
@@ -13131,120 +13316,120 @@ Overlay21Protocol = SectionProtocol[
 ]
 
 
-class Overlay22FunctionsProtocol(Protocol):
+class Overlay22FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
 
-class Overlay22DataProtocol(Protocol):
+class Overlay22DataProtocol(SymbolLookupProtocol, Protocol):
 
     SHOP_WINDOW_PARAMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SHOP_WINDOW_PARAMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY22_UNKNOWN_STRUCT__NA_238E85C: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SHOP_MENU_ITEMS_CONFIRM: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SHOP_MAIN_MENU_ITEMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SHOP_MAIN_MENU_ITEMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SHOP_MAIN_MENU_ITEMS_3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY22_UNKNOWN_STRING_IDS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SHOP_WINDOW_PARAMS_3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SHOP_WINDOW_PARAMS_4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SHOP_WINDOW_PARAMS_5: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SHOP_WINDOW_PARAMS_6: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SHOP_WINDOW_PARAMS_7: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SHOP_WINDOW_PARAMS_8: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SHOP_WINDOW_PARAMS_9: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SHOP_WINDOW_PARAMS_10: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY22_RESERVED_SPACE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY22_UNKNOWN_POINTER__NA_238EC60: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY22_UNKNOWN_POINTER__NA_238EC64: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY22_UNKNOWN_POINTER__NA_238EC68: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY22_UNKNOWN_POINTER__NA_238EC6C: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY22_UNKNOWN_POINTER__NA_238EC70: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
@@ -13256,105 +13441,105 @@ Overlay22Protocol = SectionProtocol[
 ]
 
 
-class Overlay23FunctionsProtocol(Protocol):
+class Overlay23FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
 
-class Overlay23DataProtocol(Protocol):
+class Overlay23DataProtocol(SymbolLookupProtocol, Protocol):
 
     OVERLAY23_UNKNOWN_VALUE__NA_238D2E8: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY23_UNKNOWN_VALUE__NA_238D2EC: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY23_UNKNOWN_STRUCT__NA_238D2F0: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STORAGE_MENU_ITEMS_CONFIRM: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STORAGE_MAIN_MENU_ITEMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STORAGE_MAIN_MENU_ITEMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STORAGE_MAIN_MENU_ITEMS_3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STORAGE_MAIN_MENU_ITEMS_4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY23_UNKNOWN_STRING_IDS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STORAGE_WINDOW_PARAMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STORAGE_WINDOW_PARAMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STORAGE_WINDOW_PARAMS_3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STORAGE_WINDOW_PARAMS_4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STORAGE_WINDOW_PARAMS_5: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STORAGE_WINDOW_PARAMS_6: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STORAGE_WINDOW_PARAMS_7: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STORAGE_WINDOW_PARAMS_8: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY23_RESERVED_SPACE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY23_UNKNOWN_POINTER__NA_238D8A0: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
@@ -13366,70 +13551,70 @@ Overlay23Protocol = SectionProtocol[
 ]
 
 
-class Overlay24FunctionsProtocol(Protocol):
+class Overlay24FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
 
-class Overlay24DataProtocol(Protocol):
+class Overlay24DataProtocol(SymbolLookupProtocol, Protocol):
 
     OVERLAY24_UNKNOWN_STRUCT__NA_238C508: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY24_UNKNOWN_STRUCT__NA_238C514: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DAYCARE_MENU_ITEMS_CONFIRM: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DAYCARE_MAIN_MENU_ITEMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY24_UNKNOWN_STRING_IDS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DAYCARE_WINDOW_PARAMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DAYCARE_WINDOW_PARAMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DAYCARE_WINDOW_PARAMS_3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DAYCARE_WINDOW_PARAMS_4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DAYCARE_WINDOW_PARAMS_5: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY24_RESERVED_SPACE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY24_UNKNOWN_POINTER__NA_238C600: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
@@ -13441,85 +13626,85 @@ Overlay24Protocol = SectionProtocol[
 ]
 
 
-class Overlay25FunctionsProtocol(Protocol):
+class Overlay25FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
 
-class Overlay25DataProtocol(Protocol):
+class Overlay25DataProtocol(SymbolLookupProtocol, Protocol):
 
     OVERLAY25_UNKNOWN_STRUCT__NA_238B498: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     APPRAISAL_WINDOW_PARAMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     APPRAISAL_MENU_ITEMS_CONFIRM: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     APPRAISAL_MAIN_MENU_ITEMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     APPRAISAL_SUBMENU_ITEMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY25_UNKNOWN_STRING_IDS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     APPRAISAL_WINDOW_PARAMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     APPRAISAL_WINDOW_PARAMS_3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     APPRAISAL_WINDOW_PARAMS_4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     APPRAISAL_WINDOW_PARAMS_5: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     APPRAISAL_WINDOW_PARAMS_6: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     APPRAISAL_WINDOW_PARAMS_7: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     APPRAISAL_WINDOW_PARAMS_8: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY25_RESERVED_SPACE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY25_UNKNOWN_POINTER__NA_238B5E0: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
@@ -13531,45 +13716,45 @@ Overlay25Protocol = SectionProtocol[
 ]
 
 
-class Overlay26FunctionsProtocol(Protocol):
+class Overlay26FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
 
-class Overlay26DataProtocol(Protocol):
+class Overlay26DataProtocol(SymbolLookupProtocol, Protocol):
 
     OVERLAY26_UNKNOWN_TABLE__NA_238AE20: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY26_RESERVED_SPACE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY26_UNKNOWN_POINTER__NA_238AF60: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY26_UNKNOWN_POINTER__NA_238AF64: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY26_UNKNOWN_POINTER__NA_238AF68: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY26_UNKNOWN_POINTER__NA_238AF6C: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY26_UNKNOWN_POINTER5__NA_238AF70: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
@@ -13581,105 +13766,105 @@ Overlay26Protocol = SectionProtocol[
 ]
 
 
-class Overlay27FunctionsProtocol(Protocol):
+class Overlay27FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
 
-class Overlay27DataProtocol(Protocol):
+class Overlay27DataProtocol(SymbolLookupProtocol, Protocol):
 
     OVERLAY27_UNKNOWN_VALUE__NA_238C948: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY27_UNKNOWN_VALUE__NA_238C94C: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY27_UNKNOWN_STRUCT__NA_238C950: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DISCARD_ITEMS_MENU_ITEMS_CONFIRM: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DISCARD_ITEMS_SUBMENU_ITEMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DISCARD_ITEMS_SUBMENU_ITEMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DISCARD_ITEMS_MAIN_MENU_ITEMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY27_UNKNOWN_STRING_IDS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DISCARD_WINDOW_PARAMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DISCARD_WINDOW_PARAMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DISCARD_WINDOW_PARAMS_3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DISCARD_WINDOW_PARAMS_4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DISCARD_WINDOW_PARAMS_5: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DISCARD_WINDOW_PARAMS_6: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DISCARD_WINDOW_PARAMS_7: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DISCARD_WINDOW_PARAMS_8: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY27_RESERVED_SPACE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY27_UNKNOWN_POINTER__NA_238CE80: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY27_UNKNOWN_POINTER__NA_238CE84: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
@@ -13691,12 +13876,12 @@ Overlay27Protocol = SectionProtocol[
 ]
 
 
-class Overlay28FunctionsProtocol(Protocol):
+class Overlay28FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
 
-class Overlay28DataProtocol(Protocol):
+class Overlay28DataProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
@@ -13708,4313 +13893,4313 @@ Overlay28Protocol = SectionProtocol[
 ]
 
 
-class Overlay29FunctionsProtocol(Protocol):
+class Overlay29FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     GetWeatherColorTable: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DungeonAlloc: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetDungeonPtrMaster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DungeonZInit: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DungeonFree: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RunDungeon: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EntityIsValid: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetFloorType: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryForcedLoss: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsBossFight: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsCurrentFixedRoomBossFight: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsMarowakTrainingMaze: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FixedRoomIsSubstituteRoom: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StoryRestrictionsEnabled: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetScenarioBalanceVeneer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FadeToBlack: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CheckTouchscreenArea: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetTrapInfo: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetItemInfo: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetTileAtEntity: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateEntityPixelPos: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetEntityPixelPosXY: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IncrementEntityPixelPosXY: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateEnemyEntity: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SpawnTrap: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SpawnItemEntity: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ShouldMinimapDisplayEntity: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ShouldDisplayEntity: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ShouldDisplayEntityWrapper: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CanSeeTarget: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CanTargetEntity: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CanTargetPosition: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PopulateActiveMonsterPtrs: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetTeamMemberIndex: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SubstitutePlaceholderStringTags: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateMapSurveyorFlag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PointCameraToMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateCamera: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ItemIsActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetVisibilityRange: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RevealWholeFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PlayEffectAnimationEntity: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PlayEffectAnimationPos: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PlayEffectAnimationPixelPos: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AnimationDelayOrSomething: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateStatusIconFlags: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PlayEffectAnimation0x171Full: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PlayEffectAnimation0x171: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ShowPpRestoreEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ShouldDisplayEntityAdvanced: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PlayEffectAnimation0x1A9: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PlayEffectAnimation0x18E: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadMappaFileAttributes: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetItemIdToSpawn: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CopySpawnEntriesMaster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MonsterSpawnListPartialCopy: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsOnMonsterSpawnList: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMonsterIdToSpawn: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMonsterLevelToSpawn: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AllocTopScreenStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FreeTopScreenStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitializeTeamStats: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateTeamStatsWrapper: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FreeTeamStatsWrapper: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AssignTopScreenHandlers: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HandleTopScreenFades: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FreeTopScreen: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetDirectionTowardsPosition: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetChebyshevDistance: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsPositionActuallyInSight: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsPositionInSight: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetLeader: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetLeaderMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetRandomTile: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FindNearbyUnoccupiedTile: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FindClosestUnoccupiedTileWithin2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FindFarthestUnoccupiedTileWithin2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FindUnoccupiedTileWithin3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TickStatusTurnCounter: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AdvanceFrame: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DisplayAnimatedNumbers: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetDungeonRngPreseed23Bit: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateDungeonRngSeed: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetDungeonRngPreseed: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetDungeonRngPreseed: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitDungeonRng: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DungeonRand16Bit: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DungeonRandInt: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DungeonRandRange: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DungeonRandOutcome: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CalcStatusDuration: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DungeonRngUnsetSecondary: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DungeonRngSetSecondary: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DungeonRngSetPrimary: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MusicTableIdxToMusicId: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ChangeDungeonMusic: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TrySwitchPlace: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetLeaderActionFields: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ClearMonsterActionFields: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetMonsterActionFields: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetActionPassTurnOrWalk: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetItemToUseByIndex: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetItemToUse: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetItemAction: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RemoveUsedItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AddDungeonSubMenuOption: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DisableDungeonSubMenuOption: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetActionRegularAttack: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetActionUseMovePlayer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetActionUseMoveAi: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RunFractionalTurn: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RunLeaderTurn: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TrySpawnMonsterAndActivatePlusMinus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsFloorOver: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DecrementWindCounter: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsDungeonEndReasonFailure: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetForcedLossReason: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetForcedLossReason: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     BindTrapToTile: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AreLateGameTrapsEnabledWrapper: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SpawnEnemyTrapAtPos: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PrepareTrapperTrap: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TrySpawnTrap: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TrySpawnTrapperTrap: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryRemoveTrap: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryTriggerTrap: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyMudTrapEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyStickyTrapEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyGrimyTrapEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyPitfallTrapEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplySummonTrapEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyPpZeroTrapEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyPokemonTrapEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyTripTrapEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyStealthRockTrapEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyToxicSpikesTrapEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyRandomTrapEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyGrudgeTrapEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyTrapEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RevealTrapsNearby: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ShouldRunMonsterAi: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DebugRecruitingEnabled: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryActivateIqBooster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsSecretBazaarNpcBehavior: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetLeaderAction: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetEntityTouchscreenArea: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetLeaderAction: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ShouldLeaderKeepRunning: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CheckLeaderTile: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ChangeLeader: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UseSingleUseItemWrapper: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UseSingleUseItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UseThrowableItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ResetDamageData: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FreeLoadedAttackSpriteAndMore: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetAndLoadCurrentAttackAnimation: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ClearLoadedAttackSprite: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetLoadedAttackSpriteId: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DungeonGetTotalSpriteFileSize: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DungeonGetSpriteIndex: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     JoinedAtRangeCheck2Veneer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FloorNumberIsEven: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetKecleonIdToSpawnByFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StoreSpriteFileIndexBothGenders: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadMonsterSpriteInner: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SwapMonsterWanFileIndex: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadMonsterSprite: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DeleteMonsterSpriteFile: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DeleteAllMonsterSpriteFiles: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EuFaintCheck: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HandleFaint: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MoveMonsterToPos: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateMonsterSummaryFromMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateAiTargetPos: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetMonsterTypeAndAbility: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryActivateSlowStart: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryActivateArtificialWeatherAbilities: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMonsterApparentId: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryActivateTraceAndColorChange: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DefenderAbilityIsActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryActivateConversion2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryActivateTruant: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryPointCameraToMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ReevaluateSnatchMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetRandomExplorerMazeMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RestorePpAllMovesSetFlags: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CheckTeamMemberIdxVeneer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsMonsterIdInNormalRangeVeneer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     BoostIQ: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ShouldMonsterHeadToStairs: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MewSpawnCheck: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryEndStatusWithAbility: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ExclusiveItemEffectIsActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetTeamMemberWithIqSkill: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TeamMemberHasEnabledIqSkill: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TeamLeaderIqSkillIsEnabled: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CountMovesOutOfPp: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HasSuperEffectiveMoveAgainstUser: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryEatItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetDecoyAiTracker: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CheckSpawnThreshold: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HasLowHealth: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AreEntitiesAdjacent: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsSpecialStoryAlly: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsExperienceLocked: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitOtherMonsterData: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitEnemySpawnStats: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitEnemyStatsAndMoves: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SpawnTeam: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SpawnInitialMonsters: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SpawnMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitTeamMember: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SubInitMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MarkShopkeeperSpawn: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SpawnShopkeepers: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMaxHpAtLevel: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetOffensiveStatAtLevel: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetDefensiveStatAtLevel: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetOutlawSpawnData: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ExecuteMonsterAction: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryActivateFlashFireOnAllMonsters: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HasStatusThatPreventsActing: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMobilityTypeCheckSlip: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMobilityTypeCheckSlipAndFloating: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsInvalidSpawnTile: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMobilityTypeAfterIqSkills: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CannotStandOnTile: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CalcSpeedStage: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CalcSpeedStageWrapper: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetNumberOfAttacks: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMonsterDisplayNameType: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMonsterName: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SprintfStatic: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsMonsterDrowsy: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MonsterHasNonvolatileNonsleepStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MonsterHasImmobilizingStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MonsterHasAttackInterferingStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MonsterHasSkillInterferingStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MonsterHasLeechSeedStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MonsterHasWhifferStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsMonsterVisuallyImpaired: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsMonsterMuzzled: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MonsterHasMiracleEyeStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MonsterHasNegativeStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsMonsterSleeping: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CheckVariousStatuses2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CheckVariousConditions: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CheckVariousStatuses: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CanMonsterMoveInDirection: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetDirectionalMobilityType: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsMonsterCornered: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CanAttackInDirection: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CanAiMonsterMoveInDirection: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ShouldMonsterRunAway: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ShouldMonsterRunAwayVariation: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetTreatmentBetweenMonsters: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SafeguardIsActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LeafGuardIsActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsProtectedFromStatDrops: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     NoGastroAcidStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AbilityIsActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AbilityIsActiveVeneer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     OtherMonsterAbilityIsActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LevitateIsActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MonsterIsType: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsTypeAffectedByGravity: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HasTypeAffectedByGravity: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CanSeeInvisibleMonsters: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsTacticSet: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HasDropeyeStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IqSkillIsEnabled: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateIqSkills: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMoveTypeForMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMovePower: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MonsterCanThrowItems: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateStateFlags: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsProtectedFromNegativeStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AddExpSpecial: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EnemyEvolution: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LevelUpItemEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryDecreaseLevel: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LevelUp: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMonsterMoves: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EvolveMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ChangeMonsterAnimation: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetIdleAnimationId: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DetermineAllMonsterShadow: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DetermineMonsterShadow: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DisplayActions: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CheckNonLeaderTile: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EndNegativeStatusCondition: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EndNegativeStatusConditionWrapper: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TransferNegativeStatusCondition: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EndSleepClassStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EndBurnClassStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EndFrozenClassStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EndCringeClassStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EndReflectClassStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryRemoveSnatchedMonsterFromDungeonStruct: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EndCurseClassStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EndLeechSeedClassStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EndSureShotClassStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EndInvisibleClassStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EndBlinkerClassStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EndMuzzledStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EndMiracleEyeStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EndMagnetRiseStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TransferNegativeBlinkerClassStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EndFrozenStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EndProtectStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryRestoreRoostTyping: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryTriggerMonsterHouse: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ShouldMonsterFollowLeader: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RunMonsterAi: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyDamageAndEffects: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyDamage: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AftermathCheck: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetTypeMatchupBothTypes: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ScrappyShouldActivate: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsTypeIneffectiveAgainstGhost: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GhostImmunityIsActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetTypeMatchup: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CalcTypeBasedDamageEffects: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CalcDamage: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyDamageAndEffectsWrapper: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CalcRecoilDamageFixed: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CalcDamageFixed: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CalcDamageFixedNoCategory: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CalcDamageFixedWrapper: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateShopkeeperModeAfterAttack: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateShopkeeperModeAfterTrap: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ResetDamageCalcDiagnostics: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SpecificRecruitCheck: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RecruitCheck: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryRecruit: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TrySpawnMonsterAndTickSpawnCounter: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AiDecideUseItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetPossibleAiThrownItemDirections: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetPossibleAiArcItemTargets: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryNonLeaderItemPickUp: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetExclusiveItemWithEffectFromBag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AuraBowIsActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ExclusiveItemOffenseBoost: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ExclusiveItemDefenseBoost: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TeamMemberHasItemActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TeamMemberHasExclusiveItemEffectActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TrySpawnEnemyItemDrop: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TickNoSlipCap: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TickStatusAndHealthRegen: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InflictSleepStatusSingle: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictSleepStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsProtectedFromSleepClassStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictNightmareStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictNappingStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictYawningStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictSleeplessStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictPausedStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictInfatuatedStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictBurnStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictBurnStatusWholeTeam: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictPoisonedStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictBadlyPoisonedStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictFrozenStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictConstrictionStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictShadowHoldStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictIngrainStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictWrappedStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FreeOtherWrappedMonsters: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictPetrifiedStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LowerOffensiveStat: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LowerDefensiveStat: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     BoostOffensiveStat: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     BoostDefensiveStat: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FlashFireShouldActivate: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ActivateFlashFire: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyOffensiveStatMultiplier: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyDefensiveStatMultiplier: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     BoostHitChanceStat: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LowerHitChanceStat: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictCringeStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictParalysisStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     BoostSpeed: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     BoostSpeedOneStage: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LowerSpeed: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TrySealMove: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     BoostOrLowerSpeed: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ResetHitChanceStat: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ExclusiveItemEffectIsActiveWithLogging: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryActivateQuickFeet: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictTerrifiedStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictGrudgeStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictConfusedStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictCoweringStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryRestoreHp: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryIncreaseHp: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RevealItems: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RevealStairs: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RevealEnemies: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictLeechSeedStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictDestinyBondStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictSureShotStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictWhifferStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictSetDamageStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictFocusEnergyStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictDecoyStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictCurseStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictSnatchStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictTauntStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictStockpileStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictInvisibleStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictPerishSongStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictEncoreStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryDecreaseBelly: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryIncreaseBelly: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictMuzzledStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryTransform: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictMobileStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictExposedStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryActivateIdentifyCondition: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictBlinkerStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsBlinded: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictCrossEyedStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictEyedropStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictSlipStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictDropeyeStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RestoreAllMovePP: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RestoreOneMovePP: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RestoreRandomMovePP: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyProteinEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyCalciumEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyIronEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyZincEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictLongTossStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictPierceStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictGastroAcidStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetAquaRingHealingCountdownTo4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyAquaRingHealing: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictAquaRingStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictLuckyChantStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictHealBlockStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MonsterHasEmbargoStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LogItemBlockedByEmbargo: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictEmbargoStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictMiracleEyeStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictMagnetRiseStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsFloating: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictSafeguardStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictMistStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictWishStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictMagicCoatStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictLightScreenStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictReflectStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictProtectStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictMirrorCoatStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictEndureStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictMirrorMoveStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictConversion2Status: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryInflictVitalThrowStatus: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryResetStatChanges: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MirrorMoveIsActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MistIsActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     Conversion2IsActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AiConsiderMove: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryAddTargetToAiTargetList: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsAiTargetEligible: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsTargetInRange: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ShouldUsePp: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetEntityMoveTargetAndRange: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetEntityNaturalGiftInfo: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetEntityWeatherBallType: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ActivateMotorDrive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryActivateFrisk: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryActivateBadDreams: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ActivateStench: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryActivateSteadfast: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsInSpawnList: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ChangeShayminForme: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyItemEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyCheriBerryEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyPechaBerryEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyRawstBerryEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyHungerSeedEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyVileSeedEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyViolentSeedEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyGinsengEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyBlastSeedEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyGummiBoostsDungeonMode: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CanMonsterUseItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyGrimyFoodEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyMixElixirEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyDoughSeedEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyViaSeedEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyGravelyrockEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyGonePebbleEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyGracideaEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetAiUseItemProbability: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsAdjacentToEnemy: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ShouldTryEatItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMaxPpWrapper: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MoveIsNotPhysical: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CategoryIsNotPhysical: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryDrought: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryPounce: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryBlowAway: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryExplosion: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryAftermathExplosion: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryWarp: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EnsureCanStandCurrentTile: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryActivateNondamagingDefenderAbility: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryActivateNondamagingDefenderExclusiveItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMoveRangeDistance: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MoveHitCheck: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsHyperBeamVariant: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsChargingTwoTurnMove: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsChargingAnyTwoTurnMove: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HasMaxGinsengBoost99: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TwoTurnMoveForcedMiss: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DungeonRandOutcomeUserTargetInteraction: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DungeonRandOutcomeUserAction: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CanAiUseMove: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CanMonsterUseMove: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateMovePp: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetDamageSourceWrapper: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LowerSshort: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PlayMoveAnimation: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMoveAnimationId: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ShouldMovePlayAlternativeAnimation: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ExecuteMoveEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoMoveDamageInlined: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DealDamage: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DealDamageWithTypeAndPowerBoost: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DealDamageProjectile: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DealDamageWithType: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PerformDamageSequence: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CanHitWithRegularAttack: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StatusCheckerCheck: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetApparentWeather: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryWeatherFormChange: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ActivateSportCondition: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryActivateWeather: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DigitCount: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadTextureUi: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DisplayNumberTextureUi: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DisplayCharTextureUi: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DisplayUi: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetTile: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetTileSafe: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsFullFloorFixedRoom: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsCurrentTilesetBackground: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TrySpawnGoldenChamber: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CountItemsOnFloorForAcuteSniffer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetStairsSpawnPosition: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PositionIsOnStairs: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetStairsRoom: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetDefaultTileTextureId: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DetermineAllTilesWalkableNeighbors: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DetermineTileWalkableNeighbors: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateTrapsVisibility: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DrawTileGrid: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HideTileGrid: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DiscoverMinimap: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PositionHasItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PositionHasMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TrySmashWall: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsWaterTileset: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetRandomSpawnMonsterID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     NearbyAllyIqSkillIsEnabled: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ResetGravity: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GravityIsActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryActivateGravity: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ShouldBoostKecleonShopSpawnChance: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetShouldBoostKecleonShopSpawnChance: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateShouldBoostKecleonShopSpawnChance: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetDoughSeedFlag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetDoughSeedFlag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TrySpawnDoughSeedPoke: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsSecretBazaar: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ShouldBoostHiddenStairsSpawnChance: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetShouldBoostHiddenStairsSpawnChance: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateShouldBoostHiddenStairsSpawnChance: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsSecretRoom: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsSecretFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetCurrentHiddenStairsType: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HiddenStairsPresent: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PositionIsOnHiddenStairs: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HiddenStairsTrigger: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetHiddenStairsField: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetHiddenStairsField: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetHiddenFloorField: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetHiddenFloorField: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadWeather3DFiles: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RenderWeather3D: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMinimapData: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DrawMinimapTile: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FlashLeaderIcon: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateMinimap: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetMinimapDataE447: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMinimapDataE447: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetMinimapDataE448: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitWeirdMinimapMatrix: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitMinimapDisplayTile: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadFixedRoomDataVeneer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UnloadFixedRoomData: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsNormalFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetTileTerrain: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DungeonRand100: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ClearHiddenStairs: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FlagHallwayJunctions: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateStandardFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateOuterRingFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateCrossroadsFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateLineFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateCrossFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateBeetleFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MergeRoomsVertically: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateOuterRoomsFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsNotFullFloorFixedRoom: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateFixedRoom: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateOneRoomMonsterHouseFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateTwoRoomsWithMonsterHouseFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateExtraHallways: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetGridPositions: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitDungeonGrid: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AssignRooms: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateRoomsAndAnchors: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateSecondaryStructures: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AssignGridCellConnections: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateGridCellConnections: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateRoomImperfections: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateHallway: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EnsureConnectedGrid: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetTerrainObstacleChecked: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FinalizeJunctions: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateKecleonShop: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateMonsterHouse: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateMazeRoom: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateMaze: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateMazeLine: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetSpawnFlag5: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsNextToHallway: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ResolveInvalidSpawns: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ConvertSecondaryTerrainToChasms: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     EnsureImpassableTilesAreWalls: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitializeTile: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ResetFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PosIsOutOfBounds: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ShuffleSpawnPositions: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MarkNonEnemySpawns: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MarkEnemySpawns: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetSecondaryTerrainOnWall: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateSecondaryTerrainFormations: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StairsAlwaysReachable: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetNextFixedRoomAction: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ConvertWallsToChasms: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ResetInnerBoundaryTileRows: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ResetImportantSpawnPositions: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SpawnStairs: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetHiddenStairsType: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetFinalKecleonShopSpawnChance: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ResetHiddenStairsSpawn: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     PlaceFixedRoomTile: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FixedRoomActionParamToDirection: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ApplyKeyEffect: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadFixedRoomData: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadFixedRoom: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     OpenFixedBin: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CloseFixedBin: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AreOrbsAllowed: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AreTileJumpsAllowed: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AreTrawlOrbsAllowed: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AreOrbsAllowedVeneer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AreLateGameTrapsEnabled: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AreMovesEnabled: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsRoomIlluminated: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMatchingMonsterId: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateItemExplicit: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateAndSpawnItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsHiddenStairsFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsSecretBazaarVeneer: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateStandardItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateCleanItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryLeaderItemPickUp: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SpawnItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RemoveGroundItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SpawnDroppedItemWrapper: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SpawnDroppedItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TryGenerateUnownStoneDrop: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HasHeldItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateMoneyQuantity: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CheckTeamItemsFlags: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     AddHeldItemToBag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RemoveEmptyItemsInBagWrapper: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DoesProjectileHitTarget: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DisplayFloorCard: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HandleFloorCard: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CheckActiveChallengeRequest: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMissionDestination: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsOutlawOrChallengeRequestFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsDestinationFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsCurrentMissionType: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsCurrentMissionTypeExact: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsOutlawMonsterHouseFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsGoldenChamber: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsLegendaryChallengeFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsJirachiChallengeFloor: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsDestinationFloorWithMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LoadMissionMonsterSprites: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MissionTargetEnemyIsDefeated: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetMissionTargetEnemyDefeated: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsDestinationFloorWithFixedRoom: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetItemToRetrieve: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetItemToDeliver: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetSpecialTargetItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsDestinationFloorWithItem: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsDestinationFloorWithHiddenOutlaw: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsDestinationFloorWithFleeingOutlaw: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMissionTargetEnemy: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetMissionEnemyMinionGroup: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetTargetMonsterNotFoundFlag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetTargetMonsterNotFoundFlag: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FloorHasMissionMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GenerateMissionEggMonster: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LogMessageByIdWithPopupCheckParticipants: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LogMessageByIdWithPopupCheckUser: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LogMessageWithPopupCheckUser: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LogMessageByIdQuiet: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LogMessageQuiet: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LogMessageByIdWithPopupCheckUserTarget: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LogMessageWithPopupCheckUserTarget: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LogMessageByIdQuietCheckUserTarget: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LogMessageByIdWithPopupCheckUserUnknown: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LogMessageByIdWithPopup: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LogMessageWithPopup: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LogMessage: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     LogMessageById: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     InitPortraitDungeon: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     OpenMessageLog: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RunDungeonMode: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StartFadeDungeon: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StartFadeDungeonWrapper: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HandleFadesDungeon: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HandleFadesDungeonBothScreens: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DisplayFloorTip: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DisplayItemTip: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DisplayDungeonTip: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     SetBothScreensWindowColorToDefault: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     GetPersonalityIndex: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DisplayMessage: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DisplayMessage2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     YesNoMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DisplayMessageInternal: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     OpenMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     OthersMenuLoop: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     OthersMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
 
-class Overlay29DataProtocol(Protocol):
+class Overlay29DataProtocol(SymbolLookupProtocol, Protocol):
 
     DUNGEON_STRUCT_SIZE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MAX_HP_CAP: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OFFSET_OF_DUNGEON_FLOOR_PROPERTIES: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SPAWN_RAND_MAX: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_PRNG_LCG_MULTIPLIER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_PRNG_LCG_INCREMENT_SECONDARY: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ATTACK_SPRITE_BUFFER_SIZE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     KECLEON_FEMALE_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     KECLEON_MALE_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MSG_ID_SLOW_START: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EXPERIENCE_POINT_GAIN_CAP: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     JUDGMENT_MOVE_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     REGULAR_ATTACK_MOVE_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DEOXYS_ATTACK_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DEOXYS_SPEED_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     GIRATINA_ALTERED_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     PUNISHMENT_MOVE_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OFFENSE_STAT_MAX: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     PROJECTILE_MOVE_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BELLY_LOST_PER_TURN: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MONSTER_HEAL_HP_MAX: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MOVE_TARGET_AND_RANGE_SPECIAL_USER_HEALING: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     PLAIN_SEED_STRING_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MAX_ELIXIR_PP_RESTORATION: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SLIP_SEED_FAIL_STRING_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ROCK_WRECKER_MOVE_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     CASTFORM_NORMAL_FORM_MALE_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     CASTFORM_NORMAL_FORM_FEMALE_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     CHERRIM_SUNSHINE_FORM_MALE_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     CHERRIM_OVERCAST_FORM_FEMALE_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     CHERRIM_SUNSHINE_FORM_FEMALE_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     FLOOR_GENERATION_STATUS_PTR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OFFSET_OF_DUNGEON_N_NORMAL_ITEM_SPAWNS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_GRID_COLUMN_BYTES: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DEFAULT_MAX_POSITION: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OFFSET_OF_DUNGEON_GUARANTEED_ITEM_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     FIXED_ROOM_TILE_SPAWN_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TREASURE_BOX_1_ITEM_IDS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     FIXED_ROOM_REVISIT_OVERRIDES: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     FIXED_ROOM_MONSTER_SPAWN_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     FIXED_ROOM_ITEM_SPAWN_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     FIXED_ROOM_ENTITY_SPAWN_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STATUS_ICON_ARRAY_MUZZLED: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STATUS_ICON_ARRAY_MAGNET_RISE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STATUS_ICON_ARRAY_MIRACLE_EYE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STATUS_ICON_ARRAY_LEECH_SEED: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STATUS_ICON_ARRAY_LONG_TOSS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STATUS_ICON_ARRAY_BLINDED: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STATUS_ICON_ARRAY_BURN: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STATUS_ICON_ARRAY_SURE_SHOT: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STATUS_ICON_ARRAY_INVISIBLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STATUS_ICON_ARRAY_SLEEP: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STATUS_ICON_ARRAY_CURSE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STATUS_ICON_ARRAY_FREEZE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STATUS_ICON_ARRAY_CRINGE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STATUS_ICON_ARRAY_BIDE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STATUS_ICON_ARRAY_REFLECT: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DIRECTIONS_XY: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DISPLACEMENTS_WITHIN_2_LARGEST_FIRST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DISPLACEMENTS_WITHIN_2_SMALLEST_FIRST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DISPLACEMENTS_WITHIN_3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ITEM_CATEGORY_ACTIONS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     FRACTIONAL_TURN_SEQUENCE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BELLY_DRAIN_IN_WALLS_INT: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BELLY_DRAIN_IN_WALLS_THOUSANDTHS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DAMAGE_MULTIPLIER_0_5: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DAMAGE_MULTIPLIER_1_5: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DAMAGE_MULTIPLIER_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     CLOUDY_DAMAGE_MULTIPLIER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SOLID_ROCK_MULTIPLIER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DAMAGE_FORMULA_MAX_BASE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     WONDER_GUARD_MULTIPLIER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DAMAGE_FORMULA_MIN_BASE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TYPE_DAMAGE_NEGATING_EXCLUSIVE_ITEM_EFFECTS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TWO_TURN_STATUSES: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TWO_TURN_MOVES_AND_STATUSES: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SPATK_STAT_IDX: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ATK_STAT_IDX: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ROLLOUT_DAMAGE_MULT_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MAP_COLOR_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     CORNER_CARDINAL_NEIGHBOR_IS_OPEN: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     GUMMI_LIKE_STRING_IDS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     GUMMI_IQ_STRING_IDS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DAMAGE_STRING_IDS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_PTR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_PTR_MASTER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TOP_SCREEN_STATUS_PTR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LEADER_PTR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_PRNG_STATE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_PRNG_STATE_SECONDARY_VALUES: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LOADED_ATTACK_SPRITE_FILE_INDEX: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LOADED_ATTACK_SPRITE_PACK_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EXCL_ITEM_EFFECTS_WEATHER_ATK_SPEED_BOOST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EXCL_ITEM_EFFECTS_WEATHER_MOVE_SPEED_BOOST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EXCL_ITEM_EFFECTS_WEATHER_NO_STATUS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     AI_THROWN_ITEM_ACTION_CHOICE_COUNT: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     EXCL_ITEM_EFFECTS_EVASION_BOOST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DEFAULT_TILE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     HIDDEN_STAIRS_SPAWN_BLOCKED: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     FIXED_ROOM_DATA_PTR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_FADES_PTR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     NECTAR_IQ_BOOST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     COMPRESSED_SPRITE_BUFFER_SIZE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
@@ -18026,12 +18211,12 @@ Overlay29Protocol = SectionProtocol[
 ]
 
 
-class Overlay3FunctionsProtocol(Protocol):
+class Overlay3FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
 
-class Overlay3DataProtocol(Protocol):
+class Overlay3DataProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
@@ -18043,23 +18228,23 @@ Overlay3Protocol = SectionProtocol[
 ]
 
 
-class Overlay30FunctionsProtocol(Protocol):
+class Overlay30FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     WriteQuicksaveData: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
 
-class Overlay30DataProtocol(Protocol):
+class Overlay30DataProtocol(SymbolLookupProtocol, Protocol):
 
     OVERLAY30_JP_STRING_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY30_JP_STRING_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
@@ -18071,378 +18256,378 @@ Overlay30Protocol = SectionProtocol[
 ]
 
 
-class Overlay31FunctionsProtocol(Protocol):
+class Overlay31FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     EntryOverlay31: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DrawDungeonMenuStatusWindow: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DungeonMenuSwitch: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateStairsMenuState: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     StairsSubheadingCallback: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HandleStairsMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     MovesMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HandleMovesMenuWrapper0: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HandleMovesMenuWrapper1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HandleMovesMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     TeamMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RestMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     RecruitmentSearchMenuLoop: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     HelpMenuLoop: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
 
-class Overlay31DataProtocol(Protocol):
+class Overlay31DataProtocol(SymbolLookupProtocol, Protocol):
 
     DUNGEON_WINDOW_PARAMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_MAIN_MENU_ITEMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_MENU_SWITCH_STR1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY31_UNKNOWN_STRING_IDS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY31_UNKNOWN_STRUCT__NA_2389E30: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_5: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_6: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_7: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_SUBMENU_ITEMS_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_SUBMENU_ITEMS_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_SUBMENU_ITEMS_3: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_SUBMENU_ITEMS_4: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY31_UNKNOWN_STRUCT__NA_2389EF0: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_8: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_9: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_10: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_11: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_12: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_13: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY31_JP_STRING: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_14: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_15: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_16: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_17: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_18: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_19: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY31_UNKNOWN_STRUCT__NA_2389FE8: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_20: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_21: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_22: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_23: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_24: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_25: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_SUBMENU_ITEMS_5: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_26: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY31_UNKNOWN_STRUCT__NA_238A144: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_27: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_28: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY31_UNKNOWN_STRUCT__NA_238A190: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_SUBMENU_ITEMS_6: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_29: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_30: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_31: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_WINDOW_PARAMS_32: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY31_RESERVED_SPACE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY31_UNKNOWN_POINTER__NA_238A260: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY31_UNKNOWN_VALUE__NA_238A264: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY31_UNKNOWN_POINTER__NA_238A268: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY31_UNKNOWN_POINTER__NA_238A26C: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY31_UNKNOWN_POINTER__NA_238A270: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY31_UNKNOWN_POINTER__NA_238A274: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY31_UNKNOWN_POINTER__NA_238A278: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY31_UNKNOWN_POINTER__NA_238A27C: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY31_UNKNOWN_POINTER__NA_238A280: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY31_UNKNOWN_POINTER__NA_238A284: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY31_UNKNOWN_POINTER__NA_238A288: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY31_UNKNOWN_POINTER__NA_238A28C: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
@@ -18454,12 +18639,12 @@ Overlay31Protocol = SectionProtocol[
 ]
 
 
-class Overlay32FunctionsProtocol(Protocol):
+class Overlay32FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
 
-class Overlay32DataProtocol(Protocol):
+class Overlay32DataProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
@@ -18471,12 +18656,12 @@ Overlay32Protocol = SectionProtocol[
 ]
 
 
-class Overlay33FunctionsProtocol(Protocol):
+class Overlay33FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
 
-class Overlay33DataProtocol(Protocol):
+class Overlay33DataProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
@@ -18488,63 +18673,63 @@ Overlay33Protocol = SectionProtocol[
 ]
 
 
-class Overlay34FunctionsProtocol(Protocol):
+class Overlay34FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     ExplorersOfSkyMain: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
 
-class Overlay34DataProtocol(Protocol):
+class Overlay34DataProtocol(SymbolLookupProtocol, Protocol):
 
     OVERLAY34_UNKNOWN_STRUCT__NA_22DD014: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     START_MENU_ITEMS_CONFIRM: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY34_UNKNOWN_STRUCT__NA_22DD03C: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_DEBUG_MENU_ITEMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY34_RESERVED_SPACE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY34_UNKNOWN_POINTER__NA_22DD080: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY34_UNKNOWN_POINTER__NA_22DD084: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY34_UNKNOWN_POINTER__NA_22DD088: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY34_UNKNOWN_POINTER__NA_22DD08C: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     OVERLAY34_UNKNOWN_POINTER__NA_22DD090: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
@@ -18556,12 +18741,12 @@ Overlay34Protocol = SectionProtocol[
 ]
 
 
-class Overlay35FunctionsProtocol(Protocol):
+class Overlay35FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
 
-class Overlay35DataProtocol(Protocol):
+class Overlay35DataProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
@@ -18573,12 +18758,12 @@ Overlay35Protocol = SectionProtocol[
 ]
 
 
-class Overlay4FunctionsProtocol(Protocol):
+class Overlay4FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
 
-class Overlay4DataProtocol(Protocol):
+class Overlay4DataProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
@@ -18590,12 +18775,12 @@ Overlay4Protocol = SectionProtocol[
 ]
 
 
-class Overlay5FunctionsProtocol(Protocol):
+class Overlay5FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
 
-class Overlay5DataProtocol(Protocol):
+class Overlay5DataProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
@@ -18607,12 +18792,12 @@ Overlay5Protocol = SectionProtocol[
 ]
 
 
-class Overlay6FunctionsProtocol(Protocol):
+class Overlay6FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
 
-class Overlay6DataProtocol(Protocol):
+class Overlay6DataProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
@@ -18624,12 +18809,12 @@ Overlay6Protocol = SectionProtocol[
 ]
 
 
-class Overlay7FunctionsProtocol(Protocol):
+class Overlay7FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
 
-class Overlay7DataProtocol(Protocol):
+class Overlay7DataProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
@@ -18641,12 +18826,12 @@ Overlay7Protocol = SectionProtocol[
 ]
 
 
-class Overlay8FunctionsProtocol(Protocol):
+class Overlay8FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
 
-class Overlay8DataProtocol(Protocol):
+class Overlay8DataProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
@@ -18658,88 +18843,88 @@ Overlay8Protocol = SectionProtocol[
 ]
 
 
-class Overlay9FunctionsProtocol(Protocol):
+class Overlay9FunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     CreateJukeboxTrackMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CloseJukeboxTrackMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsJukeboxTrackMenuActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateJukeboxTrackMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreatePlaybackControlsMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     ClosePlaybackControlsMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsPlaybackControlsMenuActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdatePlaybackControlsMenu: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CreateInputLockBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     CloseInputLockBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     IsInputLockBoxActive: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     UpdateInputLockBox: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
 
-class Overlay9DataProtocol(Protocol):
+class Overlay9DataProtocol(SymbolLookupProtocol, Protocol):
 
     JUKEBOX_TRACK_MENU_DEFAULT_WINDOW_PARAMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     PLAYBACK_CONTROLS_MENU_DEFAULT_WINDOW_PARAMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     INPUT_LOCK_BOX_DEFAULT_WINDOW_PARAMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TOP_MENU_RETURN_MUSIC_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
@@ -18751,390 +18936,390 @@ Overlay9Protocol = SectionProtocol[
 ]
 
 
-class RamFunctionsProtocol(Protocol):
+class RamFunctionsProtocol(SymbolLookupProtocol, Protocol):
 
     pass
 
 
-class RamDataProtocol(Protocol):
+class RamDataProtocol(SymbolLookupProtocol, Protocol):
 
     DEFAULT_MEMORY_ARENA_MEMORY: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     GROUND_MEMORY_ARENA_2: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     GROUND_MEMORY_ARENA_2_BLOCKS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     GROUND_MEMORY_ARENA_2_MEMORY: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_COLORMAP_PTR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DUNGEON_STRUCT: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MOVE_DATA_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SOUND_MEMORY_ARENA: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SOUND_MEMORY_ARENA_BLOCKS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SOUND_MEMORY_ARENA_MEMORY: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     FRAMES_SINCE_LAUNCH: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TOUCHSCREEN_STATUS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BAG_ITEMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BAG_ITEMS_PTR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STORAGE_ITEMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STORAGE_ITEM_QUANTITIES: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     KECLEON_SHOP_ITEMS_PTR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     KECLEON_SHOP_ITEMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     UNUSED_KECLEON_SHOP_ITEMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     KECLEON_WARES_ITEMS_PTR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     KECLEON_WARES_ITEMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     UNUSED_KECLEON_WARES_ITEMS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MONEY_CARRIED: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MONEY_STORED: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     AUDIO_COMMANDS_BUFFER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SOUND_MEMORY_ARENA_PTR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     WINDOW_LIST: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     CURSOR_16_SPRITE_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     CURSOR_SPRITE_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     CURSOR_ANIMATION_CONTROL: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     CURSOR_16_ANIMATION_CONTROL: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ALERT_SPRITE_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ALERT_ANIMATION_CONTROL: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LAST_NEW_MOVE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SCRIPT_VARS_VALUES: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     BAG_LEVEL: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DEBUG_SPECIAL_EPISODE_NUMBER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     KAOMADO_STREAM: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     PENDING_DUNGEON_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     PENDING_STARTING_FLOOR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     PLAY_TIME_SECONDS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     PLAY_TIME_FRAME_COUNTER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TEAM_NAME: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LEVEL_UP_DATA_MONSTER_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LEVEL_UP_DATA_DECOMPRESS_BUFFER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TEAM_MEMBER_TABLE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     DRIVER_WORK: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     DISP_MODE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     GXI_VRAM_LOCK_ID: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ENABLED_VRAM_BANKS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SUB_BG_EXT_PLTT: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     CLR_IMG: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     THREAD_INFO_STRUCT: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         None,
     ]
 
     FRAMES_SINCE_LAUNCH_TIMES_THREE: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     GROUND_MEMORY_ARENA_1_PTR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     GROUND_MEMORY_ARENA_2_PTR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LOCK_NOTIFY_ARRAY: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     GROUND_MEMORY_ARENA_1: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     GROUND_MEMORY_ARENA_1_BLOCKS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     GROUND_MEMORY_ARENA_1_MEMORY: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     SENTRY_DUTY_STRUCT: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TURNING_ON_THE_SPOT_FLAG: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     LOADED_ATTACK_SPRITE_DATA: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     AI_THROWN_ITEM_DIRECTION_IS_USED: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     AI_THROWN_ITEM_PROBABILITIES: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     AI_THROWN_ITEM_DIRECTIONS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ROLLOUT_ICE_BALL_MISSED: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MULTIHIT_FATIGUE_MOVE_USED: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TWINEEDLE_HIT_TRACKER: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     RAPID_SPIN_BINDING_REMOVAL: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     ROLLOUT_ICE_BALL_SUCCESSIVE_HITS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     MULTIHIT_MOVE_SUCCESSIVE_HITS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     TRIPLE_KICK_SUCCESSIVE_HITS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     METRONOME_NEXT_INDEX: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     FLOOR_GENERATION_STATUS: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
     STAIRS_MENU_PTR: Symbol[
-        Optional[list[int]],
+        Optional[tuple[int, ...]],
         Optional[int],
     ]
 
@@ -0,0 +1,71 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import pmdsky_debug_py
+from pmdsky_debug_py import na as na_sections
+from pmdsky_debug_py.na import NaArm9Functions, NaSections, SECTIONS, SYMBOLS_BY_ABSOLUTE_ADDRESS, sections_at, symbols_named
+
+
+def test_lookup():
+    assert NaArm9Functions.lookup("InitMemAllocTable") is NaArm9Functions.InitMemAllocTable
+    assert na_sections.arm9.data.lookup("ACTOR_LIST") is na_sections.arm9.data.ACTOR_LIST
+
+
+def test_lookup_unknown_name():
+    with pytest.raises(KeyError):
+        NaArm9Functions.lookup("InitMemAllocTabel")
+    # Class attributes are not symbols.
+    with pytest.raises(KeyError):
+        NaArm9Functions.lookup("_TABLE")
+
+
+def test_sections():
+    assert list(SECTIONS) == [name for name in vars(NaSections) if not name.startswith("_")]
+    assert SECTIONS["overlay29"] is na_sections.overlay29
+
+
+def test_sections_at():
+    names = [section.name for section in sections_at(na_sections.overlay29.loadaddress)]
+    assert "overlay29" in names
+    assert "ram" in names
+    loadaddresses = [section.loadaddress for section in sections_at(na_sections.overlay29.loadaddress)]
+    assert loadaddresses == sorted(loadaddresses)
+    assert sections_at(0x1000) == []
+
+
+def test_sections_at_end_is_exclusive():
+    overlay29 = na_sections.overlay29
+    end = overlay29.loadaddress + overlay29.length
+    assert overlay29 in sections_at(end - 1)
+    assert overlay29 not in sections_at(end)
+
+
+def test_symbols_named():
+    symbols = symbols_named("HardwareInterrupt")
+    assert [section for section, _symbol in symbols] == ["arm7", "itcm"]
+    assert symbols[0][1] is na_sections.arm7.functions.HardwareInterrupt
+    assert symbols[1][1] is na_sections.itcm.functions.HardwareInterrupt
+    assert symbols_named("InitMemAllocTabel") == []
+
+
+def test_symbols_by_absolute_address_is_lazy():
+    code = (
+        "from importlib import import_module\n"
+        "na = import_module('pmdsky_debug_py.na')\n"
+        "assert 'SYMBOLS_BY_ABSOLUTE_ADDRESS' not in vars(na)\n"
+        "table = na.SYMBOLS_BY_ABSOLUTE_ADDRESS\n"
+        "assert vars(na)['SYMBOLS_BY_ABSOLUTE_ADDRESS'] is table\n"
+    )
+    package_path = os.path.dirname(os.path.dirname(pmdsky_debug_py.__file__))
+    subprocess.run([sys.executable, "-c", code], check=True, env={**os.environ, "PYTHONPATH": package_path})
+
+
+def test_symbols_by_absolute_address():
+    symbol = NaArm9Functions.InitMemAllocTable
+    assert ("arm9", symbol) in SYMBOLS_BY_ABSOLUTE_ADDRESS[symbol.absolute_address]
+    multi = NaArm9Functions.EuclideanNorm
+    for address in multi.absolute_addresses:
+        assert ("arm9", multi) in SYMBOLS_BY_ABSOLUTE_ADDRESS[address]
@@ -0,0 +1,45 @@
+from pmdsky_debug_py import jp as jp_sections, na as na_sections
+from pmdsky_debug_py.jp import resolve as jp_resolve
+from pmdsky_debug_py.na import resolve as na_resolve
+
+
+def names(resolved):
+    return [(section, symbol.name) for section, symbol in resolved]
+
+
+def test_nested_data_table():
+    table = na_sections.arm9.data.EXCLUSIVE_ITEM_STAT_BOOST_DATA
+    nested = na_sections.arm9.data.EXCLUSIVE_ITEM_SPECIAL_DEFENSE_BOOSTS
+    assert table.absolute_address < nested.absolute_address
+    assert nested.absolute_address + nested.length <= table.absolute_address + table.length
+    resolved = names(na_resolve(nested.absolute_address))
+    assert ("arm9", table.name) in resolved
+    assert ("arm9", nested.name) in resolved
+    # The table still contains its first address, which the nested table does not.
+    resolved = names(na_resolve(table.absolute_address))
+    assert ("arm9", table.name) in resolved
+    assert ("arm9", nested.name) not in resolved
+
+
+def test_enclosing_symbol_with_later_start():
+    secure = na_sections.arm9.data.SECURE
+    resolved = names(na_resolve(secure.absolute_address + secure.length - 1))
+    assert ("arm9", secure.name) in resolved
+    assert ("arm9", na_sections.arm9.functions.Svc_CpuSet.name) in resolved
+    assert ("arm9", secure.name) not in names(na_resolve(secure.absolute_address + secure.length))
+
+
+def test_data_without_length():
+    thread_info = jp_sections.ram.data.THREAD_INFO_STRUCT
+    assert thread_info.length is None
+    assert ("ram", thread_info.name) in names(jp_resolve(thread_info.absolute_address))
+    resolved = names(jp_resolve(jp_sections.overlay29.functions.EntityIsValid.absolute_address))
+    assert ("overlay29", "EntityIsValid") in resolved
+    assert all(section != "ram" for section, _name in resolved)
+    assert ("ram", thread_info.name) not in names(jp_resolve(thread_info.absolute_address + 1))
+
+
+def test_function_without_length():
+    function = na_sections.overlay29.functions.EntityIsValid
+    assert function.length is None
+    assert ("overlay29", function.name) in names(na_resolve(function.absolute_address + 4))
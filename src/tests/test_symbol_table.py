@@ -0,0 +1,61 @@
+from array import array
+
+import pytest
+
+from pmdsky_debug_py import na as na_sections
+from pmdsky_debug_py.protocol import EMPTY_SYMBOL_TABLE, SymbolTable
+
+NONE = SymbolTable.NONE
+
+
+@pytest.fixture
+def table():
+    return SymbolTable(
+        names=("Single", "Missing", "Multi"),
+        addresses=array("I", (0x10, NONE, NONE)),
+        absolute_addresses=array("I", (0x2000010, NONE, NONE)),
+        lengths=array("I", (0x4, NONE, NONE)),
+        descriptions=array("I", (0, 1, 2)),
+        c_types=("int", "char", "u8"),
+        multi={2: ((0x20, 0x30), (0x2000020, 0x2000030))},
+    )
+
+
+def test_single_address(table):
+    assert table["Single"] == ((0x10,), (0x2000010,), 0x4, 0, "int")
+
+
+def test_none_sentinel(table):
+    assert table["Missing"] == (None, None, None, 1, "char")
+
+
+def test_multi_address(table):
+    assert table["Multi"] == ((0x20, 0x30), (0x2000020, 0x2000030), None, 2, "u8")
+
+
+def test_function_table_has_no_c_types():
+    table = SymbolTable(("Function",), array("I", (0x10,)), array("I", (0x2000010,)), array("I", (NONE,)),
+                        array("I", (0,)), None, {})
+    assert table["Function"] == ((0x10,), (0x2000010,), None, 0, None)
+
+
+def test_mapping(table):
+    assert list(table) == ["Single", "Missing", "Multi"]
+    assert len(table) == 3
+    assert "Multi" in table
+    with pytest.raises(KeyError):
+        table["Unknown"]
+    assert len(EMPTY_SYMBOL_TABLE) == 0
+
+
+def test_generated_multi_address():
+    symbol = na_sections.arm9.functions.EuclideanNorm
+    assert symbol.absolute_addresses == (0x2005050, 0x20050B0)
+    assert symbol.addresses == (0x5050, 0x50B0)
+    assert symbol.address == 0x5050
+
+
+def test_generated_missing_address():
+    symbol = na_sections.arm9.data.MAX_PLAY_TIME
+    assert symbol.addresses is None
+    assert symbol.absolute_addresses is None
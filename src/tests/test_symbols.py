@@ -0,0 +1,18 @@
+from pmdsky_debug_py.protocol import Symbol
+from pmdsky_debug_py.na import NaArm9Data, NaArm9Functions, NaRamFunctions
+
+
+def test_symbols_lists_every_symbol():
+    names = [symbol.name for symbol in NaArm9Functions.symbols()]
+    assert names == list(NaArm9Functions._RAW)
+    assert "InitMemAllocTable" in names
+    assert all(isinstance(symbol, Symbol) for symbol in NaArm9Data.symbols())
+
+
+def test_symbols_returns_cached_symbols():
+    symbol = NaArm9Functions.InitMemAllocTable
+    assert any(listed is symbol for listed in NaArm9Functions.symbols())
+
+
+def test_symbols_of_empty_class():
+    assert list(NaRamFunctions.symbols()) == []